@@ -24,6 +24,16 @@ class FasterInmemoryResultBackend(InmemoryResultBackend):
         :param task_id: id of a task to check.
         :return: True if ready.
         """
+        return await self.wait_for_result(task_id, 0.2)
+
+    async def wait_for_result(self, task_id: str, timeout: float) -> bool:
+        """
+        Waits for result to be set for up to `timeout` seconds.
+
+        :param task_id: id of a task to wait for.
+        :param timeout: how long to wait for result, in seconds.
+        :return: True if ready.
+        """
         if task_id in self.results:
             return True
 
@@ -33,7 +43,7 @@ class FasterInmemoryResultBackend(InmemoryResultBackend):
             self._events[task_id] = Event()
 
         try:
-            await asyncio.wait_for(self._events[task_id].wait(), 0.2)
+            await asyncio.wait_for(self._events[task_id].wait(), timeout)
             return True
         except TimeoutError:
             return False
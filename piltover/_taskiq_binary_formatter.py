@@ -0,0 +1,104 @@
+from typing import Any
+
+from taskiq import TaskiqFormatter, BrokerMessage, TaskiqMessage, AsyncBroker
+from taskiq.compat import model_dump_json, model_validate_json, model_copy
+
+from piltover.tl import Int
+
+_BINARY_ARG_KEY = "__binary_arg__"
+_BINARY_MESSAGE_MAGIC = b"\xb1"
+
+
+class BinaryTaskiqFormatter(TaskiqFormatter):
+    """
+    Formatter that sends bytes arguments of a task as-is instead of json-encoding them.
+    Message layout: <magic: 1 byte> <json header length: int> <json header> (<blob length: int> <blob>)*.
+    Bytes arguments are replaced in header by {"__binary_arg__": <blob index>}.
+    Messages without bytes arguments are sent as plain json, same as with JSONFormatter.
+    """
+
+    # Splitting message into header and blobs costs more than hex-encoding small payloads,
+    #  so payloads smaller than this are sent hex-encoded in plain json message
+    MIN_BINARY_PAYLOAD_SIZE = 3 * 1024
+
+    @classmethod
+    def encode_payload(cls, data: bytes) -> bytes | str:
+        if len(data) < cls.MIN_BINARY_PAYLOAD_SIZE:
+            return data.hex()
+        return data
+
+    @staticmethod
+    def _is_binary(value: Any) -> bool:
+        return isinstance(value, (bytes, bytearray, memoryview))
+
+    @staticmethod
+    def _extract(value: Any, blobs: list[bytes]) -> Any:
+        if BinaryTaskiqFormatter._is_binary(value):
+            blobs.append(value)
+            return {_BINARY_ARG_KEY: len(blobs) - 1}
+        return value
+
+    @staticmethod
+    def _restore(value: Any, blobs: list[bytes]) -> Any:
+        if isinstance(value, dict) and len(value) == 1 and _BINARY_ARG_KEY in value:
+            return blobs[value[_BINARY_ARG_KEY]]
+        return value
+
+    def dumps(self, message: TaskiqMessage) -> BrokerMessage:
+        if not any(map(self._is_binary, message.args)) and not any(map(self._is_binary, message.kwargs.values())):
+            data = model_dump_json(message).encode("utf8")
+        else:
+            blobs: list[bytes] = []
+            header = model_dump_json(model_copy(message, update={
+                "args": [self._extract(arg, blobs) for arg in message.args],
+                "kwargs": {name: self._extract(arg, blobs) for name, arg in message.kwargs.items()},
+            })).encode("utf8")
+
+            parts = [_BINARY_MESSAGE_MAGIC, Int.write(len(header)), header]
+            for blob in blobs:
+                parts.append(Int.write(len(blob)))
+                parts.append(blob)
+
+            data = b"".join(parts)
+
+        return BrokerMessage(
+            task_id=message.task_id,
+            task_name=message.task_name,
+            message=data,
+            labels=message.labels,
+        )
+
+    def loads(self, message: bytes) -> TaskiqMessage:
+        if message[:1] != _BINARY_MESSAGE_MAGIC:
+            return model_validate_json(TaskiqMessage, message)
+
+        view = memoryview(message)
+        header_length = Int.read_bytes(view[1:5])
+        offset = 5 + header_length
+        taskiq_message = model_validate_json(TaskiqMessage, view[5:offset].tobytes())
+
+        blobs = []
+        while offset < len(view):
+            blob_length = Int.read_bytes(view[offset:offset + 4])
+            offset += 4
+            blobs.append(view[offset:offset + blob_length].tobytes())
+            offset += blob_length
+
+        taskiq_message.args = [self._restore(arg, blobs) for arg in taskiq_message.args]
+        taskiq_message.kwargs = {name: self._restore(arg, blobs) for name, arg in taskiq_message.kwargs.items()}
+
+        return taskiq_message
+
+
+def encode_rpc_payload(broker: AsyncBroker, data: bytes) -> bytes | str:
+    if isinstance(broker.formatter, BinaryTaskiqFormatter):
+        return broker.formatter.encode_payload(data)
+    return data.hex()
+
+
+def decode_rpc_payload(payload: bytes | str) -> bytes:
+    # Payload is hex-encoded if it is small (see BinaryTaskiqFormatter.MIN_BINARY_PAYLOAD_SIZE)
+    #  or if task was created with hex transport (e.g. by the scheduler)
+    if isinstance(payload, str):
+        return bytes.fromhex(payload)
+    return payload
@@ -0,0 +1,26 @@
+from typing import TypeVar
+
+from redis.asyncio import Redis
+from taskiq import TaskiqResult
+from taskiq_redis import RedisAsyncResultBackend
+
+T = TypeVar("T")
+
+
+class BinaryRedisAsyncResultBackend(RedisAsyncResultBackend[T]):
+    """
+    RedisAsyncResultBackend dumps results in pydantic's json mode before passing them to serializer,
+    which fails on (non-utf8) bytes return values. This backend dumps results in python mode,
+    so raw bytes are passed to (binary-safe, pickle by default) serializer as-is.
+    """
+
+    async def set_result(self, task_id: str, result: TaskiqResult[T]) -> None:
+        name = self._task_name(task_id)
+        value = self.serializer.dumpb(result.model_dump())
+        async with Redis(connection_pool=self.redis_pool) as redis:
+            if self.result_ex_time:
+                await redis.set(name=name, value=value, ex=self.result_ex_time)
+            elif self.result_px_time:
+                await redis.set(name=name, value=value, px=self.result_px_time)
+            else:
+                await redis.set(name=name, value=value)
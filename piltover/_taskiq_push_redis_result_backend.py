@@ -0,0 +1,150 @@
+import asyncio
+from asyncio import Event, Task
+from collections import OrderedDict
+from typing import TypeVar, Any
+from uuid import uuid4
+
+from loguru import logger
+from redis.asyncio import Redis
+from taskiq import TaskiqResult
+from taskiq.compat import model_validate
+
+from piltover._taskiq_binary_redis_result_backend import BinaryRedisAsyncResultBackend
+
+T = TypeVar("T")
+
+REPLY_TO_LABEL = "reply_to"
+
+
+class PushRedisResultBackend(BinaryRedisAsyncResultBackend[T]):
+    """
+    Result backend that delivers results of tasks kicked with "reply_to" label straight to the kicker
+    via redis pub/sub channel instead of storing them in redis and polling for them.
+    Only gateway listens on its reply channel (see start_listening), workers only publish to it.
+    Results of tasks without "reply_to" label, and results nobody received because reply channel listener
+    is reconnecting, are stored in redis as usual; pending results are checked there once listener resubscribes.
+    """
+
+    def __init__(
+            self, *args, max_stored_results: int = 4096, reconnect_delay: float = 1, **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.reply_channel = f"piltover:rpc-results:{uuid4().hex}"
+        self.max_stored_results = max_stored_results
+        self.reconnect_delay = reconnect_delay
+
+        self._results: OrderedDict[str, TaskiqResult[T]] = OrderedDict()
+        self._events: OrderedDict[str, Event] = OrderedDict()
+        self._listener: Task | None = None
+
+    async def start_listening(self) -> None:
+        """ Subscribes to reply channel. Called by gateway, since only it kicks tasks with "reply_to" label. """
+
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def shutdown(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+        await super().shutdown()
+
+    async def _listen(self) -> None:
+        while True:
+            redis = Redis(connection_pool=self.redis_pool)
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.reply_channel)
+                # Results published while listener was not subscribed were stored in redis instead
+                await self._check_stored_results()
+                async for message in pubsub.listen():
+                    try:
+                        task_id, value = self.serializer.loadb(message["data"])
+                        self._store_result(task_id, model_validate(TaskiqResult[Any], value))
+                    except Exception as e:
+                        logger.opt(exception=e).error("Failed to process pushed task result")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.opt(exception=e).warning(
+                    f"Reply channel listener failed, reconnecting in {self.reconnect_delay} seconds"
+                )
+            finally:
+                await pubsub.aclose()
+                await redis.aclose()
+
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _store_result(self, task_id: str, result: TaskiqResult[T]) -> None:
+        while len(self._results) >= self.max_stored_results:
+            self._results.popitem(last=False)
+        self._results[task_id] = result
+
+        if task_id in self._events:
+            self._events.pop(task_id).set()
+
+    async def set_result(self, task_id: str, result: TaskiqResult[T]) -> None:
+        if (reply_to := result.labels.get(REPLY_TO_LABEL)) is None:
+            return await super().set_result(task_id, result)
+
+        value = self.serializer.dumpb((task_id, result.model_dump()))
+        async with Redis(connection_pool=self.redis_pool) as redis:
+            receivers = await redis.publish(reply_to, value)
+
+        # Kicker is not subscribed right now (e.g. its listener is reconnecting), it will check redis on resubscribe
+        if not receivers:
+            await super().set_result(task_id, result)
+
+    def _get_event(self, task_id: str) -> Event:
+        if task_id not in self._events:
+            while len(self._events) >= self.max_stored_results:
+                self._events.popitem(last=False)
+            self._events[task_id] = Event()
+
+        return self._events[task_id]
+
+    async def _check_stored_results(self) -> None:
+        for task_id in list(self._events):
+            if await super().is_result_ready(task_id) and task_id in self._events:
+                self._events.pop(task_id).set()
+
+    async def is_result_ready(self, task_id: str) -> bool:
+        """
+        Checks if result was pushed or, if it was published while listener was not subscribed, stored in redis.
+        Does not wait for result, use wait_for_result for that.
+
+        :param task_id: id of a task to check.
+        :return: True if ready.
+        """
+        return task_id in self._results or await super().is_result_ready(task_id)
+
+    async def wait_for_result(self, task_id: str, timeout: float) -> bool:
+        """
+        Waits for result to be pushed for up to `timeout` seconds, without polling redis.
+        Results stored in redis while listener was not subscribed are checked once right after it (re)subscribes
+        and once more when timeout expires, in case result was stored after that check.
+
+        :param task_id: id of a task to wait for.
+        :param timeout: how long to wait for result, in seconds.
+        :return: True if ready.
+        """
+        if task_id in self._results:
+            return True
+
+        try:
+            await asyncio.wait_for(self._get_event(task_id).wait(), timeout)
+            return True
+        except TimeoutError:
+            # Result pushed after this will still be stored in self._results, so event is not needed anymore
+            self._events.pop(task_id, None)
+            return await self.is_result_ready(task_id)
+
+    async def get_result(self, task_id: str, with_logs: bool = False) -> TaskiqResult[T]:
+        if task_id not in self._results:
+            return await super().get_result(task_id, with_logs)
+
+        result = self._results.pop(task_id)
+        if not with_logs:
+            result.log = None
+        return result
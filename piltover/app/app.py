@@ -7,11 +7,11 @@ from contextlib import asynccontextmanager
 from datetime import timedelta
 from pathlib import Path
 from types import SimpleNamespace
-from typing import AsyncIterator
+from typing import AsyncIterator, Literal
 
 import uvloop
 from loguru import logger
-from taskiq import TaskiqScheduler, InMemoryBroker
+from taskiq import TaskiqScheduler, InMemoryBroker, TaskiqEvents
 from tortoise import Tortoise, connections
 
 from piltover.app.handlers import register_handlers
@@ -19,9 +19,14 @@ from piltover.app.utils.app_create_system_data import create_system_data
 from piltover.app.utils.config_helper import make_broker_from_config, make_message_broker_from_config
 from piltover.cache import Cache
 from piltover.config import TORTOISE_ORM, GATEWAY_CONFIG, SYSTEM_CONFIG
+from piltover.db.models import Presence
 from piltover.gateway import Gateway
+from piltover.message_brokers.base_broker import BrokerType
 from piltover.scheduler import OrmDatabaseScheduleSource
 from piltover.session import SessionManager
+from piltover.session.context_values_cache import ContextValuesCache
+from piltover.session.response_cache import ResponseCache
+from piltover.session.seq_allocator import SeqAllocator
 from piltover.utils import gen_keys, get_public_key_fingerprint, Keys
 from piltover.utils.debug.measure_queryset_times import patch_queryset_for_measurement
 from piltover.utils.debug.tracing import Tracing
@@ -72,7 +77,11 @@ class ArgsNamespace(SimpleNamespace):
 class PiltoverApp:
     def __init__(
             self, data_dir: Path, privkey: str | Path, pubkey: str | Path, host: str = "0.0.0.0", port: int = 4430,
-            salt_key: bytes | None = None,
+            salt_key: bytes | None = None, serialization_executor: Literal["none", "thread", "process"] = "none",
+            serialization_workers: int | None = None, max_connections: int | None = None,
+            max_inflight_requests: int = 1024, max_queued_bytes: int = 16 * 1024 * 1024,
+            max_unacked_messages: int = 256, session_resume_timeout: int = 60, max_detached_sessions: int = 10000,
+            max_detached_sessions_per_key: int = 16,
     ):
         self._host = host
         self._port = port
@@ -91,7 +100,7 @@ class PiltoverApp:
         self._public_key = pubkey.read_text()
 
         broker = make_broker_from_config()
-        message_broker = make_message_broker_from_config(broker)
+        message_broker = make_message_broker_from_config(broker, BrokerType.READ | BrokerType.WRITE)
 
         self._gateway = Gateway(
             data_dir=data_dir,
@@ -104,6 +113,15 @@ class PiltoverApp:
                 public_key=self._public_key,
             ),
             salt_key=salt_key,
+            serialization_executor=serialization_executor,
+            serialization_workers=serialization_workers,
+            max_connections=max_connections,
+            max_inflight_requests=max_inflight_requests,
+            max_queued_bytes=max_queued_bytes,
+            max_unacked_messages=max_unacked_messages,
+            session_resume_timeout=session_resume_timeout,
+            max_detached_sessions=max_detached_sessions,
+            max_detached_sessions_per_key=max_detached_sessions_per_key,
         )
 
         self._worker: Worker | None = None
@@ -141,6 +159,10 @@ class PiltoverApp:
             )
         ))
 
+    @staticmethod
+    async def _invalidate_cached_responses(*args, **kwargs) -> None:
+        await SessionManager.invalidate_cached_responses()
+
     @staticmethod
     def _run_telegram_integration() -> asyncio.Task | None:
         tg_integration = SYSTEM_CONFIG.telegram_integration
@@ -171,6 +193,9 @@ class PiltoverApp:
             args, args.create_system_user, args.create_auth_countries, args.create_reactions, args.create_chat_themes,
             args.create_peer_colors, args.create_languages, args.create_system_stickersets, args.create_emoji_groups,
         )
+        # Other gateways may have cached responses (config, reactions, languages, etc.) made from old system data,
+        #  message broker is started together with gateway's taskiq client
+        self._gateway.broker.add_event_handler(TaskiqEvents.CLIENT_STARTUP, self._invalidate_cached_responses)
 
         scheduler_task = self._run_in_memory_scheduler()
         telegram_integration_task = self._run_telegram_integration()
@@ -243,9 +268,15 @@ class PiltoverApp:
             await scheduler_task
 
         await self._gateway.broker.shutdown()
+        Presence.reset()
         await connections.close_all(True)
         await Cache.obj.clear()
         SessionManager.sessions.clear()
+        SessionManager.detached.clear()
+        SessionManager.detached_by_key.clear()
+        SeqAllocator.reset()
+        ResponseCache.reset()
+        ContextValuesCache.reset()
 
 
 args: ArgsNamespace
@@ -324,6 +355,15 @@ app = PiltoverApp(
     host=GATEWAY_CONFIG.host,
     port=GATEWAY_CONFIG.port,
     salt_key=GATEWAY_CONFIG.salt_key,
+    serialization_executor=GATEWAY_CONFIG.serialization_executor,
+    serialization_workers=GATEWAY_CONFIG.serialization_workers,
+    max_connections=GATEWAY_CONFIG.max_connections,
+    max_inflight_requests=GATEWAY_CONFIG.max_inflight_requests,
+    max_queued_bytes=GATEWAY_CONFIG.max_queued_bytes,
+    max_unacked_messages=GATEWAY_CONFIG.max_unacked_messages,
+    session_resume_timeout=GATEWAY_CONFIG.session_resume_timeout,
+    max_detached_sessions=GATEWAY_CONFIG.max_detached_sessions,
+    max_detached_sessions_per_key=GATEWAY_CONFIG.max_detached_sessions_per_key,
 )
 
 
@@ -7,7 +7,8 @@ from piltover.app.bot_handlers.botfather.utils import get_bot_selection_inline_k
 from piltover.app.utils.formatable_text_with_entities import FormatableTextWithEntities
 from piltover.config import APP_CONFIG
 from piltover.db.enums import BotFatherState
-from piltover.db.models import Peer, Bot, BotInfo, BotFatherUserState, UserPhoto, BotCommand, MessageRef, User
+from piltover.db.models import Peer, Bot, BotInfo, BotFatherUserState, UserPhoto, BotCommand, MessageRef, User, \
+    MessageSearchToken
 from piltover.db.models.bot import bot_gen_token
 from piltover.tl import ReplyInlineMarkup, KeyboardButtonRow, KeyboardButtonCallback
 from piltover.tl.types.internal_botfather import BotfatherStateEditbot
@@ -81,6 +82,7 @@ async def botfather_callback_query_handler(peer: Peer, message: MessageRef, data
 
         async with in_transaction():
             await message.content.save(update_fields=["message", "reply_markup", "version"])
+            await MessageSearchToken.reindex(message.content)
         await upd.edit_message(peer.owner_id, {peer: message})
 
         return BotCallbackAnswer(cache_time=0)
@@ -124,6 +126,7 @@ async def botfather_callback_query_handler(peer: Peer, message: MessageRef, data
 
         async with in_transaction():
             await message.content.save(update_fields=["message", "entities", "reply_markup", "version"])
+            await MessageSearchToken.reindex(message.content)
         await upd.edit_message(peer.owner_id, {peer: message})
 
         return BotCallbackAnswer(cache_time=0)
@@ -140,6 +143,7 @@ async def botfather_callback_query_handler(peer: Peer, message: MessageRef, data
 
         async with in_transaction():
             await message.content.save(update_fields=["message", "reply_markup", "version"])
+            await MessageSearchToken.reindex(message.content)
         await upd.edit_message(peer.owner_id, {peer: message})
 
         return BotCallbackAnswer(cache_time=0)
@@ -176,6 +180,7 @@ async def botfather_callback_query_handler(peer: Peer, message: MessageRef, data
 
         async with in_transaction():
             await message.content.save(update_fields=["message", "entities", "reply_markup", "version"])
+            await MessageSearchToken.reindex(message.content)
         await upd.edit_message(peer.owner_id, {peer: message})
 
         return BotCallbackAnswer(cache_time=0)
@@ -214,6 +219,7 @@ async def botfather_callback_query_handler(peer: Peer, message: MessageRef, data
 
         async with in_transaction():
             await message.content.save(update_fields=["message", "entities", "reply_markup", "version"])
+            await MessageSearchToken.reindex(message.content)
         await upd.edit_message(peer.owner_id, {peer: message})
 
         return BotCallbackAnswer(cache_time=0)
@@ -287,6 +293,7 @@ async def botfather_callback_query_handler(peer: Peer, message: MessageRef, data
 
         async with in_transaction():
             await message.content.save(update_fields=["message", "entities", "reply_markup", "version"])
+            await MessageSearchToken.reindex(message.content)
         await upd.edit_message(peer.owner_id, {peer: message})
 
         return BotCallbackAnswer(cache_time=0)
@@ -12,7 +12,7 @@ from piltover.app.utils.utils import is_username_valid, BOT_COMMAND_NAME_REGEX
 from piltover.context import request_ctx
 from piltover.db.enums import BotFatherState, MediaType, PeerType
 from piltover.db.models import Peer, BotFatherUserState, Username, User, Bot, BotInfo, UserPhoto, BotCommand, State, \
-    MessageRef
+    MessageRef, PeerSearchToken
 from piltover.tl.types.internal_botfather import BotfatherStateNewbot, BotfatherStateEditbot
 
 _bot_name_invalid = "Sorry, this isn't a proper name for a bot."
@@ -112,6 +112,7 @@ class Text(BotInteractionHandler[BotFatherState, BotFatherUserState]):
             await State.create(user=bot_user)
             await Peer.create(owner=bot_user, type=PeerType.SELF, user=bot_user)
             await Username.create(user=bot_user, username=username)
+            await PeerSearchToken.index_user(bot_user.id)
             bot = await Bot.create(owner_id=peer.owner_id, bot=bot_user)
             await BotInfo.create(user=bot_user)
             await state.delete()
@@ -132,6 +133,7 @@ class Text(BotInteractionHandler[BotFatherState, BotFatherUserState]):
 
         async with in_transaction():
             await User.filter(id=bot.bot_id).update(first_name=first_name, version=F("version") + 1)
+            await PeerSearchToken.index_user(bot.bot_id)
             await state.delete()
 
         return await send_bot_message(peer, _bot_name_updated, entities=_bot_name_updated_entities)
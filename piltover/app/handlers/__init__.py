@@ -1,5 +1,8 @@
+from taskiq import TaskiqEvents
+
 from piltover.app.handlers import auth, updates, users, stories, account, messages, photos, contacts, langpack, \
     channels, upload, internal_web, help as help_, stickers, stubs, phone, internal
+from piltover.app.utils.utils import start_image_executor, shutdown_image_executor
 from piltover.worker import Worker
 
 
@@ -21,3 +24,6 @@ def register_handlers(worker_: Worker) -> None:
     worker_.register_handler(stickers.handler)
     worker_.register_handler(phone.handler)
     worker_.register_handler(internal.handler)
+
+    worker_.broker.add_event_handler(TaskiqEvents.WORKER_STARTUP, start_image_executor)
+    worker_.broker.add_event_handler(TaskiqEvents.WORKER_SHUTDOWN, shutdown_image_executor)
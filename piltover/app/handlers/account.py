@@ -21,7 +21,7 @@ from piltover.db.enums import PrivacyRuleKeyType, UserStatus, PushTokenType, Pee
 from piltover.db.models import User, UserAuthorization, Peer, Presence, Username, UserPassword, PrivacyRule, \
     UserPasswordReset, SentCode, PhoneCodePurpose, Theme, UploadingFile, Wallpaper, WallpaperSettings, \
     InstalledWallpaper, PeerColorOption, UserPersonalChannel, PeerNotifySettings, File, UserBackgroundEmojis, \
-    TaskIqScheduledDeleteUser, UserEmojiStatus, AuthKey, Channel, ProtectedUsername
+    TaskIqScheduledDeleteUser, UserEmojiStatus, AuthKey, Channel, ProtectedUsername, PeerSearchToken
 from piltover.enums import ReqHandlerFlags
 from piltover.exceptions import ErrorRpc, Unreachable
 from piltover.session import SessionManager
@@ -123,6 +123,7 @@ async def update_username(request: UpdateUsername, user: User) -> TLUserBase:
 
         user.version += 1
         await user.save(update_fields=["version"])
+        await PeerSearchToken.index_user(user.id)
 
     await upd.update_user_name(user)
     return await user.to_tl()
@@ -342,6 +343,8 @@ async def update_profile(request: UpdateProfile, user: User):
         user.version += 1
         to_update.append("version")
         await user.save(update_fields=to_update)
+        if "first_name" in to_update or "last_name" in to_update:
+            await PeerSearchToken.index_user(user.id)
         if "about" in to_update:
             await upd.update_user(user)
         else:
@@ -660,6 +663,7 @@ async def _delete_account(user_id: int) -> None:
         birthday=None,
         version=F("version") + 1,
     )
+    await PeerSearchToken.filter(user_id=user_id).delete()
 
     auths = await UserAuthorization.filter(user_id=user_id)
 
@@ -13,6 +13,7 @@ from piltover.app.handlers.messages.history import format_messages_internal, rea
 from piltover.app.handlers.messages.invites import user_join_chat_or_channel
 from piltover.app.handlers.messages.sending import send_message_internal
 from piltover.app.utils.utils import validate_username, check_password_internal
+from piltover.cache import Cache
 from piltover.config import APP_CONFIG
 from piltover.context import request_ctx
 from piltover.db.enums import MessageType, PeerType, ChatBannedRights, ChatAdminRights, PrivacyRuleKeyType, \
@@ -20,8 +21,8 @@ from piltover.db.enums import MessageType, PeerType, ChatBannedRights, ChatAdmin
 from piltover.db.models import User, Channel, Peer, Dialog, ChatParticipant, ReadState, PrivacyRule, \
     ChatInviteRequest, Username, ChatInvite, AvailableChannelReaction, Reaction, UserPassword, UserPersonalChannel, \
     Chat, PeerColorOption, File, SlowmodeLastMessage, AdminLogEntry, Contact, MessageRef, MessageContent, \
-    ReadHistoryChunk, DefaultSendAs, Stickerset, StickersetThumb, ProtectedUsername
-from piltover.db.models.channel import CREATOR_RIGHTS
+    ReadHistoryChunk, DefaultSendAs, Stickerset, StickersetThumb, ProtectedUsername, PeerSearchToken
+from piltover.db.models.channel import CREATOR_RIGHTS, ParticipantCounts
 from piltover.db.models.message_ref import append_channel_min_message_id_to_query_maybe
 from piltover.enums import ReqHandlerFlags
 from piltover.exceptions import ErrorRpc, Unreachable
@@ -33,7 +34,7 @@ from piltover.tl import MessageActionChannelCreate, UpdateChannel, Updates, \
     ReactionCustomEmoji, SendAsPeer, PeerUser, MessageActionChatEditPhoto, InputUserSelf, InputUser, \
     InputUserFromMessage, PeerColor, InputPeerChannel, InputChannelEmpty, Int, ChannelParticipantsBots, \
     ChannelParticipantsContacts, ChannelParticipantsMentions, ChannelParticipantsBanned, ChannelParticipantsKicked, \
-    ChannelParticipantLeft, PeerChannel, InputStickerSetEmpty, InputStickerSetID
+    ChannelParticipantLeft, PeerChannel, InputStickerSetEmpty, InputStickerSetID, LongVector
 from piltover.tl.functions.channels import GetAdminedPublicChannels, CheckUsername, \
     CreateChannel, GetChannels, GetFullChannel, EditTitle, EditPhoto, GetMessages, DeleteMessages, EditBanned, \
     EditAdmin, GetParticipants, GetParticipant, ReadHistory, InviteToChannel, InviteToChannel_133, ToggleSignatures, \
@@ -54,6 +55,9 @@ from piltover.worker import MessageHandler
 
 handler = MessageHandler("channels")
 
+_EPOCH = datetime.fromtimestamp(0, UTC)
+_PARTICIPANTS_CURSOR_TTL = 60 * 5
+
 
 @handler.on_request(CheckUsername, ReqHandlerFlags.BOT_NOT_ALLOWED)
 async def check_username(request: CheckUsername) -> bool:
@@ -128,6 +132,8 @@ async def update_username(request: UpdateUsername, user_id: int) -> bool:
         if protected is not None:
             await protected.delete()
 
+        await PeerSearchToken.index_channel(channel.id)
+
         await AdminLogEntry.create(
             channel=channel,
             user_id=user_id,
@@ -172,18 +178,21 @@ async def _create_channel(
 
 async def _add_user_to_channel(channel: Channel, peer_channel: Peer, user_id: int) -> ChatParticipant:
     user_is_creator = channel.creator_id == user_id
+    is_bot = await User.filter(id=user_id, bot=True).exists()
 
-    participant, _ = await ChatParticipant.update_or_create(
-        channel=channel,
-        user_id=user_id,
-        defaults={
-            "chat_channel_id": channel.make_id(),
-            "left": False,
-            "admin_rights": ChatAdminRights.from_tl(CREATOR_RIGHTS) if user_is_creator else ChatAdminRights.NONE,
-        },
-    )
-    if user_is_creator:
-        await channel.sync_admins_count(False)
+    async with in_transaction():
+        existing = await ChatParticipant.select_for_update().get_or_none(channel=channel, user_id=user_id)
+        counts_before = Channel.participant_counts(existing, is_bot)
+        participant, _ = await ChatParticipant.update_or_create(
+            channel=channel,
+            user_id=user_id,
+            defaults={
+                "chat_channel_id": channel.make_id(),
+                "left": False,
+                "admin_rights": ChatAdminRights.from_tl(CREATOR_RIGHTS) if user_is_creator else ChatAdminRights.NONE,
+            },
+        )
+        await channel.update_participants_counts([counts_before], [Channel.participant_counts(participant, is_bot)])
     await Dialog.create_or_unhide(user_id, peer_channel)
     await SessionManager.subscribe_to_channel(channel.id, [user_id])
 
@@ -413,9 +422,10 @@ async def get_full_channel(request: GetFullChannel, user_id: int) -> MessagesCha
 
             id=channel.make_id(),
             about=channel.description,
-            # TODO: use channel.participants_count
-            participants_count=await ChatParticipant.filter(channel=channel, left=False).count(),
+            participants_count=channel.participants_count,
             admins_count=channel.admins_count,
+            kicked_count=channel.kicked_count,
+            banned_count=channel.banned_count,
             read_inbox_max_id=in_read_max_id,
             read_outbox_max_id=out_read_max_id,
             unread_count=unread_count,
@@ -463,6 +473,7 @@ async def edit_channel_title(request: EditTitle, user_id: int) -> Updates:
 
     old_title = peer.channel.name
     await peer.channel.update(title=request.title)
+    await PeerSearchToken.index_channel(peer.channel_id)
 
     await AdminLogEntry.create(
         channel=peer.channel,
@@ -603,8 +614,9 @@ async def delete_messages(request: DeleteMessages, user_id: int) -> AffectedMess
         return AffectedMessages(pts=channel.pts, pts_count=0)
 
     async with in_transaction():
-        await MessageRef.filter(id__in=message_ids).delete()
+        deleted_count = await MessageRef.filter(id__in=message_ids).delete()
         await peer.sync_last_message()
+        await ReadState.delete_channel_messages(peer, message_ids, deleted_count)
 
     _, pts = await upd.delete_messages_channel(channel, message_ids)
 
@@ -653,6 +665,9 @@ async def edit_banned(request: EditBanned, user_id: int) -> Updates:
     if target_participant is not None:
         participant_tl_before = target_participant.to_tl_channel_with_creator(user_id, channel.creator_id)
 
+    target_is_bot = await User.filter(id=target_id, bot=True).exists()
+    counts_before = Channel.participant_counts(target_participant, target_is_bot)
+
     async with in_transaction():
         target_participant, created = await ChatParticipant.get_or_create(
             user_id=target_id,
@@ -673,7 +688,11 @@ async def edit_banned(request: EditBanned, user_id: int) -> Updates:
             target_participant.left = left
             target_participant.admin_rights = ChatAdminRights.NONE
             await target_participant.save(update_fields=["banned_rights", "banned_until", "left", "admin_rights"])
-            await channel.sync_admins_count(False)
+        await channel.update_participants_counts(
+            [counts_before], [Channel.participant_counts(target_participant, target_is_bot)],
+        )
+
+    await SessionManager.invalidate_context_values([target_id], participants=True)
 
     if new_banned_rights & ChatBannedRights.VIEW_MESSAGES:
         await ChatInviteRequest.filter(id__in=Subquery(
@@ -739,6 +758,8 @@ async def edit_admin(request: EditAdmin, user_id: int) -> Updates:
         return Updates(updates=[], users=[], chats=[], date=int(time()), seq=0)
 
     participant_tl_before = target_participant.to_tl_channel_with_creator(user_id, creator_id)
+    # Only admin rights are changed here, so bots count is not affected and is_bot does not matter
+    counts_before = Channel.participant_counts(target_participant, False)
 
     update_fields = []
     if request.rank != target_participant.admin_rank:
@@ -751,8 +772,12 @@ async def edit_admin(request: EditAdmin, user_id: int) -> Updates:
         target_participant.promoted_by_id = user_id
         update_fields.append("promoted_by_id")
 
-    await target_participant.save(update_fields=update_fields)
-    await channel.sync_admins_count(False)
+    async with in_transaction():
+        await target_participant.save(update_fields=update_fields)
+        await channel.update_participants_counts(
+            [counts_before], [Channel.participant_counts(target_participant, False)],
+        )
+    await SessionManager.invalidate_context_values([target_participant.user_id], participants=True)
 
     await AdminLogEntry.create(
         channel=channel,
@@ -784,25 +809,31 @@ async def get_participants(request: GetParticipants, user_id: int) -> ChannelPar
 
     filt = request.filter
 
-    view_value = ChatBannedRights.VIEW_MESSAGES.value
+    hide_anonymous = this_participant is None or not this_participant.is_admin \
+                     or isinstance(filt, ChannelParticipantsMentions)
     query = ChatParticipant.filter(channel=channel)
-    if this_participant is None or not this_participant.is_admin or isinstance(filt, ChannelParticipantsMentions):
-        anon_value = ChatAdminRights.ANONYMOUS.value
-        query = query.annotate(check_anon=RawSQL(f"admin_rights & {anon_value}")).filter(check_anon=0)
 
+    count: int | None = None
     if isinstance(filt, ChannelParticipantsRecent):
-        query = query.order_by("-invited_at")
+        query = query.filter(left=False)
+        count = channel.participants_count
     elif isinstance(filt, ChannelParticipantsAdmins):
-        query = query.filter(admin_rights__gt=0).order_by("user_id")
+        query = query.filter(admin_rights__gt=0)
+        count = channel.admins_count
     elif isinstance(filt, ChannelParticipantsSearch):
-        ...  # Handled below
+        query = query.filter(left=False)
+        if not filt.q:
+            count = channel.participants_count
     elif isinstance(filt, ChannelParticipantsBots):
-        query = query.filter(user__bot=True).order_by("user_id")
+        query = query.filter(left=False, user__bot=True)
+        count = channel.bots_count
     elif isinstance(filt, ChannelParticipantsContacts):
         query = query.filter(
-            user_id__in=Subquery(Contact.filter(owner_id=user_id).values_list("target_id", flat=True))
+            left=False,
+            user_id__in=Subquery(Contact.filter(owner_id=user_id).values_list("target_id", flat=True)),
         )
     elif isinstance(filt, ChannelParticipantsMentions):
+        query = query.filter(left=False)
         if filt.top_msg_id:
             query = query.filter(user_id__in=Subquery(
                 MessageRef.filter(
@@ -810,48 +841,76 @@ async def get_participants(request: GetParticipants, user_id: int) -> ChannelPar
                 ).distinct().values_list("content__author_id", flat=True)
             ))
     elif isinstance(filt, ChannelParticipantsBanned):
-        query = query.annotate(
-            check_view_banned=RawSQL(f"banned_rights & {view_value}"),
-        ).filter(banned_rights__gt=0, check_view_banned=0)
+        query = ChatParticipant.filter_banned(query)
+        count = channel.banned_count
     elif isinstance(filt, ChannelParticipantsKicked):
-        query = query.annotate(
-            check_view_banned=RawSQL(f"banned_rights & {view_value}"),
-        ).filter(check_view_banned__not=0)
+        query = ChatParticipant.filter_kicked(query)
+        count = channel.kicked_count
     else:
         raise Unreachable
 
     if isinstance(filt, (
             ChannelParticipantsSearch, ChannelParticipantsContacts, ChannelParticipantsMentions,
             ChannelParticipantsBanned, ChannelParticipantsKicked,
-    )):
-        if filt.q:
-            query = query.filter(Q(
-                user__first_name__icontains=filt.q,
-                user__username__username__icontains=filt.q,
-            ))
-        query = query.order_by("user_id")
+    )) and filt.q:
+        query = query.filter(PeerSearchToken.match_users(filt.q))
+        count = None
 
-    limit = max(min(request.limit, 100), 1)
-    participants = await query.select_related("user").limit(limit).offset(request.offset)
+    if hide_anonymous:
+        anon_value = ChatAdminRights.ANONYMOUS.value
+        query = query.annotate(check_anon=RawSQL(f"admin_rights & {anon_value}"))
+        if count is not None:
+            # Channel counters include anonymous admins, which are not returned to this user
+            count -= await query.filter(check_anon__gt=0).count()
+        query = query.filter(check_anon=0)
 
-    participants_tl: list[TLChannelParticipantBase] = []
-    users_to_tl: list[User] = []
+    recent = isinstance(filt, ChannelParticipantsRecent)
+    query = query.order_by("-invited_at", "-id") if recent else query.order_by("user_id")
 
-    peers_to_create: list[Peer] = []
+    limit = max(min(request.limit, 100), 1)
+    offset = max(request.offset, 0)
+
+    # Clients paginate participants by offset, so position of the last returned participant is remembered for
+    #  the offset that client will request next, and next page is fetched starting from that position
+    #  instead of skipping `offset` rows
+    cursor_key = f"channel-participants:{user_id}:{channel.id}:{int(hide_anonymous)}:{filt.write().hex()}"
+    cursor: LongVector | None = None
+    if offset:
+        cursor = await Cache.obj.get(f"{cursor_key}:{offset}")
+
+    if cursor is not None:
+        count = count if count is not None else cursor[0]
+        if recent:
+            invited_at = _EPOCH + timedelta(microseconds=cursor[1])
+            query = query.filter(Q(invited_at__lt=invited_at) | Q(invited_at=invited_at, id__lt=cursor[2]))
+        else:
+            query = query.filter(user_id__gt=cursor[1])
+        participants = await query.select_related("user").limit(limit)
+    else:
+        participants = await query.select_related("user").limit(limit).offset(offset)
 
-    for participant in participants:
-        if participant.user_id != user_id:
-            peers_to_create.append(Peer(owner_id=user_id, user=participant.user, type=PeerType.USER))
+    if count is None:
+        count = await query.count()
+
+    if participants:
+        last = participants[-1]
+        if recent:
+            next_cursor = [count, (last.invited_at - _EPOCH) // timedelta(microseconds=1), last.id]
+        else:
+            next_cursor = [count, last.user_id]
+        await Cache.obj.set(
+            f"{cursor_key}:{offset + len(participants)}", LongVector(next_cursor), ttl=_PARTICIPANTS_CURSOR_TTL,
+        )
 
-    if peers_to_create:
-        await Peer.bulk_create(peers_to_create, ignore_conflicts=True)
+    participants_tl: list[TLChannelParticipantBase] = []
+    users_to_tl: list[User] = []
 
     for participant in participants:
         participants_tl.append(participant.to_tl_channel_with_creator(user_id, creator_id=channel.creator_id))
         users_to_tl.append(participant.user)
 
     return ChannelParticipants(
-        count=await query.count(),
+        count=count,
         participants=participants_tl,
         chats=[await channel.to_tl()],
         users=await User.to_tl_bulk(users_to_tl),
@@ -897,7 +956,7 @@ async def read_channel_history(request: ReadHistory, user_id: int) -> bool:
         user_id, request.channel, message="CHANNEL_PRIVATE", code=406, peer_types=(PeerType.CHANNEL,)
     )
 
-    read_state, created = await ReadState.get_or_create(owner_id=user_id, peer=peer)
+    read_state, = await ReadState.for_peers_bulk(user_id, [peer])
     if request.max_id <= read_state.last_message_id:
         return True
 
@@ -917,8 +976,7 @@ async def read_channel_history(request: ReadHistory, user_id: int) -> bool:
 
     unread_count = await MessageRef.filter(peer=peer, id__gt=unread_max_id).count()
 
-    read_state.last_message_id = unread_max_id
-    await read_state.save(update_fields=["last_message_id"])
+    await read_state.set_read(peer, unread_max_id, unread_count)
 
     await ReadHistoryChunk.create(user_id=user_id, peer=peer, read_content_id=content_id)
 
@@ -966,6 +1024,7 @@ async def invite_to_channel(request: InviteToChannel, user_id: int) -> InvitedUs
             raise ErrorRpc(error_code=400, error_message="USER_ID_INVALID")
         user_ids.add(peer_id)
 
+    await Peer.create_user_peers_bulk(user_id, user_ids)
     peer_user_ids = set(cast(
         list[int],
         await Peer.filter(owner_id=user_id, user_id__in=user_ids).values_list("user_id", flat=True)
@@ -975,7 +1034,9 @@ async def invite_to_channel(request: InviteToChannel, user_id: int) -> InvitedUs
 
     existing_participants = {
         participant.user_id: participant
-        for participant in await ChatParticipant.filter(user_id__in=user_ids, channel_id=channel.id).only("id", "left")
+        for participant in await ChatParticipant.filter(user_id__in=user_ids, channel_id=channel.id).only(
+            "id", "user_id", "left", "admin_rights", "banned_rights",
+        )
     }
 
     privacy_rules = await PrivacyRule.has_access_to_bulk(user_ids, user_id, [PrivacyRuleKeyType.CHAT_INVITE])
@@ -983,6 +1044,7 @@ async def invite_to_channel(request: InviteToChannel, user_id: int) -> InvitedUs
     added_user_ids: list[int] = []
     participants_to_create: list[ChatParticipant] = []
     participants_to_update: list[ChatParticipant] = []
+    counts_before: list[ParticipantCounts] = []
 
     for input_user in request.users[:100]:
         _, peer_user_id = Peer.type_and_id_from_input_raise(user_id, input_user)
@@ -999,13 +1061,23 @@ async def invite_to_channel(request: InviteToChannel, user_id: int) -> InvitedUs
                 min_message_id=channel.min_available_id,
             ))
         else:
+            # Participant is left, so whether it is a bot does not affect its counts
+            counts_before.append(Channel.participant_counts(existing_participant, False))
             existing_participant.left = False
             participants_to_update.append(existing_participant)
 
-    if participants_to_create:
-        await ChatParticipant.bulk_create(participants_to_create, ignore_conflicts=True)
-    if participants_to_update:
-        await ChatParticipant.bulk_update(participants_to_update, fields=["left"])
+    if added_user_ids:
+        bot_ids = set(await User.filter(id__in=added_user_ids, bot=True).values_list("id", flat=True))
+        counts_after = [
+            Channel.participant_counts(participant, participant.user_id in bot_ids)
+            for participant in (*participants_to_create, *participants_to_update)
+        ]
+        async with in_transaction():
+            if participants_to_create:
+                await ChatParticipant.bulk_create(participants_to_create, ignore_conflicts=True)
+            if participants_to_update:
+                await ChatParticipant.bulk_update(participants_to_update, fields=["left"])
+            await channel.update_participants_counts(counts_before, counts_after)
     await ChatInviteRequest.filter(id__in=Subquery(
         ChatInviteRequest.filter(
             user_id__in=added_user_ids, invite__channel=channel,
@@ -1162,6 +1234,7 @@ async def delete_channel(request: DeleteChannel, user_id: int) -> Updates:
     channel.deleted = True
     channel.version += 1
     await channel.save(update_fields=["deleted", "version"])
+    await PeerSearchToken.filter(channel=channel).delete()
 
     await UserPersonalChannel.filter(channel=channel).delete()
     await _unlink_channel_maybe(channel)
@@ -1203,13 +1276,20 @@ async def edit_creator(request: EditCreator, user_id: int) -> Updates:
         channel.version += 1
         await channel.save(update_fields=["creator_id", "version"])
 
+        # Only admin rights are changed here, so bots count is not affected and is_bot does not matter
+        counts_before = [
+            Channel.participant_counts(participant, False), Channel.participant_counts(target_participant, False),
+        ]
         participant.admin_rights = ChatAdminRights(0)
         target_participant.admin_rights = ChatAdminRights.from_tl(CREATOR_RIGHTS)
         await ChatParticipant.bulk_update([participant, target_participant], fields=["admin_rights"])
-        await channel.sync_admins_count(False)
+        await channel.update_participants_counts(counts_before, [
+            Channel.participant_counts(participant, False), Channel.participant_counts(target_participant, False),
+        ])
 
         await _unlink_channel_maybe(channel)
 
+    await SessionManager.invalidate_context_values([user_id, target_id], participants=True)
     return await upd.update_channel(channel, send_to_users=[user_id, target_id])
 
 
@@ -1260,9 +1340,15 @@ async def leave_channel(request: LeaveChannel, user_id: int) -> Updates:
     if participant is None:
         raise ErrorRpc(error_code=400, error_message="USER_NOT_PARTICIPANT")
 
+    is_bot = await User.filter(id=user_id, bot=True).exists()
+    counts_before = Channel.participant_counts(participant, is_bot)
+
     async with in_transaction():
         participant.left = True
         await participant.save(update_fields=["left"])
+        await peer.channel.update_participants_counts(
+            [counts_before], [Channel.participant_counts(participant, is_bot)],
+        )
         await ChatInvite.filter(channel=peer.channel, user_id=user_id).update(revoked=True)
         await Dialog.hide(user_id, peer)
         await MessageContent.filter(id__in=Subquery(
@@ -1274,6 +1360,7 @@ async def leave_channel(request: LeaveChannel, user_id: int) -> Updates:
             action=AdminLogEntryAction.PARTICIPANT_LEAVE,
         )
 
+    await SessionManager.invalidate_context_values([user_id], participants=True)
     return await upd.update_channel_for_user(peer.channel, user_id)
 
 
@@ -1793,8 +1880,9 @@ async def delete_history(request: DeleteHistory, user_id: int) -> Updates:
 
     message_ids.pop(0)
     async with in_transaction():
-        await MessageRef.filter(id__in=message_ids).delete()
+        deleted_count = await MessageRef.filter(id__in=message_ids).delete()
         await peer.sync_last_message()
+        await ReadState.delete_channel_messages(peer, message_ids, deleted_count)
     updates, _ = await upd.delete_messages_channel(channel, message_ids)
     return updates
 
@@ -1830,8 +1918,9 @@ async def delete_participant_history(request: DeleteParticipantHistory, user_id:
         offset_id = messages_to_delete.pop()
 
     async with in_transaction():
-        await MessageRef.filter(id__in=messages_to_delete).delete()
+        deleted_count = await MessageRef.filter(id__in=messages_to_delete).delete()
         await peer.sync_last_message()
+        await ReadState.delete_channel_messages(peer, messages_to_delete, deleted_count)
 
     _, new_pts = await upd.delete_messages_channel(channel, messages_to_delete)
     return AffectedHistory(
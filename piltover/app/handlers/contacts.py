@@ -12,9 +12,10 @@ import piltover.app.utils.updates_manager as upd
 from piltover.config import APP_CONFIG
 from piltover.db.enums import PeerType, PrivacyRuleKeyType
 from piltover.db.models import User, Peer, Contact, Username, Dialog, Presence, Channel, PrivacyRuleException, \
-    PrivacyRule
+    PrivacyRule, PeerSearchToken
 from piltover.enums import ReqHandlerFlags
 from piltover.exceptions import ErrorRpc, Unreachable
+from piltover.session import SessionManager
 from piltover.tl import ContactBirthday, Updates, Contact as TLContact, PeerBlocked, ImportedContact, \
     ExportedContactToken, Long, TLObjectVector, PeerUser, ContactStatus, PeerChannel, LongVector
 from piltover.tl.functions.contacts import ResolveUsername, GetBlocked, Search, GetTopPeers, GetStatuses, \
@@ -121,17 +122,36 @@ async def get_blocked(request: GetBlocked, user_id: int) -> Blocked | BlockedSli
 async def contacts_search(request: Search, user_id: int) -> Found:
     limit = max(1, min(100, request.limit))
 
-    results = await Username.filter(
-        user_id__not_in=Subquery(Contact.filter(owner_id=user_id).values("target_id")),
-        user_id__not=user_id,
-        username__contains=request.q.lower(),
-    ).select_related("user", "channel").limit(limit)
+    contact_ids = Subquery(Contact.filter(owner_id=user_id).values_list("target_id", flat=True))
 
+    my_results: list[TLPeerBase] = []
     peers: list[TLPeerBase] = []
     users = []
     channels = []
 
+    found_contacts = await Contact.filter(
+        PeerSearchToken.match_users(request.q, "target_id"), owner_id=user_id,
+    ).select_related("target").order_by("target_id").limit(limit)
+    for contact in found_contacts:
+        my_results.append(PeerUser(user_id=contact.target_id))
+        users.append(contact.target)
+
+    public_query = PeerSearchToken.search_public(request.q)
+    results = []
+    if public_query is not None:
+        # Same peer may be matched by its username and by words of its title
+        results = await public_query.filter(
+            Q(user_id__isnull=True) | Q(user_id__not_in=contact_ids, user_id__not=user_id),
+        ).select_related("user", "channel").limit(limit * 2)
+
+    seen: set[tuple[int | None, int | None]] = set()
     for result in results:
+        if (result.user_id, result.channel_id) in seen:
+            continue
+        if len(seen) >= limit:
+            break
+        seen.add((result.user_id, result.channel_id))
+
         if result.user is not None:
             peers.append(PeerUser(user_id=cast(int, result.user_id)))
             users.append(result.user)
@@ -160,7 +180,7 @@ async def contacts_search(request: Search, user_id: int) -> Found:
         ])
 
     return Found(
-        my_results=[],
+        my_results=my_results,
         results=peers,
         chats=await Channel.to_tl_bulk(channels),
         users=await User.to_tl_bulk(users),
@@ -179,9 +199,9 @@ async def get_top_peers():  # pragma: no cover
 
 @handler.on_request(GetStatuses, ReqHandlerFlags.BOT_NOT_ALLOWED | ReqHandlerFlags.DONT_FETCH_USER)
 async def get_statuses(user_id: int) -> list[ContactStatus]:
-    statuses = await Presence.filter(user_id__in=Subquery(
-        Contact.filter(owner_id=user_id).values_list("target_id", flat=True)
-    ))
+    statuses = await Presence.get_many(
+        await Contact.filter(owner_id=user_id).values_list("target_id", flat=True)
+    )
 
     return TLObjectVector([
         ContactStatus(user_id=status.user_id, status=await status.to_tl(None))
@@ -387,6 +407,8 @@ async def import_contacts(request: ImportContacts, user_id: int) -> ImportedCont
         await Contact.bulk_create(to_create)
     if phones_to_delete:
         await Contact.filter(owner_id=user_id, phone_number__in=phones_to_delete).delete()
+    if to_update or to_create or phones_to_delete:
+        await SessionManager.invalidate_context_values([user_id], users=True)
 
     # TODO: updates?
 
@@ -12,7 +12,7 @@ from piltover.app.handlers.messages.sending import send_created_messages_interna
 from piltover.config import SYSTEM_CONFIG
 from piltover.db.enums import PeerType
 from piltover.db.models import Peer, MessageRef, MessageContent, User, Presence, MessageDraft, Channel, \
-    TaskIqScheduledMessage, TelegramUser
+    TaskIqScheduledMessage, TelegramUser, ReadState
 from piltover.db.models.peer import PeerChannelT
 from piltover.enums import ReqHandlerFlags
 from piltover.tl import TLObject
@@ -89,6 +89,7 @@ async def delete_scheduled_message(request: DeleteScheduledMessage) -> TLObject:
                 regular_messages[message.peer.owner_id].append(message.id)
 
         await MessageContent.filter(id=request.message_id).delete()
+        await ReadState.sync_unread_bulk([message.peer_id for message in to_delete])
 
         if regular_messages:
             await upd.delete_messages(None, regular_messages)
@@ -170,7 +171,7 @@ async def update_status_for_peers(request: UpdateStatusForPeers) -> TLObject:
 
     peer_type = PeerType(request.peer_type)
 
-    peer_users: list[User]
+    peer_users: list[int]
     if peer_type is PeerType.USER:
         if request.peer_user == 777000:
             return TaggedBool(value=True)
@@ -178,11 +179,11 @@ async def update_status_for_peers(request: UpdateStatusForPeers) -> TLObject:
                 owner_id=request.peer_user, user_id=request.peer_owner, blocked_at__not_isnull=True
         ).exists():
             return TaggedBool(value=True)
-        peer_users = [await User.get(id=request.peer_user).only("id")]
+        peer_users = [request.peer_user]
     elif peer_type is PeerType.CHAT:
         peer_users = await User.filter(
             chatparticipants__chat_id=request.peer_chat, id__not=request.peer_owner
-        ).only("id")
+        ).values_list("id", flat=True)
     else:
         return TaggedBool(value=False)
 
@@ -11,9 +11,10 @@ from piltover.app.utils.utils import get_chat_or_channel_from_peer
 from piltover.config import APP_CONFIG
 from piltover.context import request_ctx
 from piltover.db.enums import PeerType, MessageType, PrivacyRuleKeyType, ChatBannedRights, ChatAdminRights, FileType, \
-    UserStatus, AdminLogEntryAction
+    AdminLogEntryAction
 from piltover.db.models import User, Peer, Chat, File, UploadingFile, ChatParticipant, PrivacyRule, \
-    ChatInviteRequest, ChatInvite, Channel, Dialog, Presence, AdminLogEntry, MessageRef, MessageContent
+    ChatInviteRequest, ChatInvite, Channel, Dialog, Presence, AdminLogEntry, MessageRef, MessageContent, ReadState, \
+    MessageSearchToken
 from piltover.db.models.channel import CREATOR_RIGHTS
 from piltover.db.models.peer import PeerChatT, InputPeers
 from piltover.enums import ReqHandlerFlags
@@ -60,6 +61,7 @@ async def create_chat(request: CreateChat, user_id: int) -> InvitedUsers:
 
     invited_peers: list[Peer] = []
     if invited_user_ids:
+        await Peer.create_user_peers_bulk(user_id, invited_user_ids)
         invited_peers = await Peer.filter(owner_id=user_id, user_id__in=invited_user_ids)
 
     invited_users_ids = []
@@ -359,10 +361,12 @@ async def add_chat_user(request: AddChatUser, user_id: int) -> InvitedUsers:
                     for message in messages_to_forward
                 ])
                 await chat_peers[user_peer_id].sync_last_message()
+                await ReadState.add_unread_bulk([chat_peers[user_peer_id]], len(messages_to_forward))
             content_ids = [message.content_id for message in messages_to_forward]
             new_messages = await MessageRef.filter(
                 peer=chat_peers[user_peer_id], content_id__in=content_ids,
             ).order_by("id").select_related(*MessageRef.PREFETCH_FIELDS)
+            await MessageSearchToken.index(new_messages)
             await upd.send_messages({chat_peers[user_peer_id]: new_messages})
 
     user = await User.get(id=user_id).only("id")
@@ -611,6 +615,7 @@ async def migrate_chat(request: MigrateChat, user_id: int) -> Updates:
 
         await ChatParticipant.bulk_create(participants_to_create)
         await Dialog.bulk_create(dialogs_to_create)
+        await channel.sync_participants_counts(False)
         await Dialog.filter(id__in=Subquery(
             Dialog.filter(peer__chat=chat).values_list("id", flat=True)
         )).update(visible=False)
@@ -647,13 +652,10 @@ async def get_onlines(request: GetOnlines, user_id: int) -> ChatOnlines:
 
     chat_or_channel = await get_chat_or_channel_from_peer(user_id, request.peer)
 
-    onlines = await Presence.filter(
-        status=UserStatus.ONLINE, last_seen__gt=datetime.now(UTC) - timedelta(minutes=1), user_id__in=Subquery(
-            ChatParticipant.filter(
-                **Chat.or_channel(chat_or_channel), left=False,
-            ).values_list("user_id", flat=True)
-        )
-    ).count()
+    onlines = await Presence.count_online(
+        ChatParticipant.filter(**Chat.or_channel(chat_or_channel), left=False).values_list("user_id", flat=True),
+        datetime.now(UTC) - timedelta(minutes=1),
+    )
 
     return ChatOnlines(onlines=onlines)
 
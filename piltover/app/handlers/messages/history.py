@@ -1,3 +1,4 @@
+from collections import defaultdict
 from datetime import datetime, UTC
 from time import time
 from typing import cast
@@ -16,7 +17,7 @@ from piltover.db.enums import MediaType, PeerType, FileType, MessageType, ChatAd
     READABLE_FILE_TYPES
 from piltover.db.models import User, MessageDraft, ReadState, State, Peer, ChannelPostInfo, MessageMention, \
     ReadHistoryChunk, AdminLogEntry, MessageRef, MessageMediaRead, ChatParticipant, DiscussionReadState, MessageContent, \
-    MessageUniqueView, Channel, Chat
+    MessageUniqueView, Channel, Chat, MessageSearchToken
 from piltover.db.models.message_ref import append_channel_min_message_id_to_query_maybe
 from piltover.db.models.utils import DatetimeToUnix
 from piltover.enums import ReqHandlerFlags
@@ -67,12 +68,9 @@ def message_filter_to_query(filter_: MessagesFilterBase | None, peer: Peer | Non
                 | Q(content__media__file__type=FileType.DOCUMENT_VIDEO_NOTE)
         )
     elif isinstance(filter_, InputMessagesFilterUrl):
-        # TODO: add `has_url` field to message that will be calculated only once time when sending/editing a message
-        return (
-                Q(content__message__icontains="https://")
-                | Q(content__message__icontains="http://")
-                | Q(content__message__icontains="t.me/")
-        )
+        if peer is not None:
+            return MessageSearchToken.url_query(peer_id=peer.id)
+        return MessageSearchToken.url_query(owner_id=user_id)
     elif isinstance(filter_, InputMessagesFilterChatPhotos):
         return Q(content__type=MessageType.SERVICE_CHAT_EDIT_PHOTO)
     elif isinstance(filter_, InputMessagesFilterMyMentions):
@@ -128,7 +126,10 @@ async def get_messages_query_internal(
         query &= Q(content__type=MessageType.REGULAR)
 
     if q:
-        query &= Q(content__message__icontains=q)
+        if isinstance(peer, Peer):
+            query &= MessageSearchToken.query(q, peer_id=peer.id)
+        else:
+            query &= MessageSearchToken.query(q, owner_id=peer.id)
 
     if from_user_id:
         query &= Q(content__author_id=from_user_id)
@@ -470,7 +471,7 @@ async def read_history(request: ReadHistory, user_id: int) -> AffectedMessages:
     peer = await Peer.from_input_peer_raise(
         user_id, request.peer, peer_types=(PeerType.SELF, PeerType.USER, PeerType.CHAT)
     )
-    read_state, created = await ReadState.get_or_create(owner_id=user_id, peer=peer)
+    read_state, = await ReadState.for_peers_bulk(user_id, [peer])
     state, _ = await State.get_or_create(user_id=user_id)
 
     if request.max_id and request.max_id <= read_state.last_message_id:
@@ -499,10 +500,9 @@ async def read_history(request: ReadHistory, user_id: int) -> AffectedMessages:
     old_last_message_id = read_state.last_message_id
     unread_count = await MessageRef.filter(peer=peer, id__gt=max_id).count()
 
-    read_state.last_message_id = max_id
+    await read_state.set_read(peer, max_id, unread_count)
     if peer.type is PeerType.SELF:
         await peer.update_max_read_id(max_id)
-    await read_state.save(update_fields=["last_message_id"])
 
     await ReadHistoryChunk.create(user_id=user_id, peer=peer, read_content_id=content_id)
 
@@ -837,6 +837,7 @@ async def read_mentions(request: ReadMentions, user_id: int) -> AffectedHistory:
         )
 
     await MessageMention.filter(id__in=mention_ids).update(unread_target_id=None)
+    await ReadState.filter(owner_id=user_id, peer=peer).update(unread_mentions_count=0)
 
     inval_cache_query = MessageRef.filter(content_id__in=mentioned_ids)
     if peer.type is PeerType.CHANNEL:
@@ -934,6 +935,14 @@ async def read_message_contents_internal(user_id: int, valid_refs: list[MessageR
     if mentions:
         await MessageMention.bulk_update(mentions, fields=["unread_target_id"])
 
+    read_mentions_by_peer: defaultdict[int, int] = defaultdict(int)
+    for mention in mentions:
+        read_mentions_by_peer[ref_by_content_id[mention.message_id].peer_id] += 1
+    read_reactions_by_peer: defaultdict[int, int] = defaultdict(int)
+    for content_id in unread_reaction_ids:
+        read_reactions_by_peer[ref_by_content_id[content_id].peer_id] += 1
+    await ReadState.read_contents(user_id, read_mentions_by_peer, read_reactions_by_peer)
+
     if media_read_to_create:
         await MessageMediaRead.bulk_create(media_read_to_create)
 
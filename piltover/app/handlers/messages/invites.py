@@ -290,13 +290,20 @@ async def user_join_chat_or_channel(chat_or_channel: ChatBase, user: User, from_
         else:
             raise Unreachable
 
-        await ChatParticipant.update_or_create(user_id=user.id, **Chat.or_channel(chat_or_channel), defaults={
-            "inviter_id": from_invite.user_id if from_invite is not None else 0,
-            "invite": from_invite,
-            "min_message_id": min_message_id,
-            "left": False,
-            "chat_channel_id": chat_or_channel.make_id(),
-        })
+        existing_participant = await ChatParticipant.select_for_update().get_or_none(
+            user_id=user.id, **Chat.or_channel(chat_or_channel),
+        )
+        counts_before = Channel.participant_counts(existing_participant, user.bot)
+
+        participant, _ = await ChatParticipant.update_or_create(
+            user_id=user.id, **Chat.or_channel(chat_or_channel), defaults={
+                "inviter_id": from_invite.user_id if from_invite is not None else 0,
+                "invite": from_invite,
+                "min_message_id": min_message_id,
+                "left": False,
+                "chat_channel_id": chat_or_channel.make_id(),
+            },
+        )
         await ChatInviteRequest.filter(id__in=Subquery(
             ChatInviteRequest.filter(
                 Chat.query(chat_or_channel, "invite") & Q(user_id=user.id)
@@ -310,6 +317,9 @@ async def user_join_chat_or_channel(chat_or_channel: ChatBase, user: User, from_
                 # TODO: PARTICIPANT_JOIN_INVITE / PARTICIPANT_JOIN_REQUEST
                 action=AdminLogEntryAction.PARTICIPANT_JOIN,
             )
+            await chat_or_channel.update_participants_counts(
+                [counts_before], [Channel.participant_counts(participant, user.bot)],
+            )
 
     if isinstance(chat_or_channel, Channel):
         await SessionManager.subscribe_to_channel(chat_or_channel.id, [user.id])
@@ -479,6 +489,10 @@ async def add_requested_users_to_chat(user: User, chat: ChatBase, requests: list
             chat_channel_id=chat.make_id(),
         ))
 
+    existing_user_ids = set(cast(list[int], await ChatParticipant.filter(
+        **Chat.or_channel(chat), user_id__in=requested_users,
+    ).values_list("user_id", flat=True)))
+
     await Peer.bulk_create(peers_to_create, ignore_conflicts=True)
     await ChatParticipant.bulk_create(participants_to_create, ignore_conflicts=True)
     await ChatInviteRequest.filter(id__in=Subquery(
@@ -492,6 +506,12 @@ async def add_requested_users_to_chat(user: User, chat: ChatBase, requests: list
         await upd.update_chat_participants(chat, chat_peers)
     elif isinstance(chat, Channel):
         # TODO: send SERVICE_CHAT_USER_INVITE_JOIN and SERVICE_CHAT_USER_REQUEST_JOIN
+        # Participants that already existed are not changed by bulk_create with ignore_conflicts
+        await chat.update_participants_counts([], [
+            Channel.participant_counts(participant, participant.user.bot)
+            for participant in participants_to_create
+            if participant.user.id not in existing_user_ids
+        ])
         await SessionManager.subscribe_to_channel(chat.id, requested_users)
         return await upd.update_channel_for_user(chat, user.id)
     else:
@@ -572,7 +592,7 @@ async def hide_all_chat_join_requests(request: HideAllChatJoinRequests, user_id:
             raise ErrorRpc(error_code=400, error_message="INVITE_HASH_EXPIRED")
         query &= Q(invite=invite)
 
-    requests = await ChatInviteRequest.filter(query)
+    requests = await ChatInviteRequest.filter(query).select_related("user", "invite")
     if not requests:
         raise ErrorRpc(error_code=400, error_message="HIDE_REQUESTER_MISSING")
 
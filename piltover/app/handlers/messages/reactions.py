@@ -10,7 +10,7 @@ from piltover.config import APP_CONFIG
 from piltover.cache import Cache
 from piltover.db.enums import PeerType, FileType, MessageType
 from piltover.db.models import Reaction, User, Peer, MessageReaction, State, RecentReaction, UserReactionsSettings, \
-    MessageRef, AvailableChannelReaction, File, MessageContent
+    MessageRef, AvailableChannelReaction, File, MessageContent, ReadState
 from piltover.db.models.message_ref import append_channel_min_message_id_to_query_maybe
 from piltover.enums import ReqHandlerFlags
 from piltover.exceptions import ErrorRpc
@@ -125,6 +125,7 @@ async def send_reaction(request: SendReaction, user_id: int) -> Updates:
             await MessageReaction.filter(id__in=Subquery(reactions_q)).delete()
 
     author_reactions_unread: F | bool = F("author_reactions_unread")
+    reactions_were_unread = message.content.author_reactions_unread
 
     if reaction is not None or custom_reaction is not None:
         await MessageReaction.create(
@@ -141,6 +142,8 @@ async def send_reaction(request: SendReaction, user_id: int) -> Updates:
         author_reactions_unread=author_reactions_unread,
     )
     await message.content.refresh_from_db(["reactions_version", "author_reactions_unread"])
+    if author_reactions_unread is True and not reactions_were_unread:
+        await ReadState.add_unread_reactions(message.content.author_id, message.content_id)
 
     # TODO: send UpdateMessage update instead of UpdateMessageReactions
     #  (use upd.edit_message instead of upd.update_reactions)
@@ -247,6 +250,7 @@ async def read_reactions(request: ReadReactions, user_id: int) -> AffectedHistor
         reactions_version=F("reactions_version") + 1,
         author_reactions_unread=False,
     )
+    await ReadState.filter(owner_id=user_id, peer=peer).update(unread_reactions_count=0)
 
     pts = await State.add_pts(user_id, 0)
 
@@ -6,7 +6,7 @@ from tortoise.expressions import Q
 import piltover.app.utils.updates_manager as upd
 from piltover.app.handlers.messages.dialogs import get_dialogs_internal, format_dialogs
 from piltover.app.handlers.messages.history import get_messages_internal, format_messages_internal
-from piltover.db.models import SavedDialog, Peer, State, MessageRef
+from piltover.db.models import SavedDialog, Peer, State, MessageRef, ReadState
 from piltover.db.models.peer import PeerSelfT
 from piltover.enums import ReqHandlerFlags
 from piltover.exceptions import ErrorRpc
@@ -65,7 +65,9 @@ async def delete_saved_history(request: DeleteSavedHistory, user_id: int) -> Aff
     if len(ids) > 1000:
         offset = ids.pop()
 
+    affected_peer_ids = await MessageRef.filter(id__in=ids).distinct().values_list("peer_id", flat=True)
     await MessageRef.filter(id__in=ids).delete()
+    await ReadState.sync_unread_bulk(affected_peer_ids)
     pts = await upd.delete_messages(user_id, {user_id: ids})
 
     return AffectedHistory(pts=pts, pts_count=len(ids), offset=offset)
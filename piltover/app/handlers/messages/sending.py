@@ -18,7 +18,8 @@ from piltover.db.enums import MediaType, MessageType, PeerType, ChatBannedRights
 from piltover.db.models import User, Dialog, MessageDraft, State, Peer, MessageMedia, File, Presence, UploadingFile, \
     SavedDialog, ChatParticipant, ChannelPostInfo, Poll, PollAnswer, MessageMention, \
     TaskIqScheduledMessage, TaskIqScheduledDeleteMessage, Contact, RecentSticker, InlineQueryResultItem, Channel, \
-    SlowmodeLastMessage, MessageRef, MessageContent, ReadState, Username, MessageFwdHeader
+    SlowmodeLastMessage, MessageRef, MessageContent, ReadState, Username, MessageFwdHeader, \
+    MessageSearchToken
 from piltover.db.models.message_ref import append_channel_min_message_id_to_query_maybe
 from piltover.enums import ReqHandlerFlags
 from piltover.exceptions import ErrorRpc, Unreachable
@@ -110,6 +111,10 @@ async def send_created_messages_internal(
 
         if unread_mentions_to_create:
             await MessageMention.bulk_create(unread_mentions_to_create)
+            mentioned_ids = {mentioned_user.id for mentioned_user in mentioned_users}
+            await ReadState.add_unread_mentions(
+                list(mentioned_ids), [chat_peer for chat_peer in messages if chat_peer.owner_id in mentioned_ids],
+            )
 
     if clear_draft and ctx is not None:
         await ctx.worker.call_internal(ClearDraft(user_id=user.id, peer_id=peer.id))
@@ -150,6 +155,9 @@ async def send_created_messages_internal(
 
             if unread_mentions_to_create:
                 await MessageMention.bulk_create(unread_mentions_to_create)
+                await ReadState.add_unread_mentions(
+                    [mentioned_user.id for mentioned_user in mentioned_users], [message_ref.peer_id],
+                )
 
         if message_ref.content.type is MessageType.REGULAR \
                 and message_ref.peer.owner_id is None \
@@ -303,6 +311,7 @@ async def send_message_internal(
 
         await ReadState.update_or_create(owner_id=user.id, peer_id=peer.id, defaults={
             "last_message_id": message.id,
+            "unread_count": 0,
         })
 
         if peer.type is PeerType.CHANNEL:
@@ -660,6 +669,7 @@ async def delete_messages(request: DeleteMessages, user_id: int) -> AffectedMess
     async with in_transaction():
         await MessageRef.filter(id__in=all_ids).delete()
         await Peer.sync_last_message_bulk(peer_ids)
+        await ReadState.sync_unread_bulk(peer_ids)
     pts = await upd.delete_messages(user_id, messages)
 
     return AffectedMessages(pts=pts, pts_count=len(all_ids))
@@ -758,6 +768,8 @@ async def edit_message(request: EditMessage | EditMessage_133, user: User):
     await content.save(update_fields=[
         "message", "entities", "media_id", "edit_date", "edit_hide", "reply_markup", "scheduled_date", "version",
     ])
+    if message_text is not None:
+        await MessageSearchToken.reindex(content)
     if editing_schedule_date:
         await TaskIqScheduledMessage.filter(message=message).update(scheduled_time=request.schedule_date)
 
@@ -1611,7 +1623,9 @@ async def delete_history(request: DeleteHistory, user_id: int) -> AffectedHistor
             for ref_id, peer_user_id in refs:
                 messages[peer_user_id].append(ref_id)
 
+    affected_peer_ids = await MessageRef.filter(content_id__in=content_ids).distinct().values_list("peer_id", flat=True)
     await MessageContent.filter(id__in=content_ids).delete()
+    await ReadState.sync_unread_bulk(affected_peer_ids)
     pts = await upd.delete_messages(user_id, messages)
 
     if not offset_id:
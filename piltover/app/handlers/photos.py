@@ -8,6 +8,7 @@ from piltover.db.enums import PrivacyRuleKeyType, FileType, PeerType, MessageTyp
 from piltover.db.models import User, UserPhoto, Peer, UploadingFile, PrivacyRule, Bot, Contact, File
 from piltover.enums import ReqHandlerFlags
 from piltover.exceptions import ErrorRpc
+from piltover.session import SessionManager
 from piltover.tl import InputPhoto, InputPhotoEmpty, PhotoEmpty, LongVector, InputFile, InputFileBig, \
     MessageActionSuggestProfilePhoto
 from piltover.tl.base import InputUser as TLInputUserBase, Photo as TLPhotoBase
@@ -240,6 +241,8 @@ async def upload_contact_profile_photo(request: UploadContactProfilePhoto, user_
         contact.personal_photo = None
         await contact.save(update_fields=["personal_photo_id"])
 
+    await SessionManager.invalidate_context_values([user_id], users=True)
+
     # TODO: send update(s)?
 
     return PhotosPhoto(
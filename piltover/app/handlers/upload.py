@@ -1,3 +1,4 @@
+from hashlib import sha256
 from time import time
 from typing import cast
 from uuid import UUID
@@ -7,14 +8,19 @@ from loguru import logger
 from tortoise.expressions import Q
 
 from piltover.app.utils.utils import PHOTOSIZE_TO_INT, MIME_TO_TL
+from piltover.config import APP_CONFIG
 from piltover.context import request_ctx
 from piltover.db.enums import PeerType, FileType
 from piltover.db.models import UploadingFile, UploadingFilePart, File, Peer, Stickerset
 from piltover.enums import ReqHandlerFlags
 from piltover.exceptions import ErrorRpc, Unreachable
+from piltover.storage.base import StorageType
+from piltover.storage.file_part_token import make_file_part_token
 from piltover.tl import InputDocumentFileLocation, InputPhotoFileLocation, InputPeerPhotoFileLocation, \
     InputEncryptedFileLocation, InputStickerSetThumb
+from piltover.tl.base.storage import FileType as FileTypeBase
 from piltover.tl.functions.upload import SaveFilePart, SaveBigFilePart, GetFile
+from piltover.tl.types.internal import FilePartToken
 from piltover.tl.types.storage import FileUnknown, FilePartial, FileJpeg
 from piltover.tl.types.upload import File as TLFile
 from piltover.utils.debug import measure_time
@@ -70,16 +76,34 @@ async def save_file_part(request: SaveFilePart | SaveBigFilePart, user_id: int)
     if size == 0:
         raise ErrorRpc(error_code=400, error_message="FILE_PART_EMPTY")
 
+    # Size of first part (or of any part that is not last one) is size of every part except last one
+    part_size = file.part_size
+    if part_size is None and (
+            request.file_part == 0 or (file.total_parts > 0 and request.file_part < file.total_parts - 1)
+    ):
+        part_size = size
+        await UploadingFile.filter(id=file.id, part_size__isnull=True).update(part_size=size)
+    elif part_size is not None and size > part_size:
+        raise ErrorRpc(error_code=400, error_message="FILE_PART_SIZE_CHANGED")
+
+    with measure_time("sha256(part)"):
+        digest = sha256(request.bytes_).digest()
+
     with measure_time("UploadingFilePart.get_or_create"):
-        part, created = await UploadingFilePart.get_or_create(file=file, part_id=request.file_part, defaults={"size": size})
+        part, created = await UploadingFilePart.get_or_create(
+            file=file, part_id=request.file_part, defaults={"size": size, "digest": digest},
+        )
     if not created:
         if part.size == size:
             return True
         raise ErrorRpc(error_code=400, error_message="FILE_PART_INVALID")
 
+    # Parts are written in place if their offset is known, other parts are moved to their place on finalize
+    offset = request.file_part * part_size if part_size is not None else None
+
     storage = request_ctx.get().storage
     with measure_time("storage.save_part(...)"):
-        await storage.save_part(file.physical_id, request.file_part, request.bytes_, maybe_last)
+        await storage.save_part(file.physical_id, request.file_part, request.bytes_, maybe_last, offset=offset)
 
     return True
 
@@ -94,7 +118,7 @@ FOUR_KB = ONE_KB * 4
 
 
 @handler.on_request(GetFile, ReqHandlerFlags.DONT_FETCH_USER)
-async def get_file(request: GetFile, user_id: int) -> TLFile:
+async def get_file(request: GetFile, user_id: int) -> TLFile | FilePartToken:
     if not isinstance(request.location, SUPPORTED_LOCS):
         raise ErrorRpc(error_code=400, error_message="LOCATION_INVALID")
     if request.limit < 0 or request.limit > ONE_MB:
@@ -191,16 +215,29 @@ async def get_file(request: GetFile, user_id: int) -> TLFile:
         suffix = str(size)
         component = storage.photos
 
+    is_thumb = isinstance(location, (InputPhotoFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb)) \
+               or document_thumb
+
+    if APP_CONFIG.gateway_serves_files:
+        # Part is read by gateway, so its contents are not sent through result backend
+        return make_file_part_token(
+            file.physical_id, StorageType.PHOTO if suffix is not None else StorageType.DOCUMENT, suffix,
+            request.offset, request.limit,
+            _file_type(file, is_thumb, min(request.limit, file.size - request.offset)),
+            int(file.created_at.timestamp()),
+        )
+
     with measure_time(f"storage.<component>.get_part()"):
         data = await component.get_part(file.physical_id, request.offset, request.limit, suffix)
     data = data or b""
 
-    if isinstance(location, (InputPhotoFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb)) \
-            or document_thumb:
-        file_type = FileJpeg()
-    elif len(data) != file.size:
-        file_type = FilePartial()
-    else:
-        file_type = MIME_TO_TL.get(file.mime_type, FileUnknown())
+    return TLFile(type_=_file_type(file, is_thumb, len(data)), mtime=int(file.created_at.timestamp()), bytes_=data)
+
 
-    return TLFile(type_=file_type, mtime=int(file.created_at.timestamp()), bytes_=data)
+def _file_type(file: File, is_thumb: bool, data_size: int) -> FileTypeBase:
+    if is_thumb:
+        return FileJpeg()
+    elif data_size != file.size:
+        return FilePartial()
+    else:
+        return MIME_TO_TL.get(file.mime_type, FileUnknown())
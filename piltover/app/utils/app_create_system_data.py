@@ -430,7 +430,7 @@ async def _create_peer_colors(colors_dir: Path) -> None:
 async def _create_system_user() -> None:
     logger.info("Creating system user...")
 
-    from piltover.db.models import User, Username
+    from piltover.db.models import User, Username, PeerSearchToken
 
     sys_user, _ = await User.update_or_create(id=777000, defaults={
         "phone_number": "42777",
@@ -440,12 +440,13 @@ async def _create_system_user() -> None:
 
     await Username.filter(Q(user=sys_user) | Q(username=APP_CONFIG.system_user_username)).delete()
     await Username.create(user=sys_user, username=APP_CONFIG.system_user_username)
+    await PeerSearchToken.index_user(sys_user.id)
 
 
 async def _create_builtin_bots(bots: list[tuple[str, str]]) -> None:
     logger.info("Creating builtin bots...")
 
-    from piltover.db.models import User, Username
+    from piltover.db.models import User, Username, PeerSearchToken
 
     for bot_username, bot_name in bots:
         logger.debug(f"Creating bot \"{bot_name}\" (@{bot_username})...")
@@ -461,6 +462,7 @@ async def _create_builtin_bots(bots: list[tuple[str, str]]) -> None:
 
         await Username.filter(Q(user=bot) | Q(username=bot_username)).delete()
         await Username.create(user=bot, username=bot_username)
+        await PeerSearchToken.index_user(bot.id)
 
 
 async def _create_languages(langs_dir: Path) -> None:
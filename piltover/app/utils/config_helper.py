@@ -2,6 +2,7 @@ from loguru import logger
 from taskiq import AsyncBroker, InMemoryBroker, TaskiqEvents
 
 from piltover._faster_taskiq_inmemory_result_backend import FasterInmemoryResultBackend
+from piltover._taskiq_binary_formatter import BinaryTaskiqFormatter
 from piltover.config import SYSTEM_CONFIG
 from piltover.message_brokers.base_broker import BaseMessageBroker, BrokerType
 from piltover.message_brokers.in_memory_broker import InMemoryMessageBroker
@@ -9,31 +10,39 @@ from piltover.message_brokers.rabbitmq_broker import RabbitMqMessageBroker
 
 try:
     from taskiq_aio_pika import AioPikaBroker
-    from taskiq_redis import RedisAsyncResultBackend
+    from piltover._taskiq_push_redis_result_backend import PushRedisResultBackend
 
     REMOTE_BROKER_SUPPORTED = True
 except ImportError:
     AioPikaBroker = None
-    RedisAsyncResultBackend = None
+    PushRedisResultBackend = None
     REMOTE_BROKER_SUPPORTED = False
 
 
 def make_broker_from_config() -> AsyncBroker:
     rabbitmq_address = SYSTEM_CONFIG.rabbitmq_address
     redis_address = SYSTEM_CONFIG.redis_address
+    binary_transport = SYSTEM_CONFIG.rpc_transport == "binary"
 
     if not REMOTE_BROKER_SUPPORTED or rabbitmq_address is None or redis_address is None:
         logger.info("Using InMemoryBroker for taskiq")
-        return InMemoryBroker(
+        broker = InMemoryBroker(
             max_async_tasks=128,
             cast_types=False,
         ).with_result_backend(FasterInmemoryResultBackend())
     else:
-        logger.info("Using AioPikaBroker + RedisAsyncResultBackend for taskiq")
-        return AioPikaBroker(rabbitmq_address).with_result_backend(RedisAsyncResultBackend(redis_address))
+        logger.info("Using AioPikaBroker + PushRedisResultBackend for taskiq")
+        broker = AioPikaBroker(rabbitmq_address).with_result_backend(PushRedisResultBackend(redis_address))
 
+    if binary_transport:
+        broker = broker.with_formatter(BinaryTaskiqFormatter())
 
-def make_message_broker_from_config(broker: AsyncBroker | None) -> BaseMessageBroker:
+    return broker
+
+
+def make_message_broker_from_config(
+        broker: AsyncBroker | None, broker_type: BrokerType = BrokerType.WRITE,
+) -> BaseMessageBroker:
     rabbitmq_address = SYSTEM_CONFIG.rabbitmq_address
     redis_address = SYSTEM_CONFIG.redis_address
 
@@ -42,7 +51,7 @@ def make_message_broker_from_config(broker: AsyncBroker | None) -> BaseMessageBr
         message_broker = InMemoryMessageBroker()
     else:
         logger.info("Using RabbitMqMessageBroker")
-        message_broker = RabbitMqMessageBroker(BrokerType.WRITE, rabbitmq_address)
+        message_broker = RabbitMqMessageBroker(broker_type, rabbitmq_address)
 
     if broker is not None:
         async def _broker_startup(*args, **kwargs) -> None:
@@ -51,7 +60,13 @@ def make_message_broker_from_config(broker: AsyncBroker | None) -> BaseMessageBr
         async def _broker_shutdown(*args, **kwargs) -> None:
             await message_broker.shutdown()
 
-        broker.add_event_handler(TaskiqEvents.WORKER_STARTUP, _broker_startup)
-        broker.add_event_handler(TaskiqEvents.WORKER_SHUTDOWN, _broker_shutdown)
+        # Gateway is a taskiq client, so message broker that reads messages (for gateway sessions)
+        #  must be started on client startup
+        if BrokerType.READ in broker_type:
+            broker.add_event_handler(TaskiqEvents.CLIENT_STARTUP, _broker_startup)
+            broker.add_event_handler(TaskiqEvents.CLIENT_SHUTDOWN, _broker_shutdown)
+        else:
+            broker.add_event_handler(TaskiqEvents.WORKER_STARTUP, _broker_startup)
+            broker.add_event_handler(TaskiqEvents.WORKER_SHUTDOWN, _broker_shutdown)
 
     return message_broker
@@ -6,7 +6,7 @@ from loguru import logger
 from tortoise.transactions import in_transaction
 
 from piltover.context import request_ctx
-from piltover.db.enums import UpdateType, PeerType, ChannelUpdateType, NotifySettingsNotPeerType
+from piltover.db.enums import UpdateType, PeerType, ChannelUpdateType, NotifySettingsNotPeerType, PrivacyRuleKeyType
 from piltover.db.models import User, State, Update, MessageDraft, Peer, Dialog, Chat, Presence, \
     ChatParticipant, ChannelUpdate, Channel, Poll, DialogFolder, EncryptedChat, UserAuthorization, SecretUpdate, \
     Stickerset, ChatWallpaper, CallbackQuery, PeerNotifySettings, InlineQuery, SavedDialog, PrivacyRule, MessageRef, \
@@ -75,8 +75,13 @@ async def send_message(
         pts_counts.append(2 if message.random_id else 1)
 
     ptss = await State.add_pts_bulk(pts_users, pts_counts)
+    # Content is formatted once for all recipients, only ref fields are formatted per user
+    tl_messages = await MessageRef.to_tl_bulk_for_users(
+        [messages[peer_by_user_id[user_id]] for user_id in pts_users], pts_users,
+    )
+    to_send = {}
 
-    for target_user_id, new_pts in zip(pts_users, ptss):
+    for target_user_id, new_pts, tl_message in zip(pts_users, ptss, tl_messages):
         peer = peer_by_user_id[target_user_id]
         message = messages[peer]
 
@@ -102,8 +107,7 @@ async def send_message(
         updates = UpdatesWithDefaults(
             updates=[
                 UpdateNewMessage(
-                    # TODO: move out of the loop
-                    message=await message.to_tl(target_user_id, False),
+                    message=tl_message,
                     pts=new_pts,
                     pts_count=1,
                 ),
@@ -118,8 +122,11 @@ async def send_message(
         if target_user_id == current_user_id:
             result = updates
 
-        ignore_auth_id = request_ctx.get().auth_id if ignore_current and target_user_id == current_user_id else None
-        await SessionManager.send(updates, target_user_id, ignore_auth_id=ignore_auth_id)
+        to_send[target_user_id] = updates
+
+    ignore_auth_id = request_ctx.get().auth_id if ignore_current and current_user_id in to_send else None
+    # Every recipient gets its own message ids and pts, but all of them are published as one broker message
+    await SessionManager.send_to_each_user(to_send, ignore_auth_id=ignore_auth_id)
 
     if updates_to_create:
         await Update.bulk_create(updates_to_create)
@@ -897,6 +904,7 @@ async def update_chat_participants(chat: Chat, peers: list[Peer]) -> Updates:
     )
 
     await Update.bulk_create(updates_to_create)
+    await SessionManager.invalidate_context_values(user_ids, participants=True)
     await SessionManager.send(updates, user_id=user_ids)
     return updates
 
@@ -904,27 +912,47 @@ async def update_chat_participants(chat: Chat, peers: list[Peer]) -> Updates:
 async def update_status(
         user: User, status: Presence, peers: list[Peer | User | int] | list[Peer] | list[User] | list[int],
 ) -> None:
-    user_tl = await user.to_tl()
-
+    peer_user_ids = set()
     for peer in peers:
         if isinstance(peer, Peer):
-            peer_user_id = peer.owner_id
+            peer_user_ids.add(peer.owner_id)
         elif isinstance(peer, User):
-            peer_user_id = peer.id
+            peer_user_ids.add(peer.id)
         else:
-            peer_user_id = peer
+            peer_user_ids.add(peer)
+
+    if not peer_user_ids:
+        return
+
+    user_tl = await user.to_tl()
+
+    # Status is the same for every user that has (or doesn't have) access to status timestamp,
+    #  so update is sent once per privacy outcome instead of once per user
+    user_ids_by_access: dict[bool, list[int]] = {True: [], False: []}
+    if status.is_online():
+        user_ids_by_access[True].extend(peer_user_ids)
+    else:
+        has_access = await PrivacyRule.has_access_from_bulk(
+            peer_user_ids, user, PrivacyRuleKeyType.STATUS_TIMESTAMP,
+        )
+        for peer_user_id in peer_user_ids:
+            user_ids_by_access[has_access[peer_user_id]].append(peer_user_id)
+
+    for access, user_ids in user_ids_by_access.items():
+        if not user_ids:
+            continue
 
         updates = UpdatesWithDefaults(
             updates=[
                 UpdateUserStatus(
                     user_id=user.id,
-                    status=await status.to_tl(peer_user_id),
+                    status=status.to_tl_noprivacycheck(access),
                 ),
             ],
             users=[user_tl],
         )
 
-        await SessionManager.send(updates, peer_user_id)
+        await SessionManager.send(updates, user_ids)
 
 
 async def update_user_name(user: User) -> None:
@@ -997,6 +1025,7 @@ async def add_remove_contact(user_id: int, targets: list[User]) -> Updates:
     )
 
     await Update.bulk_create(updates_to_create)
+    await SessionManager.invalidate_context_values([user_id], users=True)
     await SessionManager.send(updates, user_id)
 
     return updates
@@ -1363,6 +1392,7 @@ async def update_message_poll(poll: Poll, user_id: int) -> Updates:
         ],
     )
 
+    await SessionManager.invalidate_context_values([user_id], poll_votes=True)
     await SessionManager.send(updates, user_id)
     return updates
 
@@ -1507,6 +1537,8 @@ async def update_config(user_id: int) -> Updates:
         updates=[UpdateConfig()],
     )
 
+    # Config cached by gateways must be dropped before clients are told to refetch it
+    await SessionManager.invalidate_cached_responses(user_id)
     await SessionManager.send(updates, user_id)
 
     return updates
@@ -2085,6 +2117,7 @@ async def update_privacy(user: User, rule: PrivacyRule, rules: PrivacyRules) ->
         chats=rules.chats,
     )
 
+    await SessionManager.invalidate_context_values([user.id], users=True)
     await SessionManager.send(updates, user.id)
 
     return updates
@@ -1,10 +1,11 @@
 import asyncio
 import bisect
 import ctypes
-import os
+import multiprocessing
 import re
-from asyncio import get_event_loop, gather, sleep
-from concurrent.futures.thread import ThreadPoolExecutor
+from asyncio import get_event_loop, sleep
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import ExitStack
 from hashlib import md5
 from io import BytesIO
@@ -19,6 +20,7 @@ from av import VideoFrame
 from loguru import logger
 from pylinkify import find_urls
 
+from piltover.config import APP_CONFIG
 from piltover.context import request_ctx
 from piltover.db.enums import PrivacyRuleKeyType, FileType, PeerType
 from piltover.db.models import UserPassword, User, Peer, PrivacyRule, File, Chat, Channel
@@ -39,6 +41,7 @@ from piltover.tl.base import InputCheckPasswordSRP as InputCheckPasswordSRPBase,
     MessageEntity as TLMessageEntityBase, ReplyMarkup
 from piltover.tl.types.storage import FileJpeg, FileGif, FilePng, FilePdf, FileMp3, FileMov, FileMp4, FileWebp
 from piltover.utils import gen_safe_prime
+from piltover.utils.debug import measure_time, measure_time_to_dict
 from piltover.utils.srp import sha256d, itob, btoi
 from piltover.utils.utils import xor
 
@@ -98,115 +101,203 @@ TELEGRAM_QUANTIZATION_TABLES = {
     ]
 }
 
-image_executor = ThreadPoolExecutor(thread_name_prefix="ImageResizeWorker")
+# Images are processed in separate processes since decoding and resizing hold the GIL most of the time.
+# Pool is created on worker startup (or on first use) and shut down on worker shutdown, not on import,
+#  so importing this module does not start processes.
+_image_executor: ProcessPoolExecutor | None = None
 video_executor = ThreadPoolExecutor(thread_name_prefix="VideoMetadataWorker")
 
 
-def _resize_image_internal(
-        location: str, to_size: int, out_format: str | None, force_resize: bool,
-) -> tuple[BytesIO | None, int, int]:
-    img = img_open(location)
-    img.load()
+def _get_image_executor() -> ProcessPoolExecutor:
+    global _image_executor
+    if _image_executor is None:
+        # Processes are spawned instead of forked, so they don't inherit event loop, db connections, etc.
+        _image_executor = ProcessPoolExecutor(
+            APP_CONFIG.image_processing_workers, mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _image_executor
 
-    width, height = img.size
-    factor = to_size / max(width, height)
-    if factor > 1 and not force_resize:
-        return None, 0, 0
 
+async def start_image_executor(*args, **kwargs) -> None:
+    _get_image_executor()
+
+
+async def shutdown_image_executor(*args, **kwargs) -> None:
+    global _image_executor
+    if _image_executor is not None:
+        _image_executor.shutdown(wait=False, cancel_futures=True)
+        _image_executor = None
+
+
+# (image bytes, width, height)
+ResizedImage = tuple[bytes, int, int]
+
+
+def _fit_to_size(width: int, height: int, to_size: int) -> tuple[int, int]:
+    factor = to_size / max(width, height)
     if width >= height:
-        height = int(height * factor)
-        width = to_size
-    else:
-        width = int(width * factor)
-        height = to_size
+        return to_size, int(height * factor)
+    return int(width * factor), to_size
+
+
+def _make_stripped(img: Image, size: int) -> bytes:
+    img_file = BytesIO()
+
+    img = img.convert("RGB").resize((size, size))
+    img.save(img_file, "JPEG", qtables=TELEGRAM_QUANTIZATION_TABLES)
+
+    header_offset = 623  # 619 + 4, 619 is header size, 4 is width and height
+    img_file.seek(header_offset)
+
+    return img_file.read()
+
+
+def _process_image(
+        location: str, sizes: list[tuple[int, bool]], out_format: str | None, stripped_size: int | None,
+) -> tuple[int, int, list[ResizedImage | None], bytes | None, dict[str, float]]:
+    """
+    Decodes image once and makes all requested sizes and stripped thumbnail from it.
+    Sizes are made from largest to smallest, every size is resized from previous one instead of the original image.
+    Runs in image executor process.
+
+    :param sizes: list of (longest side, whether to resize if image is smaller than that).
+    :return: original width and height, resized images (None if image is smaller than requested size),
+        stripped thumbnail (if stripped_size is set) and time spent in every stage.
+    """
+
+    times: dict[str, float] = defaultdict(float)
+
+    with measure_time_to_dict("decode", times):
+        img = img_open(location)
+        width, height = img.size
+        targets = [
+            _fit_to_size(width, height, to_size) if force_resize or to_size <= max(width, height) else None
+            for to_size, force_resize in sizes
+        ]
+
+        # Jpeg images are decoded already scaled down (but not smaller than largest requested size)
+        largest = max((target for target in targets if target is not None), key=max, default=None)
+        if largest is None:
+            largest = (stripped_size or 1, stripped_size or 1)
+        img.draft(None, largest)
+        img.load()
 
     if out_format is None:
         out_format = "PNG" if img.mode == "RGBA" else "JPEG"
 
-    out = BytesIO()
-    img.resize((width, height)).save(out, format=out_format)
-    return out, width, height
+    resized: list[ResizedImage | None] = [None] * len(sizes)
+    to_make = sorted(
+        ((idx, target) for idx, target in enumerate(targets) if target is not None),
+        key=lambda idx_target: max(idx_target[1]), reverse=True,
+    )
 
+    current = img
+    for idx, (target_width, target_height) in to_make:
 
-async def resize_photo(
+        with measure_time_to_dict("resize", times):
+            source = current if current.width >= target_width and current.height >= target_height else img
+            current = source.resize((target_width, target_height))
+
+        with measure_time_to_dict("encode", times):
+            out = BytesIO()
+            current.save(out, format=out_format)
+            resized[idx] = out.getvalue(), target_width, target_height
+
+    stripped = None
+    if stripped_size is not None:
+        with measure_time_to_dict("stripped", times):
+            stripped = _make_stripped(current, stripped_size)
+
+    return width, height, resized, stripped, times
+
+
+async def _process_image_in_executor(
+        location: str, sizes: list[tuple[int, bool]], out_format: str | None = None, stripped_size: int | None = None,
+) -> tuple[int, int, list[ResizedImage | None], bytes | None]:
+    with measure_time("_process_image(...)"):
+        width, height, resized, stripped, times = await get_event_loop().run_in_executor(
+            _get_image_executor(), _process_image, location, sizes, out_format, stripped_size,
+        )
+
+    # Stages are measured in executor process, where tracing is not available
+    logger.trace(
+        f"Processed image {width}x{height}: "
+        + ", ".join(f"{stage} took {took * 1000:.2f}ms" for stage, took in times.items())
+    )
+
+    return width, height, resized, stripped
+
+
+async def process_photo(
         storage: BaseStorage, file_id: UUID, sizes: str = "abc", suffix: str | None = None, is_document: bool = False,
         out_format: str | None = None, force_sizes: tuple[int] | None = None, new_file_id: UUID | None = None,
-        new_as_document: bool = False, force_resize_all: bool = False,
-) -> list[dict[str, int | str]]:
+        new_as_document: bool = False, force_resize_all: bool = False, stripped_size: int | None = None,
+) -> tuple[list[dict[str, int | str]], bytes | None, tuple[int, int]]:
+    """
+    Makes photo sizes, stripped thumbnail (if stripped_size is set) and dimensions of the image in one pass.
+    """
+
     if is_document:
         location = await storage.documents.get_location(file_id, suffix)
     else:
         location = await storage.photos.get_location(file_id, suffix)
 
-    tasks = [
-        get_event_loop().run_in_executor(
-            image_executor, _resize_image_internal,
-            location, PHOTOSIZE_TO_INT[size] if force_sizes is None else force_sizes[idx], out_format,
-            (force_resize_all or (idx == 0)),
-        )
-        for idx, size in enumerate(sizes)
-    ]
-    res: list[tuple[BytesIO, int, int]] = await gather(*tasks)
+    width, height, resized, stripped = await _process_image_in_executor(
+        location,
+        [
+            (PHOTOSIZE_TO_INT[size] if force_sizes is None else force_sizes[idx], force_resize_all or idx == 0)
+            for idx, size in enumerate(sizes)
+        ],
+        out_format, stripped_size,
+    )
 
     result = []
 
-    for idx, (resized, width, height) in enumerate(res):
-        if resized is None:
-            continue
+    with measure_time("<save photo sizes>"):
+        for size, resized_image in zip(sizes, resized):
+            if resized_image is None:
+                continue
 
-        await sleep(0)
+            data, size_width, size_height = resized_image
 
-        resized.seek(0, os.SEEK_END)
-        file_size = resized.tell()
-        resized.seek(0)
+            save_file_id = file_id if new_file_id is None else new_file_id
+            if new_file_id is not None and new_as_document:
+                await storage.save_part(new_file_id, 0, data, True)
+                await storage.finalize_upload_as(new_file_id, StorageType.DOCUMENT, 0)
 
-        save_file_id = file_id if new_file_id is None else new_file_id
-        if new_file_id is not None and new_as_document:
-            await storage.save_part(new_file_id, 0, resized.getbuffer(), True)
-            await storage.finalize_upload_as(new_file_id, StorageType.DOCUMENT, 0)
+            await storage.save_part(save_file_id, 0, data, True, str(size_width))
+            await storage.finalize_upload_as(save_file_id, StorageType.PHOTO, 0, str(size_width))
 
-        await storage.save_part(save_file_id, 0, resized.getbuffer(), True, str(width))
-        await storage.finalize_upload_as(save_file_id, StorageType.PHOTO, 0, str(width))
+            result.append({
+                "type_": size,
+                "w": size_width,
+                "h": size_height,
+                "size": len(data),
+            })
 
-        result.append({
-            "type_": sizes[idx],
-            "w": width,
-            "h": height,
-            "size": file_size,
-        })
+    return result, stripped, (width, height)
 
-    return result
+
+async def resize_photo(
+        storage: BaseStorage, file_id: UUID, sizes: str = "abc", suffix: str | None = None, is_document: bool = False,
+        out_format: str | None = None, force_sizes: tuple[int] | None = None, new_file_id: UUID | None = None,
+        new_as_document: bool = False, force_resize_all: bool = False,
+) -> list[dict[str, int | str]]:
+    photo_sizes, _, _ = await process_photo(
+        storage, file_id, sizes, suffix, is_document, out_format, force_sizes, new_file_id, new_as_document,
+        force_resize_all,
+    )
+    return photo_sizes
 
 
-def _get_image_dims(location: str) -> tuple[int, int] | None:
+async def get_image_dims(storage: BaseStorage, file_id: UUID) -> tuple[int, int] | None:
     try:
-        img = img_open(location)
-        img.load()
+        width, height, _, _ = await _process_image_in_executor(await storage.documents.get_location(file_id), [])
     except Exception as e:
         logger.opt(exception=e).error("Failed to load image!")
         return None
 
-    return img.size
-
-
-async def get_image_dims(storage: BaseStorage, file_id: UUID) -> tuple[int, int] | None:
-    return await get_event_loop().run_in_executor(
-        image_executor, _get_image_dims,
-        await storage.documents.get_location(file_id),
-    )
-
-
-def _generate_stripped(location: str, size: int) -> bytes:
-    img = img_open(location)
-    img_file = BytesIO()
-
-    img = img.convert("RGB").resize((size, size))
-    img.save(img_file, "JPEG", qtables=TELEGRAM_QUANTIZATION_TABLES)
-
-    header_offset = 623  # 619 + 4, 619 is header size, 4 is width and height
-    img_file.seek(header_offset)
-
-    return img_file.read()
+    return width, height
 
 
 async def generate_stripped(
@@ -217,10 +308,8 @@ async def generate_stripped(
     else:
         location = await storage.photos.get_location(file_id, suffix)
 
-    return await get_event_loop().run_in_executor(
-        image_executor, _generate_stripped,
-        location, size,
-    )
+    _, _, _, stripped = await _process_image_in_executor(location, [], stripped_size=size)
+    return cast(bytes, stripped)
 
 
 def _extract_video_metadata(location: str) -> tuple[int, bool, bool, Image | None]:
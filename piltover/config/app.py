@@ -51,6 +51,8 @@ class _AppConfig(BaseModel):
     channel_delete_history_min_id_threshold: int = 1000
     max_bots_per_user: int = 24
     username_change_protection_seconds: int = 1800
+    image_processing_workers: int = Field(default=2, ge=1)
+    gateway_serves_files: bool = False
 
     gifs: _Gifs | None = None
 
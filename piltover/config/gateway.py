@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Self
+from typing import Self, Literal
 
 from pydantic import BaseModel, model_validator, Base64Bytes, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict, PydanticBaseSettingsSource, TomlConfigSettingsSource
@@ -14,6 +14,15 @@ class _Gateway(BaseModel):
     privkey_file: Path | None = None
     pubkey_file: Path | None = None
     salt_key: Base64Bytes
+    serialization_executor: Literal["none", "thread", "process"] = "none"
+    serialization_workers: int | None = None
+    max_connections: int | None = None
+    max_inflight_requests: int = 1024
+    max_queued_bytes: int = 16 * 1024 * 1024
+    max_unacked_messages: int = 256
+    session_resume_timeout: int = 60
+    max_detached_sessions: int = 10000
+    max_detached_sessions_per_key: int = 16
 
     @model_validator(mode="after")
     def set_default_keys(self) -> Self:
@@ -32,6 +32,7 @@ class _System(BaseModel):
     database_connection_string: str = "sqlite://data/secrets/piltover.db"
     rabbitmq_address: str | None = None
     redis_address: str | None = None
+    rpc_transport: Literal["hex", "binary"] = "binary"
     cache: _CacheConfig
     debug_tracing: _TracingConfig
     debug_enable_aiomonitor: bool = False
@@ -0,0 +1,18 @@
+from tortoise import migrations
+from tortoise.migrations import operations as ops
+from tortoise import fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0064_auto_20260814_1749')]
+
+    initial = False
+
+    operations = [
+        ops.AddField(
+            model_name='UserAuthorization',
+            name='upd_seq_reserved',
+            field=fields.BigIntField(default=0),
+        ),
+        ops.RunSQL("UPDATE userauthorization SET upd_seq_reserved = upd_seq;"),
+    ]
@@ -0,0 +1,53 @@
+from tortoise import migrations
+from tortoise.migrations import operations as ops
+from tortoise import fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0065_auto_20261017_0400')]
+
+    initial = False
+
+    operations = [
+        ops.AddField(
+            model_name='ReadState',
+            name='unread_count',
+            field=fields.IntField(default=0),
+        ),
+        ops.AddField(
+            model_name='ReadState',
+            name='unread_mentions_count',
+            field=fields.IntField(default=0),
+        ),
+        ops.AddField(
+            model_name='ReadState',
+            name='unread_reactions_count',
+            field=fields.IntField(default=0),
+        ),
+        ops.RunSQL("""
+UPDATE readstate
+SET
+    unread_count = (
+        SELECT COUNT(mref.id)
+        FROM messageref mref
+        WHERE mref.peer_id = readstate.peer_id AND mref.id > readstate.last_message_id
+    ),
+    unread_mentions_count = (
+        SELECT COUNT(mention.id)
+        FROM messagemention mention, peer
+        WHERE peer.id = readstate.peer_id
+            AND mention.user_id = readstate.owner_id
+            AND mention.unread_target_id = (
+                CASE WHEN peer.chat_id IS NOT NULL THEN peer.chat_id * 2 ELSE peer.channel_id * 2 + 1 END
+            )
+    ),
+    unread_reactions_count = (
+        SELECT COUNT(content.id)
+        FROM messagecontent content
+        INNER JOIN messageref mref ON mref.content_id = content.id
+        WHERE mref.peer_id = readstate.peer_id
+            AND content.author_id = readstate.owner_id
+            AND content.author_reactions_unread = TRUE
+    );
+"""),
+    ]
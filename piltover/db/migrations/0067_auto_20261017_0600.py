@@ -0,0 +1,26 @@
+from tortoise import fields
+from tortoise import migrations
+from tortoise.fields.base import OnDelete
+from tortoise.indexes import Index
+from tortoise.migrations import operations as ops
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0066_auto_20261017_0500')]
+
+    initial = False
+
+    operations = [
+        ops.CreateModel(
+            name='MessageSearchToken',
+            fields=[
+                ('id', fields.BigIntField(generated=True, primary_key=True, unique=True, db_index=True)),
+                ('token', fields.CharField(max_length=32)),
+                ('message', fields.ForeignKeyField('models.MessageRef', source_field='message_id', db_constraint=True, to_field='id', on_delete=OnDelete.CASCADE)),
+                ('peer', fields.ForeignKeyField('models.Peer', source_field='peer_id', db_constraint=True, to_field='id', on_delete=OnDelete.CASCADE)),
+                ('owner', fields.ForeignKeyField('models.User', source_field='owner_id', null=True, db_constraint=True, to_field='id', on_delete=OnDelete.CASCADE)),
+            ],
+            options={'table': 'messagesearchtoken', 'app': 'models', 'indexes': [Index(fields=['peer_id', 'token']), Index(fields=['owner_id', 'token'])], 'pk_attr': 'id'},
+            bases=['Model'],
+        ),
+    ]
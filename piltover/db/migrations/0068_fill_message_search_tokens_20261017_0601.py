@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from tortoise import migrations
+from tortoise.migrations import operations as ops
+from tortoise.migrations.schema_editor import BaseSchemaEditor
+from tortoise.migrations.schema_generator.state_apps import StateApps
+
+if TYPE_CHECKING:
+    from piltover.db.models.message_ref import MessageRef as MessageRefT
+    from piltover.db.models.message_search_token import MessageSearchToken as MessageSearchTokenT
+
+BATCH_SIZE = 1000
+
+# Copy of tokenizer from piltover.db.models.message_search_token at the time of this migration,
+#  so changes to the tokenizer don't change what this migration does
+TOKEN_MAX_LENGTH = 32
+URL_TOKEN = ":url"
+_WORD_RE = re.compile(r"\w+")
+_URL_RE = re.compile(r"https?://|t\.me/")
+
+
+def tokenize_message(text: str | None) -> set[str]:
+    if not text:
+        return set()
+
+    tokens = {word[:TOKEN_MAX_LENGTH] for word in _WORD_RE.findall(text.lower())}
+    if _URL_RE.search(text.lower()) is not None:
+        tokens.add(URL_TOKEN)
+    return tokens
+
+
+async def forwards(apps: StateApps, schema_editor: BaseSchemaEditor) -> None:
+    MessageRef: type[MessageRefT] = apps.get_model("models", "MessageRef")
+    MessageSearchToken: type[MessageSearchTokenT] = apps.get_model("models", "MessageSearchToken")
+
+    base_query = MessageRef.filter(content__message__isnull=False).order_by("id").limit(BATCH_SIZE)
+    total_count = await MessageRef.filter(content__message__isnull=False).count()
+    processed_count = 0
+
+    offset_id = 0
+    while refs := await base_query.filter(id__gt=offset_id).values_list(
+            "id", "peer_id", "peer__owner_id", "content__message",
+    ):
+        offset_id = refs[-1][0]
+
+        tokens = [
+            MessageSearchToken(token=token, message_id=ref_id, peer_id=peer_id, owner_id=owner_id)
+            for ref_id, peer_id, owner_id, text in refs
+            for token in tokenize_message(text)
+        ]
+        if tokens:
+            await MessageSearchToken.bulk_create(tokens)
+
+        processed_count += len(refs)
+        logger.info(
+            f"Processed {processed_count}/{total_count} "
+            f"({processed_count / total_count * 100:.2f}%) messages"
+        )
+
+
+async def backwards(apps: StateApps, schema_editor: BaseSchemaEditor) -> None:
+    MessageSearchToken: type[MessageSearchTokenT] = apps.get_model("models", "MessageSearchToken")
+    await MessageSearchToken.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0067_auto_20261017_0600')]
+
+    initial = False
+
+    operations = [
+        ops.RunPython(
+            code=forwards,
+            reverse_code=backwards,
+        ),
+    ]
@@ -0,0 +1,27 @@
+from tortoise import fields
+from tortoise import migrations
+from tortoise.migrations import operations as ops
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0068_fill_message_search_tokens_20261017_0601')]
+
+    initial = False
+
+    operations = [
+        ops.AddField(
+            model_name='Channel',
+            name='bots_count',
+            field=fields.IntField(default=0),
+        ),
+        ops.AddField(
+            model_name='Channel',
+            name='banned_count',
+            field=fields.IntField(default=0),
+        ),
+        ops.AddField(
+            model_name='Channel',
+            name='kicked_count',
+            field=fields.IntField(default=0),
+        ),
+    ]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from tortoise import migrations
+from tortoise.expressions import RawSQL
+from tortoise.migrations import operations as ops
+from tortoise.migrations.schema_editor import BaseSchemaEditor
+from tortoise.migrations.schema_generator.state_apps import StateApps
+
+if TYPE_CHECKING:
+    from piltover.db.models.channel import Channel as ChannelT
+    from piltover.db.models.chat_participant import ChatParticipant as ChatParticipantT
+
+BATCH_SIZE = 1000
+
+
+async def forwards(apps: StateApps, schema_editor: BaseSchemaEditor) -> None:
+    from piltover.db.enums import ChatBannedRights
+
+    Channel: type[ChannelT] = apps.get_model("models", "Channel")
+    ChatParticipant: type[ChatParticipantT] = apps.get_model("models", "ChatParticipant")
+
+    view_value = ChatBannedRights.VIEW_MESSAGES.value
+
+    base_query = Channel.all().only("id").order_by("id").limit(BATCH_SIZE)
+    total_count = await Channel.all().count()
+    processed_count = 0
+
+    offset_id = 0
+    while channels := await base_query.filter(id__gt=offset_id):
+        offset_id = channels[-1].id
+        for channel in channels:
+            participants = ChatParticipant.filter(channel_id=channel.id)
+            banned_query = participants.annotate(check_view_banned=RawSQL(f"banned_rights & {view_value}"))
+            await Channel.filter(id=channel.id).update(
+                participants_count=await participants.filter(left=False).count(),
+                admins_count=await participants.filter(admin_rights__gt=0).count(),
+                bots_count=await participants.filter(left=False, user__bot=True).count(),
+                banned_count=await banned_query.filter(banned_rights__gt=0, check_view_banned=0).count(),
+                kicked_count=await banned_query.filter(check_view_banned__not=0).count(),
+            )
+
+        processed_count += len(channels)
+        logger.info(
+            f"Processed {processed_count}/{total_count} "
+            f"({processed_count / total_count * 100:.2f}%) channels"
+        )
+
+
+async def backwards(apps: StateApps, schema_editor: BaseSchemaEditor) -> None:
+    ...
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0069_auto_20261017_0700')]
+
+    initial = False
+
+    operations = [
+        ops.RunPython(
+            code=forwards,
+            reverse_code=backwards,
+        ),
+    ]
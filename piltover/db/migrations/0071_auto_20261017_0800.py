@@ -0,0 +1,25 @@
+from tortoise import fields
+from tortoise import migrations
+from tortoise.fields.base import OnDelete
+from tortoise.migrations import operations as ops
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0070_fill_channel_participants_counts_20261017_0701')]
+
+    initial = False
+
+    operations = [
+        ops.CreateModel(
+            name='PeerSearchToken',
+            fields=[
+                ('id', fields.BigIntField(generated=True, primary_key=True, unique=True, db_index=True)),
+                ('token', fields.CharField(max_length=32, db_index=True)),
+                ('is_public', fields.BooleanField(default=False)),
+                ('user', fields.ForeignKeyField('models.User', source_field='user_id', null=True, db_constraint=True, to_field='id', on_delete=OnDelete.CASCADE)),
+                ('channel', fields.ForeignKeyField('models.Channel', source_field='channel_id', null=True, db_constraint=True, to_field='id', on_delete=OnDelete.CASCADE)),
+            ],
+            options={'table': 'peersearchtoken', 'app': 'models', 'pk_attr': 'id'},
+            bases=['Model'],
+        ),
+    ]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from tortoise import migrations
+from tortoise.migrations import operations as ops
+from tortoise.migrations.schema_editor import BaseSchemaEditor
+from tortoise.migrations.schema_generator.state_apps import StateApps
+
+if TYPE_CHECKING:
+    from piltover.db.models.user import User as UserT
+    from piltover.db.models.channel import Channel as ChannelT
+    from piltover.db.models.username import Username as UsernameT
+    from piltover.db.models.peer_search_token import PeerSearchToken as PeerSearchTokenT
+
+BATCH_SIZE = 1000
+
+# Copy of tokenizer from piltover.db.models.message_search_token at the time of this migration,
+#  so changes to the tokenizer don't change what this migration does
+TOKEN_MAX_LENGTH = 32
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str | None) -> set[str]:
+    if not text:
+        return set()
+
+    return {word[:TOKEN_MAX_LENGTH] for word in _WORD_RE.findall(text.lower())}
+
+
+async def forwards(apps: StateApps, schema_editor: BaseSchemaEditor) -> None:
+    User: type[UserT] = apps.get_model("models", "User")
+    Channel: type[ChannelT] = apps.get_model("models", "Channel")
+    Username: type[UsernameT] = apps.get_model("models", "Username")
+    PeerSearchToken: type[PeerSearchTokenT] = apps.get_model("models", "PeerSearchToken")
+
+    base_query = User.filter(deleted=False).order_by("id").limit(BATCH_SIZE)
+    total_count = await User.filter(deleted=False).count()
+    processed_count = 0
+
+    offset_id = 0
+    while users := await base_query.filter(id__gt=offset_id).values_list("id", "first_name", "last_name"):
+        offset_id = users[-1][0]
+        usernames = dict(await Username.filter(
+            user_id__in=[user_id for user_id, _, _ in users],
+        ).values_list("user_id", "username"))
+
+        tokens = []
+        for user_id, first_name, last_name in users:
+            for token in tokenize(first_name) | tokenize(last_name):
+                tokens.append(PeerSearchToken(token=token, user_id=user_id))
+            if (username := usernames.get(user_id)) is not None:
+                tokens.append(PeerSearchToken(
+                    token=username.lower()[:TOKEN_MAX_LENGTH], is_public=True, user_id=user_id,
+                ))
+
+        if tokens:
+            await PeerSearchToken.bulk_create(tokens)
+
+        processed_count += len(users)
+        logger.info(
+            f"Processed {processed_count}/{total_count} "
+            f"({processed_count / total_count * 100:.2f}%) users"
+        )
+
+    public_channels = await Channel.filter(
+        deleted=False, username__isnull=False,
+    ).values_list("id", "name", "username__username")
+
+    tokens = []
+    for channel_id, name, username in public_channels:
+        for token in tokenize(name):
+            tokens.append(PeerSearchToken(token=token, is_public=True, channel_id=channel_id))
+        tokens.append(PeerSearchToken(token=username.lower()[:TOKEN_MAX_LENGTH], is_public=True, channel_id=channel_id))
+
+    if tokens:
+        await PeerSearchToken.bulk_create(tokens)
+
+    logger.info(f"Processed {len(public_channels)} public channels")
+
+
+async def backwards(apps: StateApps, schema_editor: BaseSchemaEditor) -> None:
+    PeerSearchToken: type[PeerSearchTokenT] = apps.get_model("models", "PeerSearchToken")
+    await PeerSearchToken.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0071_auto_20261017_0800')]
+
+    initial = False
+
+    operations = [
+        ops.RunPython(
+            code=forwards,
+            reverse_code=backwards,
+        ),
+    ]
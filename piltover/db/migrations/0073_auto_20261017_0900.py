@@ -0,0 +1,22 @@
+from tortoise import fields
+from tortoise import migrations
+from tortoise.migrations import operations as ops
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0072_fill_peer_search_tokens_20261017_0801')]
+
+    initial = False
+
+    operations = [
+        ops.AddField(
+            model_name='UploadingFilePart',
+            name='digest',
+            field=fields.BinaryField(null=True, default=None),
+        ),
+        ops.AddField(
+            model_name='File',
+            name='content_hash',
+            field=fields.CharField(max_length=64, null=True, default=None, db_index=True),
+        ),
+    ]
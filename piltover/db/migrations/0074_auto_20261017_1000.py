@@ -0,0 +1,17 @@
+from tortoise import fields
+from tortoise import migrations
+from tortoise.migrations import operations as ops
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0073_auto_20261017_0900')]
+
+    initial = False
+
+    operations = [
+        ops.AddField(
+            model_name='UploadingFile',
+            name='part_size',
+            field=fields.IntField(null=True, default=None),
+        ),
+    ]
@@ -0,0 +1,42 @@
+from tortoise import fields
+from tortoise import migrations
+from tortoise.migrations import operations as ops
+
+
+class Migration(migrations.Migration):
+    dependencies = [('models', '0074_auto_20261017_1000')]
+
+    initial = False
+
+    operations = [
+        ops.AddField(
+            model_name='Peer',
+            name='messages_count',
+            field=fields.BigIntField(default=0),
+        ),
+        ops.AddField(
+            model_name='ReadState',
+            name='read_messages_count',
+            field=fields.BigIntField(default=0),
+        ),
+        ops.RunSQL("""
+UPDATE peer
+SET
+    messages_count = (
+        SELECT COUNT(mref.id)
+        FROM messageref mref
+        WHERE mref.peer_id = peer.id
+    )
+WHERE peer.type = 3;
+"""),
+        ops.RunSQL("""
+UPDATE readstate
+SET
+    read_messages_count = (
+        SELECT COUNT(mref.id)
+        FROM messageref mref
+        WHERE mref.peer_id = readstate.peer_id AND mref.id <= readstate.last_message_id
+    )
+WHERE readstate.peer_id IN (SELECT peer.id FROM peer WHERE peer.type = 3);
+"""),
+    ]
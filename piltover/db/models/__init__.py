@@ -95,3 +95,5 @@ from .message_unique_view import MessageUniqueView
 from .user_emoji_status import UserEmojiStatus
 from .telegram_user import TelegramUser
 from .protected_username import ProtectedUsername
+from .message_search_token import MessageSearchToken
+from .peer_search_token import PeerSearchToken
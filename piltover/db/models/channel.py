@@ -4,10 +4,10 @@ import hashlib
 import hmac
 from collections import defaultdict
 from enum import auto, Enum
-from typing import cast
+from typing import cast, Iterable
 
 from tortoise import fields
-from tortoise.expressions import Subquery
+from tortoise.expressions import Subquery, F
 from tortoise.models import MODEL
 from tortoise.queryset import QuerySet, QuerySetSingle
 from tortoise.transactions import in_transaction
@@ -17,8 +17,10 @@ from piltover.config import APP_CONFIG
 from piltover.context import request_ctx
 from piltover.db import models
 from piltover.db.models import ChatBase
+from piltover.db.enums import ChatBannedRights
 from piltover.db.models.utils import NullableFKSetNull
 from piltover.db.utils.awaitable_none_queryset import EmptyQuerySet
+from piltover.db.utils.pts_allocator import PtsAllocator
 from piltover.exceptions import Unreachable
 from piltover.tl import ChannelForbidden, Long
 from piltover.tl.base import Chat as TLChatBase, InputChannel as TLInputChannelBase, InputPeer as TLInputPeerBase
@@ -51,6 +53,11 @@ class _UsernameMissing(Enum):
 
 _USERNAME_MISSING = _UsernameMissing.USERNAME_MISSING
 
+# (participants_count, admins_count, bots_count, banned_count, kicked_count) a participant adds to a channel
+ParticipantCounts = tuple[int, int, int, int, int]
+PARTICIPANT_COUNTS_FIELDS = ("participants_count", "admins_count", "bots_count", "banned_count", "kicked_count")
+_NO_PARTICIPANT_COUNTS: ParticipantCounts = (0, 0, 0, 0, 0)
+
 
 def NullableFKSetNullR(to: str, related_name: str, **kwargs) -> fields.ForeignKeyNullableRelation[MODEL]:
     return NullableFKSetNull(to=to, related_name=related_name, **kwargs)
@@ -82,6 +89,9 @@ class Channel(ChatBase):
     emojiset: models.Stickerset | None = NullableFKSetNullR("models.Stickerset", "channel_emojis")
     wallpaper: models.Wallpaper | None = NullableFKSetNull("models.Wallpaper")
     admins_count: int = fields.SmallIntField(default=0)
+    bots_count: int = fields.IntField(default=0)
+    banned_count: int = fields.IntField(default=0)
+    kicked_count: int = fields.IntField(default=0)
 
     accent_color_id: int | None
     profile_color_id: int | None
@@ -287,21 +297,8 @@ class Channel(ChatBase):
         return PeerChannel(channel_id=self.make_id())
 
     async def add_pts(self, pts_count: int) -> int:
-        async with in_transaction():
-            pts = cast(
-                int,
-                cast(object, await Channel.select_for_update().get(id=self.id).values_list("pts", flat=True))
-            )
-
-            if pts_count <= 0:
-                self.pts = pts
-                return pts
-
-            new_pts = pts + pts_count
-            await Channel.filter(id=self.id).update(pts=new_pts)
-
-        self.pts = new_pts
-        return new_pts
+        self.pts, = await PtsAllocator.allocate(Channel, "id", [self.id], [pts_count])
+        return self.pts
 
     @classmethod
     def from_input(
@@ -324,11 +321,86 @@ class Channel(ChatBase):
     ) -> QuerySetSingle[Channel | None]:
         return cls.from_input(user, input_channel).get_or_none()
 
-    async def sync_admins_count(self, refresh: bool) -> None:
+    @staticmethod
+    def participant_counts(participant: models.ChatParticipant | None, is_bot: bool) -> ParticipantCounts:
+        """
+        Returns what given participant adds to (participants_count, admins_count, bots_count, banned_count,
+        kicked_count) of the channel. Conditions are the same as in sync_participants_counts.
+        """
+
+        if participant is None:
+            return _NO_PARTICIPANT_COUNTS
+
+        kicked = bool(participant.banned_rights & ChatBannedRights.VIEW_MESSAGES)
+        return (
+            int(not participant.left),
+            int(participant.admin_rights > 0),
+            int(not participant.left and is_bot),
+            int(participant.banned_rights > 0 and not kicked),
+            int(kicked),
+        )
+
+    async def update_participants_counts(
+            self, before: Iterable[ParticipantCounts], after: Iterable[ParticipantCounts],
+    ) -> None:
+        """
+        Applies change of participants to participants_count, admins_count, bots_count, banned_count and
+        kicked_count of the channel with increments, without counting participants.
+        Must be called every time channel participants are added, removed, promoted or banned,
+        so these counts don't need to be calculated when participants are fetched.
+
+        :param before: participant_counts of changed participants before the change.
+        :param after: participant_counts of the same participants after the change.
+        """
+
+        delta = [0] * len(PARTICIPANT_COUNTS_FIELDS)
+        for counts in before:
+            for idx, count in enumerate(counts):
+                delta[idx] -= count
+        for counts in after:
+            for idx, count in enumerate(counts):
+                delta[idx] += count
+
+        to_update = {
+            field: F(field) + field_delta
+            for field, field_delta in zip(PARTICIPANT_COUNTS_FIELDS, delta)
+            if field_delta
+        }
+        if to_update:
+            await Channel.filter(id=self.id).update(**to_update)
+
+    async def sync_participants_counts(self, refresh: bool) -> None:
+        """
+        Recalculates participants_count, admins_count, bots_count, banned_count and kicked_count of the channel
+        from participants. Counters are maintained by update_participants_counts, this is only used to repair
+        them and to fill them for new channels that got participants in bulk (migrated basic groups).
+        """
+
+        participants = models.ChatParticipant.filter(channel_id=self.id)
         async with in_transaction():
-            admins_count = await Channel.filter(id=self.id).select_for_update().annotate(
-                admins_count_new=Subquery(models.ChatParticipant.filter(channel_id=self.id, admin_rights__gt=0).count())
-            ).first().values_list("admins_count_new", flat=True)
-            await Channel.filter(id=self.id).update(admins_count=admins_count)
+            counts = await Channel.filter(id=self.id).select_for_update().annotate(
+                participants_count_new=Subquery(participants.filter(left=False).count()),
+                admins_count_new=Subquery(participants.filter(admin_rights__gt=0).count()),
+                bots_count_new=Subquery(participants.filter(
+                    left=False, user_id__in=Subquery(models.User.filter(bot=True).values_list("id", flat=True)),
+                ).count()),
+                banned_count_new=Subquery(models.ChatParticipant.filter_banned(participants).count()),
+                kicked_count_new=Subquery(models.ChatParticipant.filter_kicked(participants).count()),
+            ).first().values_list(
+                "participants_count_new", "admins_count_new", "bots_count_new", "banned_count_new",
+                "kicked_count_new",
+            )
+            if counts is None:
+                return
+            participants_count, admins_count, bots_count, banned_count, kicked_count = counts
+            await Channel.filter(id=self.id).update(
+                participants_count=participants_count,
+                admins_count=admins_count,
+                bots_count=bots_count,
+                banned_count=banned_count,
+                kicked_count=kicked_count,
+            )
             if refresh:
-                await self.refresh_from_db(["admins_count"])
+                await self.refresh_from_db([
+                    "participants_count", "admins_count", "bots_count", "banned_count", "kicked_count",
+                ])
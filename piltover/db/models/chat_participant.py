@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from tortoise import fields, Model
-from tortoise.expressions import Subquery
+from tortoise.expressions import Subquery, RawSQL
 from tortoise.functions import Count
 from tortoise.queryset import QuerySet
 
@@ -46,6 +46,22 @@ class ChatParticipant(Model):
             ("user", "channel"),
         )
 
+    @staticmethod
+    def filter_banned(query: QuerySet[ChatParticipant]) -> QuerySet[ChatParticipant]:
+        """ Filters participants that are restricted, but still can view messages. """
+        view_value = ChatBannedRights.VIEW_MESSAGES.value
+        return query.annotate(
+            check_view_banned=RawSQL(f"banned_rights & {view_value}"),
+        ).filter(banned_rights__gt=0, check_view_banned=0)
+
+    @staticmethod
+    def filter_kicked(query: QuerySet[ChatParticipant]) -> QuerySet[ChatParticipant]:
+        """ Filters participants that are banned from viewing messages. """
+        view_value = ChatBannedRights.VIEW_MESSAGES.value
+        return query.annotate(
+            check_view_banned=RawSQL(f"banned_rights & {view_value}"),
+        ).filter(check_view_banned__not=0)
+
     @property
     def chat_or_channel(self) -> models.Chat | models.Channel:
         if self.chat_id is not None:
@@ -63,6 +63,9 @@ class File(Model):
     photo_stripped: bytes | None = fields.BinaryField(null=True, default=None)
     photo_path: bytes | None = fields.BinaryField(null=True, default=None)
 
+    # Hash of uploaded contents (see UploadingFile.content_hash), files with same hash share physical file
+    content_hash: str | None = fields.CharField(max_length=64, null=True, default=None, db_index=True)
+
     # DocumentAttributeSticker, DocumentAttributeCustomEmoji
     stickerset: models.Stickerset | None = fields.ForeignKeyField("models.Stickerset", null=True, default=None, on_delete=fields.SET_NULL)
     sticker_pos: int | None = fields.IntField(null=True, default=None)
@@ -164,7 +167,7 @@ class File(Model):
     async def make_thumbs(
             self, storage: BaseStorage, thumb_bytes: StorageBuffer | None = None, profile_photo: bool = False,
     ) -> bool:
-        from piltover.app.utils.utils import resize_photo, generate_stripped
+        from piltover.app.utils.utils import process_photo
 
         thumb_suffix = None
         has_thumbnail = False
@@ -184,19 +187,32 @@ class File(Model):
             return False
 
         try:
-            self.photo_sizes = await resize_photo(
-                storage, self.physical_id, suffix=thumb_suffix, is_document=is_document,
-                sizes="abc" if profile_photo else "smxy", force_resize_all=profile_photo,
-            )
-            self.photo_stripped = await generate_stripped(
+            self.photo_sizes, self.photo_stripped, dims = await process_photo(
                 storage, self.physical_id, suffix=thumb_suffix, is_document=is_document,
+                sizes="abc" if profile_photo else "smxy", force_resize_all=profile_photo, stripped_size=8,
             )
         except UnidentifiedImageError:
             self.mime_type = "application/octet-stream"
             return False
 
+        if thumb_suffix is None and (self.width is None or self.height is None):
+            self.width, self.height = dims
+
         return True
 
+    def copy_derived_from(self, other: File) -> None:
+        """
+        Copies values that are made from file contents (thumbnails, dimensions, duration) from file
+        with same physical file, so they don't need to be made again.
+        """
+
+        self.photo_sizes = other.photo_sizes
+        self.photo_stripped = other.photo_stripped
+        if (self.width is None or self.height is None) and other.width is not None and other.height is not None:
+            self.width, self.height = other.width, other.height
+        if self.mime_type.startswith("video/") and other.duration:
+            self.duration = other.duration
+
     def _to_tl_thumbs(self) -> list[PhotoStrippedSize | PhotoSize | PhotoPathSize]:
         sizes: list[PhotoStrippedSize | PhotoSize | PhotoPathSize]
         sizes = [PhotoSize(**size) for size in self.photo_sizes] if self.photo_sizes else []
@@ -306,6 +306,62 @@ class MessageRef(Model):
             for ref, content, reactions, replies in zip(refs, contents, reactionss, repliess)
         ]
 
+    @classmethod
+    async def to_tl_bulk_for_users(cls, messages: list[MessageRef], user_ids: list[int]) -> list[MessageToFormat]:
+        """
+        Formats every message for user with the same index in `user_ids` (e.g. copies of one message sent
+        to every participant of a chat), without reactions.
+        Every content is formatted once, only ref fields (id, out, mentioned, media_unread, etc.) are made per user.
+        """
+
+        contents = {ref.content_id: ref.content for ref in messages}
+        contents_tl = dict(zip(contents, await models.MessageContent.to_tl_content_bulk(list(contents.values()))))
+        repliess = await cls.to_tl_replies_bulk(messages)
+
+        # (user id, content id) -> whether mention is read
+        mention_read: dict[tuple[int, int], bool] = {}
+        mentionable_ids = [content.id for content in contents.values() if not content.is_service()]
+        if mentionable_ids:
+            for user_id, content_id, mention_target_id in await models.MessageMention.filter(
+                    user_id__in=user_ids, message_id__in=mentionable_ids,
+            ).values_list("user_id", "message_id", "unread_target_id"):
+                mention_read[(user_id, content_id)] = mention_target_id is None
+
+        readable_ref_ids = {
+            ref.id
+            for ref in messages
+            if (
+                    ref.content.media is not None
+                    and ref.content.media.file is not None
+                    and ref.content.media.file.type in READABLE_FILE_TYPES
+            )
+        }
+        media_read = set()
+        if readable_ref_ids:
+            media_read = set(await models.MessageMediaRead.filter(
+                user_id__in=user_ids, message_id__in=readable_ref_ids,
+            ).values_list("user_id", "message_id"))
+
+        result = []
+        to_cache = []
+        for ref, user_id, replies in zip(messages, user_ids, repliess):
+            mention_key = (user_id, ref.content_id)
+            media_unread = ref.id in readable_ref_ids and (user_id, ref.id) not in media_read
+            tl_ref = ref._to_tl_ref(
+                out=user_id == ref.content.author_id,
+                mentioned=mention_key in mention_read,
+                media_unread=media_unread or not mention_read.get(mention_key, True),
+            )
+            to_cache.append((ref.cache_key(user_id), tl_ref))
+            result.append(MessageToFormat(
+                ref=tl_ref, content=contents_tl[ref.content_id], reactions=None, replies=replies,
+            ))
+
+        if to_cache:
+            await Cache.obj.multi_set(to_cache)
+
+        return result
+
     @classmethod
     async def to_tl_channel_bulk(cls, messages: list[MessageRef]) -> list[ChannelMessageToFormat]:
         raw_contents = [ref.content for ref in messages]
@@ -438,7 +494,9 @@ class MessageRef(Model):
                 )
 
             await models.Peer.sync_last_message_bulk(peers)
+            await models.ReadState.add_unread_bulk(peers)
             await models.Dialog.create_or_unhide_bulk(peers)
+            await models.MessageSearchToken.index(messages.values())
 
         return messages
 
@@ -499,6 +557,7 @@ class MessageRef(Model):
         async with in_transaction():
             await MessageRef.bulk_create(messages)
             await models.Peer.sync_last_message_bulk(peers)
+            await models.ReadState.add_unread_bulk(peers)
 
         ref_ids_by_peer_ids = {
             peer_id: ref_id
@@ -511,6 +570,8 @@ class MessageRef(Model):
             message.id = ref_ids_by_peer_ids[message.peer.id]
             message._saved_in_db = True
 
+        await models.MessageSearchToken.index(messages)
+
         return messages
 
     @classmethod
@@ -544,6 +605,7 @@ class MessageRef(Model):
         async with in_transaction():
             await MessageRef.bulk_create(messages)
             await models.Peer.sync_last_message_bulk(peers)
+            await models.ReadState.add_unread_bulk(peers, len(new_contents))
 
         ref_ids_by_peer_ids = {
             (peer_id, content_id): ref_id
@@ -575,6 +637,8 @@ class MessageRef(Model):
         if to_update:
             await cls.bulk_update(to_update, ["reply_to_id"])
 
+        await models.MessageSearchToken.index(messages)
+
         return messages
 
     async def create_fwd_header(self, to_self: bool, discussion: bool = False) -> models.MessageFwdHeader:
@@ -641,6 +705,7 @@ class MessageRef(Model):
             async with in_transaction():
                 await cls.bulk_create(refs_to_create)
                 await models.Peer.sync_last_message_bulk(peers)
+                await models.ReadState.add_unread_bulk(peers)
 
         refs = await cls.filter(content=content)
 
@@ -652,6 +717,8 @@ class MessageRef(Model):
             ref.content = content
             messages[ref.peer] = ref
 
+        await models.MessageSearchToken.index(refs)
+
         if unhide_dialog:
             await models.Dialog.create_or_unhide_bulk(peers)
 
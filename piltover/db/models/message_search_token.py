@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from tortoise import fields, Model
+from tortoise.expressions import Q, Subquery
+
+from piltover.db import models
+from piltover.db.models.utils import NullableFK
+
+TOKEN_MAX_LENGTH = 32
+# Added for every message that contains a link, used by InputMessagesFilterUrl.
+# Can't be produced from a search query since tokens consist only of word characters.
+URL_TOKEN = ":url"
+# Query tokens after this one are ignored
+MAX_QUERY_TOKENS = 8
+
+_WORD_RE = re.compile(r"\w+")
+_URL_RE = re.compile(r"https?://|t\.me/")
+
+
+def tokenize(text: str | None) -> set[str]:
+    """
+    Splits text into lowercase words.
+    Words longer than TOKEN_MAX_LENGTH are truncated, so they still can be found by prefix.
+    """
+
+    if not text:
+        return set()
+
+    return {word[:TOKEN_MAX_LENGTH] for word in _WORD_RE.findall(text.lower())}
+
+
+def tokenize_message(text: str | None) -> set[str]:
+    tokens = tokenize(text)
+    if text and _URL_RE.search(text.lower()) is not None:
+        tokens.add(URL_TOKEN)
+    return tokens
+
+
+def token_prefix_query(prefix: str, field: str = "token") -> Q:
+    """
+    Returns query that matches tokens starting with `prefix`.
+    Prefix is also expressed as a range, so the index on tokens is used even where LIKE can't use it (e.g. sqlite).
+    """
+
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return Q(**{f"{field}__gte": prefix, f"{field}__lt": upper, f"{field}__startswith": prefix})
+
+
+class MessageSearchToken(Model):
+    """
+    Inverted index of message texts: one row per unique word of a message in a peer.
+    Rows are created together with message refs and are deleted with them (on delete cascade).
+    Rows are looked up by (peer, token) or, for global search, by (owner, token), so search only goes through
+    posting lists of the peer or the user and not of every message on the server.
+    """
+
+    id: int = fields.BigIntField(primary_key=True)
+    token: str = fields.CharField(max_length=TOKEN_MAX_LENGTH)
+    message: models.MessageRef = fields.ForeignKeyField("models.MessageRef")
+    peer: models.Peer = fields.ForeignKeyField("models.Peer")
+    owner: models.User | None = NullableFK("models.User")
+
+    message_id: int
+    peer_id: int
+    owner_id: int | None
+
+    class Meta:
+        indexes = (
+            ("peer_id", "token"),
+            ("owner_id", "token"),
+        )
+
+    @classmethod
+    async def index(cls, refs: Iterable[models.MessageRef]) -> None:
+        """
+        Indexes text of given refs. Refs must be saved and must have peer and content fetched.
+        """
+
+        tokens_by_content: dict[int, set[str]] = {}
+        to_create = []
+
+        for ref in refs:
+            if (tokens := tokens_by_content.get(ref.content.id)) is None:
+                # Same content is usually shared by refs in multiple peers
+                tokens = tokens_by_content[ref.content.id] = tokenize_message(ref.content.message)
+            to_create.extend(
+                cls(token=token, message_id=ref.id, peer_id=ref.peer.id, owner_id=ref.peer.owner_id)
+                for token in tokens
+            )
+
+        if to_create:
+            await cls.bulk_create(to_create)
+
+    @classmethod
+    async def reindex(cls, content: models.MessageContent) -> None:
+        refs = await models.MessageRef.filter(content_id=content.id).select_related("peer")
+        await cls.filter(message_id__in=[ref.id for ref in refs]).delete()
+        for ref in refs:
+            ref.content = content
+        await cls.index(refs)
+
+    @staticmethod
+    def _scope_query(peer_id: int | None, owner_id: int | None) -> Q:
+        if peer_id is not None:
+            return Q(peer_id=peer_id)
+        if owner_id is not None:
+            return Q(owner_id=owner_id)
+        raise ValueError("Either peer_id or owner_id must be provided")
+
+    @classmethod
+    def query(cls, q: str, peer_id: int | None = None, owner_id: int | None = None) -> Q:
+        """
+        Returns MessageRef query that matches messages that contain words starting with every word of `q`.
+
+        :param q: search query.
+        :param peer_id: id of a peer to search messages in.
+        :param owner_id: id of a user to search messages of (in all peers of the user), if peer_id is not set.
+        """
+
+        tokens = sorted(tokenize(q), key=len, reverse=True)[:MAX_QUERY_TOKENS]
+        if not tokens:
+            # Query has no words (e.g. only punctuation), there is nothing to look up in the index
+            return Q(content__message__icontains=q)
+
+        scope = cls._scope_query(peer_id, owner_id)
+
+        query = Q()
+        for token in tokens:
+            query &= Q(id__in=Subquery(
+                cls.filter(scope, token_prefix_query(token)).values_list("message_id", flat=True)
+            ))
+
+        return query
+
+    @classmethod
+    def url_query(cls, peer_id: int | None = None, owner_id: int | None = None) -> Q:
+        scope = cls._scope_query(peer_id, owner_id)
+        return Q(id__in=Subquery(cls.filter(scope, token=URL_TOKEN).values_list("message_id", flat=True)))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TypeVar, Generic, TYPE_CHECKING, Literal, TypeGuard, TypeAlias, cast
+from typing import TypeVar, Generic, TYPE_CHECKING, Literal, TypeGuard, TypeAlias, cast, Iterable
 
 from pypika_tortoise import Parameter, Dialects
 from tortoise import fields, Model, Tortoise
@@ -72,6 +72,9 @@ class Peer(Model, Generic[OwnerT, UserT, ChatT, ChannelT, OwnerIdT, UserIdT, Cha
     last_message_id: int | None = fields.BigIntField(null=True, default=None, db_index=True)
     last_message_date: datetime | None = fields.DatetimeField(null=True, default=None, db_index=True)
     out_max_read_id: int = fields.BigIntField(default=0)
+    # Number of messages in peer, maintained only for channel peers: unread count of channel subscriber is
+    #  messages_count - ReadState.read_messages_count, so new posts don't touch every subscriber's read state
+    messages_count: int = fields.BigIntField(default=0)
 
     user: UserT = fields.ForeignKeyField("models.User", related_name="user", null=True, default=None)
     chat: ChatT = fields.ForeignKeyField("models.Chat", null=True, default=None)
@@ -272,7 +275,10 @@ class Peer(Model, Generic[OwnerT, UserT, ChatT, ChannelT, OwnerIdT, UserIdT, Cha
                 return None
             if select_user_username:
                 select_related = *select_related, "user__username"
-            return await query.select_related("owner", "user", *select_related)
+            peer = await query.select_related("owner", "user", *select_related)
+            if peer is None and await cls._create_user_peer(user_id, input_peer.user_id, allow_bot):
+                peer = await query.select_related("owner", "user", *select_related)
+            return peer
 
         if isinstance(input_peer, InputPeerChat):
             if peer_types is not None and PeerType.CHAT not in peer_types:
@@ -286,6 +292,40 @@ class Peer(Model, Generic[OwnerT, UserT, ChatT, ChannelT, OwnerIdT, UserIdT, Cha
 
         raise ErrorRpc(error_code=400, error_message="PEER_ID_NOT_SUPPORTED")
 
+    @classmethod
+    async def _create_user_peer(cls, user_id: int, target_id: int, allow_bot: bool) -> bool:
+        target_query = models.User.filter(id=target_id)
+        if not allow_bot:
+            target_query = target_query.filter(bot=False)
+        if not await target_query.exists():
+            return False
+
+        await cls.get_or_create(owner_id=user_id, user_id=target_id, defaults={"type": PeerType.USER})
+        return True
+
+    @classmethod
+    async def create_user_peers_bulk(cls, user_id: int, target_ids: Iterable[int]) -> None:
+        """
+        Creates missing peers of given users for user `user_id`.
+        Peers of other users are created when client uses them for the first time (access hashes of input peers
+        must be already checked at this point), not every time user object is sent to the client.
+        """
+
+        target_ids = set(target_ids)
+        target_ids.discard(user_id)
+        target_ids.difference_update(
+            await cls.filter(owner_id=user_id, user_id__in=target_ids).values_list("user_id", flat=True)
+        )
+        if not target_ids:
+            return
+
+        existing_ids = await models.User.filter(id__in=target_ids).values_list("id", flat=True)
+        if existing_ids:
+            await cls.bulk_create([
+                cls(owner_id=user_id, user_id=target_id, type=PeerType.USER)
+                for target_id in existing_ids
+            ], ignore_conflicts=True)
+
     @classmethod
     async def from_input_peer_raise(
             cls, user: models.User | int, peer: InputPeers, message: str = "PEER_ID_INVALID", code: int = 400,
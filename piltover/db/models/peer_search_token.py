@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from tortoise import fields, Model
+from tortoise.expressions import Q, Subquery
+from tortoise.queryset import QuerySet
+
+from piltover.db import models
+from piltover.db.models.message_search_token import tokenize, token_prefix_query, TOKEN_MAX_LENGTH, MAX_QUERY_TOKENS
+
+
+class PeerSearchToken(Model):
+    """
+    Search index of user names, usernames and titles of public channels: one row per unique word.
+    Usernames are stored as one token. Names of users are searched only inside some scope (contacts,
+    channel participants), usernames and titles of public channels are searched globally.
+    """
+
+    id: int = fields.BigIntField(primary_key=True)
+    token: str = fields.CharField(max_length=TOKEN_MAX_LENGTH, db_index=True)
+    is_public: bool = fields.BooleanField(default=False)
+    user: models.User | None = fields.ForeignKeyField("models.User", null=True, default=None)
+    channel: models.Channel | None = fields.ForeignKeyField("models.Channel", null=True, default=None)
+
+    user_id: int | None
+    channel_id: int | None
+
+    @classmethod
+    async def index_user(cls, user_id: int) -> None:
+        await cls.filter(user_id=user_id).delete()
+
+        user = await models.User.get_or_none(id=user_id).values_list("first_name", "last_name", "deleted")
+        if user is None:
+            return
+        first_name, last_name, deleted = user
+        if deleted:
+            return
+
+        username = await models.Username.filter(user_id=user_id).first().values_list("username", flat=True)
+
+        tokens = tokenize(first_name) | tokenize(last_name)
+        to_create = [cls(token=token, user_id=user_id) for token in tokens]
+        if username:
+            to_create.append(cls(token=username.lower()[:TOKEN_MAX_LENGTH], is_public=True, user_id=user_id))
+
+        if to_create:
+            await cls.bulk_create(to_create)
+
+    @classmethod
+    async def index_channel(cls, channel_id: int) -> None:
+        await cls.filter(channel_id=channel_id).delete()
+
+        channel = await models.Channel.get_or_none(id=channel_id).values_list("name", "deleted")
+        if channel is None:
+            return
+        name, deleted = channel
+        if deleted:
+            return
+
+        username = await models.Username.filter(channel_id=channel_id).first().values_list("username", flat=True)
+        if not username:
+            # Private channels can't be found by search
+            return
+
+        to_create = [cls(token=token, is_public=True, channel_id=channel_id) for token in tokenize(name)]
+        to_create.append(cls(token=username.lower()[:TOKEN_MAX_LENGTH], is_public=True, channel_id=channel_id))
+
+        await cls.bulk_create(to_create)
+
+    @staticmethod
+    def query_tokens(q: str) -> list[str]:
+        return sorted(tokenize(q.lstrip("@")), key=len, reverse=True)[:MAX_QUERY_TOKENS]
+
+    @classmethod
+    def match_users(cls, q: str, field: str = "user_id") -> Q:
+        """
+        Returns query that matches rows whose `field` is id of a user with name or username words
+        starting with every word of `q`.
+        """
+
+        tokens = cls.query_tokens(q)
+        if not tokens:
+            return Q(**{f"{field}__in": []})
+
+        query = Q()
+        for token in tokens:
+            query &= Q(**{f"{field}__in": Subquery(
+                cls.filter(token_prefix_query(token), user_id__not_isnull=True).values_list("user_id", flat=True)
+            )})
+
+        return query
+
+    @classmethod
+    def search_public(cls, q: str) -> QuerySet[PeerSearchToken] | None:
+        """
+        Returns query of usernames and titles of public channels that contain words starting with every word of `q`,
+        ordered by matched word, so exact matches go first. Same peer may be returned more than once.
+        """
+
+        tokens = cls.query_tokens(q)
+        if not tokens:
+            return None
+
+        query = cls.filter(token_prefix_query(tokens[0]), is_public=True)
+        for token in tokens[1:]:
+            same_peer = cls.filter(token_prefix_query(token), is_public=True)
+            query = query.filter(
+                Q(user_id__in=Subquery(same_peer.values_list("user_id", flat=True)))
+                | Q(channel_id__in=Subquery(same_peer.values_list("channel_id", flat=True)))
+            )
+
+        return query.order_by("token", "id")
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+from asyncio import Task
 from datetime import datetime, UTC, timedelta
 from enum import auto, Enum
 from time import time
+from typing import ClassVar
 
+from loguru import logger
 from tortoise import fields, Model
+from tortoise.expressions import Subquery
+from tortoise.queryset import ValuesListQuery
 
 from piltover.db import models
 from piltover.db.enums import UserStatus, PrivacyRuleKeyType
@@ -35,19 +41,27 @@ class Presence(Model):
 
     user_id: int
 
+    # Presence updates are kept in memory and written to the database in batches, at most once per FLUSH_DELAY seconds,
+    #  so a user that updates status many times in a row (typing, reading, sending) costs one write per batch
+    FLUSH_DELAY = 1.0
+
+    _pending: ClassVar[dict[int, tuple[UserStatus, datetime]]] = {}
+    _flush_task: ClassVar[Task | None] = None
+
     EMPTY = EMPTY
     RECENTLY = RECENTLY
     LAST_WEEK = LAST_WEEK
     LAST_MONTH = LAST_MONTH
 
+    def is_online(self) -> bool:
+        return datetime.now(UTC) - self.last_seen < timedelta(seconds=30)
+
     async def to_tl(
             self, user: models.User | int | None, has_access: bool | _PresenceMissing = _MISSING,
     ) -> TLUserStatus:
         user_id = user.id if isinstance(user, models.User) else user
 
-        now = datetime.now(UTC)
-        delta = now - self.last_seen
-        if delta < timedelta(seconds=30):
+        if self.is_online():
             return UserStatusOnline(expires=int(time() + 30))
 
         if has_access is _MISSING:
@@ -85,5 +99,124 @@ class Presence(Model):
             raise RuntimeError("Can't set presence for bot")
 
         last_seen = datetime.now(UTC)
-        presence, _ = await cls.update_or_create(user=user, defaults={"status": status, "last_seen": last_seen})
-        return presence
+        cls._pending[user.id] = (status, last_seen)
+        if cls._flush_task is None:
+            cls._flush_task = asyncio.create_task(cls._flush_later())
+
+        return cls(user_id=user.id, status=status, last_seen=last_seen)
+
+    @classmethod
+    def pending_last_seen(cls, user_id: int) -> datetime | None:
+        """
+        Returns last_seen of given user that is not written to the database yet.
+        Only updates made in current process are known.
+        """
+
+        if (pending := cls._pending.get(user_id)) is not None:
+            return pending[1]
+        return None
+
+    @classmethod
+    async def get_many(cls, user_ids: list[int]) -> list[Presence]:
+        """
+        Returns presences of given users, with updates that are not written to the database yet applied,
+        including presences of users that don't have one in the database yet.
+        """
+
+        pending = {user_id: cls._pending[user_id] for user_id in user_ids if user_id in cls._pending}
+        presences = await cls.filter(user_id__in=user_ids)
+
+        for presence in presences:
+            if (pending_presence := pending.pop(presence.user_id, None)) is None:
+                continue
+            status, last_seen = pending_presence
+            if last_seen > presence.last_seen:
+                presence.status = status
+                presence.last_seen = last_seen
+
+        presences.extend(
+            cls(user_id=user_id, status=status, last_seen=last_seen)
+            for user_id, (status, last_seen) in pending.items()
+        )
+
+        return presences
+
+    @classmethod
+    async def count_online(cls, user_ids: ValuesListQuery, since: datetime) -> int:
+        """
+        Counts users (from given user ids query) that are online and were seen after given time,
+        with updates that are not written to the database yet applied.
+        """
+
+        pending = dict(cls._pending)
+        pending_ids = []
+        if pending:
+            pending_ids = await models.User.filter(
+                id__in=list(pending),
+            ).filter(id__in=Subquery(user_ids)).values_list("id", flat=True)
+
+        query = cls.filter(status=UserStatus.ONLINE, last_seen__gt=since, user_id__in=Subquery(user_ids))
+        if pending_ids:
+            query = query.exclude(user_id__in=pending_ids)
+
+        count = await query.count()
+        for user_id in pending_ids:
+            status, last_seen = pending[user_id]
+            if status is UserStatus.ONLINE and last_seen > since:
+                count += 1
+
+        return count
+
+    @classmethod
+    async def _flush_later(cls) -> None:
+        try:
+            await asyncio.sleep(cls.FLUSH_DELAY)
+            await cls.flush()
+        finally:
+            cls._flush_task = None
+            # Presences updated while previous batch was being written
+            if cls._pending:
+                cls._flush_task = asyncio.create_task(cls._flush_later())
+
+    @classmethod
+    async def flush(cls) -> None:
+        to_flush = dict(cls._pending)
+        if not to_flush:
+            return
+
+        to_create = dict(to_flush)
+        try:
+            to_update = []
+            for presence in await cls.filter(user_id__in=list(to_flush)):
+                status, last_seen = to_create.pop(presence.user_id)
+                # Presence may already be updated by another worker
+                if presence.last_seen >= last_seen:
+                    continue
+                presence.status = status
+                presence.last_seen = last_seen
+                to_update.append(presence)
+
+            if to_update:
+                await cls.bulk_update(to_update, fields=["status", "last_seen"])
+            if to_create:
+                await cls.bulk_create([
+                    cls(user_id=user_id, status=status, last_seen=last_seen)
+                    for user_id, (status, last_seen) in to_create.items()
+                ], ignore_conflicts=True)
+        except Exception as e:
+            # Pending presences are kept, so they are written with the next batch
+            logger.opt(exception=e).error(f"Failed to save presence of {len(to_flush)} users")
+            return
+
+        # Pending presences are removed only after they are written, so they are still returned
+        #  by pending_last_seen while being written
+        for user_id, pending in to_flush.items():
+            if cls._pending.get(user_id) is pending:
+                del cls._pending[user_id]
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._pending.clear()
+        if cls._flush_task is not None:
+            cls._flush_task.cancel()
+            cls._flush_task = None
@@ -203,6 +203,79 @@ class PrivacyRule(Model):
 
         return result
 
+    @classmethod
+    async def has_access_from_bulk(
+            cls, users: Iterable[models.User | int], target_user: models.User | int, key: PrivacyRuleKeyType,
+    ) -> dict[int, bool]:
+        """
+        Same as has_access_to, but checks access of multiple users to one target user.
+        Target's rule, cached results, exceptions and contacts are fetched once for all users.
+
+        :param users: users whose access is checked.
+        :param target_user: user whose privacy rule is checked.
+        :param key: privacy rule key.
+        :return: dict of user id to whether that user has access to target user.
+        """
+
+        target_id = target_user.id if isinstance(target_user, models.User) else target_user
+        user_ids = {
+            (user.id if isinstance(user, models.User) else user)
+            for user in users
+        }
+
+        results = {}
+        if target_id in user_ids:
+            user_ids.remove(target_id)
+            results[target_id] = True
+
+        if not user_ids:
+            return results
+
+        rule = await cls.get_or_none(user_id=target_id, key=key)
+        if rule is None:
+            results.update({user_id: False for user_id in user_ids})
+            return results
+
+        user_ids = list(user_ids)
+        cache_keys = [cls.cache_key(user_id, target_id, key, rule.version) for user_id in user_ids]
+        not_cached_ids = []
+        for user_id, allowed in zip(user_ids, await Cache.obj.multi_get(cache_keys)):
+            if allowed is None:
+                not_cached_ids.append(user_id)
+            else:
+                results[user_id] = allowed
+
+        if not not_cached_ids:
+            return results
+
+        exceptions = dict(
+            await models.PrivacyRuleException.filter(
+                rule=rule, user_id__in=not_cached_ids,
+            ).values_list("user_id", "allow")
+        )
+
+        contacts = set()
+        if rule.allow_contacts and not rule.allow_all:
+            contacts = set(
+                await Contact.filter(
+                    owner_id=target_id, target_id__in=not_cached_ids,
+                ).values_list("target_id", flat=True)
+            )
+
+        to_cache = []
+        for user_id in not_cached_ids:
+            if user_id in exceptions:
+                allow = exceptions[user_id]
+            else:
+                allow = rule.allow_all or (rule.allow_contacts and user_id in contacts)
+
+            results[user_id] = allow
+            to_cache.append((cls.cache_key(user_id, target_id, key, rule.version), allow))
+
+        await Cache.obj.multi_set(to_cache)
+
+        return results
+
     @classmethod
     async def has_access_to_bulk(
             cls, users: Iterable[models.User | int], user: models.User | int, keys: list[PrivacyRuleKeyType],
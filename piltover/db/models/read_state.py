@@ -2,22 +2,68 @@ from __future__ import annotations
 
 from pypika_tortoise import Dialects, Parameter
 from tortoise import fields, Model, Tortoise
+from tortoise.expressions import F
 from tortoise.functions import Count
 from tortoise.transactions import in_transaction
 
 from piltover.db import models
 from piltover.db.enums import PeerType
-from piltover.exceptions import Unreachable
-
-_UNREAD_COUNTS_SQL = """
-SELECT
-    state.id state_id, COUNT(mref.id) count
-FROM readstate state
-    JOIN messageref mref on state.peer_id = mref.peer_id and mref.id > state.last_message_id
-WHERE state.id {state_condition}
-GROUP BY state_id
+
+_SYNC_UNREAD_COUNTS_SQL = """
+UPDATE readstate
+SET
+    unread_count = (
+        SELECT COUNT(mref.id)
+        FROM messageref mref
+        WHERE mref.peer_id = readstate.peer_id AND mref.id > readstate.last_message_id
+    )
+WHERE readstate.peer_id {peer_condition}
+;
+"""
+_SYNC_CHANNEL_MESSAGES_COUNT_SQL = """
+UPDATE peer
+SET
+    messages_count = (
+        SELECT COUNT(mref.id)
+        FROM messageref mref
+        WHERE mref.peer_id = peer.id
+    )
+WHERE peer.id {peer_condition}
+;
+"""
+_SYNC_CHANNEL_READ_COUNTS_SQL = """
+UPDATE readstate
+SET
+    read_messages_count = (
+        SELECT COUNT(mref.id)
+        FROM messageref mref
+        WHERE mref.peer_id = readstate.peer_id AND mref.id <= readstate.last_message_id
+    )
+WHERE readstate.peer_id {peer_condition}
 ;
 """
+_DELETE_CHANNEL_READ_MESSAGES_SQL = """
+UPDATE readstate
+SET
+    read_messages_count = read_messages_count - (CASE {read_cases} ELSE 0 END)
+WHERE readstate.peer_id = {peer_placeholder}
+;
+"""
+_READ_CONTENTS_SQL = """
+UPDATE readstate
+SET
+    unread_mentions_count = unread_mentions_count - (CASE peer_id {mentions_cases} ELSE 0 END),
+    unread_reactions_count = unread_reactions_count - (CASE peer_id {reactions_cases} ELSE 0 END)
+WHERE readstate.owner_id = {owner_placeholder} AND readstate.peer_id IN ({peer_placeholders})
+;
+"""
+
+
+def _placeholders(start: int, count: int) -> list[str]:
+    conn = Tortoise.get_connection("default")
+    dialect = Dialects(conn.capabilities.dialect)
+    placeholder_factory = Parameter.IDX_PLACEHOLDERS[dialect]
+    return [placeholder_factory(start + i + 1) for i in range(count)]
 
 
 class ReadState(Model):
@@ -25,6 +71,13 @@ class ReadState(Model):
     last_message_id: int = fields.BigIntField(default=0)
     owner: models.User = fields.ForeignKeyField("models.User")
     peer: models.Peer = fields.ForeignKeyField("models.Peer")
+    # Counters below are maintained when messages/mentions/reactions are created, read or deleted,
+    #  so they don't need to be counted every time dialogs are fetched
+    unread_count: int = fields.IntField(default=0)
+    unread_mentions_count: int = fields.IntField(default=0)
+    unread_reactions_count: int = fields.IntField(default=0)
+    # Channel peers only: number of messages up to last_message_id, see Peer.messages_count
+    read_messages_count: int = fields.BigIntField(default=0)
 
     owner_id: int
     peer_id: int
@@ -35,14 +88,75 @@ class ReadState(Model):
         )
         # TODO: add index on peer-last_message_id?
 
+    @staticmethod
+    def _unread_target_id(peer: models.Peer) -> int | None:
+        if peer.type is PeerType.CHAT:
+            return models.Chat.make_id_from(peer.chat_id)
+        elif peer.type is PeerType.CHANNEL:
+            return models.Channel.make_id_from(peer.channel_id)
+        return None
+
+    @classmethod
+    async def _count_mentions_and_reactions(
+            cls, user_id: int, peers: list[models.Peer],
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        unread_reactions_counts = await models.MessageContent.filter(
+            author_id=user_id,
+            author_reactions_unread=True,
+            messagerefs__peer_id__in=[peer.id for peer in peers],
+        ).group_by(
+            "messagerefs__peer_id",
+        ).annotate(
+            count=Count("id"),
+        ).values_list("messagerefs__peer_id", "count")
+        unread_reactions_by_peer: dict[int, int] = dict(unread_reactions_counts)
+
+        peer_id_by_target_id = {}
+        for peer in peers:
+            if (unread_target_id := cls._unread_target_id(peer)) is not None:
+                peer_id_by_target_id[unread_target_id] = peer.id
+
+        unread_mentions_by_peer = {}
+        if peer_id_by_target_id:
+            mentions = await models.MessageMention.filter(
+                user_id=user_id, unread_target_id__in=list(peer_id_by_target_id),
+            ).group_by(
+                "unread_target_id",
+            ).annotate(
+                count=Count("id"),
+            ).values_list(
+                "unread_target_id", "count",
+            )
+
+            for unread_target_id, count in mentions:
+                unread_mentions_by_peer[peer_id_by_target_id[unread_target_id]] = count
+
+        return unread_reactions_by_peer, unread_mentions_by_peer
+
     @classmethod
     async def for_peers_bulk(cls, user_id: int, peers: list[models.Peer]) -> list[ReadState]:
         peer_ids = {peer.id for peer in peers}
         async with in_transaction():
             read_states = {ex.peer_id: ex for ex in await cls.filter(owner_id=user_id, peer_id__in=peer_ids)}
-            to_create = [ReadState(owner_id=user_id, peer=peer) for peer in peers if peer.id not in read_states]
-            if to_create:
-                await ReadState.bulk_create(to_create)
+            new_peers = [peer for peer in peers if peer.id not in read_states]
+            if new_peers:
+                # Nothing is read yet, so every message, mention and reaction in new peers is unread
+                unread_by_peer = dict(
+                    await models.MessageRef.filter(
+                        peer_id__in=[peer.id for peer in new_peers],
+                    ).group_by("peer_id").annotate(count=Count("id")).values_list("peer_id", "count")
+                )
+                reactions_by_peer, mentions_by_peer = await cls._count_mentions_and_reactions(user_id, new_peers)
+                await ReadState.bulk_create([
+                    ReadState(
+                        owner_id=user_id,
+                        peer=peer,
+                        unread_count=unread_by_peer.get(peer.id, 0),
+                        unread_mentions_count=mentions_by_peer.get(peer.id, 0),
+                        unread_reactions_count=reactions_by_peer.get(peer.id, 0),
+                    )
+                    for peer in new_peers
+                ])
 
         created = peer_ids - read_states.keys()
         if created:
@@ -58,82 +172,21 @@ class ReadState(Model):
         if not peers:
             return []
 
-        in_read_states = await cls.for_peers_bulk(user_id, peers)
-
-        fetch_unreads_for = []
-        for peer, read_state in zip(peers, in_read_states):
-            if (peer.last_message_id or 0) > read_state.last_message_id:
-                fetch_unreads_for.append(read_state.id)
-
-        unread_by_peer = {}
-        if fetch_unreads_for:
-            conn = Tortoise.get_connection("default")
-            dialect = Dialects(conn.capabilities.dialect)
-            placeholder_factory = Parameter.IDX_PLACEHOLDERS[dialect]
-            placeholders = [placeholder_factory(i + 1) for i in range(len(fetch_unreads_for))]
-
-            if len(fetch_unreads_for) == 1:
-                where_condition = f"= {placeholders[0]}"
-            else:
-                where_condition = f"IN ({','.join(placeholders)})"
-
-            sql = _UNREAD_COUNTS_SQL.format(state_condition=where_condition)
-            _, results = await conn.execute_query(sql, fetch_unreads_for)
-            for res in results:
-                unread_by_peer[res["state_id"]] = res["count"]
-
-        unread_reactions_by_peer = {}
-        if not no_reactions:
-            unread_reactions_counts = await models.MessageContent.filter(
-                author_id=user_id,
-                author_reactions_unread=True,
-                messagerefs__peer_id__in=[peer.id for peer in peers],
-            ).group_by(
-                "messagerefs__peer_id",
-            ).annotate(
-                count=Count("id"),
-            ).values_list("messagerefs__peer_id", "count")
-            unread_reactions_by_peer: dict[int, int] = dict(unread_reactions_counts)
-
-        unread_mentions_by_chat = {}
-        if not no_mentions:
-            unread_target_ids = set()
-            for peer in peers:
-                if peer.id not in unread_by_peer:
-                    # If no new messages - there can't be new mentions
-                    continue
-                if peer.type is PeerType.CHANNEL:
-                    unread_target_ids.add(models.Channel.make_id_from(peer.channel_id))
-                elif peer.type is PeerType.CHAT:
-                    unread_target_ids.add(models.Chat.make_id_from(peer.chat_id))
-
-            if unread_target_ids:
-                mentions = await models.MessageMention.filter(
-                    user_id=user_id, unread_target_id__in=unread_target_ids,
-                ).group_by(
-                    "unread_target_id",
-                ).annotate(
-                    count=Count("id"),
-                ).values_list(
-                    "unread_target_id", "count",
-                )
-
-                for unread_target_id, count in mentions:
-                    unread_mentions_by_chat[unread_target_id] = count
-
         result = []
-        for peer, in_read_state in zip(peers, in_read_states):
-            unread_target_id = None
-            if peer.type is PeerType.CHAT:
-                unread_target_id = models.Chat.make_id_from(peer.chat_id)
-            elif peer.type is PeerType.CHANNEL:
-                unread_target_id = models.Channel.make_id_from(peer.channel_id)
+        for peer, in_read_state in zip(peers, await cls.for_peers_bulk(user_id, peers)):
+            if peer.type is PeerType.CHANNEL:
+                unread_count = max(peer.messages_count - in_read_state.read_messages_count, 0)
+            else:
+                unread_count = max(in_read_state.unread_count, 0)
+            unread_reactions = 0 if no_reactions else max(in_read_state.unread_reactions_count, 0)
+            # If there are no new messages - there can't be new mentions
+            unread_mentions = 0 if no_mentions or not unread_count else max(in_read_state.unread_mentions_count, 0)
             result.append((
                 in_read_state.last_message_id,
                 peer.out_max_read_id,
-                unread_by_peer.get(in_read_state.id, 0),
-                unread_reactions_by_peer.get(peer.id, 0),
-                unread_mentions_by_chat.get(unread_target_id, 0),
+                unread_count,
+                unread_reactions,
+                unread_mentions,
             ))
 
         return result
@@ -142,34 +195,160 @@ class ReadState(Model):
     async def get_in_out_ids_and_unread(
             cls, user_id: int, peer: models.Peer, no_reactions: bool = False, no_mentions: bool = False,
     ) -> tuple[int, int, int, int, int]:
-        in_read_state, _ = await models.ReadState.get_or_create(owner_id=user_id, peer=peer)
-        unread_count = await models.MessageRef.filter(peer=peer, id__gt=in_read_state.last_message_id).count()
-        if no_reactions:
-            unread_reactions_count = 0
-        else:
-            unread_reactions_count = await models.MessageContent.filter(
-                messagerefs__peer=peer,
-                author_id=user_id,
-                author_reactions_unread=True,
-            ).count()
-
-        if not unread_count or no_mentions or peer.type not in (PeerType.CHAT, PeerType.CHANNEL):
-            unread_mentions = 0
-        else:
-            if peer.type is PeerType.CHAT:
-                unread_target_id = models.Chat.make_id_from(peer.chat_id)
+        result, = await cls.get_in_out_ids_and_unread_bulk(user_id, [peer], no_reactions, no_mentions)
+        return result
+
+    async def set_read(self, peer: models.Peer, last_message_id: int, unread_count: int) -> None:
+        """
+        Moves read position to given message and sets unread counter.
+        Mentions and reactions counters are recounted too, so they are corrected if they got out of sync
+        (e.g. when mentioned message was deleted).
+
+        :param peer: peer of this read state.
+        :param last_message_id: id of last read message.
+        :param unread_count: number of messages after last_message_id.
+        """
+
+        reactions_by_peer, mentions_by_peer = await self._count_mentions_and_reactions(self.owner_id, [peer])
+
+        self.last_message_id = last_message_id
+        self.unread_count = unread_count
+        self.unread_reactions_count = reactions_by_peer.get(peer.id, 0)
+        self.unread_mentions_count = mentions_by_peer.get(peer.id, 0)
+        update_fields = ["last_message_id", "unread_count", "unread_reactions_count", "unread_mentions_count"]
+
+        if peer.type is PeerType.CHANNEL:
+            messages_count = await models.Peer.get(id=peer.id).values_list("messages_count", flat=True)
+            self.read_messages_count = max(messages_count - unread_count, 0)
+            update_fields.append("read_messages_count")
+
+        await self.save(update_fields=update_fields)
+
+    @classmethod
+    async def add_unread_bulk(cls, peers: list[models.Peer | int], count: int = 1) -> None:
+        if not peers or count <= 0:
+            return
+
+        channel_peer_ids = []
+        peer_ids = []
+        for peer in peers:
+            if isinstance(peer, int):
+                peer_ids.append(peer)
             elif peer.type is PeerType.CHANNEL:
-                unread_target_id = models.Channel.make_id_from(peer.channel_id)
+                channel_peer_ids.append(peer.id)
             else:
-                raise Unreachable
-            unread_mentions = await models.MessageMention.filter(
-                user_id=user_id, unread_target_id=unread_target_id,
-            ).count()
-
-        return (
-            in_read_state.last_message_id,
-            peer.out_max_read_id,
-            unread_count,
-            unread_reactions_count,
-            unread_mentions,
+                peer_ids.append(peer.id)
+
+        if channel_peer_ids:
+            await models.Peer.filter(id__in=channel_peer_ids).update(messages_count=F("messages_count") + count)
+        if peer_ids:
+            await cls.filter(peer_id__in=peer_ids).update(unread_count=F("unread_count") + count)
+
+    @classmethod
+    async def sync_unread_bulk(cls, peers: list[models.Peer | int]) -> None:
+        if not peers:
+            return
+
+        peer_ids = list({(peer.id if isinstance(peer, models.Peer) else peer) for peer in peers})
+        channel_peer_ids = await models.Peer.filter(
+            id__in=peer_ids, type=PeerType.CHANNEL,
+        ).values_list("id", flat=True)
+        peer_ids = [peer_id for peer_id in peer_ids if peer_id not in channel_peer_ids]
+
+        conn = Tortoise.get_connection("default")
+
+        for sql_template, ids in (
+                (_SYNC_UNREAD_COUNTS_SQL, peer_ids),
+                (_SYNC_CHANNEL_MESSAGES_COUNT_SQL, channel_peer_ids),
+                (_SYNC_CHANNEL_READ_COUNTS_SQL, channel_peer_ids),
+        ):
+            if not ids:
+                continue
+
+            placeholders = _placeholders(0, len(ids))
+            if len(ids) == 1:
+                peer_condition = f"= {placeholders[0]}"
+            else:
+                peer_condition = f"IN ({','.join(placeholders)})"
+
+            await conn.execute_query(sql_template.format(peer_condition=peer_condition), ids)
+
+    @classmethod
+    async def delete_channel_messages(cls, peer: models.Peer, message_ids: list[int], deleted_count: int) -> None:
+        """
+        Decrements message counters of channel peer (and read counters of every subscriber) after messages
+        were deleted, instead of counting all messages of a channel for every subscriber again.
+
+        :param peer: channel peer.
+        :param message_ids: ids of messages that were requested to be deleted.
+        :param deleted_count: number of messages that were actually deleted, counters are recounted if it
+            doesn't match message_ids (e.g. some of them were deleted concurrently).
+        """
+
+        if not message_ids:
+            return
+        if deleted_count != len(set(message_ids)):
+            return await cls.sync_unread_bulk([peer])
+
+        await models.Peer.filter(id=peer.id).update(messages_count=F("messages_count") - deleted_count)
+
+        # Number of deleted messages up to last_message_id: for ids sorted in descending order,
+        #  if last_message_id >= ids[i], then len(ids) - i of deleted messages were read
+        ids = sorted(set(message_ids), reverse=True)
+        placeholders = _placeholders(0, len(ids) + 1)
+        read_cases = " ".join(
+            f"WHEN readstate.last_message_id >= {placeholders[i]} THEN {len(ids) - i}" for i in range(len(ids))
+        )
+
+        conn = Tortoise.get_connection("default")
+        await conn.execute_query(
+            _DELETE_CHANNEL_READ_MESSAGES_SQL.format(read_cases=read_cases, peer_placeholder=placeholders[-1]),
+            [*ids, peer.id],
+        )
+
+    @classmethod
+    async def add_unread_mentions(cls, user_ids: list[int], peers: list[models.Peer | int]) -> None:
+        if not user_ids or not peers:
+            return
+
+        peer_ids = [(peer.id if isinstance(peer, models.Peer) else peer) for peer in peers]
+        await cls.filter(owner_id__in=user_ids, peer_id__in=peer_ids).update(
+            unread_mentions_count=F("unread_mentions_count") + 1,
+        )
+
+    @classmethod
+    async def add_unread_reactions(cls, author_id: int, content_id: int) -> None:
+        peer_ids = await models.MessageRef.filter(content_id=content_id).values_list("peer_id", flat=True)
+        await cls.filter(owner_id=author_id, peer_id__in=peer_ids).update(
+            unread_reactions_count=F("unread_reactions_count") + 1,
+        )
+
+    @classmethod
+    async def read_contents(
+            cls, user_id: int, mentions_by_peer: dict[int, int], reactions_by_peer: dict[int, int],
+    ) -> None:
+        peer_ids = list(mentions_by_peer.keys() | reactions_by_peer.keys())
+        if not peer_ids:
+            return
+
+        args = []
+        cases = []
+        for counts in (mentions_by_peer, reactions_by_peer):
+            placeholders = _placeholders(len(args), len(peer_ids) * 2)
+            cases.append(" ".join(
+                f"WHEN {placeholders[i * 2]} THEN {placeholders[i * 2 + 1]}" for i in range(len(peer_ids))
+            ))
+            for peer_id in peer_ids:
+                args.extend((peer_id, counts.get(peer_id, 0)))
+
+        owner_placeholder, *peer_placeholders = _placeholders(len(args), len(peer_ids) + 1)
+        args.append(user_id)
+        args.extend(peer_ids)
+
+        sql = _READ_CONTENTS_SQL.format(
+            mentions_cases=cases[0],
+            reactions_cases=cases[1],
+            owner_placeholder=owner_placeholder,
+            peer_placeholders=",".join(peer_placeholders),
         )
+        await Tortoise.get_connection("default").execute_query(sql, args)
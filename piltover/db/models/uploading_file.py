@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from hashlib import sha256
 from io import BytesIO
 from uuid import UUID, uuid4
 
@@ -10,6 +11,7 @@ from piltover.db import models
 from piltover.db.enums import FileType
 from piltover.exceptions import ErrorRpc
 from piltover.storage.base import BaseStorage, StorageType
+from piltover.tl import Long
 from piltover.utils.debug import measure_time
 
 
@@ -18,6 +20,8 @@ class UploadingFile(Model):
     file_id: str = fields.CharField(db_index=True, max_length=64)
     physical_id: UUID = fields.UUIDField(default=uuid4)
     total_parts: int = fields.IntField(default=0)
+    # Size of every part except last one, known after first part or any part that is not last is saved
+    part_size: int | None = fields.IntField(null=True, default=None)
     created_at: datetime = fields.DatetimeField(auto_now_add=True)
     mime: str | None = fields.CharField(max_length=64, null=True, default=None)
     user: models.User = fields.ForeignKeyField("models.User", on_delete=fields.CASCADE)
@@ -27,6 +31,23 @@ class UploadingFile(Model):
             ("user", "file_id",),
         )
 
+    @staticmethod
+    def content_hash(parts: list[UploadingFilePart], storage_type: StorageType) -> str | None:
+        """
+        Returns hash of file contents made from hashes of its parts (which are calculated when parts are saved,
+        since parts may be uploaded in any order), or None if some part has no hash.
+        Same contents uploaded with different part size have different hashes.
+        """
+
+        content_hash = sha256(storage_type.value.encode("utf8"))
+        for part in parts:
+            if part.digest is None:
+                return None
+            content_hash.update(Long.write(part.size))
+            content_hash.update(part.digest)
+
+        return content_hash.hexdigest()
+
     async def finalize_upload(
             self, storage: BaseStorage, fallback_mime: str, attributes: list | None = None,
             file_type: FileType = FileType.DOCUMENT, parts_num: int | None = None, force_fallback_mime: bool = False,
@@ -47,6 +68,10 @@ class UploadingFile(Model):
         if parts[0].part_id != 0:
             raise ErrorRpc(error_code=400, error_message=f"FILE_PART_0_MISSING")
 
+        # Parts are written at part_id * part_size, so all of them (except last one) must have the same size
+        if self.part_size is not None and any(part.size != self.part_size for part in parts[:-1]):
+            raise ErrorRpc(error_code=400, error_message="FILE_PARTS_INVALID", reason="part size changed")
+
         size = parts[0].size
         for idx in range(1, len(parts)):
             part = parts[idx]
@@ -70,8 +95,26 @@ class UploadingFile(Model):
             finalize_as = StorageType.DOCUMENT
             component = storage.documents
 
+        # Thumbnails of files with thumbnail from client or profile photos are not made only from contents,
+        #  so such files are not deduplicated
+        if thumb_bytes is None and not profile_photo:
+            file.content_hash = self.content_hash(parts, finalize_as)
+
+        if file.content_hash is not None:
+            with measure_time("<find file with same contents>"):
+                existing = await models.File.filter(
+                    content_hash=file.content_hash, mime_type=file.mime_type,
+                ).order_by("id").first()
+            if existing is not None:
+                with measure_time("storage.discard_upload"):
+                    await storage.discard_upload(self.physical_id, len(parts))
+                file.physical_id = existing.physical_id
+                file.copy_derived_from(existing)
+                await file.save()
+                return file
+
         with measure_time("storage.finalize_upload_as"):
-            await storage.finalize_upload_as(self.physical_id, finalize_as, len(parts))
+            await storage.finalize_upload_as(self.physical_id, finalize_as, len(parts), part_size=self.part_size)
 
         if not force_fallback_mime and self.mime is not None and self.mime.startswith("video/"):
             from piltover.app.utils.utils import extract_video_metadata
@@ -96,6 +139,8 @@ class UploadingFilePart(Model):
     part_id: int = fields.IntField()
     physical_id: UUID = fields.UUIDField(default=uuid4)
     size: int = fields.IntField()
+    # Sha256 of part contents
+    digest: bytes | None = fields.BinaryField(null=True, default=None)
     file: UploadingFile = fields.ForeignKeyField("models.UploadingFile", on_delete=fields.CASCADE)
 
     class Meta:
@@ -133,7 +133,9 @@ class User(Model):
 
         presence_last_seen = None
         if not self.bot:
-            if self.presence is None or isinstance(self.presence, models.Presence):
+            if (pending_last_seen := models.Presence.pending_last_seen(self.id)) is not None:
+                presence_last_seen = int(pending_last_seen.timestamp())
+            elif self.presence is None or isinstance(self.presence, models.Presence):
                 presence_last_seen = int(self.presence.last_seen.timestamp()) if self.presence else None
             else:
                 presence = await models.Presence.get_or_none(user_id=self.id).only("last_seen")
@@ -349,6 +351,7 @@ class User(Model):
 
             emoji_status = emoji_statuses.get(user.id)
             presence = presences.get(user.id)
+            last_seen = models.Presence.pending_last_seen(user.id) or (presence.last_seen if presence else None)
 
             tl.append(UserToFormat(
                 id=user.id,
@@ -363,7 +366,7 @@ class User(Model):
                 color=color,
                 profile_color=profile_color,
                 emoji_status=emoji_status.to_tl() if emoji_status is not None else None,
-                last_seen=int(presence.last_seen.timestamp()) if presence is not None else None,
+                last_seen=int(last_seen.timestamp()) if last_seen is not None else None,
             ))
 
             to_cache.append((user._cache_key(), tl[-1]))
@@ -447,4 +450,5 @@ class User(Model):
             user = await cls.create(phone_number=phone_number, first_name=first_name, last_name=last_name)
             await models.State.create(user=user)
             await models.Peer.create(owner=user, type=PeerType.SELF, user=user)
+            await models.PeerSearchToken.index_user(user.id)
         return user
@@ -30,6 +30,8 @@ class UserAuthorization(Model):
     app_version: str = fields.CharField(max_length=32, default="Unknown")
 
     upd_seq: int = fields.BigIntField(default=0)
+    # Upper bound of seq numbers reserved by gateways (see SeqAllocator), always >= upd_seq
+    upd_seq_reserved: int = fields.BigIntField(default=0)
     upd_qts: int = fields.BigIntField(default=0)
 
     #app: models.ApiApplication = fields.ForeignKeyField("models.ApiApplication")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Collection
+
+from pypika_tortoise import Dialects, Parameter
+from tortoise import Tortoise, Model
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+_INCREMENT_RETURNING_SQL = """
+UPDATE {table} SET pts = pts + {increment} WHERE {key} {condition} RETURNING {key} k, pts
+;
+"""
+_INCREMENT_LAST_INSERT_ID_SQL = """
+UPDATE {table} SET pts = LAST_INSERT_ID(pts + %s) WHERE {key} = %s
+;
+"""
+_SELECT_SQL = """
+SELECT {key} k, pts FROM {table} WHERE {key} {condition}
+;
+"""
+
+
+class PtsAllocator:
+    """
+    Allocates pts ranges of users (State.pts) and channels (Channel.pts) with atomic increments,
+    without "SELECT ... FOR UPDATE" transactions, so concurrent senders to the same peer only wait for each other
+    for the duration of a single UPDATE statement.
+
+    Sqlite and PostgreSQL increment all rows in one "UPDATE ... RETURNING" statement.
+    MySQL has no RETURNING, so every row is incremented with "pts = LAST_INSERT_ID(pts + n)",
+    new value is then returned by the server in the same response (as last insert id).
+    """
+
+    @staticmethod
+    def _dialect(conn: BaseDBAsyncClient) -> Dialects:
+        dialect = conn.capabilities.dialect
+        return Dialects.POSTGRESQL if dialect == "postgres" else Dialects(dialect)
+
+    @staticmethod
+    def _condition(dialect: Dialects, count: int, start: int = 1) -> str:
+        placeholder_factory = Parameter.IDX_PLACEHOLDERS[dialect]
+        if count == 1:
+            return f"= {placeholder_factory(start)}"
+        return f"IN ({','.join(placeholder_factory(start + i) for i in range(count))})"
+
+    @classmethod
+    async def _select(cls, model: type[Model], key: str, ids: Collection[int]) -> dict[int, int]:
+        conn = Tortoise.get_connection("default")
+        sql = _SELECT_SQL.format(
+            table=model._meta.db_table, key=key, condition=cls._condition(cls._dialect(conn), len(ids)),
+        )
+        _, rows = await conn.execute_query(sql, list(ids))
+        return {row["k"]: row["pts"] for row in rows}
+
+    @classmethod
+    async def _increment(cls, model: type[Model], key: str, counts: dict[int, int]) -> dict[int, int]:
+        conn = Tortoise.get_connection("default")
+        dialect = cls._dialect(conn)
+        table = model._meta.db_table
+
+        if dialect is Dialects.MYSQL:
+            sql = _INCREMENT_LAST_INSERT_ID_SQL.format(table=table, key=key)
+            ids = list(counts)
+            new_ptss = await asyncio.gather(*(conn.execute_insert(sql, [counts[id_], id_]) for id_ in ids))
+            # LAST_INSERT_ID is not changed (and 0 is returned) if row does not exist
+            return {id_: new_pts for id_, new_pts in zip(ids, new_ptss) if new_pts}
+
+        placeholder_factory = Parameter.IDX_PLACEHOLDERS[dialect]
+        if len(counts) == 1:
+            id_, count = next(iter(counts.items()))
+            increment = placeholder_factory(1)
+            condition = f"= {placeholder_factory(2)}"
+            values = [count, id_]
+        else:
+            cases = " ".join(
+                f"WHEN {placeholder_factory(i * 2 + 1)} THEN {placeholder_factory(i * 2 + 2)}"
+                for i in range(len(counts))
+            )
+            increment = f"CASE {key} {cases} ELSE 0 END"
+            condition = cls._condition(dialect, len(counts), len(counts) * 2 + 1)
+            values = [value for id_, count in counts.items() for value in (id_, count)]
+            values.extend(counts)
+
+        sql = _INCREMENT_RETURNING_SQL.format(table=table, key=key, increment=increment, condition=condition)
+        _, rows = await conn.execute_query(sql, values)
+        return {row["k"]: row["pts"] for row in rows}
+
+    @classmethod
+    async def allocate(cls, model: type[Model], key: str, ids: list[int], pts_counts: Collection[int]) -> list[int]:
+        """
+        Increments pts of rows of given model by given amounts.
+
+        :param model: model with "pts" field (State or Channel).
+        :param key: name of the column by which rows are looked up.
+        :param ids: values of key column, may contain duplicates (their counts are summed up).
+        :param pts_counts: amount by which pts of each row is incremented, rows with count <= 0 are only read.
+        :return: new pts of each row, in the same order as ids.
+        """
+
+        counts: dict[int, int] = {}
+        for id_, pts_count in zip(ids, pts_counts):
+            if pts_count > 0:
+                counts[id_] = counts.get(id_, 0) + pts_count
+
+        new_ptss = await cls._increment(model, key, counts) if counts else {}
+        if to_select := {id_ for id_ in ids if id_ not in counts}:
+            new_ptss.update(await cls._select(model, key, to_select))
+
+        return [new_ptss[id_] for id_ in ids]
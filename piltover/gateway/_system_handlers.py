@@ -10,7 +10,8 @@ from loguru import logger
 from piltover.db.models import UserAuthorization, AuthKey
 from piltover.tl import InitConnection, MsgsAck, Ping, Pong, PingDelayDisconnect, InvokeWithLayer, InvokeAfterMsg, \
     InvokeWithoutUpdates, RpcDropAnswer, DestroySession, DestroySessionOk, RpcAnswerUnknown, GetFutureSalts, \
-    FutureSalt, Long
+    FutureSalt, Long, DestroySessionNone
+from piltover.session import SessionManager
 from piltover.tl.core_types import Message, RpcResult, FutureSalts
 
 if TYPE_CHECKING:
@@ -18,8 +19,8 @@ if TYPE_CHECKING:
     from piltover.session import Session
 
 
-async def msgs_ack(_1: Client, _2: Message[MsgsAck], _3: Session) -> None:
-    return
+async def msgs_ack(_: Client, request: Message[MsgsAck], session: Session) -> None:
+    session.ack(request.obj.msg_ids)
 
 
 async def ping(_1: Client, request: Message[Ping], _2: Session) -> Pong:
@@ -88,7 +89,16 @@ async def init_connection(client: Client, request: Message[InitConnection], sess
     return await _invoke_inner_query(client, request, session)
 
 
-async def destroy_session(_1: Client, request: Message[DestroySession], _3: Session) -> DestroySessionOk:
+async def destroy_session(
+        _: Client, request: Message[DestroySession], session: Session,
+) -> DestroySessionOk | DestroySessionNone:
+    to_destroy = SessionManager.sessions.get((session.auth_data.auth_key_id, request.obj.session_id))
+    if to_destroy is None:
+        return DestroySessionNone(session_id=request.obj.session_id)
+
+    # Session that waits for client to reconnect should not keep receiving updates
+    if to_destroy is not session and to_destroy.client is None:
+        to_destroy.destroy()
     return DestroySessionOk(session_id=request.obj.session_id)
 
 
@@ -3,8 +3,7 @@ from __future__ import annotations
 import asyncio
 import struct
 import time
-from asyncio import Event
-from io import BytesIO
+from asyncio import Event, Future
 from typing import TYPE_CHECKING, cast, Any
 
 from loguru import logger
@@ -18,23 +17,36 @@ from taskiq import AsyncTaskiqTask, TaskiqResult, TaskiqResultTimeoutError
 from taskiq.brokers.inmemory_broker import InmemoryResultBackend
 from taskiq.kicker import AsyncKicker
 
+from piltover._taskiq_binary_formatter import encode_rpc_payload, decode_rpc_payload
 from piltover.auth_data import AuthData, GenAuthData
 from piltover.exceptions import Disconnection, InvalidConstructorException, Unreachable
 from piltover.gateway._keygen_handlers import KEYGEN_HANDLERS
 from piltover.gateway._system_handlers import SYSTEM_HANDLERS
 from piltover.session import Session, SessionManager
+from piltover.session.response_cache import ResponseCache
+from piltover.session.seq_allocator import SeqAllocator
+from piltover.storage.file_part_token import check_file_part_token, read_file_part
 from piltover.tl import NewSessionCreated, Long, Int, RpcError, ReqPq, ReqPqMulti, MsgsAck
 from piltover.tl.core_types import TLObject, MsgContainer, Message, RpcResult
 from piltover.tl.functions.auth import BindTempAuthKey
 from piltover.tl.functions.internal import CallRpc
-from piltover.tl.types.internal import RpcResponse
+from piltover.tl.functions.updates import GetState, GetDifference, GetDifference_133
+from piltover.tl.types.internal import RpcResponse, FilePartToken
 from piltover.utils.debug import measure_time
+from piltover.utils.message_encryption import encrypt_server_message
 from ..db.models import AuthKey
 
 if TYPE_CHECKING:
     from .server import Gateway
 
 
+# Containers are limited to 1020 messages, small messages are packed until container reaches 32kb
+MAX_CONTAINER_MESSAGES = 1020
+MAX_CONTAINER_SIZE = 32 * 1024
+
+# Methods that return seq of the authorization, which SeqAllocator writes to the database lazily
+_RETURNS_SEQ_TLIDS = {GetState.tlid(), GetDifference.tlid(), GetDifference_133.tlid()}
+
 _check_req_pq_tlid = (
     Int.write(ReqPq.tlid(), False),
     Int.write(ReqPqMulti.tlid(), False),
@@ -44,7 +56,7 @@ _check_req_pq_tlid = (
 class Client:
     __slots__ = (
         "server", "reader", "writer", "conn", "peername", "gen_auth_data", "empty_session", "disconnect_timeout",
-        "write_lock", "active_sessions", "active_keys", "message_available", "loop", "tasks",
+        "write_lock", "active_sessions", "active_keys", "message_available", "loop", "tasks", "inflight_requests",
     )
 
     def __init__(self, server: Gateway, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
@@ -67,22 +79,32 @@ class Client:
         self.message_available = Event()
         self.loop = asyncio.get_running_loop()
         self.tasks = set()
+        self.inflight_requests = asyncio.Semaphore(server.max_inflight_requests)
 
-    @staticmethod
-    def _session_evicted(_: Any, session: Session) -> None:
-        session.disconnect()
+    def _request_done(self, task: asyncio.Task) -> None:
+        self.tasks.discard(task)
+        self.inflight_requests.release()
+
+    def _session_evicted(self, _: Any, session: Session) -> None:
+        session.disconnect(self)
 
     def _get_cached_session(self, auth_key_id: int, session_id: int) -> Session | None:
         uniq_id = (auth_key_id, session_id)
         if uniq_id in self.active_sessions:
             return self.active_sessions[uniq_id]
 
-    def _get_session(self, session_id: int, auth_data: AuthData) -> tuple[Session, bool]:
+    async def _get_session(self, session_id: int, auth_data: AuthData) -> tuple[Session, bool]:
         if (cached := self._get_cached_session(auth_data.auth_key_id, session_id)) is not None:
             return cached, False
 
         session, created = SessionManager.get_or_create(session_id, self, auth_data)
+        # Session may have been detached from connection in another gateway process
+        if created and await session.load_state():
+            created = False
+            await SessionManager.session_resumed(session)
         session.connect(self)
+        # Requests of this session must not be processed before gateway receives updates for it
+        await SessionManager.broker.wait_subscribed()
 
         self.active_sessions[session.uniq_id()] = session
         return session, created
@@ -111,10 +133,13 @@ class Client:
         return packet
 
     async def _write_packet(self, packet: BasePacket, ignore_errors: bool = False) -> None:
-        to_send = self.conn.send(packet)
+        await self._write_packets([packet], ignore_errors)
+
+    async def _write_packets(self, packets: list[BasePacket], ignore_errors: bool = False) -> None:
         try:
             async with self.write_lock:
-                self.writer.write(to_send)
+                for packet in packets:
+                    self.writer.write(self.conn.send(packet))
                 await self.writer.drain()
         except ConnectionResetError:
             if ignore_errors:
@@ -125,9 +150,9 @@ class Client:
                 return
             raise Disconnection from e
 
-    async def _write_message(
+    async def _encrypt_message(
             self, message_id: int, seq_no: int, data: bytes, session: Session,
-    ) -> None:
+    ) -> EncryptedMessagePacket:
         if not session.auth_data or session.auth_data.auth_key is None:
             raise Unreachable("Trying to send encrypted response, but auth_key is empty")
 
@@ -143,9 +168,12 @@ class Client:
             data=data,
         )
 
-        encrypted = decrypted.encrypt(session.auth_data.auth_key, ConnectionRole.SERVER)
-
-        await self._write_packet(encrypted)
+        executor = self.server.encryption_executor
+        if executor is None:
+            return encrypt_server_message(decrypted, session.auth_data.auth_key)
+        return await self.loop.run_in_executor(
+            executor, encrypt_server_message, decrypted, session.auth_data.auth_key,
+        )
 
     async def send_unencrypted(self, obj: TLObject) -> None:
         logger.debug(obj)
@@ -155,7 +183,6 @@ class Client:
         ))
 
     async def _kiq(self, obj: TLObject, session: Session, message_id: int | None = None) -> AsyncTaskiqTask:
-        # TODO: dont do .write.hex(), RpcResponse somehow doesn't need encoding it manually, check how exactly
         call_rpc = CallRpc(
             obj=obj,
             layer=session.layer,
@@ -167,10 +194,12 @@ class Client:
             user_id=session.user_id,
             is_bot=session.is_bot,
             mfa_pending=session.mfa_pending,
-        ).write().hex()
+        )
+        call_data = encode_rpc_payload(self.server.broker, call_rpc.write())
 
         with measure_time(".kiq()"):
-            return await AsyncKicker(task_name=f"handle_tl_rpc", broker=self.server.broker, labels={}).kiq(call_rpc)
+            kicker = AsyncKicker(task_name="handle_tl_rpc", broker=self.server.broker, labels=self.server.rpc_labels)
+            return await kicker.kiq(call_data)
 
     async def handle_unencrypted_message(self, obj: TLObject) -> None:
         # TODO: move it to worker (and add db models to save auth key generation state)
@@ -214,7 +243,7 @@ class Client:
             if session is None:
                 if auth_data is None:
                     auth_data = await self._get_auth_data(packet.auth_key_id)
-                session, _ = self._get_session(decrypted.session_id, auth_data)
+                session, _ = await self._get_session(decrypted.session_id, auth_data)
                 session.update_salts_maybe(self.server.salt_key)
 
             if packet.needs_quick_ack:
@@ -229,7 +258,7 @@ class Client:
                 message = Message(
                     message_id=decrypted.message_id,
                     seq_no=decrypted.seq_no,
-                    obj=TLObject.read(BytesIO(decrypted.data)),
+                    obj=TLObject.read_buffer(decrypted.data),
                 )
             except (struct.error, ValueError, InvalidConstructorException) as e:
                 logger.opt(exception=e).error("Failed to read object. Raw data: {raw_data}", raw_data=decrypted.data)
@@ -266,11 +295,14 @@ class Client:
                 user_id=session.user_id,
                 message=message,
             )
+            # Connection is not read until some of its requests are processed if there are too many of them already,
+            #  so client (and tcp) are slowed down instead of gateway buffering all of them
+            await self.inflight_requests.acquire()
             task = self.loop.create_task(self.handle_encrypted_message(message, session))
             self.tasks.add(task)
-            task.add_done_callback(self.tasks.discard)
+            task.add_done_callback(self._request_done)
         elif isinstance(packet, UnencryptedMessagePacket):
-            decoded = TLObject.read(BytesIO(packet.message_data))
+            decoded = TLObject.read_buffer(packet.message_data)
             if isinstance(decoded, (ReqPq, ReqPqMulti)):
                 peeked = self.conn.peek_packet()
                 if peeked is TransportEvent.DISCONNECT:
@@ -285,7 +317,7 @@ class Client:
                     await asyncio.sleep(0)
 
                 if packet is not None:
-                    decoded = TLObject.read(BytesIO(packet.message_data))
+                    decoded = TLObject.read_buffer(packet.message_data)
 
             logger.debug("{decoded}", decoded=decoded)
             await self.handle_unencrypted_message(decoded)
@@ -321,23 +353,67 @@ class Client:
                 logger.opt(exception=e).error("An error occurred in recv loop")
                 raise
 
+    async def _pack_and_encrypt_queued(self, session: Session) -> list[EncryptedMessagePacket]:
+        messages = []
+        while not session.message_queue.empty():
+            message_id, seq_no, data = session.message_queue.get_nowait()
+            if isinstance(data, Future):
+                try:
+                    data = await data
+                except Exception as e:
+                    # Only this message is dropped, other queued messages are still sent
+                    logger.opt(exception=e).error(f"Failed to serialize message {message_id}, dropping it")
+                    continue
+            session.message_sent(message_id, seq_no, data)
+            messages.append((message_id, seq_no, data))
+
+        # Small messages are packed into containers, so whole batch is encrypted and written at once
+        to_encrypt = []
+        batch = []
+        batch_size = 0
+        for message in messages:
+            message_size = len(message[2]) + 16
+            if batch and (batch_size + message_size > MAX_CONTAINER_SIZE or len(batch) >= MAX_CONTAINER_MESSAGES):
+                to_encrypt.append(session.pack_container(batch) if len(batch) > 1 else batch[0])
+                batch, batch_size = [], 0
+            batch.append(message)
+            batch_size += message_size
+
+        if batch:
+            to_encrypt.append(session.pack_container(batch) if len(batch) > 1 else batch[0])
+
+        encrypted = await asyncio.gather(*(
+            self._encrypt_message(message_id, seq_no, data, session)
+            for message_id, seq_no, data in to_encrypt
+        ), return_exceptions=True)
+
+        result = []
+        for (message_id, _, _), packet in zip(to_encrypt, encrypted):
+            if isinstance(packet, BaseException):
+                if not isinstance(packet, Exception):
+                    raise packet
+                logger.opt(exception=packet).error(f"Failed to encrypt message {message_id}, dropping it")
+                continue
+            result.append(packet)
+
+        return result
+
     async def _worker_loop_send(self) -> None:
         while True:
-            try:
-                await asyncio.wait_for(self.message_available.wait(), 0.1)
-            except TimeoutError:
-                pass
+            await self.message_available.wait()
+            # Cleared before queues are drained, so messages enqueued while sending set it again
+            self.message_available.clear()
 
-            sent = False
-            for session in list(self.active_sessions.values()):
-                if session.message_queue.empty():
-                    continue
-                message_id, seq_no, data = session.message_queue.get_nowait()
-                await self._write_message(message_id, seq_no, data, session)
-                sent = True
+            # Messages may be serialized/encrypted concurrently in executor, but they are written in queue order
+            packets = await asyncio.gather(*(
+                self._pack_and_encrypt_queued(session)
+                for session in list(self.active_sessions.values())
+                if not session.message_queue.empty()
+            ))
 
-            if not sent and not any(not sess.message_queue.empty() for sess in self.active_sessions.values()):
-                self.message_available.clear()
+            to_send = [packet for session_packets in packets for packet in session_packets]
+            if to_send:
+                await self._write_packets(to_send)
 
     async def _timer_task(self) -> None:
         try:
@@ -384,23 +460,30 @@ class Client:
 
             for session in self.active_sessions.values():
                 logger.info(f"Session {session.session_id} removed")
-                session.disconnect()
+                session.disconnect(self)
 
             self.active_sessions.clear()
 
+    @staticmethod
+    async def _wait_result(task: AsyncTaskiqTask[bytes | str], timeout: float) -> TaskiqResult[bytes | str]:
+        # Result backends used here are notified when result is set or pushed, so there is no need to poll them
+        if not await task.result_backend.wait_for_result(task.task_id, timeout):
+            raise TaskiqResultTimeoutError(timeout=timeout)
+        return await task.get_result()
+
     async def _wait_result_with_ack(
-            self, task: AsyncTaskiqTask[str], message_id: int, session: Session, method_name: str,
-    ) -> TaskiqResult[str]:
+            self, task: AsyncTaskiqTask[bytes | str], message_id: int, session: Session, method_name: str,
+    ) -> TaskiqResult[bytes | str]:
         start_time = time.perf_counter()
         result = None
 
         try:
-            result = await task.wait_result(timeout=1.5)
+            result = await self._wait_result(task, 1.5)
             return result
         except TaskiqResultTimeoutError as e:
             logger.opt(exception=e).warning(f"Task timeout exceeded, sending ack to message {message_id}")
             await session.enqueue(MsgsAck(msg_ids=[message_id]), False)
-            result = await task.wait_result(timeout=15)
+            result = await self._wait_result(task, 15)
             return result
         finally:
             end_time = time.perf_counter()
@@ -416,6 +499,17 @@ class Client:
         if request.obj.tlid() in SYSTEM_HANDLERS:
             return await SYSTEM_HANDLERS[request.obj.tlid()](self, request, session)
 
+        if request.obj.tlid() in _RETURNS_SEQ_TLIDS and session.auth_id is not None:
+            await SeqAllocator.flush_auth(session.auth_id)
+
+        if (cache_key := ResponseCache.make_key(request.obj, session)) is not None:
+            return await ResponseCache.get_or_fetch(
+                cache_key, request.message_id, session, lambda: self._execute_in_worker(request, session),
+            )
+
+        return await self._execute_in_worker(request, session)
+
+    async def _execute_in_worker(self, request: Message, session: Session) -> RpcResult | None:
         with measure_time("\"execute task\""):
             with measure_time("_kiq()"):
                 task = await self._kiq(request.obj, session, request.message_id)
@@ -440,7 +534,7 @@ class Client:
 
         result = task_result.return_value
         if not isinstance(self.server.broker.result_backend, InmemoryResultBackend):
-            result = RpcResponse.read(BytesIO(bytes.fromhex(result)))
+            result = RpcResponse.read_buffer(decode_rpc_payload(result))
         if not isinstance(result, RpcResponse):
             logger.error(f"Got response from worker that is not a RpcResponse object: {result}")
             return RpcResult(
@@ -456,8 +550,22 @@ class Client:
             await session.refresh_auth_maybe(True)
             await session.fetch_layer()
 
+        if isinstance(result.obj, RpcResult) and isinstance(result.obj.result, FilePartToken):
+            return await self._read_file_part(result.obj.req_msg_id, result.obj.result)
+
         return result.obj
 
+    async def _read_file_part(self, req_msg_id: int, token: FilePartToken) -> RpcResult:
+        if not check_file_part_token(token):
+            logger.error(f"Got invalid or expired file part token from worker: {token!r}")
+            return RpcResult(
+                req_msg_id=req_msg_id,
+                result=RpcError(error_code=500, error_message="INTERNAL_SERVER_ERROR"),
+            )
+
+        with measure_time("read_file_part(...)"):
+            return RpcResult(req_msg_id=req_msg_id, result=await read_file_part(self.server.storage, token))
+
     async def propagate(self, request: Message, session: Session) -> RpcResult | None:
         if (result := await self._process_request(request, session)) is not None:
             await session.enqueue(result, True)
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import multiprocessing
 import os
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
-from typing import cast
+from typing import cast, Literal
 
 from loguru import logger
 from taskiq import TaskiqEvents, AsyncBroker
@@ -12,8 +14,15 @@ from taskiq import TaskiqEvents, AsyncBroker
 from piltover.gateway.client import Client
 from piltover.message_brokers.base_broker import BaseMessageBroker
 from piltover.session import SessionManager
+from piltover.storage import LocalFileStorage
 from piltover.utils import gen_keys, get_public_key_fingerprint, load_private_key, load_public_key, Keys
 
+try:
+    from piltover._taskiq_push_redis_result_backend import PushRedisResultBackend, REPLY_TO_LABEL
+except ImportError:
+    PushRedisResultBackend = None
+    REPLY_TO_LABEL = None
+
 
 class Gateway:
     HOST = "0.0.0.0"
@@ -22,8 +31,15 @@ class Gateway:
     def __init__(
             self, data_dir: Path, broker: AsyncBroker, message_broker: BaseMessageBroker,
             host: str = HOST, port: int = PORT, server_keys: Keys | None = None, salt_key: bytes | None = None,
+            serialization_executor: Literal["none", "thread", "process"] = "none",
+            serialization_workers: int | None = None, max_connections: int | None = None,
+            max_inflight_requests: int = 1024, max_queued_bytes: int = 16 * 1024 * 1024,
+            max_unacked_messages: int = 256, session_resume_timeout: int = 60, max_detached_sessions: int = 10000,
+            max_detached_sessions_per_key: int = 16,
     ):
         self.data_dir = data_dir
+        # Used to read file parts that worker returned location of (see app.gateway_serves_files config option)
+        self.storage = LocalFileStorage(data_dir)
 
         self.host = host
         self.port = port
@@ -47,18 +63,86 @@ class Gateway:
         self.broker = broker
         self.message_broker = message_broker
 
+        self.rpc_labels: dict[str, str] = {}
+        if PushRedisResultBackend is not None and isinstance(self.broker.result_backend, PushRedisResultBackend):
+            self.rpc_labels[REPLY_TO_LABEL] = self.broker.result_backend.reply_channel
+
+        # Outgoing messages are serialized in serialization_executor (if set) and encrypted in encryption_executor
+        #  (if set) instead of the event loop. Objects passed to process pool must be picklable,
+        #  which is not the case for objects that need to be serialized (they may reference db models),
+        #  so only already serialized messages are encrypted there (see encrypt_server_message).
+        # Executors are created on broker startup and shut down on broker shutdown.
+        self._serialization_executor_type = serialization_executor
+        self._serialization_workers = serialization_workers
+        self.serialization_executor: Executor | None = None
+        self.encryption_executor: Executor | None = None
+
+        # Capacity limits, so gateway memory stays bounded when clients connect, send requests
+        #  or get updates faster than they can be processed
+        self.max_connections = max_connections
+        self.max_inflight_requests = max_inflight_requests
+        self.connections_count = 0
+        SessionManager.configure(
+            max_queued_bytes, max_unacked_messages, session_resume_timeout, max_detached_sessions,
+            max_detached_sessions_per_key,
+        )
+
         self.broker.add_event_handler(TaskiqEvents.CLIENT_STARTUP, self._broker_startup)
+        self.broker.add_event_handler(TaskiqEvents.CLIENT_SHUTDOWN, self._broker_shutdown)
+
+    def _start_executors(self) -> None:
+        if self._serialization_executor_type == "thread":
+            self.serialization_executor = self.encryption_executor = ThreadPoolExecutor(
+                self._serialization_workers, thread_name_prefix="piltover-serialization",
+            )
+        elif self._serialization_executor_type == "process":
+            self.encryption_executor = ProcessPoolExecutor(
+                self._serialization_workers, mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def _shutdown_executors(self) -> None:
+        executors = {self.serialization_executor, self.encryption_executor}
+        self.serialization_executor = self.encryption_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
     async def _broker_startup(self, *args, **kwargs) -> None:
         SessionManager.set_broker(self.message_broker)
+        if REPLY_TO_LABEL in self.rpc_labels:
+            await self.broker.result_backend.start_listening()
+        if self.serialization_executor is None and self.encryption_executor is None:
+            self._start_executors()
+
+    async def _broker_shutdown(self, *args, **kwargs) -> None:
+        self._shutdown_executors()
 
     @logger.catch
     async def accept_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        client = Client(server=self, reader=reader, writer=writer)
-        await client.worker()
+        if self.max_connections is not None and self.connections_count >= self.max_connections:
+            logger.warning(
+                f"Connections limit ({self.max_connections}) reached, "
+                f"closing connection from {writer.get_extra_info('peername')}"
+            )
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionResetError:
+                pass
+            return
+
+        self.connections_count += 1
+        try:
+            client = Client(server=self, reader=reader, writer=writer)
+            await client.worker()
+        finally:
+            self.connections_count -= 1
 
     async def serve(self):
         await self.broker.startup()
-        server = await asyncio.start_server(self.accept_client, self.host, self.port)
-        async with server:
-            await server.serve_forever()
+        try:
+            server = await asyncio.start_server(self.accept_client, self.host, self.port)
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.broker.shutdown()
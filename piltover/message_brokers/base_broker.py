@@ -9,10 +9,14 @@ from typing import TYPE_CHECKING, Iterable
 from loguru import logger
 
 from piltover.cache import Cache
+from piltover.session.broadcast_cache import BroadcastSerializationCache
+from piltover.session.context_values_cache import ContextValuesCache
+from piltover.session.response_cache import ResponseCache
 from piltover.tl import UpdatesTooLong
 from piltover.tl.base.internal import MessageInternal
 from piltover.tl.types.internal import MessageToUsers, MessageToUsersShort, SetSessionInternalPush, ChannelSubscribe, \
-    ObjectWithLayerRequirement, InternalPushForUsers, InternalPushForUsersShort
+    ObjectWithLayerRequirement, InternalPushForUsers, InternalPushForUsersShort, InvalidateCachedResponses, \
+    InvalidateContextValues, MessageToEachUser, SessionResumed
 
 if TYPE_CHECKING:
     from piltover.session import Session
@@ -56,12 +60,35 @@ class BaseMessageBroker(ABC):
     @abstractmethod
     async def _listen(self) -> None: ...
 
+    async def wait_subscribed(self) -> None:
+        """
+        Waits until broker actually receives messages for all targets that sessions subscribed to so far.
+        Subscriptions are applied immediately by default, brokers that apply them asynchronously override this.
+        """
+
+    def _on_subscribed(self, target: str, target_id: int) -> None:
+        """
+        Called when first session subscribes to given target.
+
+        :param target: one of "user", "key", "auth", "channel".
+        :param target_id: id of user, key, auth or channel.
+        """
+
+    def _on_unsubscribed(self, target: str, target_id: int) -> None:
+        """
+        Called when last session unsubscribes from given target.
+
+        :param target: one of "user", "key", "auth", "channel".
+        :param target_id: id of user, key, auth or channel.
+        """
+
     def subscribe_user(self, user_id: int | None, session: Session) -> None:
         if not user_id:
             return
 
         if user_id not in self.subscribed_users:
             self.subscribed_users[user_id] = set()
+            self._on_subscribed("user", user_id)
 
         self.subscribed_users[user_id].add(session)
 
@@ -71,6 +98,7 @@ class BaseMessageBroker(ABC):
 
         if key_id not in self.subscribed_keys:
             self.subscribed_keys[key_id] = set()
+            self._on_subscribed("key", key_id)
 
         self.subscribed_keys[key_id].add(session)
 
@@ -80,6 +108,7 @@ class BaseMessageBroker(ABC):
 
         if auth_id not in self.subscribed_auths:
             self.subscribed_auths[auth_id] = set()
+            self._on_subscribed("auth", auth_id)
 
         self.subscribed_auths[auth_id].add(session)
 
@@ -115,6 +144,7 @@ class BaseMessageBroker(ABC):
             self.subscribed_users[user_id].remove(session)
         if not self.subscribed_users[user_id]:
             del self.subscribed_users[user_id]
+            self._on_unsubscribed("user", user_id)
 
     def unsubscribe_key(self, key_id: int | None, session: Session) -> None:
         if not key_id or key_id not in self.subscribed_keys:
@@ -124,6 +154,7 @@ class BaseMessageBroker(ABC):
             self.subscribed_keys[key_id].remove(session)
         if not self.subscribed_keys[key_id]:
             del self.subscribed_keys[key_id]
+            self._on_unsubscribed("key", key_id)
 
     def unsubscribe_auth(self, auth_id: int | None, session: Session) -> None:
         if not auth_id or auth_id not in self.subscribed_auths:
@@ -133,6 +164,7 @@ class BaseMessageBroker(ABC):
             self.subscribed_auths[auth_id].remove(session)
         if not self.subscribed_auths[auth_id]:
             del self.subscribed_auths[auth_id]
+            self._on_unsubscribed("auth", auth_id)
 
     def unsubscribe_internal_push(self, user_id: int | None, session: Session) -> None:
         if not user_id or user_id not in self.internal_push_users:
@@ -166,10 +198,12 @@ class BaseMessageBroker(ABC):
                 self.subscribed_channels[channel_id].remove(session)
             if not self.subscribed_channels[channel_id]:
                 del self.subscribed_channels[channel_id]
+                self._on_unsubscribed("channel", channel_id)
 
         for channel_id in to_add:
             if channel_id not in self.subscribed_channels:
                 self.subscribed_channels[channel_id] = set()
+                self._on_subscribed("channel", channel_id)
 
             self.subscribed_channels[channel_id].add(session)
 
@@ -217,17 +251,39 @@ class BaseMessageBroker(ABC):
             "Got message {message!r} that will be sent to {count} sessions", message=message, count=len(send_to)
         )
 
+        # Object is serialized once for all sessions that would get the same bytes
+        broadcast_cache = BroadcastSerializationCache() if len(send_to) > 1 else None
+
         for session in send_to:
             if session.auth_id in ignore_auths or session.is_internal_push:
                 continue
             try:
-                if isinstance(message.obj, ObjectWithLayerRequirement):
-                    await session.enqueue(deepcopy(message.obj), False)
+                if broadcast_cache is None and isinstance(message.obj, ObjectWithLayerRequirement):
+                    await session.enqueue_update(deepcopy(message.obj))
                 else:
-                    await session.enqueue(message.obj, False)
+                    await session.enqueue_update(message.obj, broadcast_cache)
             except Exception as e:
                 logger.opt(exception=e).error("Error occurred while sending message")
 
+    async def _process_message_to_each_user(self, message: MessageToEachUser) -> None:
+        for user_id, obj in zip(message.users, message.objs):
+            if user_id not in self.subscribed_users:
+                continue
+
+            send_to = self.subscribed_users[user_id]
+            broadcast_cache = BroadcastSerializationCache() if len(send_to) > 1 else None
+
+            for session in send_to:
+                if session.auth_id == message.ignore_auth_id or session.is_internal_push:
+                    continue
+                try:
+                    if broadcast_cache is None and isinstance(obj, ObjectWithLayerRequirement):
+                        await session.enqueue_update(deepcopy(obj))
+                    else:
+                        await session.enqueue_update(obj, broadcast_cache)
+                except Exception as e:
+                    logger.opt(exception=e).error("Error occurred while sending message")
+
     async def _process_channels_subscribe(self, message: ChannelSubscribe) -> None:
         logger.trace(f"Subscribing/unsubscribing {len(message.user_ids)} to {len(message.channel_ids)} channels...")
 
@@ -246,10 +302,13 @@ class BaseMessageBroker(ABC):
 
         for user_id in message.user_ids:
             await Cache.obj.delete(f"channels:{user_id}")
+        ContextValuesCache.invalidate(message.user_ids, participants=True)
 
         for session in sessions:
             self.channels_diff_update(session, to_delete, to_add)
 
+        await self.wait_subscribed()
+
     async def _process_internal_push_to_users(self, message: InternalPushForUsers | InternalPushForUsersShort) -> None:
         if isinstance(message, InternalPushForUsers):
             users = message.users
@@ -278,6 +337,8 @@ class BaseMessageBroker(ABC):
         match message:
             case MessageToUsers() | MessageToUsersShort():
                 await self._process_message_to_users(message)
+            case MessageToEachUser():
+                await self._process_message_to_each_user(message)
             case SetSessionInternalPush():
                 from piltover.session import SessionManager
                 uniq_id = message.key_id, message.session_id
@@ -288,10 +349,23 @@ class BaseMessageBroker(ABC):
                 await session.refresh_auth_maybe(True)
                 self.subscribe(session)
                 logger.debug(f"Registered session {uniq_id} for internal push")
+            case SessionResumed():
+                from piltover.session import SessionManager
+                session = SessionManager.sessions.get((message.key_id, message.session_id))
+                # Session was resumed in another gateway, so copy of it detached here is not needed anymore
+                if session is not None and session.client is None:
+                    session.destroy()
             case ChannelSubscribe():
                 await self._process_channels_subscribe(message)
             case InternalPushForUsers() | InternalPushForUsersShort():
                 await self._process_internal_push_to_users(message)
+            case InvalidateCachedResponses():
+                ResponseCache.invalidate(message.user_id)
+            case InvalidateContextValues():
+                ContextValuesCache.invalidate(
+                    message.user_ids, participants=message.participants, users=message.users,
+                    poll_votes=message.poll_votes,
+                )
 
     async def process_message(self, message: MessageInternal) -> None:
         loop = asyncio.get_running_loop()
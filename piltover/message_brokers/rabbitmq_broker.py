@@ -1,13 +1,19 @@
-from asyncio import get_running_loop, Task
+import asyncio
+from asyncio import get_running_loop, Task, Queue, Future
 from io import BytesIO
 
 from aio_pika import connect_robust, ExchangeType, Message as RmqMessage
-from aio_pika.abc import AbstractChannel, DeliveryMode, AbstractQueue
+from aio_pika.abc import AbstractChannel, AbstractQueue
+from loguru import logger
 
 from piltover.exceptions import Error
 from piltover.message_brokers.base_broker import BaseMessageBroker, BrokerType
 from piltover.tl import TLObject
 from piltover.tl.base.internal import MessageInternal
+from piltover.tl.types.internal import MessageToUsers, MessageToUsersShort, SetSessionInternalPush, ChannelSubscribe, \
+    InternalPushForUsers, InternalPushForUsersShort, MessageToEachUser, SessionResumed
+
+BROADCAST_ROUTING_KEY = "broadcast"
 
 
 class RabbitMqMessageBroker(BaseMessageBroker):
@@ -23,6 +29,11 @@ class RabbitMqMessageBroker(BaseMessageBroker):
         self._read_conn = None
         self._read_channel: AbstractChannel | None = None
 
+        self._queue: AbstractQueue | None = None
+        self._bindings: Queue[tuple[bool, str, Future[None]]] = Queue()
+        self._last_binding: Future[None] | None = None
+        self._bind_task: Task | None = None
+
     async def startup(self) -> None:
         await super().startup()
 
@@ -49,36 +60,129 @@ class RabbitMqMessageBroker(BaseMessageBroker):
         if self._listen_task:
             self._listen_task.cancel()
             await self._listen_task
+        if self._bind_task:
+            self._bind_task.cancel()
+            self._bind_task = None
+
+        self._queue = None
+        self._bindings = Queue()
+        if self._last_binding is not None and not self._last_binding.done():
+            self._last_binding.cancel()
+        self._last_binding = None
 
         await super().shutdown()
 
+    @staticmethod
+    def _routing_keys(message: MessageInternal) -> list[str]:
+        match message:
+            case MessageToUsers():
+                ignore_auths = set(message.ignore_auth_id) if message.ignore_auth_id is not None else set()
+                return [
+                    *(f"user.{user_id}" for user_id in message.users or ()),
+                    *(f"channel.{channel_id}" for channel_id in message.channel_ids or ()),
+                    *(f"key.{key_id}" for key_id in message.key_ids or ()),
+                    *(f"auth.{auth_id}" for auth_id in message.auth_ids or () if auth_id not in ignore_auths),
+                ]
+            case MessageToUsersShort():
+                keys = []
+                if message.user is not None:
+                    keys.append(f"user.{message.user}")
+                if message.channel_id is not None:
+                    keys.append(f"channel.{message.channel_id}")
+                if message.key_id is not None:
+                    keys.append(f"key.{message.key_id}")
+                if message.auth_id is not None and message.auth_id != message.ignore_auth_id:
+                    keys.append(f"auth.{message.auth_id}")
+                return keys
+            case MessageToEachUser():
+                return [f"user.{user_id}" for user_id in message.users]
+            case SetSessionInternalPush() | SessionResumed():
+                return [f"key.{message.key_id}"]
+            case ChannelSubscribe():
+                return [f"user.{user_id}" for user_id in message.user_ids]
+            case InternalPushForUsers():
+                return [f"user.{user_id}" for user_id in message.users]
+            case InternalPushForUsersShort():
+                return [f"user.{message.user}"]
+
+        return [BROADCAST_ROUTING_KEY]
+
     async def send(self, message: MessageInternal) -> None:
         if BrokerType.WRITE not in self.broker_type:
             return
 
-        rmq_message = RmqMessage(body=message.write(), delivery_mode=DeliveryMode.PERSISTENT)
-        exchange = await self._write_channel.get_exchange(self._exchange_name, ensure=False)
-        await exchange.publish(rmq_message, routing_key="piltover")
+        routing_keys = self._routing_keys(message)
+        if not routing_keys:
+            return
 
-    async def _declare_queues(self, channel: AbstractChannel) -> AbstractQueue:
-        await channel.declare_queue("piltover.dead_letter")
-        queue = await channel.declare_queue(
-            "piltover",
-            arguments={
-                "x-dead-letter-exchange": "",
-                "x-dead-letter-routing-key": "piltover.dead_letter",
-            },
+        # Message is published once: rabbitmq routes it by routing key and all keys in "BCC" header,
+        #  and every queue gets at most one copy of it no matter how many of its bindings matched.
+        # Messages are not persistent: they are routed only to exclusive gateway queues, which are deleted together
+        #  with gateway connection, so there is nothing to restore them to after rabbitmq restart.
+        #  Sessions that missed updates get them with updates.getDifference.
+        rmq_message = RmqMessage(
+            body=message.write(),
+            headers={"BCC": routing_keys[1:]} if len(routing_keys) > 1 else None,
         )
+        exchange = await self._write_channel.get_exchange(self._exchange_name, ensure=False)
+        await exchange.publish(rmq_message, routing_key=routing_keys[0])
 
-        await queue.bind(exchange=self._exchange_name, routing_key="piltover")
+    def _queue_binding(self, bind: bool, routing_key: str) -> None:
+        if BrokerType.READ not in self.broker_type:
+            return
+        self._last_binding = get_running_loop().create_future()
+        self._bindings.put_nowait((bind, routing_key, self._last_binding))
+
+    def _on_subscribed(self, target: str, target_id: int) -> None:
+        self._queue_binding(True, f"{target}.{target_id}")
+
+    def _on_unsubscribed(self, target: str, target_id: int) -> None:
+        self._queue_binding(False, f"{target}.{target_id}")
+
+    async def wait_subscribed(self, timeout: float = 5) -> None:
+        # Bindings are processed in order, so when the last queued one is done, all previous ones are done too
+        if self._last_binding is None or self._last_binding.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._last_binding), timeout)
+        except TimeoutError:
+            logger.warning(f"Routing keys were not bound in {timeout} seconds, some messages may be missed")
+
+    async def _process_bindings(self) -> None:
+        # Bindings are (un)bound one by one, in order in which sessions subscribed and unsubscribed,
+        #  so quick unsubscribe + subscribe to the same target can not end up unbound.
+        while True:
+            bind, routing_key, done = await self._bindings.get()
+            try:
+                if bind:
+                    await self._queue.bind(exchange=self._exchange_name, routing_key=routing_key)
+                else:
+                    await self._queue.unbind(exchange=self._exchange_name, routing_key=routing_key)
+            except Exception as e:
+                logger.opt(exception=e).error(f"Failed to (un)bind routing key {routing_key!r}")
+            finally:
+                if not done.done():
+                    done.set_result(None)
+
+    async def _declare_queues(self, channel: AbstractChannel) -> AbstractQueue:
+        # Every gateway has its own queue and binds only routing keys of users/channels/keys/auths
+        #  it has sessions for, so every gateway gets updates only for sessions connected to it.
+        # There is no dead letter queue: messages are consumed without acks and are never rejected,
+        #  and queue has no ttl or length limit, so nothing would ever be dead-lettered to it.
+        #  Previously, with single shared durable queue, dead letter queue was not used for anything either.
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(exchange=self._exchange_name, routing_key=BROADCAST_ROUTING_KEY)
         return queue
 
     async def _listen(self) -> None:
         if BrokerType.READ not in self.broker_type:
             return
 
-        queue = await self._declare_queues(self._read_channel)
-        async with queue.iterator() as iterator:
+        await self._read_channel.declare_exchange(self._exchange_name, type=ExchangeType.TOPIC)
+        self._queue = await self._declare_queues(self._read_channel)
+        self._bind_task = get_running_loop().create_task(self._process_bindings())
+
+        async with self._queue.iterator(no_ack=True) as iterator:
             async for rmq_message in iterator:
                 try:
                     message = TLObject.read(BytesIO(rmq_message.body))
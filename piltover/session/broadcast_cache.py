@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import TYPE_CHECKING, Callable
+
+from piltover.tl import Updates, Int
+from piltover.tl.core_types import TLObject
+from piltover.tl.serialization_context import DependencyTrackingSerializationContext, ContextValues
+from piltover.tl.types.internal import ObjectWithLayerRequirement
+
+if TYPE_CHECKING:
+    from piltover.session import Session
+
+
+class BroadcastSerializationCache:
+    """
+    Cache of serialized bytes of one object that is being sent to multiple sessions.
+
+    Object is serialized with context that tracks which session-specific values (user id, auth id, context values)
+    were used during serialization, and resulting bytes are reused for every other session with the same layer
+    and the same values of those fields. Only the envelope (message id, seq_no, encryption) is made per session.
+    """
+
+    __slots__ = ("_layer_objects", "_dependencies", "_serialized",)
+
+    def __init__(self) -> None:
+        self._layer_objects: dict[int, TLObject] = {}
+        self._dependencies: list[tuple[str, ...]] = []
+        self._serialized: dict[tuple, bytes] = {}
+
+    def object_for_layer(
+            self, obj: ObjectWithLayerRequirement, layer: int,
+            strip_fields: Callable[[ObjectWithLayerRequirement, int], TLObject],
+    ) -> TLObject:
+        # Fields are stripped from copy of an object once per layer instead of once per session
+        if layer not in self._layer_objects:
+            self._layer_objects[layer] = strip_fields(deepcopy(obj), layer)
+        return self._layer_objects[layer]
+
+    @staticmethod
+    def _values_key(values: ContextValues) -> tuple | None:
+        """
+        Returns key made from contents of context values, or None if they contain values that can't be compared
+        (e.g. database models), in which case serialized bytes are not shared.
+        """
+
+        if values.chat_participants or values.channel_participants or values.contacts or values.channel_messages:
+            return None
+
+        return (
+            frozenset((poll_id, frozenset(answers)) for poll_id, answers in values.poll_answers.items()),
+            frozenset(
+                (user_id, frozenset(rules.items())) for user_id, rules in values.privacyrules.items()
+            ),
+        )
+
+    @classmethod
+    def _key(
+            cls, dependencies: tuple[str, ...], layer: int, user_id: int | None, auth_id: int | None,
+            values: ContextValues,
+    ) -> tuple | None:
+        key = [dependencies, layer]
+        for dependency in dependencies:
+            if dependency == "user_id":
+                key.append(user_id)
+            elif dependency == "auth_id":
+                key.append(auth_id)
+            elif dependency == "values":
+                # Context values are resolved for every session separately, so they are compared by contents
+                if (values_key := cls._values_key(values)) is None:
+                    return None
+                key.append(values_key)
+        return tuple(key)
+
+    def write(self, obj: TLObject, session: Session, values: ContextValues | None) -> bytes:
+        ctx = DependencyTrackingSerializationContext(
+            auth_id=session.auth_id,
+            user_id=session.user_id,
+            layer=session.layer,
+            values=values,
+        )
+        values = ctx.values
+        ctx.accessed.clear()
+
+        for dependencies in self._dependencies:
+            key = self._key(dependencies, session.layer, session.user_id, session.auth_id, values)
+            if key is None or (data := self._serialized.get(key)) is None:
+                continue
+            # Updates.seq is different for every session and it is the last field of Updates
+            if isinstance(obj, Updates):
+                data = data[:-4] + Int.write(obj.seq)
+            return data
+
+        data = obj.write(ctx)
+
+        dependencies = tuple(sorted(ctx.accessed))
+        if dependencies not in self._dependencies:
+            self._dependencies.append(dependencies)
+        key = self._key(dependencies, session.layer, session.user_id, session.auth_id, values)
+        if key is not None:
+            self._serialized[key] = data
+
+        return data
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from time import monotonic
+from typing import TYPE_CHECKING, Iterable
+
+from lru import LRU
+
+if TYPE_CHECKING:
+    from piltover.db.enums import PrivacyRuleKeyType
+    from piltover.db.models import ChatParticipant, Contact
+
+UserValues = tuple["Contact | None", "Contact | None", "dict[PrivacyRuleKeyType, bool]"]
+
+
+class _UserContextValues:
+    __slots__ = ("poll_answers", "chat_participants", "channel_participants", "users", "generation",)
+
+    def __init__(self) -> None:
+        # Values are stored as (expires_at, value) tuples, missing rows (e.g. user is not a participant)
+        #  are cached as None too
+        self.poll_answers: LRU[int, tuple[float, set[int]]] = LRU(256)
+        self.chat_participants: LRU[int, tuple[float, ChatParticipant | None]] = LRU(256)
+        self.channel_participants: LRU[int, tuple[float, ChatParticipant | None]] = LRU(256)
+        # Other user id -> (contact of this user, contact of other user, privacy rules of other user)
+        self.users: LRU[int, tuple[float, UserValues]] = LRU(1024)
+        self.generation = 0
+
+
+class ContextValuesCache:
+    """
+    Gateway-side cache of values that are resolved for every session an object with NeedsContextValues
+    is sent to (see Session._resolve_context_values), shared by all sessions of the same user.
+    Without it, every message broadcast to a channel makes the same queries for every subscribed session.
+
+    Cache is invalidated by internal.invalidate_context_values broker message
+    (see SessionManager.invalidate_context_values), entries also expire after TTL seconds.
+    """
+
+    TTL = 60
+
+    _entries: LRU[int, _UserContextValues] = LRU(16 * 1024)
+    # Incremented when values of more than one user are invalidated,
+    #  values that were fetched before invalidation are not cached
+    _generation = 0
+
+    @classmethod
+    def for_user(cls, user_id: int) -> tuple[_UserContextValues, int]:
+        """
+        Returns cached values of given user and generation, which should be passed to `store` with fetched values.
+        """
+
+        if (entry := cls._entries.get(user_id)) is None:
+            entry = cls._entries[user_id] = _UserContextValues()
+        return entry, cls._generation + entry.generation
+
+    @staticmethod
+    def get(values: LRU, key: int, now: float) -> tuple[bool, object]:
+        if (cached := values.get(key)) is None or cached[0] <= now:
+            return False, None
+        return True, cached[1]
+
+    @classmethod
+    def store(
+            cls, entry: _UserContextValues, generation: int, values: LRU, items: Iterable[tuple[int, object]],
+    ) -> None:
+        if generation != cls._generation + entry.generation:
+            return
+
+        expires_at = monotonic() + cls.TTL
+        for key, value in items:
+            values[key] = (expires_at, value)
+
+    @classmethod
+    def invalidate(
+            cls, user_ids: Iterable[int], participants: bool = False, users: bool = False, poll_votes: bool = False,
+    ) -> None:
+        """
+        Removes cached values.
+
+        :param user_ids: ids of users whose values are removed.
+        :param participants: remove chat and channel participants of given users.
+        :param users: remove contacts and privacy rules between given users and any other user.
+        :param poll_votes: remove poll answers selected by given users.
+        """
+
+        user_ids = set(user_ids)
+
+        for user_id in user_ids:
+            if (entry := cls._entries.get(user_id)) is None:
+                continue
+            entry.generation += 1
+            if participants:
+                entry.chat_participants.clear()
+                entry.channel_participants.clear()
+            if users:
+                entry.users.clear()
+            if poll_votes:
+                entry.poll_answers.clear()
+
+        if not users:
+            return
+
+        # Contacts and privacy rules of given users are also cached for every user that saw them
+        cls._generation += 1
+        for entry in cls._entries.values():
+            for user_id in user_ids:
+                if user_id in entry.users:
+                    del entry.users[user_id]
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._entries.clear()
+        cls._generation = 0
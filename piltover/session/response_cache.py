@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import TYPE_CHECKING, Awaitable, Callable, Any
+
+from lru import LRU
+
+from piltover.session.broadcast_cache import BroadcastSerializationCache
+from piltover.tl import RpcError
+from piltover.tl.core_types import TLObject, RpcResult, SerializedObject
+from piltover.tl.functions.help import GetConfig, GetAppConfig, GetCountriesList, GetPeerColors, GetPeerProfileColors
+from piltover.tl.functions.langpack import GetLangPack, GetLangPack_72, GetDifference, GetDifference_72, GetStrings, \
+    GetStrings_72
+from piltover.tl.functions.messages import GetAvailableReactions
+from piltover.tl.types.internal import NeedsContextValues
+
+if TYPE_CHECKING:
+    from piltover.session import Session
+
+
+class _CachedMethod:
+    __slots__ = ("ttl", "per_user",)
+
+    def __init__(self, ttl: float, per_user: bool = False) -> None:
+        self.ttl = ttl
+        self.per_user = per_user
+
+
+class _CacheEntry:
+    __slots__ = ("result", "expires_at", "serialized",)
+
+    def __init__(self, result: Any, expires_at: float) -> None:
+        # Results are stored with zero req_msg_id and serialized per (layer, session-specific values) they depend on,
+        #  req_msg_id is replaced when result is sent
+        self.result = RpcResult(req_msg_id=0, result=result)
+        self.expires_at = expires_at
+        self.serialized = BroadcastSerializationCache()
+
+    def to_result(self, req_msg_id: int, session: Session) -> RpcResult:
+        data = self.serialized.write(self.result, session, None)
+        # Skip RpcResult constructor id and req_msg_id
+        return RpcResult(req_msg_id=req_msg_id, result=SerializedObject(data[4 + 8:]))
+
+
+class ResponseCache:
+    """
+    Gateway-side cache of responses to methods which are answered from rarely changing data
+    (config, langpacks, reactions, etc.), so these requests don't go to workers every time.
+
+    Only methods listed in CACHED_METHODS are cached. Responses are keyed by the serialized request
+    (which includes the client-provided hash), layer and session flags the worker checks before calling a handler.
+    Methods whose response depends on the user are also keyed by user id.
+    Serialized responses are reused for every session they would be serialized the same for
+    (see BroadcastSerializationCache).
+
+    Cache is invalidated by internal.invalidate_cached_responses broker message
+    (see SessionManager.invalidate_cached_responses), entries also expire after method's ttl.
+    """
+
+    CACHED_METHODS: dict[int, _CachedMethod] = {
+        # Config has "date" and "expires" fields and default reaction of the user
+        GetConfig.tlid(): _CachedMethod(60, per_user=True),
+        GetAppConfig.tlid(): _CachedMethod(60 * 60),
+        GetCountriesList.tlid(): _CachedMethod(60 * 60),
+        GetPeerColors.tlid(): _CachedMethod(60 * 60),
+        GetPeerProfileColors.tlid(): _CachedMethod(60 * 60),
+        GetLangPack.tlid(): _CachedMethod(60 * 60),
+        GetLangPack_72.tlid(): _CachedMethod(60 * 60),
+        GetDifference.tlid(): _CachedMethod(60 * 60),
+        GetDifference_72.tlid(): _CachedMethod(60 * 60),
+        GetStrings.tlid(): _CachedMethod(60 * 60),
+        GetStrings_72.tlid(): _CachedMethod(60 * 60),
+        GetAvailableReactions.tlid(): _CachedMethod(60 * 60),
+    }
+
+    _entries: LRU[tuple, _CacheEntry] = LRU(4 * 1024)
+    _pending: dict[tuple, asyncio.Future[_CacheEntry | None]] = {}
+    # Incremented on every invalidation, responses that were requested before it are not cached
+    _generation = 0
+
+    @classmethod
+    def make_key(cls, request: TLObject, session: Session) -> tuple | None:
+        if (method := cls.CACHED_METHODS.get(request.tlid())) is None:
+            return None
+
+        return (
+            request.tlid(),
+            request.write(),
+            session.layer,
+            session.is_bot,
+            session.mfa_pending,
+            session.user_id is not None,
+            session.user_id if method.per_user else None,
+        )
+
+    @staticmethod
+    def _is_cacheable(result: TLObject | None) -> bool:
+        # Errors (including ones returned because of session state, like AUTH_KEY_UNREGISTERED) are not cached
+        if not isinstance(result, RpcResult) or isinstance(result.result, RpcError):
+            return False
+        # Results that need to be resolved for every session are not cached. Worker wraps whole RpcResult
+        #  into NeedsContextValues, so such results are already excluded above, this handles nested ones
+        if isinstance(result.result, NeedsContextValues):
+            return False
+        return True
+
+    @classmethod
+    async def get_or_fetch(
+            cls, key: tuple, req_msg_id: int, session: Session, fetch: Callable[[], Awaitable[RpcResult | None]],
+    ) -> RpcResult | None:
+        """
+        Returns cached response for given key, or calls fetch and caches its result.
+        Concurrent requests with the same key wait for the one that is already being executed.
+
+        :param key: key returned by make_key.
+        :param req_msg_id: id of the request message, returned RpcResult is made for it.
+        :param session: session that response will be sent to.
+        :param fetch: function that executes the request in worker.
+        :return: response to the request.
+        """
+
+        entry = cls._entries.get(key)
+        if entry is not None and entry.expires_at > monotonic():
+            return entry.to_result(req_msg_id, session)
+
+        if (pending := cls._pending.get(key)) is not None:
+            entry = await asyncio.shield(pending)
+            if entry is not None:
+                return entry.to_result(req_msg_id, session)
+            return await fetch()
+
+        future = cls._pending[key] = asyncio.get_running_loop().create_future()
+        generation = cls._generation
+        entry = None
+
+        try:
+            result = await fetch()
+            if cls._is_cacheable(result) and generation == cls._generation:
+                entry = _CacheEntry(result.result, monotonic() + cls.CACHED_METHODS[key[0]].ttl)
+                cls._entries[key] = entry
+            return result
+        finally:
+            cls._pending.pop(key, None)
+            future.set_result(entry)
+
+    @classmethod
+    def invalidate(cls, user_id: int | None = None) -> None:
+        """
+        Removes cached responses.
+
+        :param user_id: if set, only responses cached for this user are removed, otherwise everything is removed.
+        """
+
+        cls._generation += 1
+        if user_id is None:
+            cls._entries.clear()
+            return
+
+        for key in cls._entries.keys():
+            if key[-1] == user_id:
+                del cls._entries[key]
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._entries.clear()
+        cls._pending.clear()
+        cls._generation = 0
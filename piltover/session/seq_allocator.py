@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+from asyncio import Task
+
+from loguru import logger
+from lru import LRU
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from piltover.db.models import UserAuthorization
+
+
+class _SeqRange:
+    __slots__ = ("next", "until",)
+
+    def __init__(self, next_: int, until: int) -> None:
+        self.next = next_
+        self.until = until
+
+
+class SeqAllocator:
+    """
+    Allocates Updates.seq numbers per authorization in memory.
+
+    Numbers are reserved in blocks of BLOCK_SIZE (by incrementing UserAuthorization.upd_seq_reserved),
+    so multiple gateways never give out the same seq. Last given out seq is written to UserAuthorization.upd_seq
+    (which is returned in updates.getState) lazily, at most once per FLUSH_DELAY seconds per authorization,
+    and right before gateway passes updates.getState or updates.getDifference of the authorization to worker.
+    Unused numbers of a block are lost when gateway is restarted or authorization is evicted from memory,
+    clients see it as a gap in seq and call updates.getDifference.
+    """
+
+    BLOCK_SIZE = 100
+    FLUSH_DELAY = 0.5
+
+    _ranges: LRU[int, _SeqRange] = LRU(16 * 1024)
+    _reserving: dict[int, Task[_SeqRange | None]] = {}
+    _to_flush: dict[int, int] = {}
+    _flush_task: Task | None = None
+
+    @classmethod
+    async def _reserve(cls, auth_id: int) -> _SeqRange | None:
+        try:
+            async with in_transaction():
+                updated = await UserAuthorization.filter(id=auth_id).update(
+                    upd_seq_reserved=F("upd_seq_reserved") + cls.BLOCK_SIZE,
+                )
+                if not updated:
+                    return None
+                reserved = await UserAuthorization.get(id=auth_id).values_list("upd_seq_reserved", flat=True)
+        finally:
+            cls._reserving.pop(auth_id, None)
+
+        cls._ranges[auth_id] = seq_range = _SeqRange(reserved - cls.BLOCK_SIZE + 1, reserved)
+        return seq_range
+
+    @classmethod
+    async def next_seq(cls, auth_id: int) -> int:
+        seq_range = cls._ranges.get(auth_id)
+        while seq_range is None or seq_range.next > seq_range.until:
+            # Only one block is reserved at a time for an authorization, concurrent callers wait for it
+            if auth_id not in cls._reserving:
+                cls._reserving[auth_id] = asyncio.create_task(cls._reserve(auth_id))
+            seq_range = await asyncio.shield(cls._reserving[auth_id])
+            if seq_range is None:
+                return 0
+
+        seq = seq_range.next
+        seq_range.next += 1
+
+        cls._to_flush[auth_id] = seq
+        if cls._flush_task is None:
+            cls._flush_task = asyncio.create_task(cls._flush_later())
+
+        return seq
+
+    @classmethod
+    async def _flush_later(cls) -> None:
+        try:
+            await asyncio.sleep(cls.FLUSH_DELAY)
+            await cls.flush()
+        finally:
+            cls._flush_task = None
+
+    @classmethod
+    async def flush(cls) -> None:
+        to_flush, cls._to_flush = cls._to_flush, {}
+        for auth_id, seq in to_flush.items():
+            try:
+                await UserAuthorization.filter(id=auth_id, upd_seq__lt=seq).update(upd_seq=seq)
+            except Exception as e:
+                logger.opt(exception=e).error(f"Failed to save seq for auth {auth_id}")
+
+    @classmethod
+    async def flush_auth(cls, auth_id: int) -> None:
+        """
+        Writes last given out seq of given authorization right away, so it is returned by updates.getState
+        (which is handled by worker and reads seq from the database).
+        """
+
+        if (seq := cls._to_flush.pop(auth_id, None)) is None:
+            return
+
+        try:
+            await UserAuthorization.filter(id=auth_id, upd_seq__lt=seq).update(upd_seq=seq)
+        except Exception as e:
+            logger.opt(exception=e).error(f"Failed to save seq for auth {auth_id}")
+            cls._to_flush.setdefault(auth_id, seq)
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._ranges.clear()
+        cls._reserving.clear()
+        cls._to_flush.clear()
+        if cls._flush_task is not None:
+            cls._flush_task.cancel()
+            cls._flush_task = None
@@ -3,8 +3,10 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import hmac
-from asyncio import Queue, Event
-from time import time
+from asyncio import Queue, Event, Future, TimerHandle
+from collections import OrderedDict
+from copy import copy
+from time import time, monotonic
 from typing import cast, TYPE_CHECKING
 
 from loguru import logger
@@ -17,15 +19,19 @@ from piltover.cache import Cache
 from piltover.db.enums import PrivacyRuleKeyType
 from piltover.db.models import UserAuthorization, AuthKey, ChatParticipant, PollVote, Contact, PrivacyRule, MessageRef
 from piltover.exceptions import Unreachable
-from piltover.tl import Updates, Long, Int, BadServerSalt, BadMsgNotification
+from piltover.tl import Updates, Long, Int, BadServerSalt, BadMsgNotification, UpdatesTooLong
 from piltover.tl.core_types import TLObject, Message, MsgContainer
-from piltover.tl.types.internal import ObjectWithLayerRequirement, TaggedLongVector, NeedsContextValues
+from piltover.tl.types.internal import ObjectWithLayerRequirement, TaggedLongVector, NeedsContextValues, \
+    SessionState, SessionMessage
 from piltover.tl.utils import is_content_related, is_id_strictly_not_content_related, is_id_strictly_content_related
+from piltover.session.context_values_cache import ContextValuesCache
+from piltover.session.seq_allocator import SeqAllocator
 from piltover.utils.debug import measure_time
 from piltover.tl.serialization_context import SerializationContext, ContextValues
 
 if TYPE_CHECKING:
     from piltover.gateway import Client
+    from piltover.session.broadcast_cache import BroadcastSerializationCache
 
 
 class Salt:
@@ -44,12 +50,12 @@ class MsgIdValues:
         self.offset = offset
 
 
-# TODO: store sessions in redis or something (with non-acked messages) to be able to restore session after reconnect
 class Session:
     __slots__ = (
         "client", "session_id", "auth_data", "min_msg_id", "user_id", "auth_id", "channel_ids", "auth_loaded_at",
         "channels_loaded_at", "salt_now", "salt_prev", "no_updates", "layer", "is_bot", "mfa_pending", "msg_id_values",
-        "out_seq_no", "message_queue", "message_available", "is_internal_push", "had_init_connection",
+        "out_seq_no", "message_queue", "message_available", "is_internal_push", "had_init_connection", "queued_bytes",
+        "updates_too_long_queued", "unacked", "unacked_bytes", "expire_handle", "state_saved",
     )
 
     def __init__(self, session_id: int, client: Client | None = None, auth_data: AuthData | None = None) -> None:
@@ -80,9 +86,19 @@ class Session:
 
         self.message_queue = Queue()
         self.message_available: Event | None = None
+        # Size of serialized messages in message_queue
+        self.queued_bytes = 0
+        self.updates_too_long_queued = False
+
+        # Sent content-related messages that client did not acknowledge yet: message_id -> (seq_no, data).
+        #  They are sent again if client reconnects to this session.
+        self.unacked: OrderedDict[int, tuple[int, bytes]] = OrderedDict()
+        self.unacked_bytes = 0
+        # Set while session has no connection and waits for client to reconnect
+        self.expire_handle: TimerHandle | None = None
+        self.state_saved = False
 
         # TODO: store request states (i.e. received, processing, acked, etc.)
-        # TODO: store whole session in redis or something
 
     def uniq_id(self) -> tuple[int, int]:
         key_id = 0 if self.auth_data is None or self.auth_data.auth_key_id is None else self.auth_data.auth_key_id
@@ -91,24 +107,179 @@ class Session:
     def __hash__(self) -> int:
         return hash(self.uniq_id)
 
-    # TODO: rewrite
     def connect(self, client: Client) -> None:
         # TODO: raise AuthKeyDuplicated if self.client is not None
         self.client = client
         self.message_available = client.message_available
+
+        if self.expire_handle is not None:
+            self.expire_handle.cancel()
+            self.expire_handle = None
+            piltover.session.SessionManager.session_attached(self)
+            logger.debug(f"Session {self.session_id} resumed, resending {len(self.unacked)} unacked messages")
+        if self.state_saved:
+            self.state_saved = False
+            asyncio.get_running_loop().create_task(self._delete_state())
+
+        self._requeue_unacked()
         if not self.message_queue.empty():
             self.message_available.set()
         piltover.session.SessionManager.broker.subscribe(self)
 
-    # TODO: rewrite
-    def disconnect(self) -> None:
+    def disconnect(self, client: Client | None = None) -> None:
+        """
+        Detaches session from the connection. Session keeps receiving updates for
+        SessionManager.resume_timeout seconds, so if client reconnects to it, queued and not acknowledged messages
+        are sent to it instead of client calling updates.getDifference.
+
+        :param client: connection that is closed, session is not detached if it is used by another connection already.
+        """
+
+        if client is not None and self.client is not client:
+            return
+
         self.client = None
         self.message_available = None
         self.had_init_connection = False
-        # TODO: clear message_queue
+
+        resume_timeout = piltover.session.SessionManager.resume_timeout
+        if resume_timeout <= 0 or self.auth_data is None or self.auth_data.auth_key_id is None:
+            return self.destroy()
+
+        if self.expire_handle is None:
+            loop = asyncio.get_running_loop()
+            self.expire_handle = loop.call_later(resume_timeout, self.destroy)
+            piltover.session.SessionManager.session_detached(self)
+            # Session may be destroyed right away if there are too many detached sessions
+            if self.expire_handle is not None:
+                loop.create_task(self._save_state())
+
+    def destroy(self) -> None:
+        if self.expire_handle is not None:
+            self.expire_handle.cancel()
+            self.expire_handle = None
+
+        self.client = None
+        self.message_available = None
+        self.message_queue = Queue()
+        self.queued_bytes = 0
+        self.unacked.clear()
+        self.unacked_bytes = 0
         piltover.session.SessionManager.broker.unsubscribe(self)
         piltover.session.SessionManager.cleanup(self)
 
+    def _requeue_unacked(self) -> None:
+        if not self.unacked:
+            return
+
+        # Unacked messages are sent again with the same ids before messages that were queued after them
+        queue = Queue()
+        for message_id, (seq_no, data) in self.unacked.items():
+            queue.put_nowait((message_id, seq_no, data))
+        while not self.message_queue.empty():
+            queue.put_nowait(self.message_queue.get_nowait())
+
+        self.message_queue = queue
+        self.queued_bytes += self.unacked_bytes
+        self.unacked.clear()
+        self.unacked_bytes = 0
+
+    def message_sent(self, message_id: int, seq_no: int, data: bytes) -> None:
+        self.queued_bytes -= len(data)
+        if self.message_queue.empty():
+            self.updates_too_long_queued = False
+
+        # Only content-related messages are acknowledged by client
+        if not seq_no & 1:
+            return
+
+        self.unacked[message_id] = seq_no, data
+        self.unacked_bytes += len(data)
+
+        max_messages = piltover.session.SessionManager.max_unacked_messages
+        max_bytes = piltover.session.SessionManager.max_queued_bytes
+        while self.unacked and (len(self.unacked) > max_messages or self.unacked_bytes > max_bytes):
+            _, (_, dropped) = self.unacked.popitem(last=False)
+            self.unacked_bytes -= len(dropped)
+
+    def ack(self, message_ids: list[int]) -> None:
+        for message_id in message_ids:
+            if (message := self.unacked.pop(message_id, None)) is not None:
+                self.unacked_bytes -= len(message[1])
+
+    def _state_cache_key(self) -> str:
+        return piltover.session.SessionManager.state_cache_key(cast(AuthData, self.auth_data).auth_key_id, self.session_id)
+
+    async def _save_state(self) -> None:
+        """
+        Stores session in cache (if cache is configured), so it can be resumed by another gateway process too.
+        Only messages that were queued or sent before client disconnected are stored.
+        """
+
+        messages = [
+            SessionMessage(message_id=message_id, seq_no=seq_no, data=data)
+            for message_id, (seq_no, data) in self.unacked.items()
+        ]
+
+        queued = []
+        while not self.message_queue.empty():
+            queued.append(self.message_queue.get_nowait())
+        for message in queued:
+            self.message_queue.put_nowait(message)
+
+        for message_id, seq_no, data in queued:
+            if isinstance(data, Future):
+                data = await data
+            messages.append(SessionMessage(message_id=message_id, seq_no=seq_no, data=data))
+
+        state = SessionState(
+            min_msg_id=self.min_msg_id,
+            msg_id_last_time=self.msg_id_values.last_time,
+            msg_id_offset=self.msg_id_values.offset,
+            out_seq_no=self.out_seq_no,
+            layer=self.layer,
+            messages=messages,
+        )
+
+        try:
+            await Cache.obj.set(self._state_cache_key(), state, ttl=piltover.session.SessionManager.resume_timeout)
+            self.state_saved = True
+            # Client reconnected (or session expired) while state was being saved
+            if self.expire_handle is None:
+                self.state_saved = False
+                await self._delete_state()
+        except Exception as e:
+            logger.opt(exception=e).warning(f"Failed to save state of session {self.session_id}")
+
+    async def _delete_state(self) -> None:
+        try:
+            await Cache.obj.delete(self._state_cache_key())
+        except Exception as e:
+            logger.opt(exception=e).warning(f"Failed to delete state of session {self.session_id}")
+
+    async def load_state(self) -> bool:
+        """
+        Restores session that was detached from connection in another gateway process.
+
+        :return: True if session state was found.
+        """
+
+        state = await Cache.obj.get(self._state_cache_key())
+        if not isinstance(state, SessionState):
+            return False
+
+        await self._delete_state()
+
+        self.min_msg_id = state.min_msg_id
+        self.msg_id_values = MsgIdValues(state.msg_id_last_time, state.msg_id_offset)
+        self.out_seq_no = state.out_seq_no
+        self.layer = state.layer
+        for message in state.messages:
+            self.unacked[message.message_id] = message.seq_no, message.data
+            self.unacked_bytes += len(message.data)
+
+        return True
+
     @staticmethod
     def _get_attr_or_element(obj: TLObject | list, field_name: str) -> TLObject | list:
         if isinstance(obj, list):
@@ -116,29 +287,41 @@ class Session:
         else:
             return getattr(obj, field_name)
 
-    async def enqueue(self, obj: TLObject, in_reply: bool) -> None:
-        if self.client is None:
-            return
+    @classmethod
+    def _strip_fields_for_layer(cls, obj: ObjectWithLayerRequirement, layer: int) -> TLObject:
+        field_paths = obj.fields
+        obj = obj.object
 
-        await asyncio.sleep(0)
+        for field_path in field_paths:
+            if field_path.min_layer <= layer <= field_path.max_layer:
+                continue
 
-        if isinstance(obj, ObjectWithLayerRequirement):
-            field_paths = obj.fields
-            obj = obj.object
+            field_path = field_path.field.split(".")
+            parent = obj
+            for field_name in field_path[:-1]:
+                parent = cls._get_attr_or_element(parent, field_name)
 
-            for field_path in field_paths:
-                if field_path.min_layer <= self.layer <= field_path.max_layer:
-                    continue
+            if not isinstance(parent, list):
+                continue
 
-                field_path = field_path.field.split(".")
-                parent = obj
-                for field_name in field_path[:-1]:
-                    parent = self._get_attr_or_element(parent, field_name)
+            del parent[int(field_path[-1])]
 
-                if not isinstance(parent, list):
-                    continue
+        return obj
+
+    async def enqueue(
+            self, obj: TLObject, in_reply: bool, broadcast_cache: BroadcastSerializationCache | None = None,
+    ) -> None:
+        # Messages are still queued while session waits for client to reconnect
+        if self.client is None and self.expire_handle is None:
+            return
+
+        await asyncio.sleep(0)
 
-                del parent[int(field_path[-1])]
+        if isinstance(obj, ObjectWithLayerRequirement):
+            if broadcast_cache is not None:
+                obj = broadcast_cache.object_for_layer(obj, self.layer, self._strip_fields_for_layer)
+            else:
+                obj = self._strip_fields_for_layer(obj, self.layer)
 
         context_values = None
         if isinstance(obj, NeedsContextValues):
@@ -148,11 +331,11 @@ class Session:
 
         # TODO: use *ToFormat?
         if isinstance(obj, Updates) and self.auth_id is not None:
-            await UserAuthorization.filter(id=self.auth_id).update(upd_seq=F("upd_seq") + 1)
-            upd_seq = await UserAuthorization.get_or_none(id=self.auth_id).values_list("upd_seq", flat=True)
-            if upd_seq is None:
-                upd_seq = 0
+            upd_seq = await SeqAllocator.next_seq(self.auth_id)
             logger.trace(f"setting seq to {upd_seq} for user {self.user_id}, auth {self.auth_id}")
+            # Same object may be sent to multiple sessions (and serialized outside of event loop),
+            #  so seq is set on a copy of it
+            obj = copy(obj)
             obj.seq = upd_seq
 
         with measure_time("session.pack_message(...)"):
@@ -174,21 +357,62 @@ class Session:
         )
 
         with measure_time("<serialize message>"):
-            ctx = SerializationContext(
-                auth_id=self.auth_id,
-                user_id=self.user_id,
-                layer=self.layer,
-                values=context_values,
-            )
-            # TODO: serialize in a different thread
-            self.message_queue.put_nowait((message.message_id, message.seq_no, message.obj.write(ctx)))
+            if broadcast_cache is not None:
+                data = broadcast_cache.write(message.obj, self, context_values)
+            else:
+                ctx = SerializationContext(
+                    auth_id=self.auth_id,
+                    user_id=self.user_id,
+                    layer=self.layer,
+                    values=context_values,
+                )
+                executor = self.client.server.serialization_executor if self.client is not None else None
+                if executor is not None:
+                    data = asyncio.get_running_loop().run_in_executor(executor, message.obj.write, ctx)
+                else:
+                    data = message.obj.write(ctx)
+            self.message_queue.put_nowait((message.message_id, message.seq_no, data))
+
+        if isinstance(data, Future):
+            data.add_done_callback(self._serialized_in_executor)
+        else:
+            self.queued_bytes += len(data)
 
         if self.message_available is not None:
             self.message_available.set()
 
-        if isinstance(obj, Updates):
-            obj.seq = 0
-            obj.qts = 0
+    def _serialized_in_executor(self, future: Future[bytes]) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self.queued_bytes += len(future.result())
+
+    def is_slow_consumer(self) -> bool:
+        """
+        Returns True if client doesn't read messages of this session as fast as they are queued,
+        so queued messages take more than max_queued_bytes.
+        """
+
+        return self.queued_bytes > piltover.session.SessionManager.max_queued_bytes
+
+    async def enqueue_update(
+            self, obj: TLObject, broadcast_cache: BroadcastSerializationCache | None = None,
+    ) -> None:
+        """
+        Queues update, or updatesTooLong (once) instead of it if session is slow consumer.
+        Client fetches skipped updates with updates.getDifference after receiving updatesTooLong.
+        """
+
+        if not self.is_slow_consumer():
+            return await self.enqueue(obj, False, broadcast_cache)
+
+        if self.updates_too_long_queued:
+            return
+
+        logger.info(
+            f"Session {self.session_id} has {self.queued_bytes} bytes queued, "
+            f"sending updatesTooLong instead of updates"
+        )
+        self.updates_too_long_queued = True
+        await self.enqueue(UpdatesTooLong(), False)
 
     @staticmethod
     def make_salt(salt_key: bytes, auth_key_id: int, timestamp: int) -> bytes:
@@ -297,6 +521,8 @@ class Session:
                 piltover.session.SessionManager.broker.unsubscribe_auth(old_auth_id, self)
             piltover.session.SessionManager.broker.subscribe_auth(self.auth_id, self)
 
+        await piltover.session.SessionManager.broker.wait_subscribed()
+
     # https://core.telegram.org/mtproto/description#message-identifier-msg-id
     def msg_id(self, in_reply: bool) -> int:
         # Client message identifiers are divisible by 4, server message
@@ -322,75 +548,141 @@ class Session:
             obj=obj,
         )
 
-    def pack_container(self, objects: list[tuple[TLObject, bool]]) -> Message:
-        container = MsgContainer(messages=[
-            Message(
-                message_id=self.msg_id(in_reply=in_reply),
-                seq_no=self.get_outgoing_seq_no(obj),
-                obj=obj,
-            )
-            for obj, in_reply in objects
-        ])
+    def pack_container(self, messages: list[tuple[int, int, bytes]]) -> tuple[int, int, bytes]:
+        """
+        Packs already serialized messages into MsgContainer.
+
+        :param messages: list of (message_id, seq_no, serialized object) tuples.
+        :return: (message_id, seq_no, serialized container) tuple.
+        """
+
+        container = [Int.write(MsgContainer.tlid(), False), Int.write(len(messages))]
+        for message_id, seq_no, data in messages:
+            container.append(Long.write(message_id) + Int.write(seq_no) + Int.write(len(data)))
+            container.append(data)
 
-        return self.pack_message(container, False)
+        return self.msg_id(in_reply=False), self.get_outgoing_seq_no(MsgContainer(messages=[])), b"".join(container)
 
     async def _resolve_context_values(self, values: NeedsContextValues) -> ContextValues:
         user_id = cast(int, self.user_id)
         result = ContextValues()
 
-        # TODO: cache fetched values
+        cached, generation = ContextValuesCache.for_user(user_id)
+        now = monotonic()
 
         if values.poll_answers:
-            selected_answers = await PollVote.filter(
-                answer__poll_id__in=values.poll_answers, user_id=user_id,
-            ).values_list("answer__poll_id", "answer_id")
-            for poll_id, answer_id in selected_answers:
-                if poll_id not in result.poll_answers:
-                    result.poll_answers[poll_id] = set()
-                result.poll_answers[poll_id].add(answer_id)
+            to_fetch = []
+            for poll_id in values.poll_answers:
+                found, answers = ContextValuesCache.get(cached.poll_answers, poll_id, now)
+                if not found:
+                    to_fetch.append(poll_id)
+                elif answers:
+                    result.poll_answers[poll_id] = answers
+
+            if to_fetch:
+                fetched: dict[int, set[int]] = {poll_id: set() for poll_id in to_fetch}
+                selected_answers = await PollVote.filter(
+                    answer__poll_id__in=to_fetch, user_id=user_id,
+                ).values_list("answer__poll_id", "answer_id")
+                for poll_id, answer_id in selected_answers:
+                    fetched[poll_id].add(answer_id)
+                    result.poll_answers[poll_id] = fetched[poll_id]
+
+                ContextValuesCache.store(cached, generation, cached.poll_answers, fetched.items())
 
         if values.chat_participants or values.channel_participants:
-            participants_q = Q()
-            if values.chat_participants:
-                participants_q |= Q(chat_id__in=values.chat_participants)
-            if values.channel_participants:
-                participants_q |= Q(channel_id__in=values.channel_participants)
-
-            participants = await ChatParticipant.filter(participants_q, user_id=user_id).only(
-                "chat_id", "channel_id", "admin_rights", "banned_rights", "invited_at", "left",
-            )
-            for participant in participants:
-                if participant.chat_id is not None:
-                    result.chat_participants[participant.chat_id] = participant
-                elif participant.channel_id is not None:
-                    result.channel_participants[participant.channel_id] = participant
-                else:
-                    raise Unreachable
+            chats_to_fetch = []
+            for chat_id in values.chat_participants or ():
+                found, participant = ContextValuesCache.get(cached.chat_participants, chat_id, now)
+                if not found:
+                    chats_to_fetch.append(chat_id)
+                elif participant is not None:
+                    result.chat_participants[chat_id] = participant
+
+            channels_to_fetch = []
+            for channel_id in values.channel_participants or ():
+                found, participant = ContextValuesCache.get(cached.channel_participants, channel_id, now)
+                if not found:
+                    channels_to_fetch.append(channel_id)
+                elif participant is not None:
+                    result.channel_participants[channel_id] = participant
+
+            if chats_to_fetch or channels_to_fetch:
+                participants_q = Q()
+                if chats_to_fetch:
+                    participants_q |= Q(chat_id__in=chats_to_fetch)
+                if channels_to_fetch:
+                    participants_q |= Q(channel_id__in=channels_to_fetch)
+
+                fetched_chats: dict[int, ChatParticipant | None] = dict.fromkeys(chats_to_fetch)
+                fetched_channels: dict[int, ChatParticipant | None] = dict.fromkeys(channels_to_fetch)
+
+                participants = await ChatParticipant.filter(participants_q, user_id=user_id).only(
+                    "chat_id", "channel_id", "admin_rights", "banned_rights", "invited_at", "left",
+                )
+                for participant in participants:
+                    if participant.chat_id is not None:
+                        result.chat_participants[participant.chat_id] = participant
+                        fetched_chats[participant.chat_id] = participant
+                    elif participant.channel_id is not None:
+                        result.channel_participants[participant.channel_id] = participant
+                        fetched_channels[participant.channel_id] = participant
+                    else:
+                        raise Unreachable
+
+                ContextValuesCache.store(cached, generation, cached.chat_participants, fetched_chats.items())
+                ContextValuesCache.store(cached, generation, cached.channel_participants, fetched_channels.items())
 
         if values.users:
-            contact_ids = set()
-            for contact in await Contact.filter(
-                Q(owner_id=user_id, target_id__in=values.users)
-                | Q(owner_id__in=values.users, target_id=user_id)
-            ).select_related("personal_photo").only(
-                "id", "owner_id", "target_id", "first_name", "last_name", "known_phone_number",
-                "personal_photo_id", "personal_photo__id", "personal_photo__photo_stripped",
-            ):
-                result.contacts[(contact.owner_id, cast(int, contact.target_id))] = contact
-                if contact.owner_id != user_id:
-                    contact_ids.add(contact.owner_id)
-
-            # NOTE (for future me refactoring this): this overwrites existing rules in context variables btw
-            result.privacyrules = await PrivacyRule.has_access_to_bulk(
-                users=values.users,
-                user=user_id,
-                keys=[
-                    PrivacyRuleKeyType.PHONE_NUMBER,
-                    PrivacyRuleKeyType.PROFILE_PHOTO,
-                    PrivacyRuleKeyType.STATUS_TIMESTAMP,
-                ],
-                contacts=contact_ids,
-            )
+            users_to_fetch = []
+            for other_id in values.users:
+                found, user_values = ContextValuesCache.get(cached.users, other_id, now)
+                if not found:
+                    users_to_fetch.append(other_id)
+                    continue
+                contact, reverse_contact, privacyrules = user_values
+                if contact is not None:
+                    result.contacts[(user_id, other_id)] = contact
+                if reverse_contact is not None:
+                    result.contacts[(other_id, user_id)] = reverse_contact
+                result.privacyrules[other_id] = privacyrules
+
+            if users_to_fetch:
+                contacts: dict[tuple[int, int], Contact] = {}
+                contact_ids = set()
+                for contact in await Contact.filter(
+                    Q(owner_id=user_id, target_id__in=users_to_fetch)
+                    | Q(owner_id__in=users_to_fetch, target_id=user_id)
+                ).select_related("personal_photo").only(
+                    "id", "owner_id", "target_id", "first_name", "last_name", "known_phone_number",
+                    "personal_photo_id", "personal_photo__id", "personal_photo__photo_stripped",
+                ):
+                    contacts[(contact.owner_id, cast(int, contact.target_id))] = contact
+                    if contact.owner_id != user_id:
+                        contact_ids.add(contact.owner_id)
+
+                privacyrules = await PrivacyRule.has_access_to_bulk(
+                    users=users_to_fetch,
+                    user=user_id,
+                    keys=[
+                        PrivacyRuleKeyType.PHONE_NUMBER,
+                        PrivacyRuleKeyType.PROFILE_PHOTO,
+                        PrivacyRuleKeyType.STATUS_TIMESTAMP,
+                    ],
+                    contacts=contact_ids,
+                )
+
+                result.contacts.update(contacts)
+                result.privacyrules.update(privacyrules)
+
+                ContextValuesCache.store(cached, generation, cached.users, [
+                    (other_id, (
+                        contacts.get((user_id, other_id)),
+                        contacts.get((other_id, user_id)),
+                        privacyrules.get(other_id, {}),
+                    ))
+                    for other_id in users_to_fetch
+                ])
 
         # TODO: store list of mentioned users inside *ToFormat message
         # TODO: cache media unread statuses
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, cast
 
 from piltover.auth_data import AuthData
@@ -7,7 +8,8 @@ from piltover.context import NeedContextValuesContext
 from piltover.session import Session
 from piltover.tl import TLObject, Vector
 from piltover.tl.types.internal import MessageToUsersShort, ChannelSubscribe, MessageToUsers, \
-    ObjectWithLayerRequirement, InternalPushForUsers, InternalPushForUsersShort
+    ObjectWithLayerRequirement, InternalPushForUsers, InternalPushForUsersShort, InvalidateCachedResponses, \
+    InvalidateContextValues, MessageToEachUser, SessionResumed
 
 if TYPE_CHECKING:
     from piltover.gateway import Client
@@ -18,10 +20,32 @@ class SessionManager:
     sessions: dict[tuple[int, int], Session] = {}
     broker: BaseMessageBroker = None  # type: ignore[assignment]
 
+    # Limits configured by gateway, see Gateway.__init__
+    max_queued_bytes = 16 * 1024 * 1024
+    max_unacked_messages = 256
+    resume_timeout = 60
+    max_detached_sessions = 10000
+    max_detached_sessions_per_key = 16
+
+    # Sessions detached from connections, in order in which they were detached
+    detached: OrderedDict[tuple[int, int], Session] = OrderedDict()
+    detached_by_key: dict[int, OrderedDict[tuple[int, int], Session]] = {}
+
     @classmethod
     def set_broker(cls, broker: BaseMessageBroker) -> None:
         cls.broker = broker
 
+    @classmethod
+    def configure(
+            cls, max_queued_bytes: int, max_unacked_messages: int, resume_timeout: int,
+            max_detached_sessions: int = 10000, max_detached_sessions_per_key: int = 16,
+    ) -> None:
+        cls.max_queued_bytes = max_queued_bytes
+        cls.max_unacked_messages = max_unacked_messages
+        cls.resume_timeout = resume_timeout
+        cls.max_detached_sessions = max_detached_sessions
+        cls.max_detached_sessions_per_key = max_detached_sessions_per_key
+
     @classmethod
     def get_or_create(cls, session_id: int, client: Client, auth_data: AuthData) -> tuple[Session, bool]:
         uniq_id = cast(int, auth_data.auth_key_id), session_id
@@ -35,8 +59,53 @@ class SessionManager:
     @classmethod
     def cleanup(cls, session: Session) -> None:
         uniq_id = cast(int, cast(AuthData, session.auth_data).auth_key_id), session.session_id
-        if uniq_id in cls.sessions:
+        if cls.sessions.get(uniq_id) is session:
             del cls.sessions[uniq_id]
+        cls.session_attached(session)
+
+    @classmethod
+    def session_detached(cls, session: Session) -> None:
+        """
+        Registers session that was detached from connection and destroys sessions that were detached the earliest
+        if there are more than max_detached_sessions of them, or more than max_detached_sessions_per_key
+        for auth key of this session.
+        """
+
+        uniq_id = session.uniq_id()
+        cls.detached[uniq_id] = session
+        by_key = cls.detached_by_key.setdefault(uniq_id[0], OrderedDict())
+        by_key[uniq_id] = session
+
+        while len(by_key) > cls.max_detached_sessions_per_key:
+            next(iter(by_key.values())).destroy()
+        while len(cls.detached) > cls.max_detached_sessions:
+            next(iter(cls.detached.values())).destroy()
+
+    @classmethod
+    def session_attached(cls, session: Session) -> None:
+        uniq_id = session.uniq_id()
+        if cls.detached.get(uniq_id) is not session:
+            return
+
+        del cls.detached[uniq_id]
+        by_key = cls.detached_by_key[uniq_id[0]]
+        del by_key[uniq_id]
+        if not by_key:
+            del cls.detached_by_key[uniq_id[0]]
+
+    @classmethod
+    async def session_resumed(cls, session: Session) -> None:
+        """
+        Notifies other gateways that session was resumed from state stored in cache,
+        so gateway that session was detached in drops its copy of it.
+        """
+
+        key_id, session_id = session.uniq_id()
+        await cls.broker.send(SessionResumed(key_id=key_id, session_id=session_id))
+
+    @staticmethod
+    def state_cache_key(auth_key_id: int, session_id: int) -> str:
+        return f"session-state:{auth_key_id}:{session_id}"
 
     @classmethod
     async def send(
@@ -103,6 +172,24 @@ class SessionManager:
 
         await cls.broker.send(message)
 
+    @classmethod
+    async def send_to_each_user(cls, objs: dict[int, TLObject], ignore_auth_id: int | None = None) -> None:
+        """
+        Sends different object to every user in one broker message,
+        e.g. same message formatted for every participant of basic group.
+        """
+
+        if not objs:
+            return
+
+        to_send = []
+        for obj in objs.values():
+            ctx = NeedContextValuesContext()
+            obj.check_for_ctx_values(ctx)
+            to_send.append(ctx.to_tl(obj) if ctx.any() else obj)
+
+        await cls.broker.send(MessageToEachUser(users=list(objs), objs=to_send, ignore_auth_id=ignore_auth_id))
+
     @classmethod
     async def send_internal_push(cls, user_id: int | list[int]) -> None:
         if not user_id:
@@ -127,3 +214,16 @@ class SessionManager:
     async def unsubscribe_from_channel(cls, channel_id: int, user_ids: list[int]) -> None:
         if user_ids and channel_id:
             await cls.broker.send(ChannelSubscribe(channel_ids=[channel_id], user_ids=user_ids, subscribe=False))
+
+    @classmethod
+    async def invalidate_cached_responses(cls, user_id: int | None = None) -> None:
+        await cls.broker.send(InvalidateCachedResponses(user_id=user_id))
+
+    @classmethod
+    async def invalidate_context_values(
+            cls, user_ids: list[int], participants: bool = False, users: bool = False, poll_votes: bool = False,
+    ) -> None:
+        if user_ids:
+            await cls.broker.send(InvalidateContextValues(
+                user_ids=user_ids, participants=participants, users=users, poll_votes=poll_votes,
+            ))
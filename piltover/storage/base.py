@@ -22,18 +22,27 @@ class BaseStorageComponent(ABC):
 
 
 class BaseStorage(ABC):
+    # Parts saved with offset are written in place, other parts are put after previous parts
+    #  (or at part_id * part_size, if part_size is passed) when upload is finalized
+
     @abstractmethod
     async def save_part(
             self, file_id: UUID, part_id: int, data: StorageBuffer, is_last: bool, suffix: str | None = None,
+            offset: int | None = None,
     ) -> None:
         ...
 
     @abstractmethod
     async def finalize_upload_as(
             self, file_id: UUID, as_: StorageType, parts_num: int, suffix: str | None = None,
+            part_size: int | None = None,
     ) -> None:
         ...
 
+    @abstractmethod
+    async def discard_upload(self, file_id: UUID, parts_num: int, suffix: str | None = None) -> None:
+        ...
+
     @property
     @abstractmethod
     def documents(self) -> BaseStorageComponent:
@@ -0,0 +1,56 @@
+import hashlib
+import hmac
+from time import time
+from uuid import UUID
+
+from piltover.config import APP_CONFIG
+from piltover.storage.base import BaseStorage, StorageType
+from piltover.tl import TLObject
+from piltover.tl.types.internal import FilePartToken
+from piltover.tl.types.upload import File as TLFile
+
+# Tokens are read by gateway right after worker returns them, so they don't need to live long
+FILE_PART_TOKEN_TTL = 30
+
+
+def _sign(token: FilePartToken) -> bytes:
+    signature, token.signature = token.signature, b""
+    try:
+        payload = token.write()
+    finally:
+        token.signature = signature
+
+    return hmac.new(APP_CONFIG.hmac_key, payload, hashlib.sha256).digest()
+
+
+def make_file_part_token(
+        physical_id: UUID, storage_type: StorageType, suffix: str | None, offset: int, limit: int,
+        file_type: TLObject, mtime: int,
+) -> FilePartToken:
+    token = FilePartToken(
+        physical_id=physical_id.bytes,
+        storage=storage_type.value,
+        suffix=suffix,
+        offset=offset,
+        limit=limit,
+        file_type=file_type,
+        mtime=mtime,
+        expires_at=int(time()) + FILE_PART_TOKEN_TTL,
+        signature=b"",
+    )
+    token.signature = _sign(token)
+    return token
+
+
+def check_file_part_token(token: FilePartToken) -> bool:
+    return token.expires_at >= time() and hmac.compare_digest(_sign(token), token.signature)
+
+
+async def read_file_part(storage: BaseStorage, token: FilePartToken) -> TLFile:
+    if token.storage == StorageType.PHOTO:
+        component = storage.photos
+    else:
+        component = storage.documents
+
+    data = await component.get_part(UUID(bytes=token.physical_id), token.offset, token.limit, token.suffix)
+    return TLFile(type_=token.file_type, mtime=token.mtime, bytes_=data or b"")
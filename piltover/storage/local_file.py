@@ -1,14 +1,63 @@
+import asyncio
 import os
 from pathlib import Path
 from typing import cast
 from uuid import UUID
 
-import aiofiles
 import aiofiles.os
 from loguru import logger
 
 from .base import BaseStorage, BaseStorageComponent, StorageType, StorageBuffer
 
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _read_at(path: Path, offset: int, length: int) -> bytes | None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+
+    try:
+        return os.pread(fd, length, offset)
+    finally:
+        os.close(fd)
+
+
+def _write_at(path: Path, offset: int, data: StorageBuffer) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+    finally:
+        os.close(fd)
+
+
+def _copy_to(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    src_offset = 0
+    if hasattr(os, "copy_file_range"):
+        # Data is copied by kernel without reading it into memory
+        while count > 0:
+            copied = os.copy_file_range(src_fd, dst_fd, count, src_offset, offset)
+            if copied == 0:
+                return
+            src_offset += copied
+            offset += copied
+            count -= copied
+        return
+
+    while count > 0:
+        data = os.pread(src_fd, min(count, _COPY_CHUNK_SIZE), src_offset)
+        if not data:
+            return
+        written = os.pwrite(dst_fd, data, offset)
+        src_offset += written
+        offset += written
+        count -= written
+
 
 class LocalFileStorageComponent(BaseStorageComponent):
     def __init__(self, files_dir: Path, component_name: str) -> None:
@@ -23,13 +72,11 @@ class LocalFileStorageComponent(BaseStorageComponent):
             file_name += f"-{suffix}"
         file_path = self._dir / file_name
 
-        if not file_path.exists():
+        data = await asyncio.to_thread(_read_at, file_path, offset, length)
+        if data is None:
             logger.warning(f"Requested file {file_path} does not exist, even tho it should")
-            return None
 
-        async with aiofiles.open(file_path, "rb") as f:
-            await f.seek(offset)
-            return await f.read(length)
+        return data
 
     async def get_location(self, file_id: UUID, suffix: str | None = None) -> str:
         file_name = str(file_id)
@@ -64,22 +111,22 @@ class LocalFileStorage(BaseStorage):
 
     async def save_part(
             self, file_id: UUID, part_id: int, data: StorageBuffer, is_last: bool, suffix: str | None = None,
+            offset: int | None = None,
     ) -> None:
         file_name = str(file_id)
         if suffix is not None:
             file_name += f"-{suffix}"
 
-        if part_id > 0:
+        if offset is None and part_id > 0:
+            # Offset of this part is not known yet, it is moved to its place when upload is finalized
             file_name += f".part{part_id}"
+            offset = 0
 
-        file_path = self._dir / "uploading" / file_name
-        file_path.touch(exist_ok=True)
-
-        async with aiofiles.open(file_path, "r+b") as f:
-            await f.write(data)
+        await asyncio.to_thread(_write_at, self._dir / "uploading" / file_name, offset or 0, data)
 
     async def finalize_upload_as(
             self, file_id: UUID, as_: StorageType, parts_num: int, suffix: str | None = None,
+            part_size: int | None = None,
     ) -> None:
         file_name = str(file_id)
         if suffix is not None:
@@ -94,13 +141,37 @@ class LocalFileStorage(BaseStorage):
         if parts_num <= 1:
             return
 
-        async with aiofiles.open(dst_path, "r+b") as f_out:
-            await f_out.seek(0, os.SEEK_END)
+        await asyncio.to_thread(self._put_parts, dst_path, file_name, parts_num, part_size)
+
+    def _put_parts(self, dst_path: Path, file_name: str, parts_num: int, part_size: int | None) -> None:
+        with open(dst_path, "r+b") as f_out:
             for part_id in range(1, parts_num):
-                append_filename = self._dir / "uploading" / f"{file_name}.part{part_id}"
-                async with aiofiles.open(append_filename, "rb") as f_in:
-                    await f_out.write(await f_in.read())
-                await aiofiles.os.remove(append_filename)
+                part_path = self._dir / "uploading" / f"{file_name}.part{part_id}"
+                try:
+                    f_in = open(part_path, "rb")
+                except FileNotFoundError:
+                    # Part is already written in place
+                    continue
+
+                with f_in:
+                    offset = part_id * part_size if part_size is not None else os.fstat(f_out.fileno()).st_size
+                    _copy_to(f_in.fileno(), f_out.fileno(), offset, os.fstat(f_in.fileno()).st_size)
+
+                os.remove(part_path)
+
+    async def discard_upload(self, file_id: UUID, parts_num: int, suffix: str | None = None) -> None:
+        file_name = str(file_id)
+        if suffix is not None:
+            file_name += f"-{suffix}"
+
+        logger.trace(f"Discarding {parts_num} uploaded parts of {file_name}")
+
+        for part_id in range(parts_num):
+            part_name = file_name if part_id == 0 else f"{file_name}.part{part_id}"
+            try:
+                await aiofiles.os.remove(self._dir / "uploading" / part_name)
+            except FileNotFoundError:
+                pass
 
     @property
     def documents(self) -> BaseStorageComponent:
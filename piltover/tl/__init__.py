@@ -1,8 +1,21 @@
 from .tl_object import *
 from .primitives import *
 from .core_types import *
-from .types import *
-from . import base
-from .functions import *
-from .all import *
-from . import layer_converters
\ No newline at end of file
+from . import types, functions, base
+from .all import objects
+from .lazy_import import lazy_getattr
+
+# Generated types and functions are exported from this package the same way "from .types import *"
+#  and "from .functions import *" would do it (functions taking precedence), but their modules are imported
+#  only when one of their names is accessed for the first time.
+_LAZY_INDEX = {
+    "to_format": ("to_format", None),
+    "layer_converters": ("layer_converters", None),
+    **{name: (f"types.{module}", attr) for name, (module, attr) in types.LAZY_INDEX.items()},
+    **{name: (f"functions.{module}", attr) for name, (module, attr) in functions.LAZY_INDEX.items()},
+}
+for _name in _LAZY_INDEX.keys() & globals().keys():
+    del globals()[_name]
+del _name
+
+__getattr__ = lazy_getattr(__name__, globals(), _LAZY_INDEX)
@@ -0,0 +1,2813 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .lazy_import import LazyObjects
+
+objects = LazyObjects({
+    0x0aebc70a: ("types.internal", "SentCode"),
+    0x2c80fe90: ("types.internal", "Authorization"),
+    0xc5785da2: ("types.internal", "AppInfo"),
+    0x235e45e5: ("types.internal", "AppNotFound"),
+    0x1b3bde32: ("types.internal", "PublicKey"),
+    0xacc487b7: ("types.internal", "AvailableServer"),
+    0x58d5526f: ("types.internal", "AvailableServers"),
+    0x22be0328: ("types.internal", "RpcResponse"),
+    0x96d8b547: ("types.internal", "MessageToUsers"),
+    0xe49a2c2a: ("types.internal", "MessageToUsersShort"),
+    0x92aeb648: ("types.internal", "SetSessionInternalPush"),
+    0xae808cf6: ("types.internal", "ChannelSubscribe"),
+    0x3064535b: ("types.internal", "InternalPushForUsers"),
+    0x744c0523: ("types.internal", "InternalPushForUsersShort"),
+    0xc1950bed: ("types.internal", "InvalidateCachedResponses"),
+    0xe829d628: ("types.internal", "InvalidateContextValues"),
+    0xa09bf478: ("types.internal", "MessageToEachUser"),
+    0xe23681d5: ("types.internal", "SessionResumed"),
+    0xd9594f1f: ("types.internal", "FieldWithLayerRequirement"),
+    0x7678a3: ("types.internal", "ObjectWithLayerRequirement"),
+    0xb3e50ad9: ("types.internal", "NeedsContextValues"),
+    0x7c8ae505: ("types.internal", "SessionMessage"),
+    0x6a6a63c1: ("types.internal", "SessionState"),
+    0x8022c615: ("types.internal", "FilePartToken"),
+    0xf12bae38: ("types.internal", "TaggedIntVector"),
+    0xd3264171: ("types.internal", "TaggedLongVector"),
+    0xab8ac0d8: ("types.internal", "TaggedInt128Vector"),
+    0x625ff3a1: ("types.internal", "TaggedInt256Vector"),
+    0x457a9f22: ("types.internal", "TaggedFloatVector"),
+    0xcb98721a: ("types.internal", "TaggedBoolVector"),
+    0x8d538c0f: ("types.internal", "TaggedBytesVector"),
+    0x492bec2d: ("types.internal", "TaggedStringVector"),
+    0xb002bb63: ("types.internal", "TaggedObjectVector"),
+    0x202f2b94: ("types.internal", "TaggedInt"),
+    0x8b45cf0f: ("types.internal", "TaggedLong"),
+    0x3698302b: ("types.internal", "TaggedInt128"),
+    0xc5087dfc: ("types.internal", "TaggedInt256"),
+    0xfa738c5: ("types.internal", "TaggedFloat"),
+    0x9eb8a6a1: ("types.internal", "TaggedBool"),
+    0x942948e0: ("types.internal", "TaggedBytes"),
+    0x678b99df: ("types.internal", "TaggedString"),
+    0xfd2458a4: ("types.internal", "TaggedObject"),
+    0x8ba60692: ("types.internal", "TaggedVector"),
+    0xd5525aa8: ("types.internal_benchmarking", "NestedObject"),
+    0x88ab7760: ("types.internal_benchmarking", "DeeplyNestedObjectX8"),
+    0xf5a1d88a: ("types.internal_benchmarking", "DeeplyNestedObjectX7"),
+    0x17b5ec16: ("types.internal_benchmarking", "DeeplyNestedObjectX6"),
+    0x524e6a6a: ("types.internal_benchmarking", "DeeplyNestedObjectX5"),
+    0xc9bfbfd0: ("types.internal_benchmarking", "DeeplyNestedObjectX4"),
+    0x11bdcd0b: ("types.internal_benchmarking", "DeeplyNestedObjectX3"),
+    0xbfffaeb7: ("types.internal_benchmarking", "DeeplyNestedObjectX2"),
+    0x1c0441df: ("types.internal_benchmarking", "DeeplyNestedObjectX1"),
+    0x96be42f: ("types.internal_benchmarking", "ObjectToBenchmark"),
+    0xbcb2c294: ("types.internal_botfather", "BotfatherStateNewbot"),
+    0xad2641a6: ("types.internal_botfather", "BotfatherStateEditbot"),
+    0xfe36b3bd: ("types.internal_stickersbot", "NewpackInputSticker"),
+    0x371ef88f: ("types.internal_stickersbot", "EmojiPackTypeStatic"),
+    0xbe690159: ("types.internal_stickersbot", "EmojiPackTypeVideo"),
+    0x100a52c: ("types.internal_stickersbot", "EmojiPackTypeAnimated"),
+    0x70a163dd: ("types.internal_stickersbot", "StickersStateNewpack"),
+    0xadc6611f: ("types.internal_stickersbot", "StickersStateAddsticker"),
+    0xd3add072: ("types.internal_stickersbot", "StickersStateEditsticker"),
+    0x1852c118: ("types.internal_stickersbot", "StickersStateDelpack"),
+    0xb4b529e2: ("types.internal_stickersbot", "StickersStateRenamepack"),
+    0xdce7b0f5: ("types.internal_stickersbot", "StickersStateReplacesticker"),
+    0x3d1302b7: ("types.internal_stickersbot", "StickersStateNewemojipack"),
+    0xc7087987: ("types.internal_stickersbot", "StickersStateAddemoji"),
+    0x916e7528: ("types.internal_access", "AccessHashPayloadUser"),
+    0x8195bf26: ("types.internal_access", "AccessHashPayloadChannel"),
+    0x4c9a07fe: ("types.internal_access", "AccessHashPayloadFile"),
+    0xa773e2af: ("types.internal_access", "AccessHashPayloadEncryptedChat"),
+    0x8009da5b: ("types.internal_access", "AccessHashPayloadStickerset"),
+    0xcb83392e: ("types.internal_access", "AccessHashPayloadWallpaper"),
+    0x1c9a2a19: ("types.internal_access", "AccessHashPayloadTheme"),
+    0xaf4f0049: ("types.internal_access", "FileReferencePayload"),
+    0x4e487850: ("types.internal", "MessageToFormatContent"),
+    0x76fbc4e5: ("types.internal", "MessageToFormatServiceContent"),
+    0x66b94b3: ("types.internal", "MessageToFormatRef"),
+    0xb2d2c02: ("types.internal", "ChannelMessageToFormatCommon"),
+    0x1445ac69: ("types.internal", "StickerSetToFormatCommon"),
+    0xb27013c6: ("types.internal", "StickerSetToFormatForUser"),
+    0x68dda86b: ("to_format", "WallPaperToFormat"),
+    0xefce62cb: ("to_format", "MessageServiceToFormat"),
+    0x150039e1: ("to_format", "ThemeToFormat"),
+    0xafe6f89: ("to_format", "ChatToFormat"),
+    0x89ce0d3a: ("to_format", "ChannelToFormat"),
+    0x276511f3: ("to_format", "UserToFormat"),
+    0x44045474: ("to_format", "EncryptedChatToFormat"),
+    0xfb007fa4: ("to_format", "PollResultsToFormat"),
+    0xa6ad847b: ("to_format", "PollAnswerVotersToFormat"),
+    0x94e4f3ed: ("to_format", "PhoneCallToFormat"),
+    0xe0a8fd99: ("to_format", "MessageToFormat"),
+    0x237ed5c2: ("to_format", "ChannelMessageToFormat"),
+    0x5157a73d: ("to_format", "UpdateMessageIDToFormat"),
+    0x7108bc92: ("to_format", "StickerSetToFormat"),
+    0xbc8e37d8: ("functions.internal", "SendCode"),
+    0x53fa18be: ("functions.internal", "SignIn"),
+    0x8b497a42: ("functions.internal", "GetUserApp"),
+    0xbe19f87d: ("functions.internal", "EditUserApp"),
+    0xa2ed5af3: ("functions.internal", "GetAvailableServers"),
+    0xead5e531: ("functions.internal", "CallRpc"),
+    0xe876b427: ("functions.internal", "CallRpcInternal"),
+    0xbabeae6e: ("functions.internal", "SendScheduledMessage"),
+    0xacd1c8f0: ("functions.internal", "DeleteScheduledMessage"),
+    0x6bdac34b: ("functions.internal", "CreateDiscussionThread"),
+    0x820fd380: ("functions.internal", "ProcessMessageToBuiltinBot"),
+    0xed609074: ("functions.internal", "UpdateStatusForPeers"),
+    0xb8b19f5d: ("functions.internal", "ClearDraft"),
+    0xb1210a96: ("functions.internal", "SendTelegramMessage"),
+    0x05162463: ("types._root", "ResPQ"),
+    0x83c95aec: ("types._root", "PQInnerData"),
+    0xa9f55f95: ("types._root", "PQInnerDataDc"),
+    0x3c6a84d4: ("types._root", "PQInnerDataTemp"),
+    0x56fddf88: ("types._root", "PQInnerDataTempDc"),
+    0x75a3f765: ("types._root", "BindAuthKeyInner"),
+    0x79cb045d: ("types._root", "ServerDHParamsFail"),
+    0xd0e8075c: ("types._root", "ServerDHParamsOk"),
+    0xb5890dba: ("types._root", "ServerDHInnerData"),
+    0x6643b654: ("types._root", "ClientDHInnerData"),
+    0x3bcbf734: ("types._root", "DhGenOk"),
+    0x46dc1fb9: ("types._root", "DhGenRetry"),
+    0xa69dae02: ("types._root", "DhGenFail"),
+    0xf660e1d4: ("types._root", "DestroyAuthKeyOk"),
+    0x0a9f2259: ("types._root", "DestroyAuthKeyNone"),
+    0xea109b13: ("types._root", "DestroyAuthKeyFail"),
+    0x60469778: ("functions._root", "ReqPq"),
+    0xbe7e8ef1: ("functions._root", "ReqPqMulti"),
+    0xd712e4be: ("functions._root", "ReqDHParams"),
+    0xf5045f1f: ("functions._root", "SetClientDHParams"),
+    0xd1435160: ("functions._root", "DestroyAuthKey"),
+    0x62d6b459: ("types._root", "MsgsAck"),
+    0xa7eff811: ("types._root", "BadMsgNotification"),
+    0xedab447b: ("types._root", "BadServerSalt"),
+    0xda69fb52: ("types._root", "MsgsStateReq"),
+    0x04deb57d: ("types._root", "MsgsStateInfo"),
+    0x8cc0d131: ("types._root", "MsgsAllInfo"),
+    0x276d3ec6: ("types._root", "MsgDetailedInfo"),
+    0x809db6df: ("types._root", "MsgNewDetailedInfo"),
+    0x7d861a08: ("types._root", "MsgResendReq"),
+    0x2144ca19: ("types._root", "RpcError"),
+    0x5e2ad36e: ("types._root", "RpcAnswerUnknown"),
+    0xcd78e586: ("types._root", "RpcAnswerDroppedRunning"),
+    0xa43ad8b7: ("types._root", "RpcAnswerDropped"),
+    0x0949d9dc: ("types._root", "FutureSalt"),
+    0x347773c5: ("types._root", "Pong"),
+    0xe22045fc: ("types._root", "DestroySessionOk"),
+    0x62d350c9: ("types._root", "DestroySessionNone"),
+    0x9ec20908: ("types._root", "NewSessionCreated"),
+    0x9299359f: ("types._root", "HttpWait"),
+    0xd433ad73: ("types._root", "IpPort"),
+    0x37982646: ("types._root", "IpPortSecret"),
+    0x4679b65f: ("types._root", "AccessPointRule"),
+    0x5a592a6c: ("types.help", "ConfigSimple"),
+    0x6c52c484: ("types._root", "TlsClientHello"),
+    0x4218a164: ("types._root", "TlsBlockString"),
+    0x4d4dc41e: ("types._root", "TlsBlockRandom"),
+    0x09333afb: ("types._root", "TlsBlockZero"),
+    0x10e8636f: ("types._root", "TlsBlockDomain"),
+    0xe675a1c1: ("types._root", "TlsBlockGrease"),
+    0x9eb95b5c: ("types._root", "TlsBlockPublicKey"),
+    0xe725d44f: ("types._root", "TlsBlockScope"),
+    0x58e4a740: ("functions._root", "RpcDropAnswer"),
+    0xb921bd04: ("functions._root", "GetFutureSalts"),
+    0x7abe77ec: ("functions._root", "Ping"),
+    0xf3427b8c: ("functions._root", "PingDelayDisconnect"),
+    0xe7512126: ("functions._root", "DestroySession"),
+    0x7f3b18ea: ("types._root", "InputPeerEmpty"),
+    0x7da07ec9: ("types._root", "InputPeerSelf"),
+    0x35a95cb9: ("types._root", "InputPeerChat"),
+    0xdde8a54c: ("types._root", "InputPeerUser"),
+    0x27bcbbfc: ("types._root", "InputPeerChannel"),
+    0xa87b0a1c: ("types._root", "InputPeerUserFromMessage"),
+    0xbd2a0840: ("types._root", "InputPeerChannelFromMessage"),
+    0xb98886cf: ("types._root", "InputUserEmpty"),
+    0xf7c1b13f: ("types._root", "InputUserSelf"),
+    0xf21158c6: ("types._root", "InputUser"),
+    0x1da448e2: ("types._root", "InputUserFromMessage"),
+    0xf392b7f4: ("types._root", "InputPhoneContact"),
+    0xf52ff27f: ("types._root", "InputFile"),
+    0xfa4f0bb5: ("types._root", "InputFileBig"),
+    0x62dc8b48: ("types._root", "InputFileStoryDocument"),
+    0x9664f57f: ("types._root", "InputMediaEmpty"),
+    0x1e287d04: ("types._root", "InputMediaUploadedPhoto"),
+    0xb3ba0635: ("types._root", "InputMediaPhoto"),
+    0xf9c44144: ("types._root", "InputMediaGeoPoint"),
+    0xf8ab7dfb: ("types._root", "InputMediaContact"),
+    0x37c9330: ("types._root", "InputMediaUploadedDocument"),
+    0xa8763ab5: ("types._root", "InputMediaDocument"),
+    0xc13d1c11: ("types._root", "InputMediaVenue"),
+    0xe5bbfe1a: ("types._root", "InputMediaPhotoExternal"),
+    0x779600f9: ("types._root", "InputMediaDocumentExternal"),
+    0xd33f43f3: ("types._root", "InputMediaGame"),
+    0x405fef0d: ("types._root", "InputMediaInvoice"),
+    0x971fa843: ("types._root", "InputMediaGeoLive"),
+    0xf94e5f1: ("types._root", "InputMediaPoll"),
+    0xe66fbf7b: ("types._root", "InputMediaDice"),
+    0x89fdd778: ("types._root", "InputMediaStory"),
+    0xc21b8849: ("types._root", "InputMediaWebPage"),
+    0xc4103386: ("types._root", "InputMediaPaidMedia"),
+    0x1ca48f57: ("types._root", "InputChatPhotoEmpty"),
+    0xbdcdaec0: ("types._root", "InputChatUploadedPhoto"),
+    0x8953ad37: ("types._root", "InputChatPhoto"),
+    0xe4c123d6: ("types._root", "InputGeoPointEmpty"),
+    0x48222faf: ("types._root", "InputGeoPoint"),
+    0x1cd7bf0d: ("types._root", "InputPhotoEmpty"),
+    0x3bb3b94a: ("types._root", "InputPhoto"),
+    0xdfdaabe1: ("types._root", "InputFileLocation"),
+    0xf5235d55: ("types._root", "InputEncryptedFileLocation"),
+    0xbad07584: ("types._root", "InputDocumentFileLocation"),
+    0xcbc7ee28: ("types._root", "InputSecureFileLocation"),
+    0x29be5899: ("types._root", "InputTakeoutFileLocation"),
+    0x40181ffe: ("types._root", "InputPhotoFileLocation"),
+    0xd83466f3: ("types._root", "InputPhotoLegacyFileLocation"),
+    0x37257e99: ("types._root", "InputPeerPhotoFileLocation"),
+    0x9d84f3db: ("types._root", "InputStickerSetThumb"),
+    0x598a92a: ("types._root", "InputGroupCallStream"),
+    0x59511722: ("types._root", "PeerUser"),
+    0x36c6019a: ("types._root", "PeerChat"),
+    0xa2a5371e: ("types._root", "PeerChannel"),
+    0xaa963b05: ("types.storage", "FileUnknown"),
+    0x40bc6f52: ("types.storage", "FilePartial"),
+    0x7efe0e: ("types.storage", "FileJpeg"),
+    0xcae1aadf: ("types.storage", "FileGif"),
+    0xa4f63c0: ("types.storage", "FilePng"),
+    0xae1e508d: ("types.storage", "FilePdf"),
+    0x528a0677: ("types.storage", "FileMp3"),
+    0x4b09ebbc: ("types.storage", "FileMov"),
+    0xb3cea0e4: ("types.storage", "FileMp4"),
+    0x1081464c: ("types.storage", "FileWebp"),
+    0xd3bc4b7a: ("types._root", "UserEmpty"),
+    0x20b1422: ("types._root", "User"),
+    0x4f11bae1: ("types._root", "UserProfilePhotoEmpty"),
+    0x82d1f706: ("types._root", "UserProfilePhoto"),
+    0x9d05049: ("types._root", "UserStatusEmpty"),
+    0xedb93949: ("types._root", "UserStatusOnline"),
+    0x8c703f: ("types._root", "UserStatusOffline"),
+    0x7b197dc8: ("types._root", "UserStatusRecently"),
+    0x541a1d1a: ("types._root", "UserStatusLastWeek"),
+    0x65899777: ("types._root", "UserStatusLastMonth"),
+    0x29562865: ("types._root", "ChatEmpty"),
+    0x41cbf256: ("types._root", "Chat"),
+    0x6592a1a7: ("types._root", "ChatForbidden"),
+    0x7482147e: ("types._root", "Channel"),
+    0x17d493d5: ("types._root", "ChannelForbidden"),
+    0x2633421b: ("types._root", "ChatFull"),
+    0x52d6806b: ("types._root", "ChannelFull"),
+    0xc02d4007: ("types._root", "ChatParticipant"),
+    0xe46bcee4: ("types._root", "ChatParticipantCreator"),
+    0xa0933f5b: ("types._root", "ChatParticipantAdmin"),
+    0x8763d3e1: ("types._root", "ChatParticipantsForbidden"),
+    0x3cbc93f8: ("types._root", "ChatParticipants"),
+    0x37c1011c: ("types._root", "ChatPhotoEmpty"),
+    0x1c6e1c11: ("types._root", "ChatPhoto"),
+    0x90a6ca84: ("types._root", "MessageEmpty"),
+    0xeabcdd4d: ("types._root", "Message"),
+    0xd3d28540: ("types._root", "MessageService"),
+    0x3ded6320: ("types._root", "MessageMediaEmpty"),
+    0x695150d7: ("types._root", "MessageMediaPhoto"),
+    0x56e0d474: ("types._root", "MessageMediaGeo"),
+    0x70322949: ("types._root", "MessageMediaContact"),
+    0x9f84f49e: ("types._root", "MessageMediaUnsupported"),
+    0x52d8ccd9: ("types._root", "MessageMediaDocument"),
+    0xddf10c3b: ("types._root", "MessageMediaWebPage"),
+    0x2ec0533f: ("types._root", "MessageMediaVenue"),
+    0xfdb19008: ("types._root", "MessageMediaGame"),
+    0xf6a548d3: ("types._root", "MessageMediaInvoice"),
+    0xb940c666: ("types._root", "MessageMediaGeoLive"),
+    0x4bd6e798: ("types._root", "MessageMediaPoll"),
+    0x3f7ee58b: ("types._root", "MessageMediaDice"),
+    0x68cb6283: ("types._root", "MessageMediaStory"),
+    0xaa073beb: ("types._root", "MessageMediaGiveaway"),
+    0xceaa3ea1: ("types._root", "MessageMediaGiveawayResults"),
+    0xa8852491: ("types._root", "MessageMediaPaidMedia"),
+    0xb6aef7b0: ("types._root", "MessageActionEmpty"),
+    0xbd47cbad: ("types._root", "MessageActionChatCreate"),
+    0xb5a1ce5a: ("types._root", "MessageActionChatEditTitle"),
+    0x7fcb13a8: ("types._root", "MessageActionChatEditPhoto"),
+    0x95e3fbef: ("types._root", "MessageActionChatDeletePhoto"),
+    0x15cefd00: ("types._root", "MessageActionChatAddUser"),
+    0xa43f30cc: ("types._root", "MessageActionChatDeleteUser"),
+    0x31224c3: ("types._root", "MessageActionChatJoinedByLink"),
+    0x95d2ac92: ("types._root", "MessageActionChannelCreate"),
+    0xe1037f92: ("types._root", "MessageActionChatMigrateTo"),
+    0xea3948e9: ("types._root", "MessageActionChannelMigrateFrom"),
+    0x94bd38ed: ("types._root", "MessageActionPinMessage"),
+    0x9fbab604: ("types._root", "MessageActionHistoryClear"),
+    0x92a72876: ("types._root", "MessageActionGameScore"),
+    0xffa00ccc: ("types._root", "MessageActionPaymentSentMe"),
+    0xc624b16e: ("types._root", "MessageActionPaymentSent"),
+    0x80e11a7f: ("types._root", "MessageActionPhoneCall"),
+    0x4792929b: ("types._root", "MessageActionScreenshotTaken"),
+    0xfae69f56: ("types._root", "MessageActionCustomAction"),
+    0xc516d679: ("types._root", "MessageActionBotAllowed"),
+    0x1b287353: ("types._root", "MessageActionSecureValuesSentMe"),
+    0xd95c6154: ("types._root", "MessageActionSecureValuesSent"),
+    0xf3f25f76: ("types._root", "MessageActionContactSignUp"),
+    0x98e0d697: ("types._root", "MessageActionGeoProximityReached"),
+    0x7a0d7f42: ("types._root", "MessageActionGroupCall"),
+    0x502f92f7: ("types._root", "MessageActionInviteToGroupCall"),
+    0x3c134d7b: ("types._root", "MessageActionSetMessagesTTL"),
+    0xb3a07661: ("types._root", "MessageActionGroupCallScheduled"),
+    0xaa786345: ("types._root", "MessageActionSetChatTheme"),
+    0xebbca3cb: ("types._root", "MessageActionChatJoinedByRequest"),
+    0x47dd8079: ("types._root", "MessageActionWebViewDataSentMe"),
+    0xb4c38cb5: ("types._root", "MessageActionWebViewDataSent"),
+    0x6c6274fa: ("types._root", "MessageActionGiftPremium"),
+    0xd999256: ("types._root", "MessageActionTopicCreate"),
+    0xc0944820: ("types._root", "MessageActionTopicEdit"),
+    0x57de635e: ("types._root", "MessageActionSuggestProfilePhoto"),
+    0x31518e9b: ("types._root", "MessageActionRequestedPeer"),
+    0x5060a3f4: ("types._root", "MessageActionSetChatWallPaper"),
+    0x56d03994: ("types._root", "MessageActionGiftCode"),
+    0xa80f51e4: ("types._root", "MessageActionGiveawayLaunch"),
+    0x87e2f155: ("types._root", "MessageActionGiveawayResults"),
+    0xcc02aa6d: ("types._root", "MessageActionBoostApply"),
+    0x93b31848: ("types._root", "MessageActionRequestedPeerSentMe"),
+    0x41b3e202: ("types._root", "MessageActionPaymentRefunded"),
+    0x45d5b021: ("types._root", "MessageActionGiftStars"),
+    0xb00c47a2: ("types._root", "MessageActionPrizeStars"),
+    0x4717e8a4: ("types._root", "MessageActionStarGift"),
+    0xacdfcb81: ("types._root", "MessageActionStarGiftUnique"),
+    0xac1f1fcd: ("types._root", "MessageActionPaidMessagesRefunded"),
+    0xbcd71419: ("types._root", "MessageActionPaidMessagesPrice"),
+    0xd58a08c6: ("types._root", "Dialog"),
+    0x71bd134c: ("types._root", "DialogFolder"),
+    0x2331b22d: ("types._root", "PhotoEmpty"),
+    0xfb197a65: ("types._root", "Photo"),
+    0xe17e23c: ("types._root", "PhotoSizeEmpty"),
+    0x75c78e60: ("types._root", "PhotoSize"),
+    0x21e1ad6: ("types._root", "PhotoCachedSize"),
+    0xe0b0bc2e: ("types._root", "PhotoStrippedSize"),
+    0xfa3efb95: ("types._root", "PhotoSizeProgressive"),
+    0xd8214d41: ("types._root", "PhotoPathSize"),
+    0x1117dd5f: ("types._root", "GeoPointEmpty"),
+    0xb2a2f663: ("types._root", "GeoPoint"),
+    0x5e002502: ("types.auth", "SentCode"),
+    0x2390fe44: ("types.auth", "SentCodeSuccess"),
+    0xd7cef980: ("types.auth", "SentCodePaymentRequired"),
+    0x2ea2c0d4: ("types.auth", "Authorization"),
+    0x44747e9a: ("types.auth", "AuthorizationSignUpRequired"),
+    0xb434e2b8: ("types.auth", "ExportedAuthorization"),
+    0xb8bc5b0c: ("types._root", "InputNotifyPeer"),
+    0x193b4417: ("types._root", "InputNotifyUsers"),
+    0x4a95e84e: ("types._root", "InputNotifyChats"),
+    0xb1db7c7e: ("types._root", "InputNotifyBroadcasts"),
+    0x5c467992: ("types._root", "InputNotifyForumTopic"),
+    0xcacb6ae2: ("types._root", "InputPeerNotifySettings"),
+    0x99622c0c: ("types._root", "PeerNotifySettings"),
+    0xf47741f7: ("types._root", "PeerSettings"),
+    0xa437c3ed: ("types._root", "WallPaper"),
+    0xe0804116: ("types._root", "WallPaperNoFile"),
+    0x58dbcab8: ("types._root", "InputReportReasonSpam"),
+    0x1e22c78d: ("types._root", "InputReportReasonViolence"),
+    0x2e59d922: ("types._root", "InputReportReasonPornography"),
+    0xadf44ee3: ("types._root", "InputReportReasonChildAbuse"),
+    0xc1e4a2b1: ("types._root", "InputReportReasonOther"),
+    0x9b89f93a: ("types._root", "InputReportReasonCopyright"),
+    0xdbd4feed: ("types._root", "InputReportReasonGeoIrrelevant"),
+    0xf5ddd6e7: ("types._root", "InputReportReasonFake"),
+    0xa8eb2be: ("types._root", "InputReportReasonIllegalDrugs"),
+    0x9ec7863d: ("types._root", "InputReportReasonPersonalDetails"),
+    0x99e78045: ("types._root", "UserFull"),
+    0x145ade0b: ("types._root", "Contact"),
+    0xc13e3c50: ("types._root", "ImportedContact"),
+    0x16d9703b: ("types._root", "ContactStatus"),
+    0xb74ba9d2: ("types.contacts", "ContactsNotModified"),
+    0xeae87e42: ("types.contacts", "Contacts"),
+    0x77d01c3b: ("types.contacts", "ImportedContacts"),
+    0xade1591: ("types.contacts", "Blocked"),
+    0xe1664194: ("types.contacts", "BlockedSlice"),
+    0x15ba6c40: ("types.messages", "Dialogs"),
+    0x71e094f3: ("types.messages", "DialogsSlice"),
+    0xf0e3e596: ("types.messages", "DialogsNotModified"),
+    0x8c718e87: ("types.messages", "Messages"),
+    0x3a54685e: ("types.messages", "MessagesSlice"),
+    0xc776ba4e: ("types.messages", "ChannelMessages"),
+    0x74535f21: ("types.messages", "MessagesNotModified"),
+    0x64ff9fd5: ("types.messages", "Chats"),
+    0x9cd81144: ("types.messages", "ChatsSlice"),
+    0xe5d7d19c: ("types.messages", "ChatFull"),
+    0xb45c69d1: ("types.messages", "AffectedHistory"),
+    0x57e2f66c: ("types._root", "InputMessagesFilterEmpty"),
+    0x9609a51c: ("types._root", "InputMessagesFilterPhotos"),
+    0x9fc00e65: ("types._root", "InputMessagesFilterVideo"),
+    0x56e9f0e4: ("types._root", "InputMessagesFilterPhotoVideo"),
+    0x9eddf188: ("types._root", "InputMessagesFilterDocument"),
+    0x7ef0dd87: ("types._root", "InputMessagesFilterUrl"),
+    0xffc86587: ("types._root", "InputMessagesFilterGif"),
+    0x50f5c392: ("types._root", "InputMessagesFilterVoice"),
+    0x3751b49e: ("types._root", "InputMessagesFilterMusic"),
+    0x3a20ecb8: ("types._root", "InputMessagesFilterChatPhotos"),
+    0x80c99768: ("types._root", "InputMessagesFilterPhoneCalls"),
+    0x7a7c17a4: ("types._root", "InputMessagesFilterRoundVoice"),
+    0xb549da53: ("types._root", "InputMessagesFilterRoundVideo"),
+    0xc1f8e69a: ("types._root", "InputMessagesFilterMyMentions"),
+    0xe7026d0d: ("types._root", "InputMessagesFilterGeo"),
+    0xe062db83: ("types._root", "InputMessagesFilterContacts"),
+    0x1bb00451: ("types._root", "InputMessagesFilterPinned"),
+    0x1f2b0afd: ("types._root", "UpdateNewMessage"),
+    0x4e90bfd6: ("types._root", "UpdateMessageID"),
+    0xa20db0e5: ("types._root", "UpdateDeleteMessages"),
+    0xc01e857f: ("types._root", "UpdateUserTyping"),
+    0x83487af0: ("types._root", "UpdateChatUserTyping"),
+    0x7761198: ("types._root", "UpdateChatParticipants"),
+    0xe5bdf8de: ("types._root", "UpdateUserStatus"),
+    0xa7848924: ("types._root", "UpdateUserName"),
+    0x8951abef: ("types._root", "UpdateNewAuthorization"),
+    0x12bcbd9a: ("types._root", "UpdateNewEncryptedMessage"),
+    0x1710f156: ("types._root", "UpdateEncryptedChatTyping"),
+    0xb4a2e88d: ("types._root", "UpdateEncryption"),
+    0x38fe25b7: ("types._root", "UpdateEncryptedMessagesRead"),
+    0x3dda5451: ("types._root", "UpdateChatParticipantAdd"),
+    0xe32f3d77: ("types._root", "UpdateChatParticipantDelete"),
+    0x8e5e9873: ("types._root", "UpdateDcOptions"),
+    0xbec268ef: ("types._root", "UpdateNotifySettings"),
+    0xebe46819: ("types._root", "UpdateServiceNotification"),
+    0xee3b272a: ("types._root", "UpdatePrivacy"),
+    0x5492a13: ("types._root", "UpdateUserPhone"),
+    0x9c974fdf: ("types._root", "UpdateReadHistoryInbox"),
+    0x2f2f21bf: ("types._root", "UpdateReadHistoryOutbox"),
+    0x7f891213: ("types._root", "UpdateWebPage"),
+    0xf8227181: ("types._root", "UpdateReadMessagesContents"),
+    0x108d941f: ("types._root", "UpdateChannelTooLong"),
+    0x635b4c09: ("types._root", "UpdateChannel"),
+    0x62ba04d9: ("types._root", "UpdateNewChannelMessage"),
+    0x922e6e10: ("types._root", "UpdateReadChannelInbox"),
+    0xc32d5b12: ("types._root", "UpdateDeleteChannelMessages"),
+    0xf226ac08: ("types._root", "UpdateChannelMessageViews"),
+    0xd7ca61a2: ("types._root", "UpdateChatParticipantAdmin"),
+    0x688a30aa: ("types._root", "UpdateNewStickerSet"),
+    0xbb2d201: ("types._root", "UpdateStickerSetsOrder"),
+    0x31c24808: ("types._root", "UpdateStickerSets"),
+    0x9375341e: ("types._root", "UpdateSavedGifs"),
+    0x496f379c: ("types._root", "UpdateBotInlineQuery"),
+    0x12f12a07: ("types._root", "UpdateBotInlineSend"),
+    0x1b3f4df7: ("types._root", "UpdateEditChannelMessage"),
+    0xb9cfc48d: ("types._root", "UpdateBotCallbackQuery"),
+    0xe40370a3: ("types._root", "UpdateEditMessage"),
+    0x691e9052: ("types._root", "UpdateInlineBotCallbackQuery"),
+    0xb75f99a9: ("types._root", "UpdateReadChannelOutbox"),
+    0x1b49ec6d: ("types._root", "UpdateDraftMessage"),
+    0x571d2742: ("types._root", "UpdateReadFeaturedStickers"),
+    0x9a422c20: ("types._root", "UpdateRecentStickers"),
+    0xa229dd06: ("types._root", "UpdateConfig"),
+    0x3354678f: ("types._root", "UpdatePtsChanged"),
+    0x2f2ba99f: ("types._root", "UpdateChannelWebPage"),
+    0x6e6fe51c: ("types._root", "UpdateDialogPinned"),
+    0xfa0f3ca2: ("types._root", "UpdatePinnedDialogs"),
+    0x8317c0c3: ("types._root", "UpdateBotWebhookJSON"),
+    0x9b9240a6: ("types._root", "UpdateBotWebhookJSONQuery"),
+    0xb5aefd7d: ("types._root", "UpdateBotShippingQuery"),
+    0x8caa9a96: ("types._root", "UpdateBotPrecheckoutQuery"),
+    0xab0f6b1e: ("types._root", "UpdatePhoneCall"),
+    0x46560264: ("types._root", "UpdateLangPackTooLong"),
+    0x56022f4d: ("types._root", "UpdateLangPack"),
+    0xe511996d: ("types._root", "UpdateFavedStickers"),
+    0xea29055d: ("types._root", "UpdateChannelReadMessagesContents"),
+    0x7084a7be: ("types._root", "UpdateContactsReset"),
+    0xb23fc698: ("types._root", "UpdateChannelAvailableMessages"),
+    0xe16459c3: ("types._root", "UpdateDialogUnreadMark"),
+    0xaca1657b: ("types._root", "UpdateMessagePoll"),
+    0x54c01850: ("types._root", "UpdateChatDefaultBannedRights"),
+    0x19360dc0: ("types._root", "UpdateFolderPeers"),
+    0x6a7e7366: ("types._root", "UpdatePeerSettings"),
+    0xb4afcfb0: ("types._root", "UpdatePeerLocated"),
+    0x39a51dfb: ("types._root", "UpdateNewScheduledMessage"),
+    0xf2a71983: ("types._root", "UpdateDeleteScheduledMessages"),
+    0x8216fba3: ("types._root", "UpdateTheme"),
+    0x871fb939: ("types._root", "UpdateGeoLiveViewed"),
+    0x564fe691: ("types._root", "UpdateLoginToken"),
+    0x24f40e77: ("types._root", "UpdateMessagePollVote"),
+    0x26ffde7d: ("types._root", "UpdateDialogFilter"),
+    0xa5d72105: ("types._root", "UpdateDialogFilterOrder"),
+    0x3504914f: ("types._root", "UpdateDialogFilters"),
+    0x2661bf09: ("types._root", "UpdatePhoneCallSignalingData"),
+    0xd29a27f4: ("types._root", "UpdateChannelMessageForwards"),
+    0xd6b19546: ("types._root", "UpdateReadChannelDiscussionInbox"),
+    0x695c9e7c: ("types._root", "UpdateReadChannelDiscussionOutbox"),
+    0xebe07752: ("types._root", "UpdatePeerBlocked"),
+    0x8c88c923: ("types._root", "UpdateChannelUserTyping"),
+    0xed85eab5: ("types._root", "UpdatePinnedMessages"),
+    0x5bb98608: ("types._root", "UpdatePinnedChannelMessages"),
+    0xf89a6a4e: ("types._root", "UpdateChat"),
+    0xf2ebdb4e: ("types._root", "UpdateGroupCallParticipants"),
+    0x97d64341: ("types._root", "UpdateGroupCall"),
+    0xbb9bb9a5: ("types._root", "UpdatePeerHistoryTTL"),
+    0xd087663a: ("types._root", "UpdateChatParticipant"),
+    0x985d3abb: ("types._root", "UpdateChannelParticipant"),
+    0xc4870a49: ("types._root", "UpdateBotStopped"),
+    0xb783982: ("types._root", "UpdateGroupCallConnection"),
+    0x4d712f2e: ("types._root", "UpdateBotCommands"),
+    0x7063c3db: ("types._root", "UpdatePendingJoinRequests"),
+    0x11dfa986: ("types._root", "UpdateBotChatInviteRequester"),
+    0x5e1b3cb8: ("types._root", "UpdateMessageReactions"),
+    0x17b7a20b: ("types._root", "UpdateAttachMenuBots"),
+    0x1592b79d: ("types._root", "UpdateWebViewResultSent"),
+    0x14b85813: ("types._root", "UpdateBotMenuButton"),
+    0x74d8be99: ("types._root", "UpdateSavedRingtones"),
+    0x84cd5a: ("types._root", "UpdateTranscribedAudio"),
+    0xfb4c496c: ("types._root", "UpdateReadFeaturedEmojiStickers"),
+    0x28373599: ("types._root", "UpdateUserEmojiStatus"),
+    0x30f443db: ("types._root", "UpdateRecentEmojiStatuses"),
+    0x6f7863f4: ("types._root", "UpdateRecentReactions"),
+    0x86fccf85: ("types._root", "UpdateMoveStickerSetToTop"),
+    0xd5a41724: ("types._root", "UpdateMessageExtendedMedia"),
+    0x192efbe3: ("types._root", "UpdateChannelPinnedTopic"),
+    0xfe198602: ("types._root", "UpdateChannelPinnedTopics"),
+    0x20529438: ("types._root", "UpdateUser"),
+    0xec05b097: ("types._root", "UpdateAutoSaveSettings"),
+    0x75b3b798: ("types._root", "UpdateStory"),
+    0xf74e932b: ("types._root", "UpdateReadStories"),
+    0x1bf335b9: ("types._root", "UpdateStoryID"),
+    0x2c084dc1: ("types._root", "UpdateStoriesStealthMode"),
+    0x7d627683: ("types._root", "UpdateSentStoryReaction"),
+    0x904dd49c: ("types._root", "UpdateBotChatBoost"),
+    0x7b68920: ("types._root", "UpdateChannelViewForumAsMessages"),
+    0xae3f101d: ("types._root", "UpdatePeerWallpaper"),
+    0xac21d3ce: ("types._root", "UpdateBotMessageReaction"),
+    0x9cb7759: ("types._root", "UpdateBotMessageReactions"),
+    0xaeaf9e74: ("types._root", "UpdateSavedDialogPinned"),
+    0x686c85a6: ("types._root", "UpdatePinnedSavedDialogs"),
+    0x39c67432: ("types._root", "UpdateSavedReactionTags"),
+    0xf16269d4: ("types._root", "UpdateSmsJob"),
+    0xf9470ab2: ("types._root", "UpdateQuickReplies"),
+    0xf53da717: ("types._root", "UpdateNewQuickReply"),
+    0x53e6f1ec: ("types._root", "UpdateDeleteQuickReply"),
+    0x3e050d0f: ("types._root", "UpdateQuickReplyMessage"),
+    0x566fe7cd: ("types._root", "UpdateDeleteQuickReplyMessages"),
+    0x8ae5c97a: ("types._root", "UpdateBotBusinessConnect"),
+    0x9ddb347c: ("types._root", "UpdateBotNewBusinessMessage"),
+    0x7df587c: ("types._root", "UpdateBotEditBusinessMessage"),
+    0xa02a982e: ("types._root", "UpdateBotDeleteBusinessMessage"),
+    0x1824e40b: ("types._root", "UpdateNewStoryReaction"),
+    0xdfd961f5: ("types._root", "UpdateBroadcastRevenueTransactions"),
+    0x4e80a379: ("types._root", "UpdateStarsBalance"),
+    0x1ea2fda7: ("types._root", "UpdateBusinessBotCallbackQuery"),
+    0xa584b019: ("types._root", "UpdateStarsRevenueStatus"),
+    0x283bd312: ("types._root", "UpdateBotPurchasedPaidMedia"),
+    0x8b725fce: ("types._root", "UpdatePaidReactionPrivacy"),
+    0x504aa18f: ("types._root", "UpdateSentPhoneCode"),
+    0xa56c2a3e: ("types.updates", "State"),
+    0x5d75a138: ("types.updates", "DifferenceEmpty"),
+    0xf49ca0: ("types.updates", "Difference"),
+    0xa8fb1981: ("types.updates", "DifferenceSlice"),
+    0x4afe8f6d: ("types.updates", "DifferenceTooLong"),
+    0xe317af7e: ("types._root", "UpdatesTooLong"),
+    0x313bc7f8: ("types._root", "UpdateShortMessage"),
+    0x4d6deea5: ("types._root", "UpdateShortChatMessage"),
+    0x78d4dec1: ("types._root", "UpdateShort"),
+    0x725b04c3: ("types._root", "UpdatesCombined"),
+    0x74ae4240: ("types._root", "Updates"),
+    0x9015e101: ("types._root", "UpdateShortSentMessage"),
+    0x8dca6aa5: ("types.photos", "Photos"),
+    0x15051f54: ("types.photos", "PhotosSlice"),
+    0x20212ca8: ("types.photos", "Photo"),
+    0x96a18d5: ("types.upload", "File"),
+    0xf18cda44: ("types.upload", "FileCdnRedirect"),
+    0x18b7a10d: ("types._root", "DcOption"),
+    0xcc1a241e: ("types._root", "Config"),
+    0x8e1a1775: ("types._root", "NearestDc"),
+    0xccbbce30: ("types.help", "AppUpdate"),
+    0xc45a6536: ("types.help", "NoAppUpdate"),
+    0x18cb9f78: ("types.help", "InviteText"),
+    0xab7ec0a0: ("types._root", "EncryptedChatEmpty"),
+    0x66b25953: ("types._root", "EncryptedChatWaiting"),
+    0x48f1d94c: ("types._root", "EncryptedChatRequested"),
+    0x61f0d4c7: ("types._root", "EncryptedChat"),
+    0x1e1c7c45: ("types._root", "EncryptedChatDiscarded"),
+    0xf141b5e1: ("types._root", "InputEncryptedChat"),
+    0xc21f497e: ("types._root", "EncryptedFileEmpty"),
+    0xa8008cd8: ("types._root", "EncryptedFile"),
+    0x1837c364: ("types._root", "InputEncryptedFileEmpty"),
+    0x64bd0306: ("types._root", "InputEncryptedFileUploaded"),
+    0x5a17b5e5: ("types._root", "InputEncryptedFile"),
+    0x2dc173c8: ("types._root", "InputEncryptedFileBigUploaded"),
+    0xed18c118: ("types._root", "EncryptedMessage"),
+    0x23734b06: ("types._root", "EncryptedMessageService"),
+    0xc0e24635: ("types.messages", "DhConfigNotModified"),
+    0x2c221edd: ("types.messages", "DhConfig"),
+    0x560f8935: ("types.messages", "SentEncryptedMessage"),
+    0x9493ff32: ("types.messages", "SentEncryptedFile"),
+    0x72f0eaae: ("types._root", "InputDocumentEmpty"),
+    0x1abfb575: ("types._root", "InputDocument"),
+    0x36f8c871: ("types._root", "DocumentEmpty"),
+    0x8fd4c4d8: ("types._root", "Document"),
+    0x17c6b5f6: ("types.help", "Support"),
+    0x9fd40bd8: ("types._root", "NotifyPeer"),
+    0xb4c83b4c: ("types._root", "NotifyUsers"),
+    0xc007cec3: ("types._root", "NotifyChats"),
+    0xd612e8ef: ("types._root", "NotifyBroadcasts"),
+    0x226e6308: ("types._root", "NotifyForumTopic"),
+    0x16bf744e: ("types._root", "SendMessageTypingAction"),
+    0xfd5ec8f5: ("types._root", "SendMessageCancelAction"),
+    0xa187d66f: ("types._root", "SendMessageRecordVideoAction"),
+    0xe9763aec: ("types._root", "SendMessageUploadVideoAction"),
+    0xd52f73f7: ("types._root", "SendMessageRecordAudioAction"),
+    0xf351d7ab: ("types._root", "SendMessageUploadAudioAction"),
+    0xd1d34a26: ("types._root", "SendMessageUploadPhotoAction"),
+    0xaa0cd9e4: ("types._root", "SendMessageUploadDocumentAction"),
+    0x176f8ba1: ("types._root", "SendMessageGeoLocationAction"),
+    0x628cbc6f: ("types._root", "SendMessageChooseContactAction"),
+    0xdd6a8f48: ("types._root", "SendMessageGamePlayAction"),
+    0x88f27fbc: ("types._root", "SendMessageRecordRoundAction"),
+    0x243e1c66: ("types._root", "SendMessageUploadRoundAction"),
+    0xd92c2285: ("types._root", "SpeakingInGroupCallAction"),
+    0xdbda9246: ("types._root", "SendMessageHistoryImportAction"),
+    0xb05ac6b1: ("types._root", "SendMessageChooseStickerAction"),
+    0x25972bcb: ("types._root", "SendMessageEmojiInteraction"),
+    0xb665902e: ("types._root", "SendMessageEmojiInteractionSeen"),
+    0xb3134d9d: ("types.contacts", "Found"),
+    0x4f96cb18: ("types._root", "InputPrivacyKeyStatusTimestamp"),
+    0xbdfb0426: ("types._root", "InputPrivacyKeyChatInvite"),
+    0xfabadc5f: ("types._root", "InputPrivacyKeyPhoneCall"),
+    0xdb9e70d2: ("types._root", "InputPrivacyKeyPhoneP2P"),
+    0xa4dd4c08: ("types._root", "InputPrivacyKeyForwards"),
+    0x5719bacc: ("types._root", "InputPrivacyKeyProfilePhoto"),
+    0x352dafa: ("types._root", "InputPrivacyKeyPhoneNumber"),
+    0xd1219bdd: ("types._root", "InputPrivacyKeyAddedByPhone"),
+    0xaee69d68: ("types._root", "InputPrivacyKeyVoiceMessages"),
+    0x3823cc40: ("types._root", "InputPrivacyKeyAbout"),
+    0xd65a11cc: ("types._root", "InputPrivacyKeyBirthday"),
+    0xe1732341: ("types._root", "InputPrivacyKeyStarGiftsAutoSave"),
+    0xbdc597b4: ("types._root", "InputPrivacyKeyNoPaidMessages"),
+    0xbc2eab30: ("types._root", "PrivacyKeyStatusTimestamp"),
+    0x500e6dfa: ("types._root", "PrivacyKeyChatInvite"),
+    0x3d662b7b: ("types._root", "PrivacyKeyPhoneCall"),
+    0x39491cc8: ("types._root", "PrivacyKeyPhoneP2P"),
+    0x69ec56a3: ("types._root", "PrivacyKeyForwards"),
+    0x96151fed: ("types._root", "PrivacyKeyProfilePhoto"),
+    0xd19ae46d: ("types._root", "PrivacyKeyPhoneNumber"),
+    0x42ffd42b: ("types._root", "PrivacyKeyAddedByPhone"),
+    0x697f414: ("types._root", "PrivacyKeyVoiceMessages"),
+    0xa486b761: ("types._root", "PrivacyKeyAbout"),
+    0x2000a518: ("types._root", "PrivacyKeyBirthday"),
+    0x2ca4fdf8: ("types._root", "PrivacyKeyStarGiftsAutoSave"),
+    0x17d348d2: ("types._root", "PrivacyKeyNoPaidMessages"),
+    0xd09e07b: ("types._root", "InputPrivacyValueAllowContacts"),
+    0x184b35ce: ("types._root", "InputPrivacyValueAllowAll"),
+    0x131cc67f: ("types._root", "InputPrivacyValueAllowUsers"),
+    0xba52007: ("types._root", "InputPrivacyValueDisallowContacts"),
+    0xd66b66c9: ("types._root", "InputPrivacyValueDisallowAll"),
+    0x90110467: ("types._root", "InputPrivacyValueDisallowUsers"),
+    0x840649cf: ("types._root", "InputPrivacyValueAllowChatParticipants"),
+    0xe94f0f86: ("types._root", "InputPrivacyValueDisallowChatParticipants"),
+    0x2f453e49: ("types._root", "InputPrivacyValueAllowCloseFriends"),
+    0x77cdc9f1: ("types._root", "InputPrivacyValueAllowPremium"),
+    0x5a4fcce5: ("types._root", "InputPrivacyValueAllowBots"),
+    0xc4e57915: ("types._root", "InputPrivacyValueDisallowBots"),
+    0xfffe1bac: ("types._root", "PrivacyValueAllowContacts"),
+    0x65427b82: ("types._root", "PrivacyValueAllowAll"),
+    0xb8905fb2: ("types._root", "PrivacyValueAllowUsers"),
+    0xf888fa1a: ("types._root", "PrivacyValueDisallowContacts"),
+    0x8b73e763: ("types._root", "PrivacyValueDisallowAll"),
+    0xe4621141: ("types._root", "PrivacyValueDisallowUsers"),
+    0x6b134e8e: ("types._root", "PrivacyValueAllowChatParticipants"),
+    0x41c87565: ("types._root", "PrivacyValueDisallowChatParticipants"),
+    0xf7e8d89b: ("types._root", "PrivacyValueAllowCloseFriends"),
+    0xece9814b: ("types._root", "PrivacyValueAllowPremium"),
+    0x21461b5d: ("types._root", "PrivacyValueAllowBots"),
+    0xf6a5f82f: ("types._root", "PrivacyValueDisallowBots"),
+    0x50a04e45: ("types.account", "PrivacyRules"),
+    0xb8d0afdf: ("types._root", "AccountDaysTTL"),
+    0x6c37c15c: ("types._root", "DocumentAttributeImageSize"),
+    0x11b58939: ("types._root", "DocumentAttributeAnimated"),
+    0x6319d612: ("types._root", "DocumentAttributeSticker"),
+    0x43c57c48: ("types._root", "DocumentAttributeVideo"),
+    0x9852f9c6: ("types._root", "DocumentAttributeAudio"),
+    0x15590068: ("types._root", "DocumentAttributeFilename"),
+    0x9801d2f7: ("types._root", "DocumentAttributeHasStickers"),
+    0xfd149899: ("types._root", "DocumentAttributeCustomEmoji"),
+    0xf1749a22: ("types.messages", "StickersNotModified"),
+    0x30a6ec7e: ("types.messages", "Stickers"),
+    0x12b299d4: ("types._root", "StickerPack"),
+    0xe86602c3: ("types.messages", "AllStickersNotModified"),
+    0xcdbbcebb: ("types.messages", "AllStickers"),
+    0x84d19185: ("types.messages", "AffectedMessages"),
+    0x211a1788: ("types._root", "WebPageEmpty"),
+    0xb0d13e47: ("types._root", "WebPagePending"),
+    0xe89c45b2: ("types._root", "WebPage"),
+    0x7311ca11: ("types._root", "WebPageNotModified"),
+    0xad01d61d: ("types._root", "Authorization"),
+    0x4bff8ea0: ("types.account", "Authorizations"),
+    0x957b50fb: ("types.account", "Password"),
+    0x9a5c33e5: ("types.account", "PasswordSettings"),
+    0xc23727c9: ("types.account", "PasswordInputSettings"),
+    0x137948a5: ("types.auth", "PasswordRecovery"),
+    0xa384b779: ("types._root", "ReceivedNotifyMessage"),
+    0xa22cbd96: ("types._root", "ChatInviteExported"),
+    0xed107ab7: ("types._root", "ChatInvitePublicJoinRequests"),
+    0x5a686d7c: ("types._root", "ChatInviteAlready"),
+    0x5c9d3702: ("types._root", "ChatInvite"),
+    0x61695cb0: ("types._root", "ChatInvitePeek"),
+    0xffb62b95: ("types._root", "InputStickerSetEmpty"),
+    0x9de7a269: ("types._root", "InputStickerSetID"),
+    0x861cc8a0: ("types._root", "InputStickerSetShortName"),
+    0x28703c8: ("types._root", "InputStickerSetAnimatedEmoji"),
+    0xe67f520e: ("types._root", "InputStickerSetDice"),
+    0xcde3739: ("types._root", "InputStickerSetAnimatedEmojiAnimations"),
+    0xc88b3b02: ("types._root", "InputStickerSetPremiumGifts"),
+    0x4c4d4ce: ("types._root", "InputStickerSetEmojiGenericAnimations"),
+    0x29d0f5ee: ("types._root", "InputStickerSetEmojiDefaultStatuses"),
+    0x44c1f8e9: ("types._root", "InputStickerSetEmojiDefaultTopicIcons"),
+    0x49748553: ("types._root", "InputStickerSetEmojiChannelDefaultStatuses"),
+    0x2dd14edc: ("types._root", "StickerSet"),
+    0x6e153f16: ("types.messages", "StickerSet"),
+    0xd3f924eb: ("types.messages", "StickerSetNotModified"),
+    0xc27ac8c7: ("types._root", "BotCommand"),
+    0x4d8a0299: ("types._root", "BotInfo"),
+    0xa2fa4880: ("types._root", "KeyboardButton"),
+    0x258aff05: ("types._root", "KeyboardButtonUrl"),
+    0x35bbdb6b: ("types._root", "KeyboardButtonCallback"),
+    0xb16a6c29: ("types._root", "KeyboardButtonRequestPhone"),
+    0xfc796b3f: ("types._root", "KeyboardButtonRequestGeoLocation"),
+    0x93b9fbb5: ("types._root", "KeyboardButtonSwitchInline"),
+    0x50f41ccf: ("types._root", "KeyboardButtonGame"),
+    0xafd93fbb: ("types._root", "KeyboardButtonBuy"),
+    0x10b78d29: ("types._root", "KeyboardButtonUrlAuth"),
+    0xd02e7fd4: ("types._root", "InputKeyboardButtonUrlAuth"),
+    0xbbc7515d: ("types._root", "KeyboardButtonRequestPoll"),
+    0xe988037b: ("types._root", "InputKeyboardButtonUserProfile"),
+    0x308660c1: ("types._root", "KeyboardButtonUserProfile"),
+    0x13767230: ("types._root", "KeyboardButtonWebView"),
+    0xa0c0505c: ("types._root", "KeyboardButtonSimpleWebView"),
+    0x53d7bfd8: ("types._root", "KeyboardButtonRequestPeer"),
+    0xc9662d05: ("types._root", "InputKeyboardButtonRequestPeer"),
+    0x75d2698e: ("types._root", "KeyboardButtonCopy"),
+    0x77608b83: ("types._root", "KeyboardButtonRow"),
+    0xa03e5b85: ("types._root", "ReplyKeyboardHide"),
+    0x86b40b08: ("types._root", "ReplyKeyboardForceReply"),
+    0x85dd99d1: ("types._root", "ReplyKeyboardMarkup"),
+    0x48a30254: ("types._root", "ReplyInlineMarkup"),
+    0xbb92ba95: ("types._root", "MessageEntityUnknown"),
+    0xfa04579d: ("types._root", "MessageEntityMention"),
+    0x6f635b0d: ("types._root", "MessageEntityHashtag"),
+    0x6cef8ac7: ("types._root", "MessageEntityBotCommand"),
+    0x6ed02538: ("types._root", "MessageEntityUrl"),
+    0x64e475c2: ("types._root", "MessageEntityEmail"),
+    0xbd610bc9: ("types._root", "MessageEntityBold"),
+    0x826f8b60: ("types._root", "MessageEntityItalic"),
+    0x28a20571: ("types._root", "MessageEntityCode"),
+    0x73924be0: ("types._root", "MessageEntityPre"),
+    0x76a6d327: ("types._root", "MessageEntityTextUrl"),
+    0xdc7b1140: ("types._root", "MessageEntityMentionName"),
+    0x208e68c9: ("types._root", "InputMessageEntityMentionName"),
+    0x9b69e34b: ("types._root", "MessageEntityPhone"),
+    0x4c4e743f: ("types._root", "MessageEntityCashtag"),
+    0x9c4e7e8b: ("types._root", "MessageEntityUnderline"),
+    0xbf0693d4: ("types._root", "MessageEntityStrike"),
+    0x761e6af4: ("types._root", "MessageEntityBankCard"),
+    0x32ca960f: ("types._root", "MessageEntitySpoiler"),
+    0xc8cf05f8: ("types._root", "MessageEntityCustomEmoji"),
+    0xf1ccaaac: ("types._root", "MessageEntityBlockquote"),
+    0xee8c1e86: ("types._root", "InputChannelEmpty"),
+    0xf35aec28: ("types._root", "InputChannel"),
+    0x5b934f9d: ("types._root", "InputChannelFromMessage"),
+    0x7f077ad9: ("types.contacts", "ResolvedPeer"),
+    0xae30253: ("types._root", "MessageRange"),
+    0x3e11affb: ("types.updates", "ChannelDifferenceEmpty"),
+    0xa4bcc6fe: ("types.updates", "ChannelDifferenceTooLong"),
+    0x2064674e: ("types.updates", "ChannelDifference"),
+    0x94d42ee7: ("types._root", "ChannelMessagesFilterEmpty"),
+    0xcd77d957: ("types._root", "ChannelMessagesFilter"),
+    0xcb397619: ("types._root", "ChannelParticipant"),
+    0x4f607bef: ("types._root", "ChannelParticipantSelf"),
+    0x2fe601d3: ("types._root", "ChannelParticipantCreator"),
+    0x34c3bb53: ("types._root", "ChannelParticipantAdmin"),
+    0x6df8014e: ("types._root", "ChannelParticipantBanned"),
+    0x1b03f006: ("types._root", "ChannelParticipantLeft"),
+    0xde3f3c79: ("types._root", "ChannelParticipantsRecent"),
+    0xb4608969: ("types._root", "ChannelParticipantsAdmins"),
+    0xa3b54985: ("types._root", "ChannelParticipantsKicked"),
+    0xb0d1865b: ("types._root", "ChannelParticipantsBots"),
+    0x1427a5e1: ("types._root", "ChannelParticipantsBanned"),
+    0x656ac4b: ("types._root", "ChannelParticipantsSearch"),
+    0xbb6ae88d: ("types._root", "ChannelParticipantsContacts"),
+    0xe04b5ceb: ("types._root", "ChannelParticipantsMentions"),
+    0x9ab0feaf: ("types.channels", "ChannelParticipants"),
+    0xf0173fe9: ("types.channels", "ChannelParticipantsNotModified"),
+    0xdfb80317: ("types.channels", "ChannelParticipant"),
+    0x780a0310: ("types.help", "TermsOfService"),
+    0xe8025ca2: ("types.messages", "SavedGifsNotModified"),
+    0x84a02a0d: ("types.messages", "SavedGifs"),
+    0x3380c786: ("types._root", "InputBotInlineMessageMediaAuto"),
+    0x3dcd7a87: ("types._root", "InputBotInlineMessageText"),
+    0x96929a85: ("types._root", "InputBotInlineMessageMediaGeo"),
+    0x417bbf11: ("types._root", "InputBotInlineMessageMediaVenue"),
+    0xa6edbffd: ("types._root", "InputBotInlineMessageMediaContact"),
+    0x4b425864: ("types._root", "InputBotInlineMessageGame"),
+    0xd7e78225: ("types._root", "InputBotInlineMessageMediaInvoice"),
+    0xbddcc510: ("types._root", "InputBotInlineMessageMediaWebPage"),
+    0x88bf9319: ("types._root", "InputBotInlineResult"),
+    0xa8d864a7: ("types._root", "InputBotInlineResultPhoto"),
+    0xfff8fdc4: ("types._root", "InputBotInlineResultDocument"),
+    0x4fa417f2: ("types._root", "InputBotInlineResultGame"),
+    0x764cf810: ("types._root", "BotInlineMessageMediaAuto"),
+    0x8c7f65e2: ("types._root", "BotInlineMessageText"),
+    0x51846fd: ("types._root", "BotInlineMessageMediaGeo"),
+    0x8a86659c: ("types._root", "BotInlineMessageMediaVenue"),
+    0x18d1cdc2: ("types._root", "BotInlineMessageMediaContact"),
+    0x354a9b09: ("types._root", "BotInlineMessageMediaInvoice"),
+    0x809ad9a6: ("types._root", "BotInlineMessageMediaWebPage"),
+    0x11965f3a: ("types._root", "BotInlineResult"),
+    0x17db940b: ("types._root", "BotInlineMediaResult"),
+    0xe021f2f6: ("types.messages", "BotResults"),
+    0x5dab1af4: ("types._root", "ExportedMessageLink"),
+    0x4e4df4bb: ("types._root", "MessageFwdHeader"),
+    0x72a3158c: ("types.auth", "CodeTypeSms"),
+    0x741cd3e3: ("types.auth", "CodeTypeCall"),
+    0x226ccefb: ("types.auth", "CodeTypeFlashCall"),
+    0xd61ad6ee: ("types.auth", "CodeTypeMissedCall"),
+    0x6ed998c: ("types.auth", "CodeTypeFragmentSms"),
+    0x3dbb5986: ("types.auth", "SentCodeTypeApp"),
+    0xc000bba2: ("types.auth", "SentCodeTypeSms"),
+    0x5353e5a7: ("types.auth", "SentCodeTypeCall"),
+    0xab03c6d9: ("types.auth", "SentCodeTypeFlashCall"),
+    0x82006484: ("types.auth", "SentCodeTypeMissedCall"),
+    0xf450f59b: ("types.auth", "SentCodeTypeEmailCode"),
+    0xa5491dea: ("types.auth", "SentCodeTypeSetUpEmailRequired"),
+    0xd9565c39: ("types.auth", "SentCodeTypeFragmentSms"),
+    0x9fd736: ("types.auth", "SentCodeTypeFirebaseSms"),
+    0xa416ac81: ("types.auth", "SentCodeTypeSmsWord"),
+    0xb37794af: ("types.auth", "SentCodeTypeSmsPhrase"),
+    0x36585ea4: ("types.messages", "BotCallbackAnswer"),
+    0x26b5dde6: ("types.messages", "MessageEditData"),
+    0x890c3d89: ("types._root", "InputBotInlineMessageID"),
+    0xb6d915d7: ("types._root", "InputBotInlineMessageID64"),
+    0x3c20629f: ("types._root", "InlineBotSwitchPM"),
+    0x3371c354: ("types.messages", "PeerDialogs"),
+    0xedcdc05b: ("types._root", "TopPeer"),
+    0xab661b5b: ("types._root", "TopPeerCategoryBotsPM"),
+    0x148677e2: ("types._root", "TopPeerCategoryBotsInline"),
+    0x637b7ed: ("types._root", "TopPeerCategoryCorrespondents"),
+    0xbd17a14a: ("types._root", "TopPeerCategoryGroups"),
+    0x161d9628: ("types._root", "TopPeerCategoryChannels"),
+    0x1e76a78c: ("types._root", "TopPeerCategoryPhoneCalls"),
+    0xa8406ca9: ("types._root", "TopPeerCategoryForwardUsers"),
+    0xfbeec0f0: ("types._root", "TopPeerCategoryForwardChats"),
+    0xfd9e7bec: ("types._root", "TopPeerCategoryBotsApp"),
+    0xfb834291: ("types._root", "TopPeerCategoryPeers"),
+    0xde266ef5: ("types.contacts", "TopPeersNotModified"),
+    0x70b772a8: ("types.contacts", "TopPeers"),
+    0xb52c939d: ("types.contacts", "TopPeersDisabled"),
+    0x1b0c841a: ("types._root", "DraftMessageEmpty"),
+    0x2d65321f: ("types._root", "DraftMessage"),
+    0xc6dc0c66: ("types.messages", "FeaturedStickersNotModified"),
+    0xbe382906: ("types.messages", "FeaturedStickers"),
+    0xb17f890: ("types.messages", "RecentStickersNotModified"),
+    0x88d37c56: ("types.messages", "RecentStickers"),
+    0x4fcba9c8: ("types.messages", "ArchivedStickers"),
+    0x38641628: ("types.messages", "StickerSetInstallResultSuccess"),
+    0x35e410a8: ("types.messages", "StickerSetInstallResultArchive"),
+    0x6410a5d2: ("types._root", "StickerSetCovered"),
+    0x3407e51b: ("types._root", "StickerSetMultiCovered"),
+    0x40d13c0e: ("types._root", "StickerSetFullCovered"),
+    0x77b15d1c: ("types._root", "StickerSetNoCovered"),
+    0xaed6dbb2: ("types._root", "MaskCoords"),
+    0x4a992157: ("types._root", "InputStickeredMediaPhoto"),
+    0x438865b: ("types._root", "InputStickeredMediaDocument"),
+    0xbdf9653b: ("types._root", "Game"),
+    0x32c3e77: ("types._root", "InputGameID"),
+    0xc331e80a: ("types._root", "InputGameShortName"),
+    0x73a379eb: ("types._root", "HighScore"),
+    0x9a3bfd99: ("types.messages", "HighScores"),
+    0xdc3d824f: ("types._root", "TextEmpty"),
+    0x744694e0: ("types._root", "TextPlain"),
+    0x6724abc4: ("types._root", "TextBold"),
+    0xd912a59c: ("types._root", "TextItalic"),
+    0xc12622c4: ("types._root", "TextUnderline"),
+    0x9bf8bb95: ("types._root", "TextStrike"),
+    0x6c3f19b9: ("types._root", "TextFixed"),
+    0x3c2884c1: ("types._root", "TextUrl"),
+    0xde5a0dd6: ("types._root", "TextEmail"),
+    0x7e6260d7: ("types._root", "TextConcat"),
+    0xed6a8504: ("types._root", "TextSubscript"),
+    0xc7fb5e01: ("types._root", "TextSuperscript"),
+    0x34b8621: ("types._root", "TextMarked"),
+    0x1ccb966a: ("types._root", "TextPhone"),
+    0x81ccf4f: ("types._root", "TextImage"),
+    0x35553762: ("types._root", "TextAnchor"),
+    0x13567e8a: ("types._root", "PageBlockUnsupported"),
+    0x70abc3fd: ("types._root", "PageBlockTitle"),
+    0x8ffa9a1f: ("types._root", "PageBlockSubtitle"),
+    0xbaafe5e0: ("types._root", "PageBlockAuthorDate"),
+    0xbfd064ec: ("types._root", "PageBlockHeader"),
+    0xf12bb6e1: ("types._root", "PageBlockSubheader"),
+    0x467a0766: ("types._root", "PageBlockParagraph"),
+    0xc070d93e: ("types._root", "PageBlockPreformatted"),
+    0x48870999: ("types._root", "PageBlockFooter"),
+    0xdb20b188: ("types._root", "PageBlockDivider"),
+    0xce0d37b0: ("types._root", "PageBlockAnchor"),
+    0xe4e88011: ("types._root", "PageBlockList"),
+    0x263d7c26: ("types._root", "PageBlockBlockquote"),
+    0x4f4456d3: ("types._root", "PageBlockPullquote"),
+    0x1759c560: ("types._root", "PageBlockPhoto"),
+    0x7c8fe7b6: ("types._root", "PageBlockVideo"),
+    0x39f23300: ("types._root", "PageBlockCover"),
+    0xa8718dc5: ("types._root", "PageBlockEmbed"),
+    0xf259a80b: ("types._root", "PageBlockEmbedPost"),
+    0x65a0fa4d: ("types._root", "PageBlockCollage"),
+    0x31f9590: ("types._root", "PageBlockSlideshow"),
+    0xef1751b5: ("types._root", "PageBlockChannel"),
+    0x804361ea: ("types._root", "PageBlockAudio"),
+    0x1e148390: ("types._root", "PageBlockKicker"),
+    0xbf4dea82: ("types._root", "PageBlockTable"),
+    0x9a8ae1e1: ("types._root", "PageBlockOrderedList"),
+    0x76768bed: ("types._root", "PageBlockDetails"),
+    0x16115a96: ("types._root", "PageBlockRelatedArticles"),
+    0xa44f3ef6: ("types._root", "PageBlockMap"),
+    0x85e42301: ("types._root", "PhoneCallDiscardReasonMissed"),
+    0xe095c1a0: ("types._root", "PhoneCallDiscardReasonDisconnect"),
+    0x57adc690: ("types._root", "PhoneCallDiscardReasonHangup"),
+    0xfaf7e8c9: ("types._root", "PhoneCallDiscardReasonBusy"),
+    0x7d748d04: ("types._root", "DataJSON"),
+    0xcb296bf8: ("types._root", "LabeledPrice"),
+    0x49ee584: ("types._root", "Invoice"),
+    0xea02c27e: ("types._root", "PaymentCharge"),
+    0x1e8caaeb: ("types._root", "PostAddress"),
+    0x909c3f94: ("types._root", "PaymentRequestedInfo"),
+    0xcdc27a1f: ("types._root", "PaymentSavedCredentialsCard"),
+    0x1c570ed1: ("types._root", "WebDocument"),
+    0xf9c8bcc6: ("types._root", "WebDocumentNoProxy"),
+    0x9bed434d: ("types._root", "InputWebDocument"),
+    0xc239d686: ("types._root", "InputWebFileLocation"),
+    0x9f2221c9: ("types._root", "InputWebFileGeoPointLocation"),
+    0xf46fe924: ("types._root", "InputWebFileAudioAlbumThumbLocation"),
+    0x21e753bc: ("types.upload", "WebFile"),
+    0xa0058751: ("types.payments", "PaymentForm"),
+    0x7bf6b15c: ("types.payments", "PaymentFormStars"),
+    0xb425cfe1: ("types.payments", "PaymentFormStarGift"),
+    0xd1451883: ("types.payments", "ValidatedRequestedInfo"),
+    0x4e5f810d: ("types.payments", "PaymentResult"),
+    0xd8411139: ("types.payments", "PaymentVerificationNeeded"),
+    0x70c4fe03: ("types.payments", "PaymentReceipt"),
+    0xdabbf83a: ("types.payments", "PaymentReceiptStars"),
+    0xfb8fe43c: ("types.payments", "SavedInfo"),
+    0xc10eb2cf: ("types._root", "InputPaymentCredentialsSaved"),
+    0x3417d728: ("types._root", "InputPaymentCredentials"),
+    0xaa1c39f: ("types._root", "InputPaymentCredentialsApplePay"),
+    0x8ac32801: ("types._root", "InputPaymentCredentialsGooglePay"),
+    0xdb64fd34: ("types.account", "TmpPassword"),
+    0xb6213cdf: ("types._root", "ShippingOption"),
+    0x32da9e9c: ("types._root", "InputStickerSetItem"),
+    0x1e36fded: ("types._root", "InputPhoneCall"),
+    0x5366c915: ("types._root", "PhoneCallEmpty"),
+    0xeed42858: ("types._root", "PhoneCallWaiting"),
+    0x45361c63: ("types._root", "PhoneCallRequested"),
+    0x22fd7181: ("types._root", "PhoneCallAccepted"),
+    0x3ba5940c: ("types._root", "PhoneCall"),
+    0xf9d25503: ("types._root", "PhoneCallDiscarded"),
+    0x9cc123c7: ("types._root", "PhoneConnection"),
+    0x635fe375: ("types._root", "PhoneConnectionWebrtc"),
+    0xfc878fc8: ("types._root", "PhoneCallProtocol"),
+    0xec82e140: ("types.phone", "PhoneCall"),
+    0xeea8e46e: ("types.upload", "CdnFileReuploadNeeded"),
+    0xa99fca4f: ("types.upload", "CdnFile"),
+    0xc982eaba: ("types._root", "CdnPublicKey"),
+    0x5725e40a: ("types._root", "CdnConfig"),
+    0xcad181f6: ("types._root", "LangPackString"),
+    0x6c47ac9f: ("types._root", "LangPackStringPluralized"),
+    0x2979eeb2: ("types._root", "LangPackStringDeleted"),
+    0xf385c1f6: ("types._root", "LangPackDifference"),
+    0xeeca5ce3: ("types._root", "LangPackLanguage"),
+    0xe6dfb825: ("types._root", "ChannelAdminLogEventActionChangeTitle"),
+    0x55188a2e: ("types._root", "ChannelAdminLogEventActionChangeAbout"),
+    0x6a4afc38: ("types._root", "ChannelAdminLogEventActionChangeUsername"),
+    0x434bd2af: ("types._root", "ChannelAdminLogEventActionChangePhoto"),
+    0x1b7907ae: ("types._root", "ChannelAdminLogEventActionToggleInvites"),
+    0x26ae0971: ("types._root", "ChannelAdminLogEventActionToggleSignatures"),
+    0xe9e82c18: ("types._root", "ChannelAdminLogEventActionUpdatePinned"),
+    0x709b2405: ("types._root", "ChannelAdminLogEventActionEditMessage"),
+    0x42e047bb: ("types._root", "ChannelAdminLogEventActionDeleteMessage"),
+    0x183040d3: ("types._root", "ChannelAdminLogEventActionParticipantJoin"),
+    0xf89777f2: ("types._root", "ChannelAdminLogEventActionParticipantLeave"),
+    0xe31c34d8: ("types._root", "ChannelAdminLogEventActionParticipantInvite"),
+    0xe6d83d7e: ("types._root", "ChannelAdminLogEventActionParticipantToggleBan"),
+    0xd5676710: ("types._root", "ChannelAdminLogEventActionParticipantToggleAdmin"),
+    0xb1c3caa7: ("types._root", "ChannelAdminLogEventActionChangeStickerSet"),
+    0x5f5c95f1: ("types._root", "ChannelAdminLogEventActionTogglePreHistoryHidden"),
+    0x2df5fc0a: ("types._root", "ChannelAdminLogEventActionDefaultBannedRights"),
+    0x8f079643: ("types._root", "ChannelAdminLogEventActionStopPoll"),
+    0x50c7ac8: ("types._root", "ChannelAdminLogEventActionChangeLinkedChat"),
+    0xe6b76ae: ("types._root", "ChannelAdminLogEventActionChangeLocation"),
+    0x53909779: ("types._root", "ChannelAdminLogEventActionToggleSlowMode"),
+    0x23209745: ("types._root", "ChannelAdminLogEventActionStartGroupCall"),
+    0xdb9f9140: ("types._root", "ChannelAdminLogEventActionDiscardGroupCall"),
+    0xf92424d2: ("types._root", "ChannelAdminLogEventActionParticipantMute"),
+    0xe64429c0: ("types._root", "ChannelAdminLogEventActionParticipantUnmute"),
+    0x56d6a247: ("types._root", "ChannelAdminLogEventActionToggleGroupCallSetting"),
+    0xfe9fc158: ("types._root", "ChannelAdminLogEventActionParticipantJoinByInvite"),
+    0x5a50fca4: ("types._root", "ChannelAdminLogEventActionExportedInviteDelete"),
+    0x410a134e: ("types._root", "ChannelAdminLogEventActionExportedInviteRevoke"),
+    0xe90ebb59: ("types._root", "ChannelAdminLogEventActionExportedInviteEdit"),
+    0x3e7f6847: ("types._root", "ChannelAdminLogEventActionParticipantVolume"),
+    0x6e941a38: ("types._root", "ChannelAdminLogEventActionChangeHistoryTTL"),
+    0xafb6144a: ("types._root", "ChannelAdminLogEventActionParticipantJoinByRequest"),
+    0xcb2ac766: ("types._root", "ChannelAdminLogEventActionToggleNoForwards"),
+    0x278f2868: ("types._root", "ChannelAdminLogEventActionSendMessage"),
+    0xbe4e0ef8: ("types._root", "ChannelAdminLogEventActionChangeAvailableReactions"),
+    0xf04fb3a9: ("types._root", "ChannelAdminLogEventActionChangeUsernames"),
+    0x2cc6383: ("types._root", "ChannelAdminLogEventActionToggleForum"),
+    0x58707d28: ("types._root", "ChannelAdminLogEventActionCreateTopic"),
+    0xf06fe208: ("types._root", "ChannelAdminLogEventActionEditTopic"),
+    0xae168909: ("types._root", "ChannelAdminLogEventActionDeleteTopic"),
+    0x5d8d353b: ("types._root", "ChannelAdminLogEventActionPinTopic"),
+    0x64f36dfc: ("types._root", "ChannelAdminLogEventActionToggleAntiSpam"),
+    0x5796e780: ("types._root", "ChannelAdminLogEventActionChangePeerColor"),
+    0x5e477b25: ("types._root", "ChannelAdminLogEventActionChangeProfilePeerColor"),
+    0x31bb5d52: ("types._root", "ChannelAdminLogEventActionChangeWallpaper"),
+    0x3ea9feb1: ("types._root", "ChannelAdminLogEventActionChangeEmojiStatus"),
+    0x46d840ab: ("types._root", "ChannelAdminLogEventActionChangeEmojiStickerSet"),
+    0x60a79c79: ("types._root", "ChannelAdminLogEventActionToggleSignatureProfiles"),
+    0x64642db3: ("types._root", "ChannelAdminLogEventActionParticipantSubExtend"),
+    0x1fad68cd: ("types._root", "ChannelAdminLogEvent"),
+    0xed8af74d: ("types.channels", "AdminLogResults"),
+    0xea107ae4: ("types._root", "ChannelAdminLogEventsFilter"),
+    0x5ce14175: ("types._root", "PopularContact"),
+    0x9e8fa6d3: ("types.messages", "FavedStickersNotModified"),
+    0x2cb51097: ("types.messages", "FavedStickers"),
+    0x46e1d13d: ("types._root", "RecentMeUrlUnknown"),
+    0xb92c09e2: ("types._root", "RecentMeUrlUser"),
+    0xb2da71d2: ("types._root", "RecentMeUrlChat"),
+    0xeb49081d: ("types._root", "RecentMeUrlChatInvite"),
+    0xbc0a57dc: ("types._root", "RecentMeUrlStickerSet"),
+    0xe0310d7: ("types.help", "RecentMeUrls"),
+    0x1cc6e91f: ("types._root", "InputSingleMedia"),
+    0xa6f8f452: ("types._root", "WebAuthorization"),
+    0xed56c9fc: ("types.account", "WebAuthorizations"),
+    0xa676a322: ("types._root", "InputMessageID"),
+    0xbad88395: ("types._root", "InputMessageReplyTo"),
+    0x86872538: ("types._root", "InputMessagePinned"),
+    0xacfa1a7e: ("types._root", "InputMessageCallbackQuery"),
+    0xfcaafeb7: ("types._root", "InputDialogPeer"),
+    0x64600527: ("types._root", "InputDialogPeerFolder"),
+    0xe56dbf05: ("types._root", "DialogPeer"),
+    0x514519e2: ("types._root", "DialogPeerFolder"),
+    0xd54b65d: ("types.messages", "FoundStickerSetsNotModified"),
+    0x8af09dd2: ("types.messages", "FoundStickerSets"),
+    0xf39b035c: ("types._root", "FileHash"),
+    0x75588b3f: ("types._root", "InputClientProxy"),
+    0xe3309f7f: ("types.help", "TermsOfServiceUpdateEmpty"),
+    0x28ecf961: ("types.help", "TermsOfServiceUpdate"),
+    0x3334b0f0: ("types._root", "InputSecureFileUploaded"),
+    0x5367e5be: ("types._root", "InputSecureFile"),
+    0x64199744: ("types._root", "SecureFileEmpty"),
+    0x7d09c27e: ("types._root", "SecureFile"),
+    0x8aeabec3: ("types._root", "SecureData"),
+    0x7d6099dd: ("types._root", "SecurePlainPhone"),
+    0x21ec5a5f: ("types._root", "SecurePlainEmail"),
+    0x9d2a81e3: ("types._root", "SecureValueTypePersonalDetails"),
+    0x3dac6a00: ("types._root", "SecureValueTypePassport"),
+    0x6e425c4: ("types._root", "SecureValueTypeDriverLicense"),
+    0xa0d0744b: ("types._root", "SecureValueTypeIdentityCard"),
+    0x99a48f23: ("types._root", "SecureValueTypeInternalPassport"),
+    0xcbe31e26: ("types._root", "SecureValueTypeAddress"),
+    0xfc36954e: ("types._root", "SecureValueTypeUtilityBill"),
+    0x89137c0d: ("types._root", "SecureValueTypeBankStatement"),
+    0x8b883488: ("types._root", "SecureValueTypeRentalAgreement"),
+    0x99e3806a: ("types._root", "SecureValueTypePassportRegistration"),
+    0xea02ec33: ("types._root", "SecureValueTypeTemporaryRegistration"),
+    0xb320aadb: ("types._root", "SecureValueTypePhone"),
+    0x8e3ca7ee: ("types._root", "SecureValueTypeEmail"),
+    0x187fa0ca: ("types._root", "SecureValue"),
+    0xdb21d0a7: ("types._root", "InputSecureValue"),
+    0xed1ecdb0: ("types._root", "SecureValueHash"),
+    0xe8a40bd9: ("types._root", "SecureValueErrorData"),
+    0xbe3dfa: ("types._root", "SecureValueErrorFrontSide"),
+    0x868a2aa5: ("types._root", "SecureValueErrorReverseSide"),
+    0xe537ced6: ("types._root", "SecureValueErrorSelfie"),
+    0x7a700873: ("types._root", "SecureValueErrorFile"),
+    0x666220e9: ("types._root", "SecureValueErrorFiles"),
+    0x869d758f: ("types._root", "SecureValueError"),
+    0xa1144770: ("types._root", "SecureValueErrorTranslationFile"),
+    0x34636dd8: ("types._root", "SecureValueErrorTranslationFiles"),
+    0x33f0ea47: ("types._root", "SecureCredentialsEncrypted"),
+    0xad2e1cd8: ("types.account", "AuthorizationForm"),
+    0x811f854f: ("types.account", "SentEmailCode"),
+    0x66afa166: ("types.help", "DeepLinkInfoEmpty"),
+    0x6a4ee832: ("types.help", "DeepLinkInfo"),
+    0x1142bd56: ("types._root", "SavedPhoneContact"),
+    0x4dba4501: ("types.account", "Takeout"),
+    0xd45ab096: ("types._root", "PasswordKdfAlgoUnknown"),
+    0x3a912d4a: ("types._root", "PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow"),
+    0x4a8537: ("types._root", "SecurePasswordKdfAlgoUnknown"),
+    0xbbf2dda0: ("types._root", "SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000"),
+    0x86471d92: ("types._root", "SecurePasswordKdfAlgoSHA512"),
+    0x1527bcac: ("types._root", "SecureSecretSettings"),
+    0x9880f658: ("types._root", "InputCheckPasswordEmpty"),
+    0xd27ff082: ("types._root", "InputCheckPasswordSRP"),
+    0x829d99da: ("types._root", "SecureRequiredType"),
+    0x27477b4: ("types._root", "SecureRequiredTypeOneOf"),
+    0xbfb9f457: ("types.help", "PassportConfigNotModified"),
+    0xa098d6af: ("types.help", "PassportConfig"),
+    0x1d1b1245: ("types._root", "InputAppEvent"),
+    0xc0de1bd9: ("types._root", "JsonObjectValue"),
+    0x3f6d7b68: ("types._root", "JsonNull"),
+    0xc7345e6a: ("types._root", "JsonBool"),
+    0x2be0dfa4: ("types._root", "JsonNumber"),
+    0xb71e767a: ("types._root", "JsonString"),
+    0xf7444763: ("types._root", "JsonArray"),
+    0x99c1d49d: ("types._root", "JsonObject"),
+    0x34566b6a: ("types._root", "PageTableCell"),
+    0xe0c0c5e5: ("types._root", "PageTableRow"),
+    0x6f747657: ("types._root", "PageCaption"),
+    0xb92fb6cd: ("types._root", "PageListItemText"),
+    0x25e073fc: ("types._root", "PageListItemBlocks"),
+    0x5e068047: ("types._root", "PageListOrderedItemText"),
+    0x98dd8936: ("types._root", "PageListOrderedItemBlocks"),
+    0xb390dc08: ("types._root", "PageRelatedArticle"),
+    0x98657f0d: ("types._root", "Page"),
+    0x8c05f1c9: ("types.help", "SupportName"),
+    0xf3ae2eed: ("types.help", "UserInfoEmpty"),
+    0x1eb3758: ("types.help", "UserInfo"),
+    0xff16e2ca: ("types._root", "PollAnswer"),
+    0x58747131: ("types._root", "Poll"),
+    0x3b6ddad2: ("types._root", "PollAnswerVoters"),
+    0x7adf2420: ("types._root", "PollResults"),
+    0xf041e250: ("types._root", "ChatOnlines"),
+    0x47a971e0: ("types._root", "StatsURL"),
+    0x5fb224d5: ("types._root", "ChatAdminRights"),
+    0x9f120418: ("types._root", "ChatBannedRights"),
+    0xe630b979: ("types._root", "InputWallPaper"),
+    0x72091c80: ("types._root", "InputWallPaperSlug"),
+    0x967a462e: ("types._root", "InputWallPaperNoFile"),
+    0x1c199183: ("types.account", "WallPapersNotModified"),
+    0xcdc3858c: ("types.account", "WallPapers"),
+    0xad253d78: ("types._root", "CodeSettings"),
+    0x372efcd0: ("types._root", "WallPaperSettings"),
+    0xbaa57628: ("types._root", "AutoDownloadSettings"),
+    0x63cacf26: ("types.account", "AutoDownloadSettings"),
+    0xd5b3b9f9: ("types._root", "EmojiKeyword"),
+    0x236df622: ("types._root", "EmojiKeywordDeleted"),
+    0x5cc761bd: ("types._root", "EmojiKeywordsDifference"),
+    0xa575739d: ("types._root", "EmojiURL"),
+    0xb3fb5361: ("types._root", "EmojiLanguage"),
+    0xff544e65: ("types._root", "Folder"),
+    0xfbd2c296: ("types._root", "InputFolderPeer"),
+    0xe9baa668: ("types._root", "FolderPeer"),
+    0xe844ebff: ("types.messages", "SearchCounter"),
+    0x92d33a0e: ("types._root", "UrlAuthResultRequest"),
+    0x8f8c0e4e: ("types._root", "UrlAuthResultAccepted"),
+    0xa9d6db1f: ("types._root", "UrlAuthResultDefault"),
+    0xbfb5ad8b: ("types._root", "ChannelLocationEmpty"),
+    0x209b82db: ("types._root", "ChannelLocation"),
+    0xca461b5d: ("types._root", "PeerLocated"),
+    0xf8ec284b: ("types._root", "PeerSelfLocated"),
+    0xd072acb4: ("types._root", "RestrictionReason"),
+    0x3c5693e9: ("types._root", "InputTheme"),
+    0xf5890df1: ("types._root", "InputThemeSlug"),
+    0xa00e67d6: ("types._root", "Theme"),
+    0xf41eb622: ("types.account", "ThemesNotModified"),
+    0x9a3d8c6d: ("types.account", "Themes"),
+    0x629f1980: ("types.auth", "LoginToken"),
+    0x68e9916: ("types.auth", "LoginTokenMigrateTo"),
+    0x390d5c5e: ("types.auth", "LoginTokenSuccess"),
+    0x57e28221: ("types.account", "ContentSettings"),
+    0xa927fec5: ("types.messages", "InactiveChats"),
+    0xc3a12462: ("types._root", "BaseThemeClassic"),
+    0xfbd81688: ("types._root", "BaseThemeDay"),
+    0xb7b31ea8: ("types._root", "BaseThemeNight"),
+    0x6d5f77ee: ("types._root", "BaseThemeTinted"),
+    0x5b11125a: ("types._root", "BaseThemeArctic"),
+    0x8fde504f: ("types._root", "InputThemeSettings"),
+    0xfa58b6d4: ("types._root", "ThemeSettings"),
+    0x54b56617: ("types._root", "WebPageAttributeTheme"),
+    0x2e94c3e7: ("types._root", "WebPageAttributeStory"),
+    0x50cc03d3: ("types._root", "WebPageAttributeStickerSet"),
+    0xcf6f6db8: ("types._root", "WebPageAttributeUniqueStarGift"),
+    0x4899484e: ("types.messages", "VotesList"),
+    0xf568028a: ("types._root", "BankCardOpenUrl"),
+    0x3e24e573: ("types.payments", "BankCardData"),
+    0xaa472651: ("types._root", "DialogFilter"),
+    0x363293ae: ("types._root", "DialogFilterDefault"),
+    0x96537bd7: ("types._root", "DialogFilterChatlist"),
+    0x77744d4a: ("types._root", "DialogFilterSuggested"),
+    0xb637edaf: ("types._root", "StatsDateRangeDays"),
+    0xcb43acde: ("types._root", "StatsAbsValueAndPrev"),
+    0xcbce2fe0: ("types._root", "StatsPercentValue"),
+    0x4a27eb2d: ("types._root", "StatsGraphAsync"),
+    0xbedc9822: ("types._root", "StatsGraphError"),
+    0x8ea464b6: ("types._root", "StatsGraph"),
+    0x396ca5fc: ("types.stats", "BroadcastStats"),
+    0x98f6ac75: ("types.help", "PromoDataEmpty"),
+    0x8c39793f: ("types.help", "PromoData"),
+    0xde33b094: ("types._root", "VideoSize"),
+    0xf85c413c: ("types._root", "VideoSizeEmojiMarkup"),
+    0xda082fe: ("types._root", "VideoSizeStickerMarkup"),
+    0x9d04af9b: ("types._root", "StatsGroupTopPoster"),
+    0xd7584c87: ("types._root", "StatsGroupTopAdmin"),
+    0x535f779d: ("types._root", "StatsGroupTopInviter"),
+    0xef7ff916: ("types.stats", "MegagroupStats"),
+    0xfe41b34f: ("types._root", "GlobalPrivacySettings"),
+    0x4203c5ef: ("types.help", "CountryCode"),
+    0xc3878e23: ("types.help", "Country"),
+    0x93cc1f32: ("types.help", "CountriesListNotModified"),
+    0x87d0759e: ("types.help", "CountriesList"),
+    0x455b853d: ("types._root", "MessageViews"),
+    0xb6c4f543: ("types.messages", "MessageViews"),
+    0xa6341782: ("types.messages", "DiscussionMessage"),
+    0xafbc09db: ("types._root", "MessageReplyHeader"),
+    0xe5af939: ("types._root", "MessageReplyStoryHeader"),
+    0x83d60fc2: ("types._root", "MessageReplies"),
+    0xe8fd8014: ("types._root", "PeerBlocked"),
+    0x7fe91c14: ("types.stats", "MessageStats"),
+    0x7780bcb4: ("types._root", "GroupCallDiscarded"),
+    0xcdf8d3e3: ("types._root", "GroupCall"),
+    0xd8aa840f: ("types._root", "InputGroupCall"),
+    0xeba636fe: ("types._root", "GroupCallParticipant"),
+    0x9e727aad: ("types.phone", "GroupCall"),
+    0xf47751b6: ("types.phone", "GroupParticipants"),
+    0x3081ed9d: ("types._root", "InlineQueryPeerTypeSameBotPM"),
+    0x833c0fac: ("types._root", "InlineQueryPeerTypePM"),
+    0xd766c50a: ("types._root", "InlineQueryPeerTypeChat"),
+    0x5ec4be43: ("types._root", "InlineQueryPeerTypeMegagroup"),
+    0x6334ee9a: ("types._root", "InlineQueryPeerTypeBroadcast"),
+    0xe3b2d0c: ("types._root", "InlineQueryPeerTypeBotPM"),
+    0x1662af0b: ("types.messages", "HistoryImport"),
+    0x5e0fb7b9: ("types.messages", "HistoryImportParsed"),
+    0xef8d3e6c: ("types.messages", "AffectedFoundMessages"),
+    0x8c5adfd9: ("types._root", "ChatInviteImporter"),
+    0xbdc62dcc: ("types.messages", "ExportedChatInvites"),
+    0x1871be50: ("types.messages", "ExportedChatInvite"),
+    0x222600ef: ("types.messages", "ExportedChatInviteReplaced"),
+    0x81b6b00a: ("types.messages", "ChatInviteImporters"),
+    0xf2ecef23: ("types._root", "ChatAdminWithInvites"),
+    0xb69b72d7: ("types.messages", "ChatAdminsWithInvites"),
+    0xa24de717: ("types.messages", "CheckedHistoryImportPeer"),
+    0xafe5623f: ("types.phone", "JoinAsPeers"),
+    0x204bd158: ("types.phone", "ExportedGroupCallInvite"),
+    0xdcb118b7: ("types._root", "GroupCallParticipantVideoSourceGroup"),
+    0x67753ac8: ("types._root", "GroupCallParticipantVideo"),
+    0x85fea03f: ("types.stickers", "SuggestedShortName"),
+    0x2f6cb2ab: ("types._root", "BotCommandScopeDefault"),
+    0x3c4f04d8: ("types._root", "BotCommandScopeUsers"),
+    0x6fe1a881: ("types._root", "BotCommandScopeChats"),
+    0xb9aa606a: ("types._root", "BotCommandScopeChatAdmins"),
+    0xdb9d897d: ("types._root", "BotCommandScopePeer"),
+    0x3fd863d1: ("types._root", "BotCommandScopePeerAdmins"),
+    0xa1321f3: ("types._root", "BotCommandScopePeerUser"),
+    0xe3779861: ("types.account", "ResetPasswordFailedWait"),
+    0xe9effc7d: ("types.account", "ResetPasswordRequestedWait"),
+    0xe926d63e: ("types.account", "ResetPasswordOk"),
+    0x4d93a990: ("types._root", "SponsoredMessage"),
+    0xc9ee1d87: ("types.messages", "SponsoredMessages"),
+    0x1839490f: ("types.messages", "SponsoredMessagesEmpty"),
+    0xc9b0539f: ("types._root", "SearchResultsCalendarPeriod"),
+    0x147ee23c: ("types.messages", "SearchResultsCalendar"),
+    0x7f648b67: ("types._root", "SearchResultPosition"),
+    0x53b22baf: ("types.messages", "SearchResultsPositions"),
+    0xf496b0c6: ("types.channels", "SendAsPeers"),
+    0x3b6d152e: ("types.users", "UserFull"),
+    0x6880b94d: ("types.messages", "PeerSettings"),
+    0xc3a2835f: ("types.auth", "LoggedOut"),
+    0xa3d1cb80: ("types._root", "ReactionCount"),
+    0xa339f0b: ("types._root", "MessageReactions"),
+    0x31bd492d: ("types.messages", "MessageReactionsList"),
+    0xc077ec01: ("types._root", "AvailableReaction"),
+    0x9f071957: ("types.messages", "AvailableReactionsNotModified"),
+    0x768e3aad: ("types.messages", "AvailableReactions"),
+    0x8c79b63c: ("types._root", "MessagePeerReaction"),
+    0x80eb48af: ("types._root", "GroupCallStreamChannel"),
+    0xd0e482b2: ("types.phone", "GroupCallStreamChannels"),
+    0x2dbf3432: ("types.phone", "GroupCallStreamRtmpUrl"),
+    0x4576f3f0: ("types._root", "AttachMenuBotIconColor"),
+    0xb2a7386b: ("types._root", "AttachMenuBotIcon"),
+    0xd90d8dfe: ("types._root", "AttachMenuBot"),
+    0xf1d88a5c: ("types._root", "AttachMenuBotsNotModified"),
+    0x3c4301c0: ("types._root", "AttachMenuBots"),
+    0x93bf667f: ("types._root", "AttachMenuBotsBot"),
+    0x4d22ff98: ("types._root", "WebViewResultUrl"),
+    0xc94511c: ("types._root", "WebViewMessageSent"),
+    0x7533a588: ("types._root", "BotMenuButtonDefault"),
+    0x4258c205: ("types._root", "BotMenuButtonCommands"),
+    0xc7b57ce6: ("types._root", "BotMenuButton"),
+    0xfbf6e8b1: ("types.account", "SavedRingtonesNotModified"),
+    0xc1e92cc5: ("types.account", "SavedRingtones"),
+    0x97e8bebe: ("types._root", "NotificationSoundDefault"),
+    0x6f0c34df: ("types._root", "NotificationSoundNone"),
+    0x830b9ae4: ("types._root", "NotificationSoundLocal"),
+    0xff6c8049: ("types._root", "NotificationSoundRingtone"),
+    0xb7263f6d: ("types.account", "SavedRingtone"),
+    0x1f307eb7: ("types.account", "SavedRingtoneConverted"),
+    0x7d6be90e: ("types._root", "AttachMenuPeerTypeSameBotPM"),
+    0xc32bfa1a: ("types._root", "AttachMenuPeerTypeBotPM"),
+    0xf146d31f: ("types._root", "AttachMenuPeerTypePM"),
+    0x509113f: ("types._root", "AttachMenuPeerTypeChat"),
+    0x7bfbdefc: ("types._root", "AttachMenuPeerTypeBroadcast"),
+    0xc5b56859: ("types._root", "InputInvoiceMessage"),
+    0xc326caef: ("types._root", "InputInvoiceSlug"),
+    0x98986c0d: ("types._root", "InputInvoicePremiumGiftCode"),
+    0x65f00ce3: ("types._root", "InputInvoiceStars"),
+    0x34e793f1: ("types._root", "InputInvoiceChatInviteSubscription"),
+    0xe8625e92: ("types._root", "InputInvoiceStarGift"),
+    0x4d818d5d: ("types._root", "InputInvoiceStarGiftUpgrade"),
+    0x4a5f5bd9: ("types._root", "InputInvoiceStarGiftTransfer"),
+    0xdabab2ef: ("types._root", "InputInvoicePremiumGiftStars"),
+    0xf4997e42: ("types._root", "InputInvoiceBusinessBotTransferStars"),
+    0xaed0cbd9: ("types.payments", "ExportedInvoice"),
+    0xcfb9d957: ("types.messages", "TranscribedAudio"),
+    0x5334759c: ("types.help", "PremiumPromo"),
+    0xa6751e66: ("types._root", "InputStorePaymentPremiumSubscription"),
+    0x616f7fe8: ("types._root", "InputStorePaymentGiftPremium"),
+    0xfb790393: ("types._root", "InputStorePaymentPremiumGiftCode"),
+    0x160544ca: ("types._root", "InputStorePaymentPremiumGiveaway"),
+    0xdddd0f56: ("types._root", "InputStorePaymentStarsTopup"),
+    0x1d741ef7: ("types._root", "InputStorePaymentStarsGift"),
+    0x751f08fa: ("types._root", "InputStorePaymentStarsGiveaway"),
+    0x9bb2636d: ("types._root", "InputStorePaymentAuthCode"),
+    0x88f8f21b: ("types._root", "PaymentFormMethod"),
+    0x2de11aae: ("types._root", "EmojiStatusEmpty"),
+    0xe7ff068a: ("types._root", "EmojiStatus"),
+    0x7184603b: ("types._root", "EmojiStatusCollectible"),
+    0x7141dbf: ("types._root", "InputEmojiStatusCollectible"),
+    0xd08ce645: ("types.account", "EmojiStatusesNotModified"),
+    0x90c467d1: ("types.account", "EmojiStatuses"),
+    0x79f5d419: ("types._root", "ReactionEmpty"),
+    0x1b2286b8: ("types._root", "ReactionEmoji"),
+    0x8935fc73: ("types._root", "ReactionCustomEmoji"),
+    0x523da4eb: ("types._root", "ReactionPaid"),
+    0xeafc32bc: ("types._root", "ChatReactionsNone"),
+    0x52928bca: ("types._root", "ChatReactionsAll"),
+    0x661d4037: ("types._root", "ChatReactionsSome"),
+    0xb06fdbdf: ("types.messages", "ReactionsNotModified"),
+    0xeafdf716: ("types.messages", "Reactions"),
+    0x4345be73: ("types._root", "EmailVerifyPurposeLoginSetup"),
+    0x527d22eb: ("types._root", "EmailVerifyPurposeLoginChange"),
+    0xbbf51685: ("types._root", "EmailVerifyPurposePassport"),
+    0x922e55a9: ("types._root", "EmailVerificationCode"),
+    0xdb909ec2: ("types._root", "EmailVerificationGoogle"),
+    0x96d074fd: ("types._root", "EmailVerificationApple"),
+    0x2b96cd1b: ("types.account", "EmailVerified"),
+    0xe1bb0d61: ("types.account", "EmailVerifiedLogin"),
+    0x5f2d1df2: ("types._root", "PremiumSubscriptionOption"),
+    0xb81c7034: ("types._root", "SendAsPeer"),
+    0xad628cc8: ("types._root", "MessageExtendedMediaPreview"),
+    0xee479c64: ("types._root", "MessageExtendedMedia"),
+    0xfcfeb29c: ("types._root", "StickerKeyword"),
+    0xb4073647: ("types._root", "Username"),
+    0x23f109b: ("types._root", "ForumTopicDeleted"),
+    0x71701da9: ("types._root", "ForumTopic"),
+    0x367617d3: ("types.messages", "ForumTopics"),
+    0x43b46b20: ("types._root", "DefaultHistoryTTL"),
+    0x41bf109b: ("types._root", "ExportedContactToken"),
+    0x5f3b8a00: ("types._root", "RequestPeerTypeUser"),
+    0xc9f06e1b: ("types._root", "RequestPeerTypeChat"),
+    0x339bef6c: ("types._root", "RequestPeerTypeBroadcast"),
+    0x481eadfa: ("types._root", "EmojiListNotModified"),
+    0x7a1e11d1: ("types._root", "EmojiList"),
+    0x7a9abda9: ("types._root", "EmojiGroup"),
+    0x80d26cc7: ("types._root", "EmojiGroupGreeting"),
+    0x93bcf34: ("types._root", "EmojiGroupPremium"),
+    0x6fb4ad87: ("types.messages", "EmojiGroupsNotModified"),
+    0x881fb94b: ("types.messages", "EmojiGroups"),
+    0x751f3146: ("types._root", "TextWithEntities"),
+    0x33db32f8: ("types.messages", "TranslateResult"),
+    0xc84834ce: ("types._root", "AutoSaveSettings"),
+    0x81602d47: ("types._root", "AutoSaveException"),
+    0x4c3e069d: ("types.account", "AutoSaveSettings"),
+    0x7cde641d: ("types.help", "AppConfigNotModified"),
+    0xdd18782e: ("types.help", "AppConfig"),
+    0xa920bd7a: ("types._root", "InputBotAppID"),
+    0x908c0407: ("types._root", "InputBotAppShortName"),
+    0x5da674b7: ("types._root", "BotAppNotModified"),
+    0x95fcd1d6: ("types._root", "BotApp"),
+    0xeb50adf5: ("types.messages", "BotApp"),
+    0xb57295d5: ("types._root", "InlineBotWebView"),
+    0x4a4ff172: ("types._root", "ReadParticipantDate"),
+    0xf3e0da33: ("types._root", "InputChatlistDialogFilter"),
+    0xc5181ac: ("types._root", "ExportedChatlistInvite"),
+    0x10e6e3a6: ("types.chatlists", "ExportedChatlistInvite"),
+    0x10ab6dc7: ("types.chatlists", "ExportedInvites"),
+    0xfa87f659: ("types.chatlists", "ChatlistInviteAlready"),
+    0xf10ece2f: ("types.chatlists", "ChatlistInvite"),
+    0x93bd878d: ("types.chatlists", "ChatlistUpdates"),
+    0xe8a775b0: ("types.bots", "BotInfo"),
+    0xb6cc2d5c: ("types._root", "MessagePeerVote"),
+    0x74cda504: ("types._root", "MessagePeerVoteInputOption"),
+    0x4628f6e6: ("types._root", "MessagePeerVoteMultiple"),
+    0x8d595cd6: ("types._root", "StoryViews"),
+    0x51e6ee4f: ("types._root", "StoryItemDeleted"),
+    0xffadc913: ("types._root", "StoryItemSkipped"),
+    0x79b26a24: ("types._root", "StoryItem"),
+    0x1158fe3e: ("types.stories", "AllStoriesNotModified"),
+    0x6efc5e81: ("types.stories", "AllStories"),
+    0x63c3dd0a: ("types.stories", "Stories"),
+    0xb0bdeac5: ("types._root", "StoryView"),
+    0x9083670b: ("types._root", "StoryViewPublicForward"),
+    0xbd74cf49: ("types._root", "StoryViewPublicRepost"),
+    0x59d78fc5: ("types.stories", "StoryViewsList"),
+    0xde9eed1d: ("types.stories", "StoryViews"),
+    0x22c0f6d5: ("types._root", "InputReplyToMessage"),
+    0x5881323a: ("types._root", "InputReplyToStory"),
+    0x3fc9053b: ("types._root", "ExportedStoryLink"),
+    0x712e27fd: ("types._root", "StoriesStealthMode"),
+    0xcfc9e002: ("types._root", "MediaAreaCoordinates"),
+    0xbe82db9c: ("types._root", "MediaAreaVenue"),
+    0xb282217f: ("types._root", "InputMediaAreaVenue"),
+    0xcad5452d: ("types._root", "MediaAreaGeoPoint"),
+    0x14455871: ("types._root", "MediaAreaSuggestedReaction"),
+    0x770416af: ("types._root", "MediaAreaChannelPost"),
+    0x2271f2bf: ("types._root", "InputMediaAreaChannelPost"),
+    0x37381085: ("types._root", "MediaAreaUrl"),
+    0x49a6549c: ("types._root", "MediaAreaWeather"),
+    0x5787686d: ("types._root", "MediaAreaStarGift"),
+    0x9a35e999: ("types._root", "PeerStories"),
+    0xcae68768: ("types.stories", "PeerStories"),
+    0xfd5e12bd: ("types.messages", "WebPage"),
+    0x257e962b: ("types._root", "PremiumGiftCodeOption"),
+    0x284a1096: ("types.payments", "CheckedGiftCode"),
+    0x4367daa0: ("types.payments", "GiveawayInfo"),
+    0xe175e66f: ("types.payments", "GiveawayInfoResults"),
+    0xb2539d54: ("types._root", "PrepaidGiveaway"),
+    0x9a9d77e0: ("types._root", "PrepaidStarsGiveaway"),
+    0x4b3e14d6: ("types._root", "Boost"),
+    0x86f8613c: ("types.premium", "BoostsList"),
+    0xc448415c: ("types._root", "MyBoost"),
+    0x9ae228e2: ("types.premium", "MyBoosts"),
+    0x4959427a: ("types.premium", "BoostsStatus"),
+    0xb826e150: ("types._root", "StoryFwdHeader"),
+    0xe7058e7f: ("types._root", "PostInteractionCountersMessage"),
+    0x8a480e27: ("types._root", "PostInteractionCountersStory"),
+    0x50cd067c: ("types.stats", "StoryStats"),
+    0x1f2bf4a: ("types._root", "PublicForwardMessage"),
+    0xedf3add0: ("types._root", "PublicForwardStory"),
+    0x93037e20: ("types.stats", "PublicForwards"),
+    0xb54b5acf: ("types._root", "PeerColor"),
+    0x26219a58: ("types.help", "PeerColorSet"),
+    0x767d61eb: ("types.help", "PeerColorProfileSet"),
+    0xadec6ebe: ("types.help", "PeerColorOption"),
+    0x2ba1f5ce: ("types.help", "PeerColorsNotModified"),
+    0xf8ed08: ("types.help", "PeerColors"),
+    0x6090d6d5: ("types._root", "StoryReaction"),
+    0xbbab2643: ("types._root", "StoryReactionPublicForward"),
+    0xcfcd0f13: ("types._root", "StoryReactionPublicRepost"),
+    0xaa5f789c: ("types.stories", "StoryReactionsList"),
+    0xbd87cb6c: ("types._root", "SavedDialog"),
+    0xf83ae221: ("types.messages", "SavedDialogs"),
+    0x44ba9dd9: ("types.messages", "SavedDialogsSlice"),
+    0xc01f6fe8: ("types.messages", "SavedDialogsNotModified"),
+    0xcb6ff828: ("types._root", "SavedReactionTag"),
+    0x889b59ef: ("types.messages", "SavedReactionTagsNotModified"),
+    0x3259950a: ("types.messages", "SavedReactionTags"),
+    0x3bb842ac: ("types._root", "OutboxReadDate"),
+    0xdc8b44cf: ("types.smsjobs", "EligibleToJoin"),
+    0x2aee9191: ("types.smsjobs", "Status"),
+    0xe6a1eeb8: ("types._root", "SmsJob"),
+    0x120b1ab9: ("types._root", "BusinessWeeklyOpen"),
+    0x8c92b098: ("types._root", "BusinessWorkHours"),
+    0xac5c1af7: ("types._root", "BusinessLocation"),
+    0x6f8b32aa: ("types._root", "InputBusinessRecipients"),
+    0x21108ff7: ("types._root", "BusinessRecipients"),
+    0xc9b9e2b9: ("types._root", "BusinessAwayMessageScheduleAlways"),
+    0xc3f2f501: ("types._root", "BusinessAwayMessageScheduleOutsideWorkHours"),
+    0xcc4d9ecc: ("types._root", "BusinessAwayMessageScheduleCustom"),
+    0x194cb3b: ("types._root", "InputBusinessGreetingMessage"),
+    0xe519abab: ("types._root", "BusinessGreetingMessage"),
+    0x832175e0: ("types._root", "InputBusinessAwayMessage"),
+    0xef156a5c: ("types._root", "BusinessAwayMessage"),
+    0xff9289f5: ("types._root", "Timezone"),
+    0x970708cc: ("types.help", "TimezonesListNotModified"),
+    0x7b74ed71: ("types.help", "TimezonesList"),
+    0x697102b: ("types._root", "QuickReply"),
+    0x24596d41: ("types._root", "InputQuickReplyShortcut"),
+    0x1190cf1: ("types._root", "InputQuickReplyShortcutId"),
+    0xc68d6695: ("types.messages", "QuickReplies"),
+    0x5f91eb5b: ("types.messages", "QuickRepliesNotModified"),
+    0xcd64636c: ("types._root", "ConnectedBot"),
+    0x17d7f87b: ("types.account", "ConnectedBots"),
+    0x2ad93719: ("types.messages", "DialogFilters"),
+    0x6c8e1e06: ("types._root", "Birthday"),
+    0x8f34b2f5: ("types._root", "BotBusinessConnection"),
+    0x9c469cd: ("types._root", "InputBusinessIntro"),
+    0x5a0a066d: ("types._root", "BusinessIntro"),
+    0xfaff629d: ("types.messages", "MyStickers"),
+    0xe39460a9: ("types._root", "InputCollectibleUsername"),
+    0xa2e214a4: ("types._root", "InputCollectiblePhone"),
+    0x6ebdff91: ("types.fragment", "CollectibleInfo"),
+    0xc4e5921e: ("types._root", "InputBusinessBotRecipients"),
+    0xb88cf373: ("types._root", "BusinessBotRecipients"),
+    0x1d998733: ("types._root", "ContactBirthday"),
+    0x114ff30d: ("types.contacts", "ContactBirthdays"),
+    0x628c9224: ("types._root", "MissingInvitee"),
+    0x7f5defa6: ("types.messages", "InvitedUsers"),
+    0x11679fa7: ("types._root", "InputBusinessChatLink"),
+    0xb4ae666f: ("types._root", "BusinessChatLink"),
+    0xec43a2d1: ("types.account", "BusinessChatLinks"),
+    0x9a23af21: ("types.account", "ResolvedBusinessChatLinks"),
+    0xd62ff46a: ("types._root", "RequestedPeerUser"),
+    0x7307544f: ("types._root", "RequestedPeerChat"),
+    0x8ba403e4: ("types._root", "RequestedPeerChannel"),
+    0x430d3150: ("types._root", "SponsoredMessageReportOption"),
+    0x846f9e42: ("types.channels", "SponsoredMessageReportResultChooseOption"),
+    0x3e3bcf2f: ("types.channels", "SponsoredMessageReportResultAdsHidden"),
+    0xad798849: ("types.channels", "SponsoredMessageReportResultReported"),
+    0x5407e297: ("types.stats", "BroadcastRevenueStats"),
+    0xec659737: ("types.stats", "BroadcastRevenueWithdrawalUrl"),
+    0x557e2cc4: ("types._root", "BroadcastRevenueTransactionProceeds"),
+    0x5a590978: ("types._root", "BroadcastRevenueTransactionWithdrawal"),
+    0x42d30d2e: ("types._root", "BroadcastRevenueTransactionRefund"),
+    0x87158466: ("types.stats", "BroadcastRevenueTransactions"),
+    0xbac3a61a: ("types._root", "ReactionNotificationsFromContacts"),
+    0x4b9e22a0: ("types._root", "ReactionNotificationsFromAll"),
+    0x56e34970: ("types._root", "ReactionsNotifySettings"),
+    0xc3ff71e7: ("types._root", "BroadcastRevenueBalances"),
+    0x93c3e27e: ("types._root", "AvailableEffect"),
+    0xd1ed9a5b: ("types.messages", "AvailableEffectsNotModified"),
+    0xbddb616e: ("types.messages", "AvailableEffects"),
+    0xb89bfccf: ("types._root", "FactCheck"),
+    0x95f2bfe4: ("types._root", "StarsTransactionPeerUnsupported"),
+    0xb457b375: ("types._root", "StarsTransactionPeerAppStore"),
+    0x7b560a0b: ("types._root", "StarsTransactionPeerPlayMarket"),
+    0x250dbaf8: ("types._root", "StarsTransactionPeerPremiumBot"),
+    0xe92fd902: ("types._root", "StarsTransactionPeerFragment"),
+    0xd80da15d: ("types._root", "StarsTransactionPeer"),
+    0x60682812: ("types._root", "StarsTransactionPeerAds"),
+    0xf9677aad: ("types._root", "StarsTransactionPeerAPI"),
+    0xbd915c0: ("types._root", "StarsTopupOption"),
+    0xa39fd94a: ("types._root", "StarsTransaction"),
+    0x6c9ce8ed: ("types.payments", "StarsStatus"),
+    0xe87acbc0: ("types._root", "FoundStory"),
+    0xe2de7737: ("types.stories", "FoundStories"),
+    0xde4c5d93: ("types._root", "GeoPointAddress"),
+    0xfebe5491: ("types._root", "StarsRevenueStatus"),
+    0xc92bb73b: ("types.payments", "StarsRevenueStats"),
+    0x1dab80b7: ("types.payments", "StarsRevenueWithdrawalUrl"),
+    0x394e7f21: ("types.payments", "StarsRevenueAdsAccountUrl"),
+    0x206ae6d1: ("types._root", "InputStarsTransaction"),
+    0x5e0589f1: ("types._root", "StarsGiftOption"),
+    0x1991b13b: ("types.bots", "PopularAppBots"),
+    0x23e91ba3: ("types._root", "BotPreviewMedia"),
+    0xca71d64: ("types.bots", "PreviewInfo"),
+    0x5416d58: ("types._root", "StarsSubscriptionPricing"),
+    0x2e6eab1a: ("types._root", "StarsSubscription"),
+    0x4ba3a95a: ("types._root", "MessageReactor"),
+    0x94ce852a: ("types._root", "StarsGiveawayOption"),
+    0x54236209: ("types._root", "StarsGiveawayWinnersOption"),
+    0x2cc73c8: ("types._root", "StarGift"),
+    0x5c62d151: ("types._root", "StarGiftUnique"),
+    0xa388a368: ("types.payments", "StarGiftsNotModified"),
+    0x901689ea: ("types.payments", "StarGifts"),
+    0x7903e3d9: ("types._root", "MessageReportOption"),
+    0xf0e4e0b6: ("types._root", "ReportResultChooseOption"),
+    0x6f09ac31: ("types._root", "ReportResultAddComment"),
+    0x8db33c4b: ("types._root", "ReportResultReported"),
+    0x8ecf0511: ("types.messages", "BotPreparedInlineMessage"),
+    0xff57708d: ("types.messages", "PreparedInlineMessage"),
+    0xc99b1950: ("types._root", "BotAppSettings"),
+    0xdd0c66f2: ("types._root", "StarRefProgram"),
+    0x19a13f71: ("types._root", "ConnectedBotStarRef"),
+    0x98d5ea1d: ("types.payments", "ConnectedStarRefBots"),
+    0xb4d5d859: ("types.payments", "SuggestedStarRefBots"),
+    0xbbb6b4a3: ("types._root", "StarsAmount"),
+    0x6010c534: ("types.messages", "FoundStickersNotModified"),
+    0x82c9e290: ("types.messages", "FoundStickers"),
+    0xb0cd6617: ("types._root", "BotVerifierSettings"),
+    0xf93cd45c: ("types._root", "BotVerification"),
+    0x39d99013: ("types._root", "StarGiftAttributeModel"),
+    0x13acff19: ("types._root", "StarGiftAttributePattern"),
+    0x94271762: ("types._root", "StarGiftAttributeBackdrop"),
+    0xe0bff26c: ("types._root", "StarGiftAttributeOriginalDetails"),
+    0x167bd90b: ("types.payments", "StarGiftUpgradePreview"),
+    0x62d706b8: ("types.users", "Users"),
+    0x315a4974: ("types.users", "UsersSlice"),
+    0xcaa2f60b: ("types.payments", "UniqueStarGift"),
+    0xb53e8b21: ("types.messages", "WebPagePreview"),
+    0x6056dba5: ("types._root", "SavedStarGift"),
+    0x95f389b1: ("types.payments", "SavedStarGifts"),
+    0x69279795: ("types._root", "InputSavedStarGiftUser"),
+    0xf101aa7f: ("types._root", "InputSavedStarGiftChat"),
+    0x84aa3a9c: ("types.payments", "StarGiftWithdrawalUrl"),
+    0x206ad49e: ("types._root", "PaidReactionPrivacyDefault"),
+    0x1f0c1ad9: ("types._root", "PaidReactionPrivacyAnonymous"),
+    0xdc6cfcf0: ("types._root", "PaidReactionPrivacyPeer"),
+    0x1e109708: ("types.account", "PaidMessagesRevenue"),
+    0x50a9839: ("types._root", "RequirementToContactEmpty"),
+    0xe581e4e9: ("types._root", "RequirementToContactPremium"),
+    0xb4f67e93: ("types._root", "RequirementToContactPaidMessages"),
+    0xa0624cf7: ("types._root", "BusinessBotRights"),
+    0x71f276c4: ("types._root", "DisallowedGiftsSettings"),
+    0xc69708d3: ("types._root", "SponsoredPeer"),
+    0xea32b4b1: ("types.contacts", "SponsoredPeersEmpty"),
+    0xeb032884: ("types.contacts", "SponsoredPeers"),
+    0xcb9f372d: ("functions._root", "InvokeAfterMsg"),
+    0x3dc4b4f0: ("functions._root", "InvokeAfterMsgs"),
+    0xc1cd5ea9: ("functions._root", "InitConnection"),
+    0xda9b0d0d: ("functions._root", "InvokeWithLayer"),
+    0xbf9459b7: ("functions._root", "InvokeWithoutUpdates"),
+    0x365275f2: ("functions._root", "InvokeWithMessagesRange"),
+    0xaca9fd2e: ("functions._root", "InvokeWithTakeout"),
+    0xdd289f8e: ("functions._root", "InvokeWithBusinessConnection"),
+    0x1df92984: ("functions._root", "InvokeWithGooglePlayIntegrity"),
+    0x0dae54f8: ("functions._root", "InvokeWithApnsSecret"),
+    0xadbb0f94: ("functions._root", "InvokeWithReCaptcha"),
+    0xa677244f: ("functions.auth", "SendCode"),
+    0xaac7b717: ("functions.auth", "SignUp"),
+    0x8d52a951: ("functions.auth", "SignIn"),
+    0x3e72ba19: ("functions.auth", "LogOut"),
+    0x9fab0d1a: ("functions.auth", "ResetAuthorizations"),
+    0xe5bfffcd: ("functions.auth", "ExportAuthorization"),
+    0xa57a7dad: ("functions.auth", "ImportAuthorization"),
+    0xcdd42a05: ("functions.auth", "BindTempAuthKey"),
+    0x67a3ff2c: ("functions.auth", "ImportBotAuthorization"),
+    0xd18b4d16: ("functions.auth", "CheckPassword"),
+    0xd897bc66: ("functions.auth", "RequestPasswordRecovery"),
+    0x37096c70: ("functions.auth", "RecoverPassword"),
+    0xcae47523: ("functions.auth", "ResendCode"),
+    0x1f040578: ("functions.auth", "CancelCode"),
+    0x8e48a188: ("functions.auth", "DropTempAuthKeys"),
+    0xb7e085fe: ("functions.auth", "ExportLoginToken"),
+    0x95ac5ce4: ("functions.auth", "ImportLoginToken"),
+    0xe894ad4d: ("functions.auth", "AcceptLoginToken"),
+    0xd36bf79: ("functions.auth", "CheckRecoveryPassword"),
+    0x2db873a9: ("functions.auth", "ImportWebTokenAuthorization"),
+    0x8e39261e: ("functions.auth", "RequestFirebaseSms"),
+    0x7e960193: ("functions.auth", "ResetLoginEmail"),
+    0xcb9deff6: ("functions.auth", "ReportMissingCode"),
+    0xec86017a: ("functions.account", "RegisterDevice"),
+    0x6a0d3206: ("functions.account", "UnregisterDevice"),
+    0x84be5b93: ("functions.account", "UpdateNotifySettings"),
+    0x12b3ad31: ("functions.account", "GetNotifySettings"),
+    0xdb7e1747: ("functions.account", "ResetNotifySettings"),
+    0x78515775: ("functions.account", "UpdateProfile"),
+    0x6628562c: ("functions.account", "UpdateStatus"),
+    0x7967d36: ("functions.account", "GetWallPapers"),
+    0xc5ba3d86: ("functions.account", "ReportPeer"),
+    0x2714d86c: ("functions.account", "CheckUsername"),
+    0x3e0bdd7c: ("functions.account", "UpdateUsername"),
+    0xdadbc950: ("functions.account", "GetPrivacy"),
+    0xc9f81ce8: ("functions.account", "SetPrivacy"),
+    0xa2c0cf74: ("functions.account", "DeleteAccount"),
+    0x8fc711d: ("functions.account", "GetAccountTTL"),
+    0x2442485e: ("functions.account", "SetAccountTTL"),
+    0x82574ae5: ("functions.account", "SendChangePhoneCode"),
+    0x70c32edb: ("functions.account", "ChangePhone"),
+    0x38df3532: ("functions.account", "UpdateDeviceLocked"),
+    0xe320c158: ("functions.account", "GetAuthorizations"),
+    0xdf77f3bc: ("functions.account", "ResetAuthorization"),
+    0x548a30f5: ("functions.account", "GetPassword"),
+    0x9cd4eaf9: ("functions.account", "GetPasswordSettings"),
+    0xa59b102f: ("functions.account", "UpdatePasswordSettings"),
+    0x1b3faa88: ("functions.account", "SendConfirmPhoneCode"),
+    0x5f2178c3: ("functions.account", "ConfirmPhone"),
+    0x449e0b51: ("functions.account", "GetTmpPassword"),
+    0x182e6d6f: ("functions.account", "GetWebAuthorizations"),
+    0x2d01b9ef: ("functions.account", "ResetWebAuthorization"),
+    0x682d2594: ("functions.account", "ResetWebAuthorizations"),
+    0xb288bc7d: ("functions.account", "GetAllSecureValues"),
+    0x73665bc2: ("functions.account", "GetSecureValue"),
+    0x899fe31d: ("functions.account", "SaveSecureValue"),
+    0xb880bc4b: ("functions.account", "DeleteSecureValue"),
+    0xa929597a: ("functions.account", "GetAuthorizationForm"),
+    0xf3ed4c73: ("functions.account", "AcceptAuthorization"),
+    0xa5a356f9: ("functions.account", "SendVerifyPhoneCode"),
+    0x4dd3a7f6: ("functions.account", "VerifyPhone"),
+    0x98e037bb: ("functions.account", "SendVerifyEmailCode"),
+    0x32da4cf: ("functions.account", "VerifyEmail"),
+    0x8ef3eab0: ("functions.account", "InitTakeoutSession"),
+    0x1d2652ee: ("functions.account", "FinishTakeoutSession"),
+    0x8fdf1920: ("functions.account", "ConfirmPasswordEmail"),
+    0x7a7f2a15: ("functions.account", "ResendPasswordEmail"),
+    0xc1cbd5b6: ("functions.account", "CancelPasswordEmail"),
+    0x9f07c728: ("functions.account", "GetContactSignUpNotification"),
+    0xcff43f61: ("functions.account", "SetContactSignUpNotification"),
+    0x53577479: ("functions.account", "GetNotifyExceptions"),
+    0xfc8ddbea: ("functions.account", "GetWallPaper"),
+    0xe39a8f03: ("functions.account", "UploadWallPaper"),
+    0x6c5a5b37: ("functions.account", "SaveWallPaper"),
+    0xfeed5769: ("functions.account", "InstallWallPaper"),
+    0xbb3b9804: ("functions.account", "ResetWallPapers"),
+    0x56da0b3f: ("functions.account", "GetAutoDownloadSettings"),
+    0x76f36233: ("functions.account", "SaveAutoDownloadSettings"),
+    0x1c3db333: ("functions.account", "UploadTheme"),
+    0x652e4400: ("functions.account", "CreateTheme"),
+    0x2bf40ccc: ("functions.account", "UpdateTheme"),
+    0xf257106c: ("functions.account", "SaveTheme"),
+    0xc727bb3b: ("functions.account", "InstallTheme"),
+    0x3a5869ec: ("functions.account", "GetTheme"),
+    0x7206e458: ("functions.account", "GetThemes"),
+    0xb574b16b: ("functions.account", "SetContentSettings"),
+    0x8b9b4dae: ("functions.account", "GetContentSettings"),
+    0x65ad71dc: ("functions.account", "GetMultiWallPapers"),
+    0xeb2b4cf6: ("functions.account", "GetGlobalPrivacySettings"),
+    0x1edaaac2: ("functions.account", "SetGlobalPrivacySettings"),
+    0xfa8cc6f5: ("functions.account", "ReportProfilePhoto"),
+    0x9308ce1b: ("functions.account", "ResetPassword"),
+    0x4c9409f6: ("functions.account", "DeclinePasswordReset"),
+    0xd638de89: ("functions.account", "GetChatThemes"),
+    0xbf899aa0: ("functions.account", "SetAuthorizationTTL"),
+    0x40f48462: ("functions.account", "ChangeAuthorizationSettings"),
+    0xe1902288: ("functions.account", "GetSavedRingtones"),
+    0x3dea5b03: ("functions.account", "SaveRingtone"),
+    0x831a83a2: ("functions.account", "UploadRingtone"),
+    0xfbd3de6b: ("functions.account", "UpdateEmojiStatus"),
+    0xd6753386: ("functions.account", "GetDefaultEmojiStatuses"),
+    0xf578105: ("functions.account", "GetRecentEmojiStatuses"),
+    0x18201aae: ("functions.account", "ClearRecentEmojiStatuses"),
+    0xef500eab: ("functions.account", "ReorderUsernames"),
+    0x58d6b376: ("functions.account", "ToggleUsername"),
+    0xe2750328: ("functions.account", "GetDefaultProfilePhotoEmojis"),
+    0x915860ae: ("functions.account", "GetDefaultGroupPhotoEmojis"),
+    0xadcbbcda: ("functions.account", "GetAutoSaveSettings"),
+    0xd69b8361: ("functions.account", "SaveAutoSaveSettings"),
+    0x53bc0020: ("functions.account", "DeleteAutoSaveExceptions"),
+    0xca8ae8ba: ("functions.account", "InvalidateSignInCodes"),
+    0x7cefa15d: ("functions.account", "UpdateColor"),
+    0xa60ab9ce: ("functions.account", "GetDefaultBackgroundEmojis"),
+    0x7727a7d5: ("functions.account", "GetChannelDefaultEmojiStatuses"),
+    0x35a9e0d5: ("functions.account", "GetChannelRestrictedStatusEmojis"),
+    0x4b00e066: ("functions.account", "UpdateBusinessWorkHours"),
+    0x9e6b131a: ("functions.account", "UpdateBusinessLocation"),
+    0x66cdafc4: ("functions.account", "UpdateBusinessGreetingMessage"),
+    0xa26a7fa5: ("functions.account", "UpdateBusinessAwayMessage"),
+    0x66a08c7e: ("functions.account", "UpdateConnectedBot"),
+    0x4ea4c80f: ("functions.account", "GetConnectedBots"),
+    0x76a86270: ("functions.account", "GetBotBusinessConnection"),
+    0xa614d034: ("functions.account", "UpdateBusinessIntro"),
+    0x646e1097: ("functions.account", "ToggleConnectedBotPaused"),
+    0x5e437ed9: ("functions.account", "DisablePeerConnectedBot"),
+    0xcc6e0c11: ("functions.account", "UpdateBirthday"),
+    0x8851e68e: ("functions.account", "CreateBusinessChatLink"),
+    0x8c3410af: ("functions.account", "EditBusinessChatLink"),
+    0x60073674: ("functions.account", "DeleteBusinessChatLink"),
+    0x6f70dde1: ("functions.account", "GetBusinessChatLinks"),
+    0x5492e5ee: ("functions.account", "ResolveBusinessChatLink"),
+    0xd94305e0: ("functions.account", "UpdatePersonalChannel"),
+    0xb9d9a38d: ("functions.account", "ToggleSponsoredMessages"),
+    0x6dd654c: ("functions.account", "GetReactionsNotifySettings"),
+    0x316ce548: ("functions.account", "SetReactionsNotifySettings"),
+    0x2e7b4543: ("functions.account", "GetCollectibleEmojiStatuses"),
+    0x6f688aa7: ("functions.account", "AddNoPaidMessagesException"),
+    0xf1266f38: ("functions.account", "GetPaidMessagesRevenue"),
+    0xd91a548: ("functions.users", "GetUsers"),
+    0xb60f5918: ("functions.users", "GetFullUser"),
+    0x90c894b5: ("functions.users", "SetSecureValueErrors"),
+    0xd89a83a3: ("functions.users", "GetRequirementsToContact"),
+    0x7adc669d: ("functions.contacts", "GetContactIDs"),
+    0xc4a353ee: ("functions.contacts", "GetStatuses"),
+    0x5dd69e12: ("functions.contacts", "GetContacts"),
+    0x2c800be5: ("functions.contacts", "ImportContacts"),
+    0x96a0e00: ("functions.contacts", "DeleteContacts"),
+    0x1013fd9e: ("functions.contacts", "DeleteByPhones"),
+    0x2e2e8734: ("functions.contacts", "Block"),
+    0xb550d328: ("functions.contacts", "Unblock"),
+    0x9a868f80: ("functions.contacts", "GetBlocked"),
+    0x11f812d8: ("functions.contacts", "Search"),
+    0x725afbbc: ("functions.contacts", "ResolveUsername"),
+    0x973478b6: ("functions.contacts", "GetTopPeers"),
+    0x1ae373ac: ("functions.contacts", "ResetTopPeerRating"),
+    0x879537f1: ("functions.contacts", "ResetSaved"),
+    0x82f1e39f: ("functions.contacts", "GetSaved"),
+    0x8514bdda: ("functions.contacts", "ToggleTopPeers"),
+    0xe8f463d0: ("functions.contacts", "AddContact"),
+    0xf831a20f: ("functions.contacts", "AcceptContact"),
+    0xd348bc44: ("functions.contacts", "GetLocated"),
+    0x29a8962c: ("functions.contacts", "BlockFromReplies"),
+    0x8af94344: ("functions.contacts", "ResolvePhone"),
+    0xf8654027: ("functions.contacts", "ExportContactToken"),
+    0x13005788: ("functions.contacts", "ImportContactToken"),
+    0xba6705f0: ("functions.contacts", "EditCloseFriends"),
+    0x94c65c76: ("functions.contacts", "SetBlocked"),
+    0xdaeda864: ("functions.contacts", "GetBirthdays"),
+    0xb6c8c393: ("functions.contacts", "GetSponsoredPeers"),
+    0x63c66506: ("functions.messages", "GetMessages"),
+    0xa0f4cb4f: ("functions.messages", "GetDialogs"),
+    0x4423e6c5: ("functions.messages", "GetHistory"),
+    0x29ee847a: ("functions.messages", "Search"),
+    0xe306d3a: ("functions.messages", "ReadHistory"),
+    0xb08f922a: ("functions.messages", "DeleteHistory"),
+    0xe58e95d2: ("functions.messages", "DeleteMessages"),
+    0x5a954c0: ("functions.messages", "ReceivedMessages"),
+    0x58943ee2: ("functions.messages", "SetTyping"),
+    0xfbf2340a: ("functions.messages", "SendMessage"),
+    0xa550cd78: ("functions.messages", "SendMedia"),
+    0xbb9fa475: ("functions.messages", "ForwardMessages"),
+    0xcf1592db: ("functions.messages", "ReportSpam"),
+    0xefd9a6a2: ("functions.messages", "GetPeerSettings"),
+    0xfc78af9b: ("functions.messages", "Report"),
+    0x49e9528f: ("functions.messages", "GetChats"),
+    0xaeb00b34: ("functions.messages", "GetFullChat"),
+    0x73783ffd: ("functions.messages", "EditChatTitle"),
+    0x35ddd674: ("functions.messages", "EditChatPhoto"),
+    0xcbc6d107: ("functions.messages", "AddChatUser"),
+    0xa2185cab: ("functions.messages", "DeleteChatUser"),
+    0x92ceddd4: ("functions.messages", "CreateChat"),
+    0x26cf8950: ("functions.messages", "GetDhConfig"),
+    0xf64daf43: ("functions.messages", "RequestEncryption"),
+    0x3dbc0415: ("functions.messages", "AcceptEncryption"),
+    0xf393aea0: ("functions.messages", "DiscardEncryption"),
+    0x791451ed: ("functions.messages", "SetEncryptedTyping"),
+    0x7f4b690a: ("functions.messages", "ReadEncryptedHistory"),
+    0x44fa7a15: ("functions.messages", "SendEncrypted"),
+    0x5559481d: ("functions.messages", "SendEncryptedFile"),
+    0x32d439a4: ("functions.messages", "SendEncryptedService"),
+    0x55a5bb66: ("functions.messages", "ReceivedQueue"),
+    0x4b0c8c0f: ("functions.messages", "ReportEncryptedSpam"),
+    0x36a73f77: ("functions.messages", "ReadMessageContents"),
+    0xd5a5d3a1: ("functions.messages", "GetStickers"),
+    0xb8a0a1a8: ("functions.messages", "GetAllStickers"),
+    0x570d6f6f: ("functions.messages", "GetWebPagePreview"),
+    0xa455de90: ("functions.messages", "ExportChatInvite"),
+    0x3eadb1bb: ("functions.messages", "CheckChatInvite"),
+    0x6c50051c: ("functions.messages", "ImportChatInvite"),
+    0xc8a0ec74: ("functions.messages", "GetStickerSet"),
+    0xc78fe460: ("functions.messages", "InstallStickerSet"),
+    0xf96e55de: ("functions.messages", "UninstallStickerSet"),
+    0xe6df7378: ("functions.messages", "StartBot"),
+    0x5784d3e1: ("functions.messages", "GetMessagesViews"),
+    0xa85bd1c2: ("functions.messages", "EditChatAdmin"),
+    0xa2875319: ("functions.messages", "MigrateChat"),
+    0x4bc6589a: ("functions.messages", "SearchGlobal"),
+    0x78337739: ("functions.messages", "ReorderStickerSets"),
+    0xb1f2061f: ("functions.messages", "GetDocumentByHash"),
+    0x5cf09635: ("functions.messages", "GetSavedGifs"),
+    0x327a30cb: ("functions.messages", "SaveGif"),
+    0x514e999d: ("functions.messages", "GetInlineBotResults"),
+    0xbb12a419: ("functions.messages", "SetInlineBotResults"),
+    0xc0cf7646: ("functions.messages", "SendInlineBotResult"),
+    0xfda68d36: ("functions.messages", "GetMessageEditData"),
+    0xdfd14005: ("functions.messages", "EditMessage"),
+    0x83557dba: ("functions.messages", "EditInlineBotMessage"),
+    0x9342ca07: ("functions.messages", "GetBotCallbackAnswer"),
+    0xd58f130a: ("functions.messages", "SetBotCallbackAnswer"),
+    0xe470bcfd: ("functions.messages", "GetPeerDialogs"),
+    0xd372c5ce: ("functions.messages", "SaveDraft"),
+    0x6a3f8d65: ("functions.messages", "GetAllDrafts"),
+    0x64780b14: ("functions.messages", "GetFeaturedStickers"),
+    0x5b118126: ("functions.messages", "ReadFeaturedStickers"),
+    0x9da9403b: ("functions.messages", "GetRecentStickers"),
+    0x392718f8: ("functions.messages", "SaveRecentSticker"),
+    0x8999602d: ("functions.messages", "ClearRecentStickers"),
+    0x57f17692: ("functions.messages", "GetArchivedStickers"),
+    0x640f82b8: ("functions.messages", "GetMaskStickers"),
+    0xcc5b67cc: ("functions.messages", "GetAttachedStickers"),
+    0x8ef8ecc0: ("functions.messages", "SetGameScore"),
+    0x15ad9f64: ("functions.messages", "SetInlineGameScore"),
+    0xe822649d: ("functions.messages", "GetGameHighScores"),
+    0xf635e1b: ("functions.messages", "GetInlineGameHighScores"),
+    0xe40ca104: ("functions.messages", "GetCommonChats"),
+    0x8d9692a3: ("functions.messages", "GetWebPage"),
+    0xa731e257: ("functions.messages", "ToggleDialogPin"),
+    0x3b1adf37: ("functions.messages", "ReorderPinnedDialogs"),
+    0xd6b94df2: ("functions.messages", "GetPinnedDialogs"),
+    0xe5f672fa: ("functions.messages", "SetBotShippingResults"),
+    0x9c2dd95: ("functions.messages", "SetBotPrecheckoutResults"),
+    0x14967978: ("functions.messages", "UploadMedia"),
+    0xa1405817: ("functions.messages", "SendScreenshotNotification"),
+    0x4f1aaa9: ("functions.messages", "GetFavedStickers"),
+    0xb9ffc55b: ("functions.messages", "FaveSticker"),
+    0xf107e790: ("functions.messages", "GetUnreadMentions"),
+    0x36e5bf4d: ("functions.messages", "ReadMentions"),
+    0x702a40e0: ("functions.messages", "GetRecentLocations"),
+    0x1bf89d74: ("functions.messages", "SendMultiMedia"),
+    0x5057c497: ("functions.messages", "UploadEncryptedFile"),
+    0x35705b8a: ("functions.messages", "SearchStickerSets"),
+    0x1cff7e08: ("functions.messages", "GetSplitRanges"),
+    0xc286d98f: ("functions.messages", "MarkDialogUnread"),
+    0x22e24e22: ("functions.messages", "GetDialogUnreadMarks"),
+    0x7e58ee9c: ("functions.messages", "ClearAllDrafts"),
+    0xd2aaf7ec: ("functions.messages", "UpdatePinnedMessage"),
+    0x10ea6184: ("functions.messages", "SendVote"),
+    0x73bb643b: ("functions.messages", "GetPollResults"),
+    0x6e2be050: ("functions.messages", "GetOnlines"),
+    0xdef60797: ("functions.messages", "EditChatAbout"),
+    0xa5866b41: ("functions.messages", "EditChatDefaultBannedRights"),
+    0x35a0e062: ("functions.messages", "GetEmojiKeywords"),
+    0x1508b6af: ("functions.messages", "GetEmojiKeywordsDifference"),
+    0x4e9963b2: ("functions.messages", "GetEmojiKeywordsLanguages"),
+    0xd5b10c26: ("functions.messages", "GetEmojiURL"),
+    0x1bbcf300: ("functions.messages", "GetSearchCounters"),
+    0x198fb446: ("functions.messages", "RequestUrlAuth"),
+    0xb12c7125: ("functions.messages", "AcceptUrlAuth"),
+    0x4facb138: ("functions.messages", "HidePeerSettingsBar"),
+    0xf516760b: ("functions.messages", "GetScheduledHistory"),
+    0xbdbb0464: ("functions.messages", "GetScheduledMessages"),
+    0xbd38850a: ("functions.messages", "SendScheduledMessages"),
+    0x59ae2b16: ("functions.messages", "DeleteScheduledMessages"),
+    0xb86e380e: ("functions.messages", "GetPollVotes"),
+    0xb5052fea: ("functions.messages", "ToggleStickerSets"),
+    0xefd48c89: ("functions.messages", "GetDialogFilters"),
+    0xa29cd42c: ("functions.messages", "GetSuggestedDialogFilters"),
+    0x1ad4a04a: ("functions.messages", "UpdateDialogFilter"),
+    0xc563c1e4: ("functions.messages", "UpdateDialogFiltersOrder"),
+    0x7ed094a1: ("functions.messages", "GetOldFeaturedStickers"),
+    0x22ddd30c: ("functions.messages", "GetReplies"),
+    0x446972fd: ("functions.messages", "GetDiscussionMessage"),
+    0xf731a9f4: ("functions.messages", "ReadDiscussion"),
+    0xee22b9a8: ("functions.messages", "UnpinAllMessages"),
+    0x5bd0ee50: ("functions.messages", "DeleteChat"),
+    0xf9cbe409: ("functions.messages", "DeletePhoneCallHistory"),
+    0x43fe19f3: ("functions.messages", "CheckHistoryImport"),
+    0x34090c3b: ("functions.messages", "InitHistoryImport"),
+    0x2a862092: ("functions.messages", "UploadImportedMedia"),
+    0xb43df344: ("functions.messages", "StartHistoryImport"),
+    0xa2b5a3f6: ("functions.messages", "GetExportedChatInvites"),
+    0x73746f5c: ("functions.messages", "GetExportedChatInvite"),
+    0xbdca2f75: ("functions.messages", "EditExportedChatInvite"),
+    0x56987bd5: ("functions.messages", "DeleteRevokedExportedChatInvites"),
+    0xd464a42b: ("functions.messages", "DeleteExportedChatInvite"),
+    0x3920e6ef: ("functions.messages", "GetAdminsWithInvites"),
+    0xdf04dd4e: ("functions.messages", "GetChatInviteImporters"),
+    0xb80e5fe4: ("functions.messages", "SetHistoryTTL"),
+    0x5dc60f03: ("functions.messages", "CheckHistoryImportPeer"),
+    0xe63be13f: ("functions.messages", "SetChatTheme"),
+    0x31c1c44f: ("functions.messages", "GetMessageReadParticipants"),
+    0x6aa3f6bd: ("functions.messages", "GetSearchResultsCalendar"),
+    0x9c7f2f10: ("functions.messages", "GetSearchResultsPositions"),
+    0x7fe7e815: ("functions.messages", "HideChatJoinRequest"),
+    0xe085f4ea: ("functions.messages", "HideAllChatJoinRequests"),
+    0xb11eafa2: ("functions.messages", "ToggleNoForwards"),
+    0xccfddf96: ("functions.messages", "SaveDefaultSendAs"),
+    0xd30d78d4: ("functions.messages", "SendReaction"),
+    0x8bba90e6: ("functions.messages", "GetMessagesReactions"),
+    0x461b3f48: ("functions.messages", "GetMessageReactionsList"),
+    0x864b2581: ("functions.messages", "SetChatAvailableReactions"),
+    0x18dea0ac: ("functions.messages", "GetAvailableReactions"),
+    0x4f47a016: ("functions.messages", "SetDefaultReaction"),
+    0x63183030: ("functions.messages", "TranslateText"),
+    0x3223495b: ("functions.messages", "GetUnreadReactions"),
+    0x54aa7f8e: ("functions.messages", "ReadReactions"),
+    0x107e31a0: ("functions.messages", "SearchSentMedia"),
+    0x16fcc2cb: ("functions.messages", "GetAttachMenuBots"),
+    0x77216192: ("functions.messages", "GetAttachMenuBot"),
+    0x69f59d69: ("functions.messages", "ToggleBotInAttachMenu"),
+    0x269dc2c1: ("functions.messages", "RequestWebView"),
+    0xb0d81a83: ("functions.messages", "ProlongWebView"),
+    0x413a3e73: ("functions.messages", "RequestSimpleWebView"),
+    0xa4314f5: ("functions.messages", "SendWebViewResultMessage"),
+    0xdc0242c8: ("functions.messages", "SendWebViewData"),
+    0x269e9a49: ("functions.messages", "TranscribeAudio"),
+    0x7f1d072f: ("functions.messages", "RateTranscribedAudio"),
+    0xd9ab0f54: ("functions.messages", "GetCustomEmojiDocuments"),
+    0xfbfca18f: ("functions.messages", "GetEmojiStickers"),
+    0xecf6736: ("functions.messages", "GetFeaturedEmojiStickers"),
+    0x3f64c076: ("functions.messages", "ReportReaction"),
+    0xbb8125ba: ("functions.messages", "GetTopReactions"),
+    0x39461db2: ("functions.messages", "GetRecentReactions"),
+    0x9dfeefb4: ("functions.messages", "ClearRecentReactions"),
+    0x84f80814: ("functions.messages", "GetExtendedMedia"),
+    0x9eb51445: ("functions.messages", "SetDefaultHistoryTTL"),
+    0x658b7188: ("functions.messages", "GetDefaultHistoryTTL"),
+    0x91b2d060: ("functions.messages", "SendBotRequestedPeer"),
+    0x7488ce5b: ("functions.messages", "GetEmojiGroups"),
+    0x2ecd56cd: ("functions.messages", "GetEmojiStatusGroups"),
+    0x21a548f3: ("functions.messages", "GetEmojiProfilePhotoGroups"),
+    0x2c11c0d7: ("functions.messages", "SearchCustomEmoji"),
+    0xe47cb579: ("functions.messages", "TogglePeerTranslations"),
+    0x34fdc5c3: ("functions.messages", "GetBotApp"),
+    0x53618bce: ("functions.messages", "RequestAppWebView"),
+    0x8ffacae1: ("functions.messages", "SetChatWallPaper"),
+    0x92b4494c: ("functions.messages", "SearchEmojiStickerSets"),
+    0x5381d21a: ("functions.messages", "GetSavedDialogs"),
+    0x3d9a414d: ("functions.messages", "GetSavedHistory"),
+    0x6e98102b: ("functions.messages", "DeleteSavedHistory"),
+    0xd63d94e0: ("functions.messages", "GetPinnedSavedDialogs"),
+    0xac81bbde: ("functions.messages", "ToggleSavedDialogPin"),
+    0x8b716587: ("functions.messages", "ReorderPinnedSavedDialogs"),
+    0x3637e05b: ("functions.messages", "GetSavedReactionTags"),
+    0x60297dec: ("functions.messages", "UpdateSavedReactionTag"),
+    0xbdf93428: ("functions.messages", "GetDefaultTagReactions"),
+    0x8c4bfe5d: ("functions.messages", "GetOutboxReadDate"),
+    0xd483f2a8: ("functions.messages", "GetQuickReplies"),
+    0x60331907: ("functions.messages", "ReorderQuickReplies"),
+    0xf1d0fbd3: ("functions.messages", "CheckQuickReplyShortcut"),
+    0x5c003cef: ("functions.messages", "EditQuickReplyShortcut"),
+    0x3cc04740: ("functions.messages", "DeleteQuickReplyShortcut"),
+    0x94a495c3: ("functions.messages", "GetQuickReplyMessages"),
+    0x6c750de1: ("functions.messages", "SendQuickReplyMessages"),
+    0xe105e910: ("functions.messages", "DeleteQuickReplyMessages"),
+    0xfd2dda49: ("functions.messages", "ToggleDialogFilterTags"),
+    0xd0b5e1fc: ("functions.messages", "GetMyStickers"),
+    0x1dd840f5: ("functions.messages", "GetEmojiStickerGroups"),
+    0xdea20a39: ("functions.messages", "GetAvailableEffects"),
+    0x589ee75: ("functions.messages", "EditFactCheck"),
+    0xd1da940c: ("functions.messages", "DeleteFactCheck"),
+    0xb9cdc5ee: ("functions.messages", "GetFactCheck"),
+    0xc9e01e7b: ("functions.messages", "RequestMainWebView"),
+    0x58bbcb50: ("functions.messages", "SendPaidReaction"),
+    0x435885b5: ("functions.messages", "TogglePaidReactionPrivacy"),
+    0x472455aa: ("functions.messages", "GetPaidReactionPrivacy"),
+    0x269e3643: ("functions.messages", "ViewSponsoredMessage"),
+    0x8235057e: ("functions.messages", "ClickSponsoredMessage"),
+    0x12cbf0c4: ("functions.messages", "ReportSponsoredMessage"),
+    0x9bd2f439: ("functions.messages", "GetSponsoredMessages"),
+    0xf21f7f2f: ("functions.messages", "SavePreparedInlineMessage"),
+    0x857ebdb8: ("functions.messages", "GetPreparedInlineMessage"),
+    0x29b1c66a: ("functions.messages", "SearchStickers"),
+    0x5a6d7395: ("functions.messages", "ReportMessagesDelivery"),
+    0xedd4882a: ("functions.updates", "GetState"),
+    0x19c2f763: ("functions.updates", "GetDifference"),
+    0x3173d78: ("functions.updates", "GetChannelDifference"),
+    0x9e82039: ("functions.photos", "UpdateProfilePhoto"),
+    0x388a3b5: ("functions.photos", "UploadProfilePhoto"),
+    0x87cf7f2f: ("functions.photos", "DeletePhotos"),
+    0x91cd32a8: ("functions.photos", "GetUserPhotos"),
+    0xe14c4a71: ("functions.photos", "UploadContactProfilePhoto"),
+    0xb304a621: ("functions.upload", "SaveFilePart"),
+    0xbe5335be: ("functions.upload", "GetFile"),
+    0xde7b673d: ("functions.upload", "SaveBigFilePart"),
+    0x24e6818d: ("functions.upload", "GetWebFile"),
+    0x395f69da: ("functions.upload", "GetCdnFile"),
+    0x9b2754a8: ("functions.upload", "ReuploadCdnFile"),
+    0x91dc3f31: ("functions.upload", "GetCdnFileHashes"),
+    0x9156982a: ("functions.upload", "GetFileHashes"),
+    0xc4f9186b: ("functions.help", "GetConfig"),
+    0x1fb33026: ("functions.help", "GetNearestDc"),
+    0x522d5a7d: ("functions.help", "GetAppUpdate"),
+    0x4d392343: ("functions.help", "GetInviteText"),
+    0x9cdf08cd: ("functions.help", "GetSupport"),
+    0xec22cfcd: ("functions.help", "SetBotUpdatesStatus"),
+    0x52029342: ("functions.help", "GetCdnConfig"),
+    0x3dc0f114: ("functions.help", "GetRecentMeUrls"),
+    0x2ca51fd1: ("functions.help", "GetTermsOfServiceUpdate"),
+    0xee72f79a: ("functions.help", "AcceptTermsOfService"),
+    0x3fedc75f: ("functions.help", "GetDeepLinkInfo"),
+    0x61e3f854: ("functions.help", "GetAppConfig"),
+    0x6f02f748: ("functions.help", "SaveAppLog"),
+    0xc661ad08: ("functions.help", "GetPassportConfig"),
+    0xd360e72c: ("functions.help", "GetSupportName"),
+    0x38a08d3: ("functions.help", "GetUserInfo"),
+    0x66b91b70: ("functions.help", "EditUserInfo"),
+    0xc0977421: ("functions.help", "GetPromoData"),
+    0x1e251c95: ("functions.help", "HidePromoData"),
+    0xf50dbaa1: ("functions.help", "DismissSuggestion"),
+    0x735787a8: ("functions.help", "GetCountriesList"),
+    0xb81b93d4: ("functions.help", "GetPremiumPromo"),
+    0xda80f42f: ("functions.help", "GetPeerColors"),
+    0xabcfa9fd: ("functions.help", "GetPeerProfileColors"),
+    0x49b30240: ("functions.help", "GetTimezonesList"),
+    0xcc104937: ("functions.channels", "ReadHistory"),
+    0x84c1fd4e: ("functions.channels", "DeleteMessages"),
+    0xf44a8315: ("functions.channels", "ReportSpam"),
+    0xad8c9a23: ("functions.channels", "GetMessages"),
+    0x77ced9d0: ("functions.channels", "GetParticipants"),
+    0xa0ab6cc6: ("functions.channels", "GetParticipant"),
+    0xa7f6bbb: ("functions.channels", "GetChannels"),
+    0x8736a09: ("functions.channels", "GetFullChannel"),
+    0x91006707: ("functions.channels", "CreateChannel"),
+    0xd33c8902: ("functions.channels", "EditAdmin"),
+    0x566decd0: ("functions.channels", "EditTitle"),
+    0xf12e57c9: ("functions.channels", "EditPhoto"),
+    0x10e6bd2c: ("functions.channels", "CheckUsername"),
+    0x3514b3de: ("functions.channels", "UpdateUsername"),
+    0x24b524c5: ("functions.channels", "JoinChannel"),
+    0xf836aa95: ("functions.channels", "LeaveChannel"),
+    0xc9e33d54: ("functions.channels", "InviteToChannel"),
+    0xc0111fe3: ("functions.channels", "DeleteChannel"),
+    0xe63fadeb: ("functions.channels", "ExportMessageLink"),
+    0x418d549c: ("functions.channels", "ToggleSignatures"),
+    0xf8b036af: ("functions.channels", "GetAdminedPublicChannels"),
+    0x96e6cd81: ("functions.channels", "EditBanned"),
+    0x33ddf480: ("functions.channels", "GetAdminLog"),
+    0xea8ca4f9: ("functions.channels", "SetStickers"),
+    0xeab5dc38: ("functions.channels", "ReadMessageContents"),
+    0x9baa9647: ("functions.channels", "DeleteHistory"),
+    0xeabbb94c: ("functions.channels", "TogglePreHistoryHidden"),
+    0x8341ecc0: ("functions.channels", "GetLeftChannels"),
+    0xf5dad378: ("functions.channels", "GetGroupsForDiscussion"),
+    0x40582bb2: ("functions.channels", "SetDiscussionGroup"),
+    0x8f38cd1f: ("functions.channels", "EditCreator"),
+    0x58e63f6d: ("functions.channels", "EditLocation"),
+    0xedd49ef0: ("functions.channels", "ToggleSlowMode"),
+    0x11e831ee: ("functions.channels", "GetInactiveChannels"),
+    0xb290c69: ("functions.channels", "ConvertToGigagroup"),
+    0xe785a43f: ("functions.channels", "GetSendAs"),
+    0x367544db: ("functions.channels", "DeleteParticipantHistory"),
+    0xe4cb9580: ("functions.channels", "ToggleJoinToSend"),
+    0x4c2985b6: ("functions.channels", "ToggleJoinRequest"),
+    0xb45ced1d: ("functions.channels", "ReorderUsernames"),
+    0x50f24105: ("functions.channels", "ToggleUsername"),
+    0xa245dd3: ("functions.channels", "DeactivateAllUsernames"),
+    0xa4298b29: ("functions.channels", "ToggleForum"),
+    0xf40c0224: ("functions.channels", "CreateForumTopic"),
+    0xde560d1: ("functions.channels", "GetForumTopics"),
+    0xb0831eb9: ("functions.channels", "GetForumTopicsByID"),
+    0xf4dfa185: ("functions.channels", "EditForumTopic"),
+    0x6c2d9026: ("functions.channels", "UpdatePinnedForumTopic"),
+    0x34435f2d: ("functions.channels", "DeleteTopicHistory"),
+    0x2950a18f: ("functions.channels", "ReorderPinnedForumTopics"),
+    0x68f3e4eb: ("functions.channels", "ToggleAntiSpam"),
+    0xa850a693: ("functions.channels", "ReportAntiSpamFalsePositive"),
+    0x6a6e7854: ("functions.channels", "ToggleParticipantsHidden"),
+    0xd8aa3671: ("functions.channels", "UpdateColor"),
+    0x9738bb15: ("functions.channels", "ToggleViewForumAsMessages"),
+    0x25a71742: ("functions.channels", "GetChannelRecommendations"),
+    0xf0d3e6a8: ("functions.channels", "UpdateEmojiStatus"),
+    0xad399cee: ("functions.channels", "SetBoostsToUnblockRestrictions"),
+    0x3cd930b7: ("functions.channels", "SetEmojiStickers"),
+    0x9ae91519: ("functions.channels", "RestrictSponsoredMessages"),
+    0xd19f987b: ("functions.channels", "SearchPosts"),
+    0xfc84653f: ("functions.channels", "UpdatePaidMessagesPrice"),
+    0xaa2769ed: ("functions.bots", "SendCustomRequest"),
+    0xe6213f4d: ("functions.bots", "AnswerWebhookJSONQuery"),
+    0x517165a: ("functions.bots", "SetBotCommands"),
+    0x3d8de0f9: ("functions.bots", "ResetBotCommands"),
+    0xe34c0dd6: ("functions.bots", "GetBotCommands"),
+    0x4504d54f: ("functions.bots", "SetBotMenuButton"),
+    0x9c60eb28: ("functions.bots", "GetBotMenuButton"),
+    0x788464e1: ("functions.bots", "SetBotBroadcastDefaultAdminRights"),
+    0x925ec9ea: ("functions.bots", "SetBotGroupDefaultAdminRights"),
+    0x10cf3123: ("functions.bots", "SetBotInfo"),
+    0xdcd914fd: ("functions.bots", "GetBotInfo"),
+    0x9709b1c2: ("functions.bots", "ReorderUsernames"),
+    0x53ca973: ("functions.bots", "ToggleUsername"),
+    0x1359f4e6: ("functions.bots", "CanSendMessage"),
+    0xf132e3ef: ("functions.bots", "AllowSendMessage"),
+    0x87fc5e7: ("functions.bots", "InvokeWebViewCustomMethod"),
+    0xc2510192: ("functions.bots", "GetPopularAppBots"),
+    0x17aeb75a: ("functions.bots", "AddPreviewMedia"),
+    0x8525606f: ("functions.bots", "EditPreviewMedia"),
+    0x2d0135b3: ("functions.bots", "DeletePreviewMedia"),
+    0xb627f3aa: ("functions.bots", "ReorderPreviewMedias"),
+    0x423ab3ad: ("functions.bots", "GetPreviewInfo"),
+    0xa2a5594d: ("functions.bots", "GetPreviewMedias"),
+    0xed9f30c5: ("functions.bots", "UpdateUserEmojiStatus"),
+    0x6de6392: ("functions.bots", "ToggleUserEmojiStatusPermission"),
+    0x50077589: ("functions.bots", "CheckDownloadFileParams"),
+    0xb0711d83: ("functions.bots", "GetAdminedBots"),
+    0x778b5ab3: ("functions.bots", "UpdateStarRefProgram"),
+    0x8b89dfbd: ("functions.bots", "SetCustomVerification"),
+    0xa1b70815: ("functions.bots", "GetBotRecommendations"),
+    0x37148dbb: ("functions.payments", "GetPaymentForm"),
+    0x2478d1cc: ("functions.payments", "GetPaymentReceipt"),
+    0xb6c8f12b: ("functions.payments", "ValidateRequestedInfo"),
+    0x2d03522f: ("functions.payments", "SendPaymentForm"),
+    0x227d824b: ("functions.payments", "GetSavedInfo"),
+    0xd83d70c1: ("functions.payments", "ClearSavedInfo"),
+    0x2e79d779: ("functions.payments", "GetBankCardData"),
+    0xf91b065: ("functions.payments", "ExportInvoice"),
+    0x80ed747d: ("functions.payments", "AssignAppStoreTransaction"),
+    0xdffd50d3: ("functions.payments", "AssignPlayMarketTransaction"),
+    0x2757ba54: ("functions.payments", "GetPremiumGiftCodeOptions"),
+    0x8e51b4c1: ("functions.payments", "CheckGiftCode"),
+    0xf6e26854: ("functions.payments", "ApplyGiftCode"),
+    0xf4239425: ("functions.payments", "GetGiveawayInfo"),
+    0x5ff58f20: ("functions.payments", "LaunchPrepaidGiveaway"),
+    0xc00ec7d3: ("functions.payments", "GetStarsTopupOptions"),
+    0x104fcfa7: ("functions.payments", "GetStarsStatus"),
+    0x69da4557: ("functions.payments", "GetStarsTransactions"),
+    0x7998c914: ("functions.payments", "SendStarsForm"),
+    0x25ae8f4a: ("functions.payments", "RefundStarsCharge"),
+    0xd91ffad6: ("functions.payments", "GetStarsRevenueStats"),
+    0x13bbe8b3: ("functions.payments", "GetStarsRevenueWithdrawalUrl"),
+    0xd1d7efc5: ("functions.payments", "GetStarsRevenueAdsAccountUrl"),
+    0x27842d2e: ("functions.payments", "GetStarsTransactionsByID"),
+    0xd3c96bc8: ("functions.payments", "GetStarsGiftOptions"),
+    0x32512c5: ("functions.payments", "GetStarsSubscriptions"),
+    0xc7770878: ("functions.payments", "ChangeStarsSubscription"),
+    0xcc5bebb3: ("functions.payments", "FulfillStarsSubscription"),
+    0xbd1efd3e: ("functions.payments", "GetStarsGiveawayOptions"),
+    0xc4563590: ("functions.payments", "GetStarGifts"),
+    0x2a2a697c: ("functions.payments", "SaveStarGift"),
+    0x74bf076b: ("functions.payments", "ConvertStarGift"),
+    0x6dfa0622: ("functions.payments", "BotCancelStarsSubscription"),
+    0x5869a553: ("functions.payments", "GetConnectedStarRefBots"),
+    0xb7d998f0: ("functions.payments", "GetConnectedStarRefBot"),
+    0xd6b48f7: ("functions.payments", "GetSuggestedStarRefBots"),
+    0x7ed5348a: ("functions.payments", "ConnectStarRefBot"),
+    0xe4fca4a3: ("functions.payments", "EditConnectedStarRefBot"),
+    0x9c9abcb1: ("functions.payments", "GetStarGiftUpgradePreview"),
+    0xaed6e4f5: ("functions.payments", "UpgradeStarGift"),
+    0x7f18176a: ("functions.payments", "TransferStarGift"),
+    0xa1974d72: ("functions.payments", "GetUniqueStarGift"),
+    0x23830de9: ("functions.payments", "GetSavedStarGifts"),
+    0xb455a106: ("functions.payments", "GetSavedStarGift"),
+    0xd06e93a8: ("functions.payments", "GetStarGiftWithdrawalUrl"),
+    0x60eaefa1: ("functions.payments", "ToggleChatStarGiftNotifications"),
+    0x1513e7b0: ("functions.payments", "ToggleStarGiftsPinnedToTop"),
+    0x4fdc5ea7: ("functions.payments", "CanPurchaseStore"),
+    0x9021ab67: ("functions.stickers", "CreateStickerSet"),
+    0xf7760f51: ("functions.stickers", "RemoveStickerFromSet"),
+    0xffb6d4ca: ("functions.stickers", "ChangeStickerPosition"),
+    0x8653febe: ("functions.stickers", "AddStickerToSet"),
+    0xa76a5392: ("functions.stickers", "SetStickerSetThumb"),
+    0x284b3639: ("functions.stickers", "CheckShortName"),
+    0x4dafc503: ("functions.stickers", "SuggestShortName"),
+    0xf5537ebc: ("functions.stickers", "ChangeSticker"),
+    0x124b1c00: ("functions.stickers", "RenameStickerSet"),
+    0x87704394: ("functions.stickers", "DeleteStickerSet"),
+    0x4696459a: ("functions.stickers", "ReplaceSticker"),
+    0x55451fa9: ("functions.phone", "GetCallConfig"),
+    0xa6c4600c: ("functions.phone", "RequestCall"),
+    0x3bd2b4a0: ("functions.phone", "AcceptCall"),
+    0x2efe1722: ("functions.phone", "ConfirmCall"),
+    0x17d54f61: ("functions.phone", "ReceivedCall"),
+    0xb2cbc1c0: ("functions.phone", "DiscardCall"),
+    0x59ead627: ("functions.phone", "SetCallRating"),
+    0x277add7e: ("functions.phone", "SaveCallDebug"),
+    0xff7a9383: ("functions.phone", "SendSignalingData"),
+    0x48cdc6d8: ("functions.phone", "CreateGroupCall"),
+    0xd61e1df3: ("functions.phone", "JoinGroupCall"),
+    0x500377f9: ("functions.phone", "LeaveGroupCall"),
+    0x7b393160: ("functions.phone", "InviteToGroupCall"),
+    0x7a777135: ("functions.phone", "DiscardGroupCall"),
+    0x74bbb43d: ("functions.phone", "ToggleGroupCallSettings"),
+    0x41845db: ("functions.phone", "GetGroupCall"),
+    0xc558d8ab: ("functions.phone", "GetGroupParticipants"),
+    0xb59cf977: ("functions.phone", "CheckGroupCall"),
+    0xf128c708: ("functions.phone", "ToggleGroupCallRecord"),
+    0xa5273abf: ("functions.phone", "EditGroupCallParticipant"),
+    0x1ca6ac0a: ("functions.phone", "EditGroupCallTitle"),
+    0xef7c213a: ("functions.phone", "GetGroupCallJoinAs"),
+    0xe6aa647f: ("functions.phone", "ExportGroupCallInvite"),
+    0x219c34e6: ("functions.phone", "ToggleGroupCallStartSubscription"),
+    0x5680e342: ("functions.phone", "StartScheduledGroupCall"),
+    0x575e1f8c: ("functions.phone", "SaveDefaultGroupCallJoinAs"),
+    0xcbea6bc4: ("functions.phone", "JoinGroupCallPresentation"),
+    0x1c50d144: ("functions.phone", "LeaveGroupCallPresentation"),
+    0x1ab21940: ("functions.phone", "GetGroupCallStreamChannels"),
+    0xdeb3abbf: ("functions.phone", "GetGroupCallStreamRtmpUrl"),
+    0x41248786: ("functions.phone", "SaveCallLog"),
+    0xdfc909ab: ("functions.phone", "CreateConferenceCall"),
+    0xf2f2330a: ("functions.langpack", "GetLangPack"),
+    0xefea3803: ("functions.langpack", "GetStrings"),
+    0xcd984aa5: ("functions.langpack", "GetDifference"),
+    0x42c6978f: ("functions.langpack", "GetLanguages"),
+    0x6a596502: ("functions.langpack", "GetLanguage"),
+    0x6847d0ab: ("functions.folders", "EditPeerFolders"),
+    0xab42441a: ("functions.stats", "GetBroadcastStats"),
+    0x621d5fa0: ("functions.stats", "LoadAsyncGraph"),
+    0xdcdf8607: ("functions.stats", "GetMegagroupStats"),
+    0x5f150144: ("functions.stats", "GetMessagePublicForwards"),
+    0xb6e0a3f5: ("functions.stats", "GetMessageStats"),
+    0x374fef40: ("functions.stats", "GetStoryStats"),
+    0xa6437ef6: ("functions.stats", "GetStoryPublicForwards"),
+    0xf788ee19: ("functions.stats", "GetBroadcastRevenueStats"),
+    0x9df4faad: ("functions.stats", "GetBroadcastRevenueWithdrawalUrl"),
+    0x70990b6d: ("functions.stats", "GetBroadcastRevenueTransactions"),
+    0x8472478e: ("functions.chatlists", "ExportChatlistInvite"),
+    0x719c5c5e: ("functions.chatlists", "DeleteExportedInvite"),
+    0x653db63d: ("functions.chatlists", "EditExportedInvite"),
+    0xce03da83: ("functions.chatlists", "GetExportedInvites"),
+    0x41c10fff: ("functions.chatlists", "CheckChatlistInvite"),
+    0xa6b1e39a: ("functions.chatlists", "JoinChatlistInvite"),
+    0x89419521: ("functions.chatlists", "GetChatlistUpdates"),
+    0xe089f8f5: ("functions.chatlists", "JoinChatlistUpdates"),
+    0x66e486fb: ("functions.chatlists", "HideChatlistUpdates"),
+    0xfdbcd714: ("functions.chatlists", "GetLeaveChatlistSuggestions"),
+    0x74fae13a: ("functions.chatlists", "LeaveChatlist"),
+    0xc7dfdfdd: ("functions.stories", "CanSendStory"),
+    0xe4e6694b: ("functions.stories", "SendStory"),
+    0xb583ba46: ("functions.stories", "EditStory"),
+    0xae59db5f: ("functions.stories", "DeleteStories"),
+    0x9a75a1ef: ("functions.stories", "TogglePinned"),
+    0xeeb0d625: ("functions.stories", "GetAllStories"),
+    0x5821a5dc: ("functions.stories", "GetPinnedStories"),
+    0xb4352016: ("functions.stories", "GetStoriesArchive"),
+    0x5774ca74: ("functions.stories", "GetStoriesByID"),
+    0x7c2557c4: ("functions.stories", "ToggleAllStoriesHidden"),
+    0xa556dac8: ("functions.stories", "ReadStories"),
+    0xb2028afb: ("functions.stories", "IncrementStoryViews"),
+    0x7ed23c57: ("functions.stories", "GetStoryViewsList"),
+    0x28e16cc8: ("functions.stories", "GetStoriesViews"),
+    0x7b8def20: ("functions.stories", "ExportStoryLink"),
+    0x19d8eb45: ("functions.stories", "Report"),
+    0x57bbd166: ("functions.stories", "ActivateStealthMode"),
+    0x7fd736b2: ("functions.stories", "SendReaction"),
+    0x2c4ada50: ("functions.stories", "GetPeerStories"),
+    0x9b5ae7f9: ("functions.stories", "GetAllReadPeerStories"),
+    0x535983c3: ("functions.stories", "GetPeerMaxIDs"),
+    0xa56a8b60: ("functions.stories", "GetChatsToSend"),
+    0xbd0415c4: ("functions.stories", "TogglePeerStoriesHidden"),
+    0xb9b2881f: ("functions.stories", "GetStoryReactionsList"),
+    0xb297e9b: ("functions.stories", "TogglePinnedToTop"),
+    0xd1810907: ("functions.stories", "SearchPosts"),
+    0x60f67660: ("functions.premium", "GetBoostsList"),
+    0xbe77b4a: ("functions.premium", "GetMyBoosts"),
+    0x6b7da746: ("functions.premium", "ApplyBoost"),
+    0x42f1f61: ("functions.premium", "GetBoostsStatus"),
+    0x39854d1f: ("functions.premium", "GetUserBoosts"),
+    0xedc39d0: ("functions.smsjobs", "IsEligibleToJoin"),
+    0xa74ece2d: ("functions.smsjobs", "Join"),
+    0x9898ad73: ("functions.smsjobs", "Leave"),
+    0x93fa0bf: ("functions.smsjobs", "UpdateSettings"),
+    0x10a698e8: ("functions.smsjobs", "GetStatus"),
+    0x778d902f: ("functions.smsjobs", "GetSmsJob"),
+    0x4f1ebf24: ("functions.smsjobs", "FinishJob"),
+    0xbe1e85ba: ("functions.fragment", "GetCollectibleInfo"),
+    0x93d7b347: ("functions.channels", "GetMessages_40"),
+    0x4222fa74: ("functions.messages", "GetMessages_57"),
+    0x637ea878: ("functions.account", "RegisterDevice_70"),
+    0x65c55b40: ("functions.account", "UnregisterDevice_70"),
+    0x117698f1: ("types._root", "LangPackLanguage_72"),
+    0x9ab5c58e: ("functions.langpack", "GetLangPack_72"),
+    0x2e1ee318: ("functions.langpack", "GetStrings_72"),
+    0xb2e4d7d: ("functions.langpack", "GetDifference_72"),
+    0x800fd57d: ("functions.langpack", "GetLanguages_72"),
+    0x5b38c6c1: ("types._root", "InputMediaUploadedDocument_133"),
+    0x33473058: ("types._root", "InputMediaDocument_133"),
+    0xfb52dc99: ("types._root", "InputMediaDocumentExternal_133"),
+    0xd9799874: ("types._root", "InputMediaInvoice_133"),
+    0xc642724e: ("types._root", "InputChatUploadedPhoto_133"),
+    0x3ff6ecb0: ("types._root", "User_133"),
+    0xe26f42f1: ("types._root", "UserStatusRecently_133"),
+    0x7bf09fc: ("types._root", "UserStatusLastWeek_133"),
+    0x77ebc742: ("types._root", "UserStatusLastMonth_133"),
+    0x8261ac61: ("types._root", "Channel_133"),
+    0x4dbdc099: ("types._root", "ChatFull_133"),
+    0xe9b27a17: ("types._root", "ChannelFull_133"),
+    0x85d6cbe2: ("types._root", "Message_133"),
+    0x2b085862: ("types._root", "MessageService_133"),
+    0x9cb070d7: ("types._root", "MessageMediaDocument_133"),
+    0xa32dd600: ("types._root", "MessageMediaWebPage_133"),
+    0x84551347: ("types._root", "MessageMediaInvoice_133"),
+    0x8f31b327: ("types._root", "MessageActionPaymentSentMe_133"),
+    0x40699cd0: ("types._root", "MessageActionPaymentSent_133"),
+    0xabe9affe: ("types._root", "MessageActionBotAllowed_133"),
+    0xaa1afbfd: ("types._root", "MessageActionSetMessagesTTL_133"),
+    0x2c171f72: ("types._root", "Dialog_133"),
+    0xcd050916: ("types.auth", "Authorization_133"),
+    0x9c3d198e: ("types._root", "InputPeerNotifySettings_133"),
+    0xaf509d20: ("types._root", "PeerNotifySettings_133"),
+    0x733f2961: ("types._root", "PeerSettings_133"),
+    0xd697ff05: ("types._root", "UserFull_133"),
+    0x64479808: ("types.messages", "ChannelMessages_133"),
+    0xc3f202e0: ("types._root", "UpdateUserName_133"),
+    0xf227868c: ("types._root", "UpdateUserPhoto_133"),
+    0x68c13933: ("types._root", "UpdateReadMessagesContents_133"),
+    0x43ae3dec: ("types._root", "UpdateStickerSets_133"),
+    0xee2bb969: ("types._root", "UpdateDraftMessage_133"),
+    0x44bdd535: ("types._root", "UpdateChannelReadMessagesContents_133"),
+    0x90866cee: ("types._root", "UpdateDeleteScheduledMessages_133"),
+    0x106395c9: ("types._root", "UpdateMessagePollVote_133"),
+    0x246a4b22: ("types._root", "UpdatePeerBlocked_133"),
+    0x14b24500: ("types._root", "UpdateGroupCall_133"),
+    0x330b4067: ("types._root", "Config_133"),
+    0x4a70994c: ("types._root", "EncryptedFile_133"),
+    0x1e87342b: ("types._root", "Document_133"),
+    0xef02ce6: ("types._root", "DocumentAttributeVideo_133"),
+    0xeb1477e8: ("types._root", "WebPageEmpty_133"),
+    0xc586da1c: ("types._root", "WebPagePending_133"),
+    0x1250abde: ("types.account", "Authorizations_133"),
+    0x185b184f: ("types.account", "Password_133"),
+    0xb18105e8: ("types._root", "ChatInviteExported_133"),
+    0xdfc2f58e: ("types._root", "ChatInvite_133"),
+    0xd7df217a: ("types._root", "StickerSet_133"),
+    0xb60a24a6: ("types.messages", "StickerSet_133"),
+    0x1b74b335: ("types._root", "BotInfo_133"),
+    0x568a748: ("types._root", "KeyboardButtonSwitchInline_133"),
+    0xc00c07c0: ("types._root", "ChannelParticipant_133"),
+    0x28a8bc67: ("types._root", "ChannelParticipantSelf_133"),
+    0x947ca848: ("types.messages", "BotResults_133"),
+    0x5f777dce: ("types._root", "MessageFwdHeader_133"),
+    0xfd8e711f: ("types._root", "DraftMessage_133"),
+    0x84c02310: ("types.messages", "FeaturedStickers_133"),
+    0xcd886e0: ("types._root", "Invoice_133"),
+    0x1694761b: ("types.payments", "PaymentForm_133"),
+    0xffa0a496: ("types._root", "InputStickerSetItem_133"),
+    0xc5226f17: ("types._root", "PhoneCallWaiting_133"),
+    0x14b0ed0c: ("types._root", "PhoneCallRequested_133"),
+    0x3660c311: ("types._root", "PhoneCallAccepted_133"),
+    0x967f7c67: ("types._root", "PhoneCall_133"),
+    0x50ca4de1: ("types._root", "PhoneCallDiscarded_133"),
+    0x9d4c17c0: ("types._root", "PhoneConnection_133"),
+    0x5cdada77: ("types._root", "ChannelAdminLogEventActionParticipantJoinByInvite_133"),
+    0x6242c773: ("types._root", "FileHash_133"),
+    0xe0277a62: ("types._root", "SecureFile_133"),
+    0x6ca9c2e9: ("types._root", "PollAnswer_133"),
+    0x86e18161: ("types._root", "Poll_133"),
+    0xdcb82ea3: ("types._root", "PollResults_133"),
+    0xdebebe83: ("types._root", "CodeSettings_133"),
+    0x1dc1bca4: ("types._root", "WallPaperSettings_133"),
+    0xe04232f3: ("types._root", "AutoDownloadSettings_133"),
+    0xe802b8dc: ("types._root", "Theme_133"),
+    0x34d247b4: ("types._root", "MessageUserVote_133"),
+    0x3ca5b0ec: ("types._root", "MessageUserVoteInputOption_133"),
+    0x8a65e557: ("types._root", "MessageUserVoteMultiple_133"),
+    0x823f649: ("types.messages", "VotesList_133"),
+    0x7438f7e8: ("types._root", "DialogFilter_133"),
+    0xad4fc9bd: ("types._root", "MessageInteractionCounters_133"),
+    0xbdf78394: ("types.stats", "BroadcastStats_133"),
+    0xbea2f424: ("types._root", "GlobalPrivacySettings_133"),
+    0xa6d57763: ("types._root", "MessageReplyHeader_133"),
+    0x8999f295: ("types.stats", "MessageStats_133"),
+    0xd597650c: ("types._root", "GroupCall_133"),
+    0xb5cd5f4: ("types._root", "ChatInviteImporter_133"),
+    0xed0b5c33: ("types._root", "ChatTheme_133"),
+    0xe011e1c4: ("types.account", "ChatThemesNotModified_133"),
+    0xfe4cbebd: ("types.account", "ChatThemes_133"),
+    0x2a3c381f: ("types._root", "SponsoredMessage_133"),
+    0x65a4c7d5: ("types.messages", "SponsoredMessages_133"),
+    0x80eee427: ("functions.auth", "SignUp_133"),
+    0xbcd51581: ("functions.auth", "SignIn_133"),
+    0x5717da40: ("functions.auth", "LogOut_133"),
+    0x3ef1a9bf: ("functions.auth", "ResendCode_133"),
+    0x418d4e0b: ("functions.account", "DeleteAccount_133"),
+    0x7011509f: ("functions.account", "SendVerifyEmailCode_133"),
+    0xecba39db: ("functions.account", "VerifyEmail_133"),
+    0xf05b4804: ("functions.account", "InitTakeoutSession_133"),
+    0xdd853661: ("functions.account", "UploadWallPaper_133"),
+    0x8432c21f: ("functions.account", "CreateTheme_133"),
+    0x5cb367d5: ("functions.account", "UpdateTheme_133"),
+    0x7ae43737: ("functions.account", "InstallTheme_133"),
+    0x8d9d742b: ("functions.account", "GetTheme_133"),
+    0xd6d71d7b: ("functions.account", "GetChatThemes_133"),
+    0xca30a5b1: ("functions.users", "GetFullUser_133"),
+    0x68cc1411: ("functions.contacts", "Block_133"),
+    0xbea65d50: ("functions.contacts", "Unblock_133"),
+    0xf57c350f: ("functions.contacts", "GetBlocked_133"),
+    0xf93ccba3: ("functions.contacts", "ResolveUsername_133"),
+    0xa0fda762: ("functions.messages", "Search_133"),
+    0x1c015b09: ("functions.messages", "DeleteHistory_133"),
+    0x520c3870: ("functions.messages", "SendMessage_133"),
+    0x3491eba9: ("functions.messages", "SendMedia_133"),
+    0xd9fee60e: ("functions.messages", "ForwardMessages_133"),
+    0x3672e09c: ("functions.messages", "GetPeerSettings_133"),
+    0x8953ab4e: ("functions.messages", "Report_133"),
+    0xf24753e3: ("functions.messages", "AddChatUser_133"),
+    0x9cb126e: ("functions.messages", "CreateChat_133"),
+    0x8b68b0cc: ("functions.messages", "GetWebPagePreview_133"),
+    0x14b9bcd7: ("functions.messages", "ExportChatInvite_133"),
+    0x2619a90e: ("functions.messages", "GetStickerSet_133"),
+    0x338e2464: ("functions.messages", "GetDocumentByHash_133"),
+    0xeb5ea206: ("functions.messages", "SetInlineBotResults_133"),
+    0x220815b0: ("functions.messages", "SendInlineBotResult_133"),
+    0x48f71778: ("functions.messages", "EditMessage_133"),
+    0xbc39e14b: ("functions.messages", "SaveDraft_133"),
+    0x32ca8f91: ("functions.messages", "GetWebPage_133"),
+    0x519bc2b1: ("functions.messages", "UploadMedia_133"),
+    0xc97df020: ("functions.messages", "SendScreenshotNotification_133"),
+    0x46578472: ("functions.messages", "GetUnreadMentions_133"),
+    0xf0189d3: ("functions.messages", "ReadMentions_133"),
+    0xcc0110cb: ("functions.messages", "SendMultiMedia_133"),
+    0x732eef00: ("functions.messages", "GetSearchCounters_133"),
+    0xf19ed96d: ("functions.messages", "GetDialogFilters_133"),
+    0xf025bc8b: ("functions.messages", "UnpinAllMessages_133"),
+    0x2e4ffbe: ("functions.messages", "EditExportedChatInvite_133"),
+    0x26fb7289: ("functions.messages", "GetChatInviteImporters_133"),
+    0x2c6f97b7: ("functions.messages", "GetMessageReadParticipants_133"),
+    0x25939651: ("functions.updates", "GetDifference_133"),
+    0x72d4742c: ("functions.photos", "UpdateProfilePhoto_133"),
+    0x89f30f69: ("functions.photos", "UploadProfilePhoto_133"),
+    0xb15a9afc: ("functions.upload", "GetFile_133"),
+    0x2000bcc3: ("functions.upload", "GetCdnFile_133"),
+    0x4da54231: ("functions.upload", "GetCdnFileHashes_133"),
+    0xc7025931: ("functions.upload", "GetFileHashes_133"),
+    0x9010ef6f: ("functions.help", "GetAppChangelog_133"),
+    0x98914110: ("functions.help", "GetAppConfig_133"),
+    0xd10dd71b: ("functions.channels", "DeleteUserHistory_133"),
+    0xfe087810: ("functions.channels", "ReportSpam_133"),
+    0x3d5fb10f: ("functions.channels", "CreateChannel_133"),
+    0x199f3a6c: ("functions.channels", "InviteToChannel_133"),
+    0x1f69b606: ("functions.channels", "ToggleSignatures_133"),
+    0xaf369d42: ("functions.channels", "DeleteHistory_133"),
+    0xbeaedb94: ("functions.channels", "ViewSponsoredMessage_133"),
+    0xec210fbf: ("functions.channels", "GetSponsoredMessages_133"),
+    0x8a333c8d: ("functions.payments", "GetPaymentForm_133"),
+    0xdb103170: ("functions.payments", "ValidateRequestedInfo_133"),
+    0x30c3bc9d: ("functions.payments", "SendPaymentForm_133"),
+    0x9a364e30: ("functions.stickers", "SetStickerSetThumb_133"),
+    0x42ff96ed: ("functions.phone", "RequestCall_133"),
+    0xb132ff7b: ("functions.phone", "JoinGroupCall_133"),
+    0x5630281b: ("functions.stats", "GetMessagePublicForwards_133"),
+    0x46a6ffb4: ("types._root", "ChatFull_134"),
+    0x59cff963: ("types._root", "ChannelFull_134"),
+    0xab4a819: ("types._root", "ChatInviteExported_134"),
+    0x300c44c1: ("types._root", "ChatInvite_134"),
+    0x35a8bfa7: ("types._root", "ChannelParticipantSelf_134"),
+    0xd151e19a: ("types._root", "SponsoredMessage_134"),
+    0xa02ce5d5: ("functions.messages", "ExportChatInvite_134"),
+    0x49f0bde9: ("functions.messages", "GetSearchResultsCalendar_134"),
+    0x6e9583a3: ("functions.messages", "GetSearchResultsPositions_134"),
+    0x56662e2e: ("types._root", "ChannelFull_135"),
+    0x33fb7bb8: ("types.auth", "Authorization_135"),
+    0xa518110d: ("types._root", "PeerSettings_135"),
+    0xcf366521: ("types._root", "UserFull_135"),
+    0x8a6469c2: ("types._root", "CodeSettings_135"),
+    0x8356cda9: ("types.channels", "SendAsPeers_135"),
+    0xd9d75a4: ("functions.messages", "SendMessage_135"),
+    0xe25ff8e0: ("functions.messages", "SendMedia_135"),
+    0xcc30290b: ("functions.messages", "ForwardMessages_135"),
+    0x7aa11297: ("functions.messages", "SendInlineBotResult_135"),
+    0xf803138f: ("functions.messages", "SendMultiMedia_135"),
+    0xdc770ee: ("functions.channels", "GetSendAs_135"),
+    0xd18ee226: ("types._root", "ChatFull_136"),
+    0xe13c3d20: ("types._root", "ChannelFull_136"),
+    0x38116ee0: ("types._root", "Message_136"),
+    0x154798c3: ("types._root", "UpdateMessageReactions_136"),
+    0x9cf7f76a: ("types._root", "ChannelAdminLogEventActionChangeAvailableReactions_136"),
+    0x3a836df8: ("types._root", "SponsoredMessage_136"),
+    0x6fb250d1: ("types._root", "ReactionCount_136"),
+    0x87b6e36: ("types._root", "MessageReactions_136"),
+    0x932844fa: ("types._root", "MessageUserReaction_136"),
+    0xa366923c: ("types.messages", "MessageReactionsList_136"),
+    0x21d7c4b: ("types._root", "AvailableReaction_136"),
+    0x25690ce4: ("functions.messages", "SendReaction_136"),
+    0xe0ee6b77: ("functions.messages", "GetMessageReactionsList_136"),
+    0x14050ea6: ("functions.messages", "SetChatAvailableReactions_136"),
+    0xd960c4d4: ("functions.messages", "SetDefaultReaction_136"),
+    0x67ca4737: ("types.messages", "TranslateNoResult_137"),
+    0xa214f7d0: ("types.messages", "TranslateResultText_137"),
+    0x24ce6dee: ("functions.messages", "TranslateText_137"),
+    0xa8edd0f5: ("types._root", "Dialog_138"),
+    0x4f2b9479: ("types._root", "MessageReactions_138"),
+    0x51b67eff: ("types._root", "MessagePeerReaction_138"),
+    0xe85bae1a: ("functions.messages", "GetUnreadReactions_138"),
+    0x82e251d7: ("functions.messages", "ReadReactions_138"),
+    0xea68a619: ("types._root", "ChannelFull_140"),
+    0xdf1f002b: ("types._root", "InputPeerNotifySettings_140"),
+    0xa83b0426: ("types._root", "PeerNotifySettings_140"),
+    0x8c72ea81: ("types._root", "UserFull_140"),
+    0xe4169b5d: ("types._root", "BotInfo_140"),
+    0xe93cb772: ("types._root", "AttachMenuBot_140"),
+    0xc14557c: ("types._root", "WebViewResultUrl_140"),
+    0x882f76bb: ("types._root", "SimpleWebViewResultUrl_140"),
+    0x1aee33af: ("functions.messages", "ToggleBotInAttachMenu_140"),
+    0xfa04dff: ("functions.messages", "RequestWebView_140"),
+    0xd22ad148: ("functions.messages", "ProlongWebView_140"),
+    0x6abb2f73: ("functions.messages", "RequestSimpleWebView_140"),
+    0x96163f56: ("types._root", "MessageActionPaymentSent_143"),
+    0x8f300b57: ("types._root", "BotInfo_143"),
+    0x3e85a91b: ("types._root", "Invoice_143"),
+    0xb0133b37: ("types.payments", "PaymentForm_143"),
+    0x8efab953: ("types._root", "AutoDownloadSettings_143"),
+    0xc8aa2cd2: ("types._root", "AttachMenuBot_143"),
+    0x93752c52: ("types.messages", "TranscribedAudio_143"),
+    0x8a4f3c29: ("types.help", "PremiumPromo_143"),
+    0x91b15831: ("functions.messages", "RequestWebView_143"),
+    0xea5fbcce: ("functions.messages", "ProlongWebView_143"),
+    0xd5ccfd0: ("functions.payments", "AssignAppStoreTransaction_143"),
+    0x4faa4aed: ("functions.payments", "AssignPlayMarketTransaction_143"),
+    0xaa6a90c8: ("functions.payments", "CanPurchasePremium_143"),
+    0xaba0f5c6: ("types._root", "MessageActionGiftPremium_144"),
+    0xc4b1fc3f: ("types._root", "UserFull_144"),
+    0x1aed5ee5: ("types._root", "StickerSetFullCovered_144"),
+    0x74c34319: ("types._root", "PremiumGiftOption_144"),
+    0x9fc19eb6: ("functions.payments", "CanPurchasePremium_144"),
+    0x5d99adee: ("types._root", "User_145"),
+    0xc9d31138: ("types._root", "ChatFull_145"),
+    0xf2355507: ("types._root", "ChannelFull_145"),
+    0x232566ac: ("types._root", "Config_145"),
+    0x5a159841: ("types.auth", "SentCodeTypeEmailCode_145"),
+    0xb156fe9c: ("types._root", "MessagePeerReaction_145"),
+    0x929b619d: ("types._root", "EmojiStatus_145"),
+    0xfa30a8c7: ("types._root", "EmojiStatusUntil_145"),
+    0xb6f11ebe: ("types._root", "PremiumSubscriptionOption_145"),
+    0xfeb16771: ("functions.messages", "SetChatAvailableReactions_145"),
+    0xfc87a53c: ("functions.messages", "RequestWebView_145"),
+    0x299bec8e: ("functions.messages", "RequestSimpleWebView_145"),
+    0x8eb5a6d5: ("types._root", "InputMediaInvoice_147"),
+    0x5a73a98c: ("types._root", "UpdateMessageExtendedMedia_147"),
+    0x8f97c628: ("types._root", "User_148"),
+    0x83259464: ("types._root", "Channel_148"),
+    0xb18a431c: ("types._root", "MessageActionTopicEdit_148"),
+    0xf694b0ae: ("types._root", "UpdateChannelPinnedTopic_148"),
+    0x1cc20387: ("functions.messages", "SendMessage_148"),
+    0x7547c966: ("functions.messages", "SendMedia_148"),
+    0xc661bbc4: ("functions.messages", "ForwardMessages_148"),
+    0xd3fbdccb: ("functions.messages", "SendInlineBotResult_148"),
+    0xb4331e3f: ("functions.messages", "SaveDraft_148"),
+    0xb6f11a1c: ("functions.messages", "SendMultiMedia_148"),
+    0xae7cc1: ("functions.messages", "GetSearchCounters_148"),
+    0x178b480b: ("functions.messages", "RequestWebView_148"),
+    0x7ff34309: ("functions.messages", "ProlongWebView_148"),
+    0x6c883e2d: ("functions.channels", "EditForumTopic_148"),
+    0x34a818: ("functions.messages", "CreateChat_150"),
+    0xe7e75f97: ("types._root", "MessageActionAttachMenuBotAllowed_151"),
+    0xf8d32aed: ("types._root", "UserFull_151"),
+    0x1c3d5956: ("functions.photos", "UpdateProfilePhoto_151"),
+    0xb91a83bf: ("functions.photos", "UploadContactProfilePhoto_151"),
+    0xfe77345d: ("types._root", "MessageActionRequestedPeer_152"),
+    0xd0b468c: ("types._root", "KeyboardButtonRequestPeer_152"),
+    0xe57b1432: ("types.auth", "SentCodeTypeFirebaseSms_152"),
+    0x89464b50: ("functions.auth", "RequestFirebaseSms_152"),
+    0xfe38d01b: ("functions.messages", "SendBotRequestedPeer_152"),
+    0x93c9a51: ("functions.photos", "UploadProfilePhoto_152"),
+    0xccf08ad6: ("types._root", "UpdateGroupInvitePrivacyForbidden_155"),
+    0xfc25b828: ("types._root", "SponsoredMessage_155"),
+    0x3c1b4f0d: ("types._root", "AppWebViewResultUrl_155"),
+    0x8c5a3b3c: ("functions.messages", "RequestAppWebView_155"),
+    0xa365df7a: ("functions.bots", "SetBotInfo_155"),
+    0x75ec12e6: ("functions.bots", "GetBotInfo_155"),
+    0xc83d6aec: ("types._root", "MessageActionGiftPremium_158"),
+    0xbc44a927: ("types._root", "MessageActionSetChatWallPaper_158"),
+    0xc0787d6d: ("types._root", "MessageActionSetSameChatWallPaper_158"),
+    0x93eadb53: ("types._root", "UserFull_158"),
+    0xd64a04a8: ("types._root", "DialogFilterChatlist_158"),
+    0x1dcd839d: ("types.chatlists", "ChatlistInvite_158"),
+    0x9a86b58f: ("types._root", "InputMediaStory_160"),
+    0xabb5f120: ("types._root", "User_160"),
+    0x4cf4d72d: ("types._root", "MessageMediaDocument_160"),
+    0xcbb20d88: ("types._root", "MessageMediaStory_160"),
+    0x4fe1cc86: ("types._root", "UserFull_160"),
+    0x205a4133: ("types._root", "UpdateStory_160"),
+    0xfeb5345a: ("types._root", "UpdateReadStories_160"),
+    0xd38ff1c2: ("types._root", "DocumentAttributeVideo_160"),
+    0x20df5d0: ("types._root", "MessageEntityBlockquote_160"),
+    0x939a4671: ("types._root", "WebPageAttributeStory_160"),
+    0x734c4ccb: ("types._root", "GlobalPrivacySettings_160"),
+    0x9c98bfc1: ("types._root", "MessageReplyStoryHeader_160"),
+    0xdaafff6b: ("types._root", "SponsoredMessage_160"),
+    0x3db8ec63: ("types._root", "SponsoredWebPage_160"),
+    0xd36760cf: ("types._root", "StoryViews_160"),
+    0x562aa637: ("types._root", "StoryItem_160"),
+    0x8611a200: ("types._root", "UserStories_160"),
+    0x47e0a07e: ("types.stories", "AllStoriesNotModified_160"),
+    0x839e0428: ("types.stories", "AllStories_160"),
+    0x4fe57df1: ("types.stories", "Stories_160"),
+    0x37a6ff5f: ("types.stories", "UserStories_160"),
+    0xa71aacc2: ("types._root", "StoryView_160"),
+    0xfb3f77ac: ("types.stories", "StoryViewsList_160"),
+    0x9c5386e4: ("types._root", "InputReplyToMessage_160"),
+    0x15b0f283: ("types._root", "InputReplyToStory_160"),
+    0xca1cb9ab: ("functions.users", "GetStoriesMaxIDs_160"),
+    0x753fb865: ("functions.contacts", "ToggleStoriesHidden_160"),
+    0x280d096f: ("functions.messages", "SendMessage_160"),
+    0x72ccc23d: ("functions.messages", "SendMedia_160"),
+    0xf7bc68ba: ("functions.messages", "SendInlineBotResult_160"),
+    0x456e8987: ("functions.messages", "SendMultiMedia_160"),
+    0x18afbc93: ("functions.channels", "ClickSponsoredMessage_160"),
+    0x424cd47a: ("functions.stories", "SendStory_160"),
+    0x2aae7a41: ("functions.stories", "EditStory_160"),
+    0xb5d501d7: ("functions.stories", "DeleteStories_160"),
+    0x51602944: ("functions.stories", "TogglePinned_160"),
+    0x96d528e0: ("functions.stories", "GetUserStories_160"),
+    0xb471137: ("functions.stories", "GetPinnedStories_160"),
+    0x1f5bc5d2: ("functions.stories", "GetStoriesArchive_160"),
+    0x6a15cf46: ("functions.stories", "GetStoriesByID_160"),
+    0x729c562c: ("functions.stories", "GetAllReadUserStories_160"),
+    0xedc5105b: ("functions.stories", "ReadStories_160"),
+    0x22126127: ("functions.stories", "IncrementStoryViews_160"),
+    0x4b3b5e97: ("functions.stories", "GetStoryViewsList_160"),
+    0x9a75d6a6: ("functions.stories", "GetStoriesViews_160"),
+    0x16e443ce: ("functions.stories", "ExportStoryLink_160"),
+    0xc95be06a: ("functions.stories", "Report_160"),
+    0xe3a73d20: ("types._root", "UpdateSentStoryReaction_161"),
+    0xc64c0b97: ("types._root", "StoryViews_161"),
+    0x44c457ce: ("types._root", "StoryItem_161"),
+    0x519d899e: ("types.stories", "AllStories_161"),
+    0x46e9b9ec: ("types.stories", "StoryViewsList_161"),
+    0x3d1ea4e: ("types._root", "MediaAreaCoordinates_161"),
+    0xdf8b3b22: ("types._root", "MediaAreaGeoPoint_161"),
+    0xd455fcec: ("functions.stories", "SendStory_161"),
+    0xa9b91ae4: ("functions.stories", "EditStory_161"),
+    0xf95f61a4: ("functions.stories", "GetStoryViewsList_161"),
+    0x49aaa9b3: ("functions.stories", "SendReaction_161"),
+    0xb100d45d: ("functions.stories", "CanSendStory_162"),
+    0x1a46500a: ("functions.messages", "RequestSimpleWebView_163"),
+    0x94f592db: ("types._root", "Channel_164"),
+    0x723027bd: ("types._root", "ChannelFull_164"),
+    0xb9b12c6c: ("types._root", "UserFull_164"),
+    0x5db95a15: ("types._root", "Invoice_164"),
+    0x5dd8c3c8: ("types.stories", "Stories_164"),
+    0x66ea1fef: ("types.stories", "BoostsStatus_164"),
+    0xc3173587: ("types.stories", "CanApplyBoostOk_164"),
+    0x712c4655: ("types.stories", "CanApplyBoostReplace_164"),
+    0xe9e6380: ("types._root", "Booster_164"),
+    0xf3dd3d1d: ("types.stories", "BoostersList_164"),
+    0xbcb73644: ("functions.stories", "SendStory_164"),
+    0x1923fa8c: ("functions.stories", "Report_164"),
+    0x4c449472: ("functions.stories", "GetBoostsStatus_164"),
+    0x337ef980: ("functions.stories", "GetBoostersList_164"),
+    0xdb05c1bd: ("functions.stories", "CanApplyBoost_164"),
+    0xf29d7c2b: ("functions.stories", "ApplyBoost_164"),
+    0xe5c1aa5c: ("types.stories", "BoostsStatus_165"),
+    0xeb602f25: ("types._root", "User_166"),
+    0x1981ea7e: ("types._root", "Channel_166"),
+    0x58260664: ("types._root", "MessageMediaGiveaway_166"),
+    0xd2cfdb0e: ("types._root", "MessageActionGiftCode_166"),
+    0x332ba9ed: ("types._root", "MessageActionGiveawayLaunch_166"),
+    0xcde0ec40: ("types._root", "ChatInvite_166"),
+    0x3fccf7ef: ("types._root", "DraftMessage_166"),
+    0x3c2b247b: ("types._root", "ChannelAdminLogEventActionChangeColor_166"),
+    0x445fc434: ("types._root", "ChannelAdminLogEventActionChangeBackgroundEmoji_166"),
+    0x6eebcabd: ("types._root", "MessageReplyHeader_166"),
+    0xa3805f3f: ("types._root", "InputStorePaymentPremiumGiftCode_166"),
+    0x7c9375e6: ("types._root", "InputStorePaymentPremiumGiveaway_166"),
+    0x73ec805: ("types._root", "InputReplyToMessage_166"),
+    0xb722f158: ("types.payments", "CheckedGiftCode_166"),
+    0xcd5570: ("types.payments", "GiveawayInfoResults_166"),
+    0x2a1c8c71: ("types._root", "Boost_166"),
+    0xa001cc43: ("functions.account", "UpdateColor_166"),
+    0x7ff3b806: ("functions.messages", "SaveDraft_166"),
+    0x621a201f: ("functions.channels", "UpdateColor_166"),
+    0x215c4438: ("types._root", "User_167"),
+    0x8e87ccd8: ("types._root", "Channel_167"),
+    0x2a9fadc5: ("types._root", "MessageActionGiveawayResults_167"),
+    0xed5383f7: ("types._root", "SponsoredMessage_167"),
+    0xaf6365a1: ("types._root", "StoryItem_167"),
+    0x135bd42f: ("types.help", "PeerColorOption_167"),
+    0x83b70d97: ("functions.channels", "GetChannelRecommendations_167"),
+    0xaadfc8f: ("types._root", "Channel_168"),
+    0xf2bcb6f: ("types._root", "ChannelFull_168"),
+    0xdaad85b0: ("types._root", "MessageMediaGiveaway_168"),
+    0xc6991068: ("types._root", "MessageMediaGiveawayResults_168"),
+    0x678c2e09: ("types._root", "MessageActionGiftCode_168"),
+    0xef8430ab: ("types.help", "PeerColorOption_168"),
+    0x76bec211: ("types._root", "Message_170"),
+    0xa7b4e929: ("functions.messages", "Search_170"),
+    0x761ddacf: ("functions.messages", "GetSavedReactionTags_171"),
+    0x44c054a7: ("types._root", "ChannelFull_174"),
+    0x1e4c8a69: ("types._root", "Message_174"),
+    0xa622aa10: ("functions.users", "GetIsPremiumRequiredToContact_174"),
+    0xa66c7efc: ("types._root", "Message_176"),
+    0x22ff3e85: ("types._root", "UserFull_176"),
+    0x5fb5523b: ("types._root", "DialogFilter_176"),
+    0x9fe28ea4: ("types._root", "DialogFilterChatlist_176"),
+    0xe7e999e7: ("types._root", "ConnectedBot_176"),
+    0x9c2d527d: ("functions.account", "UpdateConnectedBot_176"),
+    0xdff8042c: ("functions.messages", "SendMessage_176"),
+    0x7bd66041: ("functions.messages", "SendMedia_176"),
+    0xd5039208: ("functions.messages", "ForwardMessages_176"),
+    0x3ebee86a: ("functions.messages", "SendInlineBotResult_176"),
+    0xc964709: ("functions.messages", "SendMultiMedia_176"),
+    0x33153ad4: ("functions.messages", "SendQuickReplyMessages_176"),
+    0x2357bf25: ("types._root", "Message_177"),
+    0xacd66c5e: ("types._root", "PeerSettings_177"),
+    0xcc997720: ("types._root", "UserFull_177"),
+    0x30535af5: ("types._root", "PhoneCall_177"),
+    0xbd068601: ("types._root", "ConnectedBot_177"),
+    0x896433b4: ("types._root", "BotBusinessConnection_177"),
+    0xd07b4bad: ("types.stats", "BroadcastRevenueStats_177"),
+    0x43d8521d: ("functions.account", "UpdateConnectedBot_177"),
+    0xaf8ff6b9: ("functions.channels", "ReportSponsoredMessage_177"),
+    0x75dfb671: ("functions.stats", "GetBroadcastRevenueStats_177"),
+    0x2a65ef73: ("functions.stats", "GetBroadcastRevenueWithdrawalUrl_177"),
+    0x69280f: ("functions.stats", "GetBroadcastRevenueTransactions_177"),
+    0xbbab348d: ("types._root", "ChannelFull_179"),
+    0x5c65d358: ("types._root", "UpdateBroadcastRevenueTransactions_179"),
+    0xbdedf566: ("types._root", "SponsoredMessage_179"),
+    0x8438f1c6: ("types._root", "BroadcastRevenueBalances_179"),
+    0x5a150bd4: ("functions.messages", "SetChatAvailableReactions_179"),
+    0x94345242: ("types._root", "Message_181"),
+    0xfb85198: ("types._root", "UpdateStarsBalance_181"),
+    0x13c90f17: ("types.auth", "SentCodeTypeFirebaseSms_181"),
+    0x1da33ad8: ("types._root", "InputInvoiceStars_181"),
+    0x4f0ee8df: ("types._root", "InputStorePaymentStars_181"),
+    0xcc7079b2: ("types._root", "StarsTransaction_181"),
+    0x8cf4ee60: ("types.payments", "StarsStatus_181"),
+    0x983f9745: ("functions.messages", "SendMessage_181"),
+    0x7852834e: ("functions.messages", "SendMedia_181"),
+    0x37b74355: ("functions.messages", "SendMultiMedia_181"),
+    0x673ac2f9: ("functions.payments", "GetStarsTransactions_181"),
+    0x2bb731d: ("functions.payments", "SendStarsForm_181"),
+    0xaa00c898: ("types._root", "StarsTransaction_182"),
+    0x79342946: ("types._root", "StarsRevenueStatus_182"),
+    0x97938d5a: ("functions.payments", "GetStarsTransactions_182"),
+    0x6cea116a: ("functions.stories", "SearchPosts_182"),
+    0xaa661fc3: ("types._root", "InputMediaPaidMedia_183"),
+    0x2db5418f: ("types._root", "StarsTransaction_183"),
+    0x83314fca: ("types._root", "User_185"),
+    0x17399fad: ("types._root", "DocumentAttributeVideo_185"),
+    0xfe4478bd: ("types._root", "Channel_186"),
+    0xfe65389d: ("types._root", "ChatInvite_186"),
+    0x82437e74: ("types._root", "BotInfo_186"),
+    0x433aeb2b: ("types._root", "StarsTransaction_186"),
+    0xbbfa316c: ("types.payments", "StarsStatus_186"),
+    0x538ecf18: ("types._root", "StarsSubscription_186"),
+    0x25c8fe3e: ("functions.messages", "SendPaidReaction_186"),
+    0x849ad397: ("functions.messages", "TogglePaidReactionPrivacy_186"),
+    0x51ca7aec: ("types._root", "UpdatePaidReactionPrivacy_187"),
+    0xee7522d5: ("types._root", "StarsTransaction_187"),
+    0x9dd6a67b: ("functions.messages", "SendPaidReaction_187"),
+    0xdd570bd5: ("types._root", "MessageMediaDocument_189"),
+    0x9bb3ef44: ("types._root", "MessageActionStarGift_189"),
+    0x1f58e369: ("types._root", "UserFull_189"),
+    0x25d8c1d8: ("types._root", "InputInvoiceStarGift_189"),
+    0xa9ee4c2: ("types._root", "StarsTransaction_189"),
+    0xaea174ee: ("types._root", "StarGift_189"),
+    0xeea49a6e: ("types._root", "UserStarGift_189"),
+    0x6b65b517: ("types.payments", "UserStarGifts_189"),
+    0x1445d75: ("functions.channels", "ClickSponsoredMessage_189"),
+    0x5e72c7e1: ("functions.payments", "GetUserStarGifts_189"),
+    0x87acf08e: ("functions.payments", "SaveStarGift_189"),
+    0x421e027: ("functions.payments", "ConvertStarGift_189"),
+    0x35d4f276: ("types._root", "StarsTransaction_192"),
+    0x49c577cd: ("types._root", "StarGift_192"),
+    0x673ad8f1: ("functions.messages", "ViewSponsoredMessage_192"),
+    0xf093465: ("functions.messages", "ClickSponsoredMessage_192"),
+    0x1af3dbb8: ("functions.messages", "ReportSponsoredMessage_192"),
+    0x8557637: ("types._root", "MessageActionStarGift_193"),
+    0x2d13c6ee: ("types._root", "UpdateBotSubscriptionExpire_193"),
+    0x36607333: ("types._root", "BotInfo_193"),
+    0x979d2376: ("types._root", "UserFull_195"),
+    0x64dfc926: ("types._root", "StarsTransaction_195"),
+    0x4b46c37e: ("types._root", "User_196"),
+    0xe00998b7: ("types._root", "Channel_196"),
+    0x9ff3b858: ("types._root", "ChannelFull_196"),
+    0x96fdbbe9: ("types._root", "Message_196"),
+    0xd8f4f0a7: ("types._root", "MessageActionStarGift_196"),
+    0x26077b99: ("types._root", "MessageActionStarGiftUnique_196"),
+    0x4d975bbc: ("types._root", "UserFull_196"),
+    0xafe2b839: ("types._root", "PhoneCallDiscardReasonAllowGroupCall_196"),
+    0x5ebe7262: ("types._root", "InputInvoiceStarGiftUpgrade_196"),
+    0xae3ba9ed: ("types._root", "InputInvoiceStarGiftTransfer_196"),
+    0x6a1407cd: ("types._root", "StarGiftUnique_196"),
+    0x325835e1: ("types._root", "UserStarGift_196"),
+    0xc02c4f4b: ("types._root", "StarGiftAttributeOriginalDetails_196"),
+    0x92fd2aae: ("functions.payments", "SaveStarGift_196"),
+    0x72770c83: ("functions.payments", "ConvertStarGift_196"),
+    0xcf4f0781: ("functions.payments", "UpgradeStarGift_196"),
+    0x333fb526: ("functions.payments", "TransferStarGift_196"),
+    0xb502e4a5: ("functions.payments", "GetUserStarGift_196"),
+    0x3482f322: ("types._root", "StarGiftUnique_197"),
+    0xf2fe7e4a: ("types._root", "StarGiftUnique_198"),
+    0x6d74da08: ("functions.messages", "ForwardMessages_198"),
+    0xd2234ea0: ("types._root", "UserFull_200"),
+    0xc9d8df1c: ("types._root", "GlobalPrivacySettings_200"),
+    0x5bb8e511: ("core_types", "Message"),
+    0x73f1f8dc: ("core_types", "MsgContainer"),
+    0xf35c6d01: ("core_types", "RpcResult"),
+    0x3072cfa1: ("core_types", "GzipPacked"),
+    0xae500895: ("core_types", "FutureSalts"),
+    0x997275b5: ("primitives", "BoolTrue"),
+    0xbc799737: ("primitives", "BoolFalse"),
+})
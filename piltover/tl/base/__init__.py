@@ -0,0 +1,800 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover.tl.lazy_import import lazy_getattr
+
+LAZY_INDEX = {
+    "internal": ("internal", None),
+    "internal_benchmarking": ("internal_benchmarking", None),
+    "internal_botfather": ("internal_botfather", None),
+    "internal_stickersbot": ("internal_stickersbot", None),
+    "internal_access": ("internal_access", None),
+    "help": ("help", None),
+    "storage": ("storage", None),
+    "auth": ("auth", None),
+    "contacts": ("contacts", None),
+    "messages": ("messages", None),
+    "updates": ("updates", None),
+    "photos": ("photos", None),
+    "upload": ("upload", None),
+    "account": ("account", None),
+    "channels": ("channels", None),
+    "payments": ("payments", None),
+    "phone": ("phone", None),
+    "stats": ("stats", None),
+    "stickers": ("stickers", None),
+    "users": ("users", None),
+    "chatlists": ("chatlists", None),
+    "bots": ("bots", None),
+    "stories": ("stories", None),
+    "premium": ("premium", None),
+    "smsjobs": ("smsjobs", None),
+    "fragment": ("fragment", None),
+    "FutureSalts": ("_root", "FutureSalts"),
+    "FutureSaltsInst": ("_root", "FutureSaltsInst"),
+    "WallPaper": ("_root", "WallPaper"),
+    "WallPaperInst": ("_root", "WallPaperInst"),
+    "Message": ("_root", "Message"),
+    "MessageInst": ("_root", "MessageInst"),
+    "Theme": ("_root", "Theme"),
+    "ThemeInst": ("_root", "ThemeInst"),
+    "Chat": ("_root", "Chat"),
+    "ChatInst": ("_root", "ChatInst"),
+    "User": ("_root", "User"),
+    "UserInst": ("_root", "UserInst"),
+    "EncryptedChat": ("_root", "EncryptedChat"),
+    "EncryptedChatInst": ("_root", "EncryptedChatInst"),
+    "PollResults": ("_root", "PollResults"),
+    "PollResultsInst": ("_root", "PollResultsInst"),
+    "PollAnswerVoters": ("_root", "PollAnswerVoters"),
+    "PollAnswerVotersInst": ("_root", "PollAnswerVotersInst"),
+    "PhoneCall": ("_root", "PhoneCall"),
+    "PhoneCallInst": ("_root", "PhoneCallInst"),
+    "Update": ("_root", "Update"),
+    "UpdateInst": ("_root", "UpdateInst"),
+    "StickerSet": ("_root", "StickerSet"),
+    "StickerSetInst": ("_root", "StickerSetInst"),
+    "ResPQ": ("_root", "ResPQ"),
+    "ResPQInst": ("_root", "ResPQInst"),
+    "PQInnerData": ("_root", "PQInnerData"),
+    "PQInnerDataInst": ("_root", "PQInnerDataInst"),
+    "BindAuthKeyInner": ("_root", "BindAuthKeyInner"),
+    "BindAuthKeyInnerInst": ("_root", "BindAuthKeyInnerInst"),
+    "ServerDHParams": ("_root", "ServerDHParams"),
+    "ServerDHParamsInst": ("_root", "ServerDHParamsInst"),
+    "ServerDHInnerData": ("_root", "ServerDHInnerData"),
+    "ServerDHInnerDataInst": ("_root", "ServerDHInnerDataInst"),
+    "ClientDHInnerData": ("_root", "ClientDHInnerData"),
+    "ClientDHInnerDataInst": ("_root", "ClientDHInnerDataInst"),
+    "SetClientDHParamsAnswer": ("_root", "SetClientDHParamsAnswer"),
+    "SetClientDHParamsAnswerInst": ("_root", "SetClientDHParamsAnswerInst"),
+    "DestroyAuthKeyRes": ("_root", "DestroyAuthKeyRes"),
+    "DestroyAuthKeyResInst": ("_root", "DestroyAuthKeyResInst"),
+    "MsgsAck": ("_root", "MsgsAck"),
+    "MsgsAckInst": ("_root", "MsgsAckInst"),
+    "BadMsgNotification": ("_root", "BadMsgNotification"),
+    "BadMsgNotificationInst": ("_root", "BadMsgNotificationInst"),
+    "MsgsStateReq": ("_root", "MsgsStateReq"),
+    "MsgsStateReqInst": ("_root", "MsgsStateReqInst"),
+    "MsgsStateInfo": ("_root", "MsgsStateInfo"),
+    "MsgsStateInfoInst": ("_root", "MsgsStateInfoInst"),
+    "MsgsAllInfo": ("_root", "MsgsAllInfo"),
+    "MsgsAllInfoInst": ("_root", "MsgsAllInfoInst"),
+    "MsgDetailedInfo": ("_root", "MsgDetailedInfo"),
+    "MsgDetailedInfoInst": ("_root", "MsgDetailedInfoInst"),
+    "MsgResendReq": ("_root", "MsgResendReq"),
+    "MsgResendReqInst": ("_root", "MsgResendReqInst"),
+    "RpcError": ("_root", "RpcError"),
+    "RpcErrorInst": ("_root", "RpcErrorInst"),
+    "RpcDropAnswer": ("_root", "RpcDropAnswer"),
+    "RpcDropAnswerInst": ("_root", "RpcDropAnswerInst"),
+    "FutureSalt": ("_root", "FutureSalt"),
+    "FutureSaltInst": ("_root", "FutureSaltInst"),
+    "Pong": ("_root", "Pong"),
+    "PongInst": ("_root", "PongInst"),
+    "DestroySessionRes": ("_root", "DestroySessionRes"),
+    "DestroySessionResInst": ("_root", "DestroySessionResInst"),
+    "NewSession": ("_root", "NewSession"),
+    "NewSessionInst": ("_root", "NewSessionInst"),
+    "HttpWait": ("_root", "HttpWait"),
+    "HttpWaitInst": ("_root", "HttpWaitInst"),
+    "IpPort": ("_root", "IpPort"),
+    "IpPortInst": ("_root", "IpPortInst"),
+    "AccessPointRule": ("_root", "AccessPointRule"),
+    "AccessPointRuleInst": ("_root", "AccessPointRuleInst"),
+    "TlsClientHello": ("_root", "TlsClientHello"),
+    "TlsClientHelloInst": ("_root", "TlsClientHelloInst"),
+    "TlsBlock": ("_root", "TlsBlock"),
+    "TlsBlockInst": ("_root", "TlsBlockInst"),
+    "InputPeer": ("_root", "InputPeer"),
+    "InputPeerInst": ("_root", "InputPeerInst"),
+    "InputUser": ("_root", "InputUser"),
+    "InputUserInst": ("_root", "InputUserInst"),
+    "InputContact": ("_root", "InputContact"),
+    "InputContactInst": ("_root", "InputContactInst"),
+    "InputFile": ("_root", "InputFile"),
+    "InputFileInst": ("_root", "InputFileInst"),
+    "InputMedia": ("_root", "InputMedia"),
+    "InputMediaInst": ("_root", "InputMediaInst"),
+    "InputChatPhoto": ("_root", "InputChatPhoto"),
+    "InputChatPhotoInst": ("_root", "InputChatPhotoInst"),
+    "InputGeoPoint": ("_root", "InputGeoPoint"),
+    "InputGeoPointInst": ("_root", "InputGeoPointInst"),
+    "InputPhoto": ("_root", "InputPhoto"),
+    "InputPhotoInst": ("_root", "InputPhotoInst"),
+    "InputFileLocation": ("_root", "InputFileLocation"),
+    "InputFileLocationInst": ("_root", "InputFileLocationInst"),
+    "Peer": ("_root", "Peer"),
+    "PeerInst": ("_root", "PeerInst"),
+    "UserProfilePhoto": ("_root", "UserProfilePhoto"),
+    "UserProfilePhotoInst": ("_root", "UserProfilePhotoInst"),
+    "UserStatus": ("_root", "UserStatus"),
+    "UserStatusInst": ("_root", "UserStatusInst"),
+    "ChatFull": ("_root", "ChatFull"),
+    "ChatFullInst": ("_root", "ChatFullInst"),
+    "ChatParticipant": ("_root", "ChatParticipant"),
+    "ChatParticipantInst": ("_root", "ChatParticipantInst"),
+    "ChatParticipants": ("_root", "ChatParticipants"),
+    "ChatParticipantsInst": ("_root", "ChatParticipantsInst"),
+    "ChatPhoto": ("_root", "ChatPhoto"),
+    "ChatPhotoInst": ("_root", "ChatPhotoInst"),
+    "MessageMedia": ("_root", "MessageMedia"),
+    "MessageMediaInst": ("_root", "MessageMediaInst"),
+    "MessageAction": ("_root", "MessageAction"),
+    "MessageActionInst": ("_root", "MessageActionInst"),
+    "Dialog": ("_root", "Dialog"),
+    "DialogInst": ("_root", "DialogInst"),
+    "Photo": ("_root", "Photo"),
+    "PhotoInst": ("_root", "PhotoInst"),
+    "PhotoSize": ("_root", "PhotoSize"),
+    "PhotoSizeInst": ("_root", "PhotoSizeInst"),
+    "GeoPoint": ("_root", "GeoPoint"),
+    "GeoPointInst": ("_root", "GeoPointInst"),
+    "InputNotifyPeer": ("_root", "InputNotifyPeer"),
+    "InputNotifyPeerInst": ("_root", "InputNotifyPeerInst"),
+    "InputPeerNotifySettings": ("_root", "InputPeerNotifySettings"),
+    "InputPeerNotifySettingsInst": ("_root", "InputPeerNotifySettingsInst"),
+    "PeerNotifySettings": ("_root", "PeerNotifySettings"),
+    "PeerNotifySettingsInst": ("_root", "PeerNotifySettingsInst"),
+    "PeerSettings": ("_root", "PeerSettings"),
+    "PeerSettingsInst": ("_root", "PeerSettingsInst"),
+    "ReportReason": ("_root", "ReportReason"),
+    "ReportReasonInst": ("_root", "ReportReasonInst"),
+    "UserFull": ("_root", "UserFull"),
+    "UserFullInst": ("_root", "UserFullInst"),
+    "Contact": ("_root", "Contact"),
+    "ContactInst": ("_root", "ContactInst"),
+    "ImportedContact": ("_root", "ImportedContact"),
+    "ImportedContactInst": ("_root", "ImportedContactInst"),
+    "ContactStatus": ("_root", "ContactStatus"),
+    "ContactStatusInst": ("_root", "ContactStatusInst"),
+    "MessagesFilter": ("_root", "MessagesFilter"),
+    "MessagesFilterInst": ("_root", "MessagesFilterInst"),
+    "Updates": ("_root", "Updates"),
+    "UpdatesInst": ("_root", "UpdatesInst"),
+    "DcOption": ("_root", "DcOption"),
+    "DcOptionInst": ("_root", "DcOptionInst"),
+    "Config": ("_root", "Config"),
+    "ConfigInst": ("_root", "ConfigInst"),
+    "NearestDc": ("_root", "NearestDc"),
+    "NearestDcInst": ("_root", "NearestDcInst"),
+    "InputEncryptedChat": ("_root", "InputEncryptedChat"),
+    "InputEncryptedChatInst": ("_root", "InputEncryptedChatInst"),
+    "EncryptedFile": ("_root", "EncryptedFile"),
+    "EncryptedFileInst": ("_root", "EncryptedFileInst"),
+    "InputEncryptedFile": ("_root", "InputEncryptedFile"),
+    "InputEncryptedFileInst": ("_root", "InputEncryptedFileInst"),
+    "EncryptedMessage": ("_root", "EncryptedMessage"),
+    "EncryptedMessageInst": ("_root", "EncryptedMessageInst"),
+    "InputDocument": ("_root", "InputDocument"),
+    "InputDocumentInst": ("_root", "InputDocumentInst"),
+    "Document": ("_root", "Document"),
+    "DocumentInst": ("_root", "DocumentInst"),
+    "NotifyPeer": ("_root", "NotifyPeer"),
+    "NotifyPeerInst": ("_root", "NotifyPeerInst"),
+    "SendMessageAction": ("_root", "SendMessageAction"),
+    "SendMessageActionInst": ("_root", "SendMessageActionInst"),
+    "InputPrivacyKey": ("_root", "InputPrivacyKey"),
+    "InputPrivacyKeyInst": ("_root", "InputPrivacyKeyInst"),
+    "PrivacyKey": ("_root", "PrivacyKey"),
+    "PrivacyKeyInst": ("_root", "PrivacyKeyInst"),
+    "InputPrivacyRule": ("_root", "InputPrivacyRule"),
+    "InputPrivacyRuleInst": ("_root", "InputPrivacyRuleInst"),
+    "PrivacyRule": ("_root", "PrivacyRule"),
+    "PrivacyRuleInst": ("_root", "PrivacyRuleInst"),
+    "AccountDaysTTL": ("_root", "AccountDaysTTL"),
+    "AccountDaysTTLInst": ("_root", "AccountDaysTTLInst"),
+    "DocumentAttribute": ("_root", "DocumentAttribute"),
+    "DocumentAttributeInst": ("_root", "DocumentAttributeInst"),
+    "StickerPack": ("_root", "StickerPack"),
+    "StickerPackInst": ("_root", "StickerPackInst"),
+    "WebPage": ("_root", "WebPage"),
+    "WebPageInst": ("_root", "WebPageInst"),
+    "Authorization": ("_root", "Authorization"),
+    "AuthorizationInst": ("_root", "AuthorizationInst"),
+    "ReceivedNotifyMessage": ("_root", "ReceivedNotifyMessage"),
+    "ReceivedNotifyMessageInst": ("_root", "ReceivedNotifyMessageInst"),
+    "ExportedChatInvite": ("_root", "ExportedChatInvite"),
+    "ExportedChatInviteInst": ("_root", "ExportedChatInviteInst"),
+    "ChatInvite": ("_root", "ChatInvite"),
+    "ChatInviteInst": ("_root", "ChatInviteInst"),
+    "InputStickerSet": ("_root", "InputStickerSet"),
+    "InputStickerSetInst": ("_root", "InputStickerSetInst"),
+    "BotCommand": ("_root", "BotCommand"),
+    "BotCommandInst": ("_root", "BotCommandInst"),
+    "BotInfo": ("_root", "BotInfo"),
+    "BotInfoInst": ("_root", "BotInfoInst"),
+    "KeyboardButton": ("_root", "KeyboardButton"),
+    "KeyboardButtonInst": ("_root", "KeyboardButtonInst"),
+    "KeyboardButtonRow": ("_root", "KeyboardButtonRow"),
+    "KeyboardButtonRowInst": ("_root", "KeyboardButtonRowInst"),
+    "ReplyMarkup": ("_root", "ReplyMarkup"),
+    "ReplyMarkupInst": ("_root", "ReplyMarkupInst"),
+    "MessageEntity": ("_root", "MessageEntity"),
+    "MessageEntityInst": ("_root", "MessageEntityInst"),
+    "InputChannel": ("_root", "InputChannel"),
+    "InputChannelInst": ("_root", "InputChannelInst"),
+    "MessageRange": ("_root", "MessageRange"),
+    "MessageRangeInst": ("_root", "MessageRangeInst"),
+    "ChannelMessagesFilter": ("_root", "ChannelMessagesFilter"),
+    "ChannelMessagesFilterInst": ("_root", "ChannelMessagesFilterInst"),
+    "ChannelParticipant": ("_root", "ChannelParticipant"),
+    "ChannelParticipantInst": ("_root", "ChannelParticipantInst"),
+    "ChannelParticipantsFilter": ("_root", "ChannelParticipantsFilter"),
+    "ChannelParticipantsFilterInst": ("_root", "ChannelParticipantsFilterInst"),
+    "InputBotInlineMessage": ("_root", "InputBotInlineMessage"),
+    "InputBotInlineMessageInst": ("_root", "InputBotInlineMessageInst"),
+    "InputBotInlineResult": ("_root", "InputBotInlineResult"),
+    "InputBotInlineResultInst": ("_root", "InputBotInlineResultInst"),
+    "BotInlineMessage": ("_root", "BotInlineMessage"),
+    "BotInlineMessageInst": ("_root", "BotInlineMessageInst"),
+    "BotInlineResult": ("_root", "BotInlineResult"),
+    "BotInlineResultInst": ("_root", "BotInlineResultInst"),
+    "ExportedMessageLink": ("_root", "ExportedMessageLink"),
+    "ExportedMessageLinkInst": ("_root", "ExportedMessageLinkInst"),
+    "MessageFwdHeader": ("_root", "MessageFwdHeader"),
+    "MessageFwdHeaderInst": ("_root", "MessageFwdHeaderInst"),
+    "InputBotInlineMessageID": ("_root", "InputBotInlineMessageID"),
+    "InputBotInlineMessageIDInst": ("_root", "InputBotInlineMessageIDInst"),
+    "InlineBotSwitchPM": ("_root", "InlineBotSwitchPM"),
+    "InlineBotSwitchPMInst": ("_root", "InlineBotSwitchPMInst"),
+    "TopPeer": ("_root", "TopPeer"),
+    "TopPeerInst": ("_root", "TopPeerInst"),
+    "TopPeerCategory": ("_root", "TopPeerCategory"),
+    "TopPeerCategoryInst": ("_root", "TopPeerCategoryInst"),
+    "TopPeerCategoryPeers": ("_root", "TopPeerCategoryPeers"),
+    "TopPeerCategoryPeersInst": ("_root", "TopPeerCategoryPeersInst"),
+    "DraftMessage": ("_root", "DraftMessage"),
+    "DraftMessageInst": ("_root", "DraftMessageInst"),
+    "StickerSetCovered": ("_root", "StickerSetCovered"),
+    "StickerSetCoveredInst": ("_root", "StickerSetCoveredInst"),
+    "MaskCoords": ("_root", "MaskCoords"),
+    "MaskCoordsInst": ("_root", "MaskCoordsInst"),
+    "InputStickeredMedia": ("_root", "InputStickeredMedia"),
+    "InputStickeredMediaInst": ("_root", "InputStickeredMediaInst"),
+    "Game": ("_root", "Game"),
+    "GameInst": ("_root", "GameInst"),
+    "InputGame": ("_root", "InputGame"),
+    "InputGameInst": ("_root", "InputGameInst"),
+    "HighScore": ("_root", "HighScore"),
+    "HighScoreInst": ("_root", "HighScoreInst"),
+    "RichText": ("_root", "RichText"),
+    "RichTextInst": ("_root", "RichTextInst"),
+    "PageBlock": ("_root", "PageBlock"),
+    "PageBlockInst": ("_root", "PageBlockInst"),
+    "PhoneCallDiscardReason": ("_root", "PhoneCallDiscardReason"),
+    "PhoneCallDiscardReasonInst": ("_root", "PhoneCallDiscardReasonInst"),
+    "DataJSON": ("_root", "DataJSON"),
+    "DataJSONInst": ("_root", "DataJSONInst"),
+    "LabeledPrice": ("_root", "LabeledPrice"),
+    "LabeledPriceInst": ("_root", "LabeledPriceInst"),
+    "Invoice": ("_root", "Invoice"),
+    "InvoiceInst": ("_root", "InvoiceInst"),
+    "PaymentCharge": ("_root", "PaymentCharge"),
+    "PaymentChargeInst": ("_root", "PaymentChargeInst"),
+    "PostAddress": ("_root", "PostAddress"),
+    "PostAddressInst": ("_root", "PostAddressInst"),
+    "PaymentRequestedInfo": ("_root", "PaymentRequestedInfo"),
+    "PaymentRequestedInfoInst": ("_root", "PaymentRequestedInfoInst"),
+    "PaymentSavedCredentials": ("_root", "PaymentSavedCredentials"),
+    "PaymentSavedCredentialsInst": ("_root", "PaymentSavedCredentialsInst"),
+    "WebDocument": ("_root", "WebDocument"),
+    "WebDocumentInst": ("_root", "WebDocumentInst"),
+    "InputWebDocument": ("_root", "InputWebDocument"),
+    "InputWebDocumentInst": ("_root", "InputWebDocumentInst"),
+    "InputWebFileLocation": ("_root", "InputWebFileLocation"),
+    "InputWebFileLocationInst": ("_root", "InputWebFileLocationInst"),
+    "InputPaymentCredentials": ("_root", "InputPaymentCredentials"),
+    "InputPaymentCredentialsInst": ("_root", "InputPaymentCredentialsInst"),
+    "ShippingOption": ("_root", "ShippingOption"),
+    "ShippingOptionInst": ("_root", "ShippingOptionInst"),
+    "InputStickerSetItem": ("_root", "InputStickerSetItem"),
+    "InputStickerSetItemInst": ("_root", "InputStickerSetItemInst"),
+    "InputPhoneCall": ("_root", "InputPhoneCall"),
+    "InputPhoneCallInst": ("_root", "InputPhoneCallInst"),
+    "PhoneConnection": ("_root", "PhoneConnection"),
+    "PhoneConnectionInst": ("_root", "PhoneConnectionInst"),
+    "PhoneCallProtocol": ("_root", "PhoneCallProtocol"),
+    "PhoneCallProtocolInst": ("_root", "PhoneCallProtocolInst"),
+    "CdnPublicKey": ("_root", "CdnPublicKey"),
+    "CdnPublicKeyInst": ("_root", "CdnPublicKeyInst"),
+    "CdnConfig": ("_root", "CdnConfig"),
+    "CdnConfigInst": ("_root", "CdnConfigInst"),
+    "LangPackString": ("_root", "LangPackString"),
+    "LangPackStringInst": ("_root", "LangPackStringInst"),
+    "LangPackDifference": ("_root", "LangPackDifference"),
+    "LangPackDifferenceInst": ("_root", "LangPackDifferenceInst"),
+    "LangPackLanguage": ("_root", "LangPackLanguage"),
+    "LangPackLanguageInst": ("_root", "LangPackLanguageInst"),
+    "ChannelAdminLogEventAction": ("_root", "ChannelAdminLogEventAction"),
+    "ChannelAdminLogEventActionInst": ("_root", "ChannelAdminLogEventActionInst"),
+    "ChannelAdminLogEvent": ("_root", "ChannelAdminLogEvent"),
+    "ChannelAdminLogEventInst": ("_root", "ChannelAdminLogEventInst"),
+    "ChannelAdminLogEventsFilter": ("_root", "ChannelAdminLogEventsFilter"),
+    "ChannelAdminLogEventsFilterInst": ("_root", "ChannelAdminLogEventsFilterInst"),
+    "PopularContact": ("_root", "PopularContact"),
+    "PopularContactInst": ("_root", "PopularContactInst"),
+    "RecentMeUrl": ("_root", "RecentMeUrl"),
+    "RecentMeUrlInst": ("_root", "RecentMeUrlInst"),
+    "InputSingleMedia": ("_root", "InputSingleMedia"),
+    "InputSingleMediaInst": ("_root", "InputSingleMediaInst"),
+    "WebAuthorization": ("_root", "WebAuthorization"),
+    "WebAuthorizationInst": ("_root", "WebAuthorizationInst"),
+    "InputMessage": ("_root", "InputMessage"),
+    "InputMessageInst": ("_root", "InputMessageInst"),
+    "InputDialogPeer": ("_root", "InputDialogPeer"),
+    "InputDialogPeerInst": ("_root", "InputDialogPeerInst"),
+    "DialogPeer": ("_root", "DialogPeer"),
+    "DialogPeerInst": ("_root", "DialogPeerInst"),
+    "FileHash": ("_root", "FileHash"),
+    "FileHashInst": ("_root", "FileHashInst"),
+    "InputClientProxy": ("_root", "InputClientProxy"),
+    "InputClientProxyInst": ("_root", "InputClientProxyInst"),
+    "InputSecureFile": ("_root", "InputSecureFile"),
+    "InputSecureFileInst": ("_root", "InputSecureFileInst"),
+    "SecureFile": ("_root", "SecureFile"),
+    "SecureFileInst": ("_root", "SecureFileInst"),
+    "SecureData": ("_root", "SecureData"),
+    "SecureDataInst": ("_root", "SecureDataInst"),
+    "SecurePlainData": ("_root", "SecurePlainData"),
+    "SecurePlainDataInst": ("_root", "SecurePlainDataInst"),
+    "SecureValueType": ("_root", "SecureValueType"),
+    "SecureValueTypeInst": ("_root", "SecureValueTypeInst"),
+    "SecureValue": ("_root", "SecureValue"),
+    "SecureValueInst": ("_root", "SecureValueInst"),
+    "InputSecureValue": ("_root", "InputSecureValue"),
+    "InputSecureValueInst": ("_root", "InputSecureValueInst"),
+    "SecureValueHash": ("_root", "SecureValueHash"),
+    "SecureValueHashInst": ("_root", "SecureValueHashInst"),
+    "SecureValueError": ("_root", "SecureValueError"),
+    "SecureValueErrorInst": ("_root", "SecureValueErrorInst"),
+    "SecureCredentialsEncrypted": ("_root", "SecureCredentialsEncrypted"),
+    "SecureCredentialsEncryptedInst": ("_root", "SecureCredentialsEncryptedInst"),
+    "SavedContact": ("_root", "SavedContact"),
+    "SavedContactInst": ("_root", "SavedContactInst"),
+    "PasswordKdfAlgo": ("_root", "PasswordKdfAlgo"),
+    "PasswordKdfAlgoInst": ("_root", "PasswordKdfAlgoInst"),
+    "SecurePasswordKdfAlgo": ("_root", "SecurePasswordKdfAlgo"),
+    "SecurePasswordKdfAlgoInst": ("_root", "SecurePasswordKdfAlgoInst"),
+    "SecureSecretSettings": ("_root", "SecureSecretSettings"),
+    "SecureSecretSettingsInst": ("_root", "SecureSecretSettingsInst"),
+    "InputCheckPasswordSRP": ("_root", "InputCheckPasswordSRP"),
+    "InputCheckPasswordSRPInst": ("_root", "InputCheckPasswordSRPInst"),
+    "SecureRequiredType": ("_root", "SecureRequiredType"),
+    "SecureRequiredTypeInst": ("_root", "SecureRequiredTypeInst"),
+    "InputAppEvent": ("_root", "InputAppEvent"),
+    "InputAppEventInst": ("_root", "InputAppEventInst"),
+    "JSONObjectValue": ("_root", "JSONObjectValue"),
+    "JSONObjectValueInst": ("_root", "JSONObjectValueInst"),
+    "JSONValue": ("_root", "JSONValue"),
+    "JSONValueInst": ("_root", "JSONValueInst"),
+    "PageTableCell": ("_root", "PageTableCell"),
+    "PageTableCellInst": ("_root", "PageTableCellInst"),
+    "PageTableRow": ("_root", "PageTableRow"),
+    "PageTableRowInst": ("_root", "PageTableRowInst"),
+    "PageCaption": ("_root", "PageCaption"),
+    "PageCaptionInst": ("_root", "PageCaptionInst"),
+    "PageListItem": ("_root", "PageListItem"),
+    "PageListItemInst": ("_root", "PageListItemInst"),
+    "PageListOrderedItem": ("_root", "PageListOrderedItem"),
+    "PageListOrderedItemInst": ("_root", "PageListOrderedItemInst"),
+    "PageRelatedArticle": ("_root", "PageRelatedArticle"),
+    "PageRelatedArticleInst": ("_root", "PageRelatedArticleInst"),
+    "Page": ("_root", "Page"),
+    "PageInst": ("_root", "PageInst"),
+    "PollAnswer": ("_root", "PollAnswer"),
+    "PollAnswerInst": ("_root", "PollAnswerInst"),
+    "Poll": ("_root", "Poll"),
+    "PollInst": ("_root", "PollInst"),
+    "ChatOnlines": ("_root", "ChatOnlines"),
+    "ChatOnlinesInst": ("_root", "ChatOnlinesInst"),
+    "StatsURL": ("_root", "StatsURL"),
+    "StatsURLInst": ("_root", "StatsURLInst"),
+    "ChatAdminRights": ("_root", "ChatAdminRights"),
+    "ChatAdminRightsInst": ("_root", "ChatAdminRightsInst"),
+    "ChatBannedRights": ("_root", "ChatBannedRights"),
+    "ChatBannedRightsInst": ("_root", "ChatBannedRightsInst"),
+    "InputWallPaper": ("_root", "InputWallPaper"),
+    "InputWallPaperInst": ("_root", "InputWallPaperInst"),
+    "CodeSettings": ("_root", "CodeSettings"),
+    "CodeSettingsInst": ("_root", "CodeSettingsInst"),
+    "WallPaperSettings": ("_root", "WallPaperSettings"),
+    "WallPaperSettingsInst": ("_root", "WallPaperSettingsInst"),
+    "AutoDownloadSettings": ("_root", "AutoDownloadSettings"),
+    "AutoDownloadSettingsInst": ("_root", "AutoDownloadSettingsInst"),
+    "EmojiKeyword": ("_root", "EmojiKeyword"),
+    "EmojiKeywordInst": ("_root", "EmojiKeywordInst"),
+    "EmojiKeywordsDifference": ("_root", "EmojiKeywordsDifference"),
+    "EmojiKeywordsDifferenceInst": ("_root", "EmojiKeywordsDifferenceInst"),
+    "EmojiURL": ("_root", "EmojiURL"),
+    "EmojiURLInst": ("_root", "EmojiURLInst"),
+    "EmojiLanguage": ("_root", "EmojiLanguage"),
+    "EmojiLanguageInst": ("_root", "EmojiLanguageInst"),
+    "Folder": ("_root", "Folder"),
+    "FolderInst": ("_root", "FolderInst"),
+    "InputFolderPeer": ("_root", "InputFolderPeer"),
+    "InputFolderPeerInst": ("_root", "InputFolderPeerInst"),
+    "FolderPeer": ("_root", "FolderPeer"),
+    "FolderPeerInst": ("_root", "FolderPeerInst"),
+    "UrlAuthResult": ("_root", "UrlAuthResult"),
+    "UrlAuthResultInst": ("_root", "UrlAuthResultInst"),
+    "ChannelLocation": ("_root", "ChannelLocation"),
+    "ChannelLocationInst": ("_root", "ChannelLocationInst"),
+    "PeerLocated": ("_root", "PeerLocated"),
+    "PeerLocatedInst": ("_root", "PeerLocatedInst"),
+    "RestrictionReason": ("_root", "RestrictionReason"),
+    "RestrictionReasonInst": ("_root", "RestrictionReasonInst"),
+    "InputTheme": ("_root", "InputTheme"),
+    "InputThemeInst": ("_root", "InputThemeInst"),
+    "BaseTheme": ("_root", "BaseTheme"),
+    "BaseThemeInst": ("_root", "BaseThemeInst"),
+    "InputThemeSettings": ("_root", "InputThemeSettings"),
+    "InputThemeSettingsInst": ("_root", "InputThemeSettingsInst"),
+    "ThemeSettings": ("_root", "ThemeSettings"),
+    "ThemeSettingsInst": ("_root", "ThemeSettingsInst"),
+    "WebPageAttribute": ("_root", "WebPageAttribute"),
+    "WebPageAttributeInst": ("_root", "WebPageAttributeInst"),
+    "BankCardOpenUrl": ("_root", "BankCardOpenUrl"),
+    "BankCardOpenUrlInst": ("_root", "BankCardOpenUrlInst"),
+    "DialogFilter": ("_root", "DialogFilter"),
+    "DialogFilterInst": ("_root", "DialogFilterInst"),
+    "DialogFilterSuggested": ("_root", "DialogFilterSuggested"),
+    "DialogFilterSuggestedInst": ("_root", "DialogFilterSuggestedInst"),
+    "StatsDateRangeDays": ("_root", "StatsDateRangeDays"),
+    "StatsDateRangeDaysInst": ("_root", "StatsDateRangeDaysInst"),
+    "StatsAbsValueAndPrev": ("_root", "StatsAbsValueAndPrev"),
+    "StatsAbsValueAndPrevInst": ("_root", "StatsAbsValueAndPrevInst"),
+    "StatsPercentValue": ("_root", "StatsPercentValue"),
+    "StatsPercentValueInst": ("_root", "StatsPercentValueInst"),
+    "StatsGraph": ("_root", "StatsGraph"),
+    "StatsGraphInst": ("_root", "StatsGraphInst"),
+    "VideoSize": ("_root", "VideoSize"),
+    "VideoSizeInst": ("_root", "VideoSizeInst"),
+    "StatsGroupTopPoster": ("_root", "StatsGroupTopPoster"),
+    "StatsGroupTopPosterInst": ("_root", "StatsGroupTopPosterInst"),
+    "StatsGroupTopAdmin": ("_root", "StatsGroupTopAdmin"),
+    "StatsGroupTopAdminInst": ("_root", "StatsGroupTopAdminInst"),
+    "StatsGroupTopInviter": ("_root", "StatsGroupTopInviter"),
+    "StatsGroupTopInviterInst": ("_root", "StatsGroupTopInviterInst"),
+    "GlobalPrivacySettings": ("_root", "GlobalPrivacySettings"),
+    "GlobalPrivacySettingsInst": ("_root", "GlobalPrivacySettingsInst"),
+    "MessageViews": ("_root", "MessageViews"),
+    "MessageViewsInst": ("_root", "MessageViewsInst"),
+    "MessageReplyHeader": ("_root", "MessageReplyHeader"),
+    "MessageReplyHeaderInst": ("_root", "MessageReplyHeaderInst"),
+    "MessageReplies": ("_root", "MessageReplies"),
+    "MessageRepliesInst": ("_root", "MessageRepliesInst"),
+    "PeerBlocked": ("_root", "PeerBlocked"),
+    "PeerBlockedInst": ("_root", "PeerBlockedInst"),
+    "GroupCall": ("_root", "GroupCall"),
+    "GroupCallInst": ("_root", "GroupCallInst"),
+    "InputGroupCall": ("_root", "InputGroupCall"),
+    "InputGroupCallInst": ("_root", "InputGroupCallInst"),
+    "GroupCallParticipant": ("_root", "GroupCallParticipant"),
+    "GroupCallParticipantInst": ("_root", "GroupCallParticipantInst"),
+    "InlineQueryPeerType": ("_root", "InlineQueryPeerType"),
+    "InlineQueryPeerTypeInst": ("_root", "InlineQueryPeerTypeInst"),
+    "ChatInviteImporter": ("_root", "ChatInviteImporter"),
+    "ChatInviteImporterInst": ("_root", "ChatInviteImporterInst"),
+    "ChatAdminWithInvites": ("_root", "ChatAdminWithInvites"),
+    "ChatAdminWithInvitesInst": ("_root", "ChatAdminWithInvitesInst"),
+    "GroupCallParticipantVideoSourceGroup": ("_root", "GroupCallParticipantVideoSourceGroup"),
+    "GroupCallParticipantVideoSourceGroupInst": ("_root", "GroupCallParticipantVideoSourceGroupInst"),
+    "GroupCallParticipantVideo": ("_root", "GroupCallParticipantVideo"),
+    "GroupCallParticipantVideoInst": ("_root", "GroupCallParticipantVideoInst"),
+    "BotCommandScope": ("_root", "BotCommandScope"),
+    "BotCommandScopeInst": ("_root", "BotCommandScopeInst"),
+    "SponsoredMessage": ("_root", "SponsoredMessage"),
+    "SponsoredMessageInst": ("_root", "SponsoredMessageInst"),
+    "SearchResultsCalendarPeriod": ("_root", "SearchResultsCalendarPeriod"),
+    "SearchResultsCalendarPeriodInst": ("_root", "SearchResultsCalendarPeriodInst"),
+    "SearchResultsPosition": ("_root", "SearchResultsPosition"),
+    "SearchResultsPositionInst": ("_root", "SearchResultsPositionInst"),
+    "ReactionCount": ("_root", "ReactionCount"),
+    "ReactionCountInst": ("_root", "ReactionCountInst"),
+    "MessageReactions": ("_root", "MessageReactions"),
+    "MessageReactionsInst": ("_root", "MessageReactionsInst"),
+    "AvailableReaction": ("_root", "AvailableReaction"),
+    "AvailableReactionInst": ("_root", "AvailableReactionInst"),
+    "MessagePeerReaction": ("_root", "MessagePeerReaction"),
+    "MessagePeerReactionInst": ("_root", "MessagePeerReactionInst"),
+    "GroupCallStreamChannel": ("_root", "GroupCallStreamChannel"),
+    "GroupCallStreamChannelInst": ("_root", "GroupCallStreamChannelInst"),
+    "AttachMenuBotIconColor": ("_root", "AttachMenuBotIconColor"),
+    "AttachMenuBotIconColorInst": ("_root", "AttachMenuBotIconColorInst"),
+    "AttachMenuBotIcon": ("_root", "AttachMenuBotIcon"),
+    "AttachMenuBotIconInst": ("_root", "AttachMenuBotIconInst"),
+    "AttachMenuBot": ("_root", "AttachMenuBot"),
+    "AttachMenuBotInst": ("_root", "AttachMenuBotInst"),
+    "AttachMenuBots": ("_root", "AttachMenuBots"),
+    "AttachMenuBotsInst": ("_root", "AttachMenuBotsInst"),
+    "AttachMenuBotsBot": ("_root", "AttachMenuBotsBot"),
+    "AttachMenuBotsBotInst": ("_root", "AttachMenuBotsBotInst"),
+    "WebViewResult": ("_root", "WebViewResult"),
+    "WebViewResultInst": ("_root", "WebViewResultInst"),
+    "WebViewMessageSent": ("_root", "WebViewMessageSent"),
+    "WebViewMessageSentInst": ("_root", "WebViewMessageSentInst"),
+    "BotMenuButton": ("_root", "BotMenuButton"),
+    "BotMenuButtonInst": ("_root", "BotMenuButtonInst"),
+    "NotificationSound": ("_root", "NotificationSound"),
+    "NotificationSoundInst": ("_root", "NotificationSoundInst"),
+    "AttachMenuPeerType": ("_root", "AttachMenuPeerType"),
+    "AttachMenuPeerTypeInst": ("_root", "AttachMenuPeerTypeInst"),
+    "InputInvoice": ("_root", "InputInvoice"),
+    "InputInvoiceInst": ("_root", "InputInvoiceInst"),
+    "InputStorePaymentPurpose": ("_root", "InputStorePaymentPurpose"),
+    "InputStorePaymentPurposeInst": ("_root", "InputStorePaymentPurposeInst"),
+    "PaymentFormMethod": ("_root", "PaymentFormMethod"),
+    "PaymentFormMethodInst": ("_root", "PaymentFormMethodInst"),
+    "EmojiStatus": ("_root", "EmojiStatus"),
+    "EmojiStatusInst": ("_root", "EmojiStatusInst"),
+    "Reaction": ("_root", "Reaction"),
+    "ReactionInst": ("_root", "ReactionInst"),
+    "ChatReactions": ("_root", "ChatReactions"),
+    "ChatReactionsInst": ("_root", "ChatReactionsInst"),
+    "EmailVerifyPurpose": ("_root", "EmailVerifyPurpose"),
+    "EmailVerifyPurposeInst": ("_root", "EmailVerifyPurposeInst"),
+    "EmailVerification": ("_root", "EmailVerification"),
+    "EmailVerificationInst": ("_root", "EmailVerificationInst"),
+    "PremiumSubscriptionOption": ("_root", "PremiumSubscriptionOption"),
+    "PremiumSubscriptionOptionInst": ("_root", "PremiumSubscriptionOptionInst"),
+    "SendAsPeer": ("_root", "SendAsPeer"),
+    "SendAsPeerInst": ("_root", "SendAsPeerInst"),
+    "MessageExtendedMedia": ("_root", "MessageExtendedMedia"),
+    "MessageExtendedMediaInst": ("_root", "MessageExtendedMediaInst"),
+    "StickerKeyword": ("_root", "StickerKeyword"),
+    "StickerKeywordInst": ("_root", "StickerKeywordInst"),
+    "Username": ("_root", "Username"),
+    "UsernameInst": ("_root", "UsernameInst"),
+    "ForumTopic": ("_root", "ForumTopic"),
+    "ForumTopicInst": ("_root", "ForumTopicInst"),
+    "DefaultHistoryTTL": ("_root", "DefaultHistoryTTL"),
+    "DefaultHistoryTTLInst": ("_root", "DefaultHistoryTTLInst"),
+    "ExportedContactToken": ("_root", "ExportedContactToken"),
+    "ExportedContactTokenInst": ("_root", "ExportedContactTokenInst"),
+    "RequestPeerType": ("_root", "RequestPeerType"),
+    "RequestPeerTypeInst": ("_root", "RequestPeerTypeInst"),
+    "EmojiList": ("_root", "EmojiList"),
+    "EmojiListInst": ("_root", "EmojiListInst"),
+    "EmojiGroup": ("_root", "EmojiGroup"),
+    "EmojiGroupInst": ("_root", "EmojiGroupInst"),
+    "TextWithEntities": ("_root", "TextWithEntities"),
+    "TextWithEntitiesInst": ("_root", "TextWithEntitiesInst"),
+    "AutoSaveSettings": ("_root", "AutoSaveSettings"),
+    "AutoSaveSettingsInst": ("_root", "AutoSaveSettingsInst"),
+    "AutoSaveException": ("_root", "AutoSaveException"),
+    "AutoSaveExceptionInst": ("_root", "AutoSaveExceptionInst"),
+    "InputBotApp": ("_root", "InputBotApp"),
+    "InputBotAppInst": ("_root", "InputBotAppInst"),
+    "BotApp": ("_root", "BotApp"),
+    "BotAppInst": ("_root", "BotAppInst"),
+    "InlineBotWebView": ("_root", "InlineBotWebView"),
+    "InlineBotWebViewInst": ("_root", "InlineBotWebViewInst"),
+    "ReadParticipantDate": ("_root", "ReadParticipantDate"),
+    "ReadParticipantDateInst": ("_root", "ReadParticipantDateInst"),
+    "InputChatlist": ("_root", "InputChatlist"),
+    "InputChatlistInst": ("_root", "InputChatlistInst"),
+    "ExportedChatlistInvite": ("_root", "ExportedChatlistInvite"),
+    "ExportedChatlistInviteInst": ("_root", "ExportedChatlistInviteInst"),
+    "MessagePeerVote": ("_root", "MessagePeerVote"),
+    "MessagePeerVoteInst": ("_root", "MessagePeerVoteInst"),
+    "StoryViews": ("_root", "StoryViews"),
+    "StoryViewsInst": ("_root", "StoryViewsInst"),
+    "StoryItem": ("_root", "StoryItem"),
+    "StoryItemInst": ("_root", "StoryItemInst"),
+    "StoryView": ("_root", "StoryView"),
+    "StoryViewInst": ("_root", "StoryViewInst"),
+    "InputReplyTo": ("_root", "InputReplyTo"),
+    "InputReplyToInst": ("_root", "InputReplyToInst"),
+    "ExportedStoryLink": ("_root", "ExportedStoryLink"),
+    "ExportedStoryLinkInst": ("_root", "ExportedStoryLinkInst"),
+    "StoriesStealthMode": ("_root", "StoriesStealthMode"),
+    "StoriesStealthModeInst": ("_root", "StoriesStealthModeInst"),
+    "MediaAreaCoordinates": ("_root", "MediaAreaCoordinates"),
+    "MediaAreaCoordinatesInst": ("_root", "MediaAreaCoordinatesInst"),
+    "MediaArea": ("_root", "MediaArea"),
+    "MediaAreaInst": ("_root", "MediaAreaInst"),
+    "PeerStories": ("_root", "PeerStories"),
+    "PeerStoriesInst": ("_root", "PeerStoriesInst"),
+    "PremiumGiftCodeOption": ("_root", "PremiumGiftCodeOption"),
+    "PremiumGiftCodeOptionInst": ("_root", "PremiumGiftCodeOptionInst"),
+    "PrepaidGiveaway": ("_root", "PrepaidGiveaway"),
+    "PrepaidGiveawayInst": ("_root", "PrepaidGiveawayInst"),
+    "Boost": ("_root", "Boost"),
+    "BoostInst": ("_root", "BoostInst"),
+    "MyBoost": ("_root", "MyBoost"),
+    "MyBoostInst": ("_root", "MyBoostInst"),
+    "StoryFwdHeader": ("_root", "StoryFwdHeader"),
+    "StoryFwdHeaderInst": ("_root", "StoryFwdHeaderInst"),
+    "PostInteractionCounters": ("_root", "PostInteractionCounters"),
+    "PostInteractionCountersInst": ("_root", "PostInteractionCountersInst"),
+    "PublicForward": ("_root", "PublicForward"),
+    "PublicForwardInst": ("_root", "PublicForwardInst"),
+    "PeerColor": ("_root", "PeerColor"),
+    "PeerColorInst": ("_root", "PeerColorInst"),
+    "StoryReaction": ("_root", "StoryReaction"),
+    "StoryReactionInst": ("_root", "StoryReactionInst"),
+    "SavedDialog": ("_root", "SavedDialog"),
+    "SavedDialogInst": ("_root", "SavedDialogInst"),
+    "SavedReactionTag": ("_root", "SavedReactionTag"),
+    "SavedReactionTagInst": ("_root", "SavedReactionTagInst"),
+    "OutboxReadDate": ("_root", "OutboxReadDate"),
+    "OutboxReadDateInst": ("_root", "OutboxReadDateInst"),
+    "SmsJob": ("_root", "SmsJob"),
+    "SmsJobInst": ("_root", "SmsJobInst"),
+    "BusinessWeeklyOpen": ("_root", "BusinessWeeklyOpen"),
+    "BusinessWeeklyOpenInst": ("_root", "BusinessWeeklyOpenInst"),
+    "BusinessWorkHours": ("_root", "BusinessWorkHours"),
+    "BusinessWorkHoursInst": ("_root", "BusinessWorkHoursInst"),
+    "BusinessLocation": ("_root", "BusinessLocation"),
+    "BusinessLocationInst": ("_root", "BusinessLocationInst"),
+    "InputBusinessRecipients": ("_root", "InputBusinessRecipients"),
+    "InputBusinessRecipientsInst": ("_root", "InputBusinessRecipientsInst"),
+    "BusinessRecipients": ("_root", "BusinessRecipients"),
+    "BusinessRecipientsInst": ("_root", "BusinessRecipientsInst"),
+    "BusinessAwayMessageSchedule": ("_root", "BusinessAwayMessageSchedule"),
+    "BusinessAwayMessageScheduleInst": ("_root", "BusinessAwayMessageScheduleInst"),
+    "InputBusinessGreetingMessage": ("_root", "InputBusinessGreetingMessage"),
+    "InputBusinessGreetingMessageInst": ("_root", "InputBusinessGreetingMessageInst"),
+    "BusinessGreetingMessage": ("_root", "BusinessGreetingMessage"),
+    "BusinessGreetingMessageInst": ("_root", "BusinessGreetingMessageInst"),
+    "InputBusinessAwayMessage": ("_root", "InputBusinessAwayMessage"),
+    "InputBusinessAwayMessageInst": ("_root", "InputBusinessAwayMessageInst"),
+    "BusinessAwayMessage": ("_root", "BusinessAwayMessage"),
+    "BusinessAwayMessageInst": ("_root", "BusinessAwayMessageInst"),
+    "Timezone": ("_root", "Timezone"),
+    "TimezoneInst": ("_root", "TimezoneInst"),
+    "QuickReply": ("_root", "QuickReply"),
+    "QuickReplyInst": ("_root", "QuickReplyInst"),
+    "InputQuickReplyShortcut": ("_root", "InputQuickReplyShortcut"),
+    "InputQuickReplyShortcutInst": ("_root", "InputQuickReplyShortcutInst"),
+    "ConnectedBot": ("_root", "ConnectedBot"),
+    "ConnectedBotInst": ("_root", "ConnectedBotInst"),
+    "Birthday": ("_root", "Birthday"),
+    "BirthdayInst": ("_root", "BirthdayInst"),
+    "BotBusinessConnection": ("_root", "BotBusinessConnection"),
+    "BotBusinessConnectionInst": ("_root", "BotBusinessConnectionInst"),
+    "InputBusinessIntro": ("_root", "InputBusinessIntro"),
+    "InputBusinessIntroInst": ("_root", "InputBusinessIntroInst"),
+    "BusinessIntro": ("_root", "BusinessIntro"),
+    "BusinessIntroInst": ("_root", "BusinessIntroInst"),
+    "InputCollectible": ("_root", "InputCollectible"),
+    "InputCollectibleInst": ("_root", "InputCollectibleInst"),
+    "InputBusinessBotRecipients": ("_root", "InputBusinessBotRecipients"),
+    "InputBusinessBotRecipientsInst": ("_root", "InputBusinessBotRecipientsInst"),
+    "BusinessBotRecipients": ("_root", "BusinessBotRecipients"),
+    "BusinessBotRecipientsInst": ("_root", "BusinessBotRecipientsInst"),
+    "ContactBirthday": ("_root", "ContactBirthday"),
+    "ContactBirthdayInst": ("_root", "ContactBirthdayInst"),
+    "MissingInvitee": ("_root", "MissingInvitee"),
+    "MissingInviteeInst": ("_root", "MissingInviteeInst"),
+    "InputBusinessChatLink": ("_root", "InputBusinessChatLink"),
+    "InputBusinessChatLinkInst": ("_root", "InputBusinessChatLinkInst"),
+    "BusinessChatLink": ("_root", "BusinessChatLink"),
+    "BusinessChatLinkInst": ("_root", "BusinessChatLinkInst"),
+    "RequestedPeer": ("_root", "RequestedPeer"),
+    "RequestedPeerInst": ("_root", "RequestedPeerInst"),
+    "SponsoredMessageReportOption": ("_root", "SponsoredMessageReportOption"),
+    "SponsoredMessageReportOptionInst": ("_root", "SponsoredMessageReportOptionInst"),
+    "BroadcastRevenueTransaction": ("_root", "BroadcastRevenueTransaction"),
+    "BroadcastRevenueTransactionInst": ("_root", "BroadcastRevenueTransactionInst"),
+    "ReactionNotificationsFrom": ("_root", "ReactionNotificationsFrom"),
+    "ReactionNotificationsFromInst": ("_root", "ReactionNotificationsFromInst"),
+    "ReactionsNotifySettings": ("_root", "ReactionsNotifySettings"),
+    "ReactionsNotifySettingsInst": ("_root", "ReactionsNotifySettingsInst"),
+    "BroadcastRevenueBalances": ("_root", "BroadcastRevenueBalances"),
+    "BroadcastRevenueBalancesInst": ("_root", "BroadcastRevenueBalancesInst"),
+    "AvailableEffect": ("_root", "AvailableEffect"),
+    "AvailableEffectInst": ("_root", "AvailableEffectInst"),
+    "FactCheck": ("_root", "FactCheck"),
+    "FactCheckInst": ("_root", "FactCheckInst"),
+    "StarsTransactionPeer": ("_root", "StarsTransactionPeer"),
+    "StarsTransactionPeerInst": ("_root", "StarsTransactionPeerInst"),
+    "StarsTopupOption": ("_root", "StarsTopupOption"),
+    "StarsTopupOptionInst": ("_root", "StarsTopupOptionInst"),
+    "StarsTransaction": ("_root", "StarsTransaction"),
+    "StarsTransactionInst": ("_root", "StarsTransactionInst"),
+    "FoundStory": ("_root", "FoundStory"),
+    "FoundStoryInst": ("_root", "FoundStoryInst"),
+    "GeoPointAddress": ("_root", "GeoPointAddress"),
+    "GeoPointAddressInst": ("_root", "GeoPointAddressInst"),
+    "StarsRevenueStatus": ("_root", "StarsRevenueStatus"),
+    "StarsRevenueStatusInst": ("_root", "StarsRevenueStatusInst"),
+    "InputStarsTransaction": ("_root", "InputStarsTransaction"),
+    "InputStarsTransactionInst": ("_root", "InputStarsTransactionInst"),
+    "StarsGiftOption": ("_root", "StarsGiftOption"),
+    "StarsGiftOptionInst": ("_root", "StarsGiftOptionInst"),
+    "BotPreviewMedia": ("_root", "BotPreviewMedia"),
+    "BotPreviewMediaInst": ("_root", "BotPreviewMediaInst"),
+    "StarsSubscriptionPricing": ("_root", "StarsSubscriptionPricing"),
+    "StarsSubscriptionPricingInst": ("_root", "StarsSubscriptionPricingInst"),
+    "StarsSubscription": ("_root", "StarsSubscription"),
+    "StarsSubscriptionInst": ("_root", "StarsSubscriptionInst"),
+    "MessageReactor": ("_root", "MessageReactor"),
+    "MessageReactorInst": ("_root", "MessageReactorInst"),
+    "StarsGiveawayOption": ("_root", "StarsGiveawayOption"),
+    "StarsGiveawayOptionInst": ("_root", "StarsGiveawayOptionInst"),
+    "StarsGiveawayWinnersOption": ("_root", "StarsGiveawayWinnersOption"),
+    "StarsGiveawayWinnersOptionInst": ("_root", "StarsGiveawayWinnersOptionInst"),
+    "StarGift": ("_root", "StarGift"),
+    "StarGiftInst": ("_root", "StarGiftInst"),
+    "MessageReportOption": ("_root", "MessageReportOption"),
+    "MessageReportOptionInst": ("_root", "MessageReportOptionInst"),
+    "ReportResult": ("_root", "ReportResult"),
+    "ReportResultInst": ("_root", "ReportResultInst"),
+    "BotAppSettings": ("_root", "BotAppSettings"),
+    "BotAppSettingsInst": ("_root", "BotAppSettingsInst"),
+    "StarRefProgram": ("_root", "StarRefProgram"),
+    "StarRefProgramInst": ("_root", "StarRefProgramInst"),
+    "ConnectedBotStarRef": ("_root", "ConnectedBotStarRef"),
+    "ConnectedBotStarRefInst": ("_root", "ConnectedBotStarRefInst"),
+    "StarsAmount": ("_root", "StarsAmount"),
+    "StarsAmountInst": ("_root", "StarsAmountInst"),
+    "BotVerifierSettings": ("_root", "BotVerifierSettings"),
+    "BotVerifierSettingsInst": ("_root", "BotVerifierSettingsInst"),
+    "BotVerification": ("_root", "BotVerification"),
+    "BotVerificationInst": ("_root", "BotVerificationInst"),
+    "StarGiftAttribute": ("_root", "StarGiftAttribute"),
+    "StarGiftAttributeInst": ("_root", "StarGiftAttributeInst"),
+    "SavedStarGift": ("_root", "SavedStarGift"),
+    "SavedStarGiftInst": ("_root", "SavedStarGiftInst"),
+    "InputSavedStarGift": ("_root", "InputSavedStarGift"),
+    "InputSavedStarGiftInst": ("_root", "InputSavedStarGiftInst"),
+    "PaidReactionPrivacy": ("_root", "PaidReactionPrivacy"),
+    "PaidReactionPrivacyInst": ("_root", "PaidReactionPrivacyInst"),
+    "RequirementToContact": ("_root", "RequirementToContact"),
+    "RequirementToContactInst": ("_root", "RequirementToContactInst"),
+    "BusinessBotRights": ("_root", "BusinessBotRights"),
+    "BusinessBotRightsInst": ("_root", "BusinessBotRightsInst"),
+    "DisallowedGiftsSettings": ("_root", "DisallowedGiftsSettings"),
+    "DisallowedGiftsSettingsInst": ("_root", "DisallowedGiftsSettingsInst"),
+    "SponsoredPeer": ("_root", "SponsoredPeer"),
+    "SponsoredPeerInst": ("_root", "SponsoredPeerInst"),
+    "MessageUserVote": ("_root", "MessageUserVote"),
+    "MessageUserVoteInst": ("_root", "MessageUserVoteInst"),
+    "MessageInteractionCounters": ("_root", "MessageInteractionCounters"),
+    "MessageInteractionCountersInst": ("_root", "MessageInteractionCountersInst"),
+    "ChatTheme": ("_root", "ChatTheme"),
+    "ChatThemeInst": ("_root", "ChatThemeInst"),
+    "MessageUserReaction": ("_root", "MessageUserReaction"),
+    "MessageUserReactionInst": ("_root", "MessageUserReactionInst"),
+    "SimpleWebViewResult": ("_root", "SimpleWebViewResult"),
+    "SimpleWebViewResultInst": ("_root", "SimpleWebViewResultInst"),
+    "PremiumGiftOption": ("_root", "PremiumGiftOption"),
+    "PremiumGiftOptionInst": ("_root", "PremiumGiftOptionInst"),
+    "AppWebViewResult": ("_root", "AppWebViewResult"),
+    "AppWebViewResultInst": ("_root", "AppWebViewResultInst"),
+    "SponsoredWebPage": ("_root", "SponsoredWebPage"),
+    "SponsoredWebPageInst": ("_root", "SponsoredWebPageInst"),
+    "UserStories": ("_root", "UserStories"),
+    "UserStoriesInst": ("_root", "UserStoriesInst"),
+    "Booster": ("_root", "Booster"),
+    "BoosterInst": ("_root", "BoosterInst"),
+    "UserStarGift": ("_root", "UserStarGift"),
+    "UserStarGiftInst": ("_root", "UserStarGiftInst"),
+}
+
+__getattr__ = lazy_getattr(__name__, globals(), LAZY_INDEX)
@@ -0,0 +1,1152 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+FutureSalts = tl.core_types.FutureSalts
+FutureSaltsInst = (tl.core_types.FutureSalts,)
+
+WallPaper = tl.types.WallPaper | tl.types.WallPaperNoFile | tl.types.WallPaperToFormatInternal
+WallPaperInst = (tl.types.WallPaper, tl.types.WallPaperNoFile, tl.types.WallPaperToFormatInternal,)
+
+Message = tl.types.ChannelMessageToFormatInternal | tl.types.Message | tl.types.MessageEmpty | tl.types.MessageService | tl.types.MessageServiceToFormatInternal | tl.types.MessageService_133 | tl.types.MessageToFormatInternal | tl.types.Message_133 | tl.types.Message_136 | tl.types.Message_170 | tl.types.Message_174 | tl.types.Message_176 | tl.types.Message_177 | tl.types.Message_181 | tl.types.Message_196
+MessageInst = (tl.types.ChannelMessageToFormatInternal, tl.types.Message, tl.types.MessageEmpty, tl.types.MessageService, tl.types.MessageServiceToFormatInternal, tl.types.MessageService_133, tl.types.MessageToFormatInternal, tl.types.Message_133, tl.types.Message_136, tl.types.Message_170, tl.types.Message_174, tl.types.Message_176, tl.types.Message_177, tl.types.Message_181, tl.types.Message_196,)
+
+Theme = tl.types.Theme | tl.types.ThemeToFormatInternal | tl.types.Theme_133
+ThemeInst = (tl.types.Theme, tl.types.ThemeToFormatInternal, tl.types.Theme_133,)
+
+Chat = tl.types.Channel | tl.types.ChannelForbidden | tl.types.ChannelToFormatInternal | tl.types.Channel_133 | tl.types.Channel_148 | tl.types.Channel_164 | tl.types.Channel_166 | tl.types.Channel_167 | tl.types.Channel_168 | tl.types.Channel_186 | tl.types.Channel_196 | tl.types.Chat | tl.types.ChatEmpty | tl.types.ChatForbidden | tl.types.ChatToFormatInternal
+ChatInst = (tl.types.Channel, tl.types.ChannelForbidden, tl.types.ChannelToFormatInternal, tl.types.Channel_133, tl.types.Channel_148, tl.types.Channel_164, tl.types.Channel_166, tl.types.Channel_167, tl.types.Channel_168, tl.types.Channel_186, tl.types.Channel_196, tl.types.Chat, tl.types.ChatEmpty, tl.types.ChatForbidden, tl.types.ChatToFormatInternal,)
+
+User = tl.types.User | tl.types.UserEmpty | tl.types.UserToFormatInternal | tl.types.User_133 | tl.types.User_145 | tl.types.User_148 | tl.types.User_160 | tl.types.User_166 | tl.types.User_167 | tl.types.User_185 | tl.types.User_196
+UserInst = (tl.types.User, tl.types.UserEmpty, tl.types.UserToFormatInternal, tl.types.User_133, tl.types.User_145, tl.types.User_148, tl.types.User_160, tl.types.User_166, tl.types.User_167, tl.types.User_185, tl.types.User_196,)
+
+EncryptedChat = tl.types.EncryptedChat | tl.types.EncryptedChatDiscarded | tl.types.EncryptedChatEmpty | tl.types.EncryptedChatRequested | tl.types.EncryptedChatToFormatInternal | tl.types.EncryptedChatWaiting
+EncryptedChatInst = (tl.types.EncryptedChat, tl.types.EncryptedChatDiscarded, tl.types.EncryptedChatEmpty, tl.types.EncryptedChatRequested, tl.types.EncryptedChatToFormatInternal, tl.types.EncryptedChatWaiting,)
+
+PollResults = tl.types.PollResults | tl.types.PollResultsToFormatInternal | tl.types.PollResults_133
+PollResultsInst = (tl.types.PollResults, tl.types.PollResultsToFormatInternal, tl.types.PollResults_133,)
+
+PollAnswerVoters = tl.types.PollAnswerVoters | tl.types.PollAnswerVotersToFormatInternal
+PollAnswerVotersInst = (tl.types.PollAnswerVoters, tl.types.PollAnswerVotersToFormatInternal,)
+
+PhoneCall = tl.types.PhoneCall | tl.types.PhoneCallAccepted | tl.types.PhoneCallAccepted_133 | tl.types.PhoneCallDiscarded | tl.types.PhoneCallDiscarded_133 | tl.types.PhoneCallEmpty | tl.types.PhoneCallRequested | tl.types.PhoneCallRequested_133 | tl.types.PhoneCallToFormatInternal | tl.types.PhoneCallWaiting | tl.types.PhoneCallWaiting_133 | tl.types.PhoneCall_133 | tl.types.PhoneCall_177
+PhoneCallInst = (tl.types.PhoneCall, tl.types.PhoneCallAccepted, tl.types.PhoneCallAccepted_133, tl.types.PhoneCallDiscarded, tl.types.PhoneCallDiscarded_133, tl.types.PhoneCallEmpty, tl.types.PhoneCallRequested, tl.types.PhoneCallRequested_133, tl.types.PhoneCallToFormatInternal, tl.types.PhoneCallWaiting, tl.types.PhoneCallWaiting_133, tl.types.PhoneCall_133, tl.types.PhoneCall_177,)
+
+Update = tl.types.UpdateAttachMenuBots | tl.types.UpdateAutoSaveSettings | tl.types.UpdateBotBusinessConnect | tl.types.UpdateBotCallbackQuery | tl.types.UpdateBotChatBoost | tl.types.UpdateBotChatInviteRequester | tl.types.UpdateBotCommands | tl.types.UpdateBotDeleteBusinessMessage | tl.types.UpdateBotEditBusinessMessage | tl.types.UpdateBotInlineQuery | tl.types.UpdateBotInlineSend | tl.types.UpdateBotMenuButton | tl.types.UpdateBotMessageReaction | tl.types.UpdateBotMessageReactions | tl.types.UpdateBotNewBusinessMessage | tl.types.UpdateBotPrecheckoutQuery | tl.types.UpdateBotPurchasedPaidMedia | tl.types.UpdateBotShippingQuery | tl.types.UpdateBotStopped | tl.types.UpdateBotSubscriptionExpire_193 | tl.types.UpdateBotWebhookJSON | tl.types.UpdateBotWebhookJSONQuery | tl.types.UpdateBroadcastRevenueTransactions | tl.types.UpdateBroadcastRevenueTransactions_179 | tl.types.UpdateBusinessBotCallbackQuery | tl.types.UpdateChannel | tl.types.UpdateChannelAvailableMessages | tl.types.UpdateChannelMessageForwards | tl.types.UpdateChannelMessageViews | tl.types.UpdateChannelParticipant | tl.types.UpdateChannelPinnedTopic | tl.types.UpdateChannelPinnedTopic_148 | tl.types.UpdateChannelPinnedTopics | tl.types.UpdateChannelReadMessagesContents | tl.types.UpdateChannelReadMessagesContents_133 | tl.types.UpdateChannelTooLong | tl.types.UpdateChannelUserTyping | tl.types.UpdateChannelViewForumAsMessages | tl.types.UpdateChannelWebPage | tl.types.UpdateChat | tl.types.UpdateChatDefaultBannedRights | tl.types.UpdateChatParticipant | tl.types.UpdateChatParticipantAdd | tl.types.UpdateChatParticipantAdmin | tl.types.UpdateChatParticipantDelete | tl.types.UpdateChatParticipants | tl.types.UpdateChatUserTyping | tl.types.UpdateConfig | tl.types.UpdateContactsReset | tl.types.UpdateDcOptions | tl.types.UpdateDeleteChannelMessages | tl.types.UpdateDeleteMessages | tl.types.UpdateDeleteQuickReply | tl.types.UpdateDeleteQuickReplyMessages | tl.types.UpdateDeleteScheduledMessages | tl.types.UpdateDeleteScheduledMessages_133 | tl.types.UpdateDialogFilter | tl.types.UpdateDialogFilterOrder | tl.types.UpdateDialogFilters | tl.types.UpdateDialogPinned | tl.types.UpdateDialogUnreadMark | tl.types.UpdateDraftMessage | tl.types.UpdateDraftMessage_133 | tl.types.UpdateEditChannelMessage | tl.types.UpdateEditMessage | tl.types.UpdateEncryptedChatTyping | tl.types.UpdateEncryptedMessagesRead | tl.types.UpdateEncryption | tl.types.UpdateFavedStickers | tl.types.UpdateFolderPeers | tl.types.UpdateGeoLiveViewed | tl.types.UpdateGroupCall | tl.types.UpdateGroupCallConnection | tl.types.UpdateGroupCallParticipants | tl.types.UpdateGroupCall_133 | tl.types.UpdateGroupInvitePrivacyForbidden_155 | tl.types.UpdateInlineBotCallbackQuery | tl.types.UpdateLangPack | tl.types.UpdateLangPackTooLong | tl.types.UpdateLoginToken | tl.types.UpdateMessageExtendedMedia | tl.types.UpdateMessageExtendedMedia_147 | tl.types.UpdateMessageID | tl.types.UpdateMessageIDToFormatInternal | tl.types.UpdateMessagePoll | tl.types.UpdateMessagePollVote | tl.types.UpdateMessagePollVote_133 | tl.types.UpdateMessageReactions | tl.types.UpdateMessageReactions_136 | tl.types.UpdateMoveStickerSetToTop | tl.types.UpdateNewAuthorization | tl.types.UpdateNewChannelMessage | tl.types.UpdateNewEncryptedMessage | tl.types.UpdateNewMessage | tl.types.UpdateNewQuickReply | tl.types.UpdateNewScheduledMessage | tl.types.UpdateNewStickerSet | tl.types.UpdateNewStoryReaction | tl.types.UpdateNotifySettings | tl.types.UpdatePaidReactionPrivacy | tl.types.UpdatePaidReactionPrivacy_187 | tl.types.UpdatePeerBlocked | tl.types.UpdatePeerBlocked_133 | tl.types.UpdatePeerHistoryTTL | tl.types.UpdatePeerLocated | tl.types.UpdatePeerSettings | tl.types.UpdatePeerWallpaper | tl.types.UpdatePendingJoinRequests | tl.types.UpdatePhoneCall | tl.types.UpdatePhoneCallSignalingData | tl.types.UpdatePinnedChannelMessages | tl.types.UpdatePinnedDialogs | tl.types.UpdatePinnedMessages | tl.types.UpdatePinnedSavedDialogs | tl.types.UpdatePrivacy | tl.types.UpdatePtsChanged | tl.types.UpdateQuickReplies | tl.types.UpdateQuickReplyMessage | tl.types.UpdateReadChannelDiscussionInbox | tl.types.UpdateReadChannelDiscussionOutbox | tl.types.UpdateReadChannelInbox | tl.types.UpdateReadChannelOutbox | tl.types.UpdateReadFeaturedEmojiStickers | tl.types.UpdateReadFeaturedStickers | tl.types.UpdateReadHistoryInbox | tl.types.UpdateReadHistoryOutbox | tl.types.UpdateReadMessagesContents | tl.types.UpdateReadMessagesContents_133 | tl.types.UpdateReadStories | tl.types.UpdateReadStories_160 | tl.types.UpdateRecentEmojiStatuses | tl.types.UpdateRecentReactions | tl.types.UpdateRecentStickers | tl.types.UpdateSavedDialogPinned | tl.types.UpdateSavedGifs | tl.types.UpdateSavedReactionTags | tl.types.UpdateSavedRingtones | tl.types.UpdateSentPhoneCode | tl.types.UpdateSentStoryReaction | tl.types.UpdateSentStoryReaction_161 | tl.types.UpdateServiceNotification | tl.types.UpdateSmsJob | tl.types.UpdateStarsBalance | tl.types.UpdateStarsBalance_181 | tl.types.UpdateStarsRevenueStatus | tl.types.UpdateStickerSets | tl.types.UpdateStickerSetsOrder | tl.types.UpdateStickerSets_133 | tl.types.UpdateStoriesStealthMode | tl.types.UpdateStory | tl.types.UpdateStoryID | tl.types.UpdateStory_160 | tl.types.UpdateTheme | tl.types.UpdateTranscribedAudio | tl.types.UpdateUser | tl.types.UpdateUserEmojiStatus | tl.types.UpdateUserName | tl.types.UpdateUserName_133 | tl.types.UpdateUserPhone | tl.types.UpdateUserPhoto_133 | tl.types.UpdateUserStatus | tl.types.UpdateUserTyping | tl.types.UpdateWebPage | tl.types.UpdateWebViewResultSent
+UpdateInst = (tl.types.UpdateAttachMenuBots, tl.types.UpdateAutoSaveSettings, tl.types.UpdateBotBusinessConnect, tl.types.UpdateBotCallbackQuery, tl.types.UpdateBotChatBoost, tl.types.UpdateBotChatInviteRequester, tl.types.UpdateBotCommands, tl.types.UpdateBotDeleteBusinessMessage, tl.types.UpdateBotEditBusinessMessage, tl.types.UpdateBotInlineQuery, tl.types.UpdateBotInlineSend, tl.types.UpdateBotMenuButton, tl.types.UpdateBotMessageReaction, tl.types.UpdateBotMessageReactions, tl.types.UpdateBotNewBusinessMessage, tl.types.UpdateBotPrecheckoutQuery, tl.types.UpdateBotPurchasedPaidMedia, tl.types.UpdateBotShippingQuery, tl.types.UpdateBotStopped, tl.types.UpdateBotSubscriptionExpire_193, tl.types.UpdateBotWebhookJSON, tl.types.UpdateBotWebhookJSONQuery, tl.types.UpdateBroadcastRevenueTransactions, tl.types.UpdateBroadcastRevenueTransactions_179, tl.types.UpdateBusinessBotCallbackQuery, tl.types.UpdateChannel, tl.types.UpdateChannelAvailableMessages, tl.types.UpdateChannelMessageForwards, tl.types.UpdateChannelMessageViews, tl.types.UpdateChannelParticipant, tl.types.UpdateChannelPinnedTopic, tl.types.UpdateChannelPinnedTopic_148, tl.types.UpdateChannelPinnedTopics, tl.types.UpdateChannelReadMessagesContents, tl.types.UpdateChannelReadMessagesContents_133, tl.types.UpdateChannelTooLong, tl.types.UpdateChannelUserTyping, tl.types.UpdateChannelViewForumAsMessages, tl.types.UpdateChannelWebPage, tl.types.UpdateChat, tl.types.UpdateChatDefaultBannedRights, tl.types.UpdateChatParticipant, tl.types.UpdateChatParticipantAdd, tl.types.UpdateChatParticipantAdmin, tl.types.UpdateChatParticipantDelete, tl.types.UpdateChatParticipants, tl.types.UpdateChatUserTyping, tl.types.UpdateConfig, tl.types.UpdateContactsReset, tl.types.UpdateDcOptions, tl.types.UpdateDeleteChannelMessages, tl.types.UpdateDeleteMessages, tl.types.UpdateDeleteQuickReply, tl.types.UpdateDeleteQuickReplyMessages, tl.types.UpdateDeleteScheduledMessages, tl.types.UpdateDeleteScheduledMessages_133, tl.types.UpdateDialogFilter, tl.types.UpdateDialogFilterOrder, tl.types.UpdateDialogFilters, tl.types.UpdateDialogPinned, tl.types.UpdateDialogUnreadMark, tl.types.UpdateDraftMessage, tl.types.UpdateDraftMessage_133, tl.types.UpdateEditChannelMessage, tl.types.UpdateEditMessage, tl.types.UpdateEncryptedChatTyping, tl.types.UpdateEncryptedMessagesRead, tl.types.UpdateEncryption, tl.types.UpdateFavedStickers, tl.types.UpdateFolderPeers, tl.types.UpdateGeoLiveViewed, tl.types.UpdateGroupCall, tl.types.UpdateGroupCallConnection, tl.types.UpdateGroupCallParticipants, tl.types.UpdateGroupCall_133, tl.types.UpdateGroupInvitePrivacyForbidden_155, tl.types.UpdateInlineBotCallbackQuery, tl.types.UpdateLangPack, tl.types.UpdateLangPackTooLong, tl.types.UpdateLoginToken, tl.types.UpdateMessageExtendedMedia, tl.types.UpdateMessageExtendedMedia_147, tl.types.UpdateMessageID, tl.types.UpdateMessageIDToFormatInternal, tl.types.UpdateMessagePoll, tl.types.UpdateMessagePollVote, tl.types.UpdateMessagePollVote_133, tl.types.UpdateMessageReactions, tl.types.UpdateMessageReactions_136, tl.types.UpdateMoveStickerSetToTop, tl.types.UpdateNewAuthorization, tl.types.UpdateNewChannelMessage, tl.types.UpdateNewEncryptedMessage, tl.types.UpdateNewMessage, tl.types.UpdateNewQuickReply, tl.types.UpdateNewScheduledMessage, tl.types.UpdateNewStickerSet, tl.types.UpdateNewStoryReaction, tl.types.UpdateNotifySettings, tl.types.UpdatePaidReactionPrivacy, tl.types.UpdatePaidReactionPrivacy_187, tl.types.UpdatePeerBlocked, tl.types.UpdatePeerBlocked_133, tl.types.UpdatePeerHistoryTTL, tl.types.UpdatePeerLocated, tl.types.UpdatePeerSettings, tl.types.UpdatePeerWallpaper, tl.types.UpdatePendingJoinRequests, tl.types.UpdatePhoneCall, tl.types.UpdatePhoneCallSignalingData, tl.types.UpdatePinnedChannelMessages, tl.types.UpdatePinnedDialogs, tl.types.UpdatePinnedMessages, tl.types.UpdatePinnedSavedDialogs, tl.types.UpdatePrivacy, tl.types.UpdatePtsChanged, tl.types.UpdateQuickReplies, tl.types.UpdateQuickReplyMessage, tl.types.UpdateReadChannelDiscussionInbox, tl.types.UpdateReadChannelDiscussionOutbox, tl.types.UpdateReadChannelInbox, tl.types.UpdateReadChannelOutbox, tl.types.UpdateReadFeaturedEmojiStickers, tl.types.UpdateReadFeaturedStickers, tl.types.UpdateReadHistoryInbox, tl.types.UpdateReadHistoryOutbox, tl.types.UpdateReadMessagesContents, tl.types.UpdateReadMessagesContents_133, tl.types.UpdateReadStories, tl.types.UpdateReadStories_160, tl.types.UpdateRecentEmojiStatuses, tl.types.UpdateRecentReactions, tl.types.UpdateRecentStickers, tl.types.UpdateSavedDialogPinned, tl.types.UpdateSavedGifs, tl.types.UpdateSavedReactionTags, tl.types.UpdateSavedRingtones, tl.types.UpdateSentPhoneCode, tl.types.UpdateSentStoryReaction, tl.types.UpdateSentStoryReaction_161, tl.types.UpdateServiceNotification, tl.types.UpdateSmsJob, tl.types.UpdateStarsBalance, tl.types.UpdateStarsBalance_181, tl.types.UpdateStarsRevenueStatus, tl.types.UpdateStickerSets, tl.types.UpdateStickerSetsOrder, tl.types.UpdateStickerSets_133, tl.types.UpdateStoriesStealthMode, tl.types.UpdateStory, tl.types.UpdateStoryID, tl.types.UpdateStory_160, tl.types.UpdateTheme, tl.types.UpdateTranscribedAudio, tl.types.UpdateUser, tl.types.UpdateUserEmojiStatus, tl.types.UpdateUserName, tl.types.UpdateUserName_133, tl.types.UpdateUserPhone, tl.types.UpdateUserPhoto_133, tl.types.UpdateUserStatus, tl.types.UpdateUserTyping, tl.types.UpdateWebPage, tl.types.UpdateWebViewResultSent,)
+
+StickerSet = tl.types.StickerSet | tl.types.StickerSetToFormatInternal | tl.types.StickerSet_133
+StickerSetInst = (tl.types.StickerSet, tl.types.StickerSetToFormatInternal, tl.types.StickerSet_133,)
+
+ResPQ = tl.types.ResPQ
+ResPQInst = (tl.types.ResPQ,)
+
+PQInnerData = tl.types.PQInnerData | tl.types.PQInnerDataDc | tl.types.PQInnerDataTemp | tl.types.PQInnerDataTempDc
+PQInnerDataInst = (tl.types.PQInnerData, tl.types.PQInnerDataDc, tl.types.PQInnerDataTemp, tl.types.PQInnerDataTempDc,)
+
+BindAuthKeyInner = tl.types.BindAuthKeyInner
+BindAuthKeyInnerInst = (tl.types.BindAuthKeyInner,)
+
+ServerDHParams = tl.types.ServerDHParamsFail | tl.types.ServerDHParamsOk
+ServerDHParamsInst = (tl.types.ServerDHParamsFail, tl.types.ServerDHParamsOk,)
+
+ServerDHInnerData = tl.types.ServerDHInnerData
+ServerDHInnerDataInst = (tl.types.ServerDHInnerData,)
+
+ClientDHInnerData = tl.types.ClientDHInnerData
+ClientDHInnerDataInst = (tl.types.ClientDHInnerData,)
+
+SetClientDHParamsAnswer = tl.types.DhGenFail | tl.types.DhGenOk | tl.types.DhGenRetry
+SetClientDHParamsAnswerInst = (tl.types.DhGenFail, tl.types.DhGenOk, tl.types.DhGenRetry,)
+
+DestroyAuthKeyRes = tl.types.DestroyAuthKeyFail | tl.types.DestroyAuthKeyNone | tl.types.DestroyAuthKeyOk
+DestroyAuthKeyResInst = (tl.types.DestroyAuthKeyFail, tl.types.DestroyAuthKeyNone, tl.types.DestroyAuthKeyOk,)
+
+MsgsAck = tl.types.MsgsAck
+MsgsAckInst = (tl.types.MsgsAck,)
+
+BadMsgNotification = tl.types.BadMsgNotification | tl.types.BadServerSalt
+BadMsgNotificationInst = (tl.types.BadMsgNotification, tl.types.BadServerSalt,)
+
+MsgsStateReq = tl.types.MsgsStateReq
+MsgsStateReqInst = (tl.types.MsgsStateReq,)
+
+MsgsStateInfo = tl.types.MsgsStateInfo
+MsgsStateInfoInst = (tl.types.MsgsStateInfo,)
+
+MsgsAllInfo = tl.types.MsgsAllInfo
+MsgsAllInfoInst = (tl.types.MsgsAllInfo,)
+
+MsgDetailedInfo = tl.types.MsgDetailedInfo | tl.types.MsgNewDetailedInfo
+MsgDetailedInfoInst = (tl.types.MsgDetailedInfo, tl.types.MsgNewDetailedInfo,)
+
+MsgResendReq = tl.types.MsgResendReq
+MsgResendReqInst = (tl.types.MsgResendReq,)
+
+RpcError = tl.types.RpcError
+RpcErrorInst = (tl.types.RpcError,)
+
+RpcDropAnswer = tl.types.RpcAnswerDropped | tl.types.RpcAnswerDroppedRunning | tl.types.RpcAnswerUnknown
+RpcDropAnswerInst = (tl.types.RpcAnswerDropped, tl.types.RpcAnswerDroppedRunning, tl.types.RpcAnswerUnknown,)
+
+FutureSalt = tl.types.FutureSalt
+FutureSaltInst = (tl.types.FutureSalt,)
+
+Pong = tl.types.Pong
+PongInst = (tl.types.Pong,)
+
+DestroySessionRes = tl.types.DestroySessionNone | tl.types.DestroySessionOk
+DestroySessionResInst = (tl.types.DestroySessionNone, tl.types.DestroySessionOk,)
+
+NewSession = tl.types.NewSessionCreated
+NewSessionInst = (tl.types.NewSessionCreated,)
+
+HttpWait = tl.types.HttpWait
+HttpWaitInst = (tl.types.HttpWait,)
+
+IpPort = tl.types.IpPort | tl.types.IpPortSecret
+IpPortInst = (tl.types.IpPort, tl.types.IpPortSecret,)
+
+AccessPointRule = tl.types.AccessPointRule
+AccessPointRuleInst = (tl.types.AccessPointRule,)
+
+TlsClientHello = tl.types.TlsClientHello
+TlsClientHelloInst = (tl.types.TlsClientHello,)
+
+TlsBlock = tl.types.TlsBlockDomain | tl.types.TlsBlockGrease | tl.types.TlsBlockPublicKey | tl.types.TlsBlockRandom | tl.types.TlsBlockScope | tl.types.TlsBlockString | tl.types.TlsBlockZero
+TlsBlockInst = (tl.types.TlsBlockDomain, tl.types.TlsBlockGrease, tl.types.TlsBlockPublicKey, tl.types.TlsBlockRandom, tl.types.TlsBlockScope, tl.types.TlsBlockString, tl.types.TlsBlockZero,)
+
+InputPeer = tl.types.InputPeerChannel | tl.types.InputPeerChannelFromMessage | tl.types.InputPeerChat | tl.types.InputPeerEmpty | tl.types.InputPeerSelf | tl.types.InputPeerUser | tl.types.InputPeerUserFromMessage
+InputPeerInst = (tl.types.InputPeerChannel, tl.types.InputPeerChannelFromMessage, tl.types.InputPeerChat, tl.types.InputPeerEmpty, tl.types.InputPeerSelf, tl.types.InputPeerUser, tl.types.InputPeerUserFromMessage,)
+
+InputUser = tl.types.InputUser | tl.types.InputUserEmpty | tl.types.InputUserFromMessage | tl.types.InputUserSelf
+InputUserInst = (tl.types.InputUser, tl.types.InputUserEmpty, tl.types.InputUserFromMessage, tl.types.InputUserSelf,)
+
+InputContact = tl.types.InputPhoneContact
+InputContactInst = (tl.types.InputPhoneContact,)
+
+InputFile = tl.types.InputFile | tl.types.InputFileBig | tl.types.InputFileStoryDocument
+InputFileInst = (tl.types.InputFile, tl.types.InputFileBig, tl.types.InputFileStoryDocument,)
+
+InputMedia = tl.types.InputMediaContact | tl.types.InputMediaDice | tl.types.InputMediaDocument | tl.types.InputMediaDocumentExternal | tl.types.InputMediaDocumentExternal_133 | tl.types.InputMediaDocument_133 | tl.types.InputMediaEmpty | tl.types.InputMediaGame | tl.types.InputMediaGeoLive | tl.types.InputMediaGeoPoint | tl.types.InputMediaInvoice | tl.types.InputMediaInvoice_133 | tl.types.InputMediaInvoice_147 | tl.types.InputMediaPaidMedia | tl.types.InputMediaPaidMedia_183 | tl.types.InputMediaPhoto | tl.types.InputMediaPhotoExternal | tl.types.InputMediaPoll | tl.types.InputMediaStory | tl.types.InputMediaStory_160 | tl.types.InputMediaUploadedDocument | tl.types.InputMediaUploadedDocument_133 | tl.types.InputMediaUploadedPhoto | tl.types.InputMediaVenue | tl.types.InputMediaWebPage
+InputMediaInst = (tl.types.InputMediaContact, tl.types.InputMediaDice, tl.types.InputMediaDocument, tl.types.InputMediaDocumentExternal, tl.types.InputMediaDocumentExternal_133, tl.types.InputMediaDocument_133, tl.types.InputMediaEmpty, tl.types.InputMediaGame, tl.types.InputMediaGeoLive, tl.types.InputMediaGeoPoint, tl.types.InputMediaInvoice, tl.types.InputMediaInvoice_133, tl.types.InputMediaInvoice_147, tl.types.InputMediaPaidMedia, tl.types.InputMediaPaidMedia_183, tl.types.InputMediaPhoto, tl.types.InputMediaPhotoExternal, tl.types.InputMediaPoll, tl.types.InputMediaStory, tl.types.InputMediaStory_160, tl.types.InputMediaUploadedDocument, tl.types.InputMediaUploadedDocument_133, tl.types.InputMediaUploadedPhoto, tl.types.InputMediaVenue, tl.types.InputMediaWebPage,)
+
+InputChatPhoto = tl.types.InputChatPhoto | tl.types.InputChatPhotoEmpty | tl.types.InputChatUploadedPhoto | tl.types.InputChatUploadedPhoto_133
+InputChatPhotoInst = (tl.types.InputChatPhoto, tl.types.InputChatPhotoEmpty, tl.types.InputChatUploadedPhoto, tl.types.InputChatUploadedPhoto_133,)
+
+InputGeoPoint = tl.types.InputGeoPoint | tl.types.InputGeoPointEmpty
+InputGeoPointInst = (tl.types.InputGeoPoint, tl.types.InputGeoPointEmpty,)
+
+InputPhoto = tl.types.InputPhoto | tl.types.InputPhotoEmpty
+InputPhotoInst = (tl.types.InputPhoto, tl.types.InputPhotoEmpty,)
+
+InputFileLocation = tl.types.InputDocumentFileLocation | tl.types.InputEncryptedFileLocation | tl.types.InputFileLocation | tl.types.InputGroupCallStream | tl.types.InputPeerPhotoFileLocation | tl.types.InputPhotoFileLocation | tl.types.InputPhotoLegacyFileLocation | tl.types.InputSecureFileLocation | tl.types.InputStickerSetThumb | tl.types.InputTakeoutFileLocation
+InputFileLocationInst = (tl.types.InputDocumentFileLocation, tl.types.InputEncryptedFileLocation, tl.types.InputFileLocation, tl.types.InputGroupCallStream, tl.types.InputPeerPhotoFileLocation, tl.types.InputPhotoFileLocation, tl.types.InputPhotoLegacyFileLocation, tl.types.InputSecureFileLocation, tl.types.InputStickerSetThumb, tl.types.InputTakeoutFileLocation,)
+
+Peer = tl.types.PeerChannel | tl.types.PeerChat | tl.types.PeerUser
+PeerInst = (tl.types.PeerChannel, tl.types.PeerChat, tl.types.PeerUser,)
+
+UserProfilePhoto = tl.types.UserProfilePhoto | tl.types.UserProfilePhotoEmpty
+UserProfilePhotoInst = (tl.types.UserProfilePhoto, tl.types.UserProfilePhotoEmpty,)
+
+UserStatus = tl.types.UserStatusEmpty | tl.types.UserStatusLastMonth | tl.types.UserStatusLastMonth_133 | tl.types.UserStatusLastWeek | tl.types.UserStatusLastWeek_133 | tl.types.UserStatusOffline | tl.types.UserStatusOnline | tl.types.UserStatusRecently | tl.types.UserStatusRecently_133
+UserStatusInst = (tl.types.UserStatusEmpty, tl.types.UserStatusLastMonth, tl.types.UserStatusLastMonth_133, tl.types.UserStatusLastWeek, tl.types.UserStatusLastWeek_133, tl.types.UserStatusOffline, tl.types.UserStatusOnline, tl.types.UserStatusRecently, tl.types.UserStatusRecently_133,)
+
+ChatFull = tl.types.ChannelFull | tl.types.ChannelFull_133 | tl.types.ChannelFull_134 | tl.types.ChannelFull_135 | tl.types.ChannelFull_136 | tl.types.ChannelFull_140 | tl.types.ChannelFull_145 | tl.types.ChannelFull_164 | tl.types.ChannelFull_168 | tl.types.ChannelFull_174 | tl.types.ChannelFull_179 | tl.types.ChannelFull_196 | tl.types.ChatFull | tl.types.ChatFull_133 | tl.types.ChatFull_134 | tl.types.ChatFull_136 | tl.types.ChatFull_145
+ChatFullInst = (tl.types.ChannelFull, tl.types.ChannelFull_133, tl.types.ChannelFull_134, tl.types.ChannelFull_135, tl.types.ChannelFull_136, tl.types.ChannelFull_140, tl.types.ChannelFull_145, tl.types.ChannelFull_164, tl.types.ChannelFull_168, tl.types.ChannelFull_174, tl.types.ChannelFull_179, tl.types.ChannelFull_196, tl.types.ChatFull, tl.types.ChatFull_133, tl.types.ChatFull_134, tl.types.ChatFull_136, tl.types.ChatFull_145,)
+
+ChatParticipant = tl.types.ChatParticipant | tl.types.ChatParticipantAdmin | tl.types.ChatParticipantCreator
+ChatParticipantInst = (tl.types.ChatParticipant, tl.types.ChatParticipantAdmin, tl.types.ChatParticipantCreator,)
+
+ChatParticipants = tl.types.ChatParticipants | tl.types.ChatParticipantsForbidden
+ChatParticipantsInst = (tl.types.ChatParticipants, tl.types.ChatParticipantsForbidden,)
+
+ChatPhoto = tl.types.ChatPhoto | tl.types.ChatPhotoEmpty
+ChatPhotoInst = (tl.types.ChatPhoto, tl.types.ChatPhotoEmpty,)
+
+MessageMedia = tl.types.MessageMediaContact | tl.types.MessageMediaDice | tl.types.MessageMediaDocument | tl.types.MessageMediaDocument_133 | tl.types.MessageMediaDocument_160 | tl.types.MessageMediaDocument_189 | tl.types.MessageMediaEmpty | tl.types.MessageMediaGame | tl.types.MessageMediaGeo | tl.types.MessageMediaGeoLive | tl.types.MessageMediaGiveaway | tl.types.MessageMediaGiveawayResults | tl.types.MessageMediaGiveawayResults_168 | tl.types.MessageMediaGiveaway_166 | tl.types.MessageMediaGiveaway_168 | tl.types.MessageMediaInvoice | tl.types.MessageMediaInvoice_133 | tl.types.MessageMediaPaidMedia | tl.types.MessageMediaPhoto | tl.types.MessageMediaPoll | tl.types.MessageMediaStory | tl.types.MessageMediaStory_160 | tl.types.MessageMediaUnsupported | tl.types.MessageMediaVenue | tl.types.MessageMediaWebPage | tl.types.MessageMediaWebPage_133
+MessageMediaInst = (tl.types.MessageMediaContact, tl.types.MessageMediaDice, tl.types.MessageMediaDocument, tl.types.MessageMediaDocument_133, tl.types.MessageMediaDocument_160, tl.types.MessageMediaDocument_189, tl.types.MessageMediaEmpty, tl.types.MessageMediaGame, tl.types.MessageMediaGeo, tl.types.MessageMediaGeoLive, tl.types.MessageMediaGiveaway, tl.types.MessageMediaGiveawayResults, tl.types.MessageMediaGiveawayResults_168, tl.types.MessageMediaGiveaway_166, tl.types.MessageMediaGiveaway_168, tl.types.MessageMediaInvoice, tl.types.MessageMediaInvoice_133, tl.types.MessageMediaPaidMedia, tl.types.MessageMediaPhoto, tl.types.MessageMediaPoll, tl.types.MessageMediaStory, tl.types.MessageMediaStory_160, tl.types.MessageMediaUnsupported, tl.types.MessageMediaVenue, tl.types.MessageMediaWebPage, tl.types.MessageMediaWebPage_133,)
+
+MessageAction = tl.types.MessageActionAttachMenuBotAllowed_151 | tl.types.MessageActionBoostApply | tl.types.MessageActionBotAllowed | tl.types.MessageActionBotAllowed_133 | tl.types.MessageActionChannelCreate | tl.types.MessageActionChannelMigrateFrom | tl.types.MessageActionChatAddUser | tl.types.MessageActionChatCreate | tl.types.MessageActionChatDeletePhoto | tl.types.MessageActionChatDeleteUser | tl.types.MessageActionChatEditPhoto | tl.types.MessageActionChatEditTitle | tl.types.MessageActionChatJoinedByLink | tl.types.MessageActionChatJoinedByRequest | tl.types.MessageActionChatMigrateTo | tl.types.MessageActionContactSignUp | tl.types.MessageActionCustomAction | tl.types.MessageActionEmpty | tl.types.MessageActionGameScore | tl.types.MessageActionGeoProximityReached | tl.types.MessageActionGiftCode | tl.types.MessageActionGiftCode_166 | tl.types.MessageActionGiftCode_168 | tl.types.MessageActionGiftPremium | tl.types.MessageActionGiftPremium_144 | tl.types.MessageActionGiftPremium_158 | tl.types.MessageActionGiftStars | tl.types.MessageActionGiveawayLaunch | tl.types.MessageActionGiveawayLaunch_166 | tl.types.MessageActionGiveawayResults | tl.types.MessageActionGiveawayResults_167 | tl.types.MessageActionGroupCall | tl.types.MessageActionGroupCallScheduled | tl.types.MessageActionHistoryClear | tl.types.MessageActionInviteToGroupCall | tl.types.MessageActionPaidMessagesPrice | tl.types.MessageActionPaidMessagesRefunded | tl.types.MessageActionPaymentRefunded | tl.types.MessageActionPaymentSent | tl.types.MessageActionPaymentSentMe | tl.types.MessageActionPaymentSentMe_133 | tl.types.MessageActionPaymentSent_133 | tl.types.MessageActionPaymentSent_143 | tl.types.MessageActionPhoneCall | tl.types.MessageActionPinMessage | tl.types.MessageActionPrizeStars | tl.types.MessageActionRequestedPeer | tl.types.MessageActionRequestedPeerSentMe | tl.types.MessageActionRequestedPeer_152 | tl.types.MessageActionScreenshotTaken | tl.types.MessageActionSecureValuesSent | tl.types.MessageActionSecureValuesSentMe | tl.types.MessageActionSetChatTheme | tl.types.MessageActionSetChatWallPaper | tl.types.MessageActionSetChatWallPaper_158 | tl.types.MessageActionSetMessagesTTL | tl.types.MessageActionSetMessagesTTL_133 | tl.types.MessageActionSetSameChatWallPaper_158 | tl.types.MessageActionStarGift | tl.types.MessageActionStarGiftUnique | tl.types.MessageActionStarGiftUnique_196 | tl.types.MessageActionStarGift_189 | tl.types.MessageActionStarGift_193 | tl.types.MessageActionStarGift_196 | tl.types.MessageActionSuggestProfilePhoto | tl.types.MessageActionTopicCreate | tl.types.MessageActionTopicEdit | tl.types.MessageActionTopicEdit_148 | tl.types.MessageActionWebViewDataSent | tl.types.MessageActionWebViewDataSentMe
+MessageActionInst = (tl.types.MessageActionAttachMenuBotAllowed_151, tl.types.MessageActionBoostApply, tl.types.MessageActionBotAllowed, tl.types.MessageActionBotAllowed_133, tl.types.MessageActionChannelCreate, tl.types.MessageActionChannelMigrateFrom, tl.types.MessageActionChatAddUser, tl.types.MessageActionChatCreate, tl.types.MessageActionChatDeletePhoto, tl.types.MessageActionChatDeleteUser, tl.types.MessageActionChatEditPhoto, tl.types.MessageActionChatEditTitle, tl.types.MessageActionChatJoinedByLink, tl.types.MessageActionChatJoinedByRequest, tl.types.MessageActionChatMigrateTo, tl.types.MessageActionContactSignUp, tl.types.MessageActionCustomAction, tl.types.MessageActionEmpty, tl.types.MessageActionGameScore, tl.types.MessageActionGeoProximityReached, tl.types.MessageActionGiftCode, tl.types.MessageActionGiftCode_166, tl.types.MessageActionGiftCode_168, tl.types.MessageActionGiftPremium, tl.types.MessageActionGiftPremium_144, tl.types.MessageActionGiftPremium_158, tl.types.MessageActionGiftStars, tl.types.MessageActionGiveawayLaunch, tl.types.MessageActionGiveawayLaunch_166, tl.types.MessageActionGiveawayResults, tl.types.MessageActionGiveawayResults_167, tl.types.MessageActionGroupCall, tl.types.MessageActionGroupCallScheduled, tl.types.MessageActionHistoryClear, tl.types.MessageActionInviteToGroupCall, tl.types.MessageActionPaidMessagesPrice, tl.types.MessageActionPaidMessagesRefunded, tl.types.MessageActionPaymentRefunded, tl.types.MessageActionPaymentSent, tl.types.MessageActionPaymentSentMe, tl.types.MessageActionPaymentSentMe_133, tl.types.MessageActionPaymentSent_133, tl.types.MessageActionPaymentSent_143, tl.types.MessageActionPhoneCall, tl.types.MessageActionPinMessage, tl.types.MessageActionPrizeStars, tl.types.MessageActionRequestedPeer, tl.types.MessageActionRequestedPeerSentMe, tl.types.MessageActionRequestedPeer_152, tl.types.MessageActionScreenshotTaken, tl.types.MessageActionSecureValuesSent, tl.types.MessageActionSecureValuesSentMe, tl.types.MessageActionSetChatTheme, tl.types.MessageActionSetChatWallPaper, tl.types.MessageActionSetChatWallPaper_158, tl.types.MessageActionSetMessagesTTL, tl.types.MessageActionSetMessagesTTL_133, tl.types.MessageActionSetSameChatWallPaper_158, tl.types.MessageActionStarGift, tl.types.MessageActionStarGiftUnique, tl.types.MessageActionStarGiftUnique_196, tl.types.MessageActionStarGift_189, tl.types.MessageActionStarGift_193, tl.types.MessageActionStarGift_196, tl.types.MessageActionSuggestProfilePhoto, tl.types.MessageActionTopicCreate, tl.types.MessageActionTopicEdit, tl.types.MessageActionTopicEdit_148, tl.types.MessageActionWebViewDataSent, tl.types.MessageActionWebViewDataSentMe,)
+
+Dialog = tl.types.Dialog | tl.types.DialogFolder | tl.types.Dialog_133 | tl.types.Dialog_138
+DialogInst = (tl.types.Dialog, tl.types.DialogFolder, tl.types.Dialog_133, tl.types.Dialog_138,)
+
+Photo = tl.types.Photo | tl.types.PhotoEmpty
+PhotoInst = (tl.types.Photo, tl.types.PhotoEmpty,)
+
+PhotoSize = tl.types.PhotoCachedSize | tl.types.PhotoPathSize | tl.types.PhotoSize | tl.types.PhotoSizeEmpty | tl.types.PhotoSizeProgressive | tl.types.PhotoStrippedSize
+PhotoSizeInst = (tl.types.PhotoCachedSize, tl.types.PhotoPathSize, tl.types.PhotoSize, tl.types.PhotoSizeEmpty, tl.types.PhotoSizeProgressive, tl.types.PhotoStrippedSize,)
+
+GeoPoint = tl.types.GeoPoint | tl.types.GeoPointEmpty
+GeoPointInst = (tl.types.GeoPoint, tl.types.GeoPointEmpty,)
+
+InputNotifyPeer = tl.types.InputNotifyBroadcasts | tl.types.InputNotifyChats | tl.types.InputNotifyForumTopic | tl.types.InputNotifyPeer | tl.types.InputNotifyUsers
+InputNotifyPeerInst = (tl.types.InputNotifyBroadcasts, tl.types.InputNotifyChats, tl.types.InputNotifyForumTopic, tl.types.InputNotifyPeer, tl.types.InputNotifyUsers,)
+
+InputPeerNotifySettings = tl.types.InputPeerNotifySettings | tl.types.InputPeerNotifySettings_133 | tl.types.InputPeerNotifySettings_140
+InputPeerNotifySettingsInst = (tl.types.InputPeerNotifySettings, tl.types.InputPeerNotifySettings_133, tl.types.InputPeerNotifySettings_140,)
+
+PeerNotifySettings = tl.types.PeerNotifySettings | tl.types.PeerNotifySettings_133 | tl.types.PeerNotifySettings_140
+PeerNotifySettingsInst = (tl.types.PeerNotifySettings, tl.types.PeerNotifySettings_133, tl.types.PeerNotifySettings_140,)
+
+PeerSettings = tl.types.PeerSettings | tl.types.PeerSettings_133 | tl.types.PeerSettings_135 | tl.types.PeerSettings_177
+PeerSettingsInst = (tl.types.PeerSettings, tl.types.PeerSettings_133, tl.types.PeerSettings_135, tl.types.PeerSettings_177,)
+
+ReportReason = tl.types.InputReportReasonChildAbuse | tl.types.InputReportReasonCopyright | tl.types.InputReportReasonFake | tl.types.InputReportReasonGeoIrrelevant | tl.types.InputReportReasonIllegalDrugs | tl.types.InputReportReasonOther | tl.types.InputReportReasonPersonalDetails | tl.types.InputReportReasonPornography | tl.types.InputReportReasonSpam | tl.types.InputReportReasonViolence
+ReportReasonInst = (tl.types.InputReportReasonChildAbuse, tl.types.InputReportReasonCopyright, tl.types.InputReportReasonFake, tl.types.InputReportReasonGeoIrrelevant, tl.types.InputReportReasonIllegalDrugs, tl.types.InputReportReasonOther, tl.types.InputReportReasonPersonalDetails, tl.types.InputReportReasonPornography, tl.types.InputReportReasonSpam, tl.types.InputReportReasonViolence,)
+
+UserFull = tl.types.UserFull | tl.types.UserFull_133 | tl.types.UserFull_135 | tl.types.UserFull_140 | tl.types.UserFull_144 | tl.types.UserFull_151 | tl.types.UserFull_158 | tl.types.UserFull_160 | tl.types.UserFull_164 | tl.types.UserFull_176 | tl.types.UserFull_177 | tl.types.UserFull_189 | tl.types.UserFull_195 | tl.types.UserFull_196 | tl.types.UserFull_200
+UserFullInst = (tl.types.UserFull, tl.types.UserFull_133, tl.types.UserFull_135, tl.types.UserFull_140, tl.types.UserFull_144, tl.types.UserFull_151, tl.types.UserFull_158, tl.types.UserFull_160, tl.types.UserFull_164, tl.types.UserFull_176, tl.types.UserFull_177, tl.types.UserFull_189, tl.types.UserFull_195, tl.types.UserFull_196, tl.types.UserFull_200,)
+
+Contact = tl.types.Contact
+ContactInst = (tl.types.Contact,)
+
+ImportedContact = tl.types.ImportedContact
+ImportedContactInst = (tl.types.ImportedContact,)
+
+ContactStatus = tl.types.ContactStatus
+ContactStatusInst = (tl.types.ContactStatus,)
+
+MessagesFilter = tl.types.InputMessagesFilterChatPhotos | tl.types.InputMessagesFilterContacts | tl.types.InputMessagesFilterDocument | tl.types.InputMessagesFilterEmpty | tl.types.InputMessagesFilterGeo | tl.types.InputMessagesFilterGif | tl.types.InputMessagesFilterMusic | tl.types.InputMessagesFilterMyMentions | tl.types.InputMessagesFilterPhoneCalls | tl.types.InputMessagesFilterPhotoVideo | tl.types.InputMessagesFilterPhotos | tl.types.InputMessagesFilterPinned | tl.types.InputMessagesFilterRoundVideo | tl.types.InputMessagesFilterRoundVoice | tl.types.InputMessagesFilterUrl | tl.types.InputMessagesFilterVideo | tl.types.InputMessagesFilterVoice
+MessagesFilterInst = (tl.types.InputMessagesFilterChatPhotos, tl.types.InputMessagesFilterContacts, tl.types.InputMessagesFilterDocument, tl.types.InputMessagesFilterEmpty, tl.types.InputMessagesFilterGeo, tl.types.InputMessagesFilterGif, tl.types.InputMessagesFilterMusic, tl.types.InputMessagesFilterMyMentions, tl.types.InputMessagesFilterPhoneCalls, tl.types.InputMessagesFilterPhotoVideo, tl.types.InputMessagesFilterPhotos, tl.types.InputMessagesFilterPinned, tl.types.InputMessagesFilterRoundVideo, tl.types.InputMessagesFilterRoundVoice, tl.types.InputMessagesFilterUrl, tl.types.InputMessagesFilterVideo, tl.types.InputMessagesFilterVoice,)
+
+Updates = tl.types.UpdateShort | tl.types.UpdateShortChatMessage | tl.types.UpdateShortMessage | tl.types.UpdateShortSentMessage | tl.types.Updates | tl.types.UpdatesCombined | tl.types.UpdatesTooLong
+UpdatesInst = (tl.types.UpdateShort, tl.types.UpdateShortChatMessage, tl.types.UpdateShortMessage, tl.types.UpdateShortSentMessage, tl.types.Updates, tl.types.UpdatesCombined, tl.types.UpdatesTooLong,)
+
+DcOption = tl.types.DcOption
+DcOptionInst = (tl.types.DcOption,)
+
+Config = tl.types.Config | tl.types.Config_133 | tl.types.Config_145
+ConfigInst = (tl.types.Config, tl.types.Config_133, tl.types.Config_145,)
+
+NearestDc = tl.types.NearestDc
+NearestDcInst = (tl.types.NearestDc,)
+
+InputEncryptedChat = tl.types.InputEncryptedChat
+InputEncryptedChatInst = (tl.types.InputEncryptedChat,)
+
+EncryptedFile = tl.types.EncryptedFile | tl.types.EncryptedFileEmpty | tl.types.EncryptedFile_133
+EncryptedFileInst = (tl.types.EncryptedFile, tl.types.EncryptedFileEmpty, tl.types.EncryptedFile_133,)
+
+InputEncryptedFile = tl.types.InputEncryptedFile | tl.types.InputEncryptedFileBigUploaded | tl.types.InputEncryptedFileEmpty | tl.types.InputEncryptedFileUploaded
+InputEncryptedFileInst = (tl.types.InputEncryptedFile, tl.types.InputEncryptedFileBigUploaded, tl.types.InputEncryptedFileEmpty, tl.types.InputEncryptedFileUploaded,)
+
+EncryptedMessage = tl.types.EncryptedMessage | tl.types.EncryptedMessageService
+EncryptedMessageInst = (tl.types.EncryptedMessage, tl.types.EncryptedMessageService,)
+
+InputDocument = tl.types.InputDocument | tl.types.InputDocumentEmpty
+InputDocumentInst = (tl.types.InputDocument, tl.types.InputDocumentEmpty,)
+
+Document = tl.types.Document | tl.types.DocumentEmpty | tl.types.Document_133
+DocumentInst = (tl.types.Document, tl.types.DocumentEmpty, tl.types.Document_133,)
+
+NotifyPeer = tl.types.NotifyBroadcasts | tl.types.NotifyChats | tl.types.NotifyForumTopic | tl.types.NotifyPeer | tl.types.NotifyUsers
+NotifyPeerInst = (tl.types.NotifyBroadcasts, tl.types.NotifyChats, tl.types.NotifyForumTopic, tl.types.NotifyPeer, tl.types.NotifyUsers,)
+
+SendMessageAction = tl.types.SendMessageCancelAction | tl.types.SendMessageChooseContactAction | tl.types.SendMessageChooseStickerAction | tl.types.SendMessageEmojiInteraction | tl.types.SendMessageEmojiInteractionSeen | tl.types.SendMessageGamePlayAction | tl.types.SendMessageGeoLocationAction | tl.types.SendMessageHistoryImportAction | tl.types.SendMessageRecordAudioAction | tl.types.SendMessageRecordRoundAction | tl.types.SendMessageRecordVideoAction | tl.types.SendMessageTypingAction | tl.types.SendMessageUploadAudioAction | tl.types.SendMessageUploadDocumentAction | tl.types.SendMessageUploadPhotoAction | tl.types.SendMessageUploadRoundAction | tl.types.SendMessageUploadVideoAction | tl.types.SpeakingInGroupCallAction
+SendMessageActionInst = (tl.types.SendMessageCancelAction, tl.types.SendMessageChooseContactAction, tl.types.SendMessageChooseStickerAction, tl.types.SendMessageEmojiInteraction, tl.types.SendMessageEmojiInteractionSeen, tl.types.SendMessageGamePlayAction, tl.types.SendMessageGeoLocationAction, tl.types.SendMessageHistoryImportAction, tl.types.SendMessageRecordAudioAction, tl.types.SendMessageRecordRoundAction, tl.types.SendMessageRecordVideoAction, tl.types.SendMessageTypingAction, tl.types.SendMessageUploadAudioAction, tl.types.SendMessageUploadDocumentAction, tl.types.SendMessageUploadPhotoAction, tl.types.SendMessageUploadRoundAction, tl.types.SendMessageUploadVideoAction, tl.types.SpeakingInGroupCallAction,)
+
+InputPrivacyKey = tl.types.InputPrivacyKeyAbout | tl.types.InputPrivacyKeyAddedByPhone | tl.types.InputPrivacyKeyBirthday | tl.types.InputPrivacyKeyChatInvite | tl.types.InputPrivacyKeyForwards | tl.types.InputPrivacyKeyNoPaidMessages | tl.types.InputPrivacyKeyPhoneCall | tl.types.InputPrivacyKeyPhoneNumber | tl.types.InputPrivacyKeyPhoneP2P | tl.types.InputPrivacyKeyProfilePhoto | tl.types.InputPrivacyKeyStarGiftsAutoSave | tl.types.InputPrivacyKeyStatusTimestamp | tl.types.InputPrivacyKeyVoiceMessages
+InputPrivacyKeyInst = (tl.types.InputPrivacyKeyAbout, tl.types.InputPrivacyKeyAddedByPhone, tl.types.InputPrivacyKeyBirthday, tl.types.InputPrivacyKeyChatInvite, tl.types.InputPrivacyKeyForwards, tl.types.InputPrivacyKeyNoPaidMessages, tl.types.InputPrivacyKeyPhoneCall, tl.types.InputPrivacyKeyPhoneNumber, tl.types.InputPrivacyKeyPhoneP2P, tl.types.InputPrivacyKeyProfilePhoto, tl.types.InputPrivacyKeyStarGiftsAutoSave, tl.types.InputPrivacyKeyStatusTimestamp, tl.types.InputPrivacyKeyVoiceMessages,)
+
+PrivacyKey = tl.types.PrivacyKeyAbout | tl.types.PrivacyKeyAddedByPhone | tl.types.PrivacyKeyBirthday | tl.types.PrivacyKeyChatInvite | tl.types.PrivacyKeyForwards | tl.types.PrivacyKeyNoPaidMessages | tl.types.PrivacyKeyPhoneCall | tl.types.PrivacyKeyPhoneNumber | tl.types.PrivacyKeyPhoneP2P | tl.types.PrivacyKeyProfilePhoto | tl.types.PrivacyKeyStarGiftsAutoSave | tl.types.PrivacyKeyStatusTimestamp | tl.types.PrivacyKeyVoiceMessages
+PrivacyKeyInst = (tl.types.PrivacyKeyAbout, tl.types.PrivacyKeyAddedByPhone, tl.types.PrivacyKeyBirthday, tl.types.PrivacyKeyChatInvite, tl.types.PrivacyKeyForwards, tl.types.PrivacyKeyNoPaidMessages, tl.types.PrivacyKeyPhoneCall, tl.types.PrivacyKeyPhoneNumber, tl.types.PrivacyKeyPhoneP2P, tl.types.PrivacyKeyProfilePhoto, tl.types.PrivacyKeyStarGiftsAutoSave, tl.types.PrivacyKeyStatusTimestamp, tl.types.PrivacyKeyVoiceMessages,)
+
+InputPrivacyRule = tl.types.InputPrivacyValueAllowAll | tl.types.InputPrivacyValueAllowBots | tl.types.InputPrivacyValueAllowChatParticipants | tl.types.InputPrivacyValueAllowCloseFriends | tl.types.InputPrivacyValueAllowContacts | tl.types.InputPrivacyValueAllowPremium | tl.types.InputPrivacyValueAllowUsers | tl.types.InputPrivacyValueDisallowAll | tl.types.InputPrivacyValueDisallowBots | tl.types.InputPrivacyValueDisallowChatParticipants | tl.types.InputPrivacyValueDisallowContacts | tl.types.InputPrivacyValueDisallowUsers
+InputPrivacyRuleInst = (tl.types.InputPrivacyValueAllowAll, tl.types.InputPrivacyValueAllowBots, tl.types.InputPrivacyValueAllowChatParticipants, tl.types.InputPrivacyValueAllowCloseFriends, tl.types.InputPrivacyValueAllowContacts, tl.types.InputPrivacyValueAllowPremium, tl.types.InputPrivacyValueAllowUsers, tl.types.InputPrivacyValueDisallowAll, tl.types.InputPrivacyValueDisallowBots, tl.types.InputPrivacyValueDisallowChatParticipants, tl.types.InputPrivacyValueDisallowContacts, tl.types.InputPrivacyValueDisallowUsers,)
+
+PrivacyRule = tl.types.PrivacyValueAllowAll | tl.types.PrivacyValueAllowBots | tl.types.PrivacyValueAllowChatParticipants | tl.types.PrivacyValueAllowCloseFriends | tl.types.PrivacyValueAllowContacts | tl.types.PrivacyValueAllowPremium | tl.types.PrivacyValueAllowUsers | tl.types.PrivacyValueDisallowAll | tl.types.PrivacyValueDisallowBots | tl.types.PrivacyValueDisallowChatParticipants | tl.types.PrivacyValueDisallowContacts | tl.types.PrivacyValueDisallowUsers
+PrivacyRuleInst = (tl.types.PrivacyValueAllowAll, tl.types.PrivacyValueAllowBots, tl.types.PrivacyValueAllowChatParticipants, tl.types.PrivacyValueAllowCloseFriends, tl.types.PrivacyValueAllowContacts, tl.types.PrivacyValueAllowPremium, tl.types.PrivacyValueAllowUsers, tl.types.PrivacyValueDisallowAll, tl.types.PrivacyValueDisallowBots, tl.types.PrivacyValueDisallowChatParticipants, tl.types.PrivacyValueDisallowContacts, tl.types.PrivacyValueDisallowUsers,)
+
+AccountDaysTTL = tl.types.AccountDaysTTL
+AccountDaysTTLInst = (tl.types.AccountDaysTTL,)
+
+DocumentAttribute = tl.types.DocumentAttributeAnimated | tl.types.DocumentAttributeAudio | tl.types.DocumentAttributeCustomEmoji | tl.types.DocumentAttributeFilename | tl.types.DocumentAttributeHasStickers | tl.types.DocumentAttributeImageSize | tl.types.DocumentAttributeSticker | tl.types.DocumentAttributeVideo | tl.types.DocumentAttributeVideo_133 | tl.types.DocumentAttributeVideo_160 | tl.types.DocumentAttributeVideo_185
+DocumentAttributeInst = (tl.types.DocumentAttributeAnimated, tl.types.DocumentAttributeAudio, tl.types.DocumentAttributeCustomEmoji, tl.types.DocumentAttributeFilename, tl.types.DocumentAttributeHasStickers, tl.types.DocumentAttributeImageSize, tl.types.DocumentAttributeSticker, tl.types.DocumentAttributeVideo, tl.types.DocumentAttributeVideo_133, tl.types.DocumentAttributeVideo_160, tl.types.DocumentAttributeVideo_185,)
+
+StickerPack = tl.types.StickerPack
+StickerPackInst = (tl.types.StickerPack,)
+
+WebPage = tl.types.WebPage | tl.types.WebPageEmpty | tl.types.WebPageEmpty_133 | tl.types.WebPageNotModified | tl.types.WebPagePending | tl.types.WebPagePending_133
+WebPageInst = (tl.types.WebPage, tl.types.WebPageEmpty, tl.types.WebPageEmpty_133, tl.types.WebPageNotModified, tl.types.WebPagePending, tl.types.WebPagePending_133,)
+
+Authorization = tl.types.Authorization
+AuthorizationInst = (tl.types.Authorization,)
+
+ReceivedNotifyMessage = tl.types.ReceivedNotifyMessage
+ReceivedNotifyMessageInst = (tl.types.ReceivedNotifyMessage,)
+
+ExportedChatInvite = tl.types.ChatInviteExported | tl.types.ChatInviteExported_133 | tl.types.ChatInviteExported_134 | tl.types.ChatInvitePublicJoinRequests
+ExportedChatInviteInst = (tl.types.ChatInviteExported, tl.types.ChatInviteExported_133, tl.types.ChatInviteExported_134, tl.types.ChatInvitePublicJoinRequests,)
+
+ChatInvite = tl.types.ChatInvite | tl.types.ChatInviteAlready | tl.types.ChatInvitePeek | tl.types.ChatInvite_133 | tl.types.ChatInvite_134 | tl.types.ChatInvite_166 | tl.types.ChatInvite_186
+ChatInviteInst = (tl.types.ChatInvite, tl.types.ChatInviteAlready, tl.types.ChatInvitePeek, tl.types.ChatInvite_133, tl.types.ChatInvite_134, tl.types.ChatInvite_166, tl.types.ChatInvite_186,)
+
+InputStickerSet = tl.types.InputStickerSetAnimatedEmoji | tl.types.InputStickerSetAnimatedEmojiAnimations | tl.types.InputStickerSetDice | tl.types.InputStickerSetEmojiChannelDefaultStatuses | tl.types.InputStickerSetEmojiDefaultStatuses | tl.types.InputStickerSetEmojiDefaultTopicIcons | tl.types.InputStickerSetEmojiGenericAnimations | tl.types.InputStickerSetEmpty | tl.types.InputStickerSetID | tl.types.InputStickerSetPremiumGifts | tl.types.InputStickerSetShortName
+InputStickerSetInst = (tl.types.InputStickerSetAnimatedEmoji, tl.types.InputStickerSetAnimatedEmojiAnimations, tl.types.InputStickerSetDice, tl.types.InputStickerSetEmojiChannelDefaultStatuses, tl.types.InputStickerSetEmojiDefaultStatuses, tl.types.InputStickerSetEmojiDefaultTopicIcons, tl.types.InputStickerSetEmojiGenericAnimations, tl.types.InputStickerSetEmpty, tl.types.InputStickerSetID, tl.types.InputStickerSetPremiumGifts, tl.types.InputStickerSetShortName,)
+
+BotCommand = tl.types.BotCommand
+BotCommandInst = (tl.types.BotCommand,)
+
+BotInfo = tl.types.BotInfo | tl.types.BotInfo_133 | tl.types.BotInfo_140 | tl.types.BotInfo_143 | tl.types.BotInfo_186 | tl.types.BotInfo_193
+BotInfoInst = (tl.types.BotInfo, tl.types.BotInfo_133, tl.types.BotInfo_140, tl.types.BotInfo_143, tl.types.BotInfo_186, tl.types.BotInfo_193,)
+
+KeyboardButton = tl.types.InputKeyboardButtonRequestPeer | tl.types.InputKeyboardButtonUrlAuth | tl.types.InputKeyboardButtonUserProfile | tl.types.KeyboardButton | tl.types.KeyboardButtonBuy | tl.types.KeyboardButtonCallback | tl.types.KeyboardButtonCopy | tl.types.KeyboardButtonGame | tl.types.KeyboardButtonRequestGeoLocation | tl.types.KeyboardButtonRequestPeer | tl.types.KeyboardButtonRequestPeer_152 | tl.types.KeyboardButtonRequestPhone | tl.types.KeyboardButtonRequestPoll | tl.types.KeyboardButtonSimpleWebView | tl.types.KeyboardButtonSwitchInline | tl.types.KeyboardButtonSwitchInline_133 | tl.types.KeyboardButtonUrl | tl.types.KeyboardButtonUrlAuth | tl.types.KeyboardButtonUserProfile | tl.types.KeyboardButtonWebView
+KeyboardButtonInst = (tl.types.InputKeyboardButtonRequestPeer, tl.types.InputKeyboardButtonUrlAuth, tl.types.InputKeyboardButtonUserProfile, tl.types.KeyboardButton, tl.types.KeyboardButtonBuy, tl.types.KeyboardButtonCallback, tl.types.KeyboardButtonCopy, tl.types.KeyboardButtonGame, tl.types.KeyboardButtonRequestGeoLocation, tl.types.KeyboardButtonRequestPeer, tl.types.KeyboardButtonRequestPeer_152, tl.types.KeyboardButtonRequestPhone, tl.types.KeyboardButtonRequestPoll, tl.types.KeyboardButtonSimpleWebView, tl.types.KeyboardButtonSwitchInline, tl.types.KeyboardButtonSwitchInline_133, tl.types.KeyboardButtonUrl, tl.types.KeyboardButtonUrlAuth, tl.types.KeyboardButtonUserProfile, tl.types.KeyboardButtonWebView,)
+
+KeyboardButtonRow = tl.types.KeyboardButtonRow
+KeyboardButtonRowInst = (tl.types.KeyboardButtonRow,)
+
+ReplyMarkup = tl.types.ReplyInlineMarkup | tl.types.ReplyKeyboardForceReply | tl.types.ReplyKeyboardHide | tl.types.ReplyKeyboardMarkup
+ReplyMarkupInst = (tl.types.ReplyInlineMarkup, tl.types.ReplyKeyboardForceReply, tl.types.ReplyKeyboardHide, tl.types.ReplyKeyboardMarkup,)
+
+MessageEntity = tl.types.InputMessageEntityMentionName | tl.types.MessageEntityBankCard | tl.types.MessageEntityBlockquote | tl.types.MessageEntityBlockquote_160 | tl.types.MessageEntityBold | tl.types.MessageEntityBotCommand | tl.types.MessageEntityCashtag | tl.types.MessageEntityCode | tl.types.MessageEntityCustomEmoji | tl.types.MessageEntityEmail | tl.types.MessageEntityHashtag | tl.types.MessageEntityItalic | tl.types.MessageEntityMention | tl.types.MessageEntityMentionName | tl.types.MessageEntityPhone | tl.types.MessageEntityPre | tl.types.MessageEntitySpoiler | tl.types.MessageEntityStrike | tl.types.MessageEntityTextUrl | tl.types.MessageEntityUnderline | tl.types.MessageEntityUnknown | tl.types.MessageEntityUrl
+MessageEntityInst = (tl.types.InputMessageEntityMentionName, tl.types.MessageEntityBankCard, tl.types.MessageEntityBlockquote, tl.types.MessageEntityBlockquote_160, tl.types.MessageEntityBold, tl.types.MessageEntityBotCommand, tl.types.MessageEntityCashtag, tl.types.MessageEntityCode, tl.types.MessageEntityCustomEmoji, tl.types.MessageEntityEmail, tl.types.MessageEntityHashtag, tl.types.MessageEntityItalic, tl.types.MessageEntityMention, tl.types.MessageEntityMentionName, tl.types.MessageEntityPhone, tl.types.MessageEntityPre, tl.types.MessageEntitySpoiler, tl.types.MessageEntityStrike, tl.types.MessageEntityTextUrl, tl.types.MessageEntityUnderline, tl.types.MessageEntityUnknown, tl.types.MessageEntityUrl,)
+
+InputChannel = tl.types.InputChannel | tl.types.InputChannelEmpty | tl.types.InputChannelFromMessage
+InputChannelInst = (tl.types.InputChannel, tl.types.InputChannelEmpty, tl.types.InputChannelFromMessage,)
+
+MessageRange = tl.types.MessageRange
+MessageRangeInst = (tl.types.MessageRange,)
+
+ChannelMessagesFilter = tl.types.ChannelMessagesFilter | tl.types.ChannelMessagesFilterEmpty
+ChannelMessagesFilterInst = (tl.types.ChannelMessagesFilter, tl.types.ChannelMessagesFilterEmpty,)
+
+ChannelParticipant = tl.types.ChannelParticipant | tl.types.ChannelParticipantAdmin | tl.types.ChannelParticipantBanned | tl.types.ChannelParticipantCreator | tl.types.ChannelParticipantLeft | tl.types.ChannelParticipantSelf | tl.types.ChannelParticipantSelf_133 | tl.types.ChannelParticipantSelf_134 | tl.types.ChannelParticipant_133
+ChannelParticipantInst = (tl.types.ChannelParticipant, tl.types.ChannelParticipantAdmin, tl.types.ChannelParticipantBanned, tl.types.ChannelParticipantCreator, tl.types.ChannelParticipantLeft, tl.types.ChannelParticipantSelf, tl.types.ChannelParticipantSelf_133, tl.types.ChannelParticipantSelf_134, tl.types.ChannelParticipant_133,)
+
+ChannelParticipantsFilter = tl.types.ChannelParticipantsAdmins | tl.types.ChannelParticipantsBanned | tl.types.ChannelParticipantsBots | tl.types.ChannelParticipantsContacts | tl.types.ChannelParticipantsKicked | tl.types.ChannelParticipantsMentions | tl.types.ChannelParticipantsRecent | tl.types.ChannelParticipantsSearch
+ChannelParticipantsFilterInst = (tl.types.ChannelParticipantsAdmins, tl.types.ChannelParticipantsBanned, tl.types.ChannelParticipantsBots, tl.types.ChannelParticipantsContacts, tl.types.ChannelParticipantsKicked, tl.types.ChannelParticipantsMentions, tl.types.ChannelParticipantsRecent, tl.types.ChannelParticipantsSearch,)
+
+InputBotInlineMessage = tl.types.InputBotInlineMessageGame | tl.types.InputBotInlineMessageMediaAuto | tl.types.InputBotInlineMessageMediaContact | tl.types.InputBotInlineMessageMediaGeo | tl.types.InputBotInlineMessageMediaInvoice | tl.types.InputBotInlineMessageMediaVenue | tl.types.InputBotInlineMessageMediaWebPage | tl.types.InputBotInlineMessageText
+InputBotInlineMessageInst = (tl.types.InputBotInlineMessageGame, tl.types.InputBotInlineMessageMediaAuto, tl.types.InputBotInlineMessageMediaContact, tl.types.InputBotInlineMessageMediaGeo, tl.types.InputBotInlineMessageMediaInvoice, tl.types.InputBotInlineMessageMediaVenue, tl.types.InputBotInlineMessageMediaWebPage, tl.types.InputBotInlineMessageText,)
+
+InputBotInlineResult = tl.types.InputBotInlineResult | tl.types.InputBotInlineResultDocument | tl.types.InputBotInlineResultGame | tl.types.InputBotInlineResultPhoto
+InputBotInlineResultInst = (tl.types.InputBotInlineResult, tl.types.InputBotInlineResultDocument, tl.types.InputBotInlineResultGame, tl.types.InputBotInlineResultPhoto,)
+
+BotInlineMessage = tl.types.BotInlineMessageMediaAuto | tl.types.BotInlineMessageMediaContact | tl.types.BotInlineMessageMediaGeo | tl.types.BotInlineMessageMediaInvoice | tl.types.BotInlineMessageMediaVenue | tl.types.BotInlineMessageMediaWebPage | tl.types.BotInlineMessageText
+BotInlineMessageInst = (tl.types.BotInlineMessageMediaAuto, tl.types.BotInlineMessageMediaContact, tl.types.BotInlineMessageMediaGeo, tl.types.BotInlineMessageMediaInvoice, tl.types.BotInlineMessageMediaVenue, tl.types.BotInlineMessageMediaWebPage, tl.types.BotInlineMessageText,)
+
+BotInlineResult = tl.types.BotInlineMediaResult | tl.types.BotInlineResult
+BotInlineResultInst = (tl.types.BotInlineMediaResult, tl.types.BotInlineResult,)
+
+ExportedMessageLink = tl.types.ExportedMessageLink
+ExportedMessageLinkInst = (tl.types.ExportedMessageLink,)
+
+MessageFwdHeader = tl.types.MessageFwdHeader | tl.types.MessageFwdHeader_133
+MessageFwdHeaderInst = (tl.types.MessageFwdHeader, tl.types.MessageFwdHeader_133,)
+
+InputBotInlineMessageID = tl.types.InputBotInlineMessageID | tl.types.InputBotInlineMessageID64
+InputBotInlineMessageIDInst = (tl.types.InputBotInlineMessageID, tl.types.InputBotInlineMessageID64,)
+
+InlineBotSwitchPM = tl.types.InlineBotSwitchPM
+InlineBotSwitchPMInst = (tl.types.InlineBotSwitchPM,)
+
+TopPeer = tl.types.TopPeer
+TopPeerInst = (tl.types.TopPeer,)
+
+TopPeerCategory = tl.types.TopPeerCategoryBotsApp | tl.types.TopPeerCategoryBotsInline | tl.types.TopPeerCategoryBotsPM | tl.types.TopPeerCategoryChannels | tl.types.TopPeerCategoryCorrespondents | tl.types.TopPeerCategoryForwardChats | tl.types.TopPeerCategoryForwardUsers | tl.types.TopPeerCategoryGroups | tl.types.TopPeerCategoryPhoneCalls
+TopPeerCategoryInst = (tl.types.TopPeerCategoryBotsApp, tl.types.TopPeerCategoryBotsInline, tl.types.TopPeerCategoryBotsPM, tl.types.TopPeerCategoryChannels, tl.types.TopPeerCategoryCorrespondents, tl.types.TopPeerCategoryForwardChats, tl.types.TopPeerCategoryForwardUsers, tl.types.TopPeerCategoryGroups, tl.types.TopPeerCategoryPhoneCalls,)
+
+TopPeerCategoryPeers = tl.types.TopPeerCategoryPeers
+TopPeerCategoryPeersInst = (tl.types.TopPeerCategoryPeers,)
+
+DraftMessage = tl.types.DraftMessage | tl.types.DraftMessageEmpty | tl.types.DraftMessage_133 | tl.types.DraftMessage_166
+DraftMessageInst = (tl.types.DraftMessage, tl.types.DraftMessageEmpty, tl.types.DraftMessage_133, tl.types.DraftMessage_166,)
+
+StickerSetCovered = tl.types.StickerSetCovered | tl.types.StickerSetFullCovered | tl.types.StickerSetFullCovered_144 | tl.types.StickerSetMultiCovered | tl.types.StickerSetNoCovered
+StickerSetCoveredInst = (tl.types.StickerSetCovered, tl.types.StickerSetFullCovered, tl.types.StickerSetFullCovered_144, tl.types.StickerSetMultiCovered, tl.types.StickerSetNoCovered,)
+
+MaskCoords = tl.types.MaskCoords
+MaskCoordsInst = (tl.types.MaskCoords,)
+
+InputStickeredMedia = tl.types.InputStickeredMediaDocument | tl.types.InputStickeredMediaPhoto
+InputStickeredMediaInst = (tl.types.InputStickeredMediaDocument, tl.types.InputStickeredMediaPhoto,)
+
+Game = tl.types.Game
+GameInst = (tl.types.Game,)
+
+InputGame = tl.types.InputGameID | tl.types.InputGameShortName
+InputGameInst = (tl.types.InputGameID, tl.types.InputGameShortName,)
+
+HighScore = tl.types.HighScore
+HighScoreInst = (tl.types.HighScore,)
+
+RichText = tl.types.TextAnchor | tl.types.TextBold | tl.types.TextConcat | tl.types.TextEmail | tl.types.TextEmpty | tl.types.TextFixed | tl.types.TextImage | tl.types.TextItalic | tl.types.TextMarked | tl.types.TextPhone | tl.types.TextPlain | tl.types.TextStrike | tl.types.TextSubscript | tl.types.TextSuperscript | tl.types.TextUnderline | tl.types.TextUrl
+RichTextInst = (tl.types.TextAnchor, tl.types.TextBold, tl.types.TextConcat, tl.types.TextEmail, tl.types.TextEmpty, tl.types.TextFixed, tl.types.TextImage, tl.types.TextItalic, tl.types.TextMarked, tl.types.TextPhone, tl.types.TextPlain, tl.types.TextStrike, tl.types.TextSubscript, tl.types.TextSuperscript, tl.types.TextUnderline, tl.types.TextUrl,)
+
+PageBlock = tl.types.PageBlockAnchor | tl.types.PageBlockAudio | tl.types.PageBlockAuthorDate | tl.types.PageBlockBlockquote | tl.types.PageBlockChannel | tl.types.PageBlockCollage | tl.types.PageBlockCover | tl.types.PageBlockDetails | tl.types.PageBlockDivider | tl.types.PageBlockEmbed | tl.types.PageBlockEmbedPost | tl.types.PageBlockFooter | tl.types.PageBlockHeader | tl.types.PageBlockKicker | tl.types.PageBlockList | tl.types.PageBlockMap | tl.types.PageBlockOrderedList | tl.types.PageBlockParagraph | tl.types.PageBlockPhoto | tl.types.PageBlockPreformatted | tl.types.PageBlockPullquote | tl.types.PageBlockRelatedArticles | tl.types.PageBlockSlideshow | tl.types.PageBlockSubheader | tl.types.PageBlockSubtitle | tl.types.PageBlockTable | tl.types.PageBlockTitle | tl.types.PageBlockUnsupported | tl.types.PageBlockVideo
+PageBlockInst = (tl.types.PageBlockAnchor, tl.types.PageBlockAudio, tl.types.PageBlockAuthorDate, tl.types.PageBlockBlockquote, tl.types.PageBlockChannel, tl.types.PageBlockCollage, tl.types.PageBlockCover, tl.types.PageBlockDetails, tl.types.PageBlockDivider, tl.types.PageBlockEmbed, tl.types.PageBlockEmbedPost, tl.types.PageBlockFooter, tl.types.PageBlockHeader, tl.types.PageBlockKicker, tl.types.PageBlockList, tl.types.PageBlockMap, tl.types.PageBlockOrderedList, tl.types.PageBlockParagraph, tl.types.PageBlockPhoto, tl.types.PageBlockPreformatted, tl.types.PageBlockPullquote, tl.types.PageBlockRelatedArticles, tl.types.PageBlockSlideshow, tl.types.PageBlockSubheader, tl.types.PageBlockSubtitle, tl.types.PageBlockTable, tl.types.PageBlockTitle, tl.types.PageBlockUnsupported, tl.types.PageBlockVideo,)
+
+PhoneCallDiscardReason = tl.types.PhoneCallDiscardReasonAllowGroupCall_196 | tl.types.PhoneCallDiscardReasonBusy | tl.types.PhoneCallDiscardReasonDisconnect | tl.types.PhoneCallDiscardReasonHangup | tl.types.PhoneCallDiscardReasonMissed
+PhoneCallDiscardReasonInst = (tl.types.PhoneCallDiscardReasonAllowGroupCall_196, tl.types.PhoneCallDiscardReasonBusy, tl.types.PhoneCallDiscardReasonDisconnect, tl.types.PhoneCallDiscardReasonHangup, tl.types.PhoneCallDiscardReasonMissed,)
+
+DataJSON = tl.types.DataJSON
+DataJSONInst = (tl.types.DataJSON,)
+
+LabeledPrice = tl.types.LabeledPrice
+LabeledPriceInst = (tl.types.LabeledPrice,)
+
+Invoice = tl.types.Invoice | tl.types.Invoice_133 | tl.types.Invoice_143 | tl.types.Invoice_164
+InvoiceInst = (tl.types.Invoice, tl.types.Invoice_133, tl.types.Invoice_143, tl.types.Invoice_164,)
+
+PaymentCharge = tl.types.PaymentCharge
+PaymentChargeInst = (tl.types.PaymentCharge,)
+
+PostAddress = tl.types.PostAddress
+PostAddressInst = (tl.types.PostAddress,)
+
+PaymentRequestedInfo = tl.types.PaymentRequestedInfo
+PaymentRequestedInfoInst = (tl.types.PaymentRequestedInfo,)
+
+PaymentSavedCredentials = tl.types.PaymentSavedCredentialsCard
+PaymentSavedCredentialsInst = (tl.types.PaymentSavedCredentialsCard,)
+
+WebDocument = tl.types.WebDocument | tl.types.WebDocumentNoProxy
+WebDocumentInst = (tl.types.WebDocument, tl.types.WebDocumentNoProxy,)
+
+InputWebDocument = tl.types.InputWebDocument
+InputWebDocumentInst = (tl.types.InputWebDocument,)
+
+InputWebFileLocation = tl.types.InputWebFileAudioAlbumThumbLocation | tl.types.InputWebFileGeoPointLocation | tl.types.InputWebFileLocation
+InputWebFileLocationInst = (tl.types.InputWebFileAudioAlbumThumbLocation, tl.types.InputWebFileGeoPointLocation, tl.types.InputWebFileLocation,)
+
+InputPaymentCredentials = tl.types.InputPaymentCredentials | tl.types.InputPaymentCredentialsApplePay | tl.types.InputPaymentCredentialsGooglePay | tl.types.InputPaymentCredentialsSaved
+InputPaymentCredentialsInst = (tl.types.InputPaymentCredentials, tl.types.InputPaymentCredentialsApplePay, tl.types.InputPaymentCredentialsGooglePay, tl.types.InputPaymentCredentialsSaved,)
+
+ShippingOption = tl.types.ShippingOption
+ShippingOptionInst = (tl.types.ShippingOption,)
+
+InputStickerSetItem = tl.types.InputStickerSetItem | tl.types.InputStickerSetItem_133
+InputStickerSetItemInst = (tl.types.InputStickerSetItem, tl.types.InputStickerSetItem_133,)
+
+InputPhoneCall = tl.types.InputPhoneCall
+InputPhoneCallInst = (tl.types.InputPhoneCall,)
+
+PhoneConnection = tl.types.PhoneConnection | tl.types.PhoneConnectionWebrtc | tl.types.PhoneConnection_133
+PhoneConnectionInst = (tl.types.PhoneConnection, tl.types.PhoneConnectionWebrtc, tl.types.PhoneConnection_133,)
+
+PhoneCallProtocol = tl.types.PhoneCallProtocol
+PhoneCallProtocolInst = (tl.types.PhoneCallProtocol,)
+
+CdnPublicKey = tl.types.CdnPublicKey
+CdnPublicKeyInst = (tl.types.CdnPublicKey,)
+
+CdnConfig = tl.types.CdnConfig
+CdnConfigInst = (tl.types.CdnConfig,)
+
+LangPackString = tl.types.LangPackString | tl.types.LangPackStringDeleted | tl.types.LangPackStringPluralized
+LangPackStringInst = (tl.types.LangPackString, tl.types.LangPackStringDeleted, tl.types.LangPackStringPluralized,)
+
+LangPackDifference = tl.types.LangPackDifference
+LangPackDifferenceInst = (tl.types.LangPackDifference,)
+
+LangPackLanguage = tl.types.LangPackLanguage | tl.types.LangPackLanguage_72
+LangPackLanguageInst = (tl.types.LangPackLanguage, tl.types.LangPackLanguage_72,)
+
+ChannelAdminLogEventAction = tl.types.ChannelAdminLogEventActionChangeAbout | tl.types.ChannelAdminLogEventActionChangeAvailableReactions | tl.types.ChannelAdminLogEventActionChangeAvailableReactions_136 | tl.types.ChannelAdminLogEventActionChangeBackgroundEmoji_166 | tl.types.ChannelAdminLogEventActionChangeColor_166 | tl.types.ChannelAdminLogEventActionChangeEmojiStatus | tl.types.ChannelAdminLogEventActionChangeEmojiStickerSet | tl.types.ChannelAdminLogEventActionChangeHistoryTTL | tl.types.ChannelAdminLogEventActionChangeLinkedChat | tl.types.ChannelAdminLogEventActionChangeLocation | tl.types.ChannelAdminLogEventActionChangePeerColor | tl.types.ChannelAdminLogEventActionChangePhoto | tl.types.ChannelAdminLogEventActionChangeProfilePeerColor | tl.types.ChannelAdminLogEventActionChangeStickerSet | tl.types.ChannelAdminLogEventActionChangeTitle | tl.types.ChannelAdminLogEventActionChangeUsername | tl.types.ChannelAdminLogEventActionChangeUsernames | tl.types.ChannelAdminLogEventActionChangeWallpaper | tl.types.ChannelAdminLogEventActionCreateTopic | tl.types.ChannelAdminLogEventActionDefaultBannedRights | tl.types.ChannelAdminLogEventActionDeleteMessage | tl.types.ChannelAdminLogEventActionDeleteTopic | tl.types.ChannelAdminLogEventActionDiscardGroupCall | tl.types.ChannelAdminLogEventActionEditMessage | tl.types.ChannelAdminLogEventActionEditTopic | tl.types.ChannelAdminLogEventActionExportedInviteDelete | tl.types.ChannelAdminLogEventActionExportedInviteEdit | tl.types.ChannelAdminLogEventActionExportedInviteRevoke | tl.types.ChannelAdminLogEventActionParticipantInvite | tl.types.ChannelAdminLogEventActionParticipantJoin | tl.types.ChannelAdminLogEventActionParticipantJoinByInvite | tl.types.ChannelAdminLogEventActionParticipantJoinByInvite_133 | tl.types.ChannelAdminLogEventActionParticipantJoinByRequest | tl.types.ChannelAdminLogEventActionParticipantLeave | tl.types.ChannelAdminLogEventActionParticipantMute | tl.types.ChannelAdminLogEventActionParticipantSubExtend | tl.types.ChannelAdminLogEventActionParticipantToggleAdmin | tl.types.ChannelAdminLogEventActionParticipantToggleBan | tl.types.ChannelAdminLogEventActionParticipantUnmute | tl.types.ChannelAdminLogEventActionParticipantVolume | tl.types.ChannelAdminLogEventActionPinTopic | tl.types.ChannelAdminLogEventActionSendMessage | tl.types.ChannelAdminLogEventActionStartGroupCall | tl.types.ChannelAdminLogEventActionStopPoll | tl.types.ChannelAdminLogEventActionToggleAntiSpam | tl.types.ChannelAdminLogEventActionToggleForum | tl.types.ChannelAdminLogEventActionToggleGroupCallSetting | tl.types.ChannelAdminLogEventActionToggleInvites | tl.types.ChannelAdminLogEventActionToggleNoForwards | tl.types.ChannelAdminLogEventActionTogglePreHistoryHidden | tl.types.ChannelAdminLogEventActionToggleSignatureProfiles | tl.types.ChannelAdminLogEventActionToggleSignatures | tl.types.ChannelAdminLogEventActionToggleSlowMode | tl.types.ChannelAdminLogEventActionUpdatePinned
+ChannelAdminLogEventActionInst = (tl.types.ChannelAdminLogEventActionChangeAbout, tl.types.ChannelAdminLogEventActionChangeAvailableReactions, tl.types.ChannelAdminLogEventActionChangeAvailableReactions_136, tl.types.ChannelAdminLogEventActionChangeBackgroundEmoji_166, tl.types.ChannelAdminLogEventActionChangeColor_166, tl.types.ChannelAdminLogEventActionChangeEmojiStatus, tl.types.ChannelAdminLogEventActionChangeEmojiStickerSet, tl.types.ChannelAdminLogEventActionChangeHistoryTTL, tl.types.ChannelAdminLogEventActionChangeLinkedChat, tl.types.ChannelAdminLogEventActionChangeLocation, tl.types.ChannelAdminLogEventActionChangePeerColor, tl.types.ChannelAdminLogEventActionChangePhoto, tl.types.ChannelAdminLogEventActionChangeProfilePeerColor, tl.types.ChannelAdminLogEventActionChangeStickerSet, tl.types.ChannelAdminLogEventActionChangeTitle, tl.types.ChannelAdminLogEventActionChangeUsername, tl.types.ChannelAdminLogEventActionChangeUsernames, tl.types.ChannelAdminLogEventActionChangeWallpaper, tl.types.ChannelAdminLogEventActionCreateTopic, tl.types.ChannelAdminLogEventActionDefaultBannedRights, tl.types.ChannelAdminLogEventActionDeleteMessage, tl.types.ChannelAdminLogEventActionDeleteTopic, tl.types.ChannelAdminLogEventActionDiscardGroupCall, tl.types.ChannelAdminLogEventActionEditMessage, tl.types.ChannelAdminLogEventActionEditTopic, tl.types.ChannelAdminLogEventActionExportedInviteDelete, tl.types.ChannelAdminLogEventActionExportedInviteEdit, tl.types.ChannelAdminLogEventActionExportedInviteRevoke, tl.types.ChannelAdminLogEventActionParticipantInvite, tl.types.ChannelAdminLogEventActionParticipantJoin, tl.types.ChannelAdminLogEventActionParticipantJoinByInvite, tl.types.ChannelAdminLogEventActionParticipantJoinByInvite_133, tl.types.ChannelAdminLogEventActionParticipantJoinByRequest, tl.types.ChannelAdminLogEventActionParticipantLeave, tl.types.ChannelAdminLogEventActionParticipantMute, tl.types.ChannelAdminLogEventActionParticipantSubExtend, tl.types.ChannelAdminLogEventActionParticipantToggleAdmin, tl.types.ChannelAdminLogEventActionParticipantToggleBan, tl.types.ChannelAdminLogEventActionParticipantUnmute, tl.types.ChannelAdminLogEventActionParticipantVolume, tl.types.ChannelAdminLogEventActionPinTopic, tl.types.ChannelAdminLogEventActionSendMessage, tl.types.ChannelAdminLogEventActionStartGroupCall, tl.types.ChannelAdminLogEventActionStopPoll, tl.types.ChannelAdminLogEventActionToggleAntiSpam, tl.types.ChannelAdminLogEventActionToggleForum, tl.types.ChannelAdminLogEventActionToggleGroupCallSetting, tl.types.ChannelAdminLogEventActionToggleInvites, tl.types.ChannelAdminLogEventActionToggleNoForwards, tl.types.ChannelAdminLogEventActionTogglePreHistoryHidden, tl.types.ChannelAdminLogEventActionToggleSignatureProfiles, tl.types.ChannelAdminLogEventActionToggleSignatures, tl.types.ChannelAdminLogEventActionToggleSlowMode, tl.types.ChannelAdminLogEventActionUpdatePinned,)
+
+ChannelAdminLogEvent = tl.types.ChannelAdminLogEvent
+ChannelAdminLogEventInst = (tl.types.ChannelAdminLogEvent,)
+
+ChannelAdminLogEventsFilter = tl.types.ChannelAdminLogEventsFilter
+ChannelAdminLogEventsFilterInst = (tl.types.ChannelAdminLogEventsFilter,)
+
+PopularContact = tl.types.PopularContact
+PopularContactInst = (tl.types.PopularContact,)
+
+RecentMeUrl = tl.types.RecentMeUrlChat | tl.types.RecentMeUrlChatInvite | tl.types.RecentMeUrlStickerSet | tl.types.RecentMeUrlUnknown | tl.types.RecentMeUrlUser
+RecentMeUrlInst = (tl.types.RecentMeUrlChat, tl.types.RecentMeUrlChatInvite, tl.types.RecentMeUrlStickerSet, tl.types.RecentMeUrlUnknown, tl.types.RecentMeUrlUser,)
+
+InputSingleMedia = tl.types.InputSingleMedia
+InputSingleMediaInst = (tl.types.InputSingleMedia,)
+
+WebAuthorization = tl.types.WebAuthorization
+WebAuthorizationInst = (tl.types.WebAuthorization,)
+
+InputMessage = tl.types.InputMessageCallbackQuery | tl.types.InputMessageID | tl.types.InputMessagePinned | tl.types.InputMessageReplyTo
+InputMessageInst = (tl.types.InputMessageCallbackQuery, tl.types.InputMessageID, tl.types.InputMessagePinned, tl.types.InputMessageReplyTo,)
+
+InputDialogPeer = tl.types.InputDialogPeer | tl.types.InputDialogPeerFolder
+InputDialogPeerInst = (tl.types.InputDialogPeer, tl.types.InputDialogPeerFolder,)
+
+DialogPeer = tl.types.DialogPeer | tl.types.DialogPeerFolder
+DialogPeerInst = (tl.types.DialogPeer, tl.types.DialogPeerFolder,)
+
+FileHash = tl.types.FileHash | tl.types.FileHash_133
+FileHashInst = (tl.types.FileHash, tl.types.FileHash_133,)
+
+InputClientProxy = tl.types.InputClientProxy
+InputClientProxyInst = (tl.types.InputClientProxy,)
+
+InputSecureFile = tl.types.InputSecureFile | tl.types.InputSecureFileUploaded
+InputSecureFileInst = (tl.types.InputSecureFile, tl.types.InputSecureFileUploaded,)
+
+SecureFile = tl.types.SecureFile | tl.types.SecureFileEmpty | tl.types.SecureFile_133
+SecureFileInst = (tl.types.SecureFile, tl.types.SecureFileEmpty, tl.types.SecureFile_133,)
+
+SecureData = tl.types.SecureData
+SecureDataInst = (tl.types.SecureData,)
+
+SecurePlainData = tl.types.SecurePlainEmail | tl.types.SecurePlainPhone
+SecurePlainDataInst = (tl.types.SecurePlainEmail, tl.types.SecurePlainPhone,)
+
+SecureValueType = tl.types.SecureValueTypeAddress | tl.types.SecureValueTypeBankStatement | tl.types.SecureValueTypeDriverLicense | tl.types.SecureValueTypeEmail | tl.types.SecureValueTypeIdentityCard | tl.types.SecureValueTypeInternalPassport | tl.types.SecureValueTypePassport | tl.types.SecureValueTypePassportRegistration | tl.types.SecureValueTypePersonalDetails | tl.types.SecureValueTypePhone | tl.types.SecureValueTypeRentalAgreement | tl.types.SecureValueTypeTemporaryRegistration | tl.types.SecureValueTypeUtilityBill
+SecureValueTypeInst = (tl.types.SecureValueTypeAddress, tl.types.SecureValueTypeBankStatement, tl.types.SecureValueTypeDriverLicense, tl.types.SecureValueTypeEmail, tl.types.SecureValueTypeIdentityCard, tl.types.SecureValueTypeInternalPassport, tl.types.SecureValueTypePassport, tl.types.SecureValueTypePassportRegistration, tl.types.SecureValueTypePersonalDetails, tl.types.SecureValueTypePhone, tl.types.SecureValueTypeRentalAgreement, tl.types.SecureValueTypeTemporaryRegistration, tl.types.SecureValueTypeUtilityBill,)
+
+SecureValue = tl.types.SecureValue
+SecureValueInst = (tl.types.SecureValue,)
+
+InputSecureValue = tl.types.InputSecureValue
+InputSecureValueInst = (tl.types.InputSecureValue,)
+
+SecureValueHash = tl.types.SecureValueHash
+SecureValueHashInst = (tl.types.SecureValueHash,)
+
+SecureValueError = tl.types.SecureValueError | tl.types.SecureValueErrorData | tl.types.SecureValueErrorFile | tl.types.SecureValueErrorFiles | tl.types.SecureValueErrorFrontSide | tl.types.SecureValueErrorReverseSide | tl.types.SecureValueErrorSelfie | tl.types.SecureValueErrorTranslationFile | tl.types.SecureValueErrorTranslationFiles
+SecureValueErrorInst = (tl.types.SecureValueError, tl.types.SecureValueErrorData, tl.types.SecureValueErrorFile, tl.types.SecureValueErrorFiles, tl.types.SecureValueErrorFrontSide, tl.types.SecureValueErrorReverseSide, tl.types.SecureValueErrorSelfie, tl.types.SecureValueErrorTranslationFile, tl.types.SecureValueErrorTranslationFiles,)
+
+SecureCredentialsEncrypted = tl.types.SecureCredentialsEncrypted
+SecureCredentialsEncryptedInst = (tl.types.SecureCredentialsEncrypted,)
+
+SavedContact = tl.types.SavedPhoneContact
+SavedContactInst = (tl.types.SavedPhoneContact,)
+
+PasswordKdfAlgo = tl.types.PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow | tl.types.PasswordKdfAlgoUnknown
+PasswordKdfAlgoInst = (tl.types.PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow, tl.types.PasswordKdfAlgoUnknown,)
+
+SecurePasswordKdfAlgo = tl.types.SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000 | tl.types.SecurePasswordKdfAlgoSHA512 | tl.types.SecurePasswordKdfAlgoUnknown
+SecurePasswordKdfAlgoInst = (tl.types.SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000, tl.types.SecurePasswordKdfAlgoSHA512, tl.types.SecurePasswordKdfAlgoUnknown,)
+
+SecureSecretSettings = tl.types.SecureSecretSettings
+SecureSecretSettingsInst = (tl.types.SecureSecretSettings,)
+
+InputCheckPasswordSRP = tl.types.InputCheckPasswordEmpty | tl.types.InputCheckPasswordSRP
+InputCheckPasswordSRPInst = (tl.types.InputCheckPasswordEmpty, tl.types.InputCheckPasswordSRP,)
+
+SecureRequiredType = tl.types.SecureRequiredType | tl.types.SecureRequiredTypeOneOf
+SecureRequiredTypeInst = (tl.types.SecureRequiredType, tl.types.SecureRequiredTypeOneOf,)
+
+InputAppEvent = tl.types.InputAppEvent
+InputAppEventInst = (tl.types.InputAppEvent,)
+
+JSONObjectValue = tl.types.JsonObjectValue
+JSONObjectValueInst = (tl.types.JsonObjectValue,)
+
+JSONValue = tl.types.JsonArray | tl.types.JsonBool | tl.types.JsonNull | tl.types.JsonNumber | tl.types.JsonObject | tl.types.JsonString
+JSONValueInst = (tl.types.JsonArray, tl.types.JsonBool, tl.types.JsonNull, tl.types.JsonNumber, tl.types.JsonObject, tl.types.JsonString,)
+
+PageTableCell = tl.types.PageTableCell
+PageTableCellInst = (tl.types.PageTableCell,)
+
+PageTableRow = tl.types.PageTableRow
+PageTableRowInst = (tl.types.PageTableRow,)
+
+PageCaption = tl.types.PageCaption
+PageCaptionInst = (tl.types.PageCaption,)
+
+PageListItem = tl.types.PageListItemBlocks | tl.types.PageListItemText
+PageListItemInst = (tl.types.PageListItemBlocks, tl.types.PageListItemText,)
+
+PageListOrderedItem = tl.types.PageListOrderedItemBlocks | tl.types.PageListOrderedItemText
+PageListOrderedItemInst = (tl.types.PageListOrderedItemBlocks, tl.types.PageListOrderedItemText,)
+
+PageRelatedArticle = tl.types.PageRelatedArticle
+PageRelatedArticleInst = (tl.types.PageRelatedArticle,)
+
+Page = tl.types.Page
+PageInst = (tl.types.Page,)
+
+PollAnswer = tl.types.PollAnswer | tl.types.PollAnswer_133
+PollAnswerInst = (tl.types.PollAnswer, tl.types.PollAnswer_133,)
+
+Poll = tl.types.Poll | tl.types.Poll_133
+PollInst = (tl.types.Poll, tl.types.Poll_133,)
+
+ChatOnlines = tl.types.ChatOnlines
+ChatOnlinesInst = (tl.types.ChatOnlines,)
+
+StatsURL = tl.types.StatsURL
+StatsURLInst = (tl.types.StatsURL,)
+
+ChatAdminRights = tl.types.ChatAdminRights
+ChatAdminRightsInst = (tl.types.ChatAdminRights,)
+
+ChatBannedRights = tl.types.ChatBannedRights
+ChatBannedRightsInst = (tl.types.ChatBannedRights,)
+
+InputWallPaper = tl.types.InputWallPaper | tl.types.InputWallPaperNoFile | tl.types.InputWallPaperSlug
+InputWallPaperInst = (tl.types.InputWallPaper, tl.types.InputWallPaperNoFile, tl.types.InputWallPaperSlug,)
+
+CodeSettings = tl.types.CodeSettings | tl.types.CodeSettings_133 | tl.types.CodeSettings_135
+CodeSettingsInst = (tl.types.CodeSettings, tl.types.CodeSettings_133, tl.types.CodeSettings_135,)
+
+WallPaperSettings = tl.types.WallPaperSettings | tl.types.WallPaperSettings_133
+WallPaperSettingsInst = (tl.types.WallPaperSettings, tl.types.WallPaperSettings_133,)
+
+AutoDownloadSettings = tl.types.AutoDownloadSettings | tl.types.AutoDownloadSettings_133 | tl.types.AutoDownloadSettings_143
+AutoDownloadSettingsInst = (tl.types.AutoDownloadSettings, tl.types.AutoDownloadSettings_133, tl.types.AutoDownloadSettings_143,)
+
+EmojiKeyword = tl.types.EmojiKeyword | tl.types.EmojiKeywordDeleted
+EmojiKeywordInst = (tl.types.EmojiKeyword, tl.types.EmojiKeywordDeleted,)
+
+EmojiKeywordsDifference = tl.types.EmojiKeywordsDifference
+EmojiKeywordsDifferenceInst = (tl.types.EmojiKeywordsDifference,)
+
+EmojiURL = tl.types.EmojiURL
+EmojiURLInst = (tl.types.EmojiURL,)
+
+EmojiLanguage = tl.types.EmojiLanguage
+EmojiLanguageInst = (tl.types.EmojiLanguage,)
+
+Folder = tl.types.Folder
+FolderInst = (tl.types.Folder,)
+
+InputFolderPeer = tl.types.InputFolderPeer
+InputFolderPeerInst = (tl.types.InputFolderPeer,)
+
+FolderPeer = tl.types.FolderPeer
+FolderPeerInst = (tl.types.FolderPeer,)
+
+UrlAuthResult = tl.types.UrlAuthResultAccepted | tl.types.UrlAuthResultDefault | tl.types.UrlAuthResultRequest
+UrlAuthResultInst = (tl.types.UrlAuthResultAccepted, tl.types.UrlAuthResultDefault, tl.types.UrlAuthResultRequest,)
+
+ChannelLocation = tl.types.ChannelLocation | tl.types.ChannelLocationEmpty
+ChannelLocationInst = (tl.types.ChannelLocation, tl.types.ChannelLocationEmpty,)
+
+PeerLocated = tl.types.PeerLocated | tl.types.PeerSelfLocated
+PeerLocatedInst = (tl.types.PeerLocated, tl.types.PeerSelfLocated,)
+
+RestrictionReason = tl.types.RestrictionReason
+RestrictionReasonInst = (tl.types.RestrictionReason,)
+
+InputTheme = tl.types.InputTheme | tl.types.InputThemeSlug
+InputThemeInst = (tl.types.InputTheme, tl.types.InputThemeSlug,)
+
+BaseTheme = tl.types.BaseThemeArctic | tl.types.BaseThemeClassic | tl.types.BaseThemeDay | tl.types.BaseThemeNight | tl.types.BaseThemeTinted
+BaseThemeInst = (tl.types.BaseThemeArctic, tl.types.BaseThemeClassic, tl.types.BaseThemeDay, tl.types.BaseThemeNight, tl.types.BaseThemeTinted,)
+
+InputThemeSettings = tl.types.InputThemeSettings
+InputThemeSettingsInst = (tl.types.InputThemeSettings,)
+
+ThemeSettings = tl.types.ThemeSettings
+ThemeSettingsInst = (tl.types.ThemeSettings,)
+
+WebPageAttribute = tl.types.WebPageAttributeStickerSet | tl.types.WebPageAttributeStory | tl.types.WebPageAttributeStory_160 | tl.types.WebPageAttributeTheme | tl.types.WebPageAttributeUniqueStarGift
+WebPageAttributeInst = (tl.types.WebPageAttributeStickerSet, tl.types.WebPageAttributeStory, tl.types.WebPageAttributeStory_160, tl.types.WebPageAttributeTheme, tl.types.WebPageAttributeUniqueStarGift,)
+
+BankCardOpenUrl = tl.types.BankCardOpenUrl
+BankCardOpenUrlInst = (tl.types.BankCardOpenUrl,)
+
+DialogFilter = tl.types.DialogFilter | tl.types.DialogFilterChatlist | tl.types.DialogFilterChatlist_158 | tl.types.DialogFilterChatlist_176 | tl.types.DialogFilterDefault | tl.types.DialogFilter_133 | tl.types.DialogFilter_176
+DialogFilterInst = (tl.types.DialogFilter, tl.types.DialogFilterChatlist, tl.types.DialogFilterChatlist_158, tl.types.DialogFilterChatlist_176, tl.types.DialogFilterDefault, tl.types.DialogFilter_133, tl.types.DialogFilter_176,)
+
+DialogFilterSuggested = tl.types.DialogFilterSuggested
+DialogFilterSuggestedInst = (tl.types.DialogFilterSuggested,)
+
+StatsDateRangeDays = tl.types.StatsDateRangeDays
+StatsDateRangeDaysInst = (tl.types.StatsDateRangeDays,)
+
+StatsAbsValueAndPrev = tl.types.StatsAbsValueAndPrev
+StatsAbsValueAndPrevInst = (tl.types.StatsAbsValueAndPrev,)
+
+StatsPercentValue = tl.types.StatsPercentValue
+StatsPercentValueInst = (tl.types.StatsPercentValue,)
+
+StatsGraph = tl.types.StatsGraph | tl.types.StatsGraphAsync | tl.types.StatsGraphError
+StatsGraphInst = (tl.types.StatsGraph, tl.types.StatsGraphAsync, tl.types.StatsGraphError,)
+
+VideoSize = tl.types.VideoSize | tl.types.VideoSizeEmojiMarkup | tl.types.VideoSizeStickerMarkup
+VideoSizeInst = (tl.types.VideoSize, tl.types.VideoSizeEmojiMarkup, tl.types.VideoSizeStickerMarkup,)
+
+StatsGroupTopPoster = tl.types.StatsGroupTopPoster
+StatsGroupTopPosterInst = (tl.types.StatsGroupTopPoster,)
+
+StatsGroupTopAdmin = tl.types.StatsGroupTopAdmin
+StatsGroupTopAdminInst = (tl.types.StatsGroupTopAdmin,)
+
+StatsGroupTopInviter = tl.types.StatsGroupTopInviter
+StatsGroupTopInviterInst = (tl.types.StatsGroupTopInviter,)
+
+GlobalPrivacySettings = tl.types.GlobalPrivacySettings | tl.types.GlobalPrivacySettings_133 | tl.types.GlobalPrivacySettings_160 | tl.types.GlobalPrivacySettings_200
+GlobalPrivacySettingsInst = (tl.types.GlobalPrivacySettings, tl.types.GlobalPrivacySettings_133, tl.types.GlobalPrivacySettings_160, tl.types.GlobalPrivacySettings_200,)
+
+MessageViews = tl.types.MessageViews
+MessageViewsInst = (tl.types.MessageViews,)
+
+MessageReplyHeader = tl.types.MessageReplyHeader | tl.types.MessageReplyHeader_133 | tl.types.MessageReplyHeader_166 | tl.types.MessageReplyStoryHeader | tl.types.MessageReplyStoryHeader_160
+MessageReplyHeaderInst = (tl.types.MessageReplyHeader, tl.types.MessageReplyHeader_133, tl.types.MessageReplyHeader_166, tl.types.MessageReplyStoryHeader, tl.types.MessageReplyStoryHeader_160,)
+
+MessageReplies = tl.types.MessageReplies
+MessageRepliesInst = (tl.types.MessageReplies,)
+
+PeerBlocked = tl.types.PeerBlocked
+PeerBlockedInst = (tl.types.PeerBlocked,)
+
+GroupCall = tl.types.GroupCall | tl.types.GroupCallDiscarded | tl.types.GroupCall_133
+GroupCallInst = (tl.types.GroupCall, tl.types.GroupCallDiscarded, tl.types.GroupCall_133,)
+
+InputGroupCall = tl.types.InputGroupCall
+InputGroupCallInst = (tl.types.InputGroupCall,)
+
+GroupCallParticipant = tl.types.GroupCallParticipant
+GroupCallParticipantInst = (tl.types.GroupCallParticipant,)
+
+InlineQueryPeerType = tl.types.InlineQueryPeerTypeBotPM | tl.types.InlineQueryPeerTypeBroadcast | tl.types.InlineQueryPeerTypeChat | tl.types.InlineQueryPeerTypeMegagroup | tl.types.InlineQueryPeerTypePM | tl.types.InlineQueryPeerTypeSameBotPM
+InlineQueryPeerTypeInst = (tl.types.InlineQueryPeerTypeBotPM, tl.types.InlineQueryPeerTypeBroadcast, tl.types.InlineQueryPeerTypeChat, tl.types.InlineQueryPeerTypeMegagroup, tl.types.InlineQueryPeerTypePM, tl.types.InlineQueryPeerTypeSameBotPM,)
+
+ChatInviteImporter = tl.types.ChatInviteImporter | tl.types.ChatInviteImporter_133
+ChatInviteImporterInst = (tl.types.ChatInviteImporter, tl.types.ChatInviteImporter_133,)
+
+ChatAdminWithInvites = tl.types.ChatAdminWithInvites
+ChatAdminWithInvitesInst = (tl.types.ChatAdminWithInvites,)
+
+GroupCallParticipantVideoSourceGroup = tl.types.GroupCallParticipantVideoSourceGroup
+GroupCallParticipantVideoSourceGroupInst = (tl.types.GroupCallParticipantVideoSourceGroup,)
+
+GroupCallParticipantVideo = tl.types.GroupCallParticipantVideo
+GroupCallParticipantVideoInst = (tl.types.GroupCallParticipantVideo,)
+
+BotCommandScope = tl.types.BotCommandScopeChatAdmins | tl.types.BotCommandScopeChats | tl.types.BotCommandScopeDefault | tl.types.BotCommandScopePeer | tl.types.BotCommandScopePeerAdmins | tl.types.BotCommandScopePeerUser | tl.types.BotCommandScopeUsers
+BotCommandScopeInst = (tl.types.BotCommandScopeChatAdmins, tl.types.BotCommandScopeChats, tl.types.BotCommandScopeDefault, tl.types.BotCommandScopePeer, tl.types.BotCommandScopePeerAdmins, tl.types.BotCommandScopePeerUser, tl.types.BotCommandScopeUsers,)
+
+SponsoredMessage = tl.types.SponsoredMessage | tl.types.SponsoredMessage_133 | tl.types.SponsoredMessage_134 | tl.types.SponsoredMessage_136 | tl.types.SponsoredMessage_155 | tl.types.SponsoredMessage_160 | tl.types.SponsoredMessage_167 | tl.types.SponsoredMessage_179
+SponsoredMessageInst = (tl.types.SponsoredMessage, tl.types.SponsoredMessage_133, tl.types.SponsoredMessage_134, tl.types.SponsoredMessage_136, tl.types.SponsoredMessage_155, tl.types.SponsoredMessage_160, tl.types.SponsoredMessage_167, tl.types.SponsoredMessage_179,)
+
+SearchResultsCalendarPeriod = tl.types.SearchResultsCalendarPeriod
+SearchResultsCalendarPeriodInst = (tl.types.SearchResultsCalendarPeriod,)
+
+SearchResultsPosition = tl.types.SearchResultPosition
+SearchResultsPositionInst = (tl.types.SearchResultPosition,)
+
+ReactionCount = tl.types.ReactionCount | tl.types.ReactionCount_136
+ReactionCountInst = (tl.types.ReactionCount, tl.types.ReactionCount_136,)
+
+MessageReactions = tl.types.MessageReactions | tl.types.MessageReactions_136 | tl.types.MessageReactions_138
+MessageReactionsInst = (tl.types.MessageReactions, tl.types.MessageReactions_136, tl.types.MessageReactions_138,)
+
+AvailableReaction = tl.types.AvailableReaction | tl.types.AvailableReaction_136
+AvailableReactionInst = (tl.types.AvailableReaction, tl.types.AvailableReaction_136,)
+
+MessagePeerReaction = tl.types.MessagePeerReaction | tl.types.MessagePeerReaction_138 | tl.types.MessagePeerReaction_145
+MessagePeerReactionInst = (tl.types.MessagePeerReaction, tl.types.MessagePeerReaction_138, tl.types.MessagePeerReaction_145,)
+
+GroupCallStreamChannel = tl.types.GroupCallStreamChannel
+GroupCallStreamChannelInst = (tl.types.GroupCallStreamChannel,)
+
+AttachMenuBotIconColor = tl.types.AttachMenuBotIconColor
+AttachMenuBotIconColorInst = (tl.types.AttachMenuBotIconColor,)
+
+AttachMenuBotIcon = tl.types.AttachMenuBotIcon
+AttachMenuBotIconInst = (tl.types.AttachMenuBotIcon,)
+
+AttachMenuBot = tl.types.AttachMenuBot | tl.types.AttachMenuBot_140 | tl.types.AttachMenuBot_143
+AttachMenuBotInst = (tl.types.AttachMenuBot, tl.types.AttachMenuBot_140, tl.types.AttachMenuBot_143,)
+
+AttachMenuBots = tl.types.AttachMenuBots | tl.types.AttachMenuBotsNotModified
+AttachMenuBotsInst = (tl.types.AttachMenuBots, tl.types.AttachMenuBotsNotModified,)
+
+AttachMenuBotsBot = tl.types.AttachMenuBotsBot
+AttachMenuBotsBotInst = (tl.types.AttachMenuBotsBot,)
+
+WebViewResult = tl.types.WebViewResultUrl | tl.types.WebViewResultUrl_140
+WebViewResultInst = (tl.types.WebViewResultUrl, tl.types.WebViewResultUrl_140,)
+
+WebViewMessageSent = tl.types.WebViewMessageSent
+WebViewMessageSentInst = (tl.types.WebViewMessageSent,)
+
+BotMenuButton = tl.types.BotMenuButton | tl.types.BotMenuButtonCommands | tl.types.BotMenuButtonDefault
+BotMenuButtonInst = (tl.types.BotMenuButton, tl.types.BotMenuButtonCommands, tl.types.BotMenuButtonDefault,)
+
+NotificationSound = tl.types.NotificationSoundDefault | tl.types.NotificationSoundLocal | tl.types.NotificationSoundNone | tl.types.NotificationSoundRingtone
+NotificationSoundInst = (tl.types.NotificationSoundDefault, tl.types.NotificationSoundLocal, tl.types.NotificationSoundNone, tl.types.NotificationSoundRingtone,)
+
+AttachMenuPeerType = tl.types.AttachMenuPeerTypeBotPM | tl.types.AttachMenuPeerTypeBroadcast | tl.types.AttachMenuPeerTypeChat | tl.types.AttachMenuPeerTypePM | tl.types.AttachMenuPeerTypeSameBotPM
+AttachMenuPeerTypeInst = (tl.types.AttachMenuPeerTypeBotPM, tl.types.AttachMenuPeerTypeBroadcast, tl.types.AttachMenuPeerTypeChat, tl.types.AttachMenuPeerTypePM, tl.types.AttachMenuPeerTypeSameBotPM,)
+
+InputInvoice = tl.types.InputInvoiceBusinessBotTransferStars | tl.types.InputInvoiceChatInviteSubscription | tl.types.InputInvoiceMessage | tl.types.InputInvoicePremiumGiftCode | tl.types.InputInvoicePremiumGiftStars | tl.types.InputInvoiceSlug | tl.types.InputInvoiceStarGift | tl.types.InputInvoiceStarGiftTransfer | tl.types.InputInvoiceStarGiftTransfer_196 | tl.types.InputInvoiceStarGiftUpgrade | tl.types.InputInvoiceStarGiftUpgrade_196 | tl.types.InputInvoiceStarGift_189 | tl.types.InputInvoiceStars | tl.types.InputInvoiceStars_181
+InputInvoiceInst = (tl.types.InputInvoiceBusinessBotTransferStars, tl.types.InputInvoiceChatInviteSubscription, tl.types.InputInvoiceMessage, tl.types.InputInvoicePremiumGiftCode, tl.types.InputInvoicePremiumGiftStars, tl.types.InputInvoiceSlug, tl.types.InputInvoiceStarGift, tl.types.InputInvoiceStarGiftTransfer, tl.types.InputInvoiceStarGiftTransfer_196, tl.types.InputInvoiceStarGiftUpgrade, tl.types.InputInvoiceStarGiftUpgrade_196, tl.types.InputInvoiceStarGift_189, tl.types.InputInvoiceStars, tl.types.InputInvoiceStars_181,)
+
+InputStorePaymentPurpose = tl.types.InputStorePaymentAuthCode | tl.types.InputStorePaymentGiftPremium | tl.types.InputStorePaymentPremiumGiftCode | tl.types.InputStorePaymentPremiumGiftCode_166 | tl.types.InputStorePaymentPremiumGiveaway | tl.types.InputStorePaymentPremiumGiveaway_166 | tl.types.InputStorePaymentPremiumSubscription | tl.types.InputStorePaymentStarsGift | tl.types.InputStorePaymentStarsGiveaway | tl.types.InputStorePaymentStarsTopup | tl.types.InputStorePaymentStars_181
+InputStorePaymentPurposeInst = (tl.types.InputStorePaymentAuthCode, tl.types.InputStorePaymentGiftPremium, tl.types.InputStorePaymentPremiumGiftCode, tl.types.InputStorePaymentPremiumGiftCode_166, tl.types.InputStorePaymentPremiumGiveaway, tl.types.InputStorePaymentPremiumGiveaway_166, tl.types.InputStorePaymentPremiumSubscription, tl.types.InputStorePaymentStarsGift, tl.types.InputStorePaymentStarsGiveaway, tl.types.InputStorePaymentStarsTopup, tl.types.InputStorePaymentStars_181,)
+
+PaymentFormMethod = tl.types.PaymentFormMethod
+PaymentFormMethodInst = (tl.types.PaymentFormMethod,)
+
+EmojiStatus = tl.types.EmojiStatus | tl.types.EmojiStatusCollectible | tl.types.EmojiStatusEmpty | tl.types.EmojiStatusUntil_145 | tl.types.EmojiStatus_145 | tl.types.InputEmojiStatusCollectible
+EmojiStatusInst = (tl.types.EmojiStatus, tl.types.EmojiStatusCollectible, tl.types.EmojiStatusEmpty, tl.types.EmojiStatusUntil_145, tl.types.EmojiStatus_145, tl.types.InputEmojiStatusCollectible,)
+
+Reaction = tl.types.ReactionCustomEmoji | tl.types.ReactionEmoji | tl.types.ReactionEmpty | tl.types.ReactionPaid
+ReactionInst = (tl.types.ReactionCustomEmoji, tl.types.ReactionEmoji, tl.types.ReactionEmpty, tl.types.ReactionPaid,)
+
+ChatReactions = tl.types.ChatReactionsAll | tl.types.ChatReactionsNone | tl.types.ChatReactionsSome
+ChatReactionsInst = (tl.types.ChatReactionsAll, tl.types.ChatReactionsNone, tl.types.ChatReactionsSome,)
+
+EmailVerifyPurpose = tl.types.EmailVerifyPurposeLoginChange | tl.types.EmailVerifyPurposeLoginSetup | tl.types.EmailVerifyPurposePassport
+EmailVerifyPurposeInst = (tl.types.EmailVerifyPurposeLoginChange, tl.types.EmailVerifyPurposeLoginSetup, tl.types.EmailVerifyPurposePassport,)
+
+EmailVerification = tl.types.EmailVerificationApple | tl.types.EmailVerificationCode | tl.types.EmailVerificationGoogle
+EmailVerificationInst = (tl.types.EmailVerificationApple, tl.types.EmailVerificationCode, tl.types.EmailVerificationGoogle,)
+
+PremiumSubscriptionOption = tl.types.PremiumSubscriptionOption | tl.types.PremiumSubscriptionOption_145
+PremiumSubscriptionOptionInst = (tl.types.PremiumSubscriptionOption, tl.types.PremiumSubscriptionOption_145,)
+
+SendAsPeer = tl.types.SendAsPeer
+SendAsPeerInst = (tl.types.SendAsPeer,)
+
+MessageExtendedMedia = tl.types.MessageExtendedMedia | tl.types.MessageExtendedMediaPreview
+MessageExtendedMediaInst = (tl.types.MessageExtendedMedia, tl.types.MessageExtendedMediaPreview,)
+
+StickerKeyword = tl.types.StickerKeyword
+StickerKeywordInst = (tl.types.StickerKeyword,)
+
+Username = tl.types.Username
+UsernameInst = (tl.types.Username,)
+
+ForumTopic = tl.types.ForumTopic | tl.types.ForumTopicDeleted
+ForumTopicInst = (tl.types.ForumTopic, tl.types.ForumTopicDeleted,)
+
+DefaultHistoryTTL = tl.types.DefaultHistoryTTL
+DefaultHistoryTTLInst = (tl.types.DefaultHistoryTTL,)
+
+ExportedContactToken = tl.types.ExportedContactToken
+ExportedContactTokenInst = (tl.types.ExportedContactToken,)
+
+RequestPeerType = tl.types.RequestPeerTypeBroadcast | tl.types.RequestPeerTypeChat | tl.types.RequestPeerTypeUser
+RequestPeerTypeInst = (tl.types.RequestPeerTypeBroadcast, tl.types.RequestPeerTypeChat, tl.types.RequestPeerTypeUser,)
+
+EmojiList = tl.types.EmojiList | tl.types.EmojiListNotModified
+EmojiListInst = (tl.types.EmojiList, tl.types.EmojiListNotModified,)
+
+EmojiGroup = tl.types.EmojiGroup | tl.types.EmojiGroupGreeting | tl.types.EmojiGroupPremium
+EmojiGroupInst = (tl.types.EmojiGroup, tl.types.EmojiGroupGreeting, tl.types.EmojiGroupPremium,)
+
+TextWithEntities = tl.types.TextWithEntities
+TextWithEntitiesInst = (tl.types.TextWithEntities,)
+
+AutoSaveSettings = tl.types.AutoSaveSettings
+AutoSaveSettingsInst = (tl.types.AutoSaveSettings,)
+
+AutoSaveException = tl.types.AutoSaveException
+AutoSaveExceptionInst = (tl.types.AutoSaveException,)
+
+InputBotApp = tl.types.InputBotAppID | tl.types.InputBotAppShortName
+InputBotAppInst = (tl.types.InputBotAppID, tl.types.InputBotAppShortName,)
+
+BotApp = tl.types.BotApp | tl.types.BotAppNotModified
+BotAppInst = (tl.types.BotApp, tl.types.BotAppNotModified,)
+
+InlineBotWebView = tl.types.InlineBotWebView
+InlineBotWebViewInst = (tl.types.InlineBotWebView,)
+
+ReadParticipantDate = tl.types.ReadParticipantDate
+ReadParticipantDateInst = (tl.types.ReadParticipantDate,)
+
+InputChatlist = tl.types.InputChatlistDialogFilter
+InputChatlistInst = (tl.types.InputChatlistDialogFilter,)
+
+ExportedChatlistInvite = tl.types.ExportedChatlistInvite
+ExportedChatlistInviteInst = (tl.types.ExportedChatlistInvite,)
+
+MessagePeerVote = tl.types.MessagePeerVote | tl.types.MessagePeerVoteInputOption | tl.types.MessagePeerVoteMultiple
+MessagePeerVoteInst = (tl.types.MessagePeerVote, tl.types.MessagePeerVoteInputOption, tl.types.MessagePeerVoteMultiple,)
+
+StoryViews = tl.types.StoryViews | tl.types.StoryViews_160 | tl.types.StoryViews_161
+StoryViewsInst = (tl.types.StoryViews, tl.types.StoryViews_160, tl.types.StoryViews_161,)
+
+StoryItem = tl.types.StoryItem | tl.types.StoryItemDeleted | tl.types.StoryItemSkipped | tl.types.StoryItem_160 | tl.types.StoryItem_161 | tl.types.StoryItem_167
+StoryItemInst = (tl.types.StoryItem, tl.types.StoryItemDeleted, tl.types.StoryItemSkipped, tl.types.StoryItem_160, tl.types.StoryItem_161, tl.types.StoryItem_167,)
+
+StoryView = tl.types.StoryView | tl.types.StoryViewPublicForward | tl.types.StoryViewPublicRepost | tl.types.StoryView_160
+StoryViewInst = (tl.types.StoryView, tl.types.StoryViewPublicForward, tl.types.StoryViewPublicRepost, tl.types.StoryView_160,)
+
+InputReplyTo = tl.types.InputReplyToMessage | tl.types.InputReplyToMessage_160 | tl.types.InputReplyToMessage_166 | tl.types.InputReplyToStory | tl.types.InputReplyToStory_160
+InputReplyToInst = (tl.types.InputReplyToMessage, tl.types.InputReplyToMessage_160, tl.types.InputReplyToMessage_166, tl.types.InputReplyToStory, tl.types.InputReplyToStory_160,)
+
+ExportedStoryLink = tl.types.ExportedStoryLink
+ExportedStoryLinkInst = (tl.types.ExportedStoryLink,)
+
+StoriesStealthMode = tl.types.StoriesStealthMode
+StoriesStealthModeInst = (tl.types.StoriesStealthMode,)
+
+MediaAreaCoordinates = tl.types.MediaAreaCoordinates | tl.types.MediaAreaCoordinates_161
+MediaAreaCoordinatesInst = (tl.types.MediaAreaCoordinates, tl.types.MediaAreaCoordinates_161,)
+
+MediaArea = tl.types.InputMediaAreaChannelPost | tl.types.InputMediaAreaVenue | tl.types.MediaAreaChannelPost | tl.types.MediaAreaGeoPoint | tl.types.MediaAreaGeoPoint_161 | tl.types.MediaAreaStarGift | tl.types.MediaAreaSuggestedReaction | tl.types.MediaAreaUrl | tl.types.MediaAreaVenue | tl.types.MediaAreaWeather
+MediaAreaInst = (tl.types.InputMediaAreaChannelPost, tl.types.InputMediaAreaVenue, tl.types.MediaAreaChannelPost, tl.types.MediaAreaGeoPoint, tl.types.MediaAreaGeoPoint_161, tl.types.MediaAreaStarGift, tl.types.MediaAreaSuggestedReaction, tl.types.MediaAreaUrl, tl.types.MediaAreaVenue, tl.types.MediaAreaWeather,)
+
+PeerStories = tl.types.PeerStories
+PeerStoriesInst = (tl.types.PeerStories,)
+
+PremiumGiftCodeOption = tl.types.PremiumGiftCodeOption
+PremiumGiftCodeOptionInst = (tl.types.PremiumGiftCodeOption,)
+
+PrepaidGiveaway = tl.types.PrepaidGiveaway | tl.types.PrepaidStarsGiveaway
+PrepaidGiveawayInst = (tl.types.PrepaidGiveaway, tl.types.PrepaidStarsGiveaway,)
+
+Boost = tl.types.Boost | tl.types.Boost_166
+BoostInst = (tl.types.Boost, tl.types.Boost_166,)
+
+MyBoost = tl.types.MyBoost
+MyBoostInst = (tl.types.MyBoost,)
+
+StoryFwdHeader = tl.types.StoryFwdHeader
+StoryFwdHeaderInst = (tl.types.StoryFwdHeader,)
+
+PostInteractionCounters = tl.types.PostInteractionCountersMessage | tl.types.PostInteractionCountersStory
+PostInteractionCountersInst = (tl.types.PostInteractionCountersMessage, tl.types.PostInteractionCountersStory,)
+
+PublicForward = tl.types.PublicForwardMessage | tl.types.PublicForwardStory
+PublicForwardInst = (tl.types.PublicForwardMessage, tl.types.PublicForwardStory,)
+
+PeerColor = tl.types.PeerColor
+PeerColorInst = (tl.types.PeerColor,)
+
+StoryReaction = tl.types.StoryReaction | tl.types.StoryReactionPublicForward | tl.types.StoryReactionPublicRepost
+StoryReactionInst = (tl.types.StoryReaction, tl.types.StoryReactionPublicForward, tl.types.StoryReactionPublicRepost,)
+
+SavedDialog = tl.types.SavedDialog
+SavedDialogInst = (tl.types.SavedDialog,)
+
+SavedReactionTag = tl.types.SavedReactionTag
+SavedReactionTagInst = (tl.types.SavedReactionTag,)
+
+OutboxReadDate = tl.types.OutboxReadDate
+OutboxReadDateInst = (tl.types.OutboxReadDate,)
+
+SmsJob = tl.types.SmsJob
+SmsJobInst = (tl.types.SmsJob,)
+
+BusinessWeeklyOpen = tl.types.BusinessWeeklyOpen
+BusinessWeeklyOpenInst = (tl.types.BusinessWeeklyOpen,)
+
+BusinessWorkHours = tl.types.BusinessWorkHours
+BusinessWorkHoursInst = (tl.types.BusinessWorkHours,)
+
+BusinessLocation = tl.types.BusinessLocation
+BusinessLocationInst = (tl.types.BusinessLocation,)
+
+InputBusinessRecipients = tl.types.InputBusinessRecipients
+InputBusinessRecipientsInst = (tl.types.InputBusinessRecipients,)
+
+BusinessRecipients = tl.types.BusinessRecipients
+BusinessRecipientsInst = (tl.types.BusinessRecipients,)
+
+BusinessAwayMessageSchedule = tl.types.BusinessAwayMessageScheduleAlways | tl.types.BusinessAwayMessageScheduleCustom | tl.types.BusinessAwayMessageScheduleOutsideWorkHours
+BusinessAwayMessageScheduleInst = (tl.types.BusinessAwayMessageScheduleAlways, tl.types.BusinessAwayMessageScheduleCustom, tl.types.BusinessAwayMessageScheduleOutsideWorkHours,)
+
+InputBusinessGreetingMessage = tl.types.InputBusinessGreetingMessage
+InputBusinessGreetingMessageInst = (tl.types.InputBusinessGreetingMessage,)
+
+BusinessGreetingMessage = tl.types.BusinessGreetingMessage
+BusinessGreetingMessageInst = (tl.types.BusinessGreetingMessage,)
+
+InputBusinessAwayMessage = tl.types.InputBusinessAwayMessage
+InputBusinessAwayMessageInst = (tl.types.InputBusinessAwayMessage,)
+
+BusinessAwayMessage = tl.types.BusinessAwayMessage
+BusinessAwayMessageInst = (tl.types.BusinessAwayMessage,)
+
+Timezone = tl.types.Timezone
+TimezoneInst = (tl.types.Timezone,)
+
+QuickReply = tl.types.QuickReply
+QuickReplyInst = (tl.types.QuickReply,)
+
+InputQuickReplyShortcut = tl.types.InputQuickReplyShortcut | tl.types.InputQuickReplyShortcutId
+InputQuickReplyShortcutInst = (tl.types.InputQuickReplyShortcut, tl.types.InputQuickReplyShortcutId,)
+
+ConnectedBot = tl.types.ConnectedBot | tl.types.ConnectedBot_176 | tl.types.ConnectedBot_177
+ConnectedBotInst = (tl.types.ConnectedBot, tl.types.ConnectedBot_176, tl.types.ConnectedBot_177,)
+
+Birthday = tl.types.Birthday
+BirthdayInst = (tl.types.Birthday,)
+
+BotBusinessConnection = tl.types.BotBusinessConnection | tl.types.BotBusinessConnection_177
+BotBusinessConnectionInst = (tl.types.BotBusinessConnection, tl.types.BotBusinessConnection_177,)
+
+InputBusinessIntro = tl.types.InputBusinessIntro
+InputBusinessIntroInst = (tl.types.InputBusinessIntro,)
+
+BusinessIntro = tl.types.BusinessIntro
+BusinessIntroInst = (tl.types.BusinessIntro,)
+
+InputCollectible = tl.types.InputCollectiblePhone | tl.types.InputCollectibleUsername
+InputCollectibleInst = (tl.types.InputCollectiblePhone, tl.types.InputCollectibleUsername,)
+
+InputBusinessBotRecipients = tl.types.InputBusinessBotRecipients
+InputBusinessBotRecipientsInst = (tl.types.InputBusinessBotRecipients,)
+
+BusinessBotRecipients = tl.types.BusinessBotRecipients
+BusinessBotRecipientsInst = (tl.types.BusinessBotRecipients,)
+
+ContactBirthday = tl.types.ContactBirthday
+ContactBirthdayInst = (tl.types.ContactBirthday,)
+
+MissingInvitee = tl.types.MissingInvitee
+MissingInviteeInst = (tl.types.MissingInvitee,)
+
+InputBusinessChatLink = tl.types.InputBusinessChatLink
+InputBusinessChatLinkInst = (tl.types.InputBusinessChatLink,)
+
+BusinessChatLink = tl.types.BusinessChatLink
+BusinessChatLinkInst = (tl.types.BusinessChatLink,)
+
+RequestedPeer = tl.types.RequestedPeerChannel | tl.types.RequestedPeerChat | tl.types.RequestedPeerUser
+RequestedPeerInst = (tl.types.RequestedPeerChannel, tl.types.RequestedPeerChat, tl.types.RequestedPeerUser,)
+
+SponsoredMessageReportOption = tl.types.SponsoredMessageReportOption
+SponsoredMessageReportOptionInst = (tl.types.SponsoredMessageReportOption,)
+
+BroadcastRevenueTransaction = tl.types.BroadcastRevenueTransactionProceeds | tl.types.BroadcastRevenueTransactionRefund | tl.types.BroadcastRevenueTransactionWithdrawal
+BroadcastRevenueTransactionInst = (tl.types.BroadcastRevenueTransactionProceeds, tl.types.BroadcastRevenueTransactionRefund, tl.types.BroadcastRevenueTransactionWithdrawal,)
+
+ReactionNotificationsFrom = tl.types.ReactionNotificationsFromAll | tl.types.ReactionNotificationsFromContacts
+ReactionNotificationsFromInst = (tl.types.ReactionNotificationsFromAll, tl.types.ReactionNotificationsFromContacts,)
+
+ReactionsNotifySettings = tl.types.ReactionsNotifySettings
+ReactionsNotifySettingsInst = (tl.types.ReactionsNotifySettings,)
+
+BroadcastRevenueBalances = tl.types.BroadcastRevenueBalances | tl.types.BroadcastRevenueBalances_179
+BroadcastRevenueBalancesInst = (tl.types.BroadcastRevenueBalances, tl.types.BroadcastRevenueBalances_179,)
+
+AvailableEffect = tl.types.AvailableEffect
+AvailableEffectInst = (tl.types.AvailableEffect,)
+
+FactCheck = tl.types.FactCheck
+FactCheckInst = (tl.types.FactCheck,)
+
+StarsTransactionPeer = tl.types.StarsTransactionPeer | tl.types.StarsTransactionPeerAPI | tl.types.StarsTransactionPeerAds | tl.types.StarsTransactionPeerAppStore | tl.types.StarsTransactionPeerFragment | tl.types.StarsTransactionPeerPlayMarket | tl.types.StarsTransactionPeerPremiumBot | tl.types.StarsTransactionPeerUnsupported
+StarsTransactionPeerInst = (tl.types.StarsTransactionPeer, tl.types.StarsTransactionPeerAPI, tl.types.StarsTransactionPeerAds, tl.types.StarsTransactionPeerAppStore, tl.types.StarsTransactionPeerFragment, tl.types.StarsTransactionPeerPlayMarket, tl.types.StarsTransactionPeerPremiumBot, tl.types.StarsTransactionPeerUnsupported,)
+
+StarsTopupOption = tl.types.StarsTopupOption
+StarsTopupOptionInst = (tl.types.StarsTopupOption,)
+
+StarsTransaction = tl.types.StarsTransaction | tl.types.StarsTransaction_181 | tl.types.StarsTransaction_182 | tl.types.StarsTransaction_183 | tl.types.StarsTransaction_186 | tl.types.StarsTransaction_187 | tl.types.StarsTransaction_189 | tl.types.StarsTransaction_192 | tl.types.StarsTransaction_195
+StarsTransactionInst = (tl.types.StarsTransaction, tl.types.StarsTransaction_181, tl.types.StarsTransaction_182, tl.types.StarsTransaction_183, tl.types.StarsTransaction_186, tl.types.StarsTransaction_187, tl.types.StarsTransaction_189, tl.types.StarsTransaction_192, tl.types.StarsTransaction_195,)
+
+FoundStory = tl.types.FoundStory
+FoundStoryInst = (tl.types.FoundStory,)
+
+GeoPointAddress = tl.types.GeoPointAddress
+GeoPointAddressInst = (tl.types.GeoPointAddress,)
+
+StarsRevenueStatus = tl.types.StarsRevenueStatus | tl.types.StarsRevenueStatus_182
+StarsRevenueStatusInst = (tl.types.StarsRevenueStatus, tl.types.StarsRevenueStatus_182,)
+
+InputStarsTransaction = tl.types.InputStarsTransaction
+InputStarsTransactionInst = (tl.types.InputStarsTransaction,)
+
+StarsGiftOption = tl.types.StarsGiftOption
+StarsGiftOptionInst = (tl.types.StarsGiftOption,)
+
+BotPreviewMedia = tl.types.BotPreviewMedia
+BotPreviewMediaInst = (tl.types.BotPreviewMedia,)
+
+StarsSubscriptionPricing = tl.types.StarsSubscriptionPricing
+StarsSubscriptionPricingInst = (tl.types.StarsSubscriptionPricing,)
+
+StarsSubscription = tl.types.StarsSubscription | tl.types.StarsSubscription_186
+StarsSubscriptionInst = (tl.types.StarsSubscription, tl.types.StarsSubscription_186,)
+
+MessageReactor = tl.types.MessageReactor
+MessageReactorInst = (tl.types.MessageReactor,)
+
+StarsGiveawayOption = tl.types.StarsGiveawayOption
+StarsGiveawayOptionInst = (tl.types.StarsGiveawayOption,)
+
+StarsGiveawayWinnersOption = tl.types.StarsGiveawayWinnersOption
+StarsGiveawayWinnersOptionInst = (tl.types.StarsGiveawayWinnersOption,)
+
+StarGift = tl.types.StarGift | tl.types.StarGiftUnique | tl.types.StarGiftUnique_196 | tl.types.StarGiftUnique_197 | tl.types.StarGiftUnique_198 | tl.types.StarGift_189 | tl.types.StarGift_192
+StarGiftInst = (tl.types.StarGift, tl.types.StarGiftUnique, tl.types.StarGiftUnique_196, tl.types.StarGiftUnique_197, tl.types.StarGiftUnique_198, tl.types.StarGift_189, tl.types.StarGift_192,)
+
+MessageReportOption = tl.types.MessageReportOption
+MessageReportOptionInst = (tl.types.MessageReportOption,)
+
+ReportResult = tl.types.ReportResultAddComment | tl.types.ReportResultChooseOption | tl.types.ReportResultReported
+ReportResultInst = (tl.types.ReportResultAddComment, tl.types.ReportResultChooseOption, tl.types.ReportResultReported,)
+
+BotAppSettings = tl.types.BotAppSettings
+BotAppSettingsInst = (tl.types.BotAppSettings,)
+
+StarRefProgram = tl.types.StarRefProgram
+StarRefProgramInst = (tl.types.StarRefProgram,)
+
+ConnectedBotStarRef = tl.types.ConnectedBotStarRef
+ConnectedBotStarRefInst = (tl.types.ConnectedBotStarRef,)
+
+StarsAmount = tl.types.StarsAmount
+StarsAmountInst = (tl.types.StarsAmount,)
+
+BotVerifierSettings = tl.types.BotVerifierSettings
+BotVerifierSettingsInst = (tl.types.BotVerifierSettings,)
+
+BotVerification = tl.types.BotVerification
+BotVerificationInst = (tl.types.BotVerification,)
+
+StarGiftAttribute = tl.types.StarGiftAttributeBackdrop | tl.types.StarGiftAttributeModel | tl.types.StarGiftAttributeOriginalDetails | tl.types.StarGiftAttributeOriginalDetails_196 | tl.types.StarGiftAttributePattern
+StarGiftAttributeInst = (tl.types.StarGiftAttributeBackdrop, tl.types.StarGiftAttributeModel, tl.types.StarGiftAttributeOriginalDetails, tl.types.StarGiftAttributeOriginalDetails_196, tl.types.StarGiftAttributePattern,)
+
+SavedStarGift = tl.types.SavedStarGift
+SavedStarGiftInst = (tl.types.SavedStarGift,)
+
+InputSavedStarGift = tl.types.InputSavedStarGiftChat | tl.types.InputSavedStarGiftUser
+InputSavedStarGiftInst = (tl.types.InputSavedStarGiftChat, tl.types.InputSavedStarGiftUser,)
+
+PaidReactionPrivacy = tl.types.PaidReactionPrivacyAnonymous | tl.types.PaidReactionPrivacyDefault | tl.types.PaidReactionPrivacyPeer
+PaidReactionPrivacyInst = (tl.types.PaidReactionPrivacyAnonymous, tl.types.PaidReactionPrivacyDefault, tl.types.PaidReactionPrivacyPeer,)
+
+RequirementToContact = tl.types.RequirementToContactEmpty | tl.types.RequirementToContactPaidMessages | tl.types.RequirementToContactPremium
+RequirementToContactInst = (tl.types.RequirementToContactEmpty, tl.types.RequirementToContactPaidMessages, tl.types.RequirementToContactPremium,)
+
+BusinessBotRights = tl.types.BusinessBotRights
+BusinessBotRightsInst = (tl.types.BusinessBotRights,)
+
+DisallowedGiftsSettings = tl.types.DisallowedGiftsSettings
+DisallowedGiftsSettingsInst = (tl.types.DisallowedGiftsSettings,)
+
+SponsoredPeer = tl.types.SponsoredPeer
+SponsoredPeerInst = (tl.types.SponsoredPeer,)
+
+MessageUserVote = tl.types.MessageUserVoteInputOption_133 | tl.types.MessageUserVoteMultiple_133 | tl.types.MessageUserVote_133
+MessageUserVoteInst = (tl.types.MessageUserVoteInputOption_133, tl.types.MessageUserVoteMultiple_133, tl.types.MessageUserVote_133,)
+
+MessageInteractionCounters = tl.types.MessageInteractionCounters_133
+MessageInteractionCountersInst = (tl.types.MessageInteractionCounters_133,)
+
+ChatTheme = tl.types.ChatTheme_133
+ChatThemeInst = (tl.types.ChatTheme_133,)
+
+MessageUserReaction = tl.types.MessageUserReaction_136
+MessageUserReactionInst = (tl.types.MessageUserReaction_136,)
+
+SimpleWebViewResult = tl.types.SimpleWebViewResultUrl_140
+SimpleWebViewResultInst = (tl.types.SimpleWebViewResultUrl_140,)
+
+PremiumGiftOption = tl.types.PremiumGiftOption_144
+PremiumGiftOptionInst = (tl.types.PremiumGiftOption_144,)
+
+AppWebViewResult = tl.types.AppWebViewResultUrl_155
+AppWebViewResultInst = (tl.types.AppWebViewResultUrl_155,)
+
+SponsoredWebPage = tl.types.SponsoredWebPage_160
+SponsoredWebPageInst = (tl.types.SponsoredWebPage_160,)
+
+UserStories = tl.types.UserStories_160
+UserStoriesInst = (tl.types.UserStories_160,)
+
+Booster = tl.types.Booster_164
+BoosterInst = (tl.types.Booster_164,)
+
+UserStarGift = tl.types.UserStarGift_189 | tl.types.UserStarGift_196
+UserStarGiftInst = (tl.types.UserStarGift_189, tl.types.UserStarGift_196,)
+
@@ -0,0 +1,84 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+PrivacyRules = tl.types.account.PrivacyRules
+PrivacyRulesInst = (tl.types.account.PrivacyRules,)
+
+Authorizations = tl.types.account.Authorizations | tl.types.account.Authorizations_133
+AuthorizationsInst = (tl.types.account.Authorizations, tl.types.account.Authorizations_133,)
+
+Password = tl.types.account.Password | tl.types.account.Password_133
+PasswordInst = (tl.types.account.Password, tl.types.account.Password_133,)
+
+PasswordSettings = tl.types.account.PasswordSettings
+PasswordSettingsInst = (tl.types.account.PasswordSettings,)
+
+PasswordInputSettings = tl.types.account.PasswordInputSettings
+PasswordInputSettingsInst = (tl.types.account.PasswordInputSettings,)
+
+TmpPassword = tl.types.account.TmpPassword
+TmpPasswordInst = (tl.types.account.TmpPassword,)
+
+WebAuthorizations = tl.types.account.WebAuthorizations
+WebAuthorizationsInst = (tl.types.account.WebAuthorizations,)
+
+AuthorizationForm = tl.types.account.AuthorizationForm
+AuthorizationFormInst = (tl.types.account.AuthorizationForm,)
+
+SentEmailCode = tl.types.account.SentEmailCode
+SentEmailCodeInst = (tl.types.account.SentEmailCode,)
+
+Takeout = tl.types.account.Takeout
+TakeoutInst = (tl.types.account.Takeout,)
+
+WallPapers = tl.types.account.WallPapers | tl.types.account.WallPapersNotModified
+WallPapersInst = (tl.types.account.WallPapers, tl.types.account.WallPapersNotModified,)
+
+AutoDownloadSettings = tl.types.account.AutoDownloadSettings
+AutoDownloadSettingsInst = (tl.types.account.AutoDownloadSettings,)
+
+Themes = tl.types.account.Themes | tl.types.account.ThemesNotModified
+ThemesInst = (tl.types.account.Themes, tl.types.account.ThemesNotModified,)
+
+ContentSettings = tl.types.account.ContentSettings
+ContentSettingsInst = (tl.types.account.ContentSettings,)
+
+ResetPasswordResult = tl.types.account.ResetPasswordFailedWait | tl.types.account.ResetPasswordOk | tl.types.account.ResetPasswordRequestedWait
+ResetPasswordResultInst = (tl.types.account.ResetPasswordFailedWait, tl.types.account.ResetPasswordOk, tl.types.account.ResetPasswordRequestedWait,)
+
+SavedRingtones = tl.types.account.SavedRingtones | tl.types.account.SavedRingtonesNotModified
+SavedRingtonesInst = (tl.types.account.SavedRingtones, tl.types.account.SavedRingtonesNotModified,)
+
+SavedRingtone = tl.types.account.SavedRingtone | tl.types.account.SavedRingtoneConverted
+SavedRingtoneInst = (tl.types.account.SavedRingtone, tl.types.account.SavedRingtoneConverted,)
+
+EmojiStatuses = tl.types.account.EmojiStatuses | tl.types.account.EmojiStatusesNotModified
+EmojiStatusesInst = (tl.types.account.EmojiStatuses, tl.types.account.EmojiStatusesNotModified,)
+
+EmailVerified = tl.types.account.EmailVerified | tl.types.account.EmailVerifiedLogin
+EmailVerifiedInst = (tl.types.account.EmailVerified, tl.types.account.EmailVerifiedLogin,)
+
+AutoSaveSettings = tl.types.account.AutoSaveSettings
+AutoSaveSettingsInst = (tl.types.account.AutoSaveSettings,)
+
+ConnectedBots = tl.types.account.ConnectedBots
+ConnectedBotsInst = (tl.types.account.ConnectedBots,)
+
+BusinessChatLinks = tl.types.account.BusinessChatLinks
+BusinessChatLinksInst = (tl.types.account.BusinessChatLinks,)
+
+ResolvedBusinessChatLinks = tl.types.account.ResolvedBusinessChatLinks
+ResolvedBusinessChatLinksInst = (tl.types.account.ResolvedBusinessChatLinks,)
+
+PaidMessagesRevenue = tl.types.account.PaidMessagesRevenue
+PaidMessagesRevenueInst = (tl.types.account.PaidMessagesRevenue,)
+
+ChatThemes = tl.types.account.ChatThemesNotModified_133 | tl.types.account.ChatThemes_133
+ChatThemesInst = (tl.types.account.ChatThemesNotModified_133, tl.types.account.ChatThemes_133,)
+
@@ -0,0 +1,33 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+SentCode = tl.types.auth.SentCode | tl.types.auth.SentCodePaymentRequired | tl.types.auth.SentCodeSuccess
+SentCodeInst = (tl.types.auth.SentCode, tl.types.auth.SentCodePaymentRequired, tl.types.auth.SentCodeSuccess,)
+
+Authorization = tl.types.auth.Authorization | tl.types.auth.AuthorizationSignUpRequired | tl.types.auth.Authorization_133 | tl.types.auth.Authorization_135
+AuthorizationInst = (tl.types.auth.Authorization, tl.types.auth.AuthorizationSignUpRequired, tl.types.auth.Authorization_133, tl.types.auth.Authorization_135,)
+
+ExportedAuthorization = tl.types.auth.ExportedAuthorization
+ExportedAuthorizationInst = (tl.types.auth.ExportedAuthorization,)
+
+PasswordRecovery = tl.types.auth.PasswordRecovery
+PasswordRecoveryInst = (tl.types.auth.PasswordRecovery,)
+
+CodeType = tl.types.auth.CodeTypeCall | tl.types.auth.CodeTypeFlashCall | tl.types.auth.CodeTypeFragmentSms | tl.types.auth.CodeTypeMissedCall | tl.types.auth.CodeTypeSms
+CodeTypeInst = (tl.types.auth.CodeTypeCall, tl.types.auth.CodeTypeFlashCall, tl.types.auth.CodeTypeFragmentSms, tl.types.auth.CodeTypeMissedCall, tl.types.auth.CodeTypeSms,)
+
+SentCodeType = tl.types.auth.SentCodeTypeApp | tl.types.auth.SentCodeTypeCall | tl.types.auth.SentCodeTypeEmailCode | tl.types.auth.SentCodeTypeEmailCode_145 | tl.types.auth.SentCodeTypeFirebaseSms | tl.types.auth.SentCodeTypeFirebaseSms_152 | tl.types.auth.SentCodeTypeFirebaseSms_181 | tl.types.auth.SentCodeTypeFlashCall | tl.types.auth.SentCodeTypeFragmentSms | tl.types.auth.SentCodeTypeMissedCall | tl.types.auth.SentCodeTypeSetUpEmailRequired | tl.types.auth.SentCodeTypeSms | tl.types.auth.SentCodeTypeSmsPhrase | tl.types.auth.SentCodeTypeSmsWord
+SentCodeTypeInst = (tl.types.auth.SentCodeTypeApp, tl.types.auth.SentCodeTypeCall, tl.types.auth.SentCodeTypeEmailCode, tl.types.auth.SentCodeTypeEmailCode_145, tl.types.auth.SentCodeTypeFirebaseSms, tl.types.auth.SentCodeTypeFirebaseSms_152, tl.types.auth.SentCodeTypeFirebaseSms_181, tl.types.auth.SentCodeTypeFlashCall, tl.types.auth.SentCodeTypeFragmentSms, tl.types.auth.SentCodeTypeMissedCall, tl.types.auth.SentCodeTypeSetUpEmailRequired, tl.types.auth.SentCodeTypeSms, tl.types.auth.SentCodeTypeSmsPhrase, tl.types.auth.SentCodeTypeSmsWord,)
+
+LoginToken = tl.types.auth.LoginToken | tl.types.auth.LoginTokenMigrateTo | tl.types.auth.LoginTokenSuccess
+LoginTokenInst = (tl.types.auth.LoginToken, tl.types.auth.LoginTokenMigrateTo, tl.types.auth.LoginTokenSuccess,)
+
+LoggedOut = tl.types.auth.LoggedOut
+LoggedOutInst = (tl.types.auth.LoggedOut,)
+
@@ -0,0 +1,18 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+BotInfo = tl.types.bots.BotInfo
+BotInfoInst = (tl.types.bots.BotInfo,)
+
+PopularAppBots = tl.types.bots.PopularAppBots
+PopularAppBotsInst = (tl.types.bots.PopularAppBots,)
+
+PreviewInfo = tl.types.bots.PreviewInfo
+PreviewInfoInst = (tl.types.bots.PreviewInfo,)
+
@@ -0,0 +1,24 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+ChannelParticipants = tl.types.channels.ChannelParticipants | tl.types.channels.ChannelParticipantsNotModified
+ChannelParticipantsInst = (tl.types.channels.ChannelParticipants, tl.types.channels.ChannelParticipantsNotModified,)
+
+ChannelParticipant = tl.types.channels.ChannelParticipant
+ChannelParticipantInst = (tl.types.channels.ChannelParticipant,)
+
+AdminLogResults = tl.types.channels.AdminLogResults
+AdminLogResultsInst = (tl.types.channels.AdminLogResults,)
+
+SendAsPeers = tl.types.channels.SendAsPeers | tl.types.channels.SendAsPeers_135
+SendAsPeersInst = (tl.types.channels.SendAsPeers, tl.types.channels.SendAsPeers_135,)
+
+SponsoredMessageReportResult = tl.types.channels.SponsoredMessageReportResultAdsHidden | tl.types.channels.SponsoredMessageReportResultChooseOption | tl.types.channels.SponsoredMessageReportResultReported
+SponsoredMessageReportResultInst = (tl.types.channels.SponsoredMessageReportResultAdsHidden, tl.types.channels.SponsoredMessageReportResultChooseOption, tl.types.channels.SponsoredMessageReportResultReported,)
+
@@ -0,0 +1,21 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+ExportedChatlistInvite = tl.types.chatlists.ExportedChatlistInvite
+ExportedChatlistInviteInst = (tl.types.chatlists.ExportedChatlistInvite,)
+
+ExportedInvites = tl.types.chatlists.ExportedInvites
+ExportedInvitesInst = (tl.types.chatlists.ExportedInvites,)
+
+ChatlistInvite = tl.types.chatlists.ChatlistInvite | tl.types.chatlists.ChatlistInviteAlready | tl.types.chatlists.ChatlistInvite_158
+ChatlistInviteInst = (tl.types.chatlists.ChatlistInvite, tl.types.chatlists.ChatlistInviteAlready, tl.types.chatlists.ChatlistInvite_158,)
+
+ChatlistUpdates = tl.types.chatlists.ChatlistUpdates
+ChatlistUpdatesInst = (tl.types.chatlists.ChatlistUpdates,)
+
@@ -0,0 +1,33 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+Contacts = tl.types.contacts.Contacts | tl.types.contacts.ContactsNotModified
+ContactsInst = (tl.types.contacts.Contacts, tl.types.contacts.ContactsNotModified,)
+
+ImportedContacts = tl.types.contacts.ImportedContacts
+ImportedContactsInst = (tl.types.contacts.ImportedContacts,)
+
+Blocked = tl.types.contacts.Blocked | tl.types.contacts.BlockedSlice
+BlockedInst = (tl.types.contacts.Blocked, tl.types.contacts.BlockedSlice,)
+
+Found = tl.types.contacts.Found
+FoundInst = (tl.types.contacts.Found,)
+
+ResolvedPeer = tl.types.contacts.ResolvedPeer
+ResolvedPeerInst = (tl.types.contacts.ResolvedPeer,)
+
+TopPeers = tl.types.contacts.TopPeers | tl.types.contacts.TopPeersDisabled | tl.types.contacts.TopPeersNotModified
+TopPeersInst = (tl.types.contacts.TopPeers, tl.types.contacts.TopPeersDisabled, tl.types.contacts.TopPeersNotModified,)
+
+ContactBirthdays = tl.types.contacts.ContactBirthdays
+ContactBirthdaysInst = (tl.types.contacts.ContactBirthdays,)
+
+SponsoredPeers = tl.types.contacts.SponsoredPeers | tl.types.contacts.SponsoredPeersEmpty
+SponsoredPeersInst = (tl.types.contacts.SponsoredPeers, tl.types.contacts.SponsoredPeersEmpty,)
+
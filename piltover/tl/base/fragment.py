@@ -0,0 +1,12 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+CollectibleInfo = tl.types.fragment.CollectibleInfo
+CollectibleInfoInst = (tl.types.fragment.CollectibleInfo,)
+
@@ -0,0 +1,72 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+ConfigSimple = tl.types.help.ConfigSimple
+ConfigSimpleInst = (tl.types.help.ConfigSimple,)
+
+AppUpdate = tl.types.help.AppUpdate | tl.types.help.NoAppUpdate
+AppUpdateInst = (tl.types.help.AppUpdate, tl.types.help.NoAppUpdate,)
+
+InviteText = tl.types.help.InviteText
+InviteTextInst = (tl.types.help.InviteText,)
+
+Support = tl.types.help.Support
+SupportInst = (tl.types.help.Support,)
+
+TermsOfService = tl.types.help.TermsOfService
+TermsOfServiceInst = (tl.types.help.TermsOfService,)
+
+RecentMeUrls = tl.types.help.RecentMeUrls
+RecentMeUrlsInst = (tl.types.help.RecentMeUrls,)
+
+TermsOfServiceUpdate = tl.types.help.TermsOfServiceUpdate | tl.types.help.TermsOfServiceUpdateEmpty
+TermsOfServiceUpdateInst = (tl.types.help.TermsOfServiceUpdate, tl.types.help.TermsOfServiceUpdateEmpty,)
+
+DeepLinkInfo = tl.types.help.DeepLinkInfo | tl.types.help.DeepLinkInfoEmpty
+DeepLinkInfoInst = (tl.types.help.DeepLinkInfo, tl.types.help.DeepLinkInfoEmpty,)
+
+PassportConfig = tl.types.help.PassportConfig | tl.types.help.PassportConfigNotModified
+PassportConfigInst = (tl.types.help.PassportConfig, tl.types.help.PassportConfigNotModified,)
+
+SupportName = tl.types.help.SupportName
+SupportNameInst = (tl.types.help.SupportName,)
+
+UserInfo = tl.types.help.UserInfo | tl.types.help.UserInfoEmpty
+UserInfoInst = (tl.types.help.UserInfo, tl.types.help.UserInfoEmpty,)
+
+PromoData = tl.types.help.PromoData | tl.types.help.PromoDataEmpty
+PromoDataInst = (tl.types.help.PromoData, tl.types.help.PromoDataEmpty,)
+
+CountryCode = tl.types.help.CountryCode
+CountryCodeInst = (tl.types.help.CountryCode,)
+
+Country = tl.types.help.Country
+CountryInst = (tl.types.help.Country,)
+
+CountriesList = tl.types.help.CountriesList | tl.types.help.CountriesListNotModified
+CountriesListInst = (tl.types.help.CountriesList, tl.types.help.CountriesListNotModified,)
+
+PremiumPromo = tl.types.help.PremiumPromo | tl.types.help.PremiumPromo_143
+PremiumPromoInst = (tl.types.help.PremiumPromo, tl.types.help.PremiumPromo_143,)
+
+AppConfig = tl.types.help.AppConfig | tl.types.help.AppConfigNotModified
+AppConfigInst = (tl.types.help.AppConfig, tl.types.help.AppConfigNotModified,)
+
+PeerColorSet = tl.types.help.PeerColorProfileSet | tl.types.help.PeerColorSet
+PeerColorSetInst = (tl.types.help.PeerColorProfileSet, tl.types.help.PeerColorSet,)
+
+PeerColorOption = tl.types.help.PeerColorOption | tl.types.help.PeerColorOption_167 | tl.types.help.PeerColorOption_168
+PeerColorOptionInst = (tl.types.help.PeerColorOption, tl.types.help.PeerColorOption_167, tl.types.help.PeerColorOption_168,)
+
+PeerColors = tl.types.help.PeerColors | tl.types.help.PeerColorsNotModified
+PeerColorsInst = (tl.types.help.PeerColors, tl.types.help.PeerColorsNotModified,)
+
+TimezonesList = tl.types.help.TimezonesList | tl.types.help.TimezonesListNotModified
+TimezonesListInst = (tl.types.help.TimezonesList, tl.types.help.TimezonesListNotModified,)
+
@@ -0,0 +1,72 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+SentCode = tl.types.internal.SentCode
+SentCodeInst = (tl.types.internal.SentCode,)
+
+Authorization = tl.types.internal.Authorization
+AuthorizationInst = (tl.types.internal.Authorization,)
+
+AppInfo = tl.types.internal.AppInfo | tl.types.internal.AppNotFound
+AppInfoInst = (tl.types.internal.AppInfo, tl.types.internal.AppNotFound,)
+
+PublicKey = tl.types.internal.PublicKey
+PublicKeyInst = (tl.types.internal.PublicKey,)
+
+AvailableServer = tl.types.internal.AvailableServer
+AvailableServerInst = (tl.types.internal.AvailableServer,)
+
+AvailableServers = tl.types.internal.AvailableServers
+AvailableServersInst = (tl.types.internal.AvailableServers,)
+
+RpcResponse = tl.types.internal.RpcResponse
+RpcResponseInst = (tl.types.internal.RpcResponse,)
+
+MessageInternal = tl.types.internal.ChannelSubscribe | tl.types.internal.InternalPushForUsers | tl.types.internal.InternalPushForUsersShort | tl.types.internal.InvalidateCachedResponses | tl.types.internal.InvalidateContextValues | tl.types.internal.MessageToEachUser | tl.types.internal.MessageToUsers | tl.types.internal.MessageToUsersShort | tl.types.internal.SessionResumed | tl.types.internal.SetSessionInternalPush
+MessageInternalInst = (tl.types.internal.ChannelSubscribe, tl.types.internal.InternalPushForUsers, tl.types.internal.InternalPushForUsersShort, tl.types.internal.InvalidateCachedResponses, tl.types.internal.InvalidateContextValues, tl.types.internal.MessageToEachUser, tl.types.internal.MessageToUsers, tl.types.internal.MessageToUsersShort, tl.types.internal.SessionResumed, tl.types.internal.SetSessionInternalPush,)
+
+FieldWithLayerRequirement = tl.types.internal.FieldWithLayerRequirement
+FieldWithLayerRequirementInst = (tl.types.internal.FieldWithLayerRequirement,)
+
+ObjectWithLayerRequirement = tl.types.internal.ObjectWithLayerRequirement
+ObjectWithLayerRequirementInst = (tl.types.internal.ObjectWithLayerRequirement,)
+
+NeedsContextValues = tl.types.internal.NeedsContextValues
+NeedsContextValuesInst = (tl.types.internal.NeedsContextValues,)
+
+SessionMessage = tl.types.internal.SessionMessage
+SessionMessageInst = (tl.types.internal.SessionMessage,)
+
+SessionState = tl.types.internal.SessionState
+SessionStateInst = (tl.types.internal.SessionState,)
+
+FilePartToken = tl.types.internal.FilePartToken
+FilePartTokenInst = (tl.types.internal.FilePartToken,)
+
+TaggedVector = tl.types.internal.TaggedBoolVector | tl.types.internal.TaggedBytesVector | tl.types.internal.TaggedFloatVector | tl.types.internal.TaggedInt128Vector | tl.types.internal.TaggedInt256Vector | tl.types.internal.TaggedIntVector | tl.types.internal.TaggedLongVector | tl.types.internal.TaggedObjectVector | tl.types.internal.TaggedStringVector
+TaggedVectorInst = (tl.types.internal.TaggedBoolVector, tl.types.internal.TaggedBytesVector, tl.types.internal.TaggedFloatVector, tl.types.internal.TaggedInt128Vector, tl.types.internal.TaggedInt256Vector, tl.types.internal.TaggedIntVector, tl.types.internal.TaggedLongVector, tl.types.internal.TaggedObjectVector, tl.types.internal.TaggedStringVector,)
+
+TaggedValue = tl.types.internal.TaggedBool | tl.types.internal.TaggedBytes | tl.types.internal.TaggedFloat | tl.types.internal.TaggedInt | tl.types.internal.TaggedInt128 | tl.types.internal.TaggedInt256 | tl.types.internal.TaggedLong | tl.types.internal.TaggedObject | tl.types.internal.TaggedString | tl.types.internal.TaggedVector
+TaggedValueInst = (tl.types.internal.TaggedBool, tl.types.internal.TaggedBytes, tl.types.internal.TaggedFloat, tl.types.internal.TaggedInt, tl.types.internal.TaggedInt128, tl.types.internal.TaggedInt256, tl.types.internal.TaggedLong, tl.types.internal.TaggedObject, tl.types.internal.TaggedString, tl.types.internal.TaggedVector,)
+
+MessageToFormatContent = tl.types.internal.MessageToFormatContent | tl.types.internal.MessageToFormatServiceContent
+MessageToFormatContentInst = (tl.types.internal.MessageToFormatContent, tl.types.internal.MessageToFormatServiceContent,)
+
+MessageToFormatRef = tl.types.internal.MessageToFormatRef
+MessageToFormatRefInst = (tl.types.internal.MessageToFormatRef,)
+
+ChannelMessageToFormatCommon = tl.types.internal.ChannelMessageToFormatCommon
+ChannelMessageToFormatCommonInst = (tl.types.internal.ChannelMessageToFormatCommon,)
+
+StickerSetToFormat = tl.types.internal.StickerSetToFormatCommon
+StickerSetToFormatInst = (tl.types.internal.StickerSetToFormatCommon,)
+
+StickerSetToFormatForUser = tl.types.internal.StickerSetToFormatForUser
+StickerSetToFormatForUserInst = (tl.types.internal.StickerSetToFormatForUser,)
+
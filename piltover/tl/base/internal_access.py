@@ -0,0 +1,15 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+AccessHashPayload = tl.types.internal_access.AccessHashPayloadChannel | tl.types.internal_access.AccessHashPayloadEncryptedChat | tl.types.internal_access.AccessHashPayloadFile | tl.types.internal_access.AccessHashPayloadStickerset | tl.types.internal_access.AccessHashPayloadTheme | tl.types.internal_access.AccessHashPayloadUser | tl.types.internal_access.AccessHashPayloadWallpaper
+AccessHashPayloadInst = (tl.types.internal_access.AccessHashPayloadChannel, tl.types.internal_access.AccessHashPayloadEncryptedChat, tl.types.internal_access.AccessHashPayloadFile, tl.types.internal_access.AccessHashPayloadStickerset, tl.types.internal_access.AccessHashPayloadTheme, tl.types.internal_access.AccessHashPayloadUser, tl.types.internal_access.AccessHashPayloadWallpaper,)
+
+FileReferencePayload = tl.types.internal_access.FileReferencePayload
+FileReferencePayloadInst = (tl.types.internal_access.FileReferencePayload,)
+
@@ -0,0 +1,18 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+NestedObject = tl.types.internal_benchmarking.NestedObject
+NestedObjectInst = (tl.types.internal_benchmarking.NestedObject,)
+
+DeeplyNestedObject = tl.types.internal_benchmarking.DeeplyNestedObjectX1 | tl.types.internal_benchmarking.DeeplyNestedObjectX2 | tl.types.internal_benchmarking.DeeplyNestedObjectX3 | tl.types.internal_benchmarking.DeeplyNestedObjectX4 | tl.types.internal_benchmarking.DeeplyNestedObjectX5 | tl.types.internal_benchmarking.DeeplyNestedObjectX6 | tl.types.internal_benchmarking.DeeplyNestedObjectX7 | tl.types.internal_benchmarking.DeeplyNestedObjectX8
+DeeplyNestedObjectInst = (tl.types.internal_benchmarking.DeeplyNestedObjectX1, tl.types.internal_benchmarking.DeeplyNestedObjectX2, tl.types.internal_benchmarking.DeeplyNestedObjectX3, tl.types.internal_benchmarking.DeeplyNestedObjectX4, tl.types.internal_benchmarking.DeeplyNestedObjectX5, tl.types.internal_benchmarking.DeeplyNestedObjectX6, tl.types.internal_benchmarking.DeeplyNestedObjectX7, tl.types.internal_benchmarking.DeeplyNestedObjectX8,)
+
+ObjectToBenchmark = tl.types.internal_benchmarking.ObjectToBenchmark
+ObjectToBenchmarkInst = (tl.types.internal_benchmarking.ObjectToBenchmark,)
+
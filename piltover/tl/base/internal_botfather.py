@@ -0,0 +1,12 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+BotFatherState = tl.types.internal_botfather.BotfatherStateEditbot | tl.types.internal_botfather.BotfatherStateNewbot
+BotFatherStateInst = (tl.types.internal_botfather.BotfatherStateEditbot, tl.types.internal_botfather.BotfatherStateNewbot,)
+
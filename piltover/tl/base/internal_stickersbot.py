@@ -0,0 +1,18 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+NewpackInputSticker = tl.types.internal_stickersbot.NewpackInputSticker
+NewpackInputStickerInst = (tl.types.internal_stickersbot.NewpackInputSticker,)
+
+EmojiPackType = tl.types.internal_stickersbot.EmojiPackTypeAnimated | tl.types.internal_stickersbot.EmojiPackTypeStatic | tl.types.internal_stickersbot.EmojiPackTypeVideo
+EmojiPackTypeInst = (tl.types.internal_stickersbot.EmojiPackTypeAnimated, tl.types.internal_stickersbot.EmojiPackTypeStatic, tl.types.internal_stickersbot.EmojiPackTypeVideo,)
+
+StickersBotState = tl.types.internal_stickersbot.StickersStateAddemoji | tl.types.internal_stickersbot.StickersStateAddsticker | tl.types.internal_stickersbot.StickersStateDelpack | tl.types.internal_stickersbot.StickersStateEditsticker | tl.types.internal_stickersbot.StickersStateNewemojipack | tl.types.internal_stickersbot.StickersStateNewpack | tl.types.internal_stickersbot.StickersStateRenamepack | tl.types.internal_stickersbot.StickersStateReplacesticker
+StickersBotStateInst = (tl.types.internal_stickersbot.StickersStateAddemoji, tl.types.internal_stickersbot.StickersStateAddsticker, tl.types.internal_stickersbot.StickersStateDelpack, tl.types.internal_stickersbot.StickersStateEditsticker, tl.types.internal_stickersbot.StickersStateNewemojipack, tl.types.internal_stickersbot.StickersStateNewpack, tl.types.internal_stickersbot.StickersStateRenamepack, tl.types.internal_stickersbot.StickersStateReplacesticker,)
+
@@ -0,0 +1,189 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+Dialogs = tl.types.messages.Dialogs | tl.types.messages.DialogsNotModified | tl.types.messages.DialogsSlice
+DialogsInst = (tl.types.messages.Dialogs, tl.types.messages.DialogsNotModified, tl.types.messages.DialogsSlice,)
+
+Messages = tl.types.messages.ChannelMessages | tl.types.messages.ChannelMessages_133 | tl.types.messages.Messages | tl.types.messages.MessagesNotModified | tl.types.messages.MessagesSlice
+MessagesInst = (tl.types.messages.ChannelMessages, tl.types.messages.ChannelMessages_133, tl.types.messages.Messages, tl.types.messages.MessagesNotModified, tl.types.messages.MessagesSlice,)
+
+Chats = tl.types.messages.Chats | tl.types.messages.ChatsSlice
+ChatsInst = (tl.types.messages.Chats, tl.types.messages.ChatsSlice,)
+
+ChatFull = tl.types.messages.ChatFull
+ChatFullInst = (tl.types.messages.ChatFull,)
+
+AffectedHistory = tl.types.messages.AffectedHistory
+AffectedHistoryInst = (tl.types.messages.AffectedHistory,)
+
+DhConfig = tl.types.messages.DhConfig | tl.types.messages.DhConfigNotModified
+DhConfigInst = (tl.types.messages.DhConfig, tl.types.messages.DhConfigNotModified,)
+
+SentEncryptedMessage = tl.types.messages.SentEncryptedFile | tl.types.messages.SentEncryptedMessage
+SentEncryptedMessageInst = (tl.types.messages.SentEncryptedFile, tl.types.messages.SentEncryptedMessage,)
+
+Stickers = tl.types.messages.Stickers | tl.types.messages.StickersNotModified
+StickersInst = (tl.types.messages.Stickers, tl.types.messages.StickersNotModified,)
+
+AllStickers = tl.types.messages.AllStickers | tl.types.messages.AllStickersNotModified
+AllStickersInst = (tl.types.messages.AllStickers, tl.types.messages.AllStickersNotModified,)
+
+AffectedMessages = tl.types.messages.AffectedMessages
+AffectedMessagesInst = (tl.types.messages.AffectedMessages,)
+
+StickerSet = tl.types.messages.StickerSet | tl.types.messages.StickerSetNotModified | tl.types.messages.StickerSet_133
+StickerSetInst = (tl.types.messages.StickerSet, tl.types.messages.StickerSetNotModified, tl.types.messages.StickerSet_133,)
+
+SavedGifs = tl.types.messages.SavedGifs | tl.types.messages.SavedGifsNotModified
+SavedGifsInst = (tl.types.messages.SavedGifs, tl.types.messages.SavedGifsNotModified,)
+
+BotResults = tl.types.messages.BotResults | tl.types.messages.BotResults_133
+BotResultsInst = (tl.types.messages.BotResults, tl.types.messages.BotResults_133,)
+
+BotCallbackAnswer = tl.types.messages.BotCallbackAnswer
+BotCallbackAnswerInst = (tl.types.messages.BotCallbackAnswer,)
+
+MessageEditData = tl.types.messages.MessageEditData
+MessageEditDataInst = (tl.types.messages.MessageEditData,)
+
+PeerDialogs = tl.types.messages.PeerDialogs
+PeerDialogsInst = (tl.types.messages.PeerDialogs,)
+
+FeaturedStickers = tl.types.messages.FeaturedStickers | tl.types.messages.FeaturedStickersNotModified | tl.types.messages.FeaturedStickers_133
+FeaturedStickersInst = (tl.types.messages.FeaturedStickers, tl.types.messages.FeaturedStickersNotModified, tl.types.messages.FeaturedStickers_133,)
+
+RecentStickers = tl.types.messages.RecentStickers | tl.types.messages.RecentStickersNotModified
+RecentStickersInst = (tl.types.messages.RecentStickers, tl.types.messages.RecentStickersNotModified,)
+
+ArchivedStickers = tl.types.messages.ArchivedStickers
+ArchivedStickersInst = (tl.types.messages.ArchivedStickers,)
+
+StickerSetInstallResult = tl.types.messages.StickerSetInstallResultArchive | tl.types.messages.StickerSetInstallResultSuccess
+StickerSetInstallResultInst = (tl.types.messages.StickerSetInstallResultArchive, tl.types.messages.StickerSetInstallResultSuccess,)
+
+HighScores = tl.types.messages.HighScores
+HighScoresInst = (tl.types.messages.HighScores,)
+
+FavedStickers = tl.types.messages.FavedStickers | tl.types.messages.FavedStickersNotModified
+FavedStickersInst = (tl.types.messages.FavedStickers, tl.types.messages.FavedStickersNotModified,)
+
+FoundStickerSets = tl.types.messages.FoundStickerSets | tl.types.messages.FoundStickerSetsNotModified
+FoundStickerSetsInst = (tl.types.messages.FoundStickerSets, tl.types.messages.FoundStickerSetsNotModified,)
+
+SearchCounter = tl.types.messages.SearchCounter
+SearchCounterInst = (tl.types.messages.SearchCounter,)
+
+InactiveChats = tl.types.messages.InactiveChats
+InactiveChatsInst = (tl.types.messages.InactiveChats,)
+
+VotesList = tl.types.messages.VotesList | tl.types.messages.VotesList_133
+VotesListInst = (tl.types.messages.VotesList, tl.types.messages.VotesList_133,)
+
+MessageViews = tl.types.messages.MessageViews
+MessageViewsInst = (tl.types.messages.MessageViews,)
+
+DiscussionMessage = tl.types.messages.DiscussionMessage
+DiscussionMessageInst = (tl.types.messages.DiscussionMessage,)
+
+HistoryImport = tl.types.messages.HistoryImport
+HistoryImportInst = (tl.types.messages.HistoryImport,)
+
+HistoryImportParsed = tl.types.messages.HistoryImportParsed
+HistoryImportParsedInst = (tl.types.messages.HistoryImportParsed,)
+
+AffectedFoundMessages = tl.types.messages.AffectedFoundMessages
+AffectedFoundMessagesInst = (tl.types.messages.AffectedFoundMessages,)
+
+ExportedChatInvites = tl.types.messages.ExportedChatInvites
+ExportedChatInvitesInst = (tl.types.messages.ExportedChatInvites,)
+
+ExportedChatInvite = tl.types.messages.ExportedChatInvite | tl.types.messages.ExportedChatInviteReplaced
+ExportedChatInviteInst = (tl.types.messages.ExportedChatInvite, tl.types.messages.ExportedChatInviteReplaced,)
+
+ChatInviteImporters = tl.types.messages.ChatInviteImporters
+ChatInviteImportersInst = (tl.types.messages.ChatInviteImporters,)
+
+ChatAdminsWithInvites = tl.types.messages.ChatAdminsWithInvites
+ChatAdminsWithInvitesInst = (tl.types.messages.ChatAdminsWithInvites,)
+
+CheckedHistoryImportPeer = tl.types.messages.CheckedHistoryImportPeer
+CheckedHistoryImportPeerInst = (tl.types.messages.CheckedHistoryImportPeer,)
+
+SponsoredMessages = tl.types.messages.SponsoredMessages | tl.types.messages.SponsoredMessagesEmpty | tl.types.messages.SponsoredMessages_133
+SponsoredMessagesInst = (tl.types.messages.SponsoredMessages, tl.types.messages.SponsoredMessagesEmpty, tl.types.messages.SponsoredMessages_133,)
+
+SearchResultsCalendar = tl.types.messages.SearchResultsCalendar
+SearchResultsCalendarInst = (tl.types.messages.SearchResultsCalendar,)
+
+SearchResultsPositions = tl.types.messages.SearchResultsPositions
+SearchResultsPositionsInst = (tl.types.messages.SearchResultsPositions,)
+
+PeerSettings = tl.types.messages.PeerSettings
+PeerSettingsInst = (tl.types.messages.PeerSettings,)
+
+MessageReactionsList = tl.types.messages.MessageReactionsList | tl.types.messages.MessageReactionsList_136
+MessageReactionsListInst = (tl.types.messages.MessageReactionsList, tl.types.messages.MessageReactionsList_136,)
+
+AvailableReactions = tl.types.messages.AvailableReactions | tl.types.messages.AvailableReactionsNotModified
+AvailableReactionsInst = (tl.types.messages.AvailableReactions, tl.types.messages.AvailableReactionsNotModified,)
+
+TranscribedAudio = tl.types.messages.TranscribedAudio | tl.types.messages.TranscribedAudio_143
+TranscribedAudioInst = (tl.types.messages.TranscribedAudio, tl.types.messages.TranscribedAudio_143,)
+
+Reactions = tl.types.messages.Reactions | tl.types.messages.ReactionsNotModified
+ReactionsInst = (tl.types.messages.Reactions, tl.types.messages.ReactionsNotModified,)
+
+ForumTopics = tl.types.messages.ForumTopics
+ForumTopicsInst = (tl.types.messages.ForumTopics,)
+
+EmojiGroups = tl.types.messages.EmojiGroups | tl.types.messages.EmojiGroupsNotModified
+EmojiGroupsInst = (tl.types.messages.EmojiGroups, tl.types.messages.EmojiGroupsNotModified,)
+
+TranslatedText = tl.types.messages.TranslateNoResult_137 | tl.types.messages.TranslateResult | tl.types.messages.TranslateResultText_137
+TranslatedTextInst = (tl.types.messages.TranslateNoResult_137, tl.types.messages.TranslateResult, tl.types.messages.TranslateResultText_137,)
+
+BotApp = tl.types.messages.BotApp
+BotAppInst = (tl.types.messages.BotApp,)
+
+WebPage = tl.types.messages.WebPage
+WebPageInst = (tl.types.messages.WebPage,)
+
+SavedDialogs = tl.types.messages.SavedDialogs | tl.types.messages.SavedDialogsNotModified | tl.types.messages.SavedDialogsSlice
+SavedDialogsInst = (tl.types.messages.SavedDialogs, tl.types.messages.SavedDialogsNotModified, tl.types.messages.SavedDialogsSlice,)
+
+SavedReactionTags = tl.types.messages.SavedReactionTags | tl.types.messages.SavedReactionTagsNotModified
+SavedReactionTagsInst = (tl.types.messages.SavedReactionTags, tl.types.messages.SavedReactionTagsNotModified,)
+
+QuickReplies = tl.types.messages.QuickReplies | tl.types.messages.QuickRepliesNotModified
+QuickRepliesInst = (tl.types.messages.QuickReplies, tl.types.messages.QuickRepliesNotModified,)
+
+DialogFilters = tl.types.messages.DialogFilters
+DialogFiltersInst = (tl.types.messages.DialogFilters,)
+
+MyStickers = tl.types.messages.MyStickers
+MyStickersInst = (tl.types.messages.MyStickers,)
+
+InvitedUsers = tl.types.messages.InvitedUsers
+InvitedUsersInst = (tl.types.messages.InvitedUsers,)
+
+AvailableEffects = tl.types.messages.AvailableEffects | tl.types.messages.AvailableEffectsNotModified
+AvailableEffectsInst = (tl.types.messages.AvailableEffects, tl.types.messages.AvailableEffectsNotModified,)
+
+BotPreparedInlineMessage = tl.types.messages.BotPreparedInlineMessage
+BotPreparedInlineMessageInst = (tl.types.messages.BotPreparedInlineMessage,)
+
+PreparedInlineMessage = tl.types.messages.PreparedInlineMessage
+PreparedInlineMessageInst = (tl.types.messages.PreparedInlineMessage,)
+
+FoundStickers = tl.types.messages.FoundStickers | tl.types.messages.FoundStickersNotModified
+FoundStickersInst = (tl.types.messages.FoundStickers, tl.types.messages.FoundStickersNotModified,)
+
+WebPagePreview = tl.types.messages.WebPagePreview
+WebPagePreviewInst = (tl.types.messages.WebPagePreview,)
+
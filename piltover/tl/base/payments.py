@@ -0,0 +1,72 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+PaymentForm = tl.types.payments.PaymentForm | tl.types.payments.PaymentFormStarGift | tl.types.payments.PaymentFormStars | tl.types.payments.PaymentForm_133 | tl.types.payments.PaymentForm_143
+PaymentFormInst = (tl.types.payments.PaymentForm, tl.types.payments.PaymentFormStarGift, tl.types.payments.PaymentFormStars, tl.types.payments.PaymentForm_133, tl.types.payments.PaymentForm_143,)
+
+ValidatedRequestedInfo = tl.types.payments.ValidatedRequestedInfo
+ValidatedRequestedInfoInst = (tl.types.payments.ValidatedRequestedInfo,)
+
+PaymentResult = tl.types.payments.PaymentResult | tl.types.payments.PaymentVerificationNeeded
+PaymentResultInst = (tl.types.payments.PaymentResult, tl.types.payments.PaymentVerificationNeeded,)
+
+PaymentReceipt = tl.types.payments.PaymentReceipt | tl.types.payments.PaymentReceiptStars
+PaymentReceiptInst = (tl.types.payments.PaymentReceipt, tl.types.payments.PaymentReceiptStars,)
+
+SavedInfo = tl.types.payments.SavedInfo
+SavedInfoInst = (tl.types.payments.SavedInfo,)
+
+BankCardData = tl.types.payments.BankCardData
+BankCardDataInst = (tl.types.payments.BankCardData,)
+
+ExportedInvoice = tl.types.payments.ExportedInvoice
+ExportedInvoiceInst = (tl.types.payments.ExportedInvoice,)
+
+CheckedGiftCode = tl.types.payments.CheckedGiftCode | tl.types.payments.CheckedGiftCode_166
+CheckedGiftCodeInst = (tl.types.payments.CheckedGiftCode, tl.types.payments.CheckedGiftCode_166,)
+
+GiveawayInfo = tl.types.payments.GiveawayInfo | tl.types.payments.GiveawayInfoResults | tl.types.payments.GiveawayInfoResults_166
+GiveawayInfoInst = (tl.types.payments.GiveawayInfo, tl.types.payments.GiveawayInfoResults, tl.types.payments.GiveawayInfoResults_166,)
+
+StarsStatus = tl.types.payments.StarsStatus | tl.types.payments.StarsStatus_181 | tl.types.payments.StarsStatus_186
+StarsStatusInst = (tl.types.payments.StarsStatus, tl.types.payments.StarsStatus_181, tl.types.payments.StarsStatus_186,)
+
+StarsRevenueStats = tl.types.payments.StarsRevenueStats
+StarsRevenueStatsInst = (tl.types.payments.StarsRevenueStats,)
+
+StarsRevenueWithdrawalUrl = tl.types.payments.StarsRevenueWithdrawalUrl
+StarsRevenueWithdrawalUrlInst = (tl.types.payments.StarsRevenueWithdrawalUrl,)
+
+StarsRevenueAdsAccountUrl = tl.types.payments.StarsRevenueAdsAccountUrl
+StarsRevenueAdsAccountUrlInst = (tl.types.payments.StarsRevenueAdsAccountUrl,)
+
+StarGifts = tl.types.payments.StarGifts | tl.types.payments.StarGiftsNotModified
+StarGiftsInst = (tl.types.payments.StarGifts, tl.types.payments.StarGiftsNotModified,)
+
+ConnectedStarRefBots = tl.types.payments.ConnectedStarRefBots
+ConnectedStarRefBotsInst = (tl.types.payments.ConnectedStarRefBots,)
+
+SuggestedStarRefBots = tl.types.payments.SuggestedStarRefBots
+SuggestedStarRefBotsInst = (tl.types.payments.SuggestedStarRefBots,)
+
+StarGiftUpgradePreview = tl.types.payments.StarGiftUpgradePreview
+StarGiftUpgradePreviewInst = (tl.types.payments.StarGiftUpgradePreview,)
+
+UniqueStarGift = tl.types.payments.UniqueStarGift
+UniqueStarGiftInst = (tl.types.payments.UniqueStarGift,)
+
+SavedStarGifts = tl.types.payments.SavedStarGifts
+SavedStarGiftsInst = (tl.types.payments.SavedStarGifts,)
+
+StarGiftWithdrawalUrl = tl.types.payments.StarGiftWithdrawalUrl
+StarGiftWithdrawalUrlInst = (tl.types.payments.StarGiftWithdrawalUrl,)
+
+UserStarGifts = tl.types.payments.UserStarGifts_189
+UserStarGiftsInst = (tl.types.payments.UserStarGifts_189,)
+
@@ -0,0 +1,30 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+PhoneCall = tl.types.phone.PhoneCall
+PhoneCallInst = (tl.types.phone.PhoneCall,)
+
+GroupCall = tl.types.phone.GroupCall
+GroupCallInst = (tl.types.phone.GroupCall,)
+
+GroupParticipants = tl.types.phone.GroupParticipants
+GroupParticipantsInst = (tl.types.phone.GroupParticipants,)
+
+JoinAsPeers = tl.types.phone.JoinAsPeers
+JoinAsPeersInst = (tl.types.phone.JoinAsPeers,)
+
+ExportedGroupCallInvite = tl.types.phone.ExportedGroupCallInvite
+ExportedGroupCallInviteInst = (tl.types.phone.ExportedGroupCallInvite,)
+
+GroupCallStreamChannels = tl.types.phone.GroupCallStreamChannels
+GroupCallStreamChannelsInst = (tl.types.phone.GroupCallStreamChannels,)
+
+GroupCallStreamRtmpUrl = tl.types.phone.GroupCallStreamRtmpUrl
+GroupCallStreamRtmpUrlInst = (tl.types.phone.GroupCallStreamRtmpUrl,)
+
@@ -0,0 +1,15 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+Photos = tl.types.photos.Photos | tl.types.photos.PhotosSlice
+PhotosInst = (tl.types.photos.Photos, tl.types.photos.PhotosSlice,)
+
+Photo = tl.types.photos.Photo
+PhotoInst = (tl.types.photos.Photo,)
+
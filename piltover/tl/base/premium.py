@@ -0,0 +1,18 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+BoostsList = tl.types.premium.BoostsList
+BoostsListInst = (tl.types.premium.BoostsList,)
+
+MyBoosts = tl.types.premium.MyBoosts
+MyBoostsInst = (tl.types.premium.MyBoosts,)
+
+BoostsStatus = tl.types.premium.BoostsStatus
+BoostsStatusInst = (tl.types.premium.BoostsStatus,)
+
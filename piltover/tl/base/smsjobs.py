@@ -0,0 +1,15 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+EligibilityToJoin = tl.types.smsjobs.EligibleToJoin
+EligibilityToJoinInst = (tl.types.smsjobs.EligibleToJoin,)
+
+Status = tl.types.smsjobs.Status
+StatusInst = (tl.types.smsjobs.Status,)
+
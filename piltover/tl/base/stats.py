@@ -0,0 +1,33 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+BroadcastStats = tl.types.stats.BroadcastStats | tl.types.stats.BroadcastStats_133
+BroadcastStatsInst = (tl.types.stats.BroadcastStats, tl.types.stats.BroadcastStats_133,)
+
+MegagroupStats = tl.types.stats.MegagroupStats
+MegagroupStatsInst = (tl.types.stats.MegagroupStats,)
+
+MessageStats = tl.types.stats.MessageStats | tl.types.stats.MessageStats_133
+MessageStatsInst = (tl.types.stats.MessageStats, tl.types.stats.MessageStats_133,)
+
+StoryStats = tl.types.stats.StoryStats
+StoryStatsInst = (tl.types.stats.StoryStats,)
+
+PublicForwards = tl.types.stats.PublicForwards
+PublicForwardsInst = (tl.types.stats.PublicForwards,)
+
+BroadcastRevenueStats = tl.types.stats.BroadcastRevenueStats | tl.types.stats.BroadcastRevenueStats_177
+BroadcastRevenueStatsInst = (tl.types.stats.BroadcastRevenueStats, tl.types.stats.BroadcastRevenueStats_177,)
+
+BroadcastRevenueWithdrawalUrl = tl.types.stats.BroadcastRevenueWithdrawalUrl
+BroadcastRevenueWithdrawalUrlInst = (tl.types.stats.BroadcastRevenueWithdrawalUrl,)
+
+BroadcastRevenueTransactions = tl.types.stats.BroadcastRevenueTransactions
+BroadcastRevenueTransactionsInst = (tl.types.stats.BroadcastRevenueTransactions,)
+
@@ -0,0 +1,12 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+SuggestedShortName = tl.types.stickers.SuggestedShortName
+SuggestedShortNameInst = (tl.types.stickers.SuggestedShortName,)
+
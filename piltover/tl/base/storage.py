@@ -0,0 +1,12 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+FileType = tl.types.storage.FileGif | tl.types.storage.FileJpeg | tl.types.storage.FileMov | tl.types.storage.FileMp3 | tl.types.storage.FileMp4 | tl.types.storage.FilePartial | tl.types.storage.FilePdf | tl.types.storage.FilePng | tl.types.storage.FileUnknown | tl.types.storage.FileWebp
+FileTypeInst = (tl.types.storage.FileGif, tl.types.storage.FileJpeg, tl.types.storage.FileMov, tl.types.storage.FileMp3, tl.types.storage.FileMp4, tl.types.storage.FilePartial, tl.types.storage.FilePdf, tl.types.storage.FilePng, tl.types.storage.FileUnknown, tl.types.storage.FileWebp,)
+
@@ -0,0 +1,42 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+AllStories = tl.types.stories.AllStories | tl.types.stories.AllStoriesNotModified | tl.types.stories.AllStoriesNotModified_160 | tl.types.stories.AllStories_160 | tl.types.stories.AllStories_161
+AllStoriesInst = (tl.types.stories.AllStories, tl.types.stories.AllStoriesNotModified, tl.types.stories.AllStoriesNotModified_160, tl.types.stories.AllStories_160, tl.types.stories.AllStories_161,)
+
+Stories = tl.types.stories.Stories | tl.types.stories.Stories_160 | tl.types.stories.Stories_164
+StoriesInst = (tl.types.stories.Stories, tl.types.stories.Stories_160, tl.types.stories.Stories_164,)
+
+StoryViewsList = tl.types.stories.StoryViewsList | tl.types.stories.StoryViewsList_160 | tl.types.stories.StoryViewsList_161
+StoryViewsListInst = (tl.types.stories.StoryViewsList, tl.types.stories.StoryViewsList_160, tl.types.stories.StoryViewsList_161,)
+
+StoryViews = tl.types.stories.StoryViews
+StoryViewsInst = (tl.types.stories.StoryViews,)
+
+PeerStories = tl.types.stories.PeerStories
+PeerStoriesInst = (tl.types.stories.PeerStories,)
+
+StoryReactionsList = tl.types.stories.StoryReactionsList
+StoryReactionsListInst = (tl.types.stories.StoryReactionsList,)
+
+FoundStories = tl.types.stories.FoundStories
+FoundStoriesInst = (tl.types.stories.FoundStories,)
+
+UserStories = tl.types.stories.UserStories_160
+UserStoriesInst = (tl.types.stories.UserStories_160,)
+
+BoostsStatus = tl.types.stories.BoostsStatus_164 | tl.types.stories.BoostsStatus_165
+BoostsStatusInst = (tl.types.stories.BoostsStatus_164, tl.types.stories.BoostsStatus_165,)
+
+CanApplyBoostResult = tl.types.stories.CanApplyBoostOk_164 | tl.types.stories.CanApplyBoostReplace_164
+CanApplyBoostResultInst = (tl.types.stories.CanApplyBoostOk_164, tl.types.stories.CanApplyBoostReplace_164,)
+
+BoostersList = tl.types.stories.BoostersList_164
+BoostersListInst = (tl.types.stories.BoostersList_164,)
+
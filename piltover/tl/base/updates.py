@@ -0,0 +1,18 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+State = tl.types.updates.State
+StateInst = (tl.types.updates.State,)
+
+Difference = tl.types.updates.Difference | tl.types.updates.DifferenceEmpty | tl.types.updates.DifferenceSlice | tl.types.updates.DifferenceTooLong
+DifferenceInst = (tl.types.updates.Difference, tl.types.updates.DifferenceEmpty, tl.types.updates.DifferenceSlice, tl.types.updates.DifferenceTooLong,)
+
+ChannelDifference = tl.types.updates.ChannelDifference | tl.types.updates.ChannelDifferenceEmpty | tl.types.updates.ChannelDifferenceTooLong
+ChannelDifferenceInst = (tl.types.updates.ChannelDifference, tl.types.updates.ChannelDifferenceEmpty, tl.types.updates.ChannelDifferenceTooLong,)
+
@@ -0,0 +1,18 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+File = tl.types.upload.File | tl.types.upload.FileCdnRedirect
+FileInst = (tl.types.upload.File, tl.types.upload.FileCdnRedirect,)
+
+WebFile = tl.types.upload.WebFile
+WebFileInst = (tl.types.upload.WebFile,)
+
+CdnFile = tl.types.upload.CdnFile | tl.types.upload.CdnFileReuploadNeeded
+CdnFileInst = (tl.types.upload.CdnFile, tl.types.upload.CdnFileReuploadNeeded,)
+
@@ -0,0 +1,15 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover import tl
+
+
+UserFull = tl.types.users.UserFull
+UserFullInst = (tl.types.users.UserFull,)
+
+Users = tl.types.users.Users | tl.types.users.UsersSlice
+UsersInst = (tl.types.users.Users, tl.types.users.UsersSlice,)
+
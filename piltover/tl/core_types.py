@@ -37,16 +37,38 @@ class Message(TLObject, Generic[T]):
 
         return Message(message_id=msg_id, seq_no=seq_no, obj=body)
 
-    def serialize(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
-        body = self.obj.write(ctx)
-        return Long.write(self.message_id) + Int.write(self.seq_no) + Int.write(len(body)) + body
+    @classmethod
+    def deserialize_from(cls, view: memoryview, pos: int) -> tuple[Message, int]:
+        msg_id, pos = Long.read_from(view, pos)
+        seq_no, pos = Int.read_from(view, pos)
+        length, pos = Int.read_from(view, pos)
+        if length < 0 or pos + length > len(view):
+            raise ValueError(f"Buffer is too short to read message body of {length} bytes at position {pos}")
+        # Body is read from a slice of the same buffer instead of a copy of it
+        body, _ = TLObject.read_from(view[pos:pos + length], 0)
+
+        return Message(message_id=msg_id, seq_no=seq_no, obj=body), pos + length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.message_id)
+        out += Int.write(self.seq_no)
+
+        # Body length is not known until body is written
+        length_pos = len(out)
+        out += b"\x00\x00\x00\x00"
+        self.obj.write_to(out, ctx)
+        out[length_pos:length_pos + 4] = Int.write(len(out) - length_pos - 4)
 
     @classmethod
     def read(cls, stream: BytesIO, strict_type: bool = False) -> TLObject:
         return Message.deserialize(stream)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
-        return self.serialize(ctx)
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int = 0, strict_type: bool = False) -> tuple[TLObject, int]:
+        return Message.deserialize_from(view, pos)
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.serialize_to(out, ctx)
 
 
 class MsgContainer(TLObject):
@@ -68,11 +90,36 @@ class MsgContainer(TLObject):
 
         return MsgContainer(messages=result)
 
-    def serialize(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
-        result = Int.write(len(self.messages))
+    @classmethod
+    def deserialize_from(cls, view: memoryview, pos: int) -> tuple[TLObject, int]:
+        count, pos = Int.read_from(view, pos)
+        result = []
+
+        for _ in range(count):
+            message, pos = Message.deserialize_from(view, pos)
+            result.append(message)
+
+        return MsgContainer(messages=result), pos
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(len(self.messages))
         for message in self.messages:
-            result += message.serialize(ctx)
-        return result
+            message.serialize_to(out, ctx)
+
+
+class SerializedObject:
+    """
+    Already serialized object, written to the output buffer as is.
+    It is not a TL object (it can't be read back), only RpcResult accepts it as a result.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"SerializedObject(<{len(self.data)} bytes>)"
 
 
 class RpcResult(TLObject):
@@ -81,7 +128,7 @@ class RpcResult(TLObject):
 
     __slots__ = ("req_msg_id", "result",)
 
-    def __init__(self, req_msg_id: int, result: TLObject):
+    def __init__(self, req_msg_id: int, result: TLObject | SerializedObject):
         self.req_msg_id = req_msg_id
         self.result = result
 
@@ -92,8 +139,21 @@ class RpcResult(TLObject):
 
         return RpcResult(req_msg_id=req_msg_id, result=result)
 
-    def serialize(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
-        return Long.write(self.req_msg_id) + SerializationUtils.write(self.result, ctx)
+    @classmethod
+    def deserialize_from(cls, view: memoryview, pos: int) -> tuple[TLObject, int]:
+        req_msg_id, pos = Long.read_from(view, pos)
+        result, pos = TLObject.read_from(view, pos)
+
+        return RpcResult(req_msg_id=req_msg_id, result=result), pos
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.req_msg_id)
+        if isinstance(self.result, TLObject):
+            self.result.write_to(out, ctx)
+        elif isinstance(self.result, SerializedObject):
+            out += self.result.data
+        else:
+            out += SerializationUtils.write(self.result, ctx)
 
     def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
         if isinstance(self.result, Iterable):
@@ -121,6 +181,13 @@ class GzipPacked(TLObject):
 
         return TLObject.read(decompressed_stream)
 
+    @classmethod
+    def deserialize_from(cls, view: memoryview, pos: int) -> tuple[TLObject, int]:
+        packed_data, pos = Bytes.read_from(view, pos)
+        obj, _ = TLObject.read_from(memoryview(decompress(packed_data)), 0)
+
+        return obj, pos
+
     def serialize(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
         return Bytes.write(self.packed_data)
 
@@ -151,12 +218,26 @@ class FutureSalts(TLObject):
 
         return FutureSalts(req_msg_id=req_msg_id, now=now, salts=salts)
 
-    def serialize(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
-        result = Long.write(self.req_msg_id)
-        result += Int.write(self.now)
-        result += Int.write(len(self.salts))
+    @classmethod
+    def deserialize_from(cls, view: memoryview, pos: int) -> tuple[TLObject, int]:
+        from .types import FutureSalt
 
-        for salt in self.salts:
-            result += salt.serialize(ctx)
+        req_msg_id, pos = Long.read_from(view, pos)
+        now, pos = Int.read_from(view, pos)
+
+        count, pos = Int.read_from(view, pos)
+        salts = []
+
+        for _ in range(count):
+            salt, pos = FutureSalt.deserialize_from(view, pos)
+            salts.append(salt)
+
+        return FutureSalts(req_msg_id=req_msg_id, now=now, salts=salts), pos
 
-        return result
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.req_msg_id)
+        out += Int.write(self.now)
+        out += Int.write(len(self.salts))
+
+        for salt in self.salts:
+            salt.serialize_to(out, ctx)
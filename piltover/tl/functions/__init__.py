@@ -0,0 +1,56 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover.tl.lazy_import import lazy_getattr
+
+LAZY_INDEX = {
+    "internal": ("internal", None),
+    "auth": ("auth", None),
+    "account": ("account", None),
+    "users": ("users", None),
+    "contacts": ("contacts", None),
+    "messages": ("messages", None),
+    "updates": ("updates", None),
+    "photos": ("photos", None),
+    "upload": ("upload", None),
+    "help": ("help", None),
+    "channels": ("channels", None),
+    "bots": ("bots", None),
+    "payments": ("payments", None),
+    "stickers": ("stickers", None),
+    "phone": ("phone", None),
+    "langpack": ("langpack", None),
+    "folders": ("folders", None),
+    "stats": ("stats", None),
+    "chatlists": ("chatlists", None),
+    "stories": ("stories", None),
+    "premium": ("premium", None),
+    "smsjobs": ("smsjobs", None),
+    "fragment": ("fragment", None),
+    "ReqPq": ("_root", "ReqPq"),
+    "ReqPqMulti": ("_root", "ReqPqMulti"),
+    "ReqDHParams": ("_root", "ReqDHParams"),
+    "SetClientDHParams": ("_root", "SetClientDHParams"),
+    "DestroyAuthKey": ("_root", "DestroyAuthKey"),
+    "RpcDropAnswer": ("_root", "RpcDropAnswer"),
+    "GetFutureSalts": ("_root", "GetFutureSalts"),
+    "Ping": ("_root", "Ping"),
+    "PingDelayDisconnect": ("_root", "PingDelayDisconnect"),
+    "DestroySession": ("_root", "DestroySession"),
+    "InvokeAfterMsg": ("_root", "InvokeAfterMsg"),
+    "InvokeAfterMsgs": ("_root", "InvokeAfterMsgs"),
+    "InitConnection": ("_root", "InitConnection"),
+    "InvokeWithLayer": ("_root", "InvokeWithLayer"),
+    "InvokeWithoutUpdates": ("_root", "InvokeWithoutUpdates"),
+    "InvokeWithMessagesRange": ("_root", "InvokeWithMessagesRange"),
+    "InvokeWithTakeout": ("_root", "InvokeWithTakeout"),
+    "InvokeWithBusinessConnection": ("_root", "InvokeWithBusinessConnection"),
+    "InvokeWithGooglePlayIntegrity": ("_root", "InvokeWithGooglePlayIntegrity"),
+    "InvokeWithApnsSecret": ("_root", "InvokeWithApnsSecret"),
+    "InvokeWithReCaptcha": ("_root", "InvokeWithReCaptcha"),
+}
+
+__getattr__ = lazy_getattr(__name__, globals(), LAZY_INDEX)
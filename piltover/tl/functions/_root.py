@@ -0,0 +1,629 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class ReqPq(TLRequest[tl.types.ResPQ]):
+    __tl_id__ = 0x60469778
+    __tl_name__ = "functions.ReqPq"
+    __tl_layer__ = 201
+
+    __slots__ = ("nonce", )
+
+    def __init__(self, *, nonce: int):
+        self.nonce = nonce
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int128.write(self.nonce)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReqPq:
+        nonce = Int128.read(stream)
+        return cls(nonce=nonce)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReqPq, int]:
+        nonce, cursor = Int128.read_from(view, cursor)
+        return cls(nonce=nonce), cursor
+
+
+class ReqPqMulti(TLRequest[tl.types.ResPQ]):
+    __tl_id__ = 0xbe7e8ef1
+    __tl_name__ = "functions.ReqPqMulti"
+    __tl_layer__ = 201
+
+    __slots__ = ("nonce", )
+
+    def __init__(self, *, nonce: int):
+        self.nonce = nonce
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int128.write(self.nonce)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReqPqMulti:
+        nonce = Int128.read(stream)
+        return cls(nonce=nonce)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReqPqMulti, int]:
+        nonce, cursor = Int128.read_from(view, cursor)
+        return cls(nonce=nonce), cursor
+
+
+class ReqDHParams(TLRequest[tl.base.ServerDHParams]):
+    __tl_id__ = 0xd712e4be
+    __tl_name__ = "functions.ReqDHParams"
+    __tl_layer__ = 201
+
+    __slots__ = ("nonce", "server_nonce", "p", "q", "public_key_fingerprint", "encrypted_data", )
+
+    def __init__(self, *, nonce: int, server_nonce: int, p: bytes, q: bytes, public_key_fingerprint: int, encrypted_data: bytes):
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.p = p
+        self.q = q
+        self.public_key_fingerprint = public_key_fingerprint
+        self.encrypted_data = encrypted_data
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int128.write(self.nonce)
+        out += Int128.write(self.server_nonce)
+        Bytes.write_to(out, self.p)
+        Bytes.write_to(out, self.q)
+        out += Long.write(self.public_key_fingerprint)
+        Bytes.write_to(out, self.encrypted_data)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReqDHParams:
+        nonce = Int128.read(stream)
+        server_nonce = Int128.read(stream)
+        p = Bytes.read(stream)
+        q = Bytes.read(stream)
+        public_key_fingerprint = Long.read(stream)
+        encrypted_data = Bytes.read(stream)
+        return cls(nonce=nonce, server_nonce=server_nonce, p=p, q=q, public_key_fingerprint=public_key_fingerprint, encrypted_data=encrypted_data)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReqDHParams, int]:
+        nonce, cursor = Int128.read_from(view, cursor)
+        server_nonce, cursor = Int128.read_from(view, cursor)
+        p, cursor = Bytes.read_from(view, cursor)
+        q, cursor = Bytes.read_from(view, cursor)
+        public_key_fingerprint, cursor = Long.read_from(view, cursor)
+        encrypted_data, cursor = Bytes.read_from(view, cursor)
+        return cls(nonce=nonce, server_nonce=server_nonce, p=p, q=q, public_key_fingerprint=public_key_fingerprint, encrypted_data=encrypted_data), cursor
+
+
+class SetClientDHParams(TLRequest[tl.base.SetClientDHParamsAnswer]):
+    __tl_id__ = 0xf5045f1f
+    __tl_name__ = "functions.SetClientDHParams"
+    __tl_layer__ = 201
+
+    __slots__ = ("nonce", "server_nonce", "encrypted_data", )
+
+    def __init__(self, *, nonce: int, server_nonce: int, encrypted_data: bytes):
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.encrypted_data = encrypted_data
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int128.write(self.nonce)
+        out += Int128.write(self.server_nonce)
+        Bytes.write_to(out, self.encrypted_data)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetClientDHParams:
+        nonce = Int128.read(stream)
+        server_nonce = Int128.read(stream)
+        encrypted_data = Bytes.read(stream)
+        return cls(nonce=nonce, server_nonce=server_nonce, encrypted_data=encrypted_data)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetClientDHParams, int]:
+        nonce, cursor = Int128.read_from(view, cursor)
+        server_nonce, cursor = Int128.read_from(view, cursor)
+        encrypted_data, cursor = Bytes.read_from(view, cursor)
+        return cls(nonce=nonce, server_nonce=server_nonce, encrypted_data=encrypted_data), cursor
+
+
+class DestroyAuthKey(TLRequest[tl.base.DestroyAuthKeyRes]):
+    __tl_id__ = 0xd1435160
+    __tl_name__ = "functions.DestroyAuthKey"
+    __tl_layer__ = 201
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DestroyAuthKey:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DestroyAuthKey, int]:
+        return cls(), cursor
+
+
+class RpcDropAnswer(TLRequest[tl.base.RpcDropAnswer]):
+    __tl_id__ = 0x58e4a740
+    __tl_name__ = "functions.RpcDropAnswer"
+    __tl_layer__ = 201
+
+    __slots__ = ("req_msg_id", )
+
+    def __init__(self, *, req_msg_id: int):
+        self.req_msg_id = req_msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.req_msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RpcDropAnswer:
+        req_msg_id = Long.read(stream)
+        return cls(req_msg_id=req_msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RpcDropAnswer, int]:
+        req_msg_id, cursor = Long.read_from(view, cursor)
+        return cls(req_msg_id=req_msg_id), cursor
+
+
+class GetFutureSalts(TLRequest[tl.base.FutureSalts]):
+    __tl_id__ = 0xb921bd04
+    __tl_name__ = "functions.GetFutureSalts"
+    __tl_layer__ = 201
+
+    __slots__ = ("num", )
+
+    def __init__(self, *, num: int):
+        self.num = num
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.num)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFutureSalts:
+        num = Int.read(stream)
+        return cls(num=num)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFutureSalts, int]:
+        num, cursor = Int.read_from(view, cursor)
+        return cls(num=num), cursor
+
+
+class Ping(TLRequest[tl.types.Pong]):
+    __tl_id__ = 0x7abe77ec
+    __tl_name__ = "functions.Ping"
+    __tl_layer__ = 201
+
+    __slots__ = ("ping_id", )
+
+    def __init__(self, *, ping_id: int):
+        self.ping_id = ping_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.ping_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Ping:
+        ping_id = Long.read(stream)
+        return cls(ping_id=ping_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Ping, int]:
+        ping_id, cursor = Long.read_from(view, cursor)
+        return cls(ping_id=ping_id), cursor
+
+
+class PingDelayDisconnect(TLRequest[tl.types.Pong]):
+    __tl_id__ = 0xf3427b8c
+    __tl_name__ = "functions.PingDelayDisconnect"
+    __tl_layer__ = 201
+
+    __slots__ = ("ping_id", "disconnect_delay", )
+
+    def __init__(self, *, ping_id: int, disconnect_delay: int):
+        self.ping_id = ping_id
+        self.disconnect_delay = disconnect_delay
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.ping_id)
+        out += Int.write(self.disconnect_delay)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PingDelayDisconnect:
+        ping_id = Long.read(stream)
+        disconnect_delay = Int.read(stream)
+        return cls(ping_id=ping_id, disconnect_delay=disconnect_delay)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PingDelayDisconnect, int]:
+        ping_id, cursor = Long.read_from(view, cursor)
+        disconnect_delay, cursor = Int.read_from(view, cursor)
+        return cls(ping_id=ping_id, disconnect_delay=disconnect_delay), cursor
+
+
+class DestroySession(TLRequest[tl.base.DestroySessionRes]):
+    __tl_id__ = 0xe7512126
+    __tl_name__ = "functions.DestroySession"
+    __tl_layer__ = 201
+
+    __slots__ = ("session_id", )
+
+    def __init__(self, *, session_id: int):
+        self.session_id = session_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.session_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DestroySession:
+        session_id = Long.read(stream)
+        return cls(session_id=session_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DestroySession, int]:
+        session_id, cursor = Long.read_from(view, cursor)
+        return cls(session_id=session_id), cursor
+
+
+class InvokeAfterMsg(TLRequest[TLObject]):
+    __tl_id__ = 0xcb9f372d
+    __tl_name__ = "functions.InvokeAfterMsg"
+    __tl_layer__ = 133
+
+    __slots__ = ("msg_id", "query", )
+
+    def __init__(self, *, msg_id: int, query: TLObject):
+        self.msg_id = msg_id
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.msg_id)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeAfterMsg:
+        msg_id = Long.read(stream)
+        query = TLObject.read(stream)
+        return cls(msg_id=msg_id, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeAfterMsg, int]:
+        msg_id, cursor = Long.read_from(view, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(msg_id=msg_id, query=query), cursor
+
+
+class InvokeAfterMsgs(TLRequest[TLObject]):
+    __tl_id__ = 0x3dc4b4f0
+    __tl_name__ = "functions.InvokeAfterMsgs"
+    __tl_layer__ = 133
+
+    __slots__ = ("msg_ids", "query", )
+
+    def __init__(self, *, msg_ids: list[int], query: TLObject):
+        self.msg_ids = msg_ids
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += LongVector.write(self.msg_ids)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeAfterMsgs:
+        msg_ids = LongVector.read(stream)
+        query = TLObject.read(stream)
+        return cls(msg_ids=msg_ids, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeAfterMsgs, int]:
+        msg_ids, cursor = LongVector.read_from(view, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(msg_ids=msg_ids, query=query), cursor
+
+
+class InitConnection(TLRequest[TLObject]):
+    __tl_id__ = 0xc1cd5ea9
+    __tl_name__ = "functions.InitConnection"
+    __tl_layer__ = 133
+
+    __slots__ = ("api_id", "device_model", "system_version", "app_version", "system_lang_code", "lang_pack", "lang_code", "proxy", "params", "query", )
+
+    def __init__(self, *, api_id: int, device_model: str, system_version: str, app_version: str, system_lang_code: str, lang_pack: str, lang_code: str, query: TLObject, proxy: tl.types.InputClientProxy | None = None, params: tl.base.JSONValue | None = None):
+        self.api_id = api_id
+        self.device_model = device_model
+        self.system_version = system_version
+        self.app_version = app_version
+        self.system_lang_code = system_lang_code
+        self.lang_pack = lang_pack
+        self.lang_code = lang_code
+        self.proxy = proxy
+        self.params = params
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.proxy is not None: flags1 |= (1 << 0)
+        if self.params is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Int.write(self.api_id)
+        String.write_to(out, self.device_model)
+        String.write_to(out, self.system_version)
+        String.write_to(out, self.app_version)
+        String.write_to(out, self.system_lang_code)
+        String.write_to(out, self.lang_pack)
+        String.write_to(out, self.lang_code)
+        if self.proxy is not None:
+            self.proxy.write_to(out, ctx)
+        if self.params is not None:
+            self.params.write_to(out, ctx)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InitConnection:
+        flags1 = Int.read(stream)
+        api_id = Int.read(stream)
+        device_model = String.read(stream)
+        system_version = String.read(stream)
+        app_version = String.read(stream)
+        system_lang_code = String.read(stream)
+        lang_pack = String.read(stream)
+        lang_code = String.read(stream)
+        proxy = tl.types.InputClientProxy.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        params = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        query = TLObject.read(stream)
+        return cls(api_id=api_id, device_model=device_model, system_version=system_version, app_version=app_version, system_lang_code=system_lang_code, lang_pack=lang_pack, lang_code=lang_code, proxy=proxy, params=params, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InitConnection, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        api_id, cursor = Int.read_from(view, cursor)
+        device_model, cursor = String.read_from(view, cursor)
+        system_version, cursor = String.read_from(view, cursor)
+        app_version, cursor = String.read_from(view, cursor)
+        system_lang_code, cursor = String.read_from(view, cursor)
+        lang_pack, cursor = String.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        proxy, cursor = tl.types.InputClientProxy.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        params, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(api_id=api_id, device_model=device_model, system_version=system_version, app_version=app_version, system_lang_code=system_lang_code, lang_pack=lang_pack, lang_code=lang_code, proxy=proxy, params=params, query=query), cursor
+
+
+class InvokeWithLayer(TLRequest[TLObject]):
+    __tl_id__ = 0xda9b0d0d
+    __tl_name__ = "functions.InvokeWithLayer"
+    __tl_layer__ = 133
+
+    __slots__ = ("layer", "query", )
+
+    def __init__(self, *, layer: int, query: TLObject):
+        self.layer = layer
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.layer)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeWithLayer:
+        layer = Int.read(stream)
+        query = TLObject.read(stream)
+        return cls(layer=layer, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeWithLayer, int]:
+        layer, cursor = Int.read_from(view, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(layer=layer, query=query), cursor
+
+
+class InvokeWithoutUpdates(TLRequest[TLObject]):
+    __tl_id__ = 0xbf9459b7
+    __tl_name__ = "functions.InvokeWithoutUpdates"
+    __tl_layer__ = 133
+
+    __slots__ = ("query", )
+
+    def __init__(self, *, query: TLObject):
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeWithoutUpdates:
+        query = TLObject.read(stream)
+        return cls(query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeWithoutUpdates, int]:
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(query=query), cursor
+
+
+class InvokeWithMessagesRange(TLRequest[TLObject]):
+    __tl_id__ = 0x365275f2
+    __tl_name__ = "functions.InvokeWithMessagesRange"
+    __tl_layer__ = 133
+
+    __slots__ = ("range", "query", )
+
+    def __init__(self, *, range: tl.types.MessageRange, query: TLObject):
+        self.range = range
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.range.write_to(out, ctx)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeWithMessagesRange:
+        range = tl.types.MessageRange.read(stream)
+        query = TLObject.read(stream)
+        return cls(range=range, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeWithMessagesRange, int]:
+        range, cursor = tl.types.MessageRange.read_from(view, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(range=range, query=query), cursor
+
+
+class InvokeWithTakeout(TLRequest[TLObject]):
+    __tl_id__ = 0xaca9fd2e
+    __tl_name__ = "functions.InvokeWithTakeout"
+    __tl_layer__ = 133
+
+    __slots__ = ("takeout_id", "query", )
+
+    def __init__(self, *, takeout_id: int, query: TLObject):
+        self.takeout_id = takeout_id
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.takeout_id)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeWithTakeout:
+        takeout_id = Long.read(stream)
+        query = TLObject.read(stream)
+        return cls(takeout_id=takeout_id, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeWithTakeout, int]:
+        takeout_id, cursor = Long.read_from(view, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(takeout_id=takeout_id, query=query), cursor
+
+
+class InvokeWithBusinessConnection(TLRequest[TLObject]):
+    __tl_id__ = 0xdd289f8e
+    __tl_name__ = "functions.InvokeWithBusinessConnection"
+    __tl_layer__ = 177
+
+    __slots__ = ("connection_id", "query", )
+
+    def __init__(self, *, connection_id: str, query: TLObject):
+        self.connection_id = connection_id
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.connection_id)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeWithBusinessConnection:
+        connection_id = String.read(stream)
+        query = TLObject.read(stream)
+        return cls(connection_id=connection_id, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeWithBusinessConnection, int]:
+        connection_id, cursor = String.read_from(view, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(connection_id=connection_id, query=query), cursor
+
+
+class InvokeWithGooglePlayIntegrity(TLRequest[TLObject]):
+    __tl_id__ = 0x1df92984
+    __tl_name__ = "functions.InvokeWithGooglePlayIntegrity"
+    __tl_layer__ = 181
+
+    __slots__ = ("nonce", "token", "query", )
+
+    def __init__(self, *, nonce: str, token: str, query: TLObject):
+        self.nonce = nonce
+        self.token = token
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.nonce)
+        String.write_to(out, self.token)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeWithGooglePlayIntegrity:
+        nonce = String.read(stream)
+        token = String.read(stream)
+        query = TLObject.read(stream)
+        return cls(nonce=nonce, token=token, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeWithGooglePlayIntegrity, int]:
+        nonce, cursor = String.read_from(view, cursor)
+        token, cursor = String.read_from(view, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(nonce=nonce, token=token, query=query), cursor
+
+
+class InvokeWithApnsSecret(TLRequest[TLObject]):
+    __tl_id__ = 0x0dae54f8
+    __tl_name__ = "functions.InvokeWithApnsSecret"
+    __tl_layer__ = 181
+
+    __slots__ = ("nonce", "secret", "query", )
+
+    def __init__(self, *, nonce: str, secret: str, query: TLObject):
+        self.nonce = nonce
+        self.secret = secret
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.nonce)
+        String.write_to(out, self.secret)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeWithApnsSecret:
+        nonce = String.read(stream)
+        secret = String.read(stream)
+        query = TLObject.read(stream)
+        return cls(nonce=nonce, secret=secret, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeWithApnsSecret, int]:
+        nonce, cursor = String.read_from(view, cursor)
+        secret, cursor = String.read_from(view, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(nonce=nonce, secret=secret, query=query), cursor
+
+
+class InvokeWithReCaptcha(TLRequest[TLObject]):
+    __tl_id__ = 0xadbb0f94
+    __tl_name__ = "functions.InvokeWithReCaptcha"
+    __tl_layer__ = 199
+
+    __slots__ = ("token", "query", )
+
+    def __init__(self, *, token: str, query: TLObject):
+        self.token = token
+        self.query = query
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.token)
+        self.query.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeWithReCaptcha:
+        token = String.read(stream)
+        query = TLObject.read(stream)
+        return cls(token=token, query=query)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeWithReCaptcha, int]:
+        token, cursor = String.read_from(view, cursor)
+        query, cursor = TLObject.read_from(view, cursor)
+        return cls(token=token, query=query), cursor
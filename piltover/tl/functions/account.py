@@ -0,0 +1,3710 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class RegisterDevice(TLRequest[bool]):
+    __tl_id__ = 0xec86017a
+    __tl_name__ = "functions.account.RegisterDevice"
+    __tl_layer__ = 133
+
+    __slots__ = ("no_muted", "token_type", "token", "app_sandbox", "secret", "other_uids", )
+
+    def __init__(self, *, token_type: int, token: str, app_sandbox: bool, secret: bytes, other_uids: list[int], no_muted: bool = False):
+        self.no_muted = no_muted
+        self.token_type = token_type
+        self.token = token
+        self.app_sandbox = app_sandbox
+        self.secret = secret
+        self.other_uids = other_uids
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_muted: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.token_type)
+        String.write_to(out, self.token)
+        out += Bool.write(self.app_sandbox)
+        Bytes.write_to(out, self.secret)
+        out += LongVector.write(self.other_uids)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RegisterDevice:
+        flags1 = Int.read(stream)
+        no_muted = (flags1 & (1 << 0)) == (1 << 0)
+        token_type = Int.read(stream)
+        token = String.read(stream)
+        app_sandbox = Bool.read(stream)
+        secret = Bytes.read(stream)
+        other_uids = LongVector.read(stream)
+        return cls(no_muted=no_muted, token_type=token_type, token=token, app_sandbox=app_sandbox, secret=secret, other_uids=other_uids)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RegisterDevice, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_muted = (flags1 & (1 << 0)) == (1 << 0)
+        token_type, cursor = Int.read_from(view, cursor)
+        token, cursor = String.read_from(view, cursor)
+        app_sandbox, cursor = Bool.read_from(view, cursor)
+        secret, cursor = Bytes.read_from(view, cursor)
+        other_uids, cursor = LongVector.read_from(view, cursor)
+        return cls(no_muted=no_muted, token_type=token_type, token=token, app_sandbox=app_sandbox, secret=secret, other_uids=other_uids), cursor
+
+
+class UnregisterDevice(TLRequest[bool]):
+    __tl_id__ = 0x6a0d3206
+    __tl_name__ = "functions.account.UnregisterDevice"
+    __tl_layer__ = 133
+
+    __slots__ = ("token_type", "token", "other_uids", )
+
+    def __init__(self, *, token_type: int, token: str, other_uids: list[int]):
+        self.token_type = token_type
+        self.token = token
+        self.other_uids = other_uids
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.token_type)
+        String.write_to(out, self.token)
+        out += LongVector.write(self.other_uids)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UnregisterDevice:
+        token_type = Int.read(stream)
+        token = String.read(stream)
+        other_uids = LongVector.read(stream)
+        return cls(token_type=token_type, token=token, other_uids=other_uids)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UnregisterDevice, int]:
+        token_type, cursor = Int.read_from(view, cursor)
+        token, cursor = String.read_from(view, cursor)
+        other_uids, cursor = LongVector.read_from(view, cursor)
+        return cls(token_type=token_type, token=token, other_uids=other_uids), cursor
+
+
+class UpdateNotifySettings(TLRequest[bool]):
+    __tl_id__ = 0x84be5b93
+    __tl_name__ = "functions.account.UpdateNotifySettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "settings", )
+
+    def __init__(self, *, peer: tl.base.InputNotifyPeer, settings: tl.base.InputPeerNotifySettings):
+        self.peer = peer
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateNotifySettings:
+        peer = TLObject.read(stream)
+        settings = TLObject.read(stream)
+        return cls(peer=peer, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateNotifySettings, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, settings=settings), cursor
+
+
+class GetNotifySettings(TLRequest[tl.base.PeerNotifySettings]):
+    __tl_id__ = 0x12b3ad31
+    __tl_name__ = "functions.account.GetNotifySettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputNotifyPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetNotifySettings:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetNotifySettings, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class ResetNotifySettings(TLRequest[bool]):
+    __tl_id__ = 0xdb7e1747
+    __tl_name__ = "functions.account.ResetNotifySettings"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetNotifySettings:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetNotifySettings, int]:
+        return cls(), cursor
+
+
+class UpdateProfile(TLRequest[tl.base.User]):
+    __tl_id__ = 0x78515775
+    __tl_name__ = "functions.account.UpdateProfile"
+    __tl_layer__ = 133
+
+    __slots__ = ("first_name", "last_name", "about", )
+
+    def __init__(self, *, first_name: str | None = None, last_name: str | None = None, about: str | None = None):
+        self.first_name = first_name
+        self.last_name = last_name
+        self.about = about
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.first_name is not None: flags1 |= (1 << 0)
+        if self.last_name is not None: flags1 |= (1 << 1)
+        if self.about is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.first_name is not None:
+            String.write_to(out, self.first_name)
+        if self.last_name is not None:
+            String.write_to(out, self.last_name)
+        if self.about is not None:
+            String.write_to(out, self.about)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateProfile:
+        flags1 = Int.read(stream)
+        first_name = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        last_name = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        about = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(first_name=first_name, last_name=last_name, about=about)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateProfile, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        first_name, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        last_name, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        about, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(first_name=first_name, last_name=last_name, about=about), cursor
+
+
+class UpdateStatus(TLRequest[bool]):
+    __tl_id__ = 0x6628562c
+    __tl_name__ = "functions.account.UpdateStatus"
+    __tl_layer__ = 133
+
+    __slots__ = ("offline", )
+
+    def __init__(self, *, offline: bool):
+        self.offline = offline
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Bool.write(self.offline)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateStatus:
+        offline = Bool.read(stream)
+        return cls(offline=offline)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateStatus, int]:
+        offline, cursor = Bool.read_from(view, cursor)
+        return cls(offline=offline), cursor
+
+
+class GetWallPapers(TLRequest[tl.base.account.WallPapers]):
+    __tl_id__ = 0x7967d36
+    __tl_name__ = "functions.account.GetWallPapers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetWallPapers:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetWallPapers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class ReportPeer(TLRequest[bool]):
+    __tl_id__ = 0xc5ba3d86
+    __tl_name__ = "functions.account.ReportPeer"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "reason", "message", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, reason: tl.base.ReportReason, message: str):
+        self.peer = peer
+        self.reason = reason
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.reason.write_to(out, ctx)
+        String.write_to(out, self.message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportPeer:
+        peer = TLObject.read(stream)
+        reason = TLObject.read(stream)
+        message = String.read(stream)
+        return cls(peer=peer, reason=reason, message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportPeer, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        reason, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, reason=reason, message=message), cursor
+
+
+class CheckUsername(TLRequest[bool]):
+    __tl_id__ = 0x2714d86c
+    __tl_name__ = "functions.account.CheckUsername"
+    __tl_layer__ = 133
+
+    __slots__ = ("username", )
+
+    def __init__(self, *, username: str):
+        self.username = username
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.username)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckUsername:
+        username = String.read(stream)
+        return cls(username=username)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckUsername, int]:
+        username, cursor = String.read_from(view, cursor)
+        return cls(username=username), cursor
+
+
+class UpdateUsername(TLRequest[tl.base.User]):
+    __tl_id__ = 0x3e0bdd7c
+    __tl_name__ = "functions.account.UpdateUsername"
+    __tl_layer__ = 133
+
+    __slots__ = ("username", )
+
+    def __init__(self, *, username: str):
+        self.username = username
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.username)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateUsername:
+        username = String.read(stream)
+        return cls(username=username)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateUsername, int]:
+        username, cursor = String.read_from(view, cursor)
+        return cls(username=username), cursor
+
+
+class GetPrivacy(TLRequest[tl.types.account.PrivacyRules]):
+    __tl_id__ = 0xdadbc950
+    __tl_name__ = "functions.account.GetPrivacy"
+    __tl_layer__ = 133
+
+    __slots__ = ("key", )
+
+    def __init__(self, *, key: tl.base.InputPrivacyKey):
+        self.key = key
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.key.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPrivacy:
+        key = TLObject.read(stream)
+        return cls(key=key)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPrivacy, int]:
+        key, cursor = TLObject.read_from(view, cursor)
+        return cls(key=key), cursor
+
+
+class SetPrivacy(TLRequest[tl.types.account.PrivacyRules]):
+    __tl_id__ = 0xc9f81ce8
+    __tl_name__ = "functions.account.SetPrivacy"
+    __tl_layer__ = 133
+
+    __slots__ = ("key", "rules", )
+
+    def __init__(self, *, key: tl.base.InputPrivacyKey, rules: list[tl.base.InputPrivacyRule]):
+        self.key = key
+        self.rules = rules
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.key.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.rules, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetPrivacy:
+        key = TLObject.read(stream)
+        rules = TLObjectVector.read(stream)
+        return cls(key=key, rules=rules)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetPrivacy, int]:
+        key, cursor = TLObject.read_from(view, cursor)
+        rules, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(key=key, rules=rules), cursor
+
+
+class DeleteAccount(TLRequest[bool]):
+    __tl_id__ = 0xa2c0cf74
+    __tl_name__ = "functions.account.DeleteAccount"
+    __tl_layer__ = 143
+
+    __slots__ = ("reason", "password", )
+
+    def __init__(self, *, reason: str, password: tl.base.InputCheckPasswordSRP | None = None):
+        self.reason = reason
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.password is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.reason)
+        if self.password is not None:
+            self.password.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteAccount:
+        flags1 = Int.read(stream)
+        reason = String.read(stream)
+        password = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(reason=reason, password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteAccount, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        reason, cursor = String.read_from(view, cursor)
+        password, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(reason=reason, password=password), cursor
+
+
+class GetAccountTTL(TLRequest[tl.types.AccountDaysTTL]):
+    __tl_id__ = 0x8fc711d
+    __tl_name__ = "functions.account.GetAccountTTL"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAccountTTL:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAccountTTL, int]:
+        return cls(), cursor
+
+
+class SetAccountTTL(TLRequest[bool]):
+    __tl_id__ = 0x2442485e
+    __tl_name__ = "functions.account.SetAccountTTL"
+    __tl_layer__ = 133
+
+    __slots__ = ("ttl", )
+
+    def __init__(self, *, ttl: tl.types.AccountDaysTTL):
+        self.ttl = ttl
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.ttl.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetAccountTTL:
+        ttl = tl.types.AccountDaysTTL.read(stream)
+        return cls(ttl=ttl)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetAccountTTL, int]:
+        ttl, cursor = tl.types.AccountDaysTTL.read_from(view, cursor)
+        return cls(ttl=ttl), cursor
+
+
+class SendChangePhoneCode(TLRequest[tl.base.auth.SentCode]):
+    __tl_id__ = 0x82574ae5
+    __tl_name__ = "functions.account.SendChangePhoneCode"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "settings", )
+
+    def __init__(self, *, phone_number: str, settings: tl.base.CodeSettings):
+        self.phone_number = phone_number
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendChangePhoneCode:
+        phone_number = String.read(stream)
+        settings = TLObject.read(stream)
+        return cls(phone_number=phone_number, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendChangePhoneCode, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(phone_number=phone_number, settings=settings), cursor
+
+
+class ChangePhone(TLRequest[tl.base.User]):
+    __tl_id__ = 0x70c32edb
+    __tl_name__ = "functions.account.ChangePhone"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "phone_code_hash", "phone_code", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, phone_code: str):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.phone_code = phone_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        String.write_to(out, self.phone_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChangePhone:
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        phone_code = String.read(stream)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, phone_code=phone_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChangePhone, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        phone_code, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, phone_code=phone_code), cursor
+
+
+class UpdateDeviceLocked(TLRequest[bool]):
+    __tl_id__ = 0x38df3532
+    __tl_name__ = "functions.account.UpdateDeviceLocked"
+    __tl_layer__ = 133
+
+    __slots__ = ("period", )
+
+    def __init__(self, *, period: int):
+        self.period = period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateDeviceLocked:
+        period = Int.read(stream)
+        return cls(period=period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateDeviceLocked, int]:
+        period, cursor = Int.read_from(view, cursor)
+        return cls(period=period), cursor
+
+
+class GetAuthorizations(TLRequest[tl.base.account.Authorizations]):
+    __tl_id__ = 0xe320c158
+    __tl_name__ = "functions.account.GetAuthorizations"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAuthorizations:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAuthorizations, int]:
+        return cls(), cursor
+
+
+class ResetAuthorization(TLRequest[bool]):
+    __tl_id__ = 0xdf77f3bc
+    __tl_name__ = "functions.account.ResetAuthorization"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetAuthorization:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetAuthorization, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetPassword(TLRequest[tl.base.account.Password]):
+    __tl_id__ = 0x548a30f5
+    __tl_name__ = "functions.account.GetPassword"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPassword:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPassword, int]:
+        return cls(), cursor
+
+
+class GetPasswordSettings(TLRequest[tl.types.account.PasswordSettings]):
+    __tl_id__ = 0x9cd4eaf9
+    __tl_name__ = "functions.account.GetPasswordSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("password", )
+
+    def __init__(self, *, password: tl.base.InputCheckPasswordSRP):
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.password.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPasswordSettings:
+        password = TLObject.read(stream)
+        return cls(password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPasswordSettings, int]:
+        password, cursor = TLObject.read_from(view, cursor)
+        return cls(password=password), cursor
+
+
+class UpdatePasswordSettings(TLRequest[bool]):
+    __tl_id__ = 0xa59b102f
+    __tl_name__ = "functions.account.UpdatePasswordSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("password", "new_settings", )
+
+    def __init__(self, *, password: tl.base.InputCheckPasswordSRP, new_settings: tl.types.account.PasswordInputSettings):
+        self.password = password
+        self.new_settings = new_settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.password.write_to(out, ctx)
+        self.new_settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdatePasswordSettings:
+        password = TLObject.read(stream)
+        new_settings = tl.types.account.PasswordInputSettings.read(stream)
+        return cls(password=password, new_settings=new_settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdatePasswordSettings, int]:
+        password, cursor = TLObject.read_from(view, cursor)
+        new_settings, cursor = tl.types.account.PasswordInputSettings.read_from(view, cursor)
+        return cls(password=password, new_settings=new_settings), cursor
+
+
+class SendConfirmPhoneCode(TLRequest[tl.base.auth.SentCode]):
+    __tl_id__ = 0x1b3faa88
+    __tl_name__ = "functions.account.SendConfirmPhoneCode"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "settings", )
+
+    def __init__(self, *, hash: str, settings: tl.base.CodeSettings):
+        self.hash = hash
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.hash)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendConfirmPhoneCode:
+        hash = String.read(stream)
+        settings = TLObject.read(stream)
+        return cls(hash=hash, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendConfirmPhoneCode, int]:
+        hash, cursor = String.read_from(view, cursor)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(hash=hash, settings=settings), cursor
+
+
+class ConfirmPhone(TLRequest[bool]):
+    __tl_id__ = 0x5f2178c3
+    __tl_name__ = "functions.account.ConfirmPhone"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_code_hash", "phone_code", )
+
+    def __init__(self, *, phone_code_hash: str, phone_code: str):
+        self.phone_code_hash = phone_code_hash
+        self.phone_code = phone_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_code_hash)
+        String.write_to(out, self.phone_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConfirmPhone:
+        phone_code_hash = String.read(stream)
+        phone_code = String.read(stream)
+        return cls(phone_code_hash=phone_code_hash, phone_code=phone_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConfirmPhone, int]:
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        phone_code, cursor = String.read_from(view, cursor)
+        return cls(phone_code_hash=phone_code_hash, phone_code=phone_code), cursor
+
+
+class GetTmpPassword(TLRequest[tl.types.account.TmpPassword]):
+    __tl_id__ = 0x449e0b51
+    __tl_name__ = "functions.account.GetTmpPassword"
+    __tl_layer__ = 133
+
+    __slots__ = ("password", "period", )
+
+    def __init__(self, *, password: tl.base.InputCheckPasswordSRP, period: int):
+        self.password = password
+        self.period = period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.password.write_to(out, ctx)
+        out += Int.write(self.period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetTmpPassword:
+        password = TLObject.read(stream)
+        period = Int.read(stream)
+        return cls(password=password, period=period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetTmpPassword, int]:
+        password, cursor = TLObject.read_from(view, cursor)
+        period, cursor = Int.read_from(view, cursor)
+        return cls(password=password, period=period), cursor
+
+
+class GetWebAuthorizations(TLRequest[tl.types.account.WebAuthorizations]):
+    __tl_id__ = 0x182e6d6f
+    __tl_name__ = "functions.account.GetWebAuthorizations"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetWebAuthorizations:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetWebAuthorizations, int]:
+        return cls(), cursor
+
+
+class ResetWebAuthorization(TLRequest[bool]):
+    __tl_id__ = 0x2d01b9ef
+    __tl_name__ = "functions.account.ResetWebAuthorization"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetWebAuthorization:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetWebAuthorization, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class ResetWebAuthorizations(TLRequest[bool]):
+    __tl_id__ = 0x682d2594
+    __tl_name__ = "functions.account.ResetWebAuthorizations"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetWebAuthorizations:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetWebAuthorizations, int]:
+        return cls(), cursor
+
+
+class GetAllSecureValues(TLRequest[list[tl.base.SecureValue]]):
+    __tl_id__ = 0xb288bc7d
+    __tl_name__ = "functions.account.GetAllSecureValues"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAllSecureValues:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAllSecureValues, int]:
+        return cls(), cursor
+
+
+class GetSecureValue(TLRequest[list[tl.base.SecureValue]]):
+    __tl_id__ = 0x73665bc2
+    __tl_name__ = "functions.account.GetSecureValue"
+    __tl_layer__ = 133
+
+    __slots__ = ("types", )
+
+    def __init__(self, *, types: list[tl.base.SecureValueType]):
+        self.types = types
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.types, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSecureValue:
+        types = TLObjectVector.read(stream)
+        return cls(types=types)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSecureValue, int]:
+        types, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(types=types), cursor
+
+
+class SaveSecureValue(TLRequest[tl.types.SecureValue]):
+    __tl_id__ = 0x899fe31d
+    __tl_name__ = "functions.account.SaveSecureValue"
+    __tl_layer__ = 133
+
+    __slots__ = ("value", "secure_secret_id", )
+
+    def __init__(self, *, value: tl.types.InputSecureValue, secure_secret_id: int):
+        self.value = value
+        self.secure_secret_id = secure_secret_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.value.write_to(out, ctx)
+        out += Long.write(self.secure_secret_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveSecureValue:
+        value = tl.types.InputSecureValue.read(stream)
+        secure_secret_id = Long.read(stream)
+        return cls(value=value, secure_secret_id=secure_secret_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveSecureValue, int]:
+        value, cursor = tl.types.InputSecureValue.read_from(view, cursor)
+        secure_secret_id, cursor = Long.read_from(view, cursor)
+        return cls(value=value, secure_secret_id=secure_secret_id), cursor
+
+
+class DeleteSecureValue(TLRequest[bool]):
+    __tl_id__ = 0xb880bc4b
+    __tl_name__ = "functions.account.DeleteSecureValue"
+    __tl_layer__ = 133
+
+    __slots__ = ("types", )
+
+    def __init__(self, *, types: list[tl.base.SecureValueType]):
+        self.types = types
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.types, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteSecureValue:
+        types = TLObjectVector.read(stream)
+        return cls(types=types)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteSecureValue, int]:
+        types, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(types=types), cursor
+
+
+class GetAuthorizationForm(TLRequest[tl.types.account.AuthorizationForm]):
+    __tl_id__ = 0xa929597a
+    __tl_name__ = "functions.account.GetAuthorizationForm"
+    __tl_layer__ = 133
+
+    __slots__ = ("bot_id", "scope", "public_key", )
+
+    def __init__(self, *, bot_id: int, scope: str, public_key: str):
+        self.bot_id = bot_id
+        self.scope = scope
+        self.public_key = public_key
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.bot_id)
+        String.write_to(out, self.scope)
+        String.write_to(out, self.public_key)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAuthorizationForm:
+        bot_id = Long.read(stream)
+        scope = String.read(stream)
+        public_key = String.read(stream)
+        return cls(bot_id=bot_id, scope=scope, public_key=public_key)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAuthorizationForm, int]:
+        bot_id, cursor = Long.read_from(view, cursor)
+        scope, cursor = String.read_from(view, cursor)
+        public_key, cursor = String.read_from(view, cursor)
+        return cls(bot_id=bot_id, scope=scope, public_key=public_key), cursor
+
+
+class AcceptAuthorization(TLRequest[bool]):
+    __tl_id__ = 0xf3ed4c73
+    __tl_name__ = "functions.account.AcceptAuthorization"
+    __tl_layer__ = 133
+
+    __slots__ = ("bot_id", "scope", "public_key", "value_hashes", "credentials", )
+
+    def __init__(self, *, bot_id: int, scope: str, public_key: str, value_hashes: list[tl.base.SecureValueHash], credentials: tl.types.SecureCredentialsEncrypted):
+        self.bot_id = bot_id
+        self.scope = scope
+        self.public_key = public_key
+        self.value_hashes = value_hashes
+        self.credentials = credentials
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.bot_id)
+        String.write_to(out, self.scope)
+        String.write_to(out, self.public_key)
+        TLObjectVector.write_to(out, self.value_hashes, ctx)
+        self.credentials.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AcceptAuthorization:
+        bot_id = Long.read(stream)
+        scope = String.read(stream)
+        public_key = String.read(stream)
+        value_hashes = TLObjectVector.read(stream)
+        credentials = tl.types.SecureCredentialsEncrypted.read(stream)
+        return cls(bot_id=bot_id, scope=scope, public_key=public_key, value_hashes=value_hashes, credentials=credentials)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AcceptAuthorization, int]:
+        bot_id, cursor = Long.read_from(view, cursor)
+        scope, cursor = String.read_from(view, cursor)
+        public_key, cursor = String.read_from(view, cursor)
+        value_hashes, cursor = TLObjectVector.read_from(view, cursor)
+        credentials, cursor = tl.types.SecureCredentialsEncrypted.read_from(view, cursor)
+        return cls(bot_id=bot_id, scope=scope, public_key=public_key, value_hashes=value_hashes, credentials=credentials), cursor
+
+
+class SendVerifyPhoneCode(TLRequest[tl.base.auth.SentCode]):
+    __tl_id__ = 0xa5a356f9
+    __tl_name__ = "functions.account.SendVerifyPhoneCode"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "settings", )
+
+    def __init__(self, *, phone_number: str, settings: tl.base.CodeSettings):
+        self.phone_number = phone_number
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendVerifyPhoneCode:
+        phone_number = String.read(stream)
+        settings = TLObject.read(stream)
+        return cls(phone_number=phone_number, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendVerifyPhoneCode, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(phone_number=phone_number, settings=settings), cursor
+
+
+class VerifyPhone(TLRequest[bool]):
+    __tl_id__ = 0x4dd3a7f6
+    __tl_name__ = "functions.account.VerifyPhone"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "phone_code_hash", "phone_code", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, phone_code: str):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.phone_code = phone_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        String.write_to(out, self.phone_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> VerifyPhone:
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        phone_code = String.read(stream)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, phone_code=phone_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[VerifyPhone, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        phone_code, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, phone_code=phone_code), cursor
+
+
+class SendVerifyEmailCode(TLRequest[tl.types.account.SentEmailCode]):
+    __tl_id__ = 0x98e037bb
+    __tl_name__ = "functions.account.SendVerifyEmailCode"
+    __tl_layer__ = 145
+
+    __slots__ = ("purpose", "email", )
+
+    def __init__(self, *, purpose: tl.base.EmailVerifyPurpose, email: str):
+        self.purpose = purpose
+        self.email = email
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.purpose.write_to(out, ctx)
+        String.write_to(out, self.email)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendVerifyEmailCode:
+        purpose = TLObject.read(stream)
+        email = String.read(stream)
+        return cls(purpose=purpose, email=email)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendVerifyEmailCode, int]:
+        purpose, cursor = TLObject.read_from(view, cursor)
+        email, cursor = String.read_from(view, cursor)
+        return cls(purpose=purpose, email=email), cursor
+
+
+class VerifyEmail(TLRequest[tl.base.account.EmailVerified]):
+    __tl_id__ = 0x32da4cf
+    __tl_name__ = "functions.account.VerifyEmail"
+    __tl_layer__ = 145
+
+    __slots__ = ("purpose", "verification", )
+
+    def __init__(self, *, purpose: tl.base.EmailVerifyPurpose, verification: tl.base.EmailVerification):
+        self.purpose = purpose
+        self.verification = verification
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.purpose.write_to(out, ctx)
+        self.verification.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> VerifyEmail:
+        purpose = TLObject.read(stream)
+        verification = TLObject.read(stream)
+        return cls(purpose=purpose, verification=verification)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[VerifyEmail, int]:
+        purpose, cursor = TLObject.read_from(view, cursor)
+        verification, cursor = TLObject.read_from(view, cursor)
+        return cls(purpose=purpose, verification=verification), cursor
+
+
+class InitTakeoutSession(TLRequest[tl.types.account.Takeout]):
+    __tl_id__ = 0x8ef3eab0
+    __tl_name__ = "functions.account.InitTakeoutSession"
+    __tl_layer__ = 143
+
+    __slots__ = ("contacts", "message_users", "message_chats", "message_megagroups", "message_channels", "files", "file_max_size", )
+
+    def __init__(self, *, contacts: bool = False, message_users: bool = False, message_chats: bool = False, message_megagroups: bool = False, message_channels: bool = False, files: bool = False, file_max_size: int | None = None):
+        self.contacts = contacts
+        self.message_users = message_users
+        self.message_chats = message_chats
+        self.message_megagroups = message_megagroups
+        self.message_channels = message_channels
+        self.files = files
+        self.file_max_size = file_max_size
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.files is False, self.file_max_size is None)
+        _flags_fields_not_empty = (self.files is True, self.file_max_size is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: files, file_max_size")
+        flags1 = 0
+        if self.contacts: flags1 |= (1 << 0)
+        if self.message_users: flags1 |= (1 << 1)
+        if self.message_chats: flags1 |= (1 << 2)
+        if self.message_megagroups: flags1 |= (1 << 3)
+        if self.message_channels: flags1 |= (1 << 4)
+        if self.files: flags1 |= (1 << 5)
+        if self.file_max_size is not None: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        if self.file_max_size is not None:
+            out += Long.write(self.file_max_size)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InitTakeoutSession:
+        flags1 = Int.read(stream)
+        contacts = (flags1 & (1 << 0)) == (1 << 0)
+        message_users = (flags1 & (1 << 1)) == (1 << 1)
+        message_chats = (flags1 & (1 << 2)) == (1 << 2)
+        message_megagroups = (flags1 & (1 << 3)) == (1 << 3)
+        message_channels = (flags1 & (1 << 4)) == (1 << 4)
+        files = (flags1 & (1 << 5)) == (1 << 5)
+        file_max_size = Long.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        return cls(contacts=contacts, message_users=message_users, message_chats=message_chats, message_megagroups=message_megagroups, message_channels=message_channels, files=files, file_max_size=file_max_size)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InitTakeoutSession, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        contacts = (flags1 & (1 << 0)) == (1 << 0)
+        message_users = (flags1 & (1 << 1)) == (1 << 1)
+        message_chats = (flags1 & (1 << 2)) == (1 << 2)
+        message_megagroups = (flags1 & (1 << 3)) == (1 << 3)
+        message_channels = (flags1 & (1 << 4)) == (1 << 4)
+        files = (flags1 & (1 << 5)) == (1 << 5)
+        file_max_size, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        return cls(contacts=contacts, message_users=message_users, message_chats=message_chats, message_megagroups=message_megagroups, message_channels=message_channels, files=files, file_max_size=file_max_size), cursor
+
+
+class FinishTakeoutSession(TLRequest[bool]):
+    __tl_id__ = 0x1d2652ee
+    __tl_name__ = "functions.account.FinishTakeoutSession"
+    __tl_layer__ = 133
+
+    __slots__ = ("success", )
+
+    def __init__(self, *, success: bool = False):
+        self.success = success
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.success: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FinishTakeoutSession:
+        flags1 = Int.read(stream)
+        success = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(success=success)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FinishTakeoutSession, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        success = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(success=success), cursor
+
+
+class ConfirmPasswordEmail(TLRequest[bool]):
+    __tl_id__ = 0x8fdf1920
+    __tl_name__ = "functions.account.ConfirmPasswordEmail"
+    __tl_layer__ = 133
+
+    __slots__ = ("code", )
+
+    def __init__(self, *, code: str):
+        self.code = code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConfirmPasswordEmail:
+        code = String.read(stream)
+        return cls(code=code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConfirmPasswordEmail, int]:
+        code, cursor = String.read_from(view, cursor)
+        return cls(code=code), cursor
+
+
+class ResendPasswordEmail(TLRequest[bool]):
+    __tl_id__ = 0x7a7f2a15
+    __tl_name__ = "functions.account.ResendPasswordEmail"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResendPasswordEmail:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResendPasswordEmail, int]:
+        return cls(), cursor
+
+
+class CancelPasswordEmail(TLRequest[bool]):
+    __tl_id__ = 0xc1cbd5b6
+    __tl_name__ = "functions.account.CancelPasswordEmail"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CancelPasswordEmail:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CancelPasswordEmail, int]:
+        return cls(), cursor
+
+
+class GetContactSignUpNotification(TLRequest[bool]):
+    __tl_id__ = 0x9f07c728
+    __tl_name__ = "functions.account.GetContactSignUpNotification"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetContactSignUpNotification:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetContactSignUpNotification, int]:
+        return cls(), cursor
+
+
+class SetContactSignUpNotification(TLRequest[bool]):
+    __tl_id__ = 0xcff43f61
+    __tl_name__ = "functions.account.SetContactSignUpNotification"
+    __tl_layer__ = 133
+
+    __slots__ = ("silent", )
+
+    def __init__(self, *, silent: bool):
+        self.silent = silent
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Bool.write(self.silent)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetContactSignUpNotification:
+        silent = Bool.read(stream)
+        return cls(silent=silent)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetContactSignUpNotification, int]:
+        silent, cursor = Bool.read_from(view, cursor)
+        return cls(silent=silent), cursor
+
+
+class GetNotifyExceptions(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x53577479
+    __tl_name__ = "functions.account.GetNotifyExceptions"
+    __tl_layer__ = 133
+
+    __slots__ = ("compare_sound", "compare_stories", "peer", )
+
+    def __init__(self, *, compare_sound: bool = False, compare_stories: bool = False, peer: tl.base.InputNotifyPeer | None = None):
+        self.compare_sound = compare_sound
+        self.compare_stories = compare_stories
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.compare_sound: flags1 |= (1 << 1)
+        if self.compare_stories: flags1 |= (1 << 2)
+        if self.peer is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.peer is not None:
+            self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetNotifyExceptions:
+        flags1 = Int.read(stream)
+        compare_sound = (flags1 & (1 << 1)) == (1 << 1)
+        compare_stories = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(compare_sound=compare_sound, compare_stories=compare_stories, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetNotifyExceptions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        compare_sound = (flags1 & (1 << 1)) == (1 << 1)
+        compare_stories = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(compare_sound=compare_sound, compare_stories=compare_stories, peer=peer), cursor
+
+
+class GetWallPaper(TLRequest[tl.base.WallPaper]):
+    __tl_id__ = 0xfc8ddbea
+    __tl_name__ = "functions.account.GetWallPaper"
+    __tl_layer__ = 133
+
+    __slots__ = ("wallpaper", )
+
+    def __init__(self, *, wallpaper: tl.base.InputWallPaper):
+        self.wallpaper = wallpaper
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.wallpaper.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetWallPaper:
+        wallpaper = TLObject.read(stream)
+        return cls(wallpaper=wallpaper)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetWallPaper, int]:
+        wallpaper, cursor = TLObject.read_from(view, cursor)
+        return cls(wallpaper=wallpaper), cursor
+
+
+class UploadWallPaper(TLRequest[tl.base.WallPaper]):
+    __tl_id__ = 0xe39a8f03
+    __tl_name__ = "functions.account.UploadWallPaper"
+    __tl_layer__ = 158
+
+    __slots__ = ("for_chat", "file", "mime_type", "settings", )
+
+    def __init__(self, *, file: tl.base.InputFile, mime_type: str, settings: tl.base.WallPaperSettings, for_chat: bool = False):
+        self.for_chat = for_chat
+        self.file = file
+        self.mime_type = mime_type
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.for_chat: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.file.write_to(out, ctx)
+        String.write_to(out, self.mime_type)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadWallPaper:
+        flags1 = Int.read(stream)
+        for_chat = (flags1 & (1 << 0)) == (1 << 0)
+        file = TLObject.read(stream)
+        mime_type = String.read(stream)
+        settings = TLObject.read(stream)
+        return cls(for_chat=for_chat, file=file, mime_type=mime_type, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadWallPaper, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        for_chat = (flags1 & (1 << 0)) == (1 << 0)
+        file, cursor = TLObject.read_from(view, cursor)
+        mime_type, cursor = String.read_from(view, cursor)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(for_chat=for_chat, file=file, mime_type=mime_type, settings=settings), cursor
+
+
+class SaveWallPaper(TLRequest[bool]):
+    __tl_id__ = 0x6c5a5b37
+    __tl_name__ = "functions.account.SaveWallPaper"
+    __tl_layer__ = 133
+
+    __slots__ = ("wallpaper", "unsave", "settings", )
+
+    def __init__(self, *, wallpaper: tl.base.InputWallPaper, unsave: bool, settings: tl.base.WallPaperSettings):
+        self.wallpaper = wallpaper
+        self.unsave = unsave
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.wallpaper.write_to(out, ctx)
+        out += Bool.write(self.unsave)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveWallPaper:
+        wallpaper = TLObject.read(stream)
+        unsave = Bool.read(stream)
+        settings = TLObject.read(stream)
+        return cls(wallpaper=wallpaper, unsave=unsave, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveWallPaper, int]:
+        wallpaper, cursor = TLObject.read_from(view, cursor)
+        unsave, cursor = Bool.read_from(view, cursor)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(wallpaper=wallpaper, unsave=unsave, settings=settings), cursor
+
+
+class InstallWallPaper(TLRequest[bool]):
+    __tl_id__ = 0xfeed5769
+    __tl_name__ = "functions.account.InstallWallPaper"
+    __tl_layer__ = 133
+
+    __slots__ = ("wallpaper", "settings", )
+
+    def __init__(self, *, wallpaper: tl.base.InputWallPaper, settings: tl.base.WallPaperSettings):
+        self.wallpaper = wallpaper
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.wallpaper.write_to(out, ctx)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InstallWallPaper:
+        wallpaper = TLObject.read(stream)
+        settings = TLObject.read(stream)
+        return cls(wallpaper=wallpaper, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InstallWallPaper, int]:
+        wallpaper, cursor = TLObject.read_from(view, cursor)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(wallpaper=wallpaper, settings=settings), cursor
+
+
+class ResetWallPapers(TLRequest[bool]):
+    __tl_id__ = 0xbb3b9804
+    __tl_name__ = "functions.account.ResetWallPapers"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetWallPapers:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetWallPapers, int]:
+        return cls(), cursor
+
+
+class GetAutoDownloadSettings(TLRequest[tl.types.account.AutoDownloadSettings]):
+    __tl_id__ = 0x56da0b3f
+    __tl_name__ = "functions.account.GetAutoDownloadSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAutoDownloadSettings:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAutoDownloadSettings, int]:
+        return cls(), cursor
+
+
+class SaveAutoDownloadSettings(TLRequest[bool]):
+    __tl_id__ = 0x76f36233
+    __tl_name__ = "functions.account.SaveAutoDownloadSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("low", "high", "settings", )
+
+    def __init__(self, *, settings: tl.base.AutoDownloadSettings, low: bool = False, high: bool = False):
+        self.low = low
+        self.high = high
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.low: flags1 |= (1 << 0)
+        if self.high: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveAutoDownloadSettings:
+        flags1 = Int.read(stream)
+        low = (flags1 & (1 << 0)) == (1 << 0)
+        high = (flags1 & (1 << 1)) == (1 << 1)
+        settings = TLObject.read(stream)
+        return cls(low=low, high=high, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveAutoDownloadSettings, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        low = (flags1 & (1 << 0)) == (1 << 0)
+        high = (flags1 & (1 << 1)) == (1 << 1)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(low=low, high=high, settings=settings), cursor
+
+
+class UploadTheme(TLRequest[tl.base.Document]):
+    __tl_id__ = 0x1c3db333
+    __tl_name__ = "functions.account.UploadTheme"
+    __tl_layer__ = 133
+
+    __slots__ = ("file", "thumb", "file_name", "mime_type", )
+
+    def __init__(self, *, file: tl.base.InputFile, file_name: str, mime_type: str, thumb: tl.base.InputFile | None = None):
+        self.file = file
+        self.thumb = thumb
+        self.file_name = file_name
+        self.mime_type = mime_type
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.thumb is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.file.write_to(out, ctx)
+        if self.thumb is not None:
+            self.thumb.write_to(out, ctx)
+        String.write_to(out, self.file_name)
+        String.write_to(out, self.mime_type)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadTheme:
+        flags1 = Int.read(stream)
+        file = TLObject.read(stream)
+        thumb = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        file_name = String.read(stream)
+        mime_type = String.read(stream)
+        return cls(file=file, thumb=thumb, file_name=file_name, mime_type=mime_type)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadTheme, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        file, cursor = TLObject.read_from(view, cursor)
+        thumb, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        file_name, cursor = String.read_from(view, cursor)
+        mime_type, cursor = String.read_from(view, cursor)
+        return cls(file=file, thumb=thumb, file_name=file_name, mime_type=mime_type), cursor
+
+
+class CreateTheme(TLRequest[tl.base.Theme]):
+    __tl_id__ = 0x652e4400
+    __tl_name__ = "functions.account.CreateTheme"
+    __tl_layer__ = 134
+
+    __slots__ = ("slug", "title", "document", "settings", )
+
+    def __init__(self, *, slug: str, title: str, document: tl.base.InputDocument | None = None, settings: list[tl.base.InputThemeSettings] | None = None):
+        self.slug = slug
+        self.title = title
+        self.document = document
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.document is not None: flags1 |= (1 << 2)
+        if self.settings: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        String.write_to(out, self.slug)
+        String.write_to(out, self.title)
+        if self.document is not None:
+            self.document.write_to(out, ctx)
+        if self.settings:
+            TLObjectVector.write_to(out, self.settings, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateTheme:
+        flags1 = Int.read(stream)
+        slug = String.read(stream)
+        title = String.read(stream)
+        document = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        settings = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(slug=slug, title=title, document=document, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateTheme, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        slug, cursor = String.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        document, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        settings, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(slug=slug, title=title, document=document, settings=settings), cursor
+
+
+class UpdateTheme(TLRequest[tl.base.Theme]):
+    __tl_id__ = 0x2bf40ccc
+    __tl_name__ = "functions.account.UpdateTheme"
+    __tl_layer__ = 134
+
+    __slots__ = ("format", "theme", "slug", "title", "document", "settings", )
+
+    def __init__(self, *, format: str, theme: tl.base.InputTheme, slug: str | None = None, title: str | None = None, document: tl.base.InputDocument | None = None, settings: list[tl.base.InputThemeSettings] | None = None):
+        self.format = format
+        self.theme = theme
+        self.slug = slug
+        self.title = title
+        self.document = document
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.slug is not None: flags1 |= (1 << 0)
+        if self.title is not None: flags1 |= (1 << 1)
+        if self.document is not None: flags1 |= (1 << 2)
+        if self.settings: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        String.write_to(out, self.format)
+        self.theme.write_to(out, ctx)
+        if self.slug is not None:
+            String.write_to(out, self.slug)
+        if self.title is not None:
+            String.write_to(out, self.title)
+        if self.document is not None:
+            self.document.write_to(out, ctx)
+        if self.settings:
+            TLObjectVector.write_to(out, self.settings, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateTheme:
+        flags1 = Int.read(stream)
+        format = String.read(stream)
+        theme = TLObject.read(stream)
+        slug = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        title = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        document = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        settings = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(format=format, theme=theme, slug=slug, title=title, document=document, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateTheme, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        format, cursor = String.read_from(view, cursor)
+        theme, cursor = TLObject.read_from(view, cursor)
+        slug, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        document, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        settings, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(format=format, theme=theme, slug=slug, title=title, document=document, settings=settings), cursor
+
+
+class SaveTheme(TLRequest[bool]):
+    __tl_id__ = 0xf257106c
+    __tl_name__ = "functions.account.SaveTheme"
+    __tl_layer__ = 133
+
+    __slots__ = ("theme", "unsave", )
+
+    def __init__(self, *, theme: tl.base.InputTheme, unsave: bool):
+        self.theme = theme
+        self.unsave = unsave
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.theme.write_to(out, ctx)
+        out += Bool.write(self.unsave)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveTheme:
+        theme = TLObject.read(stream)
+        unsave = Bool.read(stream)
+        return cls(theme=theme, unsave=unsave)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveTheme, int]:
+        theme, cursor = TLObject.read_from(view, cursor)
+        unsave, cursor = Bool.read_from(view, cursor)
+        return cls(theme=theme, unsave=unsave), cursor
+
+
+class InstallTheme(TLRequest[bool]):
+    __tl_id__ = 0xc727bb3b
+    __tl_name__ = "functions.account.InstallTheme"
+    __tl_layer__ = 134
+
+    __slots__ = ("dark", "theme", "format", "base_theme", )
+
+    def __init__(self, *, dark: bool = False, theme: tl.base.InputTheme | None = None, format: str | None = None, base_theme: tl.base.BaseTheme | None = None):
+        self.dark = dark
+        self.theme = theme
+        self.format = format
+        self.base_theme = base_theme
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.dark: flags1 |= (1 << 0)
+        if self.theme is not None: flags1 |= (1 << 1)
+        if self.format is not None: flags1 |= (1 << 2)
+        if self.base_theme is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        if self.theme is not None:
+            self.theme.write_to(out, ctx)
+        if self.format is not None:
+            String.write_to(out, self.format)
+        if self.base_theme is not None:
+            self.base_theme.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InstallTheme:
+        flags1 = Int.read(stream)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        theme = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        format = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        base_theme = TLObject.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(dark=dark, theme=theme, format=format, base_theme=base_theme)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InstallTheme, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        theme, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        format, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        base_theme, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(dark=dark, theme=theme, format=format, base_theme=base_theme), cursor
+
+
+class GetTheme(TLRequest[tl.base.Theme]):
+    __tl_id__ = 0x3a5869ec
+    __tl_name__ = "functions.account.GetTheme"
+    __tl_layer__ = 148
+
+    __slots__ = ("format", "theme", )
+
+    def __init__(self, *, format: str, theme: tl.base.InputTheme):
+        self.format = format
+        self.theme = theme
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.format)
+        self.theme.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetTheme:
+        format = String.read(stream)
+        theme = TLObject.read(stream)
+        return cls(format=format, theme=theme)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetTheme, int]:
+        format, cursor = String.read_from(view, cursor)
+        theme, cursor = TLObject.read_from(view, cursor)
+        return cls(format=format, theme=theme), cursor
+
+
+class GetThemes(TLRequest[tl.base.account.Themes]):
+    __tl_id__ = 0x7206e458
+    __tl_name__ = "functions.account.GetThemes"
+    __tl_layer__ = 133
+
+    __slots__ = ("format", "hash", )
+
+    def __init__(self, *, format: str, hash: int):
+        self.format = format
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.format)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetThemes:
+        format = String.read(stream)
+        hash = Long.read(stream)
+        return cls(format=format, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetThemes, int]:
+        format, cursor = String.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(format=format, hash=hash), cursor
+
+
+class SetContentSettings(TLRequest[bool]):
+    __tl_id__ = 0xb574b16b
+    __tl_name__ = "functions.account.SetContentSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("sensitive_enabled", )
+
+    def __init__(self, *, sensitive_enabled: bool = False):
+        self.sensitive_enabled = sensitive_enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.sensitive_enabled: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetContentSettings:
+        flags1 = Int.read(stream)
+        sensitive_enabled = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(sensitive_enabled=sensitive_enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetContentSettings, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        sensitive_enabled = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(sensitive_enabled=sensitive_enabled), cursor
+
+
+class GetContentSettings(TLRequest[tl.types.account.ContentSettings]):
+    __tl_id__ = 0x8b9b4dae
+    __tl_name__ = "functions.account.GetContentSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetContentSettings:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetContentSettings, int]:
+        return cls(), cursor
+
+
+class GetMultiWallPapers(TLRequest[list[tl.base.WallPaper]]):
+    __tl_id__ = 0x65ad71dc
+    __tl_name__ = "functions.account.GetMultiWallPapers"
+    __tl_layer__ = 133
+
+    __slots__ = ("wallpapers", )
+
+    def __init__(self, *, wallpapers: list[tl.base.InputWallPaper]):
+        self.wallpapers = wallpapers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.wallpapers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMultiWallPapers:
+        wallpapers = TLObjectVector.read(stream)
+        return cls(wallpapers=wallpapers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMultiWallPapers, int]:
+        wallpapers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(wallpapers=wallpapers), cursor
+
+
+class GetGlobalPrivacySettings(TLRequest[tl.base.GlobalPrivacySettings]):
+    __tl_id__ = 0xeb2b4cf6
+    __tl_name__ = "functions.account.GetGlobalPrivacySettings"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetGlobalPrivacySettings:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetGlobalPrivacySettings, int]:
+        return cls(), cursor
+
+
+class SetGlobalPrivacySettings(TLRequest[tl.base.GlobalPrivacySettings]):
+    __tl_id__ = 0x1edaaac2
+    __tl_name__ = "functions.account.SetGlobalPrivacySettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("settings", )
+
+    def __init__(self, *, settings: tl.base.GlobalPrivacySettings):
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetGlobalPrivacySettings:
+        settings = TLObject.read(stream)
+        return cls(settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetGlobalPrivacySettings, int]:
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(settings=settings), cursor
+
+
+class ReportProfilePhoto(TLRequest[bool]):
+    __tl_id__ = 0xfa8cc6f5
+    __tl_name__ = "functions.account.ReportProfilePhoto"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "photo_id", "reason", "message", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, photo_id: tl.base.InputPhoto, reason: tl.base.ReportReason, message: str):
+        self.peer = peer
+        self.photo_id = photo_id
+        self.reason = reason
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.photo_id.write_to(out, ctx)
+        self.reason.write_to(out, ctx)
+        String.write_to(out, self.message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportProfilePhoto:
+        peer = TLObject.read(stream)
+        photo_id = TLObject.read(stream)
+        reason = TLObject.read(stream)
+        message = String.read(stream)
+        return cls(peer=peer, photo_id=photo_id, reason=reason, message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportProfilePhoto, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        photo_id, cursor = TLObject.read_from(view, cursor)
+        reason, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, photo_id=photo_id, reason=reason, message=message), cursor
+
+
+class ResetPassword(TLRequest[tl.base.account.ResetPasswordResult]):
+    __tl_id__ = 0x9308ce1b
+    __tl_name__ = "functions.account.ResetPassword"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetPassword:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetPassword, int]:
+        return cls(), cursor
+
+
+class DeclinePasswordReset(TLRequest[bool]):
+    __tl_id__ = 0x4c9409f6
+    __tl_name__ = "functions.account.DeclinePasswordReset"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeclinePasswordReset:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeclinePasswordReset, int]:
+        return cls(), cursor
+
+
+class GetChatThemes(TLRequest[tl.base.account.Themes]):
+    __tl_id__ = 0xd638de89
+    __tl_name__ = "functions.account.GetChatThemes"
+    __tl_layer__ = 134
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChatThemes:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChatThemes, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class SetAuthorizationTTL(TLRequest[bool]):
+    __tl_id__ = 0xbf899aa0
+    __tl_name__ = "functions.account.SetAuthorizationTTL"
+    __tl_layer__ = 135
+
+    __slots__ = ("authorization_ttl_days", )
+
+    def __init__(self, *, authorization_ttl_days: int):
+        self.authorization_ttl_days = authorization_ttl_days
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.authorization_ttl_days)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetAuthorizationTTL:
+        authorization_ttl_days = Int.read(stream)
+        return cls(authorization_ttl_days=authorization_ttl_days)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetAuthorizationTTL, int]:
+        authorization_ttl_days, cursor = Int.read_from(view, cursor)
+        return cls(authorization_ttl_days=authorization_ttl_days), cursor
+
+
+class ChangeAuthorizationSettings(TLRequest[bool]):
+    __tl_id__ = 0x40f48462
+    __tl_name__ = "functions.account.ChangeAuthorizationSettings"
+    __tl_layer__ = 135
+
+    __slots__ = ("confirmed", "hash", "encrypted_requests_disabled", "call_requests_disabled", )
+
+    def __init__(self, *, hash: int, confirmed: bool = False, encrypted_requests_disabled: bool = False, call_requests_disabled: bool = False):
+        self.confirmed = confirmed
+        self.hash = hash
+        self.encrypted_requests_disabled = encrypted_requests_disabled
+        self.call_requests_disabled = call_requests_disabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.confirmed: flags1 |= (1 << 3)
+        if self.encrypted_requests_disabled is not None: flags1 |= (1 << 0)
+        if self.call_requests_disabled is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Long.write(self.hash)
+        if self.encrypted_requests_disabled is not None:
+            out += Bool.write(self.encrypted_requests_disabled)
+        if self.call_requests_disabled is not None:
+            out += Bool.write(self.call_requests_disabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChangeAuthorizationSettings:
+        flags1 = Int.read(stream)
+        confirmed = (flags1 & (1 << 3)) == (1 << 3)
+        hash = Long.read(stream)
+        encrypted_requests_disabled = Bool.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        call_requests_disabled = Bool.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(confirmed=confirmed, hash=hash, encrypted_requests_disabled=encrypted_requests_disabled, call_requests_disabled=call_requests_disabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChangeAuthorizationSettings, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        confirmed = (flags1 & (1 << 3)) == (1 << 3)
+        hash, cursor = Long.read_from(view, cursor)
+        encrypted_requests_disabled, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        call_requests_disabled, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(confirmed=confirmed, hash=hash, encrypted_requests_disabled=encrypted_requests_disabled, call_requests_disabled=call_requests_disabled), cursor
+
+
+class GetSavedRingtones(TLRequest[tl.base.account.SavedRingtones]):
+    __tl_id__ = 0xe1902288
+    __tl_name__ = "functions.account.GetSavedRingtones"
+    __tl_layer__ = 140
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSavedRingtones:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSavedRingtones, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class SaveRingtone(TLRequest[tl.base.account.SavedRingtone]):
+    __tl_id__ = 0x3dea5b03
+    __tl_name__ = "functions.account.SaveRingtone"
+    __tl_layer__ = 140
+
+    __slots__ = ("id", "unsave", )
+
+    def __init__(self, *, id: tl.base.InputDocument, unsave: bool):
+        self.id = id
+        self.unsave = unsave
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+        out += Bool.write(self.unsave)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveRingtone:
+        id = TLObject.read(stream)
+        unsave = Bool.read(stream)
+        return cls(id=id, unsave=unsave)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveRingtone, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        unsave, cursor = Bool.read_from(view, cursor)
+        return cls(id=id, unsave=unsave), cursor
+
+
+class UploadRingtone(TLRequest[tl.base.Document]):
+    __tl_id__ = 0x831a83a2
+    __tl_name__ = "functions.account.UploadRingtone"
+    __tl_layer__ = 140
+
+    __slots__ = ("file", "file_name", "mime_type", )
+
+    def __init__(self, *, file: tl.base.InputFile, file_name: str, mime_type: str):
+        self.file = file
+        self.file_name = file_name
+        self.mime_type = mime_type
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.file.write_to(out, ctx)
+        String.write_to(out, self.file_name)
+        String.write_to(out, self.mime_type)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadRingtone:
+        file = TLObject.read(stream)
+        file_name = String.read(stream)
+        mime_type = String.read(stream)
+        return cls(file=file, file_name=file_name, mime_type=mime_type)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadRingtone, int]:
+        file, cursor = TLObject.read_from(view, cursor)
+        file_name, cursor = String.read_from(view, cursor)
+        mime_type, cursor = String.read_from(view, cursor)
+        return cls(file=file, file_name=file_name, mime_type=mime_type), cursor
+
+
+class UpdateEmojiStatus(TLRequest[bool]):
+    __tl_id__ = 0xfbd3de6b
+    __tl_name__ = "functions.account.UpdateEmojiStatus"
+    __tl_layer__ = 145
+
+    __slots__ = ("emoji_status", )
+
+    def __init__(self, *, emoji_status: tl.base.EmojiStatus):
+        self.emoji_status = emoji_status
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.emoji_status.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateEmojiStatus:
+        emoji_status = TLObject.read(stream)
+        return cls(emoji_status=emoji_status)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateEmojiStatus, int]:
+        emoji_status, cursor = TLObject.read_from(view, cursor)
+        return cls(emoji_status=emoji_status), cursor
+
+
+class GetDefaultEmojiStatuses(TLRequest[tl.base.account.EmojiStatuses]):
+    __tl_id__ = 0xd6753386
+    __tl_name__ = "functions.account.GetDefaultEmojiStatuses"
+    __tl_layer__ = 145
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDefaultEmojiStatuses:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDefaultEmojiStatuses, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetRecentEmojiStatuses(TLRequest[tl.base.account.EmojiStatuses]):
+    __tl_id__ = 0xf578105
+    __tl_name__ = "functions.account.GetRecentEmojiStatuses"
+    __tl_layer__ = 145
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetRecentEmojiStatuses:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetRecentEmojiStatuses, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class ClearRecentEmojiStatuses(TLRequest[bool]):
+    __tl_id__ = 0x18201aae
+    __tl_name__ = "functions.account.ClearRecentEmojiStatuses"
+    __tl_layer__ = 145
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClearRecentEmojiStatuses:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClearRecentEmojiStatuses, int]:
+        return cls(), cursor
+
+
+class ReorderUsernames(TLRequest[bool]):
+    __tl_id__ = 0xef500eab
+    __tl_name__ = "functions.account.ReorderUsernames"
+    __tl_layer__ = 148
+
+    __slots__ = ("order", )
+
+    def __init__(self, *, order: list[str]):
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += StringVector.write(self.order)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReorderUsernames:
+        order = StringVector.read(stream)
+        return cls(order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReorderUsernames, int]:
+        order, cursor = StringVector.read_from(view, cursor)
+        return cls(order=order), cursor
+
+
+class ToggleUsername(TLRequest[bool]):
+    __tl_id__ = 0x58d6b376
+    __tl_name__ = "functions.account.ToggleUsername"
+    __tl_layer__ = 148
+
+    __slots__ = ("username", "active", )
+
+    def __init__(self, *, username: str, active: bool):
+        self.username = username
+        self.active = active
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.username)
+        out += Bool.write(self.active)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleUsername:
+        username = String.read(stream)
+        active = Bool.read(stream)
+        return cls(username=username, active=active)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleUsername, int]:
+        username, cursor = String.read_from(view, cursor)
+        active, cursor = Bool.read_from(view, cursor)
+        return cls(username=username, active=active), cursor
+
+
+class GetDefaultProfilePhotoEmojis(TLRequest[tl.base.EmojiList]):
+    __tl_id__ = 0xe2750328
+    __tl_name__ = "functions.account.GetDefaultProfilePhotoEmojis"
+    __tl_layer__ = 152
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDefaultProfilePhotoEmojis:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDefaultProfilePhotoEmojis, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetDefaultGroupPhotoEmojis(TLRequest[tl.base.EmojiList]):
+    __tl_id__ = 0x915860ae
+    __tl_name__ = "functions.account.GetDefaultGroupPhotoEmojis"
+    __tl_layer__ = 152
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDefaultGroupPhotoEmojis:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDefaultGroupPhotoEmojis, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetAutoSaveSettings(TLRequest[tl.types.account.AutoSaveSettings]):
+    __tl_id__ = 0xadcbbcda
+    __tl_name__ = "functions.account.GetAutoSaveSettings"
+    __tl_layer__ = 152
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAutoSaveSettings:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAutoSaveSettings, int]:
+        return cls(), cursor
+
+
+class SaveAutoSaveSettings(TLRequest[bool]):
+    __tl_id__ = 0xd69b8361
+    __tl_name__ = "functions.account.SaveAutoSaveSettings"
+    __tl_layer__ = 152
+
+    __slots__ = ("users", "chats", "broadcasts", "peer", "settings", )
+
+    def __init__(self, *, settings: tl.types.AutoSaveSettings, users: bool = False, chats: bool = False, broadcasts: bool = False, peer: tl.base.InputPeer | None = None):
+        self.users = users
+        self.chats = chats
+        self.broadcasts = broadcasts
+        self.peer = peer
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.users: flags1 |= (1 << 0)
+        if self.chats: flags1 |= (1 << 1)
+        if self.broadcasts: flags1 |= (1 << 2)
+        if self.peer is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        if self.peer is not None:
+            self.peer.write_to(out, ctx)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveAutoSaveSettings:
+        flags1 = Int.read(stream)
+        users = (flags1 & (1 << 0)) == (1 << 0)
+        chats = (flags1 & (1 << 1)) == (1 << 1)
+        broadcasts = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        settings = tl.types.AutoSaveSettings.read(stream)
+        return cls(users=users, chats=chats, broadcasts=broadcasts, peer=peer, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveAutoSaveSettings, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        users = (flags1 & (1 << 0)) == (1 << 0)
+        chats = (flags1 & (1 << 1)) == (1 << 1)
+        broadcasts = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        settings, cursor = tl.types.AutoSaveSettings.read_from(view, cursor)
+        return cls(users=users, chats=chats, broadcasts=broadcasts, peer=peer, settings=settings), cursor
+
+
+class DeleteAutoSaveExceptions(TLRequest[bool]):
+    __tl_id__ = 0x53bc0020
+    __tl_name__ = "functions.account.DeleteAutoSaveExceptions"
+    __tl_layer__ = 152
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteAutoSaveExceptions:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteAutoSaveExceptions, int]:
+        return cls(), cursor
+
+
+class InvalidateSignInCodes(TLRequest[bool]):
+    __tl_id__ = 0xca8ae8ba
+    __tl_name__ = "functions.account.InvalidateSignInCodes"
+    __tl_layer__ = 160
+
+    __slots__ = ("codes", )
+
+    def __init__(self, *, codes: list[str]):
+        self.codes = codes
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += StringVector.write(self.codes)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvalidateSignInCodes:
+        codes = StringVector.read(stream)
+        return cls(codes=codes)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvalidateSignInCodes, int]:
+        codes, cursor = StringVector.read_from(view, cursor)
+        return cls(codes=codes), cursor
+
+
+class UpdateColor(TLRequest[bool]):
+    __tl_id__ = 0x7cefa15d
+    __tl_name__ = "functions.account.UpdateColor"
+    __tl_layer__ = 167
+
+    __slots__ = ("for_profile", "color", "background_emoji_id", )
+
+    def __init__(self, *, for_profile: bool = False, color: int | None = None, background_emoji_id: int | None = None):
+        self.for_profile = for_profile
+        self.color = color
+        self.background_emoji_id = background_emoji_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.for_profile: flags1 |= (1 << 1)
+        if self.color is not None: flags1 |= (1 << 2)
+        if self.background_emoji_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.color is not None:
+            out += Int.write(self.color)
+        if self.background_emoji_id is not None:
+            out += Long.write(self.background_emoji_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateColor:
+        flags1 = Int.read(stream)
+        for_profile = (flags1 & (1 << 1)) == (1 << 1)
+        color = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        background_emoji_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(for_profile=for_profile, color=color, background_emoji_id=background_emoji_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateColor, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        for_profile = (flags1 & (1 << 1)) == (1 << 1)
+        color, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        background_emoji_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(for_profile=for_profile, color=color, background_emoji_id=background_emoji_id), cursor
+
+
+class GetDefaultBackgroundEmojis(TLRequest[tl.base.EmojiList]):
+    __tl_id__ = 0xa60ab9ce
+    __tl_name__ = "functions.account.GetDefaultBackgroundEmojis"
+    __tl_layer__ = 166
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDefaultBackgroundEmojis:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDefaultBackgroundEmojis, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetChannelDefaultEmojiStatuses(TLRequest[tl.base.account.EmojiStatuses]):
+    __tl_id__ = 0x7727a7d5
+    __tl_name__ = "functions.account.GetChannelDefaultEmojiStatuses"
+    __tl_layer__ = 168
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChannelDefaultEmojiStatuses:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChannelDefaultEmojiStatuses, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetChannelRestrictedStatusEmojis(TLRequest[tl.base.EmojiList]):
+    __tl_id__ = 0x35a9e0d5
+    __tl_name__ = "functions.account.GetChannelRestrictedStatusEmojis"
+    __tl_layer__ = 168
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChannelRestrictedStatusEmojis:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChannelRestrictedStatusEmojis, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class UpdateBusinessWorkHours(TLRequest[bool]):
+    __tl_id__ = 0x4b00e066
+    __tl_name__ = "functions.account.UpdateBusinessWorkHours"
+    __tl_layer__ = 176
+
+    __slots__ = ("business_work_hours", )
+
+    def __init__(self, *, business_work_hours: tl.types.BusinessWorkHours | None = None):
+        self.business_work_hours = business_work_hours
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.business_work_hours is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.business_work_hours is not None:
+            self.business_work_hours.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateBusinessWorkHours:
+        flags1 = Int.read(stream)
+        business_work_hours = tl.types.BusinessWorkHours.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(business_work_hours=business_work_hours)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateBusinessWorkHours, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        business_work_hours, cursor = tl.types.BusinessWorkHours.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(business_work_hours=business_work_hours), cursor
+
+
+class UpdateBusinessLocation(TLRequest[bool]):
+    __tl_id__ = 0x9e6b131a
+    __tl_name__ = "functions.account.UpdateBusinessLocation"
+    __tl_layer__ = 176
+
+    __slots__ = ("geo_point", "address", )
+
+    def __init__(self, *, geo_point: tl.base.InputGeoPoint | None = None, address: str | None = None):
+        self.geo_point = geo_point
+        self.address = address
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.geo_point is not None: flags1 |= (1 << 1)
+        if self.address is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.geo_point is not None:
+            self.geo_point.write_to(out, ctx)
+        if self.address is not None:
+            String.write_to(out, self.address)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateBusinessLocation:
+        flags1 = Int.read(stream)
+        geo_point = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        address = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(geo_point=geo_point, address=address)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateBusinessLocation, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        geo_point, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        address, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(geo_point=geo_point, address=address), cursor
+
+
+class UpdateBusinessGreetingMessage(TLRequest[bool]):
+    __tl_id__ = 0x66cdafc4
+    __tl_name__ = "functions.account.UpdateBusinessGreetingMessage"
+    __tl_layer__ = 176
+
+    __slots__ = ("message", )
+
+    def __init__(self, *, message: tl.types.InputBusinessGreetingMessage | None = None):
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.message is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.message is not None:
+            self.message.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateBusinessGreetingMessage:
+        flags1 = Int.read(stream)
+        message = tl.types.InputBusinessGreetingMessage.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateBusinessGreetingMessage, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        message, cursor = tl.types.InputBusinessGreetingMessage.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(message=message), cursor
+
+
+class UpdateBusinessAwayMessage(TLRequest[bool]):
+    __tl_id__ = 0xa26a7fa5
+    __tl_name__ = "functions.account.UpdateBusinessAwayMessage"
+    __tl_layer__ = 176
+
+    __slots__ = ("message", )
+
+    def __init__(self, *, message: tl.types.InputBusinessAwayMessage | None = None):
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.message is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.message is not None:
+            self.message.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateBusinessAwayMessage:
+        flags1 = Int.read(stream)
+        message = tl.types.InputBusinessAwayMessage.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateBusinessAwayMessage, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        message, cursor = tl.types.InputBusinessAwayMessage.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(message=message), cursor
+
+
+class UpdateConnectedBot(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x66a08c7e
+    __tl_name__ = "functions.account.UpdateConnectedBot"
+    __tl_layer__ = 201
+
+    __slots__ = ("deleted", "rights", "bot", "recipients", )
+
+    def __init__(self, *, bot: tl.base.InputUser, recipients: tl.types.InputBusinessBotRecipients, deleted: bool = False, rights: tl.types.BusinessBotRights | None = None):
+        self.deleted = deleted
+        self.rights = rights
+        self.bot = bot
+        self.recipients = recipients
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.deleted: flags1 |= (1 << 1)
+        if self.rights is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.rights is not None:
+            self.rights.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        self.recipients.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateConnectedBot:
+        flags1 = Int.read(stream)
+        deleted = (flags1 & (1 << 1)) == (1 << 1)
+        rights = tl.types.BusinessBotRights.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        bot = TLObject.read(stream)
+        recipients = tl.types.InputBusinessBotRecipients.read(stream)
+        return cls(deleted=deleted, rights=rights, bot=bot, recipients=recipients)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateConnectedBot, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        deleted = (flags1 & (1 << 1)) == (1 << 1)
+        rights, cursor = tl.types.BusinessBotRights.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        recipients, cursor = tl.types.InputBusinessBotRecipients.read_from(view, cursor)
+        return cls(deleted=deleted, rights=rights, bot=bot, recipients=recipients), cursor
+
+
+class GetConnectedBots(TLRequest[tl.types.account.ConnectedBots]):
+    __tl_id__ = 0x4ea4c80f
+    __tl_name__ = "functions.account.GetConnectedBots"
+    __tl_layer__ = 176
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetConnectedBots:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetConnectedBots, int]:
+        return cls(), cursor
+
+
+class GetBotBusinessConnection(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x76a86270
+    __tl_name__ = "functions.account.GetBotBusinessConnection"
+    __tl_layer__ = 177
+
+    __slots__ = ("connection_id", )
+
+    def __init__(self, *, connection_id: str):
+        self.connection_id = connection_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.connection_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBotBusinessConnection:
+        connection_id = String.read(stream)
+        return cls(connection_id=connection_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBotBusinessConnection, int]:
+        connection_id, cursor = String.read_from(view, cursor)
+        return cls(connection_id=connection_id), cursor
+
+
+class UpdateBusinessIntro(TLRequest[bool]):
+    __tl_id__ = 0xa614d034
+    __tl_name__ = "functions.account.UpdateBusinessIntro"
+    __tl_layer__ = 177
+
+    __slots__ = ("intro", )
+
+    def __init__(self, *, intro: tl.types.InputBusinessIntro | None = None):
+        self.intro = intro
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.intro is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.intro is not None:
+            self.intro.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateBusinessIntro:
+        flags1 = Int.read(stream)
+        intro = tl.types.InputBusinessIntro.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(intro=intro)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateBusinessIntro, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        intro, cursor = tl.types.InputBusinessIntro.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(intro=intro), cursor
+
+
+class ToggleConnectedBotPaused(TLRequest[bool]):
+    __tl_id__ = 0x646e1097
+    __tl_name__ = "functions.account.ToggleConnectedBotPaused"
+    __tl_layer__ = 177
+
+    __slots__ = ("peer", "paused", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, paused: bool):
+        self.peer = peer
+        self.paused = paused
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Bool.write(self.paused)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleConnectedBotPaused:
+        peer = TLObject.read(stream)
+        paused = Bool.read(stream)
+        return cls(peer=peer, paused=paused)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleConnectedBotPaused, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        paused, cursor = Bool.read_from(view, cursor)
+        return cls(peer=peer, paused=paused), cursor
+
+
+class DisablePeerConnectedBot(TLRequest[bool]):
+    __tl_id__ = 0x5e437ed9
+    __tl_name__ = "functions.account.DisablePeerConnectedBot"
+    __tl_layer__ = 177
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DisablePeerConnectedBot:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DisablePeerConnectedBot, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class UpdateBirthday(TLRequest[bool]):
+    __tl_id__ = 0xcc6e0c11
+    __tl_name__ = "functions.account.UpdateBirthday"
+    __tl_layer__ = 177
+
+    __slots__ = ("birthday", )
+
+    def __init__(self, *, birthday: tl.types.Birthday | None = None):
+        self.birthday = birthday
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.birthday is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.birthday is not None:
+            self.birthday.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateBirthday:
+        flags1 = Int.read(stream)
+        birthday = tl.types.Birthday.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(birthday=birthday)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateBirthday, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        birthday, cursor = tl.types.Birthday.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(birthday=birthday), cursor
+
+
+class CreateBusinessChatLink(TLRequest[tl.types.BusinessChatLink]):
+    __tl_id__ = 0x8851e68e
+    __tl_name__ = "functions.account.CreateBusinessChatLink"
+    __tl_layer__ = 177
+
+    __slots__ = ("link", )
+
+    def __init__(self, *, link: tl.types.InputBusinessChatLink):
+        self.link = link
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.link.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateBusinessChatLink:
+        link = tl.types.InputBusinessChatLink.read(stream)
+        return cls(link=link)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateBusinessChatLink, int]:
+        link, cursor = tl.types.InputBusinessChatLink.read_from(view, cursor)
+        return cls(link=link), cursor
+
+
+class EditBusinessChatLink(TLRequest[tl.types.BusinessChatLink]):
+    __tl_id__ = 0x8c3410af
+    __tl_name__ = "functions.account.EditBusinessChatLink"
+    __tl_layer__ = 177
+
+    __slots__ = ("slug", "link", )
+
+    def __init__(self, *, slug: str, link: tl.types.InputBusinessChatLink):
+        self.slug = slug
+        self.link = link
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.slug)
+        self.link.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditBusinessChatLink:
+        slug = String.read(stream)
+        link = tl.types.InputBusinessChatLink.read(stream)
+        return cls(slug=slug, link=link)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditBusinessChatLink, int]:
+        slug, cursor = String.read_from(view, cursor)
+        link, cursor = tl.types.InputBusinessChatLink.read_from(view, cursor)
+        return cls(slug=slug, link=link), cursor
+
+
+class DeleteBusinessChatLink(TLRequest[bool]):
+    __tl_id__ = 0x60073674
+    __tl_name__ = "functions.account.DeleteBusinessChatLink"
+    __tl_layer__ = 177
+
+    __slots__ = ("slug", )
+
+    def __init__(self, *, slug: str):
+        self.slug = slug
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.slug)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteBusinessChatLink:
+        slug = String.read(stream)
+        return cls(slug=slug)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteBusinessChatLink, int]:
+        slug, cursor = String.read_from(view, cursor)
+        return cls(slug=slug), cursor
+
+
+class GetBusinessChatLinks(TLRequest[tl.types.account.BusinessChatLinks]):
+    __tl_id__ = 0x6f70dde1
+    __tl_name__ = "functions.account.GetBusinessChatLinks"
+    __tl_layer__ = 177
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBusinessChatLinks:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBusinessChatLinks, int]:
+        return cls(), cursor
+
+
+class ResolveBusinessChatLink(TLRequest[tl.types.account.ResolvedBusinessChatLinks]):
+    __tl_id__ = 0x5492e5ee
+    __tl_name__ = "functions.account.ResolveBusinessChatLink"
+    __tl_layer__ = 177
+
+    __slots__ = ("slug", )
+
+    def __init__(self, *, slug: str):
+        self.slug = slug
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.slug)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResolveBusinessChatLink:
+        slug = String.read(stream)
+        return cls(slug=slug)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResolveBusinessChatLink, int]:
+        slug, cursor = String.read_from(view, cursor)
+        return cls(slug=slug), cursor
+
+
+class UpdatePersonalChannel(TLRequest[bool]):
+    __tl_id__ = 0xd94305e0
+    __tl_name__ = "functions.account.UpdatePersonalChannel"
+    __tl_layer__ = 177
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdatePersonalChannel:
+        channel = TLObject.read(stream)
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdatePersonalChannel, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel), cursor
+
+
+class ToggleSponsoredMessages(TLRequest[bool]):
+    __tl_id__ = 0xb9d9a38d
+    __tl_name__ = "functions.account.ToggleSponsoredMessages"
+    __tl_layer__ = 179
+
+    __slots__ = ("enabled", )
+
+    def __init__(self, *, enabled: bool):
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleSponsoredMessages:
+        enabled = Bool.read(stream)
+        return cls(enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleSponsoredMessages, int]:
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(enabled=enabled), cursor
+
+
+class GetReactionsNotifySettings(TLRequest[tl.types.ReactionsNotifySettings]):
+    __tl_id__ = 0x6dd654c
+    __tl_name__ = "functions.account.GetReactionsNotifySettings"
+    __tl_layer__ = 179
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetReactionsNotifySettings:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetReactionsNotifySettings, int]:
+        return cls(), cursor
+
+
+class SetReactionsNotifySettings(TLRequest[tl.types.ReactionsNotifySettings]):
+    __tl_id__ = 0x316ce548
+    __tl_name__ = "functions.account.SetReactionsNotifySettings"
+    __tl_layer__ = 179
+
+    __slots__ = ("settings", )
+
+    def __init__(self, *, settings: tl.types.ReactionsNotifySettings):
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetReactionsNotifySettings:
+        settings = tl.types.ReactionsNotifySettings.read(stream)
+        return cls(settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetReactionsNotifySettings, int]:
+        settings, cursor = tl.types.ReactionsNotifySettings.read_from(view, cursor)
+        return cls(settings=settings), cursor
+
+
+class GetCollectibleEmojiStatuses(TLRequest[tl.base.account.EmojiStatuses]):
+    __tl_id__ = 0x2e7b4543
+    __tl_name__ = "functions.account.GetCollectibleEmojiStatuses"
+    __tl_layer__ = 198
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCollectibleEmojiStatuses:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCollectibleEmojiStatuses, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class AddNoPaidMessagesException(TLRequest[bool]):
+    __tl_id__ = 0x6f688aa7
+    __tl_name__ = "functions.account.AddNoPaidMessagesException"
+    __tl_layer__ = 200
+
+    __slots__ = ("refund_charged", "user_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, refund_charged: bool = False):
+        self.refund_charged = refund_charged
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.refund_charged: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AddNoPaidMessagesException:
+        flags1 = Int.read(stream)
+        refund_charged = (flags1 & (1 << 0)) == (1 << 0)
+        user_id = TLObject.read(stream)
+        return cls(refund_charged=refund_charged, user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AddNoPaidMessagesException, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        refund_charged = (flags1 & (1 << 0)) == (1 << 0)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(refund_charged=refund_charged, user_id=user_id), cursor
+
+
+class GetPaidMessagesRevenue(TLRequest[tl.types.account.PaidMessagesRevenue]):
+    __tl_id__ = 0xf1266f38
+    __tl_name__ = "functions.account.GetPaidMessagesRevenue"
+    __tl_layer__ = 200
+
+    __slots__ = ("user_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser):
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPaidMessagesRevenue:
+        user_id = TLObject.read(stream)
+        return cls(user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPaidMessagesRevenue, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(user_id=user_id), cursor
+
+
+class RegisterDevice_70(TLRequest[bool]):
+    __tl_id__ = 0x637ea878
+    __tl_name__ = "functions.account.RegisterDevice_70"
+    __tl_layer__ = 70
+
+    __slots__ = ("token_type", "token", )
+
+    def __init__(self, *, token_type: int, token: str):
+        self.token_type = token_type
+        self.token = token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.token_type)
+        String.write_to(out, self.token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RegisterDevice_70:
+        token_type = Int.read(stream)
+        token = String.read(stream)
+        return cls(token_type=token_type, token=token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RegisterDevice_70, int]:
+        token_type, cursor = Int.read_from(view, cursor)
+        token, cursor = String.read_from(view, cursor)
+        return cls(token_type=token_type, token=token), cursor
+
+
+class UnregisterDevice_70(TLRequest[bool]):
+    __tl_id__ = 0x65c55b40
+    __tl_name__ = "functions.account.UnregisterDevice_70"
+    __tl_layer__ = 70
+
+    __slots__ = ("token_type", "token", )
+
+    def __init__(self, *, token_type: int, token: str):
+        self.token_type = token_type
+        self.token = token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.token_type)
+        String.write_to(out, self.token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UnregisterDevice_70:
+        token_type = Int.read(stream)
+        token = String.read(stream)
+        return cls(token_type=token_type, token=token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UnregisterDevice_70, int]:
+        token_type, cursor = Int.read_from(view, cursor)
+        token, cursor = String.read_from(view, cursor)
+        return cls(token_type=token_type, token=token), cursor
+
+
+class DeleteAccount_133(TLRequest[bool]):
+    __tl_id__ = 0x418d4e0b
+    __tl_name__ = "functions.account.DeleteAccount_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("reason", )
+
+    def __init__(self, *, reason: str):
+        self.reason = reason
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.reason)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteAccount_133:
+        reason = String.read(stream)
+        return cls(reason=reason)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteAccount_133, int]:
+        reason, cursor = String.read_from(view, cursor)
+        return cls(reason=reason), cursor
+
+
+class SendVerifyEmailCode_133(TLRequest[tl.types.account.SentEmailCode]):
+    __tl_id__ = 0x7011509f
+    __tl_name__ = "functions.account.SendVerifyEmailCode_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("email", )
+
+    def __init__(self, *, email: str):
+        self.email = email
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.email)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendVerifyEmailCode_133:
+        email = String.read(stream)
+        return cls(email=email)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendVerifyEmailCode_133, int]:
+        email, cursor = String.read_from(view, cursor)
+        return cls(email=email), cursor
+
+
+class VerifyEmail_133(TLRequest[bool]):
+    __tl_id__ = 0xecba39db
+    __tl_name__ = "functions.account.VerifyEmail_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("email", "code", )
+
+    def __init__(self, *, email: str, code: str):
+        self.email = email
+        self.code = code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.email)
+        String.write_to(out, self.code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> VerifyEmail_133:
+        email = String.read(stream)
+        code = String.read(stream)
+        return cls(email=email, code=code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[VerifyEmail_133, int]:
+        email, cursor = String.read_from(view, cursor)
+        code, cursor = String.read_from(view, cursor)
+        return cls(email=email, code=code), cursor
+
+
+class InitTakeoutSession_133(TLRequest[tl.types.account.Takeout]):
+    __tl_id__ = 0xf05b4804
+    __tl_name__ = "functions.account.InitTakeoutSession_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("contacts", "message_users", "message_chats", "message_megagroups", "message_channels", "files", "file_max_size", )
+
+    def __init__(self, *, contacts: bool = False, message_users: bool = False, message_chats: bool = False, message_megagroups: bool = False, message_channels: bool = False, files: bool = False, file_max_size: int | None = None):
+        self.contacts = contacts
+        self.message_users = message_users
+        self.message_chats = message_chats
+        self.message_megagroups = message_megagroups
+        self.message_channels = message_channels
+        self.files = files
+        self.file_max_size = file_max_size
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.files is False, self.file_max_size is None)
+        _flags_fields_not_empty = (self.files is True, self.file_max_size is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: files, file_max_size")
+        flags1 = 0
+        if self.contacts: flags1 |= (1 << 0)
+        if self.message_users: flags1 |= (1 << 1)
+        if self.message_chats: flags1 |= (1 << 2)
+        if self.message_megagroups: flags1 |= (1 << 3)
+        if self.message_channels: flags1 |= (1 << 4)
+        if self.files: flags1 |= (1 << 5)
+        if self.file_max_size is not None: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        if self.file_max_size is not None:
+            out += Int.write(self.file_max_size)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InitTakeoutSession_133:
+        flags1 = Int.read(stream)
+        contacts = (flags1 & (1 << 0)) == (1 << 0)
+        message_users = (flags1 & (1 << 1)) == (1 << 1)
+        message_chats = (flags1 & (1 << 2)) == (1 << 2)
+        message_megagroups = (flags1 & (1 << 3)) == (1 << 3)
+        message_channels = (flags1 & (1 << 4)) == (1 << 4)
+        files = (flags1 & (1 << 5)) == (1 << 5)
+        file_max_size = Int.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        return cls(contacts=contacts, message_users=message_users, message_chats=message_chats, message_megagroups=message_megagroups, message_channels=message_channels, files=files, file_max_size=file_max_size)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InitTakeoutSession_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        contacts = (flags1 & (1 << 0)) == (1 << 0)
+        message_users = (flags1 & (1 << 1)) == (1 << 1)
+        message_chats = (flags1 & (1 << 2)) == (1 << 2)
+        message_megagroups = (flags1 & (1 << 3)) == (1 << 3)
+        message_channels = (flags1 & (1 << 4)) == (1 << 4)
+        files = (flags1 & (1 << 5)) == (1 << 5)
+        file_max_size, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        return cls(contacts=contacts, message_users=message_users, message_chats=message_chats, message_megagroups=message_megagroups, message_channels=message_channels, files=files, file_max_size=file_max_size), cursor
+
+
+class UploadWallPaper_133(TLRequest[tl.base.WallPaper]):
+    __tl_id__ = 0xdd853661
+    __tl_name__ = "functions.account.UploadWallPaper_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("file", "mime_type", "settings", )
+
+    def __init__(self, *, file: tl.base.InputFile, mime_type: str, settings: tl.base.WallPaperSettings):
+        self.file = file
+        self.mime_type = mime_type
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.file.write_to(out, ctx)
+        String.write_to(out, self.mime_type)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadWallPaper_133:
+        file = TLObject.read(stream)
+        mime_type = String.read(stream)
+        settings = TLObject.read(stream)
+        return cls(file=file, mime_type=mime_type, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadWallPaper_133, int]:
+        file, cursor = TLObject.read_from(view, cursor)
+        mime_type, cursor = String.read_from(view, cursor)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(file=file, mime_type=mime_type, settings=settings), cursor
+
+
+class CreateTheme_133(TLRequest[tl.base.Theme]):
+    __tl_id__ = 0x8432c21f
+    __tl_name__ = "functions.account.CreateTheme_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("slug", "title", "document", "settings", )
+
+    def __init__(self, *, slug: str, title: str, document: tl.base.InputDocument | None = None, settings: tl.types.InputThemeSettings | None = None):
+        self.slug = slug
+        self.title = title
+        self.document = document
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.document is not None: flags1 |= (1 << 2)
+        if self.settings is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        String.write_to(out, self.slug)
+        String.write_to(out, self.title)
+        if self.document is not None:
+            self.document.write_to(out, ctx)
+        if self.settings is not None:
+            self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateTheme_133:
+        flags1 = Int.read(stream)
+        slug = String.read(stream)
+        title = String.read(stream)
+        document = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        settings = tl.types.InputThemeSettings.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(slug=slug, title=title, document=document, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateTheme_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        slug, cursor = String.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        document, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        settings, cursor = tl.types.InputThemeSettings.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(slug=slug, title=title, document=document, settings=settings), cursor
+
+
+class UpdateTheme_133(TLRequest[tl.base.Theme]):
+    __tl_id__ = 0x5cb367d5
+    __tl_name__ = "functions.account.UpdateTheme_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("format", "theme", "slug", "title", "document", "settings", )
+
+    def __init__(self, *, format: str, theme: tl.base.InputTheme, slug: str | None = None, title: str | None = None, document: tl.base.InputDocument | None = None, settings: tl.types.InputThemeSettings | None = None):
+        self.format = format
+        self.theme = theme
+        self.slug = slug
+        self.title = title
+        self.document = document
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.slug is not None: flags1 |= (1 << 0)
+        if self.title is not None: flags1 |= (1 << 1)
+        if self.document is not None: flags1 |= (1 << 2)
+        if self.settings is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        String.write_to(out, self.format)
+        self.theme.write_to(out, ctx)
+        if self.slug is not None:
+            String.write_to(out, self.slug)
+        if self.title is not None:
+            String.write_to(out, self.title)
+        if self.document is not None:
+            self.document.write_to(out, ctx)
+        if self.settings is not None:
+            self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateTheme_133:
+        flags1 = Int.read(stream)
+        format = String.read(stream)
+        theme = TLObject.read(stream)
+        slug = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        title = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        document = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        settings = tl.types.InputThemeSettings.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(format=format, theme=theme, slug=slug, title=title, document=document, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateTheme_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        format, cursor = String.read_from(view, cursor)
+        theme, cursor = TLObject.read_from(view, cursor)
+        slug, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        document, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        settings, cursor = tl.types.InputThemeSettings.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(format=format, theme=theme, slug=slug, title=title, document=document, settings=settings), cursor
+
+
+class InstallTheme_133(TLRequest[bool]):
+    __tl_id__ = 0x7ae43737
+    __tl_name__ = "functions.account.InstallTheme_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("dark", "format", "theme", )
+
+    def __init__(self, *, dark: bool = False, format: str | None = None, theme: tl.base.InputTheme | None = None):
+        self.dark = dark
+        self.format = format
+        self.theme = theme
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.format is None, self.theme is None)
+        _flags_fields_not_empty = (self.format is not None, self.theme is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: format, theme")
+        flags1 = 0
+        if self.dark: flags1 |= (1 << 0)
+        if self.format is not None: flags1 |= (1 << 1)
+        if self.theme is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.format is not None:
+            String.write_to(out, self.format)
+        if self.theme is not None:
+            self.theme.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InstallTheme_133:
+        flags1 = Int.read(stream)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        format = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        theme = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(dark=dark, format=format, theme=theme)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InstallTheme_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        format, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        theme, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(dark=dark, format=format, theme=theme), cursor
+
+
+class GetTheme_133(TLRequest[tl.base.Theme]):
+    __tl_id__ = 0x8d9d742b
+    __tl_name__ = "functions.account.GetTheme_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("format", "theme", "document_id", )
+
+    def __init__(self, *, format: str, theme: tl.base.InputTheme, document_id: int):
+        self.format = format
+        self.theme = theme
+        self.document_id = document_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.format)
+        self.theme.write_to(out, ctx)
+        out += Long.write(self.document_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetTheme_133:
+        format = String.read(stream)
+        theme = TLObject.read(stream)
+        document_id = Long.read(stream)
+        return cls(format=format, theme=theme, document_id=document_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetTheme_133, int]:
+        format, cursor = String.read_from(view, cursor)
+        theme, cursor = TLObject.read_from(view, cursor)
+        document_id, cursor = Long.read_from(view, cursor)
+        return cls(format=format, theme=theme, document_id=document_id), cursor
+
+
+class GetChatThemes_133(TLRequest[tl.base.account.ChatThemes]):
+    __tl_id__ = 0xd6d71d7b
+    __tl_name__ = "functions.account.GetChatThemes_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChatThemes_133:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChatThemes_133, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class UpdateColor_166(TLRequest[bool]):
+    __tl_id__ = 0xa001cc43
+    __tl_name__ = "functions.account.UpdateColor_166"
+    __tl_layer__ = 166
+
+    __slots__ = ("color", "background_emoji_id", )
+
+    def __init__(self, *, color: int, background_emoji_id: int | None = None):
+        self.color = color
+        self.background_emoji_id = background_emoji_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.background_emoji_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.color)
+        if self.background_emoji_id is not None:
+            out += Long.write(self.background_emoji_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateColor_166:
+        flags1 = Int.read(stream)
+        color = Int.read(stream)
+        background_emoji_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(color=color, background_emoji_id=background_emoji_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateColor_166, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        color, cursor = Int.read_from(view, cursor)
+        background_emoji_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(color=color, background_emoji_id=background_emoji_id), cursor
+
+
+class UpdateConnectedBot_176(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x9c2d527d
+    __tl_name__ = "functions.account.UpdateConnectedBot_176"
+    __tl_layer__ = 176
+
+    __slots__ = ("can_reply", "deleted", "bot", "recipients", )
+
+    def __init__(self, *, bot: tl.base.InputUser, recipients: tl.types.InputBusinessRecipients, can_reply: bool = False, deleted: bool = False):
+        self.can_reply = can_reply
+        self.deleted = deleted
+        self.bot = bot
+        self.recipients = recipients
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.can_reply: flags1 |= (1 << 0)
+        if self.deleted: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.bot.write_to(out, ctx)
+        self.recipients.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateConnectedBot_176:
+        flags1 = Int.read(stream)
+        can_reply = (flags1 & (1 << 0)) == (1 << 0)
+        deleted = (flags1 & (1 << 1)) == (1 << 1)
+        bot = TLObject.read(stream)
+        recipients = tl.types.InputBusinessRecipients.read(stream)
+        return cls(can_reply=can_reply, deleted=deleted, bot=bot, recipients=recipients)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateConnectedBot_176, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        can_reply = (flags1 & (1 << 0)) == (1 << 0)
+        deleted = (flags1 & (1 << 1)) == (1 << 1)
+        bot, cursor = TLObject.read_from(view, cursor)
+        recipients, cursor = tl.types.InputBusinessRecipients.read_from(view, cursor)
+        return cls(can_reply=can_reply, deleted=deleted, bot=bot, recipients=recipients), cursor
+
+
+class UpdateConnectedBot_177(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x43d8521d
+    __tl_name__ = "functions.account.UpdateConnectedBot_177"
+    __tl_layer__ = 177
+
+    __slots__ = ("can_reply", "deleted", "bot", "recipients", )
+
+    def __init__(self, *, bot: tl.base.InputUser, recipients: tl.types.InputBusinessBotRecipients, can_reply: bool = False, deleted: bool = False):
+        self.can_reply = can_reply
+        self.deleted = deleted
+        self.bot = bot
+        self.recipients = recipients
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.can_reply: flags1 |= (1 << 0)
+        if self.deleted: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.bot.write_to(out, ctx)
+        self.recipients.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateConnectedBot_177:
+        flags1 = Int.read(stream)
+        can_reply = (flags1 & (1 << 0)) == (1 << 0)
+        deleted = (flags1 & (1 << 1)) == (1 << 1)
+        bot = TLObject.read(stream)
+        recipients = tl.types.InputBusinessBotRecipients.read(stream)
+        return cls(can_reply=can_reply, deleted=deleted, bot=bot, recipients=recipients)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateConnectedBot_177, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        can_reply = (flags1 & (1 << 0)) == (1 << 0)
+        deleted = (flags1 & (1 << 1)) == (1 << 1)
+        bot, cursor = TLObject.read_from(view, cursor)
+        recipients, cursor = tl.types.InputBusinessBotRecipients.read_from(view, cursor)
+        return cls(can_reply=can_reply, deleted=deleted, bot=bot, recipients=recipients), cursor
@@ -0,0 +1,868 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class SendCode(TLRequest[tl.base.auth.SentCode]):
+    __tl_id__ = 0xa677244f
+    __tl_name__ = "functions.auth.SendCode"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "api_id", "api_hash", "settings", )
+
+    def __init__(self, *, phone_number: str, api_id: int, api_hash: str, settings: tl.base.CodeSettings):
+        self.phone_number = phone_number
+        self.api_id = api_id
+        self.api_hash = api_hash
+        self.settings = settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        out += Int.write(self.api_id)
+        String.write_to(out, self.api_hash)
+        self.settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendCode:
+        phone_number = String.read(stream)
+        api_id = Int.read(stream)
+        api_hash = String.read(stream)
+        settings = TLObject.read(stream)
+        return cls(phone_number=phone_number, api_id=api_id, api_hash=api_hash, settings=settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendCode, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        api_id, cursor = Int.read_from(view, cursor)
+        api_hash, cursor = String.read_from(view, cursor)
+        settings, cursor = TLObject.read_from(view, cursor)
+        return cls(phone_number=phone_number, api_id=api_id, api_hash=api_hash, settings=settings), cursor
+
+
+class SignUp(TLRequest[tl.base.auth.Authorization]):
+    __tl_id__ = 0xaac7b717
+    __tl_name__ = "functions.auth.SignUp"
+    __tl_layer__ = 174
+
+    __slots__ = ("no_joined_notifications", "phone_number", "phone_code_hash", "first_name", "last_name", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, first_name: str, last_name: str, no_joined_notifications: bool = False):
+        self.no_joined_notifications = no_joined_notifications
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.first_name = first_name
+        self.last_name = last_name
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_joined_notifications: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        String.write_to(out, self.first_name)
+        String.write_to(out, self.last_name)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SignUp:
+        flags1 = Int.read(stream)
+        no_joined_notifications = (flags1 & (1 << 0)) == (1 << 0)
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        first_name = String.read(stream)
+        last_name = String.read(stream)
+        return cls(no_joined_notifications=no_joined_notifications, phone_number=phone_number, phone_code_hash=phone_code_hash, first_name=first_name, last_name=last_name)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SignUp, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_joined_notifications = (flags1 & (1 << 0)) == (1 << 0)
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        first_name, cursor = String.read_from(view, cursor)
+        last_name, cursor = String.read_from(view, cursor)
+        return cls(no_joined_notifications=no_joined_notifications, phone_number=phone_number, phone_code_hash=phone_code_hash, first_name=first_name, last_name=last_name), cursor
+
+
+class SignIn(TLRequest[tl.base.auth.Authorization]):
+    __tl_id__ = 0x8d52a951
+    __tl_name__ = "functions.auth.SignIn"
+    __tl_layer__ = 145
+
+    __slots__ = ("phone_number", "phone_code_hash", "phone_code", "email_verification", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, phone_code: str | None = None, email_verification: tl.base.EmailVerification | None = None):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.phone_code = phone_code
+        self.email_verification = email_verification
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.phone_code is not None: flags1 |= (1 << 0)
+        if self.email_verification is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        if self.phone_code is not None:
+            String.write_to(out, self.phone_code)
+        if self.email_verification is not None:
+            self.email_verification.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SignIn:
+        flags1 = Int.read(stream)
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        phone_code = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        email_verification = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, phone_code=phone_code, email_verification=email_verification)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SignIn, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        phone_code, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        email_verification, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, phone_code=phone_code, email_verification=email_verification), cursor
+
+
+class LogOut(TLRequest[tl.types.auth.LoggedOut]):
+    __tl_id__ = 0x3e72ba19
+    __tl_name__ = "functions.auth.LogOut"
+    __tl_layer__ = 135
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LogOut:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LogOut, int]:
+        return cls(), cursor
+
+
+class ResetAuthorizations(TLRequest[bool]):
+    __tl_id__ = 0x9fab0d1a
+    __tl_name__ = "functions.auth.ResetAuthorizations"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetAuthorizations:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetAuthorizations, int]:
+        return cls(), cursor
+
+
+class ExportAuthorization(TLRequest[tl.types.auth.ExportedAuthorization]):
+    __tl_id__ = 0xe5bfffcd
+    __tl_name__ = "functions.auth.ExportAuthorization"
+    __tl_layer__ = 133
+
+    __slots__ = ("dc_id", )
+
+    def __init__(self, *, dc_id: int):
+        self.dc_id = dc_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.dc_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportAuthorization:
+        dc_id = Int.read(stream)
+        return cls(dc_id=dc_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportAuthorization, int]:
+        dc_id, cursor = Int.read_from(view, cursor)
+        return cls(dc_id=dc_id), cursor
+
+
+class ImportAuthorization(TLRequest[tl.base.auth.Authorization]):
+    __tl_id__ = 0xa57a7dad
+    __tl_name__ = "functions.auth.ImportAuthorization"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", "bytes_", )
+
+    def __init__(self, *, id: int, bytes_: bytes):
+        self.id = id
+        self.bytes_ = bytes_
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.id)
+        Bytes.write_to(out, self.bytes_)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ImportAuthorization:
+        id = Long.read(stream)
+        bytes_ = Bytes.read(stream)
+        return cls(id=id, bytes_=bytes_)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ImportAuthorization, int]:
+        id, cursor = Long.read_from(view, cursor)
+        bytes_, cursor = Bytes.read_from(view, cursor)
+        return cls(id=id, bytes_=bytes_), cursor
+
+
+class BindTempAuthKey(TLRequest[bool]):
+    __tl_id__ = 0xcdd42a05
+    __tl_name__ = "functions.auth.BindTempAuthKey"
+    __tl_layer__ = 133
+
+    __slots__ = ("perm_auth_key_id", "nonce", "expires_at", "encrypted_message", )
+
+    def __init__(self, *, perm_auth_key_id: int, nonce: int, expires_at: int, encrypted_message: bytes):
+        self.perm_auth_key_id = perm_auth_key_id
+        self.nonce = nonce
+        self.expires_at = expires_at
+        self.encrypted_message = encrypted_message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.perm_auth_key_id)
+        out += Long.write(self.nonce)
+        out += Int.write(self.expires_at)
+        Bytes.write_to(out, self.encrypted_message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BindTempAuthKey:
+        perm_auth_key_id = Long.read(stream)
+        nonce = Long.read(stream)
+        expires_at = Int.read(stream)
+        encrypted_message = Bytes.read(stream)
+        return cls(perm_auth_key_id=perm_auth_key_id, nonce=nonce, expires_at=expires_at, encrypted_message=encrypted_message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BindTempAuthKey, int]:
+        perm_auth_key_id, cursor = Long.read_from(view, cursor)
+        nonce, cursor = Long.read_from(view, cursor)
+        expires_at, cursor = Int.read_from(view, cursor)
+        encrypted_message, cursor = Bytes.read_from(view, cursor)
+        return cls(perm_auth_key_id=perm_auth_key_id, nonce=nonce, expires_at=expires_at, encrypted_message=encrypted_message), cursor
+
+
+class ImportBotAuthorization(TLRequest[tl.base.auth.Authorization]):
+    __tl_id__ = 0x67a3ff2c
+    __tl_name__ = "functions.auth.ImportBotAuthorization"
+    __tl_layer__ = 133
+
+    __slots__ = ("flags", "api_id", "api_hash", "bot_auth_token", )
+
+    def __init__(self, *, flags: int, api_id: int, api_hash: str, bot_auth_token: str):
+        self.flags = flags
+        self.api_id = api_id
+        self.api_hash = api_hash
+        self.bot_auth_token = bot_auth_token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.flags)
+        out += Int.write(self.api_id)
+        String.write_to(out, self.api_hash)
+        String.write_to(out, self.bot_auth_token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ImportBotAuthorization:
+        flags = Int.read(stream)
+        api_id = Int.read(stream)
+        api_hash = String.read(stream)
+        bot_auth_token = String.read(stream)
+        return cls(flags=flags, api_id=api_id, api_hash=api_hash, bot_auth_token=bot_auth_token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ImportBotAuthorization, int]:
+        flags, cursor = Int.read_from(view, cursor)
+        api_id, cursor = Int.read_from(view, cursor)
+        api_hash, cursor = String.read_from(view, cursor)
+        bot_auth_token, cursor = String.read_from(view, cursor)
+        return cls(flags=flags, api_id=api_id, api_hash=api_hash, bot_auth_token=bot_auth_token), cursor
+
+
+class CheckPassword(TLRequest[tl.base.auth.Authorization]):
+    __tl_id__ = 0xd18b4d16
+    __tl_name__ = "functions.auth.CheckPassword"
+    __tl_layer__ = 133
+
+    __slots__ = ("password", )
+
+    def __init__(self, *, password: tl.base.InputCheckPasswordSRP):
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.password.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckPassword:
+        password = TLObject.read(stream)
+        return cls(password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckPassword, int]:
+        password, cursor = TLObject.read_from(view, cursor)
+        return cls(password=password), cursor
+
+
+class RequestPasswordRecovery(TLRequest[tl.types.auth.PasswordRecovery]):
+    __tl_id__ = 0xd897bc66
+    __tl_name__ = "functions.auth.RequestPasswordRecovery"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestPasswordRecovery:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestPasswordRecovery, int]:
+        return cls(), cursor
+
+
+class RecoverPassword(TLRequest[tl.base.auth.Authorization]):
+    __tl_id__ = 0x37096c70
+    __tl_name__ = "functions.auth.RecoverPassword"
+    __tl_layer__ = 133
+
+    __slots__ = ("code", "new_settings", )
+
+    def __init__(self, *, code: str, new_settings: tl.types.account.PasswordInputSettings | None = None):
+        self.code = code
+        self.new_settings = new_settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.new_settings is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.code)
+        if self.new_settings is not None:
+            self.new_settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RecoverPassword:
+        flags1 = Int.read(stream)
+        code = String.read(stream)
+        new_settings = tl.types.account.PasswordInputSettings.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(code=code, new_settings=new_settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RecoverPassword, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        code, cursor = String.read_from(view, cursor)
+        new_settings, cursor = tl.types.account.PasswordInputSettings.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(code=code, new_settings=new_settings), cursor
+
+
+class ResendCode(TLRequest[tl.base.auth.SentCode]):
+    __tl_id__ = 0xcae47523
+    __tl_name__ = "functions.auth.ResendCode"
+    __tl_layer__ = 181
+
+    __slots__ = ("phone_number", "phone_code_hash", "reason", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, reason: str | None = None):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.reason = reason
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.reason is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        if self.reason is not None:
+            String.write_to(out, self.reason)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResendCode:
+        flags1 = Int.read(stream)
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        reason = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, reason=reason)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResendCode, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        reason, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, reason=reason), cursor
+
+
+class CancelCode(TLRequest[bool]):
+    __tl_id__ = 0x1f040578
+    __tl_name__ = "functions.auth.CancelCode"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "phone_code_hash", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CancelCode:
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CancelCode, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash), cursor
+
+
+class DropTempAuthKeys(TLRequest[bool]):
+    __tl_id__ = 0x8e48a188
+    __tl_name__ = "functions.auth.DropTempAuthKeys"
+    __tl_layer__ = 133
+
+    __slots__ = ("except_auth_keys", )
+
+    def __init__(self, *, except_auth_keys: list[int]):
+        self.except_auth_keys = except_auth_keys
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += LongVector.write(self.except_auth_keys)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DropTempAuthKeys:
+        except_auth_keys = LongVector.read(stream)
+        return cls(except_auth_keys=except_auth_keys)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DropTempAuthKeys, int]:
+        except_auth_keys, cursor = LongVector.read_from(view, cursor)
+        return cls(except_auth_keys=except_auth_keys), cursor
+
+
+class ExportLoginToken(TLRequest[tl.base.auth.LoginToken]):
+    __tl_id__ = 0xb7e085fe
+    __tl_name__ = "functions.auth.ExportLoginToken"
+    __tl_layer__ = 133
+
+    __slots__ = ("api_id", "api_hash", "except_ids", )
+
+    def __init__(self, *, api_id: int, api_hash: str, except_ids: list[int]):
+        self.api_id = api_id
+        self.api_hash = api_hash
+        self.except_ids = except_ids
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.api_id)
+        String.write_to(out, self.api_hash)
+        out += LongVector.write(self.except_ids)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportLoginToken:
+        api_id = Int.read(stream)
+        api_hash = String.read(stream)
+        except_ids = LongVector.read(stream)
+        return cls(api_id=api_id, api_hash=api_hash, except_ids=except_ids)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportLoginToken, int]:
+        api_id, cursor = Int.read_from(view, cursor)
+        api_hash, cursor = String.read_from(view, cursor)
+        except_ids, cursor = LongVector.read_from(view, cursor)
+        return cls(api_id=api_id, api_hash=api_hash, except_ids=except_ids), cursor
+
+
+class ImportLoginToken(TLRequest[tl.base.auth.LoginToken]):
+    __tl_id__ = 0x95ac5ce4
+    __tl_name__ = "functions.auth.ImportLoginToken"
+    __tl_layer__ = 133
+
+    __slots__ = ("token", )
+
+    def __init__(self, *, token: bytes):
+        self.token = token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ImportLoginToken:
+        token = Bytes.read(stream)
+        return cls(token=token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ImportLoginToken, int]:
+        token, cursor = Bytes.read_from(view, cursor)
+        return cls(token=token), cursor
+
+
+class AcceptLoginToken(TLRequest[tl.types.Authorization]):
+    __tl_id__ = 0xe894ad4d
+    __tl_name__ = "functions.auth.AcceptLoginToken"
+    __tl_layer__ = 133
+
+    __slots__ = ("token", )
+
+    def __init__(self, *, token: bytes):
+        self.token = token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AcceptLoginToken:
+        token = Bytes.read(stream)
+        return cls(token=token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AcceptLoginToken, int]:
+        token, cursor = Bytes.read_from(view, cursor)
+        return cls(token=token), cursor
+
+
+class CheckRecoveryPassword(TLRequest[bool]):
+    __tl_id__ = 0xd36bf79
+    __tl_name__ = "functions.auth.CheckRecoveryPassword"
+    __tl_layer__ = 133
+
+    __slots__ = ("code", )
+
+    def __init__(self, *, code: str):
+        self.code = code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckRecoveryPassword:
+        code = String.read(stream)
+        return cls(code=code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckRecoveryPassword, int]:
+        code, cursor = String.read_from(view, cursor)
+        return cls(code=code), cursor
+
+
+class ImportWebTokenAuthorization(TLRequest[tl.base.auth.Authorization]):
+    __tl_id__ = 0x2db873a9
+    __tl_name__ = "functions.auth.ImportWebTokenAuthorization"
+    __tl_layer__ = 147
+
+    __slots__ = ("api_id", "api_hash", "web_auth_token", )
+
+    def __init__(self, *, api_id: int, api_hash: str, web_auth_token: str):
+        self.api_id = api_id
+        self.api_hash = api_hash
+        self.web_auth_token = web_auth_token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.api_id)
+        String.write_to(out, self.api_hash)
+        String.write_to(out, self.web_auth_token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ImportWebTokenAuthorization:
+        api_id = Int.read(stream)
+        api_hash = String.read(stream)
+        web_auth_token = String.read(stream)
+        return cls(api_id=api_id, api_hash=api_hash, web_auth_token=web_auth_token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ImportWebTokenAuthorization, int]:
+        api_id, cursor = Int.read_from(view, cursor)
+        api_hash, cursor = String.read_from(view, cursor)
+        web_auth_token, cursor = String.read_from(view, cursor)
+        return cls(api_id=api_id, api_hash=api_hash, web_auth_token=web_auth_token), cursor
+
+
+class RequestFirebaseSms(TLRequest[bool]):
+    __tl_id__ = 0x8e39261e
+    __tl_name__ = "functions.auth.RequestFirebaseSms"
+    __tl_layer__ = 181
+
+    __slots__ = ("phone_number", "phone_code_hash", "safety_net_token", "play_integrity_token", "ios_push_secret", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, safety_net_token: str | None = None, play_integrity_token: str | None = None, ios_push_secret: str | None = None):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.safety_net_token = safety_net_token
+        self.play_integrity_token = play_integrity_token
+        self.ios_push_secret = ios_push_secret
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.safety_net_token is not None: flags1 |= (1 << 0)
+        if self.play_integrity_token is not None: flags1 |= (1 << 2)
+        if self.ios_push_secret is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        if self.safety_net_token is not None:
+            String.write_to(out, self.safety_net_token)
+        if self.play_integrity_token is not None:
+            String.write_to(out, self.play_integrity_token)
+        if self.ios_push_secret is not None:
+            String.write_to(out, self.ios_push_secret)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestFirebaseSms:
+        flags1 = Int.read(stream)
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        safety_net_token = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        play_integrity_token = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        ios_push_secret = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, safety_net_token=safety_net_token, play_integrity_token=play_integrity_token, ios_push_secret=ios_push_secret)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestFirebaseSms, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        safety_net_token, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        play_integrity_token, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        ios_push_secret, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, safety_net_token=safety_net_token, play_integrity_token=play_integrity_token, ios_push_secret=ios_push_secret), cursor
+
+
+class ResetLoginEmail(TLRequest[tl.base.auth.SentCode]):
+    __tl_id__ = 0x7e960193
+    __tl_name__ = "functions.auth.ResetLoginEmail"
+    __tl_layer__ = 158
+
+    __slots__ = ("phone_number", "phone_code_hash", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetLoginEmail:
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetLoginEmail, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash), cursor
+
+
+class ReportMissingCode(TLRequest[bool]):
+    __tl_id__ = 0xcb9deff6
+    __tl_name__ = "functions.auth.ReportMissingCode"
+    __tl_layer__ = 179
+
+    __slots__ = ("phone_number", "phone_code_hash", "mnc", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, mnc: str):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.mnc = mnc
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        String.write_to(out, self.mnc)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportMissingCode:
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        mnc = String.read(stream)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, mnc=mnc)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportMissingCode, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        mnc, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, mnc=mnc), cursor
+
+
+class SignUp_133(TLRequest[tl.base.auth.Authorization]):
+    __tl_id__ = 0x80eee427
+    __tl_name__ = "functions.auth.SignUp_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "phone_code_hash", "first_name", "last_name", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, first_name: str, last_name: str):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.first_name = first_name
+        self.last_name = last_name
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        String.write_to(out, self.first_name)
+        String.write_to(out, self.last_name)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SignUp_133:
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        first_name = String.read(stream)
+        last_name = String.read(stream)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, first_name=first_name, last_name=last_name)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SignUp_133, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        first_name, cursor = String.read_from(view, cursor)
+        last_name, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, first_name=first_name, last_name=last_name), cursor
+
+
+class SignIn_133(TLRequest[tl.base.auth.Authorization]):
+    __tl_id__ = 0xbcd51581
+    __tl_name__ = "functions.auth.SignIn_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "phone_code_hash", "phone_code", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, phone_code: str):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.phone_code = phone_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        String.write_to(out, self.phone_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SignIn_133:
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        phone_code = String.read(stream)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, phone_code=phone_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SignIn_133, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        phone_code, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, phone_code=phone_code), cursor
+
+
+class LogOut_133(TLRequest[bool]):
+    __tl_id__ = 0x5717da40
+    __tl_name__ = "functions.auth.LogOut_133"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LogOut_133:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LogOut_133, int]:
+        return cls(), cursor
+
+
+class ResendCode_133(TLRequest[tl.base.auth.SentCode]):
+    __tl_id__ = 0x3ef1a9bf
+    __tl_name__ = "functions.auth.ResendCode_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "phone_code_hash", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResendCode_133:
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResendCode_133, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash), cursor
+
+
+class RequestFirebaseSms_152(TLRequest[bool]):
+    __tl_id__ = 0x89464b50
+    __tl_name__ = "functions.auth.RequestFirebaseSms_152"
+    __tl_layer__ = 152
+
+    __slots__ = ("phone_number", "phone_code_hash", "safety_net_token", "ios_push_secret", )
+
+    def __init__(self, *, phone_number: str, phone_code_hash: str, safety_net_token: str | None = None, ios_push_secret: str | None = None):
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.safety_net_token = safety_net_token
+        self.ios_push_secret = ios_push_secret
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.safety_net_token is not None: flags1 |= (1 << 0)
+        if self.ios_push_secret is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        String.write_to(out, self.phone_number)
+        String.write_to(out, self.phone_code_hash)
+        if self.safety_net_token is not None:
+            String.write_to(out, self.safety_net_token)
+        if self.ios_push_secret is not None:
+            String.write_to(out, self.ios_push_secret)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestFirebaseSms_152:
+        flags1 = Int.read(stream)
+        phone_number = String.read(stream)
+        phone_code_hash = String.read(stream)
+        safety_net_token = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        ios_push_secret = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, safety_net_token=safety_net_token, ios_push_secret=ios_push_secret)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestFirebaseSms_152, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        phone_number, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        safety_net_token, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        ios_push_secret, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(phone_number=phone_number, phone_code_hash=phone_code_hash, safety_net_token=safety_net_token, ios_push_secret=ios_push_secret), cursor
@@ -0,0 +1,969 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class SendCustomRequest(TLRequest[tl.types.DataJSON]):
+    __tl_id__ = 0xaa2769ed
+    __tl_name__ = "functions.bots.SendCustomRequest"
+    __tl_layer__ = 133
+
+    __slots__ = ("custom_method", "params", )
+
+    def __init__(self, *, custom_method: str, params: tl.types.DataJSON):
+        self.custom_method = custom_method
+        self.params = params
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.custom_method)
+        self.params.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendCustomRequest:
+        custom_method = String.read(stream)
+        params = tl.types.DataJSON.read(stream)
+        return cls(custom_method=custom_method, params=params)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendCustomRequest, int]:
+        custom_method, cursor = String.read_from(view, cursor)
+        params, cursor = tl.types.DataJSON.read_from(view, cursor)
+        return cls(custom_method=custom_method, params=params), cursor
+
+
+class AnswerWebhookJSONQuery(TLRequest[bool]):
+    __tl_id__ = 0xe6213f4d
+    __tl_name__ = "functions.bots.AnswerWebhookJSONQuery"
+    __tl_layer__ = 133
+
+    __slots__ = ("query_id", "data", )
+
+    def __init__(self, *, query_id: int, data: tl.types.DataJSON):
+        self.query_id = query_id
+        self.data = data
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.query_id)
+        self.data.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AnswerWebhookJSONQuery:
+        query_id = Long.read(stream)
+        data = tl.types.DataJSON.read(stream)
+        return cls(query_id=query_id, data=data)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AnswerWebhookJSONQuery, int]:
+        query_id, cursor = Long.read_from(view, cursor)
+        data, cursor = tl.types.DataJSON.read_from(view, cursor)
+        return cls(query_id=query_id, data=data), cursor
+
+
+class SetBotCommands(TLRequest[bool]):
+    __tl_id__ = 0x517165a
+    __tl_name__ = "functions.bots.SetBotCommands"
+    __tl_layer__ = 133
+
+    __slots__ = ("scope", "lang_code", "commands", )
+
+    def __init__(self, *, scope: tl.base.BotCommandScope, lang_code: str, commands: list[tl.base.BotCommand]):
+        self.scope = scope
+        self.lang_code = lang_code
+        self.commands = commands
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.scope.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+        TLObjectVector.write_to(out, self.commands, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotCommands:
+        scope = TLObject.read(stream)
+        lang_code = String.read(stream)
+        commands = TLObjectVector.read(stream)
+        return cls(scope=scope, lang_code=lang_code, commands=commands)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotCommands, int]:
+        scope, cursor = TLObject.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        commands, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(scope=scope, lang_code=lang_code, commands=commands), cursor
+
+
+class ResetBotCommands(TLRequest[bool]):
+    __tl_id__ = 0x3d8de0f9
+    __tl_name__ = "functions.bots.ResetBotCommands"
+    __tl_layer__ = 133
+
+    __slots__ = ("scope", "lang_code", )
+
+    def __init__(self, *, scope: tl.base.BotCommandScope, lang_code: str):
+        self.scope = scope
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.scope.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetBotCommands:
+        scope = TLObject.read(stream)
+        lang_code = String.read(stream)
+        return cls(scope=scope, lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetBotCommands, int]:
+        scope, cursor = TLObject.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(scope=scope, lang_code=lang_code), cursor
+
+
+class GetBotCommands(TLRequest[list[tl.base.BotCommand]]):
+    __tl_id__ = 0xe34c0dd6
+    __tl_name__ = "functions.bots.GetBotCommands"
+    __tl_layer__ = 133
+
+    __slots__ = ("scope", "lang_code", )
+
+    def __init__(self, *, scope: tl.base.BotCommandScope, lang_code: str):
+        self.scope = scope
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.scope.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBotCommands:
+        scope = TLObject.read(stream)
+        lang_code = String.read(stream)
+        return cls(scope=scope, lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBotCommands, int]:
+        scope, cursor = TLObject.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(scope=scope, lang_code=lang_code), cursor
+
+
+class SetBotMenuButton(TLRequest[bool]):
+    __tl_id__ = 0x4504d54f
+    __tl_name__ = "functions.bots.SetBotMenuButton"
+    __tl_layer__ = 140
+
+    __slots__ = ("user_id", "button", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, button: tl.base.BotMenuButton):
+        self.user_id = user_id
+        self.button = button
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        self.button.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotMenuButton:
+        user_id = TLObject.read(stream)
+        button = TLObject.read(stream)
+        return cls(user_id=user_id, button=button)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotMenuButton, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        button, cursor = TLObject.read_from(view, cursor)
+        return cls(user_id=user_id, button=button), cursor
+
+
+class GetBotMenuButton(TLRequest[tl.base.BotMenuButton]):
+    __tl_id__ = 0x9c60eb28
+    __tl_name__ = "functions.bots.GetBotMenuButton"
+    __tl_layer__ = 140
+
+    __slots__ = ("user_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser):
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBotMenuButton:
+        user_id = TLObject.read(stream)
+        return cls(user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBotMenuButton, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(user_id=user_id), cursor
+
+
+class SetBotBroadcastDefaultAdminRights(TLRequest[bool]):
+    __tl_id__ = 0x788464e1
+    __tl_name__ = "functions.bots.SetBotBroadcastDefaultAdminRights"
+    __tl_layer__ = 140
+
+    __slots__ = ("admin_rights", )
+
+    def __init__(self, *, admin_rights: tl.types.ChatAdminRights):
+        self.admin_rights = admin_rights
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.admin_rights.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotBroadcastDefaultAdminRights:
+        admin_rights = tl.types.ChatAdminRights.read(stream)
+        return cls(admin_rights=admin_rights)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotBroadcastDefaultAdminRights, int]:
+        admin_rights, cursor = tl.types.ChatAdminRights.read_from(view, cursor)
+        return cls(admin_rights=admin_rights), cursor
+
+
+class SetBotGroupDefaultAdminRights(TLRequest[bool]):
+    __tl_id__ = 0x925ec9ea
+    __tl_name__ = "functions.bots.SetBotGroupDefaultAdminRights"
+    __tl_layer__ = 140
+
+    __slots__ = ("admin_rights", )
+
+    def __init__(self, *, admin_rights: tl.types.ChatAdminRights):
+        self.admin_rights = admin_rights
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.admin_rights.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotGroupDefaultAdminRights:
+        admin_rights = tl.types.ChatAdminRights.read(stream)
+        return cls(admin_rights=admin_rights)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotGroupDefaultAdminRights, int]:
+        admin_rights, cursor = tl.types.ChatAdminRights.read_from(view, cursor)
+        return cls(admin_rights=admin_rights), cursor
+
+
+class SetBotInfo(TLRequest[bool]):
+    __tl_id__ = 0x10cf3123
+    __tl_name__ = "functions.bots.SetBotInfo"
+    __tl_layer__ = 158
+
+    __slots__ = ("bot", "lang_code", "name", "about", "description", )
+
+    def __init__(self, *, lang_code: str, bot: tl.base.InputUser | None = None, name: str | None = None, about: str | None = None, description: str | None = None):
+        self.bot = bot
+        self.lang_code = lang_code
+        self.name = name
+        self.about = about
+        self.description = description
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.bot is not None: flags1 |= (1 << 2)
+        if self.name is not None: flags1 |= (1 << 3)
+        if self.about is not None: flags1 |= (1 << 0)
+        if self.description is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.bot is not None:
+            self.bot.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+        if self.name is not None:
+            String.write_to(out, self.name)
+        if self.about is not None:
+            String.write_to(out, self.about)
+        if self.description is not None:
+            String.write_to(out, self.description)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotInfo:
+        flags1 = Int.read(stream)
+        bot = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        lang_code = String.read(stream)
+        name = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        about = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        description = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(bot=bot, lang_code=lang_code, name=name, about=about, description=description)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotInfo, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        name, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        about, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        description, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(bot=bot, lang_code=lang_code, name=name, about=about, description=description), cursor
+
+
+class GetBotInfo(TLRequest[tl.types.bots.BotInfo]):
+    __tl_id__ = 0xdcd914fd
+    __tl_name__ = "functions.bots.GetBotInfo"
+    __tl_layer__ = 158
+
+    __slots__ = ("bot", "lang_code", )
+
+    def __init__(self, *, lang_code: str, bot: tl.base.InputUser | None = None):
+        self.bot = bot
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.bot is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.bot is not None:
+            self.bot.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBotInfo:
+        flags1 = Int.read(stream)
+        bot = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        lang_code = String.read(stream)
+        return cls(bot=bot, lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBotInfo, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(bot=bot, lang_code=lang_code), cursor
+
+
+class ReorderUsernames(TLRequest[bool]):
+    __tl_id__ = 0x9709b1c2
+    __tl_name__ = "functions.bots.ReorderUsernames"
+    __tl_layer__ = 158
+
+    __slots__ = ("bot", "order", )
+
+    def __init__(self, *, bot: tl.base.InputUser, order: list[str]):
+        self.bot = bot
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        out += StringVector.write(self.order)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReorderUsernames:
+        bot = TLObject.read(stream)
+        order = StringVector.read(stream)
+        return cls(bot=bot, order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReorderUsernames, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        order, cursor = StringVector.read_from(view, cursor)
+        return cls(bot=bot, order=order), cursor
+
+
+class ToggleUsername(TLRequest[bool]):
+    __tl_id__ = 0x53ca973
+    __tl_name__ = "functions.bots.ToggleUsername"
+    __tl_layer__ = 158
+
+    __slots__ = ("bot", "username", "active", )
+
+    def __init__(self, *, bot: tl.base.InputUser, username: str, active: bool):
+        self.bot = bot
+        self.username = username
+        self.active = active
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.username)
+        out += Bool.write(self.active)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleUsername:
+        bot = TLObject.read(stream)
+        username = String.read(stream)
+        active = Bool.read(stream)
+        return cls(bot=bot, username=username, active=active)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleUsername, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        username, cursor = String.read_from(view, cursor)
+        active, cursor = Bool.read_from(view, cursor)
+        return cls(bot=bot, username=username, active=active), cursor
+
+
+class CanSendMessage(TLRequest[bool]):
+    __tl_id__ = 0x1359f4e6
+    __tl_name__ = "functions.bots.CanSendMessage"
+    __tl_layer__ = 162
+
+    __slots__ = ("bot", )
+
+    def __init__(self, *, bot: tl.base.InputUser):
+        self.bot = bot
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CanSendMessage:
+        bot = TLObject.read(stream)
+        return cls(bot=bot)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CanSendMessage, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        return cls(bot=bot), cursor
+
+
+class AllowSendMessage(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf132e3ef
+    __tl_name__ = "functions.bots.AllowSendMessage"
+    __tl_layer__ = 162
+
+    __slots__ = ("bot", )
+
+    def __init__(self, *, bot: tl.base.InputUser):
+        self.bot = bot
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AllowSendMessage:
+        bot = TLObject.read(stream)
+        return cls(bot=bot)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AllowSendMessage, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        return cls(bot=bot), cursor
+
+
+class InvokeWebViewCustomMethod(TLRequest[tl.types.DataJSON]):
+    __tl_id__ = 0x87fc5e7
+    __tl_name__ = "functions.bots.InvokeWebViewCustomMethod"
+    __tl_layer__ = 162
+
+    __slots__ = ("bot", "custom_method", "params", )
+
+    def __init__(self, *, bot: tl.base.InputUser, custom_method: str, params: tl.types.DataJSON):
+        self.bot = bot
+        self.custom_method = custom_method
+        self.params = params
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.custom_method)
+        self.params.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvokeWebViewCustomMethod:
+        bot = TLObject.read(stream)
+        custom_method = String.read(stream)
+        params = tl.types.DataJSON.read(stream)
+        return cls(bot=bot, custom_method=custom_method, params=params)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvokeWebViewCustomMethod, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        custom_method, cursor = String.read_from(view, cursor)
+        params, cursor = tl.types.DataJSON.read_from(view, cursor)
+        return cls(bot=bot, custom_method=custom_method, params=params), cursor
+
+
+class GetPopularAppBots(TLRequest[tl.types.bots.PopularAppBots]):
+    __tl_id__ = 0xc2510192
+    __tl_name__ = "functions.bots.GetPopularAppBots"
+    __tl_layer__ = 185
+
+    __slots__ = ("offset", "limit", )
+
+    def __init__(self, *, offset: str, limit: int):
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPopularAppBots:
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPopularAppBots, int]:
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(offset=offset, limit=limit), cursor
+
+
+class AddPreviewMedia(TLRequest[tl.types.BotPreviewMedia]):
+    __tl_id__ = 0x17aeb75a
+    __tl_name__ = "functions.bots.AddPreviewMedia"
+    __tl_layer__ = 185
+
+    __slots__ = ("bot", "lang_code", "media", )
+
+    def __init__(self, *, bot: tl.base.InputUser, lang_code: str, media: tl.base.InputMedia):
+        self.bot = bot
+        self.lang_code = lang_code
+        self.media = media
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+        self.media.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AddPreviewMedia:
+        bot = TLObject.read(stream)
+        lang_code = String.read(stream)
+        media = TLObject.read(stream)
+        return cls(bot=bot, lang_code=lang_code, media=media)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AddPreviewMedia, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        return cls(bot=bot, lang_code=lang_code, media=media), cursor
+
+
+class EditPreviewMedia(TLRequest[tl.types.BotPreviewMedia]):
+    __tl_id__ = 0x8525606f
+    __tl_name__ = "functions.bots.EditPreviewMedia"
+    __tl_layer__ = 185
+
+    __slots__ = ("bot", "lang_code", "media", "new_media", )
+
+    def __init__(self, *, bot: tl.base.InputUser, lang_code: str, media: tl.base.InputMedia, new_media: tl.base.InputMedia):
+        self.bot = bot
+        self.lang_code = lang_code
+        self.media = media
+        self.new_media = new_media
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+        self.media.write_to(out, ctx)
+        self.new_media.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditPreviewMedia:
+        bot = TLObject.read(stream)
+        lang_code = String.read(stream)
+        media = TLObject.read(stream)
+        new_media = TLObject.read(stream)
+        return cls(bot=bot, lang_code=lang_code, media=media, new_media=new_media)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditPreviewMedia, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        new_media, cursor = TLObject.read_from(view, cursor)
+        return cls(bot=bot, lang_code=lang_code, media=media, new_media=new_media), cursor
+
+
+class DeletePreviewMedia(TLRequest[bool]):
+    __tl_id__ = 0x2d0135b3
+    __tl_name__ = "functions.bots.DeletePreviewMedia"
+    __tl_layer__ = 185
+
+    __slots__ = ("bot", "lang_code", "media", )
+
+    def __init__(self, *, bot: tl.base.InputUser, lang_code: str, media: list[tl.base.InputMedia]):
+        self.bot = bot
+        self.lang_code = lang_code
+        self.media = media
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+        TLObjectVector.write_to(out, self.media, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeletePreviewMedia:
+        bot = TLObject.read(stream)
+        lang_code = String.read(stream)
+        media = TLObjectVector.read(stream)
+        return cls(bot=bot, lang_code=lang_code, media=media)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeletePreviewMedia, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        media, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(bot=bot, lang_code=lang_code, media=media), cursor
+
+
+class ReorderPreviewMedias(TLRequest[bool]):
+    __tl_id__ = 0xb627f3aa
+    __tl_name__ = "functions.bots.ReorderPreviewMedias"
+    __tl_layer__ = 185
+
+    __slots__ = ("bot", "lang_code", "order", )
+
+    def __init__(self, *, bot: tl.base.InputUser, lang_code: str, order: list[tl.base.InputMedia]):
+        self.bot = bot
+        self.lang_code = lang_code
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+        TLObjectVector.write_to(out, self.order, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReorderPreviewMedias:
+        bot = TLObject.read(stream)
+        lang_code = String.read(stream)
+        order = TLObjectVector.read(stream)
+        return cls(bot=bot, lang_code=lang_code, order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReorderPreviewMedias, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        order, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(bot=bot, lang_code=lang_code, order=order), cursor
+
+
+class GetPreviewInfo(TLRequest[tl.types.bots.PreviewInfo]):
+    __tl_id__ = 0x423ab3ad
+    __tl_name__ = "functions.bots.GetPreviewInfo"
+    __tl_layer__ = 185
+
+    __slots__ = ("bot", "lang_code", )
+
+    def __init__(self, *, bot: tl.base.InputUser, lang_code: str):
+        self.bot = bot
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPreviewInfo:
+        bot = TLObject.read(stream)
+        lang_code = String.read(stream)
+        return cls(bot=bot, lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPreviewInfo, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(bot=bot, lang_code=lang_code), cursor
+
+
+class GetPreviewMedias(TLRequest[list[tl.base.BotPreviewMedia]]):
+    __tl_id__ = 0xa2a5594d
+    __tl_name__ = "functions.bots.GetPreviewMedias"
+    __tl_layer__ = 185
+
+    __slots__ = ("bot", )
+
+    def __init__(self, *, bot: tl.base.InputUser):
+        self.bot = bot
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPreviewMedias:
+        bot = TLObject.read(stream)
+        return cls(bot=bot)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPreviewMedias, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        return cls(bot=bot), cursor
+
+
+class UpdateUserEmojiStatus(TLRequest[bool]):
+    __tl_id__ = 0xed9f30c5
+    __tl_name__ = "functions.bots.UpdateUserEmojiStatus"
+    __tl_layer__ = 193
+
+    __slots__ = ("user_id", "emoji_status", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, emoji_status: tl.base.EmojiStatus):
+        self.user_id = user_id
+        self.emoji_status = emoji_status
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        self.emoji_status.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateUserEmojiStatus:
+        user_id = TLObject.read(stream)
+        emoji_status = TLObject.read(stream)
+        return cls(user_id=user_id, emoji_status=emoji_status)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateUserEmojiStatus, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        emoji_status, cursor = TLObject.read_from(view, cursor)
+        return cls(user_id=user_id, emoji_status=emoji_status), cursor
+
+
+class ToggleUserEmojiStatusPermission(TLRequest[bool]):
+    __tl_id__ = 0x6de6392
+    __tl_name__ = "functions.bots.ToggleUserEmojiStatusPermission"
+    __tl_layer__ = 193
+
+    __slots__ = ("bot", "enabled", )
+
+    def __init__(self, *, bot: tl.base.InputUser, enabled: bool):
+        self.bot = bot
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleUserEmojiStatusPermission:
+        bot = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(bot=bot, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleUserEmojiStatusPermission, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(bot=bot, enabled=enabled), cursor
+
+
+class CheckDownloadFileParams(TLRequest[bool]):
+    __tl_id__ = 0x50077589
+    __tl_name__ = "functions.bots.CheckDownloadFileParams"
+    __tl_layer__ = 193
+
+    __slots__ = ("bot", "file_name", "url", )
+
+    def __init__(self, *, bot: tl.base.InputUser, file_name: str, url: str):
+        self.bot = bot
+        self.file_name = file_name
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.file_name)
+        String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckDownloadFileParams:
+        bot = TLObject.read(stream)
+        file_name = String.read(stream)
+        url = String.read(stream)
+        return cls(bot=bot, file_name=file_name, url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckDownloadFileParams, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        file_name, cursor = String.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor)
+        return cls(bot=bot, file_name=file_name, url=url), cursor
+
+
+class GetAdminedBots(TLRequest[list[tl.base.User]]):
+    __tl_id__ = 0xb0711d83
+    __tl_name__ = "functions.bots.GetAdminedBots"
+    __tl_layer__ = 195
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAdminedBots:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAdminedBots, int]:
+        return cls(), cursor
+
+
+class UpdateStarRefProgram(TLRequest[tl.types.StarRefProgram]):
+    __tl_id__ = 0x778b5ab3
+    __tl_name__ = "functions.bots.UpdateStarRefProgram"
+    __tl_layer__ = 195
+
+    __slots__ = ("bot", "commission_permille", "duration_months", )
+
+    def __init__(self, *, bot: tl.base.InputUser, commission_permille: int, duration_months: int | None = None):
+        self.bot = bot
+        self.commission_permille = commission_permille
+        self.duration_months = duration_months
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.duration_months is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.bot.write_to(out, ctx)
+        out += Int.write(self.commission_permille)
+        if self.duration_months is not None:
+            out += Int.write(self.duration_months)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateStarRefProgram:
+        flags1 = Int.read(stream)
+        bot = TLObject.read(stream)
+        commission_permille = Int.read(stream)
+        duration_months = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(bot=bot, commission_permille=commission_permille, duration_months=duration_months)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateStarRefProgram, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        commission_permille, cursor = Int.read_from(view, cursor)
+        duration_months, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(bot=bot, commission_permille=commission_permille, duration_months=duration_months), cursor
+
+
+class SetCustomVerification(TLRequest[bool]):
+    __tl_id__ = 0x8b89dfbd
+    __tl_name__ = "functions.bots.SetCustomVerification"
+    __tl_layer__ = 196
+
+    __slots__ = ("enabled", "bot", "peer", "custom_description", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, enabled: bool = False, bot: tl.base.InputUser | None = None, custom_description: str | None = None):
+        self.enabled = enabled
+        self.bot = bot
+        self.peer = peer
+        self.custom_description = custom_description
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.enabled: flags1 |= (1 << 1)
+        if self.bot is not None: flags1 |= (1 << 0)
+        if self.custom_description is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.bot is not None:
+            self.bot.write_to(out, ctx)
+        self.peer.write_to(out, ctx)
+        if self.custom_description is not None:
+            String.write_to(out, self.custom_description)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetCustomVerification:
+        flags1 = Int.read(stream)
+        enabled = (flags1 & (1 << 1)) == (1 << 1)
+        bot = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        peer = TLObject.read(stream)
+        custom_description = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(enabled=enabled, bot=bot, peer=peer, custom_description=custom_description)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetCustomVerification, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        enabled = (flags1 & (1 << 1)) == (1 << 1)
+        bot, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        custom_description, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(enabled=enabled, bot=bot, peer=peer, custom_description=custom_description), cursor
+
+
+class GetBotRecommendations(TLRequest[tl.base.users.Users]):
+    __tl_id__ = 0xa1b70815
+    __tl_name__ = "functions.bots.GetBotRecommendations"
+    __tl_layer__ = 197
+
+    __slots__ = ("bot", )
+
+    def __init__(self, *, bot: tl.base.InputUser):
+        self.bot = bot
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBotRecommendations:
+        bot = TLObject.read(stream)
+        return cls(bot=bot)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBotRecommendations, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        return cls(bot=bot), cursor
+
+
+class SetBotInfo_155(TLRequest[bool]):
+    __tl_id__ = 0xa365df7a
+    __tl_name__ = "functions.bots.SetBotInfo_155"
+    __tl_layer__ = 155
+
+    __slots__ = ("lang_code", "about", "description", )
+
+    def __init__(self, *, lang_code: str, about: str | None = None, description: str | None = None):
+        self.lang_code = lang_code
+        self.about = about
+        self.description = description
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.about is not None: flags1 |= (1 << 0)
+        if self.description is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        String.write_to(out, self.lang_code)
+        if self.about is not None:
+            String.write_to(out, self.about)
+        if self.description is not None:
+            String.write_to(out, self.description)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotInfo_155:
+        flags1 = Int.read(stream)
+        lang_code = String.read(stream)
+        about = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        description = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(lang_code=lang_code, about=about, description=description)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotInfo_155, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        about, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        description, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(lang_code=lang_code, about=about, description=description), cursor
+
+
+class GetBotInfo_155(TLRequest[list[str]]):
+    __tl_id__ = 0x75ec12e6
+    __tl_name__ = "functions.bots.GetBotInfo_155"
+    __tl_layer__ = 155
+
+    __slots__ = ("lang_code", )
+
+    def __init__(self, *, lang_code: str):
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBotInfo_155:
+        lang_code = String.read(stream)
+        return cls(lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBotInfo_155, int]:
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(lang_code=lang_code), cursor
@@ -0,0 +1,2484 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class ReadHistory(TLRequest[bool]):
+    __tl_id__ = 0xcc104937
+    __tl_name__ = "functions.channels.ReadHistory"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "max_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, max_id: int):
+        self.channel = channel
+        self.max_id = max_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.max_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadHistory:
+        channel = TLObject.read(stream)
+        max_id = Int.read(stream)
+        return cls(channel=channel, max_id=max_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadHistory, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, max_id=max_id), cursor
+
+
+class DeleteMessages(TLRequest[tl.types.messages.AffectedMessages]):
+    __tl_id__ = 0x84c1fd4e
+    __tl_name__ = "functions.channels.DeleteMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, id: list[int]):
+        self.channel = channel
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteMessages:
+        channel = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(channel=channel, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteMessages, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(channel=channel, id=id), cursor
+
+
+class ReportSpam(TLRequest[bool]):
+    __tl_id__ = 0xf44a8315
+    __tl_name__ = "functions.channels.ReportSpam"
+    __tl_layer__ = 135
+
+    __slots__ = ("channel", "participant", "id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, participant: tl.base.InputPeer, id: list[int]):
+        self.channel = channel
+        self.participant = participant
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.participant.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportSpam:
+        channel = TLObject.read(stream)
+        participant = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(channel=channel, participant=participant, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportSpam, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        participant, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(channel=channel, participant=participant, id=id), cursor
+
+
+class GetMessages(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0xad8c9a23
+    __tl_name__ = "functions.channels.GetMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, id: list[tl.base.InputMessage]):
+        self.channel = channel
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessages:
+        channel = TLObject.read(stream)
+        id = TLObjectVector.read(stream)
+        return cls(channel=channel, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessages, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(channel=channel, id=id), cursor
+
+
+class GetParticipants(TLRequest[tl.base.channels.ChannelParticipants]):
+    __tl_id__ = 0x77ced9d0
+    __tl_name__ = "functions.channels.GetParticipants"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "filter", "offset", "limit", "hash", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, filter: tl.base.ChannelParticipantsFilter, offset: int, limit: int, hash: int):
+        self.channel = channel
+        self.filter = filter
+        self.offset = offset
+        self.limit = limit
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetParticipants:
+        channel = TLObject.read(stream)
+        filter = TLObject.read(stream)
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(channel=channel, filter=filter, offset=offset, limit=limit, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetParticipants, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(channel=channel, filter=filter, offset=offset, limit=limit, hash=hash), cursor
+
+
+class GetParticipant(TLRequest[tl.types.channels.ChannelParticipant]):
+    __tl_id__ = 0xa0ab6cc6
+    __tl_name__ = "functions.channels.GetParticipant"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "participant", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, participant: tl.base.InputPeer):
+        self.channel = channel
+        self.participant = participant
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.participant.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetParticipant:
+        channel = TLObject.read(stream)
+        participant = TLObject.read(stream)
+        return cls(channel=channel, participant=participant)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetParticipant, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        participant, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel, participant=participant), cursor
+
+
+class GetChannels(TLRequest[tl.base.messages.Chats]):
+    __tl_id__ = 0xa7f6bbb
+    __tl_name__ = "functions.channels.GetChannels"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[tl.base.InputChannel]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChannels:
+        id = TLObjectVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChannels, int]:
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetFullChannel(TLRequest[tl.types.messages.ChatFull]):
+    __tl_id__ = 0x8736a09
+    __tl_name__ = "functions.channels.GetFullChannel"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFullChannel:
+        channel = TLObject.read(stream)
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFullChannel, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel), cursor
+
+
+class CreateChannel(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x91006707
+    __tl_name__ = "functions.channels.CreateChannel"
+    __tl_layer__ = 150
+
+    __slots__ = ("broadcast", "megagroup", "for_import", "forum", "title", "about", "geo_point", "address", "ttl_period", )
+
+    def __init__(self, *, title: str, about: str, broadcast: bool = False, megagroup: bool = False, for_import: bool = False, forum: bool = False, geo_point: tl.base.InputGeoPoint | None = None, address: str | None = None, ttl_period: int | None = None):
+        self.broadcast = broadcast
+        self.megagroup = megagroup
+        self.for_import = for_import
+        self.forum = forum
+        self.title = title
+        self.about = about
+        self.geo_point = geo_point
+        self.address = address
+        self.ttl_period = ttl_period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.geo_point is None, self.address is None)
+        _flags_fields_not_empty = (self.geo_point is not None, self.address is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: geo_point, address")
+        flags1 = 0
+        if self.broadcast: flags1 |= (1 << 0)
+        if self.megagroup: flags1 |= (1 << 1)
+        if self.for_import: flags1 |= (1 << 3)
+        if self.forum: flags1 |= (1 << 5)
+        if self.geo_point is not None: flags1 |= (1 << 2)
+        if self.address is not None: flags1 |= (1 << 2)
+        if self.ttl_period is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        String.write_to(out, self.title)
+        String.write_to(out, self.about)
+        if self.geo_point is not None:
+            self.geo_point.write_to(out, ctx)
+        if self.address is not None:
+            String.write_to(out, self.address)
+        if self.ttl_period is not None:
+            out += Int.write(self.ttl_period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateChannel:
+        flags1 = Int.read(stream)
+        broadcast = (flags1 & (1 << 0)) == (1 << 0)
+        megagroup = (flags1 & (1 << 1)) == (1 << 1)
+        for_import = (flags1 & (1 << 3)) == (1 << 3)
+        forum = (flags1 & (1 << 5)) == (1 << 5)
+        title = String.read(stream)
+        about = String.read(stream)
+        geo_point = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        address = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        ttl_period = Int.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(broadcast=broadcast, megagroup=megagroup, for_import=for_import, forum=forum, title=title, about=about, geo_point=geo_point, address=address, ttl_period=ttl_period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateChannel, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        broadcast = (flags1 & (1 << 0)) == (1 << 0)
+        megagroup = (flags1 & (1 << 1)) == (1 << 1)
+        for_import = (flags1 & (1 << 3)) == (1 << 3)
+        forum = (flags1 & (1 << 5)) == (1 << 5)
+        title, cursor = String.read_from(view, cursor)
+        about, cursor = String.read_from(view, cursor)
+        geo_point, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        address, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        ttl_period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(broadcast=broadcast, megagroup=megagroup, for_import=for_import, forum=forum, title=title, about=about, geo_point=geo_point, address=address, ttl_period=ttl_period), cursor
+
+
+class EditAdmin(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd33c8902
+    __tl_name__ = "functions.channels.EditAdmin"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "user_id", "admin_rights", "rank", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, user_id: tl.base.InputUser, admin_rights: tl.types.ChatAdminRights, rank: str):
+        self.channel = channel
+        self.user_id = user_id
+        self.admin_rights = admin_rights
+        self.rank = rank
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.user_id.write_to(out, ctx)
+        self.admin_rights.write_to(out, ctx)
+        String.write_to(out, self.rank)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditAdmin:
+        channel = TLObject.read(stream)
+        user_id = TLObject.read(stream)
+        admin_rights = tl.types.ChatAdminRights.read(stream)
+        rank = String.read(stream)
+        return cls(channel=channel, user_id=user_id, admin_rights=admin_rights, rank=rank)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditAdmin, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        admin_rights, cursor = tl.types.ChatAdminRights.read_from(view, cursor)
+        rank, cursor = String.read_from(view, cursor)
+        return cls(channel=channel, user_id=user_id, admin_rights=admin_rights, rank=rank), cursor
+
+
+class EditTitle(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x566decd0
+    __tl_name__ = "functions.channels.EditTitle"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "title", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, title: str):
+        self.channel = channel
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditTitle:
+        channel = TLObject.read(stream)
+        title = String.read(stream)
+        return cls(channel=channel, title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditTitle, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        return cls(channel=channel, title=title), cursor
+
+
+class EditPhoto(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf12e57c9
+    __tl_name__ = "functions.channels.EditPhoto"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "photo", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, photo: tl.base.InputChatPhoto):
+        self.channel = channel
+        self.photo = photo
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.photo.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditPhoto:
+        channel = TLObject.read(stream)
+        photo = TLObject.read(stream)
+        return cls(channel=channel, photo=photo)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditPhoto, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        photo, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel, photo=photo), cursor
+
+
+class CheckUsername(TLRequest[bool]):
+    __tl_id__ = 0x10e6bd2c
+    __tl_name__ = "functions.channels.CheckUsername"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "username", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, username: str):
+        self.channel = channel
+        self.username = username
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        String.write_to(out, self.username)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckUsername:
+        channel = TLObject.read(stream)
+        username = String.read(stream)
+        return cls(channel=channel, username=username)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckUsername, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        username, cursor = String.read_from(view, cursor)
+        return cls(channel=channel, username=username), cursor
+
+
+class UpdateUsername(TLRequest[bool]):
+    __tl_id__ = 0x3514b3de
+    __tl_name__ = "functions.channels.UpdateUsername"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "username", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, username: str):
+        self.channel = channel
+        self.username = username
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        String.write_to(out, self.username)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateUsername:
+        channel = TLObject.read(stream)
+        username = String.read(stream)
+        return cls(channel=channel, username=username)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateUsername, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        username, cursor = String.read_from(view, cursor)
+        return cls(channel=channel, username=username), cursor
+
+
+class JoinChannel(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x24b524c5
+    __tl_name__ = "functions.channels.JoinChannel"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> JoinChannel:
+        channel = TLObject.read(stream)
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[JoinChannel, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel), cursor
+
+
+class LeaveChannel(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf836aa95
+    __tl_name__ = "functions.channels.LeaveChannel"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LeaveChannel:
+        channel = TLObject.read(stream)
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LeaveChannel, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel), cursor
+
+
+class InviteToChannel(TLRequest[tl.types.messages.InvitedUsers]):
+    __tl_id__ = 0xc9e33d54
+    __tl_name__ = "functions.channels.InviteToChannel"
+    __tl_layer__ = 177
+
+    __slots__ = ("channel", "users", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, users: list[tl.base.InputUser]):
+        self.channel = channel
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InviteToChannel:
+        channel = TLObject.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(channel=channel, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InviteToChannel, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(channel=channel, users=users), cursor
+
+
+class DeleteChannel(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xc0111fe3
+    __tl_name__ = "functions.channels.DeleteChannel"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteChannel:
+        channel = TLObject.read(stream)
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteChannel, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel), cursor
+
+
+class ExportMessageLink(TLRequest[tl.types.ExportedMessageLink]):
+    __tl_id__ = 0xe63fadeb
+    __tl_name__ = "functions.channels.ExportMessageLink"
+    __tl_layer__ = 133
+
+    __slots__ = ("grouped", "thread", "channel", "id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, id: int, grouped: bool = False, thread: bool = False):
+        self.grouped = grouped
+        self.thread = thread
+        self.channel = channel
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.grouped: flags1 |= (1 << 0)
+        if self.thread: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportMessageLink:
+        flags1 = Int.read(stream)
+        grouped = (flags1 & (1 << 0)) == (1 << 0)
+        thread = (flags1 & (1 << 1)) == (1 << 1)
+        channel = TLObject.read(stream)
+        id = Int.read(stream)
+        return cls(grouped=grouped, thread=thread, channel=channel, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportMessageLink, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        grouped = (flags1 & (1 << 0)) == (1 << 0)
+        thread = (flags1 & (1 << 1)) == (1 << 1)
+        channel, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        return cls(grouped=grouped, thread=thread, channel=channel, id=id), cursor
+
+
+class ToggleSignatures(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x418d549c
+    __tl_name__ = "functions.channels.ToggleSignatures"
+    __tl_layer__ = 186
+
+    __slots__ = ("signatures_enabled", "profiles_enabled", "channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, signatures_enabled: bool = False, profiles_enabled: bool = False):
+        self.signatures_enabled = signatures_enabled
+        self.profiles_enabled = profiles_enabled
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.signatures_enabled: flags1 |= (1 << 0)
+        if self.profiles_enabled: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleSignatures:
+        flags1 = Int.read(stream)
+        signatures_enabled = (flags1 & (1 << 0)) == (1 << 0)
+        profiles_enabled = (flags1 & (1 << 1)) == (1 << 1)
+        channel = TLObject.read(stream)
+        return cls(signatures_enabled=signatures_enabled, profiles_enabled=profiles_enabled, channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleSignatures, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        signatures_enabled = (flags1 & (1 << 0)) == (1 << 0)
+        profiles_enabled = (flags1 & (1 << 1)) == (1 << 1)
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(signatures_enabled=signatures_enabled, profiles_enabled=profiles_enabled, channel=channel), cursor
+
+
+class GetAdminedPublicChannels(TLRequest[tl.base.messages.Chats]):
+    __tl_id__ = 0xf8b036af
+    __tl_name__ = "functions.channels.GetAdminedPublicChannels"
+    __tl_layer__ = 133
+
+    __slots__ = ("by_location", "check_limit", "for_personal", )
+
+    def __init__(self, *, by_location: bool = False, check_limit: bool = False, for_personal: bool = False):
+        self.by_location = by_location
+        self.check_limit = check_limit
+        self.for_personal = for_personal
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.by_location: flags1 |= (1 << 0)
+        if self.check_limit: flags1 |= (1 << 1)
+        if self.for_personal: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAdminedPublicChannels:
+        flags1 = Int.read(stream)
+        by_location = (flags1 & (1 << 0)) == (1 << 0)
+        check_limit = (flags1 & (1 << 1)) == (1 << 1)
+        for_personal = (flags1 & (1 << 2)) == (1 << 2)
+        return cls(by_location=by_location, check_limit=check_limit, for_personal=for_personal)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAdminedPublicChannels, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        by_location = (flags1 & (1 << 0)) == (1 << 0)
+        check_limit = (flags1 & (1 << 1)) == (1 << 1)
+        for_personal = (flags1 & (1 << 2)) == (1 << 2)
+        return cls(by_location=by_location, check_limit=check_limit, for_personal=for_personal), cursor
+
+
+class EditBanned(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x96e6cd81
+    __tl_name__ = "functions.channels.EditBanned"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "participant", "banned_rights", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, participant: tl.base.InputPeer, banned_rights: tl.types.ChatBannedRights):
+        self.channel = channel
+        self.participant = participant
+        self.banned_rights = banned_rights
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.participant.write_to(out, ctx)
+        self.banned_rights.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditBanned:
+        channel = TLObject.read(stream)
+        participant = TLObject.read(stream)
+        banned_rights = tl.types.ChatBannedRights.read(stream)
+        return cls(channel=channel, participant=participant, banned_rights=banned_rights)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditBanned, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        participant, cursor = TLObject.read_from(view, cursor)
+        banned_rights, cursor = tl.types.ChatBannedRights.read_from(view, cursor)
+        return cls(channel=channel, participant=participant, banned_rights=banned_rights), cursor
+
+
+class GetAdminLog(TLRequest[tl.types.channels.AdminLogResults]):
+    __tl_id__ = 0x33ddf480
+    __tl_name__ = "functions.channels.GetAdminLog"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "q", "events_filter", "admins", "max_id", "min_id", "limit", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, q: str, max_id: int, min_id: int, limit: int, events_filter: tl.types.ChannelAdminLogEventsFilter | None = None, admins: list[tl.base.InputUser] | None = None):
+        self.channel = channel
+        self.q = q
+        self.events_filter = events_filter
+        self.admins = admins
+        self.max_id = max_id
+        self.min_id = min_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.events_filter is not None: flags1 |= (1 << 0)
+        if self.admins: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        String.write_to(out, self.q)
+        if self.events_filter is not None:
+            self.events_filter.write_to(out, ctx)
+        if self.admins:
+            TLObjectVector.write_to(out, self.admins, ctx)
+        out += Long.write(self.max_id)
+        out += Long.write(self.min_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAdminLog:
+        flags1 = Int.read(stream)
+        channel = TLObject.read(stream)
+        q = String.read(stream)
+        events_filter = tl.types.ChannelAdminLogEventsFilter.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        admins = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        max_id = Long.read(stream)
+        min_id = Long.read(stream)
+        limit = Int.read(stream)
+        return cls(channel=channel, q=q, events_filter=events_filter, admins=admins, max_id=max_id, min_id=min_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAdminLog, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        channel, cursor = TLObject.read_from(view, cursor)
+        q, cursor = String.read_from(view, cursor)
+        events_filter, cursor = tl.types.ChannelAdminLogEventsFilter.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        admins, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        max_id, cursor = Long.read_from(view, cursor)
+        min_id, cursor = Long.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, q=q, events_filter=events_filter, admins=admins, max_id=max_id, min_id=min_id, limit=limit), cursor
+
+
+class SetStickers(TLRequest[bool]):
+    __tl_id__ = 0xea8ca4f9
+    __tl_name__ = "functions.channels.SetStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "stickerset", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, stickerset: tl.base.InputStickerSet):
+        self.channel = channel
+        self.stickerset = stickerset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.stickerset.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetStickers:
+        channel = TLObject.read(stream)
+        stickerset = TLObject.read(stream)
+        return cls(channel=channel, stickerset=stickerset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetStickers, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel, stickerset=stickerset), cursor
+
+
+class ReadMessageContents(TLRequest[bool]):
+    __tl_id__ = 0xeab5dc38
+    __tl_name__ = "functions.channels.ReadMessageContents"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, id: list[int]):
+        self.channel = channel
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadMessageContents:
+        channel = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(channel=channel, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadMessageContents, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(channel=channel, id=id), cursor
+
+
+class DeleteHistory(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x9baa9647
+    __tl_name__ = "functions.channels.DeleteHistory"
+    __tl_layer__ = 140
+
+    __slots__ = ("for_everyone", "channel", "max_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, max_id: int, for_everyone: bool = False):
+        self.for_everyone = for_everyone
+        self.channel = channel
+        self.max_id = max_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.for_everyone: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.max_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteHistory:
+        flags1 = Int.read(stream)
+        for_everyone = (flags1 & (1 << 0)) == (1 << 0)
+        channel = TLObject.read(stream)
+        max_id = Int.read(stream)
+        return cls(for_everyone=for_everyone, channel=channel, max_id=max_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteHistory, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        for_everyone = (flags1 & (1 << 0)) == (1 << 0)
+        channel, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        return cls(for_everyone=for_everyone, channel=channel, max_id=max_id), cursor
+
+
+class TogglePreHistoryHidden(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xeabbb94c
+    __tl_name__ = "functions.channels.TogglePreHistoryHidden"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "enabled", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, enabled: bool):
+        self.channel = channel
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TogglePreHistoryHidden:
+        channel = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(channel=channel, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TogglePreHistoryHidden, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, enabled=enabled), cursor
+
+
+class GetLeftChannels(TLRequest[tl.base.messages.Chats]):
+    __tl_id__ = 0x8341ecc0
+    __tl_name__ = "functions.channels.GetLeftChannels"
+    __tl_layer__ = 133
+
+    __slots__ = ("offset", )
+
+    def __init__(self, *, offset: int):
+        self.offset = offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetLeftChannels:
+        offset = Int.read(stream)
+        return cls(offset=offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetLeftChannels, int]:
+        offset, cursor = Int.read_from(view, cursor)
+        return cls(offset=offset), cursor
+
+
+class GetGroupsForDiscussion(TLRequest[tl.base.messages.Chats]):
+    __tl_id__ = 0xf5dad378
+    __tl_name__ = "functions.channels.GetGroupsForDiscussion"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetGroupsForDiscussion:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetGroupsForDiscussion, int]:
+        return cls(), cursor
+
+
+class SetDiscussionGroup(TLRequest[bool]):
+    __tl_id__ = 0x40582bb2
+    __tl_name__ = "functions.channels.SetDiscussionGroup"
+    __tl_layer__ = 133
+
+    __slots__ = ("broadcast", "group", )
+
+    def __init__(self, *, broadcast: tl.base.InputChannel, group: tl.base.InputChannel):
+        self.broadcast = broadcast
+        self.group = group
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.broadcast.write_to(out, ctx)
+        self.group.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetDiscussionGroup:
+        broadcast = TLObject.read(stream)
+        group = TLObject.read(stream)
+        return cls(broadcast=broadcast, group=group)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetDiscussionGroup, int]:
+        broadcast, cursor = TLObject.read_from(view, cursor)
+        group, cursor = TLObject.read_from(view, cursor)
+        return cls(broadcast=broadcast, group=group), cursor
+
+
+class EditCreator(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x8f38cd1f
+    __tl_name__ = "functions.channels.EditCreator"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "user_id", "password", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, user_id: tl.base.InputUser, password: tl.base.InputCheckPasswordSRP):
+        self.channel = channel
+        self.user_id = user_id
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.user_id.write_to(out, ctx)
+        self.password.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditCreator:
+        channel = TLObject.read(stream)
+        user_id = TLObject.read(stream)
+        password = TLObject.read(stream)
+        return cls(channel=channel, user_id=user_id, password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditCreator, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        password, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel, user_id=user_id, password=password), cursor
+
+
+class EditLocation(TLRequest[bool]):
+    __tl_id__ = 0x58e63f6d
+    __tl_name__ = "functions.channels.EditLocation"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "geo_point", "address", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, geo_point: tl.base.InputGeoPoint, address: str):
+        self.channel = channel
+        self.geo_point = geo_point
+        self.address = address
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.geo_point.write_to(out, ctx)
+        String.write_to(out, self.address)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditLocation:
+        channel = TLObject.read(stream)
+        geo_point = TLObject.read(stream)
+        address = String.read(stream)
+        return cls(channel=channel, geo_point=geo_point, address=address)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditLocation, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        geo_point, cursor = TLObject.read_from(view, cursor)
+        address, cursor = String.read_from(view, cursor)
+        return cls(channel=channel, geo_point=geo_point, address=address), cursor
+
+
+class ToggleSlowMode(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xedd49ef0
+    __tl_name__ = "functions.channels.ToggleSlowMode"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "seconds", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, seconds: int):
+        self.channel = channel
+        self.seconds = seconds
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.seconds)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleSlowMode:
+        channel = TLObject.read(stream)
+        seconds = Int.read(stream)
+        return cls(channel=channel, seconds=seconds)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleSlowMode, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        seconds, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, seconds=seconds), cursor
+
+
+class GetInactiveChannels(TLRequest[tl.types.messages.InactiveChats]):
+    __tl_id__ = 0x11e831ee
+    __tl_name__ = "functions.channels.GetInactiveChannels"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetInactiveChannels:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetInactiveChannels, int]:
+        return cls(), cursor
+
+
+class ConvertToGigagroup(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xb290c69
+    __tl_name__ = "functions.channels.ConvertToGigagroup"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConvertToGigagroup:
+        channel = TLObject.read(stream)
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConvertToGigagroup, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel), cursor
+
+
+class GetSendAs(TLRequest[tl.base.channels.SendAsPeers]):
+    __tl_id__ = 0xe785a43f
+    __tl_name__ = "functions.channels.GetSendAs"
+    __tl_layer__ = 199
+
+    __slots__ = ("for_paid_reactions", "peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, for_paid_reactions: bool = False):
+        self.for_paid_reactions = for_paid_reactions
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.for_paid_reactions: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSendAs:
+        flags1 = Int.read(stream)
+        for_paid_reactions = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        return cls(for_paid_reactions=for_paid_reactions, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSendAs, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        for_paid_reactions = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(for_paid_reactions=for_paid_reactions, peer=peer), cursor
+
+
+class DeleteParticipantHistory(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0x367544db
+    __tl_name__ = "functions.channels.DeleteParticipantHistory"
+    __tl_layer__ = 135
+
+    __slots__ = ("channel", "participant", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, participant: tl.base.InputPeer):
+        self.channel = channel
+        self.participant = participant
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.participant.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteParticipantHistory:
+        channel = TLObject.read(stream)
+        participant = TLObject.read(stream)
+        return cls(channel=channel, participant=participant)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteParticipantHistory, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        participant, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel, participant=participant), cursor
+
+
+class ToggleJoinToSend(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xe4cb9580
+    __tl_name__ = "functions.channels.ToggleJoinToSend"
+    __tl_layer__ = 143
+
+    __slots__ = ("channel", "enabled", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, enabled: bool):
+        self.channel = channel
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleJoinToSend:
+        channel = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(channel=channel, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleJoinToSend, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, enabled=enabled), cursor
+
+
+class ToggleJoinRequest(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x4c2985b6
+    __tl_name__ = "functions.channels.ToggleJoinRequest"
+    __tl_layer__ = 143
+
+    __slots__ = ("channel", "enabled", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, enabled: bool):
+        self.channel = channel
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleJoinRequest:
+        channel = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(channel=channel, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleJoinRequest, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, enabled=enabled), cursor
+
+
+class ReorderUsernames(TLRequest[bool]):
+    __tl_id__ = 0xb45ced1d
+    __tl_name__ = "functions.channels.ReorderUsernames"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", "order", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, order: list[str]):
+        self.channel = channel
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += StringVector.write(self.order)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReorderUsernames:
+        channel = TLObject.read(stream)
+        order = StringVector.read(stream)
+        return cls(channel=channel, order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReorderUsernames, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        order, cursor = StringVector.read_from(view, cursor)
+        return cls(channel=channel, order=order), cursor
+
+
+class ToggleUsername(TLRequest[bool]):
+    __tl_id__ = 0x50f24105
+    __tl_name__ = "functions.channels.ToggleUsername"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", "username", "active", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, username: str, active: bool):
+        self.channel = channel
+        self.username = username
+        self.active = active
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        String.write_to(out, self.username)
+        out += Bool.write(self.active)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleUsername:
+        channel = TLObject.read(stream)
+        username = String.read(stream)
+        active = Bool.read(stream)
+        return cls(channel=channel, username=username, active=active)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleUsername, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        username, cursor = String.read_from(view, cursor)
+        active, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, username=username, active=active), cursor
+
+
+class DeactivateAllUsernames(TLRequest[bool]):
+    __tl_id__ = 0xa245dd3
+    __tl_name__ = "functions.channels.DeactivateAllUsernames"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeactivateAllUsernames:
+        channel = TLObject.read(stream)
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeactivateAllUsernames, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel), cursor
+
+
+class ToggleForum(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xa4298b29
+    __tl_name__ = "functions.channels.ToggleForum"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", "enabled", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, enabled: bool):
+        self.channel = channel
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleForum:
+        channel = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(channel=channel, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleForum, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, enabled=enabled), cursor
+
+
+class CreateForumTopic(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf40c0224
+    __tl_name__ = "functions.channels.CreateForumTopic"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", "title", "icon_color", "icon_emoji_id", "random_id", "send_as", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, title: str, random_id: int, icon_color: int | None = None, icon_emoji_id: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.channel = channel
+        self.title = title
+        self.icon_color = icon_color
+        self.icon_emoji_id = icon_emoji_id
+        self.random_id = random_id
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.icon_color is not None: flags1 |= (1 << 0)
+        if self.icon_emoji_id is not None: flags1 |= (1 << 3)
+        if self.send_as is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        String.write_to(out, self.title)
+        if self.icon_color is not None:
+            out += Int.write(self.icon_color)
+        if self.icon_emoji_id is not None:
+            out += Long.write(self.icon_emoji_id)
+        out += Long.write(self.random_id)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateForumTopic:
+        flags1 = Int.read(stream)
+        channel = TLObject.read(stream)
+        title = String.read(stream)
+        icon_color = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        icon_emoji_id = Long.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        random_id = Long.read(stream)
+        send_as = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(channel=channel, title=title, icon_color=icon_color, icon_emoji_id=icon_emoji_id, random_id=random_id, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateForumTopic, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        channel, cursor = TLObject.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        icon_color, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        icon_emoji_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(channel=channel, title=title, icon_color=icon_color, icon_emoji_id=icon_emoji_id, random_id=random_id, send_as=send_as), cursor
+
+
+class GetForumTopics(TLRequest[tl.types.messages.ForumTopics]):
+    __tl_id__ = 0xde560d1
+    __tl_name__ = "functions.channels.GetForumTopics"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", "q", "offset_date", "offset_id", "offset_topic", "limit", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, offset_date: int, offset_id: int, offset_topic: int, limit: int, q: str | None = None):
+        self.channel = channel
+        self.q = q
+        self.offset_date = offset_date
+        self.offset_id = offset_id
+        self.offset_topic = offset_topic
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.q is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        if self.q is not None:
+            String.write_to(out, self.q)
+        out += Int.write(self.offset_date)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.offset_topic)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetForumTopics:
+        flags1 = Int.read(stream)
+        channel = TLObject.read(stream)
+        q = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        offset_date = Int.read(stream)
+        offset_id = Int.read(stream)
+        offset_topic = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(channel=channel, q=q, offset_date=offset_date, offset_id=offset_id, offset_topic=offset_topic, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetForumTopics, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        channel, cursor = TLObject.read_from(view, cursor)
+        q, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        offset_topic, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, q=q, offset_date=offset_date, offset_id=offset_id, offset_topic=offset_topic, limit=limit), cursor
+
+
+class GetForumTopicsByID(TLRequest[tl.types.messages.ForumTopics]):
+    __tl_id__ = 0xb0831eb9
+    __tl_name__ = "functions.channels.GetForumTopicsByID"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", "topics", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, topics: list[int]):
+        self.channel = channel
+        self.topics = topics
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += IntVector.write(self.topics)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetForumTopicsByID:
+        channel = TLObject.read(stream)
+        topics = IntVector.read(stream)
+        return cls(channel=channel, topics=topics)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetForumTopicsByID, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        topics, cursor = IntVector.read_from(view, cursor)
+        return cls(channel=channel, topics=topics), cursor
+
+
+class EditForumTopic(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf4dfa185
+    __tl_name__ = "functions.channels.EditForumTopic"
+    __tl_layer__ = 150
+
+    __slots__ = ("channel", "topic_id", "title", "icon_emoji_id", "closed", "hidden", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, topic_id: int, title: str | None = None, icon_emoji_id: int | None = None, closed: bool = False, hidden: bool = False):
+        self.channel = channel
+        self.topic_id = topic_id
+        self.title = title
+        self.icon_emoji_id = icon_emoji_id
+        self.closed = closed
+        self.hidden = hidden
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.title is not None: flags1 |= (1 << 0)
+        if self.icon_emoji_id is not None: flags1 |= (1 << 1)
+        if self.closed is not None: flags1 |= (1 << 2)
+        if self.hidden is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.topic_id)
+        if self.title is not None:
+            String.write_to(out, self.title)
+        if self.icon_emoji_id is not None:
+            out += Long.write(self.icon_emoji_id)
+        if self.closed is not None:
+            out += Bool.write(self.closed)
+        if self.hidden is not None:
+            out += Bool.write(self.hidden)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditForumTopic:
+        flags1 = Int.read(stream)
+        channel = TLObject.read(stream)
+        topic_id = Int.read(stream)
+        title = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        icon_emoji_id = Long.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        closed = Bool.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        hidden = Bool.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(channel=channel, topic_id=topic_id, title=title, icon_emoji_id=icon_emoji_id, closed=closed, hidden=hidden)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditForumTopic, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        channel, cursor = TLObject.read_from(view, cursor)
+        topic_id, cursor = Int.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        icon_emoji_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        closed, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        hidden, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(channel=channel, topic_id=topic_id, title=title, icon_emoji_id=icon_emoji_id, closed=closed, hidden=hidden), cursor
+
+
+class UpdatePinnedForumTopic(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x6c2d9026
+    __tl_name__ = "functions.channels.UpdatePinnedForumTopic"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", "topic_id", "pinned", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, topic_id: int, pinned: bool):
+        self.channel = channel
+        self.topic_id = topic_id
+        self.pinned = pinned
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.topic_id)
+        out += Bool.write(self.pinned)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdatePinnedForumTopic:
+        channel = TLObject.read(stream)
+        topic_id = Int.read(stream)
+        pinned = Bool.read(stream)
+        return cls(channel=channel, topic_id=topic_id, pinned=pinned)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdatePinnedForumTopic, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        topic_id, cursor = Int.read_from(view, cursor)
+        pinned, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, topic_id=topic_id, pinned=pinned), cursor
+
+
+class DeleteTopicHistory(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0x34435f2d
+    __tl_name__ = "functions.channels.DeleteTopicHistory"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", "top_msg_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, top_msg_id: int):
+        self.channel = channel
+        self.top_msg_id = top_msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.top_msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteTopicHistory:
+        channel = TLObject.read(stream)
+        top_msg_id = Int.read(stream)
+        return cls(channel=channel, top_msg_id=top_msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteTopicHistory, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, top_msg_id=top_msg_id), cursor
+
+
+class ReorderPinnedForumTopics(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x2950a18f
+    __tl_name__ = "functions.channels.ReorderPinnedForumTopics"
+    __tl_layer__ = 150
+
+    __slots__ = ("force", "channel", "order", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, order: list[int], force: bool = False):
+        self.force = force
+        self.channel = channel
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.force: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        out += IntVector.write(self.order)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReorderPinnedForumTopics:
+        flags1 = Int.read(stream)
+        force = (flags1 & (1 << 0)) == (1 << 0)
+        channel = TLObject.read(stream)
+        order = IntVector.read(stream)
+        return cls(force=force, channel=channel, order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReorderPinnedForumTopics, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        force = (flags1 & (1 << 0)) == (1 << 0)
+        channel, cursor = TLObject.read_from(view, cursor)
+        order, cursor = IntVector.read_from(view, cursor)
+        return cls(force=force, channel=channel, order=order), cursor
+
+
+class ToggleAntiSpam(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x68f3e4eb
+    __tl_name__ = "functions.channels.ToggleAntiSpam"
+    __tl_layer__ = 150
+
+    __slots__ = ("channel", "enabled", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, enabled: bool):
+        self.channel = channel
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleAntiSpam:
+        channel = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(channel=channel, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleAntiSpam, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, enabled=enabled), cursor
+
+
+class ReportAntiSpamFalsePositive(TLRequest[bool]):
+    __tl_id__ = 0xa850a693
+    __tl_name__ = "functions.channels.ReportAntiSpamFalsePositive"
+    __tl_layer__ = 150
+
+    __slots__ = ("channel", "msg_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, msg_id: int):
+        self.channel = channel
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportAntiSpamFalsePositive:
+        channel = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(channel=channel, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportAntiSpamFalsePositive, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, msg_id=msg_id), cursor
+
+
+class ToggleParticipantsHidden(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x6a6e7854
+    __tl_name__ = "functions.channels.ToggleParticipantsHidden"
+    __tl_layer__ = 151
+
+    __slots__ = ("channel", "enabled", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, enabled: bool):
+        self.channel = channel
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleParticipantsHidden:
+        channel = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(channel=channel, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleParticipantsHidden, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, enabled=enabled), cursor
+
+
+class UpdateColor(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd8aa3671
+    __tl_name__ = "functions.channels.UpdateColor"
+    __tl_layer__ = 168
+
+    __slots__ = ("for_profile", "channel", "color", "background_emoji_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, for_profile: bool = False, color: int | None = None, background_emoji_id: int | None = None):
+        self.for_profile = for_profile
+        self.channel = channel
+        self.color = color
+        self.background_emoji_id = background_emoji_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.for_profile: flags1 |= (1 << 1)
+        if self.color is not None: flags1 |= (1 << 2)
+        if self.background_emoji_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        if self.color is not None:
+            out += Int.write(self.color)
+        if self.background_emoji_id is not None:
+            out += Long.write(self.background_emoji_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateColor:
+        flags1 = Int.read(stream)
+        for_profile = (flags1 & (1 << 1)) == (1 << 1)
+        channel = TLObject.read(stream)
+        color = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        background_emoji_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(for_profile=for_profile, channel=channel, color=color, background_emoji_id=background_emoji_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateColor, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        for_profile = (flags1 & (1 << 1)) == (1 << 1)
+        channel, cursor = TLObject.read_from(view, cursor)
+        color, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        background_emoji_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(for_profile=for_profile, channel=channel, color=color, background_emoji_id=background_emoji_id), cursor
+
+
+class ToggleViewForumAsMessages(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x9738bb15
+    __tl_name__ = "functions.channels.ToggleViewForumAsMessages"
+    __tl_layer__ = 167
+
+    __slots__ = ("channel", "enabled", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, enabled: bool):
+        self.channel = channel
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleViewForumAsMessages:
+        channel = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(channel=channel, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleViewForumAsMessages, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, enabled=enabled), cursor
+
+
+class GetChannelRecommendations(TLRequest[tl.base.messages.Chats]):
+    __tl_id__ = 0x25a71742
+    __tl_name__ = "functions.channels.GetChannelRecommendations"
+    __tl_layer__ = 179
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel | None = None):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.channel is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.channel is not None:
+            self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChannelRecommendations:
+        flags1 = Int.read(stream)
+        channel = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChannelRecommendations, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        channel, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(channel=channel), cursor
+
+
+class UpdateEmojiStatus(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf0d3e6a8
+    __tl_name__ = "functions.channels.UpdateEmojiStatus"
+    __tl_layer__ = 168
+
+    __slots__ = ("channel", "emoji_status", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, emoji_status: tl.base.EmojiStatus):
+        self.channel = channel
+        self.emoji_status = emoji_status
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.emoji_status.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateEmojiStatus:
+        channel = TLObject.read(stream)
+        emoji_status = TLObject.read(stream)
+        return cls(channel=channel, emoji_status=emoji_status)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateEmojiStatus, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        emoji_status, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel, emoji_status=emoji_status), cursor
+
+
+class SetBoostsToUnblockRestrictions(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xad399cee
+    __tl_name__ = "functions.channels.SetBoostsToUnblockRestrictions"
+    __tl_layer__ = 174
+
+    __slots__ = ("channel", "boosts", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, boosts: int):
+        self.channel = channel
+        self.boosts = boosts
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.boosts)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBoostsToUnblockRestrictions:
+        channel = TLObject.read(stream)
+        boosts = Int.read(stream)
+        return cls(channel=channel, boosts=boosts)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBoostsToUnblockRestrictions, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        boosts, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, boosts=boosts), cursor
+
+
+class SetEmojiStickers(TLRequest[bool]):
+    __tl_id__ = 0x3cd930b7
+    __tl_name__ = "functions.channels.SetEmojiStickers"
+    __tl_layer__ = 174
+
+    __slots__ = ("channel", "stickerset", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, stickerset: tl.base.InputStickerSet):
+        self.channel = channel
+        self.stickerset = stickerset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.stickerset.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetEmojiStickers:
+        channel = TLObject.read(stream)
+        stickerset = TLObject.read(stream)
+        return cls(channel=channel, stickerset=stickerset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetEmojiStickers, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel, stickerset=stickerset), cursor
+
+
+class RestrictSponsoredMessages(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x9ae91519
+    __tl_name__ = "functions.channels.RestrictSponsoredMessages"
+    __tl_layer__ = 177
+
+    __slots__ = ("channel", "restricted", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, restricted: bool):
+        self.channel = channel
+        self.restricted = restricted
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Bool.write(self.restricted)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RestrictSponsoredMessages:
+        channel = TLObject.read(stream)
+        restricted = Bool.read(stream)
+        return cls(channel=channel, restricted=restricted)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RestrictSponsoredMessages, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        restricted, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, restricted=restricted), cursor
+
+
+class SearchPosts(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0xd19f987b
+    __tl_name__ = "functions.channels.SearchPosts"
+    __tl_layer__ = 181
+
+    __slots__ = ("hashtag", "offset_rate", "offset_peer", "offset_id", "limit", )
+
+    def __init__(self, *, hashtag: str, offset_rate: int, offset_peer: tl.base.InputPeer, offset_id: int, limit: int):
+        self.hashtag = hashtag
+        self.offset_rate = offset_rate
+        self.offset_peer = offset_peer
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.hashtag)
+        out += Int.write(self.offset_rate)
+        self.offset_peer.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchPosts:
+        hashtag = String.read(stream)
+        offset_rate = Int.read(stream)
+        offset_peer = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(hashtag=hashtag, offset_rate=offset_rate, offset_peer=offset_peer, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchPosts, int]:
+        hashtag, cursor = String.read_from(view, cursor)
+        offset_rate, cursor = Int.read_from(view, cursor)
+        offset_peer, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(hashtag=hashtag, offset_rate=offset_rate, offset_peer=offset_peer, offset_id=offset_id, limit=limit), cursor
+
+
+class UpdatePaidMessagesPrice(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xfc84653f
+    __tl_name__ = "functions.channels.UpdatePaidMessagesPrice"
+    __tl_layer__ = 200
+
+    __slots__ = ("channel", "send_paid_messages_stars", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, send_paid_messages_stars: int):
+        self.channel = channel
+        self.send_paid_messages_stars = send_paid_messages_stars
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Long.write(self.send_paid_messages_stars)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdatePaidMessagesPrice:
+        channel = TLObject.read(stream)
+        send_paid_messages_stars = Long.read(stream)
+        return cls(channel=channel, send_paid_messages_stars=send_paid_messages_stars)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdatePaidMessagesPrice, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        send_paid_messages_stars, cursor = Long.read_from(view, cursor)
+        return cls(channel=channel, send_paid_messages_stars=send_paid_messages_stars), cursor
+
+
+class GetMessages_40(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x93d7b347
+    __tl_name__ = "functions.channels.GetMessages_40"
+    __tl_layer__ = 40
+
+    __slots__ = ("channel", "id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, id: list[int]):
+        self.channel = channel
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessages_40:
+        channel = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(channel=channel, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessages_40, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(channel=channel, id=id), cursor
+
+
+class DeleteUserHistory_133(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0xd10dd71b
+    __tl_name__ = "functions.channels.DeleteUserHistory_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "user_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, user_id: tl.base.InputUser):
+        self.channel = channel
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteUserHistory_133:
+        channel = TLObject.read(stream)
+        user_id = TLObject.read(stream)
+        return cls(channel=channel, user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteUserHistory_133, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel, user_id=user_id), cursor
+
+
+class ReportSpam_133(TLRequest[bool]):
+    __tl_id__ = 0xfe087810
+    __tl_name__ = "functions.channels.ReportSpam_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "user_id", "id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, user_id: tl.base.InputUser, id: list[int]):
+        self.channel = channel
+        self.user_id = user_id
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.user_id.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportSpam_133:
+        channel = TLObject.read(stream)
+        user_id = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(channel=channel, user_id=user_id, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportSpam_133, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(channel=channel, user_id=user_id, id=id), cursor
+
+
+class CreateChannel_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x3d5fb10f
+    __tl_name__ = "functions.channels.CreateChannel_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("broadcast", "megagroup", "for_import", "title", "about", "geo_point", "address", )
+
+    def __init__(self, *, title: str, about: str, broadcast: bool = False, megagroup: bool = False, for_import: bool = False, geo_point: tl.base.InputGeoPoint | None = None, address: str | None = None):
+        self.broadcast = broadcast
+        self.megagroup = megagroup
+        self.for_import = for_import
+        self.title = title
+        self.about = about
+        self.geo_point = geo_point
+        self.address = address
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.geo_point is None, self.address is None)
+        _flags_fields_not_empty = (self.geo_point is not None, self.address is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: geo_point, address")
+        flags1 = 0
+        if self.broadcast: flags1 |= (1 << 0)
+        if self.megagroup: flags1 |= (1 << 1)
+        if self.for_import: flags1 |= (1 << 3)
+        if self.geo_point is not None: flags1 |= (1 << 2)
+        if self.address is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        String.write_to(out, self.title)
+        String.write_to(out, self.about)
+        if self.geo_point is not None:
+            self.geo_point.write_to(out, ctx)
+        if self.address is not None:
+            String.write_to(out, self.address)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateChannel_133:
+        flags1 = Int.read(stream)
+        broadcast = (flags1 & (1 << 0)) == (1 << 0)
+        megagroup = (flags1 & (1 << 1)) == (1 << 1)
+        for_import = (flags1 & (1 << 3)) == (1 << 3)
+        title = String.read(stream)
+        about = String.read(stream)
+        geo_point = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        address = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(broadcast=broadcast, megagroup=megagroup, for_import=for_import, title=title, about=about, geo_point=geo_point, address=address)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateChannel_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        broadcast = (flags1 & (1 << 0)) == (1 << 0)
+        megagroup = (flags1 & (1 << 1)) == (1 << 1)
+        for_import = (flags1 & (1 << 3)) == (1 << 3)
+        title, cursor = String.read_from(view, cursor)
+        about, cursor = String.read_from(view, cursor)
+        geo_point, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        address, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(broadcast=broadcast, megagroup=megagroup, for_import=for_import, title=title, about=about, geo_point=geo_point, address=address), cursor
+
+
+class InviteToChannel_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x199f3a6c
+    __tl_name__ = "functions.channels.InviteToChannel_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "users", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, users: list[tl.base.InputUser]):
+        self.channel = channel
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InviteToChannel_133:
+        channel = TLObject.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(channel=channel, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InviteToChannel_133, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(channel=channel, users=users), cursor
+
+
+class ToggleSignatures_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x1f69b606
+    __tl_name__ = "functions.channels.ToggleSignatures_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "enabled", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, enabled: bool):
+        self.channel = channel
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleSignatures_133:
+        channel = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(channel=channel, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleSignatures_133, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(channel=channel, enabled=enabled), cursor
+
+
+class DeleteHistory_133(TLRequest[bool]):
+    __tl_id__ = 0xaf369d42
+    __tl_name__ = "functions.channels.DeleteHistory_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "max_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, max_id: int):
+        self.channel = channel
+        self.max_id = max_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.max_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteHistory_133:
+        channel = TLObject.read(stream)
+        max_id = Int.read(stream)
+        return cls(channel=channel, max_id=max_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteHistory_133, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, max_id=max_id), cursor
+
+
+class ViewSponsoredMessage_133(TLRequest[bool]):
+    __tl_id__ = 0xbeaedb94
+    __tl_name__ = "functions.channels.ViewSponsoredMessage_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "random_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, random_id: bytes):
+        self.channel = channel
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        Bytes.write_to(out, self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ViewSponsoredMessage_133:
+        channel = TLObject.read(stream)
+        random_id = Bytes.read(stream)
+        return cls(channel=channel, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ViewSponsoredMessage_133, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Bytes.read_from(view, cursor)
+        return cls(channel=channel, random_id=random_id), cursor
+
+
+class GetSponsoredMessages_133(TLRequest[tl.base.messages.SponsoredMessages]):
+    __tl_id__ = 0xec210fbf
+    __tl_name__ = "functions.channels.GetSponsoredMessages_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSponsoredMessages_133:
+        channel = TLObject.read(stream)
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSponsoredMessages_133, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel), cursor
+
+
+class GetSendAs_135(TLRequest[tl.base.channels.SendAsPeers]):
+    __tl_id__ = 0xdc770ee
+    __tl_name__ = "functions.channels.GetSendAs_135"
+    __tl_layer__ = 135
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSendAs_135:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSendAs_135, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class EditForumTopic_148(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x6c883e2d
+    __tl_name__ = "functions.channels.EditForumTopic_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("channel", "topic_id", "title", "icon_emoji_id", "closed", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, topic_id: int, title: str | None = None, icon_emoji_id: int | None = None, closed: bool = False):
+        self.channel = channel
+        self.topic_id = topic_id
+        self.title = title
+        self.icon_emoji_id = icon_emoji_id
+        self.closed = closed
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.title is not None: flags1 |= (1 << 0)
+        if self.icon_emoji_id is not None: flags1 |= (1 << 1)
+        if self.closed is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.topic_id)
+        if self.title is not None:
+            String.write_to(out, self.title)
+        if self.icon_emoji_id is not None:
+            out += Long.write(self.icon_emoji_id)
+        if self.closed is not None:
+            out += Bool.write(self.closed)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditForumTopic_148:
+        flags1 = Int.read(stream)
+        channel = TLObject.read(stream)
+        topic_id = Int.read(stream)
+        title = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        icon_emoji_id = Long.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        closed = Bool.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(channel=channel, topic_id=topic_id, title=title, icon_emoji_id=icon_emoji_id, closed=closed)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditForumTopic_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        channel, cursor = TLObject.read_from(view, cursor)
+        topic_id, cursor = Int.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        icon_emoji_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        closed, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(channel=channel, topic_id=topic_id, title=title, icon_emoji_id=icon_emoji_id, closed=closed), cursor
+
+
+class ClickSponsoredMessage_160(TLRequest[bool]):
+    __tl_id__ = 0x18afbc93
+    __tl_name__ = "functions.channels.ClickSponsoredMessage_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("channel", "random_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, random_id: bytes):
+        self.channel = channel
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        Bytes.write_to(out, self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClickSponsoredMessage_160:
+        channel = TLObject.read(stream)
+        random_id = Bytes.read(stream)
+        return cls(channel=channel, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClickSponsoredMessage_160, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Bytes.read_from(view, cursor)
+        return cls(channel=channel, random_id=random_id), cursor
+
+
+class UpdateColor_166(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x621a201f
+    __tl_name__ = "functions.channels.UpdateColor_166"
+    __tl_layer__ = 166
+
+    __slots__ = ("channel", "color", "background_emoji_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, color: int, background_emoji_id: int | None = None):
+        self.channel = channel
+        self.color = color
+        self.background_emoji_id = background_emoji_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.background_emoji_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.color)
+        if self.background_emoji_id is not None:
+            out += Long.write(self.background_emoji_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateColor_166:
+        flags1 = Int.read(stream)
+        channel = TLObject.read(stream)
+        color = Int.read(stream)
+        background_emoji_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(channel=channel, color=color, background_emoji_id=background_emoji_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateColor_166, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        channel, cursor = TLObject.read_from(view, cursor)
+        color, cursor = Int.read_from(view, cursor)
+        background_emoji_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(channel=channel, color=color, background_emoji_id=background_emoji_id), cursor
+
+
+class GetChannelRecommendations_167(TLRequest[tl.base.messages.Chats]):
+    __tl_id__ = 0x83b70d97
+    __tl_name__ = "functions.channels.GetChannelRecommendations_167"
+    __tl_layer__ = 167
+
+    __slots__ = ("channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel):
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChannelRecommendations_167:
+        channel = TLObject.read(stream)
+        return cls(channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChannelRecommendations_167, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel), cursor
+
+
+class ReportSponsoredMessage_177(TLRequest[tl.base.channels.SponsoredMessageReportResult]):
+    __tl_id__ = 0xaf8ff6b9
+    __tl_name__ = "functions.channels.ReportSponsoredMessage_177"
+    __tl_layer__ = 177
+
+    __slots__ = ("channel", "random_id", "option", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, random_id: bytes, option: bytes):
+        self.channel = channel
+        self.random_id = random_id
+        self.option = option
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        Bytes.write_to(out, self.random_id)
+        Bytes.write_to(out, self.option)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportSponsoredMessage_177:
+        channel = TLObject.read(stream)
+        random_id = Bytes.read(stream)
+        option = Bytes.read(stream)
+        return cls(channel=channel, random_id=random_id, option=option)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportSponsoredMessage_177, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Bytes.read_from(view, cursor)
+        option, cursor = Bytes.read_from(view, cursor)
+        return cls(channel=channel, random_id=random_id, option=option), cursor
+
+
+class ClickSponsoredMessage_189(TLRequest[bool]):
+    __tl_id__ = 0x1445d75
+    __tl_name__ = "functions.channels.ClickSponsoredMessage_189"
+    __tl_layer__ = 189
+
+    __slots__ = ("media", "fullscreen", "channel", "random_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, random_id: bytes, media: bool = False, fullscreen: bool = False):
+        self.media = media
+        self.fullscreen = fullscreen
+        self.channel = channel
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.media: flags1 |= (1 << 0)
+        if self.fullscreen: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        Bytes.write_to(out, self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClickSponsoredMessage_189:
+        flags1 = Int.read(stream)
+        media = (flags1 & (1 << 0)) == (1 << 0)
+        fullscreen = (flags1 & (1 << 1)) == (1 << 1)
+        channel = TLObject.read(stream)
+        random_id = Bytes.read(stream)
+        return cls(media=media, fullscreen=fullscreen, channel=channel, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClickSponsoredMessage_189, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        media = (flags1 & (1 << 0)) == (1 << 0)
+        fullscreen = (flags1 & (1 << 1)) == (1 << 1)
+        channel, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Bytes.read_from(view, cursor)
+        return cls(media=media, fullscreen=fullscreen, channel=channel, random_id=random_id), cursor
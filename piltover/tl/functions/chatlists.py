@@ -0,0 +1,318 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class ExportChatlistInvite(TLRequest[tl.types.chatlists.ExportedChatlistInvite]):
+    __tl_id__ = 0x8472478e
+    __tl_name__ = "functions.chatlists.ExportChatlistInvite"
+    __tl_layer__ = 158
+
+    __slots__ = ("chatlist", "title", "peers", )
+
+    def __init__(self, *, chatlist: tl.types.InputChatlistDialogFilter, title: str, peers: list[tl.base.InputPeer]):
+        self.chatlist = chatlist
+        self.title = title
+        self.peers = peers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.chatlist.write_to(out, ctx)
+        String.write_to(out, self.title)
+        TLObjectVector.write_to(out, self.peers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportChatlistInvite:
+        chatlist = tl.types.InputChatlistDialogFilter.read(stream)
+        title = String.read(stream)
+        peers = TLObjectVector.read(stream)
+        return cls(chatlist=chatlist, title=title, peers=peers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportChatlistInvite, int]:
+        chatlist, cursor = tl.types.InputChatlistDialogFilter.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(chatlist=chatlist, title=title, peers=peers), cursor
+
+
+class DeleteExportedInvite(TLRequest[bool]):
+    __tl_id__ = 0x719c5c5e
+    __tl_name__ = "functions.chatlists.DeleteExportedInvite"
+    __tl_layer__ = 158
+
+    __slots__ = ("chatlist", "slug", )
+
+    def __init__(self, *, chatlist: tl.types.InputChatlistDialogFilter, slug: str):
+        self.chatlist = chatlist
+        self.slug = slug
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.chatlist.write_to(out, ctx)
+        String.write_to(out, self.slug)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteExportedInvite:
+        chatlist = tl.types.InputChatlistDialogFilter.read(stream)
+        slug = String.read(stream)
+        return cls(chatlist=chatlist, slug=slug)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteExportedInvite, int]:
+        chatlist, cursor = tl.types.InputChatlistDialogFilter.read_from(view, cursor)
+        slug, cursor = String.read_from(view, cursor)
+        return cls(chatlist=chatlist, slug=slug), cursor
+
+
+class EditExportedInvite(TLRequest[tl.types.ExportedChatlistInvite]):
+    __tl_id__ = 0x653db63d
+    __tl_name__ = "functions.chatlists.EditExportedInvite"
+    __tl_layer__ = 158
+
+    __slots__ = ("chatlist", "slug", "title", "peers", )
+
+    def __init__(self, *, chatlist: tl.types.InputChatlistDialogFilter, slug: str, title: str | None = None, peers: list[tl.base.InputPeer] | None = None):
+        self.chatlist = chatlist
+        self.slug = slug
+        self.title = title
+        self.peers = peers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.title is not None: flags1 |= (1 << 1)
+        if self.peers: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.chatlist.write_to(out, ctx)
+        String.write_to(out, self.slug)
+        if self.title is not None:
+            String.write_to(out, self.title)
+        if self.peers:
+            TLObjectVector.write_to(out, self.peers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditExportedInvite:
+        flags1 = Int.read(stream)
+        chatlist = tl.types.InputChatlistDialogFilter.read(stream)
+        slug = String.read(stream)
+        title = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        peers = TLObjectVector.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(chatlist=chatlist, slug=slug, title=title, peers=peers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditExportedInvite, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        chatlist, cursor = tl.types.InputChatlistDialogFilter.read_from(view, cursor)
+        slug, cursor = String.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        peers, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(chatlist=chatlist, slug=slug, title=title, peers=peers), cursor
+
+
+class GetExportedInvites(TLRequest[tl.types.chatlists.ExportedInvites]):
+    __tl_id__ = 0xce03da83
+    __tl_name__ = "functions.chatlists.GetExportedInvites"
+    __tl_layer__ = 158
+
+    __slots__ = ("chatlist", )
+
+    def __init__(self, *, chatlist: tl.types.InputChatlistDialogFilter):
+        self.chatlist = chatlist
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.chatlist.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetExportedInvites:
+        chatlist = tl.types.InputChatlistDialogFilter.read(stream)
+        return cls(chatlist=chatlist)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetExportedInvites, int]:
+        chatlist, cursor = tl.types.InputChatlistDialogFilter.read_from(view, cursor)
+        return cls(chatlist=chatlist), cursor
+
+
+class CheckChatlistInvite(TLRequest[tl.base.chatlists.ChatlistInvite]):
+    __tl_id__ = 0x41c10fff
+    __tl_name__ = "functions.chatlists.CheckChatlistInvite"
+    __tl_layer__ = 158
+
+    __slots__ = ("slug", )
+
+    def __init__(self, *, slug: str):
+        self.slug = slug
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.slug)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckChatlistInvite:
+        slug = String.read(stream)
+        return cls(slug=slug)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckChatlistInvite, int]:
+        slug, cursor = String.read_from(view, cursor)
+        return cls(slug=slug), cursor
+
+
+class JoinChatlistInvite(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xa6b1e39a
+    __tl_name__ = "functions.chatlists.JoinChatlistInvite"
+    __tl_layer__ = 158
+
+    __slots__ = ("slug", "peers", )
+
+    def __init__(self, *, slug: str, peers: list[tl.base.InputPeer]):
+        self.slug = slug
+        self.peers = peers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.slug)
+        TLObjectVector.write_to(out, self.peers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> JoinChatlistInvite:
+        slug = String.read(stream)
+        peers = TLObjectVector.read(stream)
+        return cls(slug=slug, peers=peers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[JoinChatlistInvite, int]:
+        slug, cursor = String.read_from(view, cursor)
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(slug=slug, peers=peers), cursor
+
+
+class GetChatlistUpdates(TLRequest[tl.types.chatlists.ChatlistUpdates]):
+    __tl_id__ = 0x89419521
+    __tl_name__ = "functions.chatlists.GetChatlistUpdates"
+    __tl_layer__ = 158
+
+    __slots__ = ("chatlist", )
+
+    def __init__(self, *, chatlist: tl.types.InputChatlistDialogFilter):
+        self.chatlist = chatlist
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.chatlist.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChatlistUpdates:
+        chatlist = tl.types.InputChatlistDialogFilter.read(stream)
+        return cls(chatlist=chatlist)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChatlistUpdates, int]:
+        chatlist, cursor = tl.types.InputChatlistDialogFilter.read_from(view, cursor)
+        return cls(chatlist=chatlist), cursor
+
+
+class JoinChatlistUpdates(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xe089f8f5
+    __tl_name__ = "functions.chatlists.JoinChatlistUpdates"
+    __tl_layer__ = 158
+
+    __slots__ = ("chatlist", "peers", )
+
+    def __init__(self, *, chatlist: tl.types.InputChatlistDialogFilter, peers: list[tl.base.InputPeer]):
+        self.chatlist = chatlist
+        self.peers = peers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.chatlist.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.peers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> JoinChatlistUpdates:
+        chatlist = tl.types.InputChatlistDialogFilter.read(stream)
+        peers = TLObjectVector.read(stream)
+        return cls(chatlist=chatlist, peers=peers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[JoinChatlistUpdates, int]:
+        chatlist, cursor = tl.types.InputChatlistDialogFilter.read_from(view, cursor)
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(chatlist=chatlist, peers=peers), cursor
+
+
+class HideChatlistUpdates(TLRequest[bool]):
+    __tl_id__ = 0x66e486fb
+    __tl_name__ = "functions.chatlists.HideChatlistUpdates"
+    __tl_layer__ = 158
+
+    __slots__ = ("chatlist", )
+
+    def __init__(self, *, chatlist: tl.types.InputChatlistDialogFilter):
+        self.chatlist = chatlist
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.chatlist.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> HideChatlistUpdates:
+        chatlist = tl.types.InputChatlistDialogFilter.read(stream)
+        return cls(chatlist=chatlist)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[HideChatlistUpdates, int]:
+        chatlist, cursor = tl.types.InputChatlistDialogFilter.read_from(view, cursor)
+        return cls(chatlist=chatlist), cursor
+
+
+class GetLeaveChatlistSuggestions(TLRequest[list[tl.base.Peer]]):
+    __tl_id__ = 0xfdbcd714
+    __tl_name__ = "functions.chatlists.GetLeaveChatlistSuggestions"
+    __tl_layer__ = 158
+
+    __slots__ = ("chatlist", )
+
+    def __init__(self, *, chatlist: tl.types.InputChatlistDialogFilter):
+        self.chatlist = chatlist
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.chatlist.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetLeaveChatlistSuggestions:
+        chatlist = tl.types.InputChatlistDialogFilter.read(stream)
+        return cls(chatlist=chatlist)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetLeaveChatlistSuggestions, int]:
+        chatlist, cursor = tl.types.InputChatlistDialogFilter.read_from(view, cursor)
+        return cls(chatlist=chatlist), cursor
+
+
+class LeaveChatlist(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x74fae13a
+    __tl_name__ = "functions.chatlists.LeaveChatlist"
+    __tl_layer__ = 158
+
+    __slots__ = ("chatlist", "peers", )
+
+    def __init__(self, *, chatlist: tl.types.InputChatlistDialogFilter, peers: list[tl.base.InputPeer]):
+        self.chatlist = chatlist
+        self.peers = peers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.chatlist.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.peers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LeaveChatlist:
+        chatlist = tl.types.InputChatlistDialogFilter.read(stream)
+        peers = TLObjectVector.read(stream)
+        return cls(chatlist=chatlist, peers=peers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LeaveChatlist, int]:
+        chatlist, cursor = tl.types.InputChatlistDialogFilter.read_from(view, cursor)
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(chatlist=chatlist, peers=peers), cursor
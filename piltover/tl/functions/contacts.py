@@ -0,0 +1,917 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetContactIDs(TLRequest[list[int]]):
+    __tl_id__ = 0x7adc669d
+    __tl_name__ = "functions.contacts.GetContactIDs"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetContactIDs:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetContactIDs, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetStatuses(TLRequest[list[tl.base.ContactStatus]]):
+    __tl_id__ = 0xc4a353ee
+    __tl_name__ = "functions.contacts.GetStatuses"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStatuses:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStatuses, int]:
+        return cls(), cursor
+
+
+class GetContacts(TLRequest[tl.base.contacts.Contacts]):
+    __tl_id__ = 0x5dd69e12
+    __tl_name__ = "functions.contacts.GetContacts"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetContacts:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetContacts, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class ImportContacts(TLRequest[tl.types.contacts.ImportedContacts]):
+    __tl_id__ = 0x2c800be5
+    __tl_name__ = "functions.contacts.ImportContacts"
+    __tl_layer__ = 133
+
+    __slots__ = ("contacts", )
+
+    def __init__(self, *, contacts: list[tl.base.InputContact]):
+        self.contacts = contacts
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.contacts, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ImportContacts:
+        contacts = TLObjectVector.read(stream)
+        return cls(contacts=contacts)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ImportContacts, int]:
+        contacts, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(contacts=contacts), cursor
+
+
+class DeleteContacts(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x96a0e00
+    __tl_name__ = "functions.contacts.DeleteContacts"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[tl.base.InputUser]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteContacts:
+        id = TLObjectVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteContacts, int]:
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class DeleteByPhones(TLRequest[bool]):
+    __tl_id__ = 0x1013fd9e
+    __tl_name__ = "functions.contacts.DeleteByPhones"
+    __tl_layer__ = 133
+
+    __slots__ = ("phones", )
+
+    def __init__(self, *, phones: list[str]):
+        self.phones = phones
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += StringVector.write(self.phones)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteByPhones:
+        phones = StringVector.read(stream)
+        return cls(phones=phones)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteByPhones, int]:
+        phones, cursor = StringVector.read_from(view, cursor)
+        return cls(phones=phones), cursor
+
+
+class Block(TLRequest[bool]):
+    __tl_id__ = 0x2e2e8734
+    __tl_name__ = "functions.contacts.Block"
+    __tl_layer__ = 161
+
+    __slots__ = ("my_stories_from", "id", )
+
+    def __init__(self, *, id: tl.base.InputPeer, my_stories_from: bool = False):
+        self.my_stories_from = my_stories_from
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.my_stories_from: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Block:
+        flags1 = Int.read(stream)
+        my_stories_from = (flags1 & (1 << 0)) == (1 << 0)
+        id = TLObject.read(stream)
+        return cls(my_stories_from=my_stories_from, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Block, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        my_stories_from = (flags1 & (1 << 0)) == (1 << 0)
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(my_stories_from=my_stories_from, id=id), cursor
+
+
+class Unblock(TLRequest[bool]):
+    __tl_id__ = 0xb550d328
+    __tl_name__ = "functions.contacts.Unblock"
+    __tl_layer__ = 161
+
+    __slots__ = ("my_stories_from", "id", )
+
+    def __init__(self, *, id: tl.base.InputPeer, my_stories_from: bool = False):
+        self.my_stories_from = my_stories_from
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.my_stories_from: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Unblock:
+        flags1 = Int.read(stream)
+        my_stories_from = (flags1 & (1 << 0)) == (1 << 0)
+        id = TLObject.read(stream)
+        return cls(my_stories_from=my_stories_from, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Unblock, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        my_stories_from = (flags1 & (1 << 0)) == (1 << 0)
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(my_stories_from=my_stories_from, id=id), cursor
+
+
+class GetBlocked(TLRequest[tl.base.contacts.Blocked]):
+    __tl_id__ = 0x9a868f80
+    __tl_name__ = "functions.contacts.GetBlocked"
+    __tl_layer__ = 161
+
+    __slots__ = ("my_stories_from", "offset", "limit", )
+
+    def __init__(self, *, offset: int, limit: int, my_stories_from: bool = False):
+        self.my_stories_from = my_stories_from
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.my_stories_from: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBlocked:
+        flags1 = Int.read(stream)
+        my_stories_from = (flags1 & (1 << 0)) == (1 << 0)
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(my_stories_from=my_stories_from, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBlocked, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        my_stories_from = (flags1 & (1 << 0)) == (1 << 0)
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(my_stories_from=my_stories_from, offset=offset, limit=limit), cursor
+
+
+class Search(TLRequest[tl.types.contacts.Found]):
+    __tl_id__ = 0x11f812d8
+    __tl_name__ = "functions.contacts.Search"
+    __tl_layer__ = 133
+
+    __slots__ = ("q", "limit", )
+
+    def __init__(self, *, q: str, limit: int):
+        self.q = q
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.q)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Search:
+        q = String.read(stream)
+        limit = Int.read(stream)
+        return cls(q=q, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Search, int]:
+        q, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(q=q, limit=limit), cursor
+
+
+class ResolveUsername(TLRequest[tl.types.contacts.ResolvedPeer]):
+    __tl_id__ = 0x725afbbc
+    __tl_name__ = "functions.contacts.ResolveUsername"
+    __tl_layer__ = 195
+
+    __slots__ = ("username", "referer", )
+
+    def __init__(self, *, username: str, referer: str | None = None):
+        self.username = username
+        self.referer = referer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.referer is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.username)
+        if self.referer is not None:
+            String.write_to(out, self.referer)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResolveUsername:
+        flags1 = Int.read(stream)
+        username = String.read(stream)
+        referer = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(username=username, referer=referer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResolveUsername, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        username, cursor = String.read_from(view, cursor)
+        referer, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(username=username, referer=referer), cursor
+
+
+class GetTopPeers(TLRequest[tl.base.contacts.TopPeers]):
+    __tl_id__ = 0x973478b6
+    __tl_name__ = "functions.contacts.GetTopPeers"
+    __tl_layer__ = 133
+
+    __slots__ = ("correspondents", "bots_pm", "bots_inline", "phone_calls", "forward_users", "forward_chats", "groups", "channels", "bots_app", "offset", "limit", "hash", )
+
+    def __init__(self, *, offset: int, limit: int, hash: int, correspondents: bool = False, bots_pm: bool = False, bots_inline: bool = False, phone_calls: bool = False, forward_users: bool = False, forward_chats: bool = False, groups: bool = False, channels: bool = False, bots_app: bool = False):
+        self.correspondents = correspondents
+        self.bots_pm = bots_pm
+        self.bots_inline = bots_inline
+        self.phone_calls = phone_calls
+        self.forward_users = forward_users
+        self.forward_chats = forward_chats
+        self.groups = groups
+        self.channels = channels
+        self.bots_app = bots_app
+        self.offset = offset
+        self.limit = limit
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.correspondents: flags1 |= (1 << 0)
+        if self.bots_pm: flags1 |= (1 << 1)
+        if self.bots_inline: flags1 |= (1 << 2)
+        if self.phone_calls: flags1 |= (1 << 3)
+        if self.forward_users: flags1 |= (1 << 4)
+        if self.forward_chats: flags1 |= (1 << 5)
+        if self.groups: flags1 |= (1 << 10)
+        if self.channels: flags1 |= (1 << 15)
+        if self.bots_app: flags1 |= (1 << 16)
+        out += Int.write(flags1)
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetTopPeers:
+        flags1 = Int.read(stream)
+        correspondents = (flags1 & (1 << 0)) == (1 << 0)
+        bots_pm = (flags1 & (1 << 1)) == (1 << 1)
+        bots_inline = (flags1 & (1 << 2)) == (1 << 2)
+        phone_calls = (flags1 & (1 << 3)) == (1 << 3)
+        forward_users = (flags1 & (1 << 4)) == (1 << 4)
+        forward_chats = (flags1 & (1 << 5)) == (1 << 5)
+        groups = (flags1 & (1 << 10)) == (1 << 10)
+        channels = (flags1 & (1 << 15)) == (1 << 15)
+        bots_app = (flags1 & (1 << 16)) == (1 << 16)
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(correspondents=correspondents, bots_pm=bots_pm, bots_inline=bots_inline, phone_calls=phone_calls, forward_users=forward_users, forward_chats=forward_chats, groups=groups, channels=channels, bots_app=bots_app, offset=offset, limit=limit, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetTopPeers, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        correspondents = (flags1 & (1 << 0)) == (1 << 0)
+        bots_pm = (flags1 & (1 << 1)) == (1 << 1)
+        bots_inline = (flags1 & (1 << 2)) == (1 << 2)
+        phone_calls = (flags1 & (1 << 3)) == (1 << 3)
+        forward_users = (flags1 & (1 << 4)) == (1 << 4)
+        forward_chats = (flags1 & (1 << 5)) == (1 << 5)
+        groups = (flags1 & (1 << 10)) == (1 << 10)
+        channels = (flags1 & (1 << 15)) == (1 << 15)
+        bots_app = (flags1 & (1 << 16)) == (1 << 16)
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(correspondents=correspondents, bots_pm=bots_pm, bots_inline=bots_inline, phone_calls=phone_calls, forward_users=forward_users, forward_chats=forward_chats, groups=groups, channels=channels, bots_app=bots_app, offset=offset, limit=limit, hash=hash), cursor
+
+
+class ResetTopPeerRating(TLRequest[bool]):
+    __tl_id__ = 0x1ae373ac
+    __tl_name__ = "functions.contacts.ResetTopPeerRating"
+    __tl_layer__ = 133
+
+    __slots__ = ("category", "peer", )
+
+    def __init__(self, *, category: tl.base.TopPeerCategory, peer: tl.base.InputPeer):
+        self.category = category
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.category.write_to(out, ctx)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetTopPeerRating:
+        category = TLObject.read(stream)
+        peer = TLObject.read(stream)
+        return cls(category=category, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetTopPeerRating, int]:
+        category, cursor = TLObject.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(category=category, peer=peer), cursor
+
+
+class ResetSaved(TLRequest[bool]):
+    __tl_id__ = 0x879537f1
+    __tl_name__ = "functions.contacts.ResetSaved"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetSaved:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetSaved, int]:
+        return cls(), cursor
+
+
+class GetSaved(TLRequest[list[tl.base.SavedContact]]):
+    __tl_id__ = 0x82f1e39f
+    __tl_name__ = "functions.contacts.GetSaved"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSaved:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSaved, int]:
+        return cls(), cursor
+
+
+class ToggleTopPeers(TLRequest[bool]):
+    __tl_id__ = 0x8514bdda
+    __tl_name__ = "functions.contacts.ToggleTopPeers"
+    __tl_layer__ = 133
+
+    __slots__ = ("enabled", )
+
+    def __init__(self, *, enabled: bool):
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleTopPeers:
+        enabled = Bool.read(stream)
+        return cls(enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleTopPeers, int]:
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(enabled=enabled), cursor
+
+
+class AddContact(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xe8f463d0
+    __tl_name__ = "functions.contacts.AddContact"
+    __tl_layer__ = 133
+
+    __slots__ = ("add_phone_privacy_exception", "id", "first_name", "last_name", "phone", )
+
+    def __init__(self, *, id: tl.base.InputUser, first_name: str, last_name: str, phone: str, add_phone_privacy_exception: bool = False):
+        self.add_phone_privacy_exception = add_phone_privacy_exception
+        self.id = id
+        self.first_name = first_name
+        self.last_name = last_name
+        self.phone = phone
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.add_phone_privacy_exception: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.id.write_to(out, ctx)
+        String.write_to(out, self.first_name)
+        String.write_to(out, self.last_name)
+        String.write_to(out, self.phone)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AddContact:
+        flags1 = Int.read(stream)
+        add_phone_privacy_exception = (flags1 & (1 << 0)) == (1 << 0)
+        id = TLObject.read(stream)
+        first_name = String.read(stream)
+        last_name = String.read(stream)
+        phone = String.read(stream)
+        return cls(add_phone_privacy_exception=add_phone_privacy_exception, id=id, first_name=first_name, last_name=last_name, phone=phone)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AddContact, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        add_phone_privacy_exception = (flags1 & (1 << 0)) == (1 << 0)
+        id, cursor = TLObject.read_from(view, cursor)
+        first_name, cursor = String.read_from(view, cursor)
+        last_name, cursor = String.read_from(view, cursor)
+        phone, cursor = String.read_from(view, cursor)
+        return cls(add_phone_privacy_exception=add_phone_privacy_exception, id=id, first_name=first_name, last_name=last_name, phone=phone), cursor
+
+
+class AcceptContact(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf831a20f
+    __tl_name__ = "functions.contacts.AcceptContact"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: tl.base.InputUser):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AcceptContact:
+        id = TLObject.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AcceptContact, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetLocated(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd348bc44
+    __tl_name__ = "functions.contacts.GetLocated"
+    __tl_layer__ = 133
+
+    __slots__ = ("background", "geo_point", "self_expires", )
+
+    def __init__(self, *, geo_point: tl.base.InputGeoPoint, background: bool = False, self_expires: int | None = None):
+        self.background = background
+        self.geo_point = geo_point
+        self.self_expires = self_expires
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.background: flags1 |= (1 << 1)
+        if self.self_expires is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.geo_point.write_to(out, ctx)
+        if self.self_expires is not None:
+            out += Int.write(self.self_expires)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetLocated:
+        flags1 = Int.read(stream)
+        background = (flags1 & (1 << 1)) == (1 << 1)
+        geo_point = TLObject.read(stream)
+        self_expires = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(background=background, geo_point=geo_point, self_expires=self_expires)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetLocated, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        background = (flags1 & (1 << 1)) == (1 << 1)
+        geo_point, cursor = TLObject.read_from(view, cursor)
+        self_expires, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(background=background, geo_point=geo_point, self_expires=self_expires), cursor
+
+
+class BlockFromReplies(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x29a8962c
+    __tl_name__ = "functions.contacts.BlockFromReplies"
+    __tl_layer__ = 133
+
+    __slots__ = ("delete_message", "delete_history", "report_spam", "msg_id", )
+
+    def __init__(self, *, msg_id: int, delete_message: bool = False, delete_history: bool = False, report_spam: bool = False):
+        self.delete_message = delete_message
+        self.delete_history = delete_history
+        self.report_spam = report_spam
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.delete_message: flags1 |= (1 << 0)
+        if self.delete_history: flags1 |= (1 << 1)
+        if self.report_spam: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BlockFromReplies:
+        flags1 = Int.read(stream)
+        delete_message = (flags1 & (1 << 0)) == (1 << 0)
+        delete_history = (flags1 & (1 << 1)) == (1 << 1)
+        report_spam = (flags1 & (1 << 2)) == (1 << 2)
+        msg_id = Int.read(stream)
+        return cls(delete_message=delete_message, delete_history=delete_history, report_spam=report_spam, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BlockFromReplies, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        delete_message = (flags1 & (1 << 0)) == (1 << 0)
+        delete_history = (flags1 & (1 << 1)) == (1 << 1)
+        report_spam = (flags1 & (1 << 2)) == (1 << 2)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(delete_message=delete_message, delete_history=delete_history, report_spam=report_spam, msg_id=msg_id), cursor
+
+
+class ResolvePhone(TLRequest[tl.types.contacts.ResolvedPeer]):
+    __tl_id__ = 0x8af94344
+    __tl_name__ = "functions.contacts.ResolvePhone"
+    __tl_layer__ = 139
+
+    __slots__ = ("phone", )
+
+    def __init__(self, *, phone: str):
+        self.phone = phone
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResolvePhone:
+        phone = String.read(stream)
+        return cls(phone=phone)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResolvePhone, int]:
+        phone, cursor = String.read_from(view, cursor)
+        return cls(phone=phone), cursor
+
+
+class ExportContactToken(TLRequest[tl.types.ExportedContactToken]):
+    __tl_id__ = 0xf8654027
+    __tl_name__ = "functions.contacts.ExportContactToken"
+    __tl_layer__ = 150
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportContactToken:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportContactToken, int]:
+        return cls(), cursor
+
+
+class ImportContactToken(TLRequest[tl.base.User]):
+    __tl_id__ = 0x13005788
+    __tl_name__ = "functions.contacts.ImportContactToken"
+    __tl_layer__ = 150
+
+    __slots__ = ("token", )
+
+    def __init__(self, *, token: str):
+        self.token = token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ImportContactToken:
+        token = String.read(stream)
+        return cls(token=token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ImportContactToken, int]:
+        token, cursor = String.read_from(view, cursor)
+        return cls(token=token), cursor
+
+
+class EditCloseFriends(TLRequest[bool]):
+    __tl_id__ = 0xba6705f0
+    __tl_name__ = "functions.contacts.EditCloseFriends"
+    __tl_layer__ = 160
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[int]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += LongVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditCloseFriends:
+        id = LongVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditCloseFriends, int]:
+        id, cursor = LongVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class SetBlocked(TLRequest[bool]):
+    __tl_id__ = 0x94c65c76
+    __tl_name__ = "functions.contacts.SetBlocked"
+    __tl_layer__ = 161
+
+    __slots__ = ("my_stories_from", "id", "limit", )
+
+    def __init__(self, *, id: list[tl.base.InputPeer], limit: int, my_stories_from: bool = False):
+        self.my_stories_from = my_stories_from
+        self.id = id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.my_stories_from: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        TLObjectVector.write_to(out, self.id, ctx)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBlocked:
+        flags1 = Int.read(stream)
+        my_stories_from = (flags1 & (1 << 0)) == (1 << 0)
+        id = TLObjectVector.read(stream)
+        limit = Int.read(stream)
+        return cls(my_stories_from=my_stories_from, id=id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBlocked, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        my_stories_from = (flags1 & (1 << 0)) == (1 << 0)
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(my_stories_from=my_stories_from, id=id, limit=limit), cursor
+
+
+class GetBirthdays(TLRequest[tl.types.contacts.ContactBirthdays]):
+    __tl_id__ = 0xdaeda864
+    __tl_name__ = "functions.contacts.GetBirthdays"
+    __tl_layer__ = 177
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBirthdays:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBirthdays, int]:
+        return cls(), cursor
+
+
+class GetSponsoredPeers(TLRequest[tl.base.contacts.SponsoredPeers]):
+    __tl_id__ = 0xb6c8c393
+    __tl_name__ = "functions.contacts.GetSponsoredPeers"
+    __tl_layer__ = 201
+
+    __slots__ = ("q", )
+
+    def __init__(self, *, q: str):
+        self.q = q
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.q)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSponsoredPeers:
+        q = String.read(stream)
+        return cls(q=q)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSponsoredPeers, int]:
+        q, cursor = String.read_from(view, cursor)
+        return cls(q=q), cursor
+
+
+class Block_133(TLRequest[bool]):
+    __tl_id__ = 0x68cc1411
+    __tl_name__ = "functions.contacts.Block_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: tl.base.InputPeer):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Block_133:
+        id = TLObject.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Block_133, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class Unblock_133(TLRequest[bool]):
+    __tl_id__ = 0xbea65d50
+    __tl_name__ = "functions.contacts.Unblock_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: tl.base.InputPeer):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Unblock_133:
+        id = TLObject.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Unblock_133, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetBlocked_133(TLRequest[tl.base.contacts.Blocked]):
+    __tl_id__ = 0xf57c350f
+    __tl_name__ = "functions.contacts.GetBlocked_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("offset", "limit", )
+
+    def __init__(self, *, offset: int, limit: int):
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBlocked_133:
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBlocked_133, int]:
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(offset=offset, limit=limit), cursor
+
+
+class ResolveUsername_133(TLRequest[tl.types.contacts.ResolvedPeer]):
+    __tl_id__ = 0xf93ccba3
+    __tl_name__ = "functions.contacts.ResolveUsername_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("username", )
+
+    def __init__(self, *, username: str):
+        self.username = username
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.username)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResolveUsername_133:
+        username = String.read(stream)
+        return cls(username=username)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResolveUsername_133, int]:
+        username, cursor = String.read_from(view, cursor)
+        return cls(username=username), cursor
+
+
+class ToggleStoriesHidden_160(TLRequest[bool]):
+    __tl_id__ = 0x753fb865
+    __tl_name__ = "functions.contacts.ToggleStoriesHidden_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("id", "hidden", )
+
+    def __init__(self, *, id: tl.base.InputUser, hidden: bool):
+        self.id = id
+        self.hidden = hidden
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+        out += Bool.write(self.hidden)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleStoriesHidden_160:
+        id = TLObject.read(stream)
+        hidden = Bool.read(stream)
+        return cls(id=id, hidden=hidden)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleStoriesHidden_160, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        hidden, cursor = Bool.read_from(view, cursor)
+        return cls(id=id, hidden=hidden), cursor
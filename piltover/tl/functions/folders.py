@@ -0,0 +1,34 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class EditPeerFolders(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x6847d0ab
+    __tl_name__ = "functions.folders.EditPeerFolders"
+    __tl_layer__ = 133
+
+    __slots__ = ("folder_peers", )
+
+    def __init__(self, *, folder_peers: list[tl.base.InputFolderPeer]):
+        self.folder_peers = folder_peers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.folder_peers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditPeerFolders:
+        folder_peers = TLObjectVector.read(stream)
+        return cls(folder_peers=folder_peers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditPeerFolders, int]:
+        folder_peers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(folder_peers=folder_peers), cursor
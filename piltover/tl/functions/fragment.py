@@ -0,0 +1,34 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetCollectibleInfo(TLRequest[tl.types.fragment.CollectibleInfo]):
+    __tl_id__ = 0xbe1e85ba
+    __tl_name__ = "functions.fragment.GetCollectibleInfo"
+    __tl_layer__ = 177
+
+    __slots__ = ("collectible", )
+
+    def __init__(self, *, collectible: tl.base.InputCollectible):
+        self.collectible = collectible
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.collectible.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCollectibleInfo:
+        collectible = TLObject.read(stream)
+        return cls(collectible=collectible)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCollectibleInfo, int]:
+        collectible, cursor = TLObject.read_from(view, cursor)
+        return cls(collectible=collectible), cursor
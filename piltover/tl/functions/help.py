@@ -0,0 +1,628 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetConfig(TLRequest[tl.base.Config]):
+    __tl_id__ = 0xc4f9186b
+    __tl_name__ = "functions.help.GetConfig"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetConfig:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetConfig, int]:
+        return cls(), cursor
+
+
+class GetNearestDc(TLRequest[tl.types.NearestDc]):
+    __tl_id__ = 0x1fb33026
+    __tl_name__ = "functions.help.GetNearestDc"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetNearestDc:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetNearestDc, int]:
+        return cls(), cursor
+
+
+class GetAppUpdate(TLRequest[tl.base.help.AppUpdate]):
+    __tl_id__ = 0x522d5a7d
+    __tl_name__ = "functions.help.GetAppUpdate"
+    __tl_layer__ = 133
+
+    __slots__ = ("source", )
+
+    def __init__(self, *, source: str):
+        self.source = source
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.source)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAppUpdate:
+        source = String.read(stream)
+        return cls(source=source)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAppUpdate, int]:
+        source, cursor = String.read_from(view, cursor)
+        return cls(source=source), cursor
+
+
+class GetInviteText(TLRequest[tl.types.help.InviteText]):
+    __tl_id__ = 0x4d392343
+    __tl_name__ = "functions.help.GetInviteText"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetInviteText:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetInviteText, int]:
+        return cls(), cursor
+
+
+class GetSupport(TLRequest[tl.types.help.Support]):
+    __tl_id__ = 0x9cdf08cd
+    __tl_name__ = "functions.help.GetSupport"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSupport:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSupport, int]:
+        return cls(), cursor
+
+
+class SetBotUpdatesStatus(TLRequest[bool]):
+    __tl_id__ = 0xec22cfcd
+    __tl_name__ = "functions.help.SetBotUpdatesStatus"
+    __tl_layer__ = 133
+
+    __slots__ = ("pending_updates_count", "message", )
+
+    def __init__(self, *, pending_updates_count: int, message: str):
+        self.pending_updates_count = pending_updates_count
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.pending_updates_count)
+        String.write_to(out, self.message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotUpdatesStatus:
+        pending_updates_count = Int.read(stream)
+        message = String.read(stream)
+        return cls(pending_updates_count=pending_updates_count, message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotUpdatesStatus, int]:
+        pending_updates_count, cursor = Int.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        return cls(pending_updates_count=pending_updates_count, message=message), cursor
+
+
+class GetCdnConfig(TLRequest[tl.types.CdnConfig]):
+    __tl_id__ = 0x52029342
+    __tl_name__ = "functions.help.GetCdnConfig"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCdnConfig:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCdnConfig, int]:
+        return cls(), cursor
+
+
+class GetRecentMeUrls(TLRequest[tl.types.help.RecentMeUrls]):
+    __tl_id__ = 0x3dc0f114
+    __tl_name__ = "functions.help.GetRecentMeUrls"
+    __tl_layer__ = 133
+
+    __slots__ = ("referer", )
+
+    def __init__(self, *, referer: str):
+        self.referer = referer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.referer)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetRecentMeUrls:
+        referer = String.read(stream)
+        return cls(referer=referer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetRecentMeUrls, int]:
+        referer, cursor = String.read_from(view, cursor)
+        return cls(referer=referer), cursor
+
+
+class GetTermsOfServiceUpdate(TLRequest[tl.base.help.TermsOfServiceUpdate]):
+    __tl_id__ = 0x2ca51fd1
+    __tl_name__ = "functions.help.GetTermsOfServiceUpdate"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetTermsOfServiceUpdate:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetTermsOfServiceUpdate, int]:
+        return cls(), cursor
+
+
+class AcceptTermsOfService(TLRequest[bool]):
+    __tl_id__ = 0xee72f79a
+    __tl_name__ = "functions.help.AcceptTermsOfService"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: tl.types.DataJSON):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AcceptTermsOfService:
+        id = tl.types.DataJSON.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AcceptTermsOfService, int]:
+        id, cursor = tl.types.DataJSON.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetDeepLinkInfo(TLRequest[tl.base.help.DeepLinkInfo]):
+    __tl_id__ = 0x3fedc75f
+    __tl_name__ = "functions.help.GetDeepLinkInfo"
+    __tl_layer__ = 133
+
+    __slots__ = ("path", )
+
+    def __init__(self, *, path: str):
+        self.path = path
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.path)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDeepLinkInfo:
+        path = String.read(stream)
+        return cls(path=path)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDeepLinkInfo, int]:
+        path, cursor = String.read_from(view, cursor)
+        return cls(path=path), cursor
+
+
+class GetAppConfig(TLRequest[tl.base.help.AppConfig]):
+    __tl_id__ = 0x61e3f854
+    __tl_name__ = "functions.help.GetAppConfig"
+    __tl_layer__ = 153
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAppConfig:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAppConfig, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class SaveAppLog(TLRequest[bool]):
+    __tl_id__ = 0x6f02f748
+    __tl_name__ = "functions.help.SaveAppLog"
+    __tl_layer__ = 133
+
+    __slots__ = ("events", )
+
+    def __init__(self, *, events: list[tl.base.InputAppEvent]):
+        self.events = events
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.events, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveAppLog:
+        events = TLObjectVector.read(stream)
+        return cls(events=events)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveAppLog, int]:
+        events, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(events=events), cursor
+
+
+class GetPassportConfig(TLRequest[tl.base.help.PassportConfig]):
+    __tl_id__ = 0xc661ad08
+    __tl_name__ = "functions.help.GetPassportConfig"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPassportConfig:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPassportConfig, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetSupportName(TLRequest[tl.types.help.SupportName]):
+    __tl_id__ = 0xd360e72c
+    __tl_name__ = "functions.help.GetSupportName"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSupportName:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSupportName, int]:
+        return cls(), cursor
+
+
+class GetUserInfo(TLRequest[tl.base.help.UserInfo]):
+    __tl_id__ = 0x38a08d3
+    __tl_name__ = "functions.help.GetUserInfo"
+    __tl_layer__ = 133
+
+    __slots__ = ("user_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser):
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUserInfo:
+        user_id = TLObject.read(stream)
+        return cls(user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUserInfo, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(user_id=user_id), cursor
+
+
+class EditUserInfo(TLRequest[tl.base.help.UserInfo]):
+    __tl_id__ = 0x66b91b70
+    __tl_name__ = "functions.help.EditUserInfo"
+    __tl_layer__ = 133
+
+    __slots__ = ("user_id", "message", "entities", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, message: str, entities: list[tl.base.MessageEntity]):
+        self.user_id = user_id
+        self.message = message
+        self.entities = entities
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        String.write_to(out, self.message)
+        TLObjectVector.write_to(out, self.entities, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditUserInfo:
+        user_id = TLObject.read(stream)
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream)
+        return cls(user_id=user_id, message=message, entities=entities)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditUserInfo, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(user_id=user_id, message=message, entities=entities), cursor
+
+
+class GetPromoData(TLRequest[tl.base.help.PromoData]):
+    __tl_id__ = 0xc0977421
+    __tl_name__ = "functions.help.GetPromoData"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPromoData:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPromoData, int]:
+        return cls(), cursor
+
+
+class HidePromoData(TLRequest[bool]):
+    __tl_id__ = 0x1e251c95
+    __tl_name__ = "functions.help.HidePromoData"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> HidePromoData:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[HidePromoData, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class DismissSuggestion(TLRequest[bool]):
+    __tl_id__ = 0xf50dbaa1
+    __tl_name__ = "functions.help.DismissSuggestion"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "suggestion", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, suggestion: str):
+        self.peer = peer
+        self.suggestion = suggestion
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.suggestion)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DismissSuggestion:
+        peer = TLObject.read(stream)
+        suggestion = String.read(stream)
+        return cls(peer=peer, suggestion=suggestion)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DismissSuggestion, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        suggestion, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, suggestion=suggestion), cursor
+
+
+class GetCountriesList(TLRequest[tl.base.help.CountriesList]):
+    __tl_id__ = 0x735787a8
+    __tl_name__ = "functions.help.GetCountriesList"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_code", "hash", )
+
+    def __init__(self, *, lang_code: str, hash: int):
+        self.lang_code = lang_code
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_code)
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCountriesList:
+        lang_code = String.read(stream)
+        hash = Int.read(stream)
+        return cls(lang_code=lang_code, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCountriesList, int]:
+        lang_code, cursor = String.read_from(view, cursor)
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(lang_code=lang_code, hash=hash), cursor
+
+
+class GetPremiumPromo(TLRequest[tl.base.help.PremiumPromo]):
+    __tl_id__ = 0xb81b93d4
+    __tl_name__ = "functions.help.GetPremiumPromo"
+    __tl_layer__ = 143
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPremiumPromo:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPremiumPromo, int]:
+        return cls(), cursor
+
+
+class GetPeerColors(TLRequest[tl.base.help.PeerColors]):
+    __tl_id__ = 0xda80f42f
+    __tl_name__ = "functions.help.GetPeerColors"
+    __tl_layer__ = 167
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPeerColors:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPeerColors, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetPeerProfileColors(TLRequest[tl.base.help.PeerColors]):
+    __tl_id__ = 0xabcfa9fd
+    __tl_name__ = "functions.help.GetPeerProfileColors"
+    __tl_layer__ = 167
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPeerProfileColors:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPeerProfileColors, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetTimezonesList(TLRequest[tl.base.help.TimezonesList]):
+    __tl_id__ = 0x49b30240
+    __tl_name__ = "functions.help.GetTimezonesList"
+    __tl_layer__ = 176
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetTimezonesList:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetTimezonesList, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetAppChangelog_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x9010ef6f
+    __tl_name__ = "functions.help.GetAppChangelog_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("prev_app_version", )
+
+    def __init__(self, *, prev_app_version: str):
+        self.prev_app_version = prev_app_version
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.prev_app_version)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAppChangelog_133:
+        prev_app_version = String.read(stream)
+        return cls(prev_app_version=prev_app_version)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAppChangelog_133, int]:
+        prev_app_version, cursor = String.read_from(view, cursor)
+        return cls(prev_app_version=prev_app_version), cursor
+
+
+class GetAppConfig_133(TLRequest[tl.base.JSONValue]):
+    __tl_id__ = 0x98914110
+    __tl_name__ = "functions.help.GetAppConfig_133"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAppConfig_133:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAppConfig_133, int]:
+        return cls(), cursor
@@ -0,0 +1,450 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class SendCode(TLRequest[tl.types.internal.SentCode]):
+    __tl_id__ = 0xbc8e37d8
+    __tl_name__ = "functions.internal.SendCode"
+    __tl_layer__ = 201
+
+    __slots__ = ("phone_number", )
+
+    def __init__(self, *, phone_number: str):
+        self.phone_number = phone_number
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendCode:
+        phone_number = String.read(stream)
+        return cls(phone_number=phone_number)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendCode, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number), cursor
+
+
+class SignIn(TLRequest[tl.types.internal.Authorization]):
+    __tl_id__ = 0x53fa18be
+    __tl_name__ = "functions.internal.SignIn"
+    __tl_layer__ = 201
+
+    __slots__ = ("phone_number", "random_hash", "password", )
+
+    def __init__(self, *, phone_number: str, random_hash: bytes, password: str):
+        self.phone_number = phone_number
+        self.random_hash = random_hash
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        Bytes.write_to(out, self.random_hash)
+        String.write_to(out, self.password)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SignIn:
+        phone_number = String.read(stream)
+        random_hash = Bytes.read(stream)
+        password = String.read(stream)
+        return cls(phone_number=phone_number, random_hash=random_hash, password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SignIn, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        random_hash, cursor = Bytes.read_from(view, cursor)
+        password, cursor = String.read_from(view, cursor)
+        return cls(phone_number=phone_number, random_hash=random_hash, password=password), cursor
+
+
+class GetUserApp(TLRequest[tl.base.internal.AppInfo]):
+    __tl_id__ = 0x8b497a42
+    __tl_name__ = "functions.internal.GetUserApp"
+    __tl_layer__ = 201
+
+    __slots__ = ("auth", )
+
+    def __init__(self, *, auth: bytes):
+        self.auth = auth
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.auth)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUserApp:
+        auth = Bytes.read(stream)
+        return cls(auth=auth)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUserApp, int]:
+        auth, cursor = Bytes.read_from(view, cursor)
+        return cls(auth=auth), cursor
+
+
+class EditUserApp(TLRequest[bool]):
+    __tl_id__ = 0xbe19f87d
+    __tl_name__ = "functions.internal.EditUserApp"
+    __tl_layer__ = 201
+
+    __slots__ = ("auth", "title", "short_name", )
+
+    def __init__(self, *, auth: bytes, title: str, short_name: str):
+        self.auth = auth
+        self.title = title
+        self.short_name = short_name
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.auth)
+        String.write_to(out, self.title)
+        String.write_to(out, self.short_name)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditUserApp:
+        auth = Bytes.read(stream)
+        title = String.read(stream)
+        short_name = String.read(stream)
+        return cls(auth=auth, title=title, short_name=short_name)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditUserApp, int]:
+        auth, cursor = Bytes.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        short_name, cursor = String.read_from(view, cursor)
+        return cls(auth=auth, title=title, short_name=short_name), cursor
+
+
+class GetAvailableServers(TLRequest[tl.types.internal.AvailableServers]):
+    __tl_id__ = 0xa2ed5af3
+    __tl_name__ = "functions.internal.GetAvailableServers"
+    __tl_layer__ = 201
+
+    __slots__ = ("auth", )
+
+    def __init__(self, *, auth: bytes):
+        self.auth = auth
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.auth)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAvailableServers:
+        auth = Bytes.read(stream)
+        return cls(auth=auth)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAvailableServers, int]:
+        auth, cursor = Bytes.read_from(view, cursor)
+        return cls(auth=auth), cursor
+
+
+class CallRpc(TLRequest[tl.types.internal.RpcResponse]):
+    __tl_id__ = 0xead5e531
+    __tl_name__ = "functions.internal.CallRpc"
+    __tl_layer__ = 201
+
+    __slots__ = ("is_bot", "mfa_pending", "auth_key_id", "perm_auth_key_id", "session_id", "message_id", "auth_id", "user_id", "layer", "obj", )
+
+    def __init__(self, *, layer: int, obj: TLObject, is_bot: bool = False, mfa_pending: bool = False, auth_key_id: int | None = None, perm_auth_key_id: int | None = None, session_id: int | None = None, message_id: int | None = None, auth_id: int | None = None, user_id: int | None = None):
+        self.is_bot = is_bot
+        self.mfa_pending = mfa_pending
+        self.auth_key_id = auth_key_id
+        self.perm_auth_key_id = perm_auth_key_id
+        self.session_id = session_id
+        self.message_id = message_id
+        self.auth_id = auth_id
+        self.user_id = user_id
+        self.layer = layer
+        self.obj = obj
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.is_bot: flags1 |= (1 << 6)
+        if self.mfa_pending: flags1 |= (1 << 7)
+        if self.auth_key_id is not None: flags1 |= (1 << 1)
+        if self.perm_auth_key_id is not None: flags1 |= (1 << 0)
+        if self.session_id is not None: flags1 |= (1 << 2)
+        if self.message_id is not None: flags1 |= (1 << 3)
+        if self.auth_id is not None: flags1 |= (1 << 4)
+        if self.user_id is not None: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        if self.auth_key_id is not None:
+            out += Long.write(self.auth_key_id)
+        if self.perm_auth_key_id is not None:
+            out += Long.write(self.perm_auth_key_id)
+        if self.session_id is not None:
+            out += Long.write(self.session_id)
+        if self.message_id is not None:
+            out += Long.write(self.message_id)
+        if self.auth_id is not None:
+            out += Long.write(self.auth_id)
+        if self.user_id is not None:
+            out += Long.write(self.user_id)
+        out += Int.write(self.layer)
+        self.obj.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CallRpc:
+        flags1 = Int.read(stream)
+        is_bot = (flags1 & (1 << 6)) == (1 << 6)
+        mfa_pending = (flags1 & (1 << 7)) == (1 << 7)
+        auth_key_id = Long.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        perm_auth_key_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        session_id = Long.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        message_id = Long.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        auth_id = Long.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        user_id = Long.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        layer = Int.read(stream)
+        obj = TLObject.read(stream)
+        return cls(is_bot=is_bot, mfa_pending=mfa_pending, auth_key_id=auth_key_id, perm_auth_key_id=perm_auth_key_id, session_id=session_id, message_id=message_id, auth_id=auth_id, user_id=user_id, layer=layer, obj=obj)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CallRpc, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        is_bot = (flags1 & (1 << 6)) == (1 << 6)
+        mfa_pending = (flags1 & (1 << 7)) == (1 << 7)
+        auth_key_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        perm_auth_key_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        session_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        message_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        auth_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        user_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        layer, cursor = Int.read_from(view, cursor)
+        obj, cursor = TLObject.read_from(view, cursor)
+        return cls(is_bot=is_bot, mfa_pending=mfa_pending, auth_key_id=auth_key_id, perm_auth_key_id=perm_auth_key_id, session_id=session_id, message_id=message_id, auth_id=auth_id, user_id=user_id, layer=layer, obj=obj), cursor
+
+
+class CallRpcInternal(TLRequest[TLObject]):
+    __tl_id__ = 0xe876b427
+    __tl_name__ = "functions.internal.CallRpcInternal"
+    __tl_layer__ = 201
+
+    __slots__ = ("as_user", "as_auth_id", "obj", )
+
+    def __init__(self, *, obj: TLObject, as_user: int | None = None, as_auth_id: int | None = None):
+        self.as_user = as_user
+        self.as_auth_id = as_auth_id
+        self.obj = obj
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.as_user is not None: flags1 |= (1 << 0)
+        if self.as_auth_id is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.as_user is not None:
+            out += Long.write(self.as_user)
+        if self.as_auth_id is not None:
+            out += Long.write(self.as_auth_id)
+        self.obj.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CallRpcInternal:
+        flags1 = Int.read(stream)
+        as_user = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        as_auth_id = Long.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        obj = TLObject.read(stream)
+        return cls(as_user=as_user, as_auth_id=as_auth_id, obj=obj)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CallRpcInternal, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        as_user, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        as_auth_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        obj, cursor = TLObject.read_from(view, cursor)
+        return cls(as_user=as_user, as_auth_id=as_auth_id, obj=obj), cursor
+
+
+class SendScheduledMessage(TLRequest[bool]):
+    __tl_id__ = 0xbabeae6e
+    __tl_name__ = "functions.internal.SendScheduledMessage"
+    __tl_layer__ = 201
+
+    __slots__ = ("message_id", )
+
+    def __init__(self, *, message_id: int):
+        self.message_id = message_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.message_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendScheduledMessage:
+        message_id = Long.read(stream)
+        return cls(message_id=message_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendScheduledMessage, int]:
+        message_id, cursor = Long.read_from(view, cursor)
+        return cls(message_id=message_id), cursor
+
+
+class DeleteScheduledMessage(TLRequest[bool]):
+    __tl_id__ = 0xacd1c8f0
+    __tl_name__ = "functions.internal.DeleteScheduledMessage"
+    __tl_layer__ = 201
+
+    __slots__ = ("message_id", )
+
+    def __init__(self, *, message_id: int):
+        self.message_id = message_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.message_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteScheduledMessage:
+        message_id = Long.read(stream)
+        return cls(message_id=message_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteScheduledMessage, int]:
+        message_id, cursor = Long.read_from(view, cursor)
+        return cls(message_id=message_id), cursor
+
+
+class CreateDiscussionThread(TLRequest[bool]):
+    __tl_id__ = 0x6bdac34b
+    __tl_name__ = "functions.internal.CreateDiscussionThread"
+    __tl_layer__ = 201
+
+    __slots__ = ("message_id", )
+
+    def __init__(self, *, message_id: int):
+        self.message_id = message_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.message_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateDiscussionThread:
+        message_id = Long.read(stream)
+        return cls(message_id=message_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateDiscussionThread, int]:
+        message_id, cursor = Long.read_from(view, cursor)
+        return cls(message_id=message_id), cursor
+
+
+class ProcessMessageToBuiltinBot(TLRequest[bool]):
+    __tl_id__ = 0x820fd380
+    __tl_name__ = "functions.internal.ProcessMessageToBuiltinBot"
+    __tl_layer__ = 201
+
+    __slots__ = ("messageref_id", )
+
+    def __init__(self, *, messageref_id: int):
+        self.messageref_id = messageref_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.messageref_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ProcessMessageToBuiltinBot:
+        messageref_id = Long.read(stream)
+        return cls(messageref_id=messageref_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ProcessMessageToBuiltinBot, int]:
+        messageref_id, cursor = Long.read_from(view, cursor)
+        return cls(messageref_id=messageref_id), cursor
+
+
+class UpdateStatusForPeers(TLRequest[bool]):
+    __tl_id__ = 0xed609074
+    __tl_name__ = "functions.internal.UpdateStatusForPeers"
+    __tl_layer__ = 201
+
+    __slots__ = ("peer_type", "peer_owner", "peer_user", "peer_chat", )
+
+    def __init__(self, *, peer_type: int, peer_owner: int, peer_user: int, peer_chat: int):
+        self.peer_type = peer_type
+        self.peer_owner = peer_owner
+        self.peer_user = peer_user
+        self.peer_chat = peer_chat
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.peer_type)
+        out += Long.write(self.peer_owner)
+        out += Long.write(self.peer_user)
+        out += Long.write(self.peer_chat)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateStatusForPeers:
+        peer_type = Int.read(stream)
+        peer_owner = Long.read(stream)
+        peer_user = Long.read(stream)
+        peer_chat = Long.read(stream)
+        return cls(peer_type=peer_type, peer_owner=peer_owner, peer_user=peer_user, peer_chat=peer_chat)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateStatusForPeers, int]:
+        peer_type, cursor = Int.read_from(view, cursor)
+        peer_owner, cursor = Long.read_from(view, cursor)
+        peer_user, cursor = Long.read_from(view, cursor)
+        peer_chat, cursor = Long.read_from(view, cursor)
+        return cls(peer_type=peer_type, peer_owner=peer_owner, peer_user=peer_user, peer_chat=peer_chat), cursor
+
+
+class ClearDraft(TLRequest[bool]):
+    __tl_id__ = 0xb8b19f5d
+    __tl_name__ = "functions.internal.ClearDraft"
+    __tl_layer__ = 201
+
+    __slots__ = ("user_id", "peer_id", )
+
+    def __init__(self, *, user_id: int, peer_id: int):
+        self.user_id = user_id
+        self.peer_id = peer_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.user_id)
+        out += Long.write(self.peer_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClearDraft:
+        user_id = Long.read(stream)
+        peer_id = Long.read(stream)
+        return cls(user_id=user_id, peer_id=peer_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClearDraft, int]:
+        user_id, cursor = Long.read_from(view, cursor)
+        peer_id, cursor = Long.read_from(view, cursor)
+        return cls(user_id=user_id, peer_id=peer_id), cursor
+
+
+class SendTelegramMessage(TLRequest[bool]):
+    __tl_id__ = 0xb1210a96
+    __tl_name__ = "functions.internal.SendTelegramMessage"
+    __tl_layer__ = 201
+
+    __slots__ = ("user_id", "text", )
+
+    def __init__(self, *, user_id: int, text: str):
+        self.user_id = user_id
+        self.text = text
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.user_id)
+        String.write_to(out, self.text)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendTelegramMessage:
+        user_id = Long.read(stream)
+        text = String.read(stream)
+        return cls(user_id=user_id, text=text)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendTelegramMessage, int]:
+        user_id, cursor = Long.read_from(view, cursor)
+        text, cursor = String.read_from(view, cursor)
+        return cls(user_id=user_id, text=text), cursor
@@ -0,0 +1,249 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetLangPack(TLRequest[tl.types.LangPackDifference]):
+    __tl_id__ = 0xf2f2330a
+    __tl_name__ = "functions.langpack.GetLangPack"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_pack", "lang_code", )
+
+    def __init__(self, *, lang_pack: str, lang_code: str):
+        self.lang_pack = lang_pack
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_pack)
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetLangPack:
+        lang_pack = String.read(stream)
+        lang_code = String.read(stream)
+        return cls(lang_pack=lang_pack, lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetLangPack, int]:
+        lang_pack, cursor = String.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(lang_pack=lang_pack, lang_code=lang_code), cursor
+
+
+class GetStrings(TLRequest[list[tl.base.LangPackString]]):
+    __tl_id__ = 0xefea3803
+    __tl_name__ = "functions.langpack.GetStrings"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_pack", "lang_code", "keys", )
+
+    def __init__(self, *, lang_pack: str, lang_code: str, keys: list[str]):
+        self.lang_pack = lang_pack
+        self.lang_code = lang_code
+        self.keys = keys
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_pack)
+        String.write_to(out, self.lang_code)
+        out += StringVector.write(self.keys)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStrings:
+        lang_pack = String.read(stream)
+        lang_code = String.read(stream)
+        keys = StringVector.read(stream)
+        return cls(lang_pack=lang_pack, lang_code=lang_code, keys=keys)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStrings, int]:
+        lang_pack, cursor = String.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        keys, cursor = StringVector.read_from(view, cursor)
+        return cls(lang_pack=lang_pack, lang_code=lang_code, keys=keys), cursor
+
+
+class GetDifference(TLRequest[tl.types.LangPackDifference]):
+    __tl_id__ = 0xcd984aa5
+    __tl_name__ = "functions.langpack.GetDifference"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_pack", "lang_code", "from_version", )
+
+    def __init__(self, *, lang_pack: str, lang_code: str, from_version: int):
+        self.lang_pack = lang_pack
+        self.lang_code = lang_code
+        self.from_version = from_version
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_pack)
+        String.write_to(out, self.lang_code)
+        out += Int.write(self.from_version)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDifference:
+        lang_pack = String.read(stream)
+        lang_code = String.read(stream)
+        from_version = Int.read(stream)
+        return cls(lang_pack=lang_pack, lang_code=lang_code, from_version=from_version)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDifference, int]:
+        lang_pack, cursor = String.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        from_version, cursor = Int.read_from(view, cursor)
+        return cls(lang_pack=lang_pack, lang_code=lang_code, from_version=from_version), cursor
+
+
+class GetLanguages(TLRequest[list[tl.base.LangPackLanguage]]):
+    __tl_id__ = 0x42c6978f
+    __tl_name__ = "functions.langpack.GetLanguages"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_pack", )
+
+    def __init__(self, *, lang_pack: str):
+        self.lang_pack = lang_pack
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_pack)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetLanguages:
+        lang_pack = String.read(stream)
+        return cls(lang_pack=lang_pack)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetLanguages, int]:
+        lang_pack, cursor = String.read_from(view, cursor)
+        return cls(lang_pack=lang_pack), cursor
+
+
+class GetLanguage(TLRequest[tl.base.LangPackLanguage]):
+    __tl_id__ = 0x6a596502
+    __tl_name__ = "functions.langpack.GetLanguage"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_pack", "lang_code", )
+
+    def __init__(self, *, lang_pack: str, lang_code: str):
+        self.lang_pack = lang_pack
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_pack)
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetLanguage:
+        lang_pack = String.read(stream)
+        lang_code = String.read(stream)
+        return cls(lang_pack=lang_pack, lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetLanguage, int]:
+        lang_pack, cursor = String.read_from(view, cursor)
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(lang_pack=lang_pack, lang_code=lang_code), cursor
+
+
+class GetLangPack_72(TLRequest[tl.types.LangPackDifference]):
+    __tl_id__ = 0x9ab5c58e
+    __tl_name__ = "functions.langpack.GetLangPack_72"
+    __tl_layer__ = 72
+
+    __slots__ = ("lang_code", )
+
+    def __init__(self, *, lang_code: str):
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetLangPack_72:
+        lang_code = String.read(stream)
+        return cls(lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetLangPack_72, int]:
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(lang_code=lang_code), cursor
+
+
+class GetStrings_72(TLRequest[list[tl.base.LangPackString]]):
+    __tl_id__ = 0x2e1ee318
+    __tl_name__ = "functions.langpack.GetStrings_72"
+    __tl_layer__ = 72
+
+    __slots__ = ("lang_code", "keys", )
+
+    def __init__(self, *, lang_code: str, keys: list[str]):
+        self.lang_code = lang_code
+        self.keys = keys
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_code)
+        out += StringVector.write(self.keys)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStrings_72:
+        lang_code = String.read(stream)
+        keys = StringVector.read(stream)
+        return cls(lang_code=lang_code, keys=keys)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStrings_72, int]:
+        lang_code, cursor = String.read_from(view, cursor)
+        keys, cursor = StringVector.read_from(view, cursor)
+        return cls(lang_code=lang_code, keys=keys), cursor
+
+
+class GetDifference_72(TLRequest[tl.types.LangPackDifference]):
+    __tl_id__ = 0xb2e4d7d
+    __tl_name__ = "functions.langpack.GetDifference_72"
+    __tl_layer__ = 72
+
+    __slots__ = ("from_version", )
+
+    def __init__(self, *, from_version: int):
+        self.from_version = from_version
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.from_version)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDifference_72:
+        from_version = Int.read(stream)
+        return cls(from_version=from_version)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDifference_72, int]:
+        from_version, cursor = Int.read_from(view, cursor)
+        return cls(from_version=from_version), cursor
+
+
+class GetLanguages_72(TLRequest[list[tl.base.LangPackLanguage]]):
+    __tl_id__ = 0x800fd57d
+    __tl_name__ = "functions.langpack.GetLanguages_72"
+    __tl_layer__ = 72
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetLanguages_72:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetLanguages_72, int]:
+        return cls(), cursor
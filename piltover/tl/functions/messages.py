@@ -0,0 +1,12901 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetMessages(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x63c66506
+    __tl_name__ = "functions.messages.GetMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[tl.base.InputMessage]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessages:
+        id = TLObjectVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessages, int]:
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetDialogs(TLRequest[tl.base.messages.Dialogs]):
+    __tl_id__ = 0xa0f4cb4f
+    __tl_name__ = "functions.messages.GetDialogs"
+    __tl_layer__ = 133
+
+    __slots__ = ("exclude_pinned", "folder_id", "offset_date", "offset_id", "offset_peer", "limit", "hash", )
+
+    def __init__(self, *, offset_date: int, offset_id: int, offset_peer: tl.base.InputPeer, limit: int, hash: int, exclude_pinned: bool = False, folder_id: int | None = None):
+        self.exclude_pinned = exclude_pinned
+        self.folder_id = folder_id
+        self.offset_date = offset_date
+        self.offset_id = offset_id
+        self.offset_peer = offset_peer
+        self.limit = limit
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.exclude_pinned: flags1 |= (1 << 0)
+        if self.folder_id is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.folder_id is not None:
+            out += Int.write(self.folder_id)
+        out += Int.write(self.offset_date)
+        out += Int.write(self.offset_id)
+        self.offset_peer.write_to(out, ctx)
+        out += Int.write(self.limit)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDialogs:
+        flags1 = Int.read(stream)
+        exclude_pinned = (flags1 & (1 << 0)) == (1 << 0)
+        folder_id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        offset_date = Int.read(stream)
+        offset_id = Int.read(stream)
+        offset_peer = TLObject.read(stream)
+        limit = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(exclude_pinned=exclude_pinned, folder_id=folder_id, offset_date=offset_date, offset_id=offset_id, offset_peer=offset_peer, limit=limit, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDialogs, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        exclude_pinned = (flags1 & (1 << 0)) == (1 << 0)
+        folder_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        offset_peer, cursor = TLObject.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(exclude_pinned=exclude_pinned, folder_id=folder_id, offset_date=offset_date, offset_id=offset_id, offset_peer=offset_peer, limit=limit, hash=hash), cursor
+
+
+class GetHistory(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x4423e6c5
+    __tl_name__ = "functions.messages.GetHistory"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "offset_id", "offset_date", "add_offset", "limit", "max_id", "min_id", "hash", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset_id: int, offset_date: int, add_offset: int, limit: int, max_id: int, min_id: int, hash: int):
+        self.peer = peer
+        self.offset_id = offset_id
+        self.offset_date = offset_date
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.offset_date)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetHistory:
+        peer = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        offset_date = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(peer=peer, offset_id=offset_id, offset_date=offset_date, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetHistory, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, offset_id=offset_id, offset_date=offset_date, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash), cursor
+
+
+class Search(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x29ee847a
+    __tl_name__ = "functions.messages.Search"
+    __tl_layer__ = 171
+
+    __slots__ = ("peer", "q", "from_id", "saved_peer_id", "saved_reaction", "top_msg_id", "filter", "min_date", "max_date", "offset_id", "add_offset", "limit", "max_id", "min_id", "hash", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, q: str, filter: tl.base.MessagesFilter, min_date: int, max_date: int, offset_id: int, add_offset: int, limit: int, max_id: int, min_id: int, hash: int, from_id: tl.base.InputPeer | None = None, saved_peer_id: tl.base.InputPeer | None = None, saved_reaction: list[tl.base.Reaction] | None = None, top_msg_id: int | None = None):
+        self.peer = peer
+        self.q = q
+        self.from_id = from_id
+        self.saved_peer_id = saved_peer_id
+        self.saved_reaction = saved_reaction
+        self.top_msg_id = top_msg_id
+        self.filter = filter
+        self.min_date = min_date
+        self.max_date = max_date
+        self.offset_id = offset_id
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_id is not None: flags1 |= (1 << 0)
+        if self.saved_peer_id is not None: flags1 |= (1 << 2)
+        if self.saved_reaction: flags1 |= (1 << 3)
+        if self.top_msg_id is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.q)
+        if self.from_id is not None:
+            self.from_id.write_to(out, ctx)
+        if self.saved_peer_id is not None:
+            self.saved_peer_id.write_to(out, ctx)
+        if self.saved_reaction:
+            TLObjectVector.write_to(out, self.saved_reaction, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.min_date)
+        out += Int.write(self.max_date)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Search:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        q = String.read(stream)
+        from_id = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        saved_peer_id = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        saved_reaction = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        filter = TLObject.read(stream)
+        min_date = Int.read(stream)
+        max_date = Int.read(stream)
+        offset_id = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(peer=peer, q=q, from_id=from_id, saved_peer_id=saved_peer_id, saved_reaction=saved_reaction, top_msg_id=top_msg_id, filter=filter, min_date=min_date, max_date=max_date, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Search, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        q, cursor = String.read_from(view, cursor)
+        from_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        saved_peer_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        saved_reaction, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        min_date, cursor = Int.read_from(view, cursor)
+        max_date, cursor = Int.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, q=q, from_id=from_id, saved_peer_id=saved_peer_id, saved_reaction=saved_reaction, top_msg_id=top_msg_id, filter=filter, min_date=min_date, max_date=max_date, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash), cursor
+
+
+class ReadHistory(TLRequest[tl.types.messages.AffectedMessages]):
+    __tl_id__ = 0xe306d3a
+    __tl_name__ = "functions.messages.ReadHistory"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "max_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, max_id: int):
+        self.peer = peer
+        self.max_id = max_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.max_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadHistory:
+        peer = TLObject.read(stream)
+        max_id = Int.read(stream)
+        return cls(peer=peer, max_id=max_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadHistory, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, max_id=max_id), cursor
+
+
+class DeleteHistory(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0xb08f922a
+    __tl_name__ = "functions.messages.DeleteHistory"
+    __tl_layer__ = 134
+
+    __slots__ = ("just_clear", "revoke", "peer", "max_id", "min_date", "max_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, max_id: int, just_clear: bool = False, revoke: bool = False, min_date: int | None = None, max_date: int | None = None):
+        self.just_clear = just_clear
+        self.revoke = revoke
+        self.peer = peer
+        self.max_id = max_id
+        self.min_date = min_date
+        self.max_date = max_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.just_clear: flags1 |= (1 << 0)
+        if self.revoke: flags1 |= (1 << 1)
+        if self.min_date is not None: flags1 |= (1 << 2)
+        if self.max_date is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.max_id)
+        if self.min_date is not None:
+            out += Int.write(self.min_date)
+        if self.max_date is not None:
+            out += Int.write(self.max_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteHistory:
+        flags1 = Int.read(stream)
+        just_clear = (flags1 & (1 << 0)) == (1 << 0)
+        revoke = (flags1 & (1 << 1)) == (1 << 1)
+        peer = TLObject.read(stream)
+        max_id = Int.read(stream)
+        min_date = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        max_date = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(just_clear=just_clear, revoke=revoke, peer=peer, max_id=max_id, min_date=min_date, max_date=max_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteHistory, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        just_clear = (flags1 & (1 << 0)) == (1 << 0)
+        revoke = (flags1 & (1 << 1)) == (1 << 1)
+        peer, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        max_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(just_clear=just_clear, revoke=revoke, peer=peer, max_id=max_id, min_date=min_date, max_date=max_date), cursor
+
+
+class DeleteMessages(TLRequest[tl.types.messages.AffectedMessages]):
+    __tl_id__ = 0xe58e95d2
+    __tl_name__ = "functions.messages.DeleteMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("revoke", "id", )
+
+    def __init__(self, *, id: list[int], revoke: bool = False):
+        self.revoke = revoke
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.revoke: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteMessages:
+        flags1 = Int.read(stream)
+        revoke = (flags1 & (1 << 0)) == (1 << 0)
+        id = IntVector.read(stream)
+        return cls(revoke=revoke, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteMessages, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        revoke = (flags1 & (1 << 0)) == (1 << 0)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(revoke=revoke, id=id), cursor
+
+
+class ReceivedMessages(TLRequest[list[tl.base.ReceivedNotifyMessage]]):
+    __tl_id__ = 0x5a954c0
+    __tl_name__ = "functions.messages.ReceivedMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("max_id", )
+
+    def __init__(self, *, max_id: int):
+        self.max_id = max_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.max_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReceivedMessages:
+        max_id = Int.read(stream)
+        return cls(max_id=max_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReceivedMessages, int]:
+        max_id, cursor = Int.read_from(view, cursor)
+        return cls(max_id=max_id), cursor
+
+
+class SetTyping(TLRequest[bool]):
+    __tl_id__ = 0x58943ee2
+    __tl_name__ = "functions.messages.SetTyping"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "top_msg_id", "action", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, action: tl.base.SendMessageAction, top_msg_id: int | None = None):
+        self.peer = peer
+        self.top_msg_id = top_msg_id
+        self.action = action
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.top_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        self.action.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetTyping:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        action = TLObject.read(stream)
+        return cls(peer=peer, top_msg_id=top_msg_id, action=action)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetTyping, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        action, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, top_msg_id=top_msg_id, action=action), cursor
+
+
+class SendMessage(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xfbf2340a
+    __tl_name__ = "functions.messages.SendMessage"
+    __tl_layer__ = 200
+
+    __slots__ = ("no_webpage", "silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "allow_paid_floodskip", "peer", "reply_to", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", "quick_reply_shortcut", "effect", "allow_paid_stars", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, random_id: int, no_webpage: bool = False, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, invert_media: bool = False, allow_paid_floodskip: bool = False, reply_to: tl.base.InputReplyTo | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None, effect: int | None = None, allow_paid_stars: int | None = None):
+        self.no_webpage = no_webpage
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.allow_paid_floodskip = allow_paid_floodskip
+        self.peer = peer
+        self.reply_to = reply_to
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.effect = effect
+        self.allow_paid_stars = allow_paid_stars
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.allow_paid_floodskip: flags1 |= (1 << 19)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        if self.effect is not None: flags1 |= (1 << 18)
+        if self.allow_paid_stars is not None: flags1 |= (1 << 21)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+        if self.effect is not None:
+            out += Long.write(self.effect)
+        if self.allow_paid_stars is not None:
+            out += Long.write(self.allow_paid_stars)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMessage:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        effect = Long.read(stream) if (flags1 & (1 << 18)) == (1 << 18) else None
+        allow_paid_stars = Long.read(stream) if (flags1 & (1 << 21)) == (1 << 21) else None
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, allow_paid_floodskip=allow_paid_floodskip, peer=peer, reply_to=reply_to, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect, allow_paid_stars=allow_paid_stars)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMessage, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        effect, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 18)) == (1 << 18) else (None, cursor)
+        allow_paid_stars, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 21)) == (1 << 21) else (None, cursor)
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, allow_paid_floodskip=allow_paid_floodskip, peer=peer, reply_to=reply_to, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect, allow_paid_stars=allow_paid_stars), cursor
+
+
+class SendMedia(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xa550cd78
+    __tl_name__ = "functions.messages.SendMedia"
+    __tl_layer__ = 200
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "allow_paid_floodskip", "peer", "reply_to", "media", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", "quick_reply_shortcut", "effect", "allow_paid_stars", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, message: str, random_id: int, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, invert_media: bool = False, allow_paid_floodskip: bool = False, reply_to: tl.base.InputReplyTo | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None, effect: int | None = None, allow_paid_stars: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.allow_paid_floodskip = allow_paid_floodskip
+        self.peer = peer
+        self.reply_to = reply_to
+        self.media = media
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.effect = effect
+        self.allow_paid_stars = allow_paid_stars
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.allow_paid_floodskip: flags1 |= (1 << 19)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        if self.effect is not None: flags1 |= (1 << 18)
+        if self.allow_paid_stars is not None: flags1 |= (1 << 21)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        self.media.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+        if self.effect is not None:
+            out += Long.write(self.effect)
+        if self.allow_paid_stars is not None:
+            out += Long.write(self.allow_paid_stars)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMedia:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        media = TLObject.read(stream)
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        effect = Long.read(stream) if (flags1 & (1 << 18)) == (1 << 18) else None
+        allow_paid_stars = Long.read(stream) if (flags1 & (1 << 21)) == (1 << 21) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, allow_paid_floodskip=allow_paid_floodskip, peer=peer, reply_to=reply_to, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect, allow_paid_stars=allow_paid_stars)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMedia, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        effect, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 18)) == (1 << 18) else (None, cursor)
+        allow_paid_stars, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 21)) == (1 << 21) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, allow_paid_floodskip=allow_paid_floodskip, peer=peer, reply_to=reply_to, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect, allow_paid_stars=allow_paid_stars), cursor
+
+
+class ForwardMessages(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xbb9fa475
+    __tl_name__ = "functions.messages.ForwardMessages"
+    __tl_layer__ = 200
+
+    __slots__ = ("silent", "background", "with_my_score", "drop_author", "drop_media_captions", "noforwards", "allow_paid_floodskip", "from_peer", "id", "random_id", "to_peer", "top_msg_id", "schedule_date", "send_as", "quick_reply_shortcut", "video_timestamp", "allow_paid_stars", )
+
+    def __init__(self, *, from_peer: tl.base.InputPeer, id: list[int], random_id: list[int], to_peer: tl.base.InputPeer, silent: bool = False, background: bool = False, with_my_score: bool = False, drop_author: bool = False, drop_media_captions: bool = False, noforwards: bool = False, allow_paid_floodskip: bool = False, top_msg_id: int | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None, video_timestamp: int | None = None, allow_paid_stars: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.with_my_score = with_my_score
+        self.drop_author = drop_author
+        self.drop_media_captions = drop_media_captions
+        self.noforwards = noforwards
+        self.allow_paid_floodskip = allow_paid_floodskip
+        self.from_peer = from_peer
+        self.id = id
+        self.random_id = random_id
+        self.to_peer = to_peer
+        self.top_msg_id = top_msg_id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.video_timestamp = video_timestamp
+        self.allow_paid_stars = allow_paid_stars
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.with_my_score: flags1 |= (1 << 8)
+        if self.drop_author: flags1 |= (1 << 11)
+        if self.drop_media_captions: flags1 |= (1 << 12)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.allow_paid_floodskip: flags1 |= (1 << 19)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        if self.video_timestamp is not None: flags1 |= (1 << 20)
+        if self.allow_paid_stars is not None: flags1 |= (1 << 21)
+        out += Int.write(flags1)
+        self.from_peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        out += LongVector.write(self.random_id)
+        self.to_peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+        if self.video_timestamp is not None:
+            out += Int.write(self.video_timestamp)
+        if self.allow_paid_stars is not None:
+            out += Long.write(self.allow_paid_stars)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ForwardMessages:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        from_peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        random_id = LongVector.read(stream)
+        to_peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        video_timestamp = Int.read(stream) if (flags1 & (1 << 20)) == (1 << 20) else None
+        allow_paid_stars = Long.read(stream) if (flags1 & (1 << 21)) == (1 << 21) else None
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, allow_paid_floodskip=allow_paid_floodskip, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, top_msg_id=top_msg_id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, video_timestamp=video_timestamp, allow_paid_stars=allow_paid_stars)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ForwardMessages, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        from_peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        random_id, cursor = LongVector.read_from(view, cursor)
+        to_peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        video_timestamp, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 20)) == (1 << 20) else (None, cursor)
+        allow_paid_stars, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 21)) == (1 << 21) else (None, cursor)
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, allow_paid_floodskip=allow_paid_floodskip, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, top_msg_id=top_msg_id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, video_timestamp=video_timestamp, allow_paid_stars=allow_paid_stars), cursor
+
+
+class ReportSpam(TLRequest[bool]):
+    __tl_id__ = 0xcf1592db
+    __tl_name__ = "functions.messages.ReportSpam"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportSpam:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportSpam, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class GetPeerSettings(TLRequest[tl.types.messages.PeerSettings]):
+    __tl_id__ = 0xefd9a6a2
+    __tl_name__ = "functions.messages.GetPeerSettings"
+    __tl_layer__ = 135
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPeerSettings:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPeerSettings, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class Report(TLRequest[tl.base.ReportResult]):
+    __tl_id__ = 0xfc78af9b
+    __tl_name__ = "functions.messages.Report"
+    __tl_layer__ = 189
+
+    __slots__ = ("peer", "id", "option", "message", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int], option: bytes, message: str):
+        self.peer = peer
+        self.id = id
+        self.option = option
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        Bytes.write_to(out, self.option)
+        String.write_to(out, self.message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Report:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        option = Bytes.read(stream)
+        message = String.read(stream)
+        return cls(peer=peer, id=id, option=option, message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Report, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        option, cursor = Bytes.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, id=id, option=option, message=message), cursor
+
+
+class GetChats(TLRequest[tl.base.messages.Chats]):
+    __tl_id__ = 0x49e9528f
+    __tl_name__ = "functions.messages.GetChats"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[int]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += LongVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChats:
+        id = LongVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChats, int]:
+        id, cursor = LongVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetFullChat(TLRequest[tl.types.messages.ChatFull]):
+    __tl_id__ = 0xaeb00b34
+    __tl_name__ = "functions.messages.GetFullChat"
+    __tl_layer__ = 133
+
+    __slots__ = ("chat_id", )
+
+    def __init__(self, *, chat_id: int):
+        self.chat_id = chat_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.chat_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFullChat:
+        chat_id = Long.read(stream)
+        return cls(chat_id=chat_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFullChat, int]:
+        chat_id, cursor = Long.read_from(view, cursor)
+        return cls(chat_id=chat_id), cursor
+
+
+class EditChatTitle(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x73783ffd
+    __tl_name__ = "functions.messages.EditChatTitle"
+    __tl_layer__ = 133
+
+    __slots__ = ("chat_id", "title", )
+
+    def __init__(self, *, chat_id: int, title: str):
+        self.chat_id = chat_id
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.chat_id)
+        String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditChatTitle:
+        chat_id = Long.read(stream)
+        title = String.read(stream)
+        return cls(chat_id=chat_id, title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditChatTitle, int]:
+        chat_id, cursor = Long.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        return cls(chat_id=chat_id, title=title), cursor
+
+
+class EditChatPhoto(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x35ddd674
+    __tl_name__ = "functions.messages.EditChatPhoto"
+    __tl_layer__ = 133
+
+    __slots__ = ("chat_id", "photo", )
+
+    def __init__(self, *, chat_id: int, photo: tl.base.InputChatPhoto):
+        self.chat_id = chat_id
+        self.photo = photo
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.chat_id)
+        self.photo.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditChatPhoto:
+        chat_id = Long.read(stream)
+        photo = TLObject.read(stream)
+        return cls(chat_id=chat_id, photo=photo)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditChatPhoto, int]:
+        chat_id, cursor = Long.read_from(view, cursor)
+        photo, cursor = TLObject.read_from(view, cursor)
+        return cls(chat_id=chat_id, photo=photo), cursor
+
+
+class AddChatUser(TLRequest[tl.types.messages.InvitedUsers]):
+    __tl_id__ = 0xcbc6d107
+    __tl_name__ = "functions.messages.AddChatUser"
+    __tl_layer__ = 177
+
+    __slots__ = ("chat_id", "user_id", "fwd_limit", )
+
+    def __init__(self, *, chat_id: int, user_id: tl.base.InputUser, fwd_limit: int):
+        self.chat_id = chat_id
+        self.user_id = user_id
+        self.fwd_limit = fwd_limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.chat_id)
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.fwd_limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AddChatUser:
+        chat_id = Long.read(stream)
+        user_id = TLObject.read(stream)
+        fwd_limit = Int.read(stream)
+        return cls(chat_id=chat_id, user_id=user_id, fwd_limit=fwd_limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AddChatUser, int]:
+        chat_id, cursor = Long.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        fwd_limit, cursor = Int.read_from(view, cursor)
+        return cls(chat_id=chat_id, user_id=user_id, fwd_limit=fwd_limit), cursor
+
+
+class DeleteChatUser(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xa2185cab
+    __tl_name__ = "functions.messages.DeleteChatUser"
+    __tl_layer__ = 133
+
+    __slots__ = ("revoke_history", "chat_id", "user_id", )
+
+    def __init__(self, *, chat_id: int, user_id: tl.base.InputUser, revoke_history: bool = False):
+        self.revoke_history = revoke_history
+        self.chat_id = chat_id
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.revoke_history: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Long.write(self.chat_id)
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteChatUser:
+        flags1 = Int.read(stream)
+        revoke_history = (flags1 & (1 << 0)) == (1 << 0)
+        chat_id = Long.read(stream)
+        user_id = TLObject.read(stream)
+        return cls(revoke_history=revoke_history, chat_id=chat_id, user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteChatUser, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        revoke_history = (flags1 & (1 << 0)) == (1 << 0)
+        chat_id, cursor = Long.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(revoke_history=revoke_history, chat_id=chat_id, user_id=user_id), cursor
+
+
+class CreateChat(TLRequest[tl.types.messages.InvitedUsers]):
+    __tl_id__ = 0x92ceddd4
+    __tl_name__ = "functions.messages.CreateChat"
+    __tl_layer__ = 177
+
+    __slots__ = ("users", "title", "ttl_period", )
+
+    def __init__(self, *, users: list[tl.base.InputUser], title: str, ttl_period: int | None = None):
+        self.users = users
+        self.title = title
+        self.ttl_period = ttl_period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.ttl_period is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        TLObjectVector.write_to(out, self.users, ctx)
+        String.write_to(out, self.title)
+        if self.ttl_period is not None:
+            out += Int.write(self.ttl_period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateChat:
+        flags1 = Int.read(stream)
+        users = TLObjectVector.read(stream)
+        title = String.read(stream)
+        ttl_period = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(users=users, title=title, ttl_period=ttl_period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateChat, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        ttl_period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(users=users, title=title, ttl_period=ttl_period), cursor
+
+
+class GetDhConfig(TLRequest[tl.base.messages.DhConfig]):
+    __tl_id__ = 0x26cf8950
+    __tl_name__ = "functions.messages.GetDhConfig"
+    __tl_layer__ = 133
+
+    __slots__ = ("version", "random_length", )
+
+    def __init__(self, *, version: int, random_length: int):
+        self.version = version
+        self.random_length = random_length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.version)
+        out += Int.write(self.random_length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDhConfig:
+        version = Int.read(stream)
+        random_length = Int.read(stream)
+        return cls(version=version, random_length=random_length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDhConfig, int]:
+        version, cursor = Int.read_from(view, cursor)
+        random_length, cursor = Int.read_from(view, cursor)
+        return cls(version=version, random_length=random_length), cursor
+
+
+class RequestEncryption(TLRequest[tl.base.EncryptedChat]):
+    __tl_id__ = 0xf64daf43
+    __tl_name__ = "functions.messages.RequestEncryption"
+    __tl_layer__ = 133
+
+    __slots__ = ("user_id", "random_id", "g_a", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, random_id: int, g_a: bytes):
+        self.user_id = user_id
+        self.random_id = random_id
+        self.g_a = g_a
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.random_id)
+        Bytes.write_to(out, self.g_a)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestEncryption:
+        user_id = TLObject.read(stream)
+        random_id = Int.read(stream)
+        g_a = Bytes.read(stream)
+        return cls(user_id=user_id, random_id=random_id, g_a=g_a)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestEncryption, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Int.read_from(view, cursor)
+        g_a, cursor = Bytes.read_from(view, cursor)
+        return cls(user_id=user_id, random_id=random_id, g_a=g_a), cursor
+
+
+class AcceptEncryption(TLRequest[tl.base.EncryptedChat]):
+    __tl_id__ = 0x3dbc0415
+    __tl_name__ = "functions.messages.AcceptEncryption"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "g_b", "key_fingerprint", )
+
+    def __init__(self, *, peer: tl.types.InputEncryptedChat, g_b: bytes, key_fingerprint: int):
+        self.peer = peer
+        self.g_b = g_b
+        self.key_fingerprint = key_fingerprint
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        Bytes.write_to(out, self.g_b)
+        out += Long.write(self.key_fingerprint)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AcceptEncryption:
+        peer = tl.types.InputEncryptedChat.read(stream)
+        g_b = Bytes.read(stream)
+        key_fingerprint = Long.read(stream)
+        return cls(peer=peer, g_b=g_b, key_fingerprint=key_fingerprint)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AcceptEncryption, int]:
+        peer, cursor = tl.types.InputEncryptedChat.read_from(view, cursor)
+        g_b, cursor = Bytes.read_from(view, cursor)
+        key_fingerprint, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, g_b=g_b, key_fingerprint=key_fingerprint), cursor
+
+
+class DiscardEncryption(TLRequest[bool]):
+    __tl_id__ = 0xf393aea0
+    __tl_name__ = "functions.messages.DiscardEncryption"
+    __tl_layer__ = 133
+
+    __slots__ = ("delete_history", "chat_id", )
+
+    def __init__(self, *, chat_id: int, delete_history: bool = False):
+        self.delete_history = delete_history
+        self.chat_id = chat_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.delete_history: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.chat_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DiscardEncryption:
+        flags1 = Int.read(stream)
+        delete_history = (flags1 & (1 << 0)) == (1 << 0)
+        chat_id = Int.read(stream)
+        return cls(delete_history=delete_history, chat_id=chat_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DiscardEncryption, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        delete_history = (flags1 & (1 << 0)) == (1 << 0)
+        chat_id, cursor = Int.read_from(view, cursor)
+        return cls(delete_history=delete_history, chat_id=chat_id), cursor
+
+
+class SetEncryptedTyping(TLRequest[bool]):
+    __tl_id__ = 0x791451ed
+    __tl_name__ = "functions.messages.SetEncryptedTyping"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "typing", )
+
+    def __init__(self, *, peer: tl.types.InputEncryptedChat, typing: bool):
+        self.peer = peer
+        self.typing = typing
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Bool.write(self.typing)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetEncryptedTyping:
+        peer = tl.types.InputEncryptedChat.read(stream)
+        typing = Bool.read(stream)
+        return cls(peer=peer, typing=typing)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetEncryptedTyping, int]:
+        peer, cursor = tl.types.InputEncryptedChat.read_from(view, cursor)
+        typing, cursor = Bool.read_from(view, cursor)
+        return cls(peer=peer, typing=typing), cursor
+
+
+class ReadEncryptedHistory(TLRequest[bool]):
+    __tl_id__ = 0x7f4b690a
+    __tl_name__ = "functions.messages.ReadEncryptedHistory"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "max_date", )
+
+    def __init__(self, *, peer: tl.types.InputEncryptedChat, max_date: int):
+        self.peer = peer
+        self.max_date = max_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.max_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadEncryptedHistory:
+        peer = tl.types.InputEncryptedChat.read(stream)
+        max_date = Int.read(stream)
+        return cls(peer=peer, max_date=max_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadEncryptedHistory, int]:
+        peer, cursor = tl.types.InputEncryptedChat.read_from(view, cursor)
+        max_date, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, max_date=max_date), cursor
+
+
+class SendEncrypted(TLRequest[tl.base.messages.SentEncryptedMessage]):
+    __tl_id__ = 0x44fa7a15
+    __tl_name__ = "functions.messages.SendEncrypted"
+    __tl_layer__ = 133
+
+    __slots__ = ("silent", "peer", "random_id", "data", )
+
+    def __init__(self, *, peer: tl.types.InputEncryptedChat, random_id: int, data: bytes, silent: bool = False):
+        self.silent = silent
+        self.peer = peer
+        self.random_id = random_id
+        self.data = data
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.random_id)
+        Bytes.write_to(out, self.data)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendEncrypted:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 0)) == (1 << 0)
+        peer = tl.types.InputEncryptedChat.read(stream)
+        random_id = Long.read(stream)
+        data = Bytes.read(stream)
+        return cls(silent=silent, peer=peer, random_id=random_id, data=data)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendEncrypted, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = tl.types.InputEncryptedChat.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        data, cursor = Bytes.read_from(view, cursor)
+        return cls(silent=silent, peer=peer, random_id=random_id, data=data), cursor
+
+
+class SendEncryptedFile(TLRequest[tl.base.messages.SentEncryptedMessage]):
+    __tl_id__ = 0x5559481d
+    __tl_name__ = "functions.messages.SendEncryptedFile"
+    __tl_layer__ = 133
+
+    __slots__ = ("silent", "peer", "random_id", "data", "file", )
+
+    def __init__(self, *, peer: tl.types.InputEncryptedChat, random_id: int, data: bytes, file: tl.base.InputEncryptedFile, silent: bool = False):
+        self.silent = silent
+        self.peer = peer
+        self.random_id = random_id
+        self.data = data
+        self.file = file
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.random_id)
+        Bytes.write_to(out, self.data)
+        self.file.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendEncryptedFile:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 0)) == (1 << 0)
+        peer = tl.types.InputEncryptedChat.read(stream)
+        random_id = Long.read(stream)
+        data = Bytes.read(stream)
+        file = TLObject.read(stream)
+        return cls(silent=silent, peer=peer, random_id=random_id, data=data, file=file)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendEncryptedFile, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = tl.types.InputEncryptedChat.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        data, cursor = Bytes.read_from(view, cursor)
+        file, cursor = TLObject.read_from(view, cursor)
+        return cls(silent=silent, peer=peer, random_id=random_id, data=data, file=file), cursor
+
+
+class SendEncryptedService(TLRequest[tl.base.messages.SentEncryptedMessage]):
+    __tl_id__ = 0x32d439a4
+    __tl_name__ = "functions.messages.SendEncryptedService"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "random_id", "data", )
+
+    def __init__(self, *, peer: tl.types.InputEncryptedChat, random_id: int, data: bytes):
+        self.peer = peer
+        self.random_id = random_id
+        self.data = data
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.random_id)
+        Bytes.write_to(out, self.data)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendEncryptedService:
+        peer = tl.types.InputEncryptedChat.read(stream)
+        random_id = Long.read(stream)
+        data = Bytes.read(stream)
+        return cls(peer=peer, random_id=random_id, data=data)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendEncryptedService, int]:
+        peer, cursor = tl.types.InputEncryptedChat.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        data, cursor = Bytes.read_from(view, cursor)
+        return cls(peer=peer, random_id=random_id, data=data), cursor
+
+
+class ReceivedQueue(TLRequest[list[int]]):
+    __tl_id__ = 0x55a5bb66
+    __tl_name__ = "functions.messages.ReceivedQueue"
+    __tl_layer__ = 133
+
+    __slots__ = ("max_qts", )
+
+    def __init__(self, *, max_qts: int):
+        self.max_qts = max_qts
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.max_qts)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReceivedQueue:
+        max_qts = Int.read(stream)
+        return cls(max_qts=max_qts)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReceivedQueue, int]:
+        max_qts, cursor = Int.read_from(view, cursor)
+        return cls(max_qts=max_qts), cursor
+
+
+class ReportEncryptedSpam(TLRequest[bool]):
+    __tl_id__ = 0x4b0c8c0f
+    __tl_name__ = "functions.messages.ReportEncryptedSpam"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.types.InputEncryptedChat):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportEncryptedSpam:
+        peer = tl.types.InputEncryptedChat.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportEncryptedSpam, int]:
+        peer, cursor = tl.types.InputEncryptedChat.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class ReadMessageContents(TLRequest[tl.types.messages.AffectedMessages]):
+    __tl_id__ = 0x36a73f77
+    __tl_name__ = "functions.messages.ReadMessageContents"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[int]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadMessageContents:
+        id = IntVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadMessageContents, int]:
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetStickers(TLRequest[tl.base.messages.Stickers]):
+    __tl_id__ = 0xd5a5d3a1
+    __tl_name__ = "functions.messages.GetStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("emoticon", "hash", )
+
+    def __init__(self, *, emoticon: str, hash: int):
+        self.emoticon = emoticon
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.emoticon)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStickers:
+        emoticon = String.read(stream)
+        hash = Long.read(stream)
+        return cls(emoticon=emoticon, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStickers, int]:
+        emoticon, cursor = String.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(emoticon=emoticon, hash=hash), cursor
+
+
+class GetAllStickers(TLRequest[tl.base.messages.AllStickers]):
+    __tl_id__ = 0xb8a0a1a8
+    __tl_name__ = "functions.messages.GetAllStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAllStickers:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAllStickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetWebPagePreview(TLRequest[tl.types.messages.WebPagePreview]):
+    __tl_id__ = 0x570d6f6f
+    __tl_name__ = "functions.messages.GetWebPagePreview"
+    __tl_layer__ = 197
+
+    __slots__ = ("message", "entities", )
+
+    def __init__(self, *, message: str, entities: list[tl.base.MessageEntity] | None = None):
+        self.message = message
+        self.entities = entities
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.entities: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        String.write_to(out, self.message)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetWebPagePreview:
+        flags1 = Int.read(stream)
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(message=message, entities=entities)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetWebPagePreview, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(message=message, entities=entities), cursor
+
+
+class ExportChatInvite(TLRequest[tl.base.ExportedChatInvite]):
+    __tl_id__ = 0xa455de90
+    __tl_name__ = "functions.messages.ExportChatInvite"
+    __tl_layer__ = 186
+
+    __slots__ = ("legacy_revoke_permanent", "request_needed", "peer", "expire_date", "usage_limit", "title", "subscription_pricing", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, legacy_revoke_permanent: bool = False, request_needed: bool = False, expire_date: int | None = None, usage_limit: int | None = None, title: str | None = None, subscription_pricing: tl.types.StarsSubscriptionPricing | None = None):
+        self.legacy_revoke_permanent = legacy_revoke_permanent
+        self.request_needed = request_needed
+        self.peer = peer
+        self.expire_date = expire_date
+        self.usage_limit = usage_limit
+        self.title = title
+        self.subscription_pricing = subscription_pricing
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.legacy_revoke_permanent: flags1 |= (1 << 2)
+        if self.request_needed: flags1 |= (1 << 3)
+        if self.expire_date is not None: flags1 |= (1 << 0)
+        if self.usage_limit is not None: flags1 |= (1 << 1)
+        if self.title is not None: flags1 |= (1 << 4)
+        if self.subscription_pricing is not None: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.expire_date is not None:
+            out += Int.write(self.expire_date)
+        if self.usage_limit is not None:
+            out += Int.write(self.usage_limit)
+        if self.title is not None:
+            String.write_to(out, self.title)
+        if self.subscription_pricing is not None:
+            self.subscription_pricing.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportChatInvite:
+        flags1 = Int.read(stream)
+        legacy_revoke_permanent = (flags1 & (1 << 2)) == (1 << 2)
+        request_needed = (flags1 & (1 << 3)) == (1 << 3)
+        peer = TLObject.read(stream)
+        expire_date = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        usage_limit = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        title = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        subscription_pricing = tl.types.StarsSubscriptionPricing.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        return cls(legacy_revoke_permanent=legacy_revoke_permanent, request_needed=request_needed, peer=peer, expire_date=expire_date, usage_limit=usage_limit, title=title, subscription_pricing=subscription_pricing)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportChatInvite, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        legacy_revoke_permanent = (flags1 & (1 << 2)) == (1 << 2)
+        request_needed = (flags1 & (1 << 3)) == (1 << 3)
+        peer, cursor = TLObject.read_from(view, cursor)
+        expire_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        usage_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        subscription_pricing, cursor = tl.types.StarsSubscriptionPricing.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        return cls(legacy_revoke_permanent=legacy_revoke_permanent, request_needed=request_needed, peer=peer, expire_date=expire_date, usage_limit=usage_limit, title=title, subscription_pricing=subscription_pricing), cursor
+
+
+class CheckChatInvite(TLRequest[tl.base.ChatInvite]):
+    __tl_id__ = 0x3eadb1bb
+    __tl_name__ = "functions.messages.CheckChatInvite"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: str):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckChatInvite:
+        hash = String.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckChatInvite, int]:
+        hash, cursor = String.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class ImportChatInvite(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x6c50051c
+    __tl_name__ = "functions.messages.ImportChatInvite"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: str):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ImportChatInvite:
+        hash = String.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ImportChatInvite, int]:
+        hash, cursor = String.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetStickerSet(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0xc8a0ec74
+    __tl_name__ = "functions.messages.GetStickerSet"
+    __tl_layer__ = 135
+
+    __slots__ = ("stickerset", "hash", )
+
+    def __init__(self, *, stickerset: tl.base.InputStickerSet, hash: int):
+        self.stickerset = stickerset
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stickerset.write_to(out, ctx)
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStickerSet:
+        stickerset = TLObject.read(stream)
+        hash = Int.read(stream)
+        return cls(stickerset=stickerset, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStickerSet, int]:
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(stickerset=stickerset, hash=hash), cursor
+
+
+class InstallStickerSet(TLRequest[tl.base.messages.StickerSetInstallResult]):
+    __tl_id__ = 0xc78fe460
+    __tl_name__ = "functions.messages.InstallStickerSet"
+    __tl_layer__ = 133
+
+    __slots__ = ("stickerset", "archived", )
+
+    def __init__(self, *, stickerset: tl.base.InputStickerSet, archived: bool):
+        self.stickerset = stickerset
+        self.archived = archived
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stickerset.write_to(out, ctx)
+        out += Bool.write(self.archived)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InstallStickerSet:
+        stickerset = TLObject.read(stream)
+        archived = Bool.read(stream)
+        return cls(stickerset=stickerset, archived=archived)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InstallStickerSet, int]:
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        archived, cursor = Bool.read_from(view, cursor)
+        return cls(stickerset=stickerset, archived=archived), cursor
+
+
+class UninstallStickerSet(TLRequest[bool]):
+    __tl_id__ = 0xf96e55de
+    __tl_name__ = "functions.messages.UninstallStickerSet"
+    __tl_layer__ = 133
+
+    __slots__ = ("stickerset", )
+
+    def __init__(self, *, stickerset: tl.base.InputStickerSet):
+        self.stickerset = stickerset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stickerset.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UninstallStickerSet:
+        stickerset = TLObject.read(stream)
+        return cls(stickerset=stickerset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UninstallStickerSet, int]:
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        return cls(stickerset=stickerset), cursor
+
+
+class StartBot(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xe6df7378
+    __tl_name__ = "functions.messages.StartBot"
+    __tl_layer__ = 133
+
+    __slots__ = ("bot", "peer", "random_id", "start_param", )
+
+    def __init__(self, *, bot: tl.base.InputUser, peer: tl.base.InputPeer, random_id: int, start_param: str):
+        self.bot = bot
+        self.peer = peer
+        self.random_id = random_id
+        self.start_param = start_param
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.random_id)
+        String.write_to(out, self.start_param)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StartBot:
+        bot = TLObject.read(stream)
+        peer = TLObject.read(stream)
+        random_id = Long.read(stream)
+        start_param = String.read(stream)
+        return cls(bot=bot, peer=peer, random_id=random_id, start_param=start_param)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StartBot, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        start_param, cursor = String.read_from(view, cursor)
+        return cls(bot=bot, peer=peer, random_id=random_id, start_param=start_param), cursor
+
+
+class GetMessagesViews(TLRequest[tl.types.messages.MessageViews]):
+    __tl_id__ = 0x5784d3e1
+    __tl_name__ = "functions.messages.GetMessagesViews"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "id", "increment", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int], increment: bool):
+        self.peer = peer
+        self.id = id
+        self.increment = increment
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        out += Bool.write(self.increment)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessagesViews:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        increment = Bool.read(stream)
+        return cls(peer=peer, id=id, increment=increment)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessagesViews, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        increment, cursor = Bool.read_from(view, cursor)
+        return cls(peer=peer, id=id, increment=increment), cursor
+
+
+class EditChatAdmin(TLRequest[bool]):
+    __tl_id__ = 0xa85bd1c2
+    __tl_name__ = "functions.messages.EditChatAdmin"
+    __tl_layer__ = 133
+
+    __slots__ = ("chat_id", "user_id", "is_admin", )
+
+    def __init__(self, *, chat_id: int, user_id: tl.base.InputUser, is_admin: bool):
+        self.chat_id = chat_id
+        self.user_id = user_id
+        self.is_admin = is_admin
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.chat_id)
+        self.user_id.write_to(out, ctx)
+        out += Bool.write(self.is_admin)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditChatAdmin:
+        chat_id = Long.read(stream)
+        user_id = TLObject.read(stream)
+        is_admin = Bool.read(stream)
+        return cls(chat_id=chat_id, user_id=user_id, is_admin=is_admin)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditChatAdmin, int]:
+        chat_id, cursor = Long.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        is_admin, cursor = Bool.read_from(view, cursor)
+        return cls(chat_id=chat_id, user_id=user_id, is_admin=is_admin), cursor
+
+
+class MigrateChat(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xa2875319
+    __tl_name__ = "functions.messages.MigrateChat"
+    __tl_layer__ = 133
+
+    __slots__ = ("chat_id", )
+
+    def __init__(self, *, chat_id: int):
+        self.chat_id = chat_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.chat_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MigrateChat:
+        chat_id = Long.read(stream)
+        return cls(chat_id=chat_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MigrateChat, int]:
+        chat_id, cursor = Long.read_from(view, cursor)
+        return cls(chat_id=chat_id), cursor
+
+
+class SearchGlobal(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x4bc6589a
+    __tl_name__ = "functions.messages.SearchGlobal"
+    __tl_layer__ = 133
+
+    __slots__ = ("broadcasts_only", "groups_only", "users_only", "folder_id", "q", "filter", "min_date", "max_date", "offset_rate", "offset_peer", "offset_id", "limit", )
+
+    def __init__(self, *, q: str, filter: tl.base.MessagesFilter, min_date: int, max_date: int, offset_rate: int, offset_peer: tl.base.InputPeer, offset_id: int, limit: int, broadcasts_only: bool = False, groups_only: bool = False, users_only: bool = False, folder_id: int | None = None):
+        self.broadcasts_only = broadcasts_only
+        self.groups_only = groups_only
+        self.users_only = users_only
+        self.folder_id = folder_id
+        self.q = q
+        self.filter = filter
+        self.min_date = min_date
+        self.max_date = max_date
+        self.offset_rate = offset_rate
+        self.offset_peer = offset_peer
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.broadcasts_only: flags1 |= (1 << 1)
+        if self.groups_only: flags1 |= (1 << 2)
+        if self.users_only: flags1 |= (1 << 3)
+        if self.folder_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.folder_id is not None:
+            out += Int.write(self.folder_id)
+        String.write_to(out, self.q)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.min_date)
+        out += Int.write(self.max_date)
+        out += Int.write(self.offset_rate)
+        self.offset_peer.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchGlobal:
+        flags1 = Int.read(stream)
+        broadcasts_only = (flags1 & (1 << 1)) == (1 << 1)
+        groups_only = (flags1 & (1 << 2)) == (1 << 2)
+        users_only = (flags1 & (1 << 3)) == (1 << 3)
+        folder_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        q = String.read(stream)
+        filter = TLObject.read(stream)
+        min_date = Int.read(stream)
+        max_date = Int.read(stream)
+        offset_rate = Int.read(stream)
+        offset_peer = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(broadcasts_only=broadcasts_only, groups_only=groups_only, users_only=users_only, folder_id=folder_id, q=q, filter=filter, min_date=min_date, max_date=max_date, offset_rate=offset_rate, offset_peer=offset_peer, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchGlobal, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        broadcasts_only = (flags1 & (1 << 1)) == (1 << 1)
+        groups_only = (flags1 & (1 << 2)) == (1 << 2)
+        users_only = (flags1 & (1 << 3)) == (1 << 3)
+        folder_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        q, cursor = String.read_from(view, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        min_date, cursor = Int.read_from(view, cursor)
+        max_date, cursor = Int.read_from(view, cursor)
+        offset_rate, cursor = Int.read_from(view, cursor)
+        offset_peer, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(broadcasts_only=broadcasts_only, groups_only=groups_only, users_only=users_only, folder_id=folder_id, q=q, filter=filter, min_date=min_date, max_date=max_date, offset_rate=offset_rate, offset_peer=offset_peer, offset_id=offset_id, limit=limit), cursor
+
+
+class ReorderStickerSets(TLRequest[bool]):
+    __tl_id__ = 0x78337739
+    __tl_name__ = "functions.messages.ReorderStickerSets"
+    __tl_layer__ = 133
+
+    __slots__ = ("masks", "emojis", "order", )
+
+    def __init__(self, *, order: list[int], masks: bool = False, emojis: bool = False):
+        self.masks = masks
+        self.emojis = emojis
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.masks: flags1 |= (1 << 0)
+        if self.emojis: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += LongVector.write(self.order)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReorderStickerSets:
+        flags1 = Int.read(stream)
+        masks = (flags1 & (1 << 0)) == (1 << 0)
+        emojis = (flags1 & (1 << 1)) == (1 << 1)
+        order = LongVector.read(stream)
+        return cls(masks=masks, emojis=emojis, order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReorderStickerSets, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        masks = (flags1 & (1 << 0)) == (1 << 0)
+        emojis = (flags1 & (1 << 1)) == (1 << 1)
+        order, cursor = LongVector.read_from(view, cursor)
+        return cls(masks=masks, emojis=emojis, order=order), cursor
+
+
+class GetDocumentByHash(TLRequest[tl.base.Document]):
+    __tl_id__ = 0xb1f2061f
+    __tl_name__ = "functions.messages.GetDocumentByHash"
+    __tl_layer__ = 143
+
+    __slots__ = ("sha256", "size", "mime_type", )
+
+    def __init__(self, *, sha256: bytes, size: int, mime_type: str):
+        self.sha256 = sha256
+        self.size = size
+        self.mime_type = mime_type
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.sha256)
+        out += Long.write(self.size)
+        String.write_to(out, self.mime_type)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDocumentByHash:
+        sha256 = Bytes.read(stream)
+        size = Long.read(stream)
+        mime_type = String.read(stream)
+        return cls(sha256=sha256, size=size, mime_type=mime_type)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDocumentByHash, int]:
+        sha256, cursor = Bytes.read_from(view, cursor)
+        size, cursor = Long.read_from(view, cursor)
+        mime_type, cursor = String.read_from(view, cursor)
+        return cls(sha256=sha256, size=size, mime_type=mime_type), cursor
+
+
+class GetSavedGifs(TLRequest[tl.base.messages.SavedGifs]):
+    __tl_id__ = 0x5cf09635
+    __tl_name__ = "functions.messages.GetSavedGifs"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSavedGifs:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSavedGifs, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class SaveGif(TLRequest[bool]):
+    __tl_id__ = 0x327a30cb
+    __tl_name__ = "functions.messages.SaveGif"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", "unsave", )
+
+    def __init__(self, *, id: tl.base.InputDocument, unsave: bool):
+        self.id = id
+        self.unsave = unsave
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+        out += Bool.write(self.unsave)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveGif:
+        id = TLObject.read(stream)
+        unsave = Bool.read(stream)
+        return cls(id=id, unsave=unsave)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveGif, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        unsave, cursor = Bool.read_from(view, cursor)
+        return cls(id=id, unsave=unsave), cursor
+
+
+class GetInlineBotResults(TLRequest[tl.base.messages.BotResults]):
+    __tl_id__ = 0x514e999d
+    __tl_name__ = "functions.messages.GetInlineBotResults"
+    __tl_layer__ = 133
+
+    __slots__ = ("bot", "peer", "geo_point", "query", "offset", )
+
+    def __init__(self, *, bot: tl.base.InputUser, peer: tl.base.InputPeer, query: str, offset: str, geo_point: tl.base.InputGeoPoint | None = None):
+        self.bot = bot
+        self.peer = peer
+        self.geo_point = geo_point
+        self.query = query
+        self.offset = offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.geo_point is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.bot.write_to(out, ctx)
+        self.peer.write_to(out, ctx)
+        if self.geo_point is not None:
+            self.geo_point.write_to(out, ctx)
+        String.write_to(out, self.query)
+        String.write_to(out, self.offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetInlineBotResults:
+        flags1 = Int.read(stream)
+        bot = TLObject.read(stream)
+        peer = TLObject.read(stream)
+        geo_point = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        query = String.read(stream)
+        offset = String.read(stream)
+        return cls(bot=bot, peer=peer, geo_point=geo_point, query=query, offset=offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetInlineBotResults, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        geo_point, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        query, cursor = String.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        return cls(bot=bot, peer=peer, geo_point=geo_point, query=query, offset=offset), cursor
+
+
+class SetInlineBotResults(TLRequest[bool]):
+    __tl_id__ = 0xbb12a419
+    __tl_name__ = "functions.messages.SetInlineBotResults"
+    __tl_layer__ = 155
+
+    __slots__ = ("gallery", "private", "query_id", "results", "cache_time", "next_offset", "switch_pm", "switch_webview", )
+
+    def __init__(self, *, query_id: int, results: list[tl.base.InputBotInlineResult], cache_time: int, gallery: bool = False, private: bool = False, next_offset: str | None = None, switch_pm: tl.types.InlineBotSwitchPM | None = None, switch_webview: tl.types.InlineBotWebView | None = None):
+        self.gallery = gallery
+        self.private = private
+        self.query_id = query_id
+        self.results = results
+        self.cache_time = cache_time
+        self.next_offset = next_offset
+        self.switch_pm = switch_pm
+        self.switch_webview = switch_webview
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.gallery: flags1 |= (1 << 0)
+        if self.private: flags1 |= (1 << 1)
+        if self.next_offset is not None: flags1 |= (1 << 2)
+        if self.switch_pm is not None: flags1 |= (1 << 3)
+        if self.switch_webview is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        out += Long.write(self.query_id)
+        TLObjectVector.write_to(out, self.results, ctx)
+        out += Int.write(self.cache_time)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        if self.switch_pm is not None:
+            self.switch_pm.write_to(out, ctx)
+        if self.switch_webview is not None:
+            self.switch_webview.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetInlineBotResults:
+        flags1 = Int.read(stream)
+        gallery = (flags1 & (1 << 0)) == (1 << 0)
+        private = (flags1 & (1 << 1)) == (1 << 1)
+        query_id = Long.read(stream)
+        results = TLObjectVector.read(stream)
+        cache_time = Int.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        switch_pm = tl.types.InlineBotSwitchPM.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        switch_webview = tl.types.InlineBotWebView.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(gallery=gallery, private=private, query_id=query_id, results=results, cache_time=cache_time, next_offset=next_offset, switch_pm=switch_pm, switch_webview=switch_webview)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetInlineBotResults, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        gallery = (flags1 & (1 << 0)) == (1 << 0)
+        private = (flags1 & (1 << 1)) == (1 << 1)
+        query_id, cursor = Long.read_from(view, cursor)
+        results, cursor = TLObjectVector.read_from(view, cursor)
+        cache_time, cursor = Int.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        switch_pm, cursor = tl.types.InlineBotSwitchPM.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        switch_webview, cursor = tl.types.InlineBotWebView.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(gallery=gallery, private=private, query_id=query_id, results=results, cache_time=cache_time, next_offset=next_offset, switch_pm=switch_pm, switch_webview=switch_webview), cursor
+
+
+class SendInlineBotResult(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xc0cf7646
+    __tl_name__ = "functions.messages.SendInlineBotResult"
+    __tl_layer__ = 200
+
+    __slots__ = ("silent", "background", "clear_draft", "hide_via", "peer", "reply_to", "random_id", "query_id", "id", "schedule_date", "send_as", "quick_reply_shortcut", "allow_paid_stars", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: int, query_id: int, id: str, silent: bool = False, background: bool = False, clear_draft: bool = False, hide_via: bool = False, reply_to: tl.base.InputReplyTo | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None, allow_paid_stars: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.hide_via = hide_via
+        self.peer = peer
+        self.reply_to = reply_to
+        self.random_id = random_id
+        self.query_id = query_id
+        self.id = id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.allow_paid_stars = allow_paid_stars
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.hide_via: flags1 |= (1 << 11)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        if self.allow_paid_stars is not None: flags1 |= (1 << 21)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        out += Long.write(self.random_id)
+        out += Long.write(self.query_id)
+        String.write_to(out, self.id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+        if self.allow_paid_stars is not None:
+            out += Long.write(self.allow_paid_stars)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendInlineBotResult:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        random_id = Long.read(stream)
+        query_id = Long.read(stream)
+        id = String.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        allow_paid_stars = Long.read(stream) if (flags1 & (1 << 21)) == (1 << 21) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to=reply_to, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, allow_paid_stars=allow_paid_stars)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendInlineBotResult, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        id, cursor = String.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        allow_paid_stars, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 21)) == (1 << 21) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to=reply_to, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, allow_paid_stars=allow_paid_stars), cursor
+
+
+class GetMessageEditData(TLRequest[tl.types.messages.MessageEditData]):
+    __tl_id__ = 0xfda68d36
+    __tl_name__ = "functions.messages.GetMessageEditData"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessageEditData:
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessageEditData, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class EditMessage(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xdfd14005
+    __tl_name__ = "functions.messages.EditMessage"
+    __tl_layer__ = 176
+
+    __slots__ = ("no_webpage", "invert_media", "peer", "id", "message", "media", "reply_markup", "entities", "schedule_date", "quick_reply_shortcut_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, no_webpage: bool = False, invert_media: bool = False, message: str | None = None, media: tl.base.InputMedia | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, quick_reply_shortcut_id: int | None = None):
+        self.no_webpage = no_webpage
+        self.invert_media = invert_media
+        self.peer = peer
+        self.id = id
+        self.message = message
+        self.media = media
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.quick_reply_shortcut_id = quick_reply_shortcut_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.message is not None: flags1 |= (1 << 11)
+        if self.media is not None: flags1 |= (1 << 14)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 15)
+        if self.quick_reply_shortcut_id is not None: flags1 |= (1 << 17)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        if self.message is not None:
+            String.write_to(out, self.message)
+        if self.media is not None:
+            self.media.write_to(out, ctx)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.quick_reply_shortcut_id is not None:
+            out += Int.write(self.quick_reply_shortcut_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditMessage:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        message = String.read(stream) if (flags1 & (1 << 11)) == (1 << 11) else None
+        media = TLObject.read(stream) if (flags1 & (1 << 14)) == (1 << 14) else None
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 15)) == (1 << 15) else None
+        quick_reply_shortcut_id = Int.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        return cls(no_webpage=no_webpage, invert_media=invert_media, peer=peer, id=id, message=message, media=media, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, quick_reply_shortcut_id=quick_reply_shortcut_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditMessage, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor) if (flags1 & (1 << 11)) == (1 << 11) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 14)) == (1 << 14) else (None, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 15)) == (1 << 15) else (None, cursor)
+        quick_reply_shortcut_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        return cls(no_webpage=no_webpage, invert_media=invert_media, peer=peer, id=id, message=message, media=media, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, quick_reply_shortcut_id=quick_reply_shortcut_id), cursor
+
+
+class EditInlineBotMessage(TLRequest[bool]):
+    __tl_id__ = 0x83557dba
+    __tl_name__ = "functions.messages.EditInlineBotMessage"
+    __tl_layer__ = 133
+
+    __slots__ = ("no_webpage", "invert_media", "id", "message", "media", "reply_markup", "entities", )
+
+    def __init__(self, *, id: tl.base.InputBotInlineMessageID, no_webpage: bool = False, invert_media: bool = False, message: str | None = None, media: tl.base.InputMedia | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None):
+        self.no_webpage = no_webpage
+        self.invert_media = invert_media
+        self.id = id
+        self.message = message
+        self.media = media
+        self.reply_markup = reply_markup
+        self.entities = entities
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.message is not None: flags1 |= (1 << 11)
+        if self.media is not None: flags1 |= (1 << 14)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        self.id.write_to(out, ctx)
+        if self.message is not None:
+            String.write_to(out, self.message)
+        if self.media is not None:
+            self.media.write_to(out, ctx)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditInlineBotMessage:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        id = TLObject.read(stream)
+        message = String.read(stream) if (flags1 & (1 << 11)) == (1 << 11) else None
+        media = TLObject.read(stream) if (flags1 & (1 << 14)) == (1 << 14) else None
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(no_webpage=no_webpage, invert_media=invert_media, id=id, message=message, media=media, reply_markup=reply_markup, entities=entities)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditInlineBotMessage, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        id, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor) if (flags1 & (1 << 11)) == (1 << 11) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 14)) == (1 << 14) else (None, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(no_webpage=no_webpage, invert_media=invert_media, id=id, message=message, media=media, reply_markup=reply_markup, entities=entities), cursor
+
+
+class GetBotCallbackAnswer(TLRequest[tl.types.messages.BotCallbackAnswer]):
+    __tl_id__ = 0x9342ca07
+    __tl_name__ = "functions.messages.GetBotCallbackAnswer"
+    __tl_layer__ = 133
+
+    __slots__ = ("game", "peer", "msg_id", "data", "password", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, game: bool = False, data: bytes | None = None, password: tl.base.InputCheckPasswordSRP | None = None):
+        self.game = game
+        self.peer = peer
+        self.msg_id = msg_id
+        self.data = data
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.game: flags1 |= (1 << 1)
+        if self.data is not None: flags1 |= (1 << 0)
+        if self.password is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        if self.data is not None:
+            Bytes.write_to(out, self.data)
+        if self.password is not None:
+            self.password.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBotCallbackAnswer:
+        flags1 = Int.read(stream)
+        game = (flags1 & (1 << 1)) == (1 << 1)
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        data = Bytes.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        password = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(game=game, peer=peer, msg_id=msg_id, data=data, password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBotCallbackAnswer, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        game = (flags1 & (1 << 1)) == (1 << 1)
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        data, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        password, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(game=game, peer=peer, msg_id=msg_id, data=data, password=password), cursor
+
+
+class SetBotCallbackAnswer(TLRequest[bool]):
+    __tl_id__ = 0xd58f130a
+    __tl_name__ = "functions.messages.SetBotCallbackAnswer"
+    __tl_layer__ = 133
+
+    __slots__ = ("alert", "query_id", "message", "url", "cache_time", )
+
+    def __init__(self, *, query_id: int, cache_time: int, alert: bool = False, message: str | None = None, url: str | None = None):
+        self.alert = alert
+        self.query_id = query_id
+        self.message = message
+        self.url = url
+        self.cache_time = cache_time
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.alert: flags1 |= (1 << 1)
+        if self.message is not None: flags1 |= (1 << 0)
+        if self.url is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Long.write(self.query_id)
+        if self.message is not None:
+            String.write_to(out, self.message)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        out += Int.write(self.cache_time)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotCallbackAnswer:
+        flags1 = Int.read(stream)
+        alert = (flags1 & (1 << 1)) == (1 << 1)
+        query_id = Long.read(stream)
+        message = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        url = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        cache_time = Int.read(stream)
+        return cls(alert=alert, query_id=query_id, message=message, url=url, cache_time=cache_time)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotCallbackAnswer, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        alert = (flags1 & (1 << 1)) == (1 << 1)
+        query_id, cursor = Long.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        cache_time, cursor = Int.read_from(view, cursor)
+        return cls(alert=alert, query_id=query_id, message=message, url=url, cache_time=cache_time), cursor
+
+
+class GetPeerDialogs(TLRequest[tl.types.messages.PeerDialogs]):
+    __tl_id__ = 0xe470bcfd
+    __tl_name__ = "functions.messages.GetPeerDialogs"
+    __tl_layer__ = 133
+
+    __slots__ = ("peers", )
+
+    def __init__(self, *, peers: list[tl.base.InputDialogPeer]):
+        self.peers = peers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.peers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPeerDialogs:
+        peers = TLObjectVector.read(stream)
+        return cls(peers=peers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPeerDialogs, int]:
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peers=peers), cursor
+
+
+class SaveDraft(TLRequest[bool]):
+    __tl_id__ = 0xd372c5ce
+    __tl_name__ = "functions.messages.SaveDraft"
+    __tl_layer__ = 182
+
+    __slots__ = ("no_webpage", "invert_media", "reply_to", "peer", "message", "entities", "media", "effect", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, no_webpage: bool = False, invert_media: bool = False, reply_to: tl.base.InputReplyTo | None = None, entities: list[tl.base.MessageEntity] | None = None, media: tl.base.InputMedia | None = None, effect: int | None = None):
+        self.no_webpage = no_webpage
+        self.invert_media = invert_media
+        self.reply_to = reply_to
+        self.peer = peer
+        self.message = message
+        self.entities = entities
+        self.media = media
+        self.effect = effect
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.invert_media: flags1 |= (1 << 6)
+        if self.reply_to is not None: flags1 |= (1 << 4)
+        if self.entities: flags1 |= (1 << 3)
+        if self.media is not None: flags1 |= (1 << 5)
+        if self.effect is not None: flags1 |= (1 << 7)
+        out += Int.write(flags1)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.message)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.media is not None:
+            self.media.write_to(out, ctx)
+        if self.effect is not None:
+            out += Long.write(self.effect)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveDraft:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        invert_media = (flags1 & (1 << 6)) == (1 << 6)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        peer = TLObject.read(stream)
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        media = TLObject.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        effect = Long.read(stream) if (flags1 & (1 << 7)) == (1 << 7) else None
+        return cls(no_webpage=no_webpage, invert_media=invert_media, reply_to=reply_to, peer=peer, message=message, entities=entities, media=media, effect=effect)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveDraft, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        invert_media = (flags1 & (1 << 6)) == (1 << 6)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        effect, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 7)) == (1 << 7) else (None, cursor)
+        return cls(no_webpage=no_webpage, invert_media=invert_media, reply_to=reply_to, peer=peer, message=message, entities=entities, media=media, effect=effect), cursor
+
+
+class GetAllDrafts(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x6a3f8d65
+    __tl_name__ = "functions.messages.GetAllDrafts"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAllDrafts:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAllDrafts, int]:
+        return cls(), cursor
+
+
+class GetFeaturedStickers(TLRequest[tl.base.messages.FeaturedStickers]):
+    __tl_id__ = 0x64780b14
+    __tl_name__ = "functions.messages.GetFeaturedStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFeaturedStickers:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFeaturedStickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class ReadFeaturedStickers(TLRequest[bool]):
+    __tl_id__ = 0x5b118126
+    __tl_name__ = "functions.messages.ReadFeaturedStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[int]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += LongVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadFeaturedStickers:
+        id = LongVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadFeaturedStickers, int]:
+        id, cursor = LongVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetRecentStickers(TLRequest[tl.base.messages.RecentStickers]):
+    __tl_id__ = 0x9da9403b
+    __tl_name__ = "functions.messages.GetRecentStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("attached", "hash", )
+
+    def __init__(self, *, hash: int, attached: bool = False):
+        self.attached = attached
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.attached: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetRecentStickers:
+        flags1 = Int.read(stream)
+        attached = (flags1 & (1 << 0)) == (1 << 0)
+        hash = Long.read(stream)
+        return cls(attached=attached, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetRecentStickers, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        attached = (flags1 & (1 << 0)) == (1 << 0)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(attached=attached, hash=hash), cursor
+
+
+class SaveRecentSticker(TLRequest[bool]):
+    __tl_id__ = 0x392718f8
+    __tl_name__ = "functions.messages.SaveRecentSticker"
+    __tl_layer__ = 133
+
+    __slots__ = ("attached", "id", "unsave", )
+
+    def __init__(self, *, id: tl.base.InputDocument, unsave: bool, attached: bool = False):
+        self.attached = attached
+        self.id = id
+        self.unsave = unsave
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.attached: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.id.write_to(out, ctx)
+        out += Bool.write(self.unsave)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveRecentSticker:
+        flags1 = Int.read(stream)
+        attached = (flags1 & (1 << 0)) == (1 << 0)
+        id = TLObject.read(stream)
+        unsave = Bool.read(stream)
+        return cls(attached=attached, id=id, unsave=unsave)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveRecentSticker, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        attached = (flags1 & (1 << 0)) == (1 << 0)
+        id, cursor = TLObject.read_from(view, cursor)
+        unsave, cursor = Bool.read_from(view, cursor)
+        return cls(attached=attached, id=id, unsave=unsave), cursor
+
+
+class ClearRecentStickers(TLRequest[bool]):
+    __tl_id__ = 0x8999602d
+    __tl_name__ = "functions.messages.ClearRecentStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("attached", )
+
+    def __init__(self, *, attached: bool = False):
+        self.attached = attached
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.attached: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClearRecentStickers:
+        flags1 = Int.read(stream)
+        attached = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(attached=attached)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClearRecentStickers, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        attached = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(attached=attached), cursor
+
+
+class GetArchivedStickers(TLRequest[tl.types.messages.ArchivedStickers]):
+    __tl_id__ = 0x57f17692
+    __tl_name__ = "functions.messages.GetArchivedStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("masks", "emojis", "offset_id", "limit", )
+
+    def __init__(self, *, offset_id: int, limit: int, masks: bool = False, emojis: bool = False):
+        self.masks = masks
+        self.emojis = emojis
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.masks: flags1 |= (1 << 0)
+        if self.emojis: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Long.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetArchivedStickers:
+        flags1 = Int.read(stream)
+        masks = (flags1 & (1 << 0)) == (1 << 0)
+        emojis = (flags1 & (1 << 1)) == (1 << 1)
+        offset_id = Long.read(stream)
+        limit = Int.read(stream)
+        return cls(masks=masks, emojis=emojis, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetArchivedStickers, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        masks = (flags1 & (1 << 0)) == (1 << 0)
+        emojis = (flags1 & (1 << 1)) == (1 << 1)
+        offset_id, cursor = Long.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(masks=masks, emojis=emojis, offset_id=offset_id, limit=limit), cursor
+
+
+class GetMaskStickers(TLRequest[tl.base.messages.AllStickers]):
+    __tl_id__ = 0x640f82b8
+    __tl_name__ = "functions.messages.GetMaskStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMaskStickers:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMaskStickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetAttachedStickers(TLRequest[list[tl.base.StickerSetCovered]]):
+    __tl_id__ = 0xcc5b67cc
+    __tl_name__ = "functions.messages.GetAttachedStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("media", )
+
+    def __init__(self, *, media: tl.base.InputStickeredMedia):
+        self.media = media
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.media.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAttachedStickers:
+        media = TLObject.read(stream)
+        return cls(media=media)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAttachedStickers, int]:
+        media, cursor = TLObject.read_from(view, cursor)
+        return cls(media=media), cursor
+
+
+class SetGameScore(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x8ef8ecc0
+    __tl_name__ = "functions.messages.SetGameScore"
+    __tl_layer__ = 133
+
+    __slots__ = ("edit_message", "force", "peer", "id", "user_id", "score", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, user_id: tl.base.InputUser, score: int, edit_message: bool = False, force: bool = False):
+        self.edit_message = edit_message
+        self.force = force
+        self.peer = peer
+        self.id = id
+        self.user_id = user_id
+        self.score = score
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.edit_message: flags1 |= (1 << 0)
+        if self.force: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.score)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetGameScore:
+        flags1 = Int.read(stream)
+        edit_message = (flags1 & (1 << 0)) == (1 << 0)
+        force = (flags1 & (1 << 1)) == (1 << 1)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        user_id = TLObject.read(stream)
+        score = Int.read(stream)
+        return cls(edit_message=edit_message, force=force, peer=peer, id=id, user_id=user_id, score=score)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetGameScore, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        edit_message = (flags1 & (1 << 0)) == (1 << 0)
+        force = (flags1 & (1 << 1)) == (1 << 1)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        score, cursor = Int.read_from(view, cursor)
+        return cls(edit_message=edit_message, force=force, peer=peer, id=id, user_id=user_id, score=score), cursor
+
+
+class SetInlineGameScore(TLRequest[bool]):
+    __tl_id__ = 0x15ad9f64
+    __tl_name__ = "functions.messages.SetInlineGameScore"
+    __tl_layer__ = 133
+
+    __slots__ = ("edit_message", "force", "id", "user_id", "score", )
+
+    def __init__(self, *, id: tl.base.InputBotInlineMessageID, user_id: tl.base.InputUser, score: int, edit_message: bool = False, force: bool = False):
+        self.edit_message = edit_message
+        self.force = force
+        self.id = id
+        self.user_id = user_id
+        self.score = score
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.edit_message: flags1 |= (1 << 0)
+        if self.force: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.id.write_to(out, ctx)
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.score)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetInlineGameScore:
+        flags1 = Int.read(stream)
+        edit_message = (flags1 & (1 << 0)) == (1 << 0)
+        force = (flags1 & (1 << 1)) == (1 << 1)
+        id = TLObject.read(stream)
+        user_id = TLObject.read(stream)
+        score = Int.read(stream)
+        return cls(edit_message=edit_message, force=force, id=id, user_id=user_id, score=score)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetInlineGameScore, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        edit_message = (flags1 & (1 << 0)) == (1 << 0)
+        force = (flags1 & (1 << 1)) == (1 << 1)
+        id, cursor = TLObject.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        score, cursor = Int.read_from(view, cursor)
+        return cls(edit_message=edit_message, force=force, id=id, user_id=user_id, score=score), cursor
+
+
+class GetGameHighScores(TLRequest[tl.types.messages.HighScores]):
+    __tl_id__ = 0xe822649d
+    __tl_name__ = "functions.messages.GetGameHighScores"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "id", "user_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, user_id: tl.base.InputUser):
+        self.peer = peer
+        self.id = id
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetGameHighScores:
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        user_id = TLObject.read(stream)
+        return cls(peer=peer, id=id, user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetGameHighScores, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, id=id, user_id=user_id), cursor
+
+
+class GetInlineGameHighScores(TLRequest[tl.types.messages.HighScores]):
+    __tl_id__ = 0xf635e1b
+    __tl_name__ = "functions.messages.GetInlineGameHighScores"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", "user_id", )
+
+    def __init__(self, *, id: tl.base.InputBotInlineMessageID, user_id: tl.base.InputUser):
+        self.id = id
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetInlineGameHighScores:
+        id = TLObject.read(stream)
+        user_id = TLObject.read(stream)
+        return cls(id=id, user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetInlineGameHighScores, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(id=id, user_id=user_id), cursor
+
+
+class GetCommonChats(TLRequest[tl.base.messages.Chats]):
+    __tl_id__ = 0xe40ca104
+    __tl_name__ = "functions.messages.GetCommonChats"
+    __tl_layer__ = 133
+
+    __slots__ = ("user_id", "max_id", "limit", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, max_id: int, limit: int):
+        self.user_id = user_id
+        self.max_id = max_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += Long.write(self.max_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCommonChats:
+        user_id = TLObject.read(stream)
+        max_id = Long.read(stream)
+        limit = Int.read(stream)
+        return cls(user_id=user_id, max_id=max_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCommonChats, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Long.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(user_id=user_id, max_id=max_id, limit=limit), cursor
+
+
+class GetWebPage(TLRequest[tl.types.messages.WebPage]):
+    __tl_id__ = 0x8d9692a3
+    __tl_name__ = "functions.messages.GetWebPage"
+    __tl_layer__ = 165
+
+    __slots__ = ("url", "hash", )
+
+    def __init__(self, *, url: str, hash: int):
+        self.url = url
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetWebPage:
+        url = String.read(stream)
+        hash = Int.read(stream)
+        return cls(url=url, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetWebPage, int]:
+        url, cursor = String.read_from(view, cursor)
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(url=url, hash=hash), cursor
+
+
+class ToggleDialogPin(TLRequest[bool]):
+    __tl_id__ = 0xa731e257
+    __tl_name__ = "functions.messages.ToggleDialogPin"
+    __tl_layer__ = 133
+
+    __slots__ = ("pinned", "peer", )
+
+    def __init__(self, *, peer: tl.base.InputDialogPeer, pinned: bool = False):
+        self.pinned = pinned
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pinned: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleDialogPin:
+        flags1 = Int.read(stream)
+        pinned = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        return cls(pinned=pinned, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleDialogPin, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pinned = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(pinned=pinned, peer=peer), cursor
+
+
+class ReorderPinnedDialogs(TLRequest[bool]):
+    __tl_id__ = 0x3b1adf37
+    __tl_name__ = "functions.messages.ReorderPinnedDialogs"
+    __tl_layer__ = 133
+
+    __slots__ = ("force", "folder_id", "order", )
+
+    def __init__(self, *, folder_id: int, order: list[tl.base.InputDialogPeer], force: bool = False):
+        self.force = force
+        self.folder_id = folder_id
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.force: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.folder_id)
+        TLObjectVector.write_to(out, self.order, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReorderPinnedDialogs:
+        flags1 = Int.read(stream)
+        force = (flags1 & (1 << 0)) == (1 << 0)
+        folder_id = Int.read(stream)
+        order = TLObjectVector.read(stream)
+        return cls(force=force, folder_id=folder_id, order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReorderPinnedDialogs, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        force = (flags1 & (1 << 0)) == (1 << 0)
+        folder_id, cursor = Int.read_from(view, cursor)
+        order, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(force=force, folder_id=folder_id, order=order), cursor
+
+
+class GetPinnedDialogs(TLRequest[tl.types.messages.PeerDialogs]):
+    __tl_id__ = 0xd6b94df2
+    __tl_name__ = "functions.messages.GetPinnedDialogs"
+    __tl_layer__ = 133
+
+    __slots__ = ("folder_id", )
+
+    def __init__(self, *, folder_id: int):
+        self.folder_id = folder_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.folder_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPinnedDialogs:
+        folder_id = Int.read(stream)
+        return cls(folder_id=folder_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPinnedDialogs, int]:
+        folder_id, cursor = Int.read_from(view, cursor)
+        return cls(folder_id=folder_id), cursor
+
+
+class SetBotShippingResults(TLRequest[bool]):
+    __tl_id__ = 0xe5f672fa
+    __tl_name__ = "functions.messages.SetBotShippingResults"
+    __tl_layer__ = 133
+
+    __slots__ = ("query_id", "error", "shipping_options", )
+
+    def __init__(self, *, query_id: int, error: str | None = None, shipping_options: list[tl.base.ShippingOption] | None = None):
+        self.query_id = query_id
+        self.error = error
+        self.shipping_options = shipping_options
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.error is not None: flags1 |= (1 << 0)
+        if self.shipping_options: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Long.write(self.query_id)
+        if self.error is not None:
+            String.write_to(out, self.error)
+        if self.shipping_options:
+            TLObjectVector.write_to(out, self.shipping_options, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotShippingResults:
+        flags1 = Int.read(stream)
+        query_id = Long.read(stream)
+        error = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        shipping_options = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(query_id=query_id, error=error, shipping_options=shipping_options)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotShippingResults, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        error, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        shipping_options, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(query_id=query_id, error=error, shipping_options=shipping_options), cursor
+
+
+class SetBotPrecheckoutResults(TLRequest[bool]):
+    __tl_id__ = 0x9c2dd95
+    __tl_name__ = "functions.messages.SetBotPrecheckoutResults"
+    __tl_layer__ = 133
+
+    __slots__ = ("success", "query_id", "error", )
+
+    def __init__(self, *, query_id: int, success: bool = False, error: str | None = None):
+        self.success = success
+        self.query_id = query_id
+        self.error = error
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.success: flags1 |= (1 << 1)
+        if self.error is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Long.write(self.query_id)
+        if self.error is not None:
+            String.write_to(out, self.error)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetBotPrecheckoutResults:
+        flags1 = Int.read(stream)
+        success = (flags1 & (1 << 1)) == (1 << 1)
+        query_id = Long.read(stream)
+        error = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(success=success, query_id=query_id, error=error)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetBotPrecheckoutResults, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        success = (flags1 & (1 << 1)) == (1 << 1)
+        query_id, cursor = Long.read_from(view, cursor)
+        error, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(success=success, query_id=query_id, error=error), cursor
+
+
+class UploadMedia(TLRequest[tl.base.MessageMedia]):
+    __tl_id__ = 0x14967978
+    __tl_name__ = "functions.messages.UploadMedia"
+    __tl_layer__ = 177
+
+    __slots__ = ("business_connection_id", "peer", "media", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, business_connection_id: str | None = None):
+        self.business_connection_id = business_connection_id
+        self.peer = peer
+        self.media = media
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.business_connection_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.business_connection_id is not None:
+            String.write_to(out, self.business_connection_id)
+        self.peer.write_to(out, ctx)
+        self.media.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadMedia:
+        flags1 = Int.read(stream)
+        business_connection_id = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        peer = TLObject.read(stream)
+        media = TLObject.read(stream)
+        return cls(business_connection_id=business_connection_id, peer=peer, media=media)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadMedia, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        business_connection_id, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        return cls(business_connection_id=business_connection_id, peer=peer, media=media), cursor
+
+
+class SendScreenshotNotification(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xa1405817
+    __tl_name__ = "functions.messages.SendScreenshotNotification"
+    __tl_layer__ = 160
+
+    __slots__ = ("peer", "reply_to", "random_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, reply_to: tl.base.InputReplyTo, random_id: int):
+        self.peer = peer
+        self.reply_to = reply_to
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.reply_to.write_to(out, ctx)
+        out += Long.write(self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendScreenshotNotification:
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream)
+        random_id = Long.read(stream)
+        return cls(peer=peer, reply_to=reply_to, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendScreenshotNotification, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, reply_to=reply_to, random_id=random_id), cursor
+
+
+class GetFavedStickers(TLRequest[tl.base.messages.FavedStickers]):
+    __tl_id__ = 0x4f1aaa9
+    __tl_name__ = "functions.messages.GetFavedStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFavedStickers:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFavedStickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class FaveSticker(TLRequest[bool]):
+    __tl_id__ = 0xb9ffc55b
+    __tl_name__ = "functions.messages.FaveSticker"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", "unfave", )
+
+    def __init__(self, *, id: tl.base.InputDocument, unfave: bool):
+        self.id = id
+        self.unfave = unfave
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+        out += Bool.write(self.unfave)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FaveSticker:
+        id = TLObject.read(stream)
+        unfave = Bool.read(stream)
+        return cls(id=id, unfave=unfave)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FaveSticker, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        unfave, cursor = Bool.read_from(view, cursor)
+        return cls(id=id, unfave=unfave), cursor
+
+
+class GetUnreadMentions(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0xf107e790
+    __tl_name__ = "functions.messages.GetUnreadMentions"
+    __tl_layer__ = 148
+
+    __slots__ = ("peer", "top_msg_id", "offset_id", "add_offset", "limit", "max_id", "min_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset_id: int, add_offset: int, limit: int, max_id: int, min_id: int, top_msg_id: int | None = None):
+        self.peer = peer
+        self.top_msg_id = top_msg_id
+        self.offset_id = offset_id
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.top_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUnreadMentions:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        offset_id = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        return cls(peer=peer, top_msg_id=top_msg_id, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUnreadMentions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, top_msg_id=top_msg_id, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id), cursor
+
+
+class ReadMentions(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0x36e5bf4d
+    __tl_name__ = "functions.messages.ReadMentions"
+    __tl_layer__ = 148
+
+    __slots__ = ("peer", "top_msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, top_msg_id: int | None = None):
+        self.peer = peer
+        self.top_msg_id = top_msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.top_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadMentions:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(peer=peer, top_msg_id=top_msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadMentions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(peer=peer, top_msg_id=top_msg_id), cursor
+
+
+class GetRecentLocations(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x702a40e0
+    __tl_name__ = "functions.messages.GetRecentLocations"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "limit", "hash", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, limit: int, hash: int):
+        self.peer = peer
+        self.limit = limit
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.limit)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetRecentLocations:
+        peer = TLObject.read(stream)
+        limit = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(peer=peer, limit=limit, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetRecentLocations, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, limit=limit, hash=hash), cursor
+
+
+class SendMultiMedia(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x1bf89d74
+    __tl_name__ = "functions.messages.SendMultiMedia"
+    __tl_layer__ = 200
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "allow_paid_floodskip", "peer", "reply_to", "multi_media", "schedule_date", "send_as", "quick_reply_shortcut", "effect", "allow_paid_stars", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, multi_media: list[tl.base.InputSingleMedia], silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, invert_media: bool = False, allow_paid_floodskip: bool = False, reply_to: tl.base.InputReplyTo | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None, effect: int | None = None, allow_paid_stars: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.allow_paid_floodskip = allow_paid_floodskip
+        self.peer = peer
+        self.reply_to = reply_to
+        self.multi_media = multi_media
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.effect = effect
+        self.allow_paid_stars = allow_paid_stars
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.allow_paid_floodskip: flags1 |= (1 << 19)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        if self.effect is not None: flags1 |= (1 << 18)
+        if self.allow_paid_stars is not None: flags1 |= (1 << 21)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.multi_media, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+        if self.effect is not None:
+            out += Long.write(self.effect)
+        if self.allow_paid_stars is not None:
+            out += Long.write(self.allow_paid_stars)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMultiMedia:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        multi_media = TLObjectVector.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        effect = Long.read(stream) if (flags1 & (1 << 18)) == (1 << 18) else None
+        allow_paid_stars = Long.read(stream) if (flags1 & (1 << 21)) == (1 << 21) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, allow_paid_floodskip=allow_paid_floodskip, peer=peer, reply_to=reply_to, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect, allow_paid_stars=allow_paid_stars)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMultiMedia, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        multi_media, cursor = TLObjectVector.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        effect, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 18)) == (1 << 18) else (None, cursor)
+        allow_paid_stars, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 21)) == (1 << 21) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, allow_paid_floodskip=allow_paid_floodskip, peer=peer, reply_to=reply_to, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect, allow_paid_stars=allow_paid_stars), cursor
+
+
+class UploadEncryptedFile(TLRequest[tl.base.EncryptedFile]):
+    __tl_id__ = 0x5057c497
+    __tl_name__ = "functions.messages.UploadEncryptedFile"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "file", )
+
+    def __init__(self, *, peer: tl.types.InputEncryptedChat, file: tl.base.InputEncryptedFile):
+        self.peer = peer
+        self.file = file
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.file.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadEncryptedFile:
+        peer = tl.types.InputEncryptedChat.read(stream)
+        file = TLObject.read(stream)
+        return cls(peer=peer, file=file)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadEncryptedFile, int]:
+        peer, cursor = tl.types.InputEncryptedChat.read_from(view, cursor)
+        file, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, file=file), cursor
+
+
+class SearchStickerSets(TLRequest[tl.base.messages.FoundStickerSets]):
+    __tl_id__ = 0x35705b8a
+    __tl_name__ = "functions.messages.SearchStickerSets"
+    __tl_layer__ = 133
+
+    __slots__ = ("exclude_featured", "q", "hash", )
+
+    def __init__(self, *, q: str, hash: int, exclude_featured: bool = False):
+        self.exclude_featured = exclude_featured
+        self.q = q
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.exclude_featured: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.q)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchStickerSets:
+        flags1 = Int.read(stream)
+        exclude_featured = (flags1 & (1 << 0)) == (1 << 0)
+        q = String.read(stream)
+        hash = Long.read(stream)
+        return cls(exclude_featured=exclude_featured, q=q, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchStickerSets, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        exclude_featured = (flags1 & (1 << 0)) == (1 << 0)
+        q, cursor = String.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(exclude_featured=exclude_featured, q=q, hash=hash), cursor
+
+
+class GetSplitRanges(TLRequest[list[tl.base.MessageRange]]):
+    __tl_id__ = 0x1cff7e08
+    __tl_name__ = "functions.messages.GetSplitRanges"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSplitRanges:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSplitRanges, int]:
+        return cls(), cursor
+
+
+class MarkDialogUnread(TLRequest[bool]):
+    __tl_id__ = 0xc286d98f
+    __tl_name__ = "functions.messages.MarkDialogUnread"
+    __tl_layer__ = 133
+
+    __slots__ = ("unread", "peer", )
+
+    def __init__(self, *, peer: tl.base.InputDialogPeer, unread: bool = False):
+        self.unread = unread
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.unread: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MarkDialogUnread:
+        flags1 = Int.read(stream)
+        unread = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        return cls(unread=unread, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MarkDialogUnread, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        unread = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(unread=unread, peer=peer), cursor
+
+
+class GetDialogUnreadMarks(TLRequest[list[tl.base.DialogPeer]]):
+    __tl_id__ = 0x22e24e22
+    __tl_name__ = "functions.messages.GetDialogUnreadMarks"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDialogUnreadMarks:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDialogUnreadMarks, int]:
+        return cls(), cursor
+
+
+class ClearAllDrafts(TLRequest[bool]):
+    __tl_id__ = 0x7e58ee9c
+    __tl_name__ = "functions.messages.ClearAllDrafts"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClearAllDrafts:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClearAllDrafts, int]:
+        return cls(), cursor
+
+
+class UpdatePinnedMessage(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd2aaf7ec
+    __tl_name__ = "functions.messages.UpdatePinnedMessage"
+    __tl_layer__ = 133
+
+    __slots__ = ("silent", "unpin", "pm_oneside", "peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, silent: bool = False, unpin: bool = False, pm_oneside: bool = False):
+        self.silent = silent
+        self.unpin = unpin
+        self.pm_oneside = pm_oneside
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 0)
+        if self.unpin: flags1 |= (1 << 1)
+        if self.pm_oneside: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdatePinnedMessage:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 0)) == (1 << 0)
+        unpin = (flags1 & (1 << 1)) == (1 << 1)
+        pm_oneside = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        return cls(silent=silent, unpin=unpin, pm_oneside=pm_oneside, peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdatePinnedMessage, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 0)) == (1 << 0)
+        unpin = (flags1 & (1 << 1)) == (1 << 1)
+        pm_oneside = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        return cls(silent=silent, unpin=unpin, pm_oneside=pm_oneside, peer=peer, id=id), cursor
+
+
+class SendVote(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x10ea6184
+    __tl_name__ = "functions.messages.SendVote"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "msg_id", "options", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, options: list[bytes]):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.options = options
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += BytesVector.write(self.options)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendVote:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        options = BytesVector.read(stream)
+        return cls(peer=peer, msg_id=msg_id, options=options)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendVote, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        options, cursor = BytesVector.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, options=options), cursor
+
+
+class GetPollResults(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x73bb643b
+    __tl_name__ = "functions.messages.GetPollResults"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPollResults:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPollResults, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class GetOnlines(TLRequest[tl.types.ChatOnlines]):
+    __tl_id__ = 0x6e2be050
+    __tl_name__ = "functions.messages.GetOnlines"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetOnlines:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetOnlines, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class EditChatAbout(TLRequest[bool]):
+    __tl_id__ = 0xdef60797
+    __tl_name__ = "functions.messages.EditChatAbout"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "about", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, about: str):
+        self.peer = peer
+        self.about = about
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.about)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditChatAbout:
+        peer = TLObject.read(stream)
+        about = String.read(stream)
+        return cls(peer=peer, about=about)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditChatAbout, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        about, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, about=about), cursor
+
+
+class EditChatDefaultBannedRights(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xa5866b41
+    __tl_name__ = "functions.messages.EditChatDefaultBannedRights"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "banned_rights", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, banned_rights: tl.types.ChatBannedRights):
+        self.peer = peer
+        self.banned_rights = banned_rights
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.banned_rights.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditChatDefaultBannedRights:
+        peer = TLObject.read(stream)
+        banned_rights = tl.types.ChatBannedRights.read(stream)
+        return cls(peer=peer, banned_rights=banned_rights)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditChatDefaultBannedRights, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        banned_rights, cursor = tl.types.ChatBannedRights.read_from(view, cursor)
+        return cls(peer=peer, banned_rights=banned_rights), cursor
+
+
+class GetEmojiKeywords(TLRequest[tl.types.EmojiKeywordsDifference]):
+    __tl_id__ = 0x35a0e062
+    __tl_name__ = "functions.messages.GetEmojiKeywords"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_code", )
+
+    def __init__(self, *, lang_code: str):
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetEmojiKeywords:
+        lang_code = String.read(stream)
+        return cls(lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetEmojiKeywords, int]:
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(lang_code=lang_code), cursor
+
+
+class GetEmojiKeywordsDifference(TLRequest[tl.types.EmojiKeywordsDifference]):
+    __tl_id__ = 0x1508b6af
+    __tl_name__ = "functions.messages.GetEmojiKeywordsDifference"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_code", "from_version", )
+
+    def __init__(self, *, lang_code: str, from_version: int):
+        self.lang_code = lang_code
+        self.from_version = from_version
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_code)
+        out += Int.write(self.from_version)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetEmojiKeywordsDifference:
+        lang_code = String.read(stream)
+        from_version = Int.read(stream)
+        return cls(lang_code=lang_code, from_version=from_version)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetEmojiKeywordsDifference, int]:
+        lang_code, cursor = String.read_from(view, cursor)
+        from_version, cursor = Int.read_from(view, cursor)
+        return cls(lang_code=lang_code, from_version=from_version), cursor
+
+
+class GetEmojiKeywordsLanguages(TLRequest[list[tl.base.EmojiLanguage]]):
+    __tl_id__ = 0x4e9963b2
+    __tl_name__ = "functions.messages.GetEmojiKeywordsLanguages"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_codes", )
+
+    def __init__(self, *, lang_codes: list[str]):
+        self.lang_codes = lang_codes
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += StringVector.write(self.lang_codes)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetEmojiKeywordsLanguages:
+        lang_codes = StringVector.read(stream)
+        return cls(lang_codes=lang_codes)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetEmojiKeywordsLanguages, int]:
+        lang_codes, cursor = StringVector.read_from(view, cursor)
+        return cls(lang_codes=lang_codes), cursor
+
+
+class GetEmojiURL(TLRequest[tl.types.EmojiURL]):
+    __tl_id__ = 0xd5b10c26
+    __tl_name__ = "functions.messages.GetEmojiURL"
+    __tl_layer__ = 133
+
+    __slots__ = ("lang_code", )
+
+    def __init__(self, *, lang_code: str):
+        self.lang_code = lang_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.lang_code)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetEmojiURL:
+        lang_code = String.read(stream)
+        return cls(lang_code=lang_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetEmojiURL, int]:
+        lang_code, cursor = String.read_from(view, cursor)
+        return cls(lang_code=lang_code), cursor
+
+
+class GetSearchCounters(TLRequest[list[tl.base.messages.SearchCounter]]):
+    __tl_id__ = 0x1bbcf300
+    __tl_name__ = "functions.messages.GetSearchCounters"
+    __tl_layer__ = 170
+
+    __slots__ = ("peer", "saved_peer_id", "top_msg_id", "filters", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, filters: list[tl.base.MessagesFilter], saved_peer_id: tl.base.InputPeer | None = None, top_msg_id: int | None = None):
+        self.peer = peer
+        self.saved_peer_id = saved_peer_id
+        self.top_msg_id = top_msg_id
+        self.filters = filters
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.saved_peer_id is not None: flags1 |= (1 << 2)
+        if self.top_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.saved_peer_id is not None:
+            self.saved_peer_id.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        TLObjectVector.write_to(out, self.filters, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSearchCounters:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        saved_peer_id = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        filters = TLObjectVector.read(stream)
+        return cls(peer=peer, saved_peer_id=saved_peer_id, top_msg_id=top_msg_id, filters=filters)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSearchCounters, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        saved_peer_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        filters, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peer=peer, saved_peer_id=saved_peer_id, top_msg_id=top_msg_id, filters=filters), cursor
+
+
+class RequestUrlAuth(TLRequest[tl.base.UrlAuthResult]):
+    __tl_id__ = 0x198fb446
+    __tl_name__ = "functions.messages.RequestUrlAuth"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "msg_id", "button_id", "url", )
+
+    def __init__(self, *, peer: tl.base.InputPeer | None = None, msg_id: int | None = None, button_id: int | None = None, url: str | None = None):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.button_id = button_id
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.peer is None, self.msg_id is None, self.button_id is None)
+        _flags_fields_not_empty = (self.peer is not None, self.msg_id is not None, self.button_id is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: peer, msg_id, button_id")
+        flags1 = 0
+        if self.peer is not None: flags1 |= (1 << 1)
+        if self.msg_id is not None: flags1 |= (1 << 1)
+        if self.button_id is not None: flags1 |= (1 << 1)
+        if self.url is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.peer is not None:
+            self.peer.write_to(out, ctx)
+        if self.msg_id is not None:
+            out += Int.write(self.msg_id)
+        if self.button_id is not None:
+            out += Int.write(self.button_id)
+        if self.url is not None:
+            String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestUrlAuth:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        msg_id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        button_id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        url = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(peer=peer, msg_id=msg_id, button_id=button_id, url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestUrlAuth, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        button_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(peer=peer, msg_id=msg_id, button_id=button_id, url=url), cursor
+
+
+class AcceptUrlAuth(TLRequest[tl.base.UrlAuthResult]):
+    __tl_id__ = 0xb12c7125
+    __tl_name__ = "functions.messages.AcceptUrlAuth"
+    __tl_layer__ = 133
+
+    __slots__ = ("write_allowed", "peer", "msg_id", "button_id", "url", )
+
+    def __init__(self, *, write_allowed: bool = False, peer: tl.base.InputPeer | None = None, msg_id: int | None = None, button_id: int | None = None, url: str | None = None):
+        self.write_allowed = write_allowed
+        self.peer = peer
+        self.msg_id = msg_id
+        self.button_id = button_id
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.peer is None, self.msg_id is None, self.button_id is None)
+        _flags_fields_not_empty = (self.peer is not None, self.msg_id is not None, self.button_id is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: peer, msg_id, button_id")
+        flags1 = 0
+        if self.write_allowed: flags1 |= (1 << 0)
+        if self.peer is not None: flags1 |= (1 << 1)
+        if self.msg_id is not None: flags1 |= (1 << 1)
+        if self.button_id is not None: flags1 |= (1 << 1)
+        if self.url is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.peer is not None:
+            self.peer.write_to(out, ctx)
+        if self.msg_id is not None:
+            out += Int.write(self.msg_id)
+        if self.button_id is not None:
+            out += Int.write(self.button_id)
+        if self.url is not None:
+            String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AcceptUrlAuth:
+        flags1 = Int.read(stream)
+        write_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        msg_id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        button_id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        url = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(write_allowed=write_allowed, peer=peer, msg_id=msg_id, button_id=button_id, url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AcceptUrlAuth, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        write_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        button_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(write_allowed=write_allowed, peer=peer, msg_id=msg_id, button_id=button_id, url=url), cursor
+
+
+class HidePeerSettingsBar(TLRequest[bool]):
+    __tl_id__ = 0x4facb138
+    __tl_name__ = "functions.messages.HidePeerSettingsBar"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> HidePeerSettingsBar:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[HidePeerSettingsBar, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class GetScheduledHistory(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0xf516760b
+    __tl_name__ = "functions.messages.GetScheduledHistory"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "hash", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, hash: int):
+        self.peer = peer
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetScheduledHistory:
+        peer = TLObject.read(stream)
+        hash = Long.read(stream)
+        return cls(peer=peer, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetScheduledHistory, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, hash=hash), cursor
+
+
+class GetScheduledMessages(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0xbdbb0464
+    __tl_name__ = "functions.messages.GetScheduledMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetScheduledMessages:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetScheduledMessages, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class SendScheduledMessages(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xbd38850a
+    __tl_name__ = "functions.messages.SendScheduledMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendScheduledMessages:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendScheduledMessages, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class DeleteScheduledMessages(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x59ae2b16
+    __tl_name__ = "functions.messages.DeleteScheduledMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteScheduledMessages:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteScheduledMessages, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class GetPollVotes(TLRequest[tl.base.messages.VotesList]):
+    __tl_id__ = 0xb86e380e
+    __tl_name__ = "functions.messages.GetPollVotes"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "id", "option", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, limit: int, option: bytes | None = None, offset: str | None = None):
+        self.peer = peer
+        self.id = id
+        self.option = option
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.option is not None: flags1 |= (1 << 0)
+        if self.offset is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        if self.option is not None:
+            Bytes.write_to(out, self.option)
+        if self.offset is not None:
+            String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPollVotes:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        option = Bytes.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        offset = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        limit = Int.read(stream)
+        return cls(peer=peer, id=id, option=option, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPollVotes, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        option, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, id=id, option=option, offset=offset, limit=limit), cursor
+
+
+class ToggleStickerSets(TLRequest[bool]):
+    __tl_id__ = 0xb5052fea
+    __tl_name__ = "functions.messages.ToggleStickerSets"
+    __tl_layer__ = 133
+
+    __slots__ = ("uninstall", "archive", "unarchive", "stickersets", )
+
+    def __init__(self, *, stickersets: list[tl.base.InputStickerSet], uninstall: bool = False, archive: bool = False, unarchive: bool = False):
+        self.uninstall = uninstall
+        self.archive = archive
+        self.unarchive = unarchive
+        self.stickersets = stickersets
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.uninstall: flags1 |= (1 << 0)
+        if self.archive: flags1 |= (1 << 1)
+        if self.unarchive: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        TLObjectVector.write_to(out, self.stickersets, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleStickerSets:
+        flags1 = Int.read(stream)
+        uninstall = (flags1 & (1 << 0)) == (1 << 0)
+        archive = (flags1 & (1 << 1)) == (1 << 1)
+        unarchive = (flags1 & (1 << 2)) == (1 << 2)
+        stickersets = TLObjectVector.read(stream)
+        return cls(uninstall=uninstall, archive=archive, unarchive=unarchive, stickersets=stickersets)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleStickerSets, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        uninstall = (flags1 & (1 << 0)) == (1 << 0)
+        archive = (flags1 & (1 << 1)) == (1 << 1)
+        unarchive = (flags1 & (1 << 2)) == (1 << 2)
+        stickersets, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(uninstall=uninstall, archive=archive, unarchive=unarchive, stickersets=stickersets), cursor
+
+
+class GetDialogFilters(TLRequest[tl.types.messages.DialogFilters]):
+    __tl_id__ = 0xefd48c89
+    __tl_name__ = "functions.messages.GetDialogFilters"
+    __tl_layer__ = 176
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDialogFilters:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDialogFilters, int]:
+        return cls(), cursor
+
+
+class GetSuggestedDialogFilters(TLRequest[list[tl.base.DialogFilterSuggested]]):
+    __tl_id__ = 0xa29cd42c
+    __tl_name__ = "functions.messages.GetSuggestedDialogFilters"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSuggestedDialogFilters:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSuggestedDialogFilters, int]:
+        return cls(), cursor
+
+
+class UpdateDialogFilter(TLRequest[bool]):
+    __tl_id__ = 0x1ad4a04a
+    __tl_name__ = "functions.messages.UpdateDialogFilter"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", "filter", )
+
+    def __init__(self, *, id: int, filter: tl.base.DialogFilter | None = None):
+        self.id = id
+        self.filter = filter
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.filter is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.id)
+        if self.filter is not None:
+            self.filter.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateDialogFilter:
+        flags1 = Int.read(stream)
+        id = Int.read(stream)
+        filter = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(id=id, filter=filter)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateDialogFilter, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        filter, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(id=id, filter=filter), cursor
+
+
+class UpdateDialogFiltersOrder(TLRequest[bool]):
+    __tl_id__ = 0xc563c1e4
+    __tl_name__ = "functions.messages.UpdateDialogFiltersOrder"
+    __tl_layer__ = 133
+
+    __slots__ = ("order", )
+
+    def __init__(self, *, order: list[int]):
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.order)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateDialogFiltersOrder:
+        order = IntVector.read(stream)
+        return cls(order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateDialogFiltersOrder, int]:
+        order, cursor = IntVector.read_from(view, cursor)
+        return cls(order=order), cursor
+
+
+class GetOldFeaturedStickers(TLRequest[tl.base.messages.FeaturedStickers]):
+    __tl_id__ = 0x7ed094a1
+    __tl_name__ = "functions.messages.GetOldFeaturedStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("offset", "limit", "hash", )
+
+    def __init__(self, *, offset: int, limit: int, hash: int):
+        self.offset = offset
+        self.limit = limit
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetOldFeaturedStickers:
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(offset=offset, limit=limit, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetOldFeaturedStickers, int]:
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(offset=offset, limit=limit, hash=hash), cursor
+
+
+class GetReplies(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x22ddd30c
+    __tl_name__ = "functions.messages.GetReplies"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "msg_id", "offset_id", "offset_date", "add_offset", "limit", "max_id", "min_id", "hash", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, offset_id: int, offset_date: int, add_offset: int, limit: int, max_id: int, min_id: int, hash: int):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.offset_id = offset_id
+        self.offset_date = offset_date
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.offset_date)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetReplies:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        offset_id = Int.read(stream)
+        offset_date = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(peer=peer, msg_id=msg_id, offset_id=offset_id, offset_date=offset_date, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetReplies, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, offset_id=offset_id, offset_date=offset_date, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash), cursor
+
+
+class GetDiscussionMessage(TLRequest[tl.types.messages.DiscussionMessage]):
+    __tl_id__ = 0x446972fd
+    __tl_name__ = "functions.messages.GetDiscussionMessage"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDiscussionMessage:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDiscussionMessage, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class ReadDiscussion(TLRequest[bool]):
+    __tl_id__ = 0xf731a9f4
+    __tl_name__ = "functions.messages.ReadDiscussion"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "msg_id", "read_max_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, read_max_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.read_max_id = read_max_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Int.write(self.read_max_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadDiscussion:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        read_max_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id, read_max_id=read_max_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadDiscussion, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        read_max_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, read_max_id=read_max_id), cursor
+
+
+class UnpinAllMessages(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0xee22b9a8
+    __tl_name__ = "functions.messages.UnpinAllMessages"
+    __tl_layer__ = 148
+
+    __slots__ = ("peer", "top_msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, top_msg_id: int | None = None):
+        self.peer = peer
+        self.top_msg_id = top_msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.top_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UnpinAllMessages:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(peer=peer, top_msg_id=top_msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UnpinAllMessages, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(peer=peer, top_msg_id=top_msg_id), cursor
+
+
+class DeleteChat(TLRequest[bool]):
+    __tl_id__ = 0x5bd0ee50
+    __tl_name__ = "functions.messages.DeleteChat"
+    __tl_layer__ = 133
+
+    __slots__ = ("chat_id", )
+
+    def __init__(self, *, chat_id: int):
+        self.chat_id = chat_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.chat_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteChat:
+        chat_id = Long.read(stream)
+        return cls(chat_id=chat_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteChat, int]:
+        chat_id, cursor = Long.read_from(view, cursor)
+        return cls(chat_id=chat_id), cursor
+
+
+class DeletePhoneCallHistory(TLRequest[tl.types.messages.AffectedFoundMessages]):
+    __tl_id__ = 0xf9cbe409
+    __tl_name__ = "functions.messages.DeletePhoneCallHistory"
+    __tl_layer__ = 133
+
+    __slots__ = ("revoke", )
+
+    def __init__(self, *, revoke: bool = False):
+        self.revoke = revoke
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.revoke: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeletePhoneCallHistory:
+        flags1 = Int.read(stream)
+        revoke = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(revoke=revoke)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeletePhoneCallHistory, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        revoke = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(revoke=revoke), cursor
+
+
+class CheckHistoryImport(TLRequest[tl.types.messages.HistoryImportParsed]):
+    __tl_id__ = 0x43fe19f3
+    __tl_name__ = "functions.messages.CheckHistoryImport"
+    __tl_layer__ = 133
+
+    __slots__ = ("import_head", )
+
+    def __init__(self, *, import_head: str):
+        self.import_head = import_head
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.import_head)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckHistoryImport:
+        import_head = String.read(stream)
+        return cls(import_head=import_head)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckHistoryImport, int]:
+        import_head, cursor = String.read_from(view, cursor)
+        return cls(import_head=import_head), cursor
+
+
+class InitHistoryImport(TLRequest[tl.types.messages.HistoryImport]):
+    __tl_id__ = 0x34090c3b
+    __tl_name__ = "functions.messages.InitHistoryImport"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "file", "media_count", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, file: tl.base.InputFile, media_count: int):
+        self.peer = peer
+        self.file = file
+        self.media_count = media_count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.file.write_to(out, ctx)
+        out += Int.write(self.media_count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InitHistoryImport:
+        peer = TLObject.read(stream)
+        file = TLObject.read(stream)
+        media_count = Int.read(stream)
+        return cls(peer=peer, file=file, media_count=media_count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InitHistoryImport, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        file, cursor = TLObject.read_from(view, cursor)
+        media_count, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, file=file, media_count=media_count), cursor
+
+
+class UploadImportedMedia(TLRequest[tl.base.MessageMedia]):
+    __tl_id__ = 0x2a862092
+    __tl_name__ = "functions.messages.UploadImportedMedia"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "import_id", "file_name", "media", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, import_id: int, file_name: str, media: tl.base.InputMedia):
+        self.peer = peer
+        self.import_id = import_id
+        self.file_name = file_name
+        self.media = media
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.import_id)
+        String.write_to(out, self.file_name)
+        self.media.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadImportedMedia:
+        peer = TLObject.read(stream)
+        import_id = Long.read(stream)
+        file_name = String.read(stream)
+        media = TLObject.read(stream)
+        return cls(peer=peer, import_id=import_id, file_name=file_name, media=media)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadImportedMedia, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        import_id, cursor = Long.read_from(view, cursor)
+        file_name, cursor = String.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, import_id=import_id, file_name=file_name, media=media), cursor
+
+
+class StartHistoryImport(TLRequest[bool]):
+    __tl_id__ = 0xb43df344
+    __tl_name__ = "functions.messages.StartHistoryImport"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "import_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, import_id: int):
+        self.peer = peer
+        self.import_id = import_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.import_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StartHistoryImport:
+        peer = TLObject.read(stream)
+        import_id = Long.read(stream)
+        return cls(peer=peer, import_id=import_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StartHistoryImport, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        import_id, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, import_id=import_id), cursor
+
+
+class GetExportedChatInvites(TLRequest[tl.types.messages.ExportedChatInvites]):
+    __tl_id__ = 0xa2b5a3f6
+    __tl_name__ = "functions.messages.GetExportedChatInvites"
+    __tl_layer__ = 133
+
+    __slots__ = ("revoked", "peer", "admin_id", "offset_date", "offset_link", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, admin_id: tl.base.InputUser, limit: int, revoked: bool = False, offset_date: int | None = None, offset_link: str | None = None):
+        self.revoked = revoked
+        self.peer = peer
+        self.admin_id = admin_id
+        self.offset_date = offset_date
+        self.offset_link = offset_link
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.offset_date is None, self.offset_link is None)
+        _flags_fields_not_empty = (self.offset_date is not None, self.offset_link is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: offset_date, offset_link")
+        flags1 = 0
+        if self.revoked: flags1 |= (1 << 3)
+        if self.offset_date is not None: flags1 |= (1 << 2)
+        if self.offset_link is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.admin_id.write_to(out, ctx)
+        if self.offset_date is not None:
+            out += Int.write(self.offset_date)
+        if self.offset_link is not None:
+            String.write_to(out, self.offset_link)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetExportedChatInvites:
+        flags1 = Int.read(stream)
+        revoked = (flags1 & (1 << 3)) == (1 << 3)
+        peer = TLObject.read(stream)
+        admin_id = TLObject.read(stream)
+        offset_date = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        offset_link = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        limit = Int.read(stream)
+        return cls(revoked=revoked, peer=peer, admin_id=admin_id, offset_date=offset_date, offset_link=offset_link, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetExportedChatInvites, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        revoked = (flags1 & (1 << 3)) == (1 << 3)
+        peer, cursor = TLObject.read_from(view, cursor)
+        admin_id, cursor = TLObject.read_from(view, cursor)
+        offset_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        offset_link, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(revoked=revoked, peer=peer, admin_id=admin_id, offset_date=offset_date, offset_link=offset_link, limit=limit), cursor
+
+
+class GetExportedChatInvite(TLRequest[tl.base.messages.ExportedChatInvite]):
+    __tl_id__ = 0x73746f5c
+    __tl_name__ = "functions.messages.GetExportedChatInvite"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "link", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, link: str):
+        self.peer = peer
+        self.link = link
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.link)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetExportedChatInvite:
+        peer = TLObject.read(stream)
+        link = String.read(stream)
+        return cls(peer=peer, link=link)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetExportedChatInvite, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        link, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, link=link), cursor
+
+
+class EditExportedChatInvite(TLRequest[tl.base.messages.ExportedChatInvite]):
+    __tl_id__ = 0xbdca2f75
+    __tl_name__ = "functions.messages.EditExportedChatInvite"
+    __tl_layer__ = 134
+
+    __slots__ = ("revoked", "peer", "link", "expire_date", "usage_limit", "request_needed", "title", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, link: str, revoked: bool = False, expire_date: int | None = None, usage_limit: int | None = None, request_needed: bool = False, title: str | None = None):
+        self.revoked = revoked
+        self.peer = peer
+        self.link = link
+        self.expire_date = expire_date
+        self.usage_limit = usage_limit
+        self.request_needed = request_needed
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.revoked: flags1 |= (1 << 2)
+        if self.expire_date is not None: flags1 |= (1 << 0)
+        if self.usage_limit is not None: flags1 |= (1 << 1)
+        if self.request_needed is not None: flags1 |= (1 << 3)
+        if self.title is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.link)
+        if self.expire_date is not None:
+            out += Int.write(self.expire_date)
+        if self.usage_limit is not None:
+            out += Int.write(self.usage_limit)
+        if self.request_needed is not None:
+            out += Bool.write(self.request_needed)
+        if self.title is not None:
+            String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditExportedChatInvite:
+        flags1 = Int.read(stream)
+        revoked = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream)
+        link = String.read(stream)
+        expire_date = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        usage_limit = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        request_needed = Bool.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        title = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(revoked=revoked, peer=peer, link=link, expire_date=expire_date, usage_limit=usage_limit, request_needed=request_needed, title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditExportedChatInvite, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        revoked = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor)
+        link, cursor = String.read_from(view, cursor)
+        expire_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        usage_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        request_needed, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(revoked=revoked, peer=peer, link=link, expire_date=expire_date, usage_limit=usage_limit, request_needed=request_needed, title=title), cursor
+
+
+class DeleteRevokedExportedChatInvites(TLRequest[bool]):
+    __tl_id__ = 0x56987bd5
+    __tl_name__ = "functions.messages.DeleteRevokedExportedChatInvites"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "admin_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, admin_id: tl.base.InputUser):
+        self.peer = peer
+        self.admin_id = admin_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.admin_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteRevokedExportedChatInvites:
+        peer = TLObject.read(stream)
+        admin_id = TLObject.read(stream)
+        return cls(peer=peer, admin_id=admin_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteRevokedExportedChatInvites, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        admin_id, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, admin_id=admin_id), cursor
+
+
+class DeleteExportedChatInvite(TLRequest[bool]):
+    __tl_id__ = 0xd464a42b
+    __tl_name__ = "functions.messages.DeleteExportedChatInvite"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "link", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, link: str):
+        self.peer = peer
+        self.link = link
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.link)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteExportedChatInvite:
+        peer = TLObject.read(stream)
+        link = String.read(stream)
+        return cls(peer=peer, link=link)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteExportedChatInvite, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        link, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, link=link), cursor
+
+
+class GetAdminsWithInvites(TLRequest[tl.types.messages.ChatAdminsWithInvites]):
+    __tl_id__ = 0x3920e6ef
+    __tl_name__ = "functions.messages.GetAdminsWithInvites"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAdminsWithInvites:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAdminsWithInvites, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class GetChatInviteImporters(TLRequest[tl.types.messages.ChatInviteImporters]):
+    __tl_id__ = 0xdf04dd4e
+    __tl_name__ = "functions.messages.GetChatInviteImporters"
+    __tl_layer__ = 134
+
+    __slots__ = ("requested", "subscription_expired", "peer", "link", "q", "offset_date", "offset_user", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset_date: int, offset_user: tl.base.InputUser, limit: int, requested: bool = False, subscription_expired: bool = False, link: str | None = None, q: str | None = None):
+        self.requested = requested
+        self.subscription_expired = subscription_expired
+        self.peer = peer
+        self.link = link
+        self.q = q
+        self.offset_date = offset_date
+        self.offset_user = offset_user
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.requested: flags1 |= (1 << 0)
+        if self.subscription_expired: flags1 |= (1 << 3)
+        if self.link is not None: flags1 |= (1 << 1)
+        if self.q is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.link is not None:
+            String.write_to(out, self.link)
+        if self.q is not None:
+            String.write_to(out, self.q)
+        out += Int.write(self.offset_date)
+        self.offset_user.write_to(out, ctx)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChatInviteImporters:
+        flags1 = Int.read(stream)
+        requested = (flags1 & (1 << 0)) == (1 << 0)
+        subscription_expired = (flags1 & (1 << 3)) == (1 << 3)
+        peer = TLObject.read(stream)
+        link = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        q = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        offset_date = Int.read(stream)
+        offset_user = TLObject.read(stream)
+        limit = Int.read(stream)
+        return cls(requested=requested, subscription_expired=subscription_expired, peer=peer, link=link, q=q, offset_date=offset_date, offset_user=offset_user, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChatInviteImporters, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        requested = (flags1 & (1 << 0)) == (1 << 0)
+        subscription_expired = (flags1 & (1 << 3)) == (1 << 3)
+        peer, cursor = TLObject.read_from(view, cursor)
+        link, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        q, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        offset_user, cursor = TLObject.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(requested=requested, subscription_expired=subscription_expired, peer=peer, link=link, q=q, offset_date=offset_date, offset_user=offset_user, limit=limit), cursor
+
+
+class SetHistoryTTL(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xb80e5fe4
+    __tl_name__ = "functions.messages.SetHistoryTTL"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "period", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, period: int):
+        self.peer = peer
+        self.period = period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetHistoryTTL:
+        peer = TLObject.read(stream)
+        period = Int.read(stream)
+        return cls(peer=peer, period=period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetHistoryTTL, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        period, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, period=period), cursor
+
+
+class CheckHistoryImportPeer(TLRequest[tl.types.messages.CheckedHistoryImportPeer]):
+    __tl_id__ = 0x5dc60f03
+    __tl_name__ = "functions.messages.CheckHistoryImportPeer"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckHistoryImportPeer:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckHistoryImportPeer, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class SetChatTheme(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xe63be13f
+    __tl_name__ = "functions.messages.SetChatTheme"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "emoticon", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, emoticon: str):
+        self.peer = peer
+        self.emoticon = emoticon
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.emoticon)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetChatTheme:
+        peer = TLObject.read(stream)
+        emoticon = String.read(stream)
+        return cls(peer=peer, emoticon=emoticon)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetChatTheme, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        emoticon, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, emoticon=emoticon), cursor
+
+
+class GetMessageReadParticipants(TLRequest[list[tl.base.ReadParticipantDate]]):
+    __tl_id__ = 0x31c1c44f
+    __tl_name__ = "functions.messages.GetMessageReadParticipants"
+    __tl_layer__ = 155
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessageReadParticipants:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessageReadParticipants, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class GetSearchResultsCalendar(TLRequest[tl.types.messages.SearchResultsCalendar]):
+    __tl_id__ = 0x6aa3f6bd
+    __tl_name__ = "functions.messages.GetSearchResultsCalendar"
+    __tl_layer__ = 170
+
+    __slots__ = ("peer", "saved_peer_id", "filter", "offset_id", "offset_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, filter: tl.base.MessagesFilter, offset_id: int, offset_date: int, saved_peer_id: tl.base.InputPeer | None = None):
+        self.peer = peer
+        self.saved_peer_id = saved_peer_id
+        self.filter = filter
+        self.offset_id = offset_id
+        self.offset_date = offset_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.saved_peer_id is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.saved_peer_id is not None:
+            self.saved_peer_id.write_to(out, ctx)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.offset_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSearchResultsCalendar:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        saved_peer_id = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        filter = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        offset_date = Int.read(stream)
+        return cls(peer=peer, saved_peer_id=saved_peer_id, filter=filter, offset_id=offset_id, offset_date=offset_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSearchResultsCalendar, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        saved_peer_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, saved_peer_id=saved_peer_id, filter=filter, offset_id=offset_id, offset_date=offset_date), cursor
+
+
+class GetSearchResultsPositions(TLRequest[tl.types.messages.SearchResultsPositions]):
+    __tl_id__ = 0x9c7f2f10
+    __tl_name__ = "functions.messages.GetSearchResultsPositions"
+    __tl_layer__ = 170
+
+    __slots__ = ("peer", "saved_peer_id", "filter", "offset_id", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, filter: tl.base.MessagesFilter, offset_id: int, limit: int, saved_peer_id: tl.base.InputPeer | None = None):
+        self.peer = peer
+        self.saved_peer_id = saved_peer_id
+        self.filter = filter
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.saved_peer_id is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.saved_peer_id is not None:
+            self.saved_peer_id.write_to(out, ctx)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSearchResultsPositions:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        saved_peer_id = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        filter = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(peer=peer, saved_peer_id=saved_peer_id, filter=filter, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSearchResultsPositions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        saved_peer_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, saved_peer_id=saved_peer_id, filter=filter, offset_id=offset_id, limit=limit), cursor
+
+
+class HideChatJoinRequest(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x7fe7e815
+    __tl_name__ = "functions.messages.HideChatJoinRequest"
+    __tl_layer__ = 134
+
+    __slots__ = ("approved", "peer", "user_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, user_id: tl.base.InputUser, approved: bool = False):
+        self.approved = approved
+        self.peer = peer
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.approved: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> HideChatJoinRequest:
+        flags1 = Int.read(stream)
+        approved = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        user_id = TLObject.read(stream)
+        return cls(approved=approved, peer=peer, user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[HideChatJoinRequest, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        approved = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(approved=approved, peer=peer, user_id=user_id), cursor
+
+
+class HideAllChatJoinRequests(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xe085f4ea
+    __tl_name__ = "functions.messages.HideAllChatJoinRequests"
+    __tl_layer__ = 135
+
+    __slots__ = ("approved", "peer", "link", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, approved: bool = False, link: str | None = None):
+        self.approved = approved
+        self.peer = peer
+        self.link = link
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.approved: flags1 |= (1 << 0)
+        if self.link is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.link is not None:
+            String.write_to(out, self.link)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> HideAllChatJoinRequests:
+        flags1 = Int.read(stream)
+        approved = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        link = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(approved=approved, peer=peer, link=link)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[HideAllChatJoinRequests, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        approved = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        link, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(approved=approved, peer=peer, link=link), cursor
+
+
+class ToggleNoForwards(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xb11eafa2
+    __tl_name__ = "functions.messages.ToggleNoForwards"
+    __tl_layer__ = 135
+
+    __slots__ = ("peer", "enabled", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, enabled: bool):
+        self.peer = peer
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleNoForwards:
+        peer = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(peer=peer, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleNoForwards, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(peer=peer, enabled=enabled), cursor
+
+
+class SaveDefaultSendAs(TLRequest[bool]):
+    __tl_id__ = 0xccfddf96
+    __tl_name__ = "functions.messages.SaveDefaultSendAs"
+    __tl_layer__ = 135
+
+    __slots__ = ("peer", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, send_as: tl.base.InputPeer):
+        self.peer = peer
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveDefaultSendAs:
+        peer = TLObject.read(stream)
+        send_as = TLObject.read(stream)
+        return cls(peer=peer, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveDefaultSendAs, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, send_as=send_as), cursor
+
+
+class SendReaction(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd30d78d4
+    __tl_name__ = "functions.messages.SendReaction"
+    __tl_layer__ = 145
+
+    __slots__ = ("big", "add_to_recent", "peer", "msg_id", "reaction", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, big: bool = False, add_to_recent: bool = False, reaction: list[tl.base.Reaction] | None = None):
+        self.big = big
+        self.add_to_recent = add_to_recent
+        self.peer = peer
+        self.msg_id = msg_id
+        self.reaction = reaction
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.big: flags1 |= (1 << 1)
+        if self.add_to_recent: flags1 |= (1 << 2)
+        if self.reaction: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        if self.reaction:
+            TLObjectVector.write_to(out, self.reaction, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendReaction:
+        flags1 = Int.read(stream)
+        big = (flags1 & (1 << 1)) == (1 << 1)
+        add_to_recent = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        reaction = TLObjectVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(big=big, add_to_recent=add_to_recent, peer=peer, msg_id=msg_id, reaction=reaction)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendReaction, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        big = (flags1 & (1 << 1)) == (1 << 1)
+        add_to_recent = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        reaction, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(big=big, add_to_recent=add_to_recent, peer=peer, msg_id=msg_id, reaction=reaction), cursor
+
+
+class GetMessagesReactions(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x8bba90e6
+    __tl_name__ = "functions.messages.GetMessagesReactions"
+    __tl_layer__ = 136
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessagesReactions:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessagesReactions, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class GetMessageReactionsList(TLRequest[tl.base.messages.MessageReactionsList]):
+    __tl_id__ = 0x461b3f48
+    __tl_name__ = "functions.messages.GetMessageReactionsList"
+    __tl_layer__ = 145
+
+    __slots__ = ("peer", "id", "reaction", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, limit: int, reaction: tl.base.Reaction | None = None, offset: str | None = None):
+        self.peer = peer
+        self.id = id
+        self.reaction = reaction
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.reaction is not None: flags1 |= (1 << 0)
+        if self.offset is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        if self.reaction is not None:
+            self.reaction.write_to(out, ctx)
+        if self.offset is not None:
+            String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessageReactionsList:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        reaction = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        offset = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        limit = Int.read(stream)
+        return cls(peer=peer, id=id, reaction=reaction, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessageReactionsList, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        reaction, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, id=id, reaction=reaction, offset=offset, limit=limit), cursor
+
+
+class SetChatAvailableReactions(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x864b2581
+    __tl_name__ = "functions.messages.SetChatAvailableReactions"
+    __tl_layer__ = 186
+
+    __slots__ = ("peer", "available_reactions", "reactions_limit", "paid_enabled", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, available_reactions: tl.base.ChatReactions, reactions_limit: int | None = None, paid_enabled: bool = False):
+        self.peer = peer
+        self.available_reactions = available_reactions
+        self.reactions_limit = reactions_limit
+        self.paid_enabled = paid_enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.reactions_limit is not None: flags1 |= (1 << 0)
+        if self.paid_enabled is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.available_reactions.write_to(out, ctx)
+        if self.reactions_limit is not None:
+            out += Int.write(self.reactions_limit)
+        if self.paid_enabled is not None:
+            out += Bool.write(self.paid_enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetChatAvailableReactions:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        available_reactions = TLObject.read(stream)
+        reactions_limit = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        paid_enabled = Bool.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(peer=peer, available_reactions=available_reactions, reactions_limit=reactions_limit, paid_enabled=paid_enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetChatAvailableReactions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        available_reactions, cursor = TLObject.read_from(view, cursor)
+        reactions_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        paid_enabled, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(peer=peer, available_reactions=available_reactions, reactions_limit=reactions_limit, paid_enabled=paid_enabled), cursor
+
+
+class GetAvailableReactions(TLRequest[tl.base.messages.AvailableReactions]):
+    __tl_id__ = 0x18dea0ac
+    __tl_name__ = "functions.messages.GetAvailableReactions"
+    __tl_layer__ = 136
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAvailableReactions:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAvailableReactions, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class SetDefaultReaction(TLRequest[bool]):
+    __tl_id__ = 0x4f47a016
+    __tl_name__ = "functions.messages.SetDefaultReaction"
+    __tl_layer__ = 145
+
+    __slots__ = ("reaction", )
+
+    def __init__(self, *, reaction: tl.base.Reaction):
+        self.reaction = reaction
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.reaction.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetDefaultReaction:
+        reaction = TLObject.read(stream)
+        return cls(reaction=reaction)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetDefaultReaction, int]:
+        reaction, cursor = TLObject.read_from(view, cursor)
+        return cls(reaction=reaction), cursor
+
+
+class TranslateText(TLRequest[tl.base.messages.TranslatedText]):
+    __tl_id__ = 0x63183030
+    __tl_name__ = "functions.messages.TranslateText"
+    __tl_layer__ = 152
+
+    __slots__ = ("peer", "id", "text", "to_lang", )
+
+    def __init__(self, *, to_lang: str, peer: tl.base.InputPeer | None = None, id: list[int] | None = None, text: list[tl.base.TextWithEntities] | None = None):
+        self.peer = peer
+        self.id = id
+        self.text = text
+        self.to_lang = to_lang
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.peer is None, self.id is None)
+        _flags_fields_not_empty = (self.peer is not None, self.id is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: peer, id")
+        flags1 = 0
+        if self.peer is not None: flags1 |= (1 << 0)
+        if self.id: flags1 |= (1 << 0)
+        if self.text: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.peer is not None:
+            self.peer.write_to(out, ctx)
+        if self.id is not None:
+            out += IntVector.write(self.id)
+        if self.text:
+            TLObjectVector.write_to(out, self.text, ctx)
+        String.write_to(out, self.to_lang)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TranslateText:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        id = IntVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        text = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        to_lang = String.read(stream)
+        return cls(peer=peer, id=id, text=text, to_lang=to_lang)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TranslateText, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        id, cursor = IntVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        text, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        to_lang, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, id=id, text=text, to_lang=to_lang), cursor
+
+
+class GetUnreadReactions(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x3223495b
+    __tl_name__ = "functions.messages.GetUnreadReactions"
+    __tl_layer__ = 148
+
+    __slots__ = ("peer", "top_msg_id", "offset_id", "add_offset", "limit", "max_id", "min_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset_id: int, add_offset: int, limit: int, max_id: int, min_id: int, top_msg_id: int | None = None):
+        self.peer = peer
+        self.top_msg_id = top_msg_id
+        self.offset_id = offset_id
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.top_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUnreadReactions:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        offset_id = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        return cls(peer=peer, top_msg_id=top_msg_id, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUnreadReactions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, top_msg_id=top_msg_id, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id), cursor
+
+
+class ReadReactions(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0x54aa7f8e
+    __tl_name__ = "functions.messages.ReadReactions"
+    __tl_layer__ = 148
+
+    __slots__ = ("peer", "top_msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, top_msg_id: int | None = None):
+        self.peer = peer
+        self.top_msg_id = top_msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.top_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadReactions:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(peer=peer, top_msg_id=top_msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadReactions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(peer=peer, top_msg_id=top_msg_id), cursor
+
+
+class SearchSentMedia(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x107e31a0
+    __tl_name__ = "functions.messages.SearchSentMedia"
+    __tl_layer__ = 139
+
+    __slots__ = ("q", "filter", "limit", )
+
+    def __init__(self, *, q: str, filter: tl.base.MessagesFilter, limit: int):
+        self.q = q
+        self.filter = filter
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.q)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchSentMedia:
+        q = String.read(stream)
+        filter = TLObject.read(stream)
+        limit = Int.read(stream)
+        return cls(q=q, filter=filter, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchSentMedia, int]:
+        q, cursor = String.read_from(view, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(q=q, filter=filter, limit=limit), cursor
+
+
+class GetAttachMenuBots(TLRequest[tl.base.AttachMenuBots]):
+    __tl_id__ = 0x16fcc2cb
+    __tl_name__ = "functions.messages.GetAttachMenuBots"
+    __tl_layer__ = 140
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAttachMenuBots:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAttachMenuBots, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetAttachMenuBot(TLRequest[tl.types.AttachMenuBotsBot]):
+    __tl_id__ = 0x77216192
+    __tl_name__ = "functions.messages.GetAttachMenuBot"
+    __tl_layer__ = 140
+
+    __slots__ = ("bot", )
+
+    def __init__(self, *, bot: tl.base.InputUser):
+        self.bot = bot
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAttachMenuBot:
+        bot = TLObject.read(stream)
+        return cls(bot=bot)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAttachMenuBot, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        return cls(bot=bot), cursor
+
+
+class ToggleBotInAttachMenu(TLRequest[bool]):
+    __tl_id__ = 0x69f59d69
+    __tl_name__ = "functions.messages.ToggleBotInAttachMenu"
+    __tl_layer__ = 151
+
+    __slots__ = ("write_allowed", "bot", "enabled", )
+
+    def __init__(self, *, bot: tl.base.InputUser, enabled: bool, write_allowed: bool = False):
+        self.write_allowed = write_allowed
+        self.bot = bot
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.write_allowed: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.bot.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleBotInAttachMenu:
+        flags1 = Int.read(stream)
+        write_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        bot = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(write_allowed=write_allowed, bot=bot, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleBotInAttachMenu, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        write_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        bot, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(write_allowed=write_allowed, bot=bot, enabled=enabled), cursor
+
+
+class RequestWebView(TLRequest[tl.base.WebViewResult]):
+    __tl_id__ = 0x269dc2c1
+    __tl_name__ = "functions.messages.RequestWebView"
+    __tl_layer__ = 160
+
+    __slots__ = ("from_bot_menu", "silent", "compact", "fullscreen", "peer", "bot", "url", "start_param", "theme_params", "platform", "reply_to", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, platform: str, from_bot_menu: bool = False, silent: bool = False, compact: bool = False, fullscreen: bool = False, url: str | None = None, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None, reply_to: tl.base.InputReplyTo | None = None, send_as: tl.base.InputPeer | None = None):
+        self.from_bot_menu = from_bot_menu
+        self.silent = silent
+        self.compact = compact
+        self.fullscreen = fullscreen
+        self.peer = peer
+        self.bot = bot
+        self.url = url
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.platform = platform
+        self.reply_to = reply_to
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_bot_menu: flags1 |= (1 << 4)
+        if self.silent: flags1 |= (1 << 5)
+        if self.compact: flags1 |= (1 << 7)
+        if self.fullscreen: flags1 |= (1 << 8)
+        if self.url is not None: flags1 |= (1 << 1)
+        if self.start_param is not None: flags1 |= (1 << 3)
+        if self.theme_params is not None: flags1 |= (1 << 2)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        String.write_to(out, self.platform)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestWebView:
+        flags1 = Int.read(stream)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        compact = (flags1 & (1 << 7)) == (1 << 7)
+        fullscreen = (flags1 & (1 << 8)) == (1 << 8)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        url = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        start_param = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        platform = String.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(from_bot_menu=from_bot_menu, silent=silent, compact=compact, fullscreen=fullscreen, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform, reply_to=reply_to, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestWebView, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        compact = (flags1 & (1 << 7)) == (1 << 7)
+        fullscreen = (flags1 & (1 << 8)) == (1 << 8)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        platform, cursor = String.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(from_bot_menu=from_bot_menu, silent=silent, compact=compact, fullscreen=fullscreen, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform, reply_to=reply_to, send_as=send_as), cursor
+
+
+class ProlongWebView(TLRequest[bool]):
+    __tl_id__ = 0xb0d81a83
+    __tl_name__ = "functions.messages.ProlongWebView"
+    __tl_layer__ = 160
+
+    __slots__ = ("silent", "peer", "bot", "query_id", "reply_to", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, query_id: int, silent: bool = False, reply_to: tl.base.InputReplyTo | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.peer = peer
+        self.bot = bot
+        self.query_id = query_id
+        self.reply_to = reply_to
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        out += Long.write(self.query_id)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ProlongWebView:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        query_id = Long.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, peer=peer, bot=bot, query_id=query_id, reply_to=reply_to, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ProlongWebView, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, peer=peer, bot=bot, query_id=query_id, reply_to=reply_to, send_as=send_as), cursor
+
+
+class RequestSimpleWebView(TLRequest[tl.base.WebViewResult]):
+    __tl_id__ = 0x413a3e73
+    __tl_name__ = "functions.messages.RequestSimpleWebView"
+    __tl_layer__ = 183
+
+    __slots__ = ("from_switch_webview", "from_side_menu", "compact", "fullscreen", "bot", "url", "start_param", "theme_params", "platform", )
+
+    def __init__(self, *, bot: tl.base.InputUser, platform: str, from_switch_webview: bool = False, from_side_menu: bool = False, compact: bool = False, fullscreen: bool = False, url: str | None = None, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None):
+        self.from_switch_webview = from_switch_webview
+        self.from_side_menu = from_side_menu
+        self.compact = compact
+        self.fullscreen = fullscreen
+        self.bot = bot
+        self.url = url
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.platform = platform
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_switch_webview: flags1 |= (1 << 1)
+        if self.from_side_menu: flags1 |= (1 << 2)
+        if self.compact: flags1 |= (1 << 7)
+        if self.fullscreen: flags1 |= (1 << 8)
+        if self.url is not None: flags1 |= (1 << 3)
+        if self.start_param is not None: flags1 |= (1 << 4)
+        if self.theme_params is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.bot.write_to(out, ctx)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        String.write_to(out, self.platform)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestSimpleWebView:
+        flags1 = Int.read(stream)
+        from_switch_webview = (flags1 & (1 << 1)) == (1 << 1)
+        from_side_menu = (flags1 & (1 << 2)) == (1 << 2)
+        compact = (flags1 & (1 << 7)) == (1 << 7)
+        fullscreen = (flags1 & (1 << 8)) == (1 << 8)
+        bot = TLObject.read(stream)
+        url = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        start_param = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        platform = String.read(stream)
+        return cls(from_switch_webview=from_switch_webview, from_side_menu=from_side_menu, compact=compact, fullscreen=fullscreen, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestSimpleWebView, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        from_switch_webview = (flags1 & (1 << 1)) == (1 << 1)
+        from_side_menu = (flags1 & (1 << 2)) == (1 << 2)
+        compact = (flags1 & (1 << 7)) == (1 << 7)
+        fullscreen = (flags1 & (1 << 8)) == (1 << 8)
+        bot, cursor = TLObject.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        platform, cursor = String.read_from(view, cursor)
+        return cls(from_switch_webview=from_switch_webview, from_side_menu=from_side_menu, compact=compact, fullscreen=fullscreen, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform), cursor
+
+
+class SendWebViewResultMessage(TLRequest[tl.types.WebViewMessageSent]):
+    __tl_id__ = 0xa4314f5
+    __tl_name__ = "functions.messages.SendWebViewResultMessage"
+    __tl_layer__ = 140
+
+    __slots__ = ("bot_query_id", "result", )
+
+    def __init__(self, *, bot_query_id: str, result: tl.base.InputBotInlineResult):
+        self.bot_query_id = bot_query_id
+        self.result = result
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.bot_query_id)
+        self.result.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendWebViewResultMessage:
+        bot_query_id = String.read(stream)
+        result = TLObject.read(stream)
+        return cls(bot_query_id=bot_query_id, result=result)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendWebViewResultMessage, int]:
+        bot_query_id, cursor = String.read_from(view, cursor)
+        result, cursor = TLObject.read_from(view, cursor)
+        return cls(bot_query_id=bot_query_id, result=result), cursor
+
+
+class SendWebViewData(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xdc0242c8
+    __tl_name__ = "functions.messages.SendWebViewData"
+    __tl_layer__ = 140
+
+    __slots__ = ("bot", "random_id", "button_text", "data", )
+
+    def __init__(self, *, bot: tl.base.InputUser, random_id: int, button_text: str, data: str):
+        self.bot = bot
+        self.random_id = random_id
+        self.button_text = button_text
+        self.data = data
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        out += Long.write(self.random_id)
+        String.write_to(out, self.button_text)
+        String.write_to(out, self.data)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendWebViewData:
+        bot = TLObject.read(stream)
+        random_id = Long.read(stream)
+        button_text = String.read(stream)
+        data = String.read(stream)
+        return cls(bot=bot, random_id=random_id, button_text=button_text, data=data)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendWebViewData, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        button_text, cursor = String.read_from(view, cursor)
+        data, cursor = String.read_from(view, cursor)
+        return cls(bot=bot, random_id=random_id, button_text=button_text, data=data), cursor
+
+
+class TranscribeAudio(TLRequest[tl.base.messages.TranscribedAudio]):
+    __tl_id__ = 0x269e9a49
+    __tl_name__ = "functions.messages.TranscribeAudio"
+    __tl_layer__ = 143
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TranscribeAudio:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TranscribeAudio, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class RateTranscribedAudio(TLRequest[bool]):
+    __tl_id__ = 0x7f1d072f
+    __tl_name__ = "functions.messages.RateTranscribedAudio"
+    __tl_layer__ = 143
+
+    __slots__ = ("peer", "msg_id", "transcription_id", "good", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, transcription_id: int, good: bool):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.transcription_id = transcription_id
+        self.good = good
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Long.write(self.transcription_id)
+        out += Bool.write(self.good)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RateTranscribedAudio:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        transcription_id = Long.read(stream)
+        good = Bool.read(stream)
+        return cls(peer=peer, msg_id=msg_id, transcription_id=transcription_id, good=good)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RateTranscribedAudio, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        transcription_id, cursor = Long.read_from(view, cursor)
+        good, cursor = Bool.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, transcription_id=transcription_id, good=good), cursor
+
+
+class GetCustomEmojiDocuments(TLRequest[list[tl.base.Document]]):
+    __tl_id__ = 0xd9ab0f54
+    __tl_name__ = "functions.messages.GetCustomEmojiDocuments"
+    __tl_layer__ = 144
+
+    __slots__ = ("document_id", )
+
+    def __init__(self, *, document_id: list[int]):
+        self.document_id = document_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += LongVector.write(self.document_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCustomEmojiDocuments:
+        document_id = LongVector.read(stream)
+        return cls(document_id=document_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCustomEmojiDocuments, int]:
+        document_id, cursor = LongVector.read_from(view, cursor)
+        return cls(document_id=document_id), cursor
+
+
+class GetEmojiStickers(TLRequest[tl.base.messages.AllStickers]):
+    __tl_id__ = 0xfbfca18f
+    __tl_name__ = "functions.messages.GetEmojiStickers"
+    __tl_layer__ = 144
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetEmojiStickers:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetEmojiStickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetFeaturedEmojiStickers(TLRequest[tl.base.messages.FeaturedStickers]):
+    __tl_id__ = 0xecf6736
+    __tl_name__ = "functions.messages.GetFeaturedEmojiStickers"
+    __tl_layer__ = 144
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFeaturedEmojiStickers:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFeaturedEmojiStickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class ReportReaction(TLRequest[bool]):
+    __tl_id__ = 0x3f64c076
+    __tl_name__ = "functions.messages.ReportReaction"
+    __tl_layer__ = 145
+
+    __slots__ = ("peer", "id", "reaction_peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, reaction_peer: tl.base.InputPeer):
+        self.peer = peer
+        self.id = id
+        self.reaction_peer = reaction_peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        self.reaction_peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportReaction:
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        reaction_peer = TLObject.read(stream)
+        return cls(peer=peer, id=id, reaction_peer=reaction_peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportReaction, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        reaction_peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, id=id, reaction_peer=reaction_peer), cursor
+
+
+class GetTopReactions(TLRequest[tl.base.messages.Reactions]):
+    __tl_id__ = 0xbb8125ba
+    __tl_name__ = "functions.messages.GetTopReactions"
+    __tl_layer__ = 145
+
+    __slots__ = ("limit", "hash", )
+
+    def __init__(self, *, limit: int, hash: int):
+        self.limit = limit
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.limit)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetTopReactions:
+        limit = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(limit=limit, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetTopReactions, int]:
+        limit, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(limit=limit, hash=hash), cursor
+
+
+class GetRecentReactions(TLRequest[tl.base.messages.Reactions]):
+    __tl_id__ = 0x39461db2
+    __tl_name__ = "functions.messages.GetRecentReactions"
+    __tl_layer__ = 145
+
+    __slots__ = ("limit", "hash", )
+
+    def __init__(self, *, limit: int, hash: int):
+        self.limit = limit
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.limit)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetRecentReactions:
+        limit = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(limit=limit, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetRecentReactions, int]:
+        limit, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(limit=limit, hash=hash), cursor
+
+
+class ClearRecentReactions(TLRequest[bool]):
+    __tl_id__ = 0x9dfeefb4
+    __tl_name__ = "functions.messages.ClearRecentReactions"
+    __tl_layer__ = 145
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClearRecentReactions:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClearRecentReactions, int]:
+        return cls(), cursor
+
+
+class GetExtendedMedia(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x84f80814
+    __tl_name__ = "functions.messages.GetExtendedMedia"
+    __tl_layer__ = 147
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetExtendedMedia:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetExtendedMedia, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class SetDefaultHistoryTTL(TLRequest[bool]):
+    __tl_id__ = 0x9eb51445
+    __tl_name__ = "functions.messages.SetDefaultHistoryTTL"
+    __tl_layer__ = 150
+
+    __slots__ = ("period", )
+
+    def __init__(self, *, period: int):
+        self.period = period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetDefaultHistoryTTL:
+        period = Int.read(stream)
+        return cls(period=period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetDefaultHistoryTTL, int]:
+        period, cursor = Int.read_from(view, cursor)
+        return cls(period=period), cursor
+
+
+class GetDefaultHistoryTTL(TLRequest[tl.types.DefaultHistoryTTL]):
+    __tl_id__ = 0x658b7188
+    __tl_name__ = "functions.messages.GetDefaultHistoryTTL"
+    __tl_layer__ = 150
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDefaultHistoryTTL:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDefaultHistoryTTL, int]:
+        return cls(), cursor
+
+
+class SendBotRequestedPeer(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x91b2d060
+    __tl_name__ = "functions.messages.SendBotRequestedPeer"
+    __tl_layer__ = 169
+
+    __slots__ = ("peer", "msg_id", "button_id", "requested_peers", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, button_id: int, requested_peers: list[tl.base.InputPeer]):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.button_id = button_id
+        self.requested_peers = requested_peers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Int.write(self.button_id)
+        TLObjectVector.write_to(out, self.requested_peers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendBotRequestedPeer:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        button_id = Int.read(stream)
+        requested_peers = TLObjectVector.read(stream)
+        return cls(peer=peer, msg_id=msg_id, button_id=button_id, requested_peers=requested_peers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendBotRequestedPeer, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        button_id, cursor = Int.read_from(view, cursor)
+        requested_peers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, button_id=button_id, requested_peers=requested_peers), cursor
+
+
+class GetEmojiGroups(TLRequest[tl.base.messages.EmojiGroups]):
+    __tl_id__ = 0x7488ce5b
+    __tl_name__ = "functions.messages.GetEmojiGroups"
+    __tl_layer__ = 152
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetEmojiGroups:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetEmojiGroups, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetEmojiStatusGroups(TLRequest[tl.base.messages.EmojiGroups]):
+    __tl_id__ = 0x2ecd56cd
+    __tl_name__ = "functions.messages.GetEmojiStatusGroups"
+    __tl_layer__ = 152
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetEmojiStatusGroups:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetEmojiStatusGroups, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetEmojiProfilePhotoGroups(TLRequest[tl.base.messages.EmojiGroups]):
+    __tl_id__ = 0x21a548f3
+    __tl_name__ = "functions.messages.GetEmojiProfilePhotoGroups"
+    __tl_layer__ = 152
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetEmojiProfilePhotoGroups:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetEmojiProfilePhotoGroups, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class SearchCustomEmoji(TLRequest[tl.base.EmojiList]):
+    __tl_id__ = 0x2c11c0d7
+    __tl_name__ = "functions.messages.SearchCustomEmoji"
+    __tl_layer__ = 152
+
+    __slots__ = ("emoticon", "hash", )
+
+    def __init__(self, *, emoticon: str, hash: int):
+        self.emoticon = emoticon
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.emoticon)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchCustomEmoji:
+        emoticon = String.read(stream)
+        hash = Long.read(stream)
+        return cls(emoticon=emoticon, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchCustomEmoji, int]:
+        emoticon, cursor = String.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(emoticon=emoticon, hash=hash), cursor
+
+
+class TogglePeerTranslations(TLRequest[bool]):
+    __tl_id__ = 0xe47cb579
+    __tl_name__ = "functions.messages.TogglePeerTranslations"
+    __tl_layer__ = 152
+
+    __slots__ = ("disabled", "peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, disabled: bool = False):
+        self.disabled = disabled
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.disabled: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TogglePeerTranslations:
+        flags1 = Int.read(stream)
+        disabled = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        return cls(disabled=disabled, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TogglePeerTranslations, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        disabled = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(disabled=disabled, peer=peer), cursor
+
+
+class GetBotApp(TLRequest[tl.types.messages.BotApp]):
+    __tl_id__ = 0x34fdc5c3
+    __tl_name__ = "functions.messages.GetBotApp"
+    __tl_layer__ = 155
+
+    __slots__ = ("app", "hash", )
+
+    def __init__(self, *, app: tl.base.InputBotApp, hash: int):
+        self.app = app
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.app.write_to(out, ctx)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBotApp:
+        app = TLObject.read(stream)
+        hash = Long.read(stream)
+        return cls(app=app, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBotApp, int]:
+        app, cursor = TLObject.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(app=app, hash=hash), cursor
+
+
+class RequestAppWebView(TLRequest[tl.base.WebViewResult]):
+    __tl_id__ = 0x53618bce
+    __tl_name__ = "functions.messages.RequestAppWebView"
+    __tl_layer__ = 183
+
+    __slots__ = ("write_allowed", "compact", "fullscreen", "peer", "app", "start_param", "theme_params", "platform", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, app: tl.base.InputBotApp, platform: str, write_allowed: bool = False, compact: bool = False, fullscreen: bool = False, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None):
+        self.write_allowed = write_allowed
+        self.compact = compact
+        self.fullscreen = fullscreen
+        self.peer = peer
+        self.app = app
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.platform = platform
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.write_allowed: flags1 |= (1 << 0)
+        if self.compact: flags1 |= (1 << 7)
+        if self.fullscreen: flags1 |= (1 << 8)
+        if self.start_param is not None: flags1 |= (1 << 1)
+        if self.theme_params is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.app.write_to(out, ctx)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        String.write_to(out, self.platform)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestAppWebView:
+        flags1 = Int.read(stream)
+        write_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        compact = (flags1 & (1 << 7)) == (1 << 7)
+        fullscreen = (flags1 & (1 << 8)) == (1 << 8)
+        peer = TLObject.read(stream)
+        app = TLObject.read(stream)
+        start_param = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        platform = String.read(stream)
+        return cls(write_allowed=write_allowed, compact=compact, fullscreen=fullscreen, peer=peer, app=app, start_param=start_param, theme_params=theme_params, platform=platform)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestAppWebView, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        write_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        compact = (flags1 & (1 << 7)) == (1 << 7)
+        fullscreen = (flags1 & (1 << 8)) == (1 << 8)
+        peer, cursor = TLObject.read_from(view, cursor)
+        app, cursor = TLObject.read_from(view, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        platform, cursor = String.read_from(view, cursor)
+        return cls(write_allowed=write_allowed, compact=compact, fullscreen=fullscreen, peer=peer, app=app, start_param=start_param, theme_params=theme_params, platform=platform), cursor
+
+
+class SetChatWallPaper(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x8ffacae1
+    __tl_name__ = "functions.messages.SetChatWallPaper"
+    __tl_layer__ = 158
+
+    __slots__ = ("for_both", "revert", "peer", "wallpaper", "settings", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, for_both: bool = False, revert: bool = False, wallpaper: tl.base.InputWallPaper | None = None, settings: tl.base.WallPaperSettings | None = None, id: int | None = None):
+        self.for_both = for_both
+        self.revert = revert
+        self.peer = peer
+        self.wallpaper = wallpaper
+        self.settings = settings
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.for_both: flags1 |= (1 << 3)
+        if self.revert: flags1 |= (1 << 4)
+        if self.wallpaper is not None: flags1 |= (1 << 0)
+        if self.settings is not None: flags1 |= (1 << 2)
+        if self.id is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.wallpaper is not None:
+            self.wallpaper.write_to(out, ctx)
+        if self.settings is not None:
+            self.settings.write_to(out, ctx)
+        if self.id is not None:
+            out += Int.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetChatWallPaper:
+        flags1 = Int.read(stream)
+        for_both = (flags1 & (1 << 3)) == (1 << 3)
+        revert = (flags1 & (1 << 4)) == (1 << 4)
+        peer = TLObject.read(stream)
+        wallpaper = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        settings = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(for_both=for_both, revert=revert, peer=peer, wallpaper=wallpaper, settings=settings, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetChatWallPaper, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        for_both = (flags1 & (1 << 3)) == (1 << 3)
+        revert = (flags1 & (1 << 4)) == (1 << 4)
+        peer, cursor = TLObject.read_from(view, cursor)
+        wallpaper, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        settings, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(for_both=for_both, revert=revert, peer=peer, wallpaper=wallpaper, settings=settings, id=id), cursor
+
+
+class SearchEmojiStickerSets(TLRequest[tl.base.messages.FoundStickerSets]):
+    __tl_id__ = 0x92b4494c
+    __tl_name__ = "functions.messages.SearchEmojiStickerSets"
+    __tl_layer__ = 167
+
+    __slots__ = ("exclude_featured", "q", "hash", )
+
+    def __init__(self, *, q: str, hash: int, exclude_featured: bool = False):
+        self.exclude_featured = exclude_featured
+        self.q = q
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.exclude_featured: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.q)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchEmojiStickerSets:
+        flags1 = Int.read(stream)
+        exclude_featured = (flags1 & (1 << 0)) == (1 << 0)
+        q = String.read(stream)
+        hash = Long.read(stream)
+        return cls(exclude_featured=exclude_featured, q=q, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchEmojiStickerSets, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        exclude_featured = (flags1 & (1 << 0)) == (1 << 0)
+        q, cursor = String.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(exclude_featured=exclude_featured, q=q, hash=hash), cursor
+
+
+class GetSavedDialogs(TLRequest[tl.base.messages.SavedDialogs]):
+    __tl_id__ = 0x5381d21a
+    __tl_name__ = "functions.messages.GetSavedDialogs"
+    __tl_layer__ = 170
+
+    __slots__ = ("exclude_pinned", "offset_date", "offset_id", "offset_peer", "limit", "hash", )
+
+    def __init__(self, *, offset_date: int, offset_id: int, offset_peer: tl.base.InputPeer, limit: int, hash: int, exclude_pinned: bool = False):
+        self.exclude_pinned = exclude_pinned
+        self.offset_date = offset_date
+        self.offset_id = offset_id
+        self.offset_peer = offset_peer
+        self.limit = limit
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.exclude_pinned: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.offset_date)
+        out += Int.write(self.offset_id)
+        self.offset_peer.write_to(out, ctx)
+        out += Int.write(self.limit)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSavedDialogs:
+        flags1 = Int.read(stream)
+        exclude_pinned = (flags1 & (1 << 0)) == (1 << 0)
+        offset_date = Int.read(stream)
+        offset_id = Int.read(stream)
+        offset_peer = TLObject.read(stream)
+        limit = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(exclude_pinned=exclude_pinned, offset_date=offset_date, offset_id=offset_id, offset_peer=offset_peer, limit=limit, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSavedDialogs, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        exclude_pinned = (flags1 & (1 << 0)) == (1 << 0)
+        offset_date, cursor = Int.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        offset_peer, cursor = TLObject.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(exclude_pinned=exclude_pinned, offset_date=offset_date, offset_id=offset_id, offset_peer=offset_peer, limit=limit, hash=hash), cursor
+
+
+class GetSavedHistory(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x3d9a414d
+    __tl_name__ = "functions.messages.GetSavedHistory"
+    __tl_layer__ = 170
+
+    __slots__ = ("peer", "offset_id", "offset_date", "add_offset", "limit", "max_id", "min_id", "hash", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset_id: int, offset_date: int, add_offset: int, limit: int, max_id: int, min_id: int, hash: int):
+        self.peer = peer
+        self.offset_id = offset_id
+        self.offset_date = offset_date
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.offset_date)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSavedHistory:
+        peer = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        offset_date = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(peer=peer, offset_id=offset_id, offset_date=offset_date, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSavedHistory, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, offset_id=offset_id, offset_date=offset_date, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash), cursor
+
+
+class DeleteSavedHistory(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0x6e98102b
+    __tl_name__ = "functions.messages.DeleteSavedHistory"
+    __tl_layer__ = 170
+
+    __slots__ = ("peer", "max_id", "min_date", "max_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, max_id: int, min_date: int | None = None, max_date: int | None = None):
+        self.peer = peer
+        self.max_id = max_id
+        self.min_date = min_date
+        self.max_date = max_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.min_date is not None: flags1 |= (1 << 2)
+        if self.max_date is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.max_id)
+        if self.min_date is not None:
+            out += Int.write(self.min_date)
+        if self.max_date is not None:
+            out += Int.write(self.max_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteSavedHistory:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        max_id = Int.read(stream)
+        min_date = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        max_date = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(peer=peer, max_id=max_id, min_date=min_date, max_date=max_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteSavedHistory, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        max_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(peer=peer, max_id=max_id, min_date=min_date, max_date=max_date), cursor
+
+
+class GetPinnedSavedDialogs(TLRequest[tl.base.messages.SavedDialogs]):
+    __tl_id__ = 0xd63d94e0
+    __tl_name__ = "functions.messages.GetPinnedSavedDialogs"
+    __tl_layer__ = 170
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPinnedSavedDialogs:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPinnedSavedDialogs, int]:
+        return cls(), cursor
+
+
+class ToggleSavedDialogPin(TLRequest[bool]):
+    __tl_id__ = 0xac81bbde
+    __tl_name__ = "functions.messages.ToggleSavedDialogPin"
+    __tl_layer__ = 170
+
+    __slots__ = ("pinned", "peer", )
+
+    def __init__(self, *, peer: tl.base.InputDialogPeer, pinned: bool = False):
+        self.pinned = pinned
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pinned: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleSavedDialogPin:
+        flags1 = Int.read(stream)
+        pinned = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        return cls(pinned=pinned, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleSavedDialogPin, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pinned = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(pinned=pinned, peer=peer), cursor
+
+
+class ReorderPinnedSavedDialogs(TLRequest[bool]):
+    __tl_id__ = 0x8b716587
+    __tl_name__ = "functions.messages.ReorderPinnedSavedDialogs"
+    __tl_layer__ = 170
+
+    __slots__ = ("force", "order", )
+
+    def __init__(self, *, order: list[tl.base.InputDialogPeer], force: bool = False):
+        self.force = force
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.force: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        TLObjectVector.write_to(out, self.order, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReorderPinnedSavedDialogs:
+        flags1 = Int.read(stream)
+        force = (flags1 & (1 << 0)) == (1 << 0)
+        order = TLObjectVector.read(stream)
+        return cls(force=force, order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReorderPinnedSavedDialogs, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        force = (flags1 & (1 << 0)) == (1 << 0)
+        order, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(force=force, order=order), cursor
+
+
+class GetSavedReactionTags(TLRequest[tl.base.messages.SavedReactionTags]):
+    __tl_id__ = 0x3637e05b
+    __tl_name__ = "functions.messages.GetSavedReactionTags"
+    __tl_layer__ = 174
+
+    __slots__ = ("peer", "hash", )
+
+    def __init__(self, *, hash: int, peer: tl.base.InputPeer | None = None):
+        self.peer = peer
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.peer is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.peer is not None:
+            self.peer.write_to(out, ctx)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSavedReactionTags:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        hash = Long.read(stream)
+        return cls(peer=peer, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSavedReactionTags, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, hash=hash), cursor
+
+
+class UpdateSavedReactionTag(TLRequest[bool]):
+    __tl_id__ = 0x60297dec
+    __tl_name__ = "functions.messages.UpdateSavedReactionTag"
+    __tl_layer__ = 171
+
+    __slots__ = ("reaction", "title", )
+
+    def __init__(self, *, reaction: tl.base.Reaction, title: str | None = None):
+        self.reaction = reaction
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.title is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.reaction.write_to(out, ctx)
+        if self.title is not None:
+            String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateSavedReactionTag:
+        flags1 = Int.read(stream)
+        reaction = TLObject.read(stream)
+        title = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(reaction=reaction, title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateSavedReactionTag, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        reaction, cursor = TLObject.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(reaction=reaction, title=title), cursor
+
+
+class GetDefaultTagReactions(TLRequest[tl.base.messages.Reactions]):
+    __tl_id__ = 0xbdf93428
+    __tl_name__ = "functions.messages.GetDefaultTagReactions"
+    __tl_layer__ = 171
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDefaultTagReactions:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDefaultTagReactions, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetOutboxReadDate(TLRequest[tl.types.OutboxReadDate]):
+    __tl_id__ = 0x8c4bfe5d
+    __tl_name__ = "functions.messages.GetOutboxReadDate"
+    __tl_layer__ = 174
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetOutboxReadDate:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetOutboxReadDate, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class GetQuickReplies(TLRequest[tl.base.messages.QuickReplies]):
+    __tl_id__ = 0xd483f2a8
+    __tl_name__ = "functions.messages.GetQuickReplies"
+    __tl_layer__ = 176
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetQuickReplies:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetQuickReplies, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class ReorderQuickReplies(TLRequest[bool]):
+    __tl_id__ = 0x60331907
+    __tl_name__ = "functions.messages.ReorderQuickReplies"
+    __tl_layer__ = 176
+
+    __slots__ = ("order", )
+
+    def __init__(self, *, order: list[int]):
+        self.order = order
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.order)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReorderQuickReplies:
+        order = IntVector.read(stream)
+        return cls(order=order)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReorderQuickReplies, int]:
+        order, cursor = IntVector.read_from(view, cursor)
+        return cls(order=order), cursor
+
+
+class CheckQuickReplyShortcut(TLRequest[bool]):
+    __tl_id__ = 0xf1d0fbd3
+    __tl_name__ = "functions.messages.CheckQuickReplyShortcut"
+    __tl_layer__ = 176
+
+    __slots__ = ("shortcut", )
+
+    def __init__(self, *, shortcut: str):
+        self.shortcut = shortcut
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.shortcut)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckQuickReplyShortcut:
+        shortcut = String.read(stream)
+        return cls(shortcut=shortcut)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckQuickReplyShortcut, int]:
+        shortcut, cursor = String.read_from(view, cursor)
+        return cls(shortcut=shortcut), cursor
+
+
+class EditQuickReplyShortcut(TLRequest[bool]):
+    __tl_id__ = 0x5c003cef
+    __tl_name__ = "functions.messages.EditQuickReplyShortcut"
+    __tl_layer__ = 176
+
+    __slots__ = ("shortcut_id", "shortcut", )
+
+    def __init__(self, *, shortcut_id: int, shortcut: str):
+        self.shortcut_id = shortcut_id
+        self.shortcut = shortcut
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.shortcut_id)
+        String.write_to(out, self.shortcut)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditQuickReplyShortcut:
+        shortcut_id = Int.read(stream)
+        shortcut = String.read(stream)
+        return cls(shortcut_id=shortcut_id, shortcut=shortcut)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditQuickReplyShortcut, int]:
+        shortcut_id, cursor = Int.read_from(view, cursor)
+        shortcut, cursor = String.read_from(view, cursor)
+        return cls(shortcut_id=shortcut_id, shortcut=shortcut), cursor
+
+
+class DeleteQuickReplyShortcut(TLRequest[bool]):
+    __tl_id__ = 0x3cc04740
+    __tl_name__ = "functions.messages.DeleteQuickReplyShortcut"
+    __tl_layer__ = 176
+
+    __slots__ = ("shortcut_id", )
+
+    def __init__(self, *, shortcut_id: int):
+        self.shortcut_id = shortcut_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.shortcut_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteQuickReplyShortcut:
+        shortcut_id = Int.read(stream)
+        return cls(shortcut_id=shortcut_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteQuickReplyShortcut, int]:
+        shortcut_id, cursor = Int.read_from(view, cursor)
+        return cls(shortcut_id=shortcut_id), cursor
+
+
+class GetQuickReplyMessages(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x94a495c3
+    __tl_name__ = "functions.messages.GetQuickReplyMessages"
+    __tl_layer__ = 176
+
+    __slots__ = ("shortcut_id", "id", "hash", )
+
+    def __init__(self, *, shortcut_id: int, hash: int, id: list[int] | None = None):
+        self.shortcut_id = shortcut_id
+        self.id = id
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.id: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.shortcut_id)
+        if self.id:
+            out += IntVector.write(self.id)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetQuickReplyMessages:
+        flags1 = Int.read(stream)
+        shortcut_id = Int.read(stream)
+        id = IntVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        hash = Long.read(stream)
+        return cls(shortcut_id=shortcut_id, id=id, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetQuickReplyMessages, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        shortcut_id, cursor = Int.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(shortcut_id=shortcut_id, id=id, hash=hash), cursor
+
+
+class SendQuickReplyMessages(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x6c750de1
+    __tl_name__ = "functions.messages.SendQuickReplyMessages"
+    __tl_layer__ = 177
+
+    __slots__ = ("peer", "shortcut_id", "id", "random_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, shortcut_id: int, id: list[int], random_id: list[int]):
+        self.peer = peer
+        self.shortcut_id = shortcut_id
+        self.id = id
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.shortcut_id)
+        out += IntVector.write(self.id)
+        out += LongVector.write(self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendQuickReplyMessages:
+        peer = TLObject.read(stream)
+        shortcut_id = Int.read(stream)
+        id = IntVector.read(stream)
+        random_id = LongVector.read(stream)
+        return cls(peer=peer, shortcut_id=shortcut_id, id=id, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendQuickReplyMessages, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        shortcut_id, cursor = Int.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        random_id, cursor = LongVector.read_from(view, cursor)
+        return cls(peer=peer, shortcut_id=shortcut_id, id=id, random_id=random_id), cursor
+
+
+class DeleteQuickReplyMessages(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xe105e910
+    __tl_name__ = "functions.messages.DeleteQuickReplyMessages"
+    __tl_layer__ = 176
+
+    __slots__ = ("shortcut_id", "id", )
+
+    def __init__(self, *, shortcut_id: int, id: list[int]):
+        self.shortcut_id = shortcut_id
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.shortcut_id)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteQuickReplyMessages:
+        shortcut_id = Int.read(stream)
+        id = IntVector.read(stream)
+        return cls(shortcut_id=shortcut_id, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteQuickReplyMessages, int]:
+        shortcut_id, cursor = Int.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(shortcut_id=shortcut_id, id=id), cursor
+
+
+class ToggleDialogFilterTags(TLRequest[bool]):
+    __tl_id__ = 0xfd2dda49
+    __tl_name__ = "functions.messages.ToggleDialogFilterTags"
+    __tl_layer__ = 176
+
+    __slots__ = ("enabled", )
+
+    def __init__(self, *, enabled: bool):
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleDialogFilterTags:
+        enabled = Bool.read(stream)
+        return cls(enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleDialogFilterTags, int]:
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(enabled=enabled), cursor
+
+
+class GetMyStickers(TLRequest[tl.types.messages.MyStickers]):
+    __tl_id__ = 0xd0b5e1fc
+    __tl_name__ = "functions.messages.GetMyStickers"
+    __tl_layer__ = 177
+
+    __slots__ = ("offset_id", "limit", )
+
+    def __init__(self, *, offset_id: int, limit: int):
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMyStickers:
+        offset_id = Long.read(stream)
+        limit = Int.read(stream)
+        return cls(offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMyStickers, int]:
+        offset_id, cursor = Long.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(offset_id=offset_id, limit=limit), cursor
+
+
+class GetEmojiStickerGroups(TLRequest[tl.base.messages.EmojiGroups]):
+    __tl_id__ = 0x1dd840f5
+    __tl_name__ = "functions.messages.GetEmojiStickerGroups"
+    __tl_layer__ = 179
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetEmojiStickerGroups:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetEmojiStickerGroups, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class GetAvailableEffects(TLRequest[tl.base.messages.AvailableEffects]):
+    __tl_id__ = 0xdea20a39
+    __tl_name__ = "functions.messages.GetAvailableEffects"
+    __tl_layer__ = 181
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAvailableEffects:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAvailableEffects, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class EditFactCheck(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x589ee75
+    __tl_name__ = "functions.messages.EditFactCheck"
+    __tl_layer__ = 181
+
+    __slots__ = ("peer", "msg_id", "text", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, text: tl.types.TextWithEntities):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.text = text
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        self.text.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditFactCheck:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        text = tl.types.TextWithEntities.read(stream)
+        return cls(peer=peer, msg_id=msg_id, text=text)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditFactCheck, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        text, cursor = tl.types.TextWithEntities.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, text=text), cursor
+
+
+class DeleteFactCheck(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd1da940c
+    __tl_name__ = "functions.messages.DeleteFactCheck"
+    __tl_layer__ = 181
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteFactCheck:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteFactCheck, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class GetFactCheck(TLRequest[list[tl.base.FactCheck]]):
+    __tl_id__ = 0xb9cdc5ee
+    __tl_name__ = "functions.messages.GetFactCheck"
+    __tl_layer__ = 181
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: list[int]):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFactCheck:
+        peer = TLObject.read(stream)
+        msg_id = IntVector.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFactCheck, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class RequestMainWebView(TLRequest[tl.base.WebViewResult]):
+    __tl_id__ = 0xc9e01e7b
+    __tl_name__ = "functions.messages.RequestMainWebView"
+    __tl_layer__ = 185
+
+    __slots__ = ("compact", "fullscreen", "peer", "bot", "start_param", "theme_params", "platform", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, platform: str, compact: bool = False, fullscreen: bool = False, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None):
+        self.compact = compact
+        self.fullscreen = fullscreen
+        self.peer = peer
+        self.bot = bot
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.platform = platform
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.compact: flags1 |= (1 << 7)
+        if self.fullscreen: flags1 |= (1 << 8)
+        if self.start_param is not None: flags1 |= (1 << 1)
+        if self.theme_params is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        String.write_to(out, self.platform)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestMainWebView:
+        flags1 = Int.read(stream)
+        compact = (flags1 & (1 << 7)) == (1 << 7)
+        fullscreen = (flags1 & (1 << 8)) == (1 << 8)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        start_param = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        platform = String.read(stream)
+        return cls(compact=compact, fullscreen=fullscreen, peer=peer, bot=bot, start_param=start_param, theme_params=theme_params, platform=platform)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestMainWebView, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        compact = (flags1 & (1 << 7)) == (1 << 7)
+        fullscreen = (flags1 & (1 << 8)) == (1 << 8)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        platform, cursor = String.read_from(view, cursor)
+        return cls(compact=compact, fullscreen=fullscreen, peer=peer, bot=bot, start_param=start_param, theme_params=theme_params, platform=platform), cursor
+
+
+class SendPaidReaction(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x58bbcb50
+    __tl_name__ = "functions.messages.SendPaidReaction"
+    __tl_layer__ = 199
+
+    __slots__ = ("peer", "msg_id", "count", "random_id", "private", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, count: int, random_id: int, private: tl.base.PaidReactionPrivacy | None = None):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.count = count
+        self.random_id = random_id
+        self.private = private
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.private is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Int.write(self.count)
+        out += Long.write(self.random_id)
+        if self.private is not None:
+            self.private.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendPaidReaction:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        count = Int.read(stream)
+        random_id = Long.read(stream)
+        private = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(peer=peer, msg_id=msg_id, count=count, random_id=random_id, private=private)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendPaidReaction, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        private, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(peer=peer, msg_id=msg_id, count=count, random_id=random_id, private=private), cursor
+
+
+class TogglePaidReactionPrivacy(TLRequest[bool]):
+    __tl_id__ = 0x435885b5
+    __tl_name__ = "functions.messages.TogglePaidReactionPrivacy"
+    __tl_layer__ = 199
+
+    __slots__ = ("peer", "msg_id", "private", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, private: tl.base.PaidReactionPrivacy):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.private = private
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        self.private.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TogglePaidReactionPrivacy:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        private = TLObject.read(stream)
+        return cls(peer=peer, msg_id=msg_id, private=private)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TogglePaidReactionPrivacy, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        private, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, private=private), cursor
+
+
+class GetPaidReactionPrivacy(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x472455aa
+    __tl_name__ = "functions.messages.GetPaidReactionPrivacy"
+    __tl_layer__ = 187
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPaidReactionPrivacy:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPaidReactionPrivacy, int]:
+        return cls(), cursor
+
+
+class ViewSponsoredMessage(TLRequest[bool]):
+    __tl_id__ = 0x269e3643
+    __tl_name__ = "functions.messages.ViewSponsoredMessage"
+    __tl_layer__ = 201
+
+    __slots__ = ("random_id", )
+
+    def __init__(self, *, random_id: bytes):
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ViewSponsoredMessage:
+        random_id = Bytes.read(stream)
+        return cls(random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ViewSponsoredMessage, int]:
+        random_id, cursor = Bytes.read_from(view, cursor)
+        return cls(random_id=random_id), cursor
+
+
+class ClickSponsoredMessage(TLRequest[bool]):
+    __tl_id__ = 0x8235057e
+    __tl_name__ = "functions.messages.ClickSponsoredMessage"
+    __tl_layer__ = 201
+
+    __slots__ = ("media", "fullscreen", "random_id", )
+
+    def __init__(self, *, random_id: bytes, media: bool = False, fullscreen: bool = False):
+        self.media = media
+        self.fullscreen = fullscreen
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.media: flags1 |= (1 << 0)
+        if self.fullscreen: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        Bytes.write_to(out, self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClickSponsoredMessage:
+        flags1 = Int.read(stream)
+        media = (flags1 & (1 << 0)) == (1 << 0)
+        fullscreen = (flags1 & (1 << 1)) == (1 << 1)
+        random_id = Bytes.read(stream)
+        return cls(media=media, fullscreen=fullscreen, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClickSponsoredMessage, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        media = (flags1 & (1 << 0)) == (1 << 0)
+        fullscreen = (flags1 & (1 << 1)) == (1 << 1)
+        random_id, cursor = Bytes.read_from(view, cursor)
+        return cls(media=media, fullscreen=fullscreen, random_id=random_id), cursor
+
+
+class ReportSponsoredMessage(TLRequest[tl.base.channels.SponsoredMessageReportResult]):
+    __tl_id__ = 0x12cbf0c4
+    __tl_name__ = "functions.messages.ReportSponsoredMessage"
+    __tl_layer__ = 201
+
+    __slots__ = ("random_id", "option", )
+
+    def __init__(self, *, random_id: bytes, option: bytes):
+        self.random_id = random_id
+        self.option = option
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.random_id)
+        Bytes.write_to(out, self.option)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportSponsoredMessage:
+        random_id = Bytes.read(stream)
+        option = Bytes.read(stream)
+        return cls(random_id=random_id, option=option)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportSponsoredMessage, int]:
+        random_id, cursor = Bytes.read_from(view, cursor)
+        option, cursor = Bytes.read_from(view, cursor)
+        return cls(random_id=random_id, option=option), cursor
+
+
+class GetSponsoredMessages(TLRequest[tl.base.messages.SponsoredMessages]):
+    __tl_id__ = 0x9bd2f439
+    __tl_name__ = "functions.messages.GetSponsoredMessages"
+    __tl_layer__ = 192
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSponsoredMessages:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSponsoredMessages, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class SavePreparedInlineMessage(TLRequest[tl.types.messages.BotPreparedInlineMessage]):
+    __tl_id__ = 0xf21f7f2f
+    __tl_name__ = "functions.messages.SavePreparedInlineMessage"
+    __tl_layer__ = 193
+
+    __slots__ = ("result", "user_id", "peer_types", )
+
+    def __init__(self, *, result: tl.base.InputBotInlineResult, user_id: tl.base.InputUser, peer_types: list[tl.base.InlineQueryPeerType] | None = None):
+        self.result = result
+        self.user_id = user_id
+        self.peer_types = peer_types
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.peer_types: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.result.write_to(out, ctx)
+        self.user_id.write_to(out, ctx)
+        if self.peer_types:
+            TLObjectVector.write_to(out, self.peer_types, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavePreparedInlineMessage:
+        flags1 = Int.read(stream)
+        result = TLObject.read(stream)
+        user_id = TLObject.read(stream)
+        peer_types = TLObjectVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(result=result, user_id=user_id, peer_types=peer_types)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavePreparedInlineMessage, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        result, cursor = TLObject.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        peer_types, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(result=result, user_id=user_id, peer_types=peer_types), cursor
+
+
+class GetPreparedInlineMessage(TLRequest[tl.types.messages.PreparedInlineMessage]):
+    __tl_id__ = 0x857ebdb8
+    __tl_name__ = "functions.messages.GetPreparedInlineMessage"
+    __tl_layer__ = 193
+
+    __slots__ = ("bot", "id", )
+
+    def __init__(self, *, bot: tl.base.InputUser, id: str):
+        self.bot = bot
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPreparedInlineMessage:
+        bot = TLObject.read(stream)
+        id = String.read(stream)
+        return cls(bot=bot, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPreparedInlineMessage, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        id, cursor = String.read_from(view, cursor)
+        return cls(bot=bot, id=id), cursor
+
+
+class SearchStickers(TLRequest[tl.base.messages.FoundStickers]):
+    __tl_id__ = 0x29b1c66a
+    __tl_name__ = "functions.messages.SearchStickers"
+    __tl_layer__ = 195
+
+    __slots__ = ("emojis", "q", "emoticon", "lang_code", "offset", "limit", "hash", )
+
+    def __init__(self, *, q: str, emoticon: str, lang_code: list[str], offset: int, limit: int, hash: int, emojis: bool = False):
+        self.emojis = emojis
+        self.q = q
+        self.emoticon = emoticon
+        self.lang_code = lang_code
+        self.offset = offset
+        self.limit = limit
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.emojis: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.q)
+        String.write_to(out, self.emoticon)
+        out += StringVector.write(self.lang_code)
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchStickers:
+        flags1 = Int.read(stream)
+        emojis = (flags1 & (1 << 0)) == (1 << 0)
+        q = String.read(stream)
+        emoticon = String.read(stream)
+        lang_code = StringVector.read(stream)
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(emojis=emojis, q=q, emoticon=emoticon, lang_code=lang_code, offset=offset, limit=limit, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchStickers, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        emojis = (flags1 & (1 << 0)) == (1 << 0)
+        q, cursor = String.read_from(view, cursor)
+        emoticon, cursor = String.read_from(view, cursor)
+        lang_code, cursor = StringVector.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(emojis=emojis, q=q, emoticon=emoticon, lang_code=lang_code, offset=offset, limit=limit, hash=hash), cursor
+
+
+class ReportMessagesDelivery(TLRequest[bool]):
+    __tl_id__ = 0x5a6d7395
+    __tl_name__ = "functions.messages.ReportMessagesDelivery"
+    __tl_layer__ = 196
+
+    __slots__ = ("push", "peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int], push: bool = False):
+        self.push = push
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.push: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportMessagesDelivery:
+        flags1 = Int.read(stream)
+        push = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(push=push, peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportMessagesDelivery, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        push = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(push=push, peer=peer, id=id), cursor
+
+
+class GetMessages_57(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x4222fa74
+    __tl_name__ = "functions.messages.GetMessages_57"
+    __tl_layer__ = 57
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[int]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessages_57:
+        id = IntVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessages_57, int]:
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class Search_133(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0xa0fda762
+    __tl_name__ = "functions.messages.Search_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "q", "from_id", "top_msg_id", "filter", "min_date", "max_date", "offset_id", "add_offset", "limit", "max_id", "min_id", "hash", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, q: str, filter: tl.base.MessagesFilter, min_date: int, max_date: int, offset_id: int, add_offset: int, limit: int, max_id: int, min_id: int, hash: int, from_id: tl.base.InputPeer | None = None, top_msg_id: int | None = None):
+        self.peer = peer
+        self.q = q
+        self.from_id = from_id
+        self.top_msg_id = top_msg_id
+        self.filter = filter
+        self.min_date = min_date
+        self.max_date = max_date
+        self.offset_id = offset_id
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_id is not None: flags1 |= (1 << 0)
+        if self.top_msg_id is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.q)
+        if self.from_id is not None:
+            self.from_id.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.min_date)
+        out += Int.write(self.max_date)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Search_133:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        q = String.read(stream)
+        from_id = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        filter = TLObject.read(stream)
+        min_date = Int.read(stream)
+        max_date = Int.read(stream)
+        offset_id = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(peer=peer, q=q, from_id=from_id, top_msg_id=top_msg_id, filter=filter, min_date=min_date, max_date=max_date, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Search_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        q, cursor = String.read_from(view, cursor)
+        from_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        min_date, cursor = Int.read_from(view, cursor)
+        max_date, cursor = Int.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, q=q, from_id=from_id, top_msg_id=top_msg_id, filter=filter, min_date=min_date, max_date=max_date, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash), cursor
+
+
+class DeleteHistory_133(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0x1c015b09
+    __tl_name__ = "functions.messages.DeleteHistory_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("just_clear", "revoke", "peer", "max_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, max_id: int, just_clear: bool = False, revoke: bool = False):
+        self.just_clear = just_clear
+        self.revoke = revoke
+        self.peer = peer
+        self.max_id = max_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.just_clear: flags1 |= (1 << 0)
+        if self.revoke: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.max_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteHistory_133:
+        flags1 = Int.read(stream)
+        just_clear = (flags1 & (1 << 0)) == (1 << 0)
+        revoke = (flags1 & (1 << 1)) == (1 << 1)
+        peer = TLObject.read(stream)
+        max_id = Int.read(stream)
+        return cls(just_clear=just_clear, revoke=revoke, peer=peer, max_id=max_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteHistory_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        just_clear = (flags1 & (1 << 0)) == (1 << 0)
+        revoke = (flags1 & (1 << 1)) == (1 << 1)
+        peer, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        return cls(just_clear=just_clear, revoke=revoke, peer=peer, max_id=max_id), cursor
+
+
+class SendMessage_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x520c3870
+    __tl_name__ = "functions.messages.SendMessage_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("no_webpage", "silent", "background", "clear_draft", "peer", "reply_to_msg_id", "message", "random_id", "reply_markup", "entities", "schedule_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, random_id: int, no_webpage: bool = False, silent: bool = False, background: bool = False, clear_draft: bool = False, reply_to_msg_id: int | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None):
+        self.no_webpage = no_webpage
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMessage_133:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, peer=peer, reply_to_msg_id=reply_to_msg_id, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMessage_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, peer=peer, reply_to_msg_id=reply_to_msg_id, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date), cursor
+
+
+class SendMedia_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x3491eba9
+    __tl_name__ = "functions.messages.SendMedia_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("silent", "background", "clear_draft", "peer", "reply_to_msg_id", "media", "message", "random_id", "reply_markup", "entities", "schedule_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, message: str, random_id: int, silent: bool = False, background: bool = False, clear_draft: bool = False, reply_to_msg_id: int | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.media = media
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        self.media.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMedia_133:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        media = TLObject.read(stream)
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, peer=peer, reply_to_msg_id=reply_to_msg_id, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMedia_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, peer=peer, reply_to_msg_id=reply_to_msg_id, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date), cursor
+
+
+class ForwardMessages_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd9fee60e
+    __tl_name__ = "functions.messages.ForwardMessages_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("silent", "background", "with_my_score", "drop_author", "drop_media_captions", "from_peer", "id", "random_id", "to_peer", "schedule_date", )
+
+    def __init__(self, *, from_peer: tl.base.InputPeer, id: list[int], random_id: list[int], to_peer: tl.base.InputPeer, silent: bool = False, background: bool = False, with_my_score: bool = False, drop_author: bool = False, drop_media_captions: bool = False, schedule_date: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.with_my_score = with_my_score
+        self.drop_author = drop_author
+        self.drop_media_captions = drop_media_captions
+        self.from_peer = from_peer
+        self.id = id
+        self.random_id = random_id
+        self.to_peer = to_peer
+        self.schedule_date = schedule_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.with_my_score: flags1 |= (1 << 8)
+        if self.drop_author: flags1 |= (1 << 11)
+        if self.drop_media_captions: flags1 |= (1 << 12)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        out += Int.write(flags1)
+        self.from_peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        out += LongVector.write(self.random_id)
+        self.to_peer.write_to(out, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ForwardMessages_133:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        from_peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        random_id = LongVector.read(stream)
+        to_peer = TLObject.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, schedule_date=schedule_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ForwardMessages_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        from_peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        random_id, cursor = LongVector.read_from(view, cursor)
+        to_peer, cursor = TLObject.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, schedule_date=schedule_date), cursor
+
+
+class GetPeerSettings_133(TLRequest[tl.base.PeerSettings]):
+    __tl_id__ = 0x3672e09c
+    __tl_name__ = "functions.messages.GetPeerSettings_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPeerSettings_133:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPeerSettings_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class Report_133(TLRequest[bool]):
+    __tl_id__ = 0x8953ab4e
+    __tl_name__ = "functions.messages.Report_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "id", "reason", "message", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int], reason: tl.base.ReportReason, message: str):
+        self.peer = peer
+        self.id = id
+        self.reason = reason
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        self.reason.write_to(out, ctx)
+        String.write_to(out, self.message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Report_133:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        reason = TLObject.read(stream)
+        message = String.read(stream)
+        return cls(peer=peer, id=id, reason=reason, message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Report_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        reason, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, id=id, reason=reason, message=message), cursor
+
+
+class AddChatUser_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf24753e3
+    __tl_name__ = "functions.messages.AddChatUser_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("chat_id", "user_id", "fwd_limit", )
+
+    def __init__(self, *, chat_id: int, user_id: tl.base.InputUser, fwd_limit: int):
+        self.chat_id = chat_id
+        self.user_id = user_id
+        self.fwd_limit = fwd_limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.chat_id)
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.fwd_limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AddChatUser_133:
+        chat_id = Long.read(stream)
+        user_id = TLObject.read(stream)
+        fwd_limit = Int.read(stream)
+        return cls(chat_id=chat_id, user_id=user_id, fwd_limit=fwd_limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AddChatUser_133, int]:
+        chat_id, cursor = Long.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        fwd_limit, cursor = Int.read_from(view, cursor)
+        return cls(chat_id=chat_id, user_id=user_id, fwd_limit=fwd_limit), cursor
+
+
+class CreateChat_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x9cb126e
+    __tl_name__ = "functions.messages.CreateChat_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("users", "title", )
+
+    def __init__(self, *, users: list[tl.base.InputUser], title: str):
+        self.users = users
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.users, ctx)
+        String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateChat_133:
+        users = TLObjectVector.read(stream)
+        title = String.read(stream)
+        return cls(users=users, title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateChat_133, int]:
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        return cls(users=users, title=title), cursor
+
+
+class GetWebPagePreview_133(TLRequest[tl.base.MessageMedia]):
+    __tl_id__ = 0x8b68b0cc
+    __tl_name__ = "functions.messages.GetWebPagePreview_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("message", "entities", )
+
+    def __init__(self, *, message: str, entities: list[tl.base.MessageEntity] | None = None):
+        self.message = message
+        self.entities = entities
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.entities: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        String.write_to(out, self.message)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetWebPagePreview_133:
+        flags1 = Int.read(stream)
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(message=message, entities=entities)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetWebPagePreview_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(message=message, entities=entities), cursor
+
+
+class ExportChatInvite_133(TLRequest[tl.base.ExportedChatInvite]):
+    __tl_id__ = 0x14b9bcd7
+    __tl_name__ = "functions.messages.ExportChatInvite_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("legacy_revoke_permanent", "peer", "expire_date", "usage_limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, legacy_revoke_permanent: bool = False, expire_date: int | None = None, usage_limit: int | None = None):
+        self.legacy_revoke_permanent = legacy_revoke_permanent
+        self.peer = peer
+        self.expire_date = expire_date
+        self.usage_limit = usage_limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.legacy_revoke_permanent: flags1 |= (1 << 2)
+        if self.expire_date is not None: flags1 |= (1 << 0)
+        if self.usage_limit is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.expire_date is not None:
+            out += Int.write(self.expire_date)
+        if self.usage_limit is not None:
+            out += Int.write(self.usage_limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportChatInvite_133:
+        flags1 = Int.read(stream)
+        legacy_revoke_permanent = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream)
+        expire_date = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        usage_limit = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(legacy_revoke_permanent=legacy_revoke_permanent, peer=peer, expire_date=expire_date, usage_limit=usage_limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportChatInvite_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        legacy_revoke_permanent = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor)
+        expire_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        usage_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(legacy_revoke_permanent=legacy_revoke_permanent, peer=peer, expire_date=expire_date, usage_limit=usage_limit), cursor
+
+
+class GetStickerSet_133(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0x2619a90e
+    __tl_name__ = "functions.messages.GetStickerSet_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("stickerset", )
+
+    def __init__(self, *, stickerset: tl.base.InputStickerSet):
+        self.stickerset = stickerset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stickerset.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStickerSet_133:
+        stickerset = TLObject.read(stream)
+        return cls(stickerset=stickerset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStickerSet_133, int]:
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        return cls(stickerset=stickerset), cursor
+
+
+class GetDocumentByHash_133(TLRequest[tl.base.Document]):
+    __tl_id__ = 0x338e2464
+    __tl_name__ = "functions.messages.GetDocumentByHash_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("sha256", "size", "mime_type", )
+
+    def __init__(self, *, sha256: bytes, size: int, mime_type: str):
+        self.sha256 = sha256
+        self.size = size
+        self.mime_type = mime_type
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.sha256)
+        out += Int.write(self.size)
+        String.write_to(out, self.mime_type)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDocumentByHash_133:
+        sha256 = Bytes.read(stream)
+        size = Int.read(stream)
+        mime_type = String.read(stream)
+        return cls(sha256=sha256, size=size, mime_type=mime_type)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDocumentByHash_133, int]:
+        sha256, cursor = Bytes.read_from(view, cursor)
+        size, cursor = Int.read_from(view, cursor)
+        mime_type, cursor = String.read_from(view, cursor)
+        return cls(sha256=sha256, size=size, mime_type=mime_type), cursor
+
+
+class SetInlineBotResults_133(TLRequest[bool]):
+    __tl_id__ = 0xeb5ea206
+    __tl_name__ = "functions.messages.SetInlineBotResults_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("gallery", "private", "query_id", "results", "cache_time", "next_offset", "switch_pm", )
+
+    def __init__(self, *, query_id: int, results: list[tl.base.InputBotInlineResult], cache_time: int, gallery: bool = False, private: bool = False, next_offset: str | None = None, switch_pm: tl.types.InlineBotSwitchPM | None = None):
+        self.gallery = gallery
+        self.private = private
+        self.query_id = query_id
+        self.results = results
+        self.cache_time = cache_time
+        self.next_offset = next_offset
+        self.switch_pm = switch_pm
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.gallery: flags1 |= (1 << 0)
+        if self.private: flags1 |= (1 << 1)
+        if self.next_offset is not None: flags1 |= (1 << 2)
+        if self.switch_pm is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        out += Long.write(self.query_id)
+        TLObjectVector.write_to(out, self.results, ctx)
+        out += Int.write(self.cache_time)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        if self.switch_pm is not None:
+            self.switch_pm.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetInlineBotResults_133:
+        flags1 = Int.read(stream)
+        gallery = (flags1 & (1 << 0)) == (1 << 0)
+        private = (flags1 & (1 << 1)) == (1 << 1)
+        query_id = Long.read(stream)
+        results = TLObjectVector.read(stream)
+        cache_time = Int.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        switch_pm = tl.types.InlineBotSwitchPM.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(gallery=gallery, private=private, query_id=query_id, results=results, cache_time=cache_time, next_offset=next_offset, switch_pm=switch_pm)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetInlineBotResults_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        gallery = (flags1 & (1 << 0)) == (1 << 0)
+        private = (flags1 & (1 << 1)) == (1 << 1)
+        query_id, cursor = Long.read_from(view, cursor)
+        results, cursor = TLObjectVector.read_from(view, cursor)
+        cache_time, cursor = Int.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        switch_pm, cursor = tl.types.InlineBotSwitchPM.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(gallery=gallery, private=private, query_id=query_id, results=results, cache_time=cache_time, next_offset=next_offset, switch_pm=switch_pm), cursor
+
+
+class SendInlineBotResult_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x220815b0
+    __tl_name__ = "functions.messages.SendInlineBotResult_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("silent", "background", "clear_draft", "hide_via", "peer", "reply_to_msg_id", "random_id", "query_id", "id", "schedule_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: int, query_id: int, id: str, silent: bool = False, background: bool = False, clear_draft: bool = False, hide_via: bool = False, reply_to_msg_id: int | None = None, schedule_date: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.hide_via = hide_via
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.random_id = random_id
+        self.query_id = query_id
+        self.id = id
+        self.schedule_date = schedule_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.hide_via: flags1 |= (1 << 11)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        out += Long.write(self.random_id)
+        out += Long.write(self.query_id)
+        String.write_to(out, self.id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendInlineBotResult_133:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        random_id = Long.read(stream)
+        query_id = Long.read(stream)
+        id = String.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to_msg_id=reply_to_msg_id, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendInlineBotResult_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        id, cursor = String.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to_msg_id=reply_to_msg_id, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date), cursor
+
+
+class EditMessage_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x48f71778
+    __tl_name__ = "functions.messages.EditMessage_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("no_webpage", "peer", "id", "message", "media", "reply_markup", "entities", "schedule_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, no_webpage: bool = False, message: str | None = None, media: tl.base.InputMedia | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None):
+        self.no_webpage = no_webpage
+        self.peer = peer
+        self.id = id
+        self.message = message
+        self.media = media
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.message is not None: flags1 |= (1 << 11)
+        if self.media is not None: flags1 |= (1 << 14)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 15)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        if self.message is not None:
+            String.write_to(out, self.message)
+        if self.media is not None:
+            self.media.write_to(out, ctx)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditMessage_133:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        message = String.read(stream) if (flags1 & (1 << 11)) == (1 << 11) else None
+        media = TLObject.read(stream) if (flags1 & (1 << 14)) == (1 << 14) else None
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 15)) == (1 << 15) else None
+        return cls(no_webpage=no_webpage, peer=peer, id=id, message=message, media=media, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditMessage_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor) if (flags1 & (1 << 11)) == (1 << 11) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 14)) == (1 << 14) else (None, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 15)) == (1 << 15) else (None, cursor)
+        return cls(no_webpage=no_webpage, peer=peer, id=id, message=message, media=media, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date), cursor
+
+
+class SaveDraft_133(TLRequest[bool]):
+    __tl_id__ = 0xbc39e14b
+    __tl_name__ = "functions.messages.SaveDraft_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("no_webpage", "reply_to_msg_id", "peer", "message", "entities", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, no_webpage: bool = False, reply_to_msg_id: int | None = None, entities: list[tl.base.MessageEntity] | None = None):
+        self.no_webpage = no_webpage
+        self.reply_to_msg_id = reply_to_msg_id
+        self.peer = peer
+        self.message = message
+        self.entities = entities
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.entities: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.message)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveDraft_133:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        peer = TLObject.read(stream)
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(no_webpage=no_webpage, reply_to_msg_id=reply_to_msg_id, peer=peer, message=message, entities=entities)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveDraft_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(no_webpage=no_webpage, reply_to_msg_id=reply_to_msg_id, peer=peer, message=message, entities=entities), cursor
+
+
+class GetWebPage_133(TLRequest[tl.base.WebPage]):
+    __tl_id__ = 0x32ca8f91
+    __tl_name__ = "functions.messages.GetWebPage_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("url", "hash", )
+
+    def __init__(self, *, url: str, hash: int):
+        self.url = url
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetWebPage_133:
+        url = String.read(stream)
+        hash = Int.read(stream)
+        return cls(url=url, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetWebPage_133, int]:
+        url, cursor = String.read_from(view, cursor)
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(url=url, hash=hash), cursor
+
+
+class UploadMedia_133(TLRequest[tl.base.MessageMedia]):
+    __tl_id__ = 0x519bc2b1
+    __tl_name__ = "functions.messages.UploadMedia_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "media", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia):
+        self.peer = peer
+        self.media = media
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.media.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadMedia_133:
+        peer = TLObject.read(stream)
+        media = TLObject.read(stream)
+        return cls(peer=peer, media=media)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadMedia_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, media=media), cursor
+
+
+class SendScreenshotNotification_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xc97df020
+    __tl_name__ = "functions.messages.SendScreenshotNotification_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "reply_to_msg_id", "random_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, reply_to_msg_id: int, random_id: int):
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.reply_to_msg_id)
+        out += Long.write(self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendScreenshotNotification_133:
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream)
+        random_id = Long.read(stream)
+        return cls(peer=peer, reply_to_msg_id=reply_to_msg_id, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendScreenshotNotification_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, reply_to_msg_id=reply_to_msg_id, random_id=random_id), cursor
+
+
+class GetUnreadMentions_133(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x46578472
+    __tl_name__ = "functions.messages.GetUnreadMentions_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "offset_id", "add_offset", "limit", "max_id", "min_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset_id: int, add_offset: int, limit: int, max_id: int, min_id: int):
+        self.peer = peer
+        self.offset_id = offset_id
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUnreadMentions_133:
+        peer = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        return cls(peer=peer, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUnreadMentions_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id), cursor
+
+
+class ReadMentions_133(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0xf0189d3
+    __tl_name__ = "functions.messages.ReadMentions_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadMentions_133:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadMentions_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class SendMultiMedia_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xcc0110cb
+    __tl_name__ = "functions.messages.SendMultiMedia_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("silent", "background", "clear_draft", "peer", "reply_to_msg_id", "multi_media", "schedule_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, multi_media: list[tl.base.InputSingleMedia], silent: bool = False, background: bool = False, clear_draft: bool = False, reply_to_msg_id: int | None = None, schedule_date: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.multi_media = multi_media
+        self.schedule_date = schedule_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        TLObjectVector.write_to(out, self.multi_media, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMultiMedia_133:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        multi_media = TLObjectVector.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, peer=peer, reply_to_msg_id=reply_to_msg_id, multi_media=multi_media, schedule_date=schedule_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMultiMedia_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        multi_media, cursor = TLObjectVector.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, peer=peer, reply_to_msg_id=reply_to_msg_id, multi_media=multi_media, schedule_date=schedule_date), cursor
+
+
+class GetSearchCounters_133(TLRequest[list[tl.base.messages.SearchCounter]]):
+    __tl_id__ = 0x732eef00
+    __tl_name__ = "functions.messages.GetSearchCounters_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "filters", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, filters: list[tl.base.MessagesFilter]):
+        self.peer = peer
+        self.filters = filters
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.filters, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSearchCounters_133:
+        peer = TLObject.read(stream)
+        filters = TLObjectVector.read(stream)
+        return cls(peer=peer, filters=filters)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSearchCounters_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        filters, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peer=peer, filters=filters), cursor
+
+
+class GetDialogFilters_133(TLRequest[list[tl.base.DialogFilter]]):
+    __tl_id__ = 0xf19ed96d
+    __tl_name__ = "functions.messages.GetDialogFilters_133"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDialogFilters_133:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDialogFilters_133, int]:
+        return cls(), cursor
+
+
+class UnpinAllMessages_133(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0xf025bc8b
+    __tl_name__ = "functions.messages.UnpinAllMessages_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UnpinAllMessages_133:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UnpinAllMessages_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class EditExportedChatInvite_133(TLRequest[tl.base.messages.ExportedChatInvite]):
+    __tl_id__ = 0x2e4ffbe
+    __tl_name__ = "functions.messages.EditExportedChatInvite_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("revoked", "peer", "link", "expire_date", "usage_limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, link: str, revoked: bool = False, expire_date: int | None = None, usage_limit: int | None = None):
+        self.revoked = revoked
+        self.peer = peer
+        self.link = link
+        self.expire_date = expire_date
+        self.usage_limit = usage_limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.revoked: flags1 |= (1 << 2)
+        if self.expire_date is not None: flags1 |= (1 << 0)
+        if self.usage_limit is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.link)
+        if self.expire_date is not None:
+            out += Int.write(self.expire_date)
+        if self.usage_limit is not None:
+            out += Int.write(self.usage_limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditExportedChatInvite_133:
+        flags1 = Int.read(stream)
+        revoked = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream)
+        link = String.read(stream)
+        expire_date = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        usage_limit = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(revoked=revoked, peer=peer, link=link, expire_date=expire_date, usage_limit=usage_limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditExportedChatInvite_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        revoked = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor)
+        link, cursor = String.read_from(view, cursor)
+        expire_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        usage_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(revoked=revoked, peer=peer, link=link, expire_date=expire_date, usage_limit=usage_limit), cursor
+
+
+class GetChatInviteImporters_133(TLRequest[tl.types.messages.ChatInviteImporters]):
+    __tl_id__ = 0x26fb7289
+    __tl_name__ = "functions.messages.GetChatInviteImporters_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "link", "offset_date", "offset_user", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, link: str, offset_date: int, offset_user: tl.base.InputUser, limit: int):
+        self.peer = peer
+        self.link = link
+        self.offset_date = offset_date
+        self.offset_user = offset_user
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.link)
+        out += Int.write(self.offset_date)
+        self.offset_user.write_to(out, ctx)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChatInviteImporters_133:
+        peer = TLObject.read(stream)
+        link = String.read(stream)
+        offset_date = Int.read(stream)
+        offset_user = TLObject.read(stream)
+        limit = Int.read(stream)
+        return cls(peer=peer, link=link, offset_date=offset_date, offset_user=offset_user, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChatInviteImporters_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        link, cursor = String.read_from(view, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        offset_user, cursor = TLObject.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, link=link, offset_date=offset_date, offset_user=offset_user, limit=limit), cursor
+
+
+class GetMessageReadParticipants_133(TLRequest[list[int]]):
+    __tl_id__ = 0x2c6f97b7
+    __tl_name__ = "functions.messages.GetMessageReadParticipants_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessageReadParticipants_133:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessageReadParticipants_133, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class ExportChatInvite_134(TLRequest[tl.base.ExportedChatInvite]):
+    __tl_id__ = 0xa02ce5d5
+    __tl_name__ = "functions.messages.ExportChatInvite_134"
+    __tl_layer__ = 134
+
+    __slots__ = ("legacy_revoke_permanent", "request_needed", "peer", "expire_date", "usage_limit", "title", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, legacy_revoke_permanent: bool = False, request_needed: bool = False, expire_date: int | None = None, usage_limit: int | None = None, title: str | None = None):
+        self.legacy_revoke_permanent = legacy_revoke_permanent
+        self.request_needed = request_needed
+        self.peer = peer
+        self.expire_date = expire_date
+        self.usage_limit = usage_limit
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.legacy_revoke_permanent: flags1 |= (1 << 2)
+        if self.request_needed: flags1 |= (1 << 3)
+        if self.expire_date is not None: flags1 |= (1 << 0)
+        if self.usage_limit is not None: flags1 |= (1 << 1)
+        if self.title is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.expire_date is not None:
+            out += Int.write(self.expire_date)
+        if self.usage_limit is not None:
+            out += Int.write(self.usage_limit)
+        if self.title is not None:
+            String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportChatInvite_134:
+        flags1 = Int.read(stream)
+        legacy_revoke_permanent = (flags1 & (1 << 2)) == (1 << 2)
+        request_needed = (flags1 & (1 << 3)) == (1 << 3)
+        peer = TLObject.read(stream)
+        expire_date = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        usage_limit = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        title = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(legacy_revoke_permanent=legacy_revoke_permanent, request_needed=request_needed, peer=peer, expire_date=expire_date, usage_limit=usage_limit, title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportChatInvite_134, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        legacy_revoke_permanent = (flags1 & (1 << 2)) == (1 << 2)
+        request_needed = (flags1 & (1 << 3)) == (1 << 3)
+        peer, cursor = TLObject.read_from(view, cursor)
+        expire_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        usage_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(legacy_revoke_permanent=legacy_revoke_permanent, request_needed=request_needed, peer=peer, expire_date=expire_date, usage_limit=usage_limit, title=title), cursor
+
+
+class GetSearchResultsCalendar_134(TLRequest[tl.types.messages.SearchResultsCalendar]):
+    __tl_id__ = 0x49f0bde9
+    __tl_name__ = "functions.messages.GetSearchResultsCalendar_134"
+    __tl_layer__ = 134
+
+    __slots__ = ("peer", "filter", "offset_id", "offset_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, filter: tl.base.MessagesFilter, offset_id: int, offset_date: int):
+        self.peer = peer
+        self.filter = filter
+        self.offset_id = offset_id
+        self.offset_date = offset_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.offset_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSearchResultsCalendar_134:
+        peer = TLObject.read(stream)
+        filter = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        offset_date = Int.read(stream)
+        return cls(peer=peer, filter=filter, offset_id=offset_id, offset_date=offset_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSearchResultsCalendar_134, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, filter=filter, offset_id=offset_id, offset_date=offset_date), cursor
+
+
+class GetSearchResultsPositions_134(TLRequest[tl.types.messages.SearchResultsPositions]):
+    __tl_id__ = 0x6e9583a3
+    __tl_name__ = "functions.messages.GetSearchResultsPositions_134"
+    __tl_layer__ = 134
+
+    __slots__ = ("peer", "filter", "offset_id", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, filter: tl.base.MessagesFilter, offset_id: int, limit: int):
+        self.peer = peer
+        self.filter = filter
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSearchResultsPositions_134:
+        peer = TLObject.read(stream)
+        filter = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(peer=peer, filter=filter, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSearchResultsPositions_134, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, filter=filter, offset_id=offset_id, limit=limit), cursor
+
+
+class SendMessage_135(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd9d75a4
+    __tl_name__ = "functions.messages.SendMessage_135"
+    __tl_layer__ = 135
+
+    __slots__ = ("no_webpage", "silent", "background", "clear_draft", "noforwards", "peer", "reply_to_msg_id", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, random_id: int, no_webpage: bool = False, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, reply_to_msg_id: int | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.no_webpage = no_webpage
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMessage_135:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, peer=peer, reply_to_msg_id=reply_to_msg_id, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMessage_135, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, peer=peer, reply_to_msg_id=reply_to_msg_id, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SendMedia_135(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xe25ff8e0
+    __tl_name__ = "functions.messages.SendMedia_135"
+    __tl_layer__ = 135
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "peer", "reply_to_msg_id", "media", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, message: str, random_id: int, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, reply_to_msg_id: int | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.media = media
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        self.media.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMedia_135:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        media = TLObject.read(stream)
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, peer=peer, reply_to_msg_id=reply_to_msg_id, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMedia_135, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, peer=peer, reply_to_msg_id=reply_to_msg_id, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class ForwardMessages_135(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xcc30290b
+    __tl_name__ = "functions.messages.ForwardMessages_135"
+    __tl_layer__ = 135
+
+    __slots__ = ("silent", "background", "with_my_score", "drop_author", "drop_media_captions", "noforwards", "from_peer", "id", "random_id", "to_peer", "schedule_date", "send_as", )
+
+    def __init__(self, *, from_peer: tl.base.InputPeer, id: list[int], random_id: list[int], to_peer: tl.base.InputPeer, silent: bool = False, background: bool = False, with_my_score: bool = False, drop_author: bool = False, drop_media_captions: bool = False, noforwards: bool = False, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.with_my_score = with_my_score
+        self.drop_author = drop_author
+        self.drop_media_captions = drop_media_captions
+        self.noforwards = noforwards
+        self.from_peer = from_peer
+        self.id = id
+        self.random_id = random_id
+        self.to_peer = to_peer
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.with_my_score: flags1 |= (1 << 8)
+        if self.drop_author: flags1 |= (1 << 11)
+        if self.drop_media_captions: flags1 |= (1 << 12)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.from_peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        out += LongVector.write(self.random_id)
+        self.to_peer.write_to(out, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ForwardMessages_135:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        from_peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        random_id = LongVector.read(stream)
+        to_peer = TLObject.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ForwardMessages_135, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        from_peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        random_id, cursor = LongVector.read_from(view, cursor)
+        to_peer, cursor = TLObject.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SendInlineBotResult_135(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x7aa11297
+    __tl_name__ = "functions.messages.SendInlineBotResult_135"
+    __tl_layer__ = 135
+
+    __slots__ = ("silent", "background", "clear_draft", "hide_via", "peer", "reply_to_msg_id", "random_id", "query_id", "id", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: int, query_id: int, id: str, silent: bool = False, background: bool = False, clear_draft: bool = False, hide_via: bool = False, reply_to_msg_id: int | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.hide_via = hide_via
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.random_id = random_id
+        self.query_id = query_id
+        self.id = id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.hide_via: flags1 |= (1 << 11)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        out += Long.write(self.random_id)
+        out += Long.write(self.query_id)
+        String.write_to(out, self.id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendInlineBotResult_135:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        random_id = Long.read(stream)
+        query_id = Long.read(stream)
+        id = String.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to_msg_id=reply_to_msg_id, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendInlineBotResult_135, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        id, cursor = String.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to_msg_id=reply_to_msg_id, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SendMultiMedia_135(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf803138f
+    __tl_name__ = "functions.messages.SendMultiMedia_135"
+    __tl_layer__ = 135
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "peer", "reply_to_msg_id", "multi_media", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, multi_media: list[tl.base.InputSingleMedia], silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, reply_to_msg_id: int | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.multi_media = multi_media
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        TLObjectVector.write_to(out, self.multi_media, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMultiMedia_135:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        multi_media = TLObjectVector.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, peer=peer, reply_to_msg_id=reply_to_msg_id, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMultiMedia_135, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        multi_media, cursor = TLObjectVector.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, peer=peer, reply_to_msg_id=reply_to_msg_id, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SendReaction_136(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x25690ce4
+    __tl_name__ = "functions.messages.SendReaction_136"
+    __tl_layer__ = 136
+
+    __slots__ = ("big", "peer", "msg_id", "reaction", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, big: bool = False, reaction: str | None = None):
+        self.big = big
+        self.peer = peer
+        self.msg_id = msg_id
+        self.reaction = reaction
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.big: flags1 |= (1 << 1)
+        if self.reaction is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        if self.reaction is not None:
+            String.write_to(out, self.reaction)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendReaction_136:
+        flags1 = Int.read(stream)
+        big = (flags1 & (1 << 1)) == (1 << 1)
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        reaction = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(big=big, peer=peer, msg_id=msg_id, reaction=reaction)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendReaction_136, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        big = (flags1 & (1 << 1)) == (1 << 1)
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        reaction, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(big=big, peer=peer, msg_id=msg_id, reaction=reaction), cursor
+
+
+class GetMessageReactionsList_136(TLRequest[tl.base.messages.MessageReactionsList]):
+    __tl_id__ = 0xe0ee6b77
+    __tl_name__ = "functions.messages.GetMessageReactionsList_136"
+    __tl_layer__ = 136
+
+    __slots__ = ("peer", "id", "reaction", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, limit: int, reaction: str | None = None, offset: str | None = None):
+        self.peer = peer
+        self.id = id
+        self.reaction = reaction
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.reaction is not None: flags1 |= (1 << 0)
+        if self.offset is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        if self.reaction is not None:
+            String.write_to(out, self.reaction)
+        if self.offset is not None:
+            String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessageReactionsList_136:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        reaction = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        offset = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        limit = Int.read(stream)
+        return cls(peer=peer, id=id, reaction=reaction, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessageReactionsList_136, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        reaction, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, id=id, reaction=reaction, offset=offset, limit=limit), cursor
+
+
+class SetChatAvailableReactions_136(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x14050ea6
+    __tl_name__ = "functions.messages.SetChatAvailableReactions_136"
+    __tl_layer__ = 136
+
+    __slots__ = ("peer", "available_reactions", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, available_reactions: list[str]):
+        self.peer = peer
+        self.available_reactions = available_reactions
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += StringVector.write(self.available_reactions)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetChatAvailableReactions_136:
+        peer = TLObject.read(stream)
+        available_reactions = StringVector.read(stream)
+        return cls(peer=peer, available_reactions=available_reactions)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetChatAvailableReactions_136, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        available_reactions, cursor = StringVector.read_from(view, cursor)
+        return cls(peer=peer, available_reactions=available_reactions), cursor
+
+
+class SetDefaultReaction_136(TLRequest[bool]):
+    __tl_id__ = 0xd960c4d4
+    __tl_name__ = "functions.messages.SetDefaultReaction_136"
+    __tl_layer__ = 136
+
+    __slots__ = ("reaction", )
+
+    def __init__(self, *, reaction: str):
+        self.reaction = reaction
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.reaction)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetDefaultReaction_136:
+        reaction = String.read(stream)
+        return cls(reaction=reaction)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetDefaultReaction_136, int]:
+        reaction, cursor = String.read_from(view, cursor)
+        return cls(reaction=reaction), cursor
+
+
+class TranslateText_137(TLRequest[tl.base.messages.TranslatedText]):
+    __tl_id__ = 0x24ce6dee
+    __tl_name__ = "functions.messages.TranslateText_137"
+    __tl_layer__ = 137
+
+    __slots__ = ("peer", "msg_id", "text", "from_lang", "to_lang", )
+
+    def __init__(self, *, to_lang: str, peer: tl.base.InputPeer | None = None, msg_id: int | None = None, text: str | None = None, from_lang: str | None = None):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.text = text
+        self.from_lang = from_lang
+        self.to_lang = to_lang
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.peer is None, self.msg_id is None)
+        _flags_fields_not_empty = (self.peer is not None, self.msg_id is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: peer, msg_id")
+        flags1 = 0
+        if self.peer is not None: flags1 |= (1 << 0)
+        if self.msg_id is not None: flags1 |= (1 << 0)
+        if self.text is not None: flags1 |= (1 << 1)
+        if self.from_lang is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.peer is not None:
+            self.peer.write_to(out, ctx)
+        if self.msg_id is not None:
+            out += Int.write(self.msg_id)
+        if self.text is not None:
+            String.write_to(out, self.text)
+        if self.from_lang is not None:
+            String.write_to(out, self.from_lang)
+        String.write_to(out, self.to_lang)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TranslateText_137:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        text = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        from_lang = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        to_lang = String.read(stream)
+        return cls(peer=peer, msg_id=msg_id, text=text, from_lang=from_lang, to_lang=to_lang)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TranslateText_137, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        text, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        from_lang, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        to_lang, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, text=text, from_lang=from_lang, to_lang=to_lang), cursor
+
+
+class GetUnreadReactions_138(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0xe85bae1a
+    __tl_name__ = "functions.messages.GetUnreadReactions_138"
+    __tl_layer__ = 138
+
+    __slots__ = ("peer", "offset_id", "add_offset", "limit", "max_id", "min_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset_id: int, add_offset: int, limit: int, max_id: int, min_id: int):
+        self.peer = peer
+        self.offset_id = offset_id
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUnreadReactions_138:
+        peer = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        return cls(peer=peer, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUnreadReactions_138, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id), cursor
+
+
+class ReadReactions_138(TLRequest[tl.types.messages.AffectedHistory]):
+    __tl_id__ = 0x82e251d7
+    __tl_name__ = "functions.messages.ReadReactions_138"
+    __tl_layer__ = 138
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadReactions_138:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadReactions_138, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class ToggleBotInAttachMenu_140(TLRequest[bool]):
+    __tl_id__ = 0x1aee33af
+    __tl_name__ = "functions.messages.ToggleBotInAttachMenu_140"
+    __tl_layer__ = 140
+
+    __slots__ = ("bot", "enabled", )
+
+    def __init__(self, *, bot: tl.base.InputUser, enabled: bool):
+        self.bot = bot
+        self.enabled = enabled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.bot.write_to(out, ctx)
+        out += Bool.write(self.enabled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleBotInAttachMenu_140:
+        bot = TLObject.read(stream)
+        enabled = Bool.read(stream)
+        return cls(bot=bot, enabled=enabled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleBotInAttachMenu_140, int]:
+        bot, cursor = TLObject.read_from(view, cursor)
+        enabled, cursor = Bool.read_from(view, cursor)
+        return cls(bot=bot, enabled=enabled), cursor
+
+
+class RequestWebView_140(TLRequest[tl.base.WebViewResult]):
+    __tl_id__ = 0xfa04dff
+    __tl_name__ = "functions.messages.RequestWebView_140"
+    __tl_layer__ = 140
+
+    __slots__ = ("from_bot_menu", "silent", "peer", "bot", "url", "start_param", "theme_params", "reply_to_msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, from_bot_menu: bool = False, silent: bool = False, url: str | None = None, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None, reply_to_msg_id: int | None = None):
+        self.from_bot_menu = from_bot_menu
+        self.silent = silent
+        self.peer = peer
+        self.bot = bot
+        self.url = url
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.reply_to_msg_id = reply_to_msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_bot_menu: flags1 |= (1 << 4)
+        if self.silent: flags1 |= (1 << 5)
+        if self.url is not None: flags1 |= (1 << 1)
+        if self.start_param is not None: flags1 |= (1 << 3)
+        if self.theme_params is not None: flags1 |= (1 << 2)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestWebView_140:
+        flags1 = Int.read(stream)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        url = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        start_param = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(from_bot_menu=from_bot_menu, silent=silent, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, reply_to_msg_id=reply_to_msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestWebView_140, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(from_bot_menu=from_bot_menu, silent=silent, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, reply_to_msg_id=reply_to_msg_id), cursor
+
+
+class ProlongWebView_140(TLRequest[bool]):
+    __tl_id__ = 0xd22ad148
+    __tl_name__ = "functions.messages.ProlongWebView_140"
+    __tl_layer__ = 140
+
+    __slots__ = ("silent", "peer", "bot", "query_id", "reply_to_msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, query_id: int, silent: bool = False, reply_to_msg_id: int | None = None):
+        self.silent = silent
+        self.peer = peer
+        self.bot = bot
+        self.query_id = query_id
+        self.reply_to_msg_id = reply_to_msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        out += Long.write(self.query_id)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ProlongWebView_140:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        query_id = Long.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(silent=silent, peer=peer, bot=bot, query_id=query_id, reply_to_msg_id=reply_to_msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ProlongWebView_140, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(silent=silent, peer=peer, bot=bot, query_id=query_id, reply_to_msg_id=reply_to_msg_id), cursor
+
+
+class RequestSimpleWebView_140(TLRequest[tl.types.SimpleWebViewResultUrl_140]):
+    __tl_id__ = 0x6abb2f73
+    __tl_name__ = "functions.messages.RequestSimpleWebView_140"
+    __tl_layer__ = 140
+
+    __slots__ = ("bot", "url", "theme_params", )
+
+    def __init__(self, *, bot: tl.base.InputUser, url: str, theme_params: tl.types.DataJSON | None = None):
+        self.bot = bot
+        self.url = url
+        self.theme_params = theme_params
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.theme_params is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.url)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestSimpleWebView_140:
+        flags1 = Int.read(stream)
+        bot = TLObject.read(stream)
+        url = String.read(stream)
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(bot=bot, url=url, theme_params=theme_params)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestSimpleWebView_140, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(bot=bot, url=url, theme_params=theme_params), cursor
+
+
+class RequestWebView_143(TLRequest[tl.base.WebViewResult]):
+    __tl_id__ = 0x91b15831
+    __tl_name__ = "functions.messages.RequestWebView_143"
+    __tl_layer__ = 143
+
+    __slots__ = ("from_bot_menu", "silent", "peer", "bot", "url", "start_param", "theme_params", "reply_to_msg_id", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, from_bot_menu: bool = False, silent: bool = False, url: str | None = None, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None, reply_to_msg_id: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.from_bot_menu = from_bot_menu
+        self.silent = silent
+        self.peer = peer
+        self.bot = bot
+        self.url = url
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.reply_to_msg_id = reply_to_msg_id
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_bot_menu: flags1 |= (1 << 4)
+        if self.silent: flags1 |= (1 << 5)
+        if self.url is not None: flags1 |= (1 << 1)
+        if self.start_param is not None: flags1 |= (1 << 3)
+        if self.theme_params is not None: flags1 |= (1 << 2)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestWebView_143:
+        flags1 = Int.read(stream)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        url = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        start_param = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(from_bot_menu=from_bot_menu, silent=silent, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, reply_to_msg_id=reply_to_msg_id, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestWebView_143, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(from_bot_menu=from_bot_menu, silent=silent, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, reply_to_msg_id=reply_to_msg_id, send_as=send_as), cursor
+
+
+class ProlongWebView_143(TLRequest[bool]):
+    __tl_id__ = 0xea5fbcce
+    __tl_name__ = "functions.messages.ProlongWebView_143"
+    __tl_layer__ = 143
+
+    __slots__ = ("silent", "peer", "bot", "query_id", "reply_to_msg_id", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, query_id: int, silent: bool = False, reply_to_msg_id: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.peer = peer
+        self.bot = bot
+        self.query_id = query_id
+        self.reply_to_msg_id = reply_to_msg_id
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        out += Long.write(self.query_id)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ProlongWebView_143:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        query_id = Long.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, peer=peer, bot=bot, query_id=query_id, reply_to_msg_id=reply_to_msg_id, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ProlongWebView_143, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, peer=peer, bot=bot, query_id=query_id, reply_to_msg_id=reply_to_msg_id, send_as=send_as), cursor
+
+
+class SetChatAvailableReactions_145(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xfeb16771
+    __tl_name__ = "functions.messages.SetChatAvailableReactions_145"
+    __tl_layer__ = 145
+
+    __slots__ = ("peer", "available_reactions", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, available_reactions: tl.base.ChatReactions):
+        self.peer = peer
+        self.available_reactions = available_reactions
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.available_reactions.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetChatAvailableReactions_145:
+        peer = TLObject.read(stream)
+        available_reactions = TLObject.read(stream)
+        return cls(peer=peer, available_reactions=available_reactions)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetChatAvailableReactions_145, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        available_reactions, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, available_reactions=available_reactions), cursor
+
+
+class RequestWebView_145(TLRequest[tl.base.WebViewResult]):
+    __tl_id__ = 0xfc87a53c
+    __tl_name__ = "functions.messages.RequestWebView_145"
+    __tl_layer__ = 145
+
+    __slots__ = ("from_bot_menu", "silent", "peer", "bot", "url", "start_param", "theme_params", "platform", "reply_to_msg_id", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, platform: str, from_bot_menu: bool = False, silent: bool = False, url: str | None = None, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None, reply_to_msg_id: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.from_bot_menu = from_bot_menu
+        self.silent = silent
+        self.peer = peer
+        self.bot = bot
+        self.url = url
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.platform = platform
+        self.reply_to_msg_id = reply_to_msg_id
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_bot_menu: flags1 |= (1 << 4)
+        if self.silent: flags1 |= (1 << 5)
+        if self.url is not None: flags1 |= (1 << 1)
+        if self.start_param is not None: flags1 |= (1 << 3)
+        if self.theme_params is not None: flags1 |= (1 << 2)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        String.write_to(out, self.platform)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestWebView_145:
+        flags1 = Int.read(stream)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        url = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        start_param = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        platform = String.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(from_bot_menu=from_bot_menu, silent=silent, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform, reply_to_msg_id=reply_to_msg_id, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestWebView_145, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        platform, cursor = String.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(from_bot_menu=from_bot_menu, silent=silent, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform, reply_to_msg_id=reply_to_msg_id, send_as=send_as), cursor
+
+
+class RequestSimpleWebView_145(TLRequest[tl.types.SimpleWebViewResultUrl_140]):
+    __tl_id__ = 0x299bec8e
+    __tl_name__ = "functions.messages.RequestSimpleWebView_145"
+    __tl_layer__ = 145
+
+    __slots__ = ("bot", "url", "theme_params", "platform", )
+
+    def __init__(self, *, bot: tl.base.InputUser, url: str, platform: str, theme_params: tl.types.DataJSON | None = None):
+        self.bot = bot
+        self.url = url
+        self.theme_params = theme_params
+        self.platform = platform
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.theme_params is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.bot.write_to(out, ctx)
+        String.write_to(out, self.url)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        String.write_to(out, self.platform)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestSimpleWebView_145:
+        flags1 = Int.read(stream)
+        bot = TLObject.read(stream)
+        url = String.read(stream)
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        platform = String.read(stream)
+        return cls(bot=bot, url=url, theme_params=theme_params, platform=platform)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestSimpleWebView_145, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        platform, cursor = String.read_from(view, cursor)
+        return cls(bot=bot, url=url, theme_params=theme_params, platform=platform), cursor
+
+
+class SendMessage_148(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x1cc20387
+    __tl_name__ = "functions.messages.SendMessage_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("no_webpage", "silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "peer", "reply_to_msg_id", "top_msg_id", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, random_id: int, no_webpage: bool = False, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, reply_to_msg_id: int | None = None, top_msg_id: int | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.no_webpage = no_webpage
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.top_msg_id = top_msg_id
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMessage_148:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMessage_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SendMedia_148(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x7547c966
+    __tl_name__ = "functions.messages.SendMedia_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "peer", "reply_to_msg_id", "top_msg_id", "media", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, message: str, random_id: int, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, reply_to_msg_id: int | None = None, top_msg_id: int | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.top_msg_id = top_msg_id
+        self.media = media
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        self.media.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMedia_148:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        media = TLObject.read(stream)
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMedia_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class ForwardMessages_148(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xc661bbc4
+    __tl_name__ = "functions.messages.ForwardMessages_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("silent", "background", "with_my_score", "drop_author", "drop_media_captions", "noforwards", "from_peer", "id", "random_id", "to_peer", "top_msg_id", "schedule_date", "send_as", )
+
+    def __init__(self, *, from_peer: tl.base.InputPeer, id: list[int], random_id: list[int], to_peer: tl.base.InputPeer, silent: bool = False, background: bool = False, with_my_score: bool = False, drop_author: bool = False, drop_media_captions: bool = False, noforwards: bool = False, top_msg_id: int | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.with_my_score = with_my_score
+        self.drop_author = drop_author
+        self.drop_media_captions = drop_media_captions
+        self.noforwards = noforwards
+        self.from_peer = from_peer
+        self.id = id
+        self.random_id = random_id
+        self.to_peer = to_peer
+        self.top_msg_id = top_msg_id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.with_my_score: flags1 |= (1 << 8)
+        if self.drop_author: flags1 |= (1 << 11)
+        if self.drop_media_captions: flags1 |= (1 << 12)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.from_peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        out += LongVector.write(self.random_id)
+        self.to_peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ForwardMessages_148:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        from_peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        random_id = LongVector.read(stream)
+        to_peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, top_msg_id=top_msg_id, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ForwardMessages_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        from_peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        random_id, cursor = LongVector.read_from(view, cursor)
+        to_peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, top_msg_id=top_msg_id, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SendInlineBotResult_148(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd3fbdccb
+    __tl_name__ = "functions.messages.SendInlineBotResult_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("silent", "background", "clear_draft", "hide_via", "peer", "reply_to_msg_id", "top_msg_id", "random_id", "query_id", "id", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: int, query_id: int, id: str, silent: bool = False, background: bool = False, clear_draft: bool = False, hide_via: bool = False, reply_to_msg_id: int | None = None, top_msg_id: int | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.hide_via = hide_via
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.top_msg_id = top_msg_id
+        self.random_id = random_id
+        self.query_id = query_id
+        self.id = id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.hide_via: flags1 |= (1 << 11)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        out += Long.write(self.random_id)
+        out += Long.write(self.query_id)
+        String.write_to(out, self.id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendInlineBotResult_148:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        random_id = Long.read(stream)
+        query_id = Long.read(stream)
+        id = String.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendInlineBotResult_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        id, cursor = String.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SaveDraft_148(TLRequest[bool]):
+    __tl_id__ = 0xb4331e3f
+    __tl_name__ = "functions.messages.SaveDraft_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("no_webpage", "reply_to_msg_id", "top_msg_id", "peer", "message", "entities", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, no_webpage: bool = False, reply_to_msg_id: int | None = None, top_msg_id: int | None = None, entities: list[tl.base.MessageEntity] | None = None):
+        self.no_webpage = no_webpage
+        self.reply_to_msg_id = reply_to_msg_id
+        self.top_msg_id = top_msg_id
+        self.peer = peer
+        self.message = message
+        self.entities = entities
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.top_msg_id is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.message)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveDraft_148:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        peer = TLObject.read(stream)
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(no_webpage=no_webpage, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, peer=peer, message=message, entities=entities)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveDraft_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(no_webpage=no_webpage, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, peer=peer, message=message, entities=entities), cursor
+
+
+class SendMultiMedia_148(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xb6f11a1c
+    __tl_name__ = "functions.messages.SendMultiMedia_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "peer", "reply_to_msg_id", "top_msg_id", "multi_media", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, multi_media: list[tl.base.InputSingleMedia], silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, reply_to_msg_id: int | None = None, top_msg_id: int | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.peer = peer
+        self.reply_to_msg_id = reply_to_msg_id
+        self.top_msg_id = top_msg_id
+        self.multi_media = multi_media
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        TLObjectVector.write_to(out, self.multi_media, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMultiMedia_148:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer = TLObject.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        multi_media = TLObjectVector.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMultiMedia_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        multi_media, cursor = TLObjectVector.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class GetSearchCounters_148(TLRequest[list[tl.base.messages.SearchCounter]]):
+    __tl_id__ = 0xae7cc1
+    __tl_name__ = "functions.messages.GetSearchCounters_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("peer", "top_msg_id", "filters", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, filters: list[tl.base.MessagesFilter], top_msg_id: int | None = None):
+        self.peer = peer
+        self.top_msg_id = top_msg_id
+        self.filters = filters
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.top_msg_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        TLObjectVector.write_to(out, self.filters, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSearchCounters_148:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        filters = TLObjectVector.read(stream)
+        return cls(peer=peer, top_msg_id=top_msg_id, filters=filters)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSearchCounters_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        filters, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peer=peer, top_msg_id=top_msg_id, filters=filters), cursor
+
+
+class RequestWebView_148(TLRequest[tl.base.WebViewResult]):
+    __tl_id__ = 0x178b480b
+    __tl_name__ = "functions.messages.RequestWebView_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("from_bot_menu", "silent", "peer", "bot", "url", "start_param", "theme_params", "platform", "reply_to_msg_id", "top_msg_id", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, platform: str, from_bot_menu: bool = False, silent: bool = False, url: str | None = None, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None, reply_to_msg_id: int | None = None, top_msg_id: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.from_bot_menu = from_bot_menu
+        self.silent = silent
+        self.peer = peer
+        self.bot = bot
+        self.url = url
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.platform = platform
+        self.reply_to_msg_id = reply_to_msg_id
+        self.top_msg_id = top_msg_id
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_bot_menu: flags1 |= (1 << 4)
+        if self.silent: flags1 |= (1 << 5)
+        if self.url is not None: flags1 |= (1 << 1)
+        if self.start_param is not None: flags1 |= (1 << 3)
+        if self.theme_params is not None: flags1 |= (1 << 2)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        String.write_to(out, self.platform)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestWebView_148:
+        flags1 = Int.read(stream)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        url = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        start_param = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        platform = String.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(from_bot_menu=from_bot_menu, silent=silent, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestWebView_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        from_bot_menu = (flags1 & (1 << 4)) == (1 << 4)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        platform, cursor = String.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(from_bot_menu=from_bot_menu, silent=silent, peer=peer, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, send_as=send_as), cursor
+
+
+class ProlongWebView_148(TLRequest[bool]):
+    __tl_id__ = 0x7ff34309
+    __tl_name__ = "functions.messages.ProlongWebView_148"
+    __tl_layer__ = 148
+
+    __slots__ = ("silent", "peer", "bot", "query_id", "reply_to_msg_id", "top_msg_id", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser, query_id: int, silent: bool = False, reply_to_msg_id: int | None = None, top_msg_id: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.peer = peer
+        self.bot = bot
+        self.query_id = query_id
+        self.reply_to_msg_id = reply_to_msg_id
+        self.top_msg_id = top_msg_id
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.reply_to_msg_id is not None: flags1 |= (1 << 0)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+        out += Long.write(self.query_id)
+        if self.reply_to_msg_id is not None:
+            out += Int.write(self.reply_to_msg_id)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ProlongWebView_148:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        query_id = Long.read(stream)
+        reply_to_msg_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, peer=peer, bot=bot, query_id=query_id, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ProlongWebView_148, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        reply_to_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, peer=peer, bot=bot, query_id=query_id, reply_to_msg_id=reply_to_msg_id, top_msg_id=top_msg_id, send_as=send_as), cursor
+
+
+class CreateChat_150(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x34a818
+    __tl_name__ = "functions.messages.CreateChat_150"
+    __tl_layer__ = 150
+
+    __slots__ = ("users", "title", "ttl_period", )
+
+    def __init__(self, *, users: list[tl.base.InputUser], title: str, ttl_period: int | None = None):
+        self.users = users
+        self.title = title
+        self.ttl_period = ttl_period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.ttl_period is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        TLObjectVector.write_to(out, self.users, ctx)
+        String.write_to(out, self.title)
+        if self.ttl_period is not None:
+            out += Int.write(self.ttl_period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateChat_150:
+        flags1 = Int.read(stream)
+        users = TLObjectVector.read(stream)
+        title = String.read(stream)
+        ttl_period = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(users=users, title=title, ttl_period=ttl_period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateChat_150, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        ttl_period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(users=users, title=title, ttl_period=ttl_period), cursor
+
+
+class SendBotRequestedPeer_152(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xfe38d01b
+    __tl_name__ = "functions.messages.SendBotRequestedPeer_152"
+    __tl_layer__ = 152
+
+    __slots__ = ("peer", "msg_id", "button_id", "requested_peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, button_id: int, requested_peer: tl.base.InputPeer):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.button_id = button_id
+        self.requested_peer = requested_peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Int.write(self.button_id)
+        self.requested_peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendBotRequestedPeer_152:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        button_id = Int.read(stream)
+        requested_peer = TLObject.read(stream)
+        return cls(peer=peer, msg_id=msg_id, button_id=button_id, requested_peer=requested_peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendBotRequestedPeer_152, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        button_id, cursor = Int.read_from(view, cursor)
+        requested_peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, button_id=button_id, requested_peer=requested_peer), cursor
+
+
+class RequestAppWebView_155(TLRequest[tl.types.AppWebViewResultUrl_155]):
+    __tl_id__ = 0x8c5a3b3c
+    __tl_name__ = "functions.messages.RequestAppWebView_155"
+    __tl_layer__ = 155
+
+    __slots__ = ("write_allowed", "peer", "app", "start_param", "theme_params", "platform", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, app: tl.base.InputBotApp, platform: str, write_allowed: bool = False, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None):
+        self.write_allowed = write_allowed
+        self.peer = peer
+        self.app = app
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.platform = platform
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.write_allowed: flags1 |= (1 << 0)
+        if self.start_param is not None: flags1 |= (1 << 1)
+        if self.theme_params is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.app.write_to(out, ctx)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        String.write_to(out, self.platform)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestAppWebView_155:
+        flags1 = Int.read(stream)
+        write_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        app = TLObject.read(stream)
+        start_param = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        platform = String.read(stream)
+        return cls(write_allowed=write_allowed, peer=peer, app=app, start_param=start_param, theme_params=theme_params, platform=platform)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestAppWebView_155, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        write_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        app, cursor = TLObject.read_from(view, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        platform, cursor = String.read_from(view, cursor)
+        return cls(write_allowed=write_allowed, peer=peer, app=app, start_param=start_param, theme_params=theme_params, platform=platform), cursor
+
+
+class SendMessage_160(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x280d096f
+    __tl_name__ = "functions.messages.SendMessage_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("no_webpage", "silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "peer", "reply_to", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, random_id: int, no_webpage: bool = False, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, reply_to: tl.base.InputReplyTo | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.no_webpage = no_webpage
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.peer = peer
+        self.reply_to = reply_to
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMessage_160:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to=reply_to, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMessage_160, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to=reply_to, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SendMedia_160(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x72ccc23d
+    __tl_name__ = "functions.messages.SendMedia_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "peer", "reply_to", "media", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, message: str, random_id: int, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, reply_to: tl.base.InputReplyTo | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.peer = peer
+        self.reply_to = reply_to
+        self.media = media
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        self.media.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMedia_160:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        media = TLObject.read(stream)
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to=reply_to, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMedia_160, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to=reply_to, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SendInlineBotResult_160(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf7bc68ba
+    __tl_name__ = "functions.messages.SendInlineBotResult_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("silent", "background", "clear_draft", "hide_via", "peer", "reply_to", "random_id", "query_id", "id", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: int, query_id: int, id: str, silent: bool = False, background: bool = False, clear_draft: bool = False, hide_via: bool = False, reply_to: tl.base.InputReplyTo | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.hide_via = hide_via
+        self.peer = peer
+        self.reply_to = reply_to
+        self.random_id = random_id
+        self.query_id = query_id
+        self.id = id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.hide_via: flags1 |= (1 << 11)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        out += Long.write(self.random_id)
+        out += Long.write(self.query_id)
+        String.write_to(out, self.id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendInlineBotResult_160:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        random_id = Long.read(stream)
+        query_id = Long.read(stream)
+        id = String.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to=reply_to, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendInlineBotResult_160, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        id, cursor = String.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to=reply_to, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class SendMultiMedia_160(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x456e8987
+    __tl_name__ = "functions.messages.SendMultiMedia_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "peer", "reply_to", "multi_media", "schedule_date", "send_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, multi_media: list[tl.base.InputSingleMedia], silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, reply_to: tl.base.InputReplyTo | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.peer = peer
+        self.reply_to = reply_to
+        self.multi_media = multi_media
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.multi_media, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMultiMedia_160:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        multi_media = TLObjectVector.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to=reply_to, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMultiMedia_160, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        multi_media, cursor = TLObjectVector.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, peer=peer, reply_to=reply_to, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as), cursor
+
+
+class RequestSimpleWebView_163(TLRequest[tl.types.SimpleWebViewResultUrl_140]):
+    __tl_id__ = 0x1a46500a
+    __tl_name__ = "functions.messages.RequestSimpleWebView_163"
+    __tl_layer__ = 163
+
+    __slots__ = ("from_switch_webview", "from_side_menu", "bot", "url", "start_param", "theme_params", "platform", )
+
+    def __init__(self, *, bot: tl.base.InputUser, platform: str, from_switch_webview: bool = False, from_side_menu: bool = False, url: str | None = None, start_param: str | None = None, theme_params: tl.types.DataJSON | None = None):
+        self.from_switch_webview = from_switch_webview
+        self.from_side_menu = from_side_menu
+        self.bot = bot
+        self.url = url
+        self.start_param = start_param
+        self.theme_params = theme_params
+        self.platform = platform
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_switch_webview: flags1 |= (1 << 1)
+        if self.from_side_menu: flags1 |= (1 << 2)
+        if self.url is not None: flags1 |= (1 << 3)
+        if self.start_param is not None: flags1 |= (1 << 4)
+        if self.theme_params is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.bot.write_to(out, ctx)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        if self.start_param is not None:
+            String.write_to(out, self.start_param)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+        String.write_to(out, self.platform)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestSimpleWebView_163:
+        flags1 = Int.read(stream)
+        from_switch_webview = (flags1 & (1 << 1)) == (1 << 1)
+        from_side_menu = (flags1 & (1 << 2)) == (1 << 2)
+        bot = TLObject.read(stream)
+        url = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        start_param = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        platform = String.read(stream)
+        return cls(from_switch_webview=from_switch_webview, from_side_menu=from_side_menu, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestSimpleWebView_163, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        from_switch_webview = (flags1 & (1 << 1)) == (1 << 1)
+        from_side_menu = (flags1 & (1 << 2)) == (1 << 2)
+        bot, cursor = TLObject.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        start_param, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        platform, cursor = String.read_from(view, cursor)
+        return cls(from_switch_webview=from_switch_webview, from_side_menu=from_side_menu, bot=bot, url=url, start_param=start_param, theme_params=theme_params, platform=platform), cursor
+
+
+class SaveDraft_166(TLRequest[bool]):
+    __tl_id__ = 0x7ff3b806
+    __tl_name__ = "functions.messages.SaveDraft_166"
+    __tl_layer__ = 166
+
+    __slots__ = ("no_webpage", "invert_media", "reply_to", "peer", "message", "entities", "media", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, no_webpage: bool = False, invert_media: bool = False, reply_to: tl.base.InputReplyTo | None = None, entities: list[tl.base.MessageEntity] | None = None, media: tl.base.InputMedia | None = None):
+        self.no_webpage = no_webpage
+        self.invert_media = invert_media
+        self.reply_to = reply_to
+        self.peer = peer
+        self.message = message
+        self.entities = entities
+        self.media = media
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.invert_media: flags1 |= (1 << 6)
+        if self.reply_to is not None: flags1 |= (1 << 4)
+        if self.entities: flags1 |= (1 << 3)
+        if self.media is not None: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.message)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.media is not None:
+            self.media.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveDraft_166:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        invert_media = (flags1 & (1 << 6)) == (1 << 6)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        peer = TLObject.read(stream)
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        media = TLObject.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        return cls(no_webpage=no_webpage, invert_media=invert_media, reply_to=reply_to, peer=peer, message=message, entities=entities, media=media)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveDraft_166, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        invert_media = (flags1 & (1 << 6)) == (1 << 6)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        return cls(no_webpage=no_webpage, invert_media=invert_media, reply_to=reply_to, peer=peer, message=message, entities=entities, media=media), cursor
+
+
+class Search_170(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0xa7b4e929
+    __tl_name__ = "functions.messages.Search_170"
+    __tl_layer__ = 170
+
+    __slots__ = ("peer", "q", "from_id", "saved_peer_id", "top_msg_id", "filter", "min_date", "max_date", "offset_id", "add_offset", "limit", "max_id", "min_id", "hash", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, q: str, filter: tl.base.MessagesFilter, min_date: int, max_date: int, offset_id: int, add_offset: int, limit: int, max_id: int, min_id: int, hash: int, from_id: tl.base.InputPeer | None = None, saved_peer_id: tl.base.InputPeer | None = None, top_msg_id: int | None = None):
+        self.peer = peer
+        self.q = q
+        self.from_id = from_id
+        self.saved_peer_id = saved_peer_id
+        self.top_msg_id = top_msg_id
+        self.filter = filter
+        self.min_date = min_date
+        self.max_date = max_date
+        self.offset_id = offset_id
+        self.add_offset = add_offset
+        self.limit = limit
+        self.max_id = max_id
+        self.min_id = min_id
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_id is not None: flags1 |= (1 << 0)
+        if self.saved_peer_id is not None: flags1 |= (1 << 2)
+        if self.top_msg_id is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.q)
+        if self.from_id is not None:
+            self.from_id.write_to(out, ctx)
+        if self.saved_peer_id is not None:
+            self.saved_peer_id.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.min_date)
+        out += Int.write(self.max_date)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.add_offset)
+        out += Int.write(self.limit)
+        out += Int.write(self.max_id)
+        out += Int.write(self.min_id)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Search_170:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        q = String.read(stream)
+        from_id = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        saved_peer_id = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        filter = TLObject.read(stream)
+        min_date = Int.read(stream)
+        max_date = Int.read(stream)
+        offset_id = Int.read(stream)
+        add_offset = Int.read(stream)
+        limit = Int.read(stream)
+        max_id = Int.read(stream)
+        min_id = Int.read(stream)
+        hash = Long.read(stream)
+        return cls(peer=peer, q=q, from_id=from_id, saved_peer_id=saved_peer_id, top_msg_id=top_msg_id, filter=filter, min_date=min_date, max_date=max_date, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Search_170, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        q, cursor = String.read_from(view, cursor)
+        from_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        saved_peer_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        min_date, cursor = Int.read_from(view, cursor)
+        max_date, cursor = Int.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        add_offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        min_id, cursor = Int.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, q=q, from_id=from_id, saved_peer_id=saved_peer_id, top_msg_id=top_msg_id, filter=filter, min_date=min_date, max_date=max_date, offset_id=offset_id, add_offset=add_offset, limit=limit, max_id=max_id, min_id=min_id, hash=hash), cursor
+
+
+class GetSavedReactionTags_171(TLRequest[tl.base.messages.SavedReactionTags]):
+    __tl_id__ = 0x761ddacf
+    __tl_name__ = "functions.messages.GetSavedReactionTags_171"
+    __tl_layer__ = 171
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSavedReactionTags_171:
+        hash = Long.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSavedReactionTags_171, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class SendMessage_176(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xdff8042c
+    __tl_name__ = "functions.messages.SendMessage_176"
+    __tl_layer__ = 176
+
+    __slots__ = ("no_webpage", "silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "peer", "reply_to", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", "quick_reply_shortcut", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, random_id: int, no_webpage: bool = False, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, invert_media: bool = False, reply_to: tl.base.InputReplyTo | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None):
+        self.no_webpage = no_webpage
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.peer = peer
+        self.reply_to = reply_to
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMessage_176:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMessage_176, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut), cursor
+
+
+class SendMedia_176(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x7bd66041
+    __tl_name__ = "functions.messages.SendMedia_176"
+    __tl_layer__ = 176
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "peer", "reply_to", "media", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", "quick_reply_shortcut", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, message: str, random_id: int, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, invert_media: bool = False, reply_to: tl.base.InputReplyTo | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.peer = peer
+        self.reply_to = reply_to
+        self.media = media
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        self.media.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMedia_176:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        media = TLObject.read(stream)
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMedia_176, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut), cursor
+
+
+class ForwardMessages_176(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd5039208
+    __tl_name__ = "functions.messages.ForwardMessages_176"
+    __tl_layer__ = 176
+
+    __slots__ = ("silent", "background", "with_my_score", "drop_author", "drop_media_captions", "noforwards", "from_peer", "id", "random_id", "to_peer", "top_msg_id", "schedule_date", "send_as", "quick_reply_shortcut", )
+
+    def __init__(self, *, from_peer: tl.base.InputPeer, id: list[int], random_id: list[int], to_peer: tl.base.InputPeer, silent: bool = False, background: bool = False, with_my_score: bool = False, drop_author: bool = False, drop_media_captions: bool = False, noforwards: bool = False, top_msg_id: int | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None):
+        self.silent = silent
+        self.background = background
+        self.with_my_score = with_my_score
+        self.drop_author = drop_author
+        self.drop_media_captions = drop_media_captions
+        self.noforwards = noforwards
+        self.from_peer = from_peer
+        self.id = id
+        self.random_id = random_id
+        self.to_peer = to_peer
+        self.top_msg_id = top_msg_id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.with_my_score: flags1 |= (1 << 8)
+        if self.drop_author: flags1 |= (1 << 11)
+        if self.drop_media_captions: flags1 |= (1 << 12)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        out += Int.write(flags1)
+        self.from_peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        out += LongVector.write(self.random_id)
+        self.to_peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ForwardMessages_176:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        from_peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        random_id = LongVector.read(stream)
+        to_peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, top_msg_id=top_msg_id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ForwardMessages_176, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        from_peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        random_id, cursor = LongVector.read_from(view, cursor)
+        to_peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, top_msg_id=top_msg_id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut), cursor
+
+
+class SendInlineBotResult_176(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x3ebee86a
+    __tl_name__ = "functions.messages.SendInlineBotResult_176"
+    __tl_layer__ = 176
+
+    __slots__ = ("silent", "background", "clear_draft", "hide_via", "peer", "reply_to", "random_id", "query_id", "id", "schedule_date", "send_as", "quick_reply_shortcut", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: int, query_id: int, id: str, silent: bool = False, background: bool = False, clear_draft: bool = False, hide_via: bool = False, reply_to: tl.base.InputReplyTo | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.hide_via = hide_via
+        self.peer = peer
+        self.reply_to = reply_to
+        self.random_id = random_id
+        self.query_id = query_id
+        self.id = id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.hide_via: flags1 |= (1 << 11)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        out += Long.write(self.random_id)
+        out += Long.write(self.query_id)
+        String.write_to(out, self.id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendInlineBotResult_176:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        random_id = Long.read(stream)
+        query_id = Long.read(stream)
+        id = String.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to=reply_to, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendInlineBotResult_176, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        hide_via = (flags1 & (1 << 11)) == (1 << 11)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        query_id, cursor = Long.read_from(view, cursor)
+        id, cursor = String.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, hide_via=hide_via, peer=peer, reply_to=reply_to, random_id=random_id, query_id=query_id, id=id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut), cursor
+
+
+class SendMultiMedia_176(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xc964709
+    __tl_name__ = "functions.messages.SendMultiMedia_176"
+    __tl_layer__ = 176
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "peer", "reply_to", "multi_media", "schedule_date", "send_as", "quick_reply_shortcut", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, multi_media: list[tl.base.InputSingleMedia], silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, invert_media: bool = False, reply_to: tl.base.InputReplyTo | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.peer = peer
+        self.reply_to = reply_to
+        self.multi_media = multi_media
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.multi_media, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMultiMedia_176:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        multi_media = TLObjectVector.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMultiMedia_176, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        multi_media, cursor = TLObjectVector.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut), cursor
+
+
+class SendQuickReplyMessages_176(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x33153ad4
+    __tl_name__ = "functions.messages.SendQuickReplyMessages_176"
+    __tl_layer__ = 176
+
+    __slots__ = ("peer", "shortcut_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, shortcut_id: int):
+        self.peer = peer
+        self.shortcut_id = shortcut_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.shortcut_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendQuickReplyMessages_176:
+        peer = TLObject.read(stream)
+        shortcut_id = Int.read(stream)
+        return cls(peer=peer, shortcut_id=shortcut_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendQuickReplyMessages_176, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        shortcut_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, shortcut_id=shortcut_id), cursor
+
+
+class SetChatAvailableReactions_179(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x5a150bd4
+    __tl_name__ = "functions.messages.SetChatAvailableReactions_179"
+    __tl_layer__ = 179
+
+    __slots__ = ("peer", "available_reactions", "reactions_limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, available_reactions: tl.base.ChatReactions, reactions_limit: int | None = None):
+        self.peer = peer
+        self.available_reactions = available_reactions
+        self.reactions_limit = reactions_limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.reactions_limit is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.available_reactions.write_to(out, ctx)
+        if self.reactions_limit is not None:
+            out += Int.write(self.reactions_limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetChatAvailableReactions_179:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        available_reactions = TLObject.read(stream)
+        reactions_limit = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(peer=peer, available_reactions=available_reactions, reactions_limit=reactions_limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetChatAvailableReactions_179, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        available_reactions, cursor = TLObject.read_from(view, cursor)
+        reactions_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(peer=peer, available_reactions=available_reactions, reactions_limit=reactions_limit), cursor
+
+
+class SendMessage_181(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x983f9745
+    __tl_name__ = "functions.messages.SendMessage_181"
+    __tl_layer__ = 181
+
+    __slots__ = ("no_webpage", "silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "peer", "reply_to", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", "quick_reply_shortcut", "effect", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, message: str, random_id: int, no_webpage: bool = False, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, invert_media: bool = False, reply_to: tl.base.InputReplyTo | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None, effect: int | None = None):
+        self.no_webpage = no_webpage
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.peer = peer
+        self.reply_to = reply_to
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.effect = effect
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.no_webpage: flags1 |= (1 << 1)
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        if self.effect is not None: flags1 |= (1 << 18)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+        if self.effect is not None:
+            out += Long.write(self.effect)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMessage_181:
+        flags1 = Int.read(stream)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        effect = Long.read(stream) if (flags1 & (1 << 18)) == (1 << 18) else None
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMessage_181, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        no_webpage = (flags1 & (1 << 1)) == (1 << 1)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        effect, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 18)) == (1 << 18) else (None, cursor)
+        return cls(no_webpage=no_webpage, silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect), cursor
+
+
+class SendMedia_181(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x7852834e
+    __tl_name__ = "functions.messages.SendMedia_181"
+    __tl_layer__ = 181
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "peer", "reply_to", "media", "message", "random_id", "reply_markup", "entities", "schedule_date", "send_as", "quick_reply_shortcut", "effect", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, message: str, random_id: int, silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, invert_media: bool = False, reply_to: tl.base.InputReplyTo | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None, effect: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.peer = peer
+        self.reply_to = reply_to
+        self.media = media
+        self.message = message
+        self.random_id = random_id
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.effect = effect
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.reply_markup is not None: flags1 |= (1 << 2)
+        if self.entities: flags1 |= (1 << 3)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        if self.effect is not None: flags1 |= (1 << 18)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        self.media.write_to(out, ctx)
+        String.write_to(out, self.message)
+        out += Long.write(self.random_id)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+        if self.effect is not None:
+            out += Long.write(self.effect)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMedia_181:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        media = TLObject.read(stream)
+        message = String.read(stream)
+        random_id = Long.read(stream)
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        effect = Long.read(stream) if (flags1 & (1 << 18)) == (1 << 18) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMedia_181, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        effect, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 18)) == (1 << 18) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, media=media, message=message, random_id=random_id, reply_markup=reply_markup, entities=entities, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect), cursor
+
+
+class SendMultiMedia_181(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x37b74355
+    __tl_name__ = "functions.messages.SendMultiMedia_181"
+    __tl_layer__ = 181
+
+    __slots__ = ("silent", "background", "clear_draft", "noforwards", "update_stickersets_order", "invert_media", "peer", "reply_to", "multi_media", "schedule_date", "send_as", "quick_reply_shortcut", "effect", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, multi_media: list[tl.base.InputSingleMedia], silent: bool = False, background: bool = False, clear_draft: bool = False, noforwards: bool = False, update_stickersets_order: bool = False, invert_media: bool = False, reply_to: tl.base.InputReplyTo | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None, effect: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.clear_draft = clear_draft
+        self.noforwards = noforwards
+        self.update_stickersets_order = update_stickersets_order
+        self.invert_media = invert_media
+        self.peer = peer
+        self.reply_to = reply_to
+        self.multi_media = multi_media
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.effect = effect
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.clear_draft: flags1 |= (1 << 7)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.update_stickersets_order: flags1 |= (1 << 15)
+        if self.invert_media: flags1 |= (1 << 16)
+        if self.reply_to is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        if self.effect is not None: flags1 |= (1 << 18)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.multi_media, ctx)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+        if self.effect is not None:
+            out += Long.write(self.effect)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendMultiMedia_181:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer = TLObject.read(stream)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        multi_media = TLObjectVector.read(stream)
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        effect = Long.read(stream) if (flags1 & (1 << 18)) == (1 << 18) else None
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendMultiMedia_181, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        clear_draft = (flags1 & (1 << 7)) == (1 << 7)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        update_stickersets_order = (flags1 & (1 << 15)) == (1 << 15)
+        invert_media = (flags1 & (1 << 16)) == (1 << 16)
+        peer, cursor = TLObject.read_from(view, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        multi_media, cursor = TLObjectVector.read_from(view, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        effect, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 18)) == (1 << 18) else (None, cursor)
+        return cls(silent=silent, background=background, clear_draft=clear_draft, noforwards=noforwards, update_stickersets_order=update_stickersets_order, invert_media=invert_media, peer=peer, reply_to=reply_to, multi_media=multi_media, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, effect=effect), cursor
+
+
+class SendPaidReaction_186(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x25c8fe3e
+    __tl_name__ = "functions.messages.SendPaidReaction_186"
+    __tl_layer__ = 186
+
+    __slots__ = ("private", "peer", "msg_id", "count", "random_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, count: int, random_id: int, private: bool = False):
+        self.private = private
+        self.peer = peer
+        self.msg_id = msg_id
+        self.count = count
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.private: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Int.write(self.count)
+        out += Long.write(self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendPaidReaction_186:
+        flags1 = Int.read(stream)
+        private = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        count = Int.read(stream)
+        random_id = Long.read(stream)
+        return cls(private=private, peer=peer, msg_id=msg_id, count=count, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendPaidReaction_186, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        private = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        return cls(private=private, peer=peer, msg_id=msg_id, count=count, random_id=random_id), cursor
+
+
+class TogglePaidReactionPrivacy_186(TLRequest[bool]):
+    __tl_id__ = 0x849ad397
+    __tl_name__ = "functions.messages.TogglePaidReactionPrivacy_186"
+    __tl_layer__ = 186
+
+    __slots__ = ("peer", "msg_id", "private", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, private: bool):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.private = private
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Bool.write(self.private)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TogglePaidReactionPrivacy_186:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        private = Bool.read(stream)
+        return cls(peer=peer, msg_id=msg_id, private=private)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TogglePaidReactionPrivacy_186, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        private, cursor = Bool.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id, private=private), cursor
+
+
+class SendPaidReaction_187(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x9dd6a67b
+    __tl_name__ = "functions.messages.SendPaidReaction_187"
+    __tl_layer__ = 187
+
+    __slots__ = ("peer", "msg_id", "count", "random_id", "private", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, count: int, random_id: int, private: bool = False):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.count = count
+        self.random_id = random_id
+        self.private = private
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.private is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Int.write(self.count)
+        out += Long.write(self.random_id)
+        if self.private is not None:
+            out += Bool.write(self.private)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendPaidReaction_187:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        count = Int.read(stream)
+        random_id = Long.read(stream)
+        private = Bool.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(peer=peer, msg_id=msg_id, count=count, random_id=random_id, private=private)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendPaidReaction_187, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        private, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(peer=peer, msg_id=msg_id, count=count, random_id=random_id, private=private), cursor
+
+
+class ViewSponsoredMessage_192(TLRequest[bool]):
+    __tl_id__ = 0x673ad8f1
+    __tl_name__ = "functions.messages.ViewSponsoredMessage_192"
+    __tl_layer__ = 192
+
+    __slots__ = ("peer", "random_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: bytes):
+        self.peer = peer
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        Bytes.write_to(out, self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ViewSponsoredMessage_192:
+        peer = TLObject.read(stream)
+        random_id = Bytes.read(stream)
+        return cls(peer=peer, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ViewSponsoredMessage_192, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Bytes.read_from(view, cursor)
+        return cls(peer=peer, random_id=random_id), cursor
+
+
+class ClickSponsoredMessage_192(TLRequest[bool]):
+    __tl_id__ = 0xf093465
+    __tl_name__ = "functions.messages.ClickSponsoredMessage_192"
+    __tl_layer__ = 192
+
+    __slots__ = ("media", "fullscreen", "peer", "random_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: bytes, media: bool = False, fullscreen: bool = False):
+        self.media = media
+        self.fullscreen = fullscreen
+        self.peer = peer
+        self.random_id = random_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.media: flags1 |= (1 << 0)
+        if self.fullscreen: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        Bytes.write_to(out, self.random_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClickSponsoredMessage_192:
+        flags1 = Int.read(stream)
+        media = (flags1 & (1 << 0)) == (1 << 0)
+        fullscreen = (flags1 & (1 << 1)) == (1 << 1)
+        peer = TLObject.read(stream)
+        random_id = Bytes.read(stream)
+        return cls(media=media, fullscreen=fullscreen, peer=peer, random_id=random_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClickSponsoredMessage_192, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        media = (flags1 & (1 << 0)) == (1 << 0)
+        fullscreen = (flags1 & (1 << 1)) == (1 << 1)
+        peer, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Bytes.read_from(view, cursor)
+        return cls(media=media, fullscreen=fullscreen, peer=peer, random_id=random_id), cursor
+
+
+class ReportSponsoredMessage_192(TLRequest[tl.base.channels.SponsoredMessageReportResult]):
+    __tl_id__ = 0x1af3dbb8
+    __tl_name__ = "functions.messages.ReportSponsoredMessage_192"
+    __tl_layer__ = 192
+
+    __slots__ = ("peer", "random_id", "option", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: bytes, option: bytes):
+        self.peer = peer
+        self.random_id = random_id
+        self.option = option
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        Bytes.write_to(out, self.random_id)
+        Bytes.write_to(out, self.option)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReportSponsoredMessage_192:
+        peer = TLObject.read(stream)
+        random_id = Bytes.read(stream)
+        option = Bytes.read(stream)
+        return cls(peer=peer, random_id=random_id, option=option)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReportSponsoredMessage_192, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Bytes.read_from(view, cursor)
+        option, cursor = Bytes.read_from(view, cursor)
+        return cls(peer=peer, random_id=random_id, option=option), cursor
+
+
+class ForwardMessages_198(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x6d74da08
+    __tl_name__ = "functions.messages.ForwardMessages_198"
+    __tl_layer__ = 198
+
+    __slots__ = ("silent", "background", "with_my_score", "drop_author", "drop_media_captions", "noforwards", "allow_paid_floodskip", "from_peer", "id", "random_id", "to_peer", "top_msg_id", "schedule_date", "send_as", "quick_reply_shortcut", "video_timestamp", )
+
+    def __init__(self, *, from_peer: tl.base.InputPeer, id: list[int], random_id: list[int], to_peer: tl.base.InputPeer, silent: bool = False, background: bool = False, with_my_score: bool = False, drop_author: bool = False, drop_media_captions: bool = False, noforwards: bool = False, allow_paid_floodskip: bool = False, top_msg_id: int | None = None, schedule_date: int | None = None, send_as: tl.base.InputPeer | None = None, quick_reply_shortcut: tl.base.InputQuickReplyShortcut | None = None, video_timestamp: int | None = None):
+        self.silent = silent
+        self.background = background
+        self.with_my_score = with_my_score
+        self.drop_author = drop_author
+        self.drop_media_captions = drop_media_captions
+        self.noforwards = noforwards
+        self.allow_paid_floodskip = allow_paid_floodskip
+        self.from_peer = from_peer
+        self.id = id
+        self.random_id = random_id
+        self.to_peer = to_peer
+        self.top_msg_id = top_msg_id
+        self.schedule_date = schedule_date
+        self.send_as = send_as
+        self.quick_reply_shortcut = quick_reply_shortcut
+        self.video_timestamp = video_timestamp
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 5)
+        if self.background: flags1 |= (1 << 6)
+        if self.with_my_score: flags1 |= (1 << 8)
+        if self.drop_author: flags1 |= (1 << 11)
+        if self.drop_media_captions: flags1 |= (1 << 12)
+        if self.noforwards: flags1 |= (1 << 14)
+        if self.allow_paid_floodskip: flags1 |= (1 << 19)
+        if self.top_msg_id is not None: flags1 |= (1 << 9)
+        if self.schedule_date is not None: flags1 |= (1 << 10)
+        if self.send_as is not None: flags1 |= (1 << 13)
+        if self.quick_reply_shortcut is not None: flags1 |= (1 << 17)
+        if self.video_timestamp is not None: flags1 |= (1 << 20)
+        out += Int.write(flags1)
+        self.from_peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        out += LongVector.write(self.random_id)
+        self.to_peer.write_to(out, ctx)
+        if self.top_msg_id is not None:
+            out += Int.write(self.top_msg_id)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+        if self.send_as is not None:
+            self.send_as.write_to(out, ctx)
+        if self.quick_reply_shortcut is not None:
+            self.quick_reply_shortcut.write_to(out, ctx)
+        if self.video_timestamp is not None:
+            out += Int.write(self.video_timestamp)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ForwardMessages_198:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        from_peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        random_id = LongVector.read(stream)
+        to_peer = TLObject.read(stream)
+        top_msg_id = Int.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        send_as = TLObject.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        quick_reply_shortcut = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        video_timestamp = Int.read(stream) if (flags1 & (1 << 20)) == (1 << 20) else None
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, allow_paid_floodskip=allow_paid_floodskip, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, top_msg_id=top_msg_id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, video_timestamp=video_timestamp)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ForwardMessages_198, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 5)) == (1 << 5)
+        background = (flags1 & (1 << 6)) == (1 << 6)
+        with_my_score = (flags1 & (1 << 8)) == (1 << 8)
+        drop_author = (flags1 & (1 << 11)) == (1 << 11)
+        drop_media_captions = (flags1 & (1 << 12)) == (1 << 12)
+        noforwards = (flags1 & (1 << 14)) == (1 << 14)
+        allow_paid_floodskip = (flags1 & (1 << 19)) == (1 << 19)
+        from_peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        random_id, cursor = LongVector.read_from(view, cursor)
+        to_peer, cursor = TLObject.read_from(view, cursor)
+        top_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        send_as, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        quick_reply_shortcut, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        video_timestamp, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 20)) == (1 << 20) else (None, cursor)
+        return cls(silent=silent, background=background, with_my_score=with_my_score, drop_author=drop_author, drop_media_captions=drop_media_captions, noforwards=noforwards, allow_paid_floodskip=allow_paid_floodskip, from_peer=from_peer, id=id, random_id=random_id, to_peer=to_peer, top_msg_id=top_msg_id, schedule_date=schedule_date, send_as=send_as, quick_reply_shortcut=quick_reply_shortcut, video_timestamp=video_timestamp), cursor
@@ -0,0 +1,2070 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetPaymentForm(TLRequest[tl.base.payments.PaymentForm]):
+    __tl_id__ = 0x37148dbb
+    __tl_name__ = "functions.payments.GetPaymentForm"
+    __tl_layer__ = 143
+
+    __slots__ = ("invoice", "theme_params", )
+
+    def __init__(self, *, invoice: tl.base.InputInvoice, theme_params: tl.types.DataJSON | None = None):
+        self.invoice = invoice
+        self.theme_params = theme_params
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.theme_params is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.invoice.write_to(out, ctx)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPaymentForm:
+        flags1 = Int.read(stream)
+        invoice = TLObject.read(stream)
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(invoice=invoice, theme_params=theme_params)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPaymentForm, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(invoice=invoice, theme_params=theme_params), cursor
+
+
+class GetPaymentReceipt(TLRequest[tl.base.payments.PaymentReceipt]):
+    __tl_id__ = 0x2478d1cc
+    __tl_name__ = "functions.payments.GetPaymentReceipt"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPaymentReceipt:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPaymentReceipt, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class ValidateRequestedInfo(TLRequest[tl.types.payments.ValidatedRequestedInfo]):
+    __tl_id__ = 0xb6c8f12b
+    __tl_name__ = "functions.payments.ValidateRequestedInfo"
+    __tl_layer__ = 143
+
+    __slots__ = ("save", "invoice", "info", )
+
+    def __init__(self, *, invoice: tl.base.InputInvoice, info: tl.types.PaymentRequestedInfo, save: bool = False):
+        self.save = save
+        self.invoice = invoice
+        self.info = info
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.save: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.invoice.write_to(out, ctx)
+        self.info.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ValidateRequestedInfo:
+        flags1 = Int.read(stream)
+        save = (flags1 & (1 << 0)) == (1 << 0)
+        invoice = TLObject.read(stream)
+        info = tl.types.PaymentRequestedInfo.read(stream)
+        return cls(save=save, invoice=invoice, info=info)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ValidateRequestedInfo, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        save = (flags1 & (1 << 0)) == (1 << 0)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        info, cursor = tl.types.PaymentRequestedInfo.read_from(view, cursor)
+        return cls(save=save, invoice=invoice, info=info), cursor
+
+
+class SendPaymentForm(TLRequest[tl.base.payments.PaymentResult]):
+    __tl_id__ = 0x2d03522f
+    __tl_name__ = "functions.payments.SendPaymentForm"
+    __tl_layer__ = 143
+
+    __slots__ = ("form_id", "invoice", "requested_info_id", "shipping_option_id", "credentials", "tip_amount", )
+
+    def __init__(self, *, form_id: int, invoice: tl.base.InputInvoice, credentials: tl.base.InputPaymentCredentials, requested_info_id: str | None = None, shipping_option_id: str | None = None, tip_amount: int | None = None):
+        self.form_id = form_id
+        self.invoice = invoice
+        self.requested_info_id = requested_info_id
+        self.shipping_option_id = shipping_option_id
+        self.credentials = credentials
+        self.tip_amount = tip_amount
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.requested_info_id is not None: flags1 |= (1 << 0)
+        if self.shipping_option_id is not None: flags1 |= (1 << 1)
+        if self.tip_amount is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Long.write(self.form_id)
+        self.invoice.write_to(out, ctx)
+        if self.requested_info_id is not None:
+            String.write_to(out, self.requested_info_id)
+        if self.shipping_option_id is not None:
+            String.write_to(out, self.shipping_option_id)
+        self.credentials.write_to(out, ctx)
+        if self.tip_amount is not None:
+            out += Long.write(self.tip_amount)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendPaymentForm:
+        flags1 = Int.read(stream)
+        form_id = Long.read(stream)
+        invoice = TLObject.read(stream)
+        requested_info_id = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        shipping_option_id = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        credentials = TLObject.read(stream)
+        tip_amount = Long.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(form_id=form_id, invoice=invoice, requested_info_id=requested_info_id, shipping_option_id=shipping_option_id, credentials=credentials, tip_amount=tip_amount)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendPaymentForm, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        form_id, cursor = Long.read_from(view, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        requested_info_id, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        shipping_option_id, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        credentials, cursor = TLObject.read_from(view, cursor)
+        tip_amount, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(form_id=form_id, invoice=invoice, requested_info_id=requested_info_id, shipping_option_id=shipping_option_id, credentials=credentials, tip_amount=tip_amount), cursor
+
+
+class GetSavedInfo(TLRequest[tl.types.payments.SavedInfo]):
+    __tl_id__ = 0x227d824b
+    __tl_name__ = "functions.payments.GetSavedInfo"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSavedInfo:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSavedInfo, int]:
+        return cls(), cursor
+
+
+class ClearSavedInfo(TLRequest[bool]):
+    __tl_id__ = 0xd83d70c1
+    __tl_name__ = "functions.payments.ClearSavedInfo"
+    __tl_layer__ = 133
+
+    __slots__ = ("credentials", "info", )
+
+    def __init__(self, *, credentials: bool = False, info: bool = False):
+        self.credentials = credentials
+        self.info = info
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.credentials: flags1 |= (1 << 0)
+        if self.info: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ClearSavedInfo:
+        flags1 = Int.read(stream)
+        credentials = (flags1 & (1 << 0)) == (1 << 0)
+        info = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(credentials=credentials, info=info)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ClearSavedInfo, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        credentials = (flags1 & (1 << 0)) == (1 << 0)
+        info = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(credentials=credentials, info=info), cursor
+
+
+class GetBankCardData(TLRequest[tl.types.payments.BankCardData]):
+    __tl_id__ = 0x2e79d779
+    __tl_name__ = "functions.payments.GetBankCardData"
+    __tl_layer__ = 133
+
+    __slots__ = ("number", )
+
+    def __init__(self, *, number: str):
+        self.number = number
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.number)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBankCardData:
+        number = String.read(stream)
+        return cls(number=number)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBankCardData, int]:
+        number, cursor = String.read_from(view, cursor)
+        return cls(number=number), cursor
+
+
+class ExportInvoice(TLRequest[tl.types.payments.ExportedInvoice]):
+    __tl_id__ = 0xf91b065
+    __tl_name__ = "functions.payments.ExportInvoice"
+    __tl_layer__ = 143
+
+    __slots__ = ("invoice_media", )
+
+    def __init__(self, *, invoice_media: tl.base.InputMedia):
+        self.invoice_media = invoice_media
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.invoice_media.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportInvoice:
+        invoice_media = TLObject.read(stream)
+        return cls(invoice_media=invoice_media)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportInvoice, int]:
+        invoice_media, cursor = TLObject.read_from(view, cursor)
+        return cls(invoice_media=invoice_media), cursor
+
+
+class AssignAppStoreTransaction(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x80ed747d
+    __tl_name__ = "functions.payments.AssignAppStoreTransaction"
+    __tl_layer__ = 144
+
+    __slots__ = ("receipt", "purpose", )
+
+    def __init__(self, *, receipt: bytes, purpose: tl.base.InputStorePaymentPurpose):
+        self.receipt = receipt
+        self.purpose = purpose
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.receipt)
+        self.purpose.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AssignAppStoreTransaction:
+        receipt = Bytes.read(stream)
+        purpose = TLObject.read(stream)
+        return cls(receipt=receipt, purpose=purpose)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AssignAppStoreTransaction, int]:
+        receipt, cursor = Bytes.read_from(view, cursor)
+        purpose, cursor = TLObject.read_from(view, cursor)
+        return cls(receipt=receipt, purpose=purpose), cursor
+
+
+class AssignPlayMarketTransaction(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xdffd50d3
+    __tl_name__ = "functions.payments.AssignPlayMarketTransaction"
+    __tl_layer__ = 144
+
+    __slots__ = ("receipt", "purpose", )
+
+    def __init__(self, *, receipt: tl.types.DataJSON, purpose: tl.base.InputStorePaymentPurpose):
+        self.receipt = receipt
+        self.purpose = purpose
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.receipt.write_to(out, ctx)
+        self.purpose.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AssignPlayMarketTransaction:
+        receipt = tl.types.DataJSON.read(stream)
+        purpose = TLObject.read(stream)
+        return cls(receipt=receipt, purpose=purpose)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AssignPlayMarketTransaction, int]:
+        receipt, cursor = tl.types.DataJSON.read_from(view, cursor)
+        purpose, cursor = TLObject.read_from(view, cursor)
+        return cls(receipt=receipt, purpose=purpose), cursor
+
+
+class GetPremiumGiftCodeOptions(TLRequest[list[tl.base.PremiumGiftCodeOption]]):
+    __tl_id__ = 0x2757ba54
+    __tl_name__ = "functions.payments.GetPremiumGiftCodeOptions"
+    __tl_layer__ = 166
+
+    __slots__ = ("boost_peer", )
+
+    def __init__(self, *, boost_peer: tl.base.InputPeer | None = None):
+        self.boost_peer = boost_peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.boost_peer is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.boost_peer is not None:
+            self.boost_peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPremiumGiftCodeOptions:
+        flags1 = Int.read(stream)
+        boost_peer = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(boost_peer=boost_peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPremiumGiftCodeOptions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        boost_peer, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(boost_peer=boost_peer), cursor
+
+
+class CheckGiftCode(TLRequest[tl.base.payments.CheckedGiftCode]):
+    __tl_id__ = 0x8e51b4c1
+    __tl_name__ = "functions.payments.CheckGiftCode"
+    __tl_layer__ = 166
+
+    __slots__ = ("slug", )
+
+    def __init__(self, *, slug: str):
+        self.slug = slug
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.slug)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckGiftCode:
+        slug = String.read(stream)
+        return cls(slug=slug)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckGiftCode, int]:
+        slug, cursor = String.read_from(view, cursor)
+        return cls(slug=slug), cursor
+
+
+class ApplyGiftCode(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf6e26854
+    __tl_name__ = "functions.payments.ApplyGiftCode"
+    __tl_layer__ = 166
+
+    __slots__ = ("slug", )
+
+    def __init__(self, *, slug: str):
+        self.slug = slug
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.slug)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ApplyGiftCode:
+        slug = String.read(stream)
+        return cls(slug=slug)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ApplyGiftCode, int]:
+        slug, cursor = String.read_from(view, cursor)
+        return cls(slug=slug), cursor
+
+
+class GetGiveawayInfo(TLRequest[tl.base.payments.GiveawayInfo]):
+    __tl_id__ = 0xf4239425
+    __tl_name__ = "functions.payments.GetGiveawayInfo"
+    __tl_layer__ = 166
+
+    __slots__ = ("peer", "msg_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int):
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetGiveawayInfo:
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(peer=peer, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetGiveawayInfo, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, msg_id=msg_id), cursor
+
+
+class LaunchPrepaidGiveaway(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x5ff58f20
+    __tl_name__ = "functions.payments.LaunchPrepaidGiveaway"
+    __tl_layer__ = 166
+
+    __slots__ = ("peer", "giveaway_id", "purpose", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, giveaway_id: int, purpose: tl.base.InputStorePaymentPurpose):
+        self.peer = peer
+        self.giveaway_id = giveaway_id
+        self.purpose = purpose
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.giveaway_id)
+        self.purpose.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LaunchPrepaidGiveaway:
+        peer = TLObject.read(stream)
+        giveaway_id = Long.read(stream)
+        purpose = TLObject.read(stream)
+        return cls(peer=peer, giveaway_id=giveaway_id, purpose=purpose)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LaunchPrepaidGiveaway, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        giveaway_id, cursor = Long.read_from(view, cursor)
+        purpose, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, giveaway_id=giveaway_id, purpose=purpose), cursor
+
+
+class GetStarsTopupOptions(TLRequest[list[tl.base.StarsTopupOption]]):
+    __tl_id__ = 0xc00ec7d3
+    __tl_name__ = "functions.payments.GetStarsTopupOptions"
+    __tl_layer__ = 181
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsTopupOptions:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsTopupOptions, int]:
+        return cls(), cursor
+
+
+class GetStarsStatus(TLRequest[tl.base.payments.StarsStatus]):
+    __tl_id__ = 0x104fcfa7
+    __tl_name__ = "functions.payments.GetStarsStatus"
+    __tl_layer__ = 181
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsStatus:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsStatus, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class GetStarsTransactions(TLRequest[tl.base.payments.StarsStatus]):
+    __tl_id__ = 0x69da4557
+    __tl_name__ = "functions.payments.GetStarsTransactions"
+    __tl_layer__ = 186
+
+    __slots__ = ("inbound", "outbound", "ascending", "subscription_id", "peer", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset: str, limit: int, inbound: bool = False, outbound: bool = False, ascending: bool = False, subscription_id: str | None = None):
+        self.inbound = inbound
+        self.outbound = outbound
+        self.ascending = ascending
+        self.subscription_id = subscription_id
+        self.peer = peer
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.inbound: flags1 |= (1 << 0)
+        if self.outbound: flags1 |= (1 << 1)
+        if self.ascending: flags1 |= (1 << 2)
+        if self.subscription_id is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        if self.subscription_id is not None:
+            String.write_to(out, self.subscription_id)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsTransactions:
+        flags1 = Int.read(stream)
+        inbound = (flags1 & (1 << 0)) == (1 << 0)
+        outbound = (flags1 & (1 << 1)) == (1 << 1)
+        ascending = (flags1 & (1 << 2)) == (1 << 2)
+        subscription_id = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        peer = TLObject.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(inbound=inbound, outbound=outbound, ascending=ascending, subscription_id=subscription_id, peer=peer, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsTransactions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        inbound = (flags1 & (1 << 0)) == (1 << 0)
+        outbound = (flags1 & (1 << 1)) == (1 << 1)
+        ascending = (flags1 & (1 << 2)) == (1 << 2)
+        subscription_id, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(inbound=inbound, outbound=outbound, ascending=ascending, subscription_id=subscription_id, peer=peer, offset=offset, limit=limit), cursor
+
+
+class SendStarsForm(TLRequest[tl.base.payments.PaymentResult]):
+    __tl_id__ = 0x7998c914
+    __tl_name__ = "functions.payments.SendStarsForm"
+    __tl_layer__ = 189
+
+    __slots__ = ("form_id", "invoice", )
+
+    def __init__(self, *, form_id: int, invoice: tl.base.InputInvoice):
+        self.form_id = form_id
+        self.invoice = invoice
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.form_id)
+        self.invoice.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendStarsForm:
+        form_id = Long.read(stream)
+        invoice = TLObject.read(stream)
+        return cls(form_id=form_id, invoice=invoice)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendStarsForm, int]:
+        form_id, cursor = Long.read_from(view, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        return cls(form_id=form_id, invoice=invoice), cursor
+
+
+class RefundStarsCharge(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x25ae8f4a
+    __tl_name__ = "functions.payments.RefundStarsCharge"
+    __tl_layer__ = 181
+
+    __slots__ = ("user_id", "charge_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, charge_id: str):
+        self.user_id = user_id
+        self.charge_id = charge_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        String.write_to(out, self.charge_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RefundStarsCharge:
+        user_id = TLObject.read(stream)
+        charge_id = String.read(stream)
+        return cls(user_id=user_id, charge_id=charge_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RefundStarsCharge, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        charge_id, cursor = String.read_from(view, cursor)
+        return cls(user_id=user_id, charge_id=charge_id), cursor
+
+
+class GetStarsRevenueStats(TLRequest[tl.types.payments.StarsRevenueStats]):
+    __tl_id__ = 0xd91ffad6
+    __tl_name__ = "functions.payments.GetStarsRevenueStats"
+    __tl_layer__ = 182
+
+    __slots__ = ("dark", "peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, dark: bool = False):
+        self.dark = dark
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.dark: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsRevenueStats:
+        flags1 = Int.read(stream)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        return cls(dark=dark, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsRevenueStats, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(dark=dark, peer=peer), cursor
+
+
+class GetStarsRevenueWithdrawalUrl(TLRequest[tl.types.payments.StarsRevenueWithdrawalUrl]):
+    __tl_id__ = 0x13bbe8b3
+    __tl_name__ = "functions.payments.GetStarsRevenueWithdrawalUrl"
+    __tl_layer__ = 182
+
+    __slots__ = ("peer", "stars", "password", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, stars: int, password: tl.base.InputCheckPasswordSRP):
+        self.peer = peer
+        self.stars = stars
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.stars)
+        self.password.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsRevenueWithdrawalUrl:
+        peer = TLObject.read(stream)
+        stars = Long.read(stream)
+        password = TLObject.read(stream)
+        return cls(peer=peer, stars=stars, password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsRevenueWithdrawalUrl, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        stars, cursor = Long.read_from(view, cursor)
+        password, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, stars=stars, password=password), cursor
+
+
+class GetStarsRevenueAdsAccountUrl(TLRequest[tl.types.payments.StarsRevenueAdsAccountUrl]):
+    __tl_id__ = 0xd1d7efc5
+    __tl_name__ = "functions.payments.GetStarsRevenueAdsAccountUrl"
+    __tl_layer__ = 183
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsRevenueAdsAccountUrl:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsRevenueAdsAccountUrl, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class GetStarsTransactionsByID(TLRequest[tl.base.payments.StarsStatus]):
+    __tl_id__ = 0x27842d2e
+    __tl_name__ = "functions.payments.GetStarsTransactionsByID"
+    __tl_layer__ = 183
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[tl.base.InputStarsTransaction]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsTransactionsByID:
+        peer = TLObject.read(stream)
+        id = TLObjectVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsTransactionsByID, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class GetStarsGiftOptions(TLRequest[list[tl.base.StarsGiftOption]]):
+    __tl_id__ = 0xd3c96bc8
+    __tl_name__ = "functions.payments.GetStarsGiftOptions"
+    __tl_layer__ = 185
+
+    __slots__ = ("user_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser | None = None):
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.user_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.user_id is not None:
+            self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsGiftOptions:
+        flags1 = Int.read(stream)
+        user_id = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsGiftOptions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(user_id=user_id), cursor
+
+
+class GetStarsSubscriptions(TLRequest[tl.base.payments.StarsStatus]):
+    __tl_id__ = 0x32512c5
+    __tl_name__ = "functions.payments.GetStarsSubscriptions"
+    __tl_layer__ = 186
+
+    __slots__ = ("missing_balance", "peer", "offset", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset: str, missing_balance: bool = False):
+        self.missing_balance = missing_balance
+        self.peer = peer
+        self.offset = offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.missing_balance: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsSubscriptions:
+        flags1 = Int.read(stream)
+        missing_balance = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        offset = String.read(stream)
+        return cls(missing_balance=missing_balance, peer=peer, offset=offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsSubscriptions, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        missing_balance = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        return cls(missing_balance=missing_balance, peer=peer, offset=offset), cursor
+
+
+class ChangeStarsSubscription(TLRequest[bool]):
+    __tl_id__ = 0xc7770878
+    __tl_name__ = "functions.payments.ChangeStarsSubscription"
+    __tl_layer__ = 186
+
+    __slots__ = ("peer", "subscription_id", "canceled", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, subscription_id: str, canceled: bool = False):
+        self.peer = peer
+        self.subscription_id = subscription_id
+        self.canceled = canceled
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.canceled is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.subscription_id)
+        if self.canceled is not None:
+            out += Bool.write(self.canceled)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChangeStarsSubscription:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        subscription_id = String.read(stream)
+        canceled = Bool.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(peer=peer, subscription_id=subscription_id, canceled=canceled)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChangeStarsSubscription, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        subscription_id, cursor = String.read_from(view, cursor)
+        canceled, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(peer=peer, subscription_id=subscription_id, canceled=canceled), cursor
+
+
+class FulfillStarsSubscription(TLRequest[bool]):
+    __tl_id__ = 0xcc5bebb3
+    __tl_name__ = "functions.payments.FulfillStarsSubscription"
+    __tl_layer__ = 186
+
+    __slots__ = ("peer", "subscription_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, subscription_id: str):
+        self.peer = peer
+        self.subscription_id = subscription_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.subscription_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FulfillStarsSubscription:
+        peer = TLObject.read(stream)
+        subscription_id = String.read(stream)
+        return cls(peer=peer, subscription_id=subscription_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FulfillStarsSubscription, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        subscription_id, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, subscription_id=subscription_id), cursor
+
+
+class GetStarsGiveawayOptions(TLRequest[list[tl.base.StarsGiveawayOption]]):
+    __tl_id__ = 0xbd1efd3e
+    __tl_name__ = "functions.payments.GetStarsGiveawayOptions"
+    __tl_layer__ = 187
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsGiveawayOptions:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsGiveawayOptions, int]:
+        return cls(), cursor
+
+
+class GetStarGifts(TLRequest[tl.base.payments.StarGifts]):
+    __tl_id__ = 0xc4563590
+    __tl_name__ = "functions.payments.GetStarGifts"
+    __tl_layer__ = 189
+
+    __slots__ = ("hash", )
+
+    def __init__(self, *, hash: int):
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarGifts:
+        hash = Int.read(stream)
+        return cls(hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarGifts, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(hash=hash), cursor
+
+
+class SaveStarGift(TLRequest[bool]):
+    __tl_id__ = 0x2a2a697c
+    __tl_name__ = "functions.payments.SaveStarGift"
+    __tl_layer__ = 198
+
+    __slots__ = ("unsave", "stargift", )
+
+    def __init__(self, *, stargift: tl.base.InputSavedStarGift, unsave: bool = False):
+        self.unsave = unsave
+        self.stargift = stargift
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.unsave: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.stargift.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveStarGift:
+        flags1 = Int.read(stream)
+        unsave = (flags1 & (1 << 0)) == (1 << 0)
+        stargift = TLObject.read(stream)
+        return cls(unsave=unsave, stargift=stargift)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveStarGift, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        unsave = (flags1 & (1 << 0)) == (1 << 0)
+        stargift, cursor = TLObject.read_from(view, cursor)
+        return cls(unsave=unsave, stargift=stargift), cursor
+
+
+class ConvertStarGift(TLRequest[bool]):
+    __tl_id__ = 0x74bf076b
+    __tl_name__ = "functions.payments.ConvertStarGift"
+    __tl_layer__ = 198
+
+    __slots__ = ("stargift", )
+
+    def __init__(self, *, stargift: tl.base.InputSavedStarGift):
+        self.stargift = stargift
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stargift.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConvertStarGift:
+        stargift = TLObject.read(stream)
+        return cls(stargift=stargift)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConvertStarGift, int]:
+        stargift, cursor = TLObject.read_from(view, cursor)
+        return cls(stargift=stargift), cursor
+
+
+class BotCancelStarsSubscription(TLRequest[bool]):
+    __tl_id__ = 0x6dfa0622
+    __tl_name__ = "functions.payments.BotCancelStarsSubscription"
+    __tl_layer__ = 193
+
+    __slots__ = ("restore", "user_id", "charge_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, charge_id: str, restore: bool = False):
+        self.restore = restore
+        self.user_id = user_id
+        self.charge_id = charge_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.restore: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.user_id.write_to(out, ctx)
+        String.write_to(out, self.charge_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BotCancelStarsSubscription:
+        flags1 = Int.read(stream)
+        restore = (flags1 & (1 << 0)) == (1 << 0)
+        user_id = TLObject.read(stream)
+        charge_id = String.read(stream)
+        return cls(restore=restore, user_id=user_id, charge_id=charge_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BotCancelStarsSubscription, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        restore = (flags1 & (1 << 0)) == (1 << 0)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        charge_id, cursor = String.read_from(view, cursor)
+        return cls(restore=restore, user_id=user_id, charge_id=charge_id), cursor
+
+
+class GetConnectedStarRefBots(TLRequest[tl.types.payments.ConnectedStarRefBots]):
+    __tl_id__ = 0x5869a553
+    __tl_name__ = "functions.payments.GetConnectedStarRefBots"
+    __tl_layer__ = 195
+
+    __slots__ = ("peer", "offset_date", "offset_link", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, limit: int, offset_date: int | None = None, offset_link: str | None = None):
+        self.peer = peer
+        self.offset_date = offset_date
+        self.offset_link = offset_link
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.offset_date is None, self.offset_link is None)
+        _flags_fields_not_empty = (self.offset_date is not None, self.offset_link is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: offset_date, offset_link")
+        flags1 = 0
+        if self.offset_date is not None: flags1 |= (1 << 2)
+        if self.offset_link is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.offset_date is not None:
+            out += Int.write(self.offset_date)
+        if self.offset_link is not None:
+            String.write_to(out, self.offset_link)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetConnectedStarRefBots:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        offset_date = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        offset_link = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        limit = Int.read(stream)
+        return cls(peer=peer, offset_date=offset_date, offset_link=offset_link, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetConnectedStarRefBots, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        offset_link, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, offset_date=offset_date, offset_link=offset_link, limit=limit), cursor
+
+
+class GetConnectedStarRefBot(TLRequest[tl.types.payments.ConnectedStarRefBots]):
+    __tl_id__ = 0xb7d998f0
+    __tl_name__ = "functions.payments.GetConnectedStarRefBot"
+    __tl_layer__ = 195
+
+    __slots__ = ("peer", "bot", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser):
+        self.peer = peer
+        self.bot = bot
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetConnectedStarRefBot:
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        return cls(peer=peer, bot=bot)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetConnectedStarRefBot, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, bot=bot), cursor
+
+
+class GetSuggestedStarRefBots(TLRequest[tl.types.payments.SuggestedStarRefBots]):
+    __tl_id__ = 0xd6b48f7
+    __tl_name__ = "functions.payments.GetSuggestedStarRefBots"
+    __tl_layer__ = 195
+
+    __slots__ = ("order_by_revenue", "order_by_date", "peer", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset: str, limit: int, order_by_revenue: bool = False, order_by_date: bool = False):
+        self.order_by_revenue = order_by_revenue
+        self.order_by_date = order_by_date
+        self.peer = peer
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.order_by_revenue: flags1 |= (1 << 0)
+        if self.order_by_date: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSuggestedStarRefBots:
+        flags1 = Int.read(stream)
+        order_by_revenue = (flags1 & (1 << 0)) == (1 << 0)
+        order_by_date = (flags1 & (1 << 1)) == (1 << 1)
+        peer = TLObject.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(order_by_revenue=order_by_revenue, order_by_date=order_by_date, peer=peer, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSuggestedStarRefBots, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        order_by_revenue = (flags1 & (1 << 0)) == (1 << 0)
+        order_by_date = (flags1 & (1 << 1)) == (1 << 1)
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(order_by_revenue=order_by_revenue, order_by_date=order_by_date, peer=peer, offset=offset, limit=limit), cursor
+
+
+class ConnectStarRefBot(TLRequest[tl.types.payments.ConnectedStarRefBots]):
+    __tl_id__ = 0x7ed5348a
+    __tl_name__ = "functions.payments.ConnectStarRefBot"
+    __tl_layer__ = 195
+
+    __slots__ = ("peer", "bot", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, bot: tl.base.InputUser):
+        self.peer = peer
+        self.bot = bot
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.bot.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConnectStarRefBot:
+        peer = TLObject.read(stream)
+        bot = TLObject.read(stream)
+        return cls(peer=peer, bot=bot)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConnectStarRefBot, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        bot, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, bot=bot), cursor
+
+
+class EditConnectedStarRefBot(TLRequest[tl.types.payments.ConnectedStarRefBots]):
+    __tl_id__ = 0xe4fca4a3
+    __tl_name__ = "functions.payments.EditConnectedStarRefBot"
+    __tl_layer__ = 195
+
+    __slots__ = ("revoked", "peer", "link", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, link: str, revoked: bool = False):
+        self.revoked = revoked
+        self.peer = peer
+        self.link = link
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.revoked: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.link)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditConnectedStarRefBot:
+        flags1 = Int.read(stream)
+        revoked = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        link = String.read(stream)
+        return cls(revoked=revoked, peer=peer, link=link)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditConnectedStarRefBot, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        revoked = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        link, cursor = String.read_from(view, cursor)
+        return cls(revoked=revoked, peer=peer, link=link), cursor
+
+
+class GetStarGiftUpgradePreview(TLRequest[tl.types.payments.StarGiftUpgradePreview]):
+    __tl_id__ = 0x9c9abcb1
+    __tl_name__ = "functions.payments.GetStarGiftUpgradePreview"
+    __tl_layer__ = 196
+
+    __slots__ = ("gift_id", )
+
+    def __init__(self, *, gift_id: int):
+        self.gift_id = gift_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.gift_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarGiftUpgradePreview:
+        gift_id = Long.read(stream)
+        return cls(gift_id=gift_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarGiftUpgradePreview, int]:
+        gift_id, cursor = Long.read_from(view, cursor)
+        return cls(gift_id=gift_id), cursor
+
+
+class UpgradeStarGift(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xaed6e4f5
+    __tl_name__ = "functions.payments.UpgradeStarGift"
+    __tl_layer__ = 198
+
+    __slots__ = ("keep_original_details", "stargift", )
+
+    def __init__(self, *, stargift: tl.base.InputSavedStarGift, keep_original_details: bool = False):
+        self.keep_original_details = keep_original_details
+        self.stargift = stargift
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.keep_original_details: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.stargift.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpgradeStarGift:
+        flags1 = Int.read(stream)
+        keep_original_details = (flags1 & (1 << 0)) == (1 << 0)
+        stargift = TLObject.read(stream)
+        return cls(keep_original_details=keep_original_details, stargift=stargift)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpgradeStarGift, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        keep_original_details = (flags1 & (1 << 0)) == (1 << 0)
+        stargift, cursor = TLObject.read_from(view, cursor)
+        return cls(keep_original_details=keep_original_details, stargift=stargift), cursor
+
+
+class TransferStarGift(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x7f18176a
+    __tl_name__ = "functions.payments.TransferStarGift"
+    __tl_layer__ = 198
+
+    __slots__ = ("stargift", "to_id", )
+
+    def __init__(self, *, stargift: tl.base.InputSavedStarGift, to_id: tl.base.InputPeer):
+        self.stargift = stargift
+        self.to_id = to_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stargift.write_to(out, ctx)
+        self.to_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TransferStarGift:
+        stargift = TLObject.read(stream)
+        to_id = TLObject.read(stream)
+        return cls(stargift=stargift, to_id=to_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TransferStarGift, int]:
+        stargift, cursor = TLObject.read_from(view, cursor)
+        to_id, cursor = TLObject.read_from(view, cursor)
+        return cls(stargift=stargift, to_id=to_id), cursor
+
+
+class GetUniqueStarGift(TLRequest[tl.types.payments.UniqueStarGift]):
+    __tl_id__ = 0xa1974d72
+    __tl_name__ = "functions.payments.GetUniqueStarGift"
+    __tl_layer__ = 197
+
+    __slots__ = ("slug", )
+
+    def __init__(self, *, slug: str):
+        self.slug = slug
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.slug)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUniqueStarGift:
+        slug = String.read(stream)
+        return cls(slug=slug)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUniqueStarGift, int]:
+        slug, cursor = String.read_from(view, cursor)
+        return cls(slug=slug), cursor
+
+
+class GetSavedStarGifts(TLRequest[tl.types.payments.SavedStarGifts]):
+    __tl_id__ = 0x23830de9
+    __tl_name__ = "functions.payments.GetSavedStarGifts"
+    __tl_layer__ = 198
+
+    __slots__ = ("exclude_unsaved", "exclude_saved", "exclude_unlimited", "exclude_limited", "exclude_unique", "sort_by_value", "peer", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset: str, limit: int, exclude_unsaved: bool = False, exclude_saved: bool = False, exclude_unlimited: bool = False, exclude_limited: bool = False, exclude_unique: bool = False, sort_by_value: bool = False):
+        self.exclude_unsaved = exclude_unsaved
+        self.exclude_saved = exclude_saved
+        self.exclude_unlimited = exclude_unlimited
+        self.exclude_limited = exclude_limited
+        self.exclude_unique = exclude_unique
+        self.sort_by_value = sort_by_value
+        self.peer = peer
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.exclude_unsaved: flags1 |= (1 << 0)
+        if self.exclude_saved: flags1 |= (1 << 1)
+        if self.exclude_unlimited: flags1 |= (1 << 2)
+        if self.exclude_limited: flags1 |= (1 << 3)
+        if self.exclude_unique: flags1 |= (1 << 4)
+        if self.sort_by_value: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSavedStarGifts:
+        flags1 = Int.read(stream)
+        exclude_unsaved = (flags1 & (1 << 0)) == (1 << 0)
+        exclude_saved = (flags1 & (1 << 1)) == (1 << 1)
+        exclude_unlimited = (flags1 & (1 << 2)) == (1 << 2)
+        exclude_limited = (flags1 & (1 << 3)) == (1 << 3)
+        exclude_unique = (flags1 & (1 << 4)) == (1 << 4)
+        sort_by_value = (flags1 & (1 << 5)) == (1 << 5)
+        peer = TLObject.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(exclude_unsaved=exclude_unsaved, exclude_saved=exclude_saved, exclude_unlimited=exclude_unlimited, exclude_limited=exclude_limited, exclude_unique=exclude_unique, sort_by_value=sort_by_value, peer=peer, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSavedStarGifts, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        exclude_unsaved = (flags1 & (1 << 0)) == (1 << 0)
+        exclude_saved = (flags1 & (1 << 1)) == (1 << 1)
+        exclude_unlimited = (flags1 & (1 << 2)) == (1 << 2)
+        exclude_limited = (flags1 & (1 << 3)) == (1 << 3)
+        exclude_unique = (flags1 & (1 << 4)) == (1 << 4)
+        sort_by_value = (flags1 & (1 << 5)) == (1 << 5)
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(exclude_unsaved=exclude_unsaved, exclude_saved=exclude_saved, exclude_unlimited=exclude_unlimited, exclude_limited=exclude_limited, exclude_unique=exclude_unique, sort_by_value=sort_by_value, peer=peer, offset=offset, limit=limit), cursor
+
+
+class GetSavedStarGift(TLRequest[tl.types.payments.SavedStarGifts]):
+    __tl_id__ = 0xb455a106
+    __tl_name__ = "functions.payments.GetSavedStarGift"
+    __tl_layer__ = 198
+
+    __slots__ = ("stargift", )
+
+    def __init__(self, *, stargift: list[tl.base.InputSavedStarGift]):
+        self.stargift = stargift
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.stargift, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSavedStarGift:
+        stargift = TLObjectVector.read(stream)
+        return cls(stargift=stargift)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSavedStarGift, int]:
+        stargift, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(stargift=stargift), cursor
+
+
+class GetStarGiftWithdrawalUrl(TLRequest[tl.types.payments.StarGiftWithdrawalUrl]):
+    __tl_id__ = 0xd06e93a8
+    __tl_name__ = "functions.payments.GetStarGiftWithdrawalUrl"
+    __tl_layer__ = 198
+
+    __slots__ = ("stargift", "password", )
+
+    def __init__(self, *, stargift: tl.base.InputSavedStarGift, password: tl.base.InputCheckPasswordSRP):
+        self.stargift = stargift
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stargift.write_to(out, ctx)
+        self.password.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarGiftWithdrawalUrl:
+        stargift = TLObject.read(stream)
+        password = TLObject.read(stream)
+        return cls(stargift=stargift, password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarGiftWithdrawalUrl, int]:
+        stargift, cursor = TLObject.read_from(view, cursor)
+        password, cursor = TLObject.read_from(view, cursor)
+        return cls(stargift=stargift, password=password), cursor
+
+
+class ToggleChatStarGiftNotifications(TLRequest[bool]):
+    __tl_id__ = 0x60eaefa1
+    __tl_name__ = "functions.payments.ToggleChatStarGiftNotifications"
+    __tl_layer__ = 198
+
+    __slots__ = ("enabled", "peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, enabled: bool = False):
+        self.enabled = enabled
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.enabled: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleChatStarGiftNotifications:
+        flags1 = Int.read(stream)
+        enabled = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        return cls(enabled=enabled, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleChatStarGiftNotifications, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        enabled = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(enabled=enabled, peer=peer), cursor
+
+
+class ToggleStarGiftsPinnedToTop(TLRequest[bool]):
+    __tl_id__ = 0x1513e7b0
+    __tl_name__ = "functions.payments.ToggleStarGiftsPinnedToTop"
+    __tl_layer__ = 200
+
+    __slots__ = ("peer", "stargift", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, stargift: list[tl.base.InputSavedStarGift]):
+        self.peer = peer
+        self.stargift = stargift
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.stargift, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleStarGiftsPinnedToTop:
+        peer = TLObject.read(stream)
+        stargift = TLObjectVector.read(stream)
+        return cls(peer=peer, stargift=stargift)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleStarGiftsPinnedToTop, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        stargift, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peer=peer, stargift=stargift), cursor
+
+
+class CanPurchaseStore(TLRequest[bool]):
+    __tl_id__ = 0x4fdc5ea7
+    __tl_name__ = "functions.payments.CanPurchaseStore"
+    __tl_layer__ = 201
+
+    __slots__ = ("purpose", )
+
+    def __init__(self, *, purpose: tl.base.InputStorePaymentPurpose):
+        self.purpose = purpose
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.purpose.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CanPurchaseStore:
+        purpose = TLObject.read(stream)
+        return cls(purpose=purpose)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CanPurchaseStore, int]:
+        purpose, cursor = TLObject.read_from(view, cursor)
+        return cls(purpose=purpose), cursor
+
+
+class GetPaymentForm_133(TLRequest[tl.base.payments.PaymentForm]):
+    __tl_id__ = 0x8a333c8d
+    __tl_name__ = "functions.payments.GetPaymentForm_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "msg_id", "theme_params", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, theme_params: tl.types.DataJSON | None = None):
+        self.peer = peer
+        self.msg_id = msg_id
+        self.theme_params = theme_params
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.theme_params is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        if self.theme_params is not None:
+            self.theme_params.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPaymentForm_133:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        theme_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(peer=peer, msg_id=msg_id, theme_params=theme_params)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPaymentForm_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        theme_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(peer=peer, msg_id=msg_id, theme_params=theme_params), cursor
+
+
+class ValidateRequestedInfo_133(TLRequest[tl.types.payments.ValidatedRequestedInfo]):
+    __tl_id__ = 0xdb103170
+    __tl_name__ = "functions.payments.ValidateRequestedInfo_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("save", "peer", "msg_id", "info", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, msg_id: int, info: tl.types.PaymentRequestedInfo, save: bool = False):
+        self.save = save
+        self.peer = peer
+        self.msg_id = msg_id
+        self.info = info
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.save: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        self.info.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ValidateRequestedInfo_133:
+        flags1 = Int.read(stream)
+        save = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        info = tl.types.PaymentRequestedInfo.read(stream)
+        return cls(save=save, peer=peer, msg_id=msg_id, info=info)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ValidateRequestedInfo_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        save = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        info, cursor = tl.types.PaymentRequestedInfo.read_from(view, cursor)
+        return cls(save=save, peer=peer, msg_id=msg_id, info=info), cursor
+
+
+class SendPaymentForm_133(TLRequest[tl.base.payments.PaymentResult]):
+    __tl_id__ = 0x30c3bc9d
+    __tl_name__ = "functions.payments.SendPaymentForm_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("form_id", "peer", "msg_id", "requested_info_id", "shipping_option_id", "credentials", "tip_amount", )
+
+    def __init__(self, *, form_id: int, peer: tl.base.InputPeer, msg_id: int, credentials: tl.base.InputPaymentCredentials, requested_info_id: str | None = None, shipping_option_id: str | None = None, tip_amount: int | None = None):
+        self.form_id = form_id
+        self.peer = peer
+        self.msg_id = msg_id
+        self.requested_info_id = requested_info_id
+        self.shipping_option_id = shipping_option_id
+        self.credentials = credentials
+        self.tip_amount = tip_amount
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.requested_info_id is not None: flags1 |= (1 << 0)
+        if self.shipping_option_id is not None: flags1 |= (1 << 1)
+        if self.tip_amount is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Long.write(self.form_id)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        if self.requested_info_id is not None:
+            String.write_to(out, self.requested_info_id)
+        if self.shipping_option_id is not None:
+            String.write_to(out, self.shipping_option_id)
+        self.credentials.write_to(out, ctx)
+        if self.tip_amount is not None:
+            out += Long.write(self.tip_amount)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendPaymentForm_133:
+        flags1 = Int.read(stream)
+        form_id = Long.read(stream)
+        peer = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        requested_info_id = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        shipping_option_id = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        credentials = TLObject.read(stream)
+        tip_amount = Long.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(form_id=form_id, peer=peer, msg_id=msg_id, requested_info_id=requested_info_id, shipping_option_id=shipping_option_id, credentials=credentials, tip_amount=tip_amount)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendPaymentForm_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        form_id, cursor = Long.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        requested_info_id, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        shipping_option_id, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        credentials, cursor = TLObject.read_from(view, cursor)
+        tip_amount, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(form_id=form_id, peer=peer, msg_id=msg_id, requested_info_id=requested_info_id, shipping_option_id=shipping_option_id, credentials=credentials, tip_amount=tip_amount), cursor
+
+
+class AssignAppStoreTransaction_143(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd5ccfd0
+    __tl_name__ = "functions.payments.AssignAppStoreTransaction_143"
+    __tl_layer__ = 143
+
+    __slots__ = ("restore", "receipt", )
+
+    def __init__(self, *, receipt: bytes, restore: bool = False):
+        self.restore = restore
+        self.receipt = receipt
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.restore: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        Bytes.write_to(out, self.receipt)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AssignAppStoreTransaction_143:
+        flags1 = Int.read(stream)
+        restore = (flags1 & (1 << 0)) == (1 << 0)
+        receipt = Bytes.read(stream)
+        return cls(restore=restore, receipt=receipt)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AssignAppStoreTransaction_143, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        restore = (flags1 & (1 << 0)) == (1 << 0)
+        receipt, cursor = Bytes.read_from(view, cursor)
+        return cls(restore=restore, receipt=receipt), cursor
+
+
+class AssignPlayMarketTransaction_143(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x4faa4aed
+    __tl_name__ = "functions.payments.AssignPlayMarketTransaction_143"
+    __tl_layer__ = 143
+
+    __slots__ = ("purchase_token", )
+
+    def __init__(self, *, purchase_token: str):
+        self.purchase_token = purchase_token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.purchase_token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AssignPlayMarketTransaction_143:
+        purchase_token = String.read(stream)
+        return cls(purchase_token=purchase_token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AssignPlayMarketTransaction_143, int]:
+        purchase_token, cursor = String.read_from(view, cursor)
+        return cls(purchase_token=purchase_token), cursor
+
+
+class CanPurchasePremium_143(TLRequest[bool]):
+    __tl_id__ = 0xaa6a90c8
+    __tl_name__ = "functions.payments.CanPurchasePremium_143"
+    __tl_layer__ = 143
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CanPurchasePremium_143:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CanPurchasePremium_143, int]:
+        return cls(), cursor
+
+
+class CanPurchasePremium_144(TLRequest[bool]):
+    __tl_id__ = 0x9fc19eb6
+    __tl_name__ = "functions.payments.CanPurchasePremium_144"
+    __tl_layer__ = 144
+
+    __slots__ = ("purpose", )
+
+    def __init__(self, *, purpose: tl.base.InputStorePaymentPurpose):
+        self.purpose = purpose
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.purpose.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CanPurchasePremium_144:
+        purpose = TLObject.read(stream)
+        return cls(purpose=purpose)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CanPurchasePremium_144, int]:
+        purpose, cursor = TLObject.read_from(view, cursor)
+        return cls(purpose=purpose), cursor
+
+
+class GetStarsTransactions_181(TLRequest[tl.base.payments.StarsStatus]):
+    __tl_id__ = 0x673ac2f9
+    __tl_name__ = "functions.payments.GetStarsTransactions_181"
+    __tl_layer__ = 181
+
+    __slots__ = ("inbound", "outbound", "peer", "offset", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset: str, inbound: bool = False, outbound: bool = False):
+        self.inbound = inbound
+        self.outbound = outbound
+        self.peer = peer
+        self.offset = offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.inbound: flags1 |= (1 << 0)
+        if self.outbound: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsTransactions_181:
+        flags1 = Int.read(stream)
+        inbound = (flags1 & (1 << 0)) == (1 << 0)
+        outbound = (flags1 & (1 << 1)) == (1 << 1)
+        peer = TLObject.read(stream)
+        offset = String.read(stream)
+        return cls(inbound=inbound, outbound=outbound, peer=peer, offset=offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsTransactions_181, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        inbound = (flags1 & (1 << 0)) == (1 << 0)
+        outbound = (flags1 & (1 << 1)) == (1 << 1)
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        return cls(inbound=inbound, outbound=outbound, peer=peer, offset=offset), cursor
+
+
+class SendStarsForm_181(TLRequest[tl.base.payments.PaymentResult]):
+    __tl_id__ = 0x2bb731d
+    __tl_name__ = "functions.payments.SendStarsForm_181"
+    __tl_layer__ = 181
+
+    __slots__ = ("form_id", "invoice", )
+
+    def __init__(self, *, form_id: int, invoice: tl.base.InputInvoice):
+        self.form_id = form_id
+        self.invoice = invoice
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        out += Int.write(flags1)
+        out += Long.write(self.form_id)
+        self.invoice.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendStarsForm_181:
+        flags1 = Int.read(stream)
+        form_id = Long.read(stream)
+        invoice = TLObject.read(stream)
+        return cls(form_id=form_id, invoice=invoice)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendStarsForm_181, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        form_id, cursor = Long.read_from(view, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        return cls(form_id=form_id, invoice=invoice), cursor
+
+
+class GetStarsTransactions_182(TLRequest[tl.base.payments.StarsStatus]):
+    __tl_id__ = 0x97938d5a
+    __tl_name__ = "functions.payments.GetStarsTransactions_182"
+    __tl_layer__ = 182
+
+    __slots__ = ("inbound", "outbound", "ascending", "peer", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset: str, limit: int, inbound: bool = False, outbound: bool = False, ascending: bool = False):
+        self.inbound = inbound
+        self.outbound = outbound
+        self.ascending = ascending
+        self.peer = peer
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.inbound: flags1 |= (1 << 0)
+        if self.outbound: flags1 |= (1 << 1)
+        if self.ascending: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStarsTransactions_182:
+        flags1 = Int.read(stream)
+        inbound = (flags1 & (1 << 0)) == (1 << 0)
+        outbound = (flags1 & (1 << 1)) == (1 << 1)
+        ascending = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(inbound=inbound, outbound=outbound, ascending=ascending, peer=peer, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStarsTransactions_182, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        inbound = (flags1 & (1 << 0)) == (1 << 0)
+        outbound = (flags1 & (1 << 1)) == (1 << 1)
+        ascending = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(inbound=inbound, outbound=outbound, ascending=ascending, peer=peer, offset=offset, limit=limit), cursor
+
+
+class GetUserStarGifts_189(TLRequest[tl.types.payments.UserStarGifts_189]):
+    __tl_id__ = 0x5e72c7e1
+    __tl_name__ = "functions.payments.GetUserStarGifts_189"
+    __tl_layer__ = 189
+
+    __slots__ = ("user_id", "offset", "limit", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, offset: str, limit: int):
+        self.user_id = user_id
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUserStarGifts_189:
+        user_id = TLObject.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(user_id=user_id, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUserStarGifts_189, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(user_id=user_id, offset=offset, limit=limit), cursor
+
+
+class SaveStarGift_189(TLRequest[bool]):
+    __tl_id__ = 0x87acf08e
+    __tl_name__ = "functions.payments.SaveStarGift_189"
+    __tl_layer__ = 189
+
+    __slots__ = ("unsave", "user_id", "msg_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, msg_id: int, unsave: bool = False):
+        self.unsave = unsave
+        self.user_id = user_id
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.unsave: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveStarGift_189:
+        flags1 = Int.read(stream)
+        unsave = (flags1 & (1 << 0)) == (1 << 0)
+        user_id = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(unsave=unsave, user_id=user_id, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveStarGift_189, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        unsave = (flags1 & (1 << 0)) == (1 << 0)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(unsave=unsave, user_id=user_id, msg_id=msg_id), cursor
+
+
+class ConvertStarGift_189(TLRequest[bool]):
+    __tl_id__ = 0x421e027
+    __tl_name__ = "functions.payments.ConvertStarGift_189"
+    __tl_layer__ = 189
+
+    __slots__ = ("user_id", "msg_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, msg_id: int):
+        self.user_id = user_id
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConvertStarGift_189:
+        user_id = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(user_id=user_id, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConvertStarGift_189, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(user_id=user_id, msg_id=msg_id), cursor
+
+
+class SaveStarGift_196(TLRequest[bool]):
+    __tl_id__ = 0x92fd2aae
+    __tl_name__ = "functions.payments.SaveStarGift_196"
+    __tl_layer__ = 196
+
+    __slots__ = ("unsave", "msg_id", )
+
+    def __init__(self, *, msg_id: int, unsave: bool = False):
+        self.unsave = unsave
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.unsave: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveStarGift_196:
+        flags1 = Int.read(stream)
+        unsave = (flags1 & (1 << 0)) == (1 << 0)
+        msg_id = Int.read(stream)
+        return cls(unsave=unsave, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveStarGift_196, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        unsave = (flags1 & (1 << 0)) == (1 << 0)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(unsave=unsave, msg_id=msg_id), cursor
+
+
+class ConvertStarGift_196(TLRequest[bool]):
+    __tl_id__ = 0x72770c83
+    __tl_name__ = "functions.payments.ConvertStarGift_196"
+    __tl_layer__ = 196
+
+    __slots__ = ("msg_id", )
+
+    def __init__(self, *, msg_id: int):
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConvertStarGift_196:
+        msg_id = Int.read(stream)
+        return cls(msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConvertStarGift_196, int]:
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(msg_id=msg_id), cursor
+
+
+class UpgradeStarGift_196(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xcf4f0781
+    __tl_name__ = "functions.payments.UpgradeStarGift_196"
+    __tl_layer__ = 196
+
+    __slots__ = ("keep_original_details", "msg_id", )
+
+    def __init__(self, *, msg_id: int, keep_original_details: bool = False):
+        self.keep_original_details = keep_original_details
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.keep_original_details: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpgradeStarGift_196:
+        flags1 = Int.read(stream)
+        keep_original_details = (flags1 & (1 << 0)) == (1 << 0)
+        msg_id = Int.read(stream)
+        return cls(keep_original_details=keep_original_details, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpgradeStarGift_196, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        keep_original_details = (flags1 & (1 << 0)) == (1 << 0)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(keep_original_details=keep_original_details, msg_id=msg_id), cursor
+
+
+class TransferStarGift_196(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x333fb526
+    __tl_name__ = "functions.payments.TransferStarGift_196"
+    __tl_layer__ = 196
+
+    __slots__ = ("msg_id", "to_id", )
+
+    def __init__(self, *, msg_id: int, to_id: tl.base.InputUser):
+        self.msg_id = msg_id
+        self.to_id = to_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.msg_id)
+        self.to_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TransferStarGift_196:
+        msg_id = Int.read(stream)
+        to_id = TLObject.read(stream)
+        return cls(msg_id=msg_id, to_id=to_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TransferStarGift_196, int]:
+        msg_id, cursor = Int.read_from(view, cursor)
+        to_id, cursor = TLObject.read_from(view, cursor)
+        return cls(msg_id=msg_id, to_id=to_id), cursor
+
+
+class GetUserStarGift_196(TLRequest[tl.types.payments.UserStarGifts_189]):
+    __tl_id__ = 0xb502e4a5
+    __tl_name__ = "functions.payments.GetUserStarGift_196"
+    __tl_layer__ = 196
+
+    __slots__ = ("msg_id", )
+
+    def __init__(self, *, msg_id: list[int]):
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUserStarGift_196:
+        msg_id = IntVector.read(stream)
+        return cls(msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUserStarGift_196, int]:
+        msg_id, cursor = IntVector.read_from(view, cursor)
+        return cls(msg_id=msg_id), cursor
@@ -0,0 +1,1167 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetCallConfig(TLRequest[tl.types.DataJSON]):
+    __tl_id__ = 0x55451fa9
+    __tl_name__ = "functions.phone.GetCallConfig"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCallConfig:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCallConfig, int]:
+        return cls(), cursor
+
+
+class RequestCall(TLRequest[tl.types.phone.PhoneCall]):
+    __tl_id__ = 0xa6c4600c
+    __tl_name__ = "functions.phone.RequestCall"
+    __tl_layer__ = 196
+
+    __slots__ = ("video", "user_id", "conference_call", "random_id", "g_a_hash", "protocol", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, random_id: int, g_a_hash: bytes, protocol: tl.types.PhoneCallProtocol, video: bool = False, conference_call: tl.types.InputGroupCall | None = None):
+        self.video = video
+        self.user_id = user_id
+        self.conference_call = conference_call
+        self.random_id = random_id
+        self.g_a_hash = g_a_hash
+        self.protocol = protocol
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.video: flags1 |= (1 << 0)
+        if self.conference_call is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.user_id.write_to(out, ctx)
+        if self.conference_call is not None:
+            self.conference_call.write_to(out, ctx)
+        out += Int.write(self.random_id)
+        Bytes.write_to(out, self.g_a_hash)
+        self.protocol.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestCall:
+        flags1 = Int.read(stream)
+        video = (flags1 & (1 << 0)) == (1 << 0)
+        user_id = TLObject.read(stream)
+        conference_call = tl.types.InputGroupCall.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        random_id = Int.read(stream)
+        g_a_hash = Bytes.read(stream)
+        protocol = tl.types.PhoneCallProtocol.read(stream)
+        return cls(video=video, user_id=user_id, conference_call=conference_call, random_id=random_id, g_a_hash=g_a_hash, protocol=protocol)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestCall, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        video = (flags1 & (1 << 0)) == (1 << 0)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        conference_call, cursor = tl.types.InputGroupCall.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        random_id, cursor = Int.read_from(view, cursor)
+        g_a_hash, cursor = Bytes.read_from(view, cursor)
+        protocol, cursor = tl.types.PhoneCallProtocol.read_from(view, cursor)
+        return cls(video=video, user_id=user_id, conference_call=conference_call, random_id=random_id, g_a_hash=g_a_hash, protocol=protocol), cursor
+
+
+class AcceptCall(TLRequest[tl.types.phone.PhoneCall]):
+    __tl_id__ = 0x3bd2b4a0
+    __tl_name__ = "functions.phone.AcceptCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "g_b", "protocol", )
+
+    def __init__(self, *, peer: tl.types.InputPhoneCall, g_b: bytes, protocol: tl.types.PhoneCallProtocol):
+        self.peer = peer
+        self.g_b = g_b
+        self.protocol = protocol
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        Bytes.write_to(out, self.g_b)
+        self.protocol.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AcceptCall:
+        peer = tl.types.InputPhoneCall.read(stream)
+        g_b = Bytes.read(stream)
+        protocol = tl.types.PhoneCallProtocol.read(stream)
+        return cls(peer=peer, g_b=g_b, protocol=protocol)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AcceptCall, int]:
+        peer, cursor = tl.types.InputPhoneCall.read_from(view, cursor)
+        g_b, cursor = Bytes.read_from(view, cursor)
+        protocol, cursor = tl.types.PhoneCallProtocol.read_from(view, cursor)
+        return cls(peer=peer, g_b=g_b, protocol=protocol), cursor
+
+
+class ConfirmCall(TLRequest[tl.types.phone.PhoneCall]):
+    __tl_id__ = 0x2efe1722
+    __tl_name__ = "functions.phone.ConfirmCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "g_a", "key_fingerprint", "protocol", )
+
+    def __init__(self, *, peer: tl.types.InputPhoneCall, g_a: bytes, key_fingerprint: int, protocol: tl.types.PhoneCallProtocol):
+        self.peer = peer
+        self.g_a = g_a
+        self.key_fingerprint = key_fingerprint
+        self.protocol = protocol
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        Bytes.write_to(out, self.g_a)
+        out += Long.write(self.key_fingerprint)
+        self.protocol.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConfirmCall:
+        peer = tl.types.InputPhoneCall.read(stream)
+        g_a = Bytes.read(stream)
+        key_fingerprint = Long.read(stream)
+        protocol = tl.types.PhoneCallProtocol.read(stream)
+        return cls(peer=peer, g_a=g_a, key_fingerprint=key_fingerprint, protocol=protocol)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConfirmCall, int]:
+        peer, cursor = tl.types.InputPhoneCall.read_from(view, cursor)
+        g_a, cursor = Bytes.read_from(view, cursor)
+        key_fingerprint, cursor = Long.read_from(view, cursor)
+        protocol, cursor = tl.types.PhoneCallProtocol.read_from(view, cursor)
+        return cls(peer=peer, g_a=g_a, key_fingerprint=key_fingerprint, protocol=protocol), cursor
+
+
+class ReceivedCall(TLRequest[bool]):
+    __tl_id__ = 0x17d54f61
+    __tl_name__ = "functions.phone.ReceivedCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.types.InputPhoneCall):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReceivedCall:
+        peer = tl.types.InputPhoneCall.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReceivedCall, int]:
+        peer, cursor = tl.types.InputPhoneCall.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class DiscardCall(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xb2cbc1c0
+    __tl_name__ = "functions.phone.DiscardCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("video", "peer", "duration", "reason", "connection_id", )
+
+    def __init__(self, *, peer: tl.types.InputPhoneCall, duration: int, reason: tl.base.PhoneCallDiscardReason, connection_id: int, video: bool = False):
+        self.video = video
+        self.peer = peer
+        self.duration = duration
+        self.reason = reason
+        self.connection_id = connection_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.video: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.duration)
+        self.reason.write_to(out, ctx)
+        out += Long.write(self.connection_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DiscardCall:
+        flags1 = Int.read(stream)
+        video = (flags1 & (1 << 0)) == (1 << 0)
+        peer = tl.types.InputPhoneCall.read(stream)
+        duration = Int.read(stream)
+        reason = TLObject.read(stream)
+        connection_id = Long.read(stream)
+        return cls(video=video, peer=peer, duration=duration, reason=reason, connection_id=connection_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DiscardCall, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        video = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = tl.types.InputPhoneCall.read_from(view, cursor)
+        duration, cursor = Int.read_from(view, cursor)
+        reason, cursor = TLObject.read_from(view, cursor)
+        connection_id, cursor = Long.read_from(view, cursor)
+        return cls(video=video, peer=peer, duration=duration, reason=reason, connection_id=connection_id), cursor
+
+
+class SetCallRating(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x59ead627
+    __tl_name__ = "functions.phone.SetCallRating"
+    __tl_layer__ = 133
+
+    __slots__ = ("user_initiative", "peer", "rating", "comment", )
+
+    def __init__(self, *, peer: tl.types.InputPhoneCall, rating: int, comment: str, user_initiative: bool = False):
+        self.user_initiative = user_initiative
+        self.peer = peer
+        self.rating = rating
+        self.comment = comment
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.user_initiative: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.rating)
+        String.write_to(out, self.comment)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetCallRating:
+        flags1 = Int.read(stream)
+        user_initiative = (flags1 & (1 << 0)) == (1 << 0)
+        peer = tl.types.InputPhoneCall.read(stream)
+        rating = Int.read(stream)
+        comment = String.read(stream)
+        return cls(user_initiative=user_initiative, peer=peer, rating=rating, comment=comment)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetCallRating, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        user_initiative = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = tl.types.InputPhoneCall.read_from(view, cursor)
+        rating, cursor = Int.read_from(view, cursor)
+        comment, cursor = String.read_from(view, cursor)
+        return cls(user_initiative=user_initiative, peer=peer, rating=rating, comment=comment), cursor
+
+
+class SaveCallDebug(TLRequest[bool]):
+    __tl_id__ = 0x277add7e
+    __tl_name__ = "functions.phone.SaveCallDebug"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "debug", )
+
+    def __init__(self, *, peer: tl.types.InputPhoneCall, debug: tl.types.DataJSON):
+        self.peer = peer
+        self.debug = debug
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.debug.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveCallDebug:
+        peer = tl.types.InputPhoneCall.read(stream)
+        debug = tl.types.DataJSON.read(stream)
+        return cls(peer=peer, debug=debug)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveCallDebug, int]:
+        peer, cursor = tl.types.InputPhoneCall.read_from(view, cursor)
+        debug, cursor = tl.types.DataJSON.read_from(view, cursor)
+        return cls(peer=peer, debug=debug), cursor
+
+
+class SendSignalingData(TLRequest[bool]):
+    __tl_id__ = 0xff7a9383
+    __tl_name__ = "functions.phone.SendSignalingData"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "data", )
+
+    def __init__(self, *, peer: tl.types.InputPhoneCall, data: bytes):
+        self.peer = peer
+        self.data = data
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        Bytes.write_to(out, self.data)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendSignalingData:
+        peer = tl.types.InputPhoneCall.read(stream)
+        data = Bytes.read(stream)
+        return cls(peer=peer, data=data)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendSignalingData, int]:
+        peer, cursor = tl.types.InputPhoneCall.read_from(view, cursor)
+        data, cursor = Bytes.read_from(view, cursor)
+        return cls(peer=peer, data=data), cursor
+
+
+class CreateGroupCall(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x48cdc6d8
+    __tl_name__ = "functions.phone.CreateGroupCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("rtmp_stream", "peer", "random_id", "title", "schedule_date", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, random_id: int, rtmp_stream: bool = False, title: str | None = None, schedule_date: int | None = None):
+        self.rtmp_stream = rtmp_stream
+        self.peer = peer
+        self.random_id = random_id
+        self.title = title
+        self.schedule_date = schedule_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.rtmp_stream: flags1 |= (1 << 2)
+        if self.title is not None: flags1 |= (1 << 0)
+        if self.schedule_date is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.random_id)
+        if self.title is not None:
+            String.write_to(out, self.title)
+        if self.schedule_date is not None:
+            out += Int.write(self.schedule_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateGroupCall:
+        flags1 = Int.read(stream)
+        rtmp_stream = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream)
+        random_id = Int.read(stream)
+        title = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        schedule_date = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(rtmp_stream=rtmp_stream, peer=peer, random_id=random_id, title=title, schedule_date=schedule_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateGroupCall, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        rtmp_stream = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Int.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        schedule_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(rtmp_stream=rtmp_stream, peer=peer, random_id=random_id, title=title, schedule_date=schedule_date), cursor
+
+
+class JoinGroupCall(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd61e1df3
+    __tl_name__ = "functions.phone.JoinGroupCall"
+    __tl_layer__ = 196
+
+    __slots__ = ("muted", "video_stopped", "call", "join_as", "invite_hash", "key_fingerprint", "params", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, join_as: tl.base.InputPeer, params: tl.types.DataJSON, muted: bool = False, video_stopped: bool = False, invite_hash: str | None = None, key_fingerprint: int | None = None):
+        self.muted = muted
+        self.video_stopped = video_stopped
+        self.call = call
+        self.join_as = join_as
+        self.invite_hash = invite_hash
+        self.key_fingerprint = key_fingerprint
+        self.params = params
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.muted: flags1 |= (1 << 0)
+        if self.video_stopped: flags1 |= (1 << 2)
+        if self.invite_hash is not None: flags1 |= (1 << 1)
+        if self.key_fingerprint is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        self.call.write_to(out, ctx)
+        self.join_as.write_to(out, ctx)
+        if self.invite_hash is not None:
+            String.write_to(out, self.invite_hash)
+        if self.key_fingerprint is not None:
+            out += Long.write(self.key_fingerprint)
+        self.params.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> JoinGroupCall:
+        flags1 = Int.read(stream)
+        muted = (flags1 & (1 << 0)) == (1 << 0)
+        video_stopped = (flags1 & (1 << 2)) == (1 << 2)
+        call = tl.types.InputGroupCall.read(stream)
+        join_as = TLObject.read(stream)
+        invite_hash = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        key_fingerprint = Long.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        params = tl.types.DataJSON.read(stream)
+        return cls(muted=muted, video_stopped=video_stopped, call=call, join_as=join_as, invite_hash=invite_hash, key_fingerprint=key_fingerprint, params=params)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[JoinGroupCall, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        muted = (flags1 & (1 << 0)) == (1 << 0)
+        video_stopped = (flags1 & (1 << 2)) == (1 << 2)
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        join_as, cursor = TLObject.read_from(view, cursor)
+        invite_hash, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        key_fingerprint, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        params, cursor = tl.types.DataJSON.read_from(view, cursor)
+        return cls(muted=muted, video_stopped=video_stopped, call=call, join_as=join_as, invite_hash=invite_hash, key_fingerprint=key_fingerprint, params=params), cursor
+
+
+class LeaveGroupCall(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x500377f9
+    __tl_name__ = "functions.phone.LeaveGroupCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "source", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, source: int):
+        self.call = call
+        self.source = source
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+        out += Int.write(self.source)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LeaveGroupCall:
+        call = tl.types.InputGroupCall.read(stream)
+        source = Int.read(stream)
+        return cls(call=call, source=source)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LeaveGroupCall, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        source, cursor = Int.read_from(view, cursor)
+        return cls(call=call, source=source), cursor
+
+
+class InviteToGroupCall(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x7b393160
+    __tl_name__ = "functions.phone.InviteToGroupCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "users", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, users: list[tl.base.InputUser]):
+        self.call = call
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InviteToGroupCall:
+        call = tl.types.InputGroupCall.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(call=call, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InviteToGroupCall, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(call=call, users=users), cursor
+
+
+class DiscardGroupCall(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x7a777135
+    __tl_name__ = "functions.phone.DiscardGroupCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall):
+        self.call = call
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DiscardGroupCall:
+        call = tl.types.InputGroupCall.read(stream)
+        return cls(call=call)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DiscardGroupCall, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        return cls(call=call), cursor
+
+
+class ToggleGroupCallSettings(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x74bbb43d
+    __tl_name__ = "functions.phone.ToggleGroupCallSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("reset_invite_hash", "call", "join_muted", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, reset_invite_hash: bool = False, join_muted: bool = False):
+        self.reset_invite_hash = reset_invite_hash
+        self.call = call
+        self.join_muted = join_muted
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.reset_invite_hash: flags1 |= (1 << 1)
+        if self.join_muted is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.call.write_to(out, ctx)
+        if self.join_muted is not None:
+            out += Bool.write(self.join_muted)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleGroupCallSettings:
+        flags1 = Int.read(stream)
+        reset_invite_hash = (flags1 & (1 << 1)) == (1 << 1)
+        call = tl.types.InputGroupCall.read(stream)
+        join_muted = Bool.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(reset_invite_hash=reset_invite_hash, call=call, join_muted=join_muted)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleGroupCallSettings, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        reset_invite_hash = (flags1 & (1 << 1)) == (1 << 1)
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        join_muted, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(reset_invite_hash=reset_invite_hash, call=call, join_muted=join_muted), cursor
+
+
+class GetGroupCall(TLRequest[tl.types.phone.GroupCall]):
+    __tl_id__ = 0x41845db
+    __tl_name__ = "functions.phone.GetGroupCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "limit", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, limit: int):
+        self.call = call
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetGroupCall:
+        call = tl.types.InputGroupCall.read(stream)
+        limit = Int.read(stream)
+        return cls(call=call, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetGroupCall, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(call=call, limit=limit), cursor
+
+
+class GetGroupParticipants(TLRequest[tl.types.phone.GroupParticipants]):
+    __tl_id__ = 0xc558d8ab
+    __tl_name__ = "functions.phone.GetGroupParticipants"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "ids", "sources", "offset", "limit", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, ids: list[tl.base.InputPeer], sources: list[int], offset: str, limit: int):
+        self.call = call
+        self.ids = ids
+        self.sources = sources
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.ids, ctx)
+        out += IntVector.write(self.sources)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetGroupParticipants:
+        call = tl.types.InputGroupCall.read(stream)
+        ids = TLObjectVector.read(stream)
+        sources = IntVector.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(call=call, ids=ids, sources=sources, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetGroupParticipants, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        ids, cursor = TLObjectVector.read_from(view, cursor)
+        sources, cursor = IntVector.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(call=call, ids=ids, sources=sources, offset=offset, limit=limit), cursor
+
+
+class CheckGroupCall(TLRequest[list[int]]):
+    __tl_id__ = 0xb59cf977
+    __tl_name__ = "functions.phone.CheckGroupCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "sources", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, sources: list[int]):
+        self.call = call
+        self.sources = sources
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+        out += IntVector.write(self.sources)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckGroupCall:
+        call = tl.types.InputGroupCall.read(stream)
+        sources = IntVector.read(stream)
+        return cls(call=call, sources=sources)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckGroupCall, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        sources, cursor = IntVector.read_from(view, cursor)
+        return cls(call=call, sources=sources), cursor
+
+
+class ToggleGroupCallRecord(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xf128c708
+    __tl_name__ = "functions.phone.ToggleGroupCallRecord"
+    __tl_layer__ = 133
+
+    __slots__ = ("start", "video", "call", "title", "video_portrait", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, start: bool = False, video: bool = False, title: str | None = None, video_portrait: bool = False):
+        self.start = start
+        self.video = video
+        self.call = call
+        self.title = title
+        self.video_portrait = video_portrait
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.video is False, self.video_portrait is None)
+        _flags_fields_not_empty = (self.video is True, self.video_portrait is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: video, video_portrait")
+        flags1 = 0
+        if self.start: flags1 |= (1 << 0)
+        if self.video: flags1 |= (1 << 2)
+        if self.title is not None: flags1 |= (1 << 1)
+        if self.video_portrait is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.call.write_to(out, ctx)
+        if self.title is not None:
+            String.write_to(out, self.title)
+        if self.video_portrait is not None:
+            out += Bool.write(self.video_portrait)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleGroupCallRecord:
+        flags1 = Int.read(stream)
+        start = (flags1 & (1 << 0)) == (1 << 0)
+        video = (flags1 & (1 << 2)) == (1 << 2)
+        call = tl.types.InputGroupCall.read(stream)
+        title = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        video_portrait = Bool.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(start=start, video=video, call=call, title=title, video_portrait=video_portrait)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleGroupCallRecord, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        start = (flags1 & (1 << 0)) == (1 << 0)
+        video = (flags1 & (1 << 2)) == (1 << 2)
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        video_portrait, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(start=start, video=video, call=call, title=title, video_portrait=video_portrait), cursor
+
+
+class EditGroupCallParticipant(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xa5273abf
+    __tl_name__ = "functions.phone.EditGroupCallParticipant"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "participant", "muted", "volume", "raise_hand", "video_stopped", "video_paused", "presentation_paused", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, participant: tl.base.InputPeer, muted: bool = False, volume: int | None = None, raise_hand: bool = False, video_stopped: bool = False, video_paused: bool = False, presentation_paused: bool = False):
+        self.call = call
+        self.participant = participant
+        self.muted = muted
+        self.volume = volume
+        self.raise_hand = raise_hand
+        self.video_stopped = video_stopped
+        self.video_paused = video_paused
+        self.presentation_paused = presentation_paused
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.muted is not None: flags1 |= (1 << 0)
+        if self.volume is not None: flags1 |= (1 << 1)
+        if self.raise_hand is not None: flags1 |= (1 << 2)
+        if self.video_stopped is not None: flags1 |= (1 << 3)
+        if self.video_paused is not None: flags1 |= (1 << 4)
+        if self.presentation_paused is not None: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        self.call.write_to(out, ctx)
+        self.participant.write_to(out, ctx)
+        if self.muted is not None:
+            out += Bool.write(self.muted)
+        if self.volume is not None:
+            out += Int.write(self.volume)
+        if self.raise_hand is not None:
+            out += Bool.write(self.raise_hand)
+        if self.video_stopped is not None:
+            out += Bool.write(self.video_stopped)
+        if self.video_paused is not None:
+            out += Bool.write(self.video_paused)
+        if self.presentation_paused is not None:
+            out += Bool.write(self.presentation_paused)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditGroupCallParticipant:
+        flags1 = Int.read(stream)
+        call = tl.types.InputGroupCall.read(stream)
+        participant = TLObject.read(stream)
+        muted = Bool.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        volume = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        raise_hand = Bool.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        video_stopped = Bool.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        video_paused = Bool.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        presentation_paused = Bool.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        return cls(call=call, participant=participant, muted=muted, volume=volume, raise_hand=raise_hand, video_stopped=video_stopped, video_paused=video_paused, presentation_paused=presentation_paused)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditGroupCallParticipant, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        participant, cursor = TLObject.read_from(view, cursor)
+        muted, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        volume, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        raise_hand, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        video_stopped, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        video_paused, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        presentation_paused, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        return cls(call=call, participant=participant, muted=muted, volume=volume, raise_hand=raise_hand, video_stopped=video_stopped, video_paused=video_paused, presentation_paused=presentation_paused), cursor
+
+
+class EditGroupCallTitle(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x1ca6ac0a
+    __tl_name__ = "functions.phone.EditGroupCallTitle"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "title", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, title: str):
+        self.call = call
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+        String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditGroupCallTitle:
+        call = tl.types.InputGroupCall.read(stream)
+        title = String.read(stream)
+        return cls(call=call, title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditGroupCallTitle, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        return cls(call=call, title=title), cursor
+
+
+class GetGroupCallJoinAs(TLRequest[tl.types.phone.JoinAsPeers]):
+    __tl_id__ = 0xef7c213a
+    __tl_name__ = "functions.phone.GetGroupCallJoinAs"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetGroupCallJoinAs:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetGroupCallJoinAs, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class ExportGroupCallInvite(TLRequest[tl.types.phone.ExportedGroupCallInvite]):
+    __tl_id__ = 0xe6aa647f
+    __tl_name__ = "functions.phone.ExportGroupCallInvite"
+    __tl_layer__ = 133
+
+    __slots__ = ("can_self_unmute", "call", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, can_self_unmute: bool = False):
+        self.can_self_unmute = can_self_unmute
+        self.call = call
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.can_self_unmute: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.call.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportGroupCallInvite:
+        flags1 = Int.read(stream)
+        can_self_unmute = (flags1 & (1 << 0)) == (1 << 0)
+        call = tl.types.InputGroupCall.read(stream)
+        return cls(can_self_unmute=can_self_unmute, call=call)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportGroupCallInvite, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        can_self_unmute = (flags1 & (1 << 0)) == (1 << 0)
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        return cls(can_self_unmute=can_self_unmute, call=call), cursor
+
+
+class ToggleGroupCallStartSubscription(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x219c34e6
+    __tl_name__ = "functions.phone.ToggleGroupCallStartSubscription"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "subscribed", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, subscribed: bool):
+        self.call = call
+        self.subscribed = subscribed
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+        out += Bool.write(self.subscribed)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleGroupCallStartSubscription:
+        call = tl.types.InputGroupCall.read(stream)
+        subscribed = Bool.read(stream)
+        return cls(call=call, subscribed=subscribed)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleGroupCallStartSubscription, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        subscribed, cursor = Bool.read_from(view, cursor)
+        return cls(call=call, subscribed=subscribed), cursor
+
+
+class StartScheduledGroupCall(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x5680e342
+    __tl_name__ = "functions.phone.StartScheduledGroupCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall):
+        self.call = call
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StartScheduledGroupCall:
+        call = tl.types.InputGroupCall.read(stream)
+        return cls(call=call)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StartScheduledGroupCall, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        return cls(call=call), cursor
+
+
+class SaveDefaultGroupCallJoinAs(TLRequest[bool]):
+    __tl_id__ = 0x575e1f8c
+    __tl_name__ = "functions.phone.SaveDefaultGroupCallJoinAs"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "join_as", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, join_as: tl.base.InputPeer):
+        self.peer = peer
+        self.join_as = join_as
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.join_as.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveDefaultGroupCallJoinAs:
+        peer = TLObject.read(stream)
+        join_as = TLObject.read(stream)
+        return cls(peer=peer, join_as=join_as)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveDefaultGroupCallJoinAs, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        join_as, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, join_as=join_as), cursor
+
+
+class JoinGroupCallPresentation(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xcbea6bc4
+    __tl_name__ = "functions.phone.JoinGroupCallPresentation"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "params", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, params: tl.types.DataJSON):
+        self.call = call
+        self.params = params
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+        self.params.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> JoinGroupCallPresentation:
+        call = tl.types.InputGroupCall.read(stream)
+        params = tl.types.DataJSON.read(stream)
+        return cls(call=call, params=params)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[JoinGroupCallPresentation, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        params, cursor = tl.types.DataJSON.read_from(view, cursor)
+        return cls(call=call, params=params), cursor
+
+
+class LeaveGroupCallPresentation(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x1c50d144
+    __tl_name__ = "functions.phone.LeaveGroupCallPresentation"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall):
+        self.call = call
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LeaveGroupCallPresentation:
+        call = tl.types.InputGroupCall.read(stream)
+        return cls(call=call)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LeaveGroupCallPresentation, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        return cls(call=call), cursor
+
+
+class GetGroupCallStreamChannels(TLRequest[tl.types.phone.GroupCallStreamChannels]):
+    __tl_id__ = 0x1ab21940
+    __tl_name__ = "functions.phone.GetGroupCallStreamChannels"
+    __tl_layer__ = 139
+
+    __slots__ = ("call", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall):
+        self.call = call
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetGroupCallStreamChannels:
+        call = tl.types.InputGroupCall.read(stream)
+        return cls(call=call)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetGroupCallStreamChannels, int]:
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        return cls(call=call), cursor
+
+
+class GetGroupCallStreamRtmpUrl(TLRequest[tl.types.phone.GroupCallStreamRtmpUrl]):
+    __tl_id__ = 0xdeb3abbf
+    __tl_name__ = "functions.phone.GetGroupCallStreamRtmpUrl"
+    __tl_layer__ = 139
+
+    __slots__ = ("peer", "revoke", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, revoke: bool):
+        self.peer = peer
+        self.revoke = revoke
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Bool.write(self.revoke)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetGroupCallStreamRtmpUrl:
+        peer = TLObject.read(stream)
+        revoke = Bool.read(stream)
+        return cls(peer=peer, revoke=revoke)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetGroupCallStreamRtmpUrl, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        revoke, cursor = Bool.read_from(view, cursor)
+        return cls(peer=peer, revoke=revoke), cursor
+
+
+class SaveCallLog(TLRequest[bool]):
+    __tl_id__ = 0x41248786
+    __tl_name__ = "functions.phone.SaveCallLog"
+    __tl_layer__ = 140
+
+    __slots__ = ("peer", "file", )
+
+    def __init__(self, *, peer: tl.types.InputPhoneCall, file: tl.base.InputFile):
+        self.peer = peer
+        self.file = file
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.file.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveCallLog:
+        peer = tl.types.InputPhoneCall.read(stream)
+        file = TLObject.read(stream)
+        return cls(peer=peer, file=file)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveCallLog, int]:
+        peer, cursor = tl.types.InputPhoneCall.read_from(view, cursor)
+        file, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, file=file), cursor
+
+
+class CreateConferenceCall(TLRequest[tl.types.phone.PhoneCall]):
+    __tl_id__ = 0xdfc909ab
+    __tl_name__ = "functions.phone.CreateConferenceCall"
+    __tl_layer__ = 196
+
+    __slots__ = ("peer", "key_fingerprint", )
+
+    def __init__(self, *, peer: tl.types.InputPhoneCall, key_fingerprint: int):
+        self.peer = peer
+        self.key_fingerprint = key_fingerprint
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Long.write(self.key_fingerprint)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateConferenceCall:
+        peer = tl.types.InputPhoneCall.read(stream)
+        key_fingerprint = Long.read(stream)
+        return cls(peer=peer, key_fingerprint=key_fingerprint)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateConferenceCall, int]:
+        peer, cursor = tl.types.InputPhoneCall.read_from(view, cursor)
+        key_fingerprint, cursor = Long.read_from(view, cursor)
+        return cls(peer=peer, key_fingerprint=key_fingerprint), cursor
+
+
+class RequestCall_133(TLRequest[tl.types.phone.PhoneCall]):
+    __tl_id__ = 0x42ff96ed
+    __tl_name__ = "functions.phone.RequestCall_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("video", "user_id", "random_id", "g_a_hash", "protocol", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, random_id: int, g_a_hash: bytes, protocol: tl.types.PhoneCallProtocol, video: bool = False):
+        self.video = video
+        self.user_id = user_id
+        self.random_id = random_id
+        self.g_a_hash = g_a_hash
+        self.protocol = protocol
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.video: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.random_id)
+        Bytes.write_to(out, self.g_a_hash)
+        self.protocol.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RequestCall_133:
+        flags1 = Int.read(stream)
+        video = (flags1 & (1 << 0)) == (1 << 0)
+        user_id = TLObject.read(stream)
+        random_id = Int.read(stream)
+        g_a_hash = Bytes.read(stream)
+        protocol = tl.types.PhoneCallProtocol.read(stream)
+        return cls(video=video, user_id=user_id, random_id=random_id, g_a_hash=g_a_hash, protocol=protocol)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RequestCall_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        video = (flags1 & (1 << 0)) == (1 << 0)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        random_id, cursor = Int.read_from(view, cursor)
+        g_a_hash, cursor = Bytes.read_from(view, cursor)
+        protocol, cursor = tl.types.PhoneCallProtocol.read_from(view, cursor)
+        return cls(video=video, user_id=user_id, random_id=random_id, g_a_hash=g_a_hash, protocol=protocol), cursor
+
+
+class JoinGroupCall_133(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xb132ff7b
+    __tl_name__ = "functions.phone.JoinGroupCall_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("muted", "video_stopped", "call", "join_as", "invite_hash", "params", )
+
+    def __init__(self, *, call: tl.types.InputGroupCall, join_as: tl.base.InputPeer, params: tl.types.DataJSON, muted: bool = False, video_stopped: bool = False, invite_hash: str | None = None):
+        self.muted = muted
+        self.video_stopped = video_stopped
+        self.call = call
+        self.join_as = join_as
+        self.invite_hash = invite_hash
+        self.params = params
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.muted: flags1 |= (1 << 0)
+        if self.video_stopped: flags1 |= (1 << 2)
+        if self.invite_hash is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.call.write_to(out, ctx)
+        self.join_as.write_to(out, ctx)
+        if self.invite_hash is not None:
+            String.write_to(out, self.invite_hash)
+        self.params.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> JoinGroupCall_133:
+        flags1 = Int.read(stream)
+        muted = (flags1 & (1 << 0)) == (1 << 0)
+        video_stopped = (flags1 & (1 << 2)) == (1 << 2)
+        call = tl.types.InputGroupCall.read(stream)
+        join_as = TLObject.read(stream)
+        invite_hash = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        params = tl.types.DataJSON.read(stream)
+        return cls(muted=muted, video_stopped=video_stopped, call=call, join_as=join_as, invite_hash=invite_hash, params=params)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[JoinGroupCall_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        muted = (flags1 & (1 << 0)) == (1 << 0)
+        video_stopped = (flags1 & (1 << 2)) == (1 << 2)
+        call, cursor = tl.types.InputGroupCall.read_from(view, cursor)
+        join_as, cursor = TLObject.read_from(view, cursor)
+        invite_hash, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        params, cursor = tl.types.DataJSON.read_from(view, cursor)
+        return cls(muted=muted, video_stopped=video_stopped, call=call, join_as=join_as, invite_hash=invite_hash, params=params), cursor
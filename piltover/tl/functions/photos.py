@@ -0,0 +1,434 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class UpdateProfilePhoto(TLRequest[tl.types.photos.Photo]):
+    __tl_id__ = 0x9e82039
+    __tl_name__ = "functions.photos.UpdateProfilePhoto"
+    __tl_layer__ = 158
+
+    __slots__ = ("fallback", "bot", "id", )
+
+    def __init__(self, *, id: tl.base.InputPhoto, fallback: bool = False, bot: tl.base.InputUser | None = None):
+        self.fallback = fallback
+        self.bot = bot
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.fallback: flags1 |= (1 << 0)
+        if self.bot is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.bot is not None:
+            self.bot.write_to(out, ctx)
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateProfilePhoto:
+        flags1 = Int.read(stream)
+        fallback = (flags1 & (1 << 0)) == (1 << 0)
+        bot = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        id = TLObject.read(stream)
+        return cls(fallback=fallback, bot=bot, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateProfilePhoto, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        fallback = (flags1 & (1 << 0)) == (1 << 0)
+        bot, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(fallback=fallback, bot=bot, id=id), cursor
+
+
+class UploadProfilePhoto(TLRequest[tl.types.photos.Photo]):
+    __tl_id__ = 0x388a3b5
+    __tl_name__ = "functions.photos.UploadProfilePhoto"
+    __tl_layer__ = 158
+
+    __slots__ = ("fallback", "bot", "file", "video", "video_start_ts", "video_emoji_markup", )
+
+    def __init__(self, *, fallback: bool = False, bot: tl.base.InputUser | None = None, file: tl.base.InputFile | None = None, video: tl.base.InputFile | None = None, video_start_ts: float | None = None, video_emoji_markup: tl.base.VideoSize | None = None):
+        self.fallback = fallback
+        self.bot = bot
+        self.file = file
+        self.video = video
+        self.video_start_ts = video_start_ts
+        self.video_emoji_markup = video_emoji_markup
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.fallback: flags1 |= (1 << 3)
+        if self.bot is not None: flags1 |= (1 << 5)
+        if self.file is not None: flags1 |= (1 << 0)
+        if self.video is not None: flags1 |= (1 << 1)
+        if self.video_start_ts is not None: flags1 |= (1 << 2)
+        if self.video_emoji_markup is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        if self.bot is not None:
+            self.bot.write_to(out, ctx)
+        if self.file is not None:
+            self.file.write_to(out, ctx)
+        if self.video is not None:
+            self.video.write_to(out, ctx)
+        if self.video_start_ts is not None:
+            out += Float.write(self.video_start_ts)
+        if self.video_emoji_markup is not None:
+            self.video_emoji_markup.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadProfilePhoto:
+        flags1 = Int.read(stream)
+        fallback = (flags1 & (1 << 3)) == (1 << 3)
+        bot = TLObject.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        file = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        video = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        video_start_ts = Float.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        video_emoji_markup = TLObject.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(fallback=fallback, bot=bot, file=file, video=video, video_start_ts=video_start_ts, video_emoji_markup=video_emoji_markup)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadProfilePhoto, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        fallback = (flags1 & (1 << 3)) == (1 << 3)
+        bot, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        file, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        video, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        video_start_ts, cursor = Float.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        video_emoji_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(fallback=fallback, bot=bot, file=file, video=video, video_start_ts=video_start_ts, video_emoji_markup=video_emoji_markup), cursor
+
+
+class DeletePhotos(TLRequest[list[int]]):
+    __tl_id__ = 0x87cf7f2f
+    __tl_name__ = "functions.photos.DeletePhotos"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[tl.base.InputPhoto]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeletePhotos:
+        id = TLObjectVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeletePhotos, int]:
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetUserPhotos(TLRequest[tl.base.photos.Photos]):
+    __tl_id__ = 0x91cd32a8
+    __tl_name__ = "functions.photos.GetUserPhotos"
+    __tl_layer__ = 133
+
+    __slots__ = ("user_id", "offset", "max_id", "limit", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, offset: int, max_id: int, limit: int):
+        self.user_id = user_id
+        self.offset = offset
+        self.max_id = max_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.offset)
+        out += Long.write(self.max_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUserPhotos:
+        user_id = TLObject.read(stream)
+        offset = Int.read(stream)
+        max_id = Long.read(stream)
+        limit = Int.read(stream)
+        return cls(user_id=user_id, offset=offset, max_id=max_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUserPhotos, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        max_id, cursor = Long.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(user_id=user_id, offset=offset, max_id=max_id, limit=limit), cursor
+
+
+class UploadContactProfilePhoto(TLRequest[tl.types.photos.Photo]):
+    __tl_id__ = 0xe14c4a71
+    __tl_name__ = "functions.photos.UploadContactProfilePhoto"
+    __tl_layer__ = 152
+
+    __slots__ = ("suggest", "save", "user_id", "file", "video", "video_start_ts", "video_emoji_markup", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, suggest: bool = False, save: bool = False, file: tl.base.InputFile | None = None, video: tl.base.InputFile | None = None, video_start_ts: float | None = None, video_emoji_markup: tl.base.VideoSize | None = None):
+        self.suggest = suggest
+        self.save = save
+        self.user_id = user_id
+        self.file = file
+        self.video = video
+        self.video_start_ts = video_start_ts
+        self.video_emoji_markup = video_emoji_markup
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.suggest: flags1 |= (1 << 3)
+        if self.save: flags1 |= (1 << 4)
+        if self.file is not None: flags1 |= (1 << 0)
+        if self.video is not None: flags1 |= (1 << 1)
+        if self.video_start_ts is not None: flags1 |= (1 << 2)
+        if self.video_emoji_markup is not None: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        self.user_id.write_to(out, ctx)
+        if self.file is not None:
+            self.file.write_to(out, ctx)
+        if self.video is not None:
+            self.video.write_to(out, ctx)
+        if self.video_start_ts is not None:
+            out += Float.write(self.video_start_ts)
+        if self.video_emoji_markup is not None:
+            self.video_emoji_markup.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadContactProfilePhoto:
+        flags1 = Int.read(stream)
+        suggest = (flags1 & (1 << 3)) == (1 << 3)
+        save = (flags1 & (1 << 4)) == (1 << 4)
+        user_id = TLObject.read(stream)
+        file = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        video = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        video_start_ts = Float.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        video_emoji_markup = TLObject.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        return cls(suggest=suggest, save=save, user_id=user_id, file=file, video=video, video_start_ts=video_start_ts, video_emoji_markup=video_emoji_markup)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadContactProfilePhoto, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        suggest = (flags1 & (1 << 3)) == (1 << 3)
+        save = (flags1 & (1 << 4)) == (1 << 4)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        file, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        video, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        video_start_ts, cursor = Float.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        video_emoji_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        return cls(suggest=suggest, save=save, user_id=user_id, file=file, video=video, video_start_ts=video_start_ts, video_emoji_markup=video_emoji_markup), cursor
+
+
+class UpdateProfilePhoto_133(TLRequest[tl.types.photos.Photo]):
+    __tl_id__ = 0x72d4742c
+    __tl_name__ = "functions.photos.UpdateProfilePhoto_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: tl.base.InputPhoto):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateProfilePhoto_133:
+        id = TLObject.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateProfilePhoto_133, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class UploadProfilePhoto_133(TLRequest[tl.types.photos.Photo]):
+    __tl_id__ = 0x89f30f69
+    __tl_name__ = "functions.photos.UploadProfilePhoto_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("fallback", "file", "video", "video_start_ts", )
+
+    def __init__(self, *, fallback: bool = False, file: tl.base.InputFile | None = None, video: tl.base.InputFile | None = None, video_start_ts: float | None = None):
+        self.fallback = fallback
+        self.file = file
+        self.video = video
+        self.video_start_ts = video_start_ts
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.fallback: flags1 |= (1 << 3)
+        if self.file is not None: flags1 |= (1 << 0)
+        if self.video is not None: flags1 |= (1 << 1)
+        if self.video_start_ts is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.file is not None:
+            self.file.write_to(out, ctx)
+        if self.video is not None:
+            self.video.write_to(out, ctx)
+        if self.video_start_ts is not None:
+            out += Float.write(self.video_start_ts)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadProfilePhoto_133:
+        flags1 = Int.read(stream)
+        fallback = (flags1 & (1 << 3)) == (1 << 3)
+        file = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        video = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        video_start_ts = Float.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(fallback=fallback, file=file, video=video, video_start_ts=video_start_ts)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadProfilePhoto_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        fallback = (flags1 & (1 << 3)) == (1 << 3)
+        file, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        video, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        video_start_ts, cursor = Float.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(fallback=fallback, file=file, video=video, video_start_ts=video_start_ts), cursor
+
+
+class UpdateProfilePhoto_151(TLRequest[tl.types.photos.Photo]):
+    __tl_id__ = 0x1c3d5956
+    __tl_name__ = "functions.photos.UpdateProfilePhoto_151"
+    __tl_layer__ = 151
+
+    __slots__ = ("fallback", "id", )
+
+    def __init__(self, *, id: tl.base.InputPhoto, fallback: bool = False):
+        self.fallback = fallback
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.fallback: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateProfilePhoto_151:
+        flags1 = Int.read(stream)
+        fallback = (flags1 & (1 << 0)) == (1 << 0)
+        id = TLObject.read(stream)
+        return cls(fallback=fallback, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateProfilePhoto_151, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        fallback = (flags1 & (1 << 0)) == (1 << 0)
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(fallback=fallback, id=id), cursor
+
+
+class UploadContactProfilePhoto_151(TLRequest[tl.types.photos.Photo]):
+    __tl_id__ = 0xb91a83bf
+    __tl_name__ = "functions.photos.UploadContactProfilePhoto_151"
+    __tl_layer__ = 151
+
+    __slots__ = ("suggest", "save", "user_id", "file", "video", "video_start_ts", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, suggest: bool = False, save: bool = False, file: tl.base.InputFile | None = None, video: tl.base.InputFile | None = None, video_start_ts: float | None = None):
+        self.suggest = suggest
+        self.save = save
+        self.user_id = user_id
+        self.file = file
+        self.video = video
+        self.video_start_ts = video_start_ts
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.suggest: flags1 |= (1 << 3)
+        if self.save: flags1 |= (1 << 4)
+        if self.file is not None: flags1 |= (1 << 0)
+        if self.video is not None: flags1 |= (1 << 1)
+        if self.video_start_ts is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.user_id.write_to(out, ctx)
+        if self.file is not None:
+            self.file.write_to(out, ctx)
+        if self.video is not None:
+            self.video.write_to(out, ctx)
+        if self.video_start_ts is not None:
+            out += Float.write(self.video_start_ts)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadContactProfilePhoto_151:
+        flags1 = Int.read(stream)
+        suggest = (flags1 & (1 << 3)) == (1 << 3)
+        save = (flags1 & (1 << 4)) == (1 << 4)
+        user_id = TLObject.read(stream)
+        file = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        video = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        video_start_ts = Float.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(suggest=suggest, save=save, user_id=user_id, file=file, video=video, video_start_ts=video_start_ts)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadContactProfilePhoto_151, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        suggest = (flags1 & (1 << 3)) == (1 << 3)
+        save = (flags1 & (1 << 4)) == (1 << 4)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        file, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        video, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        video_start_ts, cursor = Float.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(suggest=suggest, save=save, user_id=user_id, file=file, video=video, video_start_ts=video_start_ts), cursor
+
+
+class UploadProfilePhoto_152(TLRequest[tl.types.photos.Photo]):
+    __tl_id__ = 0x93c9a51
+    __tl_name__ = "functions.photos.UploadProfilePhoto_152"
+    __tl_layer__ = 152
+
+    __slots__ = ("fallback", "file", "video", "video_start_ts", "video_emoji_markup", )
+
+    def __init__(self, *, fallback: bool = False, file: tl.base.InputFile | None = None, video: tl.base.InputFile | None = None, video_start_ts: float | None = None, video_emoji_markup: tl.base.VideoSize | None = None):
+        self.fallback = fallback
+        self.file = file
+        self.video = video
+        self.video_start_ts = video_start_ts
+        self.video_emoji_markup = video_emoji_markup
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.fallback: flags1 |= (1 << 3)
+        if self.file is not None: flags1 |= (1 << 0)
+        if self.video is not None: flags1 |= (1 << 1)
+        if self.video_start_ts is not None: flags1 |= (1 << 2)
+        if self.video_emoji_markup is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        if self.file is not None:
+            self.file.write_to(out, ctx)
+        if self.video is not None:
+            self.video.write_to(out, ctx)
+        if self.video_start_ts is not None:
+            out += Float.write(self.video_start_ts)
+        if self.video_emoji_markup is not None:
+            self.video_emoji_markup.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UploadProfilePhoto_152:
+        flags1 = Int.read(stream)
+        fallback = (flags1 & (1 << 3)) == (1 << 3)
+        file = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        video = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        video_start_ts = Float.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        video_emoji_markup = TLObject.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(fallback=fallback, file=file, video=video, video_start_ts=video_start_ts, video_emoji_markup=video_emoji_markup)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UploadProfilePhoto_152, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        fallback = (flags1 & (1 << 3)) == (1 << 3)
+        file, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        video, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        video_start_ts, cursor = Float.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        video_emoji_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(fallback=fallback, file=file, video=video, video_start_ts=video_start_ts, video_emoji_markup=video_emoji_markup), cursor
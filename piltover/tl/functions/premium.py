@@ -0,0 +1,155 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetBoostsList(TLRequest[tl.types.premium.BoostsList]):
+    __tl_id__ = 0x60f67660
+    __tl_name__ = "functions.premium.GetBoostsList"
+    __tl_layer__ = 166
+
+    __slots__ = ("gifts", "peer", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset: str, limit: int, gifts: bool = False):
+        self.gifts = gifts
+        self.peer = peer
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.gifts: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBoostsList:
+        flags1 = Int.read(stream)
+        gifts = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(gifts=gifts, peer=peer, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBoostsList, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        gifts = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(gifts=gifts, peer=peer, offset=offset, limit=limit), cursor
+
+
+class GetMyBoosts(TLRequest[tl.types.premium.MyBoosts]):
+    __tl_id__ = 0xbe77b4a
+    __tl_name__ = "functions.premium.GetMyBoosts"
+    __tl_layer__ = 166
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMyBoosts:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMyBoosts, int]:
+        return cls(), cursor
+
+
+class ApplyBoost(TLRequest[tl.types.premium.MyBoosts]):
+    __tl_id__ = 0x6b7da746
+    __tl_name__ = "functions.premium.ApplyBoost"
+    __tl_layer__ = 166
+
+    __slots__ = ("slots", "peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, slots: list[int] | None = None):
+        self.slots = slots
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.slots: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.slots:
+            out += IntVector.write(self.slots)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ApplyBoost:
+        flags1 = Int.read(stream)
+        slots = IntVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        peer = TLObject.read(stream)
+        return cls(slots=slots, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ApplyBoost, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        slots, cursor = IntVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(slots=slots, peer=peer), cursor
+
+
+class GetBoostsStatus(TLRequest[tl.types.premium.BoostsStatus]):
+    __tl_id__ = 0x42f1f61
+    __tl_name__ = "functions.premium.GetBoostsStatus"
+    __tl_layer__ = 166
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBoostsStatus:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBoostsStatus, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class GetUserBoosts(TLRequest[tl.types.premium.BoostsList]):
+    __tl_id__ = 0x39854d1f
+    __tl_name__ = "functions.premium.GetUserBoosts"
+    __tl_layer__ = 167
+
+    __slots__ = ("peer", "user_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, user_id: tl.base.InputUser):
+        self.peer = peer
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUserBoosts:
+        peer = TLObject.read(stream)
+        user_id = TLObject.read(stream)
+        return cls(peer=peer, user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUserBoosts, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, user_id=user_id), cursor
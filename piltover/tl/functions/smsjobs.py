@@ -0,0 +1,172 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class IsEligibleToJoin(TLRequest[tl.types.smsjobs.EligibleToJoin]):
+    __tl_id__ = 0xedc39d0
+    __tl_name__ = "functions.smsjobs.IsEligibleToJoin"
+    __tl_layer__ = 176
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> IsEligibleToJoin:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[IsEligibleToJoin, int]:
+        return cls(), cursor
+
+
+class Join(TLRequest[bool]):
+    __tl_id__ = 0xa74ece2d
+    __tl_name__ = "functions.smsjobs.Join"
+    __tl_layer__ = 176
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Join:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Join, int]:
+        return cls(), cursor
+
+
+class Leave(TLRequest[bool]):
+    __tl_id__ = 0x9898ad73
+    __tl_name__ = "functions.smsjobs.Leave"
+    __tl_layer__ = 176
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Leave:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Leave, int]:
+        return cls(), cursor
+
+
+class UpdateSettings(TLRequest[bool]):
+    __tl_id__ = 0x93fa0bf
+    __tl_name__ = "functions.smsjobs.UpdateSettings"
+    __tl_layer__ = 176
+
+    __slots__ = ("allow_international", )
+
+    def __init__(self, *, allow_international: bool = False):
+        self.allow_international = allow_international
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.allow_international: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UpdateSettings:
+        flags1 = Int.read(stream)
+        allow_international = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(allow_international=allow_international)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UpdateSettings, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        allow_international = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(allow_international=allow_international), cursor
+
+
+class GetStatus(TLRequest[tl.types.smsjobs.Status]):
+    __tl_id__ = 0x10a698e8
+    __tl_name__ = "functions.smsjobs.GetStatus"
+    __tl_layer__ = 176
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStatus:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStatus, int]:
+        return cls(), cursor
+
+
+class GetSmsJob(TLRequest[tl.types.SmsJob]):
+    __tl_id__ = 0x778d902f
+    __tl_name__ = "functions.smsjobs.GetSmsJob"
+    __tl_layer__ = 176
+
+    __slots__ = ("job_id", )
+
+    def __init__(self, *, job_id: str):
+        self.job_id = job_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.job_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetSmsJob:
+        job_id = String.read(stream)
+        return cls(job_id=job_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetSmsJob, int]:
+        job_id, cursor = String.read_from(view, cursor)
+        return cls(job_id=job_id), cursor
+
+
+class FinishJob(TLRequest[bool]):
+    __tl_id__ = 0x4f1ebf24
+    __tl_name__ = "functions.smsjobs.FinishJob"
+    __tl_layer__ = 176
+
+    __slots__ = ("job_id", "error", )
+
+    def __init__(self, *, job_id: str, error: str | None = None):
+        self.job_id = job_id
+        self.error = error
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.error is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.job_id)
+        if self.error is not None:
+            String.write_to(out, self.error)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FinishJob:
+        flags1 = Int.read(stream)
+        job_id = String.read(stream)
+        error = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(job_id=job_id, error=error)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FinishJob, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        job_id, cursor = String.read_from(view, cursor)
+        error, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(job_id=job_id, error=error), cursor
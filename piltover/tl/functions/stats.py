@@ -0,0 +1,480 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetBroadcastStats(TLRequest[tl.base.stats.BroadcastStats]):
+    __tl_id__ = 0xab42441a
+    __tl_name__ = "functions.stats.GetBroadcastStats"
+    __tl_layer__ = 133
+
+    __slots__ = ("dark", "channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, dark: bool = False):
+        self.dark = dark
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.dark: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBroadcastStats:
+        flags1 = Int.read(stream)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        channel = TLObject.read(stream)
+        return cls(dark=dark, channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBroadcastStats, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(dark=dark, channel=channel), cursor
+
+
+class LoadAsyncGraph(TLRequest[tl.base.StatsGraph]):
+    __tl_id__ = 0x621d5fa0
+    __tl_name__ = "functions.stats.LoadAsyncGraph"
+    __tl_layer__ = 133
+
+    __slots__ = ("token", "x", )
+
+    def __init__(self, *, token: str, x: int | None = None):
+        self.token = token
+        self.x = x
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.x is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.token)
+        if self.x is not None:
+            out += Long.write(self.x)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LoadAsyncGraph:
+        flags1 = Int.read(stream)
+        token = String.read(stream)
+        x = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(token=token, x=x)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LoadAsyncGraph, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        token, cursor = String.read_from(view, cursor)
+        x, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(token=token, x=x), cursor
+
+
+class GetMegagroupStats(TLRequest[tl.types.stats.MegagroupStats]):
+    __tl_id__ = 0xdcdf8607
+    __tl_name__ = "functions.stats.GetMegagroupStats"
+    __tl_layer__ = 133
+
+    __slots__ = ("dark", "channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, dark: bool = False):
+        self.dark = dark
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.dark: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMegagroupStats:
+        flags1 = Int.read(stream)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        channel = TLObject.read(stream)
+        return cls(dark=dark, channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMegagroupStats, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(dark=dark, channel=channel), cursor
+
+
+class GetMessagePublicForwards(TLRequest[tl.types.stats.PublicForwards]):
+    __tl_id__ = 0x5f150144
+    __tl_name__ = "functions.stats.GetMessagePublicForwards"
+    __tl_layer__ = 168
+
+    __slots__ = ("channel", "msg_id", "offset", "limit", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, msg_id: int, offset: str, limit: int):
+        self.channel = channel
+        self.msg_id = msg_id
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessagePublicForwards:
+        channel = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(channel=channel, msg_id=msg_id, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessagePublicForwards, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, msg_id=msg_id, offset=offset, limit=limit), cursor
+
+
+class GetMessageStats(TLRequest[tl.base.stats.MessageStats]):
+    __tl_id__ = 0xb6e0a3f5
+    __tl_name__ = "functions.stats.GetMessageStats"
+    __tl_layer__ = 133
+
+    __slots__ = ("dark", "channel", "msg_id", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, msg_id: int, dark: bool = False):
+        self.dark = dark
+        self.channel = channel
+        self.msg_id = msg_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.dark: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessageStats:
+        flags1 = Int.read(stream)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        channel = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        return cls(dark=dark, channel=channel, msg_id=msg_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessageStats, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        channel, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        return cls(dark=dark, channel=channel, msg_id=msg_id), cursor
+
+
+class GetStoryStats(TLRequest[tl.types.stats.StoryStats]):
+    __tl_id__ = 0x374fef40
+    __tl_name__ = "functions.stats.GetStoryStats"
+    __tl_layer__ = 167
+
+    __slots__ = ("dark", "peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, dark: bool = False):
+        self.dark = dark
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.dark: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoryStats:
+        flags1 = Int.read(stream)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        return cls(dark=dark, peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoryStats, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        return cls(dark=dark, peer=peer, id=id), cursor
+
+
+class GetStoryPublicForwards(TLRequest[tl.types.stats.PublicForwards]):
+    __tl_id__ = 0xa6437ef6
+    __tl_name__ = "functions.stats.GetStoryPublicForwards"
+    __tl_layer__ = 167
+
+    __slots__ = ("peer", "id", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, offset: str, limit: int):
+        self.peer = peer
+        self.id = id
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoryPublicForwards:
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(peer=peer, id=id, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoryPublicForwards, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, id=id, offset=offset, limit=limit), cursor
+
+
+class GetBroadcastRevenueStats(TLRequest[tl.base.stats.BroadcastRevenueStats]):
+    __tl_id__ = 0xf788ee19
+    __tl_name__ = "functions.stats.GetBroadcastRevenueStats"
+    __tl_layer__ = 192
+
+    __slots__ = ("dark", "peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, dark: bool = False):
+        self.dark = dark
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.dark: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBroadcastRevenueStats:
+        flags1 = Int.read(stream)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        return cls(dark=dark, peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBroadcastRevenueStats, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(dark=dark, peer=peer), cursor
+
+
+class GetBroadcastRevenueWithdrawalUrl(TLRequest[tl.types.stats.BroadcastRevenueWithdrawalUrl]):
+    __tl_id__ = 0x9df4faad
+    __tl_name__ = "functions.stats.GetBroadcastRevenueWithdrawalUrl"
+    __tl_layer__ = 192
+
+    __slots__ = ("peer", "password", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, password: tl.base.InputCheckPasswordSRP):
+        self.peer = peer
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        self.password.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBroadcastRevenueWithdrawalUrl:
+        peer = TLObject.read(stream)
+        password = TLObject.read(stream)
+        return cls(peer=peer, password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBroadcastRevenueWithdrawalUrl, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        password, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer, password=password), cursor
+
+
+class GetBroadcastRevenueTransactions(TLRequest[tl.types.stats.BroadcastRevenueTransactions]):
+    __tl_id__ = 0x70990b6d
+    __tl_name__ = "functions.stats.GetBroadcastRevenueTransactions"
+    __tl_layer__ = 192
+
+    __slots__ = ("peer", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset: int, limit: int):
+        self.peer = peer
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBroadcastRevenueTransactions:
+        peer = TLObject.read(stream)
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(peer=peer, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBroadcastRevenueTransactions, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, offset=offset, limit=limit), cursor
+
+
+class GetMessagePublicForwards_133(TLRequest[tl.base.messages.Messages]):
+    __tl_id__ = 0x5630281b
+    __tl_name__ = "functions.stats.GetMessagePublicForwards_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("channel", "msg_id", "offset_rate", "offset_peer", "offset_id", "limit", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, msg_id: int, offset_rate: int, offset_peer: tl.base.InputPeer, offset_id: int, limit: int):
+        self.channel = channel
+        self.msg_id = msg_id
+        self.offset_rate = offset_rate
+        self.offset_peer = offset_peer
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.msg_id)
+        out += Int.write(self.offset_rate)
+        self.offset_peer.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetMessagePublicForwards_133:
+        channel = TLObject.read(stream)
+        msg_id = Int.read(stream)
+        offset_rate = Int.read(stream)
+        offset_peer = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(channel=channel, msg_id=msg_id, offset_rate=offset_rate, offset_peer=offset_peer, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetMessagePublicForwards_133, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        msg_id, cursor = Int.read_from(view, cursor)
+        offset_rate, cursor = Int.read_from(view, cursor)
+        offset_peer, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, msg_id=msg_id, offset_rate=offset_rate, offset_peer=offset_peer, offset_id=offset_id, limit=limit), cursor
+
+
+class GetBroadcastRevenueStats_177(TLRequest[tl.base.stats.BroadcastRevenueStats]):
+    __tl_id__ = 0x75dfb671
+    __tl_name__ = "functions.stats.GetBroadcastRevenueStats_177"
+    __tl_layer__ = 177
+
+    __slots__ = ("dark", "channel", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, dark: bool = False):
+        self.dark = dark
+        self.channel = channel
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.dark: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBroadcastRevenueStats_177:
+        flags1 = Int.read(stream)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        channel = TLObject.read(stream)
+        return cls(dark=dark, channel=channel)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBroadcastRevenueStats_177, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        dark = (flags1 & (1 << 0)) == (1 << 0)
+        channel, cursor = TLObject.read_from(view, cursor)
+        return cls(dark=dark, channel=channel), cursor
+
+
+class GetBroadcastRevenueWithdrawalUrl_177(TLRequest[tl.types.stats.BroadcastRevenueWithdrawalUrl]):
+    __tl_id__ = 0x2a65ef73
+    __tl_name__ = "functions.stats.GetBroadcastRevenueWithdrawalUrl_177"
+    __tl_layer__ = 177
+
+    __slots__ = ("channel", "password", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, password: tl.base.InputCheckPasswordSRP):
+        self.channel = channel
+        self.password = password
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        self.password.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBroadcastRevenueWithdrawalUrl_177:
+        channel = TLObject.read(stream)
+        password = TLObject.read(stream)
+        return cls(channel=channel, password=password)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBroadcastRevenueWithdrawalUrl_177, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        password, cursor = TLObject.read_from(view, cursor)
+        return cls(channel=channel, password=password), cursor
+
+
+class GetBroadcastRevenueTransactions_177(TLRequest[tl.types.stats.BroadcastRevenueTransactions]):
+    __tl_id__ = 0x69280f
+    __tl_name__ = "functions.stats.GetBroadcastRevenueTransactions_177"
+    __tl_layer__ = 177
+
+    __slots__ = ("channel", "offset", "limit", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, offset: int, limit: int):
+        self.channel = channel
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.channel.write_to(out, ctx)
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBroadcastRevenueTransactions_177:
+        channel = TLObject.read(stream)
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(channel=channel, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBroadcastRevenueTransactions_177, int]:
+        channel, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(channel=channel, offset=offset, limit=limit), cursor
@@ -0,0 +1,396 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class CreateStickerSet(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0x9021ab67
+    __tl_name__ = "functions.stickers.CreateStickerSet"
+    __tl_layer__ = 133
+
+    __slots__ = ("masks", "emojis", "text_color", "user_id", "title", "short_name", "thumb", "stickers", "software", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, title: str, short_name: str, stickers: list[tl.base.InputStickerSetItem], masks: bool = False, emojis: bool = False, text_color: bool = False, thumb: tl.base.InputDocument | None = None, software: str | None = None):
+        self.masks = masks
+        self.emojis = emojis
+        self.text_color = text_color
+        self.user_id = user_id
+        self.title = title
+        self.short_name = short_name
+        self.thumb = thumb
+        self.stickers = stickers
+        self.software = software
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.masks: flags1 |= (1 << 0)
+        if self.emojis: flags1 |= (1 << 5)
+        if self.text_color: flags1 |= (1 << 6)
+        if self.thumb is not None: flags1 |= (1 << 2)
+        if self.software is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        self.user_id.write_to(out, ctx)
+        String.write_to(out, self.title)
+        String.write_to(out, self.short_name)
+        if self.thumb is not None:
+            self.thumb.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.stickers, ctx)
+        if self.software is not None:
+            String.write_to(out, self.software)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CreateStickerSet:
+        flags1 = Int.read(stream)
+        masks = (flags1 & (1 << 0)) == (1 << 0)
+        emojis = (flags1 & (1 << 5)) == (1 << 5)
+        text_color = (flags1 & (1 << 6)) == (1 << 6)
+        user_id = TLObject.read(stream)
+        title = String.read(stream)
+        short_name = String.read(stream)
+        thumb = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        stickers = TLObjectVector.read(stream)
+        software = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(masks=masks, emojis=emojis, text_color=text_color, user_id=user_id, title=title, short_name=short_name, thumb=thumb, stickers=stickers, software=software)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CreateStickerSet, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        masks = (flags1 & (1 << 0)) == (1 << 0)
+        emojis = (flags1 & (1 << 5)) == (1 << 5)
+        text_color = (flags1 & (1 << 6)) == (1 << 6)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        short_name, cursor = String.read_from(view, cursor)
+        thumb, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        stickers, cursor = TLObjectVector.read_from(view, cursor)
+        software, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(masks=masks, emojis=emojis, text_color=text_color, user_id=user_id, title=title, short_name=short_name, thumb=thumb, stickers=stickers, software=software), cursor
+
+
+class RemoveStickerFromSet(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0xf7760f51
+    __tl_name__ = "functions.stickers.RemoveStickerFromSet"
+    __tl_layer__ = 133
+
+    __slots__ = ("sticker", )
+
+    def __init__(self, *, sticker: tl.base.InputDocument):
+        self.sticker = sticker
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.sticker.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RemoveStickerFromSet:
+        sticker = TLObject.read(stream)
+        return cls(sticker=sticker)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RemoveStickerFromSet, int]:
+        sticker, cursor = TLObject.read_from(view, cursor)
+        return cls(sticker=sticker), cursor
+
+
+class ChangeStickerPosition(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0xffb6d4ca
+    __tl_name__ = "functions.stickers.ChangeStickerPosition"
+    __tl_layer__ = 133
+
+    __slots__ = ("sticker", "position", )
+
+    def __init__(self, *, sticker: tl.base.InputDocument, position: int):
+        self.sticker = sticker
+        self.position = position
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.sticker.write_to(out, ctx)
+        out += Int.write(self.position)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChangeStickerPosition:
+        sticker = TLObject.read(stream)
+        position = Int.read(stream)
+        return cls(sticker=sticker, position=position)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChangeStickerPosition, int]:
+        sticker, cursor = TLObject.read_from(view, cursor)
+        position, cursor = Int.read_from(view, cursor)
+        return cls(sticker=sticker, position=position), cursor
+
+
+class AddStickerToSet(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0x8653febe
+    __tl_name__ = "functions.stickers.AddStickerToSet"
+    __tl_layer__ = 133
+
+    __slots__ = ("stickerset", "sticker", )
+
+    def __init__(self, *, stickerset: tl.base.InputStickerSet, sticker: tl.base.InputStickerSetItem):
+        self.stickerset = stickerset
+        self.sticker = sticker
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stickerset.write_to(out, ctx)
+        self.sticker.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AddStickerToSet:
+        stickerset = TLObject.read(stream)
+        sticker = TLObject.read(stream)
+        return cls(stickerset=stickerset, sticker=sticker)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AddStickerToSet, int]:
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        sticker, cursor = TLObject.read_from(view, cursor)
+        return cls(stickerset=stickerset, sticker=sticker), cursor
+
+
+class SetStickerSetThumb(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0xa76a5392
+    __tl_name__ = "functions.stickers.SetStickerSetThumb"
+    __tl_layer__ = 153
+
+    __slots__ = ("stickerset", "thumb", "thumb_document_id", )
+
+    def __init__(self, *, stickerset: tl.base.InputStickerSet, thumb: tl.base.InputDocument | None = None, thumb_document_id: int | None = None):
+        self.stickerset = stickerset
+        self.thumb = thumb
+        self.thumb_document_id = thumb_document_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.thumb is not None: flags1 |= (1 << 0)
+        if self.thumb_document_id is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.stickerset.write_to(out, ctx)
+        if self.thumb is not None:
+            self.thumb.write_to(out, ctx)
+        if self.thumb_document_id is not None:
+            out += Long.write(self.thumb_document_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetStickerSetThumb:
+        flags1 = Int.read(stream)
+        stickerset = TLObject.read(stream)
+        thumb = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        thumb_document_id = Long.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(stickerset=stickerset, thumb=thumb, thumb_document_id=thumb_document_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetStickerSetThumb, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        thumb, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        thumb_document_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(stickerset=stickerset, thumb=thumb, thumb_document_id=thumb_document_id), cursor
+
+
+class CheckShortName(TLRequest[bool]):
+    __tl_id__ = 0x284b3639
+    __tl_name__ = "functions.stickers.CheckShortName"
+    __tl_layer__ = 133
+
+    __slots__ = ("short_name", )
+
+    def __init__(self, *, short_name: str):
+        self.short_name = short_name
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.short_name)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckShortName:
+        short_name = String.read(stream)
+        return cls(short_name=short_name)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckShortName, int]:
+        short_name, cursor = String.read_from(view, cursor)
+        return cls(short_name=short_name), cursor
+
+
+class SuggestShortName(TLRequest[tl.types.stickers.SuggestedShortName]):
+    __tl_id__ = 0x4dafc503
+    __tl_name__ = "functions.stickers.SuggestShortName"
+    __tl_layer__ = 133
+
+    __slots__ = ("title", )
+
+    def __init__(self, *, title: str):
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SuggestShortName:
+        title = String.read(stream)
+        return cls(title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SuggestShortName, int]:
+        title, cursor = String.read_from(view, cursor)
+        return cls(title=title), cursor
+
+
+class ChangeSticker(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0xf5537ebc
+    __tl_name__ = "functions.stickers.ChangeSticker"
+    __tl_layer__ = 153
+
+    __slots__ = ("sticker", "emoji", "mask_coords", "keywords", )
+
+    def __init__(self, *, sticker: tl.base.InputDocument, emoji: str | None = None, mask_coords: tl.types.MaskCoords | None = None, keywords: str | None = None):
+        self.sticker = sticker
+        self.emoji = emoji
+        self.mask_coords = mask_coords
+        self.keywords = keywords
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.emoji is not None: flags1 |= (1 << 0)
+        if self.mask_coords is not None: flags1 |= (1 << 1)
+        if self.keywords is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.sticker.write_to(out, ctx)
+        if self.emoji is not None:
+            String.write_to(out, self.emoji)
+        if self.mask_coords is not None:
+            self.mask_coords.write_to(out, ctx)
+        if self.keywords is not None:
+            String.write_to(out, self.keywords)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChangeSticker:
+        flags1 = Int.read(stream)
+        sticker = TLObject.read(stream)
+        emoji = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        mask_coords = tl.types.MaskCoords.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        keywords = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(sticker=sticker, emoji=emoji, mask_coords=mask_coords, keywords=keywords)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChangeSticker, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        sticker, cursor = TLObject.read_from(view, cursor)
+        emoji, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        mask_coords, cursor = tl.types.MaskCoords.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        keywords, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(sticker=sticker, emoji=emoji, mask_coords=mask_coords, keywords=keywords), cursor
+
+
+class RenameStickerSet(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0x124b1c00
+    __tl_name__ = "functions.stickers.RenameStickerSet"
+    __tl_layer__ = 153
+
+    __slots__ = ("stickerset", "title", )
+
+    def __init__(self, *, stickerset: tl.base.InputStickerSet, title: str):
+        self.stickerset = stickerset
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stickerset.write_to(out, ctx)
+        String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RenameStickerSet:
+        stickerset = TLObject.read(stream)
+        title = String.read(stream)
+        return cls(stickerset=stickerset, title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RenameStickerSet, int]:
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        return cls(stickerset=stickerset, title=title), cursor
+
+
+class DeleteStickerSet(TLRequest[bool]):
+    __tl_id__ = 0x87704394
+    __tl_name__ = "functions.stickers.DeleteStickerSet"
+    __tl_layer__ = 153
+
+    __slots__ = ("stickerset", )
+
+    def __init__(self, *, stickerset: tl.base.InputStickerSet):
+        self.stickerset = stickerset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stickerset.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteStickerSet:
+        stickerset = TLObject.read(stream)
+        return cls(stickerset=stickerset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteStickerSet, int]:
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        return cls(stickerset=stickerset), cursor
+
+
+class ReplaceSticker(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0x4696459a
+    __tl_name__ = "functions.stickers.ReplaceSticker"
+    __tl_layer__ = 177
+
+    __slots__ = ("sticker", "new_sticker", )
+
+    def __init__(self, *, sticker: tl.base.InputDocument, new_sticker: tl.base.InputStickerSetItem):
+        self.sticker = sticker
+        self.new_sticker = new_sticker
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.sticker.write_to(out, ctx)
+        self.new_sticker.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReplaceSticker:
+        sticker = TLObject.read(stream)
+        new_sticker = TLObject.read(stream)
+        return cls(sticker=sticker, new_sticker=new_sticker)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReplaceSticker, int]:
+        sticker, cursor = TLObject.read_from(view, cursor)
+        new_sticker, cursor = TLObject.read_from(view, cursor)
+        return cls(sticker=sticker, new_sticker=new_sticker), cursor
+
+
+class SetStickerSetThumb_133(TLRequest[tl.base.messages.StickerSet]):
+    __tl_id__ = 0x9a364e30
+    __tl_name__ = "functions.stickers.SetStickerSetThumb_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("stickerset", "thumb", )
+
+    def __init__(self, *, stickerset: tl.base.InputStickerSet, thumb: tl.base.InputDocument):
+        self.stickerset = stickerset
+        self.thumb = thumb
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stickerset.write_to(out, ctx)
+        self.thumb.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetStickerSetThumb_133:
+        stickerset = TLObject.read(stream)
+        thumb = TLObject.read(stream)
+        return cls(stickerset=stickerset, thumb=thumb)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetStickerSetThumb_133, int]:
+        stickerset, cursor = TLObject.read_from(view, cursor)
+        thumb, cursor = TLObject.read_from(view, cursor)
+        return cls(stickerset=stickerset, thumb=thumb), cursor
@@ -0,0 +1,1904 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class CanSendStory(TLRequest[bool]):
+    __tl_id__ = 0xc7dfdfdd
+    __tl_name__ = "functions.stories.CanSendStory"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CanSendStory:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CanSendStory, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class SendStory(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xe4e6694b
+    __tl_name__ = "functions.stories.SendStory"
+    __tl_layer__ = 167
+
+    __slots__ = ("pinned", "noforwards", "fwd_modified", "peer", "media", "media_areas", "caption", "entities", "privacy_rules", "random_id", "period", "fwd_from_id", "fwd_from_story", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, privacy_rules: list[tl.base.InputPrivacyRule], random_id: int, pinned: bool = False, noforwards: bool = False, fwd_modified: bool = False, media_areas: list[tl.base.MediaArea] | None = None, caption: str | None = None, entities: list[tl.base.MessageEntity] | None = None, period: int | None = None, fwd_from_id: tl.base.InputPeer | None = None, fwd_from_story: int | None = None):
+        self.pinned = pinned
+        self.noforwards = noforwards
+        self.fwd_modified = fwd_modified
+        self.peer = peer
+        self.media = media
+        self.media_areas = media_areas
+        self.caption = caption
+        self.entities = entities
+        self.privacy_rules = privacy_rules
+        self.random_id = random_id
+        self.period = period
+        self.fwd_from_id = fwd_from_id
+        self.fwd_from_story = fwd_from_story
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.fwd_from_id is None, self.fwd_from_story is None)
+        _flags_fields_not_empty = (self.fwd_from_id is not None, self.fwd_from_story is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: fwd_from_id, fwd_from_story")
+        flags1 = 0
+        if self.pinned: flags1 |= (1 << 2)
+        if self.noforwards: flags1 |= (1 << 4)
+        if self.fwd_modified: flags1 |= (1 << 7)
+        if self.media_areas: flags1 |= (1 << 5)
+        if self.caption is not None: flags1 |= (1 << 0)
+        if self.entities: flags1 |= (1 << 1)
+        if self.period is not None: flags1 |= (1 << 3)
+        if self.fwd_from_id is not None: flags1 |= (1 << 6)
+        if self.fwd_from_story is not None: flags1 |= (1 << 6)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.media.write_to(out, ctx)
+        if self.media_areas:
+            TLObjectVector.write_to(out, self.media_areas, ctx)
+        if self.caption is not None:
+            String.write_to(out, self.caption)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        TLObjectVector.write_to(out, self.privacy_rules, ctx)
+        out += Long.write(self.random_id)
+        if self.period is not None:
+            out += Int.write(self.period)
+        if self.fwd_from_id is not None:
+            self.fwd_from_id.write_to(out, ctx)
+        if self.fwd_from_story is not None:
+            out += Int.write(self.fwd_from_story)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendStory:
+        flags1 = Int.read(stream)
+        pinned = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 4)) == (1 << 4)
+        fwd_modified = (flags1 & (1 << 7)) == (1 << 7)
+        peer = TLObject.read(stream)
+        media = TLObject.read(stream)
+        media_areas = TLObjectVector.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        caption = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        privacy_rules = TLObjectVector.read(stream)
+        random_id = Long.read(stream)
+        period = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        fwd_from_id = TLObject.read(stream) if (flags1 & (1 << 6)) == (1 << 6) else None
+        fwd_from_story = Int.read(stream) if (flags1 & (1 << 6)) == (1 << 6) else None
+        return cls(pinned=pinned, noforwards=noforwards, fwd_modified=fwd_modified, peer=peer, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules, random_id=random_id, period=period, fwd_from_id=fwd_from_id, fwd_from_story=fwd_from_story)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendStory, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pinned = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 4)) == (1 << 4)
+        fwd_modified = (flags1 & (1 << 7)) == (1 << 7)
+        peer, cursor = TLObject.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        media_areas, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        caption, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        privacy_rules, cursor = TLObjectVector.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        fwd_from_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 6)) == (1 << 6) else (None, cursor)
+        fwd_from_story, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 6)) == (1 << 6) else (None, cursor)
+        return cls(pinned=pinned, noforwards=noforwards, fwd_modified=fwd_modified, peer=peer, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules, random_id=random_id, period=period, fwd_from_id=fwd_from_id, fwd_from_story=fwd_from_story), cursor
+
+
+class EditStory(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xb583ba46
+    __tl_name__ = "functions.stories.EditStory"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "id", "media", "media_areas", "caption", "entities", "privacy_rules", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, media: tl.base.InputMedia | None = None, media_areas: list[tl.base.MediaArea] | None = None, caption: str | None = None, entities: list[tl.base.MessageEntity] | None = None, privacy_rules: list[tl.base.InputPrivacyRule] | None = None):
+        self.peer = peer
+        self.id = id
+        self.media = media
+        self.media_areas = media_areas
+        self.caption = caption
+        self.entities = entities
+        self.privacy_rules = privacy_rules
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.caption is None, self.entities is None)
+        _flags_fields_not_empty = (self.caption is not None, self.entities is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: caption, entities")
+        flags1 = 0
+        if self.media is not None: flags1 |= (1 << 0)
+        if self.media_areas: flags1 |= (1 << 3)
+        if self.caption is not None: flags1 |= (1 << 1)
+        if self.entities: flags1 |= (1 << 1)
+        if self.privacy_rules: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        if self.media is not None:
+            self.media.write_to(out, ctx)
+        if self.media_areas:
+            TLObjectVector.write_to(out, self.media_areas, ctx)
+        if self.caption is not None:
+            String.write_to(out, self.caption)
+        if self.entities is not None:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.privacy_rules:
+            TLObjectVector.write_to(out, self.privacy_rules, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditStory:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        media = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        media_areas = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        caption = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        privacy_rules = TLObjectVector.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(peer=peer, id=id, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditStory, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        media_areas, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        caption, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        privacy_rules, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(peer=peer, id=id, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules), cursor
+
+
+class DeleteStories(TLRequest[list[int]]):
+    __tl_id__ = 0xae59db5f
+    __tl_name__ = "functions.stories.DeleteStories"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteStories:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteStories, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class TogglePinned(TLRequest[list[int]]):
+    __tl_id__ = 0x9a75a1ef
+    __tl_name__ = "functions.stories.TogglePinned"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "id", "pinned", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int], pinned: bool):
+        self.peer = peer
+        self.id = id
+        self.pinned = pinned
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        out += Bool.write(self.pinned)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TogglePinned:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        pinned = Bool.read(stream)
+        return cls(peer=peer, id=id, pinned=pinned)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TogglePinned, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        pinned, cursor = Bool.read_from(view, cursor)
+        return cls(peer=peer, id=id, pinned=pinned), cursor
+
+
+class GetAllStories(TLRequest[tl.base.stories.AllStories]):
+    __tl_id__ = 0xeeb0d625
+    __tl_name__ = "functions.stories.GetAllStories"
+    __tl_layer__ = 160
+
+    __slots__ = ("next", "hidden", "state", )
+
+    def __init__(self, *, next: bool = False, hidden: bool = False, state: str | None = None):
+        self.next = next
+        self.hidden = hidden
+        self.state = state
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next: flags1 |= (1 << 1)
+        if self.hidden: flags1 |= (1 << 2)
+        if self.state is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.state is not None:
+            String.write_to(out, self.state)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAllStories:
+        flags1 = Int.read(stream)
+        next = (flags1 & (1 << 1)) == (1 << 1)
+        hidden = (flags1 & (1 << 2)) == (1 << 2)
+        state = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(next=next, hidden=hidden, state=state)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAllStories, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        next = (flags1 & (1 << 1)) == (1 << 1)
+        hidden = (flags1 & (1 << 2)) == (1 << 2)
+        state, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(next=next, hidden=hidden, state=state), cursor
+
+
+class GetPinnedStories(TLRequest[tl.base.stories.Stories]):
+    __tl_id__ = 0x5821a5dc
+    __tl_name__ = "functions.stories.GetPinnedStories"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "offset_id", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset_id: int, limit: int):
+        self.peer = peer
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPinnedStories:
+        peer = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(peer=peer, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPinnedStories, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, offset_id=offset_id, limit=limit), cursor
+
+
+class GetStoriesArchive(TLRequest[tl.base.stories.Stories]):
+    __tl_id__ = 0xb4352016
+    __tl_name__ = "functions.stories.GetStoriesArchive"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "offset_id", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset_id: int, limit: int):
+        self.peer = peer
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoriesArchive:
+        peer = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(peer=peer, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoriesArchive, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, offset_id=offset_id, limit=limit), cursor
+
+
+class GetStoriesByID(TLRequest[tl.base.stories.Stories]):
+    __tl_id__ = 0x5774ca74
+    __tl_name__ = "functions.stories.GetStoriesByID"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoriesByID:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoriesByID, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class ToggleAllStoriesHidden(TLRequest[bool]):
+    __tl_id__ = 0x7c2557c4
+    __tl_name__ = "functions.stories.ToggleAllStoriesHidden"
+    __tl_layer__ = 160
+
+    __slots__ = ("hidden", )
+
+    def __init__(self, *, hidden: bool):
+        self.hidden = hidden
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Bool.write(self.hidden)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ToggleAllStoriesHidden:
+        hidden = Bool.read(stream)
+        return cls(hidden=hidden)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ToggleAllStoriesHidden, int]:
+        hidden, cursor = Bool.read_from(view, cursor)
+        return cls(hidden=hidden), cursor
+
+
+class ReadStories(TLRequest[list[int]]):
+    __tl_id__ = 0xa556dac8
+    __tl_name__ = "functions.stories.ReadStories"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "max_id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, max_id: int):
+        self.peer = peer
+        self.max_id = max_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.max_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadStories:
+        peer = TLObject.read(stream)
+        max_id = Int.read(stream)
+        return cls(peer=peer, max_id=max_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadStories, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, max_id=max_id), cursor
+
+
+class IncrementStoryViews(TLRequest[bool]):
+    __tl_id__ = 0xb2028afb
+    __tl_name__ = "functions.stories.IncrementStoryViews"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> IncrementStoryViews:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[IncrementStoryViews, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class GetStoryViewsList(TLRequest[tl.base.stories.StoryViewsList]):
+    __tl_id__ = 0x7ed23c57
+    __tl_name__ = "functions.stories.GetStoryViewsList"
+    __tl_layer__ = 164
+
+    __slots__ = ("just_contacts", "reactions_first", "forwards_first", "peer", "q", "id", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, offset: str, limit: int, just_contacts: bool = False, reactions_first: bool = False, forwards_first: bool = False, q: str | None = None):
+        self.just_contacts = just_contacts
+        self.reactions_first = reactions_first
+        self.forwards_first = forwards_first
+        self.peer = peer
+        self.q = q
+        self.id = id
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.just_contacts: flags1 |= (1 << 0)
+        if self.reactions_first: flags1 |= (1 << 2)
+        if self.forwards_first: flags1 |= (1 << 3)
+        if self.q is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        if self.q is not None:
+            String.write_to(out, self.q)
+        out += Int.write(self.id)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoryViewsList:
+        flags1 = Int.read(stream)
+        just_contacts = (flags1 & (1 << 0)) == (1 << 0)
+        reactions_first = (flags1 & (1 << 2)) == (1 << 2)
+        forwards_first = (flags1 & (1 << 3)) == (1 << 3)
+        peer = TLObject.read(stream)
+        q = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        id = Int.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(just_contacts=just_contacts, reactions_first=reactions_first, forwards_first=forwards_first, peer=peer, q=q, id=id, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoryViewsList, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        just_contacts = (flags1 & (1 << 0)) == (1 << 0)
+        reactions_first = (flags1 & (1 << 2)) == (1 << 2)
+        forwards_first = (flags1 & (1 << 3)) == (1 << 3)
+        peer, cursor = TLObject.read_from(view, cursor)
+        q, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(just_contacts=just_contacts, reactions_first=reactions_first, forwards_first=forwards_first, peer=peer, q=q, id=id, offset=offset, limit=limit), cursor
+
+
+class GetStoriesViews(TLRequest[tl.types.stories.StoryViews]):
+    __tl_id__ = 0x28e16cc8
+    __tl_name__ = "functions.stories.GetStoriesViews"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoriesViews:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoriesViews, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class ExportStoryLink(TLRequest[tl.types.ExportedStoryLink]):
+    __tl_id__ = 0x7b8def20
+    __tl_name__ = "functions.stories.ExportStoryLink"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportStoryLink:
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportStoryLink, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class Report(TLRequest[tl.base.ReportResult]):
+    __tl_id__ = 0x19d8eb45
+    __tl_name__ = "functions.stories.Report"
+    __tl_layer__ = 189
+
+    __slots__ = ("peer", "id", "option", "message", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int], option: bytes, message: str):
+        self.peer = peer
+        self.id = id
+        self.option = option
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        Bytes.write_to(out, self.option)
+        String.write_to(out, self.message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Report:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        option = Bytes.read(stream)
+        message = String.read(stream)
+        return cls(peer=peer, id=id, option=option, message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Report, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        option, cursor = Bytes.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, id=id, option=option, message=message), cursor
+
+
+class ActivateStealthMode(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x57bbd166
+    __tl_name__ = "functions.stories.ActivateStealthMode"
+    __tl_layer__ = 161
+
+    __slots__ = ("past", "future", )
+
+    def __init__(self, *, past: bool = False, future: bool = False):
+        self.past = past
+        self.future = future
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.past: flags1 |= (1 << 0)
+        if self.future: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ActivateStealthMode:
+        flags1 = Int.read(stream)
+        past = (flags1 & (1 << 0)) == (1 << 0)
+        future = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(past=past, future=future)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ActivateStealthMode, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        past = (flags1 & (1 << 0)) == (1 << 0)
+        future = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(past=past, future=future), cursor
+
+
+class SendReaction(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x7fd736b2
+    __tl_name__ = "functions.stories.SendReaction"
+    __tl_layer__ = 164
+
+    __slots__ = ("add_to_recent", "peer", "story_id", "reaction", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, story_id: int, reaction: tl.base.Reaction, add_to_recent: bool = False):
+        self.add_to_recent = add_to_recent
+        self.peer = peer
+        self.story_id = story_id
+        self.reaction = reaction
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.add_to_recent: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.story_id)
+        self.reaction.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendReaction:
+        flags1 = Int.read(stream)
+        add_to_recent = (flags1 & (1 << 0)) == (1 << 0)
+        peer = TLObject.read(stream)
+        story_id = Int.read(stream)
+        reaction = TLObject.read(stream)
+        return cls(add_to_recent=add_to_recent, peer=peer, story_id=story_id, reaction=reaction)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendReaction, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        add_to_recent = (flags1 & (1 << 0)) == (1 << 0)
+        peer, cursor = TLObject.read_from(view, cursor)
+        story_id, cursor = Int.read_from(view, cursor)
+        reaction, cursor = TLObject.read_from(view, cursor)
+        return cls(add_to_recent=add_to_recent, peer=peer, story_id=story_id, reaction=reaction), cursor
+
+
+class GetPeerStories(TLRequest[tl.types.stories.PeerStories]):
+    __tl_id__ = 0x2c4ada50
+    __tl_name__ = "functions.stories.GetPeerStories"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPeerStories:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPeerStories, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class GetAllReadPeerStories(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x9b5ae7f9
+    __tl_name__ = "functions.stories.GetAllReadPeerStories"
+    __tl_layer__ = 164
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAllReadPeerStories:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAllReadPeerStories, int]:
+        return cls(), cursor
+
+
+class GetPeerMaxIDs(TLRequest[list[int]]):
+    __tl_id__ = 0x535983c3
+    __tl_name__ = "functions.stories.GetPeerMaxIDs"
+    __tl_layer__ = 164
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[tl.base.InputPeer]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPeerMaxIDs:
+        id = TLObjectVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPeerMaxIDs, int]:
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetChatsToSend(TLRequest[tl.base.messages.Chats]):
+    __tl_id__ = 0xa56a8b60
+    __tl_name__ = "functions.stories.GetChatsToSend"
+    __tl_layer__ = 164
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChatsToSend:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChatsToSend, int]:
+        return cls(), cursor
+
+
+class TogglePeerStoriesHidden(TLRequest[bool]):
+    __tl_id__ = 0xbd0415c4
+    __tl_name__ = "functions.stories.TogglePeerStoriesHidden"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "hidden", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, hidden: bool):
+        self.peer = peer
+        self.hidden = hidden
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += Bool.write(self.hidden)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TogglePeerStoriesHidden:
+        peer = TLObject.read(stream)
+        hidden = Bool.read(stream)
+        return cls(peer=peer, hidden=hidden)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TogglePeerStoriesHidden, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        hidden, cursor = Bool.read_from(view, cursor)
+        return cls(peer=peer, hidden=hidden), cursor
+
+
+class GetStoryReactionsList(TLRequest[tl.types.stories.StoryReactionsList]):
+    __tl_id__ = 0xb9b2881f
+    __tl_name__ = "functions.stories.GetStoryReactionsList"
+    __tl_layer__ = 168
+
+    __slots__ = ("forwards_first", "peer", "id", "reaction", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: int, limit: int, forwards_first: bool = False, reaction: tl.base.Reaction | None = None, offset: str | None = None):
+        self.forwards_first = forwards_first
+        self.peer = peer
+        self.id = id
+        self.reaction = reaction
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.forwards_first: flags1 |= (1 << 2)
+        if self.reaction is not None: flags1 |= (1 << 0)
+        if self.offset is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        out += Int.write(self.id)
+        if self.reaction is not None:
+            self.reaction.write_to(out, ctx)
+        if self.offset is not None:
+            String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoryReactionsList:
+        flags1 = Int.read(stream)
+        forwards_first = (flags1 & (1 << 2)) == (1 << 2)
+        peer = TLObject.read(stream)
+        id = Int.read(stream)
+        reaction = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        offset = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        limit = Int.read(stream)
+        return cls(forwards_first=forwards_first, peer=peer, id=id, reaction=reaction, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoryReactionsList, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        forwards_first = (flags1 & (1 << 2)) == (1 << 2)
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        reaction, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(forwards_first=forwards_first, peer=peer, id=id, reaction=reaction, offset=offset, limit=limit), cursor
+
+
+class TogglePinnedToTop(TLRequest[bool]):
+    __tl_id__ = 0xb297e9b
+    __tl_name__ = "functions.stories.TogglePinnedToTop"
+    __tl_layer__ = 179
+
+    __slots__ = ("peer", "id", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int]):
+        self.peer = peer
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TogglePinnedToTop:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(peer=peer, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TogglePinnedToTop, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(peer=peer, id=id), cursor
+
+
+class SearchPosts(TLRequest[tl.types.stories.FoundStories]):
+    __tl_id__ = 0xd1810907
+    __tl_name__ = "functions.stories.SearchPosts"
+    __tl_layer__ = 192
+
+    __slots__ = ("hashtag", "area", "peer", "offset", "limit", )
+
+    def __init__(self, *, offset: str, limit: int, hashtag: str | None = None, area: tl.base.MediaArea | None = None, peer: tl.base.InputPeer | None = None):
+        self.hashtag = hashtag
+        self.area = area
+        self.peer = peer
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.hashtag is not None: flags1 |= (1 << 0)
+        if self.area is not None: flags1 |= (1 << 1)
+        if self.peer is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.hashtag is not None:
+            String.write_to(out, self.hashtag)
+        if self.area is not None:
+            self.area.write_to(out, ctx)
+        if self.peer is not None:
+            self.peer.write_to(out, ctx)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchPosts:
+        flags1 = Int.read(stream)
+        hashtag = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        area = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        peer = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(hashtag=hashtag, area=area, peer=peer, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchPosts, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        hashtag, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        area, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        peer, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(hashtag=hashtag, area=area, peer=peer, offset=offset, limit=limit), cursor
+
+
+class SendStory_160(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x424cd47a
+    __tl_name__ = "functions.stories.SendStory_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("pinned", "noforwards", "media", "caption", "entities", "privacy_rules", "random_id", "period", )
+
+    def __init__(self, *, media: tl.base.InputMedia, privacy_rules: list[tl.base.InputPrivacyRule], random_id: int, pinned: bool = False, noforwards: bool = False, caption: str | None = None, entities: list[tl.base.MessageEntity] | None = None, period: int | None = None):
+        self.pinned = pinned
+        self.noforwards = noforwards
+        self.media = media
+        self.caption = caption
+        self.entities = entities
+        self.privacy_rules = privacy_rules
+        self.random_id = random_id
+        self.period = period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pinned: flags1 |= (1 << 2)
+        if self.noforwards: flags1 |= (1 << 4)
+        if self.caption is not None: flags1 |= (1 << 0)
+        if self.entities: flags1 |= (1 << 1)
+        if self.period is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        self.media.write_to(out, ctx)
+        if self.caption is not None:
+            String.write_to(out, self.caption)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        TLObjectVector.write_to(out, self.privacy_rules, ctx)
+        out += Long.write(self.random_id)
+        if self.period is not None:
+            out += Int.write(self.period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendStory_160:
+        flags1 = Int.read(stream)
+        pinned = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 4)) == (1 << 4)
+        media = TLObject.read(stream)
+        caption = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        privacy_rules = TLObjectVector.read(stream)
+        random_id = Long.read(stream)
+        period = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(pinned=pinned, noforwards=noforwards, media=media, caption=caption, entities=entities, privacy_rules=privacy_rules, random_id=random_id, period=period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendStory_160, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pinned = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 4)) == (1 << 4)
+        media, cursor = TLObject.read_from(view, cursor)
+        caption, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        privacy_rules, cursor = TLObjectVector.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(pinned=pinned, noforwards=noforwards, media=media, caption=caption, entities=entities, privacy_rules=privacy_rules, random_id=random_id, period=period), cursor
+
+
+class EditStory_160(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x2aae7a41
+    __tl_name__ = "functions.stories.EditStory_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("id", "media", "caption", "entities", "privacy_rules", )
+
+    def __init__(self, *, id: int, media: tl.base.InputMedia | None = None, caption: str | None = None, entities: list[tl.base.MessageEntity] | None = None, privacy_rules: list[tl.base.InputPrivacyRule] | None = None):
+        self.id = id
+        self.media = media
+        self.caption = caption
+        self.entities = entities
+        self.privacy_rules = privacy_rules
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.caption is None, self.entities is None)
+        _flags_fields_not_empty = (self.caption is not None, self.entities is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: caption, entities")
+        flags1 = 0
+        if self.media is not None: flags1 |= (1 << 0)
+        if self.caption is not None: flags1 |= (1 << 1)
+        if self.entities: flags1 |= (1 << 1)
+        if self.privacy_rules: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.id)
+        if self.media is not None:
+            self.media.write_to(out, ctx)
+        if self.caption is not None:
+            String.write_to(out, self.caption)
+        if self.entities is not None:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.privacy_rules:
+            TLObjectVector.write_to(out, self.privacy_rules, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditStory_160:
+        flags1 = Int.read(stream)
+        id = Int.read(stream)
+        media = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        caption = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        privacy_rules = TLObjectVector.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(id=id, media=media, caption=caption, entities=entities, privacy_rules=privacy_rules)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditStory_160, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        caption, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        privacy_rules, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(id=id, media=media, caption=caption, entities=entities, privacy_rules=privacy_rules), cursor
+
+
+class DeleteStories_160(TLRequest[list[int]]):
+    __tl_id__ = 0xb5d501d7
+    __tl_name__ = "functions.stories.DeleteStories_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[int]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeleteStories_160:
+        id = IntVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeleteStories_160, int]:
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class TogglePinned_160(TLRequest[list[int]]):
+    __tl_id__ = 0x51602944
+    __tl_name__ = "functions.stories.TogglePinned_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("id", "pinned", )
+
+    def __init__(self, *, id: list[int], pinned: bool):
+        self.id = id
+        self.pinned = pinned
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.id)
+        out += Bool.write(self.pinned)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TogglePinned_160:
+        id = IntVector.read(stream)
+        pinned = Bool.read(stream)
+        return cls(id=id, pinned=pinned)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TogglePinned_160, int]:
+        id, cursor = IntVector.read_from(view, cursor)
+        pinned, cursor = Bool.read_from(view, cursor)
+        return cls(id=id, pinned=pinned), cursor
+
+
+class GetUserStories_160(TLRequest[tl.types.stories.UserStories_160]):
+    __tl_id__ = 0x96d528e0
+    __tl_name__ = "functions.stories.GetUserStories_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("user_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser):
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUserStories_160:
+        user_id = TLObject.read(stream)
+        return cls(user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUserStories_160, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        return cls(user_id=user_id), cursor
+
+
+class GetPinnedStories_160(TLRequest[tl.base.stories.Stories]):
+    __tl_id__ = 0xb471137
+    __tl_name__ = "functions.stories.GetPinnedStories_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("user_id", "offset_id", "limit", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, offset_id: int, limit: int):
+        self.user_id = user_id
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetPinnedStories_160:
+        user_id = TLObject.read(stream)
+        offset_id = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(user_id=user_id, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetPinnedStories_160, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        offset_id, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(user_id=user_id, offset_id=offset_id, limit=limit), cursor
+
+
+class GetStoriesArchive_160(TLRequest[tl.base.stories.Stories]):
+    __tl_id__ = 0x1f5bc5d2
+    __tl_name__ = "functions.stories.GetStoriesArchive_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("offset_id", "limit", )
+
+    def __init__(self, *, offset_id: int, limit: int):
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoriesArchive_160:
+        offset_id = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoriesArchive_160, int]:
+        offset_id, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(offset_id=offset_id, limit=limit), cursor
+
+
+class GetStoriesByID_160(TLRequest[tl.base.stories.Stories]):
+    __tl_id__ = 0x6a15cf46
+    __tl_name__ = "functions.stories.GetStoriesByID_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("user_id", "id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, id: list[int]):
+        self.user_id = user_id
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoriesByID_160:
+        user_id = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(user_id=user_id, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoriesByID_160, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(user_id=user_id, id=id), cursor
+
+
+class GetAllReadUserStories_160(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x729c562c
+    __tl_name__ = "functions.stories.GetAllReadUserStories_160"
+    __tl_layer__ = 160
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetAllReadUserStories_160:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetAllReadUserStories_160, int]:
+        return cls(), cursor
+
+
+class ReadStories_160(TLRequest[list[int]]):
+    __tl_id__ = 0xedc5105b
+    __tl_name__ = "functions.stories.ReadStories_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("user_id", "max_id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, max_id: int):
+        self.user_id = user_id
+        self.max_id = max_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.max_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReadStories_160:
+        user_id = TLObject.read(stream)
+        max_id = Int.read(stream)
+        return cls(user_id=user_id, max_id=max_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReadStories_160, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor)
+        return cls(user_id=user_id, max_id=max_id), cursor
+
+
+class IncrementStoryViews_160(TLRequest[bool]):
+    __tl_id__ = 0x22126127
+    __tl_name__ = "functions.stories.IncrementStoryViews_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("user_id", "id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, id: list[int]):
+        self.user_id = user_id
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> IncrementStoryViews_160:
+        user_id = TLObject.read(stream)
+        id = IntVector.read(stream)
+        return cls(user_id=user_id, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[IncrementStoryViews_160, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(user_id=user_id, id=id), cursor
+
+
+class GetStoryViewsList_160(TLRequest[tl.base.stories.StoryViewsList]):
+    __tl_id__ = 0x4b3b5e97
+    __tl_name__ = "functions.stories.GetStoryViewsList_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("id", "offset_date", "offset_id", "limit", )
+
+    def __init__(self, *, id: int, offset_date: int, offset_id: int, limit: int):
+        self.id = id
+        self.offset_date = offset_date
+        self.offset_id = offset_id
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.id)
+        out += Int.write(self.offset_date)
+        out += Long.write(self.offset_id)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoryViewsList_160:
+        id = Int.read(stream)
+        offset_date = Int.read(stream)
+        offset_id = Long.read(stream)
+        limit = Int.read(stream)
+        return cls(id=id, offset_date=offset_date, offset_id=offset_id, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoryViewsList_160, int]:
+        id, cursor = Int.read_from(view, cursor)
+        offset_date, cursor = Int.read_from(view, cursor)
+        offset_id, cursor = Long.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(id=id, offset_date=offset_date, offset_id=offset_id, limit=limit), cursor
+
+
+class GetStoriesViews_160(TLRequest[tl.types.stories.StoryViews]):
+    __tl_id__ = 0x9a75d6a6
+    __tl_name__ = "functions.stories.GetStoriesViews_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[int]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoriesViews_160:
+        id = IntVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoriesViews_160, int]:
+        id, cursor = IntVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class ExportStoryLink_160(TLRequest[tl.types.ExportedStoryLink]):
+    __tl_id__ = 0x16e443ce
+    __tl_name__ = "functions.stories.ExportStoryLink_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("user_id", "id", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, id: int):
+        self.user_id = user_id
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportStoryLink_160:
+        user_id = TLObject.read(stream)
+        id = Int.read(stream)
+        return cls(user_id=user_id, id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportStoryLink_160, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        return cls(user_id=user_id, id=id), cursor
+
+
+class Report_160(TLRequest[bool]):
+    __tl_id__ = 0xc95be06a
+    __tl_name__ = "functions.stories.Report_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("user_id", "id", "reason", "message", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, id: list[int], reason: tl.base.ReportReason, message: str):
+        self.user_id = user_id
+        self.id = id
+        self.reason = reason
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.user_id.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        self.reason.write_to(out, ctx)
+        String.write_to(out, self.message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Report_160:
+        user_id = TLObject.read(stream)
+        id = IntVector.read(stream)
+        reason = TLObject.read(stream)
+        message = String.read(stream)
+        return cls(user_id=user_id, id=id, reason=reason, message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Report_160, int]:
+        user_id, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        reason, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        return cls(user_id=user_id, id=id, reason=reason, message=message), cursor
+
+
+class SendStory_161(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xd455fcec
+    __tl_name__ = "functions.stories.SendStory_161"
+    __tl_layer__ = 161
+
+    __slots__ = ("pinned", "noforwards", "media", "media_areas", "caption", "entities", "privacy_rules", "random_id", "period", )
+
+    def __init__(self, *, media: tl.base.InputMedia, privacy_rules: list[tl.base.InputPrivacyRule], random_id: int, pinned: bool = False, noforwards: bool = False, media_areas: list[tl.base.MediaArea] | None = None, caption: str | None = None, entities: list[tl.base.MessageEntity] | None = None, period: int | None = None):
+        self.pinned = pinned
+        self.noforwards = noforwards
+        self.media = media
+        self.media_areas = media_areas
+        self.caption = caption
+        self.entities = entities
+        self.privacy_rules = privacy_rules
+        self.random_id = random_id
+        self.period = period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pinned: flags1 |= (1 << 2)
+        if self.noforwards: flags1 |= (1 << 4)
+        if self.media_areas: flags1 |= (1 << 5)
+        if self.caption is not None: flags1 |= (1 << 0)
+        if self.entities: flags1 |= (1 << 1)
+        if self.period is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        self.media.write_to(out, ctx)
+        if self.media_areas:
+            TLObjectVector.write_to(out, self.media_areas, ctx)
+        if self.caption is not None:
+            String.write_to(out, self.caption)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        TLObjectVector.write_to(out, self.privacy_rules, ctx)
+        out += Long.write(self.random_id)
+        if self.period is not None:
+            out += Int.write(self.period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendStory_161:
+        flags1 = Int.read(stream)
+        pinned = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 4)) == (1 << 4)
+        media = TLObject.read(stream)
+        media_areas = TLObjectVector.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        caption = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        privacy_rules = TLObjectVector.read(stream)
+        random_id = Long.read(stream)
+        period = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(pinned=pinned, noforwards=noforwards, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules, random_id=random_id, period=period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendStory_161, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pinned = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 4)) == (1 << 4)
+        media, cursor = TLObject.read_from(view, cursor)
+        media_areas, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        caption, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        privacy_rules, cursor = TLObjectVector.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(pinned=pinned, noforwards=noforwards, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules, random_id=random_id, period=period), cursor
+
+
+class EditStory_161(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xa9b91ae4
+    __tl_name__ = "functions.stories.EditStory_161"
+    __tl_layer__ = 161
+
+    __slots__ = ("id", "media", "media_areas", "caption", "entities", "privacy_rules", )
+
+    def __init__(self, *, id: int, media: tl.base.InputMedia | None = None, media_areas: list[tl.base.MediaArea] | None = None, caption: str | None = None, entities: list[tl.base.MessageEntity] | None = None, privacy_rules: list[tl.base.InputPrivacyRule] | None = None):
+        self.id = id
+        self.media = media
+        self.media_areas = media_areas
+        self.caption = caption
+        self.entities = entities
+        self.privacy_rules = privacy_rules
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.caption is None, self.entities is None)
+        _flags_fields_not_empty = (self.caption is not None, self.entities is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: caption, entities")
+        flags1 = 0
+        if self.media is not None: flags1 |= (1 << 0)
+        if self.media_areas: flags1 |= (1 << 3)
+        if self.caption is not None: flags1 |= (1 << 1)
+        if self.entities: flags1 |= (1 << 1)
+        if self.privacy_rules: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.id)
+        if self.media is not None:
+            self.media.write_to(out, ctx)
+        if self.media_areas:
+            TLObjectVector.write_to(out, self.media_areas, ctx)
+        if self.caption is not None:
+            String.write_to(out, self.caption)
+        if self.entities is not None:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.privacy_rules:
+            TLObjectVector.write_to(out, self.privacy_rules, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EditStory_161:
+        flags1 = Int.read(stream)
+        id = Int.read(stream)
+        media = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        media_areas = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        caption = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        privacy_rules = TLObjectVector.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(id=id, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EditStory_161, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        media_areas, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        caption, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        privacy_rules, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(id=id, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules), cursor
+
+
+class GetStoryViewsList_161(TLRequest[tl.base.stories.StoryViewsList]):
+    __tl_id__ = 0xf95f61a4
+    __tl_name__ = "functions.stories.GetStoryViewsList_161"
+    __tl_layer__ = 161
+
+    __slots__ = ("just_contacts", "reactions_first", "q", "id", "offset", "limit", )
+
+    def __init__(self, *, id: int, offset: str, limit: int, just_contacts: bool = False, reactions_first: bool = False, q: str | None = None):
+        self.just_contacts = just_contacts
+        self.reactions_first = reactions_first
+        self.q = q
+        self.id = id
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.just_contacts: flags1 |= (1 << 0)
+        if self.reactions_first: flags1 |= (1 << 2)
+        if self.q is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.q is not None:
+            String.write_to(out, self.q)
+        out += Int.write(self.id)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoryViewsList_161:
+        flags1 = Int.read(stream)
+        just_contacts = (flags1 & (1 << 0)) == (1 << 0)
+        reactions_first = (flags1 & (1 << 2)) == (1 << 2)
+        q = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        id = Int.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(just_contacts=just_contacts, reactions_first=reactions_first, q=q, id=id, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoryViewsList_161, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        just_contacts = (flags1 & (1 << 0)) == (1 << 0)
+        reactions_first = (flags1 & (1 << 2)) == (1 << 2)
+        q, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(just_contacts=just_contacts, reactions_first=reactions_first, q=q, id=id, offset=offset, limit=limit), cursor
+
+
+class SendReaction_161(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0x49aaa9b3
+    __tl_name__ = "functions.stories.SendReaction_161"
+    __tl_layer__ = 161
+
+    __slots__ = ("add_to_recent", "user_id", "story_id", "reaction", )
+
+    def __init__(self, *, user_id: tl.base.InputUser, story_id: int, reaction: tl.base.Reaction, add_to_recent: bool = False):
+        self.add_to_recent = add_to_recent
+        self.user_id = user_id
+        self.story_id = story_id
+        self.reaction = reaction
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.add_to_recent: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.user_id.write_to(out, ctx)
+        out += Int.write(self.story_id)
+        self.reaction.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendReaction_161:
+        flags1 = Int.read(stream)
+        add_to_recent = (flags1 & (1 << 0)) == (1 << 0)
+        user_id = TLObject.read(stream)
+        story_id = Int.read(stream)
+        reaction = TLObject.read(stream)
+        return cls(add_to_recent=add_to_recent, user_id=user_id, story_id=story_id, reaction=reaction)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendReaction_161, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        add_to_recent = (flags1 & (1 << 0)) == (1 << 0)
+        user_id, cursor = TLObject.read_from(view, cursor)
+        story_id, cursor = Int.read_from(view, cursor)
+        reaction, cursor = TLObject.read_from(view, cursor)
+        return cls(add_to_recent=add_to_recent, user_id=user_id, story_id=story_id, reaction=reaction), cursor
+
+
+class CanSendStory_162(TLRequest[bool]):
+    __tl_id__ = 0xb100d45d
+    __tl_name__ = "functions.stories.CanSendStory_162"
+    __tl_layer__ = 162
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CanSendStory_162:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CanSendStory_162, int]:
+        return cls(), cursor
+
+
+class SendStory_164(TLRequest[tl.base.Updates]):
+    __tl_id__ = 0xbcb73644
+    __tl_name__ = "functions.stories.SendStory_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("pinned", "noforwards", "peer", "media", "media_areas", "caption", "entities", "privacy_rules", "random_id", "period", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, media: tl.base.InputMedia, privacy_rules: list[tl.base.InputPrivacyRule], random_id: int, pinned: bool = False, noforwards: bool = False, media_areas: list[tl.base.MediaArea] | None = None, caption: str | None = None, entities: list[tl.base.MessageEntity] | None = None, period: int | None = None):
+        self.pinned = pinned
+        self.noforwards = noforwards
+        self.peer = peer
+        self.media = media
+        self.media_areas = media_areas
+        self.caption = caption
+        self.entities = entities
+        self.privacy_rules = privacy_rules
+        self.random_id = random_id
+        self.period = period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pinned: flags1 |= (1 << 2)
+        if self.noforwards: flags1 |= (1 << 4)
+        if self.media_areas: flags1 |= (1 << 5)
+        if self.caption is not None: flags1 |= (1 << 0)
+        if self.entities: flags1 |= (1 << 1)
+        if self.period is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        self.media.write_to(out, ctx)
+        if self.media_areas:
+            TLObjectVector.write_to(out, self.media_areas, ctx)
+        if self.caption is not None:
+            String.write_to(out, self.caption)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        TLObjectVector.write_to(out, self.privacy_rules, ctx)
+        out += Long.write(self.random_id)
+        if self.period is not None:
+            out += Int.write(self.period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendStory_164:
+        flags1 = Int.read(stream)
+        pinned = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 4)) == (1 << 4)
+        peer = TLObject.read(stream)
+        media = TLObject.read(stream)
+        media_areas = TLObjectVector.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        caption = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        privacy_rules = TLObjectVector.read(stream)
+        random_id = Long.read(stream)
+        period = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(pinned=pinned, noforwards=noforwards, peer=peer, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules, random_id=random_id, period=period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendStory_164, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pinned = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 4)) == (1 << 4)
+        peer, cursor = TLObject.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor)
+        media_areas, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        caption, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        privacy_rules, cursor = TLObjectVector.read_from(view, cursor)
+        random_id, cursor = Long.read_from(view, cursor)
+        period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(pinned=pinned, noforwards=noforwards, peer=peer, media=media, media_areas=media_areas, caption=caption, entities=entities, privacy_rules=privacy_rules, random_id=random_id, period=period), cursor
+
+
+class Report_164(TLRequest[bool]):
+    __tl_id__ = 0x1923fa8c
+    __tl_name__ = "functions.stories.Report_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "id", "reason", "message", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, id: list[int], reason: tl.base.ReportReason, message: str):
+        self.peer = peer
+        self.id = id
+        self.reason = reason
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        out += IntVector.write(self.id)
+        self.reason.write_to(out, ctx)
+        String.write_to(out, self.message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Report_164:
+        peer = TLObject.read(stream)
+        id = IntVector.read(stream)
+        reason = TLObject.read(stream)
+        message = String.read(stream)
+        return cls(peer=peer, id=id, reason=reason, message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Report_164, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        id, cursor = IntVector.read_from(view, cursor)
+        reason, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        return cls(peer=peer, id=id, reason=reason, message=message), cursor
+
+
+class GetBoostsStatus_164(TLRequest[tl.base.stories.BoostsStatus]):
+    __tl_id__ = 0x4c449472
+    __tl_name__ = "functions.stories.GetBoostsStatus_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBoostsStatus_164:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBoostsStatus_164, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class GetBoostersList_164(TLRequest[tl.types.stories.BoostersList_164]):
+    __tl_id__ = 0x337ef980
+    __tl_name__ = "functions.stories.GetBoostersList_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", "offset", "limit", )
+
+    def __init__(self, *, peer: tl.base.InputPeer, offset: str, limit: int):
+        self.peer = peer
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetBoostersList_164:
+        peer = TLObject.read(stream)
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(peer=peer, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetBoostersList_164, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(peer=peer, offset=offset, limit=limit), cursor
+
+
+class CanApplyBoost_164(TLRequest[tl.base.stories.CanApplyBoostResult]):
+    __tl_id__ = 0xdb05c1bd
+    __tl_name__ = "functions.stories.CanApplyBoost_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CanApplyBoost_164:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CanApplyBoost_164, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class ApplyBoost_164(TLRequest[bool]):
+    __tl_id__ = 0xf29d7c2b
+    __tl_name__ = "functions.stories.ApplyBoost_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("peer", )
+
+    def __init__(self, *, peer: tl.base.InputPeer):
+        self.peer = peer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ApplyBoost_164:
+        peer = TLObject.read(stream)
+        return cls(peer=peer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ApplyBoost_164, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        return cls(peer=peer), cursor
+
+
+class SearchPosts_182(TLRequest[tl.types.stories.FoundStories]):
+    __tl_id__ = 0x6cea116a
+    __tl_name__ = "functions.stories.SearchPosts_182"
+    __tl_layer__ = 182
+
+    __slots__ = ("hashtag", "area", "offset", "limit", )
+
+    def __init__(self, *, offset: str, limit: int, hashtag: str | None = None, area: tl.base.MediaArea | None = None):
+        self.hashtag = hashtag
+        self.area = area
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.hashtag is not None: flags1 |= (1 << 0)
+        if self.area is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.hashtag is not None:
+            String.write_to(out, self.hashtag)
+        if self.area is not None:
+            self.area.write_to(out, ctx)
+        String.write_to(out, self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchPosts_182:
+        flags1 = Int.read(stream)
+        hashtag = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        area = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        offset = String.read(stream)
+        limit = Int.read(stream)
+        return cls(hashtag=hashtag, area=area, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchPosts_182, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        hashtag, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        area, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        offset, cursor = String.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(hashtag=hashtag, area=area, offset=offset, limit=limit), cursor
@@ -0,0 +1,169 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetState(TLRequest[tl.types.updates.State]):
+    __tl_id__ = 0xedd4882a
+    __tl_name__ = "functions.updates.GetState"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetState:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetState, int]:
+        return cls(), cursor
+
+
+class GetDifference(TLRequest[tl.base.updates.Difference]):
+    __tl_id__ = 0x19c2f763
+    __tl_name__ = "functions.updates.GetDifference"
+    __tl_layer__ = 160
+
+    __slots__ = ("pts", "pts_limit", "pts_total_limit", "date", "qts", "qts_limit", )
+
+    def __init__(self, *, pts: int, date: int, qts: int, pts_limit: int | None = None, pts_total_limit: int | None = None, qts_limit: int | None = None):
+        self.pts = pts
+        self.pts_limit = pts_limit
+        self.pts_total_limit = pts_total_limit
+        self.date = date
+        self.qts = qts
+        self.qts_limit = qts_limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pts_limit is not None: flags1 |= (1 << 1)
+        if self.pts_total_limit is not None: flags1 |= (1 << 0)
+        if self.qts_limit is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.pts)
+        if self.pts_limit is not None:
+            out += Int.write(self.pts_limit)
+        if self.pts_total_limit is not None:
+            out += Int.write(self.pts_total_limit)
+        out += Int.write(self.date)
+        out += Int.write(self.qts)
+        if self.qts_limit is not None:
+            out += Int.write(self.qts_limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDifference:
+        flags1 = Int.read(stream)
+        pts = Int.read(stream)
+        pts_limit = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        pts_total_limit = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        date = Int.read(stream)
+        qts = Int.read(stream)
+        qts_limit = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(pts=pts, pts_limit=pts_limit, pts_total_limit=pts_total_limit, date=date, qts=qts, qts_limit=qts_limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDifference, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pts, cursor = Int.read_from(view, cursor)
+        pts_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        pts_total_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        qts, cursor = Int.read_from(view, cursor)
+        qts_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(pts=pts, pts_limit=pts_limit, pts_total_limit=pts_total_limit, date=date, qts=qts, qts_limit=qts_limit), cursor
+
+
+class GetChannelDifference(TLRequest[tl.base.updates.ChannelDifference]):
+    __tl_id__ = 0x3173d78
+    __tl_name__ = "functions.updates.GetChannelDifference"
+    __tl_layer__ = 133
+
+    __slots__ = ("force", "channel", "filter", "pts", "limit", )
+
+    def __init__(self, *, channel: tl.base.InputChannel, filter: tl.base.ChannelMessagesFilter, pts: int, limit: int, force: bool = False):
+        self.force = force
+        self.channel = channel
+        self.filter = filter
+        self.pts = pts
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.force: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.channel.write_to(out, ctx)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.pts)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetChannelDifference:
+        flags1 = Int.read(stream)
+        force = (flags1 & (1 << 0)) == (1 << 0)
+        channel = TLObject.read(stream)
+        filter = TLObject.read(stream)
+        pts = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(force=force, channel=channel, filter=filter, pts=pts, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetChannelDifference, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        force = (flags1 & (1 << 0)) == (1 << 0)
+        channel, cursor = TLObject.read_from(view, cursor)
+        filter, cursor = TLObject.read_from(view, cursor)
+        pts, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(force=force, channel=channel, filter=filter, pts=pts, limit=limit), cursor
+
+
+class GetDifference_133(TLRequest[tl.base.updates.Difference]):
+    __tl_id__ = 0x25939651
+    __tl_name__ = "functions.updates.GetDifference_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("pts", "pts_total_limit", "date", "qts", )
+
+    def __init__(self, *, pts: int, date: int, qts: int, pts_total_limit: int | None = None):
+        self.pts = pts
+        self.pts_total_limit = pts_total_limit
+        self.date = date
+        self.qts = qts
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pts_total_limit is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.pts)
+        if self.pts_total_limit is not None:
+            out += Int.write(self.pts_total_limit)
+        out += Int.write(self.date)
+        out += Int.write(self.qts)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetDifference_133:
+        flags1 = Int.read(stream)
+        pts = Int.read(stream)
+        pts_total_limit = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        date = Int.read(stream)
+        qts = Int.read(stream)
+        return cls(pts=pts, pts_total_limit=pts_total_limit, date=date, qts=qts)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetDifference_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pts, cursor = Int.read_from(view, cursor)
+        pts_total_limit, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        qts, cursor = Int.read_from(view, cursor)
+        return cls(pts=pts, pts_total_limit=pts_total_limit, date=date, qts=qts), cursor
@@ -0,0 +1,402 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class SaveFilePart(TLRequest[bool]):
+    __tl_id__ = 0xb304a621
+    __tl_name__ = "functions.upload.SaveFilePart"
+    __tl_layer__ = 133
+
+    __slots__ = ("file_id", "file_part", "bytes_", )
+
+    def __init__(self, *, file_id: int, file_part: int, bytes_: bytes):
+        self.file_id = file_id
+        self.file_part = file_part
+        self.bytes_ = bytes_
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.file_id)
+        out += Int.write(self.file_part)
+        Bytes.write_to(out, self.bytes_)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveFilePart:
+        file_id = Long.read(stream)
+        file_part = Int.read(stream)
+        bytes_ = Bytes.read(stream)
+        return cls(file_id=file_id, file_part=file_part, bytes_=bytes_)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveFilePart, int]:
+        file_id, cursor = Long.read_from(view, cursor)
+        file_part, cursor = Int.read_from(view, cursor)
+        bytes_, cursor = Bytes.read_from(view, cursor)
+        return cls(file_id=file_id, file_part=file_part, bytes_=bytes_), cursor
+
+
+class GetFile(TLRequest[tl.base.upload.File]):
+    __tl_id__ = 0xbe5335be
+    __tl_name__ = "functions.upload.GetFile"
+    __tl_layer__ = 143
+
+    __slots__ = ("precise", "cdn_supported", "location", "offset", "limit", )
+
+    def __init__(self, *, location: tl.base.InputFileLocation, offset: int, limit: int, precise: bool = False, cdn_supported: bool = False):
+        self.precise = precise
+        self.cdn_supported = cdn_supported
+        self.location = location
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.precise: flags1 |= (1 << 0)
+        if self.cdn_supported: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.location.write_to(out, ctx)
+        out += Long.write(self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFile:
+        flags1 = Int.read(stream)
+        precise = (flags1 & (1 << 0)) == (1 << 0)
+        cdn_supported = (flags1 & (1 << 1)) == (1 << 1)
+        location = TLObject.read(stream)
+        offset = Long.read(stream)
+        limit = Int.read(stream)
+        return cls(precise=precise, cdn_supported=cdn_supported, location=location, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFile, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        precise = (flags1 & (1 << 0)) == (1 << 0)
+        cdn_supported = (flags1 & (1 << 1)) == (1 << 1)
+        location, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = Long.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(precise=precise, cdn_supported=cdn_supported, location=location, offset=offset, limit=limit), cursor
+
+
+class SaveBigFilePart(TLRequest[bool]):
+    __tl_id__ = 0xde7b673d
+    __tl_name__ = "functions.upload.SaveBigFilePart"
+    __tl_layer__ = 133
+
+    __slots__ = ("file_id", "file_part", "file_total_parts", "bytes_", )
+
+    def __init__(self, *, file_id: int, file_part: int, file_total_parts: int, bytes_: bytes):
+        self.file_id = file_id
+        self.file_part = file_part
+        self.file_total_parts = file_total_parts
+        self.bytes_ = bytes_
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.file_id)
+        out += Int.write(self.file_part)
+        out += Int.write(self.file_total_parts)
+        Bytes.write_to(out, self.bytes_)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SaveBigFilePart:
+        file_id = Long.read(stream)
+        file_part = Int.read(stream)
+        file_total_parts = Int.read(stream)
+        bytes_ = Bytes.read(stream)
+        return cls(file_id=file_id, file_part=file_part, file_total_parts=file_total_parts, bytes_=bytes_)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SaveBigFilePart, int]:
+        file_id, cursor = Long.read_from(view, cursor)
+        file_part, cursor = Int.read_from(view, cursor)
+        file_total_parts, cursor = Int.read_from(view, cursor)
+        bytes_, cursor = Bytes.read_from(view, cursor)
+        return cls(file_id=file_id, file_part=file_part, file_total_parts=file_total_parts, bytes_=bytes_), cursor
+
+
+class GetWebFile(TLRequest[tl.types.upload.WebFile]):
+    __tl_id__ = 0x24e6818d
+    __tl_name__ = "functions.upload.GetWebFile"
+    __tl_layer__ = 133
+
+    __slots__ = ("location", "offset", "limit", )
+
+    def __init__(self, *, location: tl.base.InputWebFileLocation, offset: int, limit: int):
+        self.location = location
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.location.write_to(out, ctx)
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetWebFile:
+        location = TLObject.read(stream)
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(location=location, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetWebFile, int]:
+        location, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(location=location, offset=offset, limit=limit), cursor
+
+
+class GetCdnFile(TLRequest[tl.base.upload.CdnFile]):
+    __tl_id__ = 0x395f69da
+    __tl_name__ = "functions.upload.GetCdnFile"
+    __tl_layer__ = 143
+
+    __slots__ = ("file_token", "offset", "limit", )
+
+    def __init__(self, *, file_token: bytes, offset: int, limit: int):
+        self.file_token = file_token
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.file_token)
+        out += Long.write(self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCdnFile:
+        file_token = Bytes.read(stream)
+        offset = Long.read(stream)
+        limit = Int.read(stream)
+        return cls(file_token=file_token, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCdnFile, int]:
+        file_token, cursor = Bytes.read_from(view, cursor)
+        offset, cursor = Long.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(file_token=file_token, offset=offset, limit=limit), cursor
+
+
+class ReuploadCdnFile(TLRequest[list[tl.base.FileHash]]):
+    __tl_id__ = 0x9b2754a8
+    __tl_name__ = "functions.upload.ReuploadCdnFile"
+    __tl_layer__ = 133
+
+    __slots__ = ("file_token", "request_token", )
+
+    def __init__(self, *, file_token: bytes, request_token: bytes):
+        self.file_token = file_token
+        self.request_token = request_token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.file_token)
+        Bytes.write_to(out, self.request_token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReuploadCdnFile:
+        file_token = Bytes.read(stream)
+        request_token = Bytes.read(stream)
+        return cls(file_token=file_token, request_token=request_token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReuploadCdnFile, int]:
+        file_token, cursor = Bytes.read_from(view, cursor)
+        request_token, cursor = Bytes.read_from(view, cursor)
+        return cls(file_token=file_token, request_token=request_token), cursor
+
+
+class GetCdnFileHashes(TLRequest[list[tl.base.FileHash]]):
+    __tl_id__ = 0x91dc3f31
+    __tl_name__ = "functions.upload.GetCdnFileHashes"
+    __tl_layer__ = 143
+
+    __slots__ = ("file_token", "offset", )
+
+    def __init__(self, *, file_token: bytes, offset: int):
+        self.file_token = file_token
+        self.offset = offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.file_token)
+        out += Long.write(self.offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCdnFileHashes:
+        file_token = Bytes.read(stream)
+        offset = Long.read(stream)
+        return cls(file_token=file_token, offset=offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCdnFileHashes, int]:
+        file_token, cursor = Bytes.read_from(view, cursor)
+        offset, cursor = Long.read_from(view, cursor)
+        return cls(file_token=file_token, offset=offset), cursor
+
+
+class GetFileHashes(TLRequest[list[tl.base.FileHash]]):
+    __tl_id__ = 0x9156982a
+    __tl_name__ = "functions.upload.GetFileHashes"
+    __tl_layer__ = 143
+
+    __slots__ = ("location", "offset", )
+
+    def __init__(self, *, location: tl.base.InputFileLocation, offset: int):
+        self.location = location
+        self.offset = offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.location.write_to(out, ctx)
+        out += Long.write(self.offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFileHashes:
+        location = TLObject.read(stream)
+        offset = Long.read(stream)
+        return cls(location=location, offset=offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFileHashes, int]:
+        location, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = Long.read_from(view, cursor)
+        return cls(location=location, offset=offset), cursor
+
+
+class GetFile_133(TLRequest[tl.base.upload.File]):
+    __tl_id__ = 0xb15a9afc
+    __tl_name__ = "functions.upload.GetFile_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("precise", "cdn_supported", "location", "offset", "limit", )
+
+    def __init__(self, *, location: tl.base.InputFileLocation, offset: int, limit: int, precise: bool = False, cdn_supported: bool = False):
+        self.precise = precise
+        self.cdn_supported = cdn_supported
+        self.location = location
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.precise: flags1 |= (1 << 0)
+        if self.cdn_supported: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.location.write_to(out, ctx)
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFile_133:
+        flags1 = Int.read(stream)
+        precise = (flags1 & (1 << 0)) == (1 << 0)
+        cdn_supported = (flags1 & (1 << 1)) == (1 << 1)
+        location = TLObject.read(stream)
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(precise=precise, cdn_supported=cdn_supported, location=location, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFile_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        precise = (flags1 & (1 << 0)) == (1 << 0)
+        cdn_supported = (flags1 & (1 << 1)) == (1 << 1)
+        location, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(precise=precise, cdn_supported=cdn_supported, location=location, offset=offset, limit=limit), cursor
+
+
+class GetCdnFile_133(TLRequest[tl.base.upload.CdnFile]):
+    __tl_id__ = 0x2000bcc3
+    __tl_name__ = "functions.upload.GetCdnFile_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("file_token", "offset", "limit", )
+
+    def __init__(self, *, file_token: bytes, offset: int, limit: int):
+        self.file_token = file_token
+        self.offset = offset
+        self.limit = limit
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.file_token)
+        out += Int.write(self.offset)
+        out += Int.write(self.limit)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCdnFile_133:
+        file_token = Bytes.read(stream)
+        offset = Int.read(stream)
+        limit = Int.read(stream)
+        return cls(file_token=file_token, offset=offset, limit=limit)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCdnFile_133, int]:
+        file_token, cursor = Bytes.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        return cls(file_token=file_token, offset=offset, limit=limit), cursor
+
+
+class GetCdnFileHashes_133(TLRequest[list[tl.base.FileHash]]):
+    __tl_id__ = 0x4da54231
+    __tl_name__ = "functions.upload.GetCdnFileHashes_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("file_token", "offset", )
+
+    def __init__(self, *, file_token: bytes, offset: int):
+        self.file_token = file_token
+        self.offset = offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.file_token)
+        out += Int.write(self.offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetCdnFileHashes_133:
+        file_token = Bytes.read(stream)
+        offset = Int.read(stream)
+        return cls(file_token=file_token, offset=offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetCdnFileHashes_133, int]:
+        file_token, cursor = Bytes.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        return cls(file_token=file_token, offset=offset), cursor
+
+
+class GetFileHashes_133(TLRequest[list[tl.base.FileHash]]):
+    __tl_id__ = 0xc7025931
+    __tl_name__ = "functions.upload.GetFileHashes_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("location", "offset", )
+
+    def __init__(self, *, location: tl.base.InputFileLocation, offset: int):
+        self.location = location
+        self.offset = offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.location.write_to(out, ctx)
+        out += Int.write(self.offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFileHashes_133:
+        location = TLObject.read(stream)
+        offset = Int.read(stream)
+        return cls(location=location, offset=offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFileHashes_133, int]:
+        location, cursor = TLObject.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        return cls(location=location, offset=offset), cursor
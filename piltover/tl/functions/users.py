@@ -0,0 +1,182 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+
+from ..tl_object import TLRequest
+
+class GetUsers(TLRequest[list[tl.base.User]]):
+    __tl_id__ = 0xd91a548
+    __tl_name__ = "functions.users.GetUsers"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[tl.base.InputUser]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetUsers:
+        id = TLObjectVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetUsers, int]:
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetFullUser(TLRequest[tl.types.users.UserFull]):
+    __tl_id__ = 0xb60f5918
+    __tl_name__ = "functions.users.GetFullUser"
+    __tl_layer__ = 135
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: tl.base.InputUser):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFullUser:
+        id = TLObject.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFullUser, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class SetSecureValueErrors(TLRequest[bool]):
+    __tl_id__ = 0x90c894b5
+    __tl_name__ = "functions.users.SetSecureValueErrors"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", "errors", )
+
+    def __init__(self, *, id: tl.base.InputUser, errors: list[tl.base.SecureValueError]):
+        self.id = id
+        self.errors = errors
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.errors, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetSecureValueErrors:
+        id = TLObject.read(stream)
+        errors = TLObjectVector.read(stream)
+        return cls(id=id, errors=errors)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetSecureValueErrors, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        errors, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id, errors=errors), cursor
+
+
+class GetRequirementsToContact(TLRequest[list[tl.base.RequirementToContact]]):
+    __tl_id__ = 0xd89a83a3
+    __tl_name__ = "functions.users.GetRequirementsToContact"
+    __tl_layer__ = 200
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[tl.base.InputUser]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetRequirementsToContact:
+        id = TLObjectVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetRequirementsToContact, int]:
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetFullUser_133(TLRequest[tl.base.UserFull]):
+    __tl_id__ = 0xca30a5b1
+    __tl_name__ = "functions.users.GetFullUser_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: tl.base.InputUser):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.id.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetFullUser_133:
+        id = TLObject.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetFullUser_133, int]:
+        id, cursor = TLObject.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetStoriesMaxIDs_160(TLRequest[list[int]]):
+    __tl_id__ = 0xca1cb9ab
+    __tl_name__ = "functions.users.GetStoriesMaxIDs_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[tl.base.InputUser]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetStoriesMaxIDs_160:
+        id = TLObjectVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetStoriesMaxIDs_160, int]:
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class GetIsPremiumRequiredToContact_174(TLRequest[list[bool]]):
+    __tl_id__ = 0xa622aa10
+    __tl_name__ = "functions.users.GetIsPremiumRequiredToContact_174"
+    __tl_layer__ = 174
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: list[tl.base.InputUser]):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.id, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GetIsPremiumRequiredToContact_174:
+        id = TLObjectVector.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GetIsPremiumRequiredToContact_174, int]:
+        id, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(id=id), cursor
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable
+
+
+class LazyObjects(dict[int, type]):
+    """
+    Constructor id -> class mapping, module of a class is imported on first lookup of its constructor id.
+
+    :param index: constructor id -> (module path relative to piltover.tl, class name).
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, index: dict[int, tuple[str, str]]) -> None:
+        super().__init__()
+        self._index = index
+
+    def __missing__(self, constructor: int) -> type:
+        if (location := self._index.get(constructor)) is None:
+            raise KeyError(constructor)
+
+        module_path, name = location
+        self[constructor] = cls = getattr(import_module(f"piltover.tl.{module_path}"), name)
+        return cls
+
+    def __contains__(self, constructor: object) -> bool:
+        return dict.__contains__(self, constructor) or constructor in self._index
+
+    def get(self, constructor: int, default: type | None = None) -> type | None:
+        try:
+            return self[constructor]
+        except KeyError:
+            return default
+
+    def load_all(self) -> None:
+        for constructor in self._index:
+            if not dict.__contains__(self, constructor):
+                self.__missing__(constructor)
+
+
+def lazy_getattr(
+        package: str, package_globals: dict[str, Any], index: dict[str, tuple[str, str | None]],
+) -> Callable[[str], Any]:
+    """
+    Makes module-level __getattr__ that imports attributes of a package on first access.
+
+    :param package: name of the package.
+    :param package_globals: globals() of the package, imported attributes are cached there.
+    :param index: attribute name -> (module path relative to package, attribute name or None if it is module itself).
+    :return: __getattr__ function.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if (location := index.get(name)) is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module_path, attr_name = location
+        value = import_module(f"{package}.{module_path}")
+        if attr_name is not None:
+            value = getattr(value, attr_name)
+
+        package_globals[name] = value
+        return value
+
+    return __getattr__
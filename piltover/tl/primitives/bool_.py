@@ -16,6 +16,16 @@ class Bool(ABC):
 
         return bool_constructor == primitives.BOOL_TRUE
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int) -> tuple[bool, int]:
+        bool_constructor = view[pos:pos + 4]
+        if bool_constructor == primitives.BOOL_TRUE:
+            return True, pos + 4
+        if bool_constructor == primitives.BOOL_FALSE:
+            return False, pos + 4
+
+        raise InvalidConstructorException(primitives.Int.read_bytes(bool_constructor, False), view[pos + 4:].tobytes())
+
     @classmethod
     def write(cls, value: bool) -> bytes:
         return primitives.BOOL_TRUE if value else primitives.BOOL_FALSE
@@ -26,6 +36,10 @@ class BoolTrue(ABC):
     def deserialize(cls, _: BytesIO) -> bool:
         return True
 
+    @classmethod
+    def deserialize_from(cls, _: memoryview, pos: int) -> tuple[bool, int]:
+        return True, pos
+
     @classmethod
     def write(cls, _: bool) -> bytes:
         return primitives.BOOL_TRUE
@@ -36,6 +50,10 @@ class BoolFalse(ABC):
     def deserialize(cls, _: BytesIO) -> bool:
         return False
 
+    @classmethod
+    def deserialize_from(cls, _: memoryview, pos: int) -> tuple[bool, int]:
+        return False, pos
+
     @classmethod
     def write(cls, _: bool) -> bytes:
         return primitives.BOOL_FALSE
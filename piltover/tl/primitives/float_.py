@@ -11,6 +11,10 @@ class Float(float):
     def read(cls, stream: BytesIO) -> float:
         return cls.STRUCT_FMT.unpack(stream.read(8))[0]
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int) -> tuple[float, int]:
+        return cls.STRUCT_FMT.unpack_from(view, pos)[0], pos + 8
+
     @classmethod
     def write(cls, value: float) -> bytes:
         return cls.STRUCT_FMT.pack(value)
@@ -20,6 +20,12 @@ class Int(int):
     def read(cls, stream: BytesIO, signed: bool = True) -> int:
         return cls.read_bytes(stream.read(cls.SIZE), signed)
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int, signed: bool = True) -> tuple[int, int]:
+        if signed:
+            return cls.STRUCT_FMT_I.unpack_from(view, pos)[0], pos + cls.SIZE
+        return cls.STRUCT_FMT_U.unpack_from(view, pos)[0], pos + cls.SIZE
+
     @classmethod
     def write(cls, value: int, signed: bool = True) -> bytes:
         return value.to_bytes(cls.SIZE, "little", signed=signed)
@@ -41,6 +47,13 @@ class BigInt(Int):
     def read_bytes(cls, data: bytes, signed: bool = True) -> int:
         return int.from_bytes(data[:cls.SIZE], "little", signed=signed)
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int, signed: bool = True) -> tuple[int, int]:
+        end = pos + cls.SIZE
+        if end > len(view):
+            raise ValueError(f"Buffer is too short to read {cls.SIZE} bytes at position {pos}")
+        return int.from_bytes(view[pos:end], "little", signed=signed), end
+
 
 class Int128(BigInt):
     BIT_SIZE = 128
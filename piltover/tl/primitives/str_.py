@@ -20,22 +20,53 @@ class Bytes(bytes):
 
         return result
 
+    @staticmethod
+    def bounds_from(view: memoryview, pos: int) -> tuple[int, int]:
+        """
+        Returns start and end positions of bytes value with length prefix at given position.
+        Raises ValueError if buffer is too short to contain the whole value.
+        """
+
+        # Length prefix and value are padded to 4 bytes together, so there are always at least 4 bytes
+        if pos + 4 > len(view):
+            raise ValueError(f"Buffer is too short to read bytes at position {pos}")
+
+        start = pos + 1
+        if (count := view[pos]) >= 254:
+            count = view[pos + 1] | (view[pos + 2] << 8) | (view[pos + 3] << 16)
+            start = pos + 4
+
+        end = start + count
+        if end > len(view):
+            raise ValueError(f"Buffer is too short to read {count} bytes at position {start}")
+
+        return start, end
+
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int) -> tuple[bytes, int]:
+        start, end = cls.bounds_from(view, pos)
+        # Length prefix and value are padded to 4 bytes together
+        return view[start:end].tobytes(), end + (-(end - pos) & 3)
+
+    @classmethod
+    def header(cls, length: int) -> bytes:
+        if length >= 0xFE:
+            return bytes([254]) + length.to_bytes(3, "little")
+        return bytes([length])
+
     @classmethod
     def write(cls, value: bytes) -> bytes:
-        result = b""
-        ln = len(value)
-        if ln >= 0xFE:
-            result += bytes([254])
-            result += int.to_bytes(ln, 3, "little")
-        else:
-            result += bytes([ln])
-
-        result += value
-        padding = len(result) % 4
-        if padding:
-            result += b"\x00" * (4 - padding)
+        header = cls.header(len(value))
+        padding = -(len(header) + len(value)) & 3
+        return b"".join((header, value, b"\x00" * padding))
 
-        return result
+    @classmethod
+    def write_to(cls, out: bytearray, value: bytes) -> None:
+        header = cls.header(len(value))
+        out += header
+        out += value
+        if padding := -(len(header) + len(value)) & 3:
+            out += b"\x00" * padding
 
 
 class String(str):
@@ -43,6 +74,15 @@ class String(str):
     def read(cls, stream: BytesIO) -> str:
         return Bytes.read(stream).decode("utf8")
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int) -> tuple[str, int]:
+        start, end = Bytes.bounds_from(view, pos)
+        return str(view[start:end], "utf8"), end + (-(end - pos) & 3)
+
     @classmethod
     def write(cls, value: str) -> bytes:
         return Bytes.write(value.encode("utf8"))
+
+    @classmethod
+    def write_to(cls, out: bytearray, value: str) -> None:
+        Bytes.write_to(out, value.encode("utf8"))
@@ -22,6 +22,11 @@ class Vector(list[T], ABC):
     def read(cls, stream: BytesIO) -> array[int]:
         ...
 
+    @classmethod
+    @abstractmethod
+    def read_from(cls, view: memoryview, pos: int) -> tuple[list[T], int]:
+        ...
+
     @abstractmethod
     def write(self) -> bytes:
         ...
@@ -36,6 +41,12 @@ class Vector(list[T], ABC):
         cls.check_constructor(stream)
         return primitives.Int.read(stream)
 
+    @classmethod
+    def read_header_from(cls, view: memoryview, pos: int) -> tuple[int, int]:
+        if (constructor := view[pos:pos + 4]) != primitives.VECTOR:
+            raise InvalidConstructorException(primitives.Int.read_bytes(constructor, False), view[pos + 4:].tobytes())
+        return primitives.Int.read_from(view, pos + 4)
+
     @classmethod
     def header(cls, count: int) -> bytes:
         return primitives.VECTOR + primitives.Int.write(count)
@@ -51,6 +62,17 @@ class PrimitiveVector(Vector[T], ABC):
         arr = array(cls.ARRAY_TYPE, stream.read(count * cls.ELEMENT_SIZE))
         return cast(T, arr)
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int) -> tuple[array[T], int]:
+        count, pos = cls.read_header_from(view, pos)
+        end = pos + count * cls.ELEMENT_SIZE
+        if count < 0 or end > len(view):
+            raise ValueError(f"Buffer is too short to read {count} vector elements at position {pos}")
+        # Elements are copied straight from the buffer, without intermediate bytes object
+        arr = array(cls.ARRAY_TYPE)
+        arr.frombytes(view[pos:end])
+        return cast(T, arr), end
+
     # noinspection PyMethodParameters
     @classinstancemethod
     def write(cls: type[PrimitiveVector[T]], self: list[T]) -> bytes:
@@ -78,6 +100,10 @@ class _Primitive(Protocol):
     def read(cls, stream: BytesIO) -> T:
         ...
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int) -> tuple[T, int]:
+        ...
+
     @classmethod
     def write(cls, value: T) -> bytes:
         ...
@@ -91,13 +117,20 @@ class _Vector(Vector[T], ABC):
         count = cls.read_header(stream)
         return cls(cls.ELEMENT_TYPE.read(stream) for _ in range(count))
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int) -> tuple[list[T], int]:
+        count, pos = cls.read_header_from(view, pos)
+        result = cls()
+        for _ in range(count):
+            element, pos = cls.ELEMENT_TYPE.read_from(view, pos)
+            result.append(element)
+        return result, pos
+
     # noinspection PyMethodParameters
     @classinstancemethod
     def write(cls: type[_Vector[T]], self: list[T]) -> bytes:
-        result = cls.header(len(self))
-        for element in self:
-            result += cls.ELEMENT_TYPE.write(element)
-        return result
+        write = cls.ELEMENT_TYPE.write
+        return b"".join((cls.header(len(self)), *(write(element) for element in self)))
 
 
 class Int128Vector(_Vector[int]):
@@ -130,10 +163,25 @@ class TLObjectVector(Vector["TObj"]):
         count = cls.read_header(stream)
         return cls(TLObject.read(stream) for _ in range(count))
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int) -> tuple[list[TLObject], int]:
+        from piltover.tl import TLObject
+        count, pos = cls.read_header_from(view, pos)
+        result = cls()
+        for _ in range(count):
+            element, pos = TLObject.read_from(view, pos)
+            result.append(element)
+        return result, pos
+
     # noinspection PyMethodParameters
     @classinstancemethod
     def write(cls: type[TLObjectVector], self: list[TLObject], ctx: SerializationContext) -> bytes:
-        result = cls.header(len(self))
-        for element in self:
-            result += element.write(ctx)
-        return result
+        out = bytearray()
+        cls.write_to(out, self, ctx)
+        return bytes(out)
+
+    @classmethod
+    def write_to(cls, out: bytearray, value: list[TLObject], ctx: SerializationContext) -> None:
+        out += cls.header(len(value))
+        for element in value:
+            element.write_to(out, ctx)
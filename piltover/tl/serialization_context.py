@@ -52,3 +52,50 @@ EMPTY_SERIALIZATION_CONTEXT = SerializationContext(
     dont_format=True,
     values=None,
 )
+
+
+_auth_id_slot = SerializationContext.auth_id
+_user_id_slot = SerializationContext.user_id
+_values_slot = SerializationContext.values
+
+
+class DependencyTrackingSerializationContext(SerializationContext):
+    """
+    Serialization context that records which session-specific values (user_id, auth_id, values)
+    were read while serializing an object, so serialized bytes can be reused for other sessions
+    that have the same values of these fields.
+    """
+
+    __slots__ = ("accessed",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.accessed: set[str] = set()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def auth_id(self) -> int:
+        self.accessed.add("auth_id")
+        return _auth_id_slot.__get__(self)
+
+    @auth_id.setter
+    def auth_id(self, value: int) -> None:
+        _auth_id_slot.__set__(self, value)
+
+    @property
+    def user_id(self) -> int:
+        self.accessed.add("user_id")
+        return _user_id_slot.__get__(self)
+
+    @user_id.setter
+    def user_id(self, value: int) -> None:
+        _user_id_slot.__set__(self, value)
+
+    @property
+    def values(self) -> ContextValues:
+        self.accessed.add("values")
+        return _values_slot.__get__(self)
+
+    @values.setter
+    def values(self, value: ContextValues) -> None:
+        _values_slot.__set__(self, value)
+
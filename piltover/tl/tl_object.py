@@ -26,13 +26,28 @@ class TLObject(ABC):
     def tlname(cls) -> str:
         return cls.__tl_name__
 
-    @abstractmethod
-    def serialize(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes: ...
+    def serialize(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+        out = bytearray()
+        self.serialize_to(out, ctx)
+        return bytes(out)
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        """
+        Appends serialized fields of this object (without constructor id) to given buffer.
+        Generated objects implement this method, other objects may implement serialize instead.
+        """
+        out += self.serialize(ctx)
 
     @classmethod
     @abstractmethod
     def deserialize(cls, stream: BytesIO) -> Self: ...
 
+    @classmethod
+    def deserialize_from(cls, view: memoryview, pos: int) -> tuple[Self, int]:
+        stream = BytesIO(view[pos:])
+        obj = cls.deserialize(stream)
+        return obj, pos + stream.tell()
+
     def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
         ...
 
@@ -55,8 +70,52 @@ class TLObject(ABC):
 
         return obj
 
+    @classmethod
+    def read_from(cls, view: memoryview, pos: int = 0, strict_type: bool = False) -> tuple[Self, int]:
+        """
+        Same as read, but reads object from a buffer at given position instead of a stream.
+        Nothing is copied from the buffer except values of bytes/string fields.
+
+        :param view: buffer to read from.
+        :param pos: position of the object constructor in the buffer.
+        :param strict_type: whether to check that read object is an instance of cls.
+        :return: read object and position right after it.
+        """
+
+        constructor = Int.STRUCT_FMT_U.unpack_from(view, pos)[0]
+        pos += 4
+
+        if cls is not TLObject:
+            if constructor != cls.__tl_id__:
+                raise InvalidConstructorException(constructor, view[pos:].tobytes())
+            return cls.deserialize_from(view, pos)
+
+        if (obj_cls := tl.all.objects.get(constructor)) is None:
+            raise UnknownConstructorException(constructor, view[pos:].tobytes())
+
+        obj, pos = obj_cls.deserialize_from(view, pos)
+
+        if strict_type and not isinstance(obj, cls):
+            raise Error(f"Expected object type {cls.__name__}, got {obj.__class__.__name__}")
+
+        return obj, pos
+
+    @classmethod
+    def read_buffer(cls, data: bytes | bytearray | memoryview, strict_type: bool = False) -> Self:
+        return cls.read_from(memoryview(data), 0, strict_type)[0]
+
     def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
-        return Int.write(self.__tl_id__, False) + self.serialize(ctx)
+        out = bytearray()
+        self.write_to(out, ctx)
+        return bytes(out)
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        """
+        Appends serialized object to given buffer, nested objects are written to the same buffer.
+        Objects that need custom serialization (e.g. depending on the layer) should override this method, not write.
+        """
+        out += Int.write(self.__tl_id__, False)
+        self.serialize_to(out, ctx)
 
     def to_dict(self) -> dict:
         return {slot: getattr(self, slot) for slot in self.__slots__}
@@ -15,21 +15,21 @@ class ChannelToFormat(types.ChannelToFormatInternal):
             title=self.title,
         )
 
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         from piltover.db.models import Channel
         from piltover.db.models.channel import CREATOR_RIGHTS
         from piltover.db.enums import ChatAdminRights, ChatBannedRights
 
         if ctx.values is None:
-            return self._forbidden(0).write(ctx)
+            return self._forbidden(0).write_to(out, ctx)
 
         participant = ctx.values.channel_participants.get(self.id) if ctx.values is not None else None
 
         if participant is not None and participant.banned_rights & ChatBannedRights.VIEW_MESSAGES:
-            return self._forbidden(-1).write(ctx)
+            return self._forbidden(-1).write_to(out, ctx)
 
         if participant is None and not (self.nojoin_allow_view or self.username is not None):
-            return self._forbidden(-1).write(ctx)
+            return self._forbidden(-1).write_to(out, ctx)
 
         admin_rights = None
         if self.creator_id == ctx.user_id:
@@ -71,12 +71,12 @@ class ChannelToFormat(types.ChannelToFormatInternal):
             banned_rights=participant.banned_rights.to_tl() if participant is not None else None,
             color=self.color,
             profile_color=self.profile_color,
-        ).write(ctx)
+        ).write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
 
     def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
         values.channel_participants.add(self.id)
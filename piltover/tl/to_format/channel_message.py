@@ -9,7 +9,7 @@ class ChannelMessageToFormat(types.ChannelMessageToFormatInternal):
     def id(self) -> int:
         return self.common.id
 
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         from piltover.db import models
 
         peer = types.PeerChannel(channel_id=models.Channel.make_id_from(self.common.channel_id))
@@ -68,12 +68,12 @@ class ChannelMessageToFormat(types.ChannelMessageToFormatInternal):
         else:
             raise Unreachable
 
-        return message.write(ctx)
+        return message.write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
 
     def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
         values.channel_messages.add(self.common.id)
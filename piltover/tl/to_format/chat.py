@@ -4,7 +4,7 @@ from piltover.tl.serialization_context import EMPTY_SERIALIZATION_CONTEXT, Seria
 
 
 class ChatToFormat(types.ChatToFormatInternal):
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         from piltover.db.models import Chat, Channel
         from piltover.db.models.chat import DEFAULT_ADMIN_RIGHTS
 
@@ -12,7 +12,7 @@ class ChatToFormat(types.ChatToFormatInternal):
             return types.ChatForbidden(
                 id=Chat.make_id_from(self.id),
                 title=self.title,
-            ).write(ctx)
+            ).write_to(out, ctx)
 
         participant = ctx.values.chat_participants[self.id]
         is_admin = participant.is_admin or self.creator_id == ctx.user_id
@@ -35,12 +35,12 @@ class ChatToFormat(types.ChatToFormatInternal):
             migrated_to=migrated_to,
             admin_rights=DEFAULT_ADMIN_RIGHTS if is_admin else None,
             default_banned_rights=self.default_banned_rights,
-        ).write(ctx)
+        ).write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
 
     def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
         values.chat_participants.add(self.id)
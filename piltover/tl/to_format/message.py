@@ -16,7 +16,7 @@ class MessageToFormat(types.MessageToFormatInternal):
     def media_unread(self, value: bool) -> None:
         self.ref.media_unread = value
 
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         if isinstance(self.content, types.internal.MessageToFormatContent):
             message = types.Message(
                 id=self.ref.id,
@@ -64,9 +64,9 @@ class MessageToFormat(types.MessageToFormatInternal):
         else:
             raise Unreachable
 
-        return message.write(ctx)
+        return message.write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
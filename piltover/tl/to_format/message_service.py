@@ -3,7 +3,7 @@ from piltover.tl.serialization_context import EMPTY_SERIALIZATION_CONTEXT, Seria
 
 
 class MessageServiceToFormat(types.MessageServiceToFormatInternal):
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         return types.MessageService(
             id=self.id,
             peer_id=self.peer_id,
@@ -15,9 +15,9 @@ class MessageServiceToFormat(types.MessageServiceToFormatInternal):
             mentioned=False,
             media_unread=False,
             ttl_period=self.ttl_period,
-        ).write(ctx)
+        ).write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
@@ -4,7 +4,7 @@ from piltover.tl.serialization_context import EMPTY_SERIALIZATION_CONTEXT, Seria
 
 
 class PhoneCallToFormat(types.PhoneCallToFormatInternal):
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         common_kwargs = {
             "id": self.id,
             "access_hash": self.access_hash,
@@ -60,9 +60,9 @@ class PhoneCallToFormat(types.PhoneCallToFormatInternal):
         else:
             raise Unreachable
 
-        return call.write(ctx)
+        return call.write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
@@ -3,7 +3,7 @@ from piltover.tl.serialization_context import EMPTY_SERIALIZATION_CONTEXT, Seria
 
 
 class PollAnswerVotersToFormat(types.PollAnswerVotersToFormatInternal):
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         chosen = (
                 ctx.values is not None
                 and self.poll_id in ctx.values.poll_answers
@@ -15,9 +15,9 @@ class PollAnswerVotersToFormat(types.PollAnswerVotersToFormatInternal):
             correct=self.correct and chosen,
             option=self.option,
             voters=self.voters,
-        ).write(ctx)
+        ).write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
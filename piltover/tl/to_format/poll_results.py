@@ -4,7 +4,7 @@ from piltover.tl.serialization_context import EMPTY_SERIALIZATION_CONTEXT, Seria
 
 
 class PollResultsToFormat(types.PollResultsToFormatInternal):
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         return types.PollResults(
             min=ctx.values is None or self.id not in ctx.values.poll_answers,
             results=self.results,
@@ -12,12 +12,12 @@ class PollResultsToFormat(types.PollResultsToFormatInternal):
             # TODO: only show solution if incorrect option was selected
             solution=self.solution,
             solution_entities=self.solution_entities,
-        ).write(ctx)
+        ).write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
 
     def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
         values.poll_answers.add(self.id)
@@ -3,7 +3,7 @@ from piltover.tl.serialization_context import EMPTY_SERIALIZATION_CONTEXT, Seria
 
 
 class StickerSetToFormat(types.StickerSetToFormatInternal):
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         return types.StickerSet(
             id=self.info.id,
             access_hash=self.info.access_hash,
@@ -21,9 +21,9 @@ class StickerSetToFormat(types.StickerSetToFormatInternal):
             thumbs=self.info.thumbs,
             thumb_dc_id=2 if self.info.thumbs is not None else None,
             thumb_version=self.info.thumb_version,
-        ).write(ctx)
+        ).write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
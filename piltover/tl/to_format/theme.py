@@ -3,7 +3,7 @@ from piltover.tl.serialization_context import EMPTY_SERIALIZATION_CONTEXT, Seria
 
 
 class ThemeToFormat(types.ThemeToFormatInternal):
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         return types.Theme(
             creator=self.creator_id == ctx.user_id,
             for_chat=self.for_chat,
@@ -14,9 +14,9 @@ class ThemeToFormat(types.ThemeToFormatInternal):
             document=self.document,
             settings=self.settings,
             emoticon=self.emoticon,
-        ).write(ctx)
+        ).write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
@@ -6,7 +6,7 @@ from piltover.tl.serialization_context import EMPTY_SERIALIZATION_CONTEXT, Seria
 
 
 class UserToFormat(types.UserToFormatInternal):
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         from piltover.db.enums import PrivacyRuleKeyType
         from piltover.db.models.presence import Presence, EMPTY as PRESENCE_EMPTY
         from piltover.db.models import Contact
@@ -78,12 +78,12 @@ class UserToFormat(types.UserToFormatInternal):
             #  for non-premium users.
             #  Need to figure out how official telegram allows custom emojis to be visible to non-premium users.
             premium=not self.bot,
-        ).write(ctx)
+        ).write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
 
     def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
         values.users.add(self.id)
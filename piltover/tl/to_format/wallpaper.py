@@ -5,7 +5,7 @@ from piltover.tl.serialization_context import EMPTY_SERIALIZATION_CONTEXT, Seria
 class WallPaperToFormat(types.WallPaperToFormatInternal):
     __tl_result_id__ = 0xa437c3ed
 
-    def _write(self, ctx: SerializationContext) -> bytes:
+    def _write_to(self, out: bytearray, ctx: SerializationContext) -> None:
         return types.WallPaper(
             id=self.id,
             creator=self.creator_id == ctx.user_id,
@@ -16,9 +16,9 @@ class WallPaperToFormat(types.WallPaperToFormatInternal):
             slug=self.slug,
             document=self.document,
             settings=self.settings,
-        ).write(ctx)
+        ).write_to(out, ctx)
 
-    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
         if ctx.dont_format:
-            return super().write(ctx)
-        return self._write(ctx)
+            return super().write_to(out, ctx)
+        return self._write_to(out, ctx)
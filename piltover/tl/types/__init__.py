@@ -0,0 +1,1626 @@
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from piltover.tl.lazy_import import lazy_getattr
+
+LAZY_INDEX = {
+    "internal": ("internal", None),
+    "internal_benchmarking": ("internal_benchmarking", None),
+    "internal_botfather": ("internal_botfather", None),
+    "internal_stickersbot": ("internal_stickersbot", None),
+    "internal_access": ("internal_access", None),
+    "help": ("help", None),
+    "storage": ("storage", None),
+    "auth": ("auth", None),
+    "contacts": ("contacts", None),
+    "messages": ("messages", None),
+    "updates": ("updates", None),
+    "photos": ("photos", None),
+    "upload": ("upload", None),
+    "account": ("account", None),
+    "channels": ("channels", None),
+    "payments": ("payments", None),
+    "phone": ("phone", None),
+    "stats": ("stats", None),
+    "stickers": ("stickers", None),
+    "users": ("users", None),
+    "chatlists": ("chatlists", None),
+    "bots": ("bots", None),
+    "stories": ("stories", None),
+    "premium": ("premium", None),
+    "smsjobs": ("smsjobs", None),
+    "fragment": ("fragment", None),
+    "WallPaperToFormatInternal": ("_root", "WallPaperToFormatInternal"),
+    "MessageServiceToFormatInternal": ("_root", "MessageServiceToFormatInternal"),
+    "ThemeToFormatInternal": ("_root", "ThemeToFormatInternal"),
+    "ChatToFormatInternal": ("_root", "ChatToFormatInternal"),
+    "ChannelToFormatInternal": ("_root", "ChannelToFormatInternal"),
+    "UserToFormatInternal": ("_root", "UserToFormatInternal"),
+    "EncryptedChatToFormatInternal": ("_root", "EncryptedChatToFormatInternal"),
+    "PollResultsToFormatInternal": ("_root", "PollResultsToFormatInternal"),
+    "PollAnswerVotersToFormatInternal": ("_root", "PollAnswerVotersToFormatInternal"),
+    "PhoneCallToFormatInternal": ("_root", "PhoneCallToFormatInternal"),
+    "MessageToFormatInternal": ("_root", "MessageToFormatInternal"),
+    "ChannelMessageToFormatInternal": ("_root", "ChannelMessageToFormatInternal"),
+    "UpdateMessageIDToFormatInternal": ("_root", "UpdateMessageIDToFormatInternal"),
+    "StickerSetToFormatInternal": ("_root", "StickerSetToFormatInternal"),
+    "ResPQ": ("_root", "ResPQ"),
+    "PQInnerData": ("_root", "PQInnerData"),
+    "PQInnerDataDc": ("_root", "PQInnerDataDc"),
+    "PQInnerDataTemp": ("_root", "PQInnerDataTemp"),
+    "PQInnerDataTempDc": ("_root", "PQInnerDataTempDc"),
+    "BindAuthKeyInner": ("_root", "BindAuthKeyInner"),
+    "ServerDHParamsFail": ("_root", "ServerDHParamsFail"),
+    "ServerDHParamsOk": ("_root", "ServerDHParamsOk"),
+    "ServerDHInnerData": ("_root", "ServerDHInnerData"),
+    "ClientDHInnerData": ("_root", "ClientDHInnerData"),
+    "DhGenOk": ("_root", "DhGenOk"),
+    "DhGenRetry": ("_root", "DhGenRetry"),
+    "DhGenFail": ("_root", "DhGenFail"),
+    "DestroyAuthKeyOk": ("_root", "DestroyAuthKeyOk"),
+    "DestroyAuthKeyNone": ("_root", "DestroyAuthKeyNone"),
+    "DestroyAuthKeyFail": ("_root", "DestroyAuthKeyFail"),
+    "MsgsAck": ("_root", "MsgsAck"),
+    "BadMsgNotification": ("_root", "BadMsgNotification"),
+    "BadServerSalt": ("_root", "BadServerSalt"),
+    "MsgsStateReq": ("_root", "MsgsStateReq"),
+    "MsgsStateInfo": ("_root", "MsgsStateInfo"),
+    "MsgsAllInfo": ("_root", "MsgsAllInfo"),
+    "MsgDetailedInfo": ("_root", "MsgDetailedInfo"),
+    "MsgNewDetailedInfo": ("_root", "MsgNewDetailedInfo"),
+    "MsgResendReq": ("_root", "MsgResendReq"),
+    "RpcError": ("_root", "RpcError"),
+    "RpcAnswerUnknown": ("_root", "RpcAnswerUnknown"),
+    "RpcAnswerDroppedRunning": ("_root", "RpcAnswerDroppedRunning"),
+    "RpcAnswerDropped": ("_root", "RpcAnswerDropped"),
+    "FutureSalt": ("_root", "FutureSalt"),
+    "Pong": ("_root", "Pong"),
+    "DestroySessionOk": ("_root", "DestroySessionOk"),
+    "DestroySessionNone": ("_root", "DestroySessionNone"),
+    "NewSessionCreated": ("_root", "NewSessionCreated"),
+    "HttpWait": ("_root", "HttpWait"),
+    "IpPort": ("_root", "IpPort"),
+    "IpPortSecret": ("_root", "IpPortSecret"),
+    "AccessPointRule": ("_root", "AccessPointRule"),
+    "TlsClientHello": ("_root", "TlsClientHello"),
+    "TlsBlockString": ("_root", "TlsBlockString"),
+    "TlsBlockRandom": ("_root", "TlsBlockRandom"),
+    "TlsBlockZero": ("_root", "TlsBlockZero"),
+    "TlsBlockDomain": ("_root", "TlsBlockDomain"),
+    "TlsBlockGrease": ("_root", "TlsBlockGrease"),
+    "TlsBlockPublicKey": ("_root", "TlsBlockPublicKey"),
+    "TlsBlockScope": ("_root", "TlsBlockScope"),
+    "InputPeerEmpty": ("_root", "InputPeerEmpty"),
+    "InputPeerSelf": ("_root", "InputPeerSelf"),
+    "InputPeerChat": ("_root", "InputPeerChat"),
+    "InputPeerUser": ("_root", "InputPeerUser"),
+    "InputPeerChannel": ("_root", "InputPeerChannel"),
+    "InputPeerUserFromMessage": ("_root", "InputPeerUserFromMessage"),
+    "InputPeerChannelFromMessage": ("_root", "InputPeerChannelFromMessage"),
+    "InputUserEmpty": ("_root", "InputUserEmpty"),
+    "InputUserSelf": ("_root", "InputUserSelf"),
+    "InputUser": ("_root", "InputUser"),
+    "InputUserFromMessage": ("_root", "InputUserFromMessage"),
+    "InputPhoneContact": ("_root", "InputPhoneContact"),
+    "InputFile": ("_root", "InputFile"),
+    "InputFileBig": ("_root", "InputFileBig"),
+    "InputFileStoryDocument": ("_root", "InputFileStoryDocument"),
+    "InputMediaEmpty": ("_root", "InputMediaEmpty"),
+    "InputMediaUploadedPhoto": ("_root", "InputMediaUploadedPhoto"),
+    "InputMediaPhoto": ("_root", "InputMediaPhoto"),
+    "InputMediaGeoPoint": ("_root", "InputMediaGeoPoint"),
+    "InputMediaContact": ("_root", "InputMediaContact"),
+    "InputMediaUploadedDocumentBase": ("_root", "InputMediaUploadedDocumentBase"),
+    "InputMediaDocumentBase": ("_root", "InputMediaDocumentBase"),
+    "InputMediaVenue": ("_root", "InputMediaVenue"),
+    "InputMediaPhotoExternal": ("_root", "InputMediaPhotoExternal"),
+    "InputMediaDocumentExternalBase": ("_root", "InputMediaDocumentExternalBase"),
+    "InputMediaGame": ("_root", "InputMediaGame"),
+    "InputMediaInvoiceBase": ("_root", "InputMediaInvoiceBase"),
+    "InputMediaGeoLive": ("_root", "InputMediaGeoLive"),
+    "InputMediaPoll": ("_root", "InputMediaPoll"),
+    "InputMediaDice": ("_root", "InputMediaDice"),
+    "InputMediaStoryBase": ("_root", "InputMediaStoryBase"),
+    "InputMediaWebPage": ("_root", "InputMediaWebPage"),
+    "InputMediaPaidMediaBase": ("_root", "InputMediaPaidMediaBase"),
+    "InputChatPhotoEmpty": ("_root", "InputChatPhotoEmpty"),
+    "InputChatUploadedPhotoBase": ("_root", "InputChatUploadedPhotoBase"),
+    "InputChatPhoto": ("_root", "InputChatPhoto"),
+    "InputGeoPointEmpty": ("_root", "InputGeoPointEmpty"),
+    "InputGeoPoint": ("_root", "InputGeoPoint"),
+    "InputPhotoEmpty": ("_root", "InputPhotoEmpty"),
+    "InputPhoto": ("_root", "InputPhoto"),
+    "InputFileLocation": ("_root", "InputFileLocation"),
+    "InputEncryptedFileLocation": ("_root", "InputEncryptedFileLocation"),
+    "InputDocumentFileLocation": ("_root", "InputDocumentFileLocation"),
+    "InputSecureFileLocation": ("_root", "InputSecureFileLocation"),
+    "InputTakeoutFileLocation": ("_root", "InputTakeoutFileLocation"),
+    "InputPhotoFileLocation": ("_root", "InputPhotoFileLocation"),
+    "InputPhotoLegacyFileLocation": ("_root", "InputPhotoLegacyFileLocation"),
+    "InputPeerPhotoFileLocation": ("_root", "InputPeerPhotoFileLocation"),
+    "InputStickerSetThumb": ("_root", "InputStickerSetThumb"),
+    "InputGroupCallStream": ("_root", "InputGroupCallStream"),
+    "PeerUser": ("_root", "PeerUser"),
+    "PeerChat": ("_root", "PeerChat"),
+    "PeerChannel": ("_root", "PeerChannel"),
+    "UserEmpty": ("_root", "UserEmpty"),
+    "UserBase": ("_root", "UserBase"),
+    "UserProfilePhotoEmpty": ("_root", "UserProfilePhotoEmpty"),
+    "UserProfilePhoto": ("_root", "UserProfilePhoto"),
+    "UserStatusEmpty": ("_root", "UserStatusEmpty"),
+    "UserStatusOnline": ("_root", "UserStatusOnline"),
+    "UserStatusOffline": ("_root", "UserStatusOffline"),
+    "UserStatusRecentlyBase": ("_root", "UserStatusRecentlyBase"),
+    "UserStatusLastWeekBase": ("_root", "UserStatusLastWeekBase"),
+    "UserStatusLastMonthBase": ("_root", "UserStatusLastMonthBase"),
+    "ChatEmpty": ("_root", "ChatEmpty"),
+    "Chat": ("_root", "Chat"),
+    "ChatForbidden": ("_root", "ChatForbidden"),
+    "ChannelBase": ("_root", "ChannelBase"),
+    "ChannelForbidden": ("_root", "ChannelForbidden"),
+    "ChatFullBase": ("_root", "ChatFullBase"),
+    "ChannelFullBase": ("_root", "ChannelFullBase"),
+    "ChatParticipant": ("_root", "ChatParticipant"),
+    "ChatParticipantCreator": ("_root", "ChatParticipantCreator"),
+    "ChatParticipantAdmin": ("_root", "ChatParticipantAdmin"),
+    "ChatParticipantsForbidden": ("_root", "ChatParticipantsForbidden"),
+    "ChatParticipants": ("_root", "ChatParticipants"),
+    "ChatPhotoEmpty": ("_root", "ChatPhotoEmpty"),
+    "ChatPhoto": ("_root", "ChatPhoto"),
+    "MessageEmpty": ("_root", "MessageEmpty"),
+    "MessageBase": ("_root", "MessageBase"),
+    "MessageServiceBase": ("_root", "MessageServiceBase"),
+    "MessageMediaEmpty": ("_root", "MessageMediaEmpty"),
+    "MessageMediaPhoto": ("_root", "MessageMediaPhoto"),
+    "MessageMediaGeo": ("_root", "MessageMediaGeo"),
+    "MessageMediaContact": ("_root", "MessageMediaContact"),
+    "MessageMediaUnsupported": ("_root", "MessageMediaUnsupported"),
+    "MessageMediaDocumentBase": ("_root", "MessageMediaDocumentBase"),
+    "MessageMediaWebPageBase": ("_root", "MessageMediaWebPageBase"),
+    "MessageMediaVenue": ("_root", "MessageMediaVenue"),
+    "MessageMediaGame": ("_root", "MessageMediaGame"),
+    "MessageMediaInvoiceBase": ("_root", "MessageMediaInvoiceBase"),
+    "MessageMediaGeoLive": ("_root", "MessageMediaGeoLive"),
+    "MessageMediaPoll": ("_root", "MessageMediaPoll"),
+    "MessageMediaDice": ("_root", "MessageMediaDice"),
+    "MessageMediaStoryBase": ("_root", "MessageMediaStoryBase"),
+    "MessageMediaGiveawayBase": ("_root", "MessageMediaGiveawayBase"),
+    "MessageMediaGiveawayResultsBase": ("_root", "MessageMediaGiveawayResultsBase"),
+    "MessageMediaPaidMedia": ("_root", "MessageMediaPaidMedia"),
+    "MessageActionEmpty": ("_root", "MessageActionEmpty"),
+    "MessageActionChatCreate": ("_root", "MessageActionChatCreate"),
+    "MessageActionChatEditTitle": ("_root", "MessageActionChatEditTitle"),
+    "MessageActionChatEditPhoto": ("_root", "MessageActionChatEditPhoto"),
+    "MessageActionChatDeletePhoto": ("_root", "MessageActionChatDeletePhoto"),
+    "MessageActionChatAddUser": ("_root", "MessageActionChatAddUser"),
+    "MessageActionChatDeleteUser": ("_root", "MessageActionChatDeleteUser"),
+    "MessageActionChatJoinedByLink": ("_root", "MessageActionChatJoinedByLink"),
+    "MessageActionChannelCreate": ("_root", "MessageActionChannelCreate"),
+    "MessageActionChatMigrateTo": ("_root", "MessageActionChatMigrateTo"),
+    "MessageActionChannelMigrateFrom": ("_root", "MessageActionChannelMigrateFrom"),
+    "MessageActionPinMessage": ("_root", "MessageActionPinMessage"),
+    "MessageActionHistoryClear": ("_root", "MessageActionHistoryClear"),
+    "MessageActionGameScore": ("_root", "MessageActionGameScore"),
+    "MessageActionPaymentSentMeBase": ("_root", "MessageActionPaymentSentMeBase"),
+    "MessageActionPaymentSentBase": ("_root", "MessageActionPaymentSentBase"),
+    "MessageActionPhoneCall": ("_root", "MessageActionPhoneCall"),
+    "MessageActionScreenshotTaken": ("_root", "MessageActionScreenshotTaken"),
+    "MessageActionCustomAction": ("_root", "MessageActionCustomAction"),
+    "MessageActionBotAllowedBase": ("_root", "MessageActionBotAllowedBase"),
+    "MessageActionSecureValuesSentMe": ("_root", "MessageActionSecureValuesSentMe"),
+    "MessageActionSecureValuesSent": ("_root", "MessageActionSecureValuesSent"),
+    "MessageActionContactSignUp": ("_root", "MessageActionContactSignUp"),
+    "MessageActionGeoProximityReached": ("_root", "MessageActionGeoProximityReached"),
+    "MessageActionGroupCall": ("_root", "MessageActionGroupCall"),
+    "MessageActionInviteToGroupCall": ("_root", "MessageActionInviteToGroupCall"),
+    "MessageActionSetMessagesTTLBase": ("_root", "MessageActionSetMessagesTTLBase"),
+    "MessageActionGroupCallScheduled": ("_root", "MessageActionGroupCallScheduled"),
+    "MessageActionSetChatTheme": ("_root", "MessageActionSetChatTheme"),
+    "MessageActionChatJoinedByRequest": ("_root", "MessageActionChatJoinedByRequest"),
+    "MessageActionWebViewDataSentMe": ("_root", "MessageActionWebViewDataSentMe"),
+    "MessageActionWebViewDataSent": ("_root", "MessageActionWebViewDataSent"),
+    "MessageActionGiftPremiumBase": ("_root", "MessageActionGiftPremiumBase"),
+    "MessageActionTopicCreate": ("_root", "MessageActionTopicCreate"),
+    "MessageActionTopicEditBase": ("_root", "MessageActionTopicEditBase"),
+    "MessageActionSuggestProfilePhoto": ("_root", "MessageActionSuggestProfilePhoto"),
+    "MessageActionRequestedPeerBase": ("_root", "MessageActionRequestedPeerBase"),
+    "MessageActionSetChatWallPaperBase": ("_root", "MessageActionSetChatWallPaperBase"),
+    "MessageActionGiftCodeBase": ("_root", "MessageActionGiftCodeBase"),
+    "MessageActionGiveawayLaunchBase": ("_root", "MessageActionGiveawayLaunchBase"),
+    "MessageActionGiveawayResultsBase": ("_root", "MessageActionGiveawayResultsBase"),
+    "MessageActionBoostApply": ("_root", "MessageActionBoostApply"),
+    "MessageActionRequestedPeerSentMe": ("_root", "MessageActionRequestedPeerSentMe"),
+    "MessageActionPaymentRefunded": ("_root", "MessageActionPaymentRefunded"),
+    "MessageActionGiftStars": ("_root", "MessageActionGiftStars"),
+    "MessageActionPrizeStars": ("_root", "MessageActionPrizeStars"),
+    "MessageActionStarGiftBase": ("_root", "MessageActionStarGiftBase"),
+    "MessageActionStarGiftUniqueBase": ("_root", "MessageActionStarGiftUniqueBase"),
+    "MessageActionPaidMessagesRefunded": ("_root", "MessageActionPaidMessagesRefunded"),
+    "MessageActionPaidMessagesPrice": ("_root", "MessageActionPaidMessagesPrice"),
+    "DialogBase": ("_root", "DialogBase"),
+    "DialogFolder": ("_root", "DialogFolder"),
+    "PhotoEmpty": ("_root", "PhotoEmpty"),
+    "Photo": ("_root", "Photo"),
+    "PhotoSizeEmpty": ("_root", "PhotoSizeEmpty"),
+    "PhotoSize": ("_root", "PhotoSize"),
+    "PhotoCachedSize": ("_root", "PhotoCachedSize"),
+    "PhotoStrippedSize": ("_root", "PhotoStrippedSize"),
+    "PhotoSizeProgressive": ("_root", "PhotoSizeProgressive"),
+    "PhotoPathSize": ("_root", "PhotoPathSize"),
+    "GeoPointEmpty": ("_root", "GeoPointEmpty"),
+    "GeoPoint": ("_root", "GeoPoint"),
+    "InputNotifyPeer": ("_root", "InputNotifyPeer"),
+    "InputNotifyUsers": ("_root", "InputNotifyUsers"),
+    "InputNotifyChats": ("_root", "InputNotifyChats"),
+    "InputNotifyBroadcasts": ("_root", "InputNotifyBroadcasts"),
+    "InputNotifyForumTopic": ("_root", "InputNotifyForumTopic"),
+    "InputPeerNotifySettingsBase": ("_root", "InputPeerNotifySettingsBase"),
+    "PeerNotifySettingsBase": ("_root", "PeerNotifySettingsBase"),
+    "PeerSettingsBase": ("_root", "PeerSettingsBase"),
+    "WallPaper": ("_root", "WallPaper"),
+    "WallPaperNoFile": ("_root", "WallPaperNoFile"),
+    "InputReportReasonSpam": ("_root", "InputReportReasonSpam"),
+    "InputReportReasonViolence": ("_root", "InputReportReasonViolence"),
+    "InputReportReasonPornography": ("_root", "InputReportReasonPornography"),
+    "InputReportReasonChildAbuse": ("_root", "InputReportReasonChildAbuse"),
+    "InputReportReasonOther": ("_root", "InputReportReasonOther"),
+    "InputReportReasonCopyright": ("_root", "InputReportReasonCopyright"),
+    "InputReportReasonGeoIrrelevant": ("_root", "InputReportReasonGeoIrrelevant"),
+    "InputReportReasonFake": ("_root", "InputReportReasonFake"),
+    "InputReportReasonIllegalDrugs": ("_root", "InputReportReasonIllegalDrugs"),
+    "InputReportReasonPersonalDetails": ("_root", "InputReportReasonPersonalDetails"),
+    "UserFullBase": ("_root", "UserFullBase"),
+    "Contact": ("_root", "Contact"),
+    "ImportedContact": ("_root", "ImportedContact"),
+    "ContactStatus": ("_root", "ContactStatus"),
+    "InputMessagesFilterEmpty": ("_root", "InputMessagesFilterEmpty"),
+    "InputMessagesFilterPhotos": ("_root", "InputMessagesFilterPhotos"),
+    "InputMessagesFilterVideo": ("_root", "InputMessagesFilterVideo"),
+    "InputMessagesFilterPhotoVideo": ("_root", "InputMessagesFilterPhotoVideo"),
+    "InputMessagesFilterDocument": ("_root", "InputMessagesFilterDocument"),
+    "InputMessagesFilterUrl": ("_root", "InputMessagesFilterUrl"),
+    "InputMessagesFilterGif": ("_root", "InputMessagesFilterGif"),
+    "InputMessagesFilterVoice": ("_root", "InputMessagesFilterVoice"),
+    "InputMessagesFilterMusic": ("_root", "InputMessagesFilterMusic"),
+    "InputMessagesFilterChatPhotos": ("_root", "InputMessagesFilterChatPhotos"),
+    "InputMessagesFilterPhoneCalls": ("_root", "InputMessagesFilterPhoneCalls"),
+    "InputMessagesFilterRoundVoice": ("_root", "InputMessagesFilterRoundVoice"),
+    "InputMessagesFilterRoundVideo": ("_root", "InputMessagesFilterRoundVideo"),
+    "InputMessagesFilterMyMentions": ("_root", "InputMessagesFilterMyMentions"),
+    "InputMessagesFilterGeo": ("_root", "InputMessagesFilterGeo"),
+    "InputMessagesFilterContacts": ("_root", "InputMessagesFilterContacts"),
+    "InputMessagesFilterPinned": ("_root", "InputMessagesFilterPinned"),
+    "UpdateNewMessage": ("_root", "UpdateNewMessage"),
+    "UpdateMessageID": ("_root", "UpdateMessageID"),
+    "UpdateDeleteMessages": ("_root", "UpdateDeleteMessages"),
+    "UpdateUserTyping": ("_root", "UpdateUserTyping"),
+    "UpdateChatUserTyping": ("_root", "UpdateChatUserTyping"),
+    "UpdateChatParticipants": ("_root", "UpdateChatParticipants"),
+    "UpdateUserStatus": ("_root", "UpdateUserStatus"),
+    "UpdateUserNameBase": ("_root", "UpdateUserNameBase"),
+    "UpdateNewAuthorization": ("_root", "UpdateNewAuthorization"),
+    "UpdateNewEncryptedMessage": ("_root", "UpdateNewEncryptedMessage"),
+    "UpdateEncryptedChatTyping": ("_root", "UpdateEncryptedChatTyping"),
+    "UpdateEncryption": ("_root", "UpdateEncryption"),
+    "UpdateEncryptedMessagesRead": ("_root", "UpdateEncryptedMessagesRead"),
+    "UpdateChatParticipantAdd": ("_root", "UpdateChatParticipantAdd"),
+    "UpdateChatParticipantDelete": ("_root", "UpdateChatParticipantDelete"),
+    "UpdateDcOptions": ("_root", "UpdateDcOptions"),
+    "UpdateNotifySettings": ("_root", "UpdateNotifySettings"),
+    "UpdateServiceNotification": ("_root", "UpdateServiceNotification"),
+    "UpdatePrivacy": ("_root", "UpdatePrivacy"),
+    "UpdateUserPhone": ("_root", "UpdateUserPhone"),
+    "UpdateReadHistoryInbox": ("_root", "UpdateReadHistoryInbox"),
+    "UpdateReadHistoryOutbox": ("_root", "UpdateReadHistoryOutbox"),
+    "UpdateWebPage": ("_root", "UpdateWebPage"),
+    "UpdateReadMessagesContentsBase": ("_root", "UpdateReadMessagesContentsBase"),
+    "UpdateChannelTooLong": ("_root", "UpdateChannelTooLong"),
+    "UpdateChannel": ("_root", "UpdateChannel"),
+    "UpdateNewChannelMessage": ("_root", "UpdateNewChannelMessage"),
+    "UpdateReadChannelInbox": ("_root", "UpdateReadChannelInbox"),
+    "UpdateDeleteChannelMessages": ("_root", "UpdateDeleteChannelMessages"),
+    "UpdateChannelMessageViews": ("_root", "UpdateChannelMessageViews"),
+    "UpdateChatParticipantAdmin": ("_root", "UpdateChatParticipantAdmin"),
+    "UpdateNewStickerSet": ("_root", "UpdateNewStickerSet"),
+    "UpdateStickerSetsOrder": ("_root", "UpdateStickerSetsOrder"),
+    "UpdateStickerSetsBase": ("_root", "UpdateStickerSetsBase"),
+    "UpdateSavedGifs": ("_root", "UpdateSavedGifs"),
+    "UpdateBotInlineQuery": ("_root", "UpdateBotInlineQuery"),
+    "UpdateBotInlineSend": ("_root", "UpdateBotInlineSend"),
+    "UpdateEditChannelMessage": ("_root", "UpdateEditChannelMessage"),
+    "UpdateBotCallbackQuery": ("_root", "UpdateBotCallbackQuery"),
+    "UpdateEditMessage": ("_root", "UpdateEditMessage"),
+    "UpdateInlineBotCallbackQuery": ("_root", "UpdateInlineBotCallbackQuery"),
+    "UpdateReadChannelOutbox": ("_root", "UpdateReadChannelOutbox"),
+    "UpdateDraftMessageBase": ("_root", "UpdateDraftMessageBase"),
+    "UpdateReadFeaturedStickers": ("_root", "UpdateReadFeaturedStickers"),
+    "UpdateRecentStickers": ("_root", "UpdateRecentStickers"),
+    "UpdateConfig": ("_root", "UpdateConfig"),
+    "UpdatePtsChanged": ("_root", "UpdatePtsChanged"),
+    "UpdateChannelWebPage": ("_root", "UpdateChannelWebPage"),
+    "UpdateDialogPinned": ("_root", "UpdateDialogPinned"),
+    "UpdatePinnedDialogs": ("_root", "UpdatePinnedDialogs"),
+    "UpdateBotWebhookJSON": ("_root", "UpdateBotWebhookJSON"),
+    "UpdateBotWebhookJSONQuery": ("_root", "UpdateBotWebhookJSONQuery"),
+    "UpdateBotShippingQuery": ("_root", "UpdateBotShippingQuery"),
+    "UpdateBotPrecheckoutQuery": ("_root", "UpdateBotPrecheckoutQuery"),
+    "UpdatePhoneCall": ("_root", "UpdatePhoneCall"),
+    "UpdateLangPackTooLong": ("_root", "UpdateLangPackTooLong"),
+    "UpdateLangPack": ("_root", "UpdateLangPack"),
+    "UpdateFavedStickers": ("_root", "UpdateFavedStickers"),
+    "UpdateChannelReadMessagesContentsBase": ("_root", "UpdateChannelReadMessagesContentsBase"),
+    "UpdateContactsReset": ("_root", "UpdateContactsReset"),
+    "UpdateChannelAvailableMessages": ("_root", "UpdateChannelAvailableMessages"),
+    "UpdateDialogUnreadMark": ("_root", "UpdateDialogUnreadMark"),
+    "UpdateMessagePoll": ("_root", "UpdateMessagePoll"),
+    "UpdateChatDefaultBannedRights": ("_root", "UpdateChatDefaultBannedRights"),
+    "UpdateFolderPeers": ("_root", "UpdateFolderPeers"),
+    "UpdatePeerSettings": ("_root", "UpdatePeerSettings"),
+    "UpdatePeerLocated": ("_root", "UpdatePeerLocated"),
+    "UpdateNewScheduledMessage": ("_root", "UpdateNewScheduledMessage"),
+    "UpdateDeleteScheduledMessagesBase": ("_root", "UpdateDeleteScheduledMessagesBase"),
+    "UpdateTheme": ("_root", "UpdateTheme"),
+    "UpdateGeoLiveViewed": ("_root", "UpdateGeoLiveViewed"),
+    "UpdateLoginToken": ("_root", "UpdateLoginToken"),
+    "UpdateMessagePollVoteBase": ("_root", "UpdateMessagePollVoteBase"),
+    "UpdateDialogFilter": ("_root", "UpdateDialogFilter"),
+    "UpdateDialogFilterOrder": ("_root", "UpdateDialogFilterOrder"),
+    "UpdateDialogFilters": ("_root", "UpdateDialogFilters"),
+    "UpdatePhoneCallSignalingData": ("_root", "UpdatePhoneCallSignalingData"),
+    "UpdateChannelMessageForwards": ("_root", "UpdateChannelMessageForwards"),
+    "UpdateReadChannelDiscussionInbox": ("_root", "UpdateReadChannelDiscussionInbox"),
+    "UpdateReadChannelDiscussionOutbox": ("_root", "UpdateReadChannelDiscussionOutbox"),
+    "UpdatePeerBlockedBase": ("_root", "UpdatePeerBlockedBase"),
+    "UpdateChannelUserTyping": ("_root", "UpdateChannelUserTyping"),
+    "UpdatePinnedMessages": ("_root", "UpdatePinnedMessages"),
+    "UpdatePinnedChannelMessages": ("_root", "UpdatePinnedChannelMessages"),
+    "UpdateChat": ("_root", "UpdateChat"),
+    "UpdateGroupCallParticipants": ("_root", "UpdateGroupCallParticipants"),
+    "UpdateGroupCallBase": ("_root", "UpdateGroupCallBase"),
+    "UpdatePeerHistoryTTL": ("_root", "UpdatePeerHistoryTTL"),
+    "UpdateChatParticipant": ("_root", "UpdateChatParticipant"),
+    "UpdateChannelParticipant": ("_root", "UpdateChannelParticipant"),
+    "UpdateBotStopped": ("_root", "UpdateBotStopped"),
+    "UpdateGroupCallConnection": ("_root", "UpdateGroupCallConnection"),
+    "UpdateBotCommands": ("_root", "UpdateBotCommands"),
+    "UpdatePendingJoinRequests": ("_root", "UpdatePendingJoinRequests"),
+    "UpdateBotChatInviteRequester": ("_root", "UpdateBotChatInviteRequester"),
+    "UpdateMessageReactionsBase": ("_root", "UpdateMessageReactionsBase"),
+    "UpdateAttachMenuBots": ("_root", "UpdateAttachMenuBots"),
+    "UpdateWebViewResultSent": ("_root", "UpdateWebViewResultSent"),
+    "UpdateBotMenuButton": ("_root", "UpdateBotMenuButton"),
+    "UpdateSavedRingtones": ("_root", "UpdateSavedRingtones"),
+    "UpdateTranscribedAudio": ("_root", "UpdateTranscribedAudio"),
+    "UpdateReadFeaturedEmojiStickers": ("_root", "UpdateReadFeaturedEmojiStickers"),
+    "UpdateUserEmojiStatus": ("_root", "UpdateUserEmojiStatus"),
+    "UpdateRecentEmojiStatuses": ("_root", "UpdateRecentEmojiStatuses"),
+    "UpdateRecentReactions": ("_root", "UpdateRecentReactions"),
+    "UpdateMoveStickerSetToTop": ("_root", "UpdateMoveStickerSetToTop"),
+    "UpdateMessageExtendedMediaBase": ("_root", "UpdateMessageExtendedMediaBase"),
+    "UpdateChannelPinnedTopicBase": ("_root", "UpdateChannelPinnedTopicBase"),
+    "UpdateChannelPinnedTopics": ("_root", "UpdateChannelPinnedTopics"),
+    "UpdateUser": ("_root", "UpdateUser"),
+    "UpdateAutoSaveSettings": ("_root", "UpdateAutoSaveSettings"),
+    "UpdateStoryBase": ("_root", "UpdateStoryBase"),
+    "UpdateReadStoriesBase": ("_root", "UpdateReadStoriesBase"),
+    "UpdateStoryID": ("_root", "UpdateStoryID"),
+    "UpdateStoriesStealthMode": ("_root", "UpdateStoriesStealthMode"),
+    "UpdateSentStoryReactionBase": ("_root", "UpdateSentStoryReactionBase"),
+    "UpdateBotChatBoost": ("_root", "UpdateBotChatBoost"),
+    "UpdateChannelViewForumAsMessages": ("_root", "UpdateChannelViewForumAsMessages"),
+    "UpdatePeerWallpaper": ("_root", "UpdatePeerWallpaper"),
+    "UpdateBotMessageReaction": ("_root", "UpdateBotMessageReaction"),
+    "UpdateBotMessageReactions": ("_root", "UpdateBotMessageReactions"),
+    "UpdateSavedDialogPinned": ("_root", "UpdateSavedDialogPinned"),
+    "UpdatePinnedSavedDialogs": ("_root", "UpdatePinnedSavedDialogs"),
+    "UpdateSavedReactionTags": ("_root", "UpdateSavedReactionTags"),
+    "UpdateSmsJob": ("_root", "UpdateSmsJob"),
+    "UpdateQuickReplies": ("_root", "UpdateQuickReplies"),
+    "UpdateNewQuickReply": ("_root", "UpdateNewQuickReply"),
+    "UpdateDeleteQuickReply": ("_root", "UpdateDeleteQuickReply"),
+    "UpdateQuickReplyMessage": ("_root", "UpdateQuickReplyMessage"),
+    "UpdateDeleteQuickReplyMessages": ("_root", "UpdateDeleteQuickReplyMessages"),
+    "UpdateBotBusinessConnect": ("_root", "UpdateBotBusinessConnect"),
+    "UpdateBotNewBusinessMessage": ("_root", "UpdateBotNewBusinessMessage"),
+    "UpdateBotEditBusinessMessage": ("_root", "UpdateBotEditBusinessMessage"),
+    "UpdateBotDeleteBusinessMessage": ("_root", "UpdateBotDeleteBusinessMessage"),
+    "UpdateNewStoryReaction": ("_root", "UpdateNewStoryReaction"),
+    "UpdateBroadcastRevenueTransactionsBase": ("_root", "UpdateBroadcastRevenueTransactionsBase"),
+    "UpdateStarsBalanceBase": ("_root", "UpdateStarsBalanceBase"),
+    "UpdateBusinessBotCallbackQuery": ("_root", "UpdateBusinessBotCallbackQuery"),
+    "UpdateStarsRevenueStatus": ("_root", "UpdateStarsRevenueStatus"),
+    "UpdateBotPurchasedPaidMedia": ("_root", "UpdateBotPurchasedPaidMedia"),
+    "UpdatePaidReactionPrivacyBase": ("_root", "UpdatePaidReactionPrivacyBase"),
+    "UpdateSentPhoneCode": ("_root", "UpdateSentPhoneCode"),
+    "UpdatesTooLong": ("_root", "UpdatesTooLong"),
+    "UpdateShortMessage": ("_root", "UpdateShortMessage"),
+    "UpdateShortChatMessage": ("_root", "UpdateShortChatMessage"),
+    "UpdateShort": ("_root", "UpdateShort"),
+    "UpdatesCombined": ("_root", "UpdatesCombined"),
+    "Updates": ("_root", "Updates"),
+    "UpdateShortSentMessage": ("_root", "UpdateShortSentMessage"),
+    "DcOption": ("_root", "DcOption"),
+    "ConfigBase": ("_root", "ConfigBase"),
+    "NearestDc": ("_root", "NearestDc"),
+    "EncryptedChatEmpty": ("_root", "EncryptedChatEmpty"),
+    "EncryptedChatWaiting": ("_root", "EncryptedChatWaiting"),
+    "EncryptedChatRequested": ("_root", "EncryptedChatRequested"),
+    "EncryptedChat": ("_root", "EncryptedChat"),
+    "EncryptedChatDiscarded": ("_root", "EncryptedChatDiscarded"),
+    "InputEncryptedChat": ("_root", "InputEncryptedChat"),
+    "EncryptedFileEmpty": ("_root", "EncryptedFileEmpty"),
+    "EncryptedFileBase": ("_root", "EncryptedFileBase"),
+    "InputEncryptedFileEmpty": ("_root", "InputEncryptedFileEmpty"),
+    "InputEncryptedFileUploaded": ("_root", "InputEncryptedFileUploaded"),
+    "InputEncryptedFile": ("_root", "InputEncryptedFile"),
+    "InputEncryptedFileBigUploaded": ("_root", "InputEncryptedFileBigUploaded"),
+    "EncryptedMessage": ("_root", "EncryptedMessage"),
+    "EncryptedMessageService": ("_root", "EncryptedMessageService"),
+    "InputDocumentEmpty": ("_root", "InputDocumentEmpty"),
+    "InputDocument": ("_root", "InputDocument"),
+    "DocumentEmpty": ("_root", "DocumentEmpty"),
+    "DocumentBase": ("_root", "DocumentBase"),
+    "NotifyPeer": ("_root", "NotifyPeer"),
+    "NotifyUsers": ("_root", "NotifyUsers"),
+    "NotifyChats": ("_root", "NotifyChats"),
+    "NotifyBroadcasts": ("_root", "NotifyBroadcasts"),
+    "NotifyForumTopic": ("_root", "NotifyForumTopic"),
+    "SendMessageTypingAction": ("_root", "SendMessageTypingAction"),
+    "SendMessageCancelAction": ("_root", "SendMessageCancelAction"),
+    "SendMessageRecordVideoAction": ("_root", "SendMessageRecordVideoAction"),
+    "SendMessageUploadVideoAction": ("_root", "SendMessageUploadVideoAction"),
+    "SendMessageRecordAudioAction": ("_root", "SendMessageRecordAudioAction"),
+    "SendMessageUploadAudioAction": ("_root", "SendMessageUploadAudioAction"),
+    "SendMessageUploadPhotoAction": ("_root", "SendMessageUploadPhotoAction"),
+    "SendMessageUploadDocumentAction": ("_root", "SendMessageUploadDocumentAction"),
+    "SendMessageGeoLocationAction": ("_root", "SendMessageGeoLocationAction"),
+    "SendMessageChooseContactAction": ("_root", "SendMessageChooseContactAction"),
+    "SendMessageGamePlayAction": ("_root", "SendMessageGamePlayAction"),
+    "SendMessageRecordRoundAction": ("_root", "SendMessageRecordRoundAction"),
+    "SendMessageUploadRoundAction": ("_root", "SendMessageUploadRoundAction"),
+    "SpeakingInGroupCallAction": ("_root", "SpeakingInGroupCallAction"),
+    "SendMessageHistoryImportAction": ("_root", "SendMessageHistoryImportAction"),
+    "SendMessageChooseStickerAction": ("_root", "SendMessageChooseStickerAction"),
+    "SendMessageEmojiInteraction": ("_root", "SendMessageEmojiInteraction"),
+    "SendMessageEmojiInteractionSeen": ("_root", "SendMessageEmojiInteractionSeen"),
+    "InputPrivacyKeyStatusTimestamp": ("_root", "InputPrivacyKeyStatusTimestamp"),
+    "InputPrivacyKeyChatInvite": ("_root", "InputPrivacyKeyChatInvite"),
+    "InputPrivacyKeyPhoneCall": ("_root", "InputPrivacyKeyPhoneCall"),
+    "InputPrivacyKeyPhoneP2P": ("_root", "InputPrivacyKeyPhoneP2P"),
+    "InputPrivacyKeyForwards": ("_root", "InputPrivacyKeyForwards"),
+    "InputPrivacyKeyProfilePhoto": ("_root", "InputPrivacyKeyProfilePhoto"),
+    "InputPrivacyKeyPhoneNumber": ("_root", "InputPrivacyKeyPhoneNumber"),
+    "InputPrivacyKeyAddedByPhone": ("_root", "InputPrivacyKeyAddedByPhone"),
+    "InputPrivacyKeyVoiceMessages": ("_root", "InputPrivacyKeyVoiceMessages"),
+    "InputPrivacyKeyAbout": ("_root", "InputPrivacyKeyAbout"),
+    "InputPrivacyKeyBirthday": ("_root", "InputPrivacyKeyBirthday"),
+    "InputPrivacyKeyStarGiftsAutoSave": ("_root", "InputPrivacyKeyStarGiftsAutoSave"),
+    "InputPrivacyKeyNoPaidMessages": ("_root", "InputPrivacyKeyNoPaidMessages"),
+    "PrivacyKeyStatusTimestamp": ("_root", "PrivacyKeyStatusTimestamp"),
+    "PrivacyKeyChatInvite": ("_root", "PrivacyKeyChatInvite"),
+    "PrivacyKeyPhoneCall": ("_root", "PrivacyKeyPhoneCall"),
+    "PrivacyKeyPhoneP2P": ("_root", "PrivacyKeyPhoneP2P"),
+    "PrivacyKeyForwards": ("_root", "PrivacyKeyForwards"),
+    "PrivacyKeyProfilePhoto": ("_root", "PrivacyKeyProfilePhoto"),
+    "PrivacyKeyPhoneNumber": ("_root", "PrivacyKeyPhoneNumber"),
+    "PrivacyKeyAddedByPhone": ("_root", "PrivacyKeyAddedByPhone"),
+    "PrivacyKeyVoiceMessages": ("_root", "PrivacyKeyVoiceMessages"),
+    "PrivacyKeyAbout": ("_root", "PrivacyKeyAbout"),
+    "PrivacyKeyBirthday": ("_root", "PrivacyKeyBirthday"),
+    "PrivacyKeyStarGiftsAutoSave": ("_root", "PrivacyKeyStarGiftsAutoSave"),
+    "PrivacyKeyNoPaidMessages": ("_root", "PrivacyKeyNoPaidMessages"),
+    "InputPrivacyValueAllowContacts": ("_root", "InputPrivacyValueAllowContacts"),
+    "InputPrivacyValueAllowAll": ("_root", "InputPrivacyValueAllowAll"),
+    "InputPrivacyValueAllowUsers": ("_root", "InputPrivacyValueAllowUsers"),
+    "InputPrivacyValueDisallowContacts": ("_root", "InputPrivacyValueDisallowContacts"),
+    "InputPrivacyValueDisallowAll": ("_root", "InputPrivacyValueDisallowAll"),
+    "InputPrivacyValueDisallowUsers": ("_root", "InputPrivacyValueDisallowUsers"),
+    "InputPrivacyValueAllowChatParticipants": ("_root", "InputPrivacyValueAllowChatParticipants"),
+    "InputPrivacyValueDisallowChatParticipants": ("_root", "InputPrivacyValueDisallowChatParticipants"),
+    "InputPrivacyValueAllowCloseFriends": ("_root", "InputPrivacyValueAllowCloseFriends"),
+    "InputPrivacyValueAllowPremium": ("_root", "InputPrivacyValueAllowPremium"),
+    "InputPrivacyValueAllowBots": ("_root", "InputPrivacyValueAllowBots"),
+    "InputPrivacyValueDisallowBots": ("_root", "InputPrivacyValueDisallowBots"),
+    "PrivacyValueAllowContacts": ("_root", "PrivacyValueAllowContacts"),
+    "PrivacyValueAllowAll": ("_root", "PrivacyValueAllowAll"),
+    "PrivacyValueAllowUsers": ("_root", "PrivacyValueAllowUsers"),
+    "PrivacyValueDisallowContacts": ("_root", "PrivacyValueDisallowContacts"),
+    "PrivacyValueDisallowAll": ("_root", "PrivacyValueDisallowAll"),
+    "PrivacyValueDisallowUsers": ("_root", "PrivacyValueDisallowUsers"),
+    "PrivacyValueAllowChatParticipants": ("_root", "PrivacyValueAllowChatParticipants"),
+    "PrivacyValueDisallowChatParticipants": ("_root", "PrivacyValueDisallowChatParticipants"),
+    "PrivacyValueAllowCloseFriends": ("_root", "PrivacyValueAllowCloseFriends"),
+    "PrivacyValueAllowPremium": ("_root", "PrivacyValueAllowPremium"),
+    "PrivacyValueAllowBots": ("_root", "PrivacyValueAllowBots"),
+    "PrivacyValueDisallowBots": ("_root", "PrivacyValueDisallowBots"),
+    "AccountDaysTTL": ("_root", "AccountDaysTTL"),
+    "DocumentAttributeImageSize": ("_root", "DocumentAttributeImageSize"),
+    "DocumentAttributeAnimated": ("_root", "DocumentAttributeAnimated"),
+    "DocumentAttributeSticker": ("_root", "DocumentAttributeSticker"),
+    "DocumentAttributeVideoBase": ("_root", "DocumentAttributeVideoBase"),
+    "DocumentAttributeAudio": ("_root", "DocumentAttributeAudio"),
+    "DocumentAttributeFilename": ("_root", "DocumentAttributeFilename"),
+    "DocumentAttributeHasStickers": ("_root", "DocumentAttributeHasStickers"),
+    "DocumentAttributeCustomEmoji": ("_root", "DocumentAttributeCustomEmoji"),
+    "StickerPack": ("_root", "StickerPack"),
+    "WebPageEmptyBase": ("_root", "WebPageEmptyBase"),
+    "WebPagePendingBase": ("_root", "WebPagePendingBase"),
+    "WebPage": ("_root", "WebPage"),
+    "WebPageNotModified": ("_root", "WebPageNotModified"),
+    "Authorization": ("_root", "Authorization"),
+    "ReceivedNotifyMessage": ("_root", "ReceivedNotifyMessage"),
+    "ChatInviteExportedBase": ("_root", "ChatInviteExportedBase"),
+    "ChatInvitePublicJoinRequests": ("_root", "ChatInvitePublicJoinRequests"),
+    "ChatInviteAlready": ("_root", "ChatInviteAlready"),
+    "ChatInviteBase": ("_root", "ChatInviteBase"),
+    "ChatInvitePeek": ("_root", "ChatInvitePeek"),
+    "InputStickerSetEmpty": ("_root", "InputStickerSetEmpty"),
+    "InputStickerSetID": ("_root", "InputStickerSetID"),
+    "InputStickerSetShortName": ("_root", "InputStickerSetShortName"),
+    "InputStickerSetAnimatedEmoji": ("_root", "InputStickerSetAnimatedEmoji"),
+    "InputStickerSetDice": ("_root", "InputStickerSetDice"),
+    "InputStickerSetAnimatedEmojiAnimations": ("_root", "InputStickerSetAnimatedEmojiAnimations"),
+    "InputStickerSetPremiumGifts": ("_root", "InputStickerSetPremiumGifts"),
+    "InputStickerSetEmojiGenericAnimations": ("_root", "InputStickerSetEmojiGenericAnimations"),
+    "InputStickerSetEmojiDefaultStatuses": ("_root", "InputStickerSetEmojiDefaultStatuses"),
+    "InputStickerSetEmojiDefaultTopicIcons": ("_root", "InputStickerSetEmojiDefaultTopicIcons"),
+    "InputStickerSetEmojiChannelDefaultStatuses": ("_root", "InputStickerSetEmojiChannelDefaultStatuses"),
+    "StickerSetBase": ("_root", "StickerSetBase"),
+    "BotCommand": ("_root", "BotCommand"),
+    "BotInfoBase": ("_root", "BotInfoBase"),
+    "KeyboardButton": ("_root", "KeyboardButton"),
+    "KeyboardButtonUrl": ("_root", "KeyboardButtonUrl"),
+    "KeyboardButtonCallback": ("_root", "KeyboardButtonCallback"),
+    "KeyboardButtonRequestPhone": ("_root", "KeyboardButtonRequestPhone"),
+    "KeyboardButtonRequestGeoLocation": ("_root", "KeyboardButtonRequestGeoLocation"),
+    "KeyboardButtonSwitchInlineBase": ("_root", "KeyboardButtonSwitchInlineBase"),
+    "KeyboardButtonGame": ("_root", "KeyboardButtonGame"),
+    "KeyboardButtonBuy": ("_root", "KeyboardButtonBuy"),
+    "KeyboardButtonUrlAuth": ("_root", "KeyboardButtonUrlAuth"),
+    "InputKeyboardButtonUrlAuth": ("_root", "InputKeyboardButtonUrlAuth"),
+    "KeyboardButtonRequestPoll": ("_root", "KeyboardButtonRequestPoll"),
+    "InputKeyboardButtonUserProfile": ("_root", "InputKeyboardButtonUserProfile"),
+    "KeyboardButtonUserProfile": ("_root", "KeyboardButtonUserProfile"),
+    "KeyboardButtonWebView": ("_root", "KeyboardButtonWebView"),
+    "KeyboardButtonSimpleWebView": ("_root", "KeyboardButtonSimpleWebView"),
+    "KeyboardButtonRequestPeerBase": ("_root", "KeyboardButtonRequestPeerBase"),
+    "InputKeyboardButtonRequestPeer": ("_root", "InputKeyboardButtonRequestPeer"),
+    "KeyboardButtonCopy": ("_root", "KeyboardButtonCopy"),
+    "KeyboardButtonRow": ("_root", "KeyboardButtonRow"),
+    "ReplyKeyboardHide": ("_root", "ReplyKeyboardHide"),
+    "ReplyKeyboardForceReply": ("_root", "ReplyKeyboardForceReply"),
+    "ReplyKeyboardMarkup": ("_root", "ReplyKeyboardMarkup"),
+    "ReplyInlineMarkup": ("_root", "ReplyInlineMarkup"),
+    "MessageEntityUnknown": ("_root", "MessageEntityUnknown"),
+    "MessageEntityMention": ("_root", "MessageEntityMention"),
+    "MessageEntityHashtag": ("_root", "MessageEntityHashtag"),
+    "MessageEntityBotCommand": ("_root", "MessageEntityBotCommand"),
+    "MessageEntityUrl": ("_root", "MessageEntityUrl"),
+    "MessageEntityEmail": ("_root", "MessageEntityEmail"),
+    "MessageEntityBold": ("_root", "MessageEntityBold"),
+    "MessageEntityItalic": ("_root", "MessageEntityItalic"),
+    "MessageEntityCode": ("_root", "MessageEntityCode"),
+    "MessageEntityPre": ("_root", "MessageEntityPre"),
+    "MessageEntityTextUrl": ("_root", "MessageEntityTextUrl"),
+    "MessageEntityMentionName": ("_root", "MessageEntityMentionName"),
+    "InputMessageEntityMentionName": ("_root", "InputMessageEntityMentionName"),
+    "MessageEntityPhone": ("_root", "MessageEntityPhone"),
+    "MessageEntityCashtag": ("_root", "MessageEntityCashtag"),
+    "MessageEntityUnderline": ("_root", "MessageEntityUnderline"),
+    "MessageEntityStrike": ("_root", "MessageEntityStrike"),
+    "MessageEntityBankCard": ("_root", "MessageEntityBankCard"),
+    "MessageEntitySpoiler": ("_root", "MessageEntitySpoiler"),
+    "MessageEntityCustomEmoji": ("_root", "MessageEntityCustomEmoji"),
+    "MessageEntityBlockquoteBase": ("_root", "MessageEntityBlockquoteBase"),
+    "InputChannelEmpty": ("_root", "InputChannelEmpty"),
+    "InputChannel": ("_root", "InputChannel"),
+    "InputChannelFromMessage": ("_root", "InputChannelFromMessage"),
+    "MessageRange": ("_root", "MessageRange"),
+    "ChannelMessagesFilterEmpty": ("_root", "ChannelMessagesFilterEmpty"),
+    "ChannelMessagesFilter": ("_root", "ChannelMessagesFilter"),
+    "ChannelParticipantBase": ("_root", "ChannelParticipantBase"),
+    "ChannelParticipantSelfBase": ("_root", "ChannelParticipantSelfBase"),
+    "ChannelParticipantCreator": ("_root", "ChannelParticipantCreator"),
+    "ChannelParticipantAdmin": ("_root", "ChannelParticipantAdmin"),
+    "ChannelParticipantBanned": ("_root", "ChannelParticipantBanned"),
+    "ChannelParticipantLeft": ("_root", "ChannelParticipantLeft"),
+    "ChannelParticipantsRecent": ("_root", "ChannelParticipantsRecent"),
+    "ChannelParticipantsAdmins": ("_root", "ChannelParticipantsAdmins"),
+    "ChannelParticipantsKicked": ("_root", "ChannelParticipantsKicked"),
+    "ChannelParticipantsBots": ("_root", "ChannelParticipantsBots"),
+    "ChannelParticipantsBanned": ("_root", "ChannelParticipantsBanned"),
+    "ChannelParticipantsSearch": ("_root", "ChannelParticipantsSearch"),
+    "ChannelParticipantsContacts": ("_root", "ChannelParticipantsContacts"),
+    "ChannelParticipantsMentions": ("_root", "ChannelParticipantsMentions"),
+    "InputBotInlineMessageMediaAuto": ("_root", "InputBotInlineMessageMediaAuto"),
+    "InputBotInlineMessageText": ("_root", "InputBotInlineMessageText"),
+    "InputBotInlineMessageMediaGeo": ("_root", "InputBotInlineMessageMediaGeo"),
+    "InputBotInlineMessageMediaVenue": ("_root", "InputBotInlineMessageMediaVenue"),
+    "InputBotInlineMessageMediaContact": ("_root", "InputBotInlineMessageMediaContact"),
+    "InputBotInlineMessageGame": ("_root", "InputBotInlineMessageGame"),
+    "InputBotInlineMessageMediaInvoice": ("_root", "InputBotInlineMessageMediaInvoice"),
+    "InputBotInlineMessageMediaWebPage": ("_root", "InputBotInlineMessageMediaWebPage"),
+    "InputBotInlineResult": ("_root", "InputBotInlineResult"),
+    "InputBotInlineResultPhoto": ("_root", "InputBotInlineResultPhoto"),
+    "InputBotInlineResultDocument": ("_root", "InputBotInlineResultDocument"),
+    "InputBotInlineResultGame": ("_root", "InputBotInlineResultGame"),
+    "BotInlineMessageMediaAuto": ("_root", "BotInlineMessageMediaAuto"),
+    "BotInlineMessageText": ("_root", "BotInlineMessageText"),
+    "BotInlineMessageMediaGeo": ("_root", "BotInlineMessageMediaGeo"),
+    "BotInlineMessageMediaVenue": ("_root", "BotInlineMessageMediaVenue"),
+    "BotInlineMessageMediaContact": ("_root", "BotInlineMessageMediaContact"),
+    "BotInlineMessageMediaInvoice": ("_root", "BotInlineMessageMediaInvoice"),
+    "BotInlineMessageMediaWebPage": ("_root", "BotInlineMessageMediaWebPage"),
+    "BotInlineResult": ("_root", "BotInlineResult"),
+    "BotInlineMediaResult": ("_root", "BotInlineMediaResult"),
+    "ExportedMessageLink": ("_root", "ExportedMessageLink"),
+    "MessageFwdHeaderBase": ("_root", "MessageFwdHeaderBase"),
+    "InputBotInlineMessageID": ("_root", "InputBotInlineMessageID"),
+    "InputBotInlineMessageID64": ("_root", "InputBotInlineMessageID64"),
+    "InlineBotSwitchPM": ("_root", "InlineBotSwitchPM"),
+    "TopPeer": ("_root", "TopPeer"),
+    "TopPeerCategoryBotsPM": ("_root", "TopPeerCategoryBotsPM"),
+    "TopPeerCategoryBotsInline": ("_root", "TopPeerCategoryBotsInline"),
+    "TopPeerCategoryCorrespondents": ("_root", "TopPeerCategoryCorrespondents"),
+    "TopPeerCategoryGroups": ("_root", "TopPeerCategoryGroups"),
+    "TopPeerCategoryChannels": ("_root", "TopPeerCategoryChannels"),
+    "TopPeerCategoryPhoneCalls": ("_root", "TopPeerCategoryPhoneCalls"),
+    "TopPeerCategoryForwardUsers": ("_root", "TopPeerCategoryForwardUsers"),
+    "TopPeerCategoryForwardChats": ("_root", "TopPeerCategoryForwardChats"),
+    "TopPeerCategoryBotsApp": ("_root", "TopPeerCategoryBotsApp"),
+    "TopPeerCategoryPeers": ("_root", "TopPeerCategoryPeers"),
+    "DraftMessageEmpty": ("_root", "DraftMessageEmpty"),
+    "DraftMessageBase": ("_root", "DraftMessageBase"),
+    "StickerSetCovered": ("_root", "StickerSetCovered"),
+    "StickerSetMultiCovered": ("_root", "StickerSetMultiCovered"),
+    "StickerSetFullCoveredBase": ("_root", "StickerSetFullCoveredBase"),
+    "StickerSetNoCovered": ("_root", "StickerSetNoCovered"),
+    "MaskCoords": ("_root", "MaskCoords"),
+    "InputStickeredMediaPhoto": ("_root", "InputStickeredMediaPhoto"),
+    "InputStickeredMediaDocument": ("_root", "InputStickeredMediaDocument"),
+    "Game": ("_root", "Game"),
+    "InputGameID": ("_root", "InputGameID"),
+    "InputGameShortName": ("_root", "InputGameShortName"),
+    "HighScore": ("_root", "HighScore"),
+    "TextEmpty": ("_root", "TextEmpty"),
+    "TextPlain": ("_root", "TextPlain"),
+    "TextBold": ("_root", "TextBold"),
+    "TextItalic": ("_root", "TextItalic"),
+    "TextUnderline": ("_root", "TextUnderline"),
+    "TextStrike": ("_root", "TextStrike"),
+    "TextFixed": ("_root", "TextFixed"),
+    "TextUrl": ("_root", "TextUrl"),
+    "TextEmail": ("_root", "TextEmail"),
+    "TextConcat": ("_root", "TextConcat"),
+    "TextSubscript": ("_root", "TextSubscript"),
+    "TextSuperscript": ("_root", "TextSuperscript"),
+    "TextMarked": ("_root", "TextMarked"),
+    "TextPhone": ("_root", "TextPhone"),
+    "TextImage": ("_root", "TextImage"),
+    "TextAnchor": ("_root", "TextAnchor"),
+    "PageBlockUnsupported": ("_root", "PageBlockUnsupported"),
+    "PageBlockTitle": ("_root", "PageBlockTitle"),
+    "PageBlockSubtitle": ("_root", "PageBlockSubtitle"),
+    "PageBlockAuthorDate": ("_root", "PageBlockAuthorDate"),
+    "PageBlockHeader": ("_root", "PageBlockHeader"),
+    "PageBlockSubheader": ("_root", "PageBlockSubheader"),
+    "PageBlockParagraph": ("_root", "PageBlockParagraph"),
+    "PageBlockPreformatted": ("_root", "PageBlockPreformatted"),
+    "PageBlockFooter": ("_root", "PageBlockFooter"),
+    "PageBlockDivider": ("_root", "PageBlockDivider"),
+    "PageBlockAnchor": ("_root", "PageBlockAnchor"),
+    "PageBlockList": ("_root", "PageBlockList"),
+    "PageBlockBlockquote": ("_root", "PageBlockBlockquote"),
+    "PageBlockPullquote": ("_root", "PageBlockPullquote"),
+    "PageBlockPhoto": ("_root", "PageBlockPhoto"),
+    "PageBlockVideo": ("_root", "PageBlockVideo"),
+    "PageBlockCover": ("_root", "PageBlockCover"),
+    "PageBlockEmbed": ("_root", "PageBlockEmbed"),
+    "PageBlockEmbedPost": ("_root", "PageBlockEmbedPost"),
+    "PageBlockCollage": ("_root", "PageBlockCollage"),
+    "PageBlockSlideshow": ("_root", "PageBlockSlideshow"),
+    "PageBlockChannel": ("_root", "PageBlockChannel"),
+    "PageBlockAudio": ("_root", "PageBlockAudio"),
+    "PageBlockKicker": ("_root", "PageBlockKicker"),
+    "PageBlockTable": ("_root", "PageBlockTable"),
+    "PageBlockOrderedList": ("_root", "PageBlockOrderedList"),
+    "PageBlockDetails": ("_root", "PageBlockDetails"),
+    "PageBlockRelatedArticles": ("_root", "PageBlockRelatedArticles"),
+    "PageBlockMap": ("_root", "PageBlockMap"),
+    "PhoneCallDiscardReasonMissed": ("_root", "PhoneCallDiscardReasonMissed"),
+    "PhoneCallDiscardReasonDisconnect": ("_root", "PhoneCallDiscardReasonDisconnect"),
+    "PhoneCallDiscardReasonHangup": ("_root", "PhoneCallDiscardReasonHangup"),
+    "PhoneCallDiscardReasonBusy": ("_root", "PhoneCallDiscardReasonBusy"),
+    "DataJSON": ("_root", "DataJSON"),
+    "LabeledPrice": ("_root", "LabeledPrice"),
+    "InvoiceBase": ("_root", "InvoiceBase"),
+    "PaymentCharge": ("_root", "PaymentCharge"),
+    "PostAddress": ("_root", "PostAddress"),
+    "PaymentRequestedInfo": ("_root", "PaymentRequestedInfo"),
+    "PaymentSavedCredentialsCard": ("_root", "PaymentSavedCredentialsCard"),
+    "WebDocument": ("_root", "WebDocument"),
+    "WebDocumentNoProxy": ("_root", "WebDocumentNoProxy"),
+    "InputWebDocument": ("_root", "InputWebDocument"),
+    "InputWebFileLocation": ("_root", "InputWebFileLocation"),
+    "InputWebFileGeoPointLocation": ("_root", "InputWebFileGeoPointLocation"),
+    "InputWebFileAudioAlbumThumbLocation": ("_root", "InputWebFileAudioAlbumThumbLocation"),
+    "InputPaymentCredentialsSaved": ("_root", "InputPaymentCredentialsSaved"),
+    "InputPaymentCredentials": ("_root", "InputPaymentCredentials"),
+    "InputPaymentCredentialsApplePay": ("_root", "InputPaymentCredentialsApplePay"),
+    "InputPaymentCredentialsGooglePay": ("_root", "InputPaymentCredentialsGooglePay"),
+    "ShippingOption": ("_root", "ShippingOption"),
+    "InputStickerSetItemBase": ("_root", "InputStickerSetItemBase"),
+    "InputPhoneCall": ("_root", "InputPhoneCall"),
+    "PhoneCallEmpty": ("_root", "PhoneCallEmpty"),
+    "PhoneCallWaitingBase": ("_root", "PhoneCallWaitingBase"),
+    "PhoneCallRequestedBase": ("_root", "PhoneCallRequestedBase"),
+    "PhoneCallAcceptedBase": ("_root", "PhoneCallAcceptedBase"),
+    "PhoneCallBase": ("_root", "PhoneCallBase"),
+    "PhoneCallDiscardedBase": ("_root", "PhoneCallDiscardedBase"),
+    "PhoneConnectionBase": ("_root", "PhoneConnectionBase"),
+    "PhoneConnectionWebrtc": ("_root", "PhoneConnectionWebrtc"),
+    "PhoneCallProtocol": ("_root", "PhoneCallProtocol"),
+    "CdnPublicKey": ("_root", "CdnPublicKey"),
+    "CdnConfig": ("_root", "CdnConfig"),
+    "LangPackString": ("_root", "LangPackString"),
+    "LangPackStringPluralized": ("_root", "LangPackStringPluralized"),
+    "LangPackStringDeleted": ("_root", "LangPackStringDeleted"),
+    "LangPackDifference": ("_root", "LangPackDifference"),
+    "LangPackLanguageBase": ("_root", "LangPackLanguageBase"),
+    "ChannelAdminLogEventActionChangeTitle": ("_root", "ChannelAdminLogEventActionChangeTitle"),
+    "ChannelAdminLogEventActionChangeAbout": ("_root", "ChannelAdminLogEventActionChangeAbout"),
+    "ChannelAdminLogEventActionChangeUsername": ("_root", "ChannelAdminLogEventActionChangeUsername"),
+    "ChannelAdminLogEventActionChangePhoto": ("_root", "ChannelAdminLogEventActionChangePhoto"),
+    "ChannelAdminLogEventActionToggleInvites": ("_root", "ChannelAdminLogEventActionToggleInvites"),
+    "ChannelAdminLogEventActionToggleSignatures": ("_root", "ChannelAdminLogEventActionToggleSignatures"),
+    "ChannelAdminLogEventActionUpdatePinned": ("_root", "ChannelAdminLogEventActionUpdatePinned"),
+    "ChannelAdminLogEventActionEditMessage": ("_root", "ChannelAdminLogEventActionEditMessage"),
+    "ChannelAdminLogEventActionDeleteMessage": ("_root", "ChannelAdminLogEventActionDeleteMessage"),
+    "ChannelAdminLogEventActionParticipantJoin": ("_root", "ChannelAdminLogEventActionParticipantJoin"),
+    "ChannelAdminLogEventActionParticipantLeave": ("_root", "ChannelAdminLogEventActionParticipantLeave"),
+    "ChannelAdminLogEventActionParticipantInvite": ("_root", "ChannelAdminLogEventActionParticipantInvite"),
+    "ChannelAdminLogEventActionParticipantToggleBan": ("_root", "ChannelAdminLogEventActionParticipantToggleBan"),
+    "ChannelAdminLogEventActionParticipantToggleAdmin": ("_root", "ChannelAdminLogEventActionParticipantToggleAdmin"),
+    "ChannelAdminLogEventActionChangeStickerSet": ("_root", "ChannelAdminLogEventActionChangeStickerSet"),
+    "ChannelAdminLogEventActionTogglePreHistoryHidden": ("_root", "ChannelAdminLogEventActionTogglePreHistoryHidden"),
+    "ChannelAdminLogEventActionDefaultBannedRights": ("_root", "ChannelAdminLogEventActionDefaultBannedRights"),
+    "ChannelAdminLogEventActionStopPoll": ("_root", "ChannelAdminLogEventActionStopPoll"),
+    "ChannelAdminLogEventActionChangeLinkedChat": ("_root", "ChannelAdminLogEventActionChangeLinkedChat"),
+    "ChannelAdminLogEventActionChangeLocation": ("_root", "ChannelAdminLogEventActionChangeLocation"),
+    "ChannelAdminLogEventActionToggleSlowMode": ("_root", "ChannelAdminLogEventActionToggleSlowMode"),
+    "ChannelAdminLogEventActionStartGroupCall": ("_root", "ChannelAdminLogEventActionStartGroupCall"),
+    "ChannelAdminLogEventActionDiscardGroupCall": ("_root", "ChannelAdminLogEventActionDiscardGroupCall"),
+    "ChannelAdminLogEventActionParticipantMute": ("_root", "ChannelAdminLogEventActionParticipantMute"),
+    "ChannelAdminLogEventActionParticipantUnmute": ("_root", "ChannelAdminLogEventActionParticipantUnmute"),
+    "ChannelAdminLogEventActionToggleGroupCallSetting": ("_root", "ChannelAdminLogEventActionToggleGroupCallSetting"),
+    "ChannelAdminLogEventActionParticipantJoinByInviteBase": ("_root", "ChannelAdminLogEventActionParticipantJoinByInviteBase"),
+    "ChannelAdminLogEventActionExportedInviteDelete": ("_root", "ChannelAdminLogEventActionExportedInviteDelete"),
+    "ChannelAdminLogEventActionExportedInviteRevoke": ("_root", "ChannelAdminLogEventActionExportedInviteRevoke"),
+    "ChannelAdminLogEventActionExportedInviteEdit": ("_root", "ChannelAdminLogEventActionExportedInviteEdit"),
+    "ChannelAdminLogEventActionParticipantVolume": ("_root", "ChannelAdminLogEventActionParticipantVolume"),
+    "ChannelAdminLogEventActionChangeHistoryTTL": ("_root", "ChannelAdminLogEventActionChangeHistoryTTL"),
+    "ChannelAdminLogEventActionParticipantJoinByRequest": ("_root", "ChannelAdminLogEventActionParticipantJoinByRequest"),
+    "ChannelAdminLogEventActionToggleNoForwards": ("_root", "ChannelAdminLogEventActionToggleNoForwards"),
+    "ChannelAdminLogEventActionSendMessage": ("_root", "ChannelAdminLogEventActionSendMessage"),
+    "ChannelAdminLogEventActionChangeAvailableReactionsBase": ("_root", "ChannelAdminLogEventActionChangeAvailableReactionsBase"),
+    "ChannelAdminLogEventActionChangeUsernames": ("_root", "ChannelAdminLogEventActionChangeUsernames"),
+    "ChannelAdminLogEventActionToggleForum": ("_root", "ChannelAdminLogEventActionToggleForum"),
+    "ChannelAdminLogEventActionCreateTopic": ("_root", "ChannelAdminLogEventActionCreateTopic"),
+    "ChannelAdminLogEventActionEditTopic": ("_root", "ChannelAdminLogEventActionEditTopic"),
+    "ChannelAdminLogEventActionDeleteTopic": ("_root", "ChannelAdminLogEventActionDeleteTopic"),
+    "ChannelAdminLogEventActionPinTopic": ("_root", "ChannelAdminLogEventActionPinTopic"),
+    "ChannelAdminLogEventActionToggleAntiSpam": ("_root", "ChannelAdminLogEventActionToggleAntiSpam"),
+    "ChannelAdminLogEventActionChangePeerColor": ("_root", "ChannelAdminLogEventActionChangePeerColor"),
+    "ChannelAdminLogEventActionChangeProfilePeerColor": ("_root", "ChannelAdminLogEventActionChangeProfilePeerColor"),
+    "ChannelAdminLogEventActionChangeWallpaper": ("_root", "ChannelAdminLogEventActionChangeWallpaper"),
+    "ChannelAdminLogEventActionChangeEmojiStatus": ("_root", "ChannelAdminLogEventActionChangeEmojiStatus"),
+    "ChannelAdminLogEventActionChangeEmojiStickerSet": ("_root", "ChannelAdminLogEventActionChangeEmojiStickerSet"),
+    "ChannelAdminLogEventActionToggleSignatureProfiles": ("_root", "ChannelAdminLogEventActionToggleSignatureProfiles"),
+    "ChannelAdminLogEventActionParticipantSubExtend": ("_root", "ChannelAdminLogEventActionParticipantSubExtend"),
+    "ChannelAdminLogEvent": ("_root", "ChannelAdminLogEvent"),
+    "ChannelAdminLogEventsFilter": ("_root", "ChannelAdminLogEventsFilter"),
+    "PopularContact": ("_root", "PopularContact"),
+    "RecentMeUrlUnknown": ("_root", "RecentMeUrlUnknown"),
+    "RecentMeUrlUser": ("_root", "RecentMeUrlUser"),
+    "RecentMeUrlChat": ("_root", "RecentMeUrlChat"),
+    "RecentMeUrlChatInvite": ("_root", "RecentMeUrlChatInvite"),
+    "RecentMeUrlStickerSet": ("_root", "RecentMeUrlStickerSet"),
+    "InputSingleMedia": ("_root", "InputSingleMedia"),
+    "WebAuthorization": ("_root", "WebAuthorization"),
+    "InputMessageID": ("_root", "InputMessageID"),
+    "InputMessageReplyTo": ("_root", "InputMessageReplyTo"),
+    "InputMessagePinned": ("_root", "InputMessagePinned"),
+    "InputMessageCallbackQuery": ("_root", "InputMessageCallbackQuery"),
+    "InputDialogPeer": ("_root", "InputDialogPeer"),
+    "InputDialogPeerFolder": ("_root", "InputDialogPeerFolder"),
+    "DialogPeer": ("_root", "DialogPeer"),
+    "DialogPeerFolder": ("_root", "DialogPeerFolder"),
+    "FileHashBase": ("_root", "FileHashBase"),
+    "InputClientProxy": ("_root", "InputClientProxy"),
+    "InputSecureFileUploaded": ("_root", "InputSecureFileUploaded"),
+    "InputSecureFile": ("_root", "InputSecureFile"),
+    "SecureFileEmpty": ("_root", "SecureFileEmpty"),
+    "SecureFileBase": ("_root", "SecureFileBase"),
+    "SecureData": ("_root", "SecureData"),
+    "SecurePlainPhone": ("_root", "SecurePlainPhone"),
+    "SecurePlainEmail": ("_root", "SecurePlainEmail"),
+    "SecureValueTypePersonalDetails": ("_root", "SecureValueTypePersonalDetails"),
+    "SecureValueTypePassport": ("_root", "SecureValueTypePassport"),
+    "SecureValueTypeDriverLicense": ("_root", "SecureValueTypeDriverLicense"),
+    "SecureValueTypeIdentityCard": ("_root", "SecureValueTypeIdentityCard"),
+    "SecureValueTypeInternalPassport": ("_root", "SecureValueTypeInternalPassport"),
+    "SecureValueTypeAddress": ("_root", "SecureValueTypeAddress"),
+    "SecureValueTypeUtilityBill": ("_root", "SecureValueTypeUtilityBill"),
+    "SecureValueTypeBankStatement": ("_root", "SecureValueTypeBankStatement"),
+    "SecureValueTypeRentalAgreement": ("_root", "SecureValueTypeRentalAgreement"),
+    "SecureValueTypePassportRegistration": ("_root", "SecureValueTypePassportRegistration"),
+    "SecureValueTypeTemporaryRegistration": ("_root", "SecureValueTypeTemporaryRegistration"),
+    "SecureValueTypePhone": ("_root", "SecureValueTypePhone"),
+    "SecureValueTypeEmail": ("_root", "SecureValueTypeEmail"),
+    "SecureValue": ("_root", "SecureValue"),
+    "InputSecureValue": ("_root", "InputSecureValue"),
+    "SecureValueHash": ("_root", "SecureValueHash"),
+    "SecureValueErrorData": ("_root", "SecureValueErrorData"),
+    "SecureValueErrorFrontSide": ("_root", "SecureValueErrorFrontSide"),
+    "SecureValueErrorReverseSide": ("_root", "SecureValueErrorReverseSide"),
+    "SecureValueErrorSelfie": ("_root", "SecureValueErrorSelfie"),
+    "SecureValueErrorFile": ("_root", "SecureValueErrorFile"),
+    "SecureValueErrorFiles": ("_root", "SecureValueErrorFiles"),
+    "SecureValueError": ("_root", "SecureValueError"),
+    "SecureValueErrorTranslationFile": ("_root", "SecureValueErrorTranslationFile"),
+    "SecureValueErrorTranslationFiles": ("_root", "SecureValueErrorTranslationFiles"),
+    "SecureCredentialsEncrypted": ("_root", "SecureCredentialsEncrypted"),
+    "SavedPhoneContact": ("_root", "SavedPhoneContact"),
+    "PasswordKdfAlgoUnknown": ("_root", "PasswordKdfAlgoUnknown"),
+    "PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow": ("_root", "PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow"),
+    "SecurePasswordKdfAlgoUnknown": ("_root", "SecurePasswordKdfAlgoUnknown"),
+    "SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000": ("_root", "SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000"),
+    "SecurePasswordKdfAlgoSHA512": ("_root", "SecurePasswordKdfAlgoSHA512"),
+    "SecureSecretSettings": ("_root", "SecureSecretSettings"),
+    "InputCheckPasswordEmpty": ("_root", "InputCheckPasswordEmpty"),
+    "InputCheckPasswordSRP": ("_root", "InputCheckPasswordSRP"),
+    "SecureRequiredType": ("_root", "SecureRequiredType"),
+    "SecureRequiredTypeOneOf": ("_root", "SecureRequiredTypeOneOf"),
+    "InputAppEvent": ("_root", "InputAppEvent"),
+    "JsonObjectValue": ("_root", "JsonObjectValue"),
+    "JsonNull": ("_root", "JsonNull"),
+    "JsonBool": ("_root", "JsonBool"),
+    "JsonNumber": ("_root", "JsonNumber"),
+    "JsonString": ("_root", "JsonString"),
+    "JsonArray": ("_root", "JsonArray"),
+    "JsonObject": ("_root", "JsonObject"),
+    "PageTableCell": ("_root", "PageTableCell"),
+    "PageTableRow": ("_root", "PageTableRow"),
+    "PageCaption": ("_root", "PageCaption"),
+    "PageListItemText": ("_root", "PageListItemText"),
+    "PageListItemBlocks": ("_root", "PageListItemBlocks"),
+    "PageListOrderedItemText": ("_root", "PageListOrderedItemText"),
+    "PageListOrderedItemBlocks": ("_root", "PageListOrderedItemBlocks"),
+    "PageRelatedArticle": ("_root", "PageRelatedArticle"),
+    "Page": ("_root", "Page"),
+    "PollAnswerBase": ("_root", "PollAnswerBase"),
+    "PollBase": ("_root", "PollBase"),
+    "PollAnswerVoters": ("_root", "PollAnswerVoters"),
+    "PollResultsBase": ("_root", "PollResultsBase"),
+    "ChatOnlines": ("_root", "ChatOnlines"),
+    "StatsURL": ("_root", "StatsURL"),
+    "ChatAdminRights": ("_root", "ChatAdminRights"),
+    "ChatBannedRights": ("_root", "ChatBannedRights"),
+    "InputWallPaper": ("_root", "InputWallPaper"),
+    "InputWallPaperSlug": ("_root", "InputWallPaperSlug"),
+    "InputWallPaperNoFile": ("_root", "InputWallPaperNoFile"),
+    "CodeSettingsBase": ("_root", "CodeSettingsBase"),
+    "WallPaperSettingsBase": ("_root", "WallPaperSettingsBase"),
+    "AutoDownloadSettingsBase": ("_root", "AutoDownloadSettingsBase"),
+    "EmojiKeyword": ("_root", "EmojiKeyword"),
+    "EmojiKeywordDeleted": ("_root", "EmojiKeywordDeleted"),
+    "EmojiKeywordsDifference": ("_root", "EmojiKeywordsDifference"),
+    "EmojiURL": ("_root", "EmojiURL"),
+    "EmojiLanguage": ("_root", "EmojiLanguage"),
+    "Folder": ("_root", "Folder"),
+    "InputFolderPeer": ("_root", "InputFolderPeer"),
+    "FolderPeer": ("_root", "FolderPeer"),
+    "UrlAuthResultRequest": ("_root", "UrlAuthResultRequest"),
+    "UrlAuthResultAccepted": ("_root", "UrlAuthResultAccepted"),
+    "UrlAuthResultDefault": ("_root", "UrlAuthResultDefault"),
+    "ChannelLocationEmpty": ("_root", "ChannelLocationEmpty"),
+    "ChannelLocation": ("_root", "ChannelLocation"),
+    "PeerLocated": ("_root", "PeerLocated"),
+    "PeerSelfLocated": ("_root", "PeerSelfLocated"),
+    "RestrictionReason": ("_root", "RestrictionReason"),
+    "InputTheme": ("_root", "InputTheme"),
+    "InputThemeSlug": ("_root", "InputThemeSlug"),
+    "ThemeBase": ("_root", "ThemeBase"),
+    "BaseThemeClassic": ("_root", "BaseThemeClassic"),
+    "BaseThemeDay": ("_root", "BaseThemeDay"),
+    "BaseThemeNight": ("_root", "BaseThemeNight"),
+    "BaseThemeTinted": ("_root", "BaseThemeTinted"),
+    "BaseThemeArctic": ("_root", "BaseThemeArctic"),
+    "InputThemeSettings": ("_root", "InputThemeSettings"),
+    "ThemeSettings": ("_root", "ThemeSettings"),
+    "WebPageAttributeTheme": ("_root", "WebPageAttributeTheme"),
+    "WebPageAttributeStoryBase": ("_root", "WebPageAttributeStoryBase"),
+    "WebPageAttributeStickerSet": ("_root", "WebPageAttributeStickerSet"),
+    "WebPageAttributeUniqueStarGift": ("_root", "WebPageAttributeUniqueStarGift"),
+    "BankCardOpenUrl": ("_root", "BankCardOpenUrl"),
+    "DialogFilterBase": ("_root", "DialogFilterBase"),
+    "DialogFilterDefault": ("_root", "DialogFilterDefault"),
+    "DialogFilterChatlistBase": ("_root", "DialogFilterChatlistBase"),
+    "DialogFilterSuggested": ("_root", "DialogFilterSuggested"),
+    "StatsDateRangeDays": ("_root", "StatsDateRangeDays"),
+    "StatsAbsValueAndPrev": ("_root", "StatsAbsValueAndPrev"),
+    "StatsPercentValue": ("_root", "StatsPercentValue"),
+    "StatsGraphAsync": ("_root", "StatsGraphAsync"),
+    "StatsGraphError": ("_root", "StatsGraphError"),
+    "StatsGraph": ("_root", "StatsGraph"),
+    "VideoSize": ("_root", "VideoSize"),
+    "VideoSizeEmojiMarkup": ("_root", "VideoSizeEmojiMarkup"),
+    "VideoSizeStickerMarkup": ("_root", "VideoSizeStickerMarkup"),
+    "StatsGroupTopPoster": ("_root", "StatsGroupTopPoster"),
+    "StatsGroupTopAdmin": ("_root", "StatsGroupTopAdmin"),
+    "StatsGroupTopInviter": ("_root", "StatsGroupTopInviter"),
+    "GlobalPrivacySettingsBase": ("_root", "GlobalPrivacySettingsBase"),
+    "MessageViews": ("_root", "MessageViews"),
+    "MessageReplyHeaderBase": ("_root", "MessageReplyHeaderBase"),
+    "MessageReplyStoryHeaderBase": ("_root", "MessageReplyStoryHeaderBase"),
+    "MessageReplies": ("_root", "MessageReplies"),
+    "PeerBlocked": ("_root", "PeerBlocked"),
+    "GroupCallDiscarded": ("_root", "GroupCallDiscarded"),
+    "GroupCallBase": ("_root", "GroupCallBase"),
+    "InputGroupCall": ("_root", "InputGroupCall"),
+    "GroupCallParticipant": ("_root", "GroupCallParticipant"),
+    "InlineQueryPeerTypeSameBotPM": ("_root", "InlineQueryPeerTypeSameBotPM"),
+    "InlineQueryPeerTypePM": ("_root", "InlineQueryPeerTypePM"),
+    "InlineQueryPeerTypeChat": ("_root", "InlineQueryPeerTypeChat"),
+    "InlineQueryPeerTypeMegagroup": ("_root", "InlineQueryPeerTypeMegagroup"),
+    "InlineQueryPeerTypeBroadcast": ("_root", "InlineQueryPeerTypeBroadcast"),
+    "InlineQueryPeerTypeBotPM": ("_root", "InlineQueryPeerTypeBotPM"),
+    "ChatInviteImporterBase": ("_root", "ChatInviteImporterBase"),
+    "ChatAdminWithInvites": ("_root", "ChatAdminWithInvites"),
+    "GroupCallParticipantVideoSourceGroup": ("_root", "GroupCallParticipantVideoSourceGroup"),
+    "GroupCallParticipantVideo": ("_root", "GroupCallParticipantVideo"),
+    "BotCommandScopeDefault": ("_root", "BotCommandScopeDefault"),
+    "BotCommandScopeUsers": ("_root", "BotCommandScopeUsers"),
+    "BotCommandScopeChats": ("_root", "BotCommandScopeChats"),
+    "BotCommandScopeChatAdmins": ("_root", "BotCommandScopeChatAdmins"),
+    "BotCommandScopePeer": ("_root", "BotCommandScopePeer"),
+    "BotCommandScopePeerAdmins": ("_root", "BotCommandScopePeerAdmins"),
+    "BotCommandScopePeerUser": ("_root", "BotCommandScopePeerUser"),
+    "SponsoredMessageBase": ("_root", "SponsoredMessageBase"),
+    "SearchResultsCalendarPeriod": ("_root", "SearchResultsCalendarPeriod"),
+    "SearchResultPosition": ("_root", "SearchResultPosition"),
+    "ReactionCountBase": ("_root", "ReactionCountBase"),
+    "MessageReactionsBase": ("_root", "MessageReactionsBase"),
+    "AvailableReactionBase": ("_root", "AvailableReactionBase"),
+    "MessagePeerReactionBase": ("_root", "MessagePeerReactionBase"),
+    "GroupCallStreamChannel": ("_root", "GroupCallStreamChannel"),
+    "AttachMenuBotIconColor": ("_root", "AttachMenuBotIconColor"),
+    "AttachMenuBotIcon": ("_root", "AttachMenuBotIcon"),
+    "AttachMenuBotBase": ("_root", "AttachMenuBotBase"),
+    "AttachMenuBotsNotModified": ("_root", "AttachMenuBotsNotModified"),
+    "AttachMenuBots": ("_root", "AttachMenuBots"),
+    "AttachMenuBotsBot": ("_root", "AttachMenuBotsBot"),
+    "WebViewResultUrlBase": ("_root", "WebViewResultUrlBase"),
+    "WebViewMessageSent": ("_root", "WebViewMessageSent"),
+    "BotMenuButtonDefault": ("_root", "BotMenuButtonDefault"),
+    "BotMenuButtonCommands": ("_root", "BotMenuButtonCommands"),
+    "BotMenuButton": ("_root", "BotMenuButton"),
+    "NotificationSoundDefault": ("_root", "NotificationSoundDefault"),
+    "NotificationSoundNone": ("_root", "NotificationSoundNone"),
+    "NotificationSoundLocal": ("_root", "NotificationSoundLocal"),
+    "NotificationSoundRingtone": ("_root", "NotificationSoundRingtone"),
+    "AttachMenuPeerTypeSameBotPM": ("_root", "AttachMenuPeerTypeSameBotPM"),
+    "AttachMenuPeerTypeBotPM": ("_root", "AttachMenuPeerTypeBotPM"),
+    "AttachMenuPeerTypePM": ("_root", "AttachMenuPeerTypePM"),
+    "AttachMenuPeerTypeChat": ("_root", "AttachMenuPeerTypeChat"),
+    "AttachMenuPeerTypeBroadcast": ("_root", "AttachMenuPeerTypeBroadcast"),
+    "InputInvoiceMessage": ("_root", "InputInvoiceMessage"),
+    "InputInvoiceSlug": ("_root", "InputInvoiceSlug"),
+    "InputInvoicePremiumGiftCode": ("_root", "InputInvoicePremiumGiftCode"),
+    "InputInvoiceStarsBase": ("_root", "InputInvoiceStarsBase"),
+    "InputInvoiceChatInviteSubscription": ("_root", "InputInvoiceChatInviteSubscription"),
+    "InputInvoiceStarGiftBase": ("_root", "InputInvoiceStarGiftBase"),
+    "InputInvoiceStarGiftUpgradeBase": ("_root", "InputInvoiceStarGiftUpgradeBase"),
+    "InputInvoiceStarGiftTransferBase": ("_root", "InputInvoiceStarGiftTransferBase"),
+    "InputInvoicePremiumGiftStars": ("_root", "InputInvoicePremiumGiftStars"),
+    "InputInvoiceBusinessBotTransferStars": ("_root", "InputInvoiceBusinessBotTransferStars"),
+    "InputStorePaymentPremiumSubscription": ("_root", "InputStorePaymentPremiumSubscription"),
+    "InputStorePaymentGiftPremium": ("_root", "InputStorePaymentGiftPremium"),
+    "InputStorePaymentPremiumGiftCodeBase": ("_root", "InputStorePaymentPremiumGiftCodeBase"),
+    "InputStorePaymentPremiumGiveawayBase": ("_root", "InputStorePaymentPremiumGiveawayBase"),
+    "InputStorePaymentStarsTopup": ("_root", "InputStorePaymentStarsTopup"),
+    "InputStorePaymentStarsGift": ("_root", "InputStorePaymentStarsGift"),
+    "InputStorePaymentStarsGiveaway": ("_root", "InputStorePaymentStarsGiveaway"),
+    "InputStorePaymentAuthCode": ("_root", "InputStorePaymentAuthCode"),
+    "PaymentFormMethod": ("_root", "PaymentFormMethod"),
+    "EmojiStatusEmpty": ("_root", "EmojiStatusEmpty"),
+    "EmojiStatusBase": ("_root", "EmojiStatusBase"),
+    "EmojiStatusCollectible": ("_root", "EmojiStatusCollectible"),
+    "InputEmojiStatusCollectible": ("_root", "InputEmojiStatusCollectible"),
+    "ReactionEmpty": ("_root", "ReactionEmpty"),
+    "ReactionEmoji": ("_root", "ReactionEmoji"),
+    "ReactionCustomEmoji": ("_root", "ReactionCustomEmoji"),
+    "ReactionPaid": ("_root", "ReactionPaid"),
+    "ChatReactionsNone": ("_root", "ChatReactionsNone"),
+    "ChatReactionsAll": ("_root", "ChatReactionsAll"),
+    "ChatReactionsSome": ("_root", "ChatReactionsSome"),
+    "EmailVerifyPurposeLoginSetup": ("_root", "EmailVerifyPurposeLoginSetup"),
+    "EmailVerifyPurposeLoginChange": ("_root", "EmailVerifyPurposeLoginChange"),
+    "EmailVerifyPurposePassport": ("_root", "EmailVerifyPurposePassport"),
+    "EmailVerificationCode": ("_root", "EmailVerificationCode"),
+    "EmailVerificationGoogle": ("_root", "EmailVerificationGoogle"),
+    "EmailVerificationApple": ("_root", "EmailVerificationApple"),
+    "PremiumSubscriptionOptionBase": ("_root", "PremiumSubscriptionOptionBase"),
+    "SendAsPeer": ("_root", "SendAsPeer"),
+    "MessageExtendedMediaPreview": ("_root", "MessageExtendedMediaPreview"),
+    "MessageExtendedMedia": ("_root", "MessageExtendedMedia"),
+    "StickerKeyword": ("_root", "StickerKeyword"),
+    "Username": ("_root", "Username"),
+    "ForumTopicDeleted": ("_root", "ForumTopicDeleted"),
+    "ForumTopic": ("_root", "ForumTopic"),
+    "DefaultHistoryTTL": ("_root", "DefaultHistoryTTL"),
+    "ExportedContactToken": ("_root", "ExportedContactToken"),
+    "RequestPeerTypeUser": ("_root", "RequestPeerTypeUser"),
+    "RequestPeerTypeChat": ("_root", "RequestPeerTypeChat"),
+    "RequestPeerTypeBroadcast": ("_root", "RequestPeerTypeBroadcast"),
+    "EmojiListNotModified": ("_root", "EmojiListNotModified"),
+    "EmojiList": ("_root", "EmojiList"),
+    "EmojiGroup": ("_root", "EmojiGroup"),
+    "EmojiGroupGreeting": ("_root", "EmojiGroupGreeting"),
+    "EmojiGroupPremium": ("_root", "EmojiGroupPremium"),
+    "TextWithEntities": ("_root", "TextWithEntities"),
+    "AutoSaveSettings": ("_root", "AutoSaveSettings"),
+    "AutoSaveException": ("_root", "AutoSaveException"),
+    "InputBotAppID": ("_root", "InputBotAppID"),
+    "InputBotAppShortName": ("_root", "InputBotAppShortName"),
+    "BotAppNotModified": ("_root", "BotAppNotModified"),
+    "BotApp": ("_root", "BotApp"),
+    "InlineBotWebView": ("_root", "InlineBotWebView"),
+    "ReadParticipantDate": ("_root", "ReadParticipantDate"),
+    "InputChatlistDialogFilter": ("_root", "InputChatlistDialogFilter"),
+    "ExportedChatlistInvite": ("_root", "ExportedChatlistInvite"),
+    "MessagePeerVote": ("_root", "MessagePeerVote"),
+    "MessagePeerVoteInputOption": ("_root", "MessagePeerVoteInputOption"),
+    "MessagePeerVoteMultiple": ("_root", "MessagePeerVoteMultiple"),
+    "StoryViewsBase": ("_root", "StoryViewsBase"),
+    "StoryItemDeleted": ("_root", "StoryItemDeleted"),
+    "StoryItemSkipped": ("_root", "StoryItemSkipped"),
+    "StoryItemBase": ("_root", "StoryItemBase"),
+    "StoryViewBase": ("_root", "StoryViewBase"),
+    "StoryViewPublicForward": ("_root", "StoryViewPublicForward"),
+    "StoryViewPublicRepost": ("_root", "StoryViewPublicRepost"),
+    "InputReplyToMessageBase": ("_root", "InputReplyToMessageBase"),
+    "InputReplyToStoryBase": ("_root", "InputReplyToStoryBase"),
+    "ExportedStoryLink": ("_root", "ExportedStoryLink"),
+    "StoriesStealthMode": ("_root", "StoriesStealthMode"),
+    "MediaAreaCoordinatesBase": ("_root", "MediaAreaCoordinatesBase"),
+    "MediaAreaVenue": ("_root", "MediaAreaVenue"),
+    "InputMediaAreaVenue": ("_root", "InputMediaAreaVenue"),
+    "MediaAreaGeoPointBase": ("_root", "MediaAreaGeoPointBase"),
+    "MediaAreaSuggestedReaction": ("_root", "MediaAreaSuggestedReaction"),
+    "MediaAreaChannelPost": ("_root", "MediaAreaChannelPost"),
+    "InputMediaAreaChannelPost": ("_root", "InputMediaAreaChannelPost"),
+    "MediaAreaUrl": ("_root", "MediaAreaUrl"),
+    "MediaAreaWeather": ("_root", "MediaAreaWeather"),
+    "MediaAreaStarGift": ("_root", "MediaAreaStarGift"),
+    "PeerStories": ("_root", "PeerStories"),
+    "PremiumGiftCodeOption": ("_root", "PremiumGiftCodeOption"),
+    "PrepaidGiveaway": ("_root", "PrepaidGiveaway"),
+    "PrepaidStarsGiveaway": ("_root", "PrepaidStarsGiveaway"),
+    "BoostBase": ("_root", "BoostBase"),
+    "MyBoost": ("_root", "MyBoost"),
+    "StoryFwdHeader": ("_root", "StoryFwdHeader"),
+    "PostInteractionCountersMessage": ("_root", "PostInteractionCountersMessage"),
+    "PostInteractionCountersStory": ("_root", "PostInteractionCountersStory"),
+    "PublicForwardMessage": ("_root", "PublicForwardMessage"),
+    "PublicForwardStory": ("_root", "PublicForwardStory"),
+    "PeerColor": ("_root", "PeerColor"),
+    "StoryReaction": ("_root", "StoryReaction"),
+    "StoryReactionPublicForward": ("_root", "StoryReactionPublicForward"),
+    "StoryReactionPublicRepost": ("_root", "StoryReactionPublicRepost"),
+    "SavedDialog": ("_root", "SavedDialog"),
+    "SavedReactionTag": ("_root", "SavedReactionTag"),
+    "OutboxReadDate": ("_root", "OutboxReadDate"),
+    "SmsJob": ("_root", "SmsJob"),
+    "BusinessWeeklyOpen": ("_root", "BusinessWeeklyOpen"),
+    "BusinessWorkHours": ("_root", "BusinessWorkHours"),
+    "BusinessLocation": ("_root", "BusinessLocation"),
+    "InputBusinessRecipients": ("_root", "InputBusinessRecipients"),
+    "BusinessRecipients": ("_root", "BusinessRecipients"),
+    "BusinessAwayMessageScheduleAlways": ("_root", "BusinessAwayMessageScheduleAlways"),
+    "BusinessAwayMessageScheduleOutsideWorkHours": ("_root", "BusinessAwayMessageScheduleOutsideWorkHours"),
+    "BusinessAwayMessageScheduleCustom": ("_root", "BusinessAwayMessageScheduleCustom"),
+    "InputBusinessGreetingMessage": ("_root", "InputBusinessGreetingMessage"),
+    "BusinessGreetingMessage": ("_root", "BusinessGreetingMessage"),
+    "InputBusinessAwayMessage": ("_root", "InputBusinessAwayMessage"),
+    "BusinessAwayMessage": ("_root", "BusinessAwayMessage"),
+    "Timezone": ("_root", "Timezone"),
+    "QuickReply": ("_root", "QuickReply"),
+    "InputQuickReplyShortcut": ("_root", "InputQuickReplyShortcut"),
+    "InputQuickReplyShortcutId": ("_root", "InputQuickReplyShortcutId"),
+    "ConnectedBotBase": ("_root", "ConnectedBotBase"),
+    "Birthday": ("_root", "Birthday"),
+    "BotBusinessConnectionBase": ("_root", "BotBusinessConnectionBase"),
+    "InputBusinessIntro": ("_root", "InputBusinessIntro"),
+    "BusinessIntro": ("_root", "BusinessIntro"),
+    "InputCollectibleUsername": ("_root", "InputCollectibleUsername"),
+    "InputCollectiblePhone": ("_root", "InputCollectiblePhone"),
+    "InputBusinessBotRecipients": ("_root", "InputBusinessBotRecipients"),
+    "BusinessBotRecipients": ("_root", "BusinessBotRecipients"),
+    "ContactBirthday": ("_root", "ContactBirthday"),
+    "MissingInvitee": ("_root", "MissingInvitee"),
+    "InputBusinessChatLink": ("_root", "InputBusinessChatLink"),
+    "BusinessChatLink": ("_root", "BusinessChatLink"),
+    "RequestedPeerUser": ("_root", "RequestedPeerUser"),
+    "RequestedPeerChat": ("_root", "RequestedPeerChat"),
+    "RequestedPeerChannel": ("_root", "RequestedPeerChannel"),
+    "SponsoredMessageReportOption": ("_root", "SponsoredMessageReportOption"),
+    "BroadcastRevenueTransactionProceeds": ("_root", "BroadcastRevenueTransactionProceeds"),
+    "BroadcastRevenueTransactionWithdrawal": ("_root", "BroadcastRevenueTransactionWithdrawal"),
+    "BroadcastRevenueTransactionRefund": ("_root", "BroadcastRevenueTransactionRefund"),
+    "ReactionNotificationsFromContacts": ("_root", "ReactionNotificationsFromContacts"),
+    "ReactionNotificationsFromAll": ("_root", "ReactionNotificationsFromAll"),
+    "ReactionsNotifySettings": ("_root", "ReactionsNotifySettings"),
+    "BroadcastRevenueBalancesBase": ("_root", "BroadcastRevenueBalancesBase"),
+    "AvailableEffect": ("_root", "AvailableEffect"),
+    "FactCheck": ("_root", "FactCheck"),
+    "StarsTransactionPeerUnsupported": ("_root", "StarsTransactionPeerUnsupported"),
+    "StarsTransactionPeerAppStore": ("_root", "StarsTransactionPeerAppStore"),
+    "StarsTransactionPeerPlayMarket": ("_root", "StarsTransactionPeerPlayMarket"),
+    "StarsTransactionPeerPremiumBot": ("_root", "StarsTransactionPeerPremiumBot"),
+    "StarsTransactionPeerFragment": ("_root", "StarsTransactionPeerFragment"),
+    "StarsTransactionPeer": ("_root", "StarsTransactionPeer"),
+    "StarsTransactionPeerAds": ("_root", "StarsTransactionPeerAds"),
+    "StarsTransactionPeerAPI": ("_root", "StarsTransactionPeerAPI"),
+    "StarsTopupOption": ("_root", "StarsTopupOption"),
+    "StarsTransactionBase": ("_root", "StarsTransactionBase"),
+    "FoundStory": ("_root", "FoundStory"),
+    "GeoPointAddress": ("_root", "GeoPointAddress"),
+    "StarsRevenueStatusBase": ("_root", "StarsRevenueStatusBase"),
+    "InputStarsTransaction": ("_root", "InputStarsTransaction"),
+    "StarsGiftOption": ("_root", "StarsGiftOption"),
+    "BotPreviewMedia": ("_root", "BotPreviewMedia"),
+    "StarsSubscriptionPricing": ("_root", "StarsSubscriptionPricing"),
+    "StarsSubscriptionBase": ("_root", "StarsSubscriptionBase"),
+    "MessageReactor": ("_root", "MessageReactor"),
+    "StarsGiveawayOption": ("_root", "StarsGiveawayOption"),
+    "StarsGiveawayWinnersOption": ("_root", "StarsGiveawayWinnersOption"),
+    "StarGiftBase": ("_root", "StarGiftBase"),
+    "StarGiftUniqueBase": ("_root", "StarGiftUniqueBase"),
+    "MessageReportOption": ("_root", "MessageReportOption"),
+    "ReportResultChooseOption": ("_root", "ReportResultChooseOption"),
+    "ReportResultAddComment": ("_root", "ReportResultAddComment"),
+    "ReportResultReported": ("_root", "ReportResultReported"),
+    "BotAppSettings": ("_root", "BotAppSettings"),
+    "StarRefProgram": ("_root", "StarRefProgram"),
+    "ConnectedBotStarRef": ("_root", "ConnectedBotStarRef"),
+    "StarsAmount": ("_root", "StarsAmount"),
+    "BotVerifierSettings": ("_root", "BotVerifierSettings"),
+    "BotVerification": ("_root", "BotVerification"),
+    "StarGiftAttributeModel": ("_root", "StarGiftAttributeModel"),
+    "StarGiftAttributePattern": ("_root", "StarGiftAttributePattern"),
+    "StarGiftAttributeBackdrop": ("_root", "StarGiftAttributeBackdrop"),
+    "StarGiftAttributeOriginalDetailsBase": ("_root", "StarGiftAttributeOriginalDetailsBase"),
+    "SavedStarGift": ("_root", "SavedStarGift"),
+    "InputSavedStarGiftUser": ("_root", "InputSavedStarGiftUser"),
+    "InputSavedStarGiftChat": ("_root", "InputSavedStarGiftChat"),
+    "PaidReactionPrivacyDefault": ("_root", "PaidReactionPrivacyDefault"),
+    "PaidReactionPrivacyAnonymous": ("_root", "PaidReactionPrivacyAnonymous"),
+    "PaidReactionPrivacyPeer": ("_root", "PaidReactionPrivacyPeer"),
+    "RequirementToContactEmpty": ("_root", "RequirementToContactEmpty"),
+    "RequirementToContactPremium": ("_root", "RequirementToContactPremium"),
+    "RequirementToContactPaidMessages": ("_root", "RequirementToContactPaidMessages"),
+    "BusinessBotRights": ("_root", "BusinessBotRights"),
+    "DisallowedGiftsSettings": ("_root", "DisallowedGiftsSettings"),
+    "SponsoredPeer": ("_root", "SponsoredPeer"),
+    "LangPackLanguage_72": ("_root", "LangPackLanguage_72"),
+    "InputMediaUploadedDocument_133": ("_root", "InputMediaUploadedDocument_133"),
+    "InputMediaDocument_133": ("_root", "InputMediaDocument_133"),
+    "InputMediaDocumentExternal_133": ("_root", "InputMediaDocumentExternal_133"),
+    "InputMediaInvoice_133": ("_root", "InputMediaInvoice_133"),
+    "InputChatUploadedPhoto_133": ("_root", "InputChatUploadedPhoto_133"),
+    "User_133": ("_root", "User_133"),
+    "UserStatusRecently_133": ("_root", "UserStatusRecently_133"),
+    "UserStatusLastWeek_133": ("_root", "UserStatusLastWeek_133"),
+    "UserStatusLastMonth_133": ("_root", "UserStatusLastMonth_133"),
+    "Channel_133": ("_root", "Channel_133"),
+    "ChatFull_133": ("_root", "ChatFull_133"),
+    "ChannelFull_133": ("_root", "ChannelFull_133"),
+    "Message_133": ("_root", "Message_133"),
+    "MessageService_133": ("_root", "MessageService_133"),
+    "MessageMediaDocument_133": ("_root", "MessageMediaDocument_133"),
+    "MessageMediaWebPage_133": ("_root", "MessageMediaWebPage_133"),
+    "MessageMediaInvoice_133": ("_root", "MessageMediaInvoice_133"),
+    "MessageActionPaymentSentMe_133": ("_root", "MessageActionPaymentSentMe_133"),
+    "MessageActionPaymentSent_133": ("_root", "MessageActionPaymentSent_133"),
+    "MessageActionBotAllowed_133": ("_root", "MessageActionBotAllowed_133"),
+    "MessageActionSetMessagesTTL_133": ("_root", "MessageActionSetMessagesTTL_133"),
+    "Dialog_133": ("_root", "Dialog_133"),
+    "InputPeerNotifySettings_133": ("_root", "InputPeerNotifySettings_133"),
+    "PeerNotifySettings_133": ("_root", "PeerNotifySettings_133"),
+    "PeerSettings_133": ("_root", "PeerSettings_133"),
+    "UserFull_133": ("_root", "UserFull_133"),
+    "UpdateUserName_133": ("_root", "UpdateUserName_133"),
+    "UpdateUserPhoto_133": ("_root", "UpdateUserPhoto_133"),
+    "UpdateReadMessagesContents_133": ("_root", "UpdateReadMessagesContents_133"),
+    "UpdateStickerSets_133": ("_root", "UpdateStickerSets_133"),
+    "UpdateDraftMessage_133": ("_root", "UpdateDraftMessage_133"),
+    "UpdateChannelReadMessagesContents_133": ("_root", "UpdateChannelReadMessagesContents_133"),
+    "UpdateDeleteScheduledMessages_133": ("_root", "UpdateDeleteScheduledMessages_133"),
+    "UpdateMessagePollVote_133": ("_root", "UpdateMessagePollVote_133"),
+    "UpdatePeerBlocked_133": ("_root", "UpdatePeerBlocked_133"),
+    "UpdateGroupCall_133": ("_root", "UpdateGroupCall_133"),
+    "Config_133": ("_root", "Config_133"),
+    "EncryptedFile_133": ("_root", "EncryptedFile_133"),
+    "Document_133": ("_root", "Document_133"),
+    "DocumentAttributeVideo_133": ("_root", "DocumentAttributeVideo_133"),
+    "WebPageEmpty_133": ("_root", "WebPageEmpty_133"),
+    "WebPagePending_133": ("_root", "WebPagePending_133"),
+    "ChatInviteExported_133": ("_root", "ChatInviteExported_133"),
+    "ChatInvite_133": ("_root", "ChatInvite_133"),
+    "StickerSet_133": ("_root", "StickerSet_133"),
+    "BotInfo_133": ("_root", "BotInfo_133"),
+    "KeyboardButtonSwitchInline_133": ("_root", "KeyboardButtonSwitchInline_133"),
+    "ChannelParticipant_133": ("_root", "ChannelParticipant_133"),
+    "ChannelParticipantSelf_133": ("_root", "ChannelParticipantSelf_133"),
+    "MessageFwdHeader_133": ("_root", "MessageFwdHeader_133"),
+    "DraftMessage_133": ("_root", "DraftMessage_133"),
+    "Invoice_133": ("_root", "Invoice_133"),
+    "InputStickerSetItem_133": ("_root", "InputStickerSetItem_133"),
+    "PhoneCallWaiting_133": ("_root", "PhoneCallWaiting_133"),
+    "PhoneCallRequested_133": ("_root", "PhoneCallRequested_133"),
+    "PhoneCallAccepted_133": ("_root", "PhoneCallAccepted_133"),
+    "PhoneCall_133": ("_root", "PhoneCall_133"),
+    "PhoneCallDiscarded_133": ("_root", "PhoneCallDiscarded_133"),
+    "PhoneConnection_133": ("_root", "PhoneConnection_133"),
+    "ChannelAdminLogEventActionParticipantJoinByInvite_133": ("_root", "ChannelAdminLogEventActionParticipantJoinByInvite_133"),
+    "FileHash_133": ("_root", "FileHash_133"),
+    "SecureFile_133": ("_root", "SecureFile_133"),
+    "PollAnswer_133": ("_root", "PollAnswer_133"),
+    "Poll_133": ("_root", "Poll_133"),
+    "PollResults_133": ("_root", "PollResults_133"),
+    "CodeSettings_133": ("_root", "CodeSettings_133"),
+    "WallPaperSettings_133": ("_root", "WallPaperSettings_133"),
+    "AutoDownloadSettings_133": ("_root", "AutoDownloadSettings_133"),
+    "Theme_133": ("_root", "Theme_133"),
+    "MessageUserVote_133": ("_root", "MessageUserVote_133"),
+    "MessageUserVoteInputOption_133": ("_root", "MessageUserVoteInputOption_133"),
+    "MessageUserVoteMultiple_133": ("_root", "MessageUserVoteMultiple_133"),
+    "DialogFilter_133": ("_root", "DialogFilter_133"),
+    "MessageInteractionCounters_133": ("_root", "MessageInteractionCounters_133"),
+    "GlobalPrivacySettings_133": ("_root", "GlobalPrivacySettings_133"),
+    "MessageReplyHeader_133": ("_root", "MessageReplyHeader_133"),
+    "GroupCall_133": ("_root", "GroupCall_133"),
+    "ChatInviteImporter_133": ("_root", "ChatInviteImporter_133"),
+    "ChatTheme_133": ("_root", "ChatTheme_133"),
+    "SponsoredMessage_133": ("_root", "SponsoredMessage_133"),
+    "ChatFull_134": ("_root", "ChatFull_134"),
+    "ChannelFull_134": ("_root", "ChannelFull_134"),
+    "ChatInviteExported_134": ("_root", "ChatInviteExported_134"),
+    "ChatInvite_134": ("_root", "ChatInvite_134"),
+    "ChannelParticipantSelf_134": ("_root", "ChannelParticipantSelf_134"),
+    "SponsoredMessage_134": ("_root", "SponsoredMessage_134"),
+    "ChannelFull_135": ("_root", "ChannelFull_135"),
+    "PeerSettings_135": ("_root", "PeerSettings_135"),
+    "UserFull_135": ("_root", "UserFull_135"),
+    "CodeSettings_135": ("_root", "CodeSettings_135"),
+    "ChatFull_136": ("_root", "ChatFull_136"),
+    "ChannelFull_136": ("_root", "ChannelFull_136"),
+    "Message_136": ("_root", "Message_136"),
+    "UpdateMessageReactions_136": ("_root", "UpdateMessageReactions_136"),
+    "ChannelAdminLogEventActionChangeAvailableReactions_136": ("_root", "ChannelAdminLogEventActionChangeAvailableReactions_136"),
+    "SponsoredMessage_136": ("_root", "SponsoredMessage_136"),
+    "ReactionCount_136": ("_root", "ReactionCount_136"),
+    "MessageReactions_136": ("_root", "MessageReactions_136"),
+    "MessageUserReaction_136": ("_root", "MessageUserReaction_136"),
+    "AvailableReaction_136": ("_root", "AvailableReaction_136"),
+    "Dialog_138": ("_root", "Dialog_138"),
+    "MessageReactions_138": ("_root", "MessageReactions_138"),
+    "MessagePeerReaction_138": ("_root", "MessagePeerReaction_138"),
+    "ChannelFull_140": ("_root", "ChannelFull_140"),
+    "InputPeerNotifySettings_140": ("_root", "InputPeerNotifySettings_140"),
+    "PeerNotifySettings_140": ("_root", "PeerNotifySettings_140"),
+    "UserFull_140": ("_root", "UserFull_140"),
+    "BotInfo_140": ("_root", "BotInfo_140"),
+    "AttachMenuBot_140": ("_root", "AttachMenuBot_140"),
+    "WebViewResultUrl_140": ("_root", "WebViewResultUrl_140"),
+    "SimpleWebViewResultUrl_140": ("_root", "SimpleWebViewResultUrl_140"),
+    "MessageActionPaymentSent_143": ("_root", "MessageActionPaymentSent_143"),
+    "BotInfo_143": ("_root", "BotInfo_143"),
+    "Invoice_143": ("_root", "Invoice_143"),
+    "AutoDownloadSettings_143": ("_root", "AutoDownloadSettings_143"),
+    "AttachMenuBot_143": ("_root", "AttachMenuBot_143"),
+    "MessageActionGiftPremium_144": ("_root", "MessageActionGiftPremium_144"),
+    "UserFull_144": ("_root", "UserFull_144"),
+    "StickerSetFullCovered_144": ("_root", "StickerSetFullCovered_144"),
+    "PremiumGiftOption_144": ("_root", "PremiumGiftOption_144"),
+    "User_145": ("_root", "User_145"),
+    "ChatFull_145": ("_root", "ChatFull_145"),
+    "ChannelFull_145": ("_root", "ChannelFull_145"),
+    "Config_145": ("_root", "Config_145"),
+    "MessagePeerReaction_145": ("_root", "MessagePeerReaction_145"),
+    "EmojiStatus_145": ("_root", "EmojiStatus_145"),
+    "EmojiStatusUntil_145": ("_root", "EmojiStatusUntil_145"),
+    "PremiumSubscriptionOption_145": ("_root", "PremiumSubscriptionOption_145"),
+    "InputMediaInvoice_147": ("_root", "InputMediaInvoice_147"),
+    "UpdateMessageExtendedMedia_147": ("_root", "UpdateMessageExtendedMedia_147"),
+    "User_148": ("_root", "User_148"),
+    "Channel_148": ("_root", "Channel_148"),
+    "MessageActionTopicEdit_148": ("_root", "MessageActionTopicEdit_148"),
+    "UpdateChannelPinnedTopic_148": ("_root", "UpdateChannelPinnedTopic_148"),
+    "MessageActionAttachMenuBotAllowed_151": ("_root", "MessageActionAttachMenuBotAllowed_151"),
+    "UserFull_151": ("_root", "UserFull_151"),
+    "MessageActionRequestedPeer_152": ("_root", "MessageActionRequestedPeer_152"),
+    "KeyboardButtonRequestPeer_152": ("_root", "KeyboardButtonRequestPeer_152"),
+    "UpdateGroupInvitePrivacyForbidden_155": ("_root", "UpdateGroupInvitePrivacyForbidden_155"),
+    "SponsoredMessage_155": ("_root", "SponsoredMessage_155"),
+    "AppWebViewResultUrl_155": ("_root", "AppWebViewResultUrl_155"),
+    "MessageActionGiftPremium_158": ("_root", "MessageActionGiftPremium_158"),
+    "MessageActionSetChatWallPaper_158": ("_root", "MessageActionSetChatWallPaper_158"),
+    "MessageActionSetSameChatWallPaper_158": ("_root", "MessageActionSetSameChatWallPaper_158"),
+    "UserFull_158": ("_root", "UserFull_158"),
+    "DialogFilterChatlist_158": ("_root", "DialogFilterChatlist_158"),
+    "InputMediaStory_160": ("_root", "InputMediaStory_160"),
+    "User_160": ("_root", "User_160"),
+    "MessageMediaDocument_160": ("_root", "MessageMediaDocument_160"),
+    "MessageMediaStory_160": ("_root", "MessageMediaStory_160"),
+    "UserFull_160": ("_root", "UserFull_160"),
+    "UpdateStory_160": ("_root", "UpdateStory_160"),
+    "UpdateReadStories_160": ("_root", "UpdateReadStories_160"),
+    "DocumentAttributeVideo_160": ("_root", "DocumentAttributeVideo_160"),
+    "MessageEntityBlockquote_160": ("_root", "MessageEntityBlockquote_160"),
+    "WebPageAttributeStory_160": ("_root", "WebPageAttributeStory_160"),
+    "GlobalPrivacySettings_160": ("_root", "GlobalPrivacySettings_160"),
+    "MessageReplyStoryHeader_160": ("_root", "MessageReplyStoryHeader_160"),
+    "SponsoredMessage_160": ("_root", "SponsoredMessage_160"),
+    "SponsoredWebPage_160": ("_root", "SponsoredWebPage_160"),
+    "StoryViews_160": ("_root", "StoryViews_160"),
+    "StoryItem_160": ("_root", "StoryItem_160"),
+    "UserStories_160": ("_root", "UserStories_160"),
+    "StoryView_160": ("_root", "StoryView_160"),
+    "InputReplyToMessage_160": ("_root", "InputReplyToMessage_160"),
+    "InputReplyToStory_160": ("_root", "InputReplyToStory_160"),
+    "UpdateSentStoryReaction_161": ("_root", "UpdateSentStoryReaction_161"),
+    "StoryViews_161": ("_root", "StoryViews_161"),
+    "StoryItem_161": ("_root", "StoryItem_161"),
+    "MediaAreaCoordinates_161": ("_root", "MediaAreaCoordinates_161"),
+    "MediaAreaGeoPoint_161": ("_root", "MediaAreaGeoPoint_161"),
+    "Channel_164": ("_root", "Channel_164"),
+    "ChannelFull_164": ("_root", "ChannelFull_164"),
+    "UserFull_164": ("_root", "UserFull_164"),
+    "Invoice_164": ("_root", "Invoice_164"),
+    "Booster_164": ("_root", "Booster_164"),
+    "User_166": ("_root", "User_166"),
+    "Channel_166": ("_root", "Channel_166"),
+    "MessageMediaGiveaway_166": ("_root", "MessageMediaGiveaway_166"),
+    "MessageActionGiftCode_166": ("_root", "MessageActionGiftCode_166"),
+    "MessageActionGiveawayLaunch_166": ("_root", "MessageActionGiveawayLaunch_166"),
+    "ChatInvite_166": ("_root", "ChatInvite_166"),
+    "DraftMessage_166": ("_root", "DraftMessage_166"),
+    "ChannelAdminLogEventActionChangeColor_166": ("_root", "ChannelAdminLogEventActionChangeColor_166"),
+    "ChannelAdminLogEventActionChangeBackgroundEmoji_166": ("_root", "ChannelAdminLogEventActionChangeBackgroundEmoji_166"),
+    "MessageReplyHeader_166": ("_root", "MessageReplyHeader_166"),
+    "InputStorePaymentPremiumGiftCode_166": ("_root", "InputStorePaymentPremiumGiftCode_166"),
+    "InputStorePaymentPremiumGiveaway_166": ("_root", "InputStorePaymentPremiumGiveaway_166"),
+    "InputReplyToMessage_166": ("_root", "InputReplyToMessage_166"),
+    "Boost_166": ("_root", "Boost_166"),
+    "User_167": ("_root", "User_167"),
+    "Channel_167": ("_root", "Channel_167"),
+    "MessageActionGiveawayResults_167": ("_root", "MessageActionGiveawayResults_167"),
+    "SponsoredMessage_167": ("_root", "SponsoredMessage_167"),
+    "StoryItem_167": ("_root", "StoryItem_167"),
+    "Channel_168": ("_root", "Channel_168"),
+    "ChannelFull_168": ("_root", "ChannelFull_168"),
+    "MessageMediaGiveaway_168": ("_root", "MessageMediaGiveaway_168"),
+    "MessageMediaGiveawayResults_168": ("_root", "MessageMediaGiveawayResults_168"),
+    "MessageActionGiftCode_168": ("_root", "MessageActionGiftCode_168"),
+    "Message_170": ("_root", "Message_170"),
+    "ChannelFull_174": ("_root", "ChannelFull_174"),
+    "Message_174": ("_root", "Message_174"),
+    "Message_176": ("_root", "Message_176"),
+    "UserFull_176": ("_root", "UserFull_176"),
+    "DialogFilter_176": ("_root", "DialogFilter_176"),
+    "DialogFilterChatlist_176": ("_root", "DialogFilterChatlist_176"),
+    "ConnectedBot_176": ("_root", "ConnectedBot_176"),
+    "Message_177": ("_root", "Message_177"),
+    "PeerSettings_177": ("_root", "PeerSettings_177"),
+    "UserFull_177": ("_root", "UserFull_177"),
+    "PhoneCall_177": ("_root", "PhoneCall_177"),
+    "ConnectedBot_177": ("_root", "ConnectedBot_177"),
+    "BotBusinessConnection_177": ("_root", "BotBusinessConnection_177"),
+    "ChannelFull_179": ("_root", "ChannelFull_179"),
+    "UpdateBroadcastRevenueTransactions_179": ("_root", "UpdateBroadcastRevenueTransactions_179"),
+    "SponsoredMessage_179": ("_root", "SponsoredMessage_179"),
+    "BroadcastRevenueBalances_179": ("_root", "BroadcastRevenueBalances_179"),
+    "Message_181": ("_root", "Message_181"),
+    "UpdateStarsBalance_181": ("_root", "UpdateStarsBalance_181"),
+    "InputInvoiceStars_181": ("_root", "InputInvoiceStars_181"),
+    "InputStorePaymentStars_181": ("_root", "InputStorePaymentStars_181"),
+    "StarsTransaction_181": ("_root", "StarsTransaction_181"),
+    "StarsTransaction_182": ("_root", "StarsTransaction_182"),
+    "StarsRevenueStatus_182": ("_root", "StarsRevenueStatus_182"),
+    "InputMediaPaidMedia_183": ("_root", "InputMediaPaidMedia_183"),
+    "StarsTransaction_183": ("_root", "StarsTransaction_183"),
+    "User_185": ("_root", "User_185"),
+    "DocumentAttributeVideo_185": ("_root", "DocumentAttributeVideo_185"),
+    "Channel_186": ("_root", "Channel_186"),
+    "ChatInvite_186": ("_root", "ChatInvite_186"),
+    "BotInfo_186": ("_root", "BotInfo_186"),
+    "StarsTransaction_186": ("_root", "StarsTransaction_186"),
+    "StarsSubscription_186": ("_root", "StarsSubscription_186"),
+    "UpdatePaidReactionPrivacy_187": ("_root", "UpdatePaidReactionPrivacy_187"),
+    "StarsTransaction_187": ("_root", "StarsTransaction_187"),
+    "MessageMediaDocument_189": ("_root", "MessageMediaDocument_189"),
+    "MessageActionStarGift_189": ("_root", "MessageActionStarGift_189"),
+    "UserFull_189": ("_root", "UserFull_189"),
+    "InputInvoiceStarGift_189": ("_root", "InputInvoiceStarGift_189"),
+    "StarsTransaction_189": ("_root", "StarsTransaction_189"),
+    "StarGift_189": ("_root", "StarGift_189"),
+    "UserStarGift_189": ("_root", "UserStarGift_189"),
+    "StarsTransaction_192": ("_root", "StarsTransaction_192"),
+    "StarGift_192": ("_root", "StarGift_192"),
+    "MessageActionStarGift_193": ("_root", "MessageActionStarGift_193"),
+    "UpdateBotSubscriptionExpire_193": ("_root", "UpdateBotSubscriptionExpire_193"),
+    "BotInfo_193": ("_root", "BotInfo_193"),
+    "UserFull_195": ("_root", "UserFull_195"),
+    "StarsTransaction_195": ("_root", "StarsTransaction_195"),
+    "User_196": ("_root", "User_196"),
+    "Channel_196": ("_root", "Channel_196"),
+    "ChannelFull_196": ("_root", "ChannelFull_196"),
+    "Message_196": ("_root", "Message_196"),
+    "MessageActionStarGift_196": ("_root", "MessageActionStarGift_196"),
+    "MessageActionStarGiftUnique_196": ("_root", "MessageActionStarGiftUnique_196"),
+    "UserFull_196": ("_root", "UserFull_196"),
+    "PhoneCallDiscardReasonAllowGroupCall_196": ("_root", "PhoneCallDiscardReasonAllowGroupCall_196"),
+    "InputInvoiceStarGiftUpgrade_196": ("_root", "InputInvoiceStarGiftUpgrade_196"),
+    "InputInvoiceStarGiftTransfer_196": ("_root", "InputInvoiceStarGiftTransfer_196"),
+    "StarGiftUnique_196": ("_root", "StarGiftUnique_196"),
+    "UserStarGift_196Base": ("_root", "UserStarGift_196Base"),
+    "StarGiftAttributeOriginalDetails_196": ("_root", "StarGiftAttributeOriginalDetails_196"),
+    "StarGiftUnique_197": ("_root", "StarGiftUnique_197"),
+    "StarGiftUnique_198": ("_root", "StarGiftUnique_198"),
+    "UserFull_200": ("_root", "UserFull_200"),
+    "GlobalPrivacySettings_200": ("_root", "GlobalPrivacySettings_200"),
+    "InputMediaUploadedDocument": ("_root", "InputMediaUploadedDocument"),
+    "InputMediaDocument": ("_root", "InputMediaDocument"),
+    "InputMediaDocumentExternal": ("_root", "InputMediaDocumentExternal"),
+    "InputMediaInvoice": ("_root", "InputMediaInvoice"),
+    "InputMediaStory": ("_root", "InputMediaStory"),
+    "InputMediaPaidMedia": ("_root", "InputMediaPaidMedia"),
+    "InputChatUploadedPhoto": ("_root", "InputChatUploadedPhoto"),
+    "User": ("_root", "User"),
+    "UserStatusRecently": ("_root", "UserStatusRecently"),
+    "UserStatusLastWeek": ("_root", "UserStatusLastWeek"),
+    "UserStatusLastMonth": ("_root", "UserStatusLastMonth"),
+    "Channel": ("_root", "Channel"),
+    "ChatFull": ("_root", "ChatFull"),
+    "ChannelFull": ("_root", "ChannelFull"),
+    "Message": ("_root", "Message"),
+    "MessageService": ("_root", "MessageService"),
+    "MessageMediaDocument": ("_root", "MessageMediaDocument"),
+    "MessageMediaWebPage": ("_root", "MessageMediaWebPage"),
+    "MessageMediaInvoice": ("_root", "MessageMediaInvoice"),
+    "MessageMediaStory": ("_root", "MessageMediaStory"),
+    "MessageMediaGiveaway": ("_root", "MessageMediaGiveaway"),
+    "MessageMediaGiveawayResults": ("_root", "MessageMediaGiveawayResults"),
+    "MessageActionPaymentSentMe": ("_root", "MessageActionPaymentSentMe"),
+    "MessageActionPaymentSent": ("_root", "MessageActionPaymentSent"),
+    "MessageActionBotAllowed": ("_root", "MessageActionBotAllowed"),
+    "MessageActionSetMessagesTTL": ("_root", "MessageActionSetMessagesTTL"),
+    "MessageActionGiftPremium": ("_root", "MessageActionGiftPremium"),
+    "MessageActionTopicEdit": ("_root", "MessageActionTopicEdit"),
+    "MessageActionRequestedPeer": ("_root", "MessageActionRequestedPeer"),
+    "MessageActionSetChatWallPaper": ("_root", "MessageActionSetChatWallPaper"),
+    "MessageActionGiftCode": ("_root", "MessageActionGiftCode"),
+    "MessageActionGiveawayLaunch": ("_root", "MessageActionGiveawayLaunch"),
+    "MessageActionGiveawayResults": ("_root", "MessageActionGiveawayResults"),
+    "MessageActionStarGift": ("_root", "MessageActionStarGift"),
+    "MessageActionStarGiftUnique": ("_root", "MessageActionStarGiftUnique"),
+    "Dialog": ("_root", "Dialog"),
+    "InputPeerNotifySettings": ("_root", "InputPeerNotifySettings"),
+    "PeerNotifySettings": ("_root", "PeerNotifySettings"),
+    "PeerSettings": ("_root", "PeerSettings"),
+    "UserFull": ("_root", "UserFull"),
+    "UpdateUserName": ("_root", "UpdateUserName"),
+    "UpdateReadMessagesContents": ("_root", "UpdateReadMessagesContents"),
+    "UpdateStickerSets": ("_root", "UpdateStickerSets"),
+    "UpdateDraftMessage": ("_root", "UpdateDraftMessage"),
+    "UpdateChannelReadMessagesContents": ("_root", "UpdateChannelReadMessagesContents"),
+    "UpdateDeleteScheduledMessages": ("_root", "UpdateDeleteScheduledMessages"),
+    "UpdateMessagePollVote": ("_root", "UpdateMessagePollVote"),
+    "UpdatePeerBlocked": ("_root", "UpdatePeerBlocked"),
+    "UpdateGroupCall": ("_root", "UpdateGroupCall"),
+    "UpdateMessageReactions": ("_root", "UpdateMessageReactions"),
+    "UpdateMessageExtendedMedia": ("_root", "UpdateMessageExtendedMedia"),
+    "UpdateChannelPinnedTopic": ("_root", "UpdateChannelPinnedTopic"),
+    "UpdateStory": ("_root", "UpdateStory"),
+    "UpdateReadStories": ("_root", "UpdateReadStories"),
+    "UpdateSentStoryReaction": ("_root", "UpdateSentStoryReaction"),
+    "UpdateBroadcastRevenueTransactions": ("_root", "UpdateBroadcastRevenueTransactions"),
+    "UpdateStarsBalance": ("_root", "UpdateStarsBalance"),
+    "UpdatePaidReactionPrivacy": ("_root", "UpdatePaidReactionPrivacy"),
+    "Config": ("_root", "Config"),
+    "EncryptedFile": ("_root", "EncryptedFile"),
+    "Document": ("_root", "Document"),
+    "DocumentAttributeVideo": ("_root", "DocumentAttributeVideo"),
+    "WebPageEmpty": ("_root", "WebPageEmpty"),
+    "WebPagePending": ("_root", "WebPagePending"),
+    "ChatInviteExported": ("_root", "ChatInviteExported"),
+    "ChatInvite": ("_root", "ChatInvite"),
+    "StickerSet": ("_root", "StickerSet"),
+    "BotInfo": ("_root", "BotInfo"),
+    "KeyboardButtonSwitchInline": ("_root", "KeyboardButtonSwitchInline"),
+    "KeyboardButtonRequestPeer": ("_root", "KeyboardButtonRequestPeer"),
+    "MessageEntityBlockquote": ("_root", "MessageEntityBlockquote"),
+    "ChannelParticipant": ("_root", "ChannelParticipant"),
+    "ChannelParticipantSelf": ("_root", "ChannelParticipantSelf"),
+    "MessageFwdHeader": ("_root", "MessageFwdHeader"),
+    "DraftMessage": ("_root", "DraftMessage"),
+    "StickerSetFullCovered": ("_root", "StickerSetFullCovered"),
+    "Invoice": ("_root", "Invoice"),
+    "InputStickerSetItem": ("_root", "InputStickerSetItem"),
+    "PhoneCallWaiting": ("_root", "PhoneCallWaiting"),
+    "PhoneCallRequested": ("_root", "PhoneCallRequested"),
+    "PhoneCallAccepted": ("_root", "PhoneCallAccepted"),
+    "PhoneCall": ("_root", "PhoneCall"),
+    "PhoneCallDiscarded": ("_root", "PhoneCallDiscarded"),
+    "PhoneConnection": ("_root", "PhoneConnection"),
+    "LangPackLanguage": ("_root", "LangPackLanguage"),
+    "ChannelAdminLogEventActionParticipantJoinByInvite": ("_root", "ChannelAdminLogEventActionParticipantJoinByInvite"),
+    "ChannelAdminLogEventActionChangeAvailableReactions": ("_root", "ChannelAdminLogEventActionChangeAvailableReactions"),
+    "FileHash": ("_root", "FileHash"),
+    "SecureFile": ("_root", "SecureFile"),
+    "PollAnswer": ("_root", "PollAnswer"),
+    "Poll": ("_root", "Poll"),
+    "PollResults": ("_root", "PollResults"),
+    "CodeSettings": ("_root", "CodeSettings"),
+    "WallPaperSettings": ("_root", "WallPaperSettings"),
+    "AutoDownloadSettings": ("_root", "AutoDownloadSettings"),
+    "Theme": ("_root", "Theme"),
+    "WebPageAttributeStory": ("_root", "WebPageAttributeStory"),
+    "DialogFilter": ("_root", "DialogFilter"),
+    "DialogFilterChatlist": ("_root", "DialogFilterChatlist"),
+    "GlobalPrivacySettings": ("_root", "GlobalPrivacySettings"),
+    "MessageReplyHeader": ("_root", "MessageReplyHeader"),
+    "MessageReplyStoryHeader": ("_root", "MessageReplyStoryHeader"),
+    "GroupCall": ("_root", "GroupCall"),
+    "ChatInviteImporter": ("_root", "ChatInviteImporter"),
+    "SponsoredMessage": ("_root", "SponsoredMessage"),
+    "ReactionCount": ("_root", "ReactionCount"),
+    "MessageReactions": ("_root", "MessageReactions"),
+    "AvailableReaction": ("_root", "AvailableReaction"),
+    "MessagePeerReaction": ("_root", "MessagePeerReaction"),
+    "AttachMenuBot": ("_root", "AttachMenuBot"),
+    "WebViewResultUrl": ("_root", "WebViewResultUrl"),
+    "InputInvoiceStars": ("_root", "InputInvoiceStars"),
+    "InputInvoiceStarGift": ("_root", "InputInvoiceStarGift"),
+    "InputInvoiceStarGiftUpgrade": ("_root", "InputInvoiceStarGiftUpgrade"),
+    "InputInvoiceStarGiftTransfer": ("_root", "InputInvoiceStarGiftTransfer"),
+    "InputStorePaymentPremiumGiftCode": ("_root", "InputStorePaymentPremiumGiftCode"),
+    "InputStorePaymentPremiumGiveaway": ("_root", "InputStorePaymentPremiumGiveaway"),
+    "EmojiStatus": ("_root", "EmojiStatus"),
+    "PremiumSubscriptionOption": ("_root", "PremiumSubscriptionOption"),
+    "StoryViews": ("_root", "StoryViews"),
+    "StoryItem": ("_root", "StoryItem"),
+    "StoryView": ("_root", "StoryView"),
+    "InputReplyToMessage": ("_root", "InputReplyToMessage"),
+    "InputReplyToStory": ("_root", "InputReplyToStory"),
+    "MediaAreaCoordinates": ("_root", "MediaAreaCoordinates"),
+    "MediaAreaGeoPoint": ("_root", "MediaAreaGeoPoint"),
+    "Boost": ("_root", "Boost"),
+    "ConnectedBot": ("_root", "ConnectedBot"),
+    "BotBusinessConnection": ("_root", "BotBusinessConnection"),
+    "BroadcastRevenueBalances": ("_root", "BroadcastRevenueBalances"),
+    "StarsTransaction": ("_root", "StarsTransaction"),
+    "StarsRevenueStatus": ("_root", "StarsRevenueStatus"),
+    "StarsSubscription": ("_root", "StarsSubscription"),
+    "StarGift": ("_root", "StarGift"),
+    "StarGiftUnique": ("_root", "StarGiftUnique"),
+    "StarGiftAttributeOriginalDetails": ("_root", "StarGiftAttributeOriginalDetails"),
+    "UserStarGift_196": ("_root", "UserStarGift_196"),
+}
+
+__getattr__ = lazy_getattr(__name__, globals(), LAZY_INDEX)
@@ -0,0 +1,1287 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class PrivacyRules(TLObject):
+    __tl_id__ = 0x50a04e45
+    __tl_name__ = "types.account.PrivacyRules"
+    __tl_layer__ = 133
+
+    __slots__ = ("rules", "chats", "users", )
+
+    def __init__(self, *, rules: list[tl.base.PrivacyRule], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.rules = rules
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.rules, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PrivacyRules:
+        rules = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(rules=rules, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PrivacyRules, int]:
+        rules, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(rules=rules, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class AuthorizationsBase(TLObject):
+    __tl_id__ = 0x4bff8ea0
+    __tl_name__ = "types.account.Authorizations"
+    __tl_layer__ = 135
+
+    __slots__ = ("authorization_ttl_days", "authorizations", )
+
+    def __init__(self, *, authorization_ttl_days: int, authorizations: list[tl.base.Authorization]):
+        self.authorization_ttl_days = authorization_ttl_days
+        self.authorizations = authorizations
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.authorization_ttl_days)
+        TLObjectVector.write_to(out, self.authorizations, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Authorizations:
+        authorization_ttl_days = Int.read(stream)
+        authorizations = TLObjectVector.read(stream)
+        return cls(authorization_ttl_days=authorization_ttl_days, authorizations=authorizations)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Authorizations, int]:
+        authorization_ttl_days, cursor = Int.read_from(view, cursor)
+        authorizations, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(authorization_ttl_days=authorization_ttl_days, authorizations=authorizations), cursor
+
+
+class PasswordBase(TLObject):
+    __tl_id__ = 0x957b50fb
+    __tl_name__ = "types.account.Password"
+    __tl_layer__ = 145
+
+    __slots__ = ("has_recovery", "has_secure_values", "has_password", "current_algo", "srp_B", "srp_id", "hint", "email_unconfirmed_pattern", "new_algo", "new_secure_algo", "secure_random", "pending_reset_date", "login_email_pattern", )
+
+    def __init__(self, *, new_algo: tl.base.PasswordKdfAlgo, new_secure_algo: tl.base.SecurePasswordKdfAlgo, secure_random: bytes, has_recovery: bool = False, has_secure_values: bool = False, has_password: bool = False, current_algo: tl.base.PasswordKdfAlgo | None = None, srp_B: bytes | None = None, srp_id: int | None = None, hint: str | None = None, email_unconfirmed_pattern: str | None = None, pending_reset_date: int | None = None, login_email_pattern: str | None = None):
+        self.has_recovery = has_recovery
+        self.has_secure_values = has_secure_values
+        self.has_password = has_password
+        self.current_algo = current_algo
+        self.srp_B = srp_B
+        self.srp_id = srp_id
+        self.hint = hint
+        self.email_unconfirmed_pattern = email_unconfirmed_pattern
+        self.new_algo = new_algo
+        self.new_secure_algo = new_secure_algo
+        self.secure_random = secure_random
+        self.pending_reset_date = pending_reset_date
+        self.login_email_pattern = login_email_pattern
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.has_password is False, self.current_algo is None, self.srp_B is None, self.srp_id is None)
+        _flags_fields_not_empty = (self.has_password is True, self.current_algo is not None, self.srp_B is not None, self.srp_id is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: has_password, current_algo, srp_B, srp_id")
+        flags1 = 0
+        if self.has_recovery: flags1 |= (1 << 0)
+        if self.has_secure_values: flags1 |= (1 << 1)
+        if self.has_password: flags1 |= (1 << 2)
+        if self.current_algo is not None: flags1 |= (1 << 2)
+        if self.srp_B is not None: flags1 |= (1 << 2)
+        if self.srp_id is not None: flags1 |= (1 << 2)
+        if self.hint is not None: flags1 |= (1 << 3)
+        if self.email_unconfirmed_pattern is not None: flags1 |= (1 << 4)
+        if self.pending_reset_date is not None: flags1 |= (1 << 5)
+        if self.login_email_pattern is not None: flags1 |= (1 << 6)
+        out += Int.write(flags1)
+        if self.current_algo is not None:
+            self.current_algo.write_to(out, ctx)
+        if self.srp_B is not None:
+            Bytes.write_to(out, self.srp_B)
+        if self.srp_id is not None:
+            out += Long.write(self.srp_id)
+        if self.hint is not None:
+            String.write_to(out, self.hint)
+        if self.email_unconfirmed_pattern is not None:
+            String.write_to(out, self.email_unconfirmed_pattern)
+        self.new_algo.write_to(out, ctx)
+        self.new_secure_algo.write_to(out, ctx)
+        Bytes.write_to(out, self.secure_random)
+        if self.pending_reset_date is not None:
+            out += Int.write(self.pending_reset_date)
+        if self.login_email_pattern is not None:
+            String.write_to(out, self.login_email_pattern)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Password:
+        flags1 = Int.read(stream)
+        has_recovery = (flags1 & (1 << 0)) == (1 << 0)
+        has_secure_values = (flags1 & (1 << 1)) == (1 << 1)
+        has_password = (flags1 & (1 << 2)) == (1 << 2)
+        current_algo = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        srp_B = Bytes.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        srp_id = Long.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        hint = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        email_unconfirmed_pattern = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        new_algo = TLObject.read(stream)
+        new_secure_algo = TLObject.read(stream)
+        secure_random = Bytes.read(stream)
+        pending_reset_date = Int.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        login_email_pattern = String.read(stream) if (flags1 & (1 << 6)) == (1 << 6) else None
+        return cls(has_recovery=has_recovery, has_secure_values=has_secure_values, has_password=has_password, current_algo=current_algo, srp_B=srp_B, srp_id=srp_id, hint=hint, email_unconfirmed_pattern=email_unconfirmed_pattern, new_algo=new_algo, new_secure_algo=new_secure_algo, secure_random=secure_random, pending_reset_date=pending_reset_date, login_email_pattern=login_email_pattern)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Password, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        has_recovery = (flags1 & (1 << 0)) == (1 << 0)
+        has_secure_values = (flags1 & (1 << 1)) == (1 << 1)
+        has_password = (flags1 & (1 << 2)) == (1 << 2)
+        current_algo, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        srp_B, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        srp_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        hint, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        email_unconfirmed_pattern, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        new_algo, cursor = TLObject.read_from(view, cursor)
+        new_secure_algo, cursor = TLObject.read_from(view, cursor)
+        secure_random, cursor = Bytes.read_from(view, cursor)
+        pending_reset_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        login_email_pattern, cursor = String.read_from(view, cursor) if (flags1 & (1 << 6)) == (1 << 6) else (None, cursor)
+        return cls(has_recovery=has_recovery, has_secure_values=has_secure_values, has_password=has_password, current_algo=current_algo, srp_B=srp_B, srp_id=srp_id, hint=hint, email_unconfirmed_pattern=email_unconfirmed_pattern, new_algo=new_algo, new_secure_algo=new_secure_algo, secure_random=secure_random, pending_reset_date=pending_reset_date, login_email_pattern=login_email_pattern), cursor
+
+
+class PasswordSettings(TLObject):
+    __tl_id__ = 0x9a5c33e5
+    __tl_name__ = "types.account.PasswordSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("email", "secure_settings", )
+
+    def __init__(self, *, email: str | None = None, secure_settings: tl.types.SecureSecretSettings | None = None):
+        self.email = email
+        self.secure_settings = secure_settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.email is not None: flags1 |= (1 << 0)
+        if self.secure_settings is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.email is not None:
+            String.write_to(out, self.email)
+        if self.secure_settings is not None:
+            self.secure_settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PasswordSettings:
+        flags1 = Int.read(stream)
+        email = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        secure_settings = tl.types.SecureSecretSettings.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(email=email, secure_settings=secure_settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PasswordSettings, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        email, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        secure_settings, cursor = tl.types.SecureSecretSettings.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(email=email, secure_settings=secure_settings), cursor
+
+
+class PasswordInputSettings(TLObject):
+    __tl_id__ = 0xc23727c9
+    __tl_name__ = "types.account.PasswordInputSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("new_algo", "new_password_hash", "hint", "email", "new_secure_settings", )
+
+    def __init__(self, *, new_algo: tl.base.PasswordKdfAlgo | None = None, new_password_hash: bytes | None = None, hint: str | None = None, email: str | None = None, new_secure_settings: tl.types.SecureSecretSettings | None = None):
+        self.new_algo = new_algo
+        self.new_password_hash = new_password_hash
+        self.hint = hint
+        self.email = email
+        self.new_secure_settings = new_secure_settings
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.new_algo is None, self.new_password_hash is None, self.hint is None)
+        _flags_fields_not_empty = (self.new_algo is not None, self.new_password_hash is not None, self.hint is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: new_algo, new_password_hash, hint")
+        flags1 = 0
+        if self.new_algo is not None: flags1 |= (1 << 0)
+        if self.new_password_hash is not None: flags1 |= (1 << 0)
+        if self.hint is not None: flags1 |= (1 << 0)
+        if self.email is not None: flags1 |= (1 << 1)
+        if self.new_secure_settings is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.new_algo is not None:
+            self.new_algo.write_to(out, ctx)
+        if self.new_password_hash is not None:
+            Bytes.write_to(out, self.new_password_hash)
+        if self.hint is not None:
+            String.write_to(out, self.hint)
+        if self.email is not None:
+            String.write_to(out, self.email)
+        if self.new_secure_settings is not None:
+            self.new_secure_settings.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PasswordInputSettings:
+        flags1 = Int.read(stream)
+        new_algo = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        new_password_hash = Bytes.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        hint = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        email = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        new_secure_settings = tl.types.SecureSecretSettings.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(new_algo=new_algo, new_password_hash=new_password_hash, hint=hint, email=email, new_secure_settings=new_secure_settings)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PasswordInputSettings, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        new_algo, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        new_password_hash, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        hint, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        email, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        new_secure_settings, cursor = tl.types.SecureSecretSettings.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(new_algo=new_algo, new_password_hash=new_password_hash, hint=hint, email=email, new_secure_settings=new_secure_settings), cursor
+
+
+class TmpPassword(TLObject):
+    __tl_id__ = 0xdb64fd34
+    __tl_name__ = "types.account.TmpPassword"
+    __tl_layer__ = 133
+
+    __slots__ = ("tmp_password", "valid_until", )
+
+    def __init__(self, *, tmp_password: bytes, valid_until: int):
+        self.tmp_password = tmp_password
+        self.valid_until = valid_until
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.tmp_password)
+        out += Int.write(self.valid_until)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TmpPassword:
+        tmp_password = Bytes.read(stream)
+        valid_until = Int.read(stream)
+        return cls(tmp_password=tmp_password, valid_until=valid_until)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TmpPassword, int]:
+        tmp_password, cursor = Bytes.read_from(view, cursor)
+        valid_until, cursor = Int.read_from(view, cursor)
+        return cls(tmp_password=tmp_password, valid_until=valid_until), cursor
+
+
+class WebAuthorizations(TLObject):
+    __tl_id__ = 0xed56c9fc
+    __tl_name__ = "types.account.WebAuthorizations"
+    __tl_layer__ = 133
+
+    __slots__ = ("authorizations", "users", )
+
+    def __init__(self, *, authorizations: list[tl.base.WebAuthorization], users: list[tl.base.User]):
+        self.authorizations = authorizations
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.authorizations, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> WebAuthorizations:
+        authorizations = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(authorizations=authorizations, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[WebAuthorizations, int]:
+        authorizations, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(authorizations=authorizations, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class AuthorizationForm(TLObject):
+    __tl_id__ = 0xad2e1cd8
+    __tl_name__ = "types.account.AuthorizationForm"
+    __tl_layer__ = 133
+
+    __slots__ = ("required_types", "values", "errors", "users", "privacy_policy_url", )
+
+    def __init__(self, *, required_types: list[tl.base.SecureRequiredType], values: list[tl.base.SecureValue], errors: list[tl.base.SecureValueError], users: list[tl.base.User], privacy_policy_url: str | None = None):
+        self.required_types = required_types
+        self.values = values
+        self.errors = errors
+        self.users = users
+        self.privacy_policy_url = privacy_policy_url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.privacy_policy_url is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        TLObjectVector.write_to(out, self.required_types, ctx)
+        TLObjectVector.write_to(out, self.values, ctx)
+        TLObjectVector.write_to(out, self.errors, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.privacy_policy_url is not None:
+            String.write_to(out, self.privacy_policy_url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AuthorizationForm:
+        flags1 = Int.read(stream)
+        required_types = TLObjectVector.read(stream)
+        values = TLObjectVector.read(stream)
+        errors = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        privacy_policy_url = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(required_types=required_types, values=values, errors=errors, users=users, privacy_policy_url=privacy_policy_url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AuthorizationForm, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        required_types, cursor = TLObjectVector.read_from(view, cursor)
+        values, cursor = TLObjectVector.read_from(view, cursor)
+        errors, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        privacy_policy_url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(required_types=required_types, values=values, errors=errors, users=users, privacy_policy_url=privacy_policy_url), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SentEmailCode(TLObject):
+    __tl_id__ = 0x811f854f
+    __tl_name__ = "types.account.SentEmailCode"
+    __tl_layer__ = 133
+
+    __slots__ = ("email_pattern", "length", )
+
+    def __init__(self, *, email_pattern: str, length: int):
+        self.email_pattern = email_pattern
+        self.length = length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.email_pattern)
+        out += Int.write(self.length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentEmailCode:
+        email_pattern = String.read(stream)
+        length = Int.read(stream)
+        return cls(email_pattern=email_pattern, length=length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentEmailCode, int]:
+        email_pattern, cursor = String.read_from(view, cursor)
+        length, cursor = Int.read_from(view, cursor)
+        return cls(email_pattern=email_pattern, length=length), cursor
+
+
+class Takeout(TLObject):
+    __tl_id__ = 0x4dba4501
+    __tl_name__ = "types.account.Takeout"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: int):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Takeout:
+        id = Long.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Takeout, int]:
+        id, cursor = Long.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class WallPapersNotModified(TLObject):
+    __tl_id__ = 0x1c199183
+    __tl_name__ = "types.account.WallPapersNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> WallPapersNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[WallPapersNotModified, int]:
+        return cls(), cursor
+
+
+class WallPapers(TLObject):
+    __tl_id__ = 0xcdc3858c
+    __tl_name__ = "types.account.WallPapers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "wallpapers", )
+
+    def __init__(self, *, hash: int, wallpapers: list[tl.base.WallPaper]):
+        self.hash = hash
+        self.wallpapers = wallpapers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.wallpapers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> WallPapers:
+        hash = Long.read(stream)
+        wallpapers = TLObjectVector.read(stream)
+        return cls(hash=hash, wallpapers=wallpapers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[WallPapers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        wallpapers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, wallpapers=wallpapers), cursor
+
+
+class AutoDownloadSettings(TLObject):
+    __tl_id__ = 0x63cacf26
+    __tl_name__ = "types.account.AutoDownloadSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("low", "medium", "high", )
+
+    def __init__(self, *, low: tl.base.AutoDownloadSettings, medium: tl.base.AutoDownloadSettings, high: tl.base.AutoDownloadSettings):
+        self.low = low
+        self.medium = medium
+        self.high = high
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.low.write_to(out, ctx)
+        self.medium.write_to(out, ctx)
+        self.high.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AutoDownloadSettings:
+        low = TLObject.read(stream)
+        medium = TLObject.read(stream)
+        high = TLObject.read(stream)
+        return cls(low=low, medium=medium, high=high)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AutoDownloadSettings, int]:
+        low, cursor = TLObject.read_from(view, cursor)
+        medium, cursor = TLObject.read_from(view, cursor)
+        high, cursor = TLObject.read_from(view, cursor)
+        return cls(low=low, medium=medium, high=high), cursor
+
+
+class ThemesNotModified(TLObject):
+    __tl_id__ = 0xf41eb622
+    __tl_name__ = "types.account.ThemesNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ThemesNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ThemesNotModified, int]:
+        return cls(), cursor
+
+
+class Themes(TLObject):
+    __tl_id__ = 0x9a3d8c6d
+    __tl_name__ = "types.account.Themes"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "themes", )
+
+    def __init__(self, *, hash: int, themes: list[tl.base.Theme]):
+        self.hash = hash
+        self.themes = themes
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.themes, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Themes:
+        hash = Long.read(stream)
+        themes = TLObjectVector.read(stream)
+        return cls(hash=hash, themes=themes)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Themes, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        themes, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, themes=themes), cursor
+
+
+class ContentSettings(TLObject):
+    __tl_id__ = 0x57e28221
+    __tl_name__ = "types.account.ContentSettings"
+    __tl_layer__ = 133
+
+    __slots__ = ("sensitive_enabled", "sensitive_can_change", )
+
+    def __init__(self, *, sensitive_enabled: bool = False, sensitive_can_change: bool = False):
+        self.sensitive_enabled = sensitive_enabled
+        self.sensitive_can_change = sensitive_can_change
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.sensitive_enabled: flags1 |= (1 << 0)
+        if self.sensitive_can_change: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ContentSettings:
+        flags1 = Int.read(stream)
+        sensitive_enabled = (flags1 & (1 << 0)) == (1 << 0)
+        sensitive_can_change = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(sensitive_enabled=sensitive_enabled, sensitive_can_change=sensitive_can_change)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ContentSettings, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        sensitive_enabled = (flags1 & (1 << 0)) == (1 << 0)
+        sensitive_can_change = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(sensitive_enabled=sensitive_enabled, sensitive_can_change=sensitive_can_change), cursor
+
+
+class ResetPasswordFailedWait(TLObject):
+    __tl_id__ = 0xe3779861
+    __tl_name__ = "types.account.ResetPasswordFailedWait"
+    __tl_layer__ = 133
+
+    __slots__ = ("retry_date", )
+
+    def __init__(self, *, retry_date: int):
+        self.retry_date = retry_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.retry_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetPasswordFailedWait:
+        retry_date = Int.read(stream)
+        return cls(retry_date=retry_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetPasswordFailedWait, int]:
+        retry_date, cursor = Int.read_from(view, cursor)
+        return cls(retry_date=retry_date), cursor
+
+
+class ResetPasswordRequestedWait(TLObject):
+    __tl_id__ = 0xe9effc7d
+    __tl_name__ = "types.account.ResetPasswordRequestedWait"
+    __tl_layer__ = 133
+
+    __slots__ = ("until_date", )
+
+    def __init__(self, *, until_date: int):
+        self.until_date = until_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.until_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetPasswordRequestedWait:
+        until_date = Int.read(stream)
+        return cls(until_date=until_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetPasswordRequestedWait, int]:
+        until_date, cursor = Int.read_from(view, cursor)
+        return cls(until_date=until_date), cursor
+
+
+class ResetPasswordOk(TLObject):
+    __tl_id__ = 0xe926d63e
+    __tl_name__ = "types.account.ResetPasswordOk"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResetPasswordOk:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResetPasswordOk, int]:
+        return cls(), cursor
+
+
+class SavedRingtonesNotModified(TLObject):
+    __tl_id__ = 0xfbf6e8b1
+    __tl_name__ = "types.account.SavedRingtonesNotModified"
+    __tl_layer__ = 140
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedRingtonesNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedRingtonesNotModified, int]:
+        return cls(), cursor
+
+
+class SavedRingtones(TLObject):
+    __tl_id__ = 0xc1e92cc5
+    __tl_name__ = "types.account.SavedRingtones"
+    __tl_layer__ = 140
+
+    __slots__ = ("hash", "ringtones", )
+
+    def __init__(self, *, hash: int, ringtones: list[tl.base.Document]):
+        self.hash = hash
+        self.ringtones = ringtones
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.ringtones, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedRingtones:
+        hash = Long.read(stream)
+        ringtones = TLObjectVector.read(stream)
+        return cls(hash=hash, ringtones=ringtones)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedRingtones, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        ringtones, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, ringtones=ringtones), cursor
+
+
+class SavedRingtone(TLObject):
+    __tl_id__ = 0xb7263f6d
+    __tl_name__ = "types.account.SavedRingtone"
+    __tl_layer__ = 140
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedRingtone:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedRingtone, int]:
+        return cls(), cursor
+
+
+class SavedRingtoneConverted(TLObject):
+    __tl_id__ = 0x1f307eb7
+    __tl_name__ = "types.account.SavedRingtoneConverted"
+    __tl_layer__ = 140
+
+    __slots__ = ("document", )
+
+    def __init__(self, *, document: tl.base.Document):
+        self.document = document
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.document.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedRingtoneConverted:
+        document = TLObject.read(stream)
+        return cls(document=document)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedRingtoneConverted, int]:
+        document, cursor = TLObject.read_from(view, cursor)
+        return cls(document=document), cursor
+
+
+class EmojiStatusesNotModified(TLObject):
+    __tl_id__ = 0xd08ce645
+    __tl_name__ = "types.account.EmojiStatusesNotModified"
+    __tl_layer__ = 145
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EmojiStatusesNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EmojiStatusesNotModified, int]:
+        return cls(), cursor
+
+
+class EmojiStatuses(TLObject):
+    __tl_id__ = 0x90c467d1
+    __tl_name__ = "types.account.EmojiStatuses"
+    __tl_layer__ = 145
+
+    __slots__ = ("hash", "statuses", )
+
+    def __init__(self, *, hash: int, statuses: list[tl.base.EmojiStatus]):
+        self.hash = hash
+        self.statuses = statuses
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.statuses, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EmojiStatuses:
+        hash = Long.read(stream)
+        statuses = TLObjectVector.read(stream)
+        return cls(hash=hash, statuses=statuses)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EmojiStatuses, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        statuses, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, statuses=statuses), cursor
+
+
+class EmailVerified(TLObject):
+    __tl_id__ = 0x2b96cd1b
+    __tl_name__ = "types.account.EmailVerified"
+    __tl_layer__ = 145
+
+    __slots__ = ("email", )
+
+    def __init__(self, *, email: str):
+        self.email = email
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.email)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EmailVerified:
+        email = String.read(stream)
+        return cls(email=email)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EmailVerified, int]:
+        email, cursor = String.read_from(view, cursor)
+        return cls(email=email), cursor
+
+
+class EmailVerifiedLogin(TLObject):
+    __tl_id__ = 0xe1bb0d61
+    __tl_name__ = "types.account.EmailVerifiedLogin"
+    __tl_layer__ = 145
+
+    __slots__ = ("email", "sent_code", )
+
+    def __init__(self, *, email: str, sent_code: tl.base.auth.SentCode):
+        self.email = email
+        self.sent_code = sent_code
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.email)
+        self.sent_code.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EmailVerifiedLogin:
+        email = String.read(stream)
+        sent_code = TLObject.read(stream)
+        return cls(email=email, sent_code=sent_code)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EmailVerifiedLogin, int]:
+        email, cursor = String.read_from(view, cursor)
+        sent_code, cursor = TLObject.read_from(view, cursor)
+        return cls(email=email, sent_code=sent_code), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.sent_code.check_for_ctx_values(values)
+
+
+class AutoSaveSettings(TLObject):
+    __tl_id__ = 0x4c3e069d
+    __tl_name__ = "types.account.AutoSaveSettings"
+    __tl_layer__ = 152
+
+    __slots__ = ("users_settings", "chats_settings", "broadcasts_settings", "exceptions", "chats", "users", )
+
+    def __init__(self, *, users_settings: tl.types.AutoSaveSettings, chats_settings: tl.types.AutoSaveSettings, broadcasts_settings: tl.types.AutoSaveSettings, exceptions: list[tl.base.AutoSaveException], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.users_settings = users_settings
+        self.chats_settings = chats_settings
+        self.broadcasts_settings = broadcasts_settings
+        self.exceptions = exceptions
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.users_settings.write_to(out, ctx)
+        self.chats_settings.write_to(out, ctx)
+        self.broadcasts_settings.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.exceptions, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AutoSaveSettings:
+        users_settings = tl.types.AutoSaveSettings.read(stream)
+        chats_settings = tl.types.AutoSaveSettings.read(stream)
+        broadcasts_settings = tl.types.AutoSaveSettings.read(stream)
+        exceptions = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(users_settings=users_settings, chats_settings=chats_settings, broadcasts_settings=broadcasts_settings, exceptions=exceptions, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AutoSaveSettings, int]:
+        users_settings, cursor = tl.types.AutoSaveSettings.read_from(view, cursor)
+        chats_settings, cursor = tl.types.AutoSaveSettings.read_from(view, cursor)
+        broadcasts_settings, cursor = tl.types.AutoSaveSettings.read_from(view, cursor)
+        exceptions, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(users_settings=users_settings, chats_settings=chats_settings, broadcasts_settings=broadcasts_settings, exceptions=exceptions, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ConnectedBots(TLObject):
+    __tl_id__ = 0x17d7f87b
+    __tl_name__ = "types.account.ConnectedBots"
+    __tl_layer__ = 176
+
+    __slots__ = ("connected_bots", "users", )
+
+    def __init__(self, *, connected_bots: list[tl.base.ConnectedBot], users: list[tl.base.User]):
+        self.connected_bots = connected_bots
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.connected_bots, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConnectedBots:
+        connected_bots = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(connected_bots=connected_bots, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConnectedBots, int]:
+        connected_bots, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(connected_bots=connected_bots, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class BusinessChatLinks(TLObject):
+    __tl_id__ = 0xec43a2d1
+    __tl_name__ = "types.account.BusinessChatLinks"
+    __tl_layer__ = 177
+
+    __slots__ = ("links", "chats", "users", )
+
+    def __init__(self, *, links: list[tl.base.BusinessChatLink], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.links = links
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.links, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BusinessChatLinks:
+        links = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(links=links, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BusinessChatLinks, int]:
+        links, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(links=links, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ResolvedBusinessChatLinks(TLObject):
+    __tl_id__ = 0x9a23af21
+    __tl_name__ = "types.account.ResolvedBusinessChatLinks"
+    __tl_layer__ = 177
+
+    __slots__ = ("peer", "message", "entities", "chats", "users", )
+
+    def __init__(self, *, peer: tl.base.Peer, message: str, chats: list[tl.base.Chat], users: list[tl.base.User], entities: list[tl.base.MessageEntity] | None = None):
+        self.peer = peer
+        self.message = message
+        self.entities = entities
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.entities: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.peer.write_to(out, ctx)
+        String.write_to(out, self.message)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResolvedBusinessChatLinks:
+        flags1 = Int.read(stream)
+        peer = TLObject.read(stream)
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(peer=peer, message=message, entities=entities, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResolvedBusinessChatLinks, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peer=peer, message=message, entities=entities, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PaidMessagesRevenue(TLObject):
+    __tl_id__ = 0x1e109708
+    __tl_name__ = "types.account.PaidMessagesRevenue"
+    __tl_layer__ = 200
+
+    __slots__ = ("stars_amount", )
+
+    def __init__(self, *, stars_amount: int):
+        self.stars_amount = stars_amount
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.stars_amount)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaidMessagesRevenue:
+        stars_amount = Long.read(stream)
+        return cls(stars_amount=stars_amount)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaidMessagesRevenue, int]:
+        stars_amount, cursor = Long.read_from(view, cursor)
+        return cls(stars_amount=stars_amount), cursor
+
+
+class Authorizations_133(TLObject):
+    __tl_id__ = 0x1250abde
+    __tl_name__ = "types.account.Authorizations_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("authorizations", )
+
+    def __init__(self, *, authorizations: list[tl.base.Authorization]):
+        self.authorizations = authorizations
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.authorizations, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Authorizations_133:
+        authorizations = TLObjectVector.read(stream)
+        return cls(authorizations=authorizations)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Authorizations_133, int]:
+        authorizations, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(authorizations=authorizations), cursor
+
+
+class Password_133(TLObject):
+    __tl_id__ = 0x185b184f
+    __tl_name__ = "types.account.Password_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("has_recovery", "has_secure_values", "has_password", "current_algo", "srp_B", "srp_id", "hint", "email_unconfirmed_pattern", "new_algo", "new_secure_algo", "secure_random", "pending_reset_date", )
+
+    def __init__(self, *, new_algo: tl.base.PasswordKdfAlgo, new_secure_algo: tl.base.SecurePasswordKdfAlgo, secure_random: bytes, has_recovery: bool = False, has_secure_values: bool = False, has_password: bool = False, current_algo: tl.base.PasswordKdfAlgo | None = None, srp_B: bytes | None = None, srp_id: int | None = None, hint: str | None = None, email_unconfirmed_pattern: str | None = None, pending_reset_date: int | None = None):
+        self.has_recovery = has_recovery
+        self.has_secure_values = has_secure_values
+        self.has_password = has_password
+        self.current_algo = current_algo
+        self.srp_B = srp_B
+        self.srp_id = srp_id
+        self.hint = hint
+        self.email_unconfirmed_pattern = email_unconfirmed_pattern
+        self.new_algo = new_algo
+        self.new_secure_algo = new_secure_algo
+        self.secure_random = secure_random
+        self.pending_reset_date = pending_reset_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.has_password is False, self.current_algo is None, self.srp_B is None, self.srp_id is None)
+        _flags_fields_not_empty = (self.has_password is True, self.current_algo is not None, self.srp_B is not None, self.srp_id is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: has_password, current_algo, srp_B, srp_id")
+        flags1 = 0
+        if self.has_recovery: flags1 |= (1 << 0)
+        if self.has_secure_values: flags1 |= (1 << 1)
+        if self.has_password: flags1 |= (1 << 2)
+        if self.current_algo is not None: flags1 |= (1 << 2)
+        if self.srp_B is not None: flags1 |= (1 << 2)
+        if self.srp_id is not None: flags1 |= (1 << 2)
+        if self.hint is not None: flags1 |= (1 << 3)
+        if self.email_unconfirmed_pattern is not None: flags1 |= (1 << 4)
+        if self.pending_reset_date is not None: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        if self.current_algo is not None:
+            self.current_algo.write_to(out, ctx)
+        if self.srp_B is not None:
+            Bytes.write_to(out, self.srp_B)
+        if self.srp_id is not None:
+            out += Long.write(self.srp_id)
+        if self.hint is not None:
+            String.write_to(out, self.hint)
+        if self.email_unconfirmed_pattern is not None:
+            String.write_to(out, self.email_unconfirmed_pattern)
+        self.new_algo.write_to(out, ctx)
+        self.new_secure_algo.write_to(out, ctx)
+        Bytes.write_to(out, self.secure_random)
+        if self.pending_reset_date is not None:
+            out += Int.write(self.pending_reset_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Password_133:
+        flags1 = Int.read(stream)
+        has_recovery = (flags1 & (1 << 0)) == (1 << 0)
+        has_secure_values = (flags1 & (1 << 1)) == (1 << 1)
+        has_password = (flags1 & (1 << 2)) == (1 << 2)
+        current_algo = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        srp_B = Bytes.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        srp_id = Long.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        hint = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        email_unconfirmed_pattern = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        new_algo = TLObject.read(stream)
+        new_secure_algo = TLObject.read(stream)
+        secure_random = Bytes.read(stream)
+        pending_reset_date = Int.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        return cls(has_recovery=has_recovery, has_secure_values=has_secure_values, has_password=has_password, current_algo=current_algo, srp_B=srp_B, srp_id=srp_id, hint=hint, email_unconfirmed_pattern=email_unconfirmed_pattern, new_algo=new_algo, new_secure_algo=new_secure_algo, secure_random=secure_random, pending_reset_date=pending_reset_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Password_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        has_recovery = (flags1 & (1 << 0)) == (1 << 0)
+        has_secure_values = (flags1 & (1 << 1)) == (1 << 1)
+        has_password = (flags1 & (1 << 2)) == (1 << 2)
+        current_algo, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        srp_B, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        srp_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        hint, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        email_unconfirmed_pattern, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        new_algo, cursor = TLObject.read_from(view, cursor)
+        new_secure_algo, cursor = TLObject.read_from(view, cursor)
+        secure_random, cursor = Bytes.read_from(view, cursor)
+        pending_reset_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        return cls(has_recovery=has_recovery, has_secure_values=has_secure_values, has_password=has_password, current_algo=current_algo, srp_B=srp_B, srp_id=srp_id, hint=hint, email_unconfirmed_pattern=email_unconfirmed_pattern, new_algo=new_algo, new_secure_algo=new_secure_algo, secure_random=secure_random, pending_reset_date=pending_reset_date), cursor
+
+
+class ChatThemesNotModified_133(TLObject):
+    __tl_id__ = 0xe011e1c4
+    __tl_name__ = "types.account.ChatThemesNotModified_133"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatThemesNotModified_133:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatThemesNotModified_133, int]:
+        return cls(), cursor
+
+
+class ChatThemes_133(TLObject):
+    __tl_id__ = 0xfe4cbebd
+    __tl_name__ = "types.account.ChatThemes_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "themes", )
+
+    def __init__(self, *, hash: int, themes: list[tl.base.ChatTheme]):
+        self.hash = hash
+        self.themes = themes
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+        TLObjectVector.write_to(out, self.themes, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatThemes_133:
+        hash = Int.read(stream)
+        themes = TLObjectVector.read(stream)
+        return cls(hash=hash, themes=themes)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatThemes_133, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        themes, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, themes=themes), cursor
+
+
+class Authorizations(AuthorizationsBase):
+    __tl_ids__ = (
+        (Authorizations_133.__tl_layer__, Authorizations_133.__tl_id__),
+        (AuthorizationsBase.__tl_layer__, AuthorizationsBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        if ctx.layer >= 135:
+            out += Int.write(self.authorization_ttl_days)
+        TLObjectVector.write_to(out, self.authorizations, ctx)
+
+
+class Password(PasswordBase):
+    __tl_ids__ = (
+        (Password_133.__tl_layer__, Password_133.__tl_id__),
+        (PasswordBase.__tl_layer__, PasswordBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.has_recovery: flags1 |= (1 << 0)
+        if self.has_secure_values: flags1 |= (1 << 1)
+        if self.has_password: flags1 |= (1 << 2)
+        if self.current_algo is not None: flags1 |= (1 << 2)
+        if self.srp_B is not None: flags1 |= (1 << 2)
+        if self.srp_id is not None: flags1 |= (1 << 2)
+        if self.hint is not None: flags1 |= (1 << 3)
+        if self.email_unconfirmed_pattern is not None: flags1 |= (1 << 4)
+        if self.pending_reset_date is not None: flags1 |= (1 << 5)
+        if ctx.layer >= 145:
+            if self.login_email_pattern is not None: flags1 |= (1 << 6)
+        out += Int.write(flags1)
+        if self.current_algo is not None:
+            self.current_algo.write_to(out, ctx)
+        if self.srp_B is not None:
+            Bytes.write_to(out, self.srp_B)
+        if self.srp_id is not None:
+            out += Long.write(self.srp_id)
+        if self.hint is not None:
+            String.write_to(out, self.hint)
+        if self.email_unconfirmed_pattern is not None:
+            String.write_to(out, self.email_unconfirmed_pattern)
+        self.new_algo.write_to(out, ctx)
+        self.new_secure_algo.write_to(out, ctx)
+        Bytes.write_to(out, self.secure_random)
+        if self.pending_reset_date is not None:
+            out += Int.write(self.pending_reset_date)
+        if ctx.layer >= 145:
+            if self.login_email_pattern is not None:
+                String.write_to(out, self.login_email_pattern)
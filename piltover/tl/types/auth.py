@@ -0,0 +1,1203 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class SentCode(TLObject):
+    __tl_id__ = 0x5e002502
+    __tl_name__ = "types.auth.SentCode"
+    __tl_layer__ = 133
+
+    __slots__ = ("type_", "phone_code_hash", "next_type", "timeout", )
+
+    def __init__(self, *, type_: tl.base.auth.SentCodeType, phone_code_hash: str, next_type: tl.base.auth.CodeType | None = None, timeout: int | None = None):
+        self.type_ = type_
+        self.phone_code_hash = phone_code_hash
+        self.next_type = next_type
+        self.timeout = timeout
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_type is not None: flags1 |= (1 << 1)
+        if self.timeout is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.type_.write_to(out, ctx)
+        String.write_to(out, self.phone_code_hash)
+        if self.next_type is not None:
+            self.next_type.write_to(out, ctx)
+        if self.timeout is not None:
+            out += Int.write(self.timeout)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCode:
+        flags1 = Int.read(stream)
+        type_ = TLObject.read(stream)
+        phone_code_hash = String.read(stream)
+        next_type = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        timeout = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(type_=type_, phone_code_hash=phone_code_hash, next_type=next_type, timeout=timeout)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCode, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        type_, cursor = TLObject.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        next_type, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        timeout, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(type_=type_, phone_code_hash=phone_code_hash, next_type=next_type, timeout=timeout), cursor
+
+
+class SentCodeSuccess(TLObject):
+    __tl_id__ = 0x2390fe44
+    __tl_name__ = "types.auth.SentCodeSuccess"
+    __tl_layer__ = 152
+
+    __slots__ = ("authorization", )
+
+    def __init__(self, *, authorization: tl.base.auth.Authorization):
+        self.authorization = authorization
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.authorization.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeSuccess:
+        authorization = TLObject.read(stream)
+        return cls(authorization=authorization)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeSuccess, int]:
+        authorization, cursor = TLObject.read_from(view, cursor)
+        return cls(authorization=authorization), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.authorization.check_for_ctx_values(values)
+
+
+class SentCodePaymentRequired(TLObject):
+    __tl_id__ = 0xd7cef980
+    __tl_name__ = "types.auth.SentCodePaymentRequired"
+    __tl_layer__ = 201
+
+    __slots__ = ("store_product", "phone_code_hash", )
+
+    def __init__(self, *, store_product: str, phone_code_hash: str):
+        self.store_product = store_product
+        self.phone_code_hash = phone_code_hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.store_product)
+        String.write_to(out, self.phone_code_hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodePaymentRequired:
+        store_product = String.read(stream)
+        phone_code_hash = String.read(stream)
+        return cls(store_product=store_product, phone_code_hash=phone_code_hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodePaymentRequired, int]:
+        store_product, cursor = String.read_from(view, cursor)
+        phone_code_hash, cursor = String.read_from(view, cursor)
+        return cls(store_product=store_product, phone_code_hash=phone_code_hash), cursor
+
+
+class AuthorizationBase(TLObject):
+    __tl_id__ = 0x2ea2c0d4
+    __tl_name__ = "types.auth.Authorization"
+    __tl_layer__ = 152
+
+    __slots__ = ("setup_password_required", "otherwise_relogin_days", "tmp_sessions", "future_auth_token", "user", )
+
+    def __init__(self, *, user: tl.base.User, setup_password_required: bool = False, otherwise_relogin_days: int | None = None, tmp_sessions: int | None = None, future_auth_token: bytes | None = None):
+        self.setup_password_required = setup_password_required
+        self.otherwise_relogin_days = otherwise_relogin_days
+        self.tmp_sessions = tmp_sessions
+        self.future_auth_token = future_auth_token
+        self.user = user
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.setup_password_required is False, self.otherwise_relogin_days is None)
+        _flags_fields_not_empty = (self.setup_password_required is True, self.otherwise_relogin_days is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: setup_password_required, otherwise_relogin_days")
+        flags1 = 0
+        if self.setup_password_required: flags1 |= (1 << 1)
+        if self.otherwise_relogin_days is not None: flags1 |= (1 << 1)
+        if self.tmp_sessions is not None: flags1 |= (1 << 0)
+        if self.future_auth_token is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.otherwise_relogin_days is not None:
+            out += Int.write(self.otherwise_relogin_days)
+        if self.tmp_sessions is not None:
+            out += Int.write(self.tmp_sessions)
+        if self.future_auth_token is not None:
+            Bytes.write_to(out, self.future_auth_token)
+        self.user.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Authorization:
+        flags1 = Int.read(stream)
+        setup_password_required = (flags1 & (1 << 1)) == (1 << 1)
+        otherwise_relogin_days = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        tmp_sessions = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        future_auth_token = Bytes.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        user = TLObject.read(stream)
+        return cls(setup_password_required=setup_password_required, otherwise_relogin_days=otherwise_relogin_days, tmp_sessions=tmp_sessions, future_auth_token=future_auth_token, user=user)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Authorization, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        setup_password_required = (flags1 & (1 << 1)) == (1 << 1)
+        otherwise_relogin_days, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        tmp_sessions, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        future_auth_token, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        user, cursor = TLObject.read_from(view, cursor)
+        return cls(setup_password_required=setup_password_required, otherwise_relogin_days=otherwise_relogin_days, tmp_sessions=tmp_sessions, future_auth_token=future_auth_token, user=user), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.user.check_for_ctx_values(values)
+
+
+class AuthorizationSignUpRequired(TLObject):
+    __tl_id__ = 0x44747e9a
+    __tl_name__ = "types.auth.AuthorizationSignUpRequired"
+    __tl_layer__ = 133
+
+    __slots__ = ("terms_of_service", )
+
+    def __init__(self, *, terms_of_service: tl.types.help.TermsOfService | None = None):
+        self.terms_of_service = terms_of_service
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.terms_of_service is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.terms_of_service is not None:
+            self.terms_of_service.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AuthorizationSignUpRequired:
+        flags1 = Int.read(stream)
+        terms_of_service = tl.types.help.TermsOfService.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(terms_of_service=terms_of_service)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AuthorizationSignUpRequired, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        terms_of_service, cursor = tl.types.help.TermsOfService.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(terms_of_service=terms_of_service), cursor
+
+
+class ExportedAuthorization(TLObject):
+    __tl_id__ = 0xb434e2b8
+    __tl_name__ = "types.auth.ExportedAuthorization"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", "bytes_", )
+
+    def __init__(self, *, id: int, bytes_: bytes):
+        self.id = id
+        self.bytes_ = bytes_
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.id)
+        Bytes.write_to(out, self.bytes_)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportedAuthorization:
+        id = Long.read(stream)
+        bytes_ = Bytes.read(stream)
+        return cls(id=id, bytes_=bytes_)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportedAuthorization, int]:
+        id, cursor = Long.read_from(view, cursor)
+        bytes_, cursor = Bytes.read_from(view, cursor)
+        return cls(id=id, bytes_=bytes_), cursor
+
+
+class PasswordRecovery(TLObject):
+    __tl_id__ = 0x137948a5
+    __tl_name__ = "types.auth.PasswordRecovery"
+    __tl_layer__ = 133
+
+    __slots__ = ("email_pattern", )
+
+    def __init__(self, *, email_pattern: str):
+        self.email_pattern = email_pattern
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.email_pattern)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PasswordRecovery:
+        email_pattern = String.read(stream)
+        return cls(email_pattern=email_pattern)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PasswordRecovery, int]:
+        email_pattern, cursor = String.read_from(view, cursor)
+        return cls(email_pattern=email_pattern), cursor
+
+
+class CodeTypeSms(TLObject):
+    __tl_id__ = 0x72a3158c
+    __tl_name__ = "types.auth.CodeTypeSms"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CodeTypeSms:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CodeTypeSms, int]:
+        return cls(), cursor
+
+
+class CodeTypeCall(TLObject):
+    __tl_id__ = 0x741cd3e3
+    __tl_name__ = "types.auth.CodeTypeCall"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CodeTypeCall:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CodeTypeCall, int]:
+        return cls(), cursor
+
+
+class CodeTypeFlashCall(TLObject):
+    __tl_id__ = 0x226ccefb
+    __tl_name__ = "types.auth.CodeTypeFlashCall"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CodeTypeFlashCall:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CodeTypeFlashCall, int]:
+        return cls(), cursor
+
+
+class CodeTypeMissedCall(TLObject):
+    __tl_id__ = 0xd61ad6ee
+    __tl_name__ = "types.auth.CodeTypeMissedCall"
+    __tl_layer__ = 135
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CodeTypeMissedCall:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CodeTypeMissedCall, int]:
+        return cls(), cursor
+
+
+class CodeTypeFragmentSms(TLObject):
+    __tl_id__ = 0x6ed998c
+    __tl_name__ = "types.auth.CodeTypeFragmentSms"
+    __tl_layer__ = 150
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CodeTypeFragmentSms:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CodeTypeFragmentSms, int]:
+        return cls(), cursor
+
+
+class SentCodeTypeApp(TLObject):
+    __tl_id__ = 0x3dbb5986
+    __tl_name__ = "types.auth.SentCodeTypeApp"
+    __tl_layer__ = 133
+
+    __slots__ = ("length", )
+
+    def __init__(self, *, length: int):
+        self.length = length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeApp:
+        length = Int.read(stream)
+        return cls(length=length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeApp, int]:
+        length, cursor = Int.read_from(view, cursor)
+        return cls(length=length), cursor
+
+
+class SentCodeTypeSms(TLObject):
+    __tl_id__ = 0xc000bba2
+    __tl_name__ = "types.auth.SentCodeTypeSms"
+    __tl_layer__ = 133
+
+    __slots__ = ("length", )
+
+    def __init__(self, *, length: int):
+        self.length = length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeSms:
+        length = Int.read(stream)
+        return cls(length=length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeSms, int]:
+        length, cursor = Int.read_from(view, cursor)
+        return cls(length=length), cursor
+
+
+class SentCodeTypeCall(TLObject):
+    __tl_id__ = 0x5353e5a7
+    __tl_name__ = "types.auth.SentCodeTypeCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("length", )
+
+    def __init__(self, *, length: int):
+        self.length = length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeCall:
+        length = Int.read(stream)
+        return cls(length=length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeCall, int]:
+        length, cursor = Int.read_from(view, cursor)
+        return cls(length=length), cursor
+
+
+class SentCodeTypeFlashCall(TLObject):
+    __tl_id__ = 0xab03c6d9
+    __tl_name__ = "types.auth.SentCodeTypeFlashCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("pattern", )
+
+    def __init__(self, *, pattern: str):
+        self.pattern = pattern
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.pattern)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeFlashCall:
+        pattern = String.read(stream)
+        return cls(pattern=pattern)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeFlashCall, int]:
+        pattern, cursor = String.read_from(view, cursor)
+        return cls(pattern=pattern), cursor
+
+
+class SentCodeTypeMissedCall(TLObject):
+    __tl_id__ = 0x82006484
+    __tl_name__ = "types.auth.SentCodeTypeMissedCall"
+    __tl_layer__ = 135
+
+    __slots__ = ("prefix", "length", )
+
+    def __init__(self, *, prefix: str, length: int):
+        self.prefix = prefix
+        self.length = length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.prefix)
+        out += Int.write(self.length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeMissedCall:
+        prefix = String.read(stream)
+        length = Int.read(stream)
+        return cls(prefix=prefix, length=length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeMissedCall, int]:
+        prefix, cursor = String.read_from(view, cursor)
+        length, cursor = Int.read_from(view, cursor)
+        return cls(prefix=prefix, length=length), cursor
+
+
+class SentCodeTypeEmailCodeBase(TLObject):
+    __tl_id__ = 0xf450f59b
+    __tl_name__ = "types.auth.SentCodeTypeEmailCode"
+    __tl_layer__ = 158
+
+    __slots__ = ("apple_signin_allowed", "google_signin_allowed", "email_pattern", "length", "reset_available_period", "reset_pending_date", )
+
+    def __init__(self, *, email_pattern: str, length: int, apple_signin_allowed: bool = False, google_signin_allowed: bool = False, reset_available_period: int | None = None, reset_pending_date: int | None = None):
+        self.apple_signin_allowed = apple_signin_allowed
+        self.google_signin_allowed = google_signin_allowed
+        self.email_pattern = email_pattern
+        self.length = length
+        self.reset_available_period = reset_available_period
+        self.reset_pending_date = reset_pending_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.apple_signin_allowed: flags1 |= (1 << 0)
+        if self.google_signin_allowed: flags1 |= (1 << 1)
+        if self.reset_available_period is not None: flags1 |= (1 << 3)
+        if self.reset_pending_date is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        String.write_to(out, self.email_pattern)
+        out += Int.write(self.length)
+        if self.reset_available_period is not None:
+            out += Int.write(self.reset_available_period)
+        if self.reset_pending_date is not None:
+            out += Int.write(self.reset_pending_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeEmailCode:
+        flags1 = Int.read(stream)
+        apple_signin_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        google_signin_allowed = (flags1 & (1 << 1)) == (1 << 1)
+        email_pattern = String.read(stream)
+        length = Int.read(stream)
+        reset_available_period = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        reset_pending_date = Int.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(apple_signin_allowed=apple_signin_allowed, google_signin_allowed=google_signin_allowed, email_pattern=email_pattern, length=length, reset_available_period=reset_available_period, reset_pending_date=reset_pending_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeEmailCode, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        apple_signin_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        google_signin_allowed = (flags1 & (1 << 1)) == (1 << 1)
+        email_pattern, cursor = String.read_from(view, cursor)
+        length, cursor = Int.read_from(view, cursor)
+        reset_available_period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        reset_pending_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(apple_signin_allowed=apple_signin_allowed, google_signin_allowed=google_signin_allowed, email_pattern=email_pattern, length=length, reset_available_period=reset_available_period, reset_pending_date=reset_pending_date), cursor
+
+
+class SentCodeTypeSetUpEmailRequired(TLObject):
+    __tl_id__ = 0xa5491dea
+    __tl_name__ = "types.auth.SentCodeTypeSetUpEmailRequired"
+    __tl_layer__ = 145
+
+    __slots__ = ("apple_signin_allowed", "google_signin_allowed", )
+
+    def __init__(self, *, apple_signin_allowed: bool = False, google_signin_allowed: bool = False):
+        self.apple_signin_allowed = apple_signin_allowed
+        self.google_signin_allowed = google_signin_allowed
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.apple_signin_allowed: flags1 |= (1 << 0)
+        if self.google_signin_allowed: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeSetUpEmailRequired:
+        flags1 = Int.read(stream)
+        apple_signin_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        google_signin_allowed = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(apple_signin_allowed=apple_signin_allowed, google_signin_allowed=google_signin_allowed)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeSetUpEmailRequired, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        apple_signin_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        google_signin_allowed = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(apple_signin_allowed=apple_signin_allowed, google_signin_allowed=google_signin_allowed), cursor
+
+
+class SentCodeTypeFragmentSms(TLObject):
+    __tl_id__ = 0xd9565c39
+    __tl_name__ = "types.auth.SentCodeTypeFragmentSms"
+    __tl_layer__ = 150
+
+    __slots__ = ("url", "length", )
+
+    def __init__(self, *, url: str, length: int):
+        self.url = url
+        self.length = length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+        out += Int.write(self.length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeFragmentSms:
+        url = String.read(stream)
+        length = Int.read(stream)
+        return cls(url=url, length=length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeFragmentSms, int]:
+        url, cursor = String.read_from(view, cursor)
+        length, cursor = Int.read_from(view, cursor)
+        return cls(url=url, length=length), cursor
+
+
+class SentCodeTypeFirebaseSmsBase(TLObject):
+    __tl_id__ = 0x9fd736
+    __tl_name__ = "types.auth.SentCodeTypeFirebaseSms"
+    __tl_layer__ = 183
+
+    __slots__ = ("nonce", "play_integrity_project_id", "play_integrity_nonce", "receipt", "push_timeout", "length", )
+
+    def __init__(self, *, length: int, nonce: bytes | None = None, play_integrity_project_id: int | None = None, play_integrity_nonce: bytes | None = None, receipt: str | None = None, push_timeout: int | None = None):
+        self.nonce = nonce
+        self.play_integrity_project_id = play_integrity_project_id
+        self.play_integrity_nonce = play_integrity_nonce
+        self.receipt = receipt
+        self.push_timeout = push_timeout
+        self.length = length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.play_integrity_project_id is None, self.play_integrity_nonce is None)
+        _flags_fields_not_empty = (self.play_integrity_project_id is not None, self.play_integrity_nonce is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: play_integrity_project_id, play_integrity_nonce")
+        _flags_fields_empty = (self.receipt is None, self.push_timeout is None)
+        _flags_fields_not_empty = (self.receipt is not None, self.push_timeout is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: receipt, push_timeout")
+        flags1 = 0
+        if self.nonce is not None: flags1 |= (1 << 0)
+        if self.play_integrity_project_id is not None: flags1 |= (1 << 2)
+        if self.play_integrity_nonce is not None: flags1 |= (1 << 2)
+        if self.receipt is not None: flags1 |= (1 << 1)
+        if self.push_timeout is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.nonce is not None:
+            Bytes.write_to(out, self.nonce)
+        if self.play_integrity_project_id is not None:
+            out += Long.write(self.play_integrity_project_id)
+        if self.play_integrity_nonce is not None:
+            Bytes.write_to(out, self.play_integrity_nonce)
+        if self.receipt is not None:
+            String.write_to(out, self.receipt)
+        if self.push_timeout is not None:
+            out += Int.write(self.push_timeout)
+        out += Int.write(self.length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeFirebaseSms:
+        flags1 = Int.read(stream)
+        nonce = Bytes.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        play_integrity_project_id = Long.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        play_integrity_nonce = Bytes.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        receipt = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        push_timeout = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        length = Int.read(stream)
+        return cls(nonce=nonce, play_integrity_project_id=play_integrity_project_id, play_integrity_nonce=play_integrity_nonce, receipt=receipt, push_timeout=push_timeout, length=length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeFirebaseSms, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        nonce, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        play_integrity_project_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        play_integrity_nonce, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        receipt, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        push_timeout, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        length, cursor = Int.read_from(view, cursor)
+        return cls(nonce=nonce, play_integrity_project_id=play_integrity_project_id, play_integrity_nonce=play_integrity_nonce, receipt=receipt, push_timeout=push_timeout, length=length), cursor
+
+
+class SentCodeTypeSmsWord(TLObject):
+    __tl_id__ = 0xa416ac81
+    __tl_name__ = "types.auth.SentCodeTypeSmsWord"
+    __tl_layer__ = 179
+
+    __slots__ = ("beginning", )
+
+    def __init__(self, *, beginning: str | None = None):
+        self.beginning = beginning
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.beginning is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.beginning is not None:
+            String.write_to(out, self.beginning)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeSmsWord:
+        flags1 = Int.read(stream)
+        beginning = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(beginning=beginning)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeSmsWord, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        beginning, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(beginning=beginning), cursor
+
+
+class SentCodeTypeSmsPhrase(TLObject):
+    __tl_id__ = 0xb37794af
+    __tl_name__ = "types.auth.SentCodeTypeSmsPhrase"
+    __tl_layer__ = 179
+
+    __slots__ = ("beginning", )
+
+    def __init__(self, *, beginning: str | None = None):
+        self.beginning = beginning
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.beginning is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.beginning is not None:
+            String.write_to(out, self.beginning)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeSmsPhrase:
+        flags1 = Int.read(stream)
+        beginning = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(beginning=beginning)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeSmsPhrase, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        beginning, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(beginning=beginning), cursor
+
+
+class LoginToken(TLObject):
+    __tl_id__ = 0x629f1980
+    __tl_name__ = "types.auth.LoginToken"
+    __tl_layer__ = 133
+
+    __slots__ = ("expires", "token", )
+
+    def __init__(self, *, expires: int, token: bytes):
+        self.expires = expires
+        self.token = token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.expires)
+        Bytes.write_to(out, self.token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LoginToken:
+        expires = Int.read(stream)
+        token = Bytes.read(stream)
+        return cls(expires=expires, token=token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LoginToken, int]:
+        expires, cursor = Int.read_from(view, cursor)
+        token, cursor = Bytes.read_from(view, cursor)
+        return cls(expires=expires, token=token), cursor
+
+
+class LoginTokenMigrateTo(TLObject):
+    __tl_id__ = 0x68e9916
+    __tl_name__ = "types.auth.LoginTokenMigrateTo"
+    __tl_layer__ = 133
+
+    __slots__ = ("dc_id", "token", )
+
+    def __init__(self, *, dc_id: int, token: bytes):
+        self.dc_id = dc_id
+        self.token = token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.dc_id)
+        Bytes.write_to(out, self.token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LoginTokenMigrateTo:
+        dc_id = Int.read(stream)
+        token = Bytes.read(stream)
+        return cls(dc_id=dc_id, token=token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LoginTokenMigrateTo, int]:
+        dc_id, cursor = Int.read_from(view, cursor)
+        token, cursor = Bytes.read_from(view, cursor)
+        return cls(dc_id=dc_id, token=token), cursor
+
+
+class LoginTokenSuccess(TLObject):
+    __tl_id__ = 0x390d5c5e
+    __tl_name__ = "types.auth.LoginTokenSuccess"
+    __tl_layer__ = 133
+
+    __slots__ = ("authorization", )
+
+    def __init__(self, *, authorization: tl.base.auth.Authorization):
+        self.authorization = authorization
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.authorization.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LoginTokenSuccess:
+        authorization = TLObject.read(stream)
+        return cls(authorization=authorization)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LoginTokenSuccess, int]:
+        authorization, cursor = TLObject.read_from(view, cursor)
+        return cls(authorization=authorization), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.authorization.check_for_ctx_values(values)
+
+
+class LoggedOut(TLObject):
+    __tl_id__ = 0xc3a2835f
+    __tl_name__ = "types.auth.LoggedOut"
+    __tl_layer__ = 135
+
+    __slots__ = ("future_auth_token", )
+
+    def __init__(self, *, future_auth_token: bytes | None = None):
+        self.future_auth_token = future_auth_token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.future_auth_token is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.future_auth_token is not None:
+            Bytes.write_to(out, self.future_auth_token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> LoggedOut:
+        flags1 = Int.read(stream)
+        future_auth_token = Bytes.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(future_auth_token=future_auth_token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[LoggedOut, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        future_auth_token, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(future_auth_token=future_auth_token), cursor
+
+
+class Authorization_133(TLObject):
+    __tl_id__ = 0xcd050916
+    __tl_name__ = "types.auth.Authorization_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("tmp_sessions", "user", )
+
+    def __init__(self, *, user: tl.base.User, tmp_sessions: int | None = None):
+        self.tmp_sessions = tmp_sessions
+        self.user = user
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.tmp_sessions is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.tmp_sessions is not None:
+            out += Int.write(self.tmp_sessions)
+        self.user.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Authorization_133:
+        flags1 = Int.read(stream)
+        tmp_sessions = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        user = TLObject.read(stream)
+        return cls(tmp_sessions=tmp_sessions, user=user)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Authorization_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        tmp_sessions, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        user, cursor = TLObject.read_from(view, cursor)
+        return cls(tmp_sessions=tmp_sessions, user=user), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.user.check_for_ctx_values(values)
+
+
+class Authorization_135(TLObject):
+    __tl_id__ = 0x33fb7bb8
+    __tl_name__ = "types.auth.Authorization_135"
+    __tl_layer__ = 135
+
+    __slots__ = ("setup_password_required", "otherwise_relogin_days", "tmp_sessions", "user", )
+
+    def __init__(self, *, user: tl.base.User, setup_password_required: bool = False, otherwise_relogin_days: int | None = None, tmp_sessions: int | None = None):
+        self.setup_password_required = setup_password_required
+        self.otherwise_relogin_days = otherwise_relogin_days
+        self.tmp_sessions = tmp_sessions
+        self.user = user
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.setup_password_required is False, self.otherwise_relogin_days is None)
+        _flags_fields_not_empty = (self.setup_password_required is True, self.otherwise_relogin_days is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: setup_password_required, otherwise_relogin_days")
+        flags1 = 0
+        if self.setup_password_required: flags1 |= (1 << 1)
+        if self.otherwise_relogin_days is not None: flags1 |= (1 << 1)
+        if self.tmp_sessions is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.otherwise_relogin_days is not None:
+            out += Int.write(self.otherwise_relogin_days)
+        if self.tmp_sessions is not None:
+            out += Int.write(self.tmp_sessions)
+        self.user.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Authorization_135:
+        flags1 = Int.read(stream)
+        setup_password_required = (flags1 & (1 << 1)) == (1 << 1)
+        otherwise_relogin_days = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        tmp_sessions = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        user = TLObject.read(stream)
+        return cls(setup_password_required=setup_password_required, otherwise_relogin_days=otherwise_relogin_days, tmp_sessions=tmp_sessions, user=user)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Authorization_135, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        setup_password_required = (flags1 & (1 << 1)) == (1 << 1)
+        otherwise_relogin_days, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        tmp_sessions, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        user, cursor = TLObject.read_from(view, cursor)
+        return cls(setup_password_required=setup_password_required, otherwise_relogin_days=otherwise_relogin_days, tmp_sessions=tmp_sessions, user=user), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.user.check_for_ctx_values(values)
+
+
+class SentCodeTypeEmailCode_145(TLObject):
+    __tl_id__ = 0x5a159841
+    __tl_name__ = "types.auth.SentCodeTypeEmailCode_145"
+    __tl_layer__ = 145
+
+    __slots__ = ("apple_signin_allowed", "google_signin_allowed", "email_pattern", "length", "next_phone_login_date", )
+
+    def __init__(self, *, email_pattern: str, length: int, apple_signin_allowed: bool = False, google_signin_allowed: bool = False, next_phone_login_date: int | None = None):
+        self.apple_signin_allowed = apple_signin_allowed
+        self.google_signin_allowed = google_signin_allowed
+        self.email_pattern = email_pattern
+        self.length = length
+        self.next_phone_login_date = next_phone_login_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.apple_signin_allowed: flags1 |= (1 << 0)
+        if self.google_signin_allowed: flags1 |= (1 << 1)
+        if self.next_phone_login_date is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        String.write_to(out, self.email_pattern)
+        out += Int.write(self.length)
+        if self.next_phone_login_date is not None:
+            out += Int.write(self.next_phone_login_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeEmailCode_145:
+        flags1 = Int.read(stream)
+        apple_signin_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        google_signin_allowed = (flags1 & (1 << 1)) == (1 << 1)
+        email_pattern = String.read(stream)
+        length = Int.read(stream)
+        next_phone_login_date = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(apple_signin_allowed=apple_signin_allowed, google_signin_allowed=google_signin_allowed, email_pattern=email_pattern, length=length, next_phone_login_date=next_phone_login_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeEmailCode_145, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        apple_signin_allowed = (flags1 & (1 << 0)) == (1 << 0)
+        google_signin_allowed = (flags1 & (1 << 1)) == (1 << 1)
+        email_pattern, cursor = String.read_from(view, cursor)
+        length, cursor = Int.read_from(view, cursor)
+        next_phone_login_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(apple_signin_allowed=apple_signin_allowed, google_signin_allowed=google_signin_allowed, email_pattern=email_pattern, length=length, next_phone_login_date=next_phone_login_date), cursor
+
+
+class SentCodeTypeFirebaseSms_152(TLObject):
+    __tl_id__ = 0xe57b1432
+    __tl_name__ = "types.auth.SentCodeTypeFirebaseSms_152"
+    __tl_layer__ = 152
+
+    __slots__ = ("nonce", "receipt", "push_timeout", "length", )
+
+    def __init__(self, *, length: int, nonce: bytes | None = None, receipt: str | None = None, push_timeout: int | None = None):
+        self.nonce = nonce
+        self.receipt = receipt
+        self.push_timeout = push_timeout
+        self.length = length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.receipt is None, self.push_timeout is None)
+        _flags_fields_not_empty = (self.receipt is not None, self.push_timeout is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: receipt, push_timeout")
+        flags1 = 0
+        if self.nonce is not None: flags1 |= (1 << 0)
+        if self.receipt is not None: flags1 |= (1 << 1)
+        if self.push_timeout is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.nonce is not None:
+            Bytes.write_to(out, self.nonce)
+        if self.receipt is not None:
+            String.write_to(out, self.receipt)
+        if self.push_timeout is not None:
+            out += Int.write(self.push_timeout)
+        out += Int.write(self.length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeFirebaseSms_152:
+        flags1 = Int.read(stream)
+        nonce = Bytes.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        receipt = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        push_timeout = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        length = Int.read(stream)
+        return cls(nonce=nonce, receipt=receipt, push_timeout=push_timeout, length=length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeFirebaseSms_152, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        nonce, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        receipt, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        push_timeout, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        length, cursor = Int.read_from(view, cursor)
+        return cls(nonce=nonce, receipt=receipt, push_timeout=push_timeout, length=length), cursor
+
+
+class SentCodeTypeFirebaseSms_181(TLObject):
+    __tl_id__ = 0x13c90f17
+    __tl_name__ = "types.auth.SentCodeTypeFirebaseSms_181"
+    __tl_layer__ = 181
+
+    __slots__ = ("nonce", "play_integrity_nonce", "receipt", "push_timeout", "length", )
+
+    def __init__(self, *, length: int, nonce: bytes | None = None, play_integrity_nonce: bytes | None = None, receipt: str | None = None, push_timeout: int | None = None):
+        self.nonce = nonce
+        self.play_integrity_nonce = play_integrity_nonce
+        self.receipt = receipt
+        self.push_timeout = push_timeout
+        self.length = length
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.receipt is None, self.push_timeout is None)
+        _flags_fields_not_empty = (self.receipt is not None, self.push_timeout is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: receipt, push_timeout")
+        flags1 = 0
+        if self.nonce is not None: flags1 |= (1 << 0)
+        if self.play_integrity_nonce is not None: flags1 |= (1 << 2)
+        if self.receipt is not None: flags1 |= (1 << 1)
+        if self.push_timeout is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.nonce is not None:
+            Bytes.write_to(out, self.nonce)
+        if self.play_integrity_nonce is not None:
+            Bytes.write_to(out, self.play_integrity_nonce)
+        if self.receipt is not None:
+            String.write_to(out, self.receipt)
+        if self.push_timeout is not None:
+            out += Int.write(self.push_timeout)
+        out += Int.write(self.length)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCodeTypeFirebaseSms_181:
+        flags1 = Int.read(stream)
+        nonce = Bytes.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        play_integrity_nonce = Bytes.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        receipt = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        push_timeout = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        length = Int.read(stream)
+        return cls(nonce=nonce, play_integrity_nonce=play_integrity_nonce, receipt=receipt, push_timeout=push_timeout, length=length)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCodeTypeFirebaseSms_181, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        nonce, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        play_integrity_nonce, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        receipt, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        push_timeout, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        length, cursor = Int.read_from(view, cursor)
+        return cls(nonce=nonce, play_integrity_nonce=play_integrity_nonce, receipt=receipt, push_timeout=push_timeout, length=length), cursor
+
+
+class Authorization(AuthorizationBase):
+    __tl_ids__ = (
+        (Authorization_133.__tl_layer__, Authorization_133.__tl_id__),
+        (Authorization_135.__tl_layer__, Authorization_135.__tl_id__),
+        (AuthorizationBase.__tl_layer__, AuthorizationBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if ctx.layer >= 135:
+            if self.setup_password_required: flags1 |= (1 << 1)
+        if ctx.layer >= 135:
+            if self.otherwise_relogin_days is not None: flags1 |= (1 << 1)
+        if self.tmp_sessions is not None: flags1 |= (1 << 0)
+        if ctx.layer >= 152:
+            if self.future_auth_token is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if ctx.layer >= 135:
+            if self.otherwise_relogin_days is not None:
+                out += Int.write(self.otherwise_relogin_days)
+        if self.tmp_sessions is not None:
+            out += Int.write(self.tmp_sessions)
+        if ctx.layer >= 152:
+            if self.future_auth_token is not None:
+                Bytes.write_to(out, self.future_auth_token)
+        self.user.write_to(out, ctx)
+
+
+class SentCodeTypeEmailCode(SentCodeTypeEmailCodeBase):
+    __tl_ids__ = (
+        (SentCodeTypeEmailCode_145.__tl_layer__, SentCodeTypeEmailCode_145.__tl_id__),
+        (SentCodeTypeEmailCodeBase.__tl_layer__, SentCodeTypeEmailCodeBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _next_phone_login_date_fallback_145 = tl.layer_converters.auth__sent_code_type_email_code.get_next_phone_login_date_fallback_for_145(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.apple_signin_allowed: flags1 |= (1 << 0)
+        if self.google_signin_allowed: flags1 |= (1 << 1)
+        if ctx.layer >= 158:
+            if self.reset_available_period is not None: flags1 |= (1 << 3)
+        if ctx.layer >= 158:
+            if self.reset_pending_date is not None: flags1 |= (1 << 4)
+        if ctx.layer <= 157:
+            if _next_phone_login_date_fallback_145 is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        String.write_to(out, self.email_pattern)
+        out += Int.write(self.length)
+        if ctx.layer >= 158:
+            if self.reset_available_period is not None:
+                out += Int.write(self.reset_available_period)
+        if ctx.layer >= 158:
+            if self.reset_pending_date is not None:
+                out += Int.write(self.reset_pending_date)
+        if ctx.layer <= 157:
+            if _next_phone_login_date_fallback_145 is not None:
+                out += Int.write(_next_phone_login_date_fallback_145)
+
+
+class SentCodeTypeFirebaseSms(SentCodeTypeFirebaseSmsBase):
+    __tl_ids__ = (
+        (SentCodeTypeFirebaseSms_152.__tl_layer__, SentCodeTypeFirebaseSms_152.__tl_id__),
+        (SentCodeTypeFirebaseSms_181.__tl_layer__, SentCodeTypeFirebaseSms_181.__tl_id__),
+        (SentCodeTypeFirebaseSmsBase.__tl_layer__, SentCodeTypeFirebaseSmsBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.nonce is not None: flags1 |= (1 << 0)
+        if ctx.layer >= 183:
+            if self.play_integrity_project_id is not None: flags1 |= (1 << 2)
+        if ctx.layer >= 181:
+            if self.play_integrity_nonce is not None: flags1 |= (1 << 2)
+        if self.receipt is not None: flags1 |= (1 << 1)
+        if self.push_timeout is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.nonce is not None:
+            Bytes.write_to(out, self.nonce)
+        if ctx.layer >= 183:
+            if self.play_integrity_project_id is not None:
+                out += Long.write(self.play_integrity_project_id)
+        if ctx.layer >= 181:
+            if self.play_integrity_nonce is not None:
+                Bytes.write_to(out, self.play_integrity_nonce)
+        if self.receipt is not None:
+            String.write_to(out, self.receipt)
+        if self.push_timeout is not None:
+            out += Int.write(self.push_timeout)
+        out += Int.write(self.length)
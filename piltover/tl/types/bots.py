@@ -0,0 +1,117 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class BotInfo(TLObject):
+    __tl_id__ = 0xe8a775b0
+    __tl_name__ = "types.bots.BotInfo"
+    __tl_layer__ = 158
+
+    __slots__ = ("name", "about", "description", )
+
+    def __init__(self, *, name: str, about: str, description: str):
+        self.name = name
+        self.about = about
+        self.description = description
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.name)
+        String.write_to(out, self.about)
+        String.write_to(out, self.description)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BotInfo:
+        name = String.read(stream)
+        about = String.read(stream)
+        description = String.read(stream)
+        return cls(name=name, about=about, description=description)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BotInfo, int]:
+        name, cursor = String.read_from(view, cursor)
+        about, cursor = String.read_from(view, cursor)
+        description, cursor = String.read_from(view, cursor)
+        return cls(name=name, about=about, description=description), cursor
+
+
+class PopularAppBots(TLObject):
+    __tl_id__ = 0x1991b13b
+    __tl_name__ = "types.bots.PopularAppBots"
+    __tl_layer__ = 185
+
+    __slots__ = ("next_offset", "users", )
+
+    def __init__(self, *, users: list[tl.base.User], next_offset: str | None = None):
+        self.next_offset = next_offset
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PopularAppBots:
+        flags1 = Int.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        users = TLObjectVector.read(stream)
+        return cls(next_offset=next_offset, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PopularAppBots, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(next_offset=next_offset, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PreviewInfo(TLObject):
+    __tl_id__ = 0xca71d64
+    __tl_name__ = "types.bots.PreviewInfo"
+    __tl_layer__ = 185
+
+    __slots__ = ("media", "lang_codes", )
+
+    def __init__(self, *, media: list[tl.base.BotPreviewMedia], lang_codes: list[str]):
+        self.media = media
+        self.lang_codes = lang_codes
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.media, ctx)
+        out += StringVector.write(self.lang_codes)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PreviewInfo:
+        media = TLObjectVector.read(stream)
+        lang_codes = StringVector.read(stream)
+        return cls(media=media, lang_codes=lang_codes)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PreviewInfo, int]:
+        media, cursor = TLObjectVector.read_from(view, cursor)
+        lang_codes, cursor = StringVector.read_from(view, cursor)
+        return cls(media=media, lang_codes=lang_codes), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for media_item in self.media:
+            media_item.check_for_ctx_values(values)
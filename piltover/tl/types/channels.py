@@ -0,0 +1,329 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class ChannelParticipants(TLObject):
+    __tl_id__ = 0x9ab0feaf
+    __tl_name__ = "types.channels.ChannelParticipants"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "participants", "chats", "users", )
+
+    def __init__(self, *, count: int, participants: list[tl.base.ChannelParticipant], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.count = count
+        self.participants = participants
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.participants, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelParticipants:
+        count = Int.read(stream)
+        participants = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, participants=participants, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelParticipants, int]:
+        count, cursor = Int.read_from(view, cursor)
+        participants, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, participants=participants, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChannelParticipantsNotModified(TLObject):
+    __tl_id__ = 0xf0173fe9
+    __tl_name__ = "types.channels.ChannelParticipantsNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelParticipantsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelParticipantsNotModified, int]:
+        return cls(), cursor
+
+
+class ChannelParticipant(TLObject):
+    __tl_id__ = 0xdfb80317
+    __tl_name__ = "types.channels.ChannelParticipant"
+    __tl_layer__ = 133
+
+    __slots__ = ("participant", "chats", "users", )
+
+    def __init__(self, *, participant: tl.base.ChannelParticipant, chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.participant = participant
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.participant.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelParticipant:
+        participant = TLObject.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(participant=participant, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelParticipant, int]:
+        participant, cursor = TLObject.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(participant=participant, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class AdminLogResults(TLObject):
+    __tl_id__ = 0xed8af74d
+    __tl_name__ = "types.channels.AdminLogResults"
+    __tl_layer__ = 133
+
+    __slots__ = ("events", "chats", "users", )
+
+    def __init__(self, *, events: list[tl.base.ChannelAdminLogEvent], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.events = events
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.events, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AdminLogResults:
+        events = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(events=events, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AdminLogResults, int]:
+        events, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(events=events, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for events_item in self.events:
+            events_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SendAsPeersBase(TLObject):
+    __tl_id__ = 0xf496b0c6
+    __tl_name__ = "types.channels.SendAsPeers"
+    __tl_layer__ = 145
+
+    __slots__ = ("peers", "chats", "users", )
+
+    def __init__(self, *, peers: list[tl.base.SendAsPeer], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.peers = peers
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendAsPeers:
+        peers = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(peers=peers, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendAsPeers, int]:
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peers=peers, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SponsoredMessageReportResultChooseOption(TLObject):
+    __tl_id__ = 0x846f9e42
+    __tl_name__ = "types.channels.SponsoredMessageReportResultChooseOption"
+    __tl_layer__ = 177
+
+    __slots__ = ("title", "options", )
+
+    def __init__(self, *, title: str, options: list[tl.base.SponsoredMessageReportOption]):
+        self.title = title
+        self.options = options
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.title)
+        TLObjectVector.write_to(out, self.options, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SponsoredMessageReportResultChooseOption:
+        title = String.read(stream)
+        options = TLObjectVector.read(stream)
+        return cls(title=title, options=options)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SponsoredMessageReportResultChooseOption, int]:
+        title, cursor = String.read_from(view, cursor)
+        options, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(title=title, options=options), cursor
+
+
+class SponsoredMessageReportResultAdsHidden(TLObject):
+    __tl_id__ = 0x3e3bcf2f
+    __tl_name__ = "types.channels.SponsoredMessageReportResultAdsHidden"
+    __tl_layer__ = 177
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SponsoredMessageReportResultAdsHidden:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SponsoredMessageReportResultAdsHidden, int]:
+        return cls(), cursor
+
+
+class SponsoredMessageReportResultReported(TLObject):
+    __tl_id__ = 0xad798849
+    __tl_name__ = "types.channels.SponsoredMessageReportResultReported"
+    __tl_layer__ = 177
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SponsoredMessageReportResultReported:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SponsoredMessageReportResultReported, int]:
+        return cls(), cursor
+
+
+class SendAsPeers_135(TLObject):
+    __tl_id__ = 0x8356cda9
+    __tl_name__ = "types.channels.SendAsPeers_135"
+    __tl_layer__ = 135
+
+    __slots__ = ("peers", "chats", "users", )
+
+    def __init__(self, *, peers: list[tl.base.Peer], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.peers = peers
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SendAsPeers_135:
+        peers = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(peers=peers, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SendAsPeers_135, int]:
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peers=peers, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SendAsPeers(SendAsPeersBase):
+    __tl_ids__ = (
+        (SendAsPeers_135.__tl_layer__, SendAsPeers_135.__tl_id__),
+        (SendAsPeersBase.__tl_layer__, SendAsPeersBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _peers_downgrade_135 = tl.layer_converters.channels__send_as_peers.downgrade_peers_for_135(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        if ctx.layer <= 144:
+            TLObjectVector.write_to(out, _peers_downgrade_135, ctx)
+        if ctx.layer >= 145:
+            TLObjectVector.write_to(out, self.peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
@@ -0,0 +1,314 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class ExportedChatlistInvite(TLObject):
+    __tl_id__ = 0x10e6e3a6
+    __tl_name__ = "types.chatlists.ExportedChatlistInvite"
+    __tl_layer__ = 158
+
+    __slots__ = ("filter", "invite", )
+
+    def __init__(self, *, filter: tl.base.DialogFilter, invite: tl.types.ExportedChatlistInvite):
+        self.filter = filter
+        self.invite = invite
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.filter.write_to(out, ctx)
+        self.invite.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportedChatlistInvite:
+        filter = TLObject.read(stream)
+        invite = tl.types.ExportedChatlistInvite.read(stream)
+        return cls(filter=filter, invite=invite)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportedChatlistInvite, int]:
+        filter, cursor = TLObject.read_from(view, cursor)
+        invite, cursor = tl.types.ExportedChatlistInvite.read_from(view, cursor)
+        return cls(filter=filter, invite=invite), cursor
+
+
+class ExportedInvites(TLObject):
+    __tl_id__ = 0x10ab6dc7
+    __tl_name__ = "types.chatlists.ExportedInvites"
+    __tl_layer__ = 158
+
+    __slots__ = ("invites", "chats", "users", )
+
+    def __init__(self, *, invites: list[tl.base.ExportedChatlistInvite], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.invites = invites
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.invites, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportedInvites:
+        invites = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(invites=invites, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportedInvites, int]:
+        invites, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(invites=invites, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChatlistInviteAlready(TLObject):
+    __tl_id__ = 0xfa87f659
+    __tl_name__ = "types.chatlists.ChatlistInviteAlready"
+    __tl_layer__ = 158
+
+    __slots__ = ("filter_id", "missing_peers", "already_peers", "chats", "users", )
+
+    def __init__(self, *, filter_id: int, missing_peers: list[tl.base.Peer], already_peers: list[tl.base.Peer], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.filter_id = filter_id
+        self.missing_peers = missing_peers
+        self.already_peers = already_peers
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.filter_id)
+        TLObjectVector.write_to(out, self.missing_peers, ctx)
+        TLObjectVector.write_to(out, self.already_peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatlistInviteAlready:
+        filter_id = Int.read(stream)
+        missing_peers = TLObjectVector.read(stream)
+        already_peers = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(filter_id=filter_id, missing_peers=missing_peers, already_peers=already_peers, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatlistInviteAlready, int]:
+        filter_id, cursor = Int.read_from(view, cursor)
+        missing_peers, cursor = TLObjectVector.read_from(view, cursor)
+        already_peers, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(filter_id=filter_id, missing_peers=missing_peers, already_peers=already_peers, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChatlistInviteBase(TLObject):
+    __tl_id__ = 0xf10ece2f
+    __tl_name__ = "types.chatlists.ChatlistInvite"
+    __tl_layer__ = 196
+
+    __slots__ = ("title_noanimate", "title", "emoticon", "peers", "chats", "users", )
+
+    def __init__(self, *, title: tl.types.TextWithEntities, peers: list[tl.base.Peer], chats: list[tl.base.Chat], users: list[tl.base.User], title_noanimate: bool = False, emoticon: str | None = None):
+        self.title_noanimate = title_noanimate
+        self.title = title
+        self.emoticon = emoticon
+        self.peers = peers
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.title_noanimate: flags1 |= (1 << 1)
+        if self.emoticon is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.title.write_to(out, ctx)
+        if self.emoticon is not None:
+            String.write_to(out, self.emoticon)
+        TLObjectVector.write_to(out, self.peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatlistInvite:
+        flags1 = Int.read(stream)
+        title_noanimate = (flags1 & (1 << 1)) == (1 << 1)
+        title = tl.types.TextWithEntities.read(stream)
+        emoticon = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        peers = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(title_noanimate=title_noanimate, title=title, emoticon=emoticon, peers=peers, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatlistInvite, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        title_noanimate = (flags1 & (1 << 1)) == (1 << 1)
+        title, cursor = tl.types.TextWithEntities.read_from(view, cursor)
+        emoticon, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(title_noanimate=title_noanimate, title=title, emoticon=emoticon, peers=peers, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChatlistUpdates(TLObject):
+    __tl_id__ = 0x93bd878d
+    __tl_name__ = "types.chatlists.ChatlistUpdates"
+    __tl_layer__ = 158
+
+    __slots__ = ("missing_peers", "chats", "users", )
+
+    def __init__(self, *, missing_peers: list[tl.base.Peer], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.missing_peers = missing_peers
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.missing_peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatlistUpdates:
+        missing_peers = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(missing_peers=missing_peers, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatlistUpdates, int]:
+        missing_peers, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(missing_peers=missing_peers, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChatlistInvite_158(TLObject):
+    __tl_id__ = 0x1dcd839d
+    __tl_name__ = "types.chatlists.ChatlistInvite_158"
+    __tl_layer__ = 158
+
+    __slots__ = ("title", "emoticon", "peers", "chats", "users", )
+
+    def __init__(self, *, title: str, peers: list[tl.base.Peer], chats: list[tl.base.Chat], users: list[tl.base.User], emoticon: str | None = None):
+        self.title = title
+        self.emoticon = emoticon
+        self.peers = peers
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.emoticon is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        String.write_to(out, self.title)
+        if self.emoticon is not None:
+            String.write_to(out, self.emoticon)
+        TLObjectVector.write_to(out, self.peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatlistInvite_158:
+        flags1 = Int.read(stream)
+        title = String.read(stream)
+        emoticon = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        peers = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(title=title, emoticon=emoticon, peers=peers, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatlistInvite_158, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        emoticon, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(title=title, emoticon=emoticon, peers=peers, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChatlistInvite(ChatlistInviteBase):
+    __tl_ids__ = (
+        (ChatlistInvite_158.__tl_layer__, ChatlistInvite_158.__tl_id__),
+        (ChatlistInviteBase.__tl_layer__, ChatlistInviteBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _title_downgrade_158 = tl.layer_converters.chatlists__chatlist_invite.downgrade_title_for_158(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if ctx.layer >= 196:
+            if self.title_noanimate: flags1 |= (1 << 1)
+        if self.emoticon is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if ctx.layer >= 196:
+            self.title.write_to(out, ctx)
+        if ctx.layer <= 195:
+            String.write_to(out, _title_downgrade_158)
+        if self.emoticon is not None:
+            String.write_to(out, self.emoticon)
+        TLObjectVector.write_to(out, self.peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
@@ -0,0 +1,435 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class ContactsNotModified(TLObject):
+    __tl_id__ = 0xb74ba9d2
+    __tl_name__ = "types.contacts.ContactsNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ContactsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ContactsNotModified, int]:
+        return cls(), cursor
+
+
+class Contacts(TLObject):
+    __tl_id__ = 0xeae87e42
+    __tl_name__ = "types.contacts.Contacts"
+    __tl_layer__ = 133
+
+    __slots__ = ("contacts", "saved_count", "users", )
+
+    def __init__(self, *, contacts: list[tl.base.Contact], saved_count: int, users: list[tl.base.User]):
+        self.contacts = contacts
+        self.saved_count = saved_count
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.contacts, ctx)
+        out += Int.write(self.saved_count)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Contacts:
+        contacts = TLObjectVector.read(stream)
+        saved_count = Int.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(contacts=contacts, saved_count=saved_count, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Contacts, int]:
+        contacts, cursor = TLObjectVector.read_from(view, cursor)
+        saved_count, cursor = Int.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(contacts=contacts, saved_count=saved_count, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ImportedContacts(TLObject):
+    __tl_id__ = 0x77d01c3b
+    __tl_name__ = "types.contacts.ImportedContacts"
+    __tl_layer__ = 133
+
+    __slots__ = ("imported", "popular_invites", "retry_contacts", "users", )
+
+    def __init__(self, *, imported: list[tl.base.ImportedContact], popular_invites: list[tl.base.PopularContact], retry_contacts: list[int], users: list[tl.base.User]):
+        self.imported = imported
+        self.popular_invites = popular_invites
+        self.retry_contacts = retry_contacts
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.imported, ctx)
+        TLObjectVector.write_to(out, self.popular_invites, ctx)
+        out += LongVector.write(self.retry_contacts)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ImportedContacts:
+        imported = TLObjectVector.read(stream)
+        popular_invites = TLObjectVector.read(stream)
+        retry_contacts = LongVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(imported=imported, popular_invites=popular_invites, retry_contacts=retry_contacts, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ImportedContacts, int]:
+        imported, cursor = TLObjectVector.read_from(view, cursor)
+        popular_invites, cursor = TLObjectVector.read_from(view, cursor)
+        retry_contacts, cursor = LongVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(imported=imported, popular_invites=popular_invites, retry_contacts=retry_contacts, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class Blocked(TLObject):
+    __tl_id__ = 0xade1591
+    __tl_name__ = "types.contacts.Blocked"
+    __tl_layer__ = 133
+
+    __slots__ = ("blocked", "chats", "users", )
+
+    def __init__(self, *, blocked: list[tl.base.PeerBlocked], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.blocked = blocked
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.blocked, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Blocked:
+        blocked = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(blocked=blocked, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Blocked, int]:
+        blocked, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(blocked=blocked, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class BlockedSlice(TLObject):
+    __tl_id__ = 0xe1664194
+    __tl_name__ = "types.contacts.BlockedSlice"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "blocked", "chats", "users", )
+
+    def __init__(self, *, count: int, blocked: list[tl.base.PeerBlocked], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.count = count
+        self.blocked = blocked
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.blocked, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BlockedSlice:
+        count = Int.read(stream)
+        blocked = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, blocked=blocked, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BlockedSlice, int]:
+        count, cursor = Int.read_from(view, cursor)
+        blocked, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, blocked=blocked, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class Found(TLObject):
+    __tl_id__ = 0xb3134d9d
+    __tl_name__ = "types.contacts.Found"
+    __tl_layer__ = 133
+
+    __slots__ = ("my_results", "results", "chats", "users", )
+
+    def __init__(self, *, my_results: list[tl.base.Peer], results: list[tl.base.Peer], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.my_results = my_results
+        self.results = results
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.my_results, ctx)
+        TLObjectVector.write_to(out, self.results, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Found:
+        my_results = TLObjectVector.read(stream)
+        results = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(my_results=my_results, results=results, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Found, int]:
+        my_results, cursor = TLObjectVector.read_from(view, cursor)
+        results, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(my_results=my_results, results=results, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ResolvedPeer(TLObject):
+    __tl_id__ = 0x7f077ad9
+    __tl_name__ = "types.contacts.ResolvedPeer"
+    __tl_layer__ = 133
+
+    __slots__ = ("peer", "chats", "users", )
+
+    def __init__(self, *, peer: tl.base.Peer, chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.peer = peer
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.peer.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ResolvedPeer:
+        peer = TLObject.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(peer=peer, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ResolvedPeer, int]:
+        peer, cursor = TLObject.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peer=peer, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class TopPeersNotModified(TLObject):
+    __tl_id__ = 0xde266ef5
+    __tl_name__ = "types.contacts.TopPeersNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TopPeersNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TopPeersNotModified, int]:
+        return cls(), cursor
+
+
+class TopPeers(TLObject):
+    __tl_id__ = 0x70b772a8
+    __tl_name__ = "types.contacts.TopPeers"
+    __tl_layer__ = 133
+
+    __slots__ = ("categories", "chats", "users", )
+
+    def __init__(self, *, categories: list[tl.base.TopPeerCategoryPeers], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.categories = categories
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.categories, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TopPeers:
+        categories = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(categories=categories, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TopPeers, int]:
+        categories, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(categories=categories, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class TopPeersDisabled(TLObject):
+    __tl_id__ = 0xb52c939d
+    __tl_name__ = "types.contacts.TopPeersDisabled"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TopPeersDisabled:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TopPeersDisabled, int]:
+        return cls(), cursor
+
+
+class ContactBirthdays(TLObject):
+    __tl_id__ = 0x114ff30d
+    __tl_name__ = "types.contacts.ContactBirthdays"
+    __tl_layer__ = 177
+
+    __slots__ = ("contacts", "users", )
+
+    def __init__(self, *, contacts: list[tl.base.ContactBirthday], users: list[tl.base.User]):
+        self.contacts = contacts
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.contacts, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ContactBirthdays:
+        contacts = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(contacts=contacts, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ContactBirthdays, int]:
+        contacts, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(contacts=contacts, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SponsoredPeersEmpty(TLObject):
+    __tl_id__ = 0xea32b4b1
+    __tl_name__ = "types.contacts.SponsoredPeersEmpty"
+    __tl_layer__ = 201
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SponsoredPeersEmpty:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SponsoredPeersEmpty, int]:
+        return cls(), cursor
+
+
+class SponsoredPeers(TLObject):
+    __tl_id__ = 0xeb032884
+    __tl_name__ = "types.contacts.SponsoredPeers"
+    __tl_layer__ = 201
+
+    __slots__ = ("peers", "chats", "users", )
+
+    def __init__(self, *, peers: list[tl.base.SponsoredPeer], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.peers = peers
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SponsoredPeers:
+        peers = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(peers=peers, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SponsoredPeers, int]:
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peers=peers, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
@@ -0,0 +1,59 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class CollectibleInfo(TLObject):
+    __tl_id__ = 0x6ebdff91
+    __tl_name__ = "types.fragment.CollectibleInfo"
+    __tl_layer__ = 177
+
+    __slots__ = ("purchase_date", "currency", "amount", "crypto_currency", "crypto_amount", "url", )
+
+    def __init__(self, *, purchase_date: int, currency: str, amount: int, crypto_currency: str, crypto_amount: int, url: str):
+        self.purchase_date = purchase_date
+        self.currency = currency
+        self.amount = amount
+        self.crypto_currency = crypto_currency
+        self.crypto_amount = crypto_amount
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.purchase_date)
+        String.write_to(out, self.currency)
+        out += Long.write(self.amount)
+        String.write_to(out, self.crypto_currency)
+        out += Long.write(self.crypto_amount)
+        String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CollectibleInfo:
+        purchase_date = Int.read(stream)
+        currency = String.read(stream)
+        amount = Long.read(stream)
+        crypto_currency = String.read(stream)
+        crypto_amount = Long.read(stream)
+        url = String.read(stream)
+        return cls(purchase_date=purchase_date, currency=currency, amount=amount, crypto_currency=crypto_currency, crypto_amount=crypto_amount, url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CollectibleInfo, int]:
+        purchase_date, cursor = Int.read_from(view, cursor)
+        currency, cursor = String.read_from(view, cursor)
+        amount, cursor = Long.read_from(view, cursor)
+        crypto_currency, cursor = String.read_from(view, cursor)
+        crypto_amount, cursor = Long.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor)
+        return cls(purchase_date=purchase_date, currency=currency, amount=amount, crypto_currency=crypto_currency, crypto_amount=crypto_amount, url=url), cursor
@@ -0,0 +1,1255 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class ConfigSimple(TLObject):
+    __tl_id__ = 0x5a592a6c
+    __tl_name__ = "types.help.ConfigSimple"
+    __tl_layer__ = 201
+
+    __slots__ = ("date", "expires", "rules", )
+
+    def __init__(self, *, date: int, expires: int, rules: list[tl.base.AccessPointRule]):
+        self.date = date
+        self.expires = expires
+        self.rules = rules
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.date)
+        out += Int.write(self.expires)
+        TLObjectVector.write_to(out, self.rules, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConfigSimple:
+        date = Int.read(stream)
+        expires = Int.read(stream)
+        rules = TLObjectVector.read(stream)
+        return cls(date=date, expires=expires, rules=rules)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConfigSimple, int]:
+        date, cursor = Int.read_from(view, cursor)
+        expires, cursor = Int.read_from(view, cursor)
+        rules, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(date=date, expires=expires, rules=rules), cursor
+
+
+class AppUpdate(TLObject):
+    __tl_id__ = 0xccbbce30
+    __tl_name__ = "types.help.AppUpdate"
+    __tl_layer__ = 133
+
+    __slots__ = ("can_not_skip", "id", "version", "text", "entities", "document", "url", "sticker", )
+
+    def __init__(self, *, id: int, version: str, text: str, entities: list[tl.base.MessageEntity], can_not_skip: bool = False, document: tl.base.Document | None = None, url: str | None = None, sticker: tl.base.Document | None = None):
+        self.can_not_skip = can_not_skip
+        self.id = id
+        self.version = version
+        self.text = text
+        self.entities = entities
+        self.document = document
+        self.url = url
+        self.sticker = sticker
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.can_not_skip: flags1 |= (1 << 0)
+        if self.document is not None: flags1 |= (1 << 1)
+        if self.url is not None: flags1 |= (1 << 2)
+        if self.sticker is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        out += Int.write(self.id)
+        String.write_to(out, self.version)
+        String.write_to(out, self.text)
+        TLObjectVector.write_to(out, self.entities, ctx)
+        if self.document is not None:
+            self.document.write_to(out, ctx)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        if self.sticker is not None:
+            self.sticker.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AppUpdate:
+        flags1 = Int.read(stream)
+        can_not_skip = (flags1 & (1 << 0)) == (1 << 0)
+        id = Int.read(stream)
+        version = String.read(stream)
+        text = String.read(stream)
+        entities = TLObjectVector.read(stream)
+        document = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        url = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        sticker = TLObject.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(can_not_skip=can_not_skip, id=id, version=version, text=text, entities=entities, document=document, url=url, sticker=sticker)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AppUpdate, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        can_not_skip = (flags1 & (1 << 0)) == (1 << 0)
+        id, cursor = Int.read_from(view, cursor)
+        version, cursor = String.read_from(view, cursor)
+        text, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor)
+        document, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        sticker, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(can_not_skip=can_not_skip, id=id, version=version, text=text, entities=entities, document=document, url=url, sticker=sticker), cursor
+
+
+class NoAppUpdate(TLObject):
+    __tl_id__ = 0xc45a6536
+    __tl_name__ = "types.help.NoAppUpdate"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> NoAppUpdate:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[NoAppUpdate, int]:
+        return cls(), cursor
+
+
+class InviteText(TLObject):
+    __tl_id__ = 0x18cb9f78
+    __tl_name__ = "types.help.InviteText"
+    __tl_layer__ = 133
+
+    __slots__ = ("message", )
+
+    def __init__(self, *, message: str):
+        self.message = message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InviteText:
+        message = String.read(stream)
+        return cls(message=message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InviteText, int]:
+        message, cursor = String.read_from(view, cursor)
+        return cls(message=message), cursor
+
+
+class Support(TLObject):
+    __tl_id__ = 0x17c6b5f6
+    __tl_name__ = "types.help.Support"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_number", "user", )
+
+    def __init__(self, *, phone_number: str, user: tl.base.User):
+        self.phone_number = phone_number
+        self.user = user
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.phone_number)
+        self.user.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Support:
+        phone_number = String.read(stream)
+        user = TLObject.read(stream)
+        return cls(phone_number=phone_number, user=user)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Support, int]:
+        phone_number, cursor = String.read_from(view, cursor)
+        user, cursor = TLObject.read_from(view, cursor)
+        return cls(phone_number=phone_number, user=user), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.user.check_for_ctx_values(values)
+
+
+class TermsOfService(TLObject):
+    __tl_id__ = 0x780a0310
+    __tl_name__ = "types.help.TermsOfService"
+    __tl_layer__ = 133
+
+    __slots__ = ("popup", "id", "text", "entities", "min_age_confirm", )
+
+    def __init__(self, *, id: tl.types.DataJSON, text: str, entities: list[tl.base.MessageEntity], popup: bool = False, min_age_confirm: int | None = None):
+        self.popup = popup
+        self.id = id
+        self.text = text
+        self.entities = entities
+        self.min_age_confirm = min_age_confirm
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.popup: flags1 |= (1 << 0)
+        if self.min_age_confirm is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.id.write_to(out, ctx)
+        String.write_to(out, self.text)
+        TLObjectVector.write_to(out, self.entities, ctx)
+        if self.min_age_confirm is not None:
+            out += Int.write(self.min_age_confirm)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TermsOfService:
+        flags1 = Int.read(stream)
+        popup = (flags1 & (1 << 0)) == (1 << 0)
+        id = tl.types.DataJSON.read(stream)
+        text = String.read(stream)
+        entities = TLObjectVector.read(stream)
+        min_age_confirm = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(popup=popup, id=id, text=text, entities=entities, min_age_confirm=min_age_confirm)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TermsOfService, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        popup = (flags1 & (1 << 0)) == (1 << 0)
+        id, cursor = tl.types.DataJSON.read_from(view, cursor)
+        text, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor)
+        min_age_confirm, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(popup=popup, id=id, text=text, entities=entities, min_age_confirm=min_age_confirm), cursor
+
+
+class RecentMeUrls(TLObject):
+    __tl_id__ = 0xe0310d7
+    __tl_name__ = "types.help.RecentMeUrls"
+    __tl_layer__ = 133
+
+    __slots__ = ("urls", "chats", "users", )
+
+    def __init__(self, *, urls: list[tl.base.RecentMeUrl], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.urls = urls
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.urls, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RecentMeUrls:
+        urls = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(urls=urls, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RecentMeUrls, int]:
+        urls, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(urls=urls, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for urls_item in self.urls:
+            urls_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class TermsOfServiceUpdateEmpty(TLObject):
+    __tl_id__ = 0xe3309f7f
+    __tl_name__ = "types.help.TermsOfServiceUpdateEmpty"
+    __tl_layer__ = 133
+
+    __slots__ = ("expires", )
+
+    def __init__(self, *, expires: int):
+        self.expires = expires
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.expires)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TermsOfServiceUpdateEmpty:
+        expires = Int.read(stream)
+        return cls(expires=expires)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TermsOfServiceUpdateEmpty, int]:
+        expires, cursor = Int.read_from(view, cursor)
+        return cls(expires=expires), cursor
+
+
+class TermsOfServiceUpdate(TLObject):
+    __tl_id__ = 0x28ecf961
+    __tl_name__ = "types.help.TermsOfServiceUpdate"
+    __tl_layer__ = 133
+
+    __slots__ = ("expires", "terms_of_service", )
+
+    def __init__(self, *, expires: int, terms_of_service: tl.types.help.TermsOfService):
+        self.expires = expires
+        self.terms_of_service = terms_of_service
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.expires)
+        self.terms_of_service.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TermsOfServiceUpdate:
+        expires = Int.read(stream)
+        terms_of_service = tl.types.help.TermsOfService.read(stream)
+        return cls(expires=expires, terms_of_service=terms_of_service)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TermsOfServiceUpdate, int]:
+        expires, cursor = Int.read_from(view, cursor)
+        terms_of_service, cursor = tl.types.help.TermsOfService.read_from(view, cursor)
+        return cls(expires=expires, terms_of_service=terms_of_service), cursor
+
+
+class DeepLinkInfoEmpty(TLObject):
+    __tl_id__ = 0x66afa166
+    __tl_name__ = "types.help.DeepLinkInfoEmpty"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeepLinkInfoEmpty:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeepLinkInfoEmpty, int]:
+        return cls(), cursor
+
+
+class DeepLinkInfo(TLObject):
+    __tl_id__ = 0x6a4ee832
+    __tl_name__ = "types.help.DeepLinkInfo"
+    __tl_layer__ = 133
+
+    __slots__ = ("update_app", "message", "entities", )
+
+    def __init__(self, *, message: str, update_app: bool = False, entities: list[tl.base.MessageEntity] | None = None):
+        self.update_app = update_app
+        self.message = message
+        self.entities = entities
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.update_app: flags1 |= (1 << 0)
+        if self.entities: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        String.write_to(out, self.message)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeepLinkInfo:
+        flags1 = Int.read(stream)
+        update_app = (flags1 & (1 << 0)) == (1 << 0)
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(update_app=update_app, message=message, entities=entities)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeepLinkInfo, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        update_app = (flags1 & (1 << 0)) == (1 << 0)
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(update_app=update_app, message=message, entities=entities), cursor
+
+
+class PassportConfigNotModified(TLObject):
+    __tl_id__ = 0xbfb9f457
+    __tl_name__ = "types.help.PassportConfigNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PassportConfigNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PassportConfigNotModified, int]:
+        return cls(), cursor
+
+
+class PassportConfig(TLObject):
+    __tl_id__ = 0xa098d6af
+    __tl_name__ = "types.help.PassportConfig"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "countries_langs", )
+
+    def __init__(self, *, hash: int, countries_langs: tl.types.DataJSON):
+        self.hash = hash
+        self.countries_langs = countries_langs
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+        self.countries_langs.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PassportConfig:
+        hash = Int.read(stream)
+        countries_langs = tl.types.DataJSON.read(stream)
+        return cls(hash=hash, countries_langs=countries_langs)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PassportConfig, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        countries_langs, cursor = tl.types.DataJSON.read_from(view, cursor)
+        return cls(hash=hash, countries_langs=countries_langs), cursor
+
+
+class SupportName(TLObject):
+    __tl_id__ = 0x8c05f1c9
+    __tl_name__ = "types.help.SupportName"
+    __tl_layer__ = 133
+
+    __slots__ = ("name", )
+
+    def __init__(self, *, name: str):
+        self.name = name
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.name)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SupportName:
+        name = String.read(stream)
+        return cls(name=name)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SupportName, int]:
+        name, cursor = String.read_from(view, cursor)
+        return cls(name=name), cursor
+
+
+class UserInfoEmpty(TLObject):
+    __tl_id__ = 0xf3ae2eed
+    __tl_name__ = "types.help.UserInfoEmpty"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UserInfoEmpty:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UserInfoEmpty, int]:
+        return cls(), cursor
+
+
+class UserInfo(TLObject):
+    __tl_id__ = 0x1eb3758
+    __tl_name__ = "types.help.UserInfo"
+    __tl_layer__ = 133
+
+    __slots__ = ("message", "entities", "author", "date", )
+
+    def __init__(self, *, message: str, entities: list[tl.base.MessageEntity], author: str, date: int):
+        self.message = message
+        self.entities = entities
+        self.author = author
+        self.date = date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.message)
+        TLObjectVector.write_to(out, self.entities, ctx)
+        String.write_to(out, self.author)
+        out += Int.write(self.date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UserInfo:
+        message = String.read(stream)
+        entities = TLObjectVector.read(stream)
+        author = String.read(stream)
+        date = Int.read(stream)
+        return cls(message=message, entities=entities, author=author, date=date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UserInfo, int]:
+        message, cursor = String.read_from(view, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor)
+        author, cursor = String.read_from(view, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        return cls(message=message, entities=entities, author=author, date=date), cursor
+
+
+class PromoDataEmpty(TLObject):
+    __tl_id__ = 0x98f6ac75
+    __tl_name__ = "types.help.PromoDataEmpty"
+    __tl_layer__ = 133
+
+    __slots__ = ("expires", )
+
+    def __init__(self, *, expires: int):
+        self.expires = expires
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.expires)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PromoDataEmpty:
+        expires = Int.read(stream)
+        return cls(expires=expires)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PromoDataEmpty, int]:
+        expires, cursor = Int.read_from(view, cursor)
+        return cls(expires=expires), cursor
+
+
+class PromoData(TLObject):
+    __tl_id__ = 0x8c39793f
+    __tl_name__ = "types.help.PromoData"
+    __tl_layer__ = 133
+
+    __slots__ = ("proxy", "expires", "peer", "chats", "users", "psa_type", "psa_message", )
+
+    def __init__(self, *, expires: int, peer: tl.base.Peer, chats: list[tl.base.Chat], users: list[tl.base.User], proxy: bool = False, psa_type: str | None = None, psa_message: str | None = None):
+        self.proxy = proxy
+        self.expires = expires
+        self.peer = peer
+        self.chats = chats
+        self.users = users
+        self.psa_type = psa_type
+        self.psa_message = psa_message
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.proxy: flags1 |= (1 << 0)
+        if self.psa_type is not None: flags1 |= (1 << 1)
+        if self.psa_message is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.expires)
+        self.peer.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.psa_type is not None:
+            String.write_to(out, self.psa_type)
+        if self.psa_message is not None:
+            String.write_to(out, self.psa_message)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PromoData:
+        flags1 = Int.read(stream)
+        proxy = (flags1 & (1 << 0)) == (1 << 0)
+        expires = Int.read(stream)
+        peer = TLObject.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        psa_type = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        psa_message = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(proxy=proxy, expires=expires, peer=peer, chats=chats, users=users, psa_type=psa_type, psa_message=psa_message)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PromoData, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        proxy = (flags1 & (1 << 0)) == (1 << 0)
+        expires, cursor = Int.read_from(view, cursor)
+        peer, cursor = TLObject.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        psa_type, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        psa_message, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(proxy=proxy, expires=expires, peer=peer, chats=chats, users=users, psa_type=psa_type, psa_message=psa_message), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class CountryCode(TLObject):
+    __tl_id__ = 0x4203c5ef
+    __tl_name__ = "types.help.CountryCode"
+    __tl_layer__ = 133
+
+    __slots__ = ("country_code", "prefixes", "patterns", )
+
+    def __init__(self, *, country_code: str, prefixes: list[str] | None = None, patterns: list[str] | None = None):
+        self.country_code = country_code
+        self.prefixes = prefixes
+        self.patterns = patterns
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.prefixes: flags1 |= (1 << 0)
+        if self.patterns: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        String.write_to(out, self.country_code)
+        if self.prefixes:
+            out += StringVector.write(self.prefixes)
+        if self.patterns:
+            out += StringVector.write(self.patterns)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CountryCode:
+        flags1 = Int.read(stream)
+        country_code = String.read(stream)
+        prefixes = StringVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        patterns = StringVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(country_code=country_code, prefixes=prefixes, patterns=patterns)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CountryCode, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        country_code, cursor = String.read_from(view, cursor)
+        prefixes, cursor = StringVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        patterns, cursor = StringVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(country_code=country_code, prefixes=prefixes, patterns=patterns), cursor
+
+
+class Country(TLObject):
+    __tl_id__ = 0xc3878e23
+    __tl_name__ = "types.help.Country"
+    __tl_layer__ = 133
+
+    __slots__ = ("hidden", "iso2", "default_name", "name", "country_codes", )
+
+    def __init__(self, *, iso2: str, default_name: str, country_codes: list[tl.base.help.CountryCode], hidden: bool = False, name: str | None = None):
+        self.hidden = hidden
+        self.iso2 = iso2
+        self.default_name = default_name
+        self.name = name
+        self.country_codes = country_codes
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.hidden: flags1 |= (1 << 0)
+        if self.name is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        String.write_to(out, self.iso2)
+        String.write_to(out, self.default_name)
+        if self.name is not None:
+            String.write_to(out, self.name)
+        TLObjectVector.write_to(out, self.country_codes, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Country:
+        flags1 = Int.read(stream)
+        hidden = (flags1 & (1 << 0)) == (1 << 0)
+        iso2 = String.read(stream)
+        default_name = String.read(stream)
+        name = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        country_codes = TLObjectVector.read(stream)
+        return cls(hidden=hidden, iso2=iso2, default_name=default_name, name=name, country_codes=country_codes)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Country, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        hidden = (flags1 & (1 << 0)) == (1 << 0)
+        iso2, cursor = String.read_from(view, cursor)
+        default_name, cursor = String.read_from(view, cursor)
+        name, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        country_codes, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hidden=hidden, iso2=iso2, default_name=default_name, name=name, country_codes=country_codes), cursor
+
+
+class CountriesListNotModified(TLObject):
+    __tl_id__ = 0x93cc1f32
+    __tl_name__ = "types.help.CountriesListNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CountriesListNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CountriesListNotModified, int]:
+        return cls(), cursor
+
+
+class CountriesList(TLObject):
+    __tl_id__ = 0x87d0759e
+    __tl_name__ = "types.help.CountriesList"
+    __tl_layer__ = 133
+
+    __slots__ = ("countries", "hash", )
+
+    def __init__(self, *, countries: list[tl.base.help.Country], hash: int):
+        self.countries = countries
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.countries, ctx)
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CountriesList:
+        countries = TLObjectVector.read(stream)
+        hash = Int.read(stream)
+        return cls(countries=countries, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CountriesList, int]:
+        countries, cursor = TLObjectVector.read_from(view, cursor)
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(countries=countries, hash=hash), cursor
+
+
+class PremiumPromoBase(TLObject):
+    __tl_id__ = 0x5334759c
+    __tl_name__ = "types.help.PremiumPromo"
+    __tl_layer__ = 145
+
+    __slots__ = ("status_text", "status_entities", "video_sections", "videos", "period_options", "users", )
+
+    def __init__(self, *, status_text: str, status_entities: list[tl.base.MessageEntity], video_sections: list[str], videos: list[tl.base.Document], period_options: list[tl.base.PremiumSubscriptionOption], users: list[tl.base.User]):
+        self.status_text = status_text
+        self.status_entities = status_entities
+        self.video_sections = video_sections
+        self.videos = videos
+        self.period_options = period_options
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.status_text)
+        TLObjectVector.write_to(out, self.status_entities, ctx)
+        out += StringVector.write(self.video_sections)
+        TLObjectVector.write_to(out, self.videos, ctx)
+        TLObjectVector.write_to(out, self.period_options, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PremiumPromo:
+        status_text = String.read(stream)
+        status_entities = TLObjectVector.read(stream)
+        video_sections = StringVector.read(stream)
+        videos = TLObjectVector.read(stream)
+        period_options = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(status_text=status_text, status_entities=status_entities, video_sections=video_sections, videos=videos, period_options=period_options, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PremiumPromo, int]:
+        status_text, cursor = String.read_from(view, cursor)
+        status_entities, cursor = TLObjectVector.read_from(view, cursor)
+        video_sections, cursor = StringVector.read_from(view, cursor)
+        videos, cursor = TLObjectVector.read_from(view, cursor)
+        period_options, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(status_text=status_text, status_entities=status_entities, video_sections=video_sections, videos=videos, period_options=period_options, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class AppConfigNotModified(TLObject):
+    __tl_id__ = 0x7cde641d
+    __tl_name__ = "types.help.AppConfigNotModified"
+    __tl_layer__ = 153
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AppConfigNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AppConfigNotModified, int]:
+        return cls(), cursor
+
+
+class AppConfig(TLObject):
+    __tl_id__ = 0xdd18782e
+    __tl_name__ = "types.help.AppConfig"
+    __tl_layer__ = 153
+
+    __slots__ = ("hash", "config", )
+
+    def __init__(self, *, hash: int, config: tl.base.JSONValue):
+        self.hash = hash
+        self.config = config
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+        self.config.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AppConfig:
+        hash = Int.read(stream)
+        config = TLObject.read(stream)
+        return cls(hash=hash, config=config)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AppConfig, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        config, cursor = TLObject.read_from(view, cursor)
+        return cls(hash=hash, config=config), cursor
+
+
+class PeerColorSet(TLObject):
+    __tl_id__ = 0x26219a58
+    __tl_name__ = "types.help.PeerColorSet"
+    __tl_layer__ = 167
+
+    __slots__ = ("colors", )
+
+    def __init__(self, *, colors: list[int]):
+        self.colors = colors
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.colors)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerColorSet:
+        colors = IntVector.read(stream)
+        return cls(colors=colors)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerColorSet, int]:
+        colors, cursor = IntVector.read_from(view, cursor)
+        return cls(colors=colors), cursor
+
+
+class PeerColorProfileSet(TLObject):
+    __tl_id__ = 0x767d61eb
+    __tl_name__ = "types.help.PeerColorProfileSet"
+    __tl_layer__ = 167
+
+    __slots__ = ("palette_colors", "bg_colors", "story_colors", )
+
+    def __init__(self, *, palette_colors: list[int], bg_colors: list[int], story_colors: list[int]):
+        self.palette_colors = palette_colors
+        self.bg_colors = bg_colors
+        self.story_colors = story_colors
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.palette_colors)
+        out += IntVector.write(self.bg_colors)
+        out += IntVector.write(self.story_colors)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerColorProfileSet:
+        palette_colors = IntVector.read(stream)
+        bg_colors = IntVector.read(stream)
+        story_colors = IntVector.read(stream)
+        return cls(palette_colors=palette_colors, bg_colors=bg_colors, story_colors=story_colors)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerColorProfileSet, int]:
+        palette_colors, cursor = IntVector.read_from(view, cursor)
+        bg_colors, cursor = IntVector.read_from(view, cursor)
+        story_colors, cursor = IntVector.read_from(view, cursor)
+        return cls(palette_colors=palette_colors, bg_colors=bg_colors, story_colors=story_colors), cursor
+
+
+class PeerColorOptionBase(TLObject):
+    __tl_id__ = 0xadec6ebe
+    __tl_name__ = "types.help.PeerColorOption"
+    __tl_layer__ = 174
+
+    __slots__ = ("hidden", "color_id", "colors", "dark_colors", "channel_min_level", "group_min_level", )
+
+    def __init__(self, *, color_id: int, hidden: bool = False, colors: tl.base.help.PeerColorSet | None = None, dark_colors: tl.base.help.PeerColorSet | None = None, channel_min_level: int | None = None, group_min_level: int | None = None):
+        self.hidden = hidden
+        self.color_id = color_id
+        self.colors = colors
+        self.dark_colors = dark_colors
+        self.channel_min_level = channel_min_level
+        self.group_min_level = group_min_level
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.hidden: flags1 |= (1 << 0)
+        if self.colors is not None: flags1 |= (1 << 1)
+        if self.dark_colors is not None: flags1 |= (1 << 2)
+        if self.channel_min_level is not None: flags1 |= (1 << 3)
+        if self.group_min_level is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        out += Int.write(self.color_id)
+        if self.colors is not None:
+            self.colors.write_to(out, ctx)
+        if self.dark_colors is not None:
+            self.dark_colors.write_to(out, ctx)
+        if self.channel_min_level is not None:
+            out += Int.write(self.channel_min_level)
+        if self.group_min_level is not None:
+            out += Int.write(self.group_min_level)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerColorOption:
+        flags1 = Int.read(stream)
+        hidden = (flags1 & (1 << 0)) == (1 << 0)
+        color_id = Int.read(stream)
+        colors = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        dark_colors = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        channel_min_level = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        group_min_level = Int.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(hidden=hidden, color_id=color_id, colors=colors, dark_colors=dark_colors, channel_min_level=channel_min_level, group_min_level=group_min_level)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerColorOption, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        hidden = (flags1 & (1 << 0)) == (1 << 0)
+        color_id, cursor = Int.read_from(view, cursor)
+        colors, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        dark_colors, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        channel_min_level, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        group_min_level, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(hidden=hidden, color_id=color_id, colors=colors, dark_colors=dark_colors, channel_min_level=channel_min_level, group_min_level=group_min_level), cursor
+
+
+class PeerColorsNotModified(TLObject):
+    __tl_id__ = 0x2ba1f5ce
+    __tl_name__ = "types.help.PeerColorsNotModified"
+    __tl_layer__ = 167
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerColorsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerColorsNotModified, int]:
+        return cls(), cursor
+
+
+class PeerColors(TLObject):
+    __tl_id__ = 0xf8ed08
+    __tl_name__ = "types.help.PeerColors"
+    __tl_layer__ = 167
+
+    __slots__ = ("hash", "colors", )
+
+    def __init__(self, *, hash: int, colors: list[tl.base.help.PeerColorOption]):
+        self.hash = hash
+        self.colors = colors
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+        TLObjectVector.write_to(out, self.colors, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerColors:
+        hash = Int.read(stream)
+        colors = TLObjectVector.read(stream)
+        return cls(hash=hash, colors=colors)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerColors, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        colors, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, colors=colors), cursor
+
+
+class TimezonesListNotModified(TLObject):
+    __tl_id__ = 0x970708cc
+    __tl_name__ = "types.help.TimezonesListNotModified"
+    __tl_layer__ = 176
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TimezonesListNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TimezonesListNotModified, int]:
+        return cls(), cursor
+
+
+class TimezonesList(TLObject):
+    __tl_id__ = 0x7b74ed71
+    __tl_name__ = "types.help.TimezonesList"
+    __tl_layer__ = 176
+
+    __slots__ = ("timezones", "hash", )
+
+    def __init__(self, *, timezones: list[tl.base.Timezone], hash: int):
+        self.timezones = timezones
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.timezones, ctx)
+        out += Int.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TimezonesList:
+        timezones = TLObjectVector.read(stream)
+        hash = Int.read(stream)
+        return cls(timezones=timezones, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TimezonesList, int]:
+        timezones, cursor = TLObjectVector.read_from(view, cursor)
+        hash, cursor = Int.read_from(view, cursor)
+        return cls(timezones=timezones, hash=hash), cursor
+
+
+class PremiumPromo_143(TLObject):
+    __tl_id__ = 0x8a4f3c29
+    __tl_name__ = "types.help.PremiumPromo_143"
+    __tl_layer__ = 143
+
+    __slots__ = ("status_text", "status_entities", "video_sections", "videos", "currency", "monthly_amount", "users", )
+
+    def __init__(self, *, status_text: str, status_entities: list[tl.base.MessageEntity], video_sections: list[str], videos: list[tl.base.Document], currency: str, monthly_amount: int, users: list[tl.base.User]):
+        self.status_text = status_text
+        self.status_entities = status_entities
+        self.video_sections = video_sections
+        self.videos = videos
+        self.currency = currency
+        self.monthly_amount = monthly_amount
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.status_text)
+        TLObjectVector.write_to(out, self.status_entities, ctx)
+        out += StringVector.write(self.video_sections)
+        TLObjectVector.write_to(out, self.videos, ctx)
+        String.write_to(out, self.currency)
+        out += Long.write(self.monthly_amount)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PremiumPromo_143:
+        status_text = String.read(stream)
+        status_entities = TLObjectVector.read(stream)
+        video_sections = StringVector.read(stream)
+        videos = TLObjectVector.read(stream)
+        currency = String.read(stream)
+        monthly_amount = Long.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(status_text=status_text, status_entities=status_entities, video_sections=video_sections, videos=videos, currency=currency, monthly_amount=monthly_amount, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PremiumPromo_143, int]:
+        status_text, cursor = String.read_from(view, cursor)
+        status_entities, cursor = TLObjectVector.read_from(view, cursor)
+        video_sections, cursor = StringVector.read_from(view, cursor)
+        videos, cursor = TLObjectVector.read_from(view, cursor)
+        currency, cursor = String.read_from(view, cursor)
+        monthly_amount, cursor = Long.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(status_text=status_text, status_entities=status_entities, video_sections=video_sections, videos=videos, currency=currency, monthly_amount=monthly_amount, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PeerColorOption_167(TLObject):
+    __tl_id__ = 0x135bd42f
+    __tl_name__ = "types.help.PeerColorOption_167"
+    __tl_layer__ = 167
+
+    __slots__ = ("hidden", "color_id", "colors", "dark_colors", )
+
+    def __init__(self, *, color_id: int, hidden: bool = False, colors: tl.base.help.PeerColorSet | None = None, dark_colors: tl.base.help.PeerColorSet | None = None):
+        self.hidden = hidden
+        self.color_id = color_id
+        self.colors = colors
+        self.dark_colors = dark_colors
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.hidden: flags1 |= (1 << 0)
+        if self.colors is not None: flags1 |= (1 << 1)
+        if self.dark_colors is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.color_id)
+        if self.colors is not None:
+            self.colors.write_to(out, ctx)
+        if self.dark_colors is not None:
+            self.dark_colors.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerColorOption_167:
+        flags1 = Int.read(stream)
+        hidden = (flags1 & (1 << 0)) == (1 << 0)
+        color_id = Int.read(stream)
+        colors = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        dark_colors = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(hidden=hidden, color_id=color_id, colors=colors, dark_colors=dark_colors)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerColorOption_167, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        hidden = (flags1 & (1 << 0)) == (1 << 0)
+        color_id, cursor = Int.read_from(view, cursor)
+        colors, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        dark_colors, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(hidden=hidden, color_id=color_id, colors=colors, dark_colors=dark_colors), cursor
+
+
+class PeerColorOption_168(TLObject):
+    __tl_id__ = 0xef8430ab
+    __tl_name__ = "types.help.PeerColorOption_168"
+    __tl_layer__ = 168
+
+    __slots__ = ("hidden", "color_id", "colors", "dark_colors", "channel_min_level", )
+
+    def __init__(self, *, color_id: int, hidden: bool = False, colors: tl.base.help.PeerColorSet | None = None, dark_colors: tl.base.help.PeerColorSet | None = None, channel_min_level: int | None = None):
+        self.hidden = hidden
+        self.color_id = color_id
+        self.colors = colors
+        self.dark_colors = dark_colors
+        self.channel_min_level = channel_min_level
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.hidden: flags1 |= (1 << 0)
+        if self.colors is not None: flags1 |= (1 << 1)
+        if self.dark_colors is not None: flags1 |= (1 << 2)
+        if self.channel_min_level is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        out += Int.write(self.color_id)
+        if self.colors is not None:
+            self.colors.write_to(out, ctx)
+        if self.dark_colors is not None:
+            self.dark_colors.write_to(out, ctx)
+        if self.channel_min_level is not None:
+            out += Int.write(self.channel_min_level)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerColorOption_168:
+        flags1 = Int.read(stream)
+        hidden = (flags1 & (1 << 0)) == (1 << 0)
+        color_id = Int.read(stream)
+        colors = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        dark_colors = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        channel_min_level = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        return cls(hidden=hidden, color_id=color_id, colors=colors, dark_colors=dark_colors, channel_min_level=channel_min_level)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerColorOption_168, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        hidden = (flags1 & (1 << 0)) == (1 << 0)
+        color_id, cursor = Int.read_from(view, cursor)
+        colors, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        dark_colors, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        channel_min_level, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        return cls(hidden=hidden, color_id=color_id, colors=colors, dark_colors=dark_colors, channel_min_level=channel_min_level), cursor
+
+
+class PremiumPromo(PremiumPromoBase):
+    __tl_ids__ = (
+        (PremiumPromo_143.__tl_layer__, PremiumPromo_143.__tl_id__),
+        (PremiumPromoBase.__tl_layer__, PremiumPromoBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _currency_fallback_143 = tl.layer_converters.help__premium_promo.get_currency_fallback_for_143(self, ctx)
+        _monthly_amount_fallback_143 = tl.layer_converters.help__premium_promo.get_monthly_amount_fallback_for_143(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        String.write_to(out, self.status_text)
+        TLObjectVector.write_to(out, self.status_entities, ctx)
+        out += StringVector.write(self.video_sections)
+        TLObjectVector.write_to(out, self.videos, ctx)
+        if ctx.layer >= 145:
+            TLObjectVector.write_to(out, self.period_options, ctx)
+        if ctx.layer <= 144:
+            String.write_to(out, _currency_fallback_143)
+        if ctx.layer <= 144:
+            out += Long.write(_monthly_amount_fallback_143)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+
+class PeerColorOption(PeerColorOptionBase):
+    __tl_ids__ = (
+        (PeerColorOption_167.__tl_layer__, PeerColorOption_167.__tl_id__),
+        (PeerColorOption_168.__tl_layer__, PeerColorOption_168.__tl_id__),
+        (PeerColorOptionBase.__tl_layer__, PeerColorOptionBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.hidden: flags1 |= (1 << 0)
+        if self.colors is not None: flags1 |= (1 << 1)
+        if self.dark_colors is not None: flags1 |= (1 << 2)
+        if ctx.layer >= 168:
+            if self.channel_min_level is not None: flags1 |= (1 << 3)
+        if ctx.layer >= 174:
+            if self.group_min_level is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        out += Int.write(self.color_id)
+        if self.colors is not None:
+            self.colors.write_to(out, ctx)
+        if self.dark_colors is not None:
+            self.dark_colors.write_to(out, ctx)
+        if ctx.layer >= 168:
+            if self.channel_min_level is not None:
+                out += Int.write(self.channel_min_level)
+        if ctx.layer >= 174:
+            if self.group_min_level is not None:
+                out += Int.write(self.group_min_level)
@@ -0,0 +1,1801 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class SentCode(TLObject):
+    __tl_id__ = 0x0aebc70a
+    __tl_name__ = "types.internal.SentCode"
+    __tl_layer__ = 201
+
+    __slots__ = ("random_hash", )
+
+    def __init__(self, *, random_hash: bytes):
+        self.random_hash = random_hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.random_hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentCode:
+        random_hash = Bytes.read(stream)
+        return cls(random_hash=random_hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentCode, int]:
+        random_hash, cursor = Bytes.read_from(view, cursor)
+        return cls(random_hash=random_hash), cursor
+
+
+class Authorization(TLObject):
+    __tl_id__ = 0x2c80fe90
+    __tl_name__ = "types.internal.Authorization"
+    __tl_layer__ = 201
+
+    __slots__ = ("auth", )
+
+    def __init__(self, *, auth: bytes):
+        self.auth = auth
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.auth)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Authorization:
+        auth = Bytes.read(stream)
+        return cls(auth=auth)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Authorization, int]:
+        auth, cursor = Bytes.read_from(view, cursor)
+        return cls(auth=auth), cursor
+
+
+class AppInfo(TLObject):
+    __tl_id__ = 0xc5785da2
+    __tl_name__ = "types.internal.AppInfo"
+    __tl_layer__ = 201
+
+    __slots__ = ("api_id", "api_hash", "title", "short_name", )
+
+    def __init__(self, *, api_id: int, api_hash: str, title: str, short_name: str):
+        self.api_id = api_id
+        self.api_hash = api_hash
+        self.title = title
+        self.short_name = short_name
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.api_id)
+        String.write_to(out, self.api_hash)
+        String.write_to(out, self.title)
+        String.write_to(out, self.short_name)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AppInfo:
+        api_id = Int.read(stream)
+        api_hash = String.read(stream)
+        title = String.read(stream)
+        short_name = String.read(stream)
+        return cls(api_id=api_id, api_hash=api_hash, title=title, short_name=short_name)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AppInfo, int]:
+        api_id, cursor = Int.read_from(view, cursor)
+        api_hash, cursor = String.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        short_name, cursor = String.read_from(view, cursor)
+        return cls(api_id=api_id, api_hash=api_hash, title=title, short_name=short_name), cursor
+
+
+class AppNotFound(TLObject):
+    __tl_id__ = 0x235e45e5
+    __tl_name__ = "types.internal.AppNotFound"
+    __tl_layer__ = 201
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AppNotFound:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AppNotFound, int]:
+        return cls(), cursor
+
+
+class PublicKey(TLObject):
+    __tl_id__ = 0x1b3bde32
+    __tl_name__ = "types.internal.PublicKey"
+    __tl_layer__ = 201
+
+    __slots__ = ("key", "fingerprint", )
+
+    def __init__(self, *, key: str, fingerprint: int):
+        self.key = key
+        self.fingerprint = fingerprint
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.key)
+        out += Long.write(self.fingerprint)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PublicKey:
+        key = String.read(stream)
+        fingerprint = Long.read(stream)
+        return cls(key=key, fingerprint=fingerprint)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PublicKey, int]:
+        key, cursor = String.read_from(view, cursor)
+        fingerprint, cursor = Long.read_from(view, cursor)
+        return cls(key=key, fingerprint=fingerprint), cursor
+
+
+class AvailableServer(TLObject):
+    __tl_id__ = 0xacc487b7
+    __tl_name__ = "types.internal.AvailableServer"
+    __tl_layer__ = 201
+
+    __slots__ = ("address", "port", "dc_id", "name", "public_keys", )
+
+    def __init__(self, *, address: str, port: int, dc_id: int, name: str, public_keys: list[tl.base.internal.PublicKey]):
+        self.address = address
+        self.port = port
+        self.dc_id = dc_id
+        self.name = name
+        self.public_keys = public_keys
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.address)
+        out += Int.write(self.port)
+        out += Int.write(self.dc_id)
+        String.write_to(out, self.name)
+        TLObjectVector.write_to(out, self.public_keys, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AvailableServer:
+        address = String.read(stream)
+        port = Int.read(stream)
+        dc_id = Int.read(stream)
+        name = String.read(stream)
+        public_keys = TLObjectVector.read(stream)
+        return cls(address=address, port=port, dc_id=dc_id, name=name, public_keys=public_keys)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AvailableServer, int]:
+        address, cursor = String.read_from(view, cursor)
+        port, cursor = Int.read_from(view, cursor)
+        dc_id, cursor = Int.read_from(view, cursor)
+        name, cursor = String.read_from(view, cursor)
+        public_keys, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(address=address, port=port, dc_id=dc_id, name=name, public_keys=public_keys), cursor
+
+
+class AvailableServers(TLObject):
+    __tl_id__ = 0x58d5526f
+    __tl_name__ = "types.internal.AvailableServers"
+    __tl_layer__ = 201
+
+    __slots__ = ("servers", )
+
+    def __init__(self, *, servers: list[tl.base.internal.AvailableServer]):
+        self.servers = servers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.servers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AvailableServers:
+        servers = TLObjectVector.read(stream)
+        return cls(servers=servers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AvailableServers, int]:
+        servers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(servers=servers), cursor
+
+
+class RpcResponse(TLObject):
+    __tl_id__ = 0x22be0328
+    __tl_name__ = "types.internal.RpcResponse"
+    __tl_layer__ = 201
+
+    __slots__ = ("refresh_auth", "transport_error", "obj", )
+
+    def __init__(self, *, refresh_auth: bool = False, transport_error: int | None = None, obj: TLObject = None):
+        self.refresh_auth = refresh_auth
+        self.transport_error = transport_error
+        self.obj = obj
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.refresh_auth: flags1 |= (1 << 2)
+        if self.transport_error is not None: flags1 |= (1 << 0)
+        if self.obj is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.transport_error is not None:
+            out += Int.write(self.transport_error)
+        if self.obj is not None:
+            self.obj.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RpcResponse:
+        flags1 = Int.read(stream)
+        refresh_auth = (flags1 & (1 << 2)) == (1 << 2)
+        transport_error = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        obj = TLObject.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(refresh_auth=refresh_auth, transport_error=transport_error, obj=obj)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RpcResponse, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        refresh_auth = (flags1 & (1 << 2)) == (1 << 2)
+        transport_error, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        obj, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(refresh_auth=refresh_auth, transport_error=transport_error, obj=obj), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        if self.obj:
+            self.obj.check_for_ctx_values(values)
+
+
+class MessageToUsers(TLObject):
+    __tl_id__ = 0x96d8b547
+    __tl_name__ = "types.internal.MessageToUsers"
+    __tl_layer__ = 201
+
+    __slots__ = ("users", "channel_ids", "key_ids", "auth_ids", "ignore_auth_id", "obj", "min_layer", )
+
+    def __init__(self, *, users: list[int] | None = None, channel_ids: list[int] | None = None, key_ids: list[int] | None = None, auth_ids: list[int] | None = None, ignore_auth_id: list[int] | None = None, obj: TLObject = None, min_layer: int | None = None):
+        self.users = users
+        self.channel_ids = channel_ids
+        self.key_ids = key_ids
+        self.auth_ids = auth_ids
+        self.ignore_auth_id = ignore_auth_id
+        self.obj = obj
+        self.min_layer = min_layer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.users: flags1 |= (1 << 0)
+        if self.channel_ids: flags1 |= (1 << 1)
+        if self.key_ids: flags1 |= (1 << 2)
+        if self.auth_ids: flags1 |= (1 << 4)
+        if self.ignore_auth_id: flags1 |= (1 << 5)
+        if self.obj is not None: flags1 |= (1 << 3)
+        if self.min_layer is not None: flags1 |= (1 << 6)
+        out += Int.write(flags1)
+        if self.users:
+            out += LongVector.write(self.users)
+        if self.channel_ids:
+            out += LongVector.write(self.channel_ids)
+        if self.key_ids:
+            out += LongVector.write(self.key_ids)
+        if self.auth_ids:
+            out += LongVector.write(self.auth_ids)
+        if self.ignore_auth_id:
+            out += LongVector.write(self.ignore_auth_id)
+        if self.obj is not None:
+            self.obj.write_to(out, ctx)
+        if self.min_layer is not None:
+            out += Int.write(self.min_layer)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageToUsers:
+        flags1 = Int.read(stream)
+        users = LongVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        channel_ids = LongVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        key_ids = LongVector.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        auth_ids = LongVector.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        ignore_auth_id = LongVector.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        obj = TLObject.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        min_layer = Int.read(stream) if (flags1 & (1 << 6)) == (1 << 6) else None
+        return cls(users=users, channel_ids=channel_ids, key_ids=key_ids, auth_ids=auth_ids, ignore_auth_id=ignore_auth_id, obj=obj, min_layer=min_layer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageToUsers, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        users, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        channel_ids, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        key_ids, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        auth_ids, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        ignore_auth_id, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        obj, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        min_layer, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 6)) == (1 << 6) else (None, cursor)
+        return cls(users=users, channel_ids=channel_ids, key_ids=key_ids, auth_ids=auth_ids, ignore_auth_id=ignore_auth_id, obj=obj, min_layer=min_layer), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        if self.obj:
+            self.obj.check_for_ctx_values(values)
+
+
+class MessageToUsersShort(TLObject):
+    __tl_id__ = 0xe49a2c2a
+    __tl_name__ = "types.internal.MessageToUsersShort"
+    __tl_layer__ = 201
+
+    __slots__ = ("user", "channel_id", "key_id", "auth_id", "ignore_auth_id", "obj", "min_layer", )
+
+    def __init__(self, *, user: int | None = None, channel_id: int | None = None, key_id: int | None = None, auth_id: int | None = None, ignore_auth_id: int | None = None, obj: TLObject = None, min_layer: int | None = None):
+        self.user = user
+        self.channel_id = channel_id
+        self.key_id = key_id
+        self.auth_id = auth_id
+        self.ignore_auth_id = ignore_auth_id
+        self.obj = obj
+        self.min_layer = min_layer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.user is not None: flags1 |= (1 << 0)
+        if self.channel_id is not None: flags1 |= (1 << 1)
+        if self.key_id is not None: flags1 |= (1 << 2)
+        if self.auth_id is not None: flags1 |= (1 << 4)
+        if self.ignore_auth_id is not None: flags1 |= (1 << 5)
+        if self.obj is not None: flags1 |= (1 << 3)
+        if self.min_layer is not None: flags1 |= (1 << 6)
+        out += Int.write(flags1)
+        if self.user is not None:
+            out += Long.write(self.user)
+        if self.channel_id is not None:
+            out += Long.write(self.channel_id)
+        if self.key_id is not None:
+            out += Long.write(self.key_id)
+        if self.auth_id is not None:
+            out += Long.write(self.auth_id)
+        if self.ignore_auth_id is not None:
+            out += Long.write(self.ignore_auth_id)
+        if self.obj is not None:
+            self.obj.write_to(out, ctx)
+        if self.min_layer is not None:
+            out += Int.write(self.min_layer)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageToUsersShort:
+        flags1 = Int.read(stream)
+        user = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        channel_id = Long.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        key_id = Long.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        auth_id = Long.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        ignore_auth_id = Long.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        obj = TLObject.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        min_layer = Int.read(stream) if (flags1 & (1 << 6)) == (1 << 6) else None
+        return cls(user=user, channel_id=channel_id, key_id=key_id, auth_id=auth_id, ignore_auth_id=ignore_auth_id, obj=obj, min_layer=min_layer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageToUsersShort, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        user, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        channel_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        key_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        auth_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        ignore_auth_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        obj, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        min_layer, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 6)) == (1 << 6) else (None, cursor)
+        return cls(user=user, channel_id=channel_id, key_id=key_id, auth_id=auth_id, ignore_auth_id=ignore_auth_id, obj=obj, min_layer=min_layer), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        if self.obj:
+            self.obj.check_for_ctx_values(values)
+
+
+class SetSessionInternalPush(TLObject):
+    __tl_id__ = 0x92aeb648
+    __tl_name__ = "types.internal.SetSessionInternalPush"
+    __tl_layer__ = 201
+
+    __slots__ = ("key_id", "session_id", "user_id", )
+
+    def __init__(self, *, key_id: int, session_id: int, user_id: int):
+        self.key_id = key_id
+        self.session_id = session_id
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.key_id)
+        out += Long.write(self.session_id)
+        out += Long.write(self.user_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SetSessionInternalPush:
+        key_id = Long.read(stream)
+        session_id = Long.read(stream)
+        user_id = Long.read(stream)
+        return cls(key_id=key_id, session_id=session_id, user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SetSessionInternalPush, int]:
+        key_id, cursor = Long.read_from(view, cursor)
+        session_id, cursor = Long.read_from(view, cursor)
+        user_id, cursor = Long.read_from(view, cursor)
+        return cls(key_id=key_id, session_id=session_id, user_id=user_id), cursor
+
+
+class ChannelSubscribe(TLObject):
+    __tl_id__ = 0xae808cf6
+    __tl_name__ = "types.internal.ChannelSubscribe"
+    __tl_layer__ = 201
+
+    __slots__ = ("subscribe", "user_ids", "channel_ids", )
+
+    def __init__(self, *, user_ids: list[int], channel_ids: list[int], subscribe: bool = False):
+        self.subscribe = subscribe
+        self.user_ids = user_ids
+        self.channel_ids = channel_ids
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.subscribe: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += LongVector.write(self.user_ids)
+        out += LongVector.write(self.channel_ids)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelSubscribe:
+        flags1 = Int.read(stream)
+        subscribe = (flags1 & (1 << 0)) == (1 << 0)
+        user_ids = LongVector.read(stream)
+        channel_ids = LongVector.read(stream)
+        return cls(subscribe=subscribe, user_ids=user_ids, channel_ids=channel_ids)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelSubscribe, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        subscribe = (flags1 & (1 << 0)) == (1 << 0)
+        user_ids, cursor = LongVector.read_from(view, cursor)
+        channel_ids, cursor = LongVector.read_from(view, cursor)
+        return cls(subscribe=subscribe, user_ids=user_ids, channel_ids=channel_ids), cursor
+
+
+class InternalPushForUsers(TLObject):
+    __tl_id__ = 0x3064535b
+    __tl_name__ = "types.internal.InternalPushForUsers"
+    __tl_layer__ = 201
+
+    __slots__ = ("users", )
+
+    def __init__(self, *, users: list[int]):
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += LongVector.write(self.users)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InternalPushForUsers:
+        users = LongVector.read(stream)
+        return cls(users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InternalPushForUsers, int]:
+        users, cursor = LongVector.read_from(view, cursor)
+        return cls(users=users), cursor
+
+
+class InternalPushForUsersShort(TLObject):
+    __tl_id__ = 0x744c0523
+    __tl_name__ = "types.internal.InternalPushForUsersShort"
+    __tl_layer__ = 201
+
+    __slots__ = ("user", )
+
+    def __init__(self, *, user: int):
+        self.user = user
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.user)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InternalPushForUsersShort:
+        user = Long.read(stream)
+        return cls(user=user)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InternalPushForUsersShort, int]:
+        user, cursor = Long.read_from(view, cursor)
+        return cls(user=user), cursor
+
+
+class InvalidateCachedResponses(TLObject):
+    __tl_id__ = 0xc1950bed
+    __tl_name__ = "types.internal.InvalidateCachedResponses"
+    __tl_layer__ = 201
+
+    __slots__ = ("user_id", )
+
+    def __init__(self, *, user_id: int | None = None):
+        self.user_id = user_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.user_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.user_id is not None:
+            out += Long.write(self.user_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvalidateCachedResponses:
+        flags1 = Int.read(stream)
+        user_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(user_id=user_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvalidateCachedResponses, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        user_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(user_id=user_id), cursor
+
+
+class InvalidateContextValues(TLObject):
+    __tl_id__ = 0xe829d628
+    __tl_name__ = "types.internal.InvalidateContextValues"
+    __tl_layer__ = 201
+
+    __slots__ = ("participants", "users", "poll_votes", "user_ids", )
+
+    def __init__(self, *, user_ids: list[int], participants: bool = False, users: bool = False, poll_votes: bool = False):
+        self.participants = participants
+        self.users = users
+        self.poll_votes = poll_votes
+        self.user_ids = user_ids
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.participants: flags1 |= (1 << 0)
+        if self.users: flags1 |= (1 << 1)
+        if self.poll_votes: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += LongVector.write(self.user_ids)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvalidateContextValues:
+        flags1 = Int.read(stream)
+        participants = (flags1 & (1 << 0)) == (1 << 0)
+        users = (flags1 & (1 << 1)) == (1 << 1)
+        poll_votes = (flags1 & (1 << 2)) == (1 << 2)
+        user_ids = LongVector.read(stream)
+        return cls(participants=participants, users=users, poll_votes=poll_votes, user_ids=user_ids)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvalidateContextValues, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        participants = (flags1 & (1 << 0)) == (1 << 0)
+        users = (flags1 & (1 << 1)) == (1 << 1)
+        poll_votes = (flags1 & (1 << 2)) == (1 << 2)
+        user_ids, cursor = LongVector.read_from(view, cursor)
+        return cls(participants=participants, users=users, poll_votes=poll_votes, user_ids=user_ids), cursor
+
+
+class MessageToEachUser(TLObject):
+    __tl_id__ = 0xa09bf478
+    __tl_name__ = "types.internal.MessageToEachUser"
+    __tl_layer__ = 201
+
+    __slots__ = ("users", "objs", "ignore_auth_id", )
+
+    def __init__(self, *, users: list[int], objs: list[TLObject], ignore_auth_id: int | None = None):
+        self.users = users
+        self.objs = objs
+        self.ignore_auth_id = ignore_auth_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.ignore_auth_id is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += LongVector.write(self.users)
+        TLObjectVector.write_to(out, self.objs, ctx)
+        if self.ignore_auth_id is not None:
+            out += Long.write(self.ignore_auth_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageToEachUser:
+        flags1 = Int.read(stream)
+        users = LongVector.read(stream)
+        objs = TLObjectVector.read(stream)
+        ignore_auth_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(users=users, objs=objs, ignore_auth_id=ignore_auth_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageToEachUser, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        users, cursor = LongVector.read_from(view, cursor)
+        objs, cursor = TLObjectVector.read_from(view, cursor)
+        ignore_auth_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(users=users, objs=objs, ignore_auth_id=ignore_auth_id), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for objs_item in self.objs:
+            objs_item.check_for_ctx_values(values)
+
+
+class SessionResumed(TLObject):
+    __tl_id__ = 0xe23681d5
+    __tl_name__ = "types.internal.SessionResumed"
+    __tl_layer__ = 201
+
+    __slots__ = ("key_id", "session_id", )
+
+    def __init__(self, *, key_id: int, session_id: int):
+        self.key_id = key_id
+        self.session_id = session_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.key_id)
+        out += Long.write(self.session_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SessionResumed:
+        key_id = Long.read(stream)
+        session_id = Long.read(stream)
+        return cls(key_id=key_id, session_id=session_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SessionResumed, int]:
+        key_id, cursor = Long.read_from(view, cursor)
+        session_id, cursor = Long.read_from(view, cursor)
+        return cls(key_id=key_id, session_id=session_id), cursor
+
+
+class FieldWithLayerRequirement(TLObject):
+    __tl_id__ = 0xd9594f1f
+    __tl_name__ = "types.internal.FieldWithLayerRequirement"
+    __tl_layer__ = 201
+
+    __slots__ = ("field", "min_layer", "max_layer", )
+
+    def __init__(self, *, field: str, min_layer: int, max_layer: int):
+        self.field = field
+        self.min_layer = min_layer
+        self.max_layer = max_layer
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.field)
+        out += Int.write(self.min_layer)
+        out += Int.write(self.max_layer)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FieldWithLayerRequirement:
+        field = String.read(stream)
+        min_layer = Int.read(stream)
+        max_layer = Int.read(stream)
+        return cls(field=field, min_layer=min_layer, max_layer=max_layer)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FieldWithLayerRequirement, int]:
+        field, cursor = String.read_from(view, cursor)
+        min_layer, cursor = Int.read_from(view, cursor)
+        max_layer, cursor = Int.read_from(view, cursor)
+        return cls(field=field, min_layer=min_layer, max_layer=max_layer), cursor
+
+
+class ObjectWithLayerRequirement(TLObject):
+    __tl_id__ = 0x7678a3
+    __tl_name__ = "types.internal.ObjectWithLayerRequirement"
+    __tl_layer__ = 201
+
+    __slots__ = ("object", "fields", )
+
+    def __init__(self, *, object: TLObject, fields: list[tl.base.internal.FieldWithLayerRequirement]):
+        self.object = object
+        self.fields = fields
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.object.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.fields, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ObjectWithLayerRequirement:
+        object = TLObject.read(stream)
+        fields = TLObjectVector.read(stream)
+        return cls(object=object, fields=fields)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ObjectWithLayerRequirement, int]:
+        object, cursor = TLObject.read_from(view, cursor)
+        fields, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(object=object, fields=fields), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.object.check_for_ctx_values(values)
+
+
+class NeedsContextValues(TLObject):
+    __tl_id__ = 0xb3e50ad9
+    __tl_name__ = "types.internal.NeedsContextValues"
+    __tl_layer__ = 201
+
+    __slots__ = ("obj", "poll_answers", "chat_participants", "channel_participants", "users", "channel_messages", "stickersets", )
+
+    def __init__(self, *, obj: TLObject, poll_answers: list[int] | None = None, chat_participants: list[int] | None = None, channel_participants: list[int] | None = None, users: list[int] | None = None, channel_messages: list[int] | None = None, stickersets: list[int] | None = None):
+        self.obj = obj
+        self.poll_answers = poll_answers
+        self.chat_participants = chat_participants
+        self.channel_participants = channel_participants
+        self.users = users
+        self.channel_messages = channel_messages
+        self.stickersets = stickersets
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.poll_answers: flags1 |= (1 << 0)
+        if self.chat_participants: flags1 |= (1 << 1)
+        if self.channel_participants: flags1 |= (1 << 2)
+        if self.users: flags1 |= (1 << 3)
+        if self.channel_messages: flags1 |= (1 << 4)
+        if self.stickersets: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        self.obj.write_to(out, ctx)
+        if self.poll_answers:
+            out += LongVector.write(self.poll_answers)
+        if self.chat_participants:
+            out += LongVector.write(self.chat_participants)
+        if self.channel_participants:
+            out += LongVector.write(self.channel_participants)
+        if self.users:
+            out += LongVector.write(self.users)
+        if self.channel_messages:
+            out += LongVector.write(self.channel_messages)
+        if self.stickersets:
+            out += LongVector.write(self.stickersets)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> NeedsContextValues:
+        flags1 = Int.read(stream)
+        obj = TLObject.read(stream)
+        poll_answers = LongVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        chat_participants = LongVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        channel_participants = LongVector.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        users = LongVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        channel_messages = LongVector.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        stickersets = LongVector.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        return cls(obj=obj, poll_answers=poll_answers, chat_participants=chat_participants, channel_participants=channel_participants, users=users, channel_messages=channel_messages, stickersets=stickersets)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[NeedsContextValues, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        obj, cursor = TLObject.read_from(view, cursor)
+        poll_answers, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        chat_participants, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        channel_participants, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        users, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        channel_messages, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        stickersets, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        return cls(obj=obj, poll_answers=poll_answers, chat_participants=chat_participants, channel_participants=channel_participants, users=users, channel_messages=channel_messages, stickersets=stickersets), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.obj.check_for_ctx_values(values)
+
+
+class SessionMessage(TLObject):
+    __tl_id__ = 0x7c8ae505
+    __tl_name__ = "types.internal.SessionMessage"
+    __tl_layer__ = 201
+
+    __slots__ = ("message_id", "seq_no", "data", )
+
+    def __init__(self, *, message_id: int, seq_no: int, data: bytes):
+        self.message_id = message_id
+        self.seq_no = seq_no
+        self.data = data
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.message_id)
+        out += Int.write(self.seq_no)
+        Bytes.write_to(out, self.data)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SessionMessage:
+        message_id = Long.read(stream)
+        seq_no = Int.read(stream)
+        data = Bytes.read(stream)
+        return cls(message_id=message_id, seq_no=seq_no, data=data)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SessionMessage, int]:
+        message_id, cursor = Long.read_from(view, cursor)
+        seq_no, cursor = Int.read_from(view, cursor)
+        data, cursor = Bytes.read_from(view, cursor)
+        return cls(message_id=message_id, seq_no=seq_no, data=data), cursor
+
+
+class SessionState(TLObject):
+    __tl_id__ = 0x6a6a63c1
+    __tl_name__ = "types.internal.SessionState"
+    __tl_layer__ = 201
+
+    __slots__ = ("min_msg_id", "msg_id_last_time", "msg_id_offset", "out_seq_no", "layer", "messages", )
+
+    def __init__(self, *, min_msg_id: int, msg_id_last_time: int, msg_id_offset: int, out_seq_no: int, layer: int, messages: list[tl.base.internal.SessionMessage]):
+        self.min_msg_id = min_msg_id
+        self.msg_id_last_time = msg_id_last_time
+        self.msg_id_offset = msg_id_offset
+        self.out_seq_no = out_seq_no
+        self.layer = layer
+        self.messages = messages
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.min_msg_id)
+        out += Long.write(self.msg_id_last_time)
+        out += Int.write(self.msg_id_offset)
+        out += Int.write(self.out_seq_no)
+        out += Int.write(self.layer)
+        TLObjectVector.write_to(out, self.messages, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SessionState:
+        min_msg_id = Long.read(stream)
+        msg_id_last_time = Long.read(stream)
+        msg_id_offset = Int.read(stream)
+        out_seq_no = Int.read(stream)
+        layer = Int.read(stream)
+        messages = TLObjectVector.read(stream)
+        return cls(min_msg_id=min_msg_id, msg_id_last_time=msg_id_last_time, msg_id_offset=msg_id_offset, out_seq_no=out_seq_no, layer=layer, messages=messages)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SessionState, int]:
+        min_msg_id, cursor = Long.read_from(view, cursor)
+        msg_id_last_time, cursor = Long.read_from(view, cursor)
+        msg_id_offset, cursor = Int.read_from(view, cursor)
+        out_seq_no, cursor = Int.read_from(view, cursor)
+        layer, cursor = Int.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(min_msg_id=min_msg_id, msg_id_last_time=msg_id_last_time, msg_id_offset=msg_id_offset, out_seq_no=out_seq_no, layer=layer, messages=messages), cursor
+
+
+class FilePartToken(TLObject):
+    __tl_id__ = 0x8022c615
+    __tl_name__ = "types.internal.FilePartToken"
+    __tl_layer__ = 201
+
+    __slots__ = ("physical_id", "storage", "suffix", "offset", "limit", "file_type", "mtime", "expires_at", "signature", )
+
+    def __init__(self, *, physical_id: bytes, storage: str, offset: int, limit: int, file_type: TLObject, mtime: int, expires_at: int, signature: bytes, suffix: str | None = None):
+        self.physical_id = physical_id
+        self.storage = storage
+        self.suffix = suffix
+        self.offset = offset
+        self.limit = limit
+        self.file_type = file_type
+        self.mtime = mtime
+        self.expires_at = expires_at
+        self.signature = signature
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.suffix is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        Bytes.write_to(out, self.physical_id)
+        String.write_to(out, self.storage)
+        if self.suffix is not None:
+            String.write_to(out, self.suffix)
+        out += Long.write(self.offset)
+        out += Int.write(self.limit)
+        self.file_type.write_to(out, ctx)
+        out += Int.write(self.mtime)
+        out += Int.write(self.expires_at)
+        Bytes.write_to(out, self.signature)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FilePartToken:
+        flags1 = Int.read(stream)
+        physical_id = Bytes.read(stream)
+        storage = String.read(stream)
+        suffix = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        offset = Long.read(stream)
+        limit = Int.read(stream)
+        file_type = TLObject.read(stream)
+        mtime = Int.read(stream)
+        expires_at = Int.read(stream)
+        signature = Bytes.read(stream)
+        return cls(physical_id=physical_id, storage=storage, suffix=suffix, offset=offset, limit=limit, file_type=file_type, mtime=mtime, expires_at=expires_at, signature=signature)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FilePartToken, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        physical_id, cursor = Bytes.read_from(view, cursor)
+        storage, cursor = String.read_from(view, cursor)
+        suffix, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        offset, cursor = Long.read_from(view, cursor)
+        limit, cursor = Int.read_from(view, cursor)
+        file_type, cursor = TLObject.read_from(view, cursor)
+        mtime, cursor = Int.read_from(view, cursor)
+        expires_at, cursor = Int.read_from(view, cursor)
+        signature, cursor = Bytes.read_from(view, cursor)
+        return cls(physical_id=physical_id, storage=storage, suffix=suffix, offset=offset, limit=limit, file_type=file_type, mtime=mtime, expires_at=expires_at, signature=signature), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.file_type.check_for_ctx_values(values)
+
+
+class TaggedIntVector(TLObject):
+    __tl_id__ = 0xf12bae38
+    __tl_name__ = "types.internal.TaggedIntVector"
+    __tl_layer__ = 201
+
+    __slots__ = ("vec", )
+
+    def __init__(self, *, vec: list[int]):
+        self.vec = vec
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.vec)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedIntVector:
+        vec = IntVector.read(stream)
+        return cls(vec=vec)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedIntVector, int]:
+        vec, cursor = IntVector.read_from(view, cursor)
+        return cls(vec=vec), cursor
+
+
+class TaggedLongVector(TLObject):
+    __tl_id__ = 0xd3264171
+    __tl_name__ = "types.internal.TaggedLongVector"
+    __tl_layer__ = 201
+
+    __slots__ = ("vec", )
+
+    def __init__(self, *, vec: list[int]):
+        self.vec = vec
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += LongVector.write(self.vec)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedLongVector:
+        vec = LongVector.read(stream)
+        return cls(vec=vec)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedLongVector, int]:
+        vec, cursor = LongVector.read_from(view, cursor)
+        return cls(vec=vec), cursor
+
+
+class TaggedInt128Vector(TLObject):
+    __tl_id__ = 0xab8ac0d8
+    __tl_name__ = "types.internal.TaggedInt128Vector"
+    __tl_layer__ = 201
+
+    __slots__ = ("vec", )
+
+    def __init__(self, *, vec: list[tl.base.Int128]):
+        self.vec = vec
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.vec, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedInt128Vector:
+        vec = TLObjectVector.read(stream)
+        return cls(vec=vec)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedInt128Vector, int]:
+        vec, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(vec=vec), cursor
+
+
+class TaggedInt256Vector(TLObject):
+    __tl_id__ = 0x625ff3a1
+    __tl_name__ = "types.internal.TaggedInt256Vector"
+    __tl_layer__ = 201
+
+    __slots__ = ("vec", )
+
+    def __init__(self, *, vec: list[tl.base.Int256]):
+        self.vec = vec
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.vec, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedInt256Vector:
+        vec = TLObjectVector.read(stream)
+        return cls(vec=vec)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedInt256Vector, int]:
+        vec, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(vec=vec), cursor
+
+
+class TaggedFloatVector(TLObject):
+    __tl_id__ = 0x457a9f22
+    __tl_name__ = "types.internal.TaggedFloatVector"
+    __tl_layer__ = 201
+
+    __slots__ = ("vec", )
+
+    def __init__(self, *, vec: list[float]):
+        self.vec = vec
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += FloatVector.write(self.vec)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedFloatVector:
+        vec = FloatVector.read(stream)
+        return cls(vec=vec)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedFloatVector, int]:
+        vec, cursor = FloatVector.read_from(view, cursor)
+        return cls(vec=vec), cursor
+
+
+class TaggedBoolVector(TLObject):
+    __tl_id__ = 0xcb98721a
+    __tl_name__ = "types.internal.TaggedBoolVector"
+    __tl_layer__ = 201
+
+    __slots__ = ("vec", )
+
+    def __init__(self, *, vec: list[bool]):
+        self.vec = vec
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += BoolVector.write(self.vec)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedBoolVector:
+        vec = BoolVector.read(stream)
+        return cls(vec=vec)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedBoolVector, int]:
+        vec, cursor = BoolVector.read_from(view, cursor)
+        return cls(vec=vec), cursor
+
+
+class TaggedBytesVector(TLObject):
+    __tl_id__ = 0x8d538c0f
+    __tl_name__ = "types.internal.TaggedBytesVector"
+    __tl_layer__ = 201
+
+    __slots__ = ("vec", )
+
+    def __init__(self, *, vec: list[bytes]):
+        self.vec = vec
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += BytesVector.write(self.vec)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedBytesVector:
+        vec = BytesVector.read(stream)
+        return cls(vec=vec)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedBytesVector, int]:
+        vec, cursor = BytesVector.read_from(view, cursor)
+        return cls(vec=vec), cursor
+
+
+class TaggedStringVector(TLObject):
+    __tl_id__ = 0x492bec2d
+    __tl_name__ = "types.internal.TaggedStringVector"
+    __tl_layer__ = 201
+
+    __slots__ = ("vec", )
+
+    def __init__(self, *, vec: list[str]):
+        self.vec = vec
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += StringVector.write(self.vec)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedStringVector:
+        vec = StringVector.read(stream)
+        return cls(vec=vec)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedStringVector, int]:
+        vec, cursor = StringVector.read_from(view, cursor)
+        return cls(vec=vec), cursor
+
+
+class TaggedObjectVector(TLObject):
+    __tl_id__ = 0xb002bb63
+    __tl_name__ = "types.internal.TaggedObjectVector"
+    __tl_layer__ = 201
+
+    __slots__ = ("vec", )
+
+    def __init__(self, *, vec: list[TLObject]):
+        self.vec = vec
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.vec, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedObjectVector:
+        vec = TLObjectVector.read(stream)
+        return cls(vec=vec)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedObjectVector, int]:
+        vec, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(vec=vec), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for vec_item in self.vec:
+            vec_item.check_for_ctx_values(values)
+
+
+class TaggedInt(TLObject):
+    __tl_id__ = 0x202f2b94
+    __tl_name__ = "types.internal.TaggedInt"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: int):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.value)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedInt:
+        value = Int.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedInt, int]:
+        value, cursor = Int.read_from(view, cursor)
+        return cls(value=value), cursor
+
+
+class TaggedLong(TLObject):
+    __tl_id__ = 0x8b45cf0f
+    __tl_name__ = "types.internal.TaggedLong"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: int):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.value)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedLong:
+        value = Long.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedLong, int]:
+        value, cursor = Long.read_from(view, cursor)
+        return cls(value=value), cursor
+
+
+class TaggedInt128(TLObject):
+    __tl_id__ = 0x3698302b
+    __tl_name__ = "types.internal.TaggedInt128"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: tl.base.Int128):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.value.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedInt128:
+        value = TLObject.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedInt128, int]:
+        value, cursor = TLObject.read_from(view, cursor)
+        return cls(value=value), cursor
+
+
+class TaggedInt256(TLObject):
+    __tl_id__ = 0xc5087dfc
+    __tl_name__ = "types.internal.TaggedInt256"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: tl.base.Int256):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.value.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedInt256:
+        value = TLObject.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedInt256, int]:
+        value, cursor = TLObject.read_from(view, cursor)
+        return cls(value=value), cursor
+
+
+class TaggedFloat(TLObject):
+    __tl_id__ = 0xfa738c5
+    __tl_name__ = "types.internal.TaggedFloat"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: float):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Float.write(self.value)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedFloat:
+        value = Float.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedFloat, int]:
+        value, cursor = Float.read_from(view, cursor)
+        return cls(value=value), cursor
+
+
+class TaggedBool(TLObject):
+    __tl_id__ = 0x9eb8a6a1
+    __tl_name__ = "types.internal.TaggedBool"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: bool):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Bool.write(self.value)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedBool:
+        value = Bool.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedBool, int]:
+        value, cursor = Bool.read_from(view, cursor)
+        return cls(value=value), cursor
+
+
+class TaggedBytes(TLObject):
+    __tl_id__ = 0x942948e0
+    __tl_name__ = "types.internal.TaggedBytes"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: bytes):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.value)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedBytes:
+        value = Bytes.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedBytes, int]:
+        value, cursor = Bytes.read_from(view, cursor)
+        return cls(value=value), cursor
+
+
+class TaggedString(TLObject):
+    __tl_id__ = 0x678b99df
+    __tl_name__ = "types.internal.TaggedString"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: str):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.value)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedString:
+        value = String.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedString, int]:
+        value, cursor = String.read_from(view, cursor)
+        return cls(value=value), cursor
+
+
+class TaggedObject(TLObject):
+    __tl_id__ = 0xfd2458a4
+    __tl_name__ = "types.internal.TaggedObject"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: TLObject):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.value.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedObject:
+        value = TLObject.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedObject, int]:
+        value, cursor = TLObject.read_from(view, cursor)
+        return cls(value=value), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.value.check_for_ctx_values(values)
+
+
+class TaggedVector(TLObject):
+    __tl_id__ = 0x8ba60692
+    __tl_name__ = "types.internal.TaggedVector"
+    __tl_layer__ = 201
+
+    __slots__ = ("value", )
+
+    def __init__(self, *, value: tl.base.internal.TaggedVector):
+        self.value = value
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.value.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TaggedVector:
+        value = TLObject.read(stream)
+        return cls(value=value)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TaggedVector, int]:
+        value, cursor = TLObject.read_from(view, cursor)
+        return cls(value=value), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.value.check_for_ctx_values(values)
+
+
+class MessageToFormatContent(TLObject):
+    __tl_id__ = 0x4e487850
+    __tl_name__ = "types.internal.MessageToFormatContent"
+    __tl_layer__ = 201
+
+    __slots__ = ("silent", "post", "edit_hide", "noforwards", "invert_media", "from_id", "via_bot_id", "date", "message", "media", "reply_markup", "entities", "views", "forwards", "edit_date", "post_author", "grouped_id", "ttl_period", "fwd_from", )
+
+    def __init__(self, *, date: int, message: str, silent: bool = False, post: bool = False, edit_hide: bool = False, noforwards: bool = False, invert_media: bool = False, from_id: tl.base.Peer | None = None, via_bot_id: int | None = None, media: tl.base.MessageMedia | None = None, reply_markup: tl.base.ReplyMarkup | None = None, entities: list[tl.base.MessageEntity] | None = None, views: int | None = None, forwards: int | None = None, edit_date: int | None = None, post_author: str | None = None, grouped_id: int | None = None, ttl_period: int | None = None, fwd_from: tl.base.MessageFwdHeader | None = None):
+        self.silent = silent
+        self.post = post
+        self.edit_hide = edit_hide
+        self.noforwards = noforwards
+        self.invert_media = invert_media
+        self.from_id = from_id
+        self.via_bot_id = via_bot_id
+        self.date = date
+        self.message = message
+        self.media = media
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.views = views
+        self.forwards = forwards
+        self.edit_date = edit_date
+        self.post_author = post_author
+        self.grouped_id = grouped_id
+        self.ttl_period = ttl_period
+        self.fwd_from = fwd_from
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.views is None, self.forwards is None)
+        _flags_fields_not_empty = (self.views is not None, self.forwards is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: views, forwards")
+        flags1 = 0
+        if self.silent: flags1 |= (1 << 0)
+        if self.post: flags1 |= (1 << 1)
+        if self.edit_hide: flags1 |= (1 << 2)
+        if self.noforwards: flags1 |= (1 << 3)
+        if self.invert_media: flags1 |= (1 << 4)
+        if self.from_id is not None: flags1 |= (1 << 5)
+        if self.via_bot_id is not None: flags1 |= (1 << 6)
+        if self.media is not None: flags1 |= (1 << 7)
+        if self.reply_markup is not None: flags1 |= (1 << 8)
+        if self.entities: flags1 |= (1 << 9)
+        if self.views is not None: flags1 |= (1 << 10)
+        if self.forwards is not None: flags1 |= (1 << 10)
+        if self.edit_date is not None: flags1 |= (1 << 12)
+        if self.post_author is not None: flags1 |= (1 << 13)
+        if self.grouped_id is not None: flags1 |= (1 << 14)
+        if self.ttl_period is not None: flags1 |= (1 << 16)
+        if self.fwd_from is not None: flags1 |= (1 << 17)
+        out += Int.write(flags1)
+        if self.from_id is not None:
+            self.from_id.write_to(out, ctx)
+        if self.via_bot_id is not None:
+            out += Long.write(self.via_bot_id)
+        out += Int.write(self.date)
+        String.write_to(out, self.message)
+        if self.media is not None:
+            self.media.write_to(out, ctx)
+        if self.reply_markup is not None:
+            self.reply_markup.write_to(out, ctx)
+        if self.entities:
+            TLObjectVector.write_to(out, self.entities, ctx)
+        if self.views is not None:
+            out += Int.write(self.views)
+        if self.forwards is not None:
+            out += Int.write(self.forwards)
+        if self.edit_date is not None:
+            out += Int.write(self.edit_date)
+        if self.post_author is not None:
+            String.write_to(out, self.post_author)
+        if self.grouped_id is not None:
+            out += Long.write(self.grouped_id)
+        if self.ttl_period is not None:
+            out += Int.write(self.ttl_period)
+        if self.fwd_from is not None:
+            self.fwd_from.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageToFormatContent:
+        flags1 = Int.read(stream)
+        silent = (flags1 & (1 << 0)) == (1 << 0)
+        post = (flags1 & (1 << 1)) == (1 << 1)
+        edit_hide = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 3)) == (1 << 3)
+        invert_media = (flags1 & (1 << 4)) == (1 << 4)
+        from_id = TLObject.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        via_bot_id = Long.read(stream) if (flags1 & (1 << 6)) == (1 << 6) else None
+        date = Int.read(stream)
+        message = String.read(stream)
+        media = TLObject.read(stream) if (flags1 & (1 << 7)) == (1 << 7) else None
+        reply_markup = TLObject.read(stream) if (flags1 & (1 << 8)) == (1 << 8) else None
+        entities = TLObjectVector.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        views = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        forwards = Int.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        edit_date = Int.read(stream) if (flags1 & (1 << 12)) == (1 << 12) else None
+        post_author = String.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        grouped_id = Long.read(stream) if (flags1 & (1 << 14)) == (1 << 14) else None
+        ttl_period = Int.read(stream) if (flags1 & (1 << 16)) == (1 << 16) else None
+        fwd_from = TLObject.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        return cls(silent=silent, post=post, edit_hide=edit_hide, noforwards=noforwards, invert_media=invert_media, from_id=from_id, via_bot_id=via_bot_id, date=date, message=message, media=media, reply_markup=reply_markup, entities=entities, views=views, forwards=forwards, edit_date=edit_date, post_author=post_author, grouped_id=grouped_id, ttl_period=ttl_period, fwd_from=fwd_from)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageToFormatContent, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        silent = (flags1 & (1 << 0)) == (1 << 0)
+        post = (flags1 & (1 << 1)) == (1 << 1)
+        edit_hide = (flags1 & (1 << 2)) == (1 << 2)
+        noforwards = (flags1 & (1 << 3)) == (1 << 3)
+        invert_media = (flags1 & (1 << 4)) == (1 << 4)
+        from_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        via_bot_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 6)) == (1 << 6) else (None, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        message, cursor = String.read_from(view, cursor)
+        media, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 7)) == (1 << 7) else (None, cursor)
+        reply_markup, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 8)) == (1 << 8) else (None, cursor)
+        entities, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        views, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        forwards, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        edit_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 12)) == (1 << 12) else (None, cursor)
+        post_author, cursor = String.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        grouped_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 14)) == (1 << 14) else (None, cursor)
+        ttl_period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 16)) == (1 << 16) else (None, cursor)
+        fwd_from, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        return cls(silent=silent, post=post, edit_hide=edit_hide, noforwards=noforwards, invert_media=invert_media, from_id=from_id, via_bot_id=via_bot_id, date=date, message=message, media=media, reply_markup=reply_markup, entities=entities, views=views, forwards=forwards, edit_date=edit_date, post_author=post_author, grouped_id=grouped_id, ttl_period=ttl_period, fwd_from=fwd_from), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        if self.media:
+            self.media.check_for_ctx_values(values)
+
+
+class MessageToFormatServiceContent(TLObject):
+    __tl_id__ = 0x76fbc4e5
+    __tl_name__ = "types.internal.MessageToFormatServiceContent"
+    __tl_layer__ = 201
+
+    __slots__ = ("from_id", "date", "action", "ttl_period", )
+
+    def __init__(self, *, date: int, action: tl.base.MessageAction, from_id: tl.base.Peer | None = None, ttl_period: int | None = None):
+        self.from_id = from_id
+        self.date = date
+        self.action = action
+        self.ttl_period = ttl_period
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_id is not None: flags1 |= (1 << 0)
+        if self.ttl_period is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.from_id is not None:
+            self.from_id.write_to(out, ctx)
+        out += Int.write(self.date)
+        self.action.write_to(out, ctx)
+        if self.ttl_period is not None:
+            out += Int.write(self.ttl_period)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageToFormatServiceContent:
+        flags1 = Int.read(stream)
+        from_id = TLObject.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        date = Int.read(stream)
+        action = TLObject.read(stream)
+        ttl_period = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(from_id=from_id, date=date, action=action, ttl_period=ttl_period)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageToFormatServiceContent, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        from_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        action, cursor = TLObject.read_from(view, cursor)
+        ttl_period, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(from_id=from_id, date=date, action=action, ttl_period=ttl_period), cursor
+
+
+class MessageToFormatRef(TLObject):
+    __tl_id__ = 0x66b94b3
+    __tl_name__ = "types.internal.MessageToFormatRef"
+    __tl_layer__ = 201
+
+    __slots__ = ("out", "mentioned", "media_unread", "from_scheduled", "pinned", "id", "peer_id", "saved_peer_id", "reply_to", )
+
+    def __init__(self, *, id: int, peer_id: tl.base.Peer, out: bool = False, mentioned: bool = False, media_unread: bool = False, from_scheduled: bool = False, pinned: bool = False, saved_peer_id: tl.base.Peer | None = None, reply_to: tl.base.MessageReplyHeader | None = None):
+        self.out = out
+        self.mentioned = mentioned
+        self.media_unread = media_unread
+        self.from_scheduled = from_scheduled
+        self.pinned = pinned
+        self.id = id
+        self.peer_id = peer_id
+        self.saved_peer_id = saved_peer_id
+        self.reply_to = reply_to
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.out: flags1 |= (1 << 0)
+        if self.mentioned: flags1 |= (1 << 1)
+        if self.media_unread: flags1 |= (1 << 2)
+        if self.from_scheduled: flags1 |= (1 << 3)
+        if self.pinned: flags1 |= (1 << 4)
+        if self.saved_peer_id is not None: flags1 |= (1 << 5)
+        if self.reply_to is not None: flags1 |= (1 << 7)
+        out += Int.write(flags1)
+        out += Int.write(self.id)
+        self.peer_id.write_to(out, ctx)
+        if self.saved_peer_id is not None:
+            self.saved_peer_id.write_to(out, ctx)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageToFormatRef:
+        flags1 = Int.read(stream)
+        out = (flags1 & (1 << 0)) == (1 << 0)
+        mentioned = (flags1 & (1 << 1)) == (1 << 1)
+        media_unread = (flags1 & (1 << 2)) == (1 << 2)
+        from_scheduled = (flags1 & (1 << 3)) == (1 << 3)
+        pinned = (flags1 & (1 << 4)) == (1 << 4)
+        id = Int.read(stream)
+        peer_id = TLObject.read(stream)
+        saved_peer_id = TLObject.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 7)) == (1 << 7) else None
+        return cls(out=out, mentioned=mentioned, media_unread=media_unread, from_scheduled=from_scheduled, pinned=pinned, id=id, peer_id=peer_id, saved_peer_id=saved_peer_id, reply_to=reply_to)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageToFormatRef, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        out = (flags1 & (1 << 0)) == (1 << 0)
+        mentioned = (flags1 & (1 << 1)) == (1 << 1)
+        media_unread = (flags1 & (1 << 2)) == (1 << 2)
+        from_scheduled = (flags1 & (1 << 3)) == (1 << 3)
+        pinned = (flags1 & (1 << 4)) == (1 << 4)
+        id, cursor = Int.read_from(view, cursor)
+        peer_id, cursor = TLObject.read_from(view, cursor)
+        saved_peer_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 7)) == (1 << 7) else (None, cursor)
+        return cls(out=out, mentioned=mentioned, media_unread=media_unread, from_scheduled=from_scheduled, pinned=pinned, id=id, peer_id=peer_id, saved_peer_id=saved_peer_id, reply_to=reply_to), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        if self.reply_to:
+            self.reply_to.check_for_ctx_values(values)
+
+
+class ChannelMessageToFormatCommon(TLObject):
+    __tl_id__ = 0xb2d2c02
+    __tl_name__ = "types.internal.ChannelMessageToFormatCommon"
+    __tl_layer__ = 201
+
+    __slots__ = ("author_id", "id", "channel_id", "from_scheduled", "pinned", "reply_to", )
+
+    def __init__(self, *, author_id: int, id: int, channel_id: int, from_scheduled: bool = False, pinned: bool = False, reply_to: tl.base.MessageReplyHeader | None = None):
+        self.author_id = author_id
+        self.id = id
+        self.channel_id = channel_id
+        self.from_scheduled = from_scheduled
+        self.pinned = pinned
+        self.reply_to = reply_to
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.from_scheduled: flags1 |= (1 << 0)
+        if self.pinned: flags1 |= (1 << 1)
+        if self.reply_to is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Long.write(self.author_id)
+        out += Int.write(self.id)
+        out += Long.write(self.channel_id)
+        if self.reply_to is not None:
+            self.reply_to.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelMessageToFormatCommon:
+        flags1 = Int.read(stream)
+        author_id = Long.read(stream)
+        id = Int.read(stream)
+        channel_id = Long.read(stream)
+        from_scheduled = (flags1 & (1 << 0)) == (1 << 0)
+        pinned = (flags1 & (1 << 1)) == (1 << 1)
+        reply_to = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(author_id=author_id, id=id, channel_id=channel_id, from_scheduled=from_scheduled, pinned=pinned, reply_to=reply_to)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelMessageToFormatCommon, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        author_id, cursor = Long.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        channel_id, cursor = Long.read_from(view, cursor)
+        from_scheduled = (flags1 & (1 << 0)) == (1 << 0)
+        pinned = (flags1 & (1 << 1)) == (1 << 1)
+        reply_to, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(author_id=author_id, id=id, channel_id=channel_id, from_scheduled=from_scheduled, pinned=pinned, reply_to=reply_to), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        if self.reply_to:
+            self.reply_to.check_for_ctx_values(values)
+
+
+class StickerSetToFormatCommon(TLObject):
+    __tl_id__ = 0x1445ac69
+    __tl_name__ = "types.internal.StickerSetToFormatCommon"
+    __tl_layer__ = 201
+
+    __slots__ = ("id", "access_hash", "title", "short_name", "official", "creator_id", "count", "hash", "masks", "emoji", "thumbs", "thumb_version", )
+
+    def __init__(self, *, id: int, access_hash: int, title: str, creator_id: int, count: int, hash: int, short_name: str | None = None, official: bool = False, masks: bool = False, emoji: bool = False, thumbs: list[tl.base.PhotoSize] | None = None, thumb_version: int | None = None):
+        self.id = id
+        self.access_hash = access_hash
+        self.title = title
+        self.short_name = short_name
+        self.official = official
+        self.creator_id = creator_id
+        self.count = count
+        self.hash = hash
+        self.masks = masks
+        self.emoji = emoji
+        self.thumbs = thumbs
+        self.thumb_version = thumb_version
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.thumbs is None, self.thumb_version is None)
+        _flags_fields_not_empty = (self.thumbs is not None, self.thumb_version is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: thumbs, thumb_version")
+        flags1 = 0
+        if self.short_name is not None: flags1 |= (1 << 0)
+        if self.official: flags1 |= (1 << 1)
+        if self.masks: flags1 |= (1 << 2)
+        if self.emoji: flags1 |= (1 << 3)
+        if self.thumbs: flags1 |= (1 << 4)
+        if self.thumb_version is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        out += Int.write(self.id)
+        out += Long.write(self.access_hash)
+        String.write_to(out, self.title)
+        if self.short_name is not None:
+            String.write_to(out, self.short_name)
+        out += Long.write(self.creator_id)
+        out += Int.write(self.count)
+        out += Int.write(self.hash)
+        if self.thumbs is not None:
+            TLObjectVector.write_to(out, self.thumbs, ctx)
+        if self.thumb_version is not None:
+            out += Int.write(self.thumb_version)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickerSetToFormatCommon:
+        flags1 = Int.read(stream)
+        id = Int.read(stream)
+        access_hash = Long.read(stream)
+        title = String.read(stream)
+        short_name = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        official = (flags1 & (1 << 1)) == (1 << 1)
+        creator_id = Long.read(stream)
+        count = Int.read(stream)
+        hash = Int.read(stream)
+        masks = (flags1 & (1 << 2)) == (1 << 2)
+        emoji = (flags1 & (1 << 3)) == (1 << 3)
+        thumbs = TLObjectVector.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        thumb_version = Int.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(id=id, access_hash=access_hash, title=title, short_name=short_name, official=official, creator_id=creator_id, count=count, hash=hash, masks=masks, emoji=emoji, thumbs=thumbs, thumb_version=thumb_version)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickerSetToFormatCommon, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        id, cursor = Int.read_from(view, cursor)
+        access_hash, cursor = Long.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        short_name, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        official = (flags1 & (1 << 1)) == (1 << 1)
+        creator_id, cursor = Long.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        hash, cursor = Int.read_from(view, cursor)
+        masks = (flags1 & (1 << 2)) == (1 << 2)
+        emoji = (flags1 & (1 << 3)) == (1 << 3)
+        thumbs, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        thumb_version, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(id=id, access_hash=access_hash, title=title, short_name=short_name, official=official, creator_id=creator_id, count=count, hash=hash, masks=masks, emoji=emoji, thumbs=thumbs, thumb_version=thumb_version), cursor
+
+
+class StickerSetToFormatForUser(TLObject):
+    __tl_id__ = 0xb27013c6
+    __tl_name__ = "types.internal.StickerSetToFormatForUser"
+    __tl_layer__ = 201
+
+    __slots__ = ("installed_date", "archived", )
+
+    def __init__(self, *, installed_date: int | None = None, archived: bool = False):
+        self.installed_date = installed_date
+        self.archived = archived
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.installed_date is not None: flags1 |= (1 << 0)
+        if self.archived: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.installed_date is not None:
+            out += Int.write(self.installed_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickerSetToFormatForUser:
+        flags1 = Int.read(stream)
+        installed_date = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        archived = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(installed_date=installed_date, archived=archived)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickerSetToFormatForUser, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        installed_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        archived = (flags1 & (1 << 1)) == (1 << 1)
+        return cls(installed_date=installed_date, archived=archived), cursor
@@ -0,0 +1,267 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class AccessHashPayloadUser(TLObject):
+    __tl_id__ = 0x916e7528
+    __tl_name__ = "types.internal_access.AccessHashPayloadUser"
+    __tl_layer__ = 201
+
+    __slots__ = ("this_user_id", "user_id", "auth_id", )
+
+    def __init__(self, *, this_user_id: int, user_id: int, auth_id: int):
+        self.this_user_id = this_user_id
+        self.user_id = user_id
+        self.auth_id = auth_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.this_user_id)
+        out += Long.write(self.user_id)
+        out += Long.write(self.auth_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AccessHashPayloadUser:
+        this_user_id = Long.read(stream)
+        user_id = Long.read(stream)
+        auth_id = Long.read(stream)
+        return cls(this_user_id=this_user_id, user_id=user_id, auth_id=auth_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AccessHashPayloadUser, int]:
+        this_user_id, cursor = Long.read_from(view, cursor)
+        user_id, cursor = Long.read_from(view, cursor)
+        auth_id, cursor = Long.read_from(view, cursor)
+        return cls(this_user_id=this_user_id, user_id=user_id, auth_id=auth_id), cursor
+
+
+class AccessHashPayloadChannel(TLObject):
+    __tl_id__ = 0x8195bf26
+    __tl_name__ = "types.internal_access.AccessHashPayloadChannel"
+    __tl_layer__ = 201
+
+    __slots__ = ("this_user_id", "channel_id", "auth_id", )
+
+    def __init__(self, *, this_user_id: int, channel_id: int, auth_id: int):
+        self.this_user_id = this_user_id
+        self.channel_id = channel_id
+        self.auth_id = auth_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.this_user_id)
+        out += Long.write(self.channel_id)
+        out += Long.write(self.auth_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AccessHashPayloadChannel:
+        this_user_id = Long.read(stream)
+        channel_id = Long.read(stream)
+        auth_id = Long.read(stream)
+        return cls(this_user_id=this_user_id, channel_id=channel_id, auth_id=auth_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AccessHashPayloadChannel, int]:
+        this_user_id, cursor = Long.read_from(view, cursor)
+        channel_id, cursor = Long.read_from(view, cursor)
+        auth_id, cursor = Long.read_from(view, cursor)
+        return cls(this_user_id=this_user_id, channel_id=channel_id, auth_id=auth_id), cursor
+
+
+class AccessHashPayloadFile(TLObject):
+    __tl_id__ = 0x4c9a07fe
+    __tl_name__ = "types.internal_access.AccessHashPayloadFile"
+    __tl_layer__ = 201
+
+    __slots__ = ("this_user_id", "file_id", "auth_id", )
+
+    def __init__(self, *, this_user_id: int, file_id: int, auth_id: int):
+        self.this_user_id = this_user_id
+        self.file_id = file_id
+        self.auth_id = auth_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.this_user_id)
+        out += Long.write(self.file_id)
+        out += Long.write(self.auth_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AccessHashPayloadFile:
+        this_user_id = Long.read(stream)
+        file_id = Long.read(stream)
+        auth_id = Long.read(stream)
+        return cls(this_user_id=this_user_id, file_id=file_id, auth_id=auth_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AccessHashPayloadFile, int]:
+        this_user_id, cursor = Long.read_from(view, cursor)
+        file_id, cursor = Long.read_from(view, cursor)
+        auth_id, cursor = Long.read_from(view, cursor)
+        return cls(this_user_id=this_user_id, file_id=file_id, auth_id=auth_id), cursor
+
+
+class AccessHashPayloadEncryptedChat(TLObject):
+    __tl_id__ = 0xa773e2af
+    __tl_name__ = "types.internal_access.AccessHashPayloadEncryptedChat"
+    __tl_layer__ = 201
+
+    __slots__ = ("this_user_id", "chat_id", "auth_id", )
+
+    def __init__(self, *, this_user_id: int, chat_id: int, auth_id: int):
+        self.this_user_id = this_user_id
+        self.chat_id = chat_id
+        self.auth_id = auth_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.this_user_id)
+        out += Long.write(self.chat_id)
+        out += Long.write(self.auth_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AccessHashPayloadEncryptedChat:
+        this_user_id = Long.read(stream)
+        chat_id = Long.read(stream)
+        auth_id = Long.read(stream)
+        return cls(this_user_id=this_user_id, chat_id=chat_id, auth_id=auth_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AccessHashPayloadEncryptedChat, int]:
+        this_user_id, cursor = Long.read_from(view, cursor)
+        chat_id, cursor = Long.read_from(view, cursor)
+        auth_id, cursor = Long.read_from(view, cursor)
+        return cls(this_user_id=this_user_id, chat_id=chat_id, auth_id=auth_id), cursor
+
+
+class AccessHashPayloadStickerset(TLObject):
+    __tl_id__ = 0x8009da5b
+    __tl_name__ = "types.internal_access.AccessHashPayloadStickerset"
+    __tl_layer__ = 201
+
+    __slots__ = ("this_user_id", "set_id", "auth_id", )
+
+    def __init__(self, *, this_user_id: int, set_id: int, auth_id: int):
+        self.this_user_id = this_user_id
+        self.set_id = set_id
+        self.auth_id = auth_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.this_user_id)
+        out += Long.write(self.set_id)
+        out += Long.write(self.auth_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AccessHashPayloadStickerset:
+        this_user_id = Long.read(stream)
+        set_id = Long.read(stream)
+        auth_id = Long.read(stream)
+        return cls(this_user_id=this_user_id, set_id=set_id, auth_id=auth_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AccessHashPayloadStickerset, int]:
+        this_user_id, cursor = Long.read_from(view, cursor)
+        set_id, cursor = Long.read_from(view, cursor)
+        auth_id, cursor = Long.read_from(view, cursor)
+        return cls(this_user_id=this_user_id, set_id=set_id, auth_id=auth_id), cursor
+
+
+class AccessHashPayloadWallpaper(TLObject):
+    __tl_id__ = 0xcb83392e
+    __tl_name__ = "types.internal_access.AccessHashPayloadWallpaper"
+    __tl_layer__ = 201
+
+    __slots__ = ("this_user_id", "wallpaper_id", "auth_id", )
+
+    def __init__(self, *, this_user_id: int, wallpaper_id: int, auth_id: int):
+        self.this_user_id = this_user_id
+        self.wallpaper_id = wallpaper_id
+        self.auth_id = auth_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.this_user_id)
+        out += Long.write(self.wallpaper_id)
+        out += Long.write(self.auth_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AccessHashPayloadWallpaper:
+        this_user_id = Long.read(stream)
+        wallpaper_id = Long.read(stream)
+        auth_id = Long.read(stream)
+        return cls(this_user_id=this_user_id, wallpaper_id=wallpaper_id, auth_id=auth_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AccessHashPayloadWallpaper, int]:
+        this_user_id, cursor = Long.read_from(view, cursor)
+        wallpaper_id, cursor = Long.read_from(view, cursor)
+        auth_id, cursor = Long.read_from(view, cursor)
+        return cls(this_user_id=this_user_id, wallpaper_id=wallpaper_id, auth_id=auth_id), cursor
+
+
+class AccessHashPayloadTheme(TLObject):
+    __tl_id__ = 0x1c9a2a19
+    __tl_name__ = "types.internal_access.AccessHashPayloadTheme"
+    __tl_layer__ = 201
+
+    __slots__ = ("this_user_id", "theme_id", "auth_id", )
+
+    def __init__(self, *, this_user_id: int, theme_id: int, auth_id: int):
+        self.this_user_id = this_user_id
+        self.theme_id = theme_id
+        self.auth_id = auth_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.this_user_id)
+        out += Long.write(self.theme_id)
+        out += Long.write(self.auth_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AccessHashPayloadTheme:
+        this_user_id = Long.read(stream)
+        theme_id = Long.read(stream)
+        auth_id = Long.read(stream)
+        return cls(this_user_id=this_user_id, theme_id=theme_id, auth_id=auth_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AccessHashPayloadTheme, int]:
+        this_user_id, cursor = Long.read_from(view, cursor)
+        theme_id, cursor = Long.read_from(view, cursor)
+        auth_id, cursor = Long.read_from(view, cursor)
+        return cls(this_user_id=this_user_id, theme_id=theme_id, auth_id=auth_id), cursor
+
+
+class FileReferencePayload(TLObject):
+    __tl_id__ = 0xaf4f0049
+    __tl_name__ = "types.internal_access.FileReferencePayload"
+    __tl_layer__ = 201
+
+    __slots__ = ("file_id", "created_at", )
+
+    def __init__(self, *, file_id: int, created_at: int):
+        self.file_id = file_id
+        self.created_at = created_at
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.file_id)
+        out += Int.write(self.created_at)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FileReferencePayload:
+        file_id = Long.read(stream)
+        created_at = Int.read(stream)
+        return cls(file_id=file_id, created_at=created_at)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FileReferencePayload, int]:
+        file_id, cursor = Long.read_from(view, cursor)
+        created_at, cursor = Int.read_from(view, cursor)
+        return cls(file_id=file_id, created_at=created_at), cursor
@@ -0,0 +1,709 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class NestedObject(TLObject):
+    __tl_id__ = 0xd5525aa8
+    __tl_name__ = "types.internal_benchmarking.NestedObject"
+    __tl_layer__ = 201
+
+    __slots__ = ("some_int", "some_long", )
+
+    def __init__(self, *, some_int: int, some_long: int):
+        self.some_int = some_int
+        self.some_long = some_long
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.some_int)
+        out += Long.write(self.some_long)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> NestedObject:
+        some_int = Int.read(stream)
+        some_long = Long.read(stream)
+        return cls(some_int=some_int, some_long=some_long)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[NestedObject, int]:
+        some_int, cursor = Int.read_from(view, cursor)
+        some_long, cursor = Long.read_from(view, cursor)
+        return cls(some_int=some_int, some_long=some_long), cursor
+
+
+class DeeplyNestedObjectX8(TLObject):
+    __tl_id__ = 0x88ab7760
+    __tl_name__ = "types.internal_benchmarking.DeeplyNestedObjectX8"
+    __tl_layer__ = 201
+
+    __slots__ = ("some_int256", "nested_obj", )
+
+    def __init__(self, *, some_int256: int, nested_obj: tl.types.internal_benchmarking.NestedObject):
+        self.some_int256 = some_int256
+        self.nested_obj = nested_obj
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int256.write(self.some_int256)
+        self.nested_obj.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeeplyNestedObjectX8:
+        some_int256 = Int256.read(stream)
+        nested_obj = tl.types.internal_benchmarking.NestedObject.read(stream)
+        return cls(some_int256=some_int256, nested_obj=nested_obj)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeeplyNestedObjectX8, int]:
+        some_int256, cursor = Int256.read_from(view, cursor)
+        nested_obj, cursor = tl.types.internal_benchmarking.NestedObject.read_from(view, cursor)
+        return cls(some_int256=some_int256, nested_obj=nested_obj), cursor
+
+
+class DeeplyNestedObjectX7(TLObject):
+    __tl_id__ = 0xf5a1d88a
+    __tl_name__ = "types.internal_benchmarking.DeeplyNestedObjectX7"
+    __tl_layer__ = 201
+
+    __slots__ = ("some_int128", "inner_object", )
+
+    def __init__(self, *, some_int128: int, inner_object: tl.base.internal_benchmarking.DeeplyNestedObject):
+        self.some_int128 = some_int128
+        self.inner_object = inner_object
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int128.write(self.some_int128)
+        self.inner_object.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeeplyNestedObjectX7:
+        some_int128 = Int128.read(stream)
+        inner_object = TLObject.read(stream)
+        return cls(some_int128=some_int128, inner_object=inner_object)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeeplyNestedObjectX7, int]:
+        some_int128, cursor = Int128.read_from(view, cursor)
+        inner_object, cursor = TLObject.read_from(view, cursor)
+        return cls(some_int128=some_int128, inner_object=inner_object), cursor
+
+
+class DeeplyNestedObjectX6(TLObject):
+    __tl_id__ = 0x17b5ec16
+    __tl_name__ = "types.internal_benchmarking.DeeplyNestedObjectX6"
+    __tl_layer__ = 201
+
+    __slots__ = ("opt_long", "inner_object", )
+
+    def __init__(self, *, inner_object: tl.base.internal_benchmarking.DeeplyNestedObject, opt_long: int | None = None):
+        self.opt_long = opt_long
+        self.inner_object = inner_object
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.opt_long is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.opt_long is not None:
+            out += Long.write(self.opt_long)
+        self.inner_object.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeeplyNestedObjectX6:
+        flags1 = Int.read(stream)
+        opt_long = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        inner_object = TLObject.read(stream)
+        return cls(opt_long=opt_long, inner_object=inner_object)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeeplyNestedObjectX6, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        opt_long, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        inner_object, cursor = TLObject.read_from(view, cursor)
+        return cls(opt_long=opt_long, inner_object=inner_object), cursor
+
+
+class DeeplyNestedObjectX5(TLObject):
+    __tl_id__ = 0x524e6a6a
+    __tl_name__ = "types.internal_benchmarking.DeeplyNestedObjectX5"
+    __tl_layer__ = 201
+
+    __slots__ = ("some_double", "inner_object", )
+
+    def __init__(self, *, some_double: float, inner_object: tl.base.internal_benchmarking.DeeplyNestedObject):
+        self.some_double = some_double
+        self.inner_object = inner_object
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Float.write(self.some_double)
+        self.inner_object.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeeplyNestedObjectX5:
+        some_double = Float.read(stream)
+        inner_object = TLObject.read(stream)
+        return cls(some_double=some_double, inner_object=inner_object)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeeplyNestedObjectX5, int]:
+        some_double, cursor = Float.read_from(view, cursor)
+        inner_object, cursor = TLObject.read_from(view, cursor)
+        return cls(some_double=some_double, inner_object=inner_object), cursor
+
+
+class DeeplyNestedObjectX4(TLObject):
+    __tl_id__ = 0xc9bfbfd0
+    __tl_name__ = "types.internal_benchmarking.DeeplyNestedObjectX4"
+    __tl_layer__ = 201
+
+    __slots__ = ("some_bool", "inner_object", )
+
+    def __init__(self, *, some_bool: bool, inner_object: tl.base.internal_benchmarking.DeeplyNestedObject):
+        self.some_bool = some_bool
+        self.inner_object = inner_object
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Bool.write(self.some_bool)
+        self.inner_object.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeeplyNestedObjectX4:
+        some_bool = Bool.read(stream)
+        inner_object = TLObject.read(stream)
+        return cls(some_bool=some_bool, inner_object=inner_object)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeeplyNestedObjectX4, int]:
+        some_bool, cursor = Bool.read_from(view, cursor)
+        inner_object, cursor = TLObject.read_from(view, cursor)
+        return cls(some_bool=some_bool, inner_object=inner_object), cursor
+
+
+class DeeplyNestedObjectX3(TLObject):
+    __tl_id__ = 0x11bdcd0b
+    __tl_name__ = "types.internal_benchmarking.DeeplyNestedObjectX3"
+    __tl_layer__ = 201
+
+    __slots__ = ("some_bytes", "inner_object", )
+
+    def __init__(self, *, some_bytes: bytes, inner_object: tl.base.internal_benchmarking.DeeplyNestedObject):
+        self.some_bytes = some_bytes
+        self.inner_object = inner_object
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.some_bytes)
+        self.inner_object.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeeplyNestedObjectX3:
+        some_bytes = Bytes.read(stream)
+        inner_object = TLObject.read(stream)
+        return cls(some_bytes=some_bytes, inner_object=inner_object)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeeplyNestedObjectX3, int]:
+        some_bytes, cursor = Bytes.read_from(view, cursor)
+        inner_object, cursor = TLObject.read_from(view, cursor)
+        return cls(some_bytes=some_bytes, inner_object=inner_object), cursor
+
+
+class DeeplyNestedObjectX2(TLObject):
+    __tl_id__ = 0xbfffaeb7
+    __tl_name__ = "types.internal_benchmarking.DeeplyNestedObjectX2"
+    __tl_layer__ = 201
+
+    __slots__ = ("some_string", "inner_object", )
+
+    def __init__(self, *, some_string: str, inner_object: tl.base.internal_benchmarking.DeeplyNestedObject):
+        self.some_string = some_string
+        self.inner_object = inner_object
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.some_string)
+        self.inner_object.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeeplyNestedObjectX2:
+        some_string = String.read(stream)
+        inner_object = TLObject.read(stream)
+        return cls(some_string=some_string, inner_object=inner_object)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeeplyNestedObjectX2, int]:
+        some_string, cursor = String.read_from(view, cursor)
+        inner_object, cursor = TLObject.read_from(view, cursor)
+        return cls(some_string=some_string, inner_object=inner_object), cursor
+
+
+class DeeplyNestedObjectX1(TLObject):
+    __tl_id__ = 0x1c0441df
+    __tl_name__ = "types.internal_benchmarking.DeeplyNestedObjectX1"
+    __tl_layer__ = 201
+
+    __slots__ = ("some_long", "inner_object", )
+
+    def __init__(self, *, some_long: int, inner_object: tl.base.internal_benchmarking.DeeplyNestedObject):
+        self.some_long = some_long
+        self.inner_object = inner_object
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.some_long)
+        self.inner_object.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DeeplyNestedObjectX1:
+        some_long = Long.read(stream)
+        inner_object = TLObject.read(stream)
+        return cls(some_long=some_long, inner_object=inner_object)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DeeplyNestedObjectX1, int]:
+        some_long, cursor = Long.read_from(view, cursor)
+        inner_object, cursor = TLObject.read_from(view, cursor)
+        return cls(some_long=some_long, inner_object=inner_object), cursor
+
+
+class ObjectToBenchmark(TLObject):
+    __tl_id__ = 0x96be42f
+    __tl_name__ = "types.internal_benchmarking.ObjectToBenchmark"
+    __tl_layer__ = 201
+
+    __slots__ = ("int32", "optional_int32", "int64", "optional_int64", "int128", "optional_int128", "int256", "optional_int256", "double", "optional_double", "bytes_field", "optional_bytes", "string_field", "optional_string", "full_bool", "optional_full_bool", "optional_bit_bool", "nested_object", "optional_nested_object", "deeply_nested_object", "optional_deeply_nested_object", "int32_vec", "optional_int32_vec", "int64_vec", "optional_int64_vec", "int128_vec", "optional_int128_vec", "int256_vec", "optional_int256_vec", "double_vec", "optional_double_vec", "bytes_field_vec", "optional_bytes_vec", "string_field_vec", "optional_string_vec", "full_bool_vec", "optional_full_bool_vec", "nested_object_vec", "optional_nested_object_vec", "deeply_nested_object_vec", "optional_deeply_nested_object_vec", "int32_flags2", "optional_int32_flags2", "int64_flags2", "optional_int64_flags2", "int128_flags2", "optional_int128_flags2", "int256_flags2", "optional_int256_flags2", "double_flags2", "optional_double_flags2", "bytes_field_flags2", "optional_bytes_flags2", "string_field_flags2", "optional_string_flags2", "full_bool_flags2", "optional_full_bool_flags2", "optional_bit_bool_flags2", "nested_object_flags2", "optional_nested_object_flags2", "deeply_nested_object_flags2", "optional_deeply_nested_object_flags2", "int32_vec_flags2", "optional_int32_vec_flags2", "int64_vec_flags2", "optional_int64_vec_flags2", "int128_vec_flags2", "optional_int128_vec_flags2", "int256_vec_flags2", "optional_int256_vec_flags2", "double_vec_flags2", "optional_double_vec_flags2", "bytes_field_vec_flags2", "optional_bytes_vec_flags2", "string_field_vec_flags2", "optional_string_vec_flags2", "full_bool_vec_flags2", "optional_full_bool_vec_flags2", "nested_object_vec_flags2", "optional_nested_object_vec_flags2", "deeply_nested_object_vec_flags2", "optional_deeply_nested_object_vec_flags2", )
+
+    def __init__(self, *, int32: int, int64: int, int128: int, int256: int, double: float, bytes_field: bytes, string_field: str, full_bool: bool, nested_object: tl.types.internal_benchmarking.NestedObject, deeply_nested_object: tl.base.internal_benchmarking.DeeplyNestedObject, int32_vec: list[int], int64_vec: list[int], int128_vec: list[int], int256_vec: list[int], double_vec: list[float], bytes_field_vec: list[bytes], string_field_vec: list[str], full_bool_vec: list[bool], nested_object_vec: list[tl.base.internal_benchmarking.NestedObject], deeply_nested_object_vec: list[tl.base.internal_benchmarking.DeeplyNestedObject], int32_flags2: int, int64_flags2: int, int128_flags2: int, int256_flags2: int, double_flags2: float, bytes_field_flags2: bytes, string_field_flags2: str, full_bool_flags2: bool, nested_object_flags2: tl.types.internal_benchmarking.NestedObject, deeply_nested_object_flags2: tl.base.internal_benchmarking.DeeplyNestedObject, int32_vec_flags2: list[int], int64_vec_flags2: list[int], int128_vec_flags2: list[int], int256_vec_flags2: list[int], double_vec_flags2: list[float], bytes_field_vec_flags2: list[bytes], string_field_vec_flags2: list[str], full_bool_vec_flags2: list[bool], nested_object_vec_flags2: list[tl.base.internal_benchmarking.NestedObject], deeply_nested_object_vec_flags2: list[tl.base.internal_benchmarking.DeeplyNestedObject], optional_int32: int | None = None, optional_int64: int | None = None, optional_int128: int | None = None, optional_int256: int | None = None, optional_double: float | None = None, optional_bytes: bytes | None = None, optional_string: str | None = None, optional_full_bool: bool = False, optional_bit_bool: bool = False, optional_nested_object: tl.types.internal_benchmarking.NestedObject | None = None, optional_deeply_nested_object: tl.base.internal_benchmarking.DeeplyNestedObject | None = None, optional_int32_vec: list[int] | None = None, optional_int64_vec: list[int] | None = None, optional_int128_vec: list[int] | None = None, optional_int256_vec: list[int] | None = None, optional_double_vec: list[float] | None = None, optional_bytes_vec: list[bytes] | None = None, optional_string_vec: list[str] | None = None, optional_full_bool_vec: list[bool] | None = None, optional_nested_object_vec: list[tl.base.internal_benchmarking.NestedObject] | None = None, optional_deeply_nested_object_vec: list[tl.base.internal_benchmarking.DeeplyNestedObject] | None = None, optional_int32_flags2: int | None = None, optional_int64_flags2: int | None = None, optional_int128_flags2: int | None = None, optional_int256_flags2: int | None = None, optional_double_flags2: float | None = None, optional_bytes_flags2: bytes | None = None, optional_string_flags2: str | None = None, optional_full_bool_flags2: bool = False, optional_bit_bool_flags2: bool = False, optional_nested_object_flags2: tl.types.internal_benchmarking.NestedObject | None = None, optional_deeply_nested_object_flags2: tl.base.internal_benchmarking.DeeplyNestedObject | None = None, optional_int32_vec_flags2: list[int] | None = None, optional_int64_vec_flags2: list[int] | None = None, optional_int128_vec_flags2: list[int] | None = None, optional_int256_vec_flags2: list[int] | None = None, optional_double_vec_flags2: list[float] | None = None, optional_bytes_vec_flags2: list[bytes] | None = None, optional_string_vec_flags2: list[str] | None = None, optional_full_bool_vec_flags2: list[bool] | None = None, optional_nested_object_vec_flags2: list[tl.base.internal_benchmarking.NestedObject] | None = None, optional_deeply_nested_object_vec_flags2: list[tl.base.internal_benchmarking.DeeplyNestedObject] | None = None):
+        self.int32 = int32
+        self.optional_int32 = optional_int32
+        self.int64 = int64
+        self.optional_int64 = optional_int64
+        self.int128 = int128
+        self.optional_int128 = optional_int128
+        self.int256 = int256
+        self.optional_int256 = optional_int256
+        self.double = double
+        self.optional_double = optional_double
+        self.bytes_field = bytes_field
+        self.optional_bytes = optional_bytes
+        self.string_field = string_field
+        self.optional_string = optional_string
+        self.full_bool = full_bool
+        self.optional_full_bool = optional_full_bool
+        self.optional_bit_bool = optional_bit_bool
+        self.nested_object = nested_object
+        self.optional_nested_object = optional_nested_object
+        self.deeply_nested_object = deeply_nested_object
+        self.optional_deeply_nested_object = optional_deeply_nested_object
+        self.int32_vec = int32_vec
+        self.optional_int32_vec = optional_int32_vec
+        self.int64_vec = int64_vec
+        self.optional_int64_vec = optional_int64_vec
+        self.int128_vec = int128_vec
+        self.optional_int128_vec = optional_int128_vec
+        self.int256_vec = int256_vec
+        self.optional_int256_vec = optional_int256_vec
+        self.double_vec = double_vec
+        self.optional_double_vec = optional_double_vec
+        self.bytes_field_vec = bytes_field_vec
+        self.optional_bytes_vec = optional_bytes_vec
+        self.string_field_vec = string_field_vec
+        self.optional_string_vec = optional_string_vec
+        self.full_bool_vec = full_bool_vec
+        self.optional_full_bool_vec = optional_full_bool_vec
+        self.nested_object_vec = nested_object_vec
+        self.optional_nested_object_vec = optional_nested_object_vec
+        self.deeply_nested_object_vec = deeply_nested_object_vec
+        self.optional_deeply_nested_object_vec = optional_deeply_nested_object_vec
+        self.int32_flags2 = int32_flags2
+        self.optional_int32_flags2 = optional_int32_flags2
+        self.int64_flags2 = int64_flags2
+        self.optional_int64_flags2 = optional_int64_flags2
+        self.int128_flags2 = int128_flags2
+        self.optional_int128_flags2 = optional_int128_flags2
+        self.int256_flags2 = int256_flags2
+        self.optional_int256_flags2 = optional_int256_flags2
+        self.double_flags2 = double_flags2
+        self.optional_double_flags2 = optional_double_flags2
+        self.bytes_field_flags2 = bytes_field_flags2
+        self.optional_bytes_flags2 = optional_bytes_flags2
+        self.string_field_flags2 = string_field_flags2
+        self.optional_string_flags2 = optional_string_flags2
+        self.full_bool_flags2 = full_bool_flags2
+        self.optional_full_bool_flags2 = optional_full_bool_flags2
+        self.optional_bit_bool_flags2 = optional_bit_bool_flags2
+        self.nested_object_flags2 = nested_object_flags2
+        self.optional_nested_object_flags2 = optional_nested_object_flags2
+        self.deeply_nested_object_flags2 = deeply_nested_object_flags2
+        self.optional_deeply_nested_object_flags2 = optional_deeply_nested_object_flags2
+        self.int32_vec_flags2 = int32_vec_flags2
+        self.optional_int32_vec_flags2 = optional_int32_vec_flags2
+        self.int64_vec_flags2 = int64_vec_flags2
+        self.optional_int64_vec_flags2 = optional_int64_vec_flags2
+        self.int128_vec_flags2 = int128_vec_flags2
+        self.optional_int128_vec_flags2 = optional_int128_vec_flags2
+        self.int256_vec_flags2 = int256_vec_flags2
+        self.optional_int256_vec_flags2 = optional_int256_vec_flags2
+        self.double_vec_flags2 = double_vec_flags2
+        self.optional_double_vec_flags2 = optional_double_vec_flags2
+        self.bytes_field_vec_flags2 = bytes_field_vec_flags2
+        self.optional_bytes_vec_flags2 = optional_bytes_vec_flags2
+        self.string_field_vec_flags2 = string_field_vec_flags2
+        self.optional_string_vec_flags2 = optional_string_vec_flags2
+        self.full_bool_vec_flags2 = full_bool_vec_flags2
+        self.optional_full_bool_vec_flags2 = optional_full_bool_vec_flags2
+        self.nested_object_vec_flags2 = nested_object_vec_flags2
+        self.optional_nested_object_vec_flags2 = optional_nested_object_vec_flags2
+        self.deeply_nested_object_vec_flags2 = deeply_nested_object_vec_flags2
+        self.optional_deeply_nested_object_vec_flags2 = optional_deeply_nested_object_vec_flags2
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.optional_int32 is not None: flags1 |= (1 << 0)
+        if self.optional_int64 is not None: flags1 |= (1 << 1)
+        if self.optional_int128 is not None: flags1 |= (1 << 2)
+        if self.optional_int256 is not None: flags1 |= (1 << 3)
+        if self.optional_double is not None: flags1 |= (1 << 4)
+        if self.optional_bytes is not None: flags1 |= (1 << 5)
+        if self.optional_string is not None: flags1 |= (1 << 6)
+        if self.optional_full_bool is not None: flags1 |= (1 << 7)
+        if self.optional_bit_bool: flags1 |= (1 << 8)
+        if self.optional_nested_object is not None: flags1 |= (1 << 9)
+        if self.optional_deeply_nested_object is not None: flags1 |= (1 << 10)
+        if self.optional_int32_vec: flags1 |= (1 << 11)
+        if self.optional_int64_vec: flags1 |= (1 << 12)
+        if self.optional_int128_vec: flags1 |= (1 << 13)
+        if self.optional_int256_vec: flags1 |= (1 << 14)
+        if self.optional_double_vec: flags1 |= (1 << 15)
+        if self.optional_bytes_vec: flags1 |= (1 << 16)
+        if self.optional_string_vec: flags1 |= (1 << 17)
+        if self.optional_full_bool_vec: flags1 |= (1 << 18)
+        if self.optional_nested_object_vec: flags1 |= (1 << 19)
+        if self.optional_deeply_nested_object_vec: flags1 |= (1 << 20)
+        out += Int.write(flags1)
+        out += Int.write(self.int32)
+        if self.optional_int32 is not None:
+            out += Int.write(self.optional_int32)
+        out += Long.write(self.int64)
+        if self.optional_int64 is not None:
+            out += Long.write(self.optional_int64)
+        out += Int128.write(self.int128)
+        if self.optional_int128 is not None:
+            out += Int128.write(self.optional_int128)
+        out += Int256.write(self.int256)
+        if self.optional_int256 is not None:
+            out += Int256.write(self.optional_int256)
+        out += Float.write(self.double)
+        if self.optional_double is not None:
+            out += Float.write(self.optional_double)
+        Bytes.write_to(out, self.bytes_field)
+        if self.optional_bytes is not None:
+            Bytes.write_to(out, self.optional_bytes)
+        String.write_to(out, self.string_field)
+        if self.optional_string is not None:
+            String.write_to(out, self.optional_string)
+        out += Bool.write(self.full_bool)
+        if self.optional_full_bool is not None:
+            out += Bool.write(self.optional_full_bool)
+        self.nested_object.write_to(out, ctx)
+        if self.optional_nested_object is not None:
+            self.optional_nested_object.write_to(out, ctx)
+        self.deeply_nested_object.write_to(out, ctx)
+        if self.optional_deeply_nested_object is not None:
+            self.optional_deeply_nested_object.write_to(out, ctx)
+        out += IntVector.write(self.int32_vec)
+        if self.optional_int32_vec:
+            out += IntVector.write(self.optional_int32_vec)
+        out += LongVector.write(self.int64_vec)
+        if self.optional_int64_vec:
+            out += LongVector.write(self.optional_int64_vec)
+        out += Int128Vector.write(self.int128_vec)
+        if self.optional_int128_vec:
+            out += Int128Vector.write(self.optional_int128_vec)
+        out += Int256Vector.write(self.int256_vec)
+        if self.optional_int256_vec:
+            out += Int256Vector.write(self.optional_int256_vec)
+        out += FloatVector.write(self.double_vec)
+        if self.optional_double_vec:
+            out += FloatVector.write(self.optional_double_vec)
+        out += BytesVector.write(self.bytes_field_vec)
+        if self.optional_bytes_vec:
+            out += BytesVector.write(self.optional_bytes_vec)
+        out += StringVector.write(self.string_field_vec)
+        if self.optional_string_vec:
+            out += StringVector.write(self.optional_string_vec)
+        out += BoolVector.write(self.full_bool_vec)
+        if self.optional_full_bool_vec:
+            out += BoolVector.write(self.optional_full_bool_vec)
+        TLObjectVector.write_to(out, self.nested_object_vec, ctx)
+        if self.optional_nested_object_vec:
+            TLObjectVector.write_to(out, self.optional_nested_object_vec, ctx)
+        TLObjectVector.write_to(out, self.deeply_nested_object_vec, ctx)
+        if self.optional_deeply_nested_object_vec:
+            TLObjectVector.write_to(out, self.optional_deeply_nested_object_vec, ctx)
+        flags2 = 0
+        if self.optional_int32_flags2 is not None: flags2 |= (1 << 0)
+        if self.optional_int64_flags2 is not None: flags2 |= (1 << 1)
+        if self.optional_int128_flags2 is not None: flags2 |= (1 << 2)
+        if self.optional_int256_flags2 is not None: flags2 |= (1 << 3)
+        if self.optional_double_flags2 is not None: flags2 |= (1 << 4)
+        if self.optional_bytes_flags2 is not None: flags2 |= (1 << 5)
+        if self.optional_string_flags2 is not None: flags2 |= (1 << 6)
+        if self.optional_full_bool_flags2 is not None: flags2 |= (1 << 7)
+        if self.optional_bit_bool_flags2: flags2 |= (1 << 8)
+        if self.optional_nested_object_flags2 is not None: flags2 |= (1 << 9)
+        if self.optional_deeply_nested_object_flags2 is not None: flags2 |= (1 << 10)
+        if self.optional_int32_vec_flags2: flags2 |= (1 << 11)
+        if self.optional_int64_vec_flags2: flags2 |= (1 << 12)
+        if self.optional_int128_vec_flags2: flags2 |= (1 << 13)
+        if self.optional_int256_vec_flags2: flags2 |= (1 << 14)
+        if self.optional_double_vec_flags2: flags2 |= (1 << 15)
+        if self.optional_bytes_vec_flags2: flags2 |= (1 << 16)
+        if self.optional_string_vec_flags2: flags2 |= (1 << 17)
+        if self.optional_full_bool_vec_flags2: flags2 |= (1 << 18)
+        if self.optional_nested_object_vec_flags2: flags2 |= (1 << 19)
+        if self.optional_deeply_nested_object_vec_flags2: flags2 |= (1 << 20)
+        out += Int.write(flags2)
+        out += Int.write(self.int32_flags2)
+        if self.optional_int32_flags2 is not None:
+            out += Int.write(self.optional_int32_flags2)
+        out += Long.write(self.int64_flags2)
+        if self.optional_int64_flags2 is not None:
+            out += Long.write(self.optional_int64_flags2)
+        out += Int128.write(self.int128_flags2)
+        if self.optional_int128_flags2 is not None:
+            out += Int128.write(self.optional_int128_flags2)
+        out += Int256.write(self.int256_flags2)
+        if self.optional_int256_flags2 is not None:
+            out += Int256.write(self.optional_int256_flags2)
+        out += Float.write(self.double_flags2)
+        if self.optional_double_flags2 is not None:
+            out += Float.write(self.optional_double_flags2)
+        Bytes.write_to(out, self.bytes_field_flags2)
+        if self.optional_bytes_flags2 is not None:
+            Bytes.write_to(out, self.optional_bytes_flags2)
+        String.write_to(out, self.string_field_flags2)
+        if self.optional_string_flags2 is not None:
+            String.write_to(out, self.optional_string_flags2)
+        out += Bool.write(self.full_bool_flags2)
+        if self.optional_full_bool_flags2 is not None:
+            out += Bool.write(self.optional_full_bool_flags2)
+        self.nested_object_flags2.write_to(out, ctx)
+        if self.optional_nested_object_flags2 is not None:
+            self.optional_nested_object_flags2.write_to(out, ctx)
+        self.deeply_nested_object_flags2.write_to(out, ctx)
+        if self.optional_deeply_nested_object_flags2 is not None:
+            self.optional_deeply_nested_object_flags2.write_to(out, ctx)
+        out += IntVector.write(self.int32_vec_flags2)
+        if self.optional_int32_vec_flags2:
+            out += IntVector.write(self.optional_int32_vec_flags2)
+        out += LongVector.write(self.int64_vec_flags2)
+        if self.optional_int64_vec_flags2:
+            out += LongVector.write(self.optional_int64_vec_flags2)
+        out += Int128Vector.write(self.int128_vec_flags2)
+        if self.optional_int128_vec_flags2:
+            out += Int128Vector.write(self.optional_int128_vec_flags2)
+        out += Int256Vector.write(self.int256_vec_flags2)
+        if self.optional_int256_vec_flags2:
+            out += Int256Vector.write(self.optional_int256_vec_flags2)
+        out += FloatVector.write(self.double_vec_flags2)
+        if self.optional_double_vec_flags2:
+            out += FloatVector.write(self.optional_double_vec_flags2)
+        out += BytesVector.write(self.bytes_field_vec_flags2)
+        if self.optional_bytes_vec_flags2:
+            out += BytesVector.write(self.optional_bytes_vec_flags2)
+        out += StringVector.write(self.string_field_vec_flags2)
+        if self.optional_string_vec_flags2:
+            out += StringVector.write(self.optional_string_vec_flags2)
+        out += BoolVector.write(self.full_bool_vec_flags2)
+        if self.optional_full_bool_vec_flags2:
+            out += BoolVector.write(self.optional_full_bool_vec_flags2)
+        TLObjectVector.write_to(out, self.nested_object_vec_flags2, ctx)
+        if self.optional_nested_object_vec_flags2:
+            TLObjectVector.write_to(out, self.optional_nested_object_vec_flags2, ctx)
+        TLObjectVector.write_to(out, self.deeply_nested_object_vec_flags2, ctx)
+        if self.optional_deeply_nested_object_vec_flags2:
+            TLObjectVector.write_to(out, self.optional_deeply_nested_object_vec_flags2, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ObjectToBenchmark:
+        flags1 = Int.read(stream)
+        int32 = Int.read(stream)
+        optional_int32 = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        int64 = Long.read(stream)
+        optional_int64 = Long.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        int128 = Int128.read(stream)
+        optional_int128 = Int128.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        int256 = Int256.read(stream)
+        optional_int256 = Int256.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        double = Float.read(stream)
+        optional_double = Float.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        bytes_field = Bytes.read(stream)
+        optional_bytes = Bytes.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        string_field = String.read(stream)
+        optional_string = String.read(stream) if (flags1 & (1 << 6)) == (1 << 6) else None
+        full_bool = Bool.read(stream)
+        optional_full_bool = Bool.read(stream) if (flags1 & (1 << 7)) == (1 << 7) else None
+        optional_bit_bool = (flags1 & (1 << 8)) == (1 << 8)
+        nested_object = tl.types.internal_benchmarking.NestedObject.read(stream)
+        optional_nested_object = tl.types.internal_benchmarking.NestedObject.read(stream) if (flags1 & (1 << 9)) == (1 << 9) else None
+        deeply_nested_object = TLObject.read(stream)
+        optional_deeply_nested_object = TLObject.read(stream) if (flags1 & (1 << 10)) == (1 << 10) else None
+        int32_vec = IntVector.read(stream)
+        optional_int32_vec = IntVector.read(stream) if (flags1 & (1 << 11)) == (1 << 11) else None
+        int64_vec = LongVector.read(stream)
+        optional_int64_vec = LongVector.read(stream) if (flags1 & (1 << 12)) == (1 << 12) else None
+        int128_vec = Int128Vector.read(stream)
+        optional_int128_vec = Int128Vector.read(stream) if (flags1 & (1 << 13)) == (1 << 13) else None
+        int256_vec = Int256Vector.read(stream)
+        optional_int256_vec = Int256Vector.read(stream) if (flags1 & (1 << 14)) == (1 << 14) else None
+        double_vec = FloatVector.read(stream)
+        optional_double_vec = FloatVector.read(stream) if (flags1 & (1 << 15)) == (1 << 15) else None
+        bytes_field_vec = BytesVector.read(stream)
+        optional_bytes_vec = BytesVector.read(stream) if (flags1 & (1 << 16)) == (1 << 16) else None
+        string_field_vec = StringVector.read(stream)
+        optional_string_vec = StringVector.read(stream) if (flags1 & (1 << 17)) == (1 << 17) else None
+        full_bool_vec = BoolVector.read(stream)
+        optional_full_bool_vec = BoolVector.read(stream) if (flags1 & (1 << 18)) == (1 << 18) else None
+        nested_object_vec = TLObjectVector.read(stream)
+        optional_nested_object_vec = TLObjectVector.read(stream) if (flags1 & (1 << 19)) == (1 << 19) else None
+        deeply_nested_object_vec = TLObjectVector.read(stream)
+        optional_deeply_nested_object_vec = TLObjectVector.read(stream) if (flags1 & (1 << 20)) == (1 << 20) else None
+        flags2 = Int.read(stream)
+        int32_flags2 = Int.read(stream)
+        optional_int32_flags2 = Int.read(stream) if (flags2 & (1 << 0)) == (1 << 0) else None
+        int64_flags2 = Long.read(stream)
+        optional_int64_flags2 = Long.read(stream) if (flags2 & (1 << 1)) == (1 << 1) else None
+        int128_flags2 = Int128.read(stream)
+        optional_int128_flags2 = Int128.read(stream) if (flags2 & (1 << 2)) == (1 << 2) else None
+        int256_flags2 = Int256.read(stream)
+        optional_int256_flags2 = Int256.read(stream) if (flags2 & (1 << 3)) == (1 << 3) else None
+        double_flags2 = Float.read(stream)
+        optional_double_flags2 = Float.read(stream) if (flags2 & (1 << 4)) == (1 << 4) else None
+        bytes_field_flags2 = Bytes.read(stream)
+        optional_bytes_flags2 = Bytes.read(stream) if (flags2 & (1 << 5)) == (1 << 5) else None
+        string_field_flags2 = String.read(stream)
+        optional_string_flags2 = String.read(stream) if (flags2 & (1 << 6)) == (1 << 6) else None
+        full_bool_flags2 = Bool.read(stream)
+        optional_full_bool_flags2 = Bool.read(stream) if (flags2 & (1 << 7)) == (1 << 7) else None
+        optional_bit_bool_flags2 = (flags2 & (1 << 8)) == (1 << 8)
+        nested_object_flags2 = tl.types.internal_benchmarking.NestedObject.read(stream)
+        optional_nested_object_flags2 = tl.types.internal_benchmarking.NestedObject.read(stream) if (flags2 & (1 << 9)) == (1 << 9) else None
+        deeply_nested_object_flags2 = TLObject.read(stream)
+        optional_deeply_nested_object_flags2 = TLObject.read(stream) if (flags2 & (1 << 10)) == (1 << 10) else None
+        int32_vec_flags2 = IntVector.read(stream)
+        optional_int32_vec_flags2 = IntVector.read(stream) if (flags2 & (1 << 11)) == (1 << 11) else None
+        int64_vec_flags2 = LongVector.read(stream)
+        optional_int64_vec_flags2 = LongVector.read(stream) if (flags2 & (1 << 12)) == (1 << 12) else None
+        int128_vec_flags2 = Int128Vector.read(stream)
+        optional_int128_vec_flags2 = Int128Vector.read(stream) if (flags2 & (1 << 13)) == (1 << 13) else None
+        int256_vec_flags2 = Int256Vector.read(stream)
+        optional_int256_vec_flags2 = Int256Vector.read(stream) if (flags2 & (1 << 14)) == (1 << 14) else None
+        double_vec_flags2 = FloatVector.read(stream)
+        optional_double_vec_flags2 = FloatVector.read(stream) if (flags2 & (1 << 15)) == (1 << 15) else None
+        bytes_field_vec_flags2 = BytesVector.read(stream)
+        optional_bytes_vec_flags2 = BytesVector.read(stream) if (flags2 & (1 << 16)) == (1 << 16) else None
+        string_field_vec_flags2 = StringVector.read(stream)
+        optional_string_vec_flags2 = StringVector.read(stream) if (flags2 & (1 << 17)) == (1 << 17) else None
+        full_bool_vec_flags2 = BoolVector.read(stream)
+        optional_full_bool_vec_flags2 = BoolVector.read(stream) if (flags2 & (1 << 18)) == (1 << 18) else None
+        nested_object_vec_flags2 = TLObjectVector.read(stream)
+        optional_nested_object_vec_flags2 = TLObjectVector.read(stream) if (flags2 & (1 << 19)) == (1 << 19) else None
+        deeply_nested_object_vec_flags2 = TLObjectVector.read(stream)
+        optional_deeply_nested_object_vec_flags2 = TLObjectVector.read(stream) if (flags2 & (1 << 20)) == (1 << 20) else None
+        return cls(int32=int32, optional_int32=optional_int32, int64=int64, optional_int64=optional_int64, int128=int128, optional_int128=optional_int128, int256=int256, optional_int256=optional_int256, double=double, optional_double=optional_double, bytes_field=bytes_field, optional_bytes=optional_bytes, string_field=string_field, optional_string=optional_string, full_bool=full_bool, optional_full_bool=optional_full_bool, optional_bit_bool=optional_bit_bool, nested_object=nested_object, optional_nested_object=optional_nested_object, deeply_nested_object=deeply_nested_object, optional_deeply_nested_object=optional_deeply_nested_object, int32_vec=int32_vec, optional_int32_vec=optional_int32_vec, int64_vec=int64_vec, optional_int64_vec=optional_int64_vec, int128_vec=int128_vec, optional_int128_vec=optional_int128_vec, int256_vec=int256_vec, optional_int256_vec=optional_int256_vec, double_vec=double_vec, optional_double_vec=optional_double_vec, bytes_field_vec=bytes_field_vec, optional_bytes_vec=optional_bytes_vec, string_field_vec=string_field_vec, optional_string_vec=optional_string_vec, full_bool_vec=full_bool_vec, optional_full_bool_vec=optional_full_bool_vec, nested_object_vec=nested_object_vec, optional_nested_object_vec=optional_nested_object_vec, deeply_nested_object_vec=deeply_nested_object_vec, optional_deeply_nested_object_vec=optional_deeply_nested_object_vec, int32_flags2=int32_flags2, optional_int32_flags2=optional_int32_flags2, int64_flags2=int64_flags2, optional_int64_flags2=optional_int64_flags2, int128_flags2=int128_flags2, optional_int128_flags2=optional_int128_flags2, int256_flags2=int256_flags2, optional_int256_flags2=optional_int256_flags2, double_flags2=double_flags2, optional_double_flags2=optional_double_flags2, bytes_field_flags2=bytes_field_flags2, optional_bytes_flags2=optional_bytes_flags2, string_field_flags2=string_field_flags2, optional_string_flags2=optional_string_flags2, full_bool_flags2=full_bool_flags2, optional_full_bool_flags2=optional_full_bool_flags2, optional_bit_bool_flags2=optional_bit_bool_flags2, nested_object_flags2=nested_object_flags2, optional_nested_object_flags2=optional_nested_object_flags2, deeply_nested_object_flags2=deeply_nested_object_flags2, optional_deeply_nested_object_flags2=optional_deeply_nested_object_flags2, int32_vec_flags2=int32_vec_flags2, optional_int32_vec_flags2=optional_int32_vec_flags2, int64_vec_flags2=int64_vec_flags2, optional_int64_vec_flags2=optional_int64_vec_flags2, int128_vec_flags2=int128_vec_flags2, optional_int128_vec_flags2=optional_int128_vec_flags2, int256_vec_flags2=int256_vec_flags2, optional_int256_vec_flags2=optional_int256_vec_flags2, double_vec_flags2=double_vec_flags2, optional_double_vec_flags2=optional_double_vec_flags2, bytes_field_vec_flags2=bytes_field_vec_flags2, optional_bytes_vec_flags2=optional_bytes_vec_flags2, string_field_vec_flags2=string_field_vec_flags2, optional_string_vec_flags2=optional_string_vec_flags2, full_bool_vec_flags2=full_bool_vec_flags2, optional_full_bool_vec_flags2=optional_full_bool_vec_flags2, nested_object_vec_flags2=nested_object_vec_flags2, optional_nested_object_vec_flags2=optional_nested_object_vec_flags2, deeply_nested_object_vec_flags2=deeply_nested_object_vec_flags2, optional_deeply_nested_object_vec_flags2=optional_deeply_nested_object_vec_flags2)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ObjectToBenchmark, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        int32, cursor = Int.read_from(view, cursor)
+        optional_int32, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        int64, cursor = Long.read_from(view, cursor)
+        optional_int64, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        int128, cursor = Int128.read_from(view, cursor)
+        optional_int128, cursor = Int128.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        int256, cursor = Int256.read_from(view, cursor)
+        optional_int256, cursor = Int256.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        double, cursor = Float.read_from(view, cursor)
+        optional_double, cursor = Float.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        bytes_field, cursor = Bytes.read_from(view, cursor)
+        optional_bytes, cursor = Bytes.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        string_field, cursor = String.read_from(view, cursor)
+        optional_string, cursor = String.read_from(view, cursor) if (flags1 & (1 << 6)) == (1 << 6) else (None, cursor)
+        full_bool, cursor = Bool.read_from(view, cursor)
+        optional_full_bool, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 7)) == (1 << 7) else (None, cursor)
+        optional_bit_bool = (flags1 & (1 << 8)) == (1 << 8)
+        nested_object, cursor = tl.types.internal_benchmarking.NestedObject.read_from(view, cursor)
+        optional_nested_object, cursor = tl.types.internal_benchmarking.NestedObject.read_from(view, cursor) if (flags1 & (1 << 9)) == (1 << 9) else (None, cursor)
+        deeply_nested_object, cursor = TLObject.read_from(view, cursor)
+        optional_deeply_nested_object, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 10)) == (1 << 10) else (None, cursor)
+        int32_vec, cursor = IntVector.read_from(view, cursor)
+        optional_int32_vec, cursor = IntVector.read_from(view, cursor) if (flags1 & (1 << 11)) == (1 << 11) else (None, cursor)
+        int64_vec, cursor = LongVector.read_from(view, cursor)
+        optional_int64_vec, cursor = LongVector.read_from(view, cursor) if (flags1 & (1 << 12)) == (1 << 12) else (None, cursor)
+        int128_vec, cursor = Int128Vector.read_from(view, cursor)
+        optional_int128_vec, cursor = Int128Vector.read_from(view, cursor) if (flags1 & (1 << 13)) == (1 << 13) else (None, cursor)
+        int256_vec, cursor = Int256Vector.read_from(view, cursor)
+        optional_int256_vec, cursor = Int256Vector.read_from(view, cursor) if (flags1 & (1 << 14)) == (1 << 14) else (None, cursor)
+        double_vec, cursor = FloatVector.read_from(view, cursor)
+        optional_double_vec, cursor = FloatVector.read_from(view, cursor) if (flags1 & (1 << 15)) == (1 << 15) else (None, cursor)
+        bytes_field_vec, cursor = BytesVector.read_from(view, cursor)
+        optional_bytes_vec, cursor = BytesVector.read_from(view, cursor) if (flags1 & (1 << 16)) == (1 << 16) else (None, cursor)
+        string_field_vec, cursor = StringVector.read_from(view, cursor)
+        optional_string_vec, cursor = StringVector.read_from(view, cursor) if (flags1 & (1 << 17)) == (1 << 17) else (None, cursor)
+        full_bool_vec, cursor = BoolVector.read_from(view, cursor)
+        optional_full_bool_vec, cursor = BoolVector.read_from(view, cursor) if (flags1 & (1 << 18)) == (1 << 18) else (None, cursor)
+        nested_object_vec, cursor = TLObjectVector.read_from(view, cursor)
+        optional_nested_object_vec, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 19)) == (1 << 19) else (None, cursor)
+        deeply_nested_object_vec, cursor = TLObjectVector.read_from(view, cursor)
+        optional_deeply_nested_object_vec, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 20)) == (1 << 20) else (None, cursor)
+        flags2, cursor = Int.read_from(view, cursor)
+        int32_flags2, cursor = Int.read_from(view, cursor)
+        optional_int32_flags2, cursor = Int.read_from(view, cursor) if (flags2 & (1 << 0)) == (1 << 0) else (None, cursor)
+        int64_flags2, cursor = Long.read_from(view, cursor)
+        optional_int64_flags2, cursor = Long.read_from(view, cursor) if (flags2 & (1 << 1)) == (1 << 1) else (None, cursor)
+        int128_flags2, cursor = Int128.read_from(view, cursor)
+        optional_int128_flags2, cursor = Int128.read_from(view, cursor) if (flags2 & (1 << 2)) == (1 << 2) else (None, cursor)
+        int256_flags2, cursor = Int256.read_from(view, cursor)
+        optional_int256_flags2, cursor = Int256.read_from(view, cursor) if (flags2 & (1 << 3)) == (1 << 3) else (None, cursor)
+        double_flags2, cursor = Float.read_from(view, cursor)
+        optional_double_flags2, cursor = Float.read_from(view, cursor) if (flags2 & (1 << 4)) == (1 << 4) else (None, cursor)
+        bytes_field_flags2, cursor = Bytes.read_from(view, cursor)
+        optional_bytes_flags2, cursor = Bytes.read_from(view, cursor) if (flags2 & (1 << 5)) == (1 << 5) else (None, cursor)
+        string_field_flags2, cursor = String.read_from(view, cursor)
+        optional_string_flags2, cursor = String.read_from(view, cursor) if (flags2 & (1 << 6)) == (1 << 6) else (None, cursor)
+        full_bool_flags2, cursor = Bool.read_from(view, cursor)
+        optional_full_bool_flags2, cursor = Bool.read_from(view, cursor) if (flags2 & (1 << 7)) == (1 << 7) else (None, cursor)
+        optional_bit_bool_flags2 = (flags2 & (1 << 8)) == (1 << 8)
+        nested_object_flags2, cursor = tl.types.internal_benchmarking.NestedObject.read_from(view, cursor)
+        optional_nested_object_flags2, cursor = tl.types.internal_benchmarking.NestedObject.read_from(view, cursor) if (flags2 & (1 << 9)) == (1 << 9) else (None, cursor)
+        deeply_nested_object_flags2, cursor = TLObject.read_from(view, cursor)
+        optional_deeply_nested_object_flags2, cursor = TLObject.read_from(view, cursor) if (flags2 & (1 << 10)) == (1 << 10) else (None, cursor)
+        int32_vec_flags2, cursor = IntVector.read_from(view, cursor)
+        optional_int32_vec_flags2, cursor = IntVector.read_from(view, cursor) if (flags2 & (1 << 11)) == (1 << 11) else (None, cursor)
+        int64_vec_flags2, cursor = LongVector.read_from(view, cursor)
+        optional_int64_vec_flags2, cursor = LongVector.read_from(view, cursor) if (flags2 & (1 << 12)) == (1 << 12) else (None, cursor)
+        int128_vec_flags2, cursor = Int128Vector.read_from(view, cursor)
+        optional_int128_vec_flags2, cursor = Int128Vector.read_from(view, cursor) if (flags2 & (1 << 13)) == (1 << 13) else (None, cursor)
+        int256_vec_flags2, cursor = Int256Vector.read_from(view, cursor)
+        optional_int256_vec_flags2, cursor = Int256Vector.read_from(view, cursor) if (flags2 & (1 << 14)) == (1 << 14) else (None, cursor)
+        double_vec_flags2, cursor = FloatVector.read_from(view, cursor)
+        optional_double_vec_flags2, cursor = FloatVector.read_from(view, cursor) if (flags2 & (1 << 15)) == (1 << 15) else (None, cursor)
+        bytes_field_vec_flags2, cursor = BytesVector.read_from(view, cursor)
+        optional_bytes_vec_flags2, cursor = BytesVector.read_from(view, cursor) if (flags2 & (1 << 16)) == (1 << 16) else (None, cursor)
+        string_field_vec_flags2, cursor = StringVector.read_from(view, cursor)
+        optional_string_vec_flags2, cursor = StringVector.read_from(view, cursor) if (flags2 & (1 << 17)) == (1 << 17) else (None, cursor)
+        full_bool_vec_flags2, cursor = BoolVector.read_from(view, cursor)
+        optional_full_bool_vec_flags2, cursor = BoolVector.read_from(view, cursor) if (flags2 & (1 << 18)) == (1 << 18) else (None, cursor)
+        nested_object_vec_flags2, cursor = TLObjectVector.read_from(view, cursor)
+        optional_nested_object_vec_flags2, cursor = TLObjectVector.read_from(view, cursor) if (flags2 & (1 << 19)) == (1 << 19) else (None, cursor)
+        deeply_nested_object_vec_flags2, cursor = TLObjectVector.read_from(view, cursor)
+        optional_deeply_nested_object_vec_flags2, cursor = TLObjectVector.read_from(view, cursor) if (flags2 & (1 << 20)) == (1 << 20) else (None, cursor)
+        return cls(int32=int32, optional_int32=optional_int32, int64=int64, optional_int64=optional_int64, int128=int128, optional_int128=optional_int128, int256=int256, optional_int256=optional_int256, double=double, optional_double=optional_double, bytes_field=bytes_field, optional_bytes=optional_bytes, string_field=string_field, optional_string=optional_string, full_bool=full_bool, optional_full_bool=optional_full_bool, optional_bit_bool=optional_bit_bool, nested_object=nested_object, optional_nested_object=optional_nested_object, deeply_nested_object=deeply_nested_object, optional_deeply_nested_object=optional_deeply_nested_object, int32_vec=int32_vec, optional_int32_vec=optional_int32_vec, int64_vec=int64_vec, optional_int64_vec=optional_int64_vec, int128_vec=int128_vec, optional_int128_vec=optional_int128_vec, int256_vec=int256_vec, optional_int256_vec=optional_int256_vec, double_vec=double_vec, optional_double_vec=optional_double_vec, bytes_field_vec=bytes_field_vec, optional_bytes_vec=optional_bytes_vec, string_field_vec=string_field_vec, optional_string_vec=optional_string_vec, full_bool_vec=full_bool_vec, optional_full_bool_vec=optional_full_bool_vec, nested_object_vec=nested_object_vec, optional_nested_object_vec=optional_nested_object_vec, deeply_nested_object_vec=deeply_nested_object_vec, optional_deeply_nested_object_vec=optional_deeply_nested_object_vec, int32_flags2=int32_flags2, optional_int32_flags2=optional_int32_flags2, int64_flags2=int64_flags2, optional_int64_flags2=optional_int64_flags2, int128_flags2=int128_flags2, optional_int128_flags2=optional_int128_flags2, int256_flags2=int256_flags2, optional_int256_flags2=optional_int256_flags2, double_flags2=double_flags2, optional_double_flags2=optional_double_flags2, bytes_field_flags2=bytes_field_flags2, optional_bytes_flags2=optional_bytes_flags2, string_field_flags2=string_field_flags2, optional_string_flags2=optional_string_flags2, full_bool_flags2=full_bool_flags2, optional_full_bool_flags2=optional_full_bool_flags2, optional_bit_bool_flags2=optional_bit_bool_flags2, nested_object_flags2=nested_object_flags2, optional_nested_object_flags2=optional_nested_object_flags2, deeply_nested_object_flags2=deeply_nested_object_flags2, optional_deeply_nested_object_flags2=optional_deeply_nested_object_flags2, int32_vec_flags2=int32_vec_flags2, optional_int32_vec_flags2=optional_int32_vec_flags2, int64_vec_flags2=int64_vec_flags2, optional_int64_vec_flags2=optional_int64_vec_flags2, int128_vec_flags2=int128_vec_flags2, optional_int128_vec_flags2=optional_int128_vec_flags2, int256_vec_flags2=int256_vec_flags2, optional_int256_vec_flags2=optional_int256_vec_flags2, double_vec_flags2=double_vec_flags2, optional_double_vec_flags2=optional_double_vec_flags2, bytes_field_vec_flags2=bytes_field_vec_flags2, optional_bytes_vec_flags2=optional_bytes_vec_flags2, string_field_vec_flags2=string_field_vec_flags2, optional_string_vec_flags2=optional_string_vec_flags2, full_bool_vec_flags2=full_bool_vec_flags2, optional_full_bool_vec_flags2=optional_full_bool_vec_flags2, nested_object_vec_flags2=nested_object_vec_flags2, optional_nested_object_vec_flags2=optional_nested_object_vec_flags2, deeply_nested_object_vec_flags2=deeply_nested_object_vec_flags2, optional_deeply_nested_object_vec_flags2=optional_deeply_nested_object_vec_flags2), cursor
@@ -0,0 +1,63 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class BotfatherStateNewbot(TLObject):
+    __tl_id__ = 0xbcb2c294
+    __tl_name__ = "types.internal_botfather.BotfatherStateNewbot"
+    __tl_layer__ = 201
+
+    __slots__ = ("name", )
+
+    def __init__(self, *, name: str):
+        self.name = name
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.name)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BotfatherStateNewbot:
+        name = String.read(stream)
+        return cls(name=name)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BotfatherStateNewbot, int]:
+        name, cursor = String.read_from(view, cursor)
+        return cls(name=name), cursor
+
+
+class BotfatherStateEditbot(TLObject):
+    __tl_id__ = 0xad2641a6
+    __tl_name__ = "types.internal_botfather.BotfatherStateEditbot"
+    __tl_layer__ = 201
+
+    __slots__ = ("bot_id", )
+
+    def __init__(self, *, bot_id: int):
+        self.bot_id = bot_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.bot_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BotfatherStateEditbot:
+        bot_id = Long.read(stream)
+        return cls(bot_id=bot_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BotfatherStateEditbot, int]:
+        bot_id, cursor = Long.read_from(view, cursor)
+        return cls(bot_id=bot_id), cursor
@@ -0,0 +1,344 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class NewpackInputSticker(TLObject):
+    __tl_id__ = 0xfe36b3bd
+    __tl_name__ = "types.internal_stickersbot.NewpackInputSticker"
+    __tl_layer__ = 201
+
+    __slots__ = ("file_id", "emoji", )
+
+    def __init__(self, *, file_id: int, emoji: str):
+        self.file_id = file_id
+        self.emoji = emoji
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.file_id)
+        String.write_to(out, self.emoji)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> NewpackInputSticker:
+        file_id = Long.read(stream)
+        emoji = String.read(stream)
+        return cls(file_id=file_id, emoji=emoji)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[NewpackInputSticker, int]:
+        file_id, cursor = Long.read_from(view, cursor)
+        emoji, cursor = String.read_from(view, cursor)
+        return cls(file_id=file_id, emoji=emoji), cursor
+
+
+class EmojiPackTypeStatic(TLObject):
+    __tl_id__ = 0x371ef88f
+    __tl_name__ = "types.internal_stickersbot.EmojiPackTypeStatic"
+    __tl_layer__ = 201
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EmojiPackTypeStatic:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EmojiPackTypeStatic, int]:
+        return cls(), cursor
+
+
+class EmojiPackTypeVideo(TLObject):
+    __tl_id__ = 0xbe690159
+    __tl_name__ = "types.internal_stickersbot.EmojiPackTypeVideo"
+    __tl_layer__ = 201
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EmojiPackTypeVideo:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EmojiPackTypeVideo, int]:
+        return cls(), cursor
+
+
+class EmojiPackTypeAnimated(TLObject):
+    __tl_id__ = 0x100a52c
+    __tl_name__ = "types.internal_stickersbot.EmojiPackTypeAnimated"
+    __tl_layer__ = 201
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EmojiPackTypeAnimated:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EmojiPackTypeAnimated, int]:
+        return cls(), cursor
+
+
+class StickersStateNewpack(TLObject):
+    __tl_id__ = 0x70a163dd
+    __tl_name__ = "types.internal_stickersbot.StickersStateNewpack"
+    __tl_layer__ = 201
+
+    __slots__ = ("name", "stickers", )
+
+    def __init__(self, *, name: str, stickers: list[tl.base.internal_stickersbot.NewpackInputSticker]):
+        self.name = name
+        self.stickers = stickers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.name)
+        TLObjectVector.write_to(out, self.stickers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickersStateNewpack:
+        name = String.read(stream)
+        stickers = TLObjectVector.read(stream)
+        return cls(name=name, stickers=stickers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickersStateNewpack, int]:
+        name, cursor = String.read_from(view, cursor)
+        stickers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(name=name, stickers=stickers), cursor
+
+
+class StickersStateAddsticker(TLObject):
+    __tl_id__ = 0xadc6611f
+    __tl_name__ = "types.internal_stickersbot.StickersStateAddsticker"
+    __tl_layer__ = 201
+
+    __slots__ = ("set_id", "file_id", )
+
+    def __init__(self, *, set_id: int, file_id: int):
+        self.set_id = set_id
+        self.file_id = file_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.set_id)
+        out += Long.write(self.file_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickersStateAddsticker:
+        set_id = Long.read(stream)
+        file_id = Long.read(stream)
+        return cls(set_id=set_id, file_id=file_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickersStateAddsticker, int]:
+        set_id, cursor = Long.read_from(view, cursor)
+        file_id, cursor = Long.read_from(view, cursor)
+        return cls(set_id=set_id, file_id=file_id), cursor
+
+
+class StickersStateEditsticker(TLObject):
+    __tl_id__ = 0xd3add072
+    __tl_name__ = "types.internal_stickersbot.StickersStateEditsticker"
+    __tl_layer__ = 201
+
+    __slots__ = ("set_id", "file_id", )
+
+    def __init__(self, *, set_id: int | None = None, file_id: int | None = None):
+        self.set_id = set_id
+        self.file_id = file_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.set_id is not None: flags1 |= (1 << 0)
+        if self.file_id is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.set_id is not None:
+            out += Long.write(self.set_id)
+        if self.file_id is not None:
+            out += Long.write(self.file_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickersStateEditsticker:
+        flags1 = Int.read(stream)
+        set_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        file_id = Long.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(set_id=set_id, file_id=file_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickersStateEditsticker, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        set_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        file_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(set_id=set_id, file_id=file_id), cursor
+
+
+class StickersStateDelpack(TLObject):
+    __tl_id__ = 0x1852c118
+    __tl_name__ = "types.internal_stickersbot.StickersStateDelpack"
+    __tl_layer__ = 201
+
+    __slots__ = ("set_id", )
+
+    def __init__(self, *, set_id: int):
+        self.set_id = set_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.set_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickersStateDelpack:
+        set_id = Long.read(stream)
+        return cls(set_id=set_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickersStateDelpack, int]:
+        set_id, cursor = Long.read_from(view, cursor)
+        return cls(set_id=set_id), cursor
+
+
+class StickersStateRenamepack(TLObject):
+    __tl_id__ = 0xb4b529e2
+    __tl_name__ = "types.internal_stickersbot.StickersStateRenamepack"
+    __tl_layer__ = 201
+
+    __slots__ = ("set_id", )
+
+    def __init__(self, *, set_id: int):
+        self.set_id = set_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.set_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickersStateRenamepack:
+        set_id = Long.read(stream)
+        return cls(set_id=set_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickersStateRenamepack, int]:
+        set_id, cursor = Long.read_from(view, cursor)
+        return cls(set_id=set_id), cursor
+
+
+class StickersStateReplacesticker(TLObject):
+    __tl_id__ = 0xdce7b0f5
+    __tl_name__ = "types.internal_stickersbot.StickersStateReplacesticker"
+    __tl_layer__ = 201
+
+    __slots__ = ("set_id", "file_id", )
+
+    def __init__(self, *, set_id: int | None = None, file_id: int | None = None):
+        self.set_id = set_id
+        self.file_id = file_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.set_id is not None: flags1 |= (1 << 0)
+        if self.file_id is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.set_id is not None:
+            out += Long.write(self.set_id)
+        if self.file_id is not None:
+            out += Long.write(self.file_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickersStateReplacesticker:
+        flags1 = Int.read(stream)
+        set_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        file_id = Long.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(set_id=set_id, file_id=file_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickersStateReplacesticker, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        set_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        file_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(set_id=set_id, file_id=file_id), cursor
+
+
+class StickersStateNewemojipack(TLObject):
+    __tl_id__ = 0x3d1302b7
+    __tl_name__ = "types.internal_stickersbot.StickersStateNewemojipack"
+    __tl_layer__ = 201
+
+    __slots__ = ("type_", "name", "stickers", )
+
+    def __init__(self, *, type_: tl.base.internal_stickersbot.EmojiPackType, name: str | None = None, stickers: list[tl.base.internal_stickersbot.NewpackInputSticker] | None = None):
+        self.type_ = type_
+        self.name = name
+        self.stickers = stickers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.name is not None: flags1 |= (1 << 0)
+        if self.stickers: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.type_.write_to(out, ctx)
+        if self.name is not None:
+            String.write_to(out, self.name)
+        if self.stickers:
+            TLObjectVector.write_to(out, self.stickers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickersStateNewemojipack:
+        flags1 = Int.read(stream)
+        type_ = TLObject.read(stream)
+        name = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        stickers = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(type_=type_, name=name, stickers=stickers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickersStateNewemojipack, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        type_, cursor = TLObject.read_from(view, cursor)
+        name, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        stickers, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(type_=type_, name=name, stickers=stickers), cursor
+
+
+class StickersStateAddemoji(TLObject):
+    __tl_id__ = 0xc7087987
+    __tl_name__ = "types.internal_stickersbot.StickersStateAddemoji"
+    __tl_layer__ = 201
+
+    __slots__ = ("set_id", "file_id", )
+
+    def __init__(self, *, set_id: int, file_id: int):
+        self.set_id = set_id
+        self.file_id = file_id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.set_id)
+        out += Long.write(self.file_id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickersStateAddemoji:
+        set_id = Long.read(stream)
+        file_id = Long.read(stream)
+        return cls(set_id=set_id, file_id=file_id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickersStateAddemoji, int]:
+        set_id, cursor = Long.read_from(view, cursor)
+        file_id, cursor = Long.read_from(view, cursor)
+        return cls(set_id=set_id, file_id=file_id), cursor
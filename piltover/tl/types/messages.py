@@ -0,0 +1,3707 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class Dialogs(TLObject):
+    __tl_id__ = 0x15ba6c40
+    __tl_name__ = "types.messages.Dialogs"
+    __tl_layer__ = 133
+
+    __slots__ = ("dialogs", "messages", "chats", "users", )
+
+    def __init__(self, *, dialogs: list[tl.base.Dialog], messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.dialogs = dialogs
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.dialogs, ctx)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Dialogs:
+        dialogs = TLObjectVector.read(stream)
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(dialogs=dialogs, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Dialogs, int]:
+        dialogs, cursor = TLObjectVector.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(dialogs=dialogs, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class DialogsSlice(TLObject):
+    __tl_id__ = 0x71e094f3
+    __tl_name__ = "types.messages.DialogsSlice"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "dialogs", "messages", "chats", "users", )
+
+    def __init__(self, *, count: int, dialogs: list[tl.base.Dialog], messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.count = count
+        self.dialogs = dialogs
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.dialogs, ctx)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DialogsSlice:
+        count = Int.read(stream)
+        dialogs = TLObjectVector.read(stream)
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, dialogs=dialogs, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DialogsSlice, int]:
+        count, cursor = Int.read_from(view, cursor)
+        dialogs, cursor = TLObjectVector.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, dialogs=dialogs, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class DialogsNotModified(TLObject):
+    __tl_id__ = 0xf0e3e596
+    __tl_name__ = "types.messages.DialogsNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", )
+
+    def __init__(self, *, count: int):
+        self.count = count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DialogsNotModified:
+        count = Int.read(stream)
+        return cls(count=count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DialogsNotModified, int]:
+        count, cursor = Int.read_from(view, cursor)
+        return cls(count=count), cursor
+
+
+class Messages(TLObject):
+    __tl_id__ = 0x8c718e87
+    __tl_name__ = "types.messages.Messages"
+    __tl_layer__ = 133
+
+    __slots__ = ("messages", "chats", "users", )
+
+    def __init__(self, *, messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Messages:
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Messages, int]:
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class MessagesSlice(TLObject):
+    __tl_id__ = 0x3a54685e
+    __tl_name__ = "types.messages.MessagesSlice"
+    __tl_layer__ = 133
+
+    __slots__ = ("inexact", "count", "next_rate", "offset_id_offset", "messages", "chats", "users", )
+
+    def __init__(self, *, count: int, messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User], inexact: bool = False, next_rate: int | None = None, offset_id_offset: int | None = None):
+        self.inexact = inexact
+        self.count = count
+        self.next_rate = next_rate
+        self.offset_id_offset = offset_id_offset
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.inexact: flags1 |= (1 << 1)
+        if self.next_rate is not None: flags1 |= (1 << 0)
+        if self.offset_id_offset is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        if self.next_rate is not None:
+            out += Int.write(self.next_rate)
+        if self.offset_id_offset is not None:
+            out += Int.write(self.offset_id_offset)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessagesSlice:
+        flags1 = Int.read(stream)
+        inexact = (flags1 & (1 << 1)) == (1 << 1)
+        count = Int.read(stream)
+        next_rate = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        offset_id_offset = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(inexact=inexact, count=count, next_rate=next_rate, offset_id_offset=offset_id_offset, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessagesSlice, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        inexact = (flags1 & (1 << 1)) == (1 << 1)
+        count, cursor = Int.read_from(view, cursor)
+        next_rate, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        offset_id_offset, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(inexact=inexact, count=count, next_rate=next_rate, offset_id_offset=offset_id_offset, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChannelMessagesBase(TLObject):
+    __tl_id__ = 0xc776ba4e
+    __tl_name__ = "types.messages.ChannelMessages"
+    __tl_layer__ = 150
+
+    __slots__ = ("inexact", "pts", "count", "offset_id_offset", "messages", "topics", "chats", "users", )
+
+    def __init__(self, *, pts: int, count: int, messages: list[tl.base.Message], topics: list[tl.base.ForumTopic], chats: list[tl.base.Chat], users: list[tl.base.User], inexact: bool = False, offset_id_offset: int | None = None):
+        self.inexact = inexact
+        self.pts = pts
+        self.count = count
+        self.offset_id_offset = offset_id_offset
+        self.messages = messages
+        self.topics = topics
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.inexact: flags1 |= (1 << 1)
+        if self.offset_id_offset is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.pts)
+        out += Int.write(self.count)
+        if self.offset_id_offset is not None:
+            out += Int.write(self.offset_id_offset)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.topics, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelMessages:
+        flags1 = Int.read(stream)
+        inexact = (flags1 & (1 << 1)) == (1 << 1)
+        pts = Int.read(stream)
+        count = Int.read(stream)
+        offset_id_offset = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        messages = TLObjectVector.read(stream)
+        topics = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(inexact=inexact, pts=pts, count=count, offset_id_offset=offset_id_offset, messages=messages, topics=topics, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelMessages, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        inexact = (flags1 & (1 << 1)) == (1 << 1)
+        pts, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        offset_id_offset, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        topics, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(inexact=inexact, pts=pts, count=count, offset_id_offset=offset_id_offset, messages=messages, topics=topics, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class MessagesNotModified(TLObject):
+    __tl_id__ = 0x74535f21
+    __tl_name__ = "types.messages.MessagesNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", )
+
+    def __init__(self, *, count: int):
+        self.count = count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessagesNotModified:
+        count = Int.read(stream)
+        return cls(count=count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessagesNotModified, int]:
+        count, cursor = Int.read_from(view, cursor)
+        return cls(count=count), cursor
+
+
+class Chats(TLObject):
+    __tl_id__ = 0x64ff9fd5
+    __tl_name__ = "types.messages.Chats"
+    __tl_layer__ = 133
+
+    __slots__ = ("chats", )
+
+    def __init__(self, *, chats: list[tl.base.Chat]):
+        self.chats = chats
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.chats, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Chats:
+        chats = TLObjectVector.read(stream)
+        return cls(chats=chats)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Chats, int]:
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(chats=chats), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+
+
+class ChatsSlice(TLObject):
+    __tl_id__ = 0x9cd81144
+    __tl_name__ = "types.messages.ChatsSlice"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "chats", )
+
+    def __init__(self, *, count: int, chats: list[tl.base.Chat]):
+        self.count = count
+        self.chats = chats
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.chats, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatsSlice:
+        count = Int.read(stream)
+        chats = TLObjectVector.read(stream)
+        return cls(count=count, chats=chats)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatsSlice, int]:
+        count, cursor = Int.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, chats=chats), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+
+
+class ChatFull(TLObject):
+    __tl_id__ = 0xe5d7d19c
+    __tl_name__ = "types.messages.ChatFull"
+    __tl_layer__ = 133
+
+    __slots__ = ("full_chat", "chats", "users", )
+
+    def __init__(self, *, full_chat: tl.base.ChatFull, chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.full_chat = full_chat
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.full_chat.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatFull:
+        full_chat = TLObject.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(full_chat=full_chat, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatFull, int]:
+        full_chat, cursor = TLObject.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(full_chat=full_chat, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.full_chat.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class AffectedHistory(TLObject):
+    __tl_id__ = 0xb45c69d1
+    __tl_name__ = "types.messages.AffectedHistory"
+    __tl_layer__ = 133
+
+    __slots__ = ("pts", "pts_count", "offset", )
+
+    def __init__(self, *, pts: int, pts_count: int, offset: int):
+        self.pts = pts
+        self.pts_count = pts_count
+        self.offset = offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.pts)
+        out += Int.write(self.pts_count)
+        out += Int.write(self.offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AffectedHistory:
+        pts = Int.read(stream)
+        pts_count = Int.read(stream)
+        offset = Int.read(stream)
+        return cls(pts=pts, pts_count=pts_count, offset=offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AffectedHistory, int]:
+        pts, cursor = Int.read_from(view, cursor)
+        pts_count, cursor = Int.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        return cls(pts=pts, pts_count=pts_count, offset=offset), cursor
+
+
+class DhConfigNotModified(TLObject):
+    __tl_id__ = 0xc0e24635
+    __tl_name__ = "types.messages.DhConfigNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ("random", )
+
+    def __init__(self, *, random: bytes):
+        self.random = random
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.random)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DhConfigNotModified:
+        random = Bytes.read(stream)
+        return cls(random=random)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DhConfigNotModified, int]:
+        random, cursor = Bytes.read_from(view, cursor)
+        return cls(random=random), cursor
+
+
+class DhConfig(TLObject):
+    __tl_id__ = 0x2c221edd
+    __tl_name__ = "types.messages.DhConfig"
+    __tl_layer__ = 133
+
+    __slots__ = ("g", "p", "version", "random", )
+
+    def __init__(self, *, g: int, p: bytes, version: int, random: bytes):
+        self.g = g
+        self.p = p
+        self.version = version
+        self.random = random
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.g)
+        Bytes.write_to(out, self.p)
+        out += Int.write(self.version)
+        Bytes.write_to(out, self.random)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DhConfig:
+        g = Int.read(stream)
+        p = Bytes.read(stream)
+        version = Int.read(stream)
+        random = Bytes.read(stream)
+        return cls(g=g, p=p, version=version, random=random)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DhConfig, int]:
+        g, cursor = Int.read_from(view, cursor)
+        p, cursor = Bytes.read_from(view, cursor)
+        version, cursor = Int.read_from(view, cursor)
+        random, cursor = Bytes.read_from(view, cursor)
+        return cls(g=g, p=p, version=version, random=random), cursor
+
+
+class SentEncryptedMessage(TLObject):
+    __tl_id__ = 0x560f8935
+    __tl_name__ = "types.messages.SentEncryptedMessage"
+    __tl_layer__ = 133
+
+    __slots__ = ("date", )
+
+    def __init__(self, *, date: int):
+        self.date = date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentEncryptedMessage:
+        date = Int.read(stream)
+        return cls(date=date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentEncryptedMessage, int]:
+        date, cursor = Int.read_from(view, cursor)
+        return cls(date=date), cursor
+
+
+class SentEncryptedFile(TLObject):
+    __tl_id__ = 0x9493ff32
+    __tl_name__ = "types.messages.SentEncryptedFile"
+    __tl_layer__ = 133
+
+    __slots__ = ("date", "file", )
+
+    def __init__(self, *, date: int, file: tl.base.EncryptedFile):
+        self.date = date
+        self.file = file
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.date)
+        self.file.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SentEncryptedFile:
+        date = Int.read(stream)
+        file = TLObject.read(stream)
+        return cls(date=date, file=file)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SentEncryptedFile, int]:
+        date, cursor = Int.read_from(view, cursor)
+        file, cursor = TLObject.read_from(view, cursor)
+        return cls(date=date, file=file), cursor
+
+
+class StickersNotModified(TLObject):
+    __tl_id__ = 0xf1749a22
+    __tl_name__ = "types.messages.StickersNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickersNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickersNotModified, int]:
+        return cls(), cursor
+
+
+class Stickers(TLObject):
+    __tl_id__ = 0x30a6ec7e
+    __tl_name__ = "types.messages.Stickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "stickers", )
+
+    def __init__(self, *, hash: int, stickers: list[tl.base.Document]):
+        self.hash = hash
+        self.stickers = stickers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.stickers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Stickers:
+        hash = Long.read(stream)
+        stickers = TLObjectVector.read(stream)
+        return cls(hash=hash, stickers=stickers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Stickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        stickers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, stickers=stickers), cursor
+
+
+class AllStickersNotModified(TLObject):
+    __tl_id__ = 0xe86602c3
+    __tl_name__ = "types.messages.AllStickersNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AllStickersNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AllStickersNotModified, int]:
+        return cls(), cursor
+
+
+class AllStickers(TLObject):
+    __tl_id__ = 0xcdbbcebb
+    __tl_name__ = "types.messages.AllStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "sets", )
+
+    def __init__(self, *, hash: int, sets: list[tl.base.StickerSet]):
+        self.hash = hash
+        self.sets = sets
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.sets, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AllStickers:
+        hash = Long.read(stream)
+        sets = TLObjectVector.read(stream)
+        return cls(hash=hash, sets=sets)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AllStickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        sets, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, sets=sets), cursor
+
+
+class AffectedMessages(TLObject):
+    __tl_id__ = 0x84d19185
+    __tl_name__ = "types.messages.AffectedMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("pts", "pts_count", )
+
+    def __init__(self, *, pts: int, pts_count: int):
+        self.pts = pts
+        self.pts_count = pts_count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.pts)
+        out += Int.write(self.pts_count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AffectedMessages:
+        pts = Int.read(stream)
+        pts_count = Int.read(stream)
+        return cls(pts=pts, pts_count=pts_count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AffectedMessages, int]:
+        pts, cursor = Int.read_from(view, cursor)
+        pts_count, cursor = Int.read_from(view, cursor)
+        return cls(pts=pts, pts_count=pts_count), cursor
+
+
+class StickerSetBase(TLObject):
+    __tl_id__ = 0x6e153f16
+    __tl_name__ = "types.messages.StickerSet"
+    __tl_layer__ = 147
+
+    __slots__ = ("set", "packs", "keywords", "documents", )
+
+    def __init__(self, *, set: tl.base.StickerSet, packs: list[tl.base.StickerPack], keywords: list[tl.base.StickerKeyword], documents: list[tl.base.Document]):
+        self.set = set
+        self.packs = packs
+        self.keywords = keywords
+        self.documents = documents
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.set.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.packs, ctx)
+        TLObjectVector.write_to(out, self.keywords, ctx)
+        TLObjectVector.write_to(out, self.documents, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickerSet:
+        set = TLObject.read(stream)
+        packs = TLObjectVector.read(stream)
+        keywords = TLObjectVector.read(stream)
+        documents = TLObjectVector.read(stream)
+        return cls(set=set, packs=packs, keywords=keywords, documents=documents)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickerSet, int]:
+        set, cursor = TLObject.read_from(view, cursor)
+        packs, cursor = TLObjectVector.read_from(view, cursor)
+        keywords, cursor = TLObjectVector.read_from(view, cursor)
+        documents, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(set=set, packs=packs, keywords=keywords, documents=documents), cursor
+
+
+class StickerSetNotModified(TLObject):
+    __tl_id__ = 0xd3f924eb
+    __tl_name__ = "types.messages.StickerSetNotModified"
+    __tl_layer__ = 135
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickerSetNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickerSetNotModified, int]:
+        return cls(), cursor
+
+
+class SavedGifsNotModified(TLObject):
+    __tl_id__ = 0xe8025ca2
+    __tl_name__ = "types.messages.SavedGifsNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedGifsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedGifsNotModified, int]:
+        return cls(), cursor
+
+
+class SavedGifs(TLObject):
+    __tl_id__ = 0x84a02a0d
+    __tl_name__ = "types.messages.SavedGifs"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "gifs", )
+
+    def __init__(self, *, hash: int, gifs: list[tl.base.Document]):
+        self.hash = hash
+        self.gifs = gifs
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.gifs, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedGifs:
+        hash = Long.read(stream)
+        gifs = TLObjectVector.read(stream)
+        return cls(hash=hash, gifs=gifs)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedGifs, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        gifs, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, gifs=gifs), cursor
+
+
+class BotResultsBase(TLObject):
+    __tl_id__ = 0xe021f2f6
+    __tl_name__ = "types.messages.BotResults"
+    __tl_layer__ = 155
+
+    __slots__ = ("gallery", "query_id", "next_offset", "switch_pm", "switch_webview", "results", "cache_time", "users", )
+
+    def __init__(self, *, query_id: int, results: list[tl.base.BotInlineResult], cache_time: int, users: list[tl.base.User], gallery: bool = False, next_offset: str | None = None, switch_pm: tl.types.InlineBotSwitchPM | None = None, switch_webview: tl.types.InlineBotWebView | None = None):
+        self.gallery = gallery
+        self.query_id = query_id
+        self.next_offset = next_offset
+        self.switch_pm = switch_pm
+        self.switch_webview = switch_webview
+        self.results = results
+        self.cache_time = cache_time
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.gallery: flags1 |= (1 << 0)
+        if self.next_offset is not None: flags1 |= (1 << 1)
+        if self.switch_pm is not None: flags1 |= (1 << 2)
+        if self.switch_webview is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        out += Long.write(self.query_id)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        if self.switch_pm is not None:
+            self.switch_pm.write_to(out, ctx)
+        if self.switch_webview is not None:
+            self.switch_webview.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.results, ctx)
+        out += Int.write(self.cache_time)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BotResults:
+        flags1 = Int.read(stream)
+        gallery = (flags1 & (1 << 0)) == (1 << 0)
+        query_id = Long.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        switch_pm = tl.types.InlineBotSwitchPM.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        switch_webview = tl.types.InlineBotWebView.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        results = TLObjectVector.read(stream)
+        cache_time = Int.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(gallery=gallery, query_id=query_id, next_offset=next_offset, switch_pm=switch_pm, switch_webview=switch_webview, results=results, cache_time=cache_time, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BotResults, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        gallery = (flags1 & (1 << 0)) == (1 << 0)
+        query_id, cursor = Long.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        switch_pm, cursor = tl.types.InlineBotSwitchPM.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        switch_webview, cursor = tl.types.InlineBotWebView.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        results, cursor = TLObjectVector.read_from(view, cursor)
+        cache_time, cursor = Int.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(gallery=gallery, query_id=query_id, next_offset=next_offset, switch_pm=switch_pm, switch_webview=switch_webview, results=results, cache_time=cache_time, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class BotCallbackAnswer(TLObject):
+    __tl_id__ = 0x36585ea4
+    __tl_name__ = "types.messages.BotCallbackAnswer"
+    __tl_layer__ = 133
+
+    __slots__ = ("alert", "has_url", "native_ui", "message", "url", "cache_time", )
+
+    def __init__(self, *, cache_time: int, alert: bool = False, has_url: bool = False, native_ui: bool = False, message: str | None = None, url: str | None = None):
+        self.alert = alert
+        self.has_url = has_url
+        self.native_ui = native_ui
+        self.message = message
+        self.url = url
+        self.cache_time = cache_time
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.alert: flags1 |= (1 << 1)
+        if self.has_url: flags1 |= (1 << 3)
+        if self.native_ui: flags1 |= (1 << 4)
+        if self.message is not None: flags1 |= (1 << 0)
+        if self.url is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.message is not None:
+            String.write_to(out, self.message)
+        if self.url is not None:
+            String.write_to(out, self.url)
+        out += Int.write(self.cache_time)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BotCallbackAnswer:
+        flags1 = Int.read(stream)
+        alert = (flags1 & (1 << 1)) == (1 << 1)
+        has_url = (flags1 & (1 << 3)) == (1 << 3)
+        native_ui = (flags1 & (1 << 4)) == (1 << 4)
+        message = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        url = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        cache_time = Int.read(stream)
+        return cls(alert=alert, has_url=has_url, native_ui=native_ui, message=message, url=url, cache_time=cache_time)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BotCallbackAnswer, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        alert = (flags1 & (1 << 1)) == (1 << 1)
+        has_url = (flags1 & (1 << 3)) == (1 << 3)
+        native_ui = (flags1 & (1 << 4)) == (1 << 4)
+        message, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        url, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        cache_time, cursor = Int.read_from(view, cursor)
+        return cls(alert=alert, has_url=has_url, native_ui=native_ui, message=message, url=url, cache_time=cache_time), cursor
+
+
+class MessageEditData(TLObject):
+    __tl_id__ = 0x26b5dde6
+    __tl_name__ = "types.messages.MessageEditData"
+    __tl_layer__ = 133
+
+    __slots__ = ("caption", )
+
+    def __init__(self, *, caption: bool = False):
+        self.caption = caption
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.caption: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageEditData:
+        flags1 = Int.read(stream)
+        caption = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(caption=caption)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageEditData, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        caption = (flags1 & (1 << 0)) == (1 << 0)
+        return cls(caption=caption), cursor
+
+
+class PeerDialogs(TLObject):
+    __tl_id__ = 0x3371c354
+    __tl_name__ = "types.messages.PeerDialogs"
+    __tl_layer__ = 133
+
+    __slots__ = ("dialogs", "messages", "chats", "users", "state", )
+
+    def __init__(self, *, dialogs: list[tl.base.Dialog], messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User], state: tl.types.updates.State):
+        self.dialogs = dialogs
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+        self.state = state
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.dialogs, ctx)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        self.state.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerDialogs:
+        dialogs = TLObjectVector.read(stream)
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        state = tl.types.updates.State.read(stream)
+        return cls(dialogs=dialogs, messages=messages, chats=chats, users=users, state=state)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerDialogs, int]:
+        dialogs, cursor = TLObjectVector.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        state, cursor = tl.types.updates.State.read_from(view, cursor)
+        return cls(dialogs=dialogs, messages=messages, chats=chats, users=users, state=state), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class FeaturedStickersNotModified(TLObject):
+    __tl_id__ = 0xc6dc0c66
+    __tl_name__ = "types.messages.FeaturedStickersNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", )
+
+    def __init__(self, *, count: int):
+        self.count = count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FeaturedStickersNotModified:
+        count = Int.read(stream)
+        return cls(count=count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FeaturedStickersNotModified, int]:
+        count, cursor = Int.read_from(view, cursor)
+        return cls(count=count), cursor
+
+
+class FeaturedStickersBase(TLObject):
+    __tl_id__ = 0xbe382906
+    __tl_name__ = "types.messages.FeaturedStickers"
+    __tl_layer__ = 143
+
+    __slots__ = ("premium", "hash", "count", "sets", "unread", )
+
+    def __init__(self, *, hash: int, count: int, sets: list[tl.base.StickerSetCovered], unread: list[int], premium: bool = False):
+        self.premium = premium
+        self.hash = hash
+        self.count = count
+        self.sets = sets
+        self.unread = unread
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.premium: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Long.write(self.hash)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.sets, ctx)
+        out += LongVector.write(self.unread)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FeaturedStickers:
+        flags1 = Int.read(stream)
+        premium = (flags1 & (1 << 0)) == (1 << 0)
+        hash = Long.read(stream)
+        count = Int.read(stream)
+        sets = TLObjectVector.read(stream)
+        unread = LongVector.read(stream)
+        return cls(premium=premium, hash=hash, count=count, sets=sets, unread=unread)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FeaturedStickers, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        premium = (flags1 & (1 << 0)) == (1 << 0)
+        hash, cursor = Long.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        sets, cursor = TLObjectVector.read_from(view, cursor)
+        unread, cursor = LongVector.read_from(view, cursor)
+        return cls(premium=premium, hash=hash, count=count, sets=sets, unread=unread), cursor
+
+
+class RecentStickersNotModified(TLObject):
+    __tl_id__ = 0xb17f890
+    __tl_name__ = "types.messages.RecentStickersNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RecentStickersNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RecentStickersNotModified, int]:
+        return cls(), cursor
+
+
+class RecentStickers(TLObject):
+    __tl_id__ = 0x88d37c56
+    __tl_name__ = "types.messages.RecentStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "packs", "stickers", "dates", )
+
+    def __init__(self, *, hash: int, packs: list[tl.base.StickerPack], stickers: list[tl.base.Document], dates: list[int]):
+        self.hash = hash
+        self.packs = packs
+        self.stickers = stickers
+        self.dates = dates
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.packs, ctx)
+        TLObjectVector.write_to(out, self.stickers, ctx)
+        out += IntVector.write(self.dates)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> RecentStickers:
+        hash = Long.read(stream)
+        packs = TLObjectVector.read(stream)
+        stickers = TLObjectVector.read(stream)
+        dates = IntVector.read(stream)
+        return cls(hash=hash, packs=packs, stickers=stickers, dates=dates)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[RecentStickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        packs, cursor = TLObjectVector.read_from(view, cursor)
+        stickers, cursor = TLObjectVector.read_from(view, cursor)
+        dates, cursor = IntVector.read_from(view, cursor)
+        return cls(hash=hash, packs=packs, stickers=stickers, dates=dates), cursor
+
+
+class ArchivedStickers(TLObject):
+    __tl_id__ = 0x4fcba9c8
+    __tl_name__ = "types.messages.ArchivedStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "sets", )
+
+    def __init__(self, *, count: int, sets: list[tl.base.StickerSetCovered]):
+        self.count = count
+        self.sets = sets
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.sets, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ArchivedStickers:
+        count = Int.read(stream)
+        sets = TLObjectVector.read(stream)
+        return cls(count=count, sets=sets)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ArchivedStickers, int]:
+        count, cursor = Int.read_from(view, cursor)
+        sets, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, sets=sets), cursor
+
+
+class StickerSetInstallResultSuccess(TLObject):
+    __tl_id__ = 0x38641628
+    __tl_name__ = "types.messages.StickerSetInstallResultSuccess"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickerSetInstallResultSuccess:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickerSetInstallResultSuccess, int]:
+        return cls(), cursor
+
+
+class StickerSetInstallResultArchive(TLObject):
+    __tl_id__ = 0x35e410a8
+    __tl_name__ = "types.messages.StickerSetInstallResultArchive"
+    __tl_layer__ = 133
+
+    __slots__ = ("sets", )
+
+    def __init__(self, *, sets: list[tl.base.StickerSetCovered]):
+        self.sets = sets
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.sets, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickerSetInstallResultArchive:
+        sets = TLObjectVector.read(stream)
+        return cls(sets=sets)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickerSetInstallResultArchive, int]:
+        sets, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(sets=sets), cursor
+
+
+class HighScores(TLObject):
+    __tl_id__ = 0x9a3bfd99
+    __tl_name__ = "types.messages.HighScores"
+    __tl_layer__ = 133
+
+    __slots__ = ("scores", "users", )
+
+    def __init__(self, *, scores: list[tl.base.HighScore], users: list[tl.base.User]):
+        self.scores = scores
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.scores, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> HighScores:
+        scores = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(scores=scores, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[HighScores, int]:
+        scores, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(scores=scores, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class FavedStickersNotModified(TLObject):
+    __tl_id__ = 0x9e8fa6d3
+    __tl_name__ = "types.messages.FavedStickersNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FavedStickersNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FavedStickersNotModified, int]:
+        return cls(), cursor
+
+
+class FavedStickers(TLObject):
+    __tl_id__ = 0x2cb51097
+    __tl_name__ = "types.messages.FavedStickers"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "packs", "stickers", )
+
+    def __init__(self, *, hash: int, packs: list[tl.base.StickerPack], stickers: list[tl.base.Document]):
+        self.hash = hash
+        self.packs = packs
+        self.stickers = stickers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.packs, ctx)
+        TLObjectVector.write_to(out, self.stickers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FavedStickers:
+        hash = Long.read(stream)
+        packs = TLObjectVector.read(stream)
+        stickers = TLObjectVector.read(stream)
+        return cls(hash=hash, packs=packs, stickers=stickers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FavedStickers, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        packs, cursor = TLObjectVector.read_from(view, cursor)
+        stickers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, packs=packs, stickers=stickers), cursor
+
+
+class FoundStickerSetsNotModified(TLObject):
+    __tl_id__ = 0xd54b65d
+    __tl_name__ = "types.messages.FoundStickerSetsNotModified"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FoundStickerSetsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FoundStickerSetsNotModified, int]:
+        return cls(), cursor
+
+
+class FoundStickerSets(TLObject):
+    __tl_id__ = 0x8af09dd2
+    __tl_name__ = "types.messages.FoundStickerSets"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "sets", )
+
+    def __init__(self, *, hash: int, sets: list[tl.base.StickerSetCovered]):
+        self.hash = hash
+        self.sets = sets
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.sets, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FoundStickerSets:
+        hash = Long.read(stream)
+        sets = TLObjectVector.read(stream)
+        return cls(hash=hash, sets=sets)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FoundStickerSets, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        sets, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, sets=sets), cursor
+
+
+class SearchCounter(TLObject):
+    __tl_id__ = 0xe844ebff
+    __tl_name__ = "types.messages.SearchCounter"
+    __tl_layer__ = 133
+
+    __slots__ = ("inexact", "filter", "count", )
+
+    def __init__(self, *, filter: tl.base.MessagesFilter, count: int, inexact: bool = False):
+        self.inexact = inexact
+        self.filter = filter
+        self.count = count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.inexact: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.filter.write_to(out, ctx)
+        out += Int.write(self.count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchCounter:
+        flags1 = Int.read(stream)
+        inexact = (flags1 & (1 << 1)) == (1 << 1)
+        filter = TLObject.read(stream)
+        count = Int.read(stream)
+        return cls(inexact=inexact, filter=filter, count=count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchCounter, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        inexact = (flags1 & (1 << 1)) == (1 << 1)
+        filter, cursor = TLObject.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        return cls(inexact=inexact, filter=filter, count=count), cursor
+
+
+class InactiveChats(TLObject):
+    __tl_id__ = 0xa927fec5
+    __tl_name__ = "types.messages.InactiveChats"
+    __tl_layer__ = 133
+
+    __slots__ = ("dates", "chats", "users", )
+
+    def __init__(self, *, dates: list[int], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.dates = dates
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += IntVector.write(self.dates)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InactiveChats:
+        dates = IntVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(dates=dates, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InactiveChats, int]:
+        dates, cursor = IntVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(dates=dates, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class VotesListBase(TLObject):
+    __tl_id__ = 0x4899484e
+    __tl_name__ = "types.messages.VotesList"
+    __tl_layer__ = 160
+
+    __slots__ = ("count", "votes", "chats", "users", "next_offset", )
+
+    def __init__(self, *, count: int, votes: list[tl.base.MessagePeerVote], chats: list[tl.base.Chat], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.votes = votes
+        self.chats = chats
+        self.users = users
+        self.next_offset = next_offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.votes, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> VotesList:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        votes = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(count=count, votes=votes, chats=chats, users=users, next_offset=next_offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[VotesList, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        votes, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(count=count, votes=votes, chats=chats, users=users, next_offset=next_offset), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class MessageViews(TLObject):
+    __tl_id__ = 0xb6c4f543
+    __tl_name__ = "types.messages.MessageViews"
+    __tl_layer__ = 133
+
+    __slots__ = ("views", "chats", "users", )
+
+    def __init__(self, *, views: list[tl.base.MessageViews], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.views = views
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.views, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageViews:
+        views = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(views=views, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageViews, int]:
+        views, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(views=views, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class DiscussionMessage(TLObject):
+    __tl_id__ = 0xa6341782
+    __tl_name__ = "types.messages.DiscussionMessage"
+    __tl_layer__ = 133
+
+    __slots__ = ("messages", "max_id", "read_inbox_max_id", "read_outbox_max_id", "unread_count", "chats", "users", )
+
+    def __init__(self, *, messages: list[tl.base.Message], unread_count: int, chats: list[tl.base.Chat], users: list[tl.base.User], max_id: int | None = None, read_inbox_max_id: int | None = None, read_outbox_max_id: int | None = None):
+        self.messages = messages
+        self.max_id = max_id
+        self.read_inbox_max_id = read_inbox_max_id
+        self.read_outbox_max_id = read_outbox_max_id
+        self.unread_count = unread_count
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.max_id is not None: flags1 |= (1 << 0)
+        if self.read_inbox_max_id is not None: flags1 |= (1 << 1)
+        if self.read_outbox_max_id is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        if self.max_id is not None:
+            out += Int.write(self.max_id)
+        if self.read_inbox_max_id is not None:
+            out += Int.write(self.read_inbox_max_id)
+        if self.read_outbox_max_id is not None:
+            out += Int.write(self.read_outbox_max_id)
+        out += Int.write(self.unread_count)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DiscussionMessage:
+        flags1 = Int.read(stream)
+        messages = TLObjectVector.read(stream)
+        max_id = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        read_inbox_max_id = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        read_outbox_max_id = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        unread_count = Int.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(messages=messages, max_id=max_id, read_inbox_max_id=read_inbox_max_id, read_outbox_max_id=read_outbox_max_id, unread_count=unread_count, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DiscussionMessage, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        max_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        read_inbox_max_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        read_outbox_max_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        unread_count, cursor = Int.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(messages=messages, max_id=max_id, read_inbox_max_id=read_inbox_max_id, read_outbox_max_id=read_outbox_max_id, unread_count=unread_count, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class HistoryImport(TLObject):
+    __tl_id__ = 0x1662af0b
+    __tl_name__ = "types.messages.HistoryImport"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", )
+
+    def __init__(self, *, id: int):
+        self.id = id
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.id)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> HistoryImport:
+        id = Long.read(stream)
+        return cls(id=id)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[HistoryImport, int]:
+        id, cursor = Long.read_from(view, cursor)
+        return cls(id=id), cursor
+
+
+class HistoryImportParsed(TLObject):
+    __tl_id__ = 0x5e0fb7b9
+    __tl_name__ = "types.messages.HistoryImportParsed"
+    __tl_layer__ = 133
+
+    __slots__ = ("pm", "group", "title", )
+
+    def __init__(self, *, pm: bool = False, group: bool = False, title: str | None = None):
+        self.pm = pm
+        self.group = group
+        self.title = title
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pm: flags1 |= (1 << 0)
+        if self.group: flags1 |= (1 << 1)
+        if self.title is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        if self.title is not None:
+            String.write_to(out, self.title)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> HistoryImportParsed:
+        flags1 = Int.read(stream)
+        pm = (flags1 & (1 << 0)) == (1 << 0)
+        group = (flags1 & (1 << 1)) == (1 << 1)
+        title = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(pm=pm, group=group, title=title)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[HistoryImportParsed, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pm = (flags1 & (1 << 0)) == (1 << 0)
+        group = (flags1 & (1 << 1)) == (1 << 1)
+        title, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(pm=pm, group=group, title=title), cursor
+
+
+class AffectedFoundMessages(TLObject):
+    __tl_id__ = 0xef8d3e6c
+    __tl_name__ = "types.messages.AffectedFoundMessages"
+    __tl_layer__ = 133
+
+    __slots__ = ("pts", "pts_count", "offset", "messages", )
+
+    def __init__(self, *, pts: int, pts_count: int, offset: int, messages: list[int]):
+        self.pts = pts
+        self.pts_count = pts_count
+        self.offset = offset
+        self.messages = messages
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.pts)
+        out += Int.write(self.pts_count)
+        out += Int.write(self.offset)
+        out += IntVector.write(self.messages)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AffectedFoundMessages:
+        pts = Int.read(stream)
+        pts_count = Int.read(stream)
+        offset = Int.read(stream)
+        messages = IntVector.read(stream)
+        return cls(pts=pts, pts_count=pts_count, offset=offset, messages=messages)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AffectedFoundMessages, int]:
+        pts, cursor = Int.read_from(view, cursor)
+        pts_count, cursor = Int.read_from(view, cursor)
+        offset, cursor = Int.read_from(view, cursor)
+        messages, cursor = IntVector.read_from(view, cursor)
+        return cls(pts=pts, pts_count=pts_count, offset=offset, messages=messages), cursor
+
+
+class ExportedChatInvites(TLObject):
+    __tl_id__ = 0xbdc62dcc
+    __tl_name__ = "types.messages.ExportedChatInvites"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "invites", "users", )
+
+    def __init__(self, *, count: int, invites: list[tl.base.ExportedChatInvite], users: list[tl.base.User]):
+        self.count = count
+        self.invites = invites
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.invites, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportedChatInvites:
+        count = Int.read(stream)
+        invites = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, invites=invites, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportedChatInvites, int]:
+        count, cursor = Int.read_from(view, cursor)
+        invites, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, invites=invites, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ExportedChatInvite(TLObject):
+    __tl_id__ = 0x1871be50
+    __tl_name__ = "types.messages.ExportedChatInvite"
+    __tl_layer__ = 133
+
+    __slots__ = ("invite", "users", )
+
+    def __init__(self, *, invite: tl.base.ExportedChatInvite, users: list[tl.base.User]):
+        self.invite = invite
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.invite.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportedChatInvite:
+        invite = TLObject.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(invite=invite, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportedChatInvite, int]:
+        invite, cursor = TLObject.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(invite=invite, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ExportedChatInviteReplaced(TLObject):
+    __tl_id__ = 0x222600ef
+    __tl_name__ = "types.messages.ExportedChatInviteReplaced"
+    __tl_layer__ = 133
+
+    __slots__ = ("invite", "new_invite", "users", )
+
+    def __init__(self, *, invite: tl.base.ExportedChatInvite, new_invite: tl.base.ExportedChatInvite, users: list[tl.base.User]):
+        self.invite = invite
+        self.new_invite = new_invite
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.invite.write_to(out, ctx)
+        self.new_invite.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportedChatInviteReplaced:
+        invite = TLObject.read(stream)
+        new_invite = TLObject.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(invite=invite, new_invite=new_invite, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportedChatInviteReplaced, int]:
+        invite, cursor = TLObject.read_from(view, cursor)
+        new_invite, cursor = TLObject.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(invite=invite, new_invite=new_invite, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChatInviteImporters(TLObject):
+    __tl_id__ = 0x81b6b00a
+    __tl_name__ = "types.messages.ChatInviteImporters"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "importers", "users", )
+
+    def __init__(self, *, count: int, importers: list[tl.base.ChatInviteImporter], users: list[tl.base.User]):
+        self.count = count
+        self.importers = importers
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.importers, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatInviteImporters:
+        count = Int.read(stream)
+        importers = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, importers=importers, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatInviteImporters, int]:
+        count, cursor = Int.read_from(view, cursor)
+        importers, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, importers=importers, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChatAdminsWithInvites(TLObject):
+    __tl_id__ = 0xb69b72d7
+    __tl_name__ = "types.messages.ChatAdminsWithInvites"
+    __tl_layer__ = 133
+
+    __slots__ = ("admins", "users", )
+
+    def __init__(self, *, admins: list[tl.base.ChatAdminWithInvites], users: list[tl.base.User]):
+        self.admins = admins
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.admins, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChatAdminsWithInvites:
+        admins = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(admins=admins, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChatAdminsWithInvites, int]:
+        admins, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(admins=admins, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class CheckedHistoryImportPeer(TLObject):
+    __tl_id__ = 0xa24de717
+    __tl_name__ = "types.messages.CheckedHistoryImportPeer"
+    __tl_layer__ = 133
+
+    __slots__ = ("confirm_text", )
+
+    def __init__(self, *, confirm_text: str):
+        self.confirm_text = confirm_text
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.confirm_text)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckedHistoryImportPeer:
+        confirm_text = String.read(stream)
+        return cls(confirm_text=confirm_text)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckedHistoryImportPeer, int]:
+        confirm_text, cursor = String.read_from(view, cursor)
+        return cls(confirm_text=confirm_text), cursor
+
+
+class SponsoredMessagesBase(TLObject):
+    __tl_id__ = 0xc9ee1d87
+    __tl_name__ = "types.messages.SponsoredMessages"
+    __tl_layer__ = 148
+
+    __slots__ = ("posts_between", "messages", "chats", "users", )
+
+    def __init__(self, *, messages: list[tl.base.SponsoredMessage], chats: list[tl.base.Chat], users: list[tl.base.User], posts_between: int | None = None):
+        self.posts_between = posts_between
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.posts_between is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.posts_between is not None:
+            out += Int.write(self.posts_between)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SponsoredMessages:
+        flags1 = Int.read(stream)
+        posts_between = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(posts_between=posts_between, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SponsoredMessages, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        posts_between, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(posts_between=posts_between, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SponsoredMessagesEmpty(TLObject):
+    __tl_id__ = 0x1839490f
+    __tl_name__ = "types.messages.SponsoredMessagesEmpty"
+    __tl_layer__ = 148
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SponsoredMessagesEmpty:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SponsoredMessagesEmpty, int]:
+        return cls(), cursor
+
+
+class SearchResultsCalendar(TLObject):
+    __tl_id__ = 0x147ee23c
+    __tl_name__ = "types.messages.SearchResultsCalendar"
+    __tl_layer__ = 134
+
+    __slots__ = ("inexact", "count", "min_date", "min_msg_id", "offset_id_offset", "periods", "messages", "chats", "users", )
+
+    def __init__(self, *, count: int, min_date: int, min_msg_id: int, periods: list[tl.base.SearchResultsCalendarPeriod], messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User], inexact: bool = False, offset_id_offset: int | None = None):
+        self.inexact = inexact
+        self.count = count
+        self.min_date = min_date
+        self.min_msg_id = min_msg_id
+        self.offset_id_offset = offset_id_offset
+        self.periods = periods
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.inexact: flags1 |= (1 << 0)
+        if self.offset_id_offset is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        out += Int.write(self.min_date)
+        out += Int.write(self.min_msg_id)
+        if self.offset_id_offset is not None:
+            out += Int.write(self.offset_id_offset)
+        TLObjectVector.write_to(out, self.periods, ctx)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchResultsCalendar:
+        flags1 = Int.read(stream)
+        inexact = (flags1 & (1 << 0)) == (1 << 0)
+        count = Int.read(stream)
+        min_date = Int.read(stream)
+        min_msg_id = Int.read(stream)
+        offset_id_offset = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        periods = TLObjectVector.read(stream)
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(inexact=inexact, count=count, min_date=min_date, min_msg_id=min_msg_id, offset_id_offset=offset_id_offset, periods=periods, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchResultsCalendar, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        inexact = (flags1 & (1 << 0)) == (1 << 0)
+        count, cursor = Int.read_from(view, cursor)
+        min_date, cursor = Int.read_from(view, cursor)
+        min_msg_id, cursor = Int.read_from(view, cursor)
+        offset_id_offset, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        periods, cursor = TLObjectVector.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(inexact=inexact, count=count, min_date=min_date, min_msg_id=min_msg_id, offset_id_offset=offset_id_offset, periods=periods, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SearchResultsPositions(TLObject):
+    __tl_id__ = 0x53b22baf
+    __tl_name__ = "types.messages.SearchResultsPositions"
+    __tl_layer__ = 134
+
+    __slots__ = ("count", "positions", )
+
+    def __init__(self, *, count: int, positions: list[tl.base.SearchResultsPosition]):
+        self.count = count
+        self.positions = positions
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.positions, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SearchResultsPositions:
+        count = Int.read(stream)
+        positions = TLObjectVector.read(stream)
+        return cls(count=count, positions=positions)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SearchResultsPositions, int]:
+        count, cursor = Int.read_from(view, cursor)
+        positions, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, positions=positions), cursor
+
+
+class PeerSettings(TLObject):
+    __tl_id__ = 0x6880b94d
+    __tl_name__ = "types.messages.PeerSettings"
+    __tl_layer__ = 135
+
+    __slots__ = ("settings", "chats", "users", )
+
+    def __init__(self, *, settings: tl.base.PeerSettings, chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.settings = settings
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.settings.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerSettings:
+        settings = TLObject.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(settings=settings, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerSettings, int]:
+        settings, cursor = TLObject.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(settings=settings, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class MessageReactionsListBase(TLObject):
+    __tl_id__ = 0x31bd492d
+    __tl_name__ = "types.messages.MessageReactionsList"
+    __tl_layer__ = 138
+
+    __slots__ = ("count", "reactions", "chats", "users", "next_offset", )
+
+    def __init__(self, *, count: int, reactions: list[tl.base.MessagePeerReaction], chats: list[tl.base.Chat], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.reactions = reactions
+        self.chats = chats
+        self.users = users
+        self.next_offset = next_offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.reactions, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageReactionsList:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        reactions = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(count=count, reactions=reactions, chats=chats, users=users, next_offset=next_offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageReactionsList, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        reactions, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(count=count, reactions=reactions, chats=chats, users=users, next_offset=next_offset), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class AvailableReactionsNotModified(TLObject):
+    __tl_id__ = 0x9f071957
+    __tl_name__ = "types.messages.AvailableReactionsNotModified"
+    __tl_layer__ = 136
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AvailableReactionsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AvailableReactionsNotModified, int]:
+        return cls(), cursor
+
+
+class AvailableReactions(TLObject):
+    __tl_id__ = 0x768e3aad
+    __tl_name__ = "types.messages.AvailableReactions"
+    __tl_layer__ = 136
+
+    __slots__ = ("hash", "reactions", )
+
+    def __init__(self, *, hash: int, reactions: list[tl.base.AvailableReaction]):
+        self.hash = hash
+        self.reactions = reactions
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+        TLObjectVector.write_to(out, self.reactions, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AvailableReactions:
+        hash = Int.read(stream)
+        reactions = TLObjectVector.read(stream)
+        return cls(hash=hash, reactions=reactions)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AvailableReactions, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        reactions, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, reactions=reactions), cursor
+
+
+class TranscribedAudioBase(TLObject):
+    __tl_id__ = 0xcfb9d957
+    __tl_name__ = "types.messages.TranscribedAudio"
+    __tl_layer__ = 167
+
+    __slots__ = ("pending", "transcription_id", "text", "trial_remains_num", "trial_remains_until_date", )
+
+    def __init__(self, *, transcription_id: int, text: str, pending: bool = False, trial_remains_num: int | None = None, trial_remains_until_date: int | None = None):
+        self.pending = pending
+        self.transcription_id = transcription_id
+        self.text = text
+        self.trial_remains_num = trial_remains_num
+        self.trial_remains_until_date = trial_remains_until_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.trial_remains_num is None, self.trial_remains_until_date is None)
+        _flags_fields_not_empty = (self.trial_remains_num is not None, self.trial_remains_until_date is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: trial_remains_num, trial_remains_until_date")
+        flags1 = 0
+        if self.pending: flags1 |= (1 << 0)
+        if self.trial_remains_num is not None: flags1 |= (1 << 1)
+        if self.trial_remains_until_date is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Long.write(self.transcription_id)
+        String.write_to(out, self.text)
+        if self.trial_remains_num is not None:
+            out += Int.write(self.trial_remains_num)
+        if self.trial_remains_until_date is not None:
+            out += Int.write(self.trial_remains_until_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TranscribedAudio:
+        flags1 = Int.read(stream)
+        pending = (flags1 & (1 << 0)) == (1 << 0)
+        transcription_id = Long.read(stream)
+        text = String.read(stream)
+        trial_remains_num = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        trial_remains_until_date = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(pending=pending, transcription_id=transcription_id, text=text, trial_remains_num=trial_remains_num, trial_remains_until_date=trial_remains_until_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TranscribedAudio, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pending = (flags1 & (1 << 0)) == (1 << 0)
+        transcription_id, cursor = Long.read_from(view, cursor)
+        text, cursor = String.read_from(view, cursor)
+        trial_remains_num, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        trial_remains_until_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(pending=pending, transcription_id=transcription_id, text=text, trial_remains_num=trial_remains_num, trial_remains_until_date=trial_remains_until_date), cursor
+
+
+class ReactionsNotModified(TLObject):
+    __tl_id__ = 0xb06fdbdf
+    __tl_name__ = "types.messages.ReactionsNotModified"
+    __tl_layer__ = 145
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ReactionsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ReactionsNotModified, int]:
+        return cls(), cursor
+
+
+class Reactions(TLObject):
+    __tl_id__ = 0xeafdf716
+    __tl_name__ = "types.messages.Reactions"
+    __tl_layer__ = 145
+
+    __slots__ = ("hash", "reactions", )
+
+    def __init__(self, *, hash: int, reactions: list[tl.base.Reaction]):
+        self.hash = hash
+        self.reactions = reactions
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.reactions, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Reactions:
+        hash = Long.read(stream)
+        reactions = TLObjectVector.read(stream)
+        return cls(hash=hash, reactions=reactions)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Reactions, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        reactions, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, reactions=reactions), cursor
+
+
+class ForumTopics(TLObject):
+    __tl_id__ = 0x367617d3
+    __tl_name__ = "types.messages.ForumTopics"
+    __tl_layer__ = 148
+
+    __slots__ = ("order_by_create_date", "count", "topics", "messages", "chats", "users", "pts", )
+
+    def __init__(self, *, count: int, topics: list[tl.base.ForumTopic], messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User], pts: int, order_by_create_date: bool = False):
+        self.order_by_create_date = order_by_create_date
+        self.count = count
+        self.topics = topics
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+        self.pts = pts
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.order_by_create_date: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.topics, ctx)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        out += Int.write(self.pts)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ForumTopics:
+        flags1 = Int.read(stream)
+        order_by_create_date = (flags1 & (1 << 0)) == (1 << 0)
+        count = Int.read(stream)
+        topics = TLObjectVector.read(stream)
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        pts = Int.read(stream)
+        return cls(order_by_create_date=order_by_create_date, count=count, topics=topics, messages=messages, chats=chats, users=users, pts=pts)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ForumTopics, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        order_by_create_date = (flags1 & (1 << 0)) == (1 << 0)
+        count, cursor = Int.read_from(view, cursor)
+        topics, cursor = TLObjectVector.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        pts, cursor = Int.read_from(view, cursor)
+        return cls(order_by_create_date=order_by_create_date, count=count, topics=topics, messages=messages, chats=chats, users=users, pts=pts), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class EmojiGroupsNotModified(TLObject):
+    __tl_id__ = 0x6fb4ad87
+    __tl_name__ = "types.messages.EmojiGroupsNotModified"
+    __tl_layer__ = 152
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EmojiGroupsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EmojiGroupsNotModified, int]:
+        return cls(), cursor
+
+
+class EmojiGroups(TLObject):
+    __tl_id__ = 0x881fb94b
+    __tl_name__ = "types.messages.EmojiGroups"
+    __tl_layer__ = 152
+
+    __slots__ = ("hash", "groups", )
+
+    def __init__(self, *, hash: int, groups: list[tl.base.EmojiGroup]):
+        self.hash = hash
+        self.groups = groups
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+        TLObjectVector.write_to(out, self.groups, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EmojiGroups:
+        hash = Int.read(stream)
+        groups = TLObjectVector.read(stream)
+        return cls(hash=hash, groups=groups)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EmojiGroups, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        groups, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, groups=groups), cursor
+
+
+class TranslateResult(TLObject):
+    __tl_id__ = 0x33db32f8
+    __tl_name__ = "types.messages.TranslateResult"
+    __tl_layer__ = 152
+
+    __slots__ = ("result", )
+
+    def __init__(self, *, result: list[tl.base.TextWithEntities]):
+        self.result = result
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.result, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TranslateResult:
+        result = TLObjectVector.read(stream)
+        return cls(result=result)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TranslateResult, int]:
+        result, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(result=result), cursor
+
+
+class BotApp(TLObject):
+    __tl_id__ = 0xeb50adf5
+    __tl_name__ = "types.messages.BotApp"
+    __tl_layer__ = 155
+
+    __slots__ = ("inactive", "request_write_access", "has_settings", "app", )
+
+    def __init__(self, *, app: tl.base.BotApp, inactive: bool = False, request_write_access: bool = False, has_settings: bool = False):
+        self.inactive = inactive
+        self.request_write_access = request_write_access
+        self.has_settings = has_settings
+        self.app = app
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.inactive: flags1 |= (1 << 0)
+        if self.request_write_access: flags1 |= (1 << 1)
+        if self.has_settings: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        self.app.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BotApp:
+        flags1 = Int.read(stream)
+        inactive = (flags1 & (1 << 0)) == (1 << 0)
+        request_write_access = (flags1 & (1 << 1)) == (1 << 1)
+        has_settings = (flags1 & (1 << 2)) == (1 << 2)
+        app = TLObject.read(stream)
+        return cls(inactive=inactive, request_write_access=request_write_access, has_settings=has_settings, app=app)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BotApp, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        inactive = (flags1 & (1 << 0)) == (1 << 0)
+        request_write_access = (flags1 & (1 << 1)) == (1 << 1)
+        has_settings = (flags1 & (1 << 2)) == (1 << 2)
+        app, cursor = TLObject.read_from(view, cursor)
+        return cls(inactive=inactive, request_write_access=request_write_access, has_settings=has_settings, app=app), cursor
+
+
+class WebPage(TLObject):
+    __tl_id__ = 0xfd5e12bd
+    __tl_name__ = "types.messages.WebPage"
+    __tl_layer__ = 165
+
+    __slots__ = ("webpage", "chats", "users", )
+
+    def __init__(self, *, webpage: tl.base.WebPage, chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.webpage = webpage
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.webpage.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> WebPage:
+        webpage = TLObject.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(webpage=webpage, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[WebPage, int]:
+        webpage, cursor = TLObject.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(webpage=webpage, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.webpage.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SavedDialogs(TLObject):
+    __tl_id__ = 0xf83ae221
+    __tl_name__ = "types.messages.SavedDialogs"
+    __tl_layer__ = 170
+
+    __slots__ = ("dialogs", "messages", "chats", "users", )
+
+    def __init__(self, *, dialogs: list[tl.base.SavedDialog], messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.dialogs = dialogs
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.dialogs, ctx)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedDialogs:
+        dialogs = TLObjectVector.read(stream)
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(dialogs=dialogs, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedDialogs, int]:
+        dialogs, cursor = TLObjectVector.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(dialogs=dialogs, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SavedDialogsSlice(TLObject):
+    __tl_id__ = 0x44ba9dd9
+    __tl_name__ = "types.messages.SavedDialogsSlice"
+    __tl_layer__ = 170
+
+    __slots__ = ("count", "dialogs", "messages", "chats", "users", )
+
+    def __init__(self, *, count: int, dialogs: list[tl.base.SavedDialog], messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.count = count
+        self.dialogs = dialogs
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.dialogs, ctx)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedDialogsSlice:
+        count = Int.read(stream)
+        dialogs = TLObjectVector.read(stream)
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, dialogs=dialogs, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedDialogsSlice, int]:
+        count, cursor = Int.read_from(view, cursor)
+        dialogs, cursor = TLObjectVector.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, dialogs=dialogs, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SavedDialogsNotModified(TLObject):
+    __tl_id__ = 0xc01f6fe8
+    __tl_name__ = "types.messages.SavedDialogsNotModified"
+    __tl_layer__ = 170
+
+    __slots__ = ("count", )
+
+    def __init__(self, *, count: int):
+        self.count = count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedDialogsNotModified:
+        count = Int.read(stream)
+        return cls(count=count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedDialogsNotModified, int]:
+        count, cursor = Int.read_from(view, cursor)
+        return cls(count=count), cursor
+
+
+class SavedReactionTagsNotModified(TLObject):
+    __tl_id__ = 0x889b59ef
+    __tl_name__ = "types.messages.SavedReactionTagsNotModified"
+    __tl_layer__ = 171
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedReactionTagsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedReactionTagsNotModified, int]:
+        return cls(), cursor
+
+
+class SavedReactionTags(TLObject):
+    __tl_id__ = 0x3259950a
+    __tl_name__ = "types.messages.SavedReactionTags"
+    __tl_layer__ = 171
+
+    __slots__ = ("tags", "hash", )
+
+    def __init__(self, *, tags: list[tl.base.SavedReactionTag], hash: int):
+        self.tags = tags
+        self.hash = hash
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.tags, ctx)
+        out += Long.write(self.hash)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedReactionTags:
+        tags = TLObjectVector.read(stream)
+        hash = Long.read(stream)
+        return cls(tags=tags, hash=hash)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedReactionTags, int]:
+        tags, cursor = TLObjectVector.read_from(view, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        return cls(tags=tags, hash=hash), cursor
+
+
+class QuickReplies(TLObject):
+    __tl_id__ = 0xc68d6695
+    __tl_name__ = "types.messages.QuickReplies"
+    __tl_layer__ = 176
+
+    __slots__ = ("quick_replies", "messages", "chats", "users", )
+
+    def __init__(self, *, quick_replies: list[tl.base.QuickReply], messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.quick_replies = quick_replies
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.quick_replies, ctx)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> QuickReplies:
+        quick_replies = TLObjectVector.read(stream)
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(quick_replies=quick_replies, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[QuickReplies, int]:
+        quick_replies, cursor = TLObjectVector.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(quick_replies=quick_replies, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class QuickRepliesNotModified(TLObject):
+    __tl_id__ = 0x5f91eb5b
+    __tl_name__ = "types.messages.QuickRepliesNotModified"
+    __tl_layer__ = 176
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> QuickRepliesNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[QuickRepliesNotModified, int]:
+        return cls(), cursor
+
+
+class DialogFilters(TLObject):
+    __tl_id__ = 0x2ad93719
+    __tl_name__ = "types.messages.DialogFilters"
+    __tl_layer__ = 176
+
+    __slots__ = ("tags_enabled", "filters", )
+
+    def __init__(self, *, filters: list[tl.base.DialogFilter], tags_enabled: bool = False):
+        self.tags_enabled = tags_enabled
+        self.filters = filters
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.tags_enabled: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        TLObjectVector.write_to(out, self.filters, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DialogFilters:
+        flags1 = Int.read(stream)
+        tags_enabled = (flags1 & (1 << 0)) == (1 << 0)
+        filters = TLObjectVector.read(stream)
+        return cls(tags_enabled=tags_enabled, filters=filters)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DialogFilters, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        tags_enabled = (flags1 & (1 << 0)) == (1 << 0)
+        filters, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(tags_enabled=tags_enabled, filters=filters), cursor
+
+
+class MyStickers(TLObject):
+    __tl_id__ = 0xfaff629d
+    __tl_name__ = "types.messages.MyStickers"
+    __tl_layer__ = 177
+
+    __slots__ = ("count", "sets", )
+
+    def __init__(self, *, count: int, sets: list[tl.base.StickerSetCovered]):
+        self.count = count
+        self.sets = sets
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.sets, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MyStickers:
+        count = Int.read(stream)
+        sets = TLObjectVector.read(stream)
+        return cls(count=count, sets=sets)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MyStickers, int]:
+        count, cursor = Int.read_from(view, cursor)
+        sets, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, sets=sets), cursor
+
+
+class InvitedUsersBase(TLObject):
+    __tl_id__ = 0x7f5defa6
+    __tl_name__ = "types.messages.InvitedUsers"
+    __tl_layer__ = 177
+
+    __slots__ = ("updates", "missing_invitees", )
+
+    def __init__(self, *, updates: tl.base.Updates, missing_invitees: list[tl.base.MissingInvitee]):
+        self.updates = updates
+        self.missing_invitees = missing_invitees
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.updates.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.missing_invitees, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> InvitedUsers:
+        updates = TLObject.read(stream)
+        missing_invitees = TLObjectVector.read(stream)
+        return cls(updates=updates, missing_invitees=missing_invitees)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[InvitedUsers, int]:
+        updates, cursor = TLObject.read_from(view, cursor)
+        missing_invitees, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(updates=updates, missing_invitees=missing_invitees), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.updates.check_for_ctx_values(values)
+
+
+class AvailableEffectsNotModified(TLObject):
+    __tl_id__ = 0xd1ed9a5b
+    __tl_name__ = "types.messages.AvailableEffectsNotModified"
+    __tl_layer__ = 181
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AvailableEffectsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AvailableEffectsNotModified, int]:
+        return cls(), cursor
+
+
+class AvailableEffects(TLObject):
+    __tl_id__ = 0xbddb616e
+    __tl_name__ = "types.messages.AvailableEffects"
+    __tl_layer__ = 181
+
+    __slots__ = ("hash", "effects", "documents", )
+
+    def __init__(self, *, hash: int, effects: list[tl.base.AvailableEffect], documents: list[tl.base.Document]):
+        self.hash = hash
+        self.effects = effects
+        self.documents = documents
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+        TLObjectVector.write_to(out, self.effects, ctx)
+        TLObjectVector.write_to(out, self.documents, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AvailableEffects:
+        hash = Int.read(stream)
+        effects = TLObjectVector.read(stream)
+        documents = TLObjectVector.read(stream)
+        return cls(hash=hash, effects=effects, documents=documents)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AvailableEffects, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        effects, cursor = TLObjectVector.read_from(view, cursor)
+        documents, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, effects=effects, documents=documents), cursor
+
+
+class BotPreparedInlineMessage(TLObject):
+    __tl_id__ = 0x8ecf0511
+    __tl_name__ = "types.messages.BotPreparedInlineMessage"
+    __tl_layer__ = 193
+
+    __slots__ = ("id", "expire_date", )
+
+    def __init__(self, *, id: str, expire_date: int):
+        self.id = id
+        self.expire_date = expire_date
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.id)
+        out += Int.write(self.expire_date)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BotPreparedInlineMessage:
+        id = String.read(stream)
+        expire_date = Int.read(stream)
+        return cls(id=id, expire_date=expire_date)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BotPreparedInlineMessage, int]:
+        id, cursor = String.read_from(view, cursor)
+        expire_date, cursor = Int.read_from(view, cursor)
+        return cls(id=id, expire_date=expire_date), cursor
+
+
+class PreparedInlineMessage(TLObject):
+    __tl_id__ = 0xff57708d
+    __tl_name__ = "types.messages.PreparedInlineMessage"
+    __tl_layer__ = 193
+
+    __slots__ = ("query_id", "result", "peer_types", "cache_time", "users", )
+
+    def __init__(self, *, query_id: int, result: tl.base.BotInlineResult, peer_types: list[tl.base.InlineQueryPeerType], cache_time: int, users: list[tl.base.User]):
+        self.query_id = query_id
+        self.result = result
+        self.peer_types = peer_types
+        self.cache_time = cache_time
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.query_id)
+        self.result.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.peer_types, ctx)
+        out += Int.write(self.cache_time)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PreparedInlineMessage:
+        query_id = Long.read(stream)
+        result = TLObject.read(stream)
+        peer_types = TLObjectVector.read(stream)
+        cache_time = Int.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(query_id=query_id, result=result, peer_types=peer_types, cache_time=cache_time, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PreparedInlineMessage, int]:
+        query_id, cursor = Long.read_from(view, cursor)
+        result, cursor = TLObject.read_from(view, cursor)
+        peer_types, cursor = TLObjectVector.read_from(view, cursor)
+        cache_time, cursor = Int.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(query_id=query_id, result=result, peer_types=peer_types, cache_time=cache_time, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class FoundStickersNotModified(TLObject):
+    __tl_id__ = 0x6010c534
+    __tl_name__ = "types.messages.FoundStickersNotModified"
+    __tl_layer__ = 195
+
+    __slots__ = ("next_offset", )
+
+    def __init__(self, *, next_offset: int | None = None):
+        self.next_offset = next_offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.next_offset is not None:
+            out += Int.write(self.next_offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FoundStickersNotModified:
+        flags1 = Int.read(stream)
+        next_offset = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(next_offset=next_offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FoundStickersNotModified, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        next_offset, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(next_offset=next_offset), cursor
+
+
+class FoundStickers(TLObject):
+    __tl_id__ = 0x82c9e290
+    __tl_name__ = "types.messages.FoundStickers"
+    __tl_layer__ = 195
+
+    __slots__ = ("next_offset", "hash", "stickers", )
+
+    def __init__(self, *, hash: int, stickers: list[tl.base.Document], next_offset: int | None = None):
+        self.next_offset = next_offset
+        self.hash = hash
+        self.stickers = stickers
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.next_offset is not None:
+            out += Int.write(self.next_offset)
+        out += Long.write(self.hash)
+        TLObjectVector.write_to(out, self.stickers, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FoundStickers:
+        flags1 = Int.read(stream)
+        next_offset = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        hash = Long.read(stream)
+        stickers = TLObjectVector.read(stream)
+        return cls(next_offset=next_offset, hash=hash, stickers=stickers)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FoundStickers, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        next_offset, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        hash, cursor = Long.read_from(view, cursor)
+        stickers, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(next_offset=next_offset, hash=hash, stickers=stickers), cursor
+
+
+class WebPagePreview(TLObject):
+    __tl_id__ = 0xb53e8b21
+    __tl_name__ = "types.messages.WebPagePreview"
+    __tl_layer__ = 197
+
+    __slots__ = ("media", "users", )
+
+    def __init__(self, *, media: tl.base.MessageMedia, users: list[tl.base.User]):
+        self.media = media
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.media.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> WebPagePreview:
+        media = TLObject.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(media=media, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[WebPagePreview, int]:
+        media, cursor = TLObject.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(media=media, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.media.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChannelMessages_133(TLObject):
+    __tl_id__ = 0x64479808
+    __tl_name__ = "types.messages.ChannelMessages_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("inexact", "pts", "count", "offset_id_offset", "messages", "chats", "users", )
+
+    def __init__(self, *, pts: int, count: int, messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User], inexact: bool = False, offset_id_offset: int | None = None):
+        self.inexact = inexact
+        self.pts = pts
+        self.count = count
+        self.offset_id_offset = offset_id_offset
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.inexact: flags1 |= (1 << 1)
+        if self.offset_id_offset is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.pts)
+        out += Int.write(self.count)
+        if self.offset_id_offset is not None:
+            out += Int.write(self.offset_id_offset)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelMessages_133:
+        flags1 = Int.read(stream)
+        inexact = (flags1 & (1 << 1)) == (1 << 1)
+        pts = Int.read(stream)
+        count = Int.read(stream)
+        offset_id_offset = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(inexact=inexact, pts=pts, count=count, offset_id_offset=offset_id_offset, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelMessages_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        inexact = (flags1 & (1 << 1)) == (1 << 1)
+        pts, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        offset_id_offset, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(inexact=inexact, pts=pts, count=count, offset_id_offset=offset_id_offset, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StickerSet_133(TLObject):
+    __tl_id__ = 0xb60a24a6
+    __tl_name__ = "types.messages.StickerSet_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("set", "packs", "documents", )
+
+    def __init__(self, *, set: tl.base.StickerSet, packs: list[tl.base.StickerPack], documents: list[tl.base.Document]):
+        self.set = set
+        self.packs = packs
+        self.documents = documents
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.set.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.packs, ctx)
+        TLObjectVector.write_to(out, self.documents, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StickerSet_133:
+        set = TLObject.read(stream)
+        packs = TLObjectVector.read(stream)
+        documents = TLObjectVector.read(stream)
+        return cls(set=set, packs=packs, documents=documents)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StickerSet_133, int]:
+        set, cursor = TLObject.read_from(view, cursor)
+        packs, cursor = TLObjectVector.read_from(view, cursor)
+        documents, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(set=set, packs=packs, documents=documents), cursor
+
+
+class BotResults_133(TLObject):
+    __tl_id__ = 0x947ca848
+    __tl_name__ = "types.messages.BotResults_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("gallery", "query_id", "next_offset", "switch_pm", "results", "cache_time", "users", )
+
+    def __init__(self, *, query_id: int, results: list[tl.base.BotInlineResult], cache_time: int, users: list[tl.base.User], gallery: bool = False, next_offset: str | None = None, switch_pm: tl.types.InlineBotSwitchPM | None = None):
+        self.gallery = gallery
+        self.query_id = query_id
+        self.next_offset = next_offset
+        self.switch_pm = switch_pm
+        self.results = results
+        self.cache_time = cache_time
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.gallery: flags1 |= (1 << 0)
+        if self.next_offset is not None: flags1 |= (1 << 1)
+        if self.switch_pm is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Long.write(self.query_id)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        if self.switch_pm is not None:
+            self.switch_pm.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.results, ctx)
+        out += Int.write(self.cache_time)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BotResults_133:
+        flags1 = Int.read(stream)
+        gallery = (flags1 & (1 << 0)) == (1 << 0)
+        query_id = Long.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        switch_pm = tl.types.InlineBotSwitchPM.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        results = TLObjectVector.read(stream)
+        cache_time = Int.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(gallery=gallery, query_id=query_id, next_offset=next_offset, switch_pm=switch_pm, results=results, cache_time=cache_time, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BotResults_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        gallery = (flags1 & (1 << 0)) == (1 << 0)
+        query_id, cursor = Long.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        switch_pm, cursor = tl.types.InlineBotSwitchPM.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        results, cursor = TLObjectVector.read_from(view, cursor)
+        cache_time, cursor = Int.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(gallery=gallery, query_id=query_id, next_offset=next_offset, switch_pm=switch_pm, results=results, cache_time=cache_time, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class FeaturedStickers_133(TLObject):
+    __tl_id__ = 0x84c02310
+    __tl_name__ = "types.messages.FeaturedStickers_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("hash", "count", "sets", "unread", )
+
+    def __init__(self, *, hash: int, count: int, sets: list[tl.base.StickerSetCovered], unread: list[int]):
+        self.hash = hash
+        self.count = count
+        self.sets = sets
+        self.unread = unread
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.hash)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.sets, ctx)
+        out += LongVector.write(self.unread)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FeaturedStickers_133:
+        hash = Long.read(stream)
+        count = Int.read(stream)
+        sets = TLObjectVector.read(stream)
+        unread = LongVector.read(stream)
+        return cls(hash=hash, count=count, sets=sets, unread=unread)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FeaturedStickers_133, int]:
+        hash, cursor = Long.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        sets, cursor = TLObjectVector.read_from(view, cursor)
+        unread, cursor = LongVector.read_from(view, cursor)
+        return cls(hash=hash, count=count, sets=sets, unread=unread), cursor
+
+
+class VotesList_133(TLObject):
+    __tl_id__ = 0x823f649
+    __tl_name__ = "types.messages.VotesList_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "votes", "users", "next_offset", )
+
+    def __init__(self, *, count: int, votes: list[tl.base.MessageUserVote], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.votes = votes
+        self.users = users
+        self.next_offset = next_offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.votes, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> VotesList_133:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        votes = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(count=count, votes=votes, users=users, next_offset=next_offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[VotesList_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        votes, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(count=count, votes=votes, users=users, next_offset=next_offset), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SponsoredMessages_133(TLObject):
+    __tl_id__ = 0x65a4c7d5
+    __tl_name__ = "types.messages.SponsoredMessages_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("messages", "chats", "users", )
+
+    def __init__(self, *, messages: list[tl.base.SponsoredMessage], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SponsoredMessages_133:
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SponsoredMessages_133, int]:
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class MessageReactionsList_136(TLObject):
+    __tl_id__ = 0xa366923c
+    __tl_name__ = "types.messages.MessageReactionsList_136"
+    __tl_layer__ = 136
+
+    __slots__ = ("count", "reactions", "users", "next_offset", )
+
+    def __init__(self, *, count: int, reactions: list[tl.base.MessageUserReaction], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.reactions = reactions
+        self.users = users
+        self.next_offset = next_offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.reactions, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageReactionsList_136:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        reactions = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(count=count, reactions=reactions, users=users, next_offset=next_offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageReactionsList_136, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        reactions, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(count=count, reactions=reactions, users=users, next_offset=next_offset), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class TranslateNoResult_137(TLObject):
+    __tl_id__ = 0x67ca4737
+    __tl_name__ = "types.messages.TranslateNoResult_137"
+    __tl_layer__ = 137
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TranslateNoResult_137:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TranslateNoResult_137, int]:
+        return cls(), cursor
+
+
+class TranslateResultText_137(TLObject):
+    __tl_id__ = 0xa214f7d0
+    __tl_name__ = "types.messages.TranslateResultText_137"
+    __tl_layer__ = 137
+
+    __slots__ = ("text", )
+
+    def __init__(self, *, text: str):
+        self.text = text
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.text)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TranslateResultText_137:
+        text = String.read(stream)
+        return cls(text=text)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TranslateResultText_137, int]:
+        text, cursor = String.read_from(view, cursor)
+        return cls(text=text), cursor
+
+
+class TranscribedAudio_143(TLObject):
+    __tl_id__ = 0x93752c52
+    __tl_name__ = "types.messages.TranscribedAudio_143"
+    __tl_layer__ = 143
+
+    __slots__ = ("pending", "transcription_id", "text", )
+
+    def __init__(self, *, transcription_id: int, text: str, pending: bool = False):
+        self.pending = pending
+        self.transcription_id = transcription_id
+        self.text = text
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pending: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Long.write(self.transcription_id)
+        String.write_to(out, self.text)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> TranscribedAudio_143:
+        flags1 = Int.read(stream)
+        pending = (flags1 & (1 << 0)) == (1 << 0)
+        transcription_id = Long.read(stream)
+        text = String.read(stream)
+        return cls(pending=pending, transcription_id=transcription_id, text=text)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[TranscribedAudio_143, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        pending = (flags1 & (1 << 0)) == (1 << 0)
+        transcription_id, cursor = Long.read_from(view, cursor)
+        text, cursor = String.read_from(view, cursor)
+        return cls(pending=pending, transcription_id=transcription_id, text=text), cursor
+
+
+class ChannelMessages(ChannelMessagesBase):
+    __tl_ids__ = (
+        (ChannelMessages_133.__tl_layer__, ChannelMessages_133.__tl_id__),
+        (ChannelMessagesBase.__tl_layer__, ChannelMessagesBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.inexact: flags1 |= (1 << 1)
+        if self.offset_id_offset is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.pts)
+        out += Int.write(self.count)
+        if self.offset_id_offset is not None:
+            out += Int.write(self.offset_id_offset)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        if ctx.layer >= 150:
+            TLObjectVector.write_to(out, self.topics, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+
+class StickerSet(StickerSetBase):
+    __tl_ids__ = (
+        (StickerSet_133.__tl_layer__, StickerSet_133.__tl_id__),
+        (StickerSetBase.__tl_layer__, StickerSetBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        self.set.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.packs, ctx)
+        if ctx.layer >= 147:
+            TLObjectVector.write_to(out, self.keywords, ctx)
+        TLObjectVector.write_to(out, self.documents, ctx)
+
+
+class BotResults(BotResultsBase):
+    __tl_ids__ = (
+        (BotResults_133.__tl_layer__, BotResults_133.__tl_id__),
+        (BotResultsBase.__tl_layer__, BotResultsBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.gallery: flags1 |= (1 << 0)
+        if self.next_offset is not None: flags1 |= (1 << 1)
+        if self.switch_pm is not None: flags1 |= (1 << 2)
+        if ctx.layer >= 155:
+            if self.switch_webview is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        out += Long.write(self.query_id)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        if self.switch_pm is not None:
+            self.switch_pm.write_to(out, ctx)
+        if ctx.layer >= 155:
+            if self.switch_webview is not None:
+                self.switch_webview.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.results, ctx)
+        out += Int.write(self.cache_time)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+
+class FeaturedStickers(FeaturedStickersBase):
+    __tl_ids__ = (
+        (FeaturedStickers_133.__tl_layer__, FeaturedStickers_133.__tl_id__),
+        (FeaturedStickersBase.__tl_layer__, FeaturedStickersBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        if ctx.layer >= 143:
+            flags1 = 0
+            if ctx.layer >= 143:
+                if self.premium: flags1 |= (1 << 0)
+            out += Int.write(flags1)
+        out += Long.write(self.hash)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.sets, ctx)
+        out += LongVector.write(self.unread)
+
+
+class VotesList(VotesListBase):
+    __tl_ids__ = (
+        (VotesList_133.__tl_layer__, VotesList_133.__tl_id__),
+        (VotesListBase.__tl_layer__, VotesListBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _votes_downgrade_133 = tl.layer_converters.messages__votes_list.downgrade_votes_for_133(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        if ctx.layer >= 160:
+            TLObjectVector.write_to(out, self.votes, ctx)
+        if ctx.layer >= 160:
+            TLObjectVector.write_to(out, self.chats, ctx)
+        if ctx.layer <= 159:
+            TLObjectVector.write_to(out, _votes_downgrade_133, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+
+class SponsoredMessages(SponsoredMessagesBase):
+    __tl_ids__ = (
+        (SponsoredMessages_133.__tl_layer__, SponsoredMessages_133.__tl_id__),
+        (SponsoredMessagesBase.__tl_layer__, SponsoredMessagesBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        if ctx.layer >= 148:
+            flags1 = 0
+            if ctx.layer >= 148:
+                if self.posts_between is not None: flags1 |= (1 << 0)
+            out += Int.write(flags1)
+        if ctx.layer >= 148:
+            if self.posts_between is not None:
+                out += Int.write(self.posts_between)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+
+class MessageReactionsList(MessageReactionsListBase):
+    __tl_ids__ = (
+        (MessageReactionsList_136.__tl_layer__, MessageReactionsList_136.__tl_id__),
+        (MessageReactionsListBase.__tl_layer__, MessageReactionsListBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _reactions_downgrade_136 = tl.layer_converters.messages__message_reactions_list.downgrade_reactions_for_136(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        if ctx.layer >= 138:
+            TLObjectVector.write_to(out, self.reactions, ctx)
+        if ctx.layer >= 138:
+            TLObjectVector.write_to(out, self.chats, ctx)
+        if ctx.layer <= 137:
+            TLObjectVector.write_to(out, _reactions_downgrade_136, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+
+class TranscribedAudio(TranscribedAudioBase):
+    __tl_ids__ = (
+        (TranscribedAudio_143.__tl_layer__, TranscribedAudio_143.__tl_id__),
+        (TranscribedAudioBase.__tl_layer__, TranscribedAudioBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.pending: flags1 |= (1 << 0)
+        if ctx.layer >= 167:
+            if self.trial_remains_num is not None: flags1 |= (1 << 1)
+        if ctx.layer >= 167:
+            if self.trial_remains_until_date is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Long.write(self.transcription_id)
+        String.write_to(out, self.text)
+        if ctx.layer >= 167:
+            if self.trial_remains_num is not None:
+                out += Int.write(self.trial_remains_num)
+        if ctx.layer >= 167:
+            if self.trial_remains_until_date is not None:
+                out += Int.write(self.trial_remains_until_date)
+
+
+class InvitedUsers(InvitedUsersBase):
+    __tl_ids__ = (
+        (InvitedUsersBase.__tl_layer__, InvitedUsersBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        
+        if ctx.layer < 177:
+            return self.updates.write_to(out, ctx)
+        
+        return super().write_to(out, ctx)
\ No newline at end of file
@@ -0,0 +1,1891 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class PaymentFormBase(TLObject):
+    __tl_id__ = 0xa0058751
+    __tl_name__ = "types.payments.PaymentForm"
+    __tl_layer__ = 144
+
+    __slots__ = ("can_save_credentials", "password_missing", "form_id", "bot_id", "title", "description", "photo", "invoice", "provider_id", "url", "native_provider", "native_params", "additional_methods", "saved_info", "saved_credentials", "users", )
+
+    def __init__(self, *, form_id: int, bot_id: int, title: str, description: str, invoice: tl.base.Invoice, provider_id: int, url: str, users: list[tl.base.User], can_save_credentials: bool = False, password_missing: bool = False, photo: tl.base.WebDocument | None = None, native_provider: str | None = None, native_params: tl.types.DataJSON | None = None, additional_methods: list[tl.base.PaymentFormMethod] | None = None, saved_info: tl.types.PaymentRequestedInfo | None = None, saved_credentials: list[tl.base.PaymentSavedCredentials] | None = None):
+        self.can_save_credentials = can_save_credentials
+        self.password_missing = password_missing
+        self.form_id = form_id
+        self.bot_id = bot_id
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.invoice = invoice
+        self.provider_id = provider_id
+        self.url = url
+        self.native_provider = native_provider
+        self.native_params = native_params
+        self.additional_methods = additional_methods
+        self.saved_info = saved_info
+        self.saved_credentials = saved_credentials
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.native_provider is None, self.native_params is None)
+        _flags_fields_not_empty = (self.native_provider is not None, self.native_params is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: native_provider, native_params")
+        flags1 = 0
+        if self.can_save_credentials: flags1 |= (1 << 2)
+        if self.password_missing: flags1 |= (1 << 3)
+        if self.photo is not None: flags1 |= (1 << 5)
+        if self.native_provider is not None: flags1 |= (1 << 4)
+        if self.native_params is not None: flags1 |= (1 << 4)
+        if self.additional_methods: flags1 |= (1 << 6)
+        if self.saved_info is not None: flags1 |= (1 << 0)
+        if self.saved_credentials: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Long.write(self.form_id)
+        out += Long.write(self.bot_id)
+        String.write_to(out, self.title)
+        String.write_to(out, self.description)
+        if self.photo is not None:
+            self.photo.write_to(out, ctx)
+        self.invoice.write_to(out, ctx)
+        out += Long.write(self.provider_id)
+        String.write_to(out, self.url)
+        if self.native_provider is not None:
+            String.write_to(out, self.native_provider)
+        if self.native_params is not None:
+            self.native_params.write_to(out, ctx)
+        if self.additional_methods:
+            TLObjectVector.write_to(out, self.additional_methods, ctx)
+        if self.saved_info is not None:
+            self.saved_info.write_to(out, ctx)
+        if self.saved_credentials:
+            TLObjectVector.write_to(out, self.saved_credentials, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaymentForm:
+        flags1 = Int.read(stream)
+        can_save_credentials = (flags1 & (1 << 2)) == (1 << 2)
+        password_missing = (flags1 & (1 << 3)) == (1 << 3)
+        form_id = Long.read(stream)
+        bot_id = Long.read(stream)
+        title = String.read(stream)
+        description = String.read(stream)
+        photo = TLObject.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        invoice = TLObject.read(stream)
+        provider_id = Long.read(stream)
+        url = String.read(stream)
+        native_provider = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        native_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        additional_methods = TLObjectVector.read(stream) if (flags1 & (1 << 6)) == (1 << 6) else None
+        saved_info = tl.types.PaymentRequestedInfo.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        saved_credentials = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        users = TLObjectVector.read(stream)
+        return cls(can_save_credentials=can_save_credentials, password_missing=password_missing, form_id=form_id, bot_id=bot_id, title=title, description=description, photo=photo, invoice=invoice, provider_id=provider_id, url=url, native_provider=native_provider, native_params=native_params, additional_methods=additional_methods, saved_info=saved_info, saved_credentials=saved_credentials, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaymentForm, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        can_save_credentials = (flags1 & (1 << 2)) == (1 << 2)
+        password_missing = (flags1 & (1 << 3)) == (1 << 3)
+        form_id, cursor = Long.read_from(view, cursor)
+        bot_id, cursor = Long.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        description, cursor = String.read_from(view, cursor)
+        photo, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        provider_id, cursor = Long.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor)
+        native_provider, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        native_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        additional_methods, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 6)) == (1 << 6) else (None, cursor)
+        saved_info, cursor = tl.types.PaymentRequestedInfo.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        saved_credentials, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(can_save_credentials=can_save_credentials, password_missing=password_missing, form_id=form_id, bot_id=bot_id, title=title, description=description, photo=photo, invoice=invoice, provider_id=provider_id, url=url, native_provider=native_provider, native_params=native_params, additional_methods=additional_methods, saved_info=saved_info, saved_credentials=saved_credentials, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PaymentFormStars(TLObject):
+    __tl_id__ = 0x7bf6b15c
+    __tl_name__ = "types.payments.PaymentFormStars"
+    __tl_layer__ = 181
+
+    __slots__ = ("form_id", "bot_id", "title", "description", "photo", "invoice", "users", )
+
+    def __init__(self, *, form_id: int, bot_id: int, title: str, description: str, invoice: tl.base.Invoice, users: list[tl.base.User], photo: tl.base.WebDocument | None = None):
+        self.form_id = form_id
+        self.bot_id = bot_id
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.invoice = invoice
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.photo is not None: flags1 |= (1 << 5)
+        out += Int.write(flags1)
+        out += Long.write(self.form_id)
+        out += Long.write(self.bot_id)
+        String.write_to(out, self.title)
+        String.write_to(out, self.description)
+        if self.photo is not None:
+            self.photo.write_to(out, ctx)
+        self.invoice.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaymentFormStars:
+        flags1 = Int.read(stream)
+        form_id = Long.read(stream)
+        bot_id = Long.read(stream)
+        title = String.read(stream)
+        description = String.read(stream)
+        photo = TLObject.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        invoice = TLObject.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(form_id=form_id, bot_id=bot_id, title=title, description=description, photo=photo, invoice=invoice, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaymentFormStars, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        form_id, cursor = Long.read_from(view, cursor)
+        bot_id, cursor = Long.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        description, cursor = String.read_from(view, cursor)
+        photo, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(form_id=form_id, bot_id=bot_id, title=title, description=description, photo=photo, invoice=invoice, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PaymentFormStarGift(TLObject):
+    __tl_id__ = 0xb425cfe1
+    __tl_name__ = "types.payments.PaymentFormStarGift"
+    __tl_layer__ = 189
+
+    __slots__ = ("form_id", "invoice", )
+
+    def __init__(self, *, form_id: int, invoice: tl.base.Invoice):
+        self.form_id = form_id
+        self.invoice = invoice
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Long.write(self.form_id)
+        self.invoice.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaymentFormStarGift:
+        form_id = Long.read(stream)
+        invoice = TLObject.read(stream)
+        return cls(form_id=form_id, invoice=invoice)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaymentFormStarGift, int]:
+        form_id, cursor = Long.read_from(view, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        return cls(form_id=form_id, invoice=invoice), cursor
+
+
+class ValidatedRequestedInfo(TLObject):
+    __tl_id__ = 0xd1451883
+    __tl_name__ = "types.payments.ValidatedRequestedInfo"
+    __tl_layer__ = 133
+
+    __slots__ = ("id", "shipping_options", )
+
+    def __init__(self, *, id: str | None = None, shipping_options: list[tl.base.ShippingOption] | None = None):
+        self.id = id
+        self.shipping_options = shipping_options
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.id is not None: flags1 |= (1 << 0)
+        if self.shipping_options: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.id is not None:
+            String.write_to(out, self.id)
+        if self.shipping_options:
+            TLObjectVector.write_to(out, self.shipping_options, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ValidatedRequestedInfo:
+        flags1 = Int.read(stream)
+        id = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        shipping_options = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(id=id, shipping_options=shipping_options)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ValidatedRequestedInfo, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        id, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        shipping_options, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(id=id, shipping_options=shipping_options), cursor
+
+
+class PaymentResult(TLObject):
+    __tl_id__ = 0x4e5f810d
+    __tl_name__ = "types.payments.PaymentResult"
+    __tl_layer__ = 133
+
+    __slots__ = ("updates", )
+
+    def __init__(self, *, updates: tl.base.Updates):
+        self.updates = updates
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.updates.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaymentResult:
+        updates = TLObject.read(stream)
+        return cls(updates=updates)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaymentResult, int]:
+        updates, cursor = TLObject.read_from(view, cursor)
+        return cls(updates=updates), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.updates.check_for_ctx_values(values)
+
+
+class PaymentVerificationNeeded(TLObject):
+    __tl_id__ = 0xd8411139
+    __tl_name__ = "types.payments.PaymentVerificationNeeded"
+    __tl_layer__ = 133
+
+    __slots__ = ("url", )
+
+    def __init__(self, *, url: str):
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaymentVerificationNeeded:
+        url = String.read(stream)
+        return cls(url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaymentVerificationNeeded, int]:
+        url, cursor = String.read_from(view, cursor)
+        return cls(url=url), cursor
+
+
+class PaymentReceipt(TLObject):
+    __tl_id__ = 0x70c4fe03
+    __tl_name__ = "types.payments.PaymentReceipt"
+    __tl_layer__ = 133
+
+    __slots__ = ("date", "bot_id", "provider_id", "title", "description", "photo", "invoice", "info", "shipping", "tip_amount", "currency", "total_amount", "credentials_title", "users", )
+
+    def __init__(self, *, date: int, bot_id: int, provider_id: int, title: str, description: str, invoice: tl.base.Invoice, currency: str, total_amount: int, credentials_title: str, users: list[tl.base.User], photo: tl.base.WebDocument | None = None, info: tl.types.PaymentRequestedInfo | None = None, shipping: tl.types.ShippingOption | None = None, tip_amount: int | None = None):
+        self.date = date
+        self.bot_id = bot_id
+        self.provider_id = provider_id
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.invoice = invoice
+        self.info = info
+        self.shipping = shipping
+        self.tip_amount = tip_amount
+        self.currency = currency
+        self.total_amount = total_amount
+        self.credentials_title = credentials_title
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.photo is not None: flags1 |= (1 << 2)
+        if self.info is not None: flags1 |= (1 << 0)
+        if self.shipping is not None: flags1 |= (1 << 1)
+        if self.tip_amount is not None: flags1 |= (1 << 3)
+        out += Int.write(flags1)
+        out += Int.write(self.date)
+        out += Long.write(self.bot_id)
+        out += Long.write(self.provider_id)
+        String.write_to(out, self.title)
+        String.write_to(out, self.description)
+        if self.photo is not None:
+            self.photo.write_to(out, ctx)
+        self.invoice.write_to(out, ctx)
+        if self.info is not None:
+            self.info.write_to(out, ctx)
+        if self.shipping is not None:
+            self.shipping.write_to(out, ctx)
+        if self.tip_amount is not None:
+            out += Long.write(self.tip_amount)
+        String.write_to(out, self.currency)
+        out += Long.write(self.total_amount)
+        String.write_to(out, self.credentials_title)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaymentReceipt:
+        flags1 = Int.read(stream)
+        date = Int.read(stream)
+        bot_id = Long.read(stream)
+        provider_id = Long.read(stream)
+        title = String.read(stream)
+        description = String.read(stream)
+        photo = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        invoice = TLObject.read(stream)
+        info = tl.types.PaymentRequestedInfo.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        shipping = tl.types.ShippingOption.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        tip_amount = Long.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        currency = String.read(stream)
+        total_amount = Long.read(stream)
+        credentials_title = String.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(date=date, bot_id=bot_id, provider_id=provider_id, title=title, description=description, photo=photo, invoice=invoice, info=info, shipping=shipping, tip_amount=tip_amount, currency=currency, total_amount=total_amount, credentials_title=credentials_title, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaymentReceipt, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        bot_id, cursor = Long.read_from(view, cursor)
+        provider_id, cursor = Long.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        description, cursor = String.read_from(view, cursor)
+        photo, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        info, cursor = tl.types.PaymentRequestedInfo.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        shipping, cursor = tl.types.ShippingOption.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        tip_amount, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        currency, cursor = String.read_from(view, cursor)
+        total_amount, cursor = Long.read_from(view, cursor)
+        credentials_title, cursor = String.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(date=date, bot_id=bot_id, provider_id=provider_id, title=title, description=description, photo=photo, invoice=invoice, info=info, shipping=shipping, tip_amount=tip_amount, currency=currency, total_amount=total_amount, credentials_title=credentials_title, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PaymentReceiptStars(TLObject):
+    __tl_id__ = 0xdabbf83a
+    __tl_name__ = "types.payments.PaymentReceiptStars"
+    __tl_layer__ = 181
+
+    __slots__ = ("date", "bot_id", "title", "description", "photo", "invoice", "currency", "total_amount", "transaction_id", "users", )
+
+    def __init__(self, *, date: int, bot_id: int, title: str, description: str, invoice: tl.base.Invoice, currency: str, total_amount: int, transaction_id: str, users: list[tl.base.User], photo: tl.base.WebDocument | None = None):
+        self.date = date
+        self.bot_id = bot_id
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.invoice = invoice
+        self.currency = currency
+        self.total_amount = total_amount
+        self.transaction_id = transaction_id
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.photo is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.date)
+        out += Long.write(self.bot_id)
+        String.write_to(out, self.title)
+        String.write_to(out, self.description)
+        if self.photo is not None:
+            self.photo.write_to(out, ctx)
+        self.invoice.write_to(out, ctx)
+        String.write_to(out, self.currency)
+        out += Long.write(self.total_amount)
+        String.write_to(out, self.transaction_id)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaymentReceiptStars:
+        flags1 = Int.read(stream)
+        date = Int.read(stream)
+        bot_id = Long.read(stream)
+        title = String.read(stream)
+        description = String.read(stream)
+        photo = TLObject.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        invoice = TLObject.read(stream)
+        currency = String.read(stream)
+        total_amount = Long.read(stream)
+        transaction_id = String.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(date=date, bot_id=bot_id, title=title, description=description, photo=photo, invoice=invoice, currency=currency, total_amount=total_amount, transaction_id=transaction_id, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaymentReceiptStars, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        bot_id, cursor = Long.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        description, cursor = String.read_from(view, cursor)
+        photo, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        currency, cursor = String.read_from(view, cursor)
+        total_amount, cursor = Long.read_from(view, cursor)
+        transaction_id, cursor = String.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(date=date, bot_id=bot_id, title=title, description=description, photo=photo, invoice=invoice, currency=currency, total_amount=total_amount, transaction_id=transaction_id, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SavedInfo(TLObject):
+    __tl_id__ = 0xfb8fe43c
+    __tl_name__ = "types.payments.SavedInfo"
+    __tl_layer__ = 133
+
+    __slots__ = ("has_saved_credentials", "saved_info", )
+
+    def __init__(self, *, has_saved_credentials: bool = False, saved_info: tl.types.PaymentRequestedInfo | None = None):
+        self.has_saved_credentials = has_saved_credentials
+        self.saved_info = saved_info
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.has_saved_credentials: flags1 |= (1 << 1)
+        if self.saved_info is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if self.saved_info is not None:
+            self.saved_info.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedInfo:
+        flags1 = Int.read(stream)
+        has_saved_credentials = (flags1 & (1 << 1)) == (1 << 1)
+        saved_info = tl.types.PaymentRequestedInfo.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(has_saved_credentials=has_saved_credentials, saved_info=saved_info)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedInfo, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        has_saved_credentials = (flags1 & (1 << 1)) == (1 << 1)
+        saved_info, cursor = tl.types.PaymentRequestedInfo.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(has_saved_credentials=has_saved_credentials, saved_info=saved_info), cursor
+
+
+class BankCardData(TLObject):
+    __tl_id__ = 0x3e24e573
+    __tl_name__ = "types.payments.BankCardData"
+    __tl_layer__ = 133
+
+    __slots__ = ("title", "open_urls", )
+
+    def __init__(self, *, title: str, open_urls: list[tl.base.BankCardOpenUrl]):
+        self.title = title
+        self.open_urls = open_urls
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.title)
+        TLObjectVector.write_to(out, self.open_urls, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BankCardData:
+        title = String.read(stream)
+        open_urls = TLObjectVector.read(stream)
+        return cls(title=title, open_urls=open_urls)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BankCardData, int]:
+        title, cursor = String.read_from(view, cursor)
+        open_urls, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(title=title, open_urls=open_urls), cursor
+
+
+class ExportedInvoice(TLObject):
+    __tl_id__ = 0xaed0cbd9
+    __tl_name__ = "types.payments.ExportedInvoice"
+    __tl_layer__ = 143
+
+    __slots__ = ("url", )
+
+    def __init__(self, *, url: str):
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportedInvoice:
+        url = String.read(stream)
+        return cls(url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportedInvoice, int]:
+        url, cursor = String.read_from(view, cursor)
+        return cls(url=url), cursor
+
+
+class CheckedGiftCodeBase(TLObject):
+    __tl_id__ = 0x284a1096
+    __tl_name__ = "types.payments.CheckedGiftCode"
+    __tl_layer__ = 168
+
+    __slots__ = ("via_giveaway", "from_id", "giveaway_msg_id", "to_id", "date", "months", "used_date", "chats", "users", )
+
+    def __init__(self, *, date: int, months: int, chats: list[tl.base.Chat], users: list[tl.base.User], via_giveaway: bool = False, from_id: tl.base.Peer | None = None, giveaway_msg_id: int | None = None, to_id: int | None = None, used_date: int | None = None):
+        self.via_giveaway = via_giveaway
+        self.from_id = from_id
+        self.giveaway_msg_id = giveaway_msg_id
+        self.to_id = to_id
+        self.date = date
+        self.months = months
+        self.used_date = used_date
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.via_giveaway: flags1 |= (1 << 2)
+        if self.from_id is not None: flags1 |= (1 << 4)
+        if self.giveaway_msg_id is not None: flags1 |= (1 << 3)
+        if self.to_id is not None: flags1 |= (1 << 0)
+        if self.used_date is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.from_id is not None:
+            self.from_id.write_to(out, ctx)
+        if self.giveaway_msg_id is not None:
+            out += Int.write(self.giveaway_msg_id)
+        if self.to_id is not None:
+            out += Long.write(self.to_id)
+        out += Int.write(self.date)
+        out += Int.write(self.months)
+        if self.used_date is not None:
+            out += Int.write(self.used_date)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckedGiftCode:
+        flags1 = Int.read(stream)
+        via_giveaway = (flags1 & (1 << 2)) == (1 << 2)
+        from_id = TLObject.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        giveaway_msg_id = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        to_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        date = Int.read(stream)
+        months = Int.read(stream)
+        used_date = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(via_giveaway=via_giveaway, from_id=from_id, giveaway_msg_id=giveaway_msg_id, to_id=to_id, date=date, months=months, used_date=used_date, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckedGiftCode, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        via_giveaway = (flags1 & (1 << 2)) == (1 << 2)
+        from_id, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        giveaway_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        to_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        months, cursor = Int.read_from(view, cursor)
+        used_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(via_giveaway=via_giveaway, from_id=from_id, giveaway_msg_id=giveaway_msg_id, to_id=to_id, date=date, months=months, used_date=used_date, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class GiveawayInfo(TLObject):
+    __tl_id__ = 0x4367daa0
+    __tl_name__ = "types.payments.GiveawayInfo"
+    __tl_layer__ = 166
+
+    __slots__ = ("participating", "preparing_results", "start_date", "joined_too_early_date", "admin_disallowed_chat_id", "disallowed_country", )
+
+    def __init__(self, *, start_date: int, participating: bool = False, preparing_results: bool = False, joined_too_early_date: int | None = None, admin_disallowed_chat_id: int | None = None, disallowed_country: str | None = None):
+        self.participating = participating
+        self.preparing_results = preparing_results
+        self.start_date = start_date
+        self.joined_too_early_date = joined_too_early_date
+        self.admin_disallowed_chat_id = admin_disallowed_chat_id
+        self.disallowed_country = disallowed_country
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.participating: flags1 |= (1 << 0)
+        if self.preparing_results: flags1 |= (1 << 3)
+        if self.joined_too_early_date is not None: flags1 |= (1 << 1)
+        if self.admin_disallowed_chat_id is not None: flags1 |= (1 << 2)
+        if self.disallowed_country is not None: flags1 |= (1 << 4)
+        out += Int.write(flags1)
+        out += Int.write(self.start_date)
+        if self.joined_too_early_date is not None:
+            out += Int.write(self.joined_too_early_date)
+        if self.admin_disallowed_chat_id is not None:
+            out += Long.write(self.admin_disallowed_chat_id)
+        if self.disallowed_country is not None:
+            String.write_to(out, self.disallowed_country)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GiveawayInfo:
+        flags1 = Int.read(stream)
+        participating = (flags1 & (1 << 0)) == (1 << 0)
+        preparing_results = (flags1 & (1 << 3)) == (1 << 3)
+        start_date = Int.read(stream)
+        joined_too_early_date = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        admin_disallowed_chat_id = Long.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        disallowed_country = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        return cls(participating=participating, preparing_results=preparing_results, start_date=start_date, joined_too_early_date=joined_too_early_date, admin_disallowed_chat_id=admin_disallowed_chat_id, disallowed_country=disallowed_country)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GiveawayInfo, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        participating = (flags1 & (1 << 0)) == (1 << 0)
+        preparing_results = (flags1 & (1 << 3)) == (1 << 3)
+        start_date, cursor = Int.read_from(view, cursor)
+        joined_too_early_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        admin_disallowed_chat_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        disallowed_country, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        return cls(participating=participating, preparing_results=preparing_results, start_date=start_date, joined_too_early_date=joined_too_early_date, admin_disallowed_chat_id=admin_disallowed_chat_id, disallowed_country=disallowed_country), cursor
+
+
+class GiveawayInfoResultsBase(TLObject):
+    __tl_id__ = 0xe175e66f
+    __tl_name__ = "types.payments.GiveawayInfoResults"
+    __tl_layer__ = 187
+
+    __slots__ = ("winner", "refunded", "start_date", "gift_code_slug", "stars_prize", "finish_date", "winners_count", "activated_count", )
+
+    def __init__(self, *, start_date: int, finish_date: int, winners_count: int, winner: bool = False, refunded: bool = False, gift_code_slug: str | None = None, stars_prize: int | None = None, activated_count: int | None = None):
+        self.winner = winner
+        self.refunded = refunded
+        self.start_date = start_date
+        self.gift_code_slug = gift_code_slug
+        self.stars_prize = stars_prize
+        self.finish_date = finish_date
+        self.winners_count = winners_count
+        self.activated_count = activated_count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.winner: flags1 |= (1 << 0)
+        if self.refunded: flags1 |= (1 << 1)
+        if self.gift_code_slug is not None: flags1 |= (1 << 3)
+        if self.stars_prize is not None: flags1 |= (1 << 4)
+        if self.activated_count is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.start_date)
+        if self.gift_code_slug is not None:
+            String.write_to(out, self.gift_code_slug)
+        if self.stars_prize is not None:
+            out += Long.write(self.stars_prize)
+        out += Int.write(self.finish_date)
+        out += Int.write(self.winners_count)
+        if self.activated_count is not None:
+            out += Int.write(self.activated_count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GiveawayInfoResults:
+        flags1 = Int.read(stream)
+        winner = (flags1 & (1 << 0)) == (1 << 0)
+        refunded = (flags1 & (1 << 1)) == (1 << 1)
+        start_date = Int.read(stream)
+        gift_code_slug = String.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        stars_prize = Long.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        finish_date = Int.read(stream)
+        winners_count = Int.read(stream)
+        activated_count = Int.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(winner=winner, refunded=refunded, start_date=start_date, gift_code_slug=gift_code_slug, stars_prize=stars_prize, finish_date=finish_date, winners_count=winners_count, activated_count=activated_count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GiveawayInfoResults, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        winner = (flags1 & (1 << 0)) == (1 << 0)
+        refunded = (flags1 & (1 << 1)) == (1 << 1)
+        start_date, cursor = Int.read_from(view, cursor)
+        gift_code_slug, cursor = String.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        stars_prize, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        finish_date, cursor = Int.read_from(view, cursor)
+        winners_count, cursor = Int.read_from(view, cursor)
+        activated_count, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(winner=winner, refunded=refunded, start_date=start_date, gift_code_slug=gift_code_slug, stars_prize=stars_prize, finish_date=finish_date, winners_count=winners_count, activated_count=activated_count), cursor
+
+
+class StarsStatusBase(TLObject):
+    __tl_id__ = 0x6c9ce8ed
+    __tl_name__ = "types.payments.StarsStatus"
+    __tl_layer__ = 195
+
+    __slots__ = ("balance", "subscriptions", "subscriptions_next_offset", "subscriptions_missing_balance", "history", "next_offset", "chats", "users", )
+
+    def __init__(self, *, balance: tl.types.StarsAmount, chats: list[tl.base.Chat], users: list[tl.base.User], subscriptions: list[tl.base.StarsSubscription] | None = None, subscriptions_next_offset: str | None = None, subscriptions_missing_balance: int | None = None, history: list[tl.base.StarsTransaction] | None = None, next_offset: str | None = None):
+        self.balance = balance
+        self.subscriptions = subscriptions
+        self.subscriptions_next_offset = subscriptions_next_offset
+        self.subscriptions_missing_balance = subscriptions_missing_balance
+        self.history = history
+        self.next_offset = next_offset
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.subscriptions: flags1 |= (1 << 1)
+        if self.subscriptions_next_offset is not None: flags1 |= (1 << 2)
+        if self.subscriptions_missing_balance is not None: flags1 |= (1 << 4)
+        if self.history: flags1 |= (1 << 3)
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        self.balance.write_to(out, ctx)
+        if self.subscriptions:
+            TLObjectVector.write_to(out, self.subscriptions, ctx)
+        if self.subscriptions_next_offset is not None:
+            String.write_to(out, self.subscriptions_next_offset)
+        if self.subscriptions_missing_balance is not None:
+            out += Long.write(self.subscriptions_missing_balance)
+        if self.history:
+            TLObjectVector.write_to(out, self.history, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarsStatus:
+        flags1 = Int.read(stream)
+        balance = tl.types.StarsAmount.read(stream)
+        subscriptions = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        subscriptions_next_offset = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        subscriptions_missing_balance = Long.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        history = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(balance=balance, subscriptions=subscriptions, subscriptions_next_offset=subscriptions_next_offset, subscriptions_missing_balance=subscriptions_missing_balance, history=history, next_offset=next_offset, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarsStatus, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        balance, cursor = tl.types.StarsAmount.read_from(view, cursor)
+        subscriptions, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        subscriptions_next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        subscriptions_missing_balance, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        history, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(balance=balance, subscriptions=subscriptions, subscriptions_next_offset=subscriptions_next_offset, subscriptions_missing_balance=subscriptions_missing_balance, history=history, next_offset=next_offset, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        if self.history:
+            for history_item in self.history:
+                history_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StarsRevenueStats(TLObject):
+    __tl_id__ = 0xc92bb73b
+    __tl_name__ = "types.payments.StarsRevenueStats"
+    __tl_layer__ = 182
+
+    __slots__ = ("revenue_graph", "status", "usd_rate", )
+
+    def __init__(self, *, revenue_graph: tl.base.StatsGraph, status: tl.base.StarsRevenueStatus, usd_rate: float):
+        self.revenue_graph = revenue_graph
+        self.status = status
+        self.usd_rate = usd_rate
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.revenue_graph.write_to(out, ctx)
+        self.status.write_to(out, ctx)
+        out += Float.write(self.usd_rate)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarsRevenueStats:
+        revenue_graph = TLObject.read(stream)
+        status = TLObject.read(stream)
+        usd_rate = Float.read(stream)
+        return cls(revenue_graph=revenue_graph, status=status, usd_rate=usd_rate)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarsRevenueStats, int]:
+        revenue_graph, cursor = TLObject.read_from(view, cursor)
+        status, cursor = TLObject.read_from(view, cursor)
+        usd_rate, cursor = Float.read_from(view, cursor)
+        return cls(revenue_graph=revenue_graph, status=status, usd_rate=usd_rate), cursor
+
+
+class StarsRevenueWithdrawalUrl(TLObject):
+    __tl_id__ = 0x1dab80b7
+    __tl_name__ = "types.payments.StarsRevenueWithdrawalUrl"
+    __tl_layer__ = 182
+
+    __slots__ = ("url", )
+
+    def __init__(self, *, url: str):
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarsRevenueWithdrawalUrl:
+        url = String.read(stream)
+        return cls(url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarsRevenueWithdrawalUrl, int]:
+        url, cursor = String.read_from(view, cursor)
+        return cls(url=url), cursor
+
+
+class StarsRevenueAdsAccountUrl(TLObject):
+    __tl_id__ = 0x394e7f21
+    __tl_name__ = "types.payments.StarsRevenueAdsAccountUrl"
+    __tl_layer__ = 183
+
+    __slots__ = ("url", )
+
+    def __init__(self, *, url: str):
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarsRevenueAdsAccountUrl:
+        url = String.read(stream)
+        return cls(url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarsRevenueAdsAccountUrl, int]:
+        url, cursor = String.read_from(view, cursor)
+        return cls(url=url), cursor
+
+
+class StarGiftsNotModified(TLObject):
+    __tl_id__ = 0xa388a368
+    __tl_name__ = "types.payments.StarGiftsNotModified"
+    __tl_layer__ = 189
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarGiftsNotModified:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarGiftsNotModified, int]:
+        return cls(), cursor
+
+
+class StarGifts(TLObject):
+    __tl_id__ = 0x901689ea
+    __tl_name__ = "types.payments.StarGifts"
+    __tl_layer__ = 189
+
+    __slots__ = ("hash", "gifts", )
+
+    def __init__(self, *, hash: int, gifts: list[tl.base.StarGift]):
+        self.hash = hash
+        self.gifts = gifts
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.hash)
+        TLObjectVector.write_to(out, self.gifts, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarGifts:
+        hash = Int.read(stream)
+        gifts = TLObjectVector.read(stream)
+        return cls(hash=hash, gifts=gifts)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarGifts, int]:
+        hash, cursor = Int.read_from(view, cursor)
+        gifts, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(hash=hash, gifts=gifts), cursor
+
+
+class ConnectedStarRefBots(TLObject):
+    __tl_id__ = 0x98d5ea1d
+    __tl_name__ = "types.payments.ConnectedStarRefBots"
+    __tl_layer__ = 195
+
+    __slots__ = ("count", "connected_bots", "users", )
+
+    def __init__(self, *, count: int, connected_bots: list[tl.base.ConnectedBotStarRef], users: list[tl.base.User]):
+        self.count = count
+        self.connected_bots = connected_bots
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.connected_bots, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ConnectedStarRefBots:
+        count = Int.read(stream)
+        connected_bots = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, connected_bots=connected_bots, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ConnectedStarRefBots, int]:
+        count, cursor = Int.read_from(view, cursor)
+        connected_bots, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, connected_bots=connected_bots, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SuggestedStarRefBots(TLObject):
+    __tl_id__ = 0xb4d5d859
+    __tl_name__ = "types.payments.SuggestedStarRefBots"
+    __tl_layer__ = 195
+
+    __slots__ = ("count", "suggested_bots", "users", "next_offset", )
+
+    def __init__(self, *, count: int, suggested_bots: list[tl.base.StarRefProgram], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.suggested_bots = suggested_bots
+        self.users = users
+        self.next_offset = next_offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.suggested_bots, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SuggestedStarRefBots:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        suggested_bots = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(count=count, suggested_bots=suggested_bots, users=users, next_offset=next_offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SuggestedStarRefBots, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        suggested_bots, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(count=count, suggested_bots=suggested_bots, users=users, next_offset=next_offset), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StarGiftUpgradePreview(TLObject):
+    __tl_id__ = 0x167bd90b
+    __tl_name__ = "types.payments.StarGiftUpgradePreview"
+    __tl_layer__ = 196
+
+    __slots__ = ("sample_attributes", )
+
+    def __init__(self, *, sample_attributes: list[tl.base.StarGiftAttribute]):
+        self.sample_attributes = sample_attributes
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.sample_attributes, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarGiftUpgradePreview:
+        sample_attributes = TLObjectVector.read(stream)
+        return cls(sample_attributes=sample_attributes)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarGiftUpgradePreview, int]:
+        sample_attributes, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(sample_attributes=sample_attributes), cursor
+
+
+class UniqueStarGift(TLObject):
+    __tl_id__ = 0xcaa2f60b
+    __tl_name__ = "types.payments.UniqueStarGift"
+    __tl_layer__ = 197
+
+    __slots__ = ("gift", "users", )
+
+    def __init__(self, *, gift: tl.base.StarGift, users: list[tl.base.User]):
+        self.gift = gift
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.gift.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UniqueStarGift:
+        gift = TLObject.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(gift=gift, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UniqueStarGift, int]:
+        gift, cursor = TLObject.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(gift=gift, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class SavedStarGifts(TLObject):
+    __tl_id__ = 0x95f389b1
+    __tl_name__ = "types.payments.SavedStarGifts"
+    __tl_layer__ = 198
+
+    __slots__ = ("count", "chat_notifications_enabled", "gifts", "next_offset", "chats", "users", )
+
+    def __init__(self, *, count: int, gifts: list[tl.base.SavedStarGift], chats: list[tl.base.Chat], users: list[tl.base.User], chat_notifications_enabled: bool = False, next_offset: str | None = None):
+        self.count = count
+        self.chat_notifications_enabled = chat_notifications_enabled
+        self.gifts = gifts
+        self.next_offset = next_offset
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.chat_notifications_enabled is not None: flags1 |= (1 << 1)
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        if self.chat_notifications_enabled is not None:
+            out += Bool.write(self.chat_notifications_enabled)
+        TLObjectVector.write_to(out, self.gifts, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SavedStarGifts:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        chat_notifications_enabled = Bool.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        gifts = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, chat_notifications_enabled=chat_notifications_enabled, gifts=gifts, next_offset=next_offset, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SavedStarGifts, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        chat_notifications_enabled, cursor = Bool.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        gifts, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, chat_notifications_enabled=chat_notifications_enabled, gifts=gifts, next_offset=next_offset, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StarGiftWithdrawalUrl(TLObject):
+    __tl_id__ = 0x84aa3a9c
+    __tl_name__ = "types.payments.StarGiftWithdrawalUrl"
+    __tl_layer__ = 198
+
+    __slots__ = ("url", )
+
+    def __init__(self, *, url: str):
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarGiftWithdrawalUrl:
+        url = String.read(stream)
+        return cls(url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarGiftWithdrawalUrl, int]:
+        url, cursor = String.read_from(view, cursor)
+        return cls(url=url), cursor
+
+
+class PaymentForm_133(TLObject):
+    __tl_id__ = 0x1694761b
+    __tl_name__ = "types.payments.PaymentForm_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("can_save_credentials", "password_missing", "form_id", "bot_id", "invoice", "provider_id", "url", "native_provider", "native_params", "saved_info", "saved_credentials", "users", )
+
+    def __init__(self, *, form_id: int, bot_id: int, invoice: tl.base.Invoice, provider_id: int, url: str, users: list[tl.base.User], can_save_credentials: bool = False, password_missing: bool = False, native_provider: str | None = None, native_params: tl.types.DataJSON | None = None, saved_info: tl.types.PaymentRequestedInfo | None = None, saved_credentials: tl.types.PaymentSavedCredentialsCard | None = None):
+        self.can_save_credentials = can_save_credentials
+        self.password_missing = password_missing
+        self.form_id = form_id
+        self.bot_id = bot_id
+        self.invoice = invoice
+        self.provider_id = provider_id
+        self.url = url
+        self.native_provider = native_provider
+        self.native_params = native_params
+        self.saved_info = saved_info
+        self.saved_credentials = saved_credentials
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.native_provider is None, self.native_params is None)
+        _flags_fields_not_empty = (self.native_provider is not None, self.native_params is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: native_provider, native_params")
+        flags1 = 0
+        if self.can_save_credentials: flags1 |= (1 << 2)
+        if self.password_missing: flags1 |= (1 << 3)
+        if self.native_provider is not None: flags1 |= (1 << 4)
+        if self.native_params is not None: flags1 |= (1 << 4)
+        if self.saved_info is not None: flags1 |= (1 << 0)
+        if self.saved_credentials is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Long.write(self.form_id)
+        out += Long.write(self.bot_id)
+        self.invoice.write_to(out, ctx)
+        out += Long.write(self.provider_id)
+        String.write_to(out, self.url)
+        if self.native_provider is not None:
+            String.write_to(out, self.native_provider)
+        if self.native_params is not None:
+            self.native_params.write_to(out, ctx)
+        if self.saved_info is not None:
+            self.saved_info.write_to(out, ctx)
+        if self.saved_credentials is not None:
+            self.saved_credentials.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaymentForm_133:
+        flags1 = Int.read(stream)
+        can_save_credentials = (flags1 & (1 << 2)) == (1 << 2)
+        password_missing = (flags1 & (1 << 3)) == (1 << 3)
+        form_id = Long.read(stream)
+        bot_id = Long.read(stream)
+        invoice = TLObject.read(stream)
+        provider_id = Long.read(stream)
+        url = String.read(stream)
+        native_provider = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        native_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        saved_info = tl.types.PaymentRequestedInfo.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        saved_credentials = tl.types.PaymentSavedCredentialsCard.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        users = TLObjectVector.read(stream)
+        return cls(can_save_credentials=can_save_credentials, password_missing=password_missing, form_id=form_id, bot_id=bot_id, invoice=invoice, provider_id=provider_id, url=url, native_provider=native_provider, native_params=native_params, saved_info=saved_info, saved_credentials=saved_credentials, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaymentForm_133, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        can_save_credentials = (flags1 & (1 << 2)) == (1 << 2)
+        password_missing = (flags1 & (1 << 3)) == (1 << 3)
+        form_id, cursor = Long.read_from(view, cursor)
+        bot_id, cursor = Long.read_from(view, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        provider_id, cursor = Long.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor)
+        native_provider, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        native_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        saved_info, cursor = tl.types.PaymentRequestedInfo.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        saved_credentials, cursor = tl.types.PaymentSavedCredentialsCard.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(can_save_credentials=can_save_credentials, password_missing=password_missing, form_id=form_id, bot_id=bot_id, invoice=invoice, provider_id=provider_id, url=url, native_provider=native_provider, native_params=native_params, saved_info=saved_info, saved_credentials=saved_credentials, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PaymentForm_143(TLObject):
+    __tl_id__ = 0xb0133b37
+    __tl_name__ = "types.payments.PaymentForm_143"
+    __tl_layer__ = 143
+
+    __slots__ = ("can_save_credentials", "password_missing", "form_id", "bot_id", "title", "description", "photo", "invoice", "provider_id", "url", "native_provider", "native_params", "saved_info", "saved_credentials", "users", )
+
+    def __init__(self, *, form_id: int, bot_id: int, title: str, description: str, invoice: tl.base.Invoice, provider_id: int, url: str, users: list[tl.base.User], can_save_credentials: bool = False, password_missing: bool = False, photo: tl.base.WebDocument | None = None, native_provider: str | None = None, native_params: tl.types.DataJSON | None = None, saved_info: tl.types.PaymentRequestedInfo | None = None, saved_credentials: tl.types.PaymentSavedCredentialsCard | None = None):
+        self.can_save_credentials = can_save_credentials
+        self.password_missing = password_missing
+        self.form_id = form_id
+        self.bot_id = bot_id
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.invoice = invoice
+        self.provider_id = provider_id
+        self.url = url
+        self.native_provider = native_provider
+        self.native_params = native_params
+        self.saved_info = saved_info
+        self.saved_credentials = saved_credentials
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.native_provider is None, self.native_params is None)
+        _flags_fields_not_empty = (self.native_provider is not None, self.native_params is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: native_provider, native_params")
+        flags1 = 0
+        if self.can_save_credentials: flags1 |= (1 << 2)
+        if self.password_missing: flags1 |= (1 << 3)
+        if self.photo is not None: flags1 |= (1 << 5)
+        if self.native_provider is not None: flags1 |= (1 << 4)
+        if self.native_params is not None: flags1 |= (1 << 4)
+        if self.saved_info is not None: flags1 |= (1 << 0)
+        if self.saved_credentials is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Long.write(self.form_id)
+        out += Long.write(self.bot_id)
+        String.write_to(out, self.title)
+        String.write_to(out, self.description)
+        if self.photo is not None:
+            self.photo.write_to(out, ctx)
+        self.invoice.write_to(out, ctx)
+        out += Long.write(self.provider_id)
+        String.write_to(out, self.url)
+        if self.native_provider is not None:
+            String.write_to(out, self.native_provider)
+        if self.native_params is not None:
+            self.native_params.write_to(out, ctx)
+        if self.saved_info is not None:
+            self.saved_info.write_to(out, ctx)
+        if self.saved_credentials is not None:
+            self.saved_credentials.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PaymentForm_143:
+        flags1 = Int.read(stream)
+        can_save_credentials = (flags1 & (1 << 2)) == (1 << 2)
+        password_missing = (flags1 & (1 << 3)) == (1 << 3)
+        form_id = Long.read(stream)
+        bot_id = Long.read(stream)
+        title = String.read(stream)
+        description = String.read(stream)
+        photo = TLObject.read(stream) if (flags1 & (1 << 5)) == (1 << 5) else None
+        invoice = TLObject.read(stream)
+        provider_id = Long.read(stream)
+        url = String.read(stream)
+        native_provider = String.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        native_params = tl.types.DataJSON.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        saved_info = tl.types.PaymentRequestedInfo.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        saved_credentials = tl.types.PaymentSavedCredentialsCard.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        users = TLObjectVector.read(stream)
+        return cls(can_save_credentials=can_save_credentials, password_missing=password_missing, form_id=form_id, bot_id=bot_id, title=title, description=description, photo=photo, invoice=invoice, provider_id=provider_id, url=url, native_provider=native_provider, native_params=native_params, saved_info=saved_info, saved_credentials=saved_credentials, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PaymentForm_143, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        can_save_credentials = (flags1 & (1 << 2)) == (1 << 2)
+        password_missing = (flags1 & (1 << 3)) == (1 << 3)
+        form_id, cursor = Long.read_from(view, cursor)
+        bot_id, cursor = Long.read_from(view, cursor)
+        title, cursor = String.read_from(view, cursor)
+        description, cursor = String.read_from(view, cursor)
+        photo, cursor = TLObject.read_from(view, cursor) if (flags1 & (1 << 5)) == (1 << 5) else (None, cursor)
+        invoice, cursor = TLObject.read_from(view, cursor)
+        provider_id, cursor = Long.read_from(view, cursor)
+        url, cursor = String.read_from(view, cursor)
+        native_provider, cursor = String.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        native_params, cursor = tl.types.DataJSON.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        saved_info, cursor = tl.types.PaymentRequestedInfo.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        saved_credentials, cursor = tl.types.PaymentSavedCredentialsCard.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(can_save_credentials=can_save_credentials, password_missing=password_missing, form_id=form_id, bot_id=bot_id, title=title, description=description, photo=photo, invoice=invoice, provider_id=provider_id, url=url, native_provider=native_provider, native_params=native_params, saved_info=saved_info, saved_credentials=saved_credentials, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class CheckedGiftCode_166(TLObject):
+    __tl_id__ = 0xb722f158
+    __tl_name__ = "types.payments.CheckedGiftCode_166"
+    __tl_layer__ = 166
+
+    __slots__ = ("via_giveaway", "from_id", "giveaway_msg_id", "to_id", "date", "months", "used_date", "chats", "users", )
+
+    def __init__(self, *, from_id: tl.base.Peer, date: int, months: int, chats: list[tl.base.Chat], users: list[tl.base.User], via_giveaway: bool = False, giveaway_msg_id: int | None = None, to_id: int | None = None, used_date: int | None = None):
+        self.via_giveaway = via_giveaway
+        self.from_id = from_id
+        self.giveaway_msg_id = giveaway_msg_id
+        self.to_id = to_id
+        self.date = date
+        self.months = months
+        self.used_date = used_date
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.via_giveaway: flags1 |= (1 << 2)
+        if self.giveaway_msg_id is not None: flags1 |= (1 << 3)
+        if self.to_id is not None: flags1 |= (1 << 0)
+        if self.used_date is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        self.from_id.write_to(out, ctx)
+        if self.giveaway_msg_id is not None:
+            out += Int.write(self.giveaway_msg_id)
+        if self.to_id is not None:
+            out += Long.write(self.to_id)
+        out += Int.write(self.date)
+        out += Int.write(self.months)
+        if self.used_date is not None:
+            out += Int.write(self.used_date)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CheckedGiftCode_166:
+        flags1 = Int.read(stream)
+        via_giveaway = (flags1 & (1 << 2)) == (1 << 2)
+        from_id = TLObject.read(stream)
+        giveaway_msg_id = Int.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        to_id = Long.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        date = Int.read(stream)
+        months = Int.read(stream)
+        used_date = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(via_giveaway=via_giveaway, from_id=from_id, giveaway_msg_id=giveaway_msg_id, to_id=to_id, date=date, months=months, used_date=used_date, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CheckedGiftCode_166, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        via_giveaway = (flags1 & (1 << 2)) == (1 << 2)
+        from_id, cursor = TLObject.read_from(view, cursor)
+        giveaway_msg_id, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        to_id, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        months, cursor = Int.read_from(view, cursor)
+        used_date, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(via_giveaway=via_giveaway, from_id=from_id, giveaway_msg_id=giveaway_msg_id, to_id=to_id, date=date, months=months, used_date=used_date, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class GiveawayInfoResults_166(TLObject):
+    __tl_id__ = 0xcd5570
+    __tl_name__ = "types.payments.GiveawayInfoResults_166"
+    __tl_layer__ = 166
+
+    __slots__ = ("winner", "refunded", "start_date", "gift_code_slug", "finish_date", "winners_count", "activated_count", )
+
+    def __init__(self, *, start_date: int, finish_date: int, winners_count: int, activated_count: int, winner: bool = False, refunded: bool = False, gift_code_slug: str | None = None):
+        self.winner = winner
+        self.refunded = refunded
+        self.start_date = start_date
+        self.gift_code_slug = gift_code_slug
+        self.finish_date = finish_date
+        self.winners_count = winners_count
+        self.activated_count = activated_count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.winner is False, self.gift_code_slug is None)
+        _flags_fields_not_empty = (self.winner is True, self.gift_code_slug is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: winner, gift_code_slug")
+        flags1 = 0
+        if self.winner: flags1 |= (1 << 0)
+        if self.refunded: flags1 |= (1 << 1)
+        if self.gift_code_slug is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.start_date)
+        if self.gift_code_slug is not None:
+            String.write_to(out, self.gift_code_slug)
+        out += Int.write(self.finish_date)
+        out += Int.write(self.winners_count)
+        out += Int.write(self.activated_count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GiveawayInfoResults_166:
+        flags1 = Int.read(stream)
+        winner = (flags1 & (1 << 0)) == (1 << 0)
+        refunded = (flags1 & (1 << 1)) == (1 << 1)
+        start_date = Int.read(stream)
+        gift_code_slug = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        finish_date = Int.read(stream)
+        winners_count = Int.read(stream)
+        activated_count = Int.read(stream)
+        return cls(winner=winner, refunded=refunded, start_date=start_date, gift_code_slug=gift_code_slug, finish_date=finish_date, winners_count=winners_count, activated_count=activated_count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GiveawayInfoResults_166, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        winner = (flags1 & (1 << 0)) == (1 << 0)
+        refunded = (flags1 & (1 << 1)) == (1 << 1)
+        start_date, cursor = Int.read_from(view, cursor)
+        gift_code_slug, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        finish_date, cursor = Int.read_from(view, cursor)
+        winners_count, cursor = Int.read_from(view, cursor)
+        activated_count, cursor = Int.read_from(view, cursor)
+        return cls(winner=winner, refunded=refunded, start_date=start_date, gift_code_slug=gift_code_slug, finish_date=finish_date, winners_count=winners_count, activated_count=activated_count), cursor
+
+
+class StarsStatus_181(TLObject):
+    __tl_id__ = 0x8cf4ee60
+    __tl_name__ = "types.payments.StarsStatus_181"
+    __tl_layer__ = 181
+
+    __slots__ = ("balance", "history", "next_offset", "chats", "users", )
+
+    def __init__(self, *, balance: int, history: list[tl.base.StarsTransaction], chats: list[tl.base.Chat], users: list[tl.base.User], next_offset: str | None = None):
+        self.balance = balance
+        self.history = history
+        self.next_offset = next_offset
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Long.write(self.balance)
+        TLObjectVector.write_to(out, self.history, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarsStatus_181:
+        flags1 = Int.read(stream)
+        balance = Long.read(stream)
+        history = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(balance=balance, history=history, next_offset=next_offset, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarsStatus_181, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        balance, cursor = Long.read_from(view, cursor)
+        history, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(balance=balance, history=history, next_offset=next_offset, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for history_item in self.history:
+            history_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StarsStatus_186(TLObject):
+    __tl_id__ = 0xbbfa316c
+    __tl_name__ = "types.payments.StarsStatus_186"
+    __tl_layer__ = 186
+
+    __slots__ = ("balance", "subscriptions", "subscriptions_next_offset", "subscriptions_missing_balance", "history", "next_offset", "chats", "users", )
+
+    def __init__(self, *, balance: int, chats: list[tl.base.Chat], users: list[tl.base.User], subscriptions: list[tl.base.StarsSubscription] | None = None, subscriptions_next_offset: str | None = None, subscriptions_missing_balance: int | None = None, history: list[tl.base.StarsTransaction] | None = None, next_offset: str | None = None):
+        self.balance = balance
+        self.subscriptions = subscriptions
+        self.subscriptions_next_offset = subscriptions_next_offset
+        self.subscriptions_missing_balance = subscriptions_missing_balance
+        self.history = history
+        self.next_offset = next_offset
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.subscriptions: flags1 |= (1 << 1)
+        if self.subscriptions_next_offset is not None: flags1 |= (1 << 2)
+        if self.subscriptions_missing_balance is not None: flags1 |= (1 << 4)
+        if self.history: flags1 |= (1 << 3)
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Long.write(self.balance)
+        if self.subscriptions:
+            TLObjectVector.write_to(out, self.subscriptions, ctx)
+        if self.subscriptions_next_offset is not None:
+            String.write_to(out, self.subscriptions_next_offset)
+        if self.subscriptions_missing_balance is not None:
+            out += Long.write(self.subscriptions_missing_balance)
+        if self.history:
+            TLObjectVector.write_to(out, self.history, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StarsStatus_186:
+        flags1 = Int.read(stream)
+        balance = Long.read(stream)
+        subscriptions = TLObjectVector.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        subscriptions_next_offset = String.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        subscriptions_missing_balance = Long.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        history = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(balance=balance, subscriptions=subscriptions, subscriptions_next_offset=subscriptions_next_offset, subscriptions_missing_balance=subscriptions_missing_balance, history=history, next_offset=next_offset, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StarsStatus_186, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        balance, cursor = Long.read_from(view, cursor)
+        subscriptions, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        subscriptions_next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        subscriptions_missing_balance, cursor = Long.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        history, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(balance=balance, subscriptions=subscriptions, subscriptions_next_offset=subscriptions_next_offset, subscriptions_missing_balance=subscriptions_missing_balance, history=history, next_offset=next_offset, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        if self.history:
+            for history_item in self.history:
+                history_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class UserStarGifts_189(TLObject):
+    __tl_id__ = 0x6b65b517
+    __tl_name__ = "types.payments.UserStarGifts_189"
+    __tl_layer__ = 189
+
+    __slots__ = ("count", "gifts", "next_offset", "users", )
+
+    def __init__(self, *, count: int, gifts: list[tl.base.UserStarGift], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.gifts = gifts
+        self.next_offset = next_offset
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.gifts, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UserStarGifts_189:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        gifts = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        users = TLObjectVector.read(stream)
+        return cls(count=count, gifts=gifts, next_offset=next_offset, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UserStarGifts_189, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        gifts, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, gifts=gifts, next_offset=next_offset, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PaymentForm(PaymentFormBase):
+    __tl_ids__ = (
+        (PaymentForm_133.__tl_layer__, PaymentForm_133.__tl_id__),
+        (PaymentForm_143.__tl_layer__, PaymentForm_143.__tl_id__),
+        (PaymentFormBase.__tl_layer__, PaymentFormBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _saved_credentials_downgrade_133 = tl.layer_converters.payments__payment_form.downgrade_saved_credentials_for_133(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.can_save_credentials: flags1 |= (1 << 2)
+        if self.password_missing: flags1 |= (1 << 3)
+        if ctx.layer >= 143:
+            if self.photo is not None: flags1 |= (1 << 5)
+        if self.native_provider is not None: flags1 |= (1 << 4)
+        if self.native_params is not None: flags1 |= (1 << 4)
+        if ctx.layer >= 144:
+            if self.additional_methods: flags1 |= (1 << 6)
+        if self.saved_info is not None: flags1 |= (1 << 0)
+        if ctx.layer >= 144:
+            if self.saved_credentials: flags1 |= (1 << 1)
+        if ctx.layer <= 143:
+            if _saved_credentials_downgrade_133 is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Long.write(self.form_id)
+        out += Long.write(self.bot_id)
+        if ctx.layer >= 143:
+            String.write_to(out, self.title)
+        if ctx.layer >= 143:
+            String.write_to(out, self.description)
+        if ctx.layer >= 143:
+            if self.photo is not None:
+                self.photo.write_to(out, ctx)
+        self.invoice.write_to(out, ctx)
+        out += Long.write(self.provider_id)
+        String.write_to(out, self.url)
+        if self.native_provider is not None:
+            String.write_to(out, self.native_provider)
+        if self.native_params is not None:
+            self.native_params.write_to(out, ctx)
+        if ctx.layer >= 144:
+            if self.additional_methods:
+                TLObjectVector.write_to(out, self.additional_methods, ctx)
+        if self.saved_info is not None:
+            self.saved_info.write_to(out, ctx)
+        if ctx.layer >= 144:
+            if self.saved_credentials:
+                TLObjectVector.write_to(out, self.saved_credentials, ctx)
+        if ctx.layer <= 143:
+            if _saved_credentials_downgrade_133 is not None:
+                _saved_credentials_downgrade_133.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+
+class CheckedGiftCode(CheckedGiftCodeBase):
+    __tl_ids__ = (
+        (CheckedGiftCode_166.__tl_layer__, CheckedGiftCode_166.__tl_id__),
+        (CheckedGiftCodeBase.__tl_layer__, CheckedGiftCodeBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _from_id_downgrade_166 = tl.layer_converters.payments__checked_gift_code.downgrade_from_id_for_166(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.via_giveaway: flags1 |= (1 << 2)
+        if ctx.layer >= 168:
+            if self.from_id is not None: flags1 |= (1 << 4)
+        if self.giveaway_msg_id is not None: flags1 |= (1 << 3)
+        if self.to_id is not None: flags1 |= (1 << 0)
+        if self.used_date is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if ctx.layer >= 168:
+            if self.from_id is not None:
+                self.from_id.write_to(out, ctx)
+        if ctx.layer <= 167:
+            _from_id_downgrade_166.write_to(out, ctx)
+        if self.giveaway_msg_id is not None:
+            out += Int.write(self.giveaway_msg_id)
+        if self.to_id is not None:
+            out += Long.write(self.to_id)
+        out += Int.write(self.date)
+        out += Int.write(self.months)
+        if self.used_date is not None:
+            out += Int.write(self.used_date)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+
+class GiveawayInfoResults(GiveawayInfoResultsBase):
+    __tl_ids__ = (
+        (GiveawayInfoResults_166.__tl_layer__, GiveawayInfoResults_166.__tl_id__),
+        (GiveawayInfoResultsBase.__tl_layer__, GiveawayInfoResultsBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _gift_code_slug_downgrade_166 = tl.layer_converters.payments__giveaway_info_results.downgrade_gift_code_slug_for_166(self, ctx)
+        _activated_count_downgrade_166 = tl.layer_converters.payments__giveaway_info_results.downgrade_activated_count_for_166(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.winner: flags1 |= (1 << 0)
+        if self.refunded: flags1 |= (1 << 1)
+        if ctx.layer >= 187:
+            if self.gift_code_slug is not None: flags1 |= (1 << 3)
+        if ctx.layer >= 187:
+            if self.stars_prize is not None: flags1 |= (1 << 4)
+        if ctx.layer <= 186:
+            if _gift_code_slug_downgrade_166 is not None: flags1 |= (1 << 0)
+        if ctx.layer >= 187:
+            if self.activated_count is not None: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.start_date)
+        if ctx.layer >= 187:
+            if self.gift_code_slug is not None:
+                String.write_to(out, self.gift_code_slug)
+        if ctx.layer >= 187:
+            if self.stars_prize is not None:
+                out += Long.write(self.stars_prize)
+        if ctx.layer <= 186:
+            if _gift_code_slug_downgrade_166 is not None:
+                String.write_to(out, _gift_code_slug_downgrade_166)
+        out += Int.write(self.finish_date)
+        out += Int.write(self.winners_count)
+        if ctx.layer >= 187:
+            if self.activated_count is not None:
+                out += Int.write(self.activated_count)
+        if ctx.layer <= 186:
+            out += Int.write(_activated_count_downgrade_166)
+
+
+class StarsStatus(StarsStatusBase):
+    __tl_ids__ = (
+        (StarsStatus_181.__tl_layer__, StarsStatus_181.__tl_id__),
+        (StarsStatus_186.__tl_layer__, StarsStatus_186.__tl_id__),
+        (StarsStatusBase.__tl_layer__, StarsStatusBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _balance_downgrade_181 = tl.layer_converters.payments__stars_status.downgrade_balance_for_181(self, ctx)
+        _history_downgrade_181 = tl.layer_converters.payments__stars_status.downgrade_history_for_181(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if ctx.layer >= 186:
+            if self.subscriptions: flags1 |= (1 << 1)
+        if ctx.layer >= 186:
+            if self.subscriptions_next_offset is not None: flags1 |= (1 << 2)
+        if ctx.layer >= 186:
+            if self.subscriptions_missing_balance is not None: flags1 |= (1 << 4)
+        if ctx.layer >= 186:
+            if self.history: flags1 |= (1 << 3)
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        if ctx.layer >= 195:
+            self.balance.write_to(out, ctx)
+        if ctx.layer <= 194:
+            out += Long.write(_balance_downgrade_181)
+        if ctx.layer >= 186:
+            if self.subscriptions:
+                TLObjectVector.write_to(out, self.subscriptions, ctx)
+        if ctx.layer >= 186:
+            if self.subscriptions_next_offset is not None:
+                String.write_to(out, self.subscriptions_next_offset)
+        if ctx.layer >= 186:
+            if self.subscriptions_missing_balance is not None:
+                out += Long.write(self.subscriptions_missing_balance)
+        if ctx.layer >= 186:
+            if self.history:
+                TLObjectVector.write_to(out, self.history, ctx)
+        if ctx.layer <= 185:
+            TLObjectVector.write_to(out, _history_downgrade_181, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
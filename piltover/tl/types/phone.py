@@ -0,0 +1,257 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class PhoneCall(TLObject):
+    __tl_id__ = 0xec82e140
+    __tl_name__ = "types.phone.PhoneCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("phone_call", "users", )
+
+    def __init__(self, *, phone_call: tl.base.PhoneCall, users: list[tl.base.User]):
+        self.phone_call = phone_call
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.phone_call.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PhoneCall:
+        phone_call = TLObject.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(phone_call=phone_call, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PhoneCall, int]:
+        phone_call, cursor = TLObject.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(phone_call=phone_call, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class GroupCall(TLObject):
+    __tl_id__ = 0x9e727aad
+    __tl_name__ = "types.phone.GroupCall"
+    __tl_layer__ = 133
+
+    __slots__ = ("call", "participants", "participants_next_offset", "chats", "users", )
+
+    def __init__(self, *, call: tl.base.GroupCall, participants: list[tl.base.GroupCallParticipant], participants_next_offset: str, chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.call = call
+        self.participants = participants
+        self.participants_next_offset = participants_next_offset
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.call.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.participants, ctx)
+        String.write_to(out, self.participants_next_offset)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GroupCall:
+        call = TLObject.read(stream)
+        participants = TLObjectVector.read(stream)
+        participants_next_offset = String.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(call=call, participants=participants, participants_next_offset=participants_next_offset, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GroupCall, int]:
+        call, cursor = TLObject.read_from(view, cursor)
+        participants, cursor = TLObjectVector.read_from(view, cursor)
+        participants_next_offset, cursor = String.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(call=call, participants=participants, participants_next_offset=participants_next_offset, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class GroupParticipants(TLObject):
+    __tl_id__ = 0xf47751b6
+    __tl_name__ = "types.phone.GroupParticipants"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "participants", "next_offset", "chats", "users", "version", )
+
+    def __init__(self, *, count: int, participants: list[tl.base.GroupCallParticipant], next_offset: str, chats: list[tl.base.Chat], users: list[tl.base.User], version: int):
+        self.count = count
+        self.participants = participants
+        self.next_offset = next_offset
+        self.chats = chats
+        self.users = users
+        self.version = version
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.participants, ctx)
+        String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        out += Int.write(self.version)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GroupParticipants:
+        count = Int.read(stream)
+        participants = TLObjectVector.read(stream)
+        next_offset = String.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        version = Int.read(stream)
+        return cls(count=count, participants=participants, next_offset=next_offset, chats=chats, users=users, version=version)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GroupParticipants, int]:
+        count, cursor = Int.read_from(view, cursor)
+        participants, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        version, cursor = Int.read_from(view, cursor)
+        return cls(count=count, participants=participants, next_offset=next_offset, chats=chats, users=users, version=version), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class JoinAsPeers(TLObject):
+    __tl_id__ = 0xafe5623f
+    __tl_name__ = "types.phone.JoinAsPeers"
+    __tl_layer__ = 133
+
+    __slots__ = ("peers", "chats", "users", )
+
+    def __init__(self, *, peers: list[tl.base.Peer], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.peers = peers
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.peers, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> JoinAsPeers:
+        peers = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(peers=peers, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[JoinAsPeers, int]:
+        peers, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(peers=peers, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ExportedGroupCallInvite(TLObject):
+    __tl_id__ = 0x204bd158
+    __tl_name__ = "types.phone.ExportedGroupCallInvite"
+    __tl_layer__ = 133
+
+    __slots__ = ("link", )
+
+    def __init__(self, *, link: str):
+        self.link = link
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.link)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ExportedGroupCallInvite:
+        link = String.read(stream)
+        return cls(link=link)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ExportedGroupCallInvite, int]:
+        link, cursor = String.read_from(view, cursor)
+        return cls(link=link), cursor
+
+
+class GroupCallStreamChannels(TLObject):
+    __tl_id__ = 0xd0e482b2
+    __tl_name__ = "types.phone.GroupCallStreamChannels"
+    __tl_layer__ = 139
+
+    __slots__ = ("channels", )
+
+    def __init__(self, *, channels: list[tl.base.GroupCallStreamChannel]):
+        self.channels = channels
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.channels, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GroupCallStreamChannels:
+        channels = TLObjectVector.read(stream)
+        return cls(channels=channels)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GroupCallStreamChannels, int]:
+        channels, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(channels=channels), cursor
+
+
+class GroupCallStreamRtmpUrl(TLObject):
+    __tl_id__ = 0x2dbf3432
+    __tl_name__ = "types.phone.GroupCallStreamRtmpUrl"
+    __tl_layer__ = 139
+
+    __slots__ = ("url", "key", )
+
+    def __init__(self, *, url: str, key: str):
+        self.url = url
+        self.key = key
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+        String.write_to(out, self.key)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> GroupCallStreamRtmpUrl:
+        url = String.read(stream)
+        key = String.read(stream)
+        return cls(url=url, key=key)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[GroupCallStreamRtmpUrl, int]:
+        url, cursor = String.read_from(view, cursor)
+        key, cursor = String.read_from(view, cursor)
+        return cls(url=url, key=key), cursor
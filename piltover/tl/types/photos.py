@@ -0,0 +1,115 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class Photos(TLObject):
+    __tl_id__ = 0x8dca6aa5
+    __tl_name__ = "types.photos.Photos"
+    __tl_layer__ = 133
+
+    __slots__ = ("photos", "users", )
+
+    def __init__(self, *, photos: list[tl.base.Photo], users: list[tl.base.User]):
+        self.photos = photos
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.photos, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Photos:
+        photos = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(photos=photos, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Photos, int]:
+        photos, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(photos=photos, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PhotosSlice(TLObject):
+    __tl_id__ = 0x15051f54
+    __tl_name__ = "types.photos.PhotosSlice"
+    __tl_layer__ = 133
+
+    __slots__ = ("count", "photos", "users", )
+
+    def __init__(self, *, count: int, photos: list[tl.base.Photo], users: list[tl.base.User]):
+        self.count = count
+        self.photos = photos
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.photos, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PhotosSlice:
+        count = Int.read(stream)
+        photos = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, photos=photos, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PhotosSlice, int]:
+        count, cursor = Int.read_from(view, cursor)
+        photos, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, photos=photos, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class Photo(TLObject):
+    __tl_id__ = 0x20212ca8
+    __tl_name__ = "types.photos.Photo"
+    __tl_layer__ = 133
+
+    __slots__ = ("photo", "users", )
+
+    def __init__(self, *, photo: tl.base.Photo, users: list[tl.base.User]):
+        self.photo = photo
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.photo.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Photo:
+        photo = TLObject.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(photo=photo, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Photo, int]:
+        photo, cursor = TLObject.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(photo=photo, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
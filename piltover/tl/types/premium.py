@@ -0,0 +1,177 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class BoostsList(TLObject):
+    __tl_id__ = 0x86f8613c
+    __tl_name__ = "types.premium.BoostsList"
+    __tl_layer__ = 166
+
+    __slots__ = ("count", "boosts", "next_offset", "users", )
+
+    def __init__(self, *, count: int, boosts: list[tl.base.Boost], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.boosts = boosts
+        self.next_offset = next_offset
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.boosts, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BoostsList:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        boosts = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        users = TLObjectVector.read(stream)
+        return cls(count=count, boosts=boosts, next_offset=next_offset, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BoostsList, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        boosts, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, boosts=boosts, next_offset=next_offset, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class MyBoosts(TLObject):
+    __tl_id__ = 0x9ae228e2
+    __tl_name__ = "types.premium.MyBoosts"
+    __tl_layer__ = 166
+
+    __slots__ = ("my_boosts", "chats", "users", )
+
+    def __init__(self, *, my_boosts: list[tl.base.MyBoost], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.my_boosts = my_boosts
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.my_boosts, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MyBoosts:
+        my_boosts = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(my_boosts=my_boosts, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MyBoosts, int]:
+        my_boosts, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(my_boosts=my_boosts, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class BoostsStatus(TLObject):
+    __tl_id__ = 0x4959427a
+    __tl_name__ = "types.premium.BoostsStatus"
+    __tl_layer__ = 166
+
+    __slots__ = ("my_boost", "level", "current_level_boosts", "boosts", "gift_boosts", "next_level_boosts", "premium_audience", "boost_url", "prepaid_giveaways", "my_boost_slots", )
+
+    def __init__(self, *, level: int, current_level_boosts: int, boosts: int, boost_url: str, my_boost: bool = False, gift_boosts: int | None = None, next_level_boosts: int | None = None, premium_audience: tl.types.StatsPercentValue | None = None, prepaid_giveaways: list[tl.base.PrepaidGiveaway] | None = None, my_boost_slots: list[int] | None = None):
+        self.my_boost = my_boost
+        self.level = level
+        self.current_level_boosts = current_level_boosts
+        self.boosts = boosts
+        self.gift_boosts = gift_boosts
+        self.next_level_boosts = next_level_boosts
+        self.premium_audience = premium_audience
+        self.boost_url = boost_url
+        self.prepaid_giveaways = prepaid_giveaways
+        self.my_boost_slots = my_boost_slots
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        _flags_fields_empty = (self.my_boost is False, self.my_boost_slots is None)
+        _flags_fields_not_empty = (self.my_boost is True, self.my_boost_slots is not None)
+        if not (all(_flags_fields_empty) or all(_flags_fields_not_empty)):
+            raise ValueError("Some of the optional fields are empty and some are not empty: my_boost, my_boost_slots")
+        flags1 = 0
+        if self.my_boost: flags1 |= (1 << 2)
+        if self.gift_boosts is not None: flags1 |= (1 << 4)
+        if self.next_level_boosts is not None: flags1 |= (1 << 0)
+        if self.premium_audience is not None: flags1 |= (1 << 1)
+        if self.prepaid_giveaways: flags1 |= (1 << 3)
+        if self.my_boost_slots: flags1 |= (1 << 2)
+        out += Int.write(flags1)
+        out += Int.write(self.level)
+        out += Int.write(self.current_level_boosts)
+        out += Int.write(self.boosts)
+        if self.gift_boosts is not None:
+            out += Int.write(self.gift_boosts)
+        if self.next_level_boosts is not None:
+            out += Int.write(self.next_level_boosts)
+        if self.premium_audience is not None:
+            self.premium_audience.write_to(out, ctx)
+        String.write_to(out, self.boost_url)
+        if self.prepaid_giveaways:
+            TLObjectVector.write_to(out, self.prepaid_giveaways, ctx)
+        if self.my_boost_slots is not None:
+            out += IntVector.write(self.my_boost_slots)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BoostsStatus:
+        flags1 = Int.read(stream)
+        my_boost = (flags1 & (1 << 2)) == (1 << 2)
+        level = Int.read(stream)
+        current_level_boosts = Int.read(stream)
+        boosts = Int.read(stream)
+        gift_boosts = Int.read(stream) if (flags1 & (1 << 4)) == (1 << 4) else None
+        next_level_boosts = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        premium_audience = tl.types.StatsPercentValue.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        boost_url = String.read(stream)
+        prepaid_giveaways = TLObjectVector.read(stream) if (flags1 & (1 << 3)) == (1 << 3) else None
+        my_boost_slots = IntVector.read(stream) if (flags1 & (1 << 2)) == (1 << 2) else None
+        return cls(my_boost=my_boost, level=level, current_level_boosts=current_level_boosts, boosts=boosts, gift_boosts=gift_boosts, next_level_boosts=next_level_boosts, premium_audience=premium_audience, boost_url=boost_url, prepaid_giveaways=prepaid_giveaways, my_boost_slots=my_boost_slots)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BoostsStatus, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        my_boost = (flags1 & (1 << 2)) == (1 << 2)
+        level, cursor = Int.read_from(view, cursor)
+        current_level_boosts, cursor = Int.read_from(view, cursor)
+        boosts, cursor = Int.read_from(view, cursor)
+        gift_boosts, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 4)) == (1 << 4) else (None, cursor)
+        next_level_boosts, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        premium_audience, cursor = tl.types.StatsPercentValue.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        boost_url, cursor = String.read_from(view, cursor)
+        prepaid_giveaways, cursor = TLObjectVector.read_from(view, cursor) if (flags1 & (1 << 3)) == (1 << 3) else (None, cursor)
+        my_boost_slots, cursor = IntVector.read_from(view, cursor) if (flags1 & (1 << 2)) == (1 << 2) else (None, cursor)
+        return cls(my_boost=my_boost, level=level, current_level_boosts=current_level_boosts, boosts=boosts, gift_boosts=gift_boosts, next_level_boosts=next_level_boosts, premium_audience=premium_audience, boost_url=boost_url, prepaid_giveaways=prepaid_giveaways, my_boost_slots=my_boost_slots), cursor
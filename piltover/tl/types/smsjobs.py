@@ -0,0 +1,101 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class EligibleToJoin(TLObject):
+    __tl_id__ = 0xdc8b44cf
+    __tl_name__ = "types.smsjobs.EligibleToJoin"
+    __tl_layer__ = 176
+
+    __slots__ = ("terms_url", "monthly_sent_sms", )
+
+    def __init__(self, *, terms_url: str, monthly_sent_sms: int):
+        self.terms_url = terms_url
+        self.monthly_sent_sms = monthly_sent_sms
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.terms_url)
+        out += Int.write(self.monthly_sent_sms)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> EligibleToJoin:
+        terms_url = String.read(stream)
+        monthly_sent_sms = Int.read(stream)
+        return cls(terms_url=terms_url, monthly_sent_sms=monthly_sent_sms)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[EligibleToJoin, int]:
+        terms_url, cursor = String.read_from(view, cursor)
+        monthly_sent_sms, cursor = Int.read_from(view, cursor)
+        return cls(terms_url=terms_url, monthly_sent_sms=monthly_sent_sms), cursor
+
+
+class Status(TLObject):
+    __tl_id__ = 0x2aee9191
+    __tl_name__ = "types.smsjobs.Status"
+    __tl_layer__ = 176
+
+    __slots__ = ("allow_international", "recent_sent", "recent_since", "recent_remains", "total_sent", "total_since", "last_gift_slug", "terms_url", )
+
+    def __init__(self, *, recent_sent: int, recent_since: int, recent_remains: int, total_sent: int, total_since: int, terms_url: str, allow_international: bool = False, last_gift_slug: str | None = None):
+        self.allow_international = allow_international
+        self.recent_sent = recent_sent
+        self.recent_since = recent_since
+        self.recent_remains = recent_remains
+        self.total_sent = total_sent
+        self.total_since = total_since
+        self.last_gift_slug = last_gift_slug
+        self.terms_url = terms_url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.allow_international: flags1 |= (1 << 0)
+        if self.last_gift_slug is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Int.write(self.recent_sent)
+        out += Int.write(self.recent_since)
+        out += Int.write(self.recent_remains)
+        out += Int.write(self.total_sent)
+        out += Int.write(self.total_since)
+        if self.last_gift_slug is not None:
+            String.write_to(out, self.last_gift_slug)
+        String.write_to(out, self.terms_url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Status:
+        flags1 = Int.read(stream)
+        allow_international = (flags1 & (1 << 0)) == (1 << 0)
+        recent_sent = Int.read(stream)
+        recent_since = Int.read(stream)
+        recent_remains = Int.read(stream)
+        total_sent = Int.read(stream)
+        total_since = Int.read(stream)
+        last_gift_slug = String.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        terms_url = String.read(stream)
+        return cls(allow_international=allow_international, recent_sent=recent_sent, recent_since=recent_since, recent_remains=recent_remains, total_sent=total_sent, total_since=total_since, last_gift_slug=last_gift_slug, terms_url=terms_url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Status, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        allow_international = (flags1 & (1 << 0)) == (1 << 0)
+        recent_sent, cursor = Int.read_from(view, cursor)
+        recent_since, cursor = Int.read_from(view, cursor)
+        recent_remains, cursor = Int.read_from(view, cursor)
+        total_sent, cursor = Int.read_from(view, cursor)
+        total_since, cursor = Int.read_from(view, cursor)
+        last_gift_slug, cursor = String.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        terms_url, cursor = String.read_from(view, cursor)
+        return cls(allow_international=allow_international, recent_sent=recent_sent, recent_since=recent_since, recent_remains=recent_remains, total_sent=total_sent, total_since=total_since, last_gift_slug=last_gift_slug, terms_url=terms_url), cursor
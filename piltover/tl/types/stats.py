@@ -0,0 +1,688 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class BroadcastStatsBase(TLObject):
+    __tl_id__ = 0x396ca5fc
+    __tl_name__ = "types.stats.BroadcastStats"
+    __tl_layer__ = 167
+
+    __slots__ = ("period", "followers", "views_per_post", "shares_per_post", "reactions_per_post", "views_per_story", "shares_per_story", "reactions_per_story", "enabled_notifications", "growth_graph", "followers_graph", "mute_graph", "top_hours_graph", "interactions_graph", "iv_interactions_graph", "views_by_source_graph", "new_followers_by_source_graph", "languages_graph", "reactions_by_emotion_graph", "story_interactions_graph", "story_reactions_by_emotion_graph", "recent_posts_interactions", )
+
+    def __init__(self, *, period: tl.types.StatsDateRangeDays, followers: tl.types.StatsAbsValueAndPrev, views_per_post: tl.types.StatsAbsValueAndPrev, shares_per_post: tl.types.StatsAbsValueAndPrev, reactions_per_post: tl.types.StatsAbsValueAndPrev, views_per_story: tl.types.StatsAbsValueAndPrev, shares_per_story: tl.types.StatsAbsValueAndPrev, reactions_per_story: tl.types.StatsAbsValueAndPrev, enabled_notifications: tl.types.StatsPercentValue, growth_graph: tl.base.StatsGraph, followers_graph: tl.base.StatsGraph, mute_graph: tl.base.StatsGraph, top_hours_graph: tl.base.StatsGraph, interactions_graph: tl.base.StatsGraph, iv_interactions_graph: tl.base.StatsGraph, views_by_source_graph: tl.base.StatsGraph, new_followers_by_source_graph: tl.base.StatsGraph, languages_graph: tl.base.StatsGraph, reactions_by_emotion_graph: tl.base.StatsGraph, story_interactions_graph: tl.base.StatsGraph, story_reactions_by_emotion_graph: tl.base.StatsGraph, recent_posts_interactions: list[tl.base.PostInteractionCounters]):
+        self.period = period
+        self.followers = followers
+        self.views_per_post = views_per_post
+        self.shares_per_post = shares_per_post
+        self.reactions_per_post = reactions_per_post
+        self.views_per_story = views_per_story
+        self.shares_per_story = shares_per_story
+        self.reactions_per_story = reactions_per_story
+        self.enabled_notifications = enabled_notifications
+        self.growth_graph = growth_graph
+        self.followers_graph = followers_graph
+        self.mute_graph = mute_graph
+        self.top_hours_graph = top_hours_graph
+        self.interactions_graph = interactions_graph
+        self.iv_interactions_graph = iv_interactions_graph
+        self.views_by_source_graph = views_by_source_graph
+        self.new_followers_by_source_graph = new_followers_by_source_graph
+        self.languages_graph = languages_graph
+        self.reactions_by_emotion_graph = reactions_by_emotion_graph
+        self.story_interactions_graph = story_interactions_graph
+        self.story_reactions_by_emotion_graph = story_reactions_by_emotion_graph
+        self.recent_posts_interactions = recent_posts_interactions
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.period.write_to(out, ctx)
+        self.followers.write_to(out, ctx)
+        self.views_per_post.write_to(out, ctx)
+        self.shares_per_post.write_to(out, ctx)
+        self.reactions_per_post.write_to(out, ctx)
+        self.views_per_story.write_to(out, ctx)
+        self.shares_per_story.write_to(out, ctx)
+        self.reactions_per_story.write_to(out, ctx)
+        self.enabled_notifications.write_to(out, ctx)
+        self.growth_graph.write_to(out, ctx)
+        self.followers_graph.write_to(out, ctx)
+        self.mute_graph.write_to(out, ctx)
+        self.top_hours_graph.write_to(out, ctx)
+        self.interactions_graph.write_to(out, ctx)
+        self.iv_interactions_graph.write_to(out, ctx)
+        self.views_by_source_graph.write_to(out, ctx)
+        self.new_followers_by_source_graph.write_to(out, ctx)
+        self.languages_graph.write_to(out, ctx)
+        self.reactions_by_emotion_graph.write_to(out, ctx)
+        self.story_interactions_graph.write_to(out, ctx)
+        self.story_reactions_by_emotion_graph.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.recent_posts_interactions, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BroadcastStats:
+        period = tl.types.StatsDateRangeDays.read(stream)
+        followers = tl.types.StatsAbsValueAndPrev.read(stream)
+        views_per_post = tl.types.StatsAbsValueAndPrev.read(stream)
+        shares_per_post = tl.types.StatsAbsValueAndPrev.read(stream)
+        reactions_per_post = tl.types.StatsAbsValueAndPrev.read(stream)
+        views_per_story = tl.types.StatsAbsValueAndPrev.read(stream)
+        shares_per_story = tl.types.StatsAbsValueAndPrev.read(stream)
+        reactions_per_story = tl.types.StatsAbsValueAndPrev.read(stream)
+        enabled_notifications = tl.types.StatsPercentValue.read(stream)
+        growth_graph = TLObject.read(stream)
+        followers_graph = TLObject.read(stream)
+        mute_graph = TLObject.read(stream)
+        top_hours_graph = TLObject.read(stream)
+        interactions_graph = TLObject.read(stream)
+        iv_interactions_graph = TLObject.read(stream)
+        views_by_source_graph = TLObject.read(stream)
+        new_followers_by_source_graph = TLObject.read(stream)
+        languages_graph = TLObject.read(stream)
+        reactions_by_emotion_graph = TLObject.read(stream)
+        story_interactions_graph = TLObject.read(stream)
+        story_reactions_by_emotion_graph = TLObject.read(stream)
+        recent_posts_interactions = TLObjectVector.read(stream)
+        return cls(period=period, followers=followers, views_per_post=views_per_post, shares_per_post=shares_per_post, reactions_per_post=reactions_per_post, views_per_story=views_per_story, shares_per_story=shares_per_story, reactions_per_story=reactions_per_story, enabled_notifications=enabled_notifications, growth_graph=growth_graph, followers_graph=followers_graph, mute_graph=mute_graph, top_hours_graph=top_hours_graph, interactions_graph=interactions_graph, iv_interactions_graph=iv_interactions_graph, views_by_source_graph=views_by_source_graph, new_followers_by_source_graph=new_followers_by_source_graph, languages_graph=languages_graph, reactions_by_emotion_graph=reactions_by_emotion_graph, story_interactions_graph=story_interactions_graph, story_reactions_by_emotion_graph=story_reactions_by_emotion_graph, recent_posts_interactions=recent_posts_interactions)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BroadcastStats, int]:
+        period, cursor = tl.types.StatsDateRangeDays.read_from(view, cursor)
+        followers, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        views_per_post, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        shares_per_post, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        reactions_per_post, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        views_per_story, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        shares_per_story, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        reactions_per_story, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        enabled_notifications, cursor = tl.types.StatsPercentValue.read_from(view, cursor)
+        growth_graph, cursor = TLObject.read_from(view, cursor)
+        followers_graph, cursor = TLObject.read_from(view, cursor)
+        mute_graph, cursor = TLObject.read_from(view, cursor)
+        top_hours_graph, cursor = TLObject.read_from(view, cursor)
+        interactions_graph, cursor = TLObject.read_from(view, cursor)
+        iv_interactions_graph, cursor = TLObject.read_from(view, cursor)
+        views_by_source_graph, cursor = TLObject.read_from(view, cursor)
+        new_followers_by_source_graph, cursor = TLObject.read_from(view, cursor)
+        languages_graph, cursor = TLObject.read_from(view, cursor)
+        reactions_by_emotion_graph, cursor = TLObject.read_from(view, cursor)
+        story_interactions_graph, cursor = TLObject.read_from(view, cursor)
+        story_reactions_by_emotion_graph, cursor = TLObject.read_from(view, cursor)
+        recent_posts_interactions, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(period=period, followers=followers, views_per_post=views_per_post, shares_per_post=shares_per_post, reactions_per_post=reactions_per_post, views_per_story=views_per_story, shares_per_story=shares_per_story, reactions_per_story=reactions_per_story, enabled_notifications=enabled_notifications, growth_graph=growth_graph, followers_graph=followers_graph, mute_graph=mute_graph, top_hours_graph=top_hours_graph, interactions_graph=interactions_graph, iv_interactions_graph=iv_interactions_graph, views_by_source_graph=views_by_source_graph, new_followers_by_source_graph=new_followers_by_source_graph, languages_graph=languages_graph, reactions_by_emotion_graph=reactions_by_emotion_graph, story_interactions_graph=story_interactions_graph, story_reactions_by_emotion_graph=story_reactions_by_emotion_graph, recent_posts_interactions=recent_posts_interactions), cursor
+
+
+class MegagroupStats(TLObject):
+    __tl_id__ = 0xef7ff916
+    __tl_name__ = "types.stats.MegagroupStats"
+    __tl_layer__ = 133
+
+    __slots__ = ("period", "members", "messages", "viewers", "posters", "growth_graph", "members_graph", "new_members_by_source_graph", "languages_graph", "messages_graph", "actions_graph", "top_hours_graph", "weekdays_graph", "top_posters", "top_admins", "top_inviters", "users", )
+
+    def __init__(self, *, period: tl.types.StatsDateRangeDays, members: tl.types.StatsAbsValueAndPrev, messages: tl.types.StatsAbsValueAndPrev, viewers: tl.types.StatsAbsValueAndPrev, posters: tl.types.StatsAbsValueAndPrev, growth_graph: tl.base.StatsGraph, members_graph: tl.base.StatsGraph, new_members_by_source_graph: tl.base.StatsGraph, languages_graph: tl.base.StatsGraph, messages_graph: tl.base.StatsGraph, actions_graph: tl.base.StatsGraph, top_hours_graph: tl.base.StatsGraph, weekdays_graph: tl.base.StatsGraph, top_posters: list[tl.base.StatsGroupTopPoster], top_admins: list[tl.base.StatsGroupTopAdmin], top_inviters: list[tl.base.StatsGroupTopInviter], users: list[tl.base.User]):
+        self.period = period
+        self.members = members
+        self.messages = messages
+        self.viewers = viewers
+        self.posters = posters
+        self.growth_graph = growth_graph
+        self.members_graph = members_graph
+        self.new_members_by_source_graph = new_members_by_source_graph
+        self.languages_graph = languages_graph
+        self.messages_graph = messages_graph
+        self.actions_graph = actions_graph
+        self.top_hours_graph = top_hours_graph
+        self.weekdays_graph = weekdays_graph
+        self.top_posters = top_posters
+        self.top_admins = top_admins
+        self.top_inviters = top_inviters
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.period.write_to(out, ctx)
+        self.members.write_to(out, ctx)
+        self.messages.write_to(out, ctx)
+        self.viewers.write_to(out, ctx)
+        self.posters.write_to(out, ctx)
+        self.growth_graph.write_to(out, ctx)
+        self.members_graph.write_to(out, ctx)
+        self.new_members_by_source_graph.write_to(out, ctx)
+        self.languages_graph.write_to(out, ctx)
+        self.messages_graph.write_to(out, ctx)
+        self.actions_graph.write_to(out, ctx)
+        self.top_hours_graph.write_to(out, ctx)
+        self.weekdays_graph.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.top_posters, ctx)
+        TLObjectVector.write_to(out, self.top_admins, ctx)
+        TLObjectVector.write_to(out, self.top_inviters, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MegagroupStats:
+        period = tl.types.StatsDateRangeDays.read(stream)
+        members = tl.types.StatsAbsValueAndPrev.read(stream)
+        messages = tl.types.StatsAbsValueAndPrev.read(stream)
+        viewers = tl.types.StatsAbsValueAndPrev.read(stream)
+        posters = tl.types.StatsAbsValueAndPrev.read(stream)
+        growth_graph = TLObject.read(stream)
+        members_graph = TLObject.read(stream)
+        new_members_by_source_graph = TLObject.read(stream)
+        languages_graph = TLObject.read(stream)
+        messages_graph = TLObject.read(stream)
+        actions_graph = TLObject.read(stream)
+        top_hours_graph = TLObject.read(stream)
+        weekdays_graph = TLObject.read(stream)
+        top_posters = TLObjectVector.read(stream)
+        top_admins = TLObjectVector.read(stream)
+        top_inviters = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(period=period, members=members, messages=messages, viewers=viewers, posters=posters, growth_graph=growth_graph, members_graph=members_graph, new_members_by_source_graph=new_members_by_source_graph, languages_graph=languages_graph, messages_graph=messages_graph, actions_graph=actions_graph, top_hours_graph=top_hours_graph, weekdays_graph=weekdays_graph, top_posters=top_posters, top_admins=top_admins, top_inviters=top_inviters, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MegagroupStats, int]:
+        period, cursor = tl.types.StatsDateRangeDays.read_from(view, cursor)
+        members, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        messages, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        viewers, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        posters, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        growth_graph, cursor = TLObject.read_from(view, cursor)
+        members_graph, cursor = TLObject.read_from(view, cursor)
+        new_members_by_source_graph, cursor = TLObject.read_from(view, cursor)
+        languages_graph, cursor = TLObject.read_from(view, cursor)
+        messages_graph, cursor = TLObject.read_from(view, cursor)
+        actions_graph, cursor = TLObject.read_from(view, cursor)
+        top_hours_graph, cursor = TLObject.read_from(view, cursor)
+        weekdays_graph, cursor = TLObject.read_from(view, cursor)
+        top_posters, cursor = TLObjectVector.read_from(view, cursor)
+        top_admins, cursor = TLObjectVector.read_from(view, cursor)
+        top_inviters, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(period=period, members=members, messages=messages, viewers=viewers, posters=posters, growth_graph=growth_graph, members_graph=members_graph, new_members_by_source_graph=new_members_by_source_graph, languages_graph=languages_graph, messages_graph=messages_graph, actions_graph=actions_graph, top_hours_graph=top_hours_graph, weekdays_graph=weekdays_graph, top_posters=top_posters, top_admins=top_admins, top_inviters=top_inviters, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class MessageStatsBase(TLObject):
+    __tl_id__ = 0x7fe91c14
+    __tl_name__ = "types.stats.MessageStats"
+    __tl_layer__ = 167
+
+    __slots__ = ("views_graph", "reactions_by_emotion_graph", )
+
+    def __init__(self, *, views_graph: tl.base.StatsGraph, reactions_by_emotion_graph: tl.base.StatsGraph):
+        self.views_graph = views_graph
+        self.reactions_by_emotion_graph = reactions_by_emotion_graph
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.views_graph.write_to(out, ctx)
+        self.reactions_by_emotion_graph.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageStats:
+        views_graph = TLObject.read(stream)
+        reactions_by_emotion_graph = TLObject.read(stream)
+        return cls(views_graph=views_graph, reactions_by_emotion_graph=reactions_by_emotion_graph)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageStats, int]:
+        views_graph, cursor = TLObject.read_from(view, cursor)
+        reactions_by_emotion_graph, cursor = TLObject.read_from(view, cursor)
+        return cls(views_graph=views_graph, reactions_by_emotion_graph=reactions_by_emotion_graph), cursor
+
+
+class StoryStats(TLObject):
+    __tl_id__ = 0x50cd067c
+    __tl_name__ = "types.stats.StoryStats"
+    __tl_layer__ = 167
+
+    __slots__ = ("views_graph", "reactions_by_emotion_graph", )
+
+    def __init__(self, *, views_graph: tl.base.StatsGraph, reactions_by_emotion_graph: tl.base.StatsGraph):
+        self.views_graph = views_graph
+        self.reactions_by_emotion_graph = reactions_by_emotion_graph
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.views_graph.write_to(out, ctx)
+        self.reactions_by_emotion_graph.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StoryStats:
+        views_graph = TLObject.read(stream)
+        reactions_by_emotion_graph = TLObject.read(stream)
+        return cls(views_graph=views_graph, reactions_by_emotion_graph=reactions_by_emotion_graph)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StoryStats, int]:
+        views_graph, cursor = TLObject.read_from(view, cursor)
+        reactions_by_emotion_graph, cursor = TLObject.read_from(view, cursor)
+        return cls(views_graph=views_graph, reactions_by_emotion_graph=reactions_by_emotion_graph), cursor
+
+
+class PublicForwards(TLObject):
+    __tl_id__ = 0x93037e20
+    __tl_name__ = "types.stats.PublicForwards"
+    __tl_layer__ = 167
+
+    __slots__ = ("count", "forwards", "next_offset", "chats", "users", )
+
+    def __init__(self, *, count: int, forwards: list[tl.base.PublicForward], chats: list[tl.base.Chat], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.forwards = forwards
+        self.next_offset = next_offset
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.forwards, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PublicForwards:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        forwards = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, forwards=forwards, next_offset=next_offset, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PublicForwards, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        forwards, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, forwards=forwards, next_offset=next_offset, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for forwards_item in self.forwards:
+            forwards_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class BroadcastRevenueStatsBase(TLObject):
+    __tl_id__ = 0x5407e297
+    __tl_name__ = "types.stats.BroadcastRevenueStats"
+    __tl_layer__ = 179
+
+    __slots__ = ("top_hours_graph", "revenue_graph", "balances", "usd_rate", )
+
+    def __init__(self, *, top_hours_graph: tl.base.StatsGraph, revenue_graph: tl.base.StatsGraph, balances: tl.base.BroadcastRevenueBalances, usd_rate: float):
+        self.top_hours_graph = top_hours_graph
+        self.revenue_graph = revenue_graph
+        self.balances = balances
+        self.usd_rate = usd_rate
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.top_hours_graph.write_to(out, ctx)
+        self.revenue_graph.write_to(out, ctx)
+        self.balances.write_to(out, ctx)
+        out += Float.write(self.usd_rate)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BroadcastRevenueStats:
+        top_hours_graph = TLObject.read(stream)
+        revenue_graph = TLObject.read(stream)
+        balances = TLObject.read(stream)
+        usd_rate = Float.read(stream)
+        return cls(top_hours_graph=top_hours_graph, revenue_graph=revenue_graph, balances=balances, usd_rate=usd_rate)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BroadcastRevenueStats, int]:
+        top_hours_graph, cursor = TLObject.read_from(view, cursor)
+        revenue_graph, cursor = TLObject.read_from(view, cursor)
+        balances, cursor = TLObject.read_from(view, cursor)
+        usd_rate, cursor = Float.read_from(view, cursor)
+        return cls(top_hours_graph=top_hours_graph, revenue_graph=revenue_graph, balances=balances, usd_rate=usd_rate), cursor
+
+
+class BroadcastRevenueWithdrawalUrl(TLObject):
+    __tl_id__ = 0xec659737
+    __tl_name__ = "types.stats.BroadcastRevenueWithdrawalUrl"
+    __tl_layer__ = 177
+
+    __slots__ = ("url", )
+
+    def __init__(self, *, url: str):
+        self.url = url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BroadcastRevenueWithdrawalUrl:
+        url = String.read(stream)
+        return cls(url=url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BroadcastRevenueWithdrawalUrl, int]:
+        url, cursor = String.read_from(view, cursor)
+        return cls(url=url), cursor
+
+
+class BroadcastRevenueTransactions(TLObject):
+    __tl_id__ = 0x87158466
+    __tl_name__ = "types.stats.BroadcastRevenueTransactions"
+    __tl_layer__ = 177
+
+    __slots__ = ("count", "transactions", )
+
+    def __init__(self, *, count: int, transactions: list[tl.base.BroadcastRevenueTransaction]):
+        self.count = count
+        self.transactions = transactions
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.transactions, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BroadcastRevenueTransactions:
+        count = Int.read(stream)
+        transactions = TLObjectVector.read(stream)
+        return cls(count=count, transactions=transactions)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BroadcastRevenueTransactions, int]:
+        count, cursor = Int.read_from(view, cursor)
+        transactions, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, transactions=transactions), cursor
+
+
+class BroadcastStats_133(TLObject):
+    __tl_id__ = 0xbdf78394
+    __tl_name__ = "types.stats.BroadcastStats_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("period", "followers", "views_per_post", "shares_per_post", "enabled_notifications", "growth_graph", "followers_graph", "mute_graph", "top_hours_graph", "interactions_graph", "iv_interactions_graph", "views_by_source_graph", "new_followers_by_source_graph", "languages_graph", "recent_message_interactions", )
+
+    def __init__(self, *, period: tl.types.StatsDateRangeDays, followers: tl.types.StatsAbsValueAndPrev, views_per_post: tl.types.StatsAbsValueAndPrev, shares_per_post: tl.types.StatsAbsValueAndPrev, enabled_notifications: tl.types.StatsPercentValue, growth_graph: tl.base.StatsGraph, followers_graph: tl.base.StatsGraph, mute_graph: tl.base.StatsGraph, top_hours_graph: tl.base.StatsGraph, interactions_graph: tl.base.StatsGraph, iv_interactions_graph: tl.base.StatsGraph, views_by_source_graph: tl.base.StatsGraph, new_followers_by_source_graph: tl.base.StatsGraph, languages_graph: tl.base.StatsGraph, recent_message_interactions: list[tl.base.MessageInteractionCounters]):
+        self.period = period
+        self.followers = followers
+        self.views_per_post = views_per_post
+        self.shares_per_post = shares_per_post
+        self.enabled_notifications = enabled_notifications
+        self.growth_graph = growth_graph
+        self.followers_graph = followers_graph
+        self.mute_graph = mute_graph
+        self.top_hours_graph = top_hours_graph
+        self.interactions_graph = interactions_graph
+        self.iv_interactions_graph = iv_interactions_graph
+        self.views_by_source_graph = views_by_source_graph
+        self.new_followers_by_source_graph = new_followers_by_source_graph
+        self.languages_graph = languages_graph
+        self.recent_message_interactions = recent_message_interactions
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.period.write_to(out, ctx)
+        self.followers.write_to(out, ctx)
+        self.views_per_post.write_to(out, ctx)
+        self.shares_per_post.write_to(out, ctx)
+        self.enabled_notifications.write_to(out, ctx)
+        self.growth_graph.write_to(out, ctx)
+        self.followers_graph.write_to(out, ctx)
+        self.mute_graph.write_to(out, ctx)
+        self.top_hours_graph.write_to(out, ctx)
+        self.interactions_graph.write_to(out, ctx)
+        self.iv_interactions_graph.write_to(out, ctx)
+        self.views_by_source_graph.write_to(out, ctx)
+        self.new_followers_by_source_graph.write_to(out, ctx)
+        self.languages_graph.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.recent_message_interactions, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BroadcastStats_133:
+        period = tl.types.StatsDateRangeDays.read(stream)
+        followers = tl.types.StatsAbsValueAndPrev.read(stream)
+        views_per_post = tl.types.StatsAbsValueAndPrev.read(stream)
+        shares_per_post = tl.types.StatsAbsValueAndPrev.read(stream)
+        enabled_notifications = tl.types.StatsPercentValue.read(stream)
+        growth_graph = TLObject.read(stream)
+        followers_graph = TLObject.read(stream)
+        mute_graph = TLObject.read(stream)
+        top_hours_graph = TLObject.read(stream)
+        interactions_graph = TLObject.read(stream)
+        iv_interactions_graph = TLObject.read(stream)
+        views_by_source_graph = TLObject.read(stream)
+        new_followers_by_source_graph = TLObject.read(stream)
+        languages_graph = TLObject.read(stream)
+        recent_message_interactions = TLObjectVector.read(stream)
+        return cls(period=period, followers=followers, views_per_post=views_per_post, shares_per_post=shares_per_post, enabled_notifications=enabled_notifications, growth_graph=growth_graph, followers_graph=followers_graph, mute_graph=mute_graph, top_hours_graph=top_hours_graph, interactions_graph=interactions_graph, iv_interactions_graph=iv_interactions_graph, views_by_source_graph=views_by_source_graph, new_followers_by_source_graph=new_followers_by_source_graph, languages_graph=languages_graph, recent_message_interactions=recent_message_interactions)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BroadcastStats_133, int]:
+        period, cursor = tl.types.StatsDateRangeDays.read_from(view, cursor)
+        followers, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        views_per_post, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        shares_per_post, cursor = tl.types.StatsAbsValueAndPrev.read_from(view, cursor)
+        enabled_notifications, cursor = tl.types.StatsPercentValue.read_from(view, cursor)
+        growth_graph, cursor = TLObject.read_from(view, cursor)
+        followers_graph, cursor = TLObject.read_from(view, cursor)
+        mute_graph, cursor = TLObject.read_from(view, cursor)
+        top_hours_graph, cursor = TLObject.read_from(view, cursor)
+        interactions_graph, cursor = TLObject.read_from(view, cursor)
+        iv_interactions_graph, cursor = TLObject.read_from(view, cursor)
+        views_by_source_graph, cursor = TLObject.read_from(view, cursor)
+        new_followers_by_source_graph, cursor = TLObject.read_from(view, cursor)
+        languages_graph, cursor = TLObject.read_from(view, cursor)
+        recent_message_interactions, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(period=period, followers=followers, views_per_post=views_per_post, shares_per_post=shares_per_post, enabled_notifications=enabled_notifications, growth_graph=growth_graph, followers_graph=followers_graph, mute_graph=mute_graph, top_hours_graph=top_hours_graph, interactions_graph=interactions_graph, iv_interactions_graph=iv_interactions_graph, views_by_source_graph=views_by_source_graph, new_followers_by_source_graph=new_followers_by_source_graph, languages_graph=languages_graph, recent_message_interactions=recent_message_interactions), cursor
+
+
+class MessageStats_133(TLObject):
+    __tl_id__ = 0x8999f295
+    __tl_name__ = "types.stats.MessageStats_133"
+    __tl_layer__ = 133
+
+    __slots__ = ("views_graph", )
+
+    def __init__(self, *, views_graph: tl.base.StatsGraph):
+        self.views_graph = views_graph
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.views_graph.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> MessageStats_133:
+        views_graph = TLObject.read(stream)
+        return cls(views_graph=views_graph)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[MessageStats_133, int]:
+        views_graph, cursor = TLObject.read_from(view, cursor)
+        return cls(views_graph=views_graph), cursor
+
+
+class BroadcastRevenueStats_177(TLObject):
+    __tl_id__ = 0xd07b4bad
+    __tl_name__ = "types.stats.BroadcastRevenueStats_177"
+    __tl_layer__ = 177
+
+    __slots__ = ("top_hours_graph", "revenue_graph", "current_balance", "available_balance", "overall_revenue", "usd_rate", )
+
+    def __init__(self, *, top_hours_graph: tl.base.StatsGraph, revenue_graph: tl.base.StatsGraph, current_balance: int, available_balance: int, overall_revenue: int, usd_rate: float):
+        self.top_hours_graph = top_hours_graph
+        self.revenue_graph = revenue_graph
+        self.current_balance = current_balance
+        self.available_balance = available_balance
+        self.overall_revenue = overall_revenue
+        self.usd_rate = usd_rate
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.top_hours_graph.write_to(out, ctx)
+        self.revenue_graph.write_to(out, ctx)
+        out += Long.write(self.current_balance)
+        out += Long.write(self.available_balance)
+        out += Long.write(self.overall_revenue)
+        out += Float.write(self.usd_rate)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BroadcastRevenueStats_177:
+        top_hours_graph = TLObject.read(stream)
+        revenue_graph = TLObject.read(stream)
+        current_balance = Long.read(stream)
+        available_balance = Long.read(stream)
+        overall_revenue = Long.read(stream)
+        usd_rate = Float.read(stream)
+        return cls(top_hours_graph=top_hours_graph, revenue_graph=revenue_graph, current_balance=current_balance, available_balance=available_balance, overall_revenue=overall_revenue, usd_rate=usd_rate)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BroadcastRevenueStats_177, int]:
+        top_hours_graph, cursor = TLObject.read_from(view, cursor)
+        revenue_graph, cursor = TLObject.read_from(view, cursor)
+        current_balance, cursor = Long.read_from(view, cursor)
+        available_balance, cursor = Long.read_from(view, cursor)
+        overall_revenue, cursor = Long.read_from(view, cursor)
+        usd_rate, cursor = Float.read_from(view, cursor)
+        return cls(top_hours_graph=top_hours_graph, revenue_graph=revenue_graph, current_balance=current_balance, available_balance=available_balance, overall_revenue=overall_revenue, usd_rate=usd_rate), cursor
+
+
+class BroadcastStats(BroadcastStatsBase):
+    __tl_ids__ = (
+        (BroadcastStats_133.__tl_layer__, BroadcastStats_133.__tl_id__),
+        (BroadcastStatsBase.__tl_layer__, BroadcastStatsBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _recent_message_interactions_fallback_133 = tl.layer_converters.stats__broadcast_stats.get_recent_message_interactions_fallback_for_133(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        self.period.write_to(out, ctx)
+        self.followers.write_to(out, ctx)
+        self.views_per_post.write_to(out, ctx)
+        self.shares_per_post.write_to(out, ctx)
+        if ctx.layer >= 167:
+            self.reactions_per_post.write_to(out, ctx)
+        if ctx.layer >= 167:
+            self.views_per_story.write_to(out, ctx)
+        if ctx.layer >= 167:
+            self.shares_per_story.write_to(out, ctx)
+        if ctx.layer >= 167:
+            self.reactions_per_story.write_to(out, ctx)
+        self.enabled_notifications.write_to(out, ctx)
+        self.growth_graph.write_to(out, ctx)
+        self.followers_graph.write_to(out, ctx)
+        self.mute_graph.write_to(out, ctx)
+        self.top_hours_graph.write_to(out, ctx)
+        self.interactions_graph.write_to(out, ctx)
+        self.iv_interactions_graph.write_to(out, ctx)
+        self.views_by_source_graph.write_to(out, ctx)
+        self.new_followers_by_source_graph.write_to(out, ctx)
+        self.languages_graph.write_to(out, ctx)
+        if ctx.layer >= 167:
+            self.reactions_by_emotion_graph.write_to(out, ctx)
+        if ctx.layer >= 167:
+            self.story_interactions_graph.write_to(out, ctx)
+        if ctx.layer >= 167:
+            self.story_reactions_by_emotion_graph.write_to(out, ctx)
+        if ctx.layer >= 167:
+            TLObjectVector.write_to(out, self.recent_posts_interactions, ctx)
+        if ctx.layer <= 166:
+            TLObjectVector.write_to(out, _recent_message_interactions_fallback_133, ctx)
+
+
+class MessageStats(MessageStatsBase):
+    __tl_ids__ = (
+        (MessageStats_133.__tl_layer__, MessageStats_133.__tl_id__),
+        (MessageStatsBase.__tl_layer__, MessageStatsBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        self.views_graph.write_to(out, ctx)
+        if ctx.layer >= 167:
+            self.reactions_by_emotion_graph.write_to(out, ctx)
+
+
+class BroadcastRevenueStats(BroadcastRevenueStatsBase):
+    __tl_ids__ = (
+        (BroadcastRevenueStats_177.__tl_layer__, BroadcastRevenueStats_177.__tl_id__),
+        (BroadcastRevenueStatsBase.__tl_layer__, BroadcastRevenueStatsBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _current_balance_fallback_177 = tl.layer_converters.stats__broadcast_revenue_stats.get_current_balance_fallback_for_177(self, ctx)
+        _available_balance_fallback_177 = tl.layer_converters.stats__broadcast_revenue_stats.get_available_balance_fallback_for_177(self, ctx)
+        _overall_revenue_fallback_177 = tl.layer_converters.stats__broadcast_revenue_stats.get_overall_revenue_fallback_for_177(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        self.top_hours_graph.write_to(out, ctx)
+        self.revenue_graph.write_to(out, ctx)
+        if ctx.layer >= 179:
+            self.balances.write_to(out, ctx)
+        if ctx.layer <= 178:
+            out += Long.write(_current_balance_fallback_177)
+        if ctx.layer <= 178:
+            out += Long.write(_available_balance_fallback_177)
+        if ctx.layer <= 178:
+            out += Long.write(_overall_revenue_fallback_177)
+        out += Float.write(self.usd_rate)
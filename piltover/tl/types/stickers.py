@@ -0,0 +1,39 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class SuggestedShortName(TLObject):
+    __tl_id__ = 0x85fea03f
+    __tl_name__ = "types.stickers.SuggestedShortName"
+    __tl_layer__ = 133
+
+    __slots__ = ("short_name", )
+
+    def __init__(self, *, short_name: str):
+        self.short_name = short_name
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.short_name)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> SuggestedShortName:
+        short_name = String.read(stream)
+        return cls(short_name=short_name)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[SuggestedShortName, int]:
+        short_name, cursor = String.read_from(view, cursor)
+        return cls(short_name=short_name), cursor
@@ -0,0 +1,205 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class FileUnknown(TLObject):
+    __tl_id__ = 0xaa963b05
+    __tl_name__ = "types.storage.FileUnknown"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FileUnknown:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FileUnknown, int]:
+        return cls(), cursor
+
+
+class FilePartial(TLObject):
+    __tl_id__ = 0x40bc6f52
+    __tl_name__ = "types.storage.FilePartial"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FilePartial:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FilePartial, int]:
+        return cls(), cursor
+
+
+class FileJpeg(TLObject):
+    __tl_id__ = 0x7efe0e
+    __tl_name__ = "types.storage.FileJpeg"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FileJpeg:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FileJpeg, int]:
+        return cls(), cursor
+
+
+class FileGif(TLObject):
+    __tl_id__ = 0xcae1aadf
+    __tl_name__ = "types.storage.FileGif"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FileGif:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FileGif, int]:
+        return cls(), cursor
+
+
+class FilePng(TLObject):
+    __tl_id__ = 0xa4f63c0
+    __tl_name__ = "types.storage.FilePng"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FilePng:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FilePng, int]:
+        return cls(), cursor
+
+
+class FilePdf(TLObject):
+    __tl_id__ = 0xae1e508d
+    __tl_name__ = "types.storage.FilePdf"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FilePdf:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FilePdf, int]:
+        return cls(), cursor
+
+
+class FileMp3(TLObject):
+    __tl_id__ = 0x528a0677
+    __tl_name__ = "types.storage.FileMp3"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FileMp3:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FileMp3, int]:
+        return cls(), cursor
+
+
+class FileMov(TLObject):
+    __tl_id__ = 0x4b09ebbc
+    __tl_name__ = "types.storage.FileMov"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FileMov:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FileMov, int]:
+        return cls(), cursor
+
+
+class FileMp4(TLObject):
+    __tl_id__ = 0xb3cea0e4
+    __tl_name__ = "types.storage.FileMp4"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FileMp4:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FileMp4, int]:
+        return cls(), cursor
+
+
+class FileWebp(TLObject):
+    __tl_id__ = 0x1081464c
+    __tl_name__ = "types.storage.FileWebp"
+    __tl_layer__ = 133
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FileWebp:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FileWebp, int]:
+        return cls(), cursor
@@ -0,0 +1,1140 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class AllStoriesNotModifiedBase(TLObject):
+    __tl_id__ = 0x1158fe3e
+    __tl_name__ = "types.stories.AllStoriesNotModified"
+    __tl_layer__ = 161
+
+    __slots__ = ("state", "stealth_mode", )
+
+    def __init__(self, *, state: str, stealth_mode: tl.types.StoriesStealthMode):
+        self.state = state
+        self.stealth_mode = stealth_mode
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        out += Int.write(flags1)
+        String.write_to(out, self.state)
+        self.stealth_mode.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AllStoriesNotModified:
+        flags1 = Int.read(stream)
+        state = String.read(stream)
+        stealth_mode = tl.types.StoriesStealthMode.read(stream)
+        return cls(state=state, stealth_mode=stealth_mode)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AllStoriesNotModified, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        state, cursor = String.read_from(view, cursor)
+        stealth_mode, cursor = tl.types.StoriesStealthMode.read_from(view, cursor)
+        return cls(state=state, stealth_mode=stealth_mode), cursor
+
+
+class AllStoriesBase(TLObject):
+    __tl_id__ = 0x6efc5e81
+    __tl_name__ = "types.stories.AllStories"
+    __tl_layer__ = 164
+
+    __slots__ = ("has_more", "count", "state", "peer_stories", "chats", "users", "stealth_mode", )
+
+    def __init__(self, *, count: int, state: str, peer_stories: list[tl.base.PeerStories], chats: list[tl.base.Chat], users: list[tl.base.User], stealth_mode: tl.types.StoriesStealthMode, has_more: bool = False):
+        self.has_more = has_more
+        self.count = count
+        self.state = state
+        self.peer_stories = peer_stories
+        self.chats = chats
+        self.users = users
+        self.stealth_mode = stealth_mode
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.has_more: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        String.write_to(out, self.state)
+        TLObjectVector.write_to(out, self.peer_stories, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        self.stealth_mode.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AllStories:
+        flags1 = Int.read(stream)
+        has_more = (flags1 & (1 << 0)) == (1 << 0)
+        count = Int.read(stream)
+        state = String.read(stream)
+        peer_stories = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        stealth_mode = tl.types.StoriesStealthMode.read(stream)
+        return cls(has_more=has_more, count=count, state=state, peer_stories=peer_stories, chats=chats, users=users, stealth_mode=stealth_mode)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AllStories, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        has_more = (flags1 & (1 << 0)) == (1 << 0)
+        count, cursor = Int.read_from(view, cursor)
+        state, cursor = String.read_from(view, cursor)
+        peer_stories, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        stealth_mode, cursor = tl.types.StoriesStealthMode.read_from(view, cursor)
+        return cls(has_more=has_more, count=count, state=state, peer_stories=peer_stories, chats=chats, users=users, stealth_mode=stealth_mode), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for peer_stories_item in self.peer_stories:
+            peer_stories_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StoriesBase(TLObject):
+    __tl_id__ = 0x63c3dd0a
+    __tl_name__ = "types.stories.Stories"
+    __tl_layer__ = 179
+
+    __slots__ = ("count", "stories", "pinned_to_top", "chats", "users", )
+
+    def __init__(self, *, count: int, stories: list[tl.base.StoryItem], chats: list[tl.base.Chat], users: list[tl.base.User], pinned_to_top: list[int] | None = None):
+        self.count = count
+        self.stories = stories
+        self.pinned_to_top = pinned_to_top
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.pinned_to_top: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.stories, ctx)
+        if self.pinned_to_top:
+            out += IntVector.write(self.pinned_to_top)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Stories:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        stories = TLObjectVector.read(stream)
+        pinned_to_top = IntVector.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, stories=stories, pinned_to_top=pinned_to_top, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Stories, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        stories, cursor = TLObjectVector.read_from(view, cursor)
+        pinned_to_top, cursor = IntVector.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, stories=stories, pinned_to_top=pinned_to_top, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for stories_item in self.stories:
+            stories_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StoryViewsListBase(TLObject):
+    __tl_id__ = 0x59d78fc5
+    __tl_name__ = "types.stories.StoryViewsList"
+    __tl_layer__ = 168
+
+    __slots__ = ("count", "views_count", "forwards_count", "reactions_count", "views", "chats", "users", "next_offset", )
+
+    def __init__(self, *, count: int, views_count: int, forwards_count: int, reactions_count: int, views: list[tl.base.StoryView], chats: list[tl.base.Chat], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.views_count = views_count
+        self.forwards_count = forwards_count
+        self.reactions_count = reactions_count
+        self.views = views
+        self.chats = chats
+        self.users = users
+        self.next_offset = next_offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        out += Int.write(self.views_count)
+        out += Int.write(self.forwards_count)
+        out += Int.write(self.reactions_count)
+        TLObjectVector.write_to(out, self.views, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StoryViewsList:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        views_count = Int.read(stream)
+        forwards_count = Int.read(stream)
+        reactions_count = Int.read(stream)
+        views = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(count=count, views_count=views_count, forwards_count=forwards_count, reactions_count=reactions_count, views=views, chats=chats, users=users, next_offset=next_offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StoryViewsList, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        views_count, cursor = Int.read_from(view, cursor)
+        forwards_count, cursor = Int.read_from(view, cursor)
+        reactions_count, cursor = Int.read_from(view, cursor)
+        views, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(count=count, views_count=views_count, forwards_count=forwards_count, reactions_count=reactions_count, views=views, chats=chats, users=users, next_offset=next_offset), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for views_item in self.views:
+            views_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StoryViews(TLObject):
+    __tl_id__ = 0xde9eed1d
+    __tl_name__ = "types.stories.StoryViews"
+    __tl_layer__ = 160
+
+    __slots__ = ("views", "users", )
+
+    def __init__(self, *, views: list[tl.base.StoryViews], users: list[tl.base.User]):
+        self.views = views
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.views, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StoryViews:
+        views = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(views=views, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StoryViews, int]:
+        views, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(views=views, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class PeerStories(TLObject):
+    __tl_id__ = 0xcae68768
+    __tl_name__ = "types.stories.PeerStories"
+    __tl_layer__ = 164
+
+    __slots__ = ("stories", "chats", "users", )
+
+    def __init__(self, *, stories: tl.types.PeerStories, chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.stories = stories
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stories.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> PeerStories:
+        stories = tl.types.PeerStories.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(stories=stories, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[PeerStories, int]:
+        stories, cursor = tl.types.PeerStories.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(stories=stories, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.stories.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StoryReactionsList(TLObject):
+    __tl_id__ = 0xaa5f789c
+    __tl_name__ = "types.stories.StoryReactionsList"
+    __tl_layer__ = 168
+
+    __slots__ = ("count", "reactions", "chats", "users", "next_offset", )
+
+    def __init__(self, *, count: int, reactions: list[tl.base.StoryReaction], chats: list[tl.base.Chat], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.reactions = reactions
+        self.chats = chats
+        self.users = users
+        self.next_offset = next_offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.reactions, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StoryReactionsList:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        reactions = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(count=count, reactions=reactions, chats=chats, users=users, next_offset=next_offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StoryReactionsList, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        reactions, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(count=count, reactions=reactions, chats=chats, users=users, next_offset=next_offset), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for reactions_item in self.reactions:
+            reactions_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class FoundStories(TLObject):
+    __tl_id__ = 0xe2de7737
+    __tl_name__ = "types.stories.FoundStories"
+    __tl_layer__ = 182
+
+    __slots__ = ("count", "stories", "next_offset", "chats", "users", )
+
+    def __init__(self, *, count: int, stories: list[tl.base.FoundStory], chats: list[tl.base.Chat], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.stories = stories
+        self.next_offset = next_offset
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.stories, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FoundStories:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        stories = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, stories=stories, next_offset=next_offset, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FoundStories, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        stories, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, stories=stories, next_offset=next_offset, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for stories_item in self.stories:
+            stories_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class AllStoriesNotModified_160(TLObject):
+    __tl_id__ = 0x47e0a07e
+    __tl_name__ = "types.stories.AllStoriesNotModified_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("state", )
+
+    def __init__(self, *, state: str):
+        self.state = state
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        String.write_to(out, self.state)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AllStoriesNotModified_160:
+        state = String.read(stream)
+        return cls(state=state)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AllStoriesNotModified_160, int]:
+        state, cursor = String.read_from(view, cursor)
+        return cls(state=state), cursor
+
+
+class AllStories_160(TLObject):
+    __tl_id__ = 0x839e0428
+    __tl_name__ = "types.stories.AllStories_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("has_more", "count", "state", "user_stories", "users", )
+
+    def __init__(self, *, count: int, state: str, user_stories: list[tl.base.UserStories], users: list[tl.base.User], has_more: bool = False):
+        self.has_more = has_more
+        self.count = count
+        self.state = state
+        self.user_stories = user_stories
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.has_more: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        String.write_to(out, self.state)
+        TLObjectVector.write_to(out, self.user_stories, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AllStories_160:
+        flags1 = Int.read(stream)
+        has_more = (flags1 & (1 << 0)) == (1 << 0)
+        count = Int.read(stream)
+        state = String.read(stream)
+        user_stories = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(has_more=has_more, count=count, state=state, user_stories=user_stories, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AllStories_160, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        has_more = (flags1 & (1 << 0)) == (1 << 0)
+        count, cursor = Int.read_from(view, cursor)
+        state, cursor = String.read_from(view, cursor)
+        user_stories, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(has_more=has_more, count=count, state=state, user_stories=user_stories, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for user_stories_item in self.user_stories:
+            user_stories_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class Stories_160(TLObject):
+    __tl_id__ = 0x4fe57df1
+    __tl_name__ = "types.stories.Stories_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("count", "stories", "users", )
+
+    def __init__(self, *, count: int, stories: list[tl.base.StoryItem], users: list[tl.base.User]):
+        self.count = count
+        self.stories = stories
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.stories, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Stories_160:
+        count = Int.read(stream)
+        stories = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, stories=stories, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Stories_160, int]:
+        count, cursor = Int.read_from(view, cursor)
+        stories, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, stories=stories, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for stories_item in self.stories:
+            stories_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class UserStories_160(TLObject):
+    __tl_id__ = 0x37a6ff5f
+    __tl_name__ = "types.stories.UserStories_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("stories", "users", )
+
+    def __init__(self, *, stories: tl.types.UserStories_160, users: list[tl.base.User]):
+        self.stories = stories
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.stories.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UserStories_160:
+        stories = tl.types.UserStories_160.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(stories=stories, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UserStories_160, int]:
+        stories, cursor = tl.types.UserStories_160.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(stories=stories, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.stories.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StoryViewsList_160(TLObject):
+    __tl_id__ = 0xfb3f77ac
+    __tl_name__ = "types.stories.StoryViewsList_160"
+    __tl_layer__ = 160
+
+    __slots__ = ("count", "views", "users", )
+
+    def __init__(self, *, count: int, views: list[tl.base.StoryView], users: list[tl.base.User]):
+        self.count = count
+        self.views = views
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.views, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StoryViewsList_160:
+        count = Int.read(stream)
+        views = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, views=views, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StoryViewsList_160, int]:
+        count, cursor = Int.read_from(view, cursor)
+        views, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, views=views, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for views_item in self.views:
+            views_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class AllStories_161(TLObject):
+    __tl_id__ = 0x519d899e
+    __tl_name__ = "types.stories.AllStories_161"
+    __tl_layer__ = 161
+
+    __slots__ = ("has_more", "count", "state", "user_stories", "users", "stealth_mode", )
+
+    def __init__(self, *, count: int, state: str, user_stories: list[tl.base.UserStories], users: list[tl.base.User], stealth_mode: tl.types.StoriesStealthMode, has_more: bool = False):
+        self.has_more = has_more
+        self.count = count
+        self.state = state
+        self.user_stories = user_stories
+        self.users = users
+        self.stealth_mode = stealth_mode
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.has_more: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        String.write_to(out, self.state)
+        TLObjectVector.write_to(out, self.user_stories, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        self.stealth_mode.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> AllStories_161:
+        flags1 = Int.read(stream)
+        has_more = (flags1 & (1 << 0)) == (1 << 0)
+        count = Int.read(stream)
+        state = String.read(stream)
+        user_stories = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        stealth_mode = tl.types.StoriesStealthMode.read(stream)
+        return cls(has_more=has_more, count=count, state=state, user_stories=user_stories, users=users, stealth_mode=stealth_mode)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[AllStories_161, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        has_more = (flags1 & (1 << 0)) == (1 << 0)
+        count, cursor = Int.read_from(view, cursor)
+        state, cursor = String.read_from(view, cursor)
+        user_stories, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        stealth_mode, cursor = tl.types.StoriesStealthMode.read_from(view, cursor)
+        return cls(has_more=has_more, count=count, state=state, user_stories=user_stories, users=users, stealth_mode=stealth_mode), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for user_stories_item in self.user_stories:
+            user_stories_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class StoryViewsList_161(TLObject):
+    __tl_id__ = 0x46e9b9ec
+    __tl_name__ = "types.stories.StoryViewsList_161"
+    __tl_layer__ = 161
+
+    __slots__ = ("count", "reactions_count", "views", "users", "next_offset", )
+
+    def __init__(self, *, count: int, reactions_count: int, views: list[tl.base.StoryView], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.reactions_count = reactions_count
+        self.views = views
+        self.users = users
+        self.next_offset = next_offset
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        out += Int.write(self.reactions_count)
+        TLObjectVector.write_to(out, self.views, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> StoryViewsList_161:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        reactions_count = Int.read(stream)
+        views = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        return cls(count=count, reactions_count=reactions_count, views=views, users=users, next_offset=next_offset)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[StoryViewsList_161, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        reactions_count, cursor = Int.read_from(view, cursor)
+        views, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        return cls(count=count, reactions_count=reactions_count, views=views, users=users, next_offset=next_offset), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for views_item in self.views:
+            views_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class Stories_164(TLObject):
+    __tl_id__ = 0x5dd8c3c8
+    __tl_name__ = "types.stories.Stories_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("count", "stories", "chats", "users", )
+
+    def __init__(self, *, count: int, stories: list[tl.base.StoryItem], chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.count = count
+        self.stories = stories
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.stories, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Stories_164:
+        count = Int.read(stream)
+        stories = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, stories=stories, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Stories_164, int]:
+        count, cursor = Int.read_from(view, cursor)
+        stories, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, stories=stories, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for stories_item in self.stories:
+            stories_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class BoostsStatus_164(TLObject):
+    __tl_id__ = 0x66ea1fef
+    __tl_name__ = "types.stories.BoostsStatus_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("my_boost", "level", "current_level_boosts", "boosts", "next_level_boosts", "premium_audience", )
+
+    def __init__(self, *, level: int, current_level_boosts: int, boosts: int, my_boost: bool = False, next_level_boosts: int | None = None, premium_audience: tl.types.StatsPercentValue | None = None):
+        self.my_boost = my_boost
+        self.level = level
+        self.current_level_boosts = current_level_boosts
+        self.boosts = boosts
+        self.next_level_boosts = next_level_boosts
+        self.premium_audience = premium_audience
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.my_boost: flags1 |= (1 << 2)
+        if self.next_level_boosts is not None: flags1 |= (1 << 0)
+        if self.premium_audience is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Int.write(self.level)
+        out += Int.write(self.current_level_boosts)
+        out += Int.write(self.boosts)
+        if self.next_level_boosts is not None:
+            out += Int.write(self.next_level_boosts)
+        if self.premium_audience is not None:
+            self.premium_audience.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BoostsStatus_164:
+        flags1 = Int.read(stream)
+        my_boost = (flags1 & (1 << 2)) == (1 << 2)
+        level = Int.read(stream)
+        current_level_boosts = Int.read(stream)
+        boosts = Int.read(stream)
+        next_level_boosts = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        premium_audience = tl.types.StatsPercentValue.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(my_boost=my_boost, level=level, current_level_boosts=current_level_boosts, boosts=boosts, next_level_boosts=next_level_boosts, premium_audience=premium_audience)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BoostsStatus_164, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        my_boost = (flags1 & (1 << 2)) == (1 << 2)
+        level, cursor = Int.read_from(view, cursor)
+        current_level_boosts, cursor = Int.read_from(view, cursor)
+        boosts, cursor = Int.read_from(view, cursor)
+        next_level_boosts, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        premium_audience, cursor = tl.types.StatsPercentValue.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(my_boost=my_boost, level=level, current_level_boosts=current_level_boosts, boosts=boosts, next_level_boosts=next_level_boosts, premium_audience=premium_audience), cursor
+
+
+class CanApplyBoostOk_164(TLObject):
+    __tl_id__ = 0xc3173587
+    __tl_name__ = "types.stories.CanApplyBoostOk_164"
+    __tl_layer__ = 164
+
+    __slots__ = ()
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        return
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CanApplyBoostOk_164:
+        return cls()
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CanApplyBoostOk_164, int]:
+        return cls(), cursor
+
+
+class CanApplyBoostReplace_164(TLObject):
+    __tl_id__ = 0x712c4655
+    __tl_name__ = "types.stories.CanApplyBoostReplace_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("current_boost", "chats", )
+
+    def __init__(self, *, current_boost: tl.base.Peer, chats: list[tl.base.Chat]):
+        self.current_boost = current_boost
+        self.chats = chats
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.current_boost.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CanApplyBoostReplace_164:
+        current_boost = TLObject.read(stream)
+        chats = TLObjectVector.read(stream)
+        return cls(current_boost=current_boost, chats=chats)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CanApplyBoostReplace_164, int]:
+        current_boost, cursor = TLObject.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(current_boost=current_boost, chats=chats), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+
+
+class BoostersList_164(TLObject):
+    __tl_id__ = 0xf3dd3d1d
+    __tl_name__ = "types.stories.BoostersList_164"
+    __tl_layer__ = 164
+
+    __slots__ = ("count", "boosters", "next_offset", "users", )
+
+    def __init__(self, *, count: int, boosters: list[tl.base.Booster], users: list[tl.base.User], next_offset: str | None = None):
+        self.count = count
+        self.boosters = boosters
+        self.next_offset = next_offset
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.next_offset is not None: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.boosters, ctx)
+        if self.next_offset is not None:
+            String.write_to(out, self.next_offset)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BoostersList_164:
+        flags1 = Int.read(stream)
+        count = Int.read(stream)
+        boosters = TLObjectVector.read(stream)
+        next_offset = String.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        users = TLObjectVector.read(stream)
+        return cls(count=count, boosters=boosters, next_offset=next_offset, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BoostersList_164, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        count, cursor = Int.read_from(view, cursor)
+        boosters, cursor = TLObjectVector.read_from(view, cursor)
+        next_offset, cursor = String.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, boosters=boosters, next_offset=next_offset, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class BoostsStatus_165Base(TLObject):
+    __tl_id__ = 0xe5c1aa5c
+    __tl_name__ = "types.stories.BoostsStatus_165"
+    __tl_layer__ = 165
+
+    __slots__ = ("my_boost", "level", "current_level_boosts", "boosts", "next_level_boosts", "premium_audience", "boost_url", )
+
+    def __init__(self, *, level: int, current_level_boosts: int, boosts: int, boost_url: str, my_boost: bool = False, next_level_boosts: int | None = None, premium_audience: tl.types.StatsPercentValue | None = None):
+        self.my_boost = my_boost
+        self.level = level
+        self.current_level_boosts = current_level_boosts
+        self.boosts = boosts
+        self.next_level_boosts = next_level_boosts
+        self.premium_audience = premium_audience
+        self.boost_url = boost_url
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.my_boost: flags1 |= (1 << 2)
+        if self.next_level_boosts is not None: flags1 |= (1 << 0)
+        if self.premium_audience is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Int.write(self.level)
+        out += Int.write(self.current_level_boosts)
+        out += Int.write(self.boosts)
+        if self.next_level_boosts is not None:
+            out += Int.write(self.next_level_boosts)
+        if self.premium_audience is not None:
+            self.premium_audience.write_to(out, ctx)
+        String.write_to(out, self.boost_url)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> BoostsStatus_165:
+        flags1 = Int.read(stream)
+        my_boost = (flags1 & (1 << 2)) == (1 << 2)
+        level = Int.read(stream)
+        current_level_boosts = Int.read(stream)
+        boosts = Int.read(stream)
+        next_level_boosts = Int.read(stream) if (flags1 & (1 << 0)) == (1 << 0) else None
+        premium_audience = tl.types.StatsPercentValue.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        boost_url = String.read(stream)
+        return cls(my_boost=my_boost, level=level, current_level_boosts=current_level_boosts, boosts=boosts, next_level_boosts=next_level_boosts, premium_audience=premium_audience, boost_url=boost_url)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[BoostsStatus_165, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        my_boost = (flags1 & (1 << 2)) == (1 << 2)
+        level, cursor = Int.read_from(view, cursor)
+        current_level_boosts, cursor = Int.read_from(view, cursor)
+        boosts, cursor = Int.read_from(view, cursor)
+        next_level_boosts, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 0)) == (1 << 0) else (None, cursor)
+        premium_audience, cursor = tl.types.StatsPercentValue.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        boost_url, cursor = String.read_from(view, cursor)
+        return cls(my_boost=my_boost, level=level, current_level_boosts=current_level_boosts, boosts=boosts, next_level_boosts=next_level_boosts, premium_audience=premium_audience, boost_url=boost_url), cursor
+
+
+class AllStoriesNotModified(AllStoriesNotModifiedBase):
+    __tl_ids__ = (
+        (AllStoriesNotModified_160.__tl_layer__, AllStoriesNotModified_160.__tl_id__),
+        (AllStoriesNotModifiedBase.__tl_layer__, AllStoriesNotModifiedBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        if ctx.layer >= 161:
+            flags1 = 0
+            out += Int.write(flags1)
+        String.write_to(out, self.state)
+        if ctx.layer >= 161:
+            self.stealth_mode.write_to(out, ctx)
+
+
+class AllStories(AllStoriesBase):
+    __tl_ids__ = (
+        (AllStories_160.__tl_layer__, AllStories_160.__tl_id__),
+        (AllStories_161.__tl_layer__, AllStories_161.__tl_id__),
+        (AllStoriesBase.__tl_layer__, AllStoriesBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        _user_stories_fallback_160 = tl.layer_converters.stories__all_stories.get_user_stories_fallback_for_160(self, ctx)
+        
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.has_more: flags1 |= (1 << 0)
+        out += Int.write(flags1)
+        out += Int.write(self.count)
+        String.write_to(out, self.state)
+        if ctx.layer >= 164:
+            TLObjectVector.write_to(out, self.peer_stories, ctx)
+        if ctx.layer >= 164:
+            TLObjectVector.write_to(out, self.chats, ctx)
+        if ctx.layer <= 163:
+            TLObjectVector.write_to(out, _user_stories_fallback_160, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if ctx.layer >= 161:
+            self.stealth_mode.write_to(out, ctx)
+
+
+class Stories(StoriesBase):
+    __tl_ids__ = (
+        (Stories_160.__tl_layer__, Stories_160.__tl_id__),
+        (Stories_164.__tl_layer__, Stories_164.__tl_id__),
+        (StoriesBase.__tl_layer__, StoriesBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        if ctx.layer >= 179:
+            flags1 = 0
+            if ctx.layer >= 179:
+                if self.pinned_to_top: flags1 |= (1 << 0)
+            out += Int.write(flags1)
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.stories, ctx)
+        if ctx.layer >= 179:
+            if self.pinned_to_top:
+                out += IntVector.write(self.pinned_to_top)
+        if ctx.layer >= 164:
+            TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+
+class StoryViewsList(StoryViewsListBase):
+    __tl_ids__ = (
+        (StoryViewsList_160.__tl_layer__, StoryViewsList_160.__tl_id__),
+        (StoryViewsList_161.__tl_layer__, StoryViewsList_161.__tl_id__),
+        (StoryViewsListBase.__tl_layer__, StoryViewsListBase.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        if ctx.layer >= 161:
+            flags1 = 0
+            if ctx.layer >= 161:
+                if self.next_offset is not None: flags1 |= (1 << 0)
+            out += Int.write(flags1)
+        out += Int.write(self.count)
+        if ctx.layer >= 168:
+            out += Int.write(self.views_count)
+        if ctx.layer >= 168:
+            out += Int.write(self.forwards_count)
+        if ctx.layer >= 161:
+            out += Int.write(self.reactions_count)
+        TLObjectVector.write_to(out, self.views, ctx)
+        if ctx.layer >= 168:
+            TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        if ctx.layer >= 161:
+            if self.next_offset is not None:
+                String.write_to(out, self.next_offset)
+
+
+class BoostsStatus_165(BoostsStatus_165Base):
+    __tl_ids__ = (
+        (BoostsStatus_164.__tl_layer__, BoostsStatus_164.__tl_id__),
+        (BoostsStatus_165Base.__tl_layer__, BoostsStatus_165Base.__tl_id__),
+    )
+
+    __slots__ = ()
+
+    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        if ctx.dont_format:
+            return super().write_to(out, ctx)
+        if ctx.layer >= self.__tl_layer__:
+            return super().write_to(out, ctx)
+
+        if ctx.layer < self.__tl_ids__[0][0]:
+            raise RuntimeError(
+                f"Client wants layer {ctx.layer} for object {self.__class__.__name__!r}, "
+                f"but minimum available is {self.__tl_ids__[0][0]}"
+            )
+
+        layer_idx = bisect.bisect_right(self.__tl_ids__, ctx.layer, key=lambda e: e[0]) - 1
+
+        out += Int.write(self.__tl_ids__[layer_idx][1], False)
+        flags1 = 0
+        if self.my_boost: flags1 |= (1 << 2)
+        if self.next_level_boosts is not None: flags1 |= (1 << 0)
+        if self.premium_audience is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Int.write(self.level)
+        out += Int.write(self.current_level_boosts)
+        out += Int.write(self.boosts)
+        if self.next_level_boosts is not None:
+            out += Int.write(self.next_level_boosts)
+        if self.premium_audience is not None:
+            self.premium_audience.write_to(out, ctx)
+        if ctx.layer >= 165:
+            String.write_to(out, self.boost_url)
@@ -0,0 +1,375 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class State(TLObject):
+    __tl_id__ = 0xa56c2a3e
+    __tl_name__ = "types.updates.State"
+    __tl_layer__ = 133
+
+    __slots__ = ("pts", "qts", "date", "seq", "unread_count", )
+
+    def __init__(self, *, pts: int, qts: int, date: int, seq: int, unread_count: int):
+        self.pts = pts
+        self.qts = qts
+        self.date = date
+        self.seq = seq
+        self.unread_count = unread_count
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.pts)
+        out += Int.write(self.qts)
+        out += Int.write(self.date)
+        out += Int.write(self.seq)
+        out += Int.write(self.unread_count)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> State:
+        pts = Int.read(stream)
+        qts = Int.read(stream)
+        date = Int.read(stream)
+        seq = Int.read(stream)
+        unread_count = Int.read(stream)
+        return cls(pts=pts, qts=qts, date=date, seq=seq, unread_count=unread_count)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[State, int]:
+        pts, cursor = Int.read_from(view, cursor)
+        qts, cursor = Int.read_from(view, cursor)
+        date, cursor = Int.read_from(view, cursor)
+        seq, cursor = Int.read_from(view, cursor)
+        unread_count, cursor = Int.read_from(view, cursor)
+        return cls(pts=pts, qts=qts, date=date, seq=seq, unread_count=unread_count), cursor
+
+
+class DifferenceEmpty(TLObject):
+    __tl_id__ = 0x5d75a138
+    __tl_name__ = "types.updates.DifferenceEmpty"
+    __tl_layer__ = 133
+
+    __slots__ = ("date", "seq", )
+
+    def __init__(self, *, date: int, seq: int):
+        self.date = date
+        self.seq = seq
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.date)
+        out += Int.write(self.seq)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DifferenceEmpty:
+        date = Int.read(stream)
+        seq = Int.read(stream)
+        return cls(date=date, seq=seq)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DifferenceEmpty, int]:
+        date, cursor = Int.read_from(view, cursor)
+        seq, cursor = Int.read_from(view, cursor)
+        return cls(date=date, seq=seq), cursor
+
+
+class Difference(TLObject):
+    __tl_id__ = 0xf49ca0
+    __tl_name__ = "types.updates.Difference"
+    __tl_layer__ = 133
+
+    __slots__ = ("new_messages", "new_encrypted_messages", "other_updates", "chats", "users", "state", )
+
+    def __init__(self, *, new_messages: list[tl.base.Message], new_encrypted_messages: list[tl.base.EncryptedMessage], other_updates: list[tl.base.Update], chats: list[tl.base.Chat], users: list[tl.base.User], state: tl.types.updates.State):
+        self.new_messages = new_messages
+        self.new_encrypted_messages = new_encrypted_messages
+        self.other_updates = other_updates
+        self.chats = chats
+        self.users = users
+        self.state = state
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.new_messages, ctx)
+        TLObjectVector.write_to(out, self.new_encrypted_messages, ctx)
+        TLObjectVector.write_to(out, self.other_updates, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        self.state.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Difference:
+        new_messages = TLObjectVector.read(stream)
+        new_encrypted_messages = TLObjectVector.read(stream)
+        other_updates = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        state = tl.types.updates.State.read(stream)
+        return cls(new_messages=new_messages, new_encrypted_messages=new_encrypted_messages, other_updates=other_updates, chats=chats, users=users, state=state)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Difference, int]:
+        new_messages, cursor = TLObjectVector.read_from(view, cursor)
+        new_encrypted_messages, cursor = TLObjectVector.read_from(view, cursor)
+        other_updates, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        state, cursor = tl.types.updates.State.read_from(view, cursor)
+        return cls(new_messages=new_messages, new_encrypted_messages=new_encrypted_messages, other_updates=other_updates, chats=chats, users=users, state=state), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for new_messages_item in self.new_messages:
+            new_messages_item.check_for_ctx_values(values)
+        for other_updates_item in self.other_updates:
+            other_updates_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class DifferenceSlice(TLObject):
+    __tl_id__ = 0xa8fb1981
+    __tl_name__ = "types.updates.DifferenceSlice"
+    __tl_layer__ = 133
+
+    __slots__ = ("new_messages", "new_encrypted_messages", "other_updates", "chats", "users", "intermediate_state", )
+
+    def __init__(self, *, new_messages: list[tl.base.Message], new_encrypted_messages: list[tl.base.EncryptedMessage], other_updates: list[tl.base.Update], chats: list[tl.base.Chat], users: list[tl.base.User], intermediate_state: tl.types.updates.State):
+        self.new_messages = new_messages
+        self.new_encrypted_messages = new_encrypted_messages
+        self.other_updates = other_updates
+        self.chats = chats
+        self.users = users
+        self.intermediate_state = intermediate_state
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.new_messages, ctx)
+        TLObjectVector.write_to(out, self.new_encrypted_messages, ctx)
+        TLObjectVector.write_to(out, self.other_updates, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+        self.intermediate_state.write_to(out, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DifferenceSlice:
+        new_messages = TLObjectVector.read(stream)
+        new_encrypted_messages = TLObjectVector.read(stream)
+        other_updates = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        intermediate_state = tl.types.updates.State.read(stream)
+        return cls(new_messages=new_messages, new_encrypted_messages=new_encrypted_messages, other_updates=other_updates, chats=chats, users=users, intermediate_state=intermediate_state)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DifferenceSlice, int]:
+        new_messages, cursor = TLObjectVector.read_from(view, cursor)
+        new_encrypted_messages, cursor = TLObjectVector.read_from(view, cursor)
+        other_updates, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        intermediate_state, cursor = tl.types.updates.State.read_from(view, cursor)
+        return cls(new_messages=new_messages, new_encrypted_messages=new_encrypted_messages, other_updates=other_updates, chats=chats, users=users, intermediate_state=intermediate_state), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for new_messages_item in self.new_messages:
+            new_messages_item.check_for_ctx_values(values)
+        for other_updates_item in self.other_updates:
+            other_updates_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class DifferenceTooLong(TLObject):
+    __tl_id__ = 0x4afe8f6d
+    __tl_name__ = "types.updates.DifferenceTooLong"
+    __tl_layer__ = 133
+
+    __slots__ = ("pts", )
+
+    def __init__(self, *, pts: int):
+        self.pts = pts
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.pts)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> DifferenceTooLong:
+        pts = Int.read(stream)
+        return cls(pts=pts)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[DifferenceTooLong, int]:
+        pts, cursor = Int.read_from(view, cursor)
+        return cls(pts=pts), cursor
+
+
+class ChannelDifferenceEmpty(TLObject):
+    __tl_id__ = 0x3e11affb
+    __tl_name__ = "types.updates.ChannelDifferenceEmpty"
+    __tl_layer__ = 133
+
+    __slots__ = ("final", "pts", "timeout", )
+
+    def __init__(self, *, pts: int, final: bool = False, timeout: int | None = None):
+        self.final = final
+        self.pts = pts
+        self.timeout = timeout
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.final: flags1 |= (1 << 0)
+        if self.timeout is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Int.write(self.pts)
+        if self.timeout is not None:
+            out += Int.write(self.timeout)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelDifferenceEmpty:
+        flags1 = Int.read(stream)
+        final = (flags1 & (1 << 0)) == (1 << 0)
+        pts = Int.read(stream)
+        timeout = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        return cls(final=final, pts=pts, timeout=timeout)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelDifferenceEmpty, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        final = (flags1 & (1 << 0)) == (1 << 0)
+        pts, cursor = Int.read_from(view, cursor)
+        timeout, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        return cls(final=final, pts=pts, timeout=timeout), cursor
+
+
+class ChannelDifferenceTooLong(TLObject):
+    __tl_id__ = 0xa4bcc6fe
+    __tl_name__ = "types.updates.ChannelDifferenceTooLong"
+    __tl_layer__ = 133
+
+    __slots__ = ("final", "timeout", "dialog", "messages", "chats", "users", )
+
+    def __init__(self, *, dialog: tl.base.Dialog, messages: list[tl.base.Message], chats: list[tl.base.Chat], users: list[tl.base.User], final: bool = False, timeout: int | None = None):
+        self.final = final
+        self.timeout = timeout
+        self.dialog = dialog
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.final: flags1 |= (1 << 0)
+        if self.timeout is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        if self.timeout is not None:
+            out += Int.write(self.timeout)
+        self.dialog.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.messages, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelDifferenceTooLong:
+        flags1 = Int.read(stream)
+        final = (flags1 & (1 << 0)) == (1 << 0)
+        timeout = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        dialog = TLObject.read(stream)
+        messages = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(final=final, timeout=timeout, dialog=dialog, messages=messages, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelDifferenceTooLong, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        final = (flags1 & (1 << 0)) == (1 << 0)
+        timeout, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        dialog, cursor = TLObject.read_from(view, cursor)
+        messages, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(final=final, timeout=timeout, dialog=dialog, messages=messages, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for messages_item in self.messages:
+            messages_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class ChannelDifference(TLObject):
+    __tl_id__ = 0x2064674e
+    __tl_name__ = "types.updates.ChannelDifference"
+    __tl_layer__ = 133
+
+    __slots__ = ("final", "pts", "timeout", "new_messages", "other_updates", "chats", "users", )
+
+    def __init__(self, *, pts: int, new_messages: list[tl.base.Message], other_updates: list[tl.base.Update], chats: list[tl.base.Chat], users: list[tl.base.User], final: bool = False, timeout: int | None = None):
+        self.final = final
+        self.pts = pts
+        self.timeout = timeout
+        self.new_messages = new_messages
+        self.other_updates = other_updates
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        flags1 = 0
+        if self.final: flags1 |= (1 << 0)
+        if self.timeout is not None: flags1 |= (1 << 1)
+        out += Int.write(flags1)
+        out += Int.write(self.pts)
+        if self.timeout is not None:
+            out += Int.write(self.timeout)
+        TLObjectVector.write_to(out, self.new_messages, ctx)
+        TLObjectVector.write_to(out, self.other_updates, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> ChannelDifference:
+        flags1 = Int.read(stream)
+        final = (flags1 & (1 << 0)) == (1 << 0)
+        pts = Int.read(stream)
+        timeout = Int.read(stream) if (flags1 & (1 << 1)) == (1 << 1) else None
+        new_messages = TLObjectVector.read(stream)
+        other_updates = TLObjectVector.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(final=final, pts=pts, timeout=timeout, new_messages=new_messages, other_updates=other_updates, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[ChannelDifference, int]:
+        flags1, cursor = Int.read_from(view, cursor)
+        final = (flags1 & (1 << 0)) == (1 << 0)
+        pts, cursor = Int.read_from(view, cursor)
+        timeout, cursor = Int.read_from(view, cursor) if (flags1 & (1 << 1)) == (1 << 1) else (None, cursor)
+        new_messages, cursor = TLObjectVector.read_from(view, cursor)
+        other_updates, cursor = TLObjectVector.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(final=final, pts=pts, timeout=timeout, new_messages=new_messages, other_updates=other_updates, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for new_messages_item in self.new_messages:
+            new_messages_item.check_for_ctx_values(values)
+        for other_updates_item in self.other_updates:
+            other_updates_item.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
@@ -0,0 +1,175 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class File(TLObject):
+    __tl_id__ = 0x96a18d5
+    __tl_name__ = "types.upload.File"
+    __tl_layer__ = 133
+
+    __slots__ = ("type_", "mtime", "bytes_", )
+
+    def __init__(self, *, type_: tl.base.storage.FileType, mtime: int, bytes_: bytes):
+        self.type_ = type_
+        self.mtime = mtime
+        self.bytes_ = bytes_
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.type_.write_to(out, ctx)
+        out += Int.write(self.mtime)
+        Bytes.write_to(out, self.bytes_)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> File:
+        type_ = TLObject.read(stream)
+        mtime = Int.read(stream)
+        bytes_ = Bytes.read(stream)
+        return cls(type_=type_, mtime=mtime, bytes_=bytes_)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[File, int]:
+        type_, cursor = TLObject.read_from(view, cursor)
+        mtime, cursor = Int.read_from(view, cursor)
+        bytes_, cursor = Bytes.read_from(view, cursor)
+        return cls(type_=type_, mtime=mtime, bytes_=bytes_), cursor
+
+
+class FileCdnRedirect(TLObject):
+    __tl_id__ = 0xf18cda44
+    __tl_name__ = "types.upload.FileCdnRedirect"
+    __tl_layer__ = 133
+
+    __slots__ = ("dc_id", "file_token", "encryption_key", "encryption_iv", "file_hashes", )
+
+    def __init__(self, *, dc_id: int, file_token: bytes, encryption_key: bytes, encryption_iv: bytes, file_hashes: list[tl.base.FileHash]):
+        self.dc_id = dc_id
+        self.file_token = file_token
+        self.encryption_key = encryption_key
+        self.encryption_iv = encryption_iv
+        self.file_hashes = file_hashes
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.dc_id)
+        Bytes.write_to(out, self.file_token)
+        Bytes.write_to(out, self.encryption_key)
+        Bytes.write_to(out, self.encryption_iv)
+        TLObjectVector.write_to(out, self.file_hashes, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> FileCdnRedirect:
+        dc_id = Int.read(stream)
+        file_token = Bytes.read(stream)
+        encryption_key = Bytes.read(stream)
+        encryption_iv = Bytes.read(stream)
+        file_hashes = TLObjectVector.read(stream)
+        return cls(dc_id=dc_id, file_token=file_token, encryption_key=encryption_key, encryption_iv=encryption_iv, file_hashes=file_hashes)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[FileCdnRedirect, int]:
+        dc_id, cursor = Int.read_from(view, cursor)
+        file_token, cursor = Bytes.read_from(view, cursor)
+        encryption_key, cursor = Bytes.read_from(view, cursor)
+        encryption_iv, cursor = Bytes.read_from(view, cursor)
+        file_hashes, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(dc_id=dc_id, file_token=file_token, encryption_key=encryption_key, encryption_iv=encryption_iv, file_hashes=file_hashes), cursor
+
+
+class WebFile(TLObject):
+    __tl_id__ = 0x21e753bc
+    __tl_name__ = "types.upload.WebFile"
+    __tl_layer__ = 133
+
+    __slots__ = ("size", "mime_type", "file_type", "mtime", "bytes_", )
+
+    def __init__(self, *, size: int, mime_type: str, file_type: tl.base.storage.FileType, mtime: int, bytes_: bytes):
+        self.size = size
+        self.mime_type = mime_type
+        self.file_type = file_type
+        self.mtime = mtime
+        self.bytes_ = bytes_
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.size)
+        String.write_to(out, self.mime_type)
+        self.file_type.write_to(out, ctx)
+        out += Int.write(self.mtime)
+        Bytes.write_to(out, self.bytes_)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> WebFile:
+        size = Int.read(stream)
+        mime_type = String.read(stream)
+        file_type = TLObject.read(stream)
+        mtime = Int.read(stream)
+        bytes_ = Bytes.read(stream)
+        return cls(size=size, mime_type=mime_type, file_type=file_type, mtime=mtime, bytes_=bytes_)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[WebFile, int]:
+        size, cursor = Int.read_from(view, cursor)
+        mime_type, cursor = String.read_from(view, cursor)
+        file_type, cursor = TLObject.read_from(view, cursor)
+        mtime, cursor = Int.read_from(view, cursor)
+        bytes_, cursor = Bytes.read_from(view, cursor)
+        return cls(size=size, mime_type=mime_type, file_type=file_type, mtime=mtime, bytes_=bytes_), cursor
+
+
+class CdnFileReuploadNeeded(TLObject):
+    __tl_id__ = 0xeea8e46e
+    __tl_name__ = "types.upload.CdnFileReuploadNeeded"
+    __tl_layer__ = 133
+
+    __slots__ = ("request_token", )
+
+    def __init__(self, *, request_token: bytes):
+        self.request_token = request_token
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.request_token)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CdnFileReuploadNeeded:
+        request_token = Bytes.read(stream)
+        return cls(request_token=request_token)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CdnFileReuploadNeeded, int]:
+        request_token, cursor = Bytes.read_from(view, cursor)
+        return cls(request_token=request_token), cursor
+
+
+class CdnFile(TLObject):
+    __tl_id__ = 0xa99fca4f
+    __tl_name__ = "types.upload.CdnFile"
+    __tl_layer__ = 133
+
+    __slots__ = ("bytes_", )
+
+    def __init__(self, *, bytes_: bytes):
+        self.bytes_ = bytes_
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        Bytes.write_to(out, self.bytes_)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> CdnFile:
+        bytes_ = Bytes.read(stream)
+        return cls(bytes_=bytes_)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[CdnFile, int]:
+        bytes_, cursor = Bytes.read_from(view, cursor)
+        return cls(bytes_=bytes_), cursor
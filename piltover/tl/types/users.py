@@ -0,0 +1,114 @@
+# mypy: disable-error-code=arg-type
+
+from __future__ import annotations
+import bisect
+from io import BytesIO
+from ..primitives import *
+from piltover import tl
+from ..tl_object import TLObject
+from ..serialization_context import SerializationContext, EMPTY_SERIALIZATION_CONTEXT
+from .. import placeholders as tl_placeholders
+from ..layer_info import layer as tl_base_layer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from piltover.context import NeedContextValuesContext
+
+
+class UserFull(TLObject):
+    __tl_id__ = 0x3b6d152e
+    __tl_name__ = "types.users.UserFull"
+    __tl_layer__ = 135
+
+    __slots__ = ("full_user", "chats", "users", )
+
+    def __init__(self, *, full_user: tl.base.UserFull, chats: list[tl.base.Chat], users: list[tl.base.User]):
+        self.full_user = full_user
+        self.chats = chats
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        self.full_user.write_to(out, ctx)
+        TLObjectVector.write_to(out, self.chats, ctx)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UserFull:
+        full_user = TLObject.read(stream)
+        chats = TLObjectVector.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(full_user=full_user, chats=chats, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UserFull, int]:
+        full_user, cursor = TLObject.read_from(view, cursor)
+        chats, cursor = TLObjectVector.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(full_user=full_user, chats=chats, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        self.full_user.check_for_ctx_values(values)
+        for chats_item in self.chats:
+            chats_item.check_for_ctx_values(values)
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class Users(TLObject):
+    __tl_id__ = 0x62d706b8
+    __tl_name__ = "types.users.Users"
+    __tl_layer__ = 197
+
+    __slots__ = ("users", )
+
+    def __init__(self, *, users: list[tl.base.User]):
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> Users:
+        users = TLObjectVector.read(stream)
+        return cls(users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[Users, int]:
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
+
+
+class UsersSlice(TLObject):
+    __tl_id__ = 0x315a4974
+    __tl_name__ = "types.users.UsersSlice"
+    __tl_layer__ = 197
+
+    __slots__ = ("count", "users", )
+
+    def __init__(self, *, count: int, users: list[tl.base.User]):
+        self.count = count
+        self.users = users
+
+    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:
+        out += Int.write(self.count)
+        TLObjectVector.write_to(out, self.users, ctx)
+
+    @classmethod
+    def deserialize(cls, stream: BytesIO) -> UsersSlice:
+        count = Int.read(stream)
+        users = TLObjectVector.read(stream)
+        return cls(count=count, users=users)
+
+    @classmethod
+    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[UsersSlice, int]:
+        count, cursor = Int.read_from(view, cursor)
+        users, cursor = TLObjectVector.read_from(view, cursor)
+        return cls(count=count, users=users), cursor
+
+    def check_for_ctx_values(self, values: NeedContextValuesContext) -> None:
+        for users_item in self.users:
+            users_item.check_for_ctx_values(values)
@@ -0,0 +1,11 @@
+from mtproto import ConnectionRole
+from mtproto.transport.packets import DecryptedMessagePacket, EncryptedMessagePacket
+
+
+def encrypt_server_message(packet: DecryptedMessagePacket, auth_key: bytes) -> EncryptedMessagePacket:
+    """
+    Encrypts message sent by server.
+    This is a module-level function (and both packets are picklable), so it can be run in process pool as well.
+    """
+
+    return packet.encrypt(auth_key, ConnectionRole.SERVER)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from inspect import getfullargspec
-from io import BytesIO
 from pathlib import Path
 from typing import Callable, Any, TypeVar, cast, Protocol, ParamSpec, Awaitable
 
@@ -11,8 +10,9 @@ from taskiq.abc.broker import AsyncBroker
 from taskiq.brokers.inmemory_broker import InmemoryResultBackend
 from taskiq.kicker import AsyncKicker
 
+from piltover._taskiq_binary_formatter import encode_rpc_payload, decode_rpc_payload
 from piltover.context import RequestContext, request_ctx, NeedContextValuesContext
-from piltover.db.models import User
+from piltover.db.models import User, Presence
 from piltover.enums import ReqHandlerFlags
 from piltover.exceptions import ErrorRpc
 from piltover.message_brokers.base_broker import BaseMessageBroker
@@ -129,10 +129,10 @@ class Worker(MessageHandler):
         self.pubsub = InMemoryPubSub()
 
         # https://github.com/taskiq-python/taskiq/issues/436
-        async def _handle_tl_rpc_measure_time(call_hex: str) -> RpcResponse | str:
-            return await self._handle_tl_rpc_measure_time(call_hex)
+        async def _handle_tl_rpc_measure_time(call_data: bytes | str) -> RpcResponse | bytes | str:
+            return await self._handle_tl_rpc_measure_time(call_data)
 
-        async def _handle_tl_rpc_internal(call: str) -> Any:
+        async def _handle_tl_rpc_internal(call: bytes | str) -> Any:
             return await self._handle_tl_rpc_internal(call)
 
         # self.broker.register_task(self._handle_tl_rpc, "handle_tl_rpc")
@@ -147,6 +147,7 @@ class Worker(MessageHandler):
 
     async def _broker_shutdown(self, _) -> None:
         await self.pubsub.shutdown()
+        await Presence.flush()
 
     async def call_internal(self, request: TLObject) -> AsyncTaskiqTask[TLObject]:
         return await AsyncKicker(
@@ -154,7 +155,7 @@ class Worker(MessageHandler):
             broker=self.broker,
             labels={},
         ).kiq(
-            call=CallRpcInternal(obj=request).write().hex(),
+            call=encode_rpc_payload(self.broker, CallRpcInternal(obj=request).write()),
         )
 
     @classmethod
@@ -170,32 +171,28 @@ class Worker(MessageHandler):
 
         return await query
 
-    async def _handle_tl_rpc_measure_time(self, call_hex: str) -> RpcResponse | str:
+    async def _handle_tl_rpc_measure_time(self, call_data: bytes | str) -> RpcResponse | bytes | str:
         with measure_time("_handle_tl_rpc()"):
-            return await self._handle_tl_rpc(call_hex)
-
-    def _err_response(self, req_msg_id: int, code: int, message: str) -> RpcResponse | str:
-        response = RpcResponse(obj=RpcResult(
-            req_msg_id=req_msg_id,
-            result=RpcError(error_code=code, error_message=message),
-        ))
+            return await self._handle_tl_rpc(call_data)
 
+    def _encode_result(self, result: TLObject) -> TLObject | bytes | str:
         if isinstance(self.broker.result_backend, InmemoryResultBackend):
-            return response
+            return result
         else:
-            return response.write().hex()
+            return encode_rpc_payload(self.broker, result.write())
 
-    def _err_response_internal(self, code: int, message: str) -> RpcError | str:
-        response = RpcError(error_code=code, error_message=message)
+    def _err_response(self, req_msg_id: int, code: int, message: str) -> RpcResponse | bytes | str:
+        return self._encode_result(RpcResponse(obj=RpcResult(
+            req_msg_id=req_msg_id,
+            result=RpcError(error_code=code, error_message=message),
+        )))
 
-        if isinstance(self.broker.result_backend, InmemoryResultBackend):
-            return response
-        else:
-            return response.write().hex()
+    def _err_response_internal(self, code: int, message: str) -> RpcError | bytes | str:
+        return self._encode_result(RpcError(error_code=code, error_message=message))
 
-    async def _handle_tl_rpc(self, call_hex: str) -> RpcResponse | str:
+    async def _handle_tl_rpc(self, call_data: bytes | str) -> RpcResponse | bytes | str:
         with measure_time("read CallRpc"):
-            call = CallRpc.read(BytesIO(bytes.fromhex(call_hex)), True)
+            call = CallRpc.read_buffer(decode_rpc_payload(call_data), True)
 
         logger.trace("Got request: {call!r}", call=call)
 
@@ -266,19 +263,14 @@ class Worker(MessageHandler):
 
         logger.trace("Returning to gateway: {result!r}", result=result_obj)
 
-        response = RpcResponse(
+        return self._encode_result(RpcResponse(
             obj=result_obj,
             refresh_auth=handler.refresh_session,
-        )
-
-        if isinstance(self.broker.result_backend, InmemoryResultBackend):
-            return response
-        else:
-            return response.write().hex()
+        ))
 
-    async def _handle_tl_rpc_internal(self, call: str) -> Any:
+    async def _handle_tl_rpc_internal(self, call: bytes | str) -> Any:
         with measure_time("read CallRpc"):
-            call = CallRpcInternal.read(BytesIO(bytes.fromhex(call)), True)
+            call = CallRpcInternal.read_buffer(decode_rpc_payload(call), True)
 
         logger.trace("Got internal request: {call!r}", call=call)
 
@@ -313,7 +305,4 @@ class Worker(MessageHandler):
 
         logger.trace("Returning internal result: {result!r}", result=result)
 
-        if isinstance(self.broker.result_backend, InmemoryResultBackend):
-            return result
-        else:
-            return result.write().hex()
+        return self._encode_result(result)
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import time
+
+from tortoise import Tortoise
+
+from piltover.db.enums import ChatAdminRights, ChatBannedRights
+
+
+async def _create_channel(participants_count: int) -> int:
+    from piltover.db.models import User, Channel, ChatParticipant
+
+    creator = await User.create(phone_number="1", first_name="creator")
+    channel = await Channel.create(creator=creator, name="bench", supergroup=True)
+
+    await User.bulk_create([
+        User(phone_number=str(100 + idx), first_name=f"user {idx}", bot=idx % 100 == 0)
+        for idx in range(participants_count)
+    ], batch_size=5000)
+    user_ids = await User.filter(id__not=creator.id).order_by("id").values_list("id", flat=True)
+
+    await ChatParticipant.bulk_create([
+        ChatParticipant(
+            user_id=user_id, channel=channel, chat_channel_id=channel.make_id(),
+            admin_rights=ChatAdminRights.CHANGE_INFO if idx % 1000 == 0 else ChatAdminRights.NONE,
+            banned_rights=ChatBannedRights.SEND_MESSAGES if idx % 500 == 0 else ChatBannedRights.NONE,
+        )
+        for idx, user_id in enumerate(user_ids)
+    ], batch_size=5000)
+
+    await channel.sync_participants_counts(False)
+    return channel.id
+
+
+async def _measure(name: str, func, iterations: int) -> None:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    took = (time.perf_counter() - start) / iterations
+    print(f"{name}: {took * 1000:.2f} ms")
+
+
+async def bench(participants_count: int, limit: int, iterations: int) -> None:
+    from piltover.db.models import Channel, ChatParticipant
+
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["piltover.db.models"]}, _create_db=True)
+    await Tortoise.generate_schemas()
+
+    try:
+        channel_id = await _create_channel(participants_count)
+        channel = await Channel.get(id=channel_id)
+        query = ChatParticipant.filter(channel_id=channel_id, left=False).order_by("user_id")
+
+        offset = participants_count - limit
+        last_user_id = await query.offset(offset - 1).first().values_list("user_id", flat=True)
+
+        async def offset_page_with_count() -> None:
+            await query.select_related("user").limit(limit).offset(offset)
+            await query.count()
+
+        async def keyset_page_with_maintained_count() -> None:
+            await query.filter(user_id__gt=last_user_id).select_related("user").limit(limit)
+            await channel.refresh_from_db(["participants_count"])
+
+        print(f"Channel with {participants_count} participants, page of {limit} at offset {offset}")
+        await _measure("offset + count()", offset_page_with_count, iterations)
+        await _measure("keyset + maintained count", keyset_page_with_maintained_count, iterations)
+        await _measure(
+            "update_participants_counts (on membership change)",
+            lambda: channel.update_participants_counts([(0, 0, 0, 0, 0)], [(1, 0, 0, 0, 0)]), iterations,
+        )
+        await _measure(
+            "sync_participants_counts (repair)",
+            lambda: channel.sync_participants_counts(False), iterations,
+        )
+    finally:
+        await Tortoise.close_connections()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--participants", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(bench(args.participants, args.limit, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
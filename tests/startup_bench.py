@@ -0,0 +1,87 @@
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+
+_IMPORT_SNIPPET = """
+import resource, sys, time
+start = time.perf_counter()
+import piltover.tl
+{extra}
+took = time.perf_counter() - start
+modules = sum(1 for name in sys.modules if name.startswith("piltover.tl."))
+print(took, modules, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def _run_import(extra: str) -> tuple[float, int, int]:
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SNIPPET.format(extra=extra)],
+        cwd=ROOT_DIR, env={**os.environ, "PYTHONPATH": str(ROOT_DIR)}, capture_output=True, text=True, check=True,
+    )
+    took, modules, max_rss = result.stdout.split()
+    return float(took), int(modules), int(max_rss)
+
+
+def bench_tl_import() -> None:
+    iterations = 5
+
+    for name, extra in (
+            # What gateway needs to decrypt and route a request
+            ("lazy", "piltover.tl.TLObject.read_buffer(piltover.tl.functions.help.GetConfig().write())"),
+            # Same amount of work as importing piltover.tl did before generated modules were loaded lazily
+            ("everything", "piltover.tl.objects.load_all()"),
+    ):
+        runs = [_run_import(extra) for _ in range(iterations)]
+        took, modules, max_rss = min(runs)
+        print(f"Import of piltover.tl ({name}) took {took * 1000:.1f} ms, {modules} tl modules, max rss {max_rss / 1024:.1f} MB")
+
+
+def bench_first_connection(host: str, port: int, timeout: float) -> None:
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "piltover.app.app"],
+        cwd=ROOT_DIR, env={**os.environ, "PYTHONPATH": str(ROOT_DIR)},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                print(f"Server exited with code {process.returncode} before accepting a connection")
+                return
+            try:
+                with socket.create_connection((host, port), timeout=0.1):
+                    break
+            except OSError:
+                time.sleep(0.01)
+        else:
+            print(f"Server did not accept a connection in {timeout} seconds")
+            return
+
+        print(f"First connection was accepted after {time.perf_counter() - start:.2f} seconds")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--server", action="store_true", help="Also measure time to first accepted connection")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4430)
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    bench_tl_import()
+    if args.server:
+        bench_first_connection(args.host, args.port, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
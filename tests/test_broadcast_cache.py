@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import pytest
+
+from piltover.session.broadcast_cache import BroadcastSerializationCache
+from piltover.tl import PollResults, TLObject
+from piltover.tl.serialization_context import ContextValues
+from piltover.tl.to_format import PollResultsToFormat
+
+
+def _session(user_id: int, layer: int = 201) -> SimpleNamespace:
+    return SimpleNamespace(user_id=user_id, auth_id=user_id, layer=layer)
+
+
+def _write_with_votes(
+        cache: BroadcastSerializationCache, obj: TLObject, user_id: int, votes: dict[int, set[int]],
+) -> bytes:
+    # Context values object is not kept alive after write, same as in Session.enqueue
+    values = ContextValues()
+    values.poll_answers.update(votes)
+    return cache.write(obj, _session(user_id), values)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_cache_shares_bytes_for_same_values() -> None:
+    cache = BroadcastSerializationCache()
+    obj = PollResultsToFormat(id=5, results=[], total_voters=1)
+
+    voter1 = _write_with_votes(cache, obj, 1, {5: {1}})
+    voter2 = _write_with_votes(cache, obj, 2, {5: {1}})
+    assert voter1 is voter2
+
+
+@pytest.mark.asyncio
+async def test_broadcast_cache_poll_results_for_voters_and_non_voters() -> None:
+    cache = BroadcastSerializationCache()
+    obj = PollResultsToFormat(id=5, results=[], total_voters=1)
+
+    results = [
+        PollResults.read_buffer(_write_with_votes(cache, obj, user_id, votes))
+        for user_id, votes in ((1, {5: {1}}), (2, {}), (3, {5: {2}}), (4, {}))
+    ]
+    assert [result.min for result in results] == [False, True, False, True]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_cache_does_not_share_bytes_for_participants() -> None:
+    cache = BroadcastSerializationCache()
+    obj = PollResultsToFormat(id=5, results=[], total_voters=1)
+
+    values = ContextValues()
+    values.chat_participants[1] = SimpleNamespace()
+    assert BroadcastSerializationCache._key(("values",), 201, 1, 1, values) is None
+
+    values.poll_answers[5] = {1}
+    first = cache.write(obj, _session(1), values)
+    second = cache.write(obj, _session(2), values)
+    assert first == second
+    assert first is not second
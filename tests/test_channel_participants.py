@@ -0,0 +1,146 @@
+import pytest
+from pyrogram.enums import ChatMembersFilter
+from pyrogram.raw.functions.channels import GetParticipants
+from pyrogram.raw.types import UpdateChannel, ChannelParticipantsRecent, ChannelParticipantsAdmins
+from pyrogram.raw.types.channels import ChannelParticipants
+from pyrogram.types import ChatPrivileges, ChatPermissions, ChatMember
+from pyrogram.utils import get_channel_id
+
+from piltover.db.models import Channel
+from tests.client import TestClient
+from tests.conftest import ChannelWithClientsFactory, ClientFactory
+
+
+async def _channel_counts(channel_id: int) -> tuple[int, int, int, int, int]:
+    channel = await Channel.get(id=Channel.norm_id(get_channel_id(channel_id)))
+    return (
+        channel.participants_count, channel.admins_count, channel.bots_count, channel.banned_count,
+        channel.kicked_count,
+    )
+
+
+async def _assert_counts_match_participants(channel_id: int) -> tuple[int, int, int, int, int]:
+    counts = await _channel_counts(channel_id)
+    channel = await Channel.get(id=Channel.norm_id(get_channel_id(channel_id)))
+    await channel.sync_participants_counts(False)
+    assert await _channel_counts(channel_id) == counts
+    return counts
+
+
+@pytest.mark.asyncio
+async def test_channel_participants_counts(
+        channel_with_clients: ChannelWithClientsFactory, client_with_auth: ClientFactory,
+) -> None:
+    channel, (client1,) = await channel_with_clients(supergroup=True, clients_run=True, resolve_channel=True)
+    client2 = await client_with_auth(run=True)
+    client3 = await client_with_auth(run=True)
+
+    user2 = await client1.resolve_user(client2)
+    user3 = await client1.resolve_user(client3)
+
+    assert await _assert_counts_match_participants(channel.id) == (1, 1, 0, 0, 0)
+
+    invite_link = await channel.export_invite_link()
+    await client2.join_chat(invite_link)
+    await client2.expect_update(UpdateChannel)
+    await client3.join_chat(invite_link)
+    await client3.expect_update(UpdateChannel)
+    assert await _assert_counts_match_participants(channel.id) == (3, 1, 0, 0, 0)
+
+    assert await client1.promote_chat_member(channel.id, user2.id, ChatPrivileges(can_pin_messages=True))
+    assert await _assert_counts_match_participants(channel.id) == (3, 2, 0, 0, 0)
+
+    assert await client1.promote_chat_member(channel.id, user2.id, ChatPrivileges(can_manage_chat=False))
+    assert await _assert_counts_match_participants(channel.id) == (3, 1, 0, 0, 0)
+
+    await client1.restrict_chat_member(channel.id, user3.id, ChatPermissions(can_send_messages=False))
+    assert await _assert_counts_match_participants(channel.id) == (3, 1, 0, 1, 0)
+
+    await client1.ban_chat_member(channel.id, user3.id)
+    await client3.expect_update(UpdateChannel)
+    assert await _assert_counts_match_participants(channel.id) == (2, 1, 0, 0, 1)
+
+    await client1.unban_chat_member(channel.id, user3.id)
+    assert await _assert_counts_match_participants(channel.id) == (2, 1, 0, 0, 0)
+
+    await client2.leave_chat(channel.id)
+    await client2.expect_update(UpdateChannel)
+    assert await _assert_counts_match_participants(channel.id) == (1, 1, 0, 0, 0)
+
+    await client2.join_chat(invite_link)
+    await client2.expect_update(UpdateChannel)
+    assert await _assert_counts_match_participants(channel.id) == (2, 1, 0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_channel_participants_counts_on_invite(
+        channel_with_clients: ChannelWithClientsFactory, client_with_auth: ClientFactory,
+) -> None:
+    channel, (client1,) = await channel_with_clients(supergroup=True, clients_run=True, resolve_channel=True)
+    client2 = await client_with_auth(run=True)
+    client3 = await client_with_auth(run=True)
+
+    user2 = await client1.resolve_user(client2)
+    user3 = await client1.resolve_user(client3)
+
+    await client1.add_chat_members(channel.id, [user2.id, user3.id])
+    assert await _assert_counts_match_participants(channel.id) == (3, 1, 0, 0, 0)
+    assert await client1.get_chat_members_count(channel.id) == 3
+
+    await client1.add_chat_members(channel.id, [user2.id])
+    assert await _assert_counts_match_participants(channel.id) == (3, 1, 0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_get_channel_participants_pages(channel_with_clients: ChannelWithClientsFactory) -> None:
+    channel, (client1, *clients) = await channel_with_clients(
+        5, supergroup=True, clients_run=True, resolve_channel=True,
+    )
+
+    user_ids = {(await client.get_me()).id for client in (client1, *clients)}
+
+    participants: list[ChatMember] = [participant async for participant in client1.get_chat_members(channel.id)]
+    assert {participant.user.id for participant in participants} == user_ids
+
+    participants = [participant async for participant in client1.get_chat_members(channel.id, limit=2)]
+    assert len(participants) == 2
+
+    admins: list[ChatMember] = [
+        participant async for participant in client1.get_chat_members(
+            channel.id, filter=ChatMembersFilter.ADMINISTRATORS,
+        )
+    ]
+    assert [admin.user.id for admin in admins] == [(await client1.get_me()).id]
+
+
+async def _get_participants(client: TestClient, channel_id: int, admins: bool) -> ChannelParticipants:
+    return await client.invoke(GetParticipants(
+        channel=await client.resolve_peer(channel_id),
+        filter=ChannelParticipantsAdmins() if admins else ChannelParticipantsRecent(),
+        offset=0,
+        limit=100,
+        hash=0,
+    ))
+
+
+@pytest.mark.asyncio
+async def test_get_channel_participants_count_without_anonymous_admins(
+        channel_with_clients: ChannelWithClientsFactory,
+) -> None:
+    channel, (client1, client2, client3) = await channel_with_clients(
+        3, supergroup=True, clients_run=True, resolve_channel=True,
+    )
+
+    user2 = await client1.resolve_user(client2)
+    assert await client1.promote_chat_member(
+        channel.id, user2.id, ChatPrivileges(can_pin_messages=True, is_anonymous=True),
+    )
+
+    for admins, count in ((False, 3), (True, 2)):
+        participants = await _get_participants(client1, channel.id, admins)
+        assert participants.count == len(participants.participants) == count
+
+    for admins, count in ((False, 2), (True, 1)):
+        participants = await _get_participants(client3, channel.id, admins)
+        assert participants.count == len(participants.participants) == count
+        assert user2.id not in {user.id for user in participants.users}
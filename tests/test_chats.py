@@ -6,13 +6,16 @@ import pytest
 from PIL import Image
 from pyrogram.errors import PeerIdInvalid, ChatAdminRequired, Forbidden, UsersTooMuch, BadRequest, RPCError
 from pyrogram.raw.functions.messages import EditChatAdmin, GetDialogs, MigrateChat
+from pyrogram.raw.functions.updates import GetState
 from pyrogram.raw.types import UpdateUserName, UpdateNewMessage, MessageService, MessageActionChatMigrateTo, \
     UpdateNewChannelMessage, InputPrivacyKeyChatInvite, InputPrivacyValueAllowUsers, InputPrivacyValueAllowAll
 from pyrogram.raw.types.messages import Dialogs
 from pyrogram.utils import get_channel_id
 
 from piltover.config import APP_CONFIG
+from piltover.session import SessionManager
 from piltover.tl import InputPeerEmpty
+from piltover.tl.types.internal import MessageToEachUser
 from tests.client import TestClient
 from tests.conftest import ClientFactory
 from tests.utils import color_is_near
@@ -378,3 +381,50 @@ async def test_set_new_chat_creator_when_creator_left(client_with_auth: ClientFa
 
     group2 = await client2.get_chat(group.id)
     assert group2.is_creator
+
+
+@pytest.mark.asyncio
+async def test_basic_group_message_sent_to_each_user_once(
+        client_with_auth: ClientFactory, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client1 = await client_with_auth(run=True)
+    client2 = await client_with_auth(run=True)
+    client3 = await client_with_auth(run=True)
+
+    user2 = await client1.resolve_user(client2)
+    user3 = await client1.resolve_user(client3)
+    group = await client1.create_group("idk", [user2.id, user3.id])
+
+    # Recipients get their own message ids and pts, so they are shifted by sending some messages to client2 only
+    for _ in range(3):
+        await client1.send_message(user2.id, "test")
+    for client in (client1, client2, client3):
+        client.clear_updates(UpdateNewMessage)
+
+    sent_to_each_user: list[MessageToEachUser] = []
+    broker_send = SessionManager.broker.send
+
+    async def _send(message) -> None:
+        if isinstance(message, MessageToEachUser):
+            sent_to_each_user.append(message)
+        await broker_send(message)
+
+    monkeypatch.setattr(SessionManager.broker, "send", _send)
+
+    await client1.send_message(group.id, "test group message")
+
+    assert len(sent_to_each_user) == 1
+    assert set(sent_to_each_user[0].users) == {(await client1.get_me()).id, user2.id, user3.id}
+
+    updates = {}
+    for client in (client2, client3):
+        update = await client.expect_update(UpdateNewMessage)
+        assert update.message.message == "test group message"
+        assert update.pts == (await client.invoke(GetState())).pts
+
+        last_message = [message async for message in client.get_chat_history(group.id, limit=1)][0]
+        assert update.message.id == last_message.id
+        updates[client] = update
+
+    assert updates[client2].message.id != updates[client3].message.id
+    assert updates[client2].pts != updates[client3].pts
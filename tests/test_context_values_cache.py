@@ -0,0 +1,71 @@
+import pytest
+from pyrogram.raw.functions.channels import GetChannels
+from pyrogram.raw.types import InputPrivacyKeyPhoneNumber, InputPrivacyValueAllowAll, InputPrivacyValueDisallowAll, \
+    ChatAdminRights
+from pyrogram.types import ChatPrivileges
+
+from tests.client import TestClient
+from tests.conftest import ChannelWithClientsFactory
+
+CHECK_PHONE_NUMBER = "123456789"
+
+
+# Users, channels and their participants are resolved (and cached) by gateway for every session they are sent to,
+#  so every request below is made twice: change must be visible right after it is made, and must not be lost
+#  after being cached again
+
+
+@pytest.mark.asyncio
+async def test_context_values_after_contact_change() -> None:
+    async with TestClient(phone_number="123456780") as client1, TestClient(phone_number="123456781") as client2:
+        user2 = await client1.resolve_user(client2)
+        real_name = user2.first_name
+
+        for _ in range(2):
+            assert (await client1.get_users(user2.id)).first_name == real_name
+
+        await client1.add_contact(user2.id, "Contact Name")
+        for _ in range(2):
+            assert (await client1.get_users(user2.id)).first_name == "Contact Name"
+
+        await client1.delete_contacts(user2.id)
+        for _ in range(2):
+            assert (await client1.get_users(user2.id)).first_name == real_name
+
+
+@pytest.mark.asyncio
+async def test_context_values_after_privacy_change() -> None:
+    async with (
+        TestClient(phone_number=CHECK_PHONE_NUMBER) as client1,
+        TestClient(phone_number="123456780") as client2,
+    ):
+        user1 = await client2.resolve_user(client1)
+
+        await client1.set_privacy(key=InputPrivacyKeyPhoneNumber(), rules=[InputPrivacyValueDisallowAll()])
+        for _ in range(2):
+            assert (await client2.get_users(user1.id)).phone_number is None
+
+        await client1.set_privacy(key=InputPrivacyKeyPhoneNumber(), rules=[InputPrivacyValueAllowAll()])
+        for _ in range(2):
+            assert (await client2.get_users(user1.id)).phone_number == CHECK_PHONE_NUMBER
+
+
+@pytest.mark.asyncio
+async def test_context_values_after_participant_change(channel_with_clients: ChannelWithClientsFactory) -> None:
+    channel, (client1, client2) = await channel_with_clients(
+        2, supergroup=True, clients_run=True, resolve_channel=True,
+    )
+
+    async def _admin_rights() -> ChatAdminRights | None:
+        chats = await client2.invoke(GetChannels(id=[await client2.resolve_peer(channel.id)]))
+        return chats.chats[0].admin_rights
+
+    for _ in range(2):
+        assert await _admin_rights() is None
+
+    user2 = await client1.resolve_user(client2)
+    assert await client1.promote_chat_member(channel.id, user2.id, ChatPrivileges(can_pin_messages=True))
+    for _ in range(2):
+        rights = await _admin_rights()
+        assert rights is not None
+        assert rights.pin_messages
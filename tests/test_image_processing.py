@@ -0,0 +1,94 @@
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageChops, ImageStat
+
+from piltover.app.utils.utils import _process_image, PHOTOSIZE_TO_INT, TELEGRAM_QUANTIZATION_TABLES
+
+# Sizes are resized from previous (larger) size and jpeg images are decoded with draft scaling,
+#  so pixels may differ slightly from image resized straight from the original
+MAX_MEAN_DIFFERENCE = 3
+
+
+def _make_image(path: Path, size: tuple[int, int], mode: str, image_format: str) -> str:
+    width, height = size
+    img = Image.linear_gradient("L").resize(size)
+    channels = [img, img.transpose(Image.Transpose.FLIP_LEFT_RIGHT), img.transpose(Image.Transpose.ROTATE_90)]
+    if mode == "RGBA":
+        channels.append(Image.new("L", size, 200))
+    img = Image.merge(mode, [channel.resize((width, height)) for channel in channels])
+
+    location = str(path / f"image.{image_format.lower()}")
+    img.save(location, format=image_format)
+    return location
+
+
+def _resize_from_original(location: str, to_size: int, force_resize: bool) -> tuple[bytes, int, int] | None:
+    img = Image.open(location)
+    img.load()
+
+    width, height = img.size
+    factor = to_size / max(width, height)
+    if factor > 1 and not force_resize:
+        return None
+
+    if width >= height:
+        width, height = to_size, int(height * factor)
+    else:
+        width, height = int(width * factor), to_size
+
+    out = BytesIO()
+    img.resize((width, height)).save(out, format="PNG" if img.mode == "RGBA" else "JPEG")
+    return out.getvalue(), width, height
+
+
+def _stripped_from_original(location: str, size: int) -> bytes:
+    out = BytesIO()
+    Image.open(location).convert("RGB").resize((size, size)).save(out, "JPEG", qtables=TELEGRAM_QUANTIZATION_TABLES)
+    return out.getvalue()[623:]
+
+
+def _decode_stripped(stripped: bytes, size: int) -> Image.Image:
+    # Header of stripped thumbnail is the same for all thumbnails of the same size
+    header = BytesIO()
+    Image.new("RGB", (size, size)).save(header, "JPEG", qtables=TELEGRAM_QUANTIZATION_TABLES)
+    return Image.open(BytesIO(header.getvalue()[:623] + stripped)).convert("RGB")
+
+
+def _mean_difference(first: Image.Image, second: Image.Image) -> float:
+    first, second = first.convert("RGB"), second.convert("RGB")
+    return max(ImageStat.Stat(ImageChops.difference(first, second)).mean)
+
+
+@pytest.mark.parametrize(
+    ("size", "mode", "image_format"),
+    [((1000, 700), "RGB", "JPEG"), ((300, 900), "RGB", "JPEG"), ((500, 400), "RGBA", "PNG")],
+)
+@pytest.mark.asyncio
+async def test_process_image_matches_resizing_from_original(
+        tmp_path: Path, size: tuple[int, int], mode: str, image_format: str,
+) -> None:
+    location = _make_image(tmp_path, size, mode, image_format)
+    sizes = [(PHOTOSIZE_TO_INT[photo_size], idx == 0) for idx, photo_size in enumerate("smxyw")]
+
+    width, height, resized, stripped, _ = _process_image(location, sizes, None, 8)
+    assert (width, height) == size
+
+    for (to_size, force_resize), resized_image in zip(sizes, resized):
+        expected = _resize_from_original(location, to_size, force_resize)
+        if expected is None:
+            assert resized_image is None
+            continue
+
+        assert resized_image is not None
+        assert resized_image[1:] == expected[1:]
+
+        actual_img, expected_img = Image.open(BytesIO(resized_image[0])), Image.open(BytesIO(expected[0]))
+        assert actual_img.format == expected_img.format
+        assert actual_img.size == expected_img.size
+        assert _mean_difference(actual_img, expected_img) < MAX_MEAN_DIFFERENCE
+
+    expected_stripped = _stripped_from_original(location, 8)
+    assert _mean_difference(_decode_stripped(stripped, 8), _decode_stripped(expected_stripped, 8)) \
+           < MAX_MEAN_DIFFERENCE
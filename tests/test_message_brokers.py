@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from piltover.auth_data import AuthData
+from piltover.message_brokers.base_broker import BrokerType
+from piltover.session import Session
+
+pytest.importorskip("aio_pika")
+
+from piltover.message_brokers.rabbitmq_broker import RabbitMqMessageBroker, BROADCAST_ROUTING_KEY
+
+
+class _FakeQueue:
+    def __init__(self) -> None:
+        self.bound = {BROADCAST_ROUTING_KEY}
+
+    async def bind(self, exchange: str, routing_key: str) -> None:
+        self.bound.add(routing_key)
+
+    async def unbind(self, exchange: str, routing_key: str) -> None:
+        self.bound.remove(routing_key)
+
+
+def _session(session_id: int, user_id: int, key_id: int, auth_id: int, channel_ids: set[int]) -> Session:
+    session = Session(session_id, None, AuthData(key_id, b"\x00" * 256, key_id))
+    session.user_id = user_id
+    session.auth_id = auth_id
+    session.channel_ids = channel_ids
+    return session
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_routing_keys_bound_and_unbound() -> None:
+    broker = RabbitMqMessageBroker(BrokerType.READ, "amqp://127.0.0.1/")
+    queue = broker._queue = _FakeQueue()
+    broker._bind_task = asyncio.create_task(broker._process_bindings())
+
+    try:
+        session1 = _session(1, 10, 20, 30, {40})
+        session2 = _session(2, 10, 21, 31, {40, 41})
+
+        broker.subscribe(session1)
+        await broker.wait_subscribed()
+        assert queue.bound == {BROADCAST_ROUTING_KEY, "user.10", "key.20", "auth.30", "channel.40"}
+
+        broker.subscribe(session2)
+        await broker.wait_subscribed()
+        assert queue.bound == {
+            BROADCAST_ROUTING_KEY, "user.10", "key.20", "key.21", "auth.30", "auth.31", "channel.40", "channel.41",
+        }
+
+        # Routing keys are unbound only when last session that needs them unsubscribes
+        broker.unsubscribe(session1)
+        await broker.wait_subscribed()
+        assert queue.bound == {BROADCAST_ROUTING_KEY, "user.10", "key.21", "auth.31", "channel.40", "channel.41"}
+
+        broker.channels_diff_update(session2, [41], [])
+        session2.channel_ids = {40}
+        await broker.wait_subscribed()
+        assert queue.bound == {BROADCAST_ROUTING_KEY, "user.10", "key.21", "auth.31", "channel.40"}
+
+        # Bindings are applied in order, so quick unsubscribe and subscribe leaves keys bound
+        broker.unsubscribe(session2)
+        broker.subscribe(session2)
+        await broker.wait_subscribed()
+        assert queue.bound == {BROADCAST_ROUTING_KEY, "user.10", "key.21", "auth.31", "channel.40"}
+
+        broker.unsubscribe(session2)
+        await broker.wait_subscribed()
+        assert queue.bound == {BROADCAST_ROUTING_KEY}
+    finally:
+        broker._bind_task.cancel()
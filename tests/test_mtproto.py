@@ -1,13 +1,22 @@
+import asyncio
+import hashlib
+from os import urandom
 from time import time
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
+from mtproto import ConnectionRole
 from pyrogram.errors import BadRequest
 from pyrogram.raw.core import TLObject, FutureSalts
 from pyrogram.raw.functions import GetFutureSalts
+from pyrogram.raw.functions.contacts import ResolveUsername
 from pyrogram.session import Auth
 
+from piltover.auth_data import AuthData
+from piltover.gateway.client import Client, MAX_CONTAINER_MESSAGES, MAX_CONTAINER_SIZE
+from piltover.session import Session
+from piltover.tl import Int, Long, MsgContainer
 from tests.client import TestClient
 from tests.conftest import ClientFactory
 
@@ -34,6 +43,20 @@ async def test_invalid_method(client_with_auth: ClientFactory) -> None:
         await client.invoke(InvalidObject())
 
 
+@pytest.mark.asyncio
+async def test_truncated_method(client_with_auth: ClientFactory) -> None:
+    class TruncatedObject(TLObject):
+        def write(self, *args: Any) -> bytes:
+            return ResolveUsername(username="a" * 300).write()[:8]
+
+    client = await client_with_auth(run=True)
+
+    with pytest.raises(BadRequest, match="INPUT_METHOD_INVALID_0_"):
+        await client.invoke(TruncatedObject())
+
+    assert await client.get_me()
+
+
 @pytest.mark.real_key_gen
 @pytest.mark.asyncio
 async def test_get_future_salts() -> None:
@@ -79,3 +102,41 @@ async def test_get_future_salts_upper_limit() -> None:
         salts = await client.invoke(GetFutureSalts(num=65))
         assert isinstance(salts, FutureSalts)
         assert len(salts.salts) == 64
+
+
+async def _pack_queued(messages: list[bytes]) -> list[bytes]:
+    auth_key = urandom(256)
+    auth_key_id = Long.read_bytes(hashlib.sha1(auth_key).digest()[-8:])
+    session = Session(1, None, AuthData(auth_key_id, auth_key, auth_key_id))
+    for data in messages:
+        session.message_queue.put_nowait((session.msg_id(in_reply=False), 0, data))
+
+    client = Client.__new__(Client)
+    client.server = SimpleNamespace(encryption_executor=None, salt_key=urandom(32))
+    client.loop = asyncio.get_running_loop()
+
+    packets = await client._pack_and_encrypt_queued(session)
+    return [packet.decrypt(auth_key, ConnectionRole.SERVER).data for packet in packets]
+
+
+def _container_size(data: bytes) -> int | None:
+    if data[:4] != Int.write(MsgContainer.tlid(), False):
+        return None
+    return Int.read_bytes(data[4:8])
+
+
+@pytest.mark.asyncio
+async def test_queued_messages_split_by_container_messages_limit() -> None:
+    packets = await _pack_queued([urandom(8) for _ in range(MAX_CONTAINER_MESSAGES + 5)])
+    assert [_container_size(data) for data in packets] == [MAX_CONTAINER_MESSAGES, 5]
+
+
+@pytest.mark.asyncio
+async def test_queued_messages_split_by_container_size_limit() -> None:
+    message_size = MAX_CONTAINER_SIZE // 3 - 1024
+    big_message = urandom(MAX_CONTAINER_SIZE)
+    packets = await _pack_queued([urandom(message_size) for _ in range(5)] + [big_message, urandom(8)])
+
+    # Message that doesn't fit into container with other messages is sent on its own
+    assert [_container_size(data) for data in packets] == [3, 2, None, None]
+    assert packets[2] == big_message
@@ -0,0 +1,79 @@
+from datetime import datetime, UTC, timedelta
+
+import pytest
+from pyrogram.raw.functions.account import UpdateStatus
+from pyrogram.raw.functions.contacts import GetStatuses
+from pyrogram.raw.types import UserStatusOnline
+
+from piltover.db.enums import UserStatus
+from piltover.db.models import Presence, User
+from tests.conftest import ClientFactory
+
+
+async def _create_users(count: int) -> list[User]:
+    return [await User.create(phone_number=f"12345678{num}", first_name=f"user{num}") for num in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_presence_get_many_and_count_online_with_pending(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Presence, "FLUSH_DELAY", 60)
+    user1, user2, user3 = await _create_users(3)
+    await Presence.create(user=user1, status=UserStatus.OFFLINE, last_seen=datetime.now(UTC) - timedelta(days=1))
+    await Presence.create(user=user3, status=UserStatus.ONLINE, last_seen=datetime.now(UTC))
+
+    await Presence.update_to_now(user1)
+    await Presence.update_to_now(user2)
+
+    presences = {presence.user_id: presence for presence in await Presence.get_many([user1.id, user2.id, user3.id])}
+    assert set(presences) == {user1.id, user2.id, user3.id}
+    assert all(presence.status is UserStatus.ONLINE and presence.is_online() for presence in presences.values())
+
+    since = datetime.now(UTC) - timedelta(minutes=1)
+    user_ids = User.filter(id__in=[user1.id, user2.id, user3.id]).values_list("id", flat=True)
+    assert await Presence.count_online(user_ids, since) == 3
+
+    await Presence.update_to_now(user3, UserStatus.OFFLINE)
+    assert await Presence.count_online(user_ids, since) == 2
+
+    Presence.reset()
+
+
+@pytest.mark.asyncio
+async def test_presence_failed_flush_is_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Presence, "FLUSH_DELAY", 60)
+    user, = await _create_users(1)
+    await Presence.update_to_now(user)
+
+    async def _failing_bulk_create(*args, **kwargs) -> None:
+        raise RuntimeError("database is unavailable")
+
+    with monkeypatch.context() as m:
+        m.setattr(Presence, "bulk_create", _failing_bulk_create)
+        await Presence.flush()
+
+    assert Presence.pending_last_seen(user.id) is not None
+    assert not await Presence.filter(user=user).exists()
+
+    await Presence.flush()
+    assert Presence.pending_last_seen(user.id) is None
+    assert (await Presence.get(user=user)).status is UserStatus.ONLINE
+
+    Presence.reset()
+
+
+@pytest.mark.asyncio
+async def test_get_statuses_with_pending_presence(
+        client_with_auth: ClientFactory, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(Presence, "FLUSH_DELAY", 60)
+    client1 = await client_with_auth(run=True)
+    client2 = await client_with_auth(run=True)
+
+    user2 = await client1.resolve_user(client2)
+    await client1.add_contact(user2.id, "idk")
+
+    assert await client2.invoke(UpdateStatus(offline=False))
+    assert not await Presence.filter(user_id=user2.id).exists()
+
+    statuses = {status.user_id: status.status for status in await client1.invoke(GetStatuses())}
+    assert isinstance(statuses[user2.id], UserStatusOnline)
@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from piltover.db.models import State, User
+from tests.conftest import ClientFactory
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pts_allocation_is_unique_and_contiguous(client_with_auth: ClientFactory) -> None:
+    users = [await User.get(phone_number=(await client_with_auth()).phone_number) for _ in range(2)]
+    start = {user.id: (await State.get(user=user)).pts for user in users}
+
+    single = [State.add_pts(users[0], 2) for _ in range(10)]
+    bulk = [State.add_pts_bulk(users, [1, 3]) for _ in range(10)]
+    results = await asyncio.gather(*single, *bulk)
+
+    # Every allocation returns last pts of its own range
+    ranges: dict[int, list[tuple[int, int]]] = {user.id: [] for user in users}
+    for new_pts in results[:10]:
+        ranges[users[0].id].append((new_pts - 1, new_pts))
+    for new_pts1, new_pts2 in results[10:]:
+        ranges[users[0].id].append((new_pts1, new_pts1))
+        ranges[users[1].id].append((new_pts2 - 2, new_pts2))
+
+    for user in users:
+        allocated = [pts for first, last in ranges[user.id] for pts in range(first, last + 1)]
+        assert sorted(allocated) == list(range(start[user.id] + 1, start[user.id] + len(allocated) + 1))
+        assert (await State.get(user=user)).pts == start[user.id] + len(allocated)
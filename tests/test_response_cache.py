@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+from pyrogram.emoji import THUMBS_UP, THUMBS_DOWN
+from pyrogram.raw.functions.help import GetConfig as PyroGetConfig
+from pyrogram.raw.functions.messages import SetDefaultReaction
+from pyrogram.raw.types import ReactionEmoji
+
+from piltover.session.response_cache import ResponseCache
+from piltover.tl.core_types import RpcResult
+from piltover.tl.functions.help import GetConfig, GetAppConfig
+from piltover.tl.types.help import CountriesListNotModified
+from tests.client import TestClient
+from tests.test_reactions import skip_reactions_test
+
+
+def _session(user_id: int) -> SimpleNamespace:
+    return SimpleNamespace(user_id=user_id, auth_id=user_id, layer=201, is_bot=False, mfa_pending=False)
+
+
+@pytest.mark.asyncio
+async def test_response_cache_hit() -> None:
+    ResponseCache.reset()
+    calls = 0
+
+    async def fetch() -> RpcResult:
+        nonlocal calls
+        calls += 1
+        return RpcResult(req_msg_id=1, result=CountriesListNotModified())
+
+    session = _session(1)
+    key = ResponseCache.make_key(GetAppConfig(hash=0), session)
+
+    first = await ResponseCache.get_or_fetch(key, 1, session, fetch)
+    second = await ResponseCache.get_or_fetch(key, 2, session, fetch)
+    assert calls == 1
+    assert first.req_msg_id == 1
+    assert second.req_msg_id == 2
+    assert second.result.data == CountriesListNotModified().write()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_get_config_key_is_per_user() -> None:
+    ResponseCache.reset()
+
+    assert ResponseCache.make_key(GetConfig(), _session(1)) != ResponseCache.make_key(GetConfig(), _session(2))
+    assert ResponseCache.make_key(GetAppConfig(hash=0), _session(1)) \
+           == ResponseCache.make_key(GetAppConfig(hash=0), _session(2))
+
+    async def fetch() -> RpcResult:
+        return RpcResult(req_msg_id=1, result=CountriesListNotModified())
+
+    key1 = ResponseCache.make_key(GetConfig(), _session(1))
+    key2 = ResponseCache.make_key(GetConfig(), _session(2))
+    await ResponseCache.get_or_fetch(key1, 1, _session(1), fetch)
+    await ResponseCache.get_or_fetch(key2, 1, _session(2), fetch)
+
+    ResponseCache.invalidate(1)
+    assert key1 not in ResponseCache._entries
+    assert key2 in ResponseCache._entries
+
+
+@skip_reactions_test
+@pytest.mark.create_reactions
+@pytest.mark.asyncio
+async def test_get_config_after_set_default_reaction() -> None:
+    async with TestClient(phone_number="123456789") as client:
+        for emoticon in (THUMBS_UP, THUMBS_DOWN):
+            assert await client.invoke(SetDefaultReaction(reaction=ReactionEmoji(emoticon=emoticon)))
+            config = await client.invoke(PyroGetConfig())
+            assert config.reactions_default == ReactionEmoji(emoticon=emoticon)
+            # Second request is answered from gateway cache
+            config = await client.invoke(PyroGetConfig())
+            assert config.reactions_default == ReactionEmoji(emoticon=emoticon)
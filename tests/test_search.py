@@ -0,0 +1,146 @@
+from contextlib import AsyncExitStack
+
+import pytest
+from pyrogram.enums import MessagesFilter
+from pyrogram.raw.functions.contacts import Search
+from pyrogram.raw.types import PeerUser, PeerChannel
+from pyrogram.utils import get_channel_id
+
+from tests.client import TestClient
+
+
+@pytest.mark.asyncio
+async def test_search_messages_by_word_prefix() -> None:
+    async with TestClient(phone_number="123456789") as client:
+        await client.send_message("me", "Hello world")
+        await client.send_message("me", "hello there")
+        await client.send_message("me", "nothing to see")
+
+        found = [message.text async for message in client.search_messages("me", query="hel")]
+        assert sorted(found) == ["Hello world", "hello there"]
+
+        found = [message.text async for message in client.search_messages("me", query="hello wor")]
+        assert found == ["Hello world"]
+
+        found = [message.text async for message in client.search_messages("me", query="world nothing")]
+        assert found == []
+
+
+@pytest.mark.asyncio
+async def test_search_messages_only_in_requested_peer(exit_stack: AsyncExitStack) -> None:
+    client1: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="123456789"))
+    client2: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="1234567890"))
+
+    await client2.set_username("test2_username")
+    await client1.get_users("test2_username")
+
+    await client1.send_message("me", "hello from saved messages")
+    await client1.send_message("test2_username", "hello from private chat")
+
+    found = [message.text async for message in client1.search_messages("me", query="hello")]
+    assert found == ["hello from saved messages"]
+
+    found = [message.text async for message in client1.search_messages("test2_username", query="hello")]
+    assert found == ["hello from private chat"]
+
+    found = [message.text async for message in client1.search_global(query="hello")]
+    assert sorted(found) == ["hello from private chat", "hello from saved messages"]
+
+    found = [message.text async for message in client2.search_global(query="hello")]
+    assert found == ["hello from private chat"]
+
+
+@pytest.mark.asyncio
+async def test_search_messages_after_edit() -> None:
+    async with TestClient(phone_number="123456789") as client:
+        message = await client.send_message("me", "first version")
+
+        assert [msg.id async for msg in client.search_messages("me", query="first")] == [message.id]
+
+        await message.edit("second version")
+
+        assert [msg.id async for msg in client.search_messages("me", query="first")] == []
+        assert [msg.id async for msg in client.search_messages("me", query="second")] == [message.id]
+
+
+@pytest.mark.asyncio
+async def test_search_messages_deleted_only_for_one_side(exit_stack: AsyncExitStack) -> None:
+    client1: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="123456789"))
+    client2: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="1234567890"))
+
+    await client1.set_username("test1_username")
+    await client2.set_username("test2_username")
+    await client1.get_users("test2_username")
+    await client2.get_users("test1_username")
+
+    await client1.send_message("test2_username", "hello there")
+    message2 = [message async for message in client2.search_messages("test1_username", query="hello")]
+    assert len(message2) == 1
+
+    await client2.delete_messages("test1_username", [message2[0].id], revoke=False)
+
+    assert [message async for message in client2.search_messages("test1_username", query="hello")] == []
+    assert len([message async for message in client1.search_messages("test2_username", query="hello")]) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_messages_with_urls() -> None:
+    async with TestClient(phone_number="123456789") as client:
+        message = await client.send_message("me", "look at https://example.com")
+        await client.send_message("me", "no links here")
+
+        found = [msg.id async for msg in client.search_messages("me", filter=MessagesFilter.URL)]
+        assert found == [message.id]
+
+
+@pytest.mark.asyncio
+async def test_contacts_search_by_name_prefix_only_in_contacts(exit_stack: AsyncExitStack) -> None:
+    client1: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="123456789"))
+    client2: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="1234567890"))
+
+    await client2.update_profile(first_name="Somebody", last_name="Unique")
+    await client2.set_username("test2_username")
+    user2 = await client1.get_users("test2_username")
+
+    result = await client1.invoke(Search(q="somebo uniq", limit=10))
+    assert result.my_results == []
+
+    await client1.add_contact(user2.id, first_name="Somebody", last_name="Unique")
+
+    result = await client1.invoke(Search(q="somebo uniq", limit=10))
+    assert result.my_results == [PeerUser(user_id=user2.id)]
+
+
+@pytest.mark.asyncio
+async def test_contacts_search_after_username_change(exit_stack: AsyncExitStack) -> None:
+    client1: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="123456789"))
+    client2: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="1234567890"))
+
+    await client2.set_username("test2_old")
+    me2 = await client2.get_me()
+
+    result = await client1.invoke(Search(q="test2_o", limit=10))
+    assert result.results == [PeerUser(user_id=me2.id)]
+
+    await client2.set_username("test2_new")
+
+    result = await client1.invoke(Search(q="test2_o", limit=10))
+    assert result.results == []
+    result = await client1.invoke(Search(q="test2_n", limit=10))
+    assert result.results == [PeerUser(user_id=me2.id)]
+
+
+@pytest.mark.asyncio
+async def test_contacts_search_public_channel_by_title(exit_stack: AsyncExitStack) -> None:
+    client1: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="123456789"))
+    client2: TestClient = await exit_stack.enter_async_context(TestClient(phone_number="1234567890"))
+
+    channel = await client2.create_channel("Interesting Channel Title")
+
+    result = await client1.invoke(Search(q="interest", limit=10))
+    assert result.results == []
+
+    assert await client2.set_chat_username(channel.id, "test_public_channel")
+
+    result = await client1.invoke(Search(q="interest titl", limit=10))
+    assert result.results == [PeerChannel(channel_id=get_channel_id(channel.id))]
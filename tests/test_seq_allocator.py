@@ -0,0 +1,38 @@
+import pytest
+
+from piltover.db.models import UserAuthorization
+from piltover.session.seq_allocator import SeqAllocator
+from tests.conftest import ClientFactory
+
+
+@pytest.mark.asyncio
+async def test_seq_blocks_after_flush_and_restart(
+        client_with_auth: ClientFactory, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = await client_with_auth()
+    auth = await UserAuthorization.get(user__phone_number=client.phone_number)
+    reserved = auth.upd_seq_reserved
+
+    monkeypatch.setattr(SeqAllocator, "BLOCK_SIZE", 5)
+    SeqAllocator.reset()
+
+    # Second block is reserved right after first one is used up
+    seqs = [await SeqAllocator.next_seq(auth.id) for _ in range(7)]
+    assert seqs == list(range(reserved + 1, reserved + 8))
+
+    await SeqAllocator.flush()
+    await auth.refresh_from_db()
+    assert auth.upd_seq == seqs[-1]
+    assert auth.upd_seq_reserved == reserved + 10
+
+    # Unused numbers of reserved block are skipped after restart, seq never goes back
+    SeqAllocator.reset()
+    seq = await SeqAllocator.next_seq(auth.id)
+    assert seq == reserved + 11
+
+    await SeqAllocator.flush_auth(auth.id)
+    await auth.refresh_from_db()
+    assert auth.upd_seq == seq
+    assert auth.upd_seq_reserved == reserved + 15
+
+    SeqAllocator.reset()
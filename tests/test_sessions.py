@@ -0,0 +1,130 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from piltover.auth_data import AuthData
+from piltover.session import SessionManager
+from piltover.tl import UpdatesTooLong, UpdateShort, UpdateConfig
+from piltover.tl.types.internal import SessionResumed
+
+
+def _fake_client() -> SimpleNamespace:
+    return SimpleNamespace(message_available=asyncio.Event(), server=SimpleNamespace(serialization_executor=None))
+
+
+def _session(key_id: int, session_id: int):
+    client = _fake_client()
+    session, created = SessionManager.get_or_create(session_id, client, AuthData(key_id, b"\x00" * 256, key_id))
+    assert created
+    session.connect(client)
+    return session, client
+
+
+@pytest.mark.asyncio
+async def test_session_resume_resends_unacked() -> None:
+    session, client = _session(1, 1)
+
+    session.message_sent(10, 1, b"first")
+    session.message_sent(12, 3, b"second")
+    session.message_sent(14, 4, b"not-content-related")
+    assert list(session.unacked) == [10, 12]
+
+    session.ack([10])
+    assert list(session.unacked) == [12]
+
+    session.disconnect(client)
+    assert session.client is None
+    assert SessionManager.sessions[session.uniq_id()] is session
+    assert session.uniq_id() in SessionManager.detached
+
+    new_client = _fake_client()
+    resumed, created = SessionManager.get_or_create(1, new_client, session.auth_data)
+    assert resumed is session
+    assert not created
+
+    session.connect(new_client)
+    assert session.uniq_id() not in SessionManager.detached
+    assert not session.unacked
+    assert session.message_queue.get_nowait() == (12, 3, b"second")
+    assert new_client.message_available.is_set()
+
+    session.destroy()
+
+
+@pytest.mark.asyncio
+async def test_detached_sessions_limits() -> None:
+    SessionManager.configure(
+        SessionManager.max_queued_bytes, SessionManager.max_unacked_messages, SessionManager.resume_timeout,
+        max_detached_sessions=3, max_detached_sessions_per_key=2,
+    )
+
+    try:
+        sessions = [_session(1, session_id) for session_id in range(3)]
+        for session, client in sessions:
+            session.disconnect(client)
+
+        assert sessions[0][0].uniq_id() not in SessionManager.sessions
+        assert [session.uniq_id() for session in SessionManager.detached.values()] == [(1, 1), (1, 2)]
+
+        other_sessions = [_session(2, session_id) for session_id in range(2)]
+        for session, client in other_sessions:
+            session.disconnect(client)
+
+        assert [session.uniq_id() for session in SessionManager.detached.values()] == [(1, 2), (2, 0), (2, 1)]
+        assert (1, 1) not in SessionManager.sessions
+    finally:
+        for session in list(SessionManager.detached.values()):
+            session.destroy()
+        SessionManager.configure(
+            SessionManager.max_queued_bytes, SessionManager.max_unacked_messages, SessionManager.resume_timeout,
+        )
+
+
+@pytest.mark.asyncio
+async def test_session_resumed_elsewhere_drops_detached() -> None:
+    detached, detached_client = _session(1, 1)
+    connected, _ = _session(1, 2)
+    detached.message_sent(10, 1, b"first")
+    detached.disconnect(detached_client)
+
+    await SessionManager.broker._process_message(SessionResumed(key_id=1, session_id=1))
+    await SessionManager.broker._process_message(SessionResumed(key_id=1, session_id=2))
+
+    assert (1, 1) not in SessionManager.sessions
+    assert (1, 1) not in SessionManager.detached
+    assert not detached.unacked
+    assert SessionManager.sessions[(1, 2)] is connected
+
+    connected.destroy()
+
+
+def _drain(session) -> list[bytes]:
+    messages = []
+    while not session.message_queue.empty():
+        message_id, seq_no, data = session.message_queue.get_nowait()
+        session.message_sent(message_id, seq_no, data)
+        messages.append(data)
+    return messages
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_gets_updates_too_long_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    session, _ = _session(1, 1)
+    update = UpdateShort(update=UpdateConfig(), date=0)
+    monkeypatch.setattr(SessionManager, "max_queued_bytes", len(update.write()) * 3)
+
+    for _ in range(10):
+        await session.enqueue_update(update)
+
+    too_long = UpdatesTooLong().write()
+    messages = _drain(session)
+    assert messages == [update.write()] * 4 + [too_long]
+    assert session.queued_bytes == 0
+
+    # Client caught up, so next time it falls behind it gets updatesTooLong again
+    for _ in range(10):
+        await session.enqueue_update(update)
+    assert _drain(session) == [update.write()] * 4 + [too_long]
+
+    session.destroy()
@@ -0,0 +1,82 @@
+import pytest
+from pyrogram.raw.functions.messages import GetPeerDialogs
+from pyrogram.raw.types import InputDialogPeer, UpdateNewChannelMessage, UpdateNewMessage
+from pyrogram.raw.types.messages import PeerDialogs
+
+from piltover.db.enums import PeerType
+from piltover.db.models import Peer, ReadState, User
+from tests.client import TestClient
+from tests.conftest import ChannelWithClientsFactory, ClientFactory
+
+
+async def _unread_count(client: TestClient, chat_id: int) -> int:
+    dialogs: PeerDialogs = await client.invoke(GetPeerDialogs(
+        peers=[InputDialogPeer(peer=await client.resolve_peer(chat_id))],
+    ))
+    assert len(dialogs.dialogs) == 1
+    return dialogs.dialogs[0].unread_count
+
+
+@pytest.mark.asyncio
+async def test_unread_count_in_channel(channel_with_clients: ChannelWithClientsFactory) -> None:
+    channel, (client1, client2, client3) = await channel_with_clients(3, clients_run=True, resolve_channel=True)
+
+    messages = []
+    for i in range(3):
+        messages.append(await client1.send_message(channel.id, f"test message {i}"))
+        await client2.expect_update(UpdateNewChannelMessage)
+        await client3.expect_update(UpdateNewChannelMessage)
+
+    assert await _unread_count(client2, channel.id) == 3
+    assert await _unread_count(client3, channel.id) == 3
+
+    await client2.read_chat_history(channel.id, messages[1].id)
+    assert await _unread_count(client2, channel.id) == 1
+    assert await _unread_count(client3, channel.id) == 3
+
+    assert await client1.send_message(channel.id, "test message 3")
+    await client2.expect_update(UpdateNewChannelMessage)
+    assert await _unread_count(client2, channel.id) == 2
+    assert await _unread_count(client3, channel.id) == 4
+
+    await client1.delete_messages(channel.id, [messages[0].id, messages[2].id])
+    assert await _unread_count(client2, channel.id) == 1
+    assert await _unread_count(client3, channel.id) == 2
+
+
+@pytest.mark.asyncio
+async def test_new_channel_post_does_not_touch_read_states(
+        channel_with_clients: ChannelWithClientsFactory,
+) -> None:
+    channel, (client1, client2) = await channel_with_clients(2, clients_run=True, resolve_channel=True)
+
+    assert await _unread_count(client2, channel.id) == 0
+    user2 = await User.get(phone_number=client2.phone_number)
+    read_state = await ReadState.get(owner=user2, peer__type=PeerType.CHANNEL)
+
+    assert await client1.send_message(channel.id, "test message")
+    await client2.expect_update(UpdateNewChannelMessage)
+
+    channel_peer = await Peer.get(id=read_state.peer_id)
+    assert channel_peer.messages_count == 1
+    await read_state.refresh_from_db()
+    assert read_state.unread_count == 0
+    assert await _unread_count(client2, channel.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_unread_count_for_forwarded_messages_in_chat(client_with_auth: ClientFactory) -> None:
+    client1 = await client_with_auth(run=True)
+    client2 = await client_with_auth(run=True)
+
+    user2 = await client1.resolve_user(client2)
+    group = await client1.create_group("idk", [user2.id])
+    await client2.expect_update(UpdateNewMessage)
+    unread_before = await _unread_count(client2, group.id)
+
+    message1 = await client1.send_message("me", "test message 1")
+    message2 = await client1.send_message("me", "test message 2")
+    assert await client1.forward_messages(group.id, "me", [message1.id, message2.id])
+    await client2.expect_update(UpdateNewMessage)
+
+    assert await _unread_count(client2, group.id) == unread_before + 2
@@ -0,0 +1,107 @@
+from io import BytesIO
+from uuid import uuid4
+
+import pytest
+from fastrand import xorshift128plus_bytes
+from pyrogram.errors import BadRequest
+from pyrogram.raw.functions.messages import SendMedia
+from pyrogram.raw.functions.upload import SaveFilePart
+from pyrogram.raw.types import InputPeerSelf, InputMediaUploadedDocument, InputFile, DocumentAttributeFilename
+
+from piltover.config import APP_CONFIG
+from piltover.db.models import File
+from piltover.storage import file_part_token
+from piltover.storage.base import StorageType
+from piltover.storage.file_part_token import make_file_part_token, check_file_part_token
+from piltover.tl.types.storage import FileUnknown
+from tests.conftest import ClientFactory
+
+PART_SIZE = 512 * 1024
+
+
+def _make_file(data: bytes, name: str = "test.bin") -> BytesIO:
+    file = BytesIO(data)
+    setattr(file, "name", name)
+    return file
+
+
+@pytest.mark.asyncio
+async def test_same_file_uploaded_twice_is_deduplicated(client_with_auth: ClientFactory) -> None:
+    client = await client_with_auth(run=True)
+
+    data = xorshift128plus_bytes(PART_SIZE * 2 + 1024)
+    message1 = await client.send_document("me", document=_make_file(data))
+    message2 = await client.send_document("me", document=_make_file(data))
+    message3 = await client.send_document("me", document=_make_file(data[:-1024]))
+
+    files = await File.filter(content_hash__not_isnull=True).order_by("id")
+    assert len(files) == 3
+    assert files[0].content_hash == files[1].content_hash
+    assert files[0].physical_id == files[1].physical_id
+    assert files[0].id != files[1].id
+    assert files[2].content_hash != files[0].content_hash
+    assert files[2].physical_id != files[0].physical_id
+
+    assert (await message1.download(in_memory=True)).getvalue() == data
+    assert (await message2.download(in_memory=True)).getvalue() == data
+    assert (await message3.download(in_memory=True)).getvalue() == data[:-1024]
+
+
+@pytest.mark.asyncio
+async def test_upload_parts_out_of_order(client_with_auth: ClientFactory) -> None:
+    client = await client_with_auth(run=True)
+
+    data = xorshift128plus_bytes(PART_SIZE * 3 + 1000)
+    parts = [data[offset:offset + PART_SIZE] for offset in range(0, len(data), PART_SIZE)]
+
+    # Parts uploaded before first one don't have known offset yet, so they are moved to their place on finalize
+    for part_id in (3, 1, 0, 2):
+        assert await client.invoke(SaveFilePart(file_id=123, file_part=part_id, bytes=parts[part_id]))
+
+    await client.invoke(SendMedia(
+        peer=InputPeerSelf(),
+        media=InputMediaUploadedDocument(
+            file=InputFile(id=123, parts=len(parts), name="test.bin", md5_checksum=""),
+            mime_type="application/octet-stream",
+            attributes=[DocumentAttributeFilename(file_name="test.bin")],
+        ),
+        message="",
+        random_id=123,
+    ))
+
+    message = [msg async for msg in client.get_chat_history("me")][0]
+    assert message.document is not None
+    assert (await message.download(in_memory=True)).getvalue() == data
+
+
+@pytest.mark.asyncio
+async def test_upload_part_size_changed(client_with_auth: ClientFactory) -> None:
+    client = await client_with_auth(run=True)
+
+    assert await client.invoke(SaveFilePart(file_id=123, file_part=0, bytes=xorshift128plus_bytes(1024)))
+    with pytest.raises(BadRequest, match="FILE_PART_SIZE_CHANGED"):
+        await client.invoke(SaveFilePart(file_id=123, file_part=1, bytes=xorshift128plus_bytes(2048)))
+
+
+@pytest.mark.asyncio
+async def test_get_file_served_by_gateway(client_with_auth: ClientFactory) -> None:
+    APP_CONFIG.gateway_serves_files = True
+
+    client = await client_with_auth(run=True)
+
+    data = xorshift128plus_bytes(1024 * 1024 * 3 + 1024)
+    message = await client.send_document("me", document=_make_file(data))
+    assert (await message.download(in_memory=True)).getvalue() == data
+
+
+@pytest.mark.asyncio
+async def test_file_part_token_signature(monkeypatch: pytest.MonkeyPatch) -> None:
+    token = make_file_part_token(uuid4(), StorageType.DOCUMENT, None, 0, 1024, FileUnknown(), 0)
+    assert check_file_part_token(token)
+
+    token.offset = 1024
+    assert not check_file_part_token(token)
+
+    monkeypatch.setattr(file_part_token, "FILE_PART_TOKEN_TTL", -1)
+    token = make_file_part_token(uuid4(), StorageType.DOCUMENT, None, 0, 1024, FileUnknown(), 0)
+    assert not check_file_part_token(token)
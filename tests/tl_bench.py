@@ -3,7 +3,15 @@ from io import BytesIO
 from os import urandom
 from typing import TypeVar, Callable
 
-from piltover.tl import Long, Int, Int128, Int256, Float
+from taskiq import TaskiqMessage
+from taskiq.formatters.json_formatter import JSONFormatter
+
+from piltover._taskiq_binary_formatter import BinaryTaskiqFormatter, decode_rpc_payload
+from piltover.tl import Long, Int, Int128, Int256, Float, TLObject, types
+from piltover.tl.core_types import Message
+from piltover.tl.functions.help import GetConfig
+from piltover.tl.functions.internal import CallRpc
+from piltover.tl.functions.upload import SaveFilePart, SaveBigFilePart
 from piltover.tl.types.internal_benchmarking import ObjectToBenchmark, NestedObject, DeeplyNestedObjectX1, \
     DeeplyNestedObjectX2, DeeplyNestedObjectX3, DeeplyNestedObjectX4, DeeplyNestedObjectX5, DeeplyNestedObjectX6, \
     DeeplyNestedObjectX7, DeeplyNestedObjectX8
@@ -174,6 +182,118 @@ def _read_compare_obj(buf: BytesIO, orig: ObjectToBenchmark) -> bool:
     return new_obj == orig
 
 
+def _read_buffer_compare_obj(data: bytes, orig: ObjectToBenchmark) -> bool:
+    new_obj = ObjectToBenchmark.read_buffer(data)
+    return new_obj == orig
+
+
+def bench_read_paths() -> None:
+    iterations = 200
+
+    objects = (
+        ("upload.saveFilePart (512 KB)", SaveFilePart(file_id=1, file_part=0, bytes_=urandom(512 * 1024))),
+        (
+            "upload.saveBigFilePart (512 KB)",
+            SaveBigFilePart(file_id=1, file_part=0, file_total_parts=4, bytes_=urandom(512 * 1024)),
+        ),
+        ("deeply nested object", _rand_deeply_nested_obj()),
+    )
+
+    for name, obj in objects:
+        # Objects are received wrapped in a message, same as in Client.recv
+        data = Message(message_id=_rand_long(), seq_no=1, obj=obj).write()
+        for reader, read in (
+                ("BytesIO", lambda: Message.read(BytesIO(data))),
+                ("memoryview", lambda: Message.read_buffer(data)),
+        ):
+            total_time = timeit.timeit(read, number=iterations)
+            print(f"Read of {name} via {reader} took {total_time * 1000 / iterations:.3f} ms/it")
+
+
+def make_messages_to_benchmark() -> types.messages.Messages:
+    users = [
+        types.User(
+            id=user_id, access_hash=_rand_long(), first_name=urandom(8).hex(), last_name=urandom(8).hex(),
+            username=urandom(6).hex(), photo=types.UserProfilePhotoEmpty(), status=types.UserStatusRecently(),
+        )
+        for user_id in range(1, 21)
+    ]
+    chats = [
+        types.Chat(
+            id=chat_id, title=urandom(12).hex(), photo=types.ChatPhotoEmpty(), participants_count=20, date=_rand_int(),
+            version=1,
+        )
+        for chat_id in range(1, 6)
+    ]
+    messages = [
+        types.Message(
+            id=message_id, peer_id=types.PeerChat(chat_id=message_id % 5 + 1),
+            from_id=types.PeerUser(user_id=message_id % 20 + 1), date=_rand_int(), message=urandom(128).hex(),
+            entities=[types.MessageEntityBold(offset=0, length=16), types.MessageEntityItalic(offset=16, length=16)],
+        )
+        for message_id in range(1, 101)
+    ]
+
+    return types.messages.Messages(messages=messages, chats=chats, users=users)
+
+
+def bench_write_messages() -> None:
+    iterations = 200
+
+    obj = make_messages_to_benchmark()
+    total_time = timeit.timeit(obj.write, number=iterations)
+    print(
+        f"Write of messages.messages with 100 messages took {total_time * 1000 / iterations:.3f} ms/it: "
+        f"{len(obj.write()) / 1024:.2f} KB"
+    )
+
+
+def _make_call_rpc(obj: TLObject) -> CallRpc:
+    return CallRpc(
+        obj=obj,
+        layer=201,
+        auth_key_id=_rand_long(),
+        perm_auth_key_id=_rand_long(),
+        session_id=_rand_long(),
+        message_id=_rand_long(),
+        auth_id=_rand_long(),
+        user_id=_rand_long(),
+    )
+
+
+def _rpc_round_trip(formatter: JSONFormatter | BinaryTaskiqFormatter, call: CallRpc, binary: bool) -> int:
+    data = call.write()
+    message = formatter.dumps(TaskiqMessage(
+        task_id="0", task_name="handle_tl_rpc", labels={},
+        args=[formatter.encode_payload(data) if binary else data.hex()], kwargs={},
+    ))
+    CallRpc.read(BytesIO(decode_rpc_payload(formatter.loads(message.message).args[0])))
+    return len(message.message)
+
+
+def bench_rpc_transport() -> None:
+    iterations = 200
+
+    calls = (
+        ("help.getConfig", _make_call_rpc(GetConfig())),
+        ("upload.saveFilePart (1 KB)", _make_call_rpc(SaveFilePart(file_id=1, file_part=0, bytes_=urandom(1024)))),
+        ("upload.saveFilePart (4 KB)", _make_call_rpc(SaveFilePart(file_id=1, file_part=0, bytes_=urandom(4 * 1024)))),
+        ("upload.saveFilePart (512 KB)", _make_call_rpc(SaveFilePart(file_id=1, file_part=0, bytes_=urandom(512 * 1024)))),
+    )
+
+    for name, call in calls:
+        for transport, formatter, binary in (
+                ("hex", JSONFormatter(), False),
+                ("binary", BinaryTaskiqFormatter(), True),
+        ):
+            size = _rpc_round_trip(formatter, call, binary)
+            total_time = timeit.timeit(lambda: _rpc_round_trip(formatter, call, binary), number=iterations)
+            print(
+                f"{name} via {transport} transport took {total_time * 1000 / iterations:.3f} ms/request, "
+                f"{size / 1024:.2f} KB on the wire"
+            )
+
+
 def main() -> None:
     iterations = 1000
 
@@ -185,6 +305,18 @@ def main() -> None:
     total_time = timeit.timeit(lambda: _read_compare_obj(buf_to_read, obj), number=iterations)
     print(f"Read took {total_time:.2f} seconds ({total_time * 1000 / iterations:.2f} ms/it): {len(obj.write()) / 1024:.2f} KB")
 
+    data_to_read = obj.write()
+    total_time = timeit.timeit(lambda: _read_buffer_compare_obj(data_to_read, obj), number=iterations)
+    print(
+        f"Read (memoryview) took {total_time:.2f} seconds ({total_time * 1000 / iterations:.2f} ms/it): "
+        f"{len(data_to_read) / 1024:.2f} KB"
+    )
+
+    bench_read_paths()
+    bench_write_messages()
+
+    bench_rpc_transport()
+
 
 if __name__ == "__main__":
     #yappi.start()
@@ -81,6 +81,8 @@ types_to_combinators: dict[str, list[Combinator]] = defaultdict(list)
 namespaces_to_constructors: dict[str, list[str]] = defaultdict(list)
 namespaces_to_functions: dict[str, list[str]] = defaultdict(list)
 namespaces_to_types: dict[str, list[str]] = defaultdict(list)
+# Names of classes defined in "types/_root.py" and "functions/_root.py", exported from these packages lazily
+root_class_names: dict[str, list[str]] = defaultdict(list)
 
 
 class Combinator:
@@ -419,6 +421,16 @@ def get_real_type_from_type_and_subtype(type_name: str, subtype_name: str | None
         raise RuntimeError(f"Got unknown type: {type_name=!r}, {subtype_name=!r}")
 
 
+def get_write_statement(type_name: str, value: str) -> str:
+    if type_name == "TLObject" or type_name.startswith("tl.types."):
+        return f"{value}.write_to(out, ctx)"
+    elif type_name == "TLObjectVector":
+        return f"TLObjectVector.write_to(out, {value}, ctx)"
+    elif type_name in ("Bytes", "String"):
+        return f"{type_name}.write_to(out, {value})"
+    return f"out += {type_name}.write({value})"
+
+
 def resolve_fields_for_check(c: Combinator) -> list[Field]:
     if c.fields_for_check is not None:
         return c.fields_for_check
@@ -570,6 +582,7 @@ def start():
 
         serialize_body = []
         deserialize_body = []
+        deserialize_from_body = []
 
         fields_by_flag = defaultdict(list)
         for field in c.fields:
@@ -633,9 +646,10 @@ def start():
                         continue
                     empty_condition = "" if ffield.type().lower().startswith("vector") or not ffield.write else " is not None"
                     serialize_body.append(f"if self.{ffield.name}{empty_condition}: {flag_var} |= (1 << {ffield.flag_bit})")
-                serialize_body.append(f"result += Int.write({flag_var})")
+                serialize_body.append(f"out += Int.write({flag_var})")
 
                 deserialize_body.append(f"{flag_var} = Int.read(stream)")
+                deserialize_from_body.append(f"{flag_var}, cursor = Int.read_from(view, cursor)")
                 continue
 
             write_var_name = f"self.{field.name}"
@@ -663,32 +677,27 @@ def start():
                         empty_condition = " is not None"
 
                     serialize_body.append(f"if {write_var_name}{empty_condition}:")
-                    if type_name == "TLObject":
-                        serialize_body.append(f"    result += {write_var_name}.write(ctx)")
-                    else:
-                        ctx_arg_maybe = ""
-                        if type_name == "TLObjectVector":
-                            ctx_arg_maybe = ", ctx"
-                        serialize_body.append(f"    result += {type_name}.write({write_var_name}{ctx_arg_maybe})")
+                    serialize_body.append(f"    {get_write_statement(type_name, write_var_name)}")
                     deserialize_body.append(
                         f"{field.name} = {type_name}.read(stream) "
                         f"if (flags{field.flag_num} & (1 << {field.flag_bit})) == (1 << {field.flag_bit}) else None"
                     )
+                    deserialize_from_body.append(
+                        f"{field.name}, cursor = {type_name}.read_from(view, cursor) "
+                        f"if (flags{field.flag_num} & (1 << {field.flag_bit})) == (1 << {field.flag_bit}) "
+                        f"else (None, cursor)"
+                    )
                 elif field.type() == "true":
                     deserialize_body.append(
                         f"{field.name} = (flags{field.flag_num} & (1 << {field.flag_bit})) == (1 << {field.flag_bit})"
                     )
+                    deserialize_from_body.append(deserialize_body[-1])
 
                 continue
 
-            if type_name == "TLObject":
-                serialize_body.append(f"result += {write_var_name}.write(ctx)")
-            else:
-                ctx_arg_maybe = ""
-                if type_name == "TLObjectVector":
-                    ctx_arg_maybe = ", ctx"
-                serialize_body.append(f"result += {type_name}.write({write_var_name}{ctx_arg_maybe})")
+            serialize_body.append(get_write_statement(type_name, write_var_name))
             deserialize_body.append(f"{field.name} = {type_name}.read(stream)")
+            deserialize_from_body.append(f"{field.name}, cursor = {type_name}.read_from(view, cursor)")
 
         to_check_body = []
         if c.section == "types":
@@ -764,22 +773,18 @@ def start():
                 ] if init_args else []
             ),
             f"",
-            f"    def serialize(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:",
-            *indent(
-                [
-                    f"result = b\"\"",
-                    *serialize_body,
-                    f"return result",
-                ] if serialize_body else [
-                    "return b\"\""
-                ],
-                8
-            ),
+            f"    def serialize_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:",
+            *indent(serialize_body if serialize_body else ["return"], 8),
             f"",
             f"    @classmethod",
             f"    def deserialize(cls, stream: BytesIO) -> {c.name}:",
             *indent(deserialize_body, 8),
             f"        return cls({', '.join(deserialize_cls_args)})",
+            f"",
+            f"    @classmethod",
+            f"    def deserialize_from(cls, view: memoryview, cursor: int) -> tuple[{c.name}, int]:",
+            *indent(deserialize_from_body, 8),
+            f"        return cls({', '.join(deserialize_cls_args)}), cursor",
             *(
                 [
                     f"",
@@ -804,6 +809,8 @@ def start():
 
         d = namespaces_to_constructors if c.section == "types" else namespaces_to_functions
         d[c.namespace].append(c.name)
+        if not c.namespace:
+            root_class_names[c.section].append(cls_name)
 
     for older_combinators in tqdm(combinators_to_replace.values(), desc="Writing downgradable combinators", total=len(combinators_to_replace)):
         oldest = older_combinators[0]
@@ -1045,7 +1052,7 @@ def start():
                         ffield_add_indent = ""
 
                     serialize_body.append(f"{add_indent}{ffield_add_indent}if {ffield_var_name}{empty_condition}: {flag_var} |= (1 << {ffield.flag_bit})")
-                serialize_body.append(f"{add_indent}result += Int.write({flag_var})")
+                serialize_body.append(f"{add_indent}out += Int.write({flag_var})")
                 continue
 
             if field.name in placeholders:
@@ -1078,25 +1085,15 @@ def start():
                         empty_condition = " is not None"
 
                     serialize_body.append(f"{add_indent}if {field_var_name}{empty_condition}:")
-                    if type_name == "TLObject":
-                        serialize_body.append(f"    {add_indent}result += {field_var_name}.write(ctx)")
-                    else:
-                        ctx_arg_maybe = ""
-                        if type_name == "TLObjectVector":
-                            ctx_arg_maybe = ", ctx"
-                        serialize_body.append(f"    {add_indent}result += {type_name}.write({field_var_name}{ctx_arg_maybe})")
+                    serialize_body.append(f"    {add_indent}{get_write_statement(type_name, field_var_name)}")
 
                 continue
 
-            if type_name == "TLObject":
-                serialize_body.append(f"{add_indent}result += {field_var_name}.write(ctx)")
-            else:
-                ctx_arg_maybe = ""
-                if type_name == "TLObjectVector":
-                    ctx_arg_maybe = ", ctx"
-                serialize_body.append(f"{add_indent}result += {type_name}.write({field_var_name}{ctx_arg_maybe})")
+            serialize_body.append(f"{add_indent}{get_write_statement(type_name, field_var_name)}")
 
         downgradable_cls_name = base.name
+        if not base.namespace:
+            root_class_names[base.section].append(downgradable_cls_name)
 
         write_hooks_body = []
         for hook in WRITE_HOOKS.get(base.qualname, ()):
@@ -1122,9 +1119,9 @@ def start():
             f"",
             f"    __slots__ = ()",
             f"",
-            f"    def write(self, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> bytes:",
+            f"    def write_to(self, out: bytearray, ctx: SerializationContext = EMPTY_SERIALIZATION_CONTEXT) -> None:",
             f"        if ctx.dont_format:",
-            f"            return super().write(ctx)",
+            f"            return super().write_to(out, ctx)",
             *indent(
                 ([""] if write_hooks_body else []) +
                 write_hooks_body
@@ -1134,11 +1131,11 @@ def start():
         ]
 
         if oldest is base:
-            result.append("        return super().write(ctx)")
+            result.append("        return super().write_to(out, ctx)")
         else:
             result.extend((
                 f"        if ctx.layer >= self.__tl_layer__:",
-                f"            return super().write(ctx)",
+                f"            return super().write_to(out, ctx)",
                 f"",
                 f"        if ctx.layer < self.__tl_ids__[0][0]:",
                 f"            raise RuntimeError(",
@@ -1162,16 +1159,8 @@ def start():
                     ] + ([""] if fields_to_downgrade else []),
                     spaces=8
                 ),
-                f"        result = Int.write(self.__tl_ids__[layer_idx][1], False)",
-                *indent(
-                    [
-                        *serialize_body,
-                        f"return result",
-                    ] if serialize_body else [
-                        "return b\"\""
-                    ],
-                    8
-                ),
+                f"        out += Int.write(self.__tl_ids__[layer_idx][1], False)",
+                *indent(serialize_body, 8),
                 f"",
             ))
 
@@ -1268,40 +1257,50 @@ def start():
 
                 f.write("\n")
 
-    with open(DESTINATION_PATH / "types" / "__init__.py", "a") as f:
-        f.write(f"from ._root import *\n")
-        f.write(f"from . import {', '.join(filter(bool, namespaces_to_constructors))}\n")
-
-    with open(DESTINATION_PATH / "functions" / "__init__.py", "a") as f:
-        f.write(f"from ._root import *\n")
-        f.write(f"from . import {', '.join(filter(bool, namespaces_to_functions))}\n")
-
-    with open(DESTINATION_PATH / "base" / "__init__.py", "a") as f:
-        f.write(f"from ._root import *\n")
-        f.write(f"from . import {', '.join(filter(bool, namespaces_to_types))}\n")
+    base_root_names = ["FutureSalts", "FutureSaltsInst"]
+    for t in namespaces_to_types[""]:
+        base_root_names.extend((t, f"{t}Inst"))
+
+    for section, namespaces, root_names in (
+            ("types", namespaces_to_constructors, root_class_names["types"]),
+            ("functions", namespaces_to_functions, root_class_names["functions"]),
+            ("base", namespaces_to_types, base_root_names),
+    ):
+        # Modules are imported on first access to one of their attributes, not when package is imported
+        with open(DESTINATION_PATH / section / "__init__.py", "w") as f:
+            f.write(WARNING + "\n\n")
+            f.write(f"from piltover.tl.lazy_import import lazy_getattr\n\n")
+            f.write("LAZY_INDEX = {\n")
+            for namespace in filter(bool, namespaces):
+                f.write(f"    \"{namespace}\": (\"{namespace}\", None),\n")
+            for name in root_names:
+                f.write(f"    \"{name}\": (\"_root\", \"{name}\"),\n")
+            f.write("}\n\n")
+            f.write("__getattr__ = lazy_getattr(__name__, globals(), LAZY_INDEX)\n")
 
     with open(DESTINATION_PATH / "all.py", "w") as f:
         f.write(WARNING + "\n\n")
-        f.write(f"from . import core_types, primitives, types, functions, to_format\n")
-        f.write("objects = {\n")
+        f.write(f"from .lazy_import import LazyObjects\n\n")
+        f.write("objects = LazyObjects({\n")
 
         for c in combinators:
             id_int = int(c.id[2:], 16)
             if id_int in REPLACE_CONSTRUCTORS:
-                f.write(f"    {c.id}: {REPLACE_CONSTRUCTORS[id_int]},\n")
+                module_name, cls_name = REPLACE_CONSTRUCTORS[id_int].rsplit(".", 1)
             else:
-                f.write(f"    {c.id}: {c.section}.{c.qualname},\n")
-
-        f.write(f"    0x5bb8e511: core_types.Message,\n")
-        f.write(f"    0x73f1f8dc: core_types.MsgContainer,\n")
-        f.write(f"    0xf35c6d01: core_types.RpcResult,\n")
-        f.write(f"    0x3072cfa1: core_types.GzipPacked,\n")
-        f.write(f"    0xae500895: core_types.FutureSalts,\n")
-        f.write(f"    0x997275b5: primitives.BoolTrue,\n")
-        f.write(f"    0xbc799737: primitives.BoolFalse,\n")
+                module_name, cls_name = f"{c.section}.{c.namespace or '_root'}", c.name
+            f.write(f"    {c.id}: (\"{module_name}\", \"{cls_name}\"),\n")
+
+        f.write(f"    0x5bb8e511: (\"core_types\", \"Message\"),\n")
+        f.write(f"    0x73f1f8dc: (\"core_types\", \"MsgContainer\"),\n")
+        f.write(f"    0xf35c6d01: (\"core_types\", \"RpcResult\"),\n")
+        f.write(f"    0x3072cfa1: (\"core_types\", \"GzipPacked\"),\n")
+        f.write(f"    0xae500895: (\"core_types\", \"FutureSalts\"),\n")
+        f.write(f"    0x997275b5: (\"primitives\", \"BoolTrue\"),\n")
+        f.write(f"    0xbc799737: (\"primitives\", \"BoolFalse\"),\n")
         # TODO: vectors
 
-        f.write("}\n")
+        f.write("})\n")
 
     with open(DESTINATION_PATH / "layer_info.py", "w") as f:
         f.write(WARNING + "\n\n")
@@ -28,7 +28,7 @@ WRITE_HOOKS: dict[str, list[WriteHook]] = {
     "messages.InvitedUsers": [
         WriteHookRunCode(
             condition="ctx.layer < 177",
-            code=["return self.updates.write(ctx)"],
+            code=["return self.updates.write_to(out, ctx)"],
         ),
     ],
 }